@@ -1,9 +1,13 @@
+from gcodeparse import parse_lines, to_lines
+from pipelinelog import log
+
+
 def remove_continuous_g0(data):
     """移除连续的G0指令，仅保留最后一个G0"""
     result = []
     g0_lines = []  # 用于存储连续的G0指令
     for line in data:
-        if line.startswith("G0"):
+        if line.code == "G0":
             g0_lines.append(line)  # 收集连续的G0指令
         else:
             # 如果遇到非G0指令，先将最后一个G0指令（如果有）加入结果
@@ -22,32 +26,48 @@ def process_file(input_path, output_path):
         with open(input_path, 'r') as file:
             data = file.readlines()
 
-        processed_data = []
-        block = []
-        for line in data:
-            if line.strip() == "":
-                # 如果遇到空行，处理当前数据块
-                if block:
-                    # 检查是否以T0开头，不进行处理
-                    if block[0].startswith("T0"):
-                        processed_data.extend(block)
-                    else:
-                        processed_data.extend(remove_continuous_g0(block))
-                    processed_data.append("")  # 保留空行分隔数据块
-                    block = []  # 重置块
-            else:
-                block.append(line)
-
-        # 处理最后一个数据块
-        if block:
-            if block[0].startswith("T0"):
-                processed_data.extend(block)
-            else:
-                processed_data.extend(remove_continuous_g0(block))
+        processed_data = process_commands(parse_lines(data))
 
         # 写入输出文件
         with open(output_path, 'w') as file:
-            file.writelines(processed_data)
-        print("G0Trimmer 处理完成！")
+            file.writelines(to_lines(processed_data))
+        log("G0Trimmer 处理完成！")
     except Exception as e:
-        raise Exception(f"处理文件时出错: {e}")
\ No newline at end of file
+        raise Exception(f"处理文件时出错: {e}")
+
+def process_commands(data):
+    """process_file 的内存版本：输入指令列表，返回删除非T0块中连续G0后的指令列表"""
+    return list(stream_commands(data))
+
+def stream_commands(data):
+    """
+    process_commands 的流式版本：逐行输出，只暂存当前连续G0中的最后一个。
+    空行之后的第一行决定该数据块是否以T0开头（T0块原样输出）。
+    """
+    block_start = True  # 下一行是否为数据块的第一行
+    keep_block = False  # 当前数据块是否以T0开头
+    last_g0 = None  # 当前连续G0中的最后一个
+    for line in data:
+        if line.is_blank:
+            # 空行本身写出时为空字符串，不再保留
+            if last_g0 is not None:
+                yield last_g0
+                last_g0 = None
+            block_start = True
+            continue
+        if block_start:
+            keep_block = line.code == "T0"
+            block_start = False
+        if keep_block:
+            yield line
+        elif line.code == "G0":
+            last_g0 = line  # 只保留最后一个G0
+        else:
+            if last_g0 is not None:
+                yield last_g0
+                last_g0 = None
+            yield line
+
+    # 处理文件末尾的连续G0指令
+    if last_g0 is not None:
+        yield last_g0
@@ -1,4 +1,5 @@
-import re
+from gcodeparse import BLANK_LINE, parse_line, parse_lines, to_lines
+from pipelinelog import log
 
 def process_gcode(input_path, output_path):
     """处理 G-code 文件，添加空行、打印头类型和打印类型"""
@@ -6,38 +7,49 @@ def process_gcode(input_path, output_path):
         with open(input_path, 'r') as infile:
             lines = infile.readlines()
 
-        new_lines = []
-        current_type = ""
-        current_head = ""
-
-        for line in lines:
-            # 识别打印头类型
-            if "T0" in line:
-                current_head = "T0"
-            elif "T1" in line:
-                current_head = "T1"
-
-            # 识别打印类型
-            match = re.search(r';TYPE:(\S+)', line)
-            if match:
-                current_type = match.group(1)
-
-            # 在特定 G0 指令前添加空行、打印头类型和打印类型
-            if line.startswith("G0 F15000"):
-                new_lines.append("\n")  # 添加空行
-                new_lines.append(f"{current_head}\n")  # 打印头类型
-                new_lines.append(f";TYPE:{current_type}\n")  # 打印类型
-
-            # 添加其他数据行
-            new_lines.append(line)
+        new_lines = process_commands(parse_lines(lines))
 
         # 写入新的 G-code 文件
         with open(output_path, 'w') as outfile:
-            outfile.writelines(new_lines)
-        print("G-code 处理完成！")
+            outfile.writelines(to_lines(new_lines))
+        log("G-code 处理完成！")
     except Exception as e:
         raise Exception(f"处理 G-code 文件时出错: {e}")
 
+def process_commands(commands):
+    """process_gcode 的内存版本：输入指令列表，返回添加空行、打印头类型和打印类型后的指令列表"""
+    return list(stream_commands(commands))
+
+def stream_commands(commands):
+    """process_commands 的流式版本：逐条输出，只记录当前打印头和打印类型"""
+    current_type = ""
+    current_head = ""
+    header_lines = {}  # (打印头, 打印类型) 到插入行的缓存，避免重复解析
+
+    for cmd in commands:
+        # 识别打印头类型
+        if cmd.code == "T0":
+            current_head = "T0"
+        elif cmd.code == "T1":
+            current_head = "T1"
+
+        # 识别打印类型
+        type_name = cmd.type_name
+        if type_name is not None:
+            current_type = type_name
+
+        # 在特定 G0 指令前添加空行、打印头类型和打印类型
+        if cmd.code == "G0" and cmd.f == 15000 and cmd.raw.startswith("G0 F"):
+            key = (current_head, current_type)
+            if key not in header_lines:
+                header_lines[key] = (parse_line(f"{current_head}\n"),  # 打印头类型
+                                     parse_line(f";TYPE:{current_type}\n"))  # 打印类型
+            yield BLANK_LINE  # 添加空行
+            yield from header_lines[key]
+
+        # 添加其他数据行
+        yield cmd
+
 # 可选：添加命令行接口（独立运行时使用）
 if __name__ == "__main__":
     import sys
@@ -1,4 +1,5 @@
-import re
+from gcodeparse import BLANK_LINE, iter_strip_last_newline, parse_lines, to_lines
+from pipelinelog import log
 
 def process_gcode(input_path, output_path):
     """处理G-code文件，删除Z值不符合条件的G0/G1指令"""
@@ -6,46 +7,56 @@ def process_gcode(input_path, output_path):
         with open(input_path, 'r') as infile:
             lines = infile.readlines()
 
-        result_lines = []
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        result = process_commands(parse_lines(lines))
 
-            # 处理G0/G1指令的块
-            if line.startswith(('G0', 'G1')):
-                # 获取当前行和下一行的Z值进行比较
-                if i + 1 < len(lines):  # 确保有第二行
-                    match1 = re.search(r'Z([+-]?[0-9]*\.?[0-9]+)', lines[i])
-                    match2 = re.search(r'Z([+-]?[0-9]*\.?[0-9]+)', lines[i + 1])
+        # 写入处理后的文本到输出文件
+        with open(output_path, 'w') as outfile:
+            outfile.writelines(to_lines(result))
+        log("G-code 处理完成！")
 
-                    if match1 and match2:
-                        z1 = float(match1.group(1))
-                        z2 = float(match2.group(1))
+    except Exception as e:
+        raise Exception(f"处理 G-code 文件时出错: {e}")
 
-                        # 如果当前行的 Z 值大于下一行的 Z 值，则删除当前行
-                        if z1 > z2:
-                            i += 1  # 跳过当前行
-                            continue  # 跳过当前行并处理下一行
+def process_commands(commands):
+    """
+    process_gcode 的内存版本：删除Z值大于下一行Z值的G0/G1指令，并在G0/G1块结束处插入空行，
+    返回与输出文件内容一致的指令列表（最后一行不带换行符）
+    """
+    return list(stream_commands(commands))
 
-                # 将有效行加入结果
-                result_lines.append(line)
+def stream_commands(commands):
+    """process_commands 的流式版本：只向后多读一行用于比较Z值，最后一行不带换行符"""
+    return iter_strip_last_newline(filter_lines(commands))
 
-                # 检查是否下一行不是G0/G1指令，如果是，则添加一个空行
-                if i + 1 < len(lines) and not lines[i + 1].strip().startswith(('G0', 'G1')):
-                    result_lines.append("")  # 添加空行
+def filter_lines(commands):
+    """逐行比较当前行与下一行（只缓存一行），返回每行以换行符结尾的指令生成器"""
+    cmd = None
+    for next_cmd in commands:
+        if cmd is not None:
+            yield from filter_line(cmd, next_cmd)
+        cmd = next_cmd
+    if cmd is not None:
+        yield from filter_line(cmd, None)
 
-            else:
-                result_lines.append(line)
+def filter_line(cmd, next_cmd):
+    """处理一行指令，next_cmd 为下一行（最后一行时为 None）"""
+    # 处理G0/G1指令的块
+    if cmd.is_motion:
+        # 获取当前行和下一行的Z值进行比较
+        if next_cmd is not None and cmd.z is not None and next_cmd.z is not None:
+            # 如果当前行的 Z 值大于下一行的 Z 值，则删除当前行
+            if cmd.z > next_cmd.z:
+                return  # 跳过当前行并处理下一行
 
-            i += 1
+        # 将有效行加入结果
+        yield cmd.stripped()
 
-        # 写入处理后的文本到输出文件
-        with open(output_path, 'w') as outfile:
-            outfile.write('\n'.join(result_lines))
-        print("G-code 处理完成！")
+        # 检查是否下一行不是G0/G1指令，如果是，则添加一个空行
+        if next_cmd is not None and not next_cmd.is_motion:
+            yield BLANK_LINE  # 添加空行
 
-    except Exception as e:
-        raise Exception(f"处理 G-code 文件时出错: {e}")
+    else:
+        yield cmd.stripped()
 
 # 命令行接口
 if __name__ == "__main__":
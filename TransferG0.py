@@ -1,5 +1,7 @@
 import argparse
 
+from gcodeparse import parse_lines, to_lines
+
 def process_file(input_path, output_path):
     """处理 G-code 文件，保留特定行并调整 G0 和 G1 指令顺序"""
     # 读取输入文件
@@ -11,47 +13,54 @@ def process_file(input_path, output_path):
     except Exception as e:
         raise Exception(f"读取输入文件失败: {str(e)}")
 
-    result = []
+    result = process_commands(parse_lines(lines))
+
+    # 写入结果到输出文件
+    try:
+        with open(output_path, 'w') as outfile:
+            outfile.writelines(to_lines(result))
+    except Exception as e:
+        raise Exception(f"写入输出文件失败: {str(e)}")
+
+def process_commands(commands):
+    """process_file 的内存版本：输入指令列表，返回保留特定行并调整 G0/G1 顺序后的指令列表"""
+    return list(stream_commands(commands))
+
+def stream_commands(commands):
+    """process_commands 的流式版本：逐条输出，只暂存最近一条不带Z坐标的 G0 指令"""
     additional_line = None  # 用于存储不带Z坐标的 G0 指令
 
     # 逐行处理 G-code
-    for line in lines:
-        line = line.strip()
+    for cmd in commands:
+        code = cmd.code
 
         # 保存所有的 ;TYPE: 行
-        if line.startswith(';TYPE:'):
-            result.append(line)  # 添加 ;TYPE: 行
+        if cmd.is_type:
+            yield cmd.stripped()  # 添加 ;TYPE: 行
             continue  # 跳过后续处理
 
         # 处理 T0 和 T1 行
-        if line.startswith(('T0', 'T1')):
-            result.append(line)  # 添加 T0 或 T1 行
+        if code == 'T0' or code == 'T1':
+            yield cmd.stripped()  # 添加 T0 或 T1 行
             continue  # 跳过后续处理
 
         # 处理 G0 指令
-        if line.startswith('G0'):
+        if code == 'G0':
             # 检查是否包含 Z 坐标
-            if 'Z' in line:
-                result.append(line)  # 直接保留带有 Z 坐标的 G0 行
+            if cmd.z is not None:
+                yield cmd.stripped()  # 直接保留带有 Z 坐标的 G0 行
             else:
-                additional_line = line  # 存储不带 Z 坐标的 G0 指令
+                additional_line = cmd.stripped()  # 存储不带 Z 坐标的 G0 指令
             continue  # 跳过当前行，等待后续处理
 
         # 处理 G1 指令
-        if line.startswith('G1'):
+        if code == 'G1':
             if additional_line:  # 如果之前存储了不带 Z 坐标的 G0 指令
-                result.append(additional_line)  # 添加 G0 指令
-                result.append(line)  # 添加当前的 G1 指令
+                yield additional_line  # 添加 G0 指令
+                yield cmd.stripped()  # 添加当前的 G1 指令
                 additional_line = None  # 清空存储的 G0 指令
             else:
-                result.append(line)  # 直接添加 G1 指令
-
-    # 写入结果到输出文件
-    try:
-        with open(output_path, 'w') as outfile:
-            outfile.writelines([line + '\n' for line in result])
-    except Exception as e:
-        raise Exception(f"写入输出文件失败: {str(e)}")
+                yield cmd.stripped()  # 直接添加 G1 指令
 
 def main():
     # 设置命令行参数解析
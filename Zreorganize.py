@@ -1,6 +1,11 @@
-import re
 import argparse
 
+import numpy as np
+
+from gcodeparse import parse_lines, replace_params, to_lines
+from motiontable import MotionTable
+from pipelinelog import log
+
 def process_z_values(input_path, output_path):
     """
     处理文本文件，确保每个由空行分隔的文本块中的Z值一致。
@@ -18,64 +23,67 @@ def process_z_values(input_path, output_path):
     except Exception as e:
         raise Exception(f"无法读取输入文件：{e}")
 
-    processed_lines = []  # 存储处理后的行
-    block = []  # 当前文本块
-    first_z = None  # 文本块中的第一个Z值
-
-    # 逐行处理
-    for line in lines:
-        stripped_line = line.strip()
-        if stripped_line == "":
-            # 遇到空行，处理当前文本块并保留空行
-            if block:
-                processed_lines.extend(process_block(block, first_z))
-            processed_lines.append(line)  # 直接保留原始空行（包含换行符）
-            block = []
-            first_z = None
-        else:
-            block.append(line)
-            # 提取Z值，仅用于确定第一个Z值
-            z_match = re.search(r'Z([+-]?\d*\.?\d+)', line)
-            if z_match and first_z is None:
-                first_z = float(z_match.group(1))
-
-    # 处理最后一个文本块
-    if block:
-        processed_lines.extend(process_block(block, first_z))
+    processed_lines = process_commands(parse_lines(lines))
 
     # 写入输出文件
     try:
         with open(output_path, 'w') as f:
-            for line in processed_lines:
+            for line in to_lines(processed_lines):
                 f.write(line)
     except Exception as e:
         raise Exception(f"无法写入输出文件：{e}")
 
-    print("文本处理完成！")
+    log("文本处理完成！")
 
-def process_block(block, first_z):
+def process_commands(commands, table=None):
     """
-    处理单个文本块，确保所有Z值与第一个Z值一致。
+    process_z_values 的内存版本：输入指令列表，返回每个文本块Z值统一后的指令列表。
+
+    各文本块的第一个Z值通过数值表一次性求出并广播到块内各行，
+    只有Z值与之不同的行需要重新生成文本。
 
     参数:
-        block (list): 文本块的行列表
-        first_z (float): 文本块中的第一个Z值
+        commands (list): GCodeLine 列表
+        table (MotionTable): commands 对应的数值表，为空时自动生成
 
     返回:
-        list: 处理后的文本块行列表
+        list: 处理后的指令列表
+    """
+    if table is None:
+        table = MotionTable.from_commands(commands)
+
+    # 文本块中的第一个Z值，以及与其不一致的行
+    first_z = table.block_first(table.z)
+    changed = np.flatnonzero(~np.isnan(table.z) & (table.z != first_z))
+
+    processed_lines = list(commands)
+    for i in changed:
+        z_value = float(first_z[i])
+        processed_lines[i] = replace_params(commands[i], Z=(round(z_value, 2), f"{z_value:.2f}"))
+    return processed_lines
+
+def stream_commands(commands):
+    """
+    process_commands 的流式版本：逐块读入指令，内存中只保留当前文本块。
+
+    空行属于其后的文本块（与数值表的分块方式一致），空行本身没有Z值，不影响结果。
     """
-    if first_z is None:
-        return block  # 没有Z值，保持不变
-
-    processed_block = []
-    for line in block:
-        z_match = re.search(r'Z([+-]?\d*\.?\d+)', line)
-        if z_match:
-            current_z = float(z_match.group(1))
-            if current_z != first_z:
-                line = re.sub(r'Z[+-]?\d*\.?\d+', f'Z{first_z:.2f}', line)
-        processed_block.append(line)
-    return processed_block
+    block = []
+    for cmd in commands:
+        if cmd.is_blank and block:
+            yield from unify_block_z(block)
+            block = []
+        block.append(cmd)
+    if block:
+        yield from unify_block_z(block)
+
+def unify_block_z(block):
+    """将文本块中与第一个Z值不同的行统一修改为第一个Z值"""
+    first_z = next((cmd.z for cmd in block if cmd.z is not None), None)
+    for cmd in block:
+        if cmd.z is not None and cmd.z != first_z:
+            cmd = replace_params(cmd, Z=(round(first_z, 2), f"{first_z:.2f}"))
+        yield cmd
 
 # 命令行接口
 if __name__ == "__main__":
@@ -0,0 +1,231 @@
+/*
+ * gcodeparse 的可选 C 扩展：按与 gcodeparse.py_parse_line 完全相同的规则解析 G-code 行。
+ *
+ * 编译（生成 _gcodeparse*.so / .pyd，放在本目录即可被 gcodeparse 自动使用）：
+ *     python setup_gcodeparse.py build_ext --inplace
+ *
+ * - 指令和参数按 str.split() 的规则（Unicode 空白）拆分，注释为第一个分号之后的内容
+ * - 参数数值的转换结果与 float() 相同（普通数字直接用 PyOS_string_to_double，其余用 PyFloat_FromString）；
+ *   无法转换的参数跳过
+ * - 参数重复出现时以第一次成功转换的为准
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+/* 参数字母在 GCodeLine 构造参数中的位置（raw, code 之后），不是参数字母时为 -1 */
+static int
+param_index(Py_UCS4 ch)
+{
+    switch (ch) {
+    case 'X': return 0;
+    case 'Y': return 1;
+    case 'Z': return 2;
+    case 'E': return 3;
+    case 'J': return 4;
+    case 'F': return 5;
+    default: return -1;
+    }
+}
+
+/* 只含数字、符号、小数点和指数的 ASCII 文本直接转换，其余（inf、nan、下划线等）交给 float() 的规则 */
+static PyObject *
+parse_float(PyObject *raw, int kind, const void *data, Py_ssize_t start, Py_ssize_t end)
+{
+    char buffer[64];
+    Py_ssize_t length = end - start;
+    Py_ssize_t i;
+    PyObject *text;
+    PyObject *value;
+
+    if (length > 0 && length < (Py_ssize_t)sizeof(buffer)) {
+        for (i = 0; i < length; i++) {
+            Py_UCS4 ch = PyUnicode_READ(kind, data, start + i);
+            if (!((ch >= '0' && ch <= '9') || ch == '.' || ch == '-' || ch == '+' || ch == 'e' || ch == 'E')) {
+                break;
+            }
+            buffer[i] = (char)ch;
+        }
+        if (i == length) {
+            char *parsed_end;
+            double number;
+            buffer[length] = '\0';
+            number = PyOS_string_to_double(buffer, &parsed_end, NULL);
+            if (number == -1.0 && PyErr_Occurred()) {
+                return NULL;
+            }
+            if (parsed_end != buffer + length) {
+                PyErr_SetString(PyExc_ValueError, "could not convert string to float");
+                return NULL;
+            }
+            return PyFloat_FromDouble(number);
+        }
+    }
+
+    text = PyUnicode_Substring(raw, start, end);
+    if (text == NULL) {
+        return NULL;
+    }
+    value = PyFloat_FromString(text);
+    Py_DECREF(text);
+    return value;
+}
+
+static PyObject *
+parse_one(PyObject *raw, PyObject *line_type)
+{
+    PyObject *args[9] = {NULL};
+    PyObject *result = NULL;
+    Py_ssize_t length, semicolon, i, start;
+    int kind, k;
+    const void *data;
+
+    if (!PyUnicode_Check(raw)) {
+        PyErr_Format(PyExc_TypeError, "expected str, got %.200s", Py_TYPE(raw)->tp_name);
+        return NULL;
+    }
+#if PY_VERSION_HEX < 0x030C0000
+    if (PyUnicode_READY(raw) < 0) {
+        return NULL;
+    }
+#endif
+    length = PyUnicode_GET_LENGTH(raw);
+    kind = PyUnicode_KIND(raw);
+    data = PyUnicode_DATA(raw);
+
+    semicolon = length;
+    for (i = 0; i < length; i++) {
+        if (PyUnicode_READ(kind, data, i) == ';') {
+            semicolon = i;
+            break;
+        }
+    }
+
+    args[0] = raw;
+    /* 注释：分号之后的内容，去掉末尾的 \r\n */
+    if (semicolon < length) {
+        Py_ssize_t end = length;
+        while (end > semicolon + 1) {
+            Py_UCS4 ch = PyUnicode_READ(kind, data, end - 1);
+            if (ch != '\r' && ch != '\n') {
+                break;
+            }
+            end--;
+        }
+        args[8] = PyUnicode_Substring(raw, semicolon + 1, end);
+        if (args[8] == NULL) {
+            goto done;
+        }
+    }
+
+    /* 逐个拆分单词：第一个为指令字，其余为参数 */
+    i = 0;
+    while (1) {
+        while (i < semicolon && Py_UNICODE_ISSPACE(PyUnicode_READ(kind, data, i))) {
+            i++;
+        }
+        if (i >= semicolon) {
+            break;
+        }
+        start = i;
+        while (i < semicolon && !Py_UNICODE_ISSPACE(PyUnicode_READ(kind, data, i))) {
+            i++;
+        }
+        if (args[1] == NULL) {
+            args[1] = PyUnicode_Substring(raw, start, i);
+            if (args[1] == NULL) {
+                goto done;
+            }
+            continue;
+        }
+        k = param_index(PyUnicode_READ(kind, data, start));
+        if (k < 0 || args[2 + k] != NULL) {
+            continue;
+        }
+        args[2 + k] = parse_float(raw, kind, data, start + 1, i);
+        if (args[2 + k] == NULL) {
+            if (!PyErr_ExceptionMatches(PyExc_ValueError)) {
+                goto done;
+            }
+            PyErr_Clear();
+        }
+    }
+
+    for (k = 1; k < 9; k++) {
+        if (args[k] == NULL) {
+            args[k] = Py_None;
+            Py_INCREF(Py_None);
+        }
+    }
+    result = PyObject_Vectorcall(line_type, args, 9, NULL);
+
+done:
+    for (k = 1; k < 9; k++) {
+        Py_XDECREF(args[k]);
+    }
+    return result;
+}
+
+static PyObject *
+gcodeparse_parse_line(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    if (nargs != 2) {
+        PyErr_SetString(PyExc_TypeError, "parse_line(raw, line_type) takes exactly 2 arguments");
+        return NULL;
+    }
+    return parse_one(args[0], args[1]);
+}
+
+static PyObject *
+gcodeparse_parse_lines(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *iterator, *item, *record, *result;
+
+    if (nargs != 2) {
+        PyErr_SetString(PyExc_TypeError, "parse_lines(lines, line_type) takes exactly 2 arguments");
+        return NULL;
+    }
+    iterator = PyObject_GetIter(args[0]);
+    if (iterator == NULL) {
+        return NULL;
+    }
+    result = PyList_New(0);
+    if (result == NULL) {
+        Py_DECREF(iterator);
+        return NULL;
+    }
+    while ((item = PyIter_Next(iterator)) != NULL) {
+        record = parse_one(item, args[1]);
+        Py_DECREF(item);
+        if (record == NULL || PyList_Append(result, record) < 0) {
+            Py_XDECREF(record);
+            Py_DECREF(iterator);
+            Py_DECREF(result);
+            return NULL;
+        }
+        Py_DECREF(record);
+    }
+    Py_DECREF(iterator);
+    if (PyErr_Occurred()) {
+        Py_DECREF(result);
+        return NULL;
+    }
+    return result;
+}
+
+static PyMethodDef gcodeparse_methods[] = {
+    {"parse_line", (PyCFunction)(void (*)(void))gcodeparse_parse_line, METH_FASTCALL,
+     "parse_line(raw, line_type): 将一行文本解析为 line_type(raw, code, x, y, z, e, j, f, comment)"},
+    {"parse_lines", (PyCFunction)(void (*)(void))gcodeparse_parse_lines, METH_FASTCALL,
+     "parse_lines(lines, line_type): 将行迭代器解析为 line_type 记录列表"},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef gcodeparse_module = {
+    PyModuleDef_HEAD_INIT, "_gcodeparse", "gcodeparse 的可选 C 扩展", -1, gcodeparse_methods
+};
+
+PyMODINIT_FUNC
+PyInit__gcodeparse(void)
+{
+    return PyModule_Create(&gcodeparse_module);
+}
@@ -1,39 +1,48 @@
 import argparse
 
+from gcodeparse import parse_line, parse_lines, to_lines
+
+# 插入的固定指令
+M211_LINE = parse_line("M211 S0\n")
+T0_COMMANDS = parse_lines(["M400\n", "M280 P0 S95\n", "M400\n"])
+T1_COMMANDS = parse_lines(["M400\n", "M280 P0 S2\n", "M400\n"])
+TYPE_COMMANDS = parse_lines(["G92 E0\n", "G92 J0\n"])
+
 def add_commands_and_swap_T0_T1(file_path, output_path):
     with open(file_path, 'r') as file:
         lines = file.readlines()
 
-    # 在文件开头添加 M211 S0
-    lines.insert(0, "M211 S0\n")
+    new_lines = process_commands(parse_lines(lines))
+
+    # 将修改后的内容写入到输出文件
+    with open(output_path, 'w') as file:
+        file.writelines(to_lines(new_lines))
 
-    # 创建一个新的列表来存储修改后的行
-    new_lines = []
+def process_commands(commands):
+    """add_commands_and_swap_T0_T1 的内存版本：输入指令列表，返回添加命令并交换 T0/T1 后的指令列表"""
+    return list(stream_commands(commands))
 
-    for line in lines:
+def stream_commands(commands):
+    """process_commands 的流式版本：逐条输出，T0/T1 和 ;TYPE: 行前插入固定指令"""
+    # 在文件开头添加 M211 S0
+    yield M211_LINE
+
+    for cmd in commands:
+        line = cmd.raw
         # 如果是T0，在T0前面添加M400和M280 P0 S95
-        if 'T0' in line:
-            new_lines.append("M400\n")
-            new_lines.append("M280 P0 S95\n")
-            new_lines.append("M400\n")
-            new_lines.append(line.replace('T0', 'TEMP').replace('T1', 'T0').replace('TEMP', 'T1'))
+        if cmd.code == 'T0':
+            yield from T0_COMMANDS
+            yield parse_line(line.replace('T0', 'TEMP').replace('T1', 'T0').replace('TEMP', 'T1'))
         # 如果是T1，在T1前面添加M400和M280 P0 S2
-        elif 'T1' in line:
-            new_lines.append("M400\n")
-            new_lines.append("M280 P0 S2\n")
-            new_lines.append("M400\n")
-            new_lines.append(line.replace('T1', 'TEMP').replace('T0', 'T1').replace('TEMP', 'T0'))
+        elif cmd.code == 'T1':
+            yield from T1_COMMANDS
+            yield parse_line(line.replace('T1', 'TEMP').replace('T0', 'T1').replace('TEMP', 'T0'))
         # 如果是;TYPE:语句，在其前面添加G92 E0和G92 J0
-        elif ';TYPE:' in line:
-            new_lines.append("G92 E0\n")  # 添加G92 E0
-            new_lines.append("G92 J0\n")  # 添加G92 J0
-            new_lines.append(line)
+        elif cmd.is_type:
+            yield from TYPE_COMMANDS  # 添加G92 E0 和 G92 J0
+            yield cmd
         else:
-            new_lines.append(line)
-
-    # 将修改后的内容写入到输出文件
-    with open(output_path, 'w') as file:
-        file.writelines(new_lines)
+            yield cmd
 
 def main():
     # 设置命令行参数解析
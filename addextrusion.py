@@ -1,32 +1,21 @@
-import re
 import math
 import argparse
 
-# 提取坐标的函数
-def extract_coordinates(input_file):
-    """从G-code文件中提取X、Y、Z坐标"""
-    coordinates = []
-    original_lines = []
-    with open(input_file, 'r') as file:
-        for line in file:
-            original_line = line.strip()
-            original_lines.append(original_line)  # 保留原始行
-            if original_line:
-                parts = re.findall(r'X([+-]?\d*\.?\d+)\s*Y([+-]?\d*\.?\d+)\s*Z([+-]?\d*\.?\d+)', original_line)
-                if parts:
-                    x, y, z = map(float, parts[0])
-                    coordinates.append((x, y, z))
-                else:
-                    coordinates.append(None)  # 无坐标行为None
-            else:
-                coordinates.append(None)  # 空行为None
-    return coordinates, original_lines
+import numpy as np
+
+from gcodeparse import GCodeLine, read_commands, to_lines
+from motiontable import CMD_G0, CMD_G1, CMD_T0, CMD_T1, MotionTable, segmented_cumsum
+from pipelinelog import log
+
 
 # 计算坐标距离并根据T0和T1选择不同的计算方式
 
-def calculate_distances(coordinates, original_lines, k1, k2, f1, f2):
-    """根据T0/T1命令计算E和J值，并生成新的G-code行"""
-    output_lines = []
+def calculate_distances(commands, k1, k2, f1, f2):
+    """根据T0/T1命令计算E和J值，并生成新的G-code指令（每行以换行符结尾）"""
+    return list(iter_distances(commands, k1, k2, f1, f2))
+
+def iter_distances(commands, k1, k2, f1, f2):
+    """calculate_distances 的流式版本：逐行计算并输出，只保留上一坐标点和累积值"""
     accumulated_e = 0  # T0后的累积E值
     accumulated_j = 0  # T1后的累积J值
     previous_coordinate = None
@@ -34,39 +23,46 @@ def calculate_distances(coordinates, original_lines, k1, k2, f1, f2):
     use_e = True  # 默认使用E值计算（从T0开始）
     last_valid_e = 0  # 记录上一个有效的E值
     last_valid_j = 0  # 记录上一个有效的J值（新增）
+    f1_value = float(f1)
+    f2_value = float(f2)
 
-    for i, coordinate in enumerate(coordinates):
-        line = original_lines[i]
+    for cmd in commands:
+        code = cmd.code
 
         # 检测T0和T1命令，并更新使用的计算方式
-        if 'T0' in line:
+        if code == 'T0':
             use_e = True  # T0之后使用E值
             accumulated_j = 0  # 切换到T0时重置J
-            output_lines.append(line)  # 保留T0的行
+            yield cmd.stripped()  # 保留T0的行
             continue
-        elif 'T1' in line:
+        elif code == 'T1':
             use_e = False  # T1之后使用J值
             accumulated_e = 0  # 切换到T1时重置E
-            output_lines.append(line)  # 保留T1的行
+            yield cmd.stripped()  # 保留T1的行
             continue
 
         # 对其他行进行坐标计算处理
-        if coordinate is None:
-            output_lines.append(line)  # 保留无坐标的原始行
+        if not cmd.has_xyz:
+            yield cmd.stripped()  # 保留无坐标的原始行
             accumulated_e = 0  # 检测到无坐标行为时重置E值
             accumulated_j = 0  # 检测到无坐标行为时重置J值
             previous_coordinate = None  # 清除上一坐标
             previous_command = None  # 清除前一个命令
             continue
 
+        line = cmd.text
+        coordinate = (cmd.x, cmd.y, cmd.z)
+
         # 如果前一个命令是G1，当前命令是G0，或者前一个命令是G0，当前命令是G0，则跳过挤出量计算
-        if (previous_command == 'G1' and 'G0' in line) or (previous_command == 'G0' and 'G0' in line):
+        if (previous_command == 'G1' and code == 'G0') or (previous_command == 'G0' and code == 'G0'):
             # 根据当前文本块类型选择使用最后一个有效的E或J值
             if use_e:
-                modified_line = f"{line} E{last_valid_e:.5f} F{f1}"
+                modified = GCodeLine(f"{line} E{last_valid_e:.5f} F{f1}\n", code, cmd.x, cmd.y, cmd.z,
+                                     e=round(last_valid_e, 5), f=f1_value)
             else:
-                modified_line = f"{line} J{last_valid_j:.2f} F{f2}"
-            output_lines.append(modified_line)  # 直接保存G1到G0或G0到G0之间的命令
+                modified = GCodeLine(f"{line} J{last_valid_j:.2f} F{f2}\n", code, cmd.x, cmd.y, cmd.z,
+                                     j=round(last_valid_j, 2), f=f2_value)
+            yield modified  # 直接保存G1到G0或G0到G0之间的命令
             previous_command = 'G0'
             previous_coordinate = coordinate
             continue
@@ -79,48 +75,160 @@ def calculate_distances(coordinates, original_lines, k1, k2, f1, f2):
             if use_e:
                 e = distance * k1
                 accumulated_e += e
-                modified_line = f"{line} E{accumulated_e:.5f} F{f1}"  # 使用F1
+                modified = GCodeLine(f"{line} E{accumulated_e:.5f} F{f1}\n", code, x, y, z,
+                                     e=round(accumulated_e, 5), f=f1_value)  # 使用F1
                 last_valid_e = accumulated_e  # 更新最后一个有效的E值
             else:
                 j = distance * k2  # 直接使用k2计算J值
                 accumulated_j += j
-                modified_line = f"{line} J{accumulated_j:.2f} F{f2}"  # 使用F2
+                modified = GCodeLine(f"{line} J{accumulated_j:.2f} F{f2}\n", code, x, y, z,
+                                     j=round(accumulated_j, 2), f=f2_value)  # 使用F2
                 last_valid_j = accumulated_j  # 更新最后一个有效的J值
         else:
             # 对第一条数据直接设置E值为0.00或J值为0.00，F值由输入指定
             if use_e:
-                modified_line = f"{line} E0.00000 F{f1}"  # 使用F1
+                modified = GCodeLine(f"{line} E0.00000 F{f1}\n", code, x, y, z, e=0.0, f=f1_value)  # 使用F1
                 last_valid_e = 0  # 更新最后一个有效的E值
             else:
-                modified_line = f"{line} J0.00 F{f2}"  # 使用F2
+                modified = GCodeLine(f"{line} J0.00 F{f2}\n", code, x, y, z, j=0.0, f=f2_value)  # 使用F2
                 last_valid_j = 0  # 更新最后一个有效的J值
 
-        output_lines.append(modified_line)
-        previous_command = line.split()[0] if line.split() else None  # 记录当前命令类型
+        yield modified
+        previous_command = code  # 记录当前命令类型
         previous_coordinate = coordinate
 
+def calculate_distances_batch(commands, k1, k2, f1, f2, table=None):
+    """
+    calculate_distances 的批量版本，输出与逐行版本逐位一致：
+
+    - 各坐标行与上一坐标行的平面距离用数组一次算出
+    - E/J 累积值用分段 cumsum 计算，在无坐标行和打印头切换处重新从 0 开始
+    - G1→G0、G0→G0 的 G0 行沿用上一个有效的 E/J 值（前向填充）
+    """
+    if table is None:
+        table = MotionTable.from_commands(commands)
+    cmd = table.cmd
+    is_tool = (cmd == CMD_T0) | (cmd == CMD_T1)
+    has_xyz = ~(np.isnan(table.x) | np.isnan(table.y) | np.isnan(table.z))
+    coord = has_xyz & ~is_tool
+    no_coord = ~has_xyz & ~is_tool
+
+    # 只对坐标行计算，idx 为坐标行的行号
+    idx = np.flatnonzero(coord)
+    code = cmd[idx]
+    use_e = table.tool[idx] != 1  # T1 之后使用 J 值，其余使用 E 值
+
+    # 与上一坐标行之间没有无坐标行时，上一坐标行即为上一个点
+    resets = np.cumsum(no_coord)[idx]
+    has_prev = np.zeros(len(idx), dtype=bool)
+    has_prev[1:] = resets[1:] == resets[:-1]
+    prev_motion = np.zeros(len(idx), dtype=bool)
+    prev_motion[1:] = (code[:-1] == CMD_G0) | (code[:-1] == CMD_G1)
+
+    # G1→G0 或 G0→G0 的 G0 行不计算挤出量
+    skip = (code == CMD_G0) & has_prev & prev_motion
+    counted = has_prev & ~skip
+
+    # 平面距离；平方用 Python 的 ** 计算，与逐行版本的 math.sqrt((x - x1) ** 2 + (y - y1) ** 2) 一致
+    x = table.x[idx]
+    y = table.y[idx]
+    dx = np.zeros(len(idx))
+    dy = np.zeros(len(idx))
+    dx[1:] = x[1:] - x[:-1]
+    dy[1:] = y[1:] - y[:-1]
+    rows = np.flatnonzero(counted)
+    squares = np.array([a ** 2 + b ** 2 for a, b in zip(dx[rows].tolist(), dy[rows].tolist())])
+    increment = np.zeros(len(idx))
+    if rows.size:
+        distance = np.sqrt(squares)
+        increment[rows] = np.where(use_e[rows], distance * k1, distance * k2)
+
+    # E 在无坐标行和 T1 处清零，J 在无坐标行和 T0 处清零
+    e_segments = np.cumsum(no_coord | (cmd == CMD_T1))[idx]
+    j_segments = np.cumsum(no_coord | (cmd == CMD_T0))[idx]
+    accumulated_e = segmented_cumsum(np.where(use_e, increment, 0.0), e_segments)
+    accumulated_j = segmented_cumsum(np.where(use_e, 0.0, increment), j_segments)
+    values = np.where(use_e, accumulated_e, accumulated_j)
+
+    # 跳过的 G0 行沿用同一模式下上一个有效值（没有时为 0）
+    for mode in (True, False):
+        valid = ~skip & (use_e == mode)
+        last = np.maximum.accumulate(np.where(valid, np.arange(len(idx)), -1))
+        target = skip & (use_e == mode)
+        values[target] = np.where(last[target] >= 0, values[np.maximum(last[target], 0)], 0.0)
+
+    # 生成文本：E/J 数值一次性按 .5f/.2f 格式化（与逐行 f-string 结果相同）
+    texts = [None] * len(idx)
+    for mode, fmt in ((True, "%.5f\n"), (False, "%.2f\n")):
+        positions = np.flatnonzero(use_e == mode).tolist()
+        formatted = (fmt * len(positions) % tuple(values[positions].tolist())).split("\n")
+        for position, text in zip(positions, formatted):
+            texts[position] = text
+
+    output_lines = list(commands)
+    for i in np.flatnonzero(~coord).tolist():
+        output_lines[i] = commands[i].stripped()
+    f1_value = float(f1)
+    f2_value = float(f2)
+    for i, text, e_mode in zip(idx.tolist(), texts, use_e.tolist()):
+        cmd_line = commands[i]
+        if e_mode:
+            output_lines[i] = GCodeLine(f"{cmd_line.raw.strip()} E{text} F{f1}\n", cmd_line.code, cmd_line.x, cmd_line.y,
+                                        cmd_line.z, e=float(text), f=f1_value)
+        else:
+            output_lines[i] = GCodeLine(f"{cmd_line.raw.strip()} J{text} F{f2}\n", cmd_line.code, cmd_line.x, cmd_line.y,
+                                        cmd_line.z, j=float(text), f=f2_value)
     return output_lines
 
 # 处理主程序
-def process_jcount(input_file_path, output_file_path, w, h, k2, f1, f2):
+def process_jcount(input_file_path, output_file_path, w, h, k2, f1, f2, batch=True):
     """处理G-code文件，计算并添加E和J值"""
-    coordinates, original_lines = extract_coordinates(input_file_path)
-    if not coordinates:
-        print("未提取到坐标数据.")
+    commands = read_commands(input_file_path)
+    if not commands:
+        log("未提取到坐标数据.")
         return
 
-    # 计算K1
-    k1 = (w * h) / (math.pi * (7 / 8) ** 2)
-
-    # 处理G-code
-    output_lines = calculate_distances(coordinates, original_lines, k1, k2, f1, f2)
+    output_lines = calculate_extrusion(commands, w, h, k2, f1, f2, batch)
 
     # 写入输出文件
     with open(output_file_path, 'w') as file:
-        for line in output_lines:
-            file.write(line + "\n")
+        file.writelines(to_lines(output_lines))
 
-    print(f"处理后的数据已保存到 {output_file_path}")
+    log(f"处理后的数据已保存到 {output_file_path}")
+
+def process_commands(commands, w, h, k2, f1, f2, batch=True):
+    """process_jcount 的内存版本：输入指令列表，返回添加E和J值后的指令列表"""
+    if not commands:
+        raise ValueError("未提取到坐标数据.")
+
+    return calculate_extrusion(commands, w, h, k2, f1, f2, batch)
+
+def stream_commands(commands, w, h, k2, f1, f2):
+    """process_commands 的流式版本：逐行计算E和J值（不使用批量计算），输入为空时抛出 ValueError"""
+    empty = True
+    for line in iter_distances(commands, calculate_k1(w, h), k2, f1, f2):
+        empty = False
+        yield line
+    if empty:
+        raise ValueError("未提取到坐标数据.")
+
+def calculate_k1(w, h):
+    """根据线宽和层厚计算K1"""
+    return (w * h) / (math.pi * (7 / 8) ** 2)
+
+def calculate_extrusion(commands, w, h, k2, f1, f2, batch=True):
+    """
+    根据线宽和层厚计算K1，并返回添加E和J值后的G-code指令。
+
+    batch 为 True 时使用 NumPy 批量计算（calculate_distances_batch），否则逐行计算。
+    """
+    # 计算K1
+    k1 = calculate_k1(w, h)
+
+    # 处理G-code
+    if batch:
+        return calculate_distances_batch(commands, k1, k2, f1, f2)
+    return calculate_distances(commands, k1, k2, f1, f2)
 
 def main():
     # 设置命令行参数解析
@@ -132,10 +240,11 @@ def main():
     parser.add_argument('--k2', type=float, required=True, help='K2值')
     parser.add_argument('--f1', type=float, required=True, help='F1进给速度')
     parser.add_argument('--f2', type=float, required=True, help='F2进给速度')
+    parser.add_argument('--no-batch', action='store_true', help='逐行计算（不使用 NumPy 批量计算）')
     args = parser.parse_args()
 
     # 调用处理函数
-    process_jcount(args.input, args.output, args.w, args.h, args.k2, args.f1, args.f2)
+    process_jcount(args.input, args.output, args.w, args.h, args.k2, args.f1, args.f2, not args.no_batch)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
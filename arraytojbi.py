@@ -1,94 +1,134 @@
 import numpy as np
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 
-def process_array_to_jbi(input_file, output_folder, user=2, tool=0):
+# 点数组第 7 列标记对应的夹爪指令（1：M280 P0 S2 之后，2：剪切，3：M280 P0 S95 之后）
+HAND_COMMANDS = {
+    1: 'HAND HNO: 1 ON\n',
+    2: 'HAND HNO: 2 ON\nTIMER T=1.00\nHAND HNO: 2 OFF\n',
+    3: 'HAND HNO: 1 OFF\n',
+}
+
+# 每个 JBI 文件默认的最大数据点数量
+POINTS_PER_JOB = 9500
+# 位置变量编号为 5 位数字（C00000～C99999、EC00000～EC99999），
+# 每个点占用 1 个 C 变量和 2 个 EC 变量，因此一个文件最多 50000 个点
+MAX_POINTS_PER_JOB = 100000 // 2
+
+def process_array_to_jbi(input_file, output_folder, user=2, tool=0, workers=None, points_per_job=POINTS_PER_JOB,
+                         balance=False, log=print):
     # 读取输入数据
     try:
-        F = np.loadtxt(input_file)  # 假设输入文件是TXT格式，每行包含多个值
+        F = load_array(input_file)
     except Exception as e:
-        print(f"读取输入文件时发生错误: {str(e)}")
+        log(f"读取输入文件时发生错误: {str(e)}")
         return
 
+    return write_jbi_files(F, output_folder, user, tool, workers, points_per_job, balance, log)
+
+def load_array(input_file):
+    """
+    读取点数组：.npy 文件按内存映射方式打开（不复制、不解析文本），
+    其他文件按 TXT 格式读取，每行包含多个值。
+    """
+    if input_file.endswith(".npy"):
+        return np.load(input_file, mmap_mode="r")
+    return np.loadtxt(input_file)
+
+def write_jbi_files(F, output_folder, user=2, tool=0, workers=None, points_per_job=POINTS_PER_JOB, balance=False,
+                    log=print):
+    """
+    process_array_to_jbi 的内存版本：直接根据点数组生成 JBI 文件。
+
+    每个文件最多 points_per_job 个点（见 chunk_sizes），balance 为 True 时各文件点数平均分配。
+
+    各 JBI 文件互不相关，workers 不为 1 时用多个进程同时生成（默认进程数为 CPU 核数，
+    只有一个文件时不启动进程池），输出与逐个生成完全相同。返回生成的文件路径列表。
+    提示信息通过 log 输出（默认打印）。
+    """
     m, n = F.shape  # 获取数据的行数和列数
     if n < 7:
-        print("输入数据的列数不足7列，请确保每行包含7个值。")
+        log("输入数据的列数不足7列，请确保每行包含7个值。")
         return
 
-    # 设置每个JBI文件的最大数据点数量
-    filen = 9500
-    num_files = m // filen
-
-    # 定义JBI文件的格式字符串，包含 user 和 tool 占位符
-    Jformat = '/JOB\n//NAME {name}\n//POS\n///NPOS {npos1},0,{npos2},0,0,0\n///USER {user}\n///TOOL {tool}\n///POSTYPE USER\n///RECTAN\n///RCONF 1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0\n'
-    Cformat = 'C{:05d}={:.3f},{:.3f},{:.3f},180,0,0\n'
-    Eformat = 'EC{:05d}={}\nEC{:05d}={}\n'
-    Mformat = 'MOVL C{:05d} V={:.1f} +MOVJ EC{:05d} +MOVJ EC{:05d}\n'
+    sizes = chunk_sizes(m, points_per_job, balance)
 
     # 确保输出文件夹存在
     if not os.path.exists(output_folder):
         os.makedirs(output_folder)
 
-    # 生成JBI文件
-    for i in range(num_files):
-        filename = os.path.join(output_folder, f'{i + 1}.JBI')
-        with open(filename, 'w') as fid:
-            # 使用动态的 user 和 tool 参数格式化 Jformat
-            fid.write(Jformat.format(name=i + 1, npos1=filen, npos2=2 * filen, user=user, tool=tool))
-            for j in range(filen * i, filen * (i + 1)):
-                cR = (j % filen)
-                fid.write(Cformat.format(cR, F[j, 0], F[j, 1], F[j, 2]))
-
-            fid.write('///POSTYPE PULSE\n///PULSE\n')
-            for j in range(filen * i, filen * (i + 1)):
-                eR1 = 2 * (j % filen)
-                eR2 = eR1 + 1
-                fid.write(Eformat.format(eR1, int(F[j, 3]), eR2, int(F[j, 4])))
-
-            # 在 INST 部分也使用动态 user 参数
-            fid.write(f'//INST\n///DATE 2019/10/30 19:46\n///ATTR SC,RW,RJ\n////FRAME USER {user}\n///GROUP1 RB1\n///GROUP2 ST2\n///GROUP3 ST3\nNOP\n')
-            for j in range(filen * i, filen * (i + 1)):
-                cR = (j % filen)
-                eR1 = 2 * (j % filen)
-                eR2 = eR1 + 1
-                v = F[j, 5]
-                fid.write(Mformat.format(cR, v, eR1, eR2))
-                if F[j, 6] == 1:
-                    fid.write('HAND HNO: 1 ON\n')
-                elif F[j, 6] == 2:
-                    fid.write('HAND HNO: 2 ON\nTIMER T=1.00\nHAND HNO: 2 OFF\n')
-                elif F[j, 6] == 3:
-                    fid.write('HAND HNO: 1 OFF\n')
-            fid.write('END\n')
-
-    # 处理剩余的数据点
-    lm = m % filen  # 剩余的数据点数
-    if lm > 0:
-        filename = os.path.join(output_folder, f'{num_files + 1}.JBI')
-        with open(filename, 'w') as fid:
-            # 使用动态的 user 和 tool 参数格式化 Jformat
-            fid.write(Jformat.format(name=num_files + 1, npos1=lm, npos2=2 * lm, user=user, tool=tool))
-            for i in range(num_files * filen, num_files * filen + lm):
-                cR = (i % filen)
-                fid.write(Cformat.format(cR, F[i, 0], F[i, 1], F[i, 2]))
-            fid.write('///POSTYPE PULSE\n///PULSE\n')
-            for j in range(filen * num_files, filen * num_files + lm):
-                eR1 = 2 * (j % filen)
-                eR2 = eR1 + 1
-                fid.write(Eformat.format(eR1, int(F[j, 3]), eR2, int(F[j, 4])))
-            # 在 INST 部分也使用动态 user 参数
-            fid.write(f'//INST\n///DATE 2019/10/30 19:46\n///ATTR SC,RW,RJ\n////FRAME USER {user}\n///GROUP1 RB1\n///GROUP2 ST2\n///GROUP3 ST3\nNOP\n')
-            for j in range(filen * num_files, filen * num_files + lm):
-                cR = (j % filen)
-                eR1 = 2 * (j % filen)
-                eR2 = eR1 + 1
-                v = F[j, 5]
-                fid.write(Mformat.format(cR, v, eR1, eR2))
-                if F[j, 6] == 1:
-                    fid.write('HAND HNO: 1 ON\n')
-                elif F[j, 6] == 2:
-                    fid.write('HAND HNO: 2 ON\nTIMER T=1.00\nHAND HNO: 2 OFF\n')
-                elif F[j, 6] == 3:
-                    fid.write('HAND HNO: 1 OFF\n')
-            fid.write('END\n')
-
-    print('JBI conversion completed successfully for all files.')
\ No newline at end of file
+    jobs = []
+    start = 0
+    for i, size in enumerate(sizes):
+        jobs.append((os.path.join(output_folder, f'{i + 1}.JBI'), i + 1, F[start:start + size], user, tool))
+        start += size
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(jobs))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # 逐个取结果，子进程中的异常在这里抛出
+            for _ in executor.map(write_jbi_file, *zip(*jobs)):
+                pass
+    else:
+        for job in jobs:
+            write_jbi_file(*job)
+
+    log('JBI conversion completed successfully for all files.')
+    return [job[0] for job in jobs]
+
+def chunk_sizes(count, points_per_job=POINTS_PER_JOB, balance=False):
+    """
+    返回各 JBI 文件的点数。
+
+    默认每 points_per_job 个点一个文件，剩余的数据点单独一个文件；
+    balance 为 True 时先按总点数算出所需的文件数（与默认相同），再把点数平均分配到各文件
+    （相差不超过 1），避免最后只剩一个很小的文件。
+    """
+    if not 1 <= points_per_job <= MAX_POINTS_PER_JOB:
+        raise ValueError(f"每个 JBI 文件的点数应在 1～{MAX_POINTS_PER_JOB} 之间: {points_per_job}")
+    if not balance:
+        sizes = [points_per_job] * (count // points_per_job)
+        if count % points_per_job:
+            sizes.append(count % points_per_job)
+        return sizes
+    files = -(-count // points_per_job)
+    return [count // files + (1 if i < count % files else 0) for i in range(files)]
+
+def write_jbi_file(filename, name, points, user, tool):
+    """生成一个 JBI 文件，points 为该文件的点"""
+    with open(filename, 'w') as fid:
+        fid.write(format_jbi(points, name, user, tool))
+
+def format_jbi(points, name, user=2, tool=0):
+    """
+    生成一个 JBI 文件的全部文本。
+
+    C、EC、MOVL 三部分各自把整列数值一次性代入重复的格式串（"格式" * 行数 % 数值），
+    不再逐行调用 str.format，结果与逐行格式化相同。
+    """
+    count = len(points)
+    index = range(count)
+    x, y, z, e, j, v, flag = (points[:, c].tolist() for c in range(7))
+    # int() 取整（向零截断）
+    e = [int(value) for value in e]
+    j = [int(value) for value in j]
+
+    # 定义JBI文件的格式字符串，使用 user 和 tool 参数
+    header = (f'/JOB\n//NAME {name}\n//POS\n///NPOS {count},0,{2 * count},0,0,0\n///USER {user}\n///TOOL {tool}\n'
+              '///POSTYPE USER\n///RECTAN\n///RCONF 1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0\n')
+    positions = ('C%05d=%.3f,%.3f,%.3f,180,0,0\n' * count) % tuple(chain.from_iterable(zip(index, x, y, z)))
+    pulses = ('EC%05d=%d\nEC%05d=%d\n' * count) % tuple(
+        chain.from_iterable(zip(range(0, 2 * count, 2), e, range(1, 2 * count, 2), j)))
+
+    # 在 INST 部分也使用动态 user 参数
+    inst = (f'//INST\n///DATE 2019/10/30 19:46\n///ATTR SC,RW,RJ\n////FRAME USER {user}\n'
+            '///GROUP1 RB1\n///GROUP2 ST2\n///GROUP3 ST3\nNOP\n')
+    # 每个点的 MOVL 之后按标记追加夹爪指令
+    hands = [HAND_COMMANDS.get(value, '') for value in flag]
+    moves = ('MOVL C%05d V=%.1f +MOVJ EC%05d +MOVJ EC%05d\n%s' * count) % tuple(
+        chain.from_iterable(zip(index, v, range(0, 2 * count, 2), range(1, 2 * count, 2), hands)))
+
+    return ''.join((header, positions, '///POSTYPE PULSE\n///PULSE\n', pulses, inst, moves, 'END\n'))
@@ -0,0 +1,209 @@
+import argparse
+import copy
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from pipelinestats import display_width
+from readjson import process_files, sliceSTL
+
+# 批量处理的汇总文件名（保存在输出根文件夹）
+SUMMARY_NAME = "batch_summary.json"
+# 每个任务的提示信息保存在该任务输出文件夹中的这个文件里
+LOG_NAME = "job.log"
+
+
+def load_jobs(source):
+    """
+    读取任务列表，source 为文件夹或清单文件：
+
+    - 文件夹：其中每个 .stl 文件为一个任务（按文件名排序）
+    - 清单（JSON）：任务列表，或 {"jobs": [...]}；每个任务为 STL 路径，或
+      {"stl": 路径, "name": 输出文件夹名, "json_config": {...}, "gcode_processor": {...}}，
+      json_config、gcode_processor 中的参数覆盖基础配置中的同名参数；相对路径相对于清单所在文件夹
+
+    返回 [{"name", "stl", "json_config", "gcode_processor"}]，name 默认为 STL 文件名（重复时加序号）。
+    """
+    if os.path.isdir(source):
+        entries = [os.path.join(source, name) for name in sorted(os.listdir(source))
+                   if name.lower().endswith(".stl")]
+        base_folder = source
+    else:
+        with open(source, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        if isinstance(entries, dict):
+            entries = entries.get("jobs", [])
+        base_folder = os.path.dirname(os.path.abspath(source))
+
+    jobs = []
+    names = set()
+    for entry in entries:
+        if isinstance(entry, str):
+            entry = {"stl": entry}
+        if "stl" not in entry:
+            raise ValueError(f"任务缺少 stl 路径: {entry}")
+        stl = os.path.abspath(os.path.join(base_folder, entry["stl"]))
+        name = base = entry.get("name") or os.path.splitext(os.path.basename(stl))[0]
+        index = 2
+        while name in names:
+            name = f"{base}_{index}"
+            index += 1
+        names.add(name)
+        jobs.append({"name": name, "stl": stl, "json_config": entry.get("json_config", {}),
+                     "gcode_processor": entry.get("gcode_processor", {})})
+    return jobs
+
+
+def job_config(config_data, job):
+    """基础配置加上任务中的参数覆盖（不修改基础配置）"""
+    config = copy.deepcopy(config_data)
+    for section in ("json_config", "gcode_processor"):
+        config.setdefault(section, {}).update(job[section])
+    return config
+
+
+def jbi_files(folder):
+    """文件夹中的 JBI 文件名列表"""
+    return [name for name in os.listdir(folder) if name.endswith(".JBI")]
+
+
+def run_job(job, config_data, output_root, options):
+    """
+    切片并处理一个任务（在进程池中执行），输出保存在 output_root/任务名 中，
+    提示信息通过 log 回调写入该文件夹的 job.log。返回结果字典。
+
+    文件夹中之前运行留下的 JBI 文件先删除，jbi_files 只统计本次生成的文件。
+    """
+    output_folder = os.path.join(output_root, job["name"])
+    os.makedirs(output_folder, exist_ok=True)
+    result = {"name": job["name"], "stl": job["stl"], "output_folder": output_folder, "status": "failed",
+              "error": None, "slice_time": None, "process_time": None, "jbi_files": 0}
+    start = time.perf_counter()
+    with open(os.path.join(output_folder, LOG_NAME), "w", encoding="utf-8") as log_file:
+        def log(*args):
+            log_file.write(" ".join(str(arg) for arg in args) + "\n")
+
+        try:
+            stale = jbi_files(output_folder)
+            for name in stale:
+                os.remove(os.path.join(output_folder, name))
+            if stale:
+                log(f"已删除之前运行留下的 {len(stale)} 个 JBI 文件")
+            config = job_config(config_data, job)
+            gcode_file = sliceSTL(job["stl"], output_folder, config, cache_folder=options.get("cache_folder"),
+                                  log=log)
+            result["slice_time"] = time.perf_counter() - start
+            if not gcode_file:
+                result["error"] = "切片失败"
+            else:
+                start = time.perf_counter()
+                # 多个任务已经并行，JBI 文件默认在任务进程中逐个生成
+                jbi_workers = config["gcode_processor"].get("jbi_workers", 1)
+                ok = process_files(gcode_file, output_folder, config, jbi_workers=jbi_workers,
+                                   streaming=options.get("streaming"), profile=options.get("profile"),
+                                   cache_folder=options.get("cache_folder"), log=log)
+                result["process_time"] = time.perf_counter() - start
+                if ok:
+                    result["status"] = "ok"
+                else:
+                    result["error"] = "后处理失败"
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+            log(f"任务出错: {result['error']}")
+    result["jbi_files"] = len(jbi_files(output_folder))
+    if result["error"]:
+        result["error"] += f"（详见 {os.path.join(output_folder, LOG_NAME)}）"
+    return result
+
+
+def run_batch(jobs, config_data, output_root, workers=None, **options):
+    """
+    用进程池（默认进程数为 CPU 核数）切片并处理所有任务，返回汇总字典，
+    并在 output_root 中写出 batch_summary.json。
+
+    options 可包含 streaming、profile、cache_folder（传给 sliceSTL/process_files）。
+    """
+    os.makedirs(output_root, exist_ok=True)
+    workers = min(workers or os.cpu_count() or 1, max(len(jobs), 1))
+    started = time.strftime("%Y-%m-%d %H:%M:%S")
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_job, job, config_data, output_root, options): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:  # 子进程异常退出等
+                result = {"name": job["name"], "stl": job["stl"], "status": "failed",
+                          "error": f"{type(e).__name__}: {e}"}
+            results.append(result)
+            print(f"[{len(results)}/{len(jobs)}] {result['name']}: "
+                  f"{'完成' if result['status'] == 'ok' else '失败 - ' + result['error']}")
+
+    order = {job["name"]: i for i, job in enumerate(jobs)}
+    results.sort(key=lambda result: order[result["name"]])
+    summary = {
+        "started": started,
+        "wall_time": time.perf_counter() - start,
+        "workers": workers,
+        "succeeded": sum(1 for result in results if result["status"] == "ok"),
+        "failed": sum(1 for result in results if result["status"] != "ok"),
+        "jobs": results,
+    }
+    with open(os.path.join(output_root, SUMMARY_NAME), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=4, ensure_ascii=False)
+    return summary
+
+
+def format_summary(summary):
+    """返回汇总表文本"""
+    rows = [("任务", "状态", "切片(s)", "后处理(s)", "JBI 文件")]
+    for result in summary["jobs"]:
+        rows.append((result["name"], "完成" if result["status"] == "ok" else "失败",
+                     "-" if result.get("slice_time") is None else f"{result['slice_time']:.1f}",
+                     "-" if result.get("process_time") is None else f"{result['process_time']:.1f}",
+                     str(result.get("jbi_files", 0))))
+    widths = [max(display_width(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = ["  ".join(cell + " " * (width - display_width(cell)) for cell, width in zip(row, widths))
+             for row in rows]
+    lines.append(f"共 {len(summary['jobs'])} 个任务：成功 {summary['succeeded']}，失败 {summary['failed']}，"
+                 f"总耗时 {summary['wall_time']:.1f} s（{summary['workers']} 个进程）")
+    for result in summary["jobs"]:
+        if result["status"] != "ok":
+            lines.append(f"  {result['name']}: {result['error']}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="批量切片和处理 STL 文件（每个 STL 的输出保存在单独的文件夹）")
+    parser.add_argument("source", help="STL 文件夹，或任务清单 JSON 文件")
+    parser.add_argument("output_root", help="输出根文件夹")
+    parser.add_argument("--config", help="基础配置文件路径", default=os.path.join(os.getcwd(), '1231.json'))
+    parser.add_argument("--workers", type=int, help="同时处理的任务数（默认为 CPU 核数）")
+    parser.add_argument("--streaming", action="store_true", help="流式处理（适用于很大的 G-code 文件）")
+    parser.add_argument("--profile", action="store_true", help="每个任务输出性能报告")
+    parser.add_argument("--cache-folder", help="切片结果和中间结果的缓存文件夹（各任务共用）")
+    args = parser.parse_args()
+
+    try:
+        with open(args.config, 'r', encoding='utf-8') as f:
+            config_data = json.load(f)
+        jobs = load_jobs(args.source)
+    except Exception as e:
+        print(f"错误: {str(e)}")
+        return
+    if not jobs:
+        print(f"{args.source} 中没有 STL 任务")
+        return
+
+    summary = run_batch(jobs, config_data, args.output_root, args.workers,
+                        streaming=True if args.streaming else None, profile=True if args.profile else None,
+                        cache_folder=args.cache_folder)
+    print(format_summary(summary))
+    print(f"汇总已保存至 {os.path.join(args.output_root, SUMMARY_NAME)}")
+
+
+if __name__ == "__main__":
+    main()
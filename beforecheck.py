@@ -1,65 +1,173 @@
 import sys
-import re
 
+import numpy as np
 
-def process_gcode_file(input_file, output_file):
+from gcodeparse import (BLANK_LINE, GCodeLine, iter_strip_last_newline, parse_line, parse_lines,
+                        replace_params, strip_last_newline, to_lines)
+
+# 拆分 J 值停滞处时插入的打印头行
+T1_LINE = parse_line("T1\n")
+
+# 打印头指令对应的编号
+TOOL_CODES = {"T0": 0, "T1": 1}
+
+
+def process_gcode_file(input_file, output_file, batch=True):
     with open(input_file, 'r') as f:
         lines = f.readlines()
 
-    output_lines = []
+    output_lines = process_commands(parse_lines(lines), batch)
+
+    # 写入输出文件
+    with open(output_file, 'w') as f:
+        f.writelines(to_lines(output_lines))
+
+
+def process_commands(commands, batch=True):
+    """
+    process_gcode_file 的内存版本：输入指令列表，返回与输出文件内容一致的指令列表。
+
+    batch 为 True 时使用 NumPy 批量计算（split_stalled_j_batch），否则逐行计算。
+    """
+    if batch:
+        return strip_last_newline(split_stalled_j_batch(commands))
+    return strip_last_newline(split_stalled_j(commands))
+
+
+def stream_commands(commands):
+    """process_commands 的流式版本：逐行输出，最后一行不带换行符"""
+    return iter_strip_last_newline(iter_split_stalled_j(commands))
+
+
+def split_stalled_j(commands):
+    """在 T1 块中 J 值停滞处拆分出新的 T1 块，并从拆分点重新计算 J 值，返回每行以换行符结尾的指令列表"""
+    return list(iter_split_stalled_j(commands))
+
+
+def iter_split_stalled_j(commands):
+    """split_stalled_j 的流式版本：逐行输出，只记录上一个 J 值和最近输出的 TYPE 行"""
     in_t1_block = False
+    last_type = None  # 最近输出的 ;TYPE: 行
     prev_j_value = None
     j_offset = 0.0  # 用于记录当前段的J值偏移量
 
-    for line in lines:
-        line = line.strip()
-
+    for cmd in commands:
         # 检查是否是T1开始的数据块
-        if line.startswith('T1'):
+        if cmd.code == 'T1':
             in_t1_block = True
             j_offset = 0.0  # 重置偏移量
-            output_lines.append(line)
+            yield cmd.stripped()
             continue
         # 检查是否是T0或其他打印头，结束T1检测
-        elif line.startswith('T0'):
+        elif cmd.code == 'T0':
             in_t1_block = False
             j_offset = 0.0  # 重置偏移量
-            output_lines.append(line)
+            yield cmd.stripped()
             continue
 
+        line = cmd.stripped()
+
         # 如果在T1块中
         if in_t1_block:
             # 提取当前行的J值（如果有）
-            j_match = re.search(r'J([\d.]+)', line)
-            current_j = float(j_match.group(1)) if j_match else None
+            current_j = cmd.j
 
             # 如果当前行有J值
             if current_j is not None:
                 # 如果与前一个J值相等
                 if prev_j_value is not None and abs(current_j - prev_j_value) < 0.0001:
                     # 添加空行、打印头和类型
-                    output_lines.append('')
-                    output_lines.append('T1')
-                    # 查找上一条TYPE行
-                    for prev_line in reversed(output_lines):
-                        if prev_line.startswith(';TYPE:'):
-                            output_lines.append(prev_line)
-                            break
+                    yield BLANK_LINE
+                    yield T1_LINE
+                    # 重复上一条TYPE行
+                    if last_type is not None:
+                        yield last_type
                     # 更新J值偏移量，从这行开始重新计算
                     j_offset = current_j
 
                 # 处理当前行的J值（无论是否分割，都应用偏移量）
                 new_j = current_j - j_offset
-                line = re.sub(r'J[\d.]+', f'J{new_j:.2f}', line)
+                line = replace_params(line, J=(round(new_j, 2), f"{new_j:.2f}"))
 
                 # 更新prev_j_value
                 prev_j_value = current_j
 
-        output_lines.append(line)
-
-    # 写入输出文件
-    with open(output_file, 'w') as f:
-        f.write('\n'.join(output_lines))
+        if line.is_type:
+            last_type = line
+        yield line
+
+
+def split_stalled_j_batch(commands):
+    """
+    split_stalled_j 的批量版本，输出与逐行版本逐位一致：
+
+    - T1 块中带 J 的行依次排列，相邻两行 J 值之差小于 0.0001 处为停滞点
+      （上一个 J 值不随 T0/T1 重置，与逐行版本相同）
+    - 每行的 J 偏移量为同一 T 块中该行及之前最后一个停滞点的 J 值，没有时为 0
+    - 停滞点之前最近的 ;TYPE: 行用前向下标求出，拼接输出时与空行、T1 一起插入
+    """
+    n = len(commands)
+    lines = [cmd.stripped() for cmd in commands]
+    # None 转换为 float64 时为 NaN，另用 has_j 区分 J 缺省和 Jnan
+    j_column = np.array([cmd.j for cmd in commands], dtype=np.float64).reshape(n)
+    has_j = np.array([cmd.j is not None for cmd in commands], dtype=bool).reshape(n)
+    tool_at = np.array([TOOL_CODES.get(cmd.code, -1) for cmd in commands], dtype=np.int8).reshape(n)
+    is_tool = tool_at >= 0
+    last_tool = np.maximum.accumulate(np.where(is_tool, np.arange(n), -1))
+    in_t1_block = (last_tool >= 0) & (tool_at[last_tool] == 1)
+
+    # T1 块中带 J 的行
+    rows = np.flatnonzero(has_j & ~is_tool & in_t1_block)
+    j = j_column[rows]
+    stall = np.zeros(len(rows), dtype=bool)
+    with np.errstate(invalid='ignore'):  # Jinf 相减得到 NaN，按不相等处理
+        stall[1:] = np.abs(np.diff(j)) < 0.0001
+
+    # J 偏移量：同一 T 块（T0/T1 处重新开始）中最后一个停滞点的 J 值
+    segment = np.cumsum(is_tool)[rows]
+    last_stall = np.maximum.accumulate(np.where(stall, np.arange(len(rows)), -1))
+    anchor = np.maximum(last_stall, 0)
+    offset = np.where((last_stall >= 0) & (segment[anchor] == segment), j[anchor], 0.0)
+    new_j = j - offset
+
+    # 生成文本：J 值一次性按 .2f 格式化（与逐行 f-string 结果相同）
+    texts = ("%.2f\n" * len(rows) % tuple(new_j.tolist())).split("\n")
+    for i, text in zip(rows.tolist(), texts):
+        lines[i] = replace_j(lines[i], text)
+
+    # 拼接输出：停滞点前插入空行、T1 和最近的 TYPE 行
+    stall_rows = rows[stall].tolist()
+    if stall_rows:
+        type_mask = np.zeros(n, dtype=bool)
+        type_mask[[i for i, cmd in enumerate(commands) if cmd.is_type]] = True
+        last_type = np.maximum.accumulate(np.where(type_mask, np.arange(n), -1))
+    output = []
+    start = 0
+    for i in stall_rows:
+        output += lines[start:i]
+        output.append(BLANK_LINE)
+        output.append(T1_LINE)
+        if last_type[i] >= 0:
+            output.append(lines[last_type[i]])
+        start = i
+    output += lines[start:]
+    return output
+
+
+def replace_j(line, text):
+    """
+    将已去除首尾空白的行中的 J 参数替换为 text，等价于 replace_params(line, J=(float(text), text))。
+    参数以单个空格分隔、只有一个 J 参数且没有注释时直接拼接文本，不重新拆分；J 文本不变时返回原记录。
+    """
+    body = line.raw[:-1]
+    # isprintable() 为 False 时含有空格以外的空白字符
+    if ";" in body or "  " in body or not body.isprintable() or body.count(" J") != 1:
+        return replace_params(line, J=(float(text), text))
+    head, _, rest = body.partition(" J")
+    value, space, tail = rest.partition(" ")
+    if value == text:
+        return line
+    return GCodeLine(f"{head} J{text}{space}{tail}\n", line.code, line.x, line.y, line.z, line.e, float(text), line.f)
 
 
 def main():
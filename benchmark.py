@@ -0,0 +1,217 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from functools import partial
+
+import numpy as np
+
+import arraytojbi
+import gcodeparse
+import trans_gcode_to_array
+from gcodesynth import parse_range, parse_type_mix, write_cura_gcode
+from pipeline import ARRAY_NAME, DEFAULT_PARAMS, build_steps, run_pipeline
+from pipelinestats import display_width
+
+# 整条流程的测试模式
+CHAIN_MODES = ("memory", "streaming", "dump")
+
+
+def file_size(path):
+    """文件字节数，path 为文件夹时为其中所有文件之和"""
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+    return os.path.getsize(path)
+
+
+def count_lines(path):
+    """文件行数"""
+    with open(path, "rb") as f:
+        return sum(1 for _ in f)
+
+
+def timed(func, *args, repeat=1):
+    """调用 func(*args) repeat 次（不输出各步骤的打印信息），返回最短耗时（秒）"""
+    best = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func(*args)
+            seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def throughput(record, seconds, lines, size):
+    """在记录中加入耗时和吞吐量（行/秒、MB/秒，按输入计算）"""
+    record["seconds"] = seconds
+    record["input_lines"] = lines
+    record["input_bytes"] = size
+    record["lines_per_second"] = lines / seconds if seconds else None
+    record["mb_per_second"] = size / 2 ** 20 / seconds if seconds else None
+    return record
+
+
+def bench_stages(input_path, work_folder, params, repeat=1, fused=False):
+    """
+    逐个测试各步骤的文件版本函数（reorganization.process_file … arraytojbi.process_array_to_jbi），
+    每一步的输入为上一步的输出文件。fused 为 True 时测试合并后的步骤。
+    """
+    results = []
+    current = input_path
+    stages = [(file_func.__module__ + "." + file_func.__name__, file_func, name, args)
+              for name, file_func, _, _, args in build_steps(params, fused=fused)]
+    stages.append(("trans_gcode_to_array.process_gcode_to_array", trans_gcode_to_array.process_gcode_to_array,
+                   ARRAY_NAME, ()))
+    for stage, func, name, args in stages:
+        output_path = os.path.join(work_folder, name)
+        seconds = timed(func, current, output_path, *args, repeat=repeat)
+        results.append(throughput({"stage": stage}, seconds, count_lines(current), file_size(current)))
+        current = output_path
+
+    # 第 19 步的输入为点数组，按点数计算行数
+    jbi_folder = os.path.join(work_folder, "jbi")
+    seconds = timed(arraytojbi.process_array_to_jbi, current, jbi_folder, params["user"], params["tool"],
+                    repeat=repeat)
+    points = len(np.load(current, mmap_mode="r"))
+    results.append(throughput({"stage": "arraytojbi.process_array_to_jbi"}, seconds, points, file_size(current)))
+    return results
+
+
+def bench_chains(input_path, work_folder, params, modes=CHAIN_MODES, repeat=1, fused=False):
+    """测试整条流程（run_pipeline）在各模式下的耗时"""
+    lines = count_lines(input_path)
+    size = file_size(input_path)
+    results = []
+    for mode in modes:
+        output_folder = os.path.join(work_folder, "chain_" + mode)
+        os.makedirs(output_folder, exist_ok=True)
+        run = partial(run_pipeline, dump_intermediates=mode == "dump", streaming=mode == "streaming", fused=fused)
+        seconds = timed(run, input_path, output_folder, params, repeat=repeat)
+        results.append(throughput({"mode": mode}, seconds, lines, size))
+    return results
+
+
+def git_commit():
+    """当前代码的 git 提交号，无法获取时返回 None"""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(layer_counts, repeat=1, modes=CHAIN_MODES, stages=True, fused=False, **options):
+    """
+    对每个层数生成合成 G-code，测试各步骤和整条流程，返回结果字典。
+    fused 为 True 时使用合并后的步骤（见 pipeline.build_steps）。
+
+    options 传给 gcodesynth.write_cura_gcode（type_mix、t1_ratio、segments、islands、seed 等）。
+    """
+    results = {
+        "commit": git_commit(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "parser": gcodeparse.BACKEND,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": repeat,
+        "fused": fused,
+        "generator": {key: value for key, value in options.items()},
+        "cases": [],
+    }
+    for layers in layer_counts:
+        with tempfile.TemporaryDirectory() as work_folder:
+            input_path = os.path.join(work_folder, "input.gcode")
+            write_cura_gcode(input_path, layers=layers, **options)
+            case = {"layers": layers, "lines": count_lines(input_path), "bytes": file_size(input_path)}
+            print(f"{layers} 层：{case['lines']} 行，{case['bytes'] / 2 ** 20:.2f} MB")
+            if stages:
+                stage_folder = os.path.join(work_folder, "stages")
+                os.makedirs(stage_folder)
+                case["stages"] = bench_stages(input_path, stage_folder, DEFAULT_PARAMS, repeat, fused)
+            case["chains"] = bench_chains(input_path, work_folder, DEFAULT_PARAMS, modes, repeat, fused)
+            results["cases"].append(case)
+    return results
+
+
+def print_results(results):
+    """打印结果表"""
+    for case in results["cases"]:
+        print(f"\n{case['layers']} 层（{case['lines']} 行，{case['bytes'] / 2 ** 20:.2f} MB）")
+        for record in case.get("stages", []) + case["chains"]:
+            name = record.get("stage") or f"整条流程（{record['mode']}）"
+            print(f"  {name}{' ' * (48 - display_width(name))} {record['seconds']:9.3f} s  {record['lines_per_second'] or 0:12.0f} 行/s  "
+                  f"{record['mb_per_second'] or 0:8.2f} MB/s")
+
+
+def compare_results(results, baseline, threshold=1.2):
+    """
+    与之前保存的结果比较耗时，返回变慢超过 threshold 倍的项目列表 [(名称, 之前, 现在)]。
+
+    只比较层数相同的测试用例。
+    """
+    previous = {}
+    for case in baseline["cases"]:
+        for record in case.get("stages", []) + case["chains"]:
+            previous[(case["layers"], record.get("stage") or record["mode"])] = record["seconds"]
+
+    slower = []
+    for case in results["cases"]:
+        for record in case.get("stages", []) + case["chains"]:
+            key = (case["layers"], record.get("stage") or record["mode"])
+            if key in previous and previous[key] and record["seconds"] > previous[key] * threshold:
+                slower.append((f"{key[0]} 层 {key[1]}", previous[key], record["seconds"]))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description="G-code 后处理各步骤的性能测试（使用合成的 Cura G-code）")
+    parser.add_argument("--layers", default="20,100", help="测试的层数，逗号分隔，如 20,100,400")
+    parser.add_argument("--repeat", type=int, default=1, help="每项重复次数（取最短耗时）")
+    parser.add_argument("--modes", default=",".join(CHAIN_MODES), help="整条流程的测试模式：memory,streaming,dump")
+    parser.add_argument("--no-stages", action="store_true", help="只测试整条流程，不逐个测试各步骤")
+    parser.add_argument("--fused", action="store_true", help="使用合并后的步骤")
+    parser.add_argument("--types", type=parse_type_mix, help="类型权重，如 FILL=2,WALL-OUTER=1,SUPPORT=0.5")
+    parser.add_argument("--t1-ratio", type=float, help="T1 类型出现的比例")
+    parser.add_argument("--segments", type=parse_range, default=(10, 60), help="每段挤出的 G1 数量范围")
+    parser.add_argument("--islands", type=parse_range, default=(1, 3), help="每个类型中的挤出段数范围")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("--output", help="结果 JSON 文件路径（默认 benchmark_<提交号>_<时间>.json）")
+    parser.add_argument("--compare", help="与之前保存的结果 JSON 比较")
+    parser.add_argument("--threshold", type=float, default=1.2, help="耗时超过之前多少倍时视为变慢")
+    args = parser.parse_args()
+
+    results = run_benchmarks([int(layers) for layers in args.layers.split(",")], repeat=args.repeat,
+                             modes=[mode for mode in args.modes.split(",") if mode], stages=not args.no_stages,
+                             fused=args.fused,
+                             type_mix=args.types, t1_ratio=args.t1_ratio, segments=args.segments,
+                             islands=args.islands, seed=args.seed)
+    print_results(results)
+
+    output = args.output or f"benchmark_{results['commit'] or 'unknown'}_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=4, ensure_ascii=False)
+    print(f"\n结果已保存至 {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        slower = compare_results(results, baseline, args.threshold)
+        if slower:
+            print(f"\n以下项目比 {args.compare} 慢 {args.threshold} 倍以上：")
+            for name, before, after in slower:
+                print(f"  {name}: {before:.3f} s → {after:.3f} s")
+        else:
+            print(f"\n与 {args.compare} 相比没有明显变慢的项目")
+
+
+if __name__ == "__main__":
+    main()
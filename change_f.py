@@ -1,5 +1,8 @@
 import argparse
 
+from gcodeparse import parse_lines, replace_params, to_lines
+from pipelinelog import log
+
 
 def process_file(input_file, output_file, f_value):
     """
@@ -15,32 +18,61 @@ def process_file(input_file, output_file, f_value):
         with open(input_file, 'r') as file:
             lines = file.readlines()
 
-        # 遍历文件行，找到 T1 并处理后续 G1 命令
-        for i in range(len(lines)):
-            if lines[i].startswith('T1'):
-                count = 0
-                # 从 T1 后的行开始，替换前四个 G1 的 F 值
-                for j in range(i + 1, len(lines)):
-                    # 跳过 T0 或以 ;TYPE: 开头的行
-                    if lines[j].startswith('T0') or lines[j].startswith(';TYPE:'):
-                        continue
-                    # 处理包含 G1 和 F 的行
-                    if 'G1' in lines[j] and 'F' in lines[j]:
-                        parts = lines[j].split()
-                        for k in range(len(parts)):
-                            if parts[k].startswith('F'):
-                                parts[k] = f"F{f_value}"
-                        lines[j] = ' '.join(parts) + '\n'
-                        count += 1
-                        if count >= 4:  # 只替换前四个 G1
-                            break
+        commands = process_commands(parse_lines(lines), f_value)
 
         # 将修改后的内容写入输出文件
         with open(output_file, 'w') as file:
-            file.writelines(lines)
-        print("文件处理完成！")
+            file.writelines(to_lines(commands))
+        log("文件处理完成！")
     except Exception as e:
-        print(f"处理文件时出错: {e}")
+        log(f"处理文件时出错: {e}")
+
+
+def process_commands(commands, f_value):
+    """
+    process_file 的内存版本：替换 T1 块中前四个 G1 命令的 F 值。
+
+    参数:
+        commands (list): GCodeLine 列表（原地修改）
+        f_value (float): 要替换的 F 值
+
+    返回:
+        list: 处理后的指令列表
+    """
+    f_param = (float(f_value), f"{f_value}")
+    # 遍历指令，找到 T1 并处理后续 G1 命令
+    for i in range(len(commands)):
+        if commands[i].code == 'T1':
+            count = 0
+            # 从 T1 后的行开始，替换前四个 G1 的 F 值
+            for j in range(i + 1, len(commands)):
+                cmd = commands[j]
+                # 跳过 T0 或以 ;TYPE: 开头的行
+                if cmd.code == 'T0' or cmd.is_type:
+                    continue
+                # 处理包含 F 参数的 G1 行
+                if cmd.code == 'G1' and cmd.f is not None:
+                    commands[j] = replace_params(cmd, newline='\n', F=f_param)
+                    count += 1
+                    if count >= 4:  # 只替换前四个 G1
+                        break
+    return commands
+
+
+def stream_commands(commands, f_value):
+    """
+    process_commands 的流式版本：单次遍历，每遇到 T1 重新开始计数，
+    替换其后前四个带 F 参数的 G1 命令（T0 和 ;TYPE: 行不中断计数）。
+    """
+    f_param = (float(f_value), f"{f_value}")
+    remaining = 0  # 当前 T1 之后还需替换的 G1 数量
+    for cmd in commands:
+        if cmd.code == 'T1':
+            remaining = 4
+        elif remaining and cmd.code == 'G1' and cmd.f is not None:
+            cmd = replace_params(cmd, newline='\n', F=f_param)
+            remaining -= 1
+        yield cmd
 
 
 def main():
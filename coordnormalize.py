@@ -0,0 +1,124 @@
+from gcodeparse import BLANK_LINE, iter_strip_last_newline, motion, ordered_xyz, parse_lines, replace_params, to_lines
+from pipelinelog import log
+
+
+def process_file(input_path, output_path):
+    """
+    合并第 5～9 步（GCodeProcessor → GCodeMotionExtractor → gcodefile → GCodeZFilter → Zreorganize），
+    只读写一次文件，输出与依次执行五个步骤相同。
+    """
+    try:
+        with open(input_path, 'r') as infile:
+            lines = infile.readlines()
+
+        result = process_commands(parse_lines(lines))
+
+        with open(output_path, 'w') as outfile:
+            outfile.writelines(to_lines(result))
+        log("坐标整理完成！")
+    except Exception as e:
+        raise Exception(f"处理 G-code 文件时出错: {e}")
+
+
+def process_commands(commands):
+    """process_file 的内存版本：输入第 4 步输出的指令列表，返回 Zreorganize 输出的指令列表"""
+    return list(stream_commands(commands))
+
+
+def stream_commands(commands):
+    """process_commands 的流式版本：最后一行不带换行符（与 GCodeZFilter 相同）"""
+    return iter_strip_last_newline(normalize_lines(commands))
+
+
+def normalize_lines(commands):
+    """
+    一次遍历完成五个步骤，只向后多看一行（GCodeZFilter 比较 Z 值用），每行以换行符结尾。
+
+    - GCodeProcessor：遇到 G91 停止；只保留 TYPE、LAYER、T0/T1、G0/G1 行，
+      G0/G1 按原有规则提取坐标（保留两位小数）后重新生成，第一条 G0/G1 删除，
+      尚未出现打印头时的 G1 删除
+    - GCodeMotionExtractor：上一步的输出原样保留
+    - gcodefile：第一条 G0 移到其后第一个 ;TYPE: 行之后
+    - GCodeZFilter：删除 Z 值大于下一行 Z 值的 G0/G1，G0/G1 块结束处插入空行
+    - Zreorganize：空行分隔的每个文本块中的 Z 值统一为块中第一个 Z 值
+    """
+    current_printhead = None
+    last_x = 0.0
+    last_y = 0.0
+    last_z = 0.0
+    skip_motion = True  # GCodeProcessor：跳过第一条 G0/G1
+    first_g0 = None  # gcodefile：等待插入到 ;TYPE: 行之后的第一条 G0
+    g0_found = False
+    previous = None  # GCodeZFilter：等待与下一行比较 Z 值的行
+    block_z = None  # Zreorganize：当前文本块中的第一个 Z 值
+
+    for cmd in commands:
+        code = cmd.code
+
+        # GCodeProcessor + gcodefile：本行对应的输出
+        if code == "G0" or code == "G1":
+            x_value, y_value, z_value = ordered_xyz(cmd)
+            if x_value is not None:
+                last_x = round(x_value, 2)
+            if y_value is not None:
+                last_y = round(y_value, 2)
+            if z_value is not None:
+                last_z = round(z_value, 2)
+            if skip_motion:
+                skip_motion = False
+                continue
+            if code == "G1":
+                if current_printhead is None:
+                    continue
+            elif not g0_found:
+                first_g0 = motion(code, last_x, last_y, last_z)
+                g0_found = True
+                continue
+            kept = (motion(code, last_x, last_y, last_z),)
+        elif code == "G91":
+            break
+        elif code == "T0" or code == "T1":
+            current_printhead = code
+            kept = (cmd.stripped(),)
+        elif cmd.is_type:
+            if first_g0 is not None:
+                kept = (cmd.stripped(), first_g0)
+                first_g0 = None
+            else:
+                kept = (cmd.stripped(),)
+        elif cmd.is_layer:
+            kept = (cmd.stripped(),)
+        else:
+            continue
+
+        # GCodeZFilter + Zreorganize：输出上一行
+        for line in kept:
+            if previous is not None:
+                if previous.is_motion:
+                    # Z 值大于下一行 Z 值的行删除
+                    if not (previous.z is not None and line.z is not None and previous.z > line.z):
+                        previous, block_z = unify_z(previous, block_z)
+                        yield previous
+                        if not line.is_motion:
+                            yield BLANK_LINE
+                            block_z = None
+                else:
+                    previous, block_z = unify_z(previous, block_z)
+                    yield previous
+            previous = line
+
+    if previous is not None:
+        previous, block_z = unify_z(previous, block_z)
+        yield previous
+
+
+def unify_z(cmd, block_z):
+    """Zreorganize：返回 (Z 值统一后的指令, 当前文本块中的第一个 Z 值)"""
+    z_value = cmd.z
+    if z_value is None:
+        return cmd, block_z
+    if block_z is None:
+        return cmd, z_value
+    if z_value != block_z:
+        cmd = replace_params(cmd, Z=(round(block_z, 2), f"{block_z:.2f}"))
+    return cmd, block_z
@@ -1,148 +1,298 @@
-import re
-import math
 import argparse
+from itertools import dropwhile
 
-def parse_gcode(content):
+import numpy as np
+
+from gcodeio import mapped_lines
+from gcodeparse import (BLANK_LINE, GCodeLine, iter_blocks, iter_parse, iter_strip_last_newline, motion, parse_lines,
+                        replace_params, split_blocks, strip_last_newline, write_commands)
+from motiontable import segmented_cumsum
+
+# 流式处理时每批计算剪切点的最少行数
+STREAM_BATCH_LINES = 5000
+
+# 剪切点后插入的附加指令
+ADDITIONAL_COMMANDS = parse_lines([
+    "M400\n",
+    "M280 P1.0000 S95\n",
+    "M280 P1.0000 S2\n",
+    "M400\n",
+    "; fiber_basic cut 0\n"
+])
+
+def parse_gcode(commands):
     """
-    解析 G-code，将每个块内的所有行按顺序存入 commands，
-    同时提取所有以 G0 和 G1 开头的命令，并记录其在 commands 列表中的行号。
+    解析 G-code，将每个块内的所有指令按顺序存入 commands，
+    同时提取可能需要剪断的块（前三行含有 T1）中所有 G0 和 G1 指令，并记录其在 commands 列表中的行号，
+    其余块的 positions 为空列表。
     每个命令保存格式：(行号, command_type, x, y, z, j, f)
     其中 command_type 为 'G0' 或 'G1'
     """
-    blocks = content.strip().split("\n\n")
-    all_data = []
-    for block in blocks:
-        commands = block.strip().split('\n')
-        positions = []
-        for idx, command in enumerate(commands):
-            if command.startswith("G0") or command.startswith("G1"):
-                command_type = command.split()[0]
-                parts = command.split()
-                try:
-                    # 提取 X, Y, Z
-                    x = next(float(p[1:]) for p in parts if p.startswith("X"))
-                    y = next(float(p[1:]) for p in parts if p.startswith("Y"))
-                    z = next(float(p[1:]) for p in parts if p.startswith("Z"))
-                except StopIteration:
-                    continue  # 缺少 X, Y, Z 时跳过
-                # 提取 J 和 F
-                j = next((float(p[1:]) for p in parts if p.startswith("J")), None)
-                f = next((float(p[1:]) for p in parts if p.startswith("F")), None)
-                positions.append((idx, command_type, x, y, z, j, f))
-        all_data.append((commands, positions))
-    return all_data
-
-def calculate_length(positions):
-    """
-    计算由 positions 中 G1 命令构成的路径总长度
-    """
-    total_length = 0
-    g1_positions = [p for p in positions if p[1] == 'G1']
-    if len(g1_positions) < 2:
-        return 0
-    for i in range(1, len(g1_positions)):
-        _, _, x1, y1, z1, _, _ = g1_positions[i - 1]
-        _, _, x2, y2, z2, _, _ = g1_positions[i]
-        total_length += math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2 + (z2 - z1) ** 2)
-    return total_length
-
-def insert_cut_points(all_data, d, insert_f, connection_f, j_offset):
+    # 去掉首尾空行后按空行分块
+    start = 0
+    end = len(commands)
+    while start < end and commands[start].is_blank:
+        start += 1
+    while end > start and commands[end - 1].is_blank:
+        end -= 1
+
+    return [(block, cut_positions(block)) for block in split_blocks(commands[start:end])]
+
+def block_positions(block):
+    """提取块内所有包含 X, Y, Z 的 G0 和 G1 指令，格式为 (行号, command_type, x, y, z, j, f)"""
+    # 缺少 X, Y, Z 的指令跳过
+    return [(idx, command.code, command.x, command.y, command.z, command.j, command.f)
+            for idx, command in enumerate(block)
+            if (command.code == "G0" or command.code == "G1")
+            and command.x is not None and command.y is not None and command.z is not None]
+
+def cut_positions(block):
+    """前三行含有 T1 的块返回 block_positions(block)，其余块不会剪断，返回空列表"""
+    if any(line.code == "T1" for line in block[:3]):
+        return block_positions(block)
+    return []
+
+def iter_trimmed_blocks(commands):
+    """
+    parse_gcode 分块方式的流式版本：跳过开头的空行后逐个返回文本块。
+    末尾空行产生的空块需要读到文件结束才能确定，因此连续的空块先计数，遇到非空块时再输出。
+    """
+    empty_blocks = 0
+    for block in iter_blocks(dropwhile(lambda command: command.is_blank, commands)):
+        if not block:
+            empty_blocks += 1
+            continue
+        for _ in range(empty_blocks):
+            yield []
+        empty_blocks = 0
+        yield block
+
+def insert_cut_points(all_data, d, insert_f, connection_f, j_offset, period=None):
     """
     对于每个文本块：
       - 如果该块的前三行中包含 "T1"，则认为该块需要剪断，
         否则原样输出该块。
       - 对需要剪断的块：
           1. 计算 G1 命令的路径总长度 L，设剪切点累计长度 C = L - d
-          2. 遍历 G1 命令，累计距离，当累计距离首次超过 C 时，
-             在该段内线性插值得到剪切点坐标及 J 值，并记录插入位置。
+             （period 不为空时另外每隔 period 向前增加剪切点，见 plan_cuts）
+          2. 累计距离首次达到 C 的线段内线性插值得到剪切点坐标及 J 值，
+             所有块的剪切点由 plan_cuts 一次算出。
           3. 在该位置插入新的剪切指令（使用 insert_f 进给和 j_offset 调整后的 J 值），
-             紧跟插入附加指令，然后更新剪切点后所有 G0 和 G1 命令的 J 和 F 值。
+             紧跟插入附加指令，然后更新最后一个剪切点后所有 G0 和 G1 命令的 J 和 F 值。
+             有多个剪切点时，两个剪切点之间的 G0/G1 保留原 F 值，J 值加上前一个剪切点的偏移量
+             （剪切指令的 J 值减去插值得到的 J 值），使 J 从剪切指令处继续增加而不回退。
     """
-    results = []
-    for commands, positions in all_data:
-        # 仅检查文本块的前三行是否含有 "T1"
-        found_T1 = any("T1" in line for line in commands[:3])
+    results = cut_blocks(all_data, d, insert_f, connection_f, j_offset, period)
 
-        if not found_T1:
-            results.append("\n".join(commands))
-            continue
+    # 各块之间以空行分隔，最后一行不带换行符
+    output = []
+    for index, commands in enumerate(results):
+        if index:
+            output.append(BLANK_LINE)
+        output.extend(map(GCodeLine.terminated, commands))
+    return strip_last_newline(output)
 
-        if len(positions) < 2:
-            results.append("\n".join(commands))
-            continue
+def cut_blocks(all_data, d, insert_f, connection_f, j_offset, period=None):
+    """对 [(文本块, positions)] 中需要剪断的块插入剪切点，返回各块处理后的指令列表"""
+    results = [commands for commands, _ in all_data]
+    cut_indices = [index for index, (commands, positions) in enumerate(all_data) if needs_cut(commands, positions)]
+    planned = plan_cuts([all_data[index][1] for index in cut_indices], d, period)
+    for index, cuts in zip(cut_indices, planned):
+        if cuts:
+            results[index] = splice_cuts(results[index], cuts, insert_f, connection_f, j_offset)
+    return results
+
+def needs_cut(commands, positions):
+    """文本块的前三行含有 "T1"，且至少有两条包含 X, Y, Z 的 G0/G1 指令"""
+    # 仅检查文本块的前三行是否含有 "T1"
+    found_T1 = any(line.code == "T1" for line in commands[:3])
+    return found_T1 and len(positions) >= 2
+
+def plan_cuts(blocks, d, period=None):
+    """
+    为多个文本块一次性计算剪切点。blocks 为各块的 positions（见 block_positions），
+    返回与 blocks 一一对应的剪切点列表，每个剪切点为 (插入位置的行号, x, y, z, J 值)，按路径先后排列；
+    两端 G1 不都带 J 时 J 值为 0。
+
+    - 所有块的 G1 线段长度用数组一次算出，各块分别累加得到累计长度（与逐段累加的结果逐位一致）
+    - 剪切点累计长度为 C = L - d；period 不为空时另有 C - period、C - 2 * period …（大于 0 的部分）
+    - 用 searchsorted 找到累计长度首次达到剪切点的非零长度线段，插入位置为该线段终点的行号，
+      坐标和 J 值在该线段内一次插值
+    """
+    cuts = [[] for _ in blocks]
+    # 各块的 G1 点 (行号, 'G1', x, y, z, j, f)，少于两个点的块没有线段
+    g1_blocks = [[p for p in positions if p[1] == 'G1'] for positions in blocks]
+    counts = np.array([len(g1_positions) for g1_positions in g1_blocks], dtype=np.int64)
+    counts[counts < 2] = 0
+    if not counts.any():
+        return cuts
+
+    rows = [p for g1_positions, count in zip(g1_blocks, counts.tolist()) if count for p in g1_positions]
+    point_block = np.repeat(np.arange(len(blocks)), counts)
+    x = np.array([p[2] for p in rows], dtype=np.float64)
+    y = np.array([p[3] for p in rows], dtype=np.float64)
+    z = np.array([p[4] for p in rows], dtype=np.float64)
+    js = [p[5] for p in rows]
+    j = np.array(js, dtype=np.float64)  # None 为 NaN
+    has_j = ~np.equal(js, None)
+
+    # 线段：同一块中相邻的两个 G1 点，seg_end 为终点的下标
+    seg_end = np.flatnonzero(point_block[1:] == point_block[:-1]) + 1
+    seg_start = seg_end - 1
+    seg_block = point_block[seg_end]
+    dx = (x[seg_end] - x[seg_start]).tolist()
+    dy = (y[seg_end] - y[seg_start]).tolist()
+    dz = (z[seg_end] - z[seg_start]).tolist()
+    # 平方用 Python 的 ** 计算，与逐段 math.sqrt((x2 - x1) ** 2 + ...) 的结果一致
+    seg = np.sqrt(np.array([a ** 2 + b ** 2 + c ** 2 for a, b, c in zip(dx, dy, dz)]))
+    cum = segmented_cumsum(seg, seg_block)
 
-        # 只考虑 G1 命令计算路径长度
-        g1_positions = [p for p in positions if p[1] == 'G1']
-        L = calculate_length(g1_positions)
-        C = L - d
-        cumulative_distance = 0
-        new_j_value = None
-        insertion_index = None
-        additional_commands = [
-            "M400",
-            "M280 P1.0000 S95",
-            "M280 P1.0000 S2",
-            "M400",
-            "; fiber_basic cut 0"
-        ]
-
-        # 遍历 G1 命令，计算累计距离
-        for i in range(1, len(g1_positions)):
-            idx_prev, _, x1, y1, z1, j1, f1 = g1_positions[i - 1]
-            idx_curr, _, x2, y2, z2, j2, f2 = g1_positions[i]
-            seg = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2 + (z2 - z1) ** 2)
-            if seg == 0:
-                continue
-            if cumulative_distance + seg >= C:
-                ratio = (C - cumulative_distance) / seg
-                x_new = x1 + ratio * (x2 - x1)
-                y_new = y1 + ratio * (y2 - y1)
-                z_new = z1 + ratio * (z2 - z1)
-                if j1 is not None and j2 is not None:
-                    new_j_value = j1 + ratio * (j2 - j1)
-                else:
-                    new_j_value = 0
-                # 插入位置为当前 G1 命令的行号
-                insertion_index = idx_curr
-                new_command = f"G1 X{x_new:.2f} Y{y_new:.2f} Z{z_new:.2f} J{new_j_value + j_offset:.2f} F{insert_f}"
-                commands.insert(insertion_index, new_command)
-                for cmd in reversed(additional_commands):
-                    commands.insert(insertion_index + 1, cmd)
-                break
-            cumulative_distance += seg
-
-        # 更新剪切点之后所有 G0 和 G1 命令的 J 和 F 值
-        if new_j_value is not None and insertion_index is not None:
-            # 找到插入点之后的命令行
-            start_index = insertion_index + len(additional_commands) + 1
-            for idx in range(start_index, len(commands)):
-                if commands[idx].startswith("G0") or commands[idx].startswith("G1"):
-                    parts = commands[idx].split()
-                    command_type = parts[0]
-                    # 保留 X, Y, Z 参数不变
-                    x_val = next((p for p in parts if p.startswith("X")), None)
-                    y_val = next((p for p in parts if p.startswith("Y")), None)
-                    z_val = next((p for p in parts if p.startswith("Z")), None)
-                    # 更新 J 和 F 值
-                    if x_val and y_val and z_val:
-                        commands[idx] = f"{command_type} {x_val} {y_val} {z_val} J{new_j_value + j_offset:.2f} F{connection_f}"
-                    else:
-                        # 如果缺少 X, Y, Z，则不进行修改
-                        continue
-
-        results.append("\n".join(commands))
-    return "\n\n".join(results)
-
-def process_gcode_file(input_file, output_file, distance, insert_f, connection_f, j_offset):
-    """处理 G-code 文件的核心函数"""
-    with open(input_file, 'r') as file:
-        content = file.read()
-
-    all_data = parse_gcode(content)
-    updated_gcode = insert_cut_points(all_data, distance, insert_f, connection_f, j_offset)
-
-    with open(output_file, 'w') as file:
-        file.write(updated_gcode)
+    # 各块的线段范围 [start, end) 与剪切点累计长度
+    count = len(seg)
+    starts = np.flatnonzero(np.diff(seg_block, prepend=-1))
+    ends = np.append(starts[1:], count)
+    cut_owner, lengths = cut_lengths(starts, cum[ends - 1] - d, period)
+
+    # (块, 累计长度) 按字典序有序，以复数表示后一次 searchsorted 即可在各自的块内查找；
+    # 累计长度相同的零长度线段被跳过，改用其后第一条非零长度线段
+    keys = seg_block + 1j * cum
+    found = np.searchsorted(keys, seg_block[starts[cut_owner]] + 1j * lengths, side='left')
+    following = np.where(seg != 0, np.arange(count), count)
+    next_nonzero = np.append(np.minimum.accumulate(following[::-1])[::-1], count)
+    k = next_nonzero[found]
+    valid = k < ends[cut_owner]
+    valid[valid] = cum[k[valid]] >= lengths[valid]
+    k = k[valid]
+    cut_owner = cut_owner[valid]
+    lengths = lengths[valid]
+    if not k.size:
+        return cuts
+
+    # 一次插值所有剪切点
+    previous = np.where(k > starts[cut_owner], cum[k - 1], 0.0)
+    p1 = seg_start[k]
+    p2 = seg_end[k]
+    ratio = (lengths - previous) / seg[k]
+    x_new = x[p1] + ratio * (x[p2] - x[p1])
+    y_new = y[p1] + ratio * (y[p2] - y[p1])
+    z_new = z[p1] + ratio * (z[p2] - z[p1])
+    j_new = np.where(has_j[p1] & has_j[p2], j[p1] + ratio * (j[p2] - j[p1]), 0.0)
+    for block_index, p, values in zip(seg_block[k].tolist(), p2.tolist(),
+                                      zip(x_new.tolist(), y_new.tolist(), z_new.tolist(), j_new.tolist())):
+        cuts[block_index].append((rows[p][0],) + values)
+    return cuts
+
+def cut_lengths(starts, last_lengths, period=None):
+    """
+    各块的剪切点累计长度，返回 (剪切点所属块在 starts 中的序号, 累计长度)，同一块内从小到大排列。
+    last_lengths 为各块最后一个剪切点的累计长度 L - d；period 不为空时另有每隔 period 向前的剪切点（大于 0 的部分）。
+    """
+    owners = np.arange(len(starts))
+    if not period or period <= 0:
+        return owners, last_lengths
+    # 每块的剪切点数：last - m * period > 0 的 m（m ≥ 1）再加上最后一个剪切点
+    extra = np.where(last_lengths > 0, np.ceil(last_lengths / period) - 1, 0)
+    counts = np.nan_to_num(extra, nan=0.0).astype(np.int64) + 1
+    owners = np.repeat(owners, counts)
+    steps = np.arange(len(owners)) - np.repeat(np.cumsum(counts) - counts, counts)
+    steps = np.repeat(counts, counts) - 1 - steps  # 同一块内从大到小的 m，使累计长度从小到大
+    lengths = last_lengths[owners] - steps * period
+    keep = (steps == 0) | (lengths > 0)
+    return owners[keep], lengths[keep]
+
+def splice_cuts(commands, cuts, insert_f, connection_f, j_offset):
+    """
+    按 plan_cuts 的结果拼接文本块：每个剪切点之前插入剪切指令和附加指令，
+    相邻两个剪切点之间带 J 的 G0/G1 按前一个剪切点的偏移量调整 J 值（见 rebase_move），
+    最后一个剪切点之后的 G0/G1 改为剪切点的 J 值和 connection_f 进给。
+    """
+    result = []
+    start = 0
+    new_j = None
+    shift = None
+    for insertion_index, x_new, y_new, z_new, j_value in cuts:
+        segment = commands[start:insertion_index]
+        if shift is not None:
+            segment = [rebase_move(command, shift) for command in segment]
+        result += segment
+        new_j = j_value + j_offset
+        result.append(motion("G1", round(x_new, 2), round(y_new, 2), round(z_new, 2),
+                             j=round(new_j, 2), f=float(insert_f),
+                             raw=f"G1 X{x_new:.2f} Y{y_new:.2f} Z{z_new:.2f} J{new_j:.2f} F{insert_f}\n"))
+        result += ADDITIONAL_COMMANDS
+        start = insertion_index
+        shift = new_j - j_value
+
+    # 更新剪切点之后所有 G0 和 G1 命令的 J 和 F 值
+    result += [connection_move(command, new_j, connection_f) if command.is_motion else command
+               for command in commands[start:]]
+    return result
+
+def rebase_move(command, shift):
+    """两个剪切点之间的 G0/G1：J 值加上前一个剪切点的偏移量 shift，其余参数不变；不带 J 的指令不修改"""
+    if not command.is_motion or command.j is None:
+        return command
+    new_j = command.j + shift
+    return replace_params(command, J=(round(new_j, 2), f"{new_j:.2f}"))
+
+def connection_move(command, new_j, connection_f):
+    """剪切点之后的 G0/G1：保留 X, Y, Z 参数文本，J 和 F 改为剪切点的 J 值和 connection_f"""
+    parts = command.raw.split()
+    command_type = parts[0]
+    # 保留 X, Y, Z 参数不变
+    x_val = next((p for p in parts if p.startswith("X")), None)
+    y_val = next((p for p in parts if p.startswith("Y")), None)
+    z_val = next((p for p in parts if p.startswith("Z")), None)
+    # 如果缺少 X, Y, Z，则不进行修改
+    if not (x_val and y_val and z_val):
+        return command
+    return GCodeLine(f"{command_type} {x_val} {y_val} {z_val} J{new_j:.2f} F{connection_f}\n",
+                     command_type, command.x, command.y, command.z,
+                     j=round(new_j, 2), f=float(connection_f))
+
+def process_gcode_file(input_file, output_file, distance, insert_f, connection_f, j_offset, period=None):
+    """
+    处理 G-code 文件的核心函数。输入文件以内存映射方式逐段读取，按批处理后直接写出
+    （与 stream_commands 相同），内存中只保留当前一批文本块。
+    """
+    commands = iter_parse(mapped_lines(input_file, output_file))
+    write_commands(output_file, stream_commands(commands, distance, insert_f, connection_f, j_offset, period))
+
+def process_commands(commands, distance, insert_f, connection_f, j_offset, period=None):
+    """process_gcode_file 的内存版本：输入指令列表，返回插入剪切点后的指令列表"""
+    all_data = parse_gcode(commands)
+    return insert_cut_points(all_data, distance, insert_f, connection_f, j_offset, period)
+
+def stream_commands(commands, distance, insert_f, connection_f, j_offset, period=None):
+    """process_commands 的流式版本：逐块插入剪切点并输出，内存中只保留当前文本块"""
+    return iter_strip_last_newline(iter_cut_blocks(commands, distance, insert_f, connection_f, j_offset, period))
+
+def iter_cut_blocks(commands, distance, insert_f, connection_f, j_offset, period=None):
+    """
+    逐块处理，各块之间以空行分隔，返回每行以换行符结尾的指令生成器。
+    文本块累计到 STREAM_BATCH_LINES 行后一起计算剪切点，内存中只保留这一批文本块。
+    """
+    first = True
+    batch = []
+    batch_lines = 0
+    blocks = iter_trimmed_blocks(commands)
+    for block in blocks:
+        batch.append((block, cut_positions(block)))
+        batch_lines += len(block)
+        if batch_lines < STREAM_BATCH_LINES:
+            continue
+        for result in cut_blocks(batch, distance, insert_f, connection_f, j_offset, period):
+            if not first:
+                yield BLANK_LINE
+            first = False
+            yield from map(GCodeLine.terminated, result)
+        batch = []
+        batch_lines = 0
+    for result in cut_blocks(batch, distance, insert_f, connection_f, j_offset, period):
+        if not first:
+            yield BLANK_LINE
+        first = False
+        yield from map(GCodeLine.terminated, result)
 
 def main():
     # 设置命令行参数解析
@@ -153,13 +303,15 @@ def main():
     parser.add_argument('--insert_f', type=float, required=True, help='插入的 G1 命令的进给速度')
     parser.add_argument('--connection_f', type=float, required=True, help='剪切点后 G0 和 G1 命令的进给速度')
     parser.add_argument('--j_offset', type=float, required=True, help='J 参数的偏移值')
+    parser.add_argument('--period', type=float, default=None, help='每隔多长路径增加一个剪切点（mm，可选）')
 
     # 解析命令行参数
     args = parser.parse_args()
 
     try:
         # 调用处理函数
-        process_gcode_file(args.input, args.output, args.distance, args.insert_f, args.connection_f, args.j_offset)
+        process_gcode_file(args.input, args.output, args.distance, args.insert_f, args.connection_f, args.j_offset,
+                           args.period)
         print("处理完成！")
     except Exception as e:
         print(f"错误: {e}")
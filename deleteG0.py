@@ -1,13 +1,15 @@
 import argparse
 
+from gcodeparse import BLANK_LINE, parse_lines, to_lines
+from pipelinelog import log
+
 def remove_continuous_g0(data):
     """移除连续的 G0 指令"""
     result = []
     g0_lines = []  # 存储连续的 G0 指令
 
     for line in data:
-        stripped_line = line.strip()
-        if stripped_line.startswith("G0"):
+        if line.code == "G0":
             g0_lines.append(line)  # 收集 G0 指令
         else:
             # 处理前面的连续 G0 指令
@@ -32,40 +34,57 @@ def process_file(input_path, output_path):
         with open(input_path, 'r') as file:
             lines = file.readlines()  # 读取所有行，保留换行符
 
-        processed_data = []
-        block = []
-        for line in lines:
-            stripped_line = line.strip()
-            if stripped_line == "":
-                # 遇到空行，处理当前数据块并添加空行
-                if block:
-                    if block[0].strip().startswith("T0"):
-                        processed_data.extend(block)  # T0 块保持不变
-                    else:
-                        processed_data.extend(remove_continuous_g0(block))  # 删除连续 G0
-                    block = []
-                processed_data.append("")  # 保留原始空行
-            else:
-                block.append(line.rstrip('\n'))  # 去掉换行符，稍后统一处理
-
-        # 处理最后一个数据块
-        if block:
-            if block[0].strip().startswith("T0"):
-                processed_data.extend(block)
-            else:
-                processed_data.extend(remove_continuous_g0(block))
+        processed_data = process_commands(parse_lines(lines))
 
         # 写入输出文件，保留原始换行符
         with open(output_path, 'w') as file:
-            for line in processed_data:
-                file.write(line + "\n")  # 统一添加换行符
+            file.writelines(to_lines(processed_data))
 
-        print("文件处理完成！")
+        log("文件处理完成！")
 
     except FileNotFoundError:
-        print(f"错误：输入文件 {input_path} 不存在")
+        log(f"错误：输入文件 {input_path} 不存在")
     except Exception as e:
-        print(f"处理文件时出错: {e}")
+        log(f"处理文件时出错: {e}")
+
+def process_commands(commands):
+    """按空行分块，删除非 T0 块中的连续 G0 指令，返回每行均以换行符结尾的指令列表"""
+    return list(stream_commands(commands))
+
+def stream_commands(commands):
+    """
+    process_commands 的流式版本：逐行输出，只暂存当前连续 G0 中的最后一个。
+    空行之后的第一行决定该数据块是否以 T0 开头（T0 块保持不变）。
+    """
+    block_start = True  # 下一行是否为数据块的第一行
+    keep_block = False  # 当前数据块是否以 T0 开头
+    last_g0 = None  # 当前连续 G0 中的最后一个
+    for cmd in commands:
+        if cmd.is_blank:
+            # 遇到空行，先输出数据块末尾的 G0 再添加空行
+            if last_g0 is not None:
+                yield last_g0
+                last_g0 = None
+            block_start = True
+            yield BLANK_LINE  # 保留原始空行
+            continue
+        cmd = cmd.terminated()  # 统一以换行符结尾
+        if block_start:
+            keep_block = cmd.code == "T0"
+            block_start = False
+        if keep_block:
+            yield cmd
+        elif cmd.code == "G0":
+            last_g0 = cmd  # 只保留最后一个 G0
+        else:
+            if last_g0 is not None:
+                yield last_g0
+                last_g0 = None
+            yield cmd
+
+    # 处理数据块末尾的连续 G0
+    if last_g0 is not None:
+        yield last_g0
 
 def main():
     # 设置命令行参数解析
@@ -1,5 +1,8 @@
 import argparse
 
+from gcodeparse import BLANK_LINE, motion, parse_lines, to_lines
+from pipelinelog import log
+
 def process_file(input_file, output_file):
     """
     处理 G-code 文件，在文件末尾添加一条修改后的 G1 命令行。
@@ -13,67 +16,106 @@ def process_file(input_file, output_file):
         with open(input_file, 'r', encoding='utf-8') as f:
             lines = f.readlines()
 
-        # 找到最后一条包含 X、Y、Z 的 G1 数据行
-        last_data_line = None
-        for line in reversed(lines):
-            line = line.strip()
-            if line.startswith('G1'):
-                parts = line.split()
-                x = None
-                y = None
-                z = None
-                for part in parts:
-                    if part.startswith('X'):
-                        x = part[1:]
-                    elif part.startswith('Y'):
-                        y = part[1:]
-                    elif part.startswith('Z'):
-                        z = part[1:]
-                if x is not None and y is not None and z is not None:
-                    last_data_line = line
-                    break
-
-        if not last_data_line:
-            print("未找到包含 X、Y、Z 的 G1 数据行")
-            return
-
-        # 解析数据
-        parts = last_data_line.split()
-        x = None
-        y = None
-        z = None
-        f = None
-        for part in parts:
-            if part.startswith('X'):
-                x = part[1:]
-            elif part.startswith('Y'):
-                y = part[1:]
-            elif part.startswith('Z'):
-                z = part[1:]
-            elif part.startswith('F'):
-                f = part[1:]
-
-        if not all([x, y, z]):
-            print("未找到 X、Y、Z 值")
+        commands = parse_lines(lines)
+        new_line = build_end_line(commands)
+        if new_line is None:
             return
 
-        # 修改 Z 和 F 值
-        z_new = float(z) + 40
-        f_new = 300  # 固定修改为 300
-
-        # 生成新行
-        new_line = f"G1 X{x} Y{y} Z{z_new:.2f}"
-        if f:
-            new_line += f" F{f_new}"
-
         # 写入输出文件
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("".join(lines))
-            f.write("\n" + new_line)
+            f.writelines(to_lines(append_end_line(commands, new_line)))
 
-        print("处理完成")
+        log("处理完成")
     except Exception as e:
-        print(f"处理失败：{str(e)}")
+        log(f"处理失败：{str(e)}")
+
+def process_commands(commands):
+    """
+    process_file 的内存版本：在指令列表末尾添加一条修改后的 G1 命令行。
+
+    参数:
+        commands (list): GCodeLine 列表
+
+    返回:
+        list: 处理后的指令列表
+    """
+    new_line = build_end_line(commands)
+    if new_line is None:
+        raise ValueError("未找到包含 X、Y、Z 的 G1 数据行")
+    return append_end_line(commands, new_line)
+
+def stream_commands(commands):
+    """
+    process_commands 的流式版本：边输出边记录最后一条包含 X、Y、Z 的 G1 数据行，
+    只缓存一行用于在末尾追加结束行。
+    """
+    last_data_line = None
+    previous = None
+    for cmd in commands:
+        if cmd.code == 'G1' and cmd.has_xyz:
+            last_data_line = cmd
+        if previous is not None:
+            yield previous
+        previous = cmd
+
+    new_line = build_end_line([last_data_line] if last_data_line is not None else [])
+    if new_line is None:
+        raise ValueError("未找到包含 X、Y、Z 的 G1 数据行")
+    yield from append_end_line([previous] if previous is not None else [], new_line)
+
+def append_end_line(commands, new_line):
+    """返回在末尾追加结束行后的指令列表，与写文件时 "".join(lines) + "\n" + new_line 的结果保持一致"""
+    result = list(commands)
+    if result and not result[-1].raw.endswith('\n'):
+        result[-1] = result[-1].with_raw(result[-1].raw + '\n')
+    else:
+        result.append(BLANK_LINE)
+    result.append(new_line)
+    return result
+
+def build_end_line(commands):
+    """根据最后一条包含 X、Y、Z 的 G1 数据行生成抬升 Z 后的结束行（不带换行符），未找到时返回 None"""
+    # 找到最后一条包含 X、Y、Z 的 G1 数据行
+    last_data_line = None
+    for cmd in reversed(commands):
+        if cmd.code == 'G1' and cmd.has_xyz:
+            last_data_line = cmd.text
+            break
+
+    if not last_data_line:
+        log("未找到包含 X、Y、Z 的 G1 数据行")
+        return None
+
+    # 解析数据（保留 X、Y 的原始文本）
+    parts = last_data_line.split()
+    x = None
+    y = None
+    z = None
+    f = None
+    for part in parts:
+        if part.startswith('X'):
+            x = part[1:]
+        elif part.startswith('Y'):
+            y = part[1:]
+        elif part.startswith('Z'):
+            z = part[1:]
+        elif part.startswith('F'):
+            f = part[1:]
+
+    if not all([x, y, z]):
+        log("未找到 X、Y、Z 值")
+        return None
+
+    # 修改 Z 和 F 值
+    z_new = float(z) + 40
+    f_new = 300  # 固定修改为 300
+
+    # 生成新行
+    new_line = f"G1 X{x} Y{y} Z{z_new:.2f}"
+    if f:
+        new_line += f" F{f_new}"
+
+    return motion("G1", float(x), float(y), round(z_new, 2), f=float(f_new) if f else None, raw=new_line)
 
 def main():
     # 设置命令行参数解析
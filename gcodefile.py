@@ -1,78 +1,79 @@
-import re
+from gcodeparse import motion, parse_lines, to_lines
+from pipelinelog import log
 
 def process_gcode(input_path, output_path):
     """处理G-code文件，复制第一条G0指令到;TYPE:行后"""
+    try:
+        with open(input_path, 'r') as infile:
+            lines = infile.readlines()
+
+        result = process_commands(parse_lines(lines))
+
+        # 写入结果到输出文件
+        with open(output_path, 'w') as outfile:
+            for line in to_lines(result):
+                outfile.write(line)
+        log("G-code 处理完成！")
+
+    except Exception as e:
+        raise Exception(f"处理 G-code 文件时出错: {e}")
+
+def process_commands(commands):
+    """process_gcode 的内存版本：输入指令列表，返回复制第一条G0指令到;TYPE:行后的指令列表"""
+    return list(stream_commands(commands))
+
+def stream_commands(commands):
+    """process_commands 的流式版本：逐条输出，只暂存第一条G0指令直到遇到;TYPE:行"""
     # 初始化变量
     last_x = 0.0
     last_y = 0.0
     last_z = 0.0
-    result = []
     first_g1_found = False  # 用于标记是否已经找到第一条G0指令
     g1_first_line = None  # 用于存储第一条G0指令
     first_printhead = None  # 用于存储第一个打印头类型
     inserted_g1 = False  # 用于标记是否已插入G0指令到;TYPE:后面
 
-    try:
-        with open(input_path, 'r') as infile:
-            for line in infile:
-                line = line.strip()
-
-                # 保留T0和T1指令
-                if line == "T0" or line == "T1":
-                    if first_printhead is None:
-                        first_printhead = line  # 保存第一个打印头类型
-                    result.append(line + "\n")
-                    continue
-
-                # 检测;TYPE:行，并在后面插入第一条G0指令（如果已找到）
-                if ";TYPE:" in line and not inserted_g1:
-                    result.append(line + "\n")
-                    if g1_first_line:  # 插入第一条G0指令
-                        result.append(g1_first_line)
-                        inserted_g1 = True  # 标记已经插入
-                    continue
+    for cmd in commands:
+        code = cmd.code
 
-                # 匹配G0或G1指令
-                match = re.match(
-                    r'(G0|G1)\s*(F\d+)?\s*(X[-+]?[0-9]*\.?[0-9]+)?\s*(Y[-+]?[0-9]*\.?[0-9]+)?\s*(Z[-+]?[0-9]*\.?[0-9]+)?\s*(E[-+]?[0-9]*\.?[0-9]+)?',
-                    line)
-                if match:
-                    g_code = match.group(1)
-                    x_value = match.group(3)
-                    y_value = match.group(4)
-                    z_value = match.group(5)
+        # 保留T0和T1指令
+        if code == "T0" or code == "T1":
+            if first_printhead is None:
+                first_printhead = code  # 保存第一个打印头类型
+            yield cmd.stripped()
+            continue
 
-                    # 更新X, Y, Z坐标
-                    if x_value:
-                        last_x = round(float(x_value[1:]), 2)
-                    if y_value:
-                        last_y = round(float(y_value[1:]), 2)
-                    if z_value:
-                        last_z = round(float(z_value[1:]), 2)
+        # 检测;TYPE:行，并在后面插入第一条G0指令（如果已找到）
+        if cmd.is_type and not inserted_g1:
+            yield cmd.stripped()
+            if g1_first_line:  # 插入第一条G0指令
+                yield g1_first_line
+                inserted_g1 = True  # 标记已经插入
+            continue
 
-                    # 复制第一条G0指令并跳过
-                    if not first_g1_found and g_code == "G0":
-                        g1_first_line = f"{g_code} X{last_x} Y{last_y} Z{last_z}\n"
-                        first_g1_found = True
-                        continue  # 跳过当前G0指令
+        # 匹配G0或G1指令
+        if code == "G0" or code == "G1":
+            # 更新X, Y, Z坐标
+            if cmd.x is not None:
+                last_x = round(cmd.x, 2)
+            if cmd.y is not None:
+                last_y = round(cmd.y, 2)
+            if cmd.z is not None:
+                last_z = round(cmd.z, 2)
 
-                    # 保留G0指令
-                    if g_code == "G0":
-                        output_line = f"{g_code} X{last_x} Y{last_y} Z{last_z}\n"
-                        result.append(output_line)
-                        continue
+            # 复制第一条G0指令并跳过
+            if not first_g1_found and code == "G0":
+                g1_first_line = motion(code, last_x, last_y, last_z)
+                first_g1_found = True
+                continue  # 跳过当前G0指令
 
-                # 保留其他内容
-                result.append(line + "\n")
+            # 保留G0指令
+            if code == "G0":
+                yield motion(code, last_x, last_y, last_z)
+                continue
 
-        # 写入结果到输出文件
-        with open(output_path, 'w') as outfile:
-            for line in result:
-                outfile.write(line)
-        print("G-code 处理完成！")
-
-    except Exception as e:
-        raise Exception(f"处理 G-code 文件时出错: {e}")
+        # 保留其他内容
+        yield cmd.stripped()
 
 # 命令行接口
 if __name__ == "__main__":
@@ -0,0 +1,142 @@
+import io
+import locale
+import mmap
+import os
+
+import numpy as np
+
+# 计算行偏移量时每次扫描的字节数（临时数组的大小与此相同）
+SCAN_CHUNK_BYTES = 16 * 2 ** 20
+
+# 逐行读取时每次解码的字节数
+DECODE_CHUNK_BYTES = 2 ** 20
+
+
+def read_lines(input_path, encoding=None):
+    """读取 G-code 文件，返回与 readlines() 相同格式的行列表（保留换行符）"""
+    with open(input_path, 'r', encoding=encoding) as f:
+        return f.readlines()
+
+
+def iter_lines(input_path, encoding=None):
+    """逐行读取 G-code 文件（保留换行符），不一次性读入整个文件，用于流式处理"""
+    with open(input_path, 'r', encoding=encoding) as f:
+        yield from f
+
+
+def write_lines(output_path, lines, encoding=None):
+    """
+    将行列表原样写入文件（行自带换行符）。
+
+    先写入同一文件夹中的临时文件，全部写完后再替换 output_path：lines 为惰性生成器时，
+    中途出错不会留下被截断的输出文件（原有文件保持不变）。
+    """
+    temp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'w', encoding=encoding) as f:
+            f.writelines(lines)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def split_lines(text):
+    """将整段文本拆分为与 readlines() 相同格式的行列表"""
+    return io.StringIO(text).readlines()
+
+
+class MappedGCode:
+    """
+    以只读内存映射（mmap）方式打开的 G-code 文件，用于数百 MB 的大文件：
+    不把整个文件读入内存，行用字节偏移量表示，只有实际用到的行才解码为文本。
+
+    - 按 b"\\n" 分行，encoding 需兼容 ASCII（utf-8、gbk 等）；为空时与 open() 相同使用系统默认编码
+    - 解码后的行与文本模式 readlines() 相同：保留换行符，"\\r\\n" 转为 "\\n"
+
+    用完后调用 close()（或用 with 语句）。
+    """
+
+    def __init__(self, path, encoding=None):
+        self.path = path
+        self.encoding = encoding or locale.getpreferredencoding(False)
+        with open(path, 'rb') as f:
+            size = f.seek(0, io.SEEK_END)
+            # 空文件无法映射
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self.size = size
+        self._line_starts = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self.line_starts) - 1
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+    def byte_array(self):
+        """整个文件的 uint8 数组视图（不复制）；用完后需释放（del），否则无法 close()"""
+        return np.frombuffer(self._map, dtype=np.uint8)
+
+    @property
+    def line_starts(self):
+        """各行起始字节偏移量（int64 数组），最后多一个元素为文件大小，第 i 行为 [starts[i], starts[i + 1])"""
+        if self._line_starts is None:
+            parts = [np.zeros(1, dtype=np.int64)]
+            data = self.byte_array()
+            for start in range(0, self.size, SCAN_CHUNK_BYTES):
+                parts.append(np.flatnonzero(data[start:start + SCAN_CHUNK_BYTES] == 10) + (start + 1))
+            del data
+            starts = np.concatenate(parts)
+            if starts[-1] != self.size:
+                starts = np.append(starts, self.size)  # 最后一行没有换行符
+            self._line_starts = starts
+        return self._line_starts
+
+    def decode(self, start, end):
+        """将字节范围 [start, end) 解码为文本，换行符与文本模式读取相同"""
+        text = self._map[start:end].decode(self.encoding)
+        if "\r" in text:
+            text = text.replace("\r\n", "\n")
+        return text
+
+    def iter_lines(self, start=0, stop=None):
+        """
+        逐行返回第 start～stop 行（不含 stop）的文本，与 readlines() 的各行相同，
+        每次只解码一段（约 DECODE_CHUNK_BYTES 字节）。
+        """
+        starts = self.line_starts
+        stop = len(starts) - 1 if stop is None else min(stop, len(starts) - 1)
+        while start < stop:
+            # 按字节数分段，每段至少一行
+            end = int(np.searchsorted(starts, starts[start] + DECODE_CHUNK_BYTES, side='right')) - 1
+            end = min(max(end, start + 1), stop)
+            yield from split_lines(self.decode(int(starts[start]), int(starts[end])))
+            start = end
+
+
+def mapped_lines(input_path, output_path=None, encoding=None):
+    """
+    以内存映射方式打开 input_path，返回逐行文本的迭代器（与 readlines() 的各行相同，读完后关闭映射）。
+    文件在调用时即打开，打开失败时直接抛出异常。
+
+    output_path 与 input_path 为同一文件（原地修改）时先读入全部行并关闭映射，
+    避免写完后替换仍在映射中的文件（Windows 上无法替换）。
+    """
+    mapped = MappedGCode(input_path, encoding)
+    if output_path is not None and os.path.exists(output_path) and os.path.samefile(input_path, output_path):
+        with mapped:
+            return list(mapped.iter_lines())
+    return _iter_mapped(mapped)
+
+
+def _iter_mapped(mapped):
+    with mapped:
+        yield from mapped.iter_lines()
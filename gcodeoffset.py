@@ -1,63 +1,157 @@
-import re
 import argparse
 
+import numpy as np
+
+from gcodeio import mapped_lines
+from gcodeparse import BLANK_LINE, iter_parse, replace_params, write_commands
+from motiontable import CMD_T1, MotionTable
+from pipelinelog import log
+
 def process_gcode(input_path, output_path, offset_x, offset_y, offset_z):
     """
     读取 G-code 文件，按空行分块处理。
     对包含 T1 的文本块中以 G0 或 G1 开头的行，调整 X、Y、Z 坐标。
+
+    输入文件以内存映射方式逐段读取，逐块处理后直接写出（与 stream_commands 相同），
+    内存中只保留当前块和下一块。
     """
     try:
-        with open(input_path, 'r') as f:
-            content = f.read()
+        lines = mapped_lines(input_path, output_path)
     except Exception as e:
         raise Exception(f"无法读取输入文件：{e}")
 
-    # 按空行分割成多个文本块
-    blocks = re.split(r'\n\s*\n', content)
-    new_blocks = []
-
-    for block in blocks:
-        # 如果该文本块包含 T1，则进行坐标偏移处理
-        if 'T1' in block:
-            new_lines = []
-            for line in block.splitlines():
-                # 对以 G0 或 G1 开头的行进行处理
-                if line.startswith(('G0', 'G1')):
-                    # 替换 X、Y、Z 坐标
-                    def replace_coord(match):
-                        coord_type = match.group(1)  # X, Y 或 Z
-                        coord_value = match.group(2)  # 数字部分
-                        if coord_value:  # 确保有数值
-                            try:
-                                value = float(coord_value)
-                                if coord_type == 'X':
-                                    new_value = value + offset_x
-                                elif coord_type == 'Y':
-                                    new_value = value + offset_y
-                                elif coord_type == 'Z':
-                                    new_value = value + offset_z
-                                return f"{coord_type}{new_value:.2f}"
-                            except ValueError:
-                                return match.group(0)  # 如果转换失败，保持原样
-                        return match.group(0)  # 如果没有数值，保持原样
-
-                    line = re.sub(r'([XYZ])(-?\d+\.?\d*)', replace_coord, line)
-                new_lines.append(line)
-            new_block = "\n".join(new_lines)
-        else:
-            new_block = block
-        new_blocks.append(new_block)
-
-    # 组合所有文本块
-    new_content = "\n\n".join(new_blocks)
+    result = stream_commands(iter_parse(lines), offset_x, offset_y, offset_z)
 
     try:
-        with open(output_path, 'w') as f:
-            f.write(new_content)
+        write_commands(output_path, result)
+    except UnicodeDecodeError as e:
+        raise Exception(f"无法读取输入文件：{e}")
     except Exception as e:
         raise Exception(f"无法写入输出文件：{e}")
 
-    print("G-code 处理完成！")
+    log("G-code 处理完成！")
+
+def process_commands(commands, offset_x, offset_y, offset_z, table=None):
+    """
+    process_gcode 的内存版本：按空行分块，对包含 T1 的文本块中 G0/G1 行的 X、Y、Z 坐标加上偏移量，
+    返回新的指令列表。连续的多个空行合并为一个空行。
+
+    偏移量通过数值表按块一次性计算，table 为 commands 对应的数值表，为空时自动生成。
+    """
+    if table is None:
+        table = MotionTable.from_commands(commands)
+
+    # 包含 T1 的文本块中的 G0/G1 行
+    in_t1_block = table.block_any(table.cmd == CMD_T1)
+    coords = (('X', table.x + offset_x), ('Y', table.y + offset_y), ('Z', table.z + offset_z))
+    has_coord = ~(np.isnan(table.x) & np.isnan(table.y) & np.isnan(table.z))
+
+    commands = list(commands)
+    for i in np.flatnonzero(in_t1_block & table.is_motion & has_coord):
+        values = {}
+        for coord_type, new_values in coords:
+            new_value = float(new_values[i])
+            if new_value == new_value:  # 跳过 NaN（该行没有此坐标）
+                values[coord_type] = (round(new_value, 2), f"{new_value:.2f}")
+        commands[i] = replace_params(commands[i], **values)
+
+    blocks = split_offset_blocks(commands)
+    result = []
+    for index, block in enumerate(blocks):
+        is_last = index == len(blocks) - 1
+
+        # 最后一个 T1 块按行重新拼接，末尾不保留换行符
+        if is_last and block and block[-1].raw.endswith("\n") and any(cmd.code == 'T1' for cmd in block):
+            block = block[:-1] + [block[-1].with_raw(block[-1].raw[:-1])]
+
+        result.extend(block)
+        if not is_last:
+            if not block:
+                result.append(BLANK_LINE)  # 文件开头的空块
+            result.append(BLANK_LINE)
+
+    return result
+
+def stream_commands(commands, offset_x, offset_y, offset_z):
+    """
+    process_commands 的流式版本：逐块读入并输出，内存中只保留当前块和下一块
+    （需要读到下一块才能确定当前块是否为最后一块）。
+    """
+    previous = None
+    for block in iter_offset_blocks(commands):
+        if previous is not None:
+            yield from previous
+            if not previous:
+                yield BLANK_LINE  # 文件开头的空块
+            yield BLANK_LINE
+        previous = offset_block(block, offset_x, offset_y, offset_z)
+
+    # 最后一个 T1 块按行重新拼接，末尾不保留换行符
+    block = previous
+    if block and block[-1].raw.endswith("\n") and any(cmd.code == 'T1' for cmd in block):
+        block = block[:-1] + [block[-1].with_raw(block[-1].raw[:-1])]
+    yield from block
+
+def offset_block(block, offset_x, offset_y, offset_z):
+    """对包含 T1 的文本块中 G0/G1 行的 X、Y、Z 坐标加上偏移量，返回新的文本块"""
+    if not any(cmd.code == 'T1' for cmd in block):
+        return block
+    result = []
+    for cmd in block:
+        if cmd.is_motion:
+            values = {}
+            for coord_type, value, offset in (('X', cmd.x, offset_x), ('Y', cmd.y, offset_y), ('Z', cmd.z, offset_z)):
+                if value is not None:
+                    new_value = value + offset
+                    values[coord_type] = (round(new_value, 2), f"{new_value:.2f}")
+            if values:
+                cmd = replace_params(cmd, **values)
+        result.append(cmd)
+    return result
+
+def split_offset_blocks(commands):
+    """
+    按空行分块，分块方式与 re.split(r'\n\s*\n', content) 一致：
+    连续空行视为一个分隔，文件开头只有一个空行时该空行属于第一个块。
+    """
+    return list(iter_offset_blocks(commands))
+
+def iter_offset_blocks(commands):
+    """split_offset_blocks 的流式版本：逐个返回文本块"""
+    leading = []  # 文件开头的空行
+    block = []
+    in_gap = False
+    for cmd in commands:
+        if leading is not None:
+            if cmd.is_blank:
+                leading.append(cmd)
+                continue
+            if len(leading) >= 2:
+                yield []  # 文件开头的多个空行分出一个空块
+            else:
+                block.extend(leading)
+            leading = None
+
+        if cmd.is_blank:
+            if block:
+                in_gap = True
+            else:
+                block.append(cmd)
+            continue
+        if in_gap:
+            yield block
+            block = []
+            in_gap = False
+        block.append(cmd)
+
+    if leading is not None:  # 全部为空行
+        if len(leading) >= 2:
+            yield []
+        else:
+            block.extend(leading)
+    yield block
+    if in_gap:
+        yield []  # 文件末尾的空行分出一个空块
 
 # 命令行接口
 if __name__ == "__main__":
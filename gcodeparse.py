@@ -0,0 +1,307 @@
+from gcodeio import iter_lines, read_lines, write_lines
+
+try:
+    import _gcodeparse  # 可选的 C 扩展（python setup_gcodeparse.py build_ext --inplace 编译）
+except ImportError:
+    _gcodeparse = None
+
+# 解析为数值的参数字母
+PARAM_LETTERS = "XYZEJF"
+
+
+class GCodeLine:
+    """
+    一行 G-code 的解析结果。
+
+    - raw: 原始行文本（保留换行符），写文件时原样输出
+    - code: 指令字（如 G0、G1、T0、M400），空行和纯注释行为 None
+    - x/y/z/e/j/f: 对应参数的数值，缺省为 None
+    - comment: 分号后的注释内容（不含分号），无注释时为 None
+    """
+    __slots__ = ("raw", "code", "x", "y", "z", "e", "j", "f", "comment")
+
+    def __init__(self, raw, code=None, x=None, y=None, z=None, e=None, j=None, f=None, comment=None):
+        self.raw = raw
+        self.code = code
+        self.x = x
+        self.y = y
+        self.z = z
+        self.e = e
+        self.j = j
+        self.f = f
+        self.comment = comment
+
+    def __repr__(self):
+        return f"GCodeLine({self.raw!r})"
+
+    @property
+    def text(self):
+        """去除首尾空白后的行文本"""
+        return self.raw.strip()
+
+    @property
+    def is_blank(self):
+        """是否为空行（块分隔行）"""
+        return self.code is None and self.comment is None
+
+    @property
+    def is_motion(self):
+        """是否为 G0/G1 运动指令"""
+        return self.code == "G0" or self.code == "G1"
+
+    @property
+    def has_xyz(self):
+        """是否同时包含 X、Y、Z 坐标"""
+        return self.x is not None and self.y is not None and self.z is not None
+
+    @property
+    def type_name(self):
+        """;TYPE: 注释中的打印类型，非 TYPE 行返回 None"""
+        comment = self.comment
+        if comment is not None and comment.startswith("TYPE:") and comment[5:6].strip():
+            return comment[5:].split(None, 1)[0]
+        return None
+
+    @property
+    def is_type(self):
+        """是否为 ;TYPE: 注释行"""
+        return self.code is None and self.comment is not None and self.comment.startswith("TYPE:")
+
+    @property
+    def is_layer(self):
+        """是否为 ;LAYER: 注释行"""
+        return self.code is None and self.comment is not None and self.comment.startswith("LAYER:")
+
+    @property
+    def layer(self):
+        """;LAYER: 注释中的层号，无法解析时返回 None"""
+        if self.is_layer:
+            try:
+                return int(self.comment[6:].strip())
+            except ValueError:
+                return None
+        return None
+
+    def with_raw(self, raw):
+        """返回仅原始文本不同的新记录（参数不变，无需重新解析）"""
+        return GCodeLine(raw, self.code, self.x, self.y, self.z, self.e, self.j, self.f, self.comment)
+
+    def stripped(self):
+        """返回去除首尾空白并以换行结尾的记录（等价于 line.strip() + "\n"）"""
+        raw = self.raw.strip() + "\n"
+        if raw == self.raw:
+            return self
+        return self.with_raw(raw)
+
+    def terminated(self):
+        """返回以换行结尾的记录（等价于 line.rstrip('\n') + "\n"）"""
+        if self.raw.endswith("\n"):
+            return self
+        return self.with_raw(self.raw + "\n")
+
+
+# 空行（块分隔行）。记录创建后不再修改，可在各步骤间共享
+BLANK_LINE = GCodeLine("\n")
+
+
+def py_parse_line(raw):
+    """将一行文本解析为 GCodeLine（纯 Python 实现，C 扩展 _gcodeparse 的解析规则与此相同）"""
+    body, sep, comment = raw.partition(";")
+    words = body.split()
+    if not words:
+        if sep:
+            return GCodeLine(raw, comment=comment.rstrip("\r\n"))
+        return GCodeLine(raw)
+
+    x = y = z = e = j = f = None
+    for word in words[1:]:
+        letter = word[0]
+        if letter not in PARAM_LETTERS:
+            continue
+        try:
+            value = float(word[1:])
+        except ValueError:
+            continue
+        # 参数重复出现时以第一次为准（与原先各步骤的 re.search 行为一致）
+        if letter == "X":
+            if x is None:
+                x = value
+        elif letter == "Y":
+            if y is None:
+                y = value
+        elif letter == "Z":
+            if z is None:
+                z = value
+        elif letter == "E":
+            if e is None:
+                e = value
+        elif letter == "J":
+            if j is None:
+                j = value
+        elif f is None:
+            f = value
+    return GCodeLine(raw, words[0], x, y, z, e, j, f, comment.rstrip("\r\n") if sep else None)
+
+
+def py_parse_lines(lines):
+    """parse_lines 的纯 Python 实现"""
+    return [py_parse_line(line) for line in lines]
+
+
+if _gcodeparse is not None:
+    # 解析后端名称（"c" 或 "python"），两者结果相同，只是速度不同
+    BACKEND = "c"
+
+    def parse_line(raw):
+        """将一行文本解析为 GCodeLine"""
+        return _gcodeparse.parse_line(raw, GCodeLine)
+
+    def parse_lines(lines):
+        """将行列表（readlines() 格式）解析为 GCodeLine 列表"""
+        return _gcodeparse.parse_lines(lines, GCodeLine)
+else:
+    BACKEND = "python"
+    parse_line = py_parse_line
+    parse_lines = py_parse_lines
+
+
+def ordered_xyz(cmd):
+    """
+    按原先 GCodeProcessor 中 G0/G1 正则的规则提取坐标：
+    只识别紧跟在指令（及整数 F）之后、按 X、Y、Z 顺序出现的坐标。
+    例如 Cura 结束代码 "G1 E-2 Z0.2" 中的 Z 不会被识别，返回 (None, None, None)。
+    """
+    words = cmd.raw.partition(";")[0].split()
+    count = len(words)
+    i = 1
+    if i < count and words[i][0] == "F":
+        if not words[i][1:].isdigit():
+            return None, None, None  # 小数 F 时正则匹配不到后面的坐标
+        i += 1
+
+    values = []
+    for letter in "XYZ":
+        value = None
+        if i < count and words[i][0] == letter:
+            value = getattr(cmd, letter.lower())
+            if value is None:
+                break
+            i += 1
+        values.append(value)
+    values += [None] * (3 - len(values))
+    return tuple(values)
+
+
+def iter_parse(lines):
+    """parse_lines 的流式版本：逐行解析任意行迭代器，返回 GCodeLine 生成器"""
+    return map(parse_line, lines)
+
+
+def to_lines(commands):
+    """将 GCodeLine 列表还原为行列表"""
+    return [cmd.raw for cmd in commands]
+
+
+def read_commands(input_path, encoding=None):
+    """读取并解析 G-code 文件"""
+    return parse_lines(read_lines(input_path, encoding=encoding))
+
+
+def iter_commands(input_path, encoding=None):
+    """read_commands 的流式版本：边读边解析，不保留整个文件"""
+    return iter_parse(iter_lines(input_path, encoding=encoding))
+
+
+def write_commands(output_path, commands, encoding=None):
+    """将 GCodeLine 列表或生成器逐行写入文件"""
+    write_lines(output_path, (cmd.raw for cmd in commands), encoding=encoding)
+
+
+def motion(code, x, y, z, e=None, j=None, f=None, raw=None):
+    """
+    生成一条 G0/G1 运动指令记录。
+
+    数值需与写出的文本一致（例如按 .2f 输出时传入 round(v, 2)）；
+    raw 为空时按 "G1 X.. Y.. Z.." 格式（使用 str(float)）生成文本。
+    """
+    if raw is None:
+        raw = f"{code} X{x} Y{y} Z{z}\n"
+    return GCodeLine(raw, code, x, y, z, e, j, f)
+
+
+def replace_params(cmd, newline=None, **values):
+    """
+    替换指令中的参数文本并返回新记录，values 形如 X=(数值, 文本)。
+
+    参数按原有顺序逐个替换，其余参数和注释保持不变；各参数之间以单个空格分隔。
+    newline 为 None 时保留原行的换行符。
+    """
+    line = cmd.raw.rstrip("\r\n")
+    if newline is None:
+        newline = cmd.raw[len(line):]
+    body, sep, comment = line.partition(";")
+    words = body.split()
+    fields = [cmd.x, cmd.y, cmd.z, cmd.e, cmd.j, cmd.f]
+    for i in range(1, len(words)):
+        letter = words[i][0]
+        if letter in values:
+            value, text = values[letter]
+            words[i] = letter + text
+            fields[PARAM_LETTERS.index(letter)] = value
+    raw = " ".join(words)
+    if sep:
+        raw += " ;" + comment
+    return GCodeLine(raw + newline, cmd.code, *fields, cmd.comment)
+
+
+def strip_last_newline(commands):
+    """
+    原地去掉最后一行的换行符，与用 '\\n'.join(...) 写文件的结果保持一致：
+    最后一行为空行时直接去掉该行。
+    """
+    if commands:
+        last = commands[-1]
+        if last.raw == "\n":
+            commands.pop()
+        elif last.raw.endswith("\n"):
+            commands[-1] = last.with_raw(last.raw[:-1])
+    return commands
+
+
+def iter_strip_last_newline(commands):
+    """strip_last_newline 的流式版本：只缓存一行，用于判断哪一行是最后一行"""
+    previous = None
+    for cmd in commands:
+        if previous is not None:
+            yield previous
+        previous = cmd
+    if previous is not None:
+        if previous.raw.endswith("\n"):
+            if previous.raw == "\n":
+                return
+            previous = previous.with_raw(previous.raw[:-1])
+        yield previous
+
+
+def split_blocks(commands):
+    """按空行将指令列表拆分为文本块列表（空行本身不包含在块中）"""
+    blocks = []
+    start = 0
+    # 先找出所有空行再按位置切片，不逐行追加
+    for index in [i for i, cmd in enumerate(commands) if cmd.code is None and cmd.comment is None]:
+        blocks.append(commands[start:index])
+        start = index + 1
+    blocks.append(commands[start:])
+    return blocks
+
+
+def iter_blocks(commands):
+    """split_blocks 的流式版本：逐个返回文本块，内存中只保留当前块"""
+    block = []
+    for cmd in commands:
+        if cmd.is_blank:
+            yield block
+            block = []
+        else:
+            block.append(cmd)
+    yield block
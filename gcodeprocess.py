@@ -2,31 +2,14 @@ import sys
 import json
 import os
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog,
-                             QMessageBox, QHBoxLayout, QComboBox, QDoubleSpinBox, QSpinBox, QLineEdit)
+                             QMessageBox, QHBoxLayout, QComboBox, QDoubleSpinBox, QSpinBox, QLineEdit, QCheckBox)
 from PyQt5.QtCore import Qt
 
-# 假设这些导入的模块是你程序中已有的 G-code 处理函数
-from reorganization import process_file as reorganize
-from TransferG0 import process_file as transfer_g0
-from G0Trimmer import process_file as trim_g0
-from GCodeAnnotator import process_gcode as next_step
-from GCodeProcessor import process_gcode as fifth_step
-from GCodeMotionExtractor import process_gcode as sixth_step
-from gcodefile import process_gcode as seventh_step
-from GCodeZFilter import process_gcode as eighth_step
-from Zreorganize import process_z_values as zreorganize_step
-from gcodeoffset import process_gcode as ninth_step
-from deleteG0 import process_file as tenth_step
-from addextrusion import process_jcount as eleventh_step
-from cutter import process_gcode_file as twelfth_step
-from change_f import process_file as thirteenth_step
-from upupup import process_file as fourteenth_step
-from joffset import process_file as fifteenth_step
-from endZup import process_file as sixteenth_step
-from add_commands import add_commands_and_swap_T0_T1 as seventeenth_step
-from trans_gcode_to_array import process_gcode_to_array as eighteenth_step
-from arraytojbi import process_array_to_jbi as nineteenth_step
-from offset import process_gcode_with_offset as twentieth_step
+# G-code 后处理流程（20 个步骤）
+from pipeline import run_pipeline
+from pipelinestats import REPORT_NAME
+# 后台线程执行处理流程，显示进度和日志
+from pipelineworker import PipelineRunPanel
 
 class GCodeProcessorApp(QWidget):
     def __init__(self, parent=None, config=None):
@@ -155,6 +138,8 @@ class GCodeProcessorApp(QWidget):
         self.j_distance_label = QLabel("预挤出长度 J_distance:", self)
         self.j_distance_entry = QLineEdit(self)
         self.j_distance_entry.setText("10.0")
+        self.cut_period_label = QLabel("周期剪断间距 (mm，留空不启用):", self)
+        self.cut_period_entry = QLineEdit(self)
         twelfth_step_params_layout = QVBoxLayout()
         twelfth_step_params_layout.addWidget(self.distance_label)
         twelfth_step_params_layout.addWidget(self.distance_entry)
@@ -164,6 +149,8 @@ class GCodeProcessorApp(QWidget):
         twelfth_step_params_layout.addWidget(self.connection_f_entry)
         twelfth_step_params_layout.addWidget(self.j_distance_label)
         twelfth_step_params_layout.addWidget(self.j_distance_entry)
+        twelfth_step_params_layout.addWidget(self.cut_period_label)
+        twelfth_step_params_layout.addWidget(self.cut_period_entry)
         layout.addLayout(twelfth_step_params_layout)
 
         twentieth_step_params_layout = QHBoxLayout()
@@ -187,10 +174,21 @@ class GCodeProcessorApp(QWidget):
         twentieth_step_params_layout.addWidget(self.global_offset_z_entry)
         layout.addLayout(twentieth_step_params_layout)
 
+        self.dump_intermediates_check = QCheckBox("保存中间文件（调试用）", self)
+        layout.addWidget(self.dump_intermediates_check)
+        self.profile_check = QCheckBox("记录各步骤耗时和内存（性能报告）", self)
+        layout.addWidget(self.profile_check)
+
         self.process_button = QPushButton("开始处理", self)
         self.process_button.clicked.connect(self.process_files)
         layout.addWidget(self.process_button)
 
+        self.run_panel = PipelineRunPanel(self)
+        self.run_panel.finished.connect(self.on_process_finished)
+        self.run_panel.failed.connect(self.on_process_failed)
+        self.run_panel.stopped.connect(lambda: self.process_button.setEnabled(True))
+        layout.addWidget(self.run_panel)
+
     def select_input_file(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "选择输入文件", "", "G-code files (*.gcode)")
         if file_path:
@@ -244,7 +242,7 @@ class GCodeProcessorApp(QWidget):
             insert_f = float(self.insert_f_entry.text())
             connection_f = float(self.connection_f_entry.text())
             j_distance = float(self.j_distance_entry.text())
-            j_offset = j_distance - distance
+            cut_period = self.cut_period()
         except ValueError:
             QMessageBox.warning(self, "错误", "请输入有效的第十二步参数（数字）")
             return
@@ -257,53 +255,42 @@ class GCodeProcessorApp(QWidget):
             QMessageBox.warning(self, "错误", "请输入有效的整体偏置坐标（数字）")
             return
 
-        try:
-            intermediate_output1 = "intermediate_1.gcode"
-            intermediate_output2 = "intermediate_2.gcode"
-            intermediate_output3 = "intermediate_3.gcode"
-            intermediate_output4 = "intermediate_4.gcode"
-            intermediate_output5 = "intermediate_5.gcode"
-            intermediate_output6 = "intermediate_6.gcode"
-            intermediate_output7 = "intermediate_7.gcode"
-            intermediate_output8 = "intermediate_8.gcode"
-            intermediate_output_zreorganize = "intermediate_zreorganize.gcode"
-            intermediate_output9 = "intermediate_9.gcode"
-            intermediate_output10 = "intermediate_10.gcode"
-            eleventh_output = "intermediate_11.gcode"
-            twelfth_output = "intermediate_12.gcode"
-            thirteenth_output = "intermediate_13.gcode"
-            fourteenth_output = "intermediate_14.gcode"
-            fifteenth_output = "intermediate_15.gcode"
-            intermediate_16 = "intermediate_16.gcode"
-            intermediate_17 = "intermediate_17.gcode"
-            intermediate_20 = "intermediate_20.gcode"
-            intermediate_18 = "intermediate_18.gcode"
-
-            reorganize(input_file, intermediate_output1, type_map)
-            transfer_g0(intermediate_output1, intermediate_output2)
-            trim_g0(intermediate_output2, intermediate_output3)
-            next_step(intermediate_output3, intermediate_output4)
-            fifth_step(intermediate_output4, intermediate_output5)
-            sixth_step(intermediate_output5, intermediate_output6)
-            seventh_step(intermediate_output6, intermediate_output7)
-            eighth_step(intermediate_output7, intermediate_output8)
-            zreorganize_step(intermediate_output8, intermediate_output_zreorganize)
-            ninth_step(intermediate_output_zreorganize, intermediate_output9, offset_x, offset_y, offset_z)
-            tenth_step(intermediate_output9, intermediate_output10)
-            eleventh_step(intermediate_output10, eleventh_output, w, h, k2, f1, f2)
-            twelfth_step(eleventh_output, twelfth_output, distance, insert_f, connection_f, j_offset)
-            thirteenth_step(twelfth_output, thirteenth_output, insert_f)
-            fourteenth_step(thirteenth_output, fourteenth_output)
-            fifteenth_step(fourteenth_output, fifteenth_output, -5, -5, j_distance)
-            sixteenth_step(fifteenth_output, intermediate_16)
-            seventeenth_step(intermediate_16, intermediate_17)
-            twentieth_step(intermediate_17, intermediate_20, global_offset_x, global_offset_y, global_offset_z)
-            eighteenth_step(intermediate_20, intermediate_18)
-            nineteenth_step(intermediate_18, nineteenth_output_folder, user, tool)
-
-            QMessageBox.information(self, "成功", f"所有处理步骤完成！第19步输出文件夹: {nineteenth_output_folder}")
-        except Exception as e:
-            QMessageBox.critical(self, "错误", f"处理失败: {str(e)}")
+        params = {
+            "type_map": type_map,
+            "offset_x": offset_x, "offset_y": offset_y, "offset_z": offset_z,
+            "w": w, "h": h, "k2": k2, "f1": f1, "f2": f2,
+            "distance": distance, "insert_f": insert_f, "connection_f": connection_f, "j_distance": j_distance,
+            "cut_period": cut_period,
+            "global_offset_x": global_offset_x, "global_offset_y": global_offset_y, "global_offset_z": global_offset_z,
+            "user": user, "tool": tool,
+        }
+
+        # 在后台线程中处理，完成后在 on_process_finished / on_process_failed 中提示
+        # 调试模式下中间文件保存在当前工作目录（与原流程一致）
+        self.running_output_folder = nineteenth_output_folder
+        self.running_profile = self.profile_check.isChecked()
+        if self.run_panel.start(run_pipeline, input_file, nineteenth_output_folder, params,
+                                dump_intermediates=self.dump_intermediates_check.isChecked(),
+                                intermediate_folder=os.getcwd(), before_check=False,
+                                profile=self.running_profile, profile_summary=self.running_profile):
+            self.process_button.setEnabled(False)
+
+    def on_process_finished(self, result):
+        message = f"所有处理步骤完成！第19步输出文件夹: {self.running_output_folder}"
+        if self.running_profile:
+            message += f"\n性能报告: {os.path.join(self.running_output_folder, REPORT_NAME)}"
+        QMessageBox.information(self, "成功", message)
+
+    def on_process_failed(self, error):
+        message = f"处理失败: {error}"
+        if self.running_profile:
+            message += f"\n出错的步骤见性能报告: {os.path.join(self.running_output_folder, REPORT_NAME)}"
+        QMessageBox.critical(self, "错误", message)
+
+    def cut_period(self):
+        """周期剪断间距，留空时为 None（只在距离末端 distance 处剪断）"""
+        text = self.cut_period_entry.text().strip()
+        return float(text) if text else None
 
     def load_config(self, config):
         if "type_map" in config:
@@ -322,12 +309,16 @@ class GCodeProcessorApp(QWidget):
         self.insert_f_entry.setText(str(config.get("insert_f", 300.0)))
         self.connection_f_entry.setText(str(config.get("connection_f", 800.0)))
         self.j_distance_entry.setText(str(config.get("j_distance", 10.0)))
+        cut_period = config.get("cut_period")
+        self.cut_period_entry.setText("" if cut_period is None else str(cut_period))
         self.global_offset_x_entry.setText(str(config.get("global_offset_x", 100.0)))
         self.global_offset_y_entry.setText(str(config.get("global_offset_y", 200.0)))
         self.global_offset_z_entry.setText(str(config.get("global_offset_z", 0.0)))
         self.user_entry.setText(str(config.get("user", 2)))
         self.tool_entry.setText(str(config.get("tool", 0)))
         self.nineteenth_output_folder_path.setText(config.get("nineteenth_output_folder", ""))
+        self.dump_intermediates_check.setChecked(bool(config.get("dump_intermediates", False)))
+        self.profile_check.setChecked(bool(config.get("profile", False)))
 
     def get_config(self):
         config = {
@@ -344,12 +335,15 @@ class GCodeProcessorApp(QWidget):
             "insert_f": float(self.insert_f_entry.text()),
             "connection_f": float(self.connection_f_entry.text()),
             "j_distance": float(self.j_distance_entry.text()),
+            "cut_period": self.cut_period(),
             "global_offset_x": float(self.global_offset_x_entry.text()),
             "global_offset_y": float(self.global_offset_y_entry.text()),
             "global_offset_z": float(self.global_offset_z_entry.text()),
             "user": int(self.user_entry.text()),
             "tool": int(self.tool_entry.text()),
-            "nineteenth_output_folder": self.nineteenth_output_folder_path.text()
+            "nineteenth_output_folder": self.nineteenth_output_folder_path.text(),
+            "dump_intermediates": self.dump_intermediates_check.isChecked(),
+            "profile": self.profile_check.isChecked()
         }
         return config
 
@@ -382,6 +376,11 @@ class GCodeProcessorAppMain(QMainWindow):
         central_widget.setLayout(layout)
         self.setCentralWidget(central_widget)
 
+    def closeEvent(self, event):
+        # 子部件不会收到主窗口的关闭事件，需要在这里停止后台处理
+        self.gcode_processor.run_panel.shutdown()
+        super().closeEvent(event)
+
     def load_config(self):
         """加载默认配置文件"""
         if os.path.exists(self.config_file):
@@ -0,0 +1,204 @@
+import argparse
+import random
+
+# 默认的打印类型权重（各类型在每层中出现的相对频率）
+DEFAULT_TYPE_MIX = {
+    "WALL-OUTER": 1.0,
+    "WALL-INNER": 1.0,
+    "FILL": 1.0,
+    "SKIN": 0.5,
+    "SUPPORT": 0.3,
+}
+
+# 与界面默认值一致的打印类型 → 打印头映射，用于按 T1 比例调整类型权重
+DEFAULT_TYPE_MAP = {
+    "FILL": "T0",
+    "WALL-INNER": "T1",
+    "WALL-OUTER": "T1",
+    "SUPPORT": "T1",
+    "SUPPORT-INTERFACE": "T1",
+    "SKIN": "T0",
+    "SKIRT": "T0",
+}
+
+CURA_START = [
+    ";FLAVOR:Marlin",
+    ";TIME:{time}",
+    ";Filament used: 1.0m",
+    ";Layer height: {layer_height}",
+    ";Generated with Cura_SteamEngine 5.8.1",
+    "M140 S60",
+    "M105",
+    "M190 S60",
+    "M104 S200",
+    "M105",
+    "M109 S200",
+    "M82 ;absolute extrusion mode",
+    "G28 ;Home",
+    "G1 Z15.0 F6000 ;Move the platform down 15mm",
+    ";Prime the extruder",
+    "G92 E0",
+    "G1 F200 E3",
+    "G92 E0",
+    "G92 E0",
+    "G1 F1500 E-6.5",
+    ";LAYER_COUNT:{layers}",
+]
+
+CURA_END = [
+    "M140 S0",
+    "M107",
+    "G91 ;Relative positioning",
+    "G1 E-2 F2700 ;Retract a bit",
+    "G1 E-2 Z0.2 F2400 ;Retract and raise Z",
+    "G1 X5 Y5 F3000 ;Wipe out",
+    "G1 Z10 ;Raise Z more",
+    "G90 ;Absolute positioning",
+    "M106 S0",
+    "M104 S0",
+    "M140 S0",
+    ";Retract the filament",
+    "G92 E1",
+    "G1 E-1 F300",
+    "G28 X0 Y0",
+    "M84",
+    "M82 ;absolute extrusion mode",
+    "M104 S0",
+    ";End of Gcode",
+]
+
+
+def type_weights(type_mix=None, t1_ratio=None, type_map=None):
+    """
+    返回 [(类型, 权重)]。
+
+    t1_ratio 不为空时按 type_map 把类型分为 T0、T1 两组，
+    缩放两组的权重，使 T1 类型出现的比例约为 t1_ratio。
+    """
+    weights = dict(type_mix or DEFAULT_TYPE_MIX)
+    if t1_ratio is not None:
+        type_map = type_map or DEFAULT_TYPE_MAP
+        t1_types = [name for name in weights if type_map.get(name) == "T1"]
+        t0_types = [name for name in weights if name not in t1_types]
+        t1_total = sum(weights[name] for name in t1_types)
+        t0_total = sum(weights[name] for name in t0_types)
+        if t1_total and t0_total:
+            for name in t1_types:
+                weights[name] *= t1_ratio / t1_total
+            for name in t0_types:
+                weights[name] *= (1 - t1_ratio) / t0_total
+    return [(name, weight) for name, weight in weights.items() if weight > 0]
+
+
+def iter_cura_lines(layers=50, type_mix=None, t1_ratio=None, type_map=None, segments=(10, 60),
+                    islands=(1, 3), types_per_layer=(2, 4), layer_height=0.2, seed=0):
+    """
+    逐行生成 Cura 风格的 G-code（不含换行符）。
+
+    - layers: 层数
+    - type_mix: {打印类型: 权重}，默认 DEFAULT_TYPE_MIX
+    - t1_ratio: T1 类型出现的比例（按 type_map 划分），为空时直接使用 type_mix 的权重
+    - segments: 每段连续挤出的 G1 数量范围
+    - islands: 每个类型中的挤出段数范围（段之间有回抽、G0 空移和 Z 抬升）
+    - types_per_layer: 每层出现的类型数范围
+    - seed: 随机种子，相同参数和种子生成完全相同的文件
+    """
+    rnd = random.Random(seed)
+    weights = type_weights(type_mix, t1_ratio, type_map)
+    names = [name for name, _ in weights]
+    values = [weight for _, weight in weights]
+
+    for line in CURA_START:
+        yield line.format(time=layers * 60, layer_height=layer_height, layers=layers)
+
+    e = -6.5
+    z = 0.0
+    x, y = 120.0, 120.0
+    for layer in range(layers):
+        z = round(z + layer_height, 3)
+        yield f";LAYER:{layer}"
+        yield "M107" if layer else "M106 S255"
+        x, y = rnd.uniform(80, 160), rnd.uniform(80, 160)
+        yield f"G0 F6000 X{x:.3f} Y{y:.3f} Z{z:g}"
+        count = min(rnd.randint(*types_per_layer), len(names))
+        chosen = []
+        while len(chosen) < count:
+            name = rnd.choices(names, values)[0]
+            if name not in chosen:
+                chosen.append(name)
+        for name in chosen:
+            yield f";TYPE:{name}"
+            for island in range(rnd.randint(*islands)):
+                if island:
+                    # 回抽、空移（偶尔抬升 Z）、回填
+                    yield f"G1 F2700 E{e - 6.5:.5f}"
+                    hop = rnd.random() < 0.3
+                    if hop:
+                        yield f"G1 F3000 Z{z + 0.2:g}"
+                    for _ in range(rnd.randint(1, 3)):
+                        x, y = rnd.uniform(80, 160), rnd.uniform(80, 160)
+                        yield f"G0 F15000 X{x:.3f} Y{y:.3f}" if rnd.random() < 0.6 else f"G0 X{x:.3f} Y{y:.3f}"
+                    if hop:
+                        yield f"G1 F3000 Z{z:g}"
+                    yield f"G1 F2700 E{e:.5f}"
+                for i in range(rnd.randint(*segments)):
+                    nx = min(max(x + rnd.uniform(-8, 8), 20), 220)
+                    ny = min(max(y + rnd.uniform(-8, 8), 20), 220)
+                    e += ((nx - x) ** 2 + (ny - y) ** 2) ** 0.5 * 0.033
+                    x, y = nx, ny
+                    # Cura 输出的坐标省略末尾的 0
+                    xs = f"{x:.3f}".rstrip("0").rstrip(".")
+                    ys = f"{y:.3f}".rstrip("0").rstrip(".")
+                    if i == 0:
+                        yield f"G1 F1800 X{xs} Y{ys} E{e:.5f}"
+                    else:
+                        yield f"G1 X{xs} Y{ys} E{e:.5f}"
+        yield f";TIME_ELAPSED:{(layer + 1) * 60:.6f}"
+
+    yield f"G1 F2700 E{e - 6.5:.5f}"
+    yield from CURA_END
+
+
+def write_cura_gcode(path, **options):
+    """生成 Cura 风格的 G-code 文件，options 见 iter_cura_lines，返回行数"""
+    count = 0
+    with open(path, "w") as f:
+        for line in iter_cura_lines(**options):
+            f.write(line + "\n")
+            count += 1
+    return count
+
+
+def parse_range(text):
+    """把 "10,60" 或 "20" 解析为 (最小值, 最大值)"""
+    parts = [int(part) for part in text.split(",")]
+    return parts[0], parts[-1]
+
+
+def parse_type_mix(text):
+    """把 "FILL=2,WALL-OUTER=1" 解析为类型权重字典"""
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="生成 Cura 风格的合成 G-code 文件（用于性能测试）")
+    parser.add_argument("output", help="输出 G-code 文件路径")
+    parser.add_argument("--layers", type=int, default=50, help="层数")
+    parser.add_argument("--types", type=parse_type_mix, help="类型权重，如 FILL=2,WALL-OUTER=1,SUPPORT=0.5")
+    parser.add_argument("--t1-ratio", type=float, help="T1 类型（按界面默认映射）出现的比例")
+    parser.add_argument("--segments", type=parse_range, default=(10, 60), help="每段挤出的 G1 数量范围，如 10,60")
+    parser.add_argument("--islands", type=parse_range, default=(1, 3), help="每个类型中的挤出段数范围")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    args = parser.parse_args()
+
+    count = write_cura_gcode(args.output, layers=args.layers, type_mix=args.types, t1_ratio=args.t1_ratio,
+                             segments=args.segments, islands=args.islands, seed=args.seed)
+    print(f"已生成 {args.output}，共 {count} 行")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+
+import arraytojbi
+import trans_gcode_to_array
+from gcodeio import read_lines
+from gcodeparse import parse_lines, to_lines
+from gcodesynth import write_cura_gcode
+from goldenref import BASELINE_REVISION, export_baseline, run_reference
+from pipeline import ARRAY_NAME, DEFAULT_PARAMS, PREVIEW_NAME, build_steps, run_pipeline
+
+# 默认的参考输出文件夹
+GOLDEN_FOLDER = "golden"
+MANIFEST_NAME = "manifest.json"
+INPUT_NAME = "input.gcode"
+JBI_FOLDER = "jbi"
+# 基准版本写出的点数组（np.savetxt 的文本格式）
+REFERENCE_ARRAY_NAME = "intermediate_18.txt"
+
+# 仓库自带的输入文件
+BUNDLED_INPUTS = ["processed_output.txt", "connected_polyline_all.txt"]
+
+# 合成输入：(用例名, gcodesynth.write_cura_gcode 的参数)
+SYNTHETIC_INPUTS = [
+    ("synthetic_small", {"layers": 8, "seed": 1, "segments": (4, 20)}),
+    ("synthetic_t1_heavy", {"layers": 30, "seed": 2, "t1_ratio": 0.8}),
+    ("synthetic_t0_heavy", {"layers": 30, "seed": 3, "t1_ratio": 0.2, "islands": (1, 5)}),
+]
+
+# 检查模式：各步骤的文件版本、内存版本和流式版本
+CHECK_MODES = ("dump", "memory", "streaming")
+
+
+def quiet():
+    """不输出各步骤的打印信息"""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def stage_names(steps):
+    """步骤名称（模块名），如 reorganization、offset"""
+    return [file_func.__module__ for _, file_func, _, _, _ in steps]
+
+
+def snapshot_case(case_folder, input_path, baseline_folder, params=None, before_check=True, source=None):
+    """
+    用基准版本的实现（goldenref.BASELINE_REVISION，各步骤的文件版本函数，依次执行）处理 input_path，
+    把输入、每一步的输出、点数组和 JBI 文件保存到 case_folder，并写出 manifest.json。
+    baseline_folder 为 goldenref.export_baseline 导出的基准版本源码。
+
+    某一步没有写出文件或抛出异常时在该步停止，记录在 manifest 中。
+    """
+    params = dict(params or DEFAULT_PARAMS)
+    if os.path.exists(case_folder):
+        shutil.rmtree(case_folder)
+    os.makedirs(case_folder)
+    shutil.copyfile(input_path, os.path.join(case_folder, INPUT_NAME))
+
+    steps = build_steps(params, before_check)
+    specs = [(name, stage, file_func.__name__, list(args))
+             for (name, file_func, _, _, args), stage in zip(steps, stage_names(steps))]
+    manifest = {"source": source or input_path, "reference": BASELINE_REVISION, "params": params,
+                "before_check": before_check}
+    manifest.update(run_reference(baseline_folder, case_folder, INPUT_NAME, specs, REFERENCE_ARRAY_NAME,
+                                  JBI_FOLDER, params["user"], params["tool"]))
+
+    with open(os.path.join(case_folder, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4, ensure_ascii=False)
+    return manifest
+
+
+def snapshot(golden_folder=GOLDEN_FOLDER, inputs=None, synthetic=True, params=None, base_folder=None):
+    """
+    用基准版本生成参考输出：inputs 为输入文件列表（默认为仓库自带的 processed_output.txt、
+    connected_polyline_all.txt），synthetic 为 True 时再加上 SYNTHETIC_INPUTS 中的合成文件。
+    """
+    base_folder = base_folder or os.path.dirname(os.path.abspath(__file__))
+    if inputs is None:
+        inputs = [os.path.join(base_folder, name) for name in BUNDLED_INPUTS]
+    manifests = {}
+    with tempfile.TemporaryDirectory() as temp_folder:
+        baseline_folder = os.path.join(temp_folder, "baseline")
+        export_baseline(baseline_folder, repo_folder=base_folder)
+        for input_path in inputs:
+            case = os.path.splitext(os.path.basename(input_path))[0]
+            manifests[case] = snapshot_case(os.path.join(golden_folder, case), input_path, baseline_folder,
+                                            params, source=os.path.basename(input_path))
+        if synthetic:
+            for case, options in SYNTHETIC_INPUTS:
+                input_path = os.path.join(temp_folder, case + ".gcode")
+                write_cura_gcode(input_path, **options)
+                manifests[case] = snapshot_case(os.path.join(golden_folder, case), input_path, baseline_folder,
+                                                params, source=f"gcodesynth {options}")
+    return manifests
+
+
+def load_manifest(case_folder):
+    with open(os.path.join(case_folder, MANIFEST_NAME), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def list_cases(golden_folder=GOLDEN_FOLDER):
+    """参考输出文件夹中的用例名"""
+    return sorted(name for name in os.listdir(golden_folder)
+                  if os.path.exists(os.path.join(golden_folder, name, MANIFEST_NAME)))
+
+
+def first_difference(expected, actual):
+    """
+    比较两个行列表，返回第一处不同 (行号, 参考行, 实际行)，相同时返回 None。
+
+    行号从 1 开始；一方已经结束时对应的行为 None。
+    """
+    for i, (a, b) in enumerate(zip(expected, actual)):
+        if a != b:
+            return i + 1, a, b
+    if len(expected) != len(actual):
+        i = min(len(expected), len(actual))
+        return (i + 1, expected[i] if i < len(expected) else None,
+                actual[i] if i < len(actual) else None)
+    return None
+
+
+def stage_inputs(case_folder, manifest):
+    """返回 [(步骤名, 输入文件路径, 参考输出文件路径或 None)]，参考实现停止的步骤输出为 None"""
+    result = []
+    current = os.path.join(case_folder, INPUT_NAME)
+    for stage in manifest["stages"]:
+        output_path = os.path.join(case_folder, stage["output"])
+        result.append((stage["name"], current, output_path))
+        current = output_path
+    if manifest["stopped_at"]:
+        result.append((manifest["stopped_at"], current, None))
+    return result
+
+
+def fused_stage_inputs(stages, steps, reference_steps):
+    """
+    按合并后的步骤列表 steps（build_steps(..., fused=True)）重新划分 stage_inputs 的结果：
+    合并步骤的输入为它代替的第一个步骤的输入，参考输出为代替的最后一个步骤
+    （在 reference_steps 中输出文件名相同的步骤）的输出。
+    """
+    outputs = [step[0] for step in reference_steps]
+    names = stage_names(steps)
+    result = []
+    i = 0
+    for k, step in enumerate(steps):
+        if i >= len(stages):
+            break
+        j = outputs.index(step[0])
+        # 参考实现在代替的步骤中途停止时参考输出为 None
+        result.append((names[k], stages[i][1], stages[min(j, len(stages) - 1)][2]))
+        i = j + 1
+    return result
+
+
+def run_stage(mode, step, input_path, output_path):
+    """用指定模式执行一个步骤，返回输出行列表"""
+    _, file_func, commands_func, stream_func, args = step
+    with quiet():
+        if mode == "dump":
+            file_func(input_path, output_path, *args)
+            if not os.path.exists(output_path):
+                raise RuntimeError("没有写出输出文件")
+            return read_lines(output_path, encoding="utf-8")
+        commands = parse_lines(read_lines(input_path, encoding="utf-8"))
+        if mode == "memory":
+            return to_lines(commands_func(commands, *args))
+        return [cmd.raw for cmd in stream_func(iter(commands), *args)]
+
+
+def compare_stage(case, stage, expected_path, run):
+    """
+    执行 run() 得到输出行列表并与参考输出比较，返回差异记录（相同时返回 None）。
+
+    参考实现在该步停止时，要求新实现也抛出异常。
+    """
+    try:
+        actual = run()
+        error = None
+    except (Exception, SystemExit) as e:
+        actual = None
+        error = f"{type(e).__name__}: {e}"
+
+    if expected_path is None:
+        if error is None:
+            return {"case": case, "stage": stage, "message": "参考实现在这一步停止，新实现却有输出"}
+        return None
+    if error is not None:
+        return {"case": case, "stage": stage, "message": f"新实现出错：{error}"}
+    difference = first_difference(read_lines(expected_path, encoding="utf-8"), actual)
+    if difference:
+        line, expected, got = difference
+        return {"case": case, "stage": stage, "line": line, "expected": expected, "actual": got}
+    return None
+
+
+def check_case(golden_folder, case, mode="memory", chain=True, fused=False):
+    """
+    用指定模式逐个检查各步骤：每一步都以参考输出作为输入（互不影响），输出与参考输出逐行比较；
+    再由参考的第 20 步输出生成点数组和 JBI 文件，与基准版本的输出比较。
+    chain 为 True 时内存/流式模式还会执行整条流程，比较最终 G-code 和 JBI 文件。
+    fused 为 True 时检查合并后的步骤（见 pipeline.build_steps），整条流程也使用合并后的步骤。
+
+    返回差异记录列表。
+    """
+    case_folder = os.path.join(golden_folder, case)
+    manifest = load_manifest(case_folder)
+    params = manifest["params"]
+    step_list = build_steps(params, manifest["before_check"], fused)
+    steps = {step[1].__module__: step for step in step_list}
+    stages = stage_inputs(case_folder, manifest)
+    if fused:
+        stages = fused_stage_inputs(stages, step_list, build_steps(params, manifest["before_check"]))
+    differences = []
+
+    with tempfile.TemporaryDirectory() as temp_folder:
+        for stage, input_path, expected_path in stages:
+            step = steps[stage]
+            output_path = os.path.join(temp_folder, step[0])
+            difference = compare_stage(case, stage, expected_path,
+                                       lambda: run_stage(mode, step, input_path, output_path))
+            if difference:
+                differences.append(difference)
+
+        if manifest["stopped_at"]:
+            return differences
+
+        # 点数组和 JBI 文件
+        final_path = os.path.join(case_folder, manifest["stages"][-1]["output"])
+        with quiet():
+            if mode == "dump":
+                arr = trans_gcode_to_array.process_gcode_to_array(final_path, os.path.join(temp_folder, ARRAY_NAME))
+            else:
+                arr = trans_gcode_to_array.commands_to_array(parse_lines(read_lines(final_path, encoding="utf-8")))
+        # 基准版本以文本保存点数组，按相同格式输出后逐行比较
+        text = io.StringIO()
+        np.savetxt(text, arr, fmt='%f', delimiter="\t")
+        difference = compare_stage(case, "trans_gcode_to_array", os.path.join(case_folder, REFERENCE_ARRAY_NAME),
+                                   lambda: text.getvalue().splitlines(keepends=True))
+        if difference:
+            differences.append(difference)
+        jbi_folder = os.path.join(temp_folder, JBI_FOLDER)
+        with quiet():
+            arraytojbi.write_jbi_files(arr, jbi_folder, params["user"], params["tool"])
+        differences += compare_jbi(case, "arraytojbi", os.path.join(case_folder, JBI_FOLDER), jbi_folder,
+                                   manifest["jbi"])
+
+        if chain and mode != "dump":
+            chain_folder = os.path.join(temp_folder, "chain")
+            preview_path = os.path.join(temp_folder, "chain_" + PREVIEW_NAME)
+            with quiet():
+                run_pipeline(os.path.join(case_folder, INPUT_NAME), chain_folder, params,
+                             before_check=manifest["before_check"], preview_path=preview_path,
+                             streaming=mode == "streaming", fused=fused)
+            difference = compare_stage(case, f"整条流程（{mode}）", final_path,
+                                       lambda: read_lines(preview_path, encoding="utf-8"))
+            if difference:
+                differences.append(difference)
+            differences += compare_jbi(case, f"整条流程（{mode}）", os.path.join(case_folder, JBI_FOLDER),
+                                       chain_folder, manifest["jbi"])
+    return differences
+
+
+def compare_jbi(case, stage, expected_folder, actual_folder, names):
+    """逐个比较 JBI 文件"""
+    differences = []
+    actual_names = sorted(name for name in os.listdir(actual_folder) if name.endswith(".JBI")) \
+        if os.path.exists(actual_folder) else []
+    if sorted(names) != actual_names:
+        differences.append({"case": case, "stage": stage,
+                            "message": f"JBI 文件不同：参考 {sorted(names)}，实际 {actual_names}"})
+    for name in names:
+        actual_path = os.path.join(actual_folder, name)
+        if not os.path.exists(actual_path):
+            continue
+        difference = compare_stage(case, f"{stage} {name}", os.path.join(expected_folder, name),
+                                   lambda: read_lines(actual_path))
+        if difference:
+            differences.append(difference)
+    return differences
+
+
+def check_fast_path(golden_folder, func, first_stage, last_stage, *args, cases=None):
+    """
+    检查替代连续若干步骤的新实现（例如合并后的快速路径）。
+
+    func(commands, *args) 接收 first_stage 的参考输入（GCodeLine 列表），
+    输出与 last_stage 的参考输出比较。返回差异记录列表。
+    """
+    differences = []
+    for case in cases or list_cases(golden_folder):
+        case_folder = os.path.join(golden_folder, case)
+        stages = stage_inputs(case_folder, load_manifest(case_folder))
+        names = [stage for stage, _, _ in stages]
+        if first_stage not in names or last_stage not in names:
+            continue  # 参考实现在这之前已经停止
+        input_path = stages[names.index(first_stage)][1]
+        expected_path = stages[names.index(last_stage)][2]
+
+        def run():
+            with quiet():
+                commands = parse_lines(read_lines(input_path, encoding="utf-8"))
+                return to_lines(func(commands, *args))
+
+        difference = compare_stage(case, f"{first_stage}…{last_stage}", expected_path, run)
+        if difference:
+            differences.append(difference)
+    return differences
+
+
+def format_difference(difference):
+    """差异记录的说明文字"""
+    text = f"[{difference['case']}] {difference['stage']}："
+    if "message" in difference:
+        return text + difference["message"]
+    return (text + f"第 {difference['line']} 行不同\n"
+            f"    参考：{difference['expected']!r}\n    实际：{difference['actual']!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="G-code 后处理的参考输出回归测试")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    snapshot_parser = subparsers.add_parser("snapshot", help="用基准版本的实现生成参考输出")
+    snapshot_parser.add_argument("inputs", nargs="*", help="输入文件（默认为仓库自带的输入文件）")
+    snapshot_parser.add_argument("--folder", default=GOLDEN_FOLDER, help="参考输出文件夹")
+    snapshot_parser.add_argument("--no-synthetic", action="store_true", help="不生成合成输入")
+    check_parser = subparsers.add_parser("check", help="与参考输出逐步比较")
+    check_parser.add_argument("--folder", default=GOLDEN_FOLDER, help="参考输出文件夹")
+    check_parser.add_argument("--mode", choices=CHECK_MODES + ("all",), default="all", help="检查的实现")
+    check_parser.add_argument("--cases", nargs="*", help="只检查这些用例")
+    check_parser.add_argument("--fused", action="store_true", help="检查合并后的步骤")
+    args = parser.parse_args()
+
+    if args.command == "snapshot":
+        manifests = snapshot(args.folder, args.inputs or None, not args.no_synthetic)
+        for case, manifest in manifests.items():
+            status = f"在 {manifest['stopped_at']} 停止（{manifest['error']}）" if manifest["stopped_at"] \
+                else f"{len(manifest['jbi'])} 个 JBI 文件"
+            print(f"{case}: {len(manifest['stages'])} 个步骤，{status}")
+        print(f"参考输出已保存至 {args.folder}")
+        return
+
+    modes = CHECK_MODES if args.mode == "all" else (args.mode,)
+    failed = False
+    for case in args.cases or list_cases(args.folder):
+        for mode in modes:
+            differences = check_case(args.folder, case, mode, fused=args.fused)
+            print(f"{case} [{mode}{'，合并步骤' if args.fused else ''}]: {'通过' if not differences else f'{len(differences)} 处不同'}")
+            for difference in differences:
+                print("  " + format_difference(difference))
+            failed = failed or bool(differences)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5190 @@
+T1
+G1 X42.99 Y-76.42 Z-3.01
+G1 X42.99 Y-36.61 Z-3.01
+G1 X42.99 Y-36.52 Z-3.01
+G1 X-36.62 Y-36.52 Z-3.01
+G1 X-36.91 Y-36.52 Z-3.01
+G1 X-36.91 Y-76.33 Z-3.01
+G1 X-36.91 Y-76.42 Z-3.01
+G1 X42.70 Y-76.42 Z-3.01
+G1 X42.70 Y-76.42 Z-3.01
+G1 X-36.91 Y-75.31 Z-3.01
+G1 X-36.81 Y-75.25 Z-3.01
+G1 X-36.81 Y-71.05 Z-3.01
+G1 X-36.91 Y-71.00 Z-3.01
+G1 X-36.91 Y-63.31 Z-3.01
+G1 X-36.81 Y-63.25 Z-3.01
+G1 X-36.81 Y-59.05 Z-3.01
+G1 X-36.91 Y-58.99 Z-3.01
+G1 X-36.91 Y-51.31 Z-3.01
+G1 X-36.81 Y-51.25 Z-3.01
+G1 X-36.81 Y-47.05 Z-3.01
+G1 X-36.91 Y-47.00 Z-3.01
+G1 X-36.91 Y-39.31 Z-3.01
+G1 X-36.81 Y-39.25 Z-3.01
+G1 X-36.81 Y-36.52 Z-3.01
+G1 X-36.46 Y-36.52 Z-3.01
+G1 X-36.46 Y-39.25 Z-3.01
+G1 X-33.34 Y-41.05 Z-3.01
+G1 X-33.34 Y-45.25 Z-3.01
+G1 X-36.46 Y-47.05 Z-3.01
+G1 X-36.46 Y-51.25 Z-3.01
+G1 X-33.34 Y-53.05 Z-3.01
+G1 X-33.34 Y-57.25 Z-3.01
+G1 X-36.46 Y-59.05 Z-3.01
+G1 X-36.46 Y-63.25 Z-3.01
+G1 X-33.34 Y-65.05 Z-3.01
+G1 X-33.34 Y-69.25 Z-3.01
+G1 X-36.46 Y-71.05 Z-3.01
+G1 X-36.46 Y-75.25 Z-3.01
+G1 X-34.45 Y-76.42 Z-3.01
+G1 X-31.90 Y-76.42 Z-3.01
+G1 X-29.88 Y-75.25 Z-3.01
+G1 X-29.88 Y-71.05 Z-3.01
+G1 X-33.00 Y-69.25 Z-3.01
+G1 X-33.00 Y-65.05 Z-3.01
+G1 X-29.88 Y-63.25 Z-3.01
+G1 X-29.88 Y-59.05 Z-3.01
+G1 X-33.00 Y-57.25 Z-3.01
+G1 X-33.00 Y-53.05 Z-3.01
+G1 X-29.88 Y-51.25 Z-3.01
+G1 X-29.88 Y-47.05 Z-3.01
+G1 X-33.00 Y-45.25 Z-3.01
+G1 X-33.00 Y-41.05 Z-3.01
+G1 X-29.88 Y-39.25 Z-3.01
+G1 X-29.88 Y-36.52 Z-3.01
+G1 X-29.53 Y-36.52 Z-3.01
+G1 X-29.53 Y-39.25 Z-3.01
+G1 X-26.42 Y-41.05 Z-3.01
+G1 X-26.42 Y-45.25 Z-3.01
+G1 X-29.53 Y-47.05 Z-3.01
+G1 X-29.53 Y-51.25 Z-3.01
+G1 X-26.42 Y-53.05 Z-3.01
+G1 X-26.42 Y-57.25 Z-3.01
+G1 X-29.53 Y-59.05 Z-3.01
+G1 X-29.53 Y-63.25 Z-3.01
+G1 X-26.42 Y-65.05 Z-3.01
+G1 X-26.42 Y-69.25 Z-3.01
+G1 X-29.53 Y-71.05 Z-3.01
+G1 X-29.53 Y-75.25 Z-3.01
+G1 X-27.52 Y-76.42 Z-3.01
+G1 X-24.97 Y-76.42 Z-3.01
+G1 X-22.95 Y-75.25 Z-3.01
+G1 X-22.95 Y-71.05 Z-3.01
+G1 X-26.07 Y-69.25 Z-3.01
+G1 X-26.07 Y-65.05 Z-3.01
+G1 X-22.95 Y-63.25 Z-3.01
+G1 X-22.95 Y-59.05 Z-3.01
+G1 X-26.07 Y-57.25 Z-3.01
+G1 X-26.07 Y-53.05 Z-3.01
+G1 X-22.95 Y-51.25 Z-3.01
+G1 X-22.95 Y-47.05 Z-3.01
+G1 X-26.07 Y-45.25 Z-3.01
+G1 X-26.07 Y-41.05 Z-3.01
+G1 X-22.95 Y-39.25 Z-3.01
+G1 X-22.95 Y-36.52 Z-3.01
+G1 X-22.61 Y-36.52 Z-3.01
+G1 X-22.61 Y-39.25 Z-3.01
+G1 X-19.49 Y-41.05 Z-3.01
+G1 X-19.49 Y-45.25 Z-3.01
+G1 X-22.61 Y-47.05 Z-3.01
+G1 X-22.61 Y-51.25 Z-3.01
+G1 X-19.49 Y-53.05 Z-3.01
+G1 X-19.49 Y-57.25 Z-3.01
+G1 X-22.61 Y-59.05 Z-3.01
+G1 X-22.61 Y-63.25 Z-3.01
+G1 X-19.49 Y-65.05 Z-3.01
+G1 X-19.49 Y-69.25 Z-3.01
+G1 X-22.61 Y-71.05 Z-3.01
+G1 X-22.61 Y-75.25 Z-3.01
+G1 X-20.59 Y-76.42 Z-3.01
+G1 X-18.04 Y-76.42 Z-3.01
+G1 X-16.02 Y-75.25 Z-3.01
+G1 X-16.02 Y-71.05 Z-3.01
+G1 X-19.14 Y-69.25 Z-3.01
+G1 X-19.14 Y-65.05 Z-3.01
+G1 X-16.02 Y-63.25 Z-3.01
+G1 X-16.02 Y-59.05 Z-3.01
+G1 X-19.14 Y-57.25 Z-3.01
+G1 X-19.14 Y-53.05 Z-3.01
+G1 X-16.02 Y-51.25 Z-3.01
+G1 X-16.02 Y-47.05 Z-3.01
+G1 X-19.14 Y-45.25 Z-3.01
+G1 X-19.14 Y-41.05 Z-3.01
+G1 X-16.02 Y-39.25 Z-3.01
+G1 X-16.02 Y-36.52 Z-3.01
+G1 X-15.68 Y-36.52 Z-3.01
+G1 X-15.68 Y-39.25 Z-3.01
+G1 X-12.56 Y-41.05 Z-3.01
+G1 X-12.56 Y-45.25 Z-3.01
+G1 X-15.68 Y-47.05 Z-3.01
+G1 X-15.68 Y-51.25 Z-3.01
+G1 X-12.56 Y-53.05 Z-3.01
+G1 X-12.56 Y-57.25 Z-3.01
+G1 X-15.68 Y-59.05 Z-3.01
+G1 X-15.68 Y-63.25 Z-3.01
+G1 X-12.56 Y-65.05 Z-3.01
+G1 X-12.56 Y-69.25 Z-3.01
+G1 X-15.68 Y-71.05 Z-3.01
+G1 X-15.68 Y-75.25 Z-3.01
+G1 X-13.66 Y-76.42 Z-3.01
+G1 X-11.11 Y-76.42 Z-3.01
+G1 X-9.10 Y-75.25 Z-3.01
+G1 X-9.10 Y-71.05 Z-3.01
+G1 X-12.21 Y-69.25 Z-3.01
+G1 X-12.21 Y-65.05 Z-3.01
+G1 X-9.10 Y-63.25 Z-3.01
+G1 X-9.10 Y-59.05 Z-3.01
+G1 X-12.21 Y-57.25 Z-3.01
+G1 X-12.21 Y-53.05 Z-3.01
+G1 X-9.10 Y-51.25 Z-3.01
+G1 X-9.10 Y-47.05 Z-3.01
+G1 X-12.21 Y-45.25 Z-3.01
+G1 X-12.21 Y-41.05 Z-3.01
+G1 X-9.10 Y-39.25 Z-3.01
+G1 X-9.10 Y-36.52 Z-3.01
+G1 X-8.75 Y-36.52 Z-3.01
+G1 X-8.75 Y-39.25 Z-3.01
+G1 X-5.63 Y-41.05 Z-3.01
+G1 X-5.63 Y-45.25 Z-3.01
+G1 X-8.75 Y-47.05 Z-3.01
+G1 X-8.75 Y-51.25 Z-3.01
+G1 X-5.63 Y-53.05 Z-3.01
+G1 X-5.63 Y-57.25 Z-3.01
+G1 X-8.75 Y-59.05 Z-3.01
+G1 X-8.75 Y-63.25 Z-3.01
+G1 X-5.63 Y-65.05 Z-3.01
+G1 X-5.63 Y-69.25 Z-3.01
+G1 X-8.75 Y-71.05 Z-3.01
+G1 X-8.75 Y-75.25 Z-3.01
+G1 X-6.73 Y-76.42 Z-3.01
+G1 X-4.18 Y-76.42 Z-3.01
+G1 X-2.17 Y-75.25 Z-3.01
+G1 X-2.17 Y-71.05 Z-3.01
+G1 X-5.28 Y-69.25 Z-3.01
+G1 X-5.28 Y-65.05 Z-3.01
+G1 X-2.17 Y-63.25 Z-3.01
+G1 X-2.17 Y-59.05 Z-3.01
+G1 X-5.28 Y-57.25 Z-3.01
+G1 X-5.28 Y-53.05 Z-3.01
+G1 X-2.17 Y-51.25 Z-3.01
+G1 X-2.17 Y-47.05 Z-3.01
+G1 X-5.28 Y-45.25 Z-3.01
+G1 X-5.28 Y-41.05 Z-3.01
+G1 X-2.17 Y-39.25 Z-3.01
+G1 X-2.17 Y-36.52 Z-3.01
+G1 X-1.82 Y-36.52 Z-3.01
+G1 X-1.82 Y-39.25 Z-3.01
+G1 X1.30 Y-41.05 Z-3.01
+G1 X1.30 Y-45.25 Z-3.01
+G1 X-1.82 Y-47.05 Z-3.01
+G1 X-1.82 Y-51.25 Z-3.01
+G1 X1.30 Y-53.05 Z-3.01
+G1 X1.30 Y-57.25 Z-3.01
+G1 X-1.82 Y-59.05 Z-3.01
+G1 X-1.82 Y-63.25 Z-3.01
+G1 X1.30 Y-65.05 Z-3.01
+G1 X1.30 Y-69.25 Z-3.01
+G1 X-1.82 Y-71.05 Z-3.01
+G1 X-1.82 Y-75.25 Z-3.01
+G1 X0.19 Y-76.42 Z-3.01
+G1 X2.75 Y-76.42 Z-3.01
+G1 X4.76 Y-75.25 Z-3.01
+G1 X4.76 Y-71.05 Z-3.01
+G1 X1.64 Y-69.25 Z-3.01
+G1 X1.64 Y-65.05 Z-3.01
+G1 X4.76 Y-63.25 Z-3.01
+G1 X4.76 Y-59.05 Z-3.01
+G1 X1.64 Y-57.25 Z-3.01
+G1 X1.64 Y-53.05 Z-3.01
+G1 X4.76 Y-51.25 Z-3.01
+G1 X4.76 Y-47.05 Z-3.01
+G1 X1.64 Y-45.25 Z-3.01
+G1 X1.64 Y-41.05 Z-3.01
+G1 X4.76 Y-39.25 Z-3.01
+G1 X4.76 Y-36.52 Z-3.01
+G1 X5.11 Y-36.52 Z-3.01
+G1 X5.11 Y-39.25 Z-3.01
+G1 X8.22 Y-41.05 Z-3.01
+G1 X8.22 Y-45.25 Z-3.01
+G1 X5.11 Y-47.05 Z-3.01
+G1 X5.11 Y-51.25 Z-3.01
+G1 X8.22 Y-53.05 Z-3.01
+G1 X8.22 Y-57.25 Z-3.01
+G1 X5.11 Y-59.05 Z-3.01
+G1 X5.11 Y-63.25 Z-3.01
+G1 X8.22 Y-65.05 Z-3.01
+G1 X8.22 Y-69.25 Z-3.01
+G1 X5.11 Y-71.05 Z-3.01
+G1 X5.11 Y-75.25 Z-3.01
+G1 X7.12 Y-76.42 Z-3.01
+G1 X9.67 Y-76.42 Z-3.01
+G1 X11.69 Y-75.25 Z-3.01
+G1 X11.69 Y-71.05 Z-3.01
+G1 X8.57 Y-69.25 Z-3.01
+G1 X8.57 Y-65.05 Z-3.01
+G1 X11.69 Y-63.25 Z-3.01
+G1 X11.69 Y-59.05 Z-3.01
+G1 X8.57 Y-57.25 Z-3.01
+G1 X8.57 Y-53.05 Z-3.01
+G1 X11.69 Y-51.25 Z-3.01
+G1 X11.69 Y-47.05 Z-3.01
+G1 X8.57 Y-45.25 Z-3.01
+G1 X8.57 Y-41.05 Z-3.01
+G1 X11.69 Y-39.25 Z-3.01
+G1 X11.69 Y-36.52 Z-3.01
+G1 X12.03 Y-36.52 Z-3.01
+G1 X12.03 Y-39.25 Z-3.01
+G1 X15.15 Y-41.05 Z-3.01
+G1 X15.15 Y-45.25 Z-3.01
+G1 X12.03 Y-47.05 Z-3.01
+G1 X12.03 Y-51.25 Z-3.01
+G1 X15.15 Y-53.05 Z-3.01
+G1 X15.15 Y-57.25 Z-3.01
+G1 X12.03 Y-59.05 Z-3.01
+G1 X12.03 Y-63.25 Z-3.01
+G1 X15.15 Y-65.05 Z-3.01
+G1 X15.15 Y-69.25 Z-3.01
+G1 X12.03 Y-71.05 Z-3.01
+G1 X12.03 Y-75.25 Z-3.01
+G1 X14.05 Y-76.42 Z-3.01
+G1 X16.60 Y-76.42 Z-3.01
+G1 X18.62 Y-75.25 Z-3.01
+G1 X18.62 Y-71.05 Z-3.01
+G1 X15.50 Y-69.25 Z-3.01
+G1 X15.50 Y-65.05 Z-3.01
+G1 X18.62 Y-63.25 Z-3.01
+G1 X18.62 Y-59.05 Z-3.01
+G1 X15.50 Y-57.25 Z-3.01
+G1 X15.50 Y-53.05 Z-3.01
+G1 X18.62 Y-51.25 Z-3.01
+G1 X18.62 Y-47.05 Z-3.01
+G1 X15.50 Y-45.25 Z-3.01
+G1 X15.50 Y-41.05 Z-3.01
+G1 X18.62 Y-39.25 Z-3.01
+G1 X18.62 Y-36.52 Z-3.01
+G1 X18.96 Y-36.52 Z-3.01
+G1 X18.96 Y-39.25 Z-3.01
+G1 X22.08 Y-41.05 Z-3.01
+G1 X22.08 Y-45.25 Z-3.01
+G1 X18.96 Y-47.05 Z-3.01
+G1 X18.96 Y-51.25 Z-3.01
+G1 X22.08 Y-53.05 Z-3.01
+G1 X22.08 Y-57.25 Z-3.01
+G1 X18.96 Y-59.05 Z-3.01
+G1 X18.96 Y-63.25 Z-3.01
+G1 X22.08 Y-65.05 Z-3.01
+G1 X22.08 Y-69.25 Z-3.01
+G1 X18.96 Y-71.05 Z-3.01
+G1 X18.96 Y-75.25 Z-3.01
+G1 X20.98 Y-76.42 Z-3.01
+G1 X23.53 Y-76.42 Z-3.01
+G1 X25.54 Y-75.25 Z-3.01
+G1 X25.54 Y-71.05 Z-3.01
+G1 X22.43 Y-69.25 Z-3.01
+G1 X22.43 Y-65.05 Z-3.01
+G1 X25.54 Y-63.25 Z-3.01
+G1 X25.54 Y-59.05 Z-3.01
+G1 X22.43 Y-57.25 Z-3.01
+G1 X22.43 Y-53.05 Z-3.01
+G1 X25.54 Y-51.25 Z-3.01
+G1 X25.54 Y-47.05 Z-3.01
+G1 X22.43 Y-45.25 Z-3.01
+G1 X22.43 Y-41.05 Z-3.01
+G1 X25.54 Y-39.25 Z-3.01
+G1 X25.54 Y-36.52 Z-3.01
+G1 X25.89 Y-36.52 Z-3.01
+G1 X25.89 Y-39.25 Z-3.01
+G1 X29.01 Y-41.05 Z-3.01
+G1 X29.01 Y-45.25 Z-3.01
+G1 X25.89 Y-47.05 Z-3.01
+G1 X25.89 Y-51.25 Z-3.01
+G1 X29.01 Y-53.05 Z-3.01
+G1 X29.01 Y-57.25 Z-3.01
+G1 X25.89 Y-59.05 Z-3.01
+G1 X25.89 Y-63.25 Z-3.01
+G1 X29.01 Y-65.05 Z-3.01
+G1 X29.01 Y-69.25 Z-3.01
+G1 X25.89 Y-71.05 Z-3.01
+G1 X25.89 Y-75.25 Z-3.01
+G1 X27.91 Y-76.42 Z-3.01
+G1 X30.46 Y-76.42 Z-3.01
+G1 X32.47 Y-75.25 Z-3.01
+G1 X32.47 Y-71.05 Z-3.01
+G1 X29.36 Y-69.25 Z-3.01
+G1 X29.36 Y-65.05 Z-3.01
+G1 X32.47 Y-63.25 Z-3.01
+G1 X32.47 Y-59.05 Z-3.01
+G1 X29.36 Y-57.25 Z-3.01
+G1 X29.36 Y-53.05 Z-3.01
+G1 X32.47 Y-51.25 Z-3.01
+G1 X32.47 Y-47.05 Z-3.01
+G1 X29.36 Y-45.25 Z-3.01
+G1 X29.36 Y-41.05 Z-3.01
+G1 X32.47 Y-39.25 Z-3.01
+G1 X32.47 Y-36.52 Z-3.01
+G1 X32.82 Y-36.52 Z-3.01
+G1 X32.82 Y-39.25 Z-3.01
+G1 X35.94 Y-41.05 Z-3.01
+G1 X35.94 Y-45.25 Z-3.01
+G1 X32.82 Y-47.05 Z-3.01
+G1 X32.82 Y-51.25 Z-3.01
+G1 X35.94 Y-53.05 Z-3.01
+G1 X35.94 Y-57.25 Z-3.01
+G1 X32.82 Y-59.05 Z-3.01
+G1 X32.82 Y-63.25 Z-3.01
+G1 X35.94 Y-65.05 Z-3.01
+G1 X35.94 Y-69.25 Z-3.01
+G1 X32.82 Y-71.05 Z-3.01
+G1 X32.82 Y-75.25 Z-3.01
+G1 X34.84 Y-76.42 Z-3.01
+G1 X37.39 Y-76.42 Z-3.01
+G1 X39.40 Y-75.25 Z-3.01
+G1 X39.40 Y-71.05 Z-3.01
+G1 X36.28 Y-69.25 Z-3.01
+G1 X36.28 Y-65.05 Z-3.01
+G1 X39.40 Y-63.25 Z-3.01
+G1 X39.40 Y-59.05 Z-3.01
+G1 X36.28 Y-57.25 Z-3.01
+G1 X36.28 Y-53.05 Z-3.01
+G1 X39.40 Y-51.25 Z-3.01
+G1 X39.40 Y-47.05 Z-3.01
+G1 X36.28 Y-45.25 Z-3.01
+G1 X36.28 Y-41.05 Z-3.01
+G1 X39.40 Y-39.25 Z-3.01
+G1 X39.40 Y-36.52 Z-3.01
+G1 X39.75 Y-36.52 Z-3.01
+G1 X39.75 Y-39.25 Z-3.01
+G1 X42.87 Y-41.05 Z-3.01
+G1 X42.87 Y-45.25 Z-3.01
+G1 X39.75 Y-47.05 Z-3.01
+G1 X39.75 Y-51.25 Z-3.01
+G1 X42.87 Y-53.05 Z-3.01
+G1 X42.87 Y-57.25 Z-3.01
+G1 X39.75 Y-59.05 Z-3.01
+G1 X39.75 Y-63.25 Z-3.01
+G1 X42.87 Y-65.05 Z-3.01
+G1 X42.87 Y-69.25 Z-3.01
+G1 X39.75 Y-71.05 Z-3.01
+G1 X39.75 Y-75.25 Z-3.01
+G1 X41.76 Y-76.42 Z-3.01
+
+T1
+G1 X39.25 Y-75.86 Z-2.01
+G1 X42.43 Y-75.86 Z-2.01
+G1 X42.43 Y-38.06 Z-2.01
+G1 X42.43 Y-37.08 Z-2.01
+G1 X-33.17 Y-37.08 Z-2.01
+G1 X-36.35 Y-37.08 Z-2.01
+G1 X-36.35 Y-74.88 Z-2.01
+G1 X-36.35 Y-75.86 Z-2.01
+G1 X39.25 Y-75.86 Z-2.01
+G1 X39.25 Y-75.86 Z-2.01
+G1 X-36.35 Y-39.32 Z-2.01
+G1 X-33.34 Y-41.05 Z-2.01
+G1 X-33.34 Y-45.25 Z-2.01
+G1 X-36.35 Y-46.99 Z-2.01
+G1 X-36.35 Y-51.32 Z-2.01
+G1 X-33.34 Y-53.05 Z-2.01
+G1 X-33.34 Y-57.25 Z-2.01
+G1 X-36.35 Y-58.99 Z-2.01
+G1 X-36.35 Y-63.32 Z-2.01
+G1 X-33.34 Y-65.05 Z-2.01
+G1 X-33.34 Y-69.25 Z-2.01
+G1 X-36.35 Y-70.99 Z-2.01
+G1 X-36.35 Y-75.32 Z-2.01
+G1 X-35.41 Y-75.86 Z-2.01
+G1 X-30.94 Y-75.86 Z-2.01
+G1 X-29.88 Y-75.25 Z-2.01
+G1 X-29.88 Y-71.05 Z-2.01
+G1 X-33.00 Y-69.25 Z-2.01
+G1 X-33.00 Y-65.05 Z-2.01
+G1 X-29.88 Y-63.25 Z-2.01
+G1 X-29.88 Y-59.05 Z-2.01
+G1 X-33.00 Y-57.25 Z-2.01
+G1 X-33.00 Y-53.05 Z-2.01
+G1 X-29.88 Y-51.25 Z-2.01
+G1 X-29.88 Y-47.05 Z-2.01
+G1 X-33.00 Y-45.25 Z-2.01
+G1 X-33.00 Y-41.05 Z-2.01
+G1 X-29.88 Y-39.25 Z-2.01
+G1 X-29.88 Y-37.08 Z-2.01
+G1 X-29.53 Y-37.08 Z-2.01
+G1 X-29.53 Y-39.25 Z-2.01
+G1 X-26.42 Y-41.05 Z-2.01
+G1 X-26.42 Y-45.25 Z-2.01
+G1 X-29.53 Y-47.05 Z-2.01
+G1 X-29.53 Y-51.25 Z-2.01
+G1 X-26.42 Y-53.05 Z-2.01
+G1 X-26.42 Y-57.25 Z-2.01
+G1 X-29.53 Y-59.05 Z-2.01
+G1 X-29.53 Y-63.25 Z-2.01
+G1 X-26.42 Y-65.05 Z-2.01
+G1 X-26.42 Y-69.25 Z-2.01
+G1 X-29.53 Y-71.05 Z-2.01
+G1 X-29.53 Y-75.25 Z-2.01
+G1 X-28.48 Y-75.86 Z-2.01
+G1 X-24.01 Y-75.86 Z-2.01
+G1 X-22.95 Y-75.25 Z-2.01
+G1 X-22.95 Y-71.05 Z-2.01
+G1 X-26.07 Y-69.25 Z-2.01
+G1 X-26.07 Y-65.05 Z-2.01
+G1 X-22.95 Y-63.25 Z-2.01
+G1 X-22.95 Y-59.05 Z-2.01
+G1 X-26.07 Y-57.25 Z-2.01
+G1 X-26.07 Y-53.05 Z-2.01
+G1 X-22.95 Y-51.25 Z-2.01
+G1 X-22.95 Y-47.05 Z-2.01
+G1 X-26.07 Y-45.25 Z-2.01
+G1 X-26.07 Y-41.05 Z-2.01
+G1 X-22.95 Y-39.25 Z-2.01
+G1 X-22.95 Y-37.08 Z-2.01
+G1 X-22.61 Y-37.08 Z-2.01
+G1 X-22.61 Y-39.25 Z-2.01
+G1 X-19.49 Y-41.05 Z-2.01
+G1 X-19.49 Y-45.25 Z-2.01
+G1 X-22.61 Y-47.05 Z-2.01
+G1 X-22.61 Y-51.25 Z-2.01
+G1 X-19.49 Y-53.05 Z-2.01
+G1 X-19.49 Y-57.25 Z-2.01
+G1 X-22.61 Y-59.05 Z-2.01
+G1 X-22.61 Y-63.25 Z-2.01
+G1 X-19.49 Y-65.05 Z-2.01
+G1 X-19.49 Y-69.25 Z-2.01
+G1 X-22.61 Y-71.05 Z-2.01
+G1 X-22.61 Y-75.25 Z-2.01
+G1 X-21.55 Y-75.86 Z-2.01
+G1 X-17.08 Y-75.86 Z-2.01
+G1 X-16.02 Y-75.25 Z-2.01
+G1 X-16.02 Y-71.05 Z-2.01
+G1 X-19.14 Y-69.25 Z-2.01
+G1 X-19.14 Y-65.05 Z-2.01
+G1 X-16.02 Y-63.25 Z-2.01
+G1 X-16.02 Y-59.05 Z-2.01
+G1 X-19.14 Y-57.25 Z-2.01
+G1 X-19.14 Y-53.05 Z-2.01
+G1 X-16.02 Y-51.25 Z-2.01
+G1 X-16.02 Y-47.05 Z-2.01
+G1 X-19.14 Y-45.25 Z-2.01
+G1 X-19.14 Y-41.05 Z-2.01
+G1 X-16.02 Y-39.25 Z-2.01
+G1 X-16.02 Y-37.08 Z-2.01
+G1 X-15.68 Y-37.08 Z-2.01
+G1 X-15.68 Y-39.25 Z-2.01
+G1 X-12.56 Y-41.05 Z-2.01
+G1 X-12.56 Y-45.25 Z-2.01
+G1 X-15.68 Y-47.05 Z-2.01
+G1 X-15.68 Y-51.25 Z-2.01
+G1 X-12.56 Y-53.05 Z-2.01
+G1 X-12.56 Y-57.25 Z-2.01
+G1 X-15.68 Y-59.05 Z-2.01
+G1 X-15.68 Y-63.25 Z-2.01
+G1 X-12.56 Y-65.05 Z-2.01
+G1 X-12.56 Y-69.25 Z-2.01
+G1 X-15.68 Y-71.05 Z-2.01
+G1 X-15.68 Y-75.25 Z-2.01
+G1 X-14.62 Y-75.86 Z-2.01
+G1 X-10.15 Y-75.86 Z-2.01
+G1 X-9.10 Y-75.25 Z-2.01
+G1 X-9.10 Y-71.05 Z-2.01
+G1 X-12.21 Y-69.25 Z-2.01
+G1 X-12.21 Y-65.05 Z-2.01
+G1 X-9.10 Y-63.25 Z-2.01
+G1 X-9.10 Y-59.05 Z-2.01
+G1 X-12.21 Y-57.25 Z-2.01
+G1 X-12.21 Y-53.05 Z-2.01
+G1 X-9.10 Y-51.25 Z-2.01
+G1 X-9.10 Y-47.05 Z-2.01
+G1 X-12.21 Y-45.25 Z-2.01
+G1 X-12.21 Y-41.05 Z-2.01
+G1 X-9.10 Y-39.25 Z-2.01
+G1 X-9.10 Y-37.08 Z-2.01
+G1 X-8.75 Y-37.08 Z-2.01
+G1 X-8.75 Y-39.25 Z-2.01
+G1 X-5.63 Y-41.05 Z-2.01
+G1 X-5.63 Y-45.25 Z-2.01
+G1 X-8.75 Y-47.05 Z-2.01
+G1 X-8.75 Y-51.25 Z-2.01
+G1 X-5.63 Y-53.05 Z-2.01
+G1 X-5.63 Y-57.25 Z-2.01
+G1 X-8.75 Y-59.05 Z-2.01
+G1 X-8.75 Y-63.25 Z-2.01
+G1 X-5.63 Y-65.05 Z-2.01
+G1 X-5.63 Y-69.25 Z-2.01
+G1 X-8.75 Y-71.05 Z-2.01
+G1 X-8.75 Y-75.25 Z-2.01
+G1 X-7.69 Y-75.86 Z-2.01
+G1 X-3.22 Y-75.86 Z-2.01
+G1 X-2.17 Y-75.25 Z-2.01
+G1 X-2.17 Y-71.05 Z-2.01
+G1 X-5.28 Y-69.25 Z-2.01
+G1 X-5.28 Y-65.05 Z-2.01
+G1 X-2.17 Y-63.25 Z-2.01
+G1 X-2.17 Y-59.05 Z-2.01
+G1 X-5.28 Y-57.25 Z-2.01
+G1 X-5.28 Y-53.05 Z-2.01
+G1 X-2.17 Y-51.25 Z-2.01
+G1 X-2.17 Y-47.05 Z-2.01
+G1 X-5.28 Y-45.25 Z-2.01
+G1 X-5.28 Y-41.05 Z-2.01
+G1 X-2.17 Y-39.25 Z-2.01
+G1 X-2.17 Y-37.08 Z-2.01
+G1 X-1.82 Y-37.08 Z-2.01
+G1 X-1.82 Y-39.25 Z-2.01
+G1 X1.30 Y-41.05 Z-2.01
+G1 X1.30 Y-45.25 Z-2.01
+G1 X-1.82 Y-47.05 Z-2.01
+G1 X-1.82 Y-51.25 Z-2.01
+G1 X1.30 Y-53.05 Z-2.01
+G1 X1.30 Y-57.25 Z-2.01
+G1 X-1.82 Y-59.05 Z-2.01
+G1 X-1.82 Y-63.25 Z-2.01
+G1 X1.30 Y-65.05 Z-2.01
+G1 X1.30 Y-69.25 Z-2.01
+G1 X-1.82 Y-71.05 Z-2.01
+G1 X-1.82 Y-75.25 Z-2.01
+G1 X-0.77 Y-75.86 Z-2.01
+G1 X3.71 Y-75.86 Z-2.01
+G1 X4.76 Y-75.25 Z-2.01
+G1 X4.76 Y-71.05 Z-2.01
+G1 X1.64 Y-69.25 Z-2.01
+G1 X1.64 Y-65.05 Z-2.01
+G1 X4.76 Y-63.25 Z-2.01
+G1 X4.76 Y-59.05 Z-2.01
+G1 X1.64 Y-57.25 Z-2.01
+G1 X1.64 Y-53.05 Z-2.01
+G1 X4.76 Y-51.25 Z-2.01
+G1 X4.76 Y-47.05 Z-2.01
+G1 X1.64 Y-45.25 Z-2.01
+G1 X1.64 Y-41.05 Z-2.01
+G1 X4.76 Y-39.25 Z-2.01
+G1 X4.76 Y-37.08 Z-2.01
+G1 X5.11 Y-37.08 Z-2.01
+G1 X5.11 Y-39.25 Z-2.01
+G1 X8.22 Y-41.05 Z-2.01
+G1 X8.22 Y-45.25 Z-2.01
+G1 X5.11 Y-47.05 Z-2.01
+G1 X5.11 Y-51.25 Z-2.01
+G1 X8.22 Y-53.05 Z-2.01
+G1 X8.22 Y-57.25 Z-2.01
+G1 X5.11 Y-59.05 Z-2.01
+G1 X5.11 Y-63.25 Z-2.01
+G1 X8.22 Y-65.05 Z-2.01
+G1 X8.22 Y-69.25 Z-2.01
+G1 X5.11 Y-71.05 Z-2.01
+G1 X5.11 Y-75.25 Z-2.01
+G1 X6.16 Y-75.86 Z-2.01
+G1 X10.63 Y-75.86 Z-2.01
+G1 X11.69 Y-75.25 Z-2.01
+G1 X11.69 Y-71.05 Z-2.01
+G1 X8.57 Y-69.25 Z-2.01
+G1 X8.57 Y-65.05 Z-2.01
+G1 X11.69 Y-63.25 Z-2.01
+G1 X11.69 Y-59.05 Z-2.01
+G1 X8.57 Y-57.25 Z-2.01
+G1 X8.57 Y-53.05 Z-2.01
+G1 X11.69 Y-51.25 Z-2.01
+G1 X11.69 Y-47.05 Z-2.01
+G1 X8.57 Y-45.25 Z-2.01
+G1 X8.57 Y-41.05 Z-2.01
+G1 X11.69 Y-39.25 Z-2.01
+G1 X11.69 Y-37.08 Z-2.01
+G1 X12.03 Y-37.08 Z-2.01
+G1 X12.03 Y-39.25 Z-2.01
+G1 X15.15 Y-41.05 Z-2.01
+G1 X15.15 Y-45.25 Z-2.01
+G1 X12.03 Y-47.05 Z-2.01
+G1 X12.03 Y-51.25 Z-2.01
+G1 X15.15 Y-53.05 Z-2.01
+G1 X15.15 Y-57.25 Z-2.01
+G1 X12.03 Y-59.05 Z-2.01
+G1 X12.03 Y-63.25 Z-2.01
+G1 X15.15 Y-65.05 Z-2.01
+G1 X15.15 Y-69.25 Z-2.01
+G1 X12.03 Y-71.05 Z-2.01
+G1 X12.03 Y-75.25 Z-2.01
+G1 X13.09 Y-75.86 Z-2.01
+G1 X17.56 Y-75.86 Z-2.01
+G1 X18.62 Y-75.25 Z-2.01
+G1 X18.62 Y-71.05 Z-2.01
+G1 X15.50 Y-69.25 Z-2.01
+G1 X15.50 Y-65.05 Z-2.01
+G1 X18.62 Y-63.25 Z-2.01
+G1 X18.62 Y-59.05 Z-2.01
+G1 X15.50 Y-57.25 Z-2.01
+G1 X15.50 Y-53.05 Z-2.01
+G1 X18.62 Y-51.25 Z-2.01
+G1 X18.62 Y-47.05 Z-2.01
+G1 X15.50 Y-45.25 Z-2.01
+G1 X15.50 Y-41.05 Z-2.01
+G1 X18.62 Y-39.25 Z-2.01
+G1 X18.62 Y-37.08 Z-2.01
+G1 X18.96 Y-37.08 Z-2.01
+G1 X18.96 Y-39.25 Z-2.01
+G1 X22.08 Y-41.05 Z-2.01
+G1 X22.08 Y-45.25 Z-2.01
+G1 X18.96 Y-47.05 Z-2.01
+G1 X18.96 Y-51.25 Z-2.01
+G1 X22.08 Y-53.05 Z-2.01
+G1 X22.08 Y-57.25 Z-2.01
+G1 X18.96 Y-59.05 Z-2.01
+G1 X18.96 Y-63.25 Z-2.01
+G1 X22.08 Y-65.05 Z-2.01
+G1 X22.08 Y-69.25 Z-2.01
+G1 X18.96 Y-71.05 Z-2.01
+G1 X18.96 Y-75.25 Z-2.01
+G1 X20.02 Y-75.86 Z-2.01
+G1 X24.49 Y-75.86 Z-2.01
+G1 X25.54 Y-75.25 Z-2.01
+G1 X25.54 Y-71.05 Z-2.01
+G1 X22.43 Y-69.25 Z-2.01
+G1 X22.43 Y-65.05 Z-2.01
+G1 X25.54 Y-63.25 Z-2.01
+G1 X25.54 Y-59.05 Z-2.01
+G1 X22.43 Y-57.25 Z-2.01
+G1 X22.43 Y-53.05 Z-2.01
+G1 X25.54 Y-51.25 Z-2.01
+G1 X25.54 Y-47.05 Z-2.01
+G1 X22.43 Y-45.25 Z-2.01
+G1 X22.43 Y-41.05 Z-2.01
+G1 X25.54 Y-39.25 Z-2.01
+G1 X25.54 Y-37.08 Z-2.01
+G1 X25.89 Y-37.08 Z-2.01
+G1 X25.89 Y-39.25 Z-2.01
+G1 X29.01 Y-41.05 Z-2.01
+G1 X29.01 Y-45.25 Z-2.01
+G1 X25.89 Y-47.05 Z-2.01
+G1 X25.89 Y-51.25 Z-2.01
+G1 X29.01 Y-53.05 Z-2.01
+G1 X29.01 Y-57.25 Z-2.01
+G1 X25.89 Y-59.05 Z-2.01
+G1 X25.89 Y-63.25 Z-2.01
+G1 X29.01 Y-65.05 Z-2.01
+G1 X29.01 Y-69.25 Z-2.01
+G1 X25.89 Y-71.05 Z-2.01
+G1 X25.89 Y-75.25 Z-2.01
+G1 X26.95 Y-75.86 Z-2.01
+G1 X31.42 Y-75.86 Z-2.01
+G1 X32.47 Y-75.25 Z-2.01
+G1 X32.47 Y-71.05 Z-2.01
+G1 X29.36 Y-69.25 Z-2.01
+G1 X29.36 Y-65.05 Z-2.01
+G1 X32.47 Y-63.25 Z-2.01
+G1 X32.47 Y-59.05 Z-2.01
+G1 X29.36 Y-57.25 Z-2.01
+G1 X29.36 Y-53.05 Z-2.01
+G1 X32.47 Y-51.25 Z-2.01
+G1 X32.47 Y-47.05 Z-2.01
+G1 X29.36 Y-45.25 Z-2.01
+G1 X29.36 Y-41.05 Z-2.01
+G1 X32.47 Y-39.25 Z-2.01
+G1 X32.47 Y-37.08 Z-2.01
+G1 X32.82 Y-37.08 Z-2.01
+G1 X32.82 Y-39.25 Z-2.01
+G1 X35.94 Y-41.05 Z-2.01
+G1 X35.94 Y-45.25 Z-2.01
+G1 X32.82 Y-47.05 Z-2.01
+G1 X32.82 Y-51.25 Z-2.01
+G1 X35.94 Y-53.05 Z-2.01
+G1 X35.94 Y-57.25 Z-2.01
+G1 X32.82 Y-59.05 Z-2.01
+G1 X32.82 Y-63.25 Z-2.01
+G1 X35.94 Y-65.05 Z-2.01
+G1 X35.94 Y-69.25 Z-2.01
+G1 X32.82 Y-71.05 Z-2.01
+G1 X32.82 Y-75.25 Z-2.01
+G1 X33.88 Y-75.86 Z-2.01
+G1 X38.35 Y-75.86 Z-2.01
+G1 X39.40 Y-75.25 Z-2.01
+G1 X39.40 Y-71.05 Z-2.01
+G1 X36.28 Y-69.25 Z-2.01
+G1 X36.28 Y-65.05 Z-2.01
+G1 X39.40 Y-63.25 Z-2.01
+G1 X39.40 Y-59.05 Z-2.01
+G1 X36.28 Y-57.25 Z-2.01
+G1 X36.28 Y-53.05 Z-2.01
+G1 X39.40 Y-51.25 Z-2.01
+G1 X39.40 Y-47.05 Z-2.01
+G1 X36.28 Y-45.25 Z-2.01
+G1 X36.28 Y-41.05 Z-2.01
+G1 X39.40 Y-39.25 Z-2.01
+G1 X39.40 Y-37.08 Z-2.01
+G1 X39.75 Y-37.08 Z-2.01
+G1 X39.75 Y-39.25 Z-2.01
+G1 X42.43 Y-40.80 Z-2.01
+G1 X42.43 Y-45.50 Z-2.01
+G1 X39.75 Y-47.05 Z-2.01
+G1 X39.75 Y-51.25 Z-2.01
+G1 X42.43 Y-52.80 Z-2.01
+G1 X42.43 Y-57.50 Z-2.01
+G1 X39.75 Y-59.05 Z-2.01
+G1 X39.75 Y-63.25 Z-2.01
+G1 X42.43 Y-64.80 Z-2.01
+G1 X42.43 Y-69.50 Z-2.01
+G1 X39.75 Y-71.05 Z-2.01
+G1 X39.75 Y-75.25 Z-2.01
+G1 X40.80 Y-75.86 Z-2.01
+
+T1
+G1 X35.80 Y-75.31 Z-1.01
+G1 X41.88 Y-75.31 Z-1.01
+G1 X41.88 Y-39.51 Z-1.01
+G1 X41.88 Y-37.63 Z-1.01
+G1 X-29.72 Y-37.63 Z-1.01
+G1 X-35.80 Y-37.63 Z-1.01
+G1 X-35.80 Y-73.43 Z-1.01
+G1 X-35.80 Y-75.31 Z-1.01
+G1 X35.80 Y-75.31 Z-1.01
+G1 X35.80 Y-75.31 Z-1.01
+G1 X-35.80 Y-39.63 Z-1.01
+G1 X-33.34 Y-41.05 Z-1.01
+G1 X-33.34 Y-45.25 Z-1.01
+G1 X-35.80 Y-46.67 Z-1.01
+G1 X-35.80 Y-51.64 Z-1.01
+G1 X-33.34 Y-53.05 Z-1.01
+G1 X-33.34 Y-57.25 Z-1.01
+G1 X-35.80 Y-58.67 Z-1.01
+G1 X-35.80 Y-63.64 Z-1.01
+G1 X-33.34 Y-65.05 Z-1.01
+G1 X-33.34 Y-69.25 Z-1.01
+G1 X-35.80 Y-70.67 Z-1.01
+G1 X-29.98 Y-75.31 Z-1.01
+G1 X-29.88 Y-75.25 Z-1.01
+G1 X-29.88 Y-71.05 Z-1.01
+G1 X-33.00 Y-69.25 Z-1.01
+G1 X-33.00 Y-65.05 Z-1.01
+G1 X-29.88 Y-63.25 Z-1.01
+G1 X-29.88 Y-59.05 Z-1.01
+G1 X-33.00 Y-57.25 Z-1.01
+G1 X-33.00 Y-53.05 Z-1.01
+G1 X-29.88 Y-51.25 Z-1.01
+G1 X-29.88 Y-47.05 Z-1.01
+G1 X-33.00 Y-45.25 Z-1.01
+G1 X-33.00 Y-41.05 Z-1.01
+G1 X-29.88 Y-39.25 Z-1.01
+G1 X-29.88 Y-37.63 Z-1.01
+G1 X-29.53 Y-37.63 Z-1.01
+G1 X-29.53 Y-39.25 Z-1.01
+G1 X-26.42 Y-41.05 Z-1.01
+G1 X-26.42 Y-45.25 Z-1.01
+G1 X-29.53 Y-47.05 Z-1.01
+G1 X-29.53 Y-51.25 Z-1.01
+G1 X-26.42 Y-53.05 Z-1.01
+G1 X-26.42 Y-57.25 Z-1.01
+G1 X-29.53 Y-59.05 Z-1.01
+G1 X-29.53 Y-63.25 Z-1.01
+G1 X-26.42 Y-65.05 Z-1.01
+G1 X-26.42 Y-69.25 Z-1.01
+G1 X-29.53 Y-71.05 Z-1.01
+G1 X-29.53 Y-75.25 Z-1.01
+G1 X-29.44 Y-75.31 Z-1.01
+G1 X-23.05 Y-75.31 Z-1.01
+G1 X-22.95 Y-75.25 Z-1.01
+G1 X-22.95 Y-71.05 Z-1.01
+G1 X-26.07 Y-69.25 Z-1.01
+G1 X-26.07 Y-65.05 Z-1.01
+G1 X-22.95 Y-63.25 Z-1.01
+G1 X-22.95 Y-59.05 Z-1.01
+G1 X-26.07 Y-57.25 Z-1.01
+G1 X-26.07 Y-53.05 Z-1.01
+G1 X-22.95 Y-51.25 Z-1.01
+G1 X-22.95 Y-47.05 Z-1.01
+G1 X-26.07 Y-45.25 Z-1.01
+G1 X-26.07 Y-41.05 Z-1.01
+G1 X-22.95 Y-39.25 Z-1.01
+G1 X-22.95 Y-37.63 Z-1.01
+G1 X-22.61 Y-37.63 Z-1.01
+G1 X-22.61 Y-39.25 Z-1.01
+G1 X-19.49 Y-41.05 Z-1.01
+G1 X-19.49 Y-45.25 Z-1.01
+G1 X-22.61 Y-47.05 Z-1.01
+G1 X-22.61 Y-51.25 Z-1.01
+G1 X-19.49 Y-53.05 Z-1.01
+G1 X-19.49 Y-57.25 Z-1.01
+G1 X-22.61 Y-59.05 Z-1.01
+G1 X-22.61 Y-63.25 Z-1.01
+G1 X-19.49 Y-65.05 Z-1.01
+G1 X-19.49 Y-69.25 Z-1.01
+G1 X-22.61 Y-71.05 Z-1.01
+G1 X-22.61 Y-75.25 Z-1.01
+G1 X-22.51 Y-75.31 Z-1.01
+G1 X-16.12 Y-75.31 Z-1.01
+G1 X-16.02 Y-75.25 Z-1.01
+G1 X-16.02 Y-71.05 Z-1.01
+G1 X-19.14 Y-69.25 Z-1.01
+G1 X-19.14 Y-65.05 Z-1.01
+G1 X-16.02 Y-63.25 Z-1.01
+G1 X-16.02 Y-59.05 Z-1.01
+G1 X-19.14 Y-57.25 Z-1.01
+G1 X-19.14 Y-53.05 Z-1.01
+G1 X-16.02 Y-51.25 Z-1.01
+G1 X-16.02 Y-47.05 Z-1.01
+G1 X-19.14 Y-45.25 Z-1.01
+G1 X-19.14 Y-41.05 Z-1.01
+G1 X-16.02 Y-39.25 Z-1.01
+G1 X-16.02 Y-37.63 Z-1.01
+G1 X-15.68 Y-37.63 Z-1.01
+G1 X-15.68 Y-39.25 Z-1.01
+G1 X-12.56 Y-41.05 Z-1.01
+G1 X-12.56 Y-45.25 Z-1.01
+G1 X-15.68 Y-47.05 Z-1.01
+G1 X-15.68 Y-51.25 Z-1.01
+G1 X-12.56 Y-53.05 Z-1.01
+G1 X-12.56 Y-57.25 Z-1.01
+G1 X-15.68 Y-59.05 Z-1.01
+G1 X-15.68 Y-63.25 Z-1.01
+G1 X-12.56 Y-65.05 Z-1.01
+G1 X-12.56 Y-69.25 Z-1.01
+G1 X-15.68 Y-71.05 Z-1.01
+G1 X-15.68 Y-75.25 Z-1.01
+G1 X-15.58 Y-75.31 Z-1.01
+G1 X-9.19 Y-75.31 Z-1.01
+G1 X-9.10 Y-75.25 Z-1.01
+G1 X-9.10 Y-71.05 Z-1.01
+G1 X-12.21 Y-69.25 Z-1.01
+G1 X-12.21 Y-65.05 Z-1.01
+G1 X-9.10 Y-63.25 Z-1.01
+G1 X-9.10 Y-59.05 Z-1.01
+G1 X-12.21 Y-57.25 Z-1.01
+G1 X-12.21 Y-53.05 Z-1.01
+G1 X-9.10 Y-51.25 Z-1.01
+G1 X-9.10 Y-47.05 Z-1.01
+G1 X-12.21 Y-45.25 Z-1.01
+G1 X-12.21 Y-41.05 Z-1.01
+G1 X-9.10 Y-39.25 Z-1.01
+G1 X-9.10 Y-37.63 Z-1.01
+G1 X-8.75 Y-37.63 Z-1.01
+G1 X-8.75 Y-39.25 Z-1.01
+G1 X-5.63 Y-41.05 Z-1.01
+G1 X-5.63 Y-45.25 Z-1.01
+G1 X-8.75 Y-47.05 Z-1.01
+G1 X-8.75 Y-51.25 Z-1.01
+G1 X-5.63 Y-53.05 Z-1.01
+G1 X-5.63 Y-57.25 Z-1.01
+G1 X-8.75 Y-59.05 Z-1.01
+G1 X-8.75 Y-63.25 Z-1.01
+G1 X-5.63 Y-65.05 Z-1.01
+G1 X-5.63 Y-69.25 Z-1.01
+G1 X-8.75 Y-71.05 Z-1.01
+G1 X-8.75 Y-75.25 Z-1.01
+G1 X-8.65 Y-75.31 Z-1.01
+G1 X-2.26 Y-75.31 Z-1.01
+G1 X-2.17 Y-75.25 Z-1.01
+G1 X-2.17 Y-71.05 Z-1.01
+G1 X-5.28 Y-69.25 Z-1.01
+G1 X-5.28 Y-65.05 Z-1.01
+G1 X-2.17 Y-63.25 Z-1.01
+G1 X-2.17 Y-59.05 Z-1.01
+G1 X-5.28 Y-57.25 Z-1.01
+G1 X-5.28 Y-53.05 Z-1.01
+G1 X-2.17 Y-51.25 Z-1.01
+G1 X-2.17 Y-47.05 Z-1.01
+G1 X-5.28 Y-45.25 Z-1.01
+G1 X-5.28 Y-41.05 Z-1.01
+G1 X-2.17 Y-39.25 Z-1.01
+G1 X-2.17 Y-37.63 Z-1.01
+G1 X-1.82 Y-37.63 Z-1.01
+G1 X-1.82 Y-39.25 Z-1.01
+G1 X1.30 Y-41.05 Z-1.01
+G1 X1.30 Y-45.25 Z-1.01
+G1 X-1.82 Y-47.05 Z-1.01
+G1 X-1.82 Y-51.25 Z-1.01
+G1 X1.30 Y-53.05 Z-1.01
+G1 X1.30 Y-57.25 Z-1.01
+G1 X-1.82 Y-59.05 Z-1.01
+G1 X-1.82 Y-63.25 Z-1.01
+G1 X1.30 Y-65.05 Z-1.01
+G1 X1.30 Y-69.25 Z-1.01
+G1 X-1.82 Y-71.05 Z-1.01
+G1 X-1.82 Y-75.25 Z-1.01
+G1 X-1.73 Y-75.31 Z-1.01
+G1 X4.67 Y-75.31 Z-1.01
+G1 X4.76 Y-75.25 Z-1.01
+G1 X4.76 Y-71.05 Z-1.01
+G1 X1.64 Y-69.25 Z-1.01
+G1 X1.64 Y-65.05 Z-1.01
+G1 X4.76 Y-63.25 Z-1.01
+G1 X4.76 Y-59.05 Z-1.01
+G1 X1.64 Y-57.25 Z-1.01
+G1 X1.64 Y-53.05 Z-1.01
+G1 X4.76 Y-51.25 Z-1.01
+G1 X4.76 Y-47.05 Z-1.01
+G1 X1.64 Y-45.25 Z-1.01
+G1 X1.64 Y-41.05 Z-1.01
+G1 X4.76 Y-39.25 Z-1.01
+G1 X4.76 Y-37.63 Z-1.01
+G1 X5.11 Y-37.63 Z-1.01
+G1 X5.11 Y-39.25 Z-1.01
+G1 X8.22 Y-41.05 Z-1.01
+G1 X8.22 Y-45.25 Z-1.01
+G1 X5.11 Y-47.05 Z-1.01
+G1 X5.11 Y-51.25 Z-1.01
+G1 X8.22 Y-53.05 Z-1.01
+G1 X8.22 Y-57.25 Z-1.01
+G1 X5.11 Y-59.05 Z-1.01
+G1 X5.11 Y-63.25 Z-1.01
+G1 X8.22 Y-65.05 Z-1.01
+G1 X8.22 Y-69.25 Z-1.01
+G1 X5.11 Y-71.05 Z-1.01
+G1 X5.11 Y-75.25 Z-1.01
+G1 X5.20 Y-75.31 Z-1.01
+G1 X11.59 Y-75.31 Z-1.01
+G1 X11.69 Y-75.25 Z-1.01
+G1 X11.69 Y-71.05 Z-1.01
+G1 X8.57 Y-69.25 Z-1.01
+G1 X8.57 Y-65.05 Z-1.01
+G1 X11.69 Y-63.25 Z-1.01
+G1 X11.69 Y-59.05 Z-1.01
+G1 X8.57 Y-57.25 Z-1.01
+G1 X8.57 Y-53.05 Z-1.01
+G1 X11.69 Y-51.25 Z-1.01
+G1 X11.69 Y-47.05 Z-1.01
+G1 X8.57 Y-45.25 Z-1.01
+G1 X8.57 Y-41.05 Z-1.01
+G1 X11.69 Y-39.25 Z-1.01
+G1 X11.69 Y-37.63 Z-1.01
+G1 X12.03 Y-37.63 Z-1.01
+G1 X12.03 Y-39.25 Z-1.01
+G1 X15.15 Y-41.05 Z-1.01
+G1 X15.15 Y-45.25 Z-1.01
+G1 X12.03 Y-47.05 Z-1.01
+G1 X12.03 Y-51.25 Z-1.01
+G1 X15.15 Y-53.05 Z-1.01
+G1 X15.15 Y-57.25 Z-1.01
+G1 X12.03 Y-59.05 Z-1.01
+G1 X12.03 Y-63.25 Z-1.01
+G1 X15.15 Y-65.05 Z-1.01
+G1 X15.15 Y-69.25 Z-1.01
+G1 X12.03 Y-71.05 Z-1.01
+G1 X12.03 Y-75.25 Z-1.01
+G1 X12.13 Y-75.31 Z-1.01
+G1 X18.52 Y-75.31 Z-1.01
+G1 X18.62 Y-75.25 Z-1.01
+G1 X18.62 Y-71.05 Z-1.01
+G1 X15.50 Y-69.25 Z-1.01
+G1 X15.50 Y-65.05 Z-1.01
+G1 X18.62 Y-63.25 Z-1.01
+G1 X18.62 Y-59.05 Z-1.01
+G1 X15.50 Y-57.25 Z-1.01
+G1 X15.50 Y-53.05 Z-1.01
+G1 X18.62 Y-51.25 Z-1.01
+G1 X18.62 Y-47.05 Z-1.01
+G1 X15.50 Y-45.25 Z-1.01
+G1 X15.50 Y-41.05 Z-1.01
+G1 X18.62 Y-39.25 Z-1.01
+G1 X18.62 Y-37.63 Z-1.01
+G1 X18.96 Y-37.63 Z-1.01
+G1 X18.96 Y-39.25 Z-1.01
+G1 X22.08 Y-41.05 Z-1.01
+G1 X22.08 Y-45.25 Z-1.01
+G1 X18.96 Y-47.05 Z-1.01
+G1 X18.96 Y-51.25 Z-1.01
+G1 X22.08 Y-53.05 Z-1.01
+G1 X22.08 Y-57.25 Z-1.01
+G1 X18.96 Y-59.05 Z-1.01
+G1 X18.96 Y-63.25 Z-1.01
+G1 X22.08 Y-65.05 Z-1.01
+G1 X22.08 Y-69.25 Z-1.01
+G1 X18.96 Y-71.05 Z-1.01
+G1 X18.96 Y-75.25 Z-1.01
+G1 X19.06 Y-75.31 Z-1.01
+G1 X25.45 Y-75.31 Z-1.01
+G1 X25.54 Y-75.25 Z-1.01
+G1 X25.54 Y-71.05 Z-1.01
+G1 X22.43 Y-69.25 Z-1.01
+G1 X22.43 Y-65.05 Z-1.01
+G1 X25.54 Y-63.25 Z-1.01
+G1 X25.54 Y-59.05 Z-1.01
+G1 X22.43 Y-57.25 Z-1.01
+G1 X22.43 Y-53.05 Z-1.01
+G1 X25.54 Y-51.25 Z-1.01
+G1 X25.54 Y-47.05 Z-1.01
+G1 X22.43 Y-45.25 Z-1.01
+G1 X22.43 Y-41.05 Z-1.01
+G1 X25.54 Y-39.25 Z-1.01
+G1 X25.54 Y-37.63 Z-1.01
+G1 X25.89 Y-37.63 Z-1.01
+G1 X25.89 Y-39.25 Z-1.01
+G1 X29.01 Y-41.05 Z-1.01
+G1 X29.01 Y-45.25 Z-1.01
+G1 X25.89 Y-47.05 Z-1.01
+G1 X25.89 Y-51.25 Z-1.01
+G1 X29.01 Y-53.05 Z-1.01
+G1 X29.01 Y-57.25 Z-1.01
+G1 X25.89 Y-59.05 Z-1.01
+G1 X25.89 Y-63.25 Z-1.01
+G1 X29.01 Y-65.05 Z-1.01
+G1 X29.01 Y-69.25 Z-1.01
+G1 X25.89 Y-71.05 Z-1.01
+G1 X25.89 Y-75.25 Z-1.01
+G1 X25.99 Y-75.31 Z-1.01
+G1 X32.38 Y-75.31 Z-1.01
+G1 X32.47 Y-75.25 Z-1.01
+G1 X32.47 Y-71.05 Z-1.01
+G1 X29.36 Y-69.25 Z-1.01
+G1 X29.36 Y-65.05 Z-1.01
+G1 X32.47 Y-63.25 Z-1.01
+G1 X32.47 Y-59.05 Z-1.01
+G1 X29.36 Y-57.25 Z-1.01
+G1 X29.36 Y-53.05 Z-1.01
+G1 X32.47 Y-51.25 Z-1.01
+G1 X32.47 Y-47.05 Z-1.01
+G1 X29.36 Y-45.25 Z-1.01
+G1 X29.36 Y-41.05 Z-1.01
+G1 X32.47 Y-39.25 Z-1.01
+G1 X32.47 Y-37.63 Z-1.01
+G1 X32.82 Y-37.63 Z-1.01
+G1 X32.82 Y-39.25 Z-1.01
+G1 X35.94 Y-41.05 Z-1.01
+G1 X35.94 Y-45.25 Z-1.01
+G1 X32.82 Y-47.05 Z-1.01
+G1 X32.82 Y-51.25 Z-1.01
+G1 X35.94 Y-53.05 Z-1.01
+G1 X35.94 Y-57.25 Z-1.01
+G1 X32.82 Y-59.05 Z-1.01
+G1 X32.82 Y-63.25 Z-1.01
+G1 X35.94 Y-65.05 Z-1.01
+G1 X35.94 Y-69.25 Z-1.01
+G1 X32.82 Y-71.05 Z-1.01
+G1 X32.82 Y-75.25 Z-1.01
+G1 X32.92 Y-75.31 Z-1.01
+G1 X39.31 Y-75.31 Z-1.01
+G1 X39.40 Y-75.25 Z-1.01
+G1 X39.40 Y-71.05 Z-1.01
+G1 X36.28 Y-69.25 Z-1.01
+G1 X36.28 Y-65.05 Z-1.01
+G1 X39.40 Y-63.25 Z-1.01
+G1 X39.40 Y-59.05 Z-1.01
+G1 X36.28 Y-57.25 Z-1.01
+G1 X36.28 Y-53.05 Z-1.01
+G1 X39.40 Y-51.25 Z-1.01
+G1 X39.40 Y-47.05 Z-1.01
+G1 X36.28 Y-45.25 Z-1.01
+G1 X36.28 Y-41.05 Z-1.01
+G1 X39.40 Y-39.25 Z-1.01
+G1 X39.40 Y-37.63 Z-1.01
+G1 X39.75 Y-37.63 Z-1.01
+G1 X39.75 Y-39.25 Z-1.01
+G1 X41.88 Y-40.48 Z-1.01
+G1 X41.88 Y-45.82 Z-1.01
+G1 X39.75 Y-47.05 Z-1.01
+G1 X39.75 Y-51.25 Z-1.01
+G1 X41.88 Y-52.48 Z-1.01
+G1 X41.88 Y-57.82 Z-1.01
+G1 X39.75 Y-59.05 Z-1.01
+G1 X39.75 Y-63.25 Z-1.01
+G1 X41.88 Y-64.48 Z-1.01
+G1 X41.88 Y-69.82 Z-1.01
+G1 X39.75 Y-71.05 Z-1.01
+G1 X39.75 Y-75.25 Z-1.01
+G1 X39.84 Y-75.31 Z-1.01
+
+T1
+G1 X32.36 Y-74.75 Z-0.01
+G1 X41.32 Y-74.75 Z-0.01
+G1 X41.32 Y-40.95 Z-0.01
+G1 X41.32 Y-38.19 Z-0.01
+G1 X-26.28 Y-38.19 Z-0.01
+G1 X-35.24 Y-38.19 Z-0.01
+G1 X-35.24 Y-71.99 Z-0.01
+G1 X-35.24 Y-74.75 Z-0.01
+G1 X32.36 Y-74.75 Z-0.01
+G1 X32.36 Y-74.75 Z-0.01
+G1 X-35.24 Y-39.95 Z-0.01
+G1 X-33.34 Y-41.05 Z-0.01
+G1 X-33.34 Y-45.25 Z-0.01
+G1 X-35.24 Y-46.35 Z-0.01
+G1 X-35.24 Y-51.96 Z-0.01
+G1 X-33.34 Y-53.05 Z-0.01
+G1 X-33.34 Y-57.25 Z-0.01
+G1 X-35.24 Y-58.35 Z-0.01
+G1 X-35.24 Y-63.96 Z-0.01
+G1 X-33.34 Y-65.05 Z-0.01
+G1 X-33.34 Y-69.25 Z-0.01
+G1 X-35.24 Y-70.35 Z-0.01
+G1 X-29.88 Y-74.75 Z-0.01
+G1 X-29.88 Y-71.05 Z-0.01
+G1 X-33.00 Y-69.25 Z-0.01
+G1 X-33.00 Y-65.05 Z-0.01
+G1 X-29.88 Y-63.25 Z-0.01
+G1 X-29.88 Y-59.05 Z-0.01
+G1 X-33.00 Y-57.25 Z-0.01
+G1 X-33.00 Y-53.05 Z-0.01
+G1 X-29.88 Y-51.25 Z-0.01
+G1 X-29.88 Y-47.05 Z-0.01
+G1 X-33.00 Y-45.25 Z-0.01
+G1 X-33.00 Y-41.05 Z-0.01
+G1 X-29.88 Y-39.25 Z-0.01
+G1 X-29.88 Y-38.19 Z-0.01
+G1 X-29.53 Y-38.19 Z-0.01
+G1 X-29.53 Y-39.25 Z-0.01
+G1 X-26.42 Y-41.05 Z-0.01
+G1 X-26.42 Y-45.25 Z-0.01
+G1 X-29.53 Y-47.05 Z-0.01
+G1 X-29.53 Y-51.25 Z-0.01
+G1 X-26.42 Y-53.05 Z-0.01
+G1 X-26.42 Y-57.25 Z-0.01
+G1 X-29.53 Y-59.05 Z-0.01
+G1 X-29.53 Y-63.25 Z-0.01
+G1 X-26.42 Y-65.05 Z-0.01
+G1 X-26.42 Y-69.25 Z-0.01
+G1 X-29.53 Y-71.05 Z-0.01
+G1 X-29.53 Y-74.75 Z-0.01
+G1 X-22.95 Y-74.75 Z-0.01
+G1 X-22.95 Y-71.05 Z-0.01
+G1 X-26.07 Y-69.25 Z-0.01
+G1 X-26.07 Y-65.05 Z-0.01
+G1 X-22.95 Y-63.25 Z-0.01
+G1 X-22.95 Y-59.05 Z-0.01
+G1 X-26.07 Y-57.25 Z-0.01
+G1 X-26.07 Y-53.05 Z-0.01
+G1 X-22.95 Y-51.25 Z-0.01
+G1 X-22.95 Y-47.05 Z-0.01
+G1 X-26.07 Y-45.25 Z-0.01
+G1 X-26.07 Y-41.05 Z-0.01
+G1 X-22.95 Y-39.25 Z-0.01
+G1 X-22.95 Y-38.19 Z-0.01
+G1 X-22.61 Y-38.19 Z-0.01
+G1 X-22.61 Y-39.25 Z-0.01
+G1 X-19.49 Y-41.05 Z-0.01
+G1 X-19.49 Y-45.25 Z-0.01
+G1 X-22.61 Y-47.05 Z-0.01
+G1 X-22.61 Y-51.25 Z-0.01
+G1 X-19.49 Y-53.05 Z-0.01
+G1 X-19.49 Y-57.25 Z-0.01
+G1 X-22.61 Y-59.05 Z-0.01
+G1 X-22.61 Y-63.25 Z-0.01
+G1 X-19.49 Y-65.05 Z-0.01
+G1 X-19.49 Y-69.25 Z-0.01
+G1 X-22.61 Y-71.05 Z-0.01
+G1 X-22.61 Y-74.75 Z-0.01
+G1 X-16.02 Y-74.75 Z-0.01
+G1 X-16.02 Y-71.05 Z-0.01
+G1 X-19.14 Y-69.25 Z-0.01
+G1 X-19.14 Y-65.05 Z-0.01
+G1 X-16.02 Y-63.25 Z-0.01
+G1 X-16.02 Y-59.05 Z-0.01
+G1 X-19.14 Y-57.25 Z-0.01
+G1 X-19.14 Y-53.05 Z-0.01
+G1 X-16.02 Y-51.25 Z-0.01
+G1 X-16.02 Y-47.05 Z-0.01
+G1 X-19.14 Y-45.25 Z-0.01
+G1 X-19.14 Y-41.05 Z-0.01
+G1 X-16.02 Y-39.25 Z-0.01
+G1 X-16.02 Y-38.19 Z-0.01
+G1 X-15.68 Y-38.19 Z-0.01
+G1 X-15.68 Y-39.25 Z-0.01
+G1 X-12.56 Y-41.05 Z-0.01
+G1 X-12.56 Y-45.25 Z-0.01
+G1 X-15.68 Y-47.05 Z-0.01
+G1 X-15.68 Y-51.25 Z-0.01
+G1 X-12.56 Y-53.05 Z-0.01
+G1 X-12.56 Y-57.25 Z-0.01
+G1 X-15.68 Y-59.05 Z-0.01
+G1 X-15.68 Y-63.25 Z-0.01
+G1 X-12.56 Y-65.05 Z-0.01
+G1 X-12.56 Y-69.25 Z-0.01
+G1 X-15.68 Y-71.05 Z-0.01
+G1 X-15.68 Y-74.75 Z-0.01
+G1 X-9.10 Y-74.75 Z-0.01
+G1 X-9.10 Y-71.05 Z-0.01
+G1 X-12.21 Y-69.25 Z-0.01
+G1 X-12.21 Y-65.05 Z-0.01
+G1 X-9.10 Y-63.25 Z-0.01
+G1 X-9.10 Y-59.05 Z-0.01
+G1 X-12.21 Y-57.25 Z-0.01
+G1 X-12.21 Y-53.05 Z-0.01
+G1 X-9.10 Y-51.25 Z-0.01
+G1 X-9.10 Y-47.05 Z-0.01
+G1 X-12.21 Y-45.25 Z-0.01
+G1 X-12.21 Y-41.05 Z-0.01
+G1 X-9.10 Y-39.25 Z-0.01
+G1 X-9.10 Y-38.19 Z-0.01
+G1 X-8.75 Y-38.19 Z-0.01
+G1 X-8.75 Y-39.25 Z-0.01
+G1 X-5.63 Y-41.05 Z-0.01
+G1 X-5.63 Y-45.25 Z-0.01
+G1 X-8.75 Y-47.05 Z-0.01
+G1 X-8.75 Y-51.25 Z-0.01
+G1 X-5.63 Y-53.05 Z-0.01
+G1 X-5.63 Y-57.25 Z-0.01
+G1 X-8.75 Y-59.05 Z-0.01
+G1 X-8.75 Y-63.25 Z-0.01
+G1 X-5.63 Y-65.05 Z-0.01
+G1 X-5.63 Y-69.25 Z-0.01
+G1 X-8.75 Y-71.05 Z-0.01
+G1 X-8.75 Y-74.75 Z-0.01
+G1 X-2.17 Y-74.75 Z-0.01
+G1 X-2.17 Y-71.05 Z-0.01
+G1 X-5.28 Y-69.25 Z-0.01
+G1 X-5.28 Y-65.05 Z-0.01
+G1 X-2.17 Y-63.25 Z-0.01
+G1 X-2.17 Y-59.05 Z-0.01
+G1 X-5.28 Y-57.25 Z-0.01
+G1 X-5.28 Y-53.05 Z-0.01
+G1 X-2.17 Y-51.25 Z-0.01
+G1 X-2.17 Y-47.05 Z-0.01
+G1 X-5.28 Y-45.25 Z-0.01
+G1 X-5.28 Y-41.05 Z-0.01
+G1 X-2.17 Y-39.25 Z-0.01
+G1 X-2.17 Y-38.19 Z-0.01
+G1 X-1.82 Y-38.19 Z-0.01
+G1 X-1.82 Y-39.25 Z-0.01
+G1 X1.30 Y-41.05 Z-0.01
+G1 X1.30 Y-45.25 Z-0.01
+G1 X-1.82 Y-47.05 Z-0.01
+G1 X-1.82 Y-51.25 Z-0.01
+G1 X1.30 Y-53.05 Z-0.01
+G1 X1.30 Y-57.25 Z-0.01
+G1 X-1.82 Y-59.05 Z-0.01
+G1 X-1.82 Y-63.25 Z-0.01
+G1 X1.30 Y-65.05 Z-0.01
+G1 X1.30 Y-69.25 Z-0.01
+G1 X-1.82 Y-71.05 Z-0.01
+G1 X-1.82 Y-74.75 Z-0.01
+G1 X4.76 Y-74.75 Z-0.01
+G1 X4.76 Y-71.05 Z-0.01
+G1 X1.64 Y-69.25 Z-0.01
+G1 X1.64 Y-65.05 Z-0.01
+G1 X4.76 Y-63.25 Z-0.01
+G1 X4.76 Y-59.05 Z-0.01
+G1 X1.64 Y-57.25 Z-0.01
+G1 X1.64 Y-53.05 Z-0.01
+G1 X4.76 Y-51.25 Z-0.01
+G1 X4.76 Y-47.05 Z-0.01
+G1 X1.64 Y-45.25 Z-0.01
+G1 X1.64 Y-41.05 Z-0.01
+G1 X4.76 Y-39.25 Z-0.01
+G1 X4.76 Y-38.19 Z-0.01
+G1 X5.11 Y-38.19 Z-0.01
+G1 X5.11 Y-39.25 Z-0.01
+G1 X8.22 Y-41.05 Z-0.01
+G1 X8.22 Y-45.25 Z-0.01
+G1 X5.11 Y-47.05 Z-0.01
+G1 X5.11 Y-51.25 Z-0.01
+G1 X8.22 Y-53.05 Z-0.01
+G1 X8.22 Y-57.25 Z-0.01
+G1 X5.11 Y-59.05 Z-0.01
+G1 X5.11 Y-63.25 Z-0.01
+G1 X8.22 Y-65.05 Z-0.01
+G1 X8.22 Y-69.25 Z-0.01
+G1 X5.11 Y-71.05 Z-0.01
+G1 X5.11 Y-74.75 Z-0.01
+G1 X11.69 Y-74.75 Z-0.01
+G1 X11.69 Y-71.05 Z-0.01
+G1 X8.57 Y-69.25 Z-0.01
+G1 X8.57 Y-65.05 Z-0.01
+G1 X11.69 Y-63.25 Z-0.01
+G1 X11.69 Y-59.05 Z-0.01
+G1 X8.57 Y-57.25 Z-0.01
+G1 X8.57 Y-53.05 Z-0.01
+G1 X11.69 Y-51.25 Z-0.01
+G1 X11.69 Y-47.05 Z-0.01
+G1 X8.57 Y-45.25 Z-0.01
+G1 X8.57 Y-41.05 Z-0.01
+G1 X11.69 Y-39.25 Z-0.01
+G1 X11.69 Y-38.19 Z-0.01
+G1 X12.03 Y-38.19 Z-0.01
+G1 X12.03 Y-39.25 Z-0.01
+G1 X15.15 Y-41.05 Z-0.01
+G1 X15.15 Y-45.25 Z-0.01
+G1 X12.03 Y-47.05 Z-0.01
+G1 X12.03 Y-51.25 Z-0.01
+G1 X15.15 Y-53.05 Z-0.01
+G1 X15.15 Y-57.25 Z-0.01
+G1 X12.03 Y-59.05 Z-0.01
+G1 X12.03 Y-63.25 Z-0.01
+G1 X15.15 Y-65.05 Z-0.01
+G1 X15.15 Y-69.25 Z-0.01
+G1 X12.03 Y-71.05 Z-0.01
+G1 X12.03 Y-74.75 Z-0.01
+G1 X18.62 Y-74.75 Z-0.01
+G1 X18.62 Y-71.05 Z-0.01
+G1 X15.50 Y-69.25 Z-0.01
+G1 X15.50 Y-65.05 Z-0.01
+G1 X18.62 Y-63.25 Z-0.01
+G1 X18.62 Y-59.05 Z-0.01
+G1 X15.50 Y-57.25 Z-0.01
+G1 X15.50 Y-53.05 Z-0.01
+G1 X18.62 Y-51.25 Z-0.01
+G1 X18.62 Y-47.05 Z-0.01
+G1 X15.50 Y-45.25 Z-0.01
+G1 X15.50 Y-41.05 Z-0.01
+G1 X18.62 Y-39.25 Z-0.01
+G1 X18.62 Y-38.19 Z-0.01
+G1 X18.96 Y-38.19 Z-0.01
+G1 X18.96 Y-39.25 Z-0.01
+G1 X22.08 Y-41.05 Z-0.01
+G1 X22.08 Y-45.25 Z-0.01
+G1 X18.96 Y-47.05 Z-0.01
+G1 X18.96 Y-51.25 Z-0.01
+G1 X22.08 Y-53.05 Z-0.01
+G1 X22.08 Y-57.25 Z-0.01
+G1 X18.96 Y-59.05 Z-0.01
+G1 X18.96 Y-63.25 Z-0.01
+G1 X22.08 Y-65.05 Z-0.01
+G1 X22.08 Y-69.25 Z-0.01
+G1 X18.96 Y-71.05 Z-0.01
+G1 X18.96 Y-74.75 Z-0.01
+G1 X25.54 Y-74.75 Z-0.01
+G1 X25.54 Y-71.05 Z-0.01
+G1 X22.43 Y-69.25 Z-0.01
+G1 X22.43 Y-65.05 Z-0.01
+G1 X25.54 Y-63.25 Z-0.01
+G1 X25.54 Y-59.05 Z-0.01
+G1 X22.43 Y-57.25 Z-0.01
+G1 X22.43 Y-53.05 Z-0.01
+G1 X25.54 Y-51.25 Z-0.01
+G1 X25.54 Y-47.05 Z-0.01
+G1 X22.43 Y-45.25 Z-0.01
+G1 X22.43 Y-41.05 Z-0.01
+G1 X25.54 Y-39.25 Z-0.01
+G1 X25.54 Y-38.19 Z-0.01
+G1 X25.89 Y-38.19 Z-0.01
+G1 X25.89 Y-39.25 Z-0.01
+G1 X29.01 Y-41.05 Z-0.01
+G1 X29.01 Y-45.25 Z-0.01
+G1 X25.89 Y-47.05 Z-0.01
+G1 X25.89 Y-51.25 Z-0.01
+G1 X29.01 Y-53.05 Z-0.01
+G1 X29.01 Y-57.25 Z-0.01
+G1 X25.89 Y-59.05 Z-0.01
+G1 X25.89 Y-63.25 Z-0.01
+G1 X29.01 Y-65.05 Z-0.01
+G1 X29.01 Y-69.25 Z-0.01
+G1 X25.89 Y-71.05 Z-0.01
+G1 X25.89 Y-74.75 Z-0.01
+G1 X32.47 Y-74.75 Z-0.01
+G1 X32.47 Y-71.05 Z-0.01
+G1 X29.36 Y-69.25 Z-0.01
+G1 X29.36 Y-65.05 Z-0.01
+G1 X32.47 Y-63.25 Z-0.01
+G1 X32.47 Y-59.05 Z-0.01
+G1 X29.36 Y-57.25 Z-0.01
+G1 X29.36 Y-53.05 Z-0.01
+G1 X32.47 Y-51.25 Z-0.01
+G1 X32.47 Y-47.05 Z-0.01
+G1 X29.36 Y-45.25 Z-0.01
+G1 X29.36 Y-41.05 Z-0.01
+G1 X32.47 Y-39.25 Z-0.01
+G1 X32.47 Y-38.19 Z-0.01
+G1 X32.82 Y-38.19 Z-0.01
+G1 X32.82 Y-39.25 Z-0.01
+G1 X35.94 Y-41.05 Z-0.01
+G1 X35.94 Y-45.25 Z-0.01
+G1 X32.82 Y-47.05 Z-0.01
+G1 X32.82 Y-51.25 Z-0.01
+G1 X35.94 Y-53.05 Z-0.01
+G1 X35.94 Y-57.25 Z-0.01
+G1 X32.82 Y-59.05 Z-0.01
+G1 X32.82 Y-63.25 Z-0.01
+G1 X35.94 Y-65.05 Z-0.01
+G1 X35.94 Y-69.25 Z-0.01
+G1 X32.82 Y-71.05 Z-0.01
+G1 X32.82 Y-74.75 Z-0.01
+G1 X39.40 Y-74.75 Z-0.01
+G1 X39.40 Y-71.05 Z-0.01
+G1 X36.28 Y-69.25 Z-0.01
+G1 X36.28 Y-65.05 Z-0.01
+G1 X39.40 Y-63.25 Z-0.01
+G1 X39.40 Y-59.05 Z-0.01
+G1 X36.28 Y-57.25 Z-0.01
+G1 X36.28 Y-53.05 Z-0.01
+G1 X39.40 Y-51.25 Z-0.01
+G1 X39.40 Y-47.05 Z-0.01
+G1 X36.28 Y-45.25 Z-0.01
+G1 X36.28 Y-41.05 Z-0.01
+G1 X39.40 Y-39.25 Z-0.01
+G1 X39.40 Y-38.19 Z-0.01
+G1 X39.75 Y-38.19 Z-0.01
+G1 X39.75 Y-39.25 Z-0.01
+G1 X41.32 Y-40.16 Z-0.01
+G1 X41.32 Y-46.14 Z-0.01
+G1 X39.75 Y-47.05 Z-0.01
+G1 X39.75 Y-51.25 Z-0.01
+G1 X41.32 Y-52.16 Z-0.01
+G1 X41.32 Y-58.14 Z-0.01
+G1 X39.75 Y-59.05 Z-0.01
+G1 X39.75 Y-63.25 Z-0.01
+G1 X41.32 Y-64.16 Z-0.01
+G1 X41.32 Y-70.14 Z-0.01
+G1 X39.75 Y-71.05 Z-0.01
+G1 X39.75 Y-74.75 Z-0.01
+
+T1
+G1 X28.91 Y-74.20 Z0.99
+G1 X40.77 Y-74.20 Z0.99
+G1 X40.77 Y-42.40 Z0.99
+G1 X40.77 Y-38.74 Z0.99
+G1 X-22.83 Y-38.74 Z0.99
+G1 X-34.69 Y-38.74 Z0.99
+G1 X-34.69 Y-70.54 Z0.99
+G1 X-34.69 Y-74.20 Z0.99
+G1 X28.91 Y-74.20 Z0.99
+G1 X28.91 Y-74.20 Z0.99
+G1 X-34.69 Y-40.28 Z0.99
+G1 X-33.34 Y-41.05 Z0.99
+G1 X-33.34 Y-45.25 Z0.99
+G1 X-34.69 Y-46.03 Z0.99
+G1 X-34.69 Y-52.28 Z0.99
+G1 X-33.34 Y-53.05 Z0.99
+G1 X-33.34 Y-57.25 Z0.99
+G1 X-34.69 Y-58.03 Z0.99
+G1 X-34.69 Y-64.28 Z0.99
+G1 X-33.34 Y-65.05 Z0.99
+G1 X-33.34 Y-69.25 Z0.99
+G1 X-34.69 Y-70.03 Z0.99
+G1 X-29.88 Y-74.20 Z0.99
+G1 X-29.88 Y-71.05 Z0.99
+G1 X-33.00 Y-69.25 Z0.99
+G1 X-33.00 Y-65.05 Z0.99
+G1 X-29.88 Y-63.25 Z0.99
+G1 X-29.88 Y-59.05 Z0.99
+G1 X-33.00 Y-57.25 Z0.99
+G1 X-33.00 Y-53.05 Z0.99
+G1 X-29.88 Y-51.25 Z0.99
+G1 X-29.88 Y-47.05 Z0.99
+G1 X-33.00 Y-45.25 Z0.99
+G1 X-33.00 Y-41.05 Z0.99
+G1 X-29.88 Y-39.25 Z0.99
+G1 X-29.88 Y-38.74 Z0.99
+G1 X-29.53 Y-38.74 Z0.99
+G1 X-29.53 Y-39.25 Z0.99
+G1 X-26.42 Y-41.05 Z0.99
+G1 X-26.42 Y-45.25 Z0.99
+G1 X-29.53 Y-47.05 Z0.99
+G1 X-29.53 Y-51.25 Z0.99
+G1 X-26.42 Y-53.05 Z0.99
+G1 X-26.42 Y-57.25 Z0.99
+G1 X-29.53 Y-59.05 Z0.99
+G1 X-29.53 Y-63.25 Z0.99
+G1 X-26.42 Y-65.05 Z0.99
+G1 X-26.42 Y-69.25 Z0.99
+G1 X-29.53 Y-71.05 Z0.99
+G1 X-29.53 Y-74.20 Z0.99
+G1 X-22.95 Y-74.20 Z0.99
+G1 X-22.95 Y-71.05 Z0.99
+G1 X-26.07 Y-69.25 Z0.99
+G1 X-26.07 Y-65.05 Z0.99
+G1 X-22.95 Y-63.25 Z0.99
+G1 X-22.95 Y-59.05 Z0.99
+G1 X-26.07 Y-57.25 Z0.99
+G1 X-26.07 Y-53.05 Z0.99
+G1 X-22.95 Y-51.25 Z0.99
+G1 X-22.95 Y-47.05 Z0.99
+G1 X-26.07 Y-45.25 Z0.99
+G1 X-26.07 Y-41.05 Z0.99
+G1 X-22.95 Y-39.25 Z0.99
+G1 X-22.95 Y-38.74 Z0.99
+G1 X-22.61 Y-38.74 Z0.99
+G1 X-22.61 Y-39.25 Z0.99
+G1 X-19.49 Y-41.05 Z0.99
+G1 X-19.49 Y-45.25 Z0.99
+G1 X-22.61 Y-47.05 Z0.99
+G1 X-22.61 Y-51.25 Z0.99
+G1 X-19.49 Y-53.05 Z0.99
+G1 X-19.49 Y-57.25 Z0.99
+G1 X-22.61 Y-59.05 Z0.99
+G1 X-22.61 Y-63.25 Z0.99
+G1 X-19.49 Y-65.05 Z0.99
+G1 X-19.49 Y-69.25 Z0.99
+G1 X-22.61 Y-71.05 Z0.99
+G1 X-22.61 Y-74.20 Z0.99
+G1 X-16.02 Y-74.20 Z0.99
+G1 X-16.02 Y-71.05 Z0.99
+G1 X-19.14 Y-69.25 Z0.99
+G1 X-19.14 Y-65.05 Z0.99
+G1 X-16.02 Y-63.25 Z0.99
+G1 X-16.02 Y-59.05 Z0.99
+G1 X-19.14 Y-57.25 Z0.99
+G1 X-19.14 Y-53.05 Z0.99
+G1 X-16.02 Y-51.25 Z0.99
+G1 X-16.02 Y-47.05 Z0.99
+G1 X-19.14 Y-45.25 Z0.99
+G1 X-19.14 Y-41.05 Z0.99
+G1 X-16.02 Y-39.25 Z0.99
+G1 X-16.02 Y-38.74 Z0.99
+G1 X-15.68 Y-38.74 Z0.99
+G1 X-15.68 Y-39.25 Z0.99
+G1 X-12.56 Y-41.05 Z0.99
+G1 X-12.56 Y-45.25 Z0.99
+G1 X-15.68 Y-47.05 Z0.99
+G1 X-15.68 Y-51.25 Z0.99
+G1 X-12.56 Y-53.05 Z0.99
+G1 X-12.56 Y-57.25 Z0.99
+G1 X-15.68 Y-59.05 Z0.99
+G1 X-15.68 Y-63.25 Z0.99
+G1 X-12.56 Y-65.05 Z0.99
+G1 X-12.56 Y-69.25 Z0.99
+G1 X-15.68 Y-71.05 Z0.99
+G1 X-15.68 Y-74.20 Z0.99
+G1 X-9.10 Y-74.20 Z0.99
+G1 X-9.10 Y-71.05 Z0.99
+G1 X-12.21 Y-69.25 Z0.99
+G1 X-12.21 Y-65.05 Z0.99
+G1 X-9.10 Y-63.25 Z0.99
+G1 X-9.10 Y-59.05 Z0.99
+G1 X-12.21 Y-57.25 Z0.99
+G1 X-12.21 Y-53.05 Z0.99
+G1 X-9.10 Y-51.25 Z0.99
+G1 X-9.10 Y-47.05 Z0.99
+G1 X-12.21 Y-45.25 Z0.99
+G1 X-12.21 Y-41.05 Z0.99
+G1 X-9.10 Y-39.25 Z0.99
+G1 X-9.10 Y-38.74 Z0.99
+G1 X-8.75 Y-38.74 Z0.99
+G1 X-8.75 Y-39.25 Z0.99
+G1 X-5.63 Y-41.05 Z0.99
+G1 X-5.63 Y-45.25 Z0.99
+G1 X-8.75 Y-47.05 Z0.99
+G1 X-8.75 Y-51.25 Z0.99
+G1 X-5.63 Y-53.05 Z0.99
+G1 X-5.63 Y-57.25 Z0.99
+G1 X-8.75 Y-59.05 Z0.99
+G1 X-8.75 Y-63.25 Z0.99
+G1 X-5.63 Y-65.05 Z0.99
+G1 X-5.63 Y-69.25 Z0.99
+G1 X-8.75 Y-71.05 Z0.99
+G1 X-8.75 Y-74.20 Z0.99
+G1 X-2.17 Y-74.20 Z0.99
+G1 X-2.17 Y-71.05 Z0.99
+G1 X-5.28 Y-69.25 Z0.99
+G1 X-5.28 Y-65.05 Z0.99
+G1 X-2.17 Y-63.25 Z0.99
+G1 X-2.17 Y-59.05 Z0.99
+G1 X-5.28 Y-57.25 Z0.99
+G1 X-5.28 Y-53.05 Z0.99
+G1 X-2.17 Y-51.25 Z0.99
+G1 X-2.17 Y-47.05 Z0.99
+G1 X-5.28 Y-45.25 Z0.99
+G1 X-5.28 Y-41.05 Z0.99
+G1 X-2.17 Y-39.25 Z0.99
+G1 X-2.17 Y-38.74 Z0.99
+G1 X-1.82 Y-38.74 Z0.99
+G1 X-1.82 Y-39.25 Z0.99
+G1 X1.30 Y-41.05 Z0.99
+G1 X1.30 Y-45.25 Z0.99
+G1 X-1.82 Y-47.05 Z0.99
+G1 X-1.82 Y-51.25 Z0.99
+G1 X1.30 Y-53.05 Z0.99
+G1 X1.30 Y-57.25 Z0.99
+G1 X-1.82 Y-59.05 Z0.99
+G1 X-1.82 Y-63.25 Z0.99
+G1 X1.30 Y-65.05 Z0.99
+G1 X1.30 Y-69.25 Z0.99
+G1 X-1.82 Y-71.05 Z0.99
+G1 X-1.82 Y-74.20 Z0.99
+G1 X4.76 Y-74.20 Z0.99
+G1 X4.76 Y-71.05 Z0.99
+G1 X1.64 Y-69.25 Z0.99
+G1 X1.64 Y-65.05 Z0.99
+G1 X4.76 Y-63.25 Z0.99
+G1 X4.76 Y-59.05 Z0.99
+G1 X1.64 Y-57.25 Z0.99
+G1 X1.64 Y-53.05 Z0.99
+G1 X4.76 Y-51.25 Z0.99
+G1 X4.76 Y-47.05 Z0.99
+G1 X1.64 Y-45.25 Z0.99
+G1 X1.64 Y-41.05 Z0.99
+G1 X4.76 Y-39.25 Z0.99
+G1 X4.76 Y-38.74 Z0.99
+G1 X5.11 Y-38.74 Z0.99
+G1 X5.11 Y-39.25 Z0.99
+G1 X8.22 Y-41.05 Z0.99
+G1 X8.22 Y-45.25 Z0.99
+G1 X5.11 Y-47.05 Z0.99
+G1 X5.11 Y-51.25 Z0.99
+G1 X8.22 Y-53.05 Z0.99
+G1 X8.22 Y-57.25 Z0.99
+G1 X5.11 Y-59.05 Z0.99
+G1 X5.11 Y-63.25 Z0.99
+G1 X8.22 Y-65.05 Z0.99
+G1 X8.22 Y-69.25 Z0.99
+G1 X5.11 Y-71.05 Z0.99
+G1 X5.11 Y-74.20 Z0.99
+G1 X11.69 Y-74.20 Z0.99
+G1 X11.69 Y-71.05 Z0.99
+G1 X8.57 Y-69.25 Z0.99
+G1 X8.57 Y-65.05 Z0.99
+G1 X11.69 Y-63.25 Z0.99
+G1 X11.69 Y-59.05 Z0.99
+G1 X8.57 Y-57.25 Z0.99
+G1 X8.57 Y-53.05 Z0.99
+G1 X11.69 Y-51.25 Z0.99
+G1 X11.69 Y-47.05 Z0.99
+G1 X8.57 Y-45.25 Z0.99
+G1 X8.57 Y-41.05 Z0.99
+G1 X11.69 Y-39.25 Z0.99
+G1 X11.69 Y-38.74 Z0.99
+G1 X12.03 Y-38.74 Z0.99
+G1 X12.03 Y-39.25 Z0.99
+G1 X15.15 Y-41.05 Z0.99
+G1 X15.15 Y-45.25 Z0.99
+G1 X12.03 Y-47.05 Z0.99
+G1 X12.03 Y-51.25 Z0.99
+G1 X15.15 Y-53.05 Z0.99
+G1 X15.15 Y-57.25 Z0.99
+G1 X12.03 Y-59.05 Z0.99
+G1 X12.03 Y-63.25 Z0.99
+G1 X15.15 Y-65.05 Z0.99
+G1 X15.15 Y-69.25 Z0.99
+G1 X12.03 Y-71.05 Z0.99
+G1 X12.03 Y-74.20 Z0.99
+G1 X18.62 Y-74.20 Z0.99
+G1 X18.62 Y-71.05 Z0.99
+G1 X15.50 Y-69.25 Z0.99
+G1 X15.50 Y-65.05 Z0.99
+G1 X18.62 Y-63.25 Z0.99
+G1 X18.62 Y-59.05 Z0.99
+G1 X15.50 Y-57.25 Z0.99
+G1 X15.50 Y-53.05 Z0.99
+G1 X18.62 Y-51.25 Z0.99
+G1 X18.62 Y-47.05 Z0.99
+G1 X15.50 Y-45.25 Z0.99
+G1 X15.50 Y-41.05 Z0.99
+G1 X18.62 Y-39.25 Z0.99
+G1 X18.62 Y-38.74 Z0.99
+G1 X18.96 Y-38.74 Z0.99
+G1 X18.96 Y-39.25 Z0.99
+G1 X22.08 Y-41.05 Z0.99
+G1 X22.08 Y-45.25 Z0.99
+G1 X18.96 Y-47.05 Z0.99
+G1 X18.96 Y-51.25 Z0.99
+G1 X22.08 Y-53.05 Z0.99
+G1 X22.08 Y-57.25 Z0.99
+G1 X18.96 Y-59.05 Z0.99
+G1 X18.96 Y-63.25 Z0.99
+G1 X22.08 Y-65.05 Z0.99
+G1 X22.08 Y-69.25 Z0.99
+G1 X18.96 Y-71.05 Z0.99
+G1 X18.96 Y-74.20 Z0.99
+G1 X25.54 Y-74.20 Z0.99
+G1 X25.54 Y-71.05 Z0.99
+G1 X22.43 Y-69.25 Z0.99
+G1 X22.43 Y-65.05 Z0.99
+G1 X25.54 Y-63.25 Z0.99
+G1 X25.54 Y-59.05 Z0.99
+G1 X22.43 Y-57.25 Z0.99
+G1 X22.43 Y-53.05 Z0.99
+G1 X25.54 Y-51.25 Z0.99
+G1 X25.54 Y-47.05 Z0.99
+G1 X22.43 Y-45.25 Z0.99
+G1 X22.43 Y-41.05 Z0.99
+G1 X25.54 Y-39.25 Z0.99
+G1 X25.54 Y-38.74 Z0.99
+G1 X25.89 Y-38.74 Z0.99
+G1 X25.89 Y-39.25 Z0.99
+G1 X29.01 Y-41.05 Z0.99
+G1 X29.01 Y-45.25 Z0.99
+G1 X25.89 Y-47.05 Z0.99
+G1 X25.89 Y-51.25 Z0.99
+G1 X29.01 Y-53.05 Z0.99
+G1 X29.01 Y-57.25 Z0.99
+G1 X25.89 Y-59.05 Z0.99
+G1 X25.89 Y-63.25 Z0.99
+G1 X29.01 Y-65.05 Z0.99
+G1 X29.01 Y-69.25 Z0.99
+G1 X25.89 Y-71.05 Z0.99
+G1 X25.89 Y-74.20 Z0.99
+G1 X32.47 Y-74.20 Z0.99
+G1 X32.47 Y-71.05 Z0.99
+G1 X29.36 Y-69.25 Z0.99
+G1 X29.36 Y-65.05 Z0.99
+G1 X32.47 Y-63.25 Z0.99
+G1 X32.47 Y-59.05 Z0.99
+G1 X29.36 Y-57.25 Z0.99
+G1 X29.36 Y-53.05 Z0.99
+G1 X32.47 Y-51.25 Z0.99
+G1 X32.47 Y-47.05 Z0.99
+G1 X29.36 Y-45.25 Z0.99
+G1 X29.36 Y-41.05 Z0.99
+G1 X32.47 Y-39.25 Z0.99
+G1 X32.47 Y-38.74 Z0.99
+G1 X32.82 Y-38.74 Z0.99
+G1 X32.82 Y-39.25 Z0.99
+G1 X35.94 Y-41.05 Z0.99
+G1 X35.94 Y-45.25 Z0.99
+G1 X32.82 Y-47.05 Z0.99
+G1 X32.82 Y-51.25 Z0.99
+G1 X35.94 Y-53.05 Z0.99
+G1 X35.94 Y-57.25 Z0.99
+G1 X32.82 Y-59.05 Z0.99
+G1 X32.82 Y-63.25 Z0.99
+G1 X35.94 Y-65.05 Z0.99
+G1 X35.94 Y-69.25 Z0.99
+G1 X32.82 Y-71.05 Z0.99
+G1 X32.82 Y-74.20 Z0.99
+G1 X39.40 Y-74.20 Z0.99
+G1 X39.40 Y-71.05 Z0.99
+G1 X36.28 Y-69.25 Z0.99
+G1 X36.28 Y-65.05 Z0.99
+G1 X39.40 Y-63.25 Z0.99
+G1 X39.40 Y-59.05 Z0.99
+G1 X36.28 Y-57.25 Z0.99
+G1 X36.28 Y-53.05 Z0.99
+G1 X39.40 Y-51.25 Z0.99
+G1 X39.40 Y-47.05 Z0.99
+G1 X36.28 Y-45.25 Z0.99
+G1 X36.28 Y-41.05 Z0.99
+G1 X39.40 Y-39.25 Z0.99
+G1 X39.40 Y-38.74 Z0.99
+G1 X39.75 Y-38.74 Z0.99
+G1 X39.75 Y-39.25 Z0.99
+G1 X40.77 Y-39.84 Z0.99
+G1 X40.77 Y-46.46 Z0.99
+G1 X39.75 Y-47.05 Z0.99
+G1 X39.75 Y-51.25 Z0.99
+G1 X40.77 Y-51.84 Z0.99
+G1 X40.77 Y-58.46 Z0.99
+G1 X39.75 Y-59.05 Z0.99
+G1 X39.75 Y-63.25 Z0.99
+G1 X40.77 Y-63.84 Z0.99
+G1 X40.77 Y-70.46 Z0.99
+G1 X39.75 Y-71.05 Z0.99
+G1 X39.75 Y-74.20 Z0.99
+
+T1
+G1 X25.47 Y-73.64 Z1.99
+G1 X40.21 Y-73.64 Z1.99
+G1 X40.21 Y-43.84 Z1.99
+G1 X40.21 Y-39.30 Z1.99
+G1 X-19.39 Y-39.30 Z1.99
+G1 X-34.13 Y-39.30 Z1.99
+G1 X-34.13 Y-69.10 Z1.99
+G1 X-34.13 Y-73.64 Z1.99
+G1 X25.47 Y-73.64 Z1.99
+G1 X25.47 Y-73.64 Z1.99
+G1 X-34.13 Y-40.60 Z1.99
+G1 X-33.34 Y-41.05 Z1.99
+G1 X-33.34 Y-45.25 Z1.99
+G1 X-34.13 Y-45.71 Z1.99
+G1 X-34.13 Y-52.60 Z1.99
+G1 X-33.34 Y-53.05 Z1.99
+G1 X-33.34 Y-57.25 Z1.99
+G1 X-34.13 Y-57.71 Z1.99
+G1 X-34.13 Y-64.60 Z1.99
+G1 X-33.34 Y-65.05 Z1.99
+G1 X-33.34 Y-69.25 Z1.99
+G1 X-34.13 Y-69.71 Z1.99
+G1 X-29.88 Y-73.64 Z1.99
+G1 X-29.88 Y-71.05 Z1.99
+G1 X-33.00 Y-69.25 Z1.99
+G1 X-33.00 Y-65.05 Z1.99
+G1 X-29.88 Y-63.25 Z1.99
+G1 X-29.88 Y-59.05 Z1.99
+G1 X-33.00 Y-57.25 Z1.99
+G1 X-33.00 Y-53.05 Z1.99
+G1 X-29.88 Y-51.25 Z1.99
+G1 X-29.88 Y-47.05 Z1.99
+G1 X-33.00 Y-45.25 Z1.99
+G1 X-33.00 Y-41.05 Z1.99
+G1 X-29.96 Y-39.30 Z1.99
+G1 X-29.45 Y-39.30 Z1.99
+G1 X-26.42 Y-41.05 Z1.99
+G1 X-26.42 Y-45.25 Z1.99
+G1 X-29.53 Y-47.05 Z1.99
+G1 X-29.53 Y-51.25 Z1.99
+G1 X-26.42 Y-53.05 Z1.99
+G1 X-26.42 Y-57.25 Z1.99
+G1 X-29.53 Y-59.05 Z1.99
+G1 X-29.53 Y-63.25 Z1.99
+G1 X-26.42 Y-65.05 Z1.99
+G1 X-26.42 Y-69.25 Z1.99
+G1 X-29.53 Y-71.05 Z1.99
+G1 X-29.53 Y-73.64 Z1.99
+G1 X-22.95 Y-73.64 Z1.99
+G1 X-22.95 Y-71.05 Z1.99
+G1 X-26.07 Y-69.25 Z1.99
+G1 X-26.07 Y-65.05 Z1.99
+G1 X-22.95 Y-63.25 Z1.99
+G1 X-22.95 Y-59.05 Z1.99
+G1 X-26.07 Y-57.25 Z1.99
+G1 X-26.07 Y-53.05 Z1.99
+G1 X-22.95 Y-51.25 Z1.99
+G1 X-22.95 Y-47.05 Z1.99
+G1 X-26.07 Y-45.25 Z1.99
+G1 X-26.07 Y-41.05 Z1.99
+G1 X-23.03 Y-39.30 Z1.99
+G1 X-22.53 Y-39.30 Z1.99
+G1 X-19.49 Y-41.05 Z1.99
+G1 X-19.49 Y-45.25 Z1.99
+G1 X-22.61 Y-47.05 Z1.99
+G1 X-22.61 Y-51.25 Z1.99
+G1 X-19.49 Y-53.05 Z1.99
+G1 X-19.49 Y-57.25 Z1.99
+G1 X-22.61 Y-59.05 Z1.99
+G1 X-22.61 Y-63.25 Z1.99
+G1 X-19.49 Y-65.05 Z1.99
+G1 X-19.49 Y-69.25 Z1.99
+G1 X-22.61 Y-71.05 Z1.99
+G1 X-22.61 Y-73.64 Z1.99
+G1 X-16.02 Y-73.64 Z1.99
+G1 X-16.02 Y-71.05 Z1.99
+G1 X-19.14 Y-69.25 Z1.99
+G1 X-19.14 Y-65.05 Z1.99
+G1 X-16.02 Y-63.25 Z1.99
+G1 X-16.02 Y-59.05 Z1.99
+G1 X-19.14 Y-57.25 Z1.99
+G1 X-19.14 Y-53.05 Z1.99
+G1 X-16.02 Y-51.25 Z1.99
+G1 X-16.02 Y-47.05 Z1.99
+G1 X-19.14 Y-45.25 Z1.99
+G1 X-19.14 Y-41.05 Z1.99
+G1 X-16.10 Y-39.30 Z1.99
+G1 X-15.60 Y-39.30 Z1.99
+G1 X-12.56 Y-41.05 Z1.99
+G1 X-12.56 Y-45.25 Z1.99
+G1 X-15.68 Y-47.05 Z1.99
+G1 X-15.68 Y-51.25 Z1.99
+G1 X-12.56 Y-53.05 Z1.99
+G1 X-12.56 Y-57.25 Z1.99
+G1 X-15.68 Y-59.05 Z1.99
+G1 X-15.68 Y-63.25 Z1.99
+G1 X-12.56 Y-65.05 Z1.99
+G1 X-12.56 Y-69.25 Z1.99
+G1 X-15.68 Y-71.05 Z1.99
+G1 X-15.68 Y-73.64 Z1.99
+G1 X-9.10 Y-73.64 Z1.99
+G1 X-9.10 Y-71.05 Z1.99
+G1 X-12.21 Y-69.25 Z1.99
+G1 X-12.21 Y-65.05 Z1.99
+G1 X-9.10 Y-63.25 Z1.99
+G1 X-9.10 Y-59.05 Z1.99
+G1 X-12.21 Y-57.25 Z1.99
+G1 X-12.21 Y-53.05 Z1.99
+G1 X-9.10 Y-51.25 Z1.99
+G1 X-9.10 Y-47.05 Z1.99
+G1 X-12.21 Y-45.25 Z1.99
+G1 X-12.21 Y-41.05 Z1.99
+G1 X-9.18 Y-39.30 Z1.99
+G1 X-8.67 Y-39.30 Z1.99
+G1 X-5.63 Y-41.05 Z1.99
+G1 X-5.63 Y-45.25 Z1.99
+G1 X-8.75 Y-47.05 Z1.99
+G1 X-8.75 Y-51.25 Z1.99
+G1 X-5.63 Y-53.05 Z1.99
+G1 X-5.63 Y-57.25 Z1.99
+G1 X-8.75 Y-59.05 Z1.99
+G1 X-8.75 Y-63.25 Z1.99
+G1 X-5.63 Y-65.05 Z1.99
+G1 X-5.63 Y-69.25 Z1.99
+G1 X-8.75 Y-71.05 Z1.99
+G1 X-8.75 Y-73.64 Z1.99
+G1 X-2.17 Y-73.64 Z1.99
+G1 X-2.17 Y-71.05 Z1.99
+G1 X-5.28 Y-69.25 Z1.99
+G1 X-5.28 Y-65.05 Z1.99
+G1 X-2.17 Y-63.25 Z1.99
+G1 X-2.17 Y-59.05 Z1.99
+G1 X-5.28 Y-57.25 Z1.99
+G1 X-5.28 Y-53.05 Z1.99
+G1 X-2.17 Y-51.25 Z1.99
+G1 X-2.17 Y-47.05 Z1.99
+G1 X-5.28 Y-45.25 Z1.99
+G1 X-5.28 Y-41.05 Z1.99
+G1 X-2.25 Y-39.30 Z1.99
+G1 X-1.74 Y-39.30 Z1.99
+G1 X1.30 Y-41.05 Z1.99
+G1 X1.30 Y-45.25 Z1.99
+G1 X-1.82 Y-47.05 Z1.99
+G1 X-1.82 Y-51.25 Z1.99
+G1 X1.30 Y-53.05 Z1.99
+G1 X1.30 Y-57.25 Z1.99
+G1 X-1.82 Y-59.05 Z1.99
+G1 X-1.82 Y-63.25 Z1.99
+G1 X1.30 Y-65.05 Z1.99
+G1 X1.30 Y-69.25 Z1.99
+G1 X-1.82 Y-71.05 Z1.99
+G1 X-1.82 Y-73.64 Z1.99
+G1 X4.76 Y-73.64 Z1.99
+G1 X4.76 Y-71.05 Z1.99
+G1 X1.64 Y-69.25 Z1.99
+G1 X1.64 Y-65.05 Z1.99
+G1 X4.76 Y-63.25 Z1.99
+G1 X4.76 Y-59.05 Z1.99
+G1 X1.64 Y-57.25 Z1.99
+G1 X1.64 Y-53.05 Z1.99
+G1 X4.76 Y-51.25 Z1.99
+G1 X4.76 Y-47.05 Z1.99
+G1 X1.64 Y-45.25 Z1.99
+G1 X1.64 Y-41.05 Z1.99
+G1 X4.68 Y-39.30 Z1.99
+G1 X5.19 Y-39.30 Z1.99
+G1 X8.22 Y-41.05 Z1.99
+G1 X8.22 Y-45.25 Z1.99
+G1 X5.11 Y-47.05 Z1.99
+G1 X5.11 Y-51.25 Z1.99
+G1 X8.22 Y-53.05 Z1.99
+G1 X8.22 Y-57.25 Z1.99
+G1 X5.11 Y-59.05 Z1.99
+G1 X5.11 Y-63.25 Z1.99
+G1 X8.22 Y-65.05 Z1.99
+G1 X8.22 Y-69.25 Z1.99
+G1 X5.11 Y-71.05 Z1.99
+G1 X5.11 Y-73.64 Z1.99
+G1 X11.69 Y-73.64 Z1.99
+G1 X11.69 Y-71.05 Z1.99
+G1 X8.57 Y-69.25 Z1.99
+G1 X8.57 Y-65.05 Z1.99
+G1 X11.69 Y-63.25 Z1.99
+G1 X11.69 Y-59.05 Z1.99
+G1 X8.57 Y-57.25 Z1.99
+G1 X8.57 Y-53.05 Z1.99
+G1 X11.69 Y-51.25 Z1.99
+G1 X11.69 Y-47.05 Z1.99
+G1 X8.57 Y-45.25 Z1.99
+G1 X8.57 Y-41.05 Z1.99
+G1 X11.61 Y-39.30 Z1.99
+G1 X12.11 Y-39.30 Z1.99
+G1 X15.15 Y-41.05 Z1.99
+G1 X15.15 Y-45.25 Z1.99
+G1 X12.03 Y-47.05 Z1.99
+G1 X12.03 Y-51.25 Z1.99
+G1 X15.15 Y-53.05 Z1.99
+G1 X15.15 Y-57.25 Z1.99
+G1 X12.03 Y-59.05 Z1.99
+G1 X12.03 Y-63.25 Z1.99
+G1 X15.15 Y-65.05 Z1.99
+G1 X15.15 Y-69.25 Z1.99
+G1 X12.03 Y-71.05 Z1.99
+G1 X12.03 Y-73.64 Z1.99
+G1 X18.62 Y-73.64 Z1.99
+G1 X18.62 Y-71.05 Z1.99
+G1 X15.50 Y-69.25 Z1.99
+G1 X15.50 Y-65.05 Z1.99
+G1 X18.62 Y-63.25 Z1.99
+G1 X18.62 Y-59.05 Z1.99
+G1 X15.50 Y-57.25 Z1.99
+G1 X15.50 Y-53.05 Z1.99
+G1 X18.62 Y-51.25 Z1.99
+G1 X18.62 Y-47.05 Z1.99
+G1 X15.50 Y-45.25 Z1.99
+G1 X15.50 Y-41.05 Z1.99
+G1 X18.54 Y-39.30 Z1.99
+G1 X19.04 Y-39.30 Z1.99
+G1 X22.08 Y-41.05 Z1.99
+G1 X22.08 Y-45.25 Z1.99
+G1 X18.96 Y-47.05 Z1.99
+G1 X18.96 Y-51.25 Z1.99
+G1 X22.08 Y-53.05 Z1.99
+G1 X22.08 Y-57.25 Z1.99
+G1 X18.96 Y-59.05 Z1.99
+G1 X18.96 Y-63.25 Z1.99
+G1 X22.08 Y-65.05 Z1.99
+G1 X22.08 Y-69.25 Z1.99
+G1 X18.96 Y-71.05 Z1.99
+G1 X18.96 Y-73.64 Z1.99
+G1 X25.54 Y-73.64 Z1.99
+G1 X25.54 Y-71.05 Z1.99
+G1 X22.43 Y-69.25 Z1.99
+G1 X22.43 Y-65.05 Z1.99
+G1 X25.54 Y-63.25 Z1.99
+G1 X25.54 Y-59.05 Z1.99
+G1 X22.43 Y-57.25 Z1.99
+G1 X22.43 Y-53.05 Z1.99
+G1 X25.54 Y-51.25 Z1.99
+G1 X25.54 Y-47.05 Z1.99
+G1 X22.43 Y-45.25 Z1.99
+G1 X22.43 Y-41.05 Z1.99
+G1 X25.47 Y-39.30 Z1.99
+G1 X25.97 Y-39.30 Z1.99
+G1 X29.01 Y-41.05 Z1.99
+G1 X29.01 Y-45.25 Z1.99
+G1 X25.89 Y-47.05 Z1.99
+G1 X25.89 Y-51.25 Z1.99
+G1 X29.01 Y-53.05 Z1.99
+G1 X29.01 Y-57.25 Z1.99
+G1 X25.89 Y-59.05 Z1.99
+G1 X25.89 Y-63.25 Z1.99
+G1 X29.01 Y-65.05 Z1.99
+G1 X29.01 Y-69.25 Z1.99
+G1 X25.89 Y-71.05 Z1.99
+G1 X25.89 Y-73.64 Z1.99
+G1 X32.47 Y-73.64 Z1.99
+G1 X32.47 Y-71.05 Z1.99
+G1 X29.36 Y-69.25 Z1.99
+G1 X29.36 Y-65.05 Z1.99
+G1 X32.47 Y-63.25 Z1.99
+G1 X32.47 Y-59.05 Z1.99
+G1 X29.36 Y-57.25 Z1.99
+G1 X29.36 Y-53.05 Z1.99
+G1 X32.47 Y-51.25 Z1.99
+G1 X32.47 Y-47.05 Z1.99
+G1 X29.36 Y-45.25 Z1.99
+G1 X29.36 Y-41.05 Z1.99
+G1 X32.39 Y-39.30 Z1.99
+G1 X32.90 Y-39.30 Z1.99
+G1 X35.94 Y-41.05 Z1.99
+G1 X35.94 Y-45.25 Z1.99
+G1 X32.82 Y-47.05 Z1.99
+G1 X32.82 Y-51.25 Z1.99
+G1 X35.94 Y-53.05 Z1.99
+G1 X35.94 Y-57.25 Z1.99
+G1 X32.82 Y-59.05 Z1.99
+G1 X32.82 Y-63.25 Z1.99
+G1 X35.94 Y-65.05 Z1.99
+G1 X35.94 Y-69.25 Z1.99
+G1 X32.82 Y-71.05 Z1.99
+G1 X32.82 Y-73.64 Z1.99
+G1 X39.40 Y-73.64 Z1.99
+G1 X39.40 Y-71.05 Z1.99
+G1 X36.28 Y-69.25 Z1.99
+G1 X36.28 Y-65.05 Z1.99
+G1 X39.40 Y-63.25 Z1.99
+G1 X39.40 Y-59.05 Z1.99
+G1 X36.28 Y-57.25 Z1.99
+G1 X36.28 Y-53.05 Z1.99
+G1 X39.40 Y-51.25 Z1.99
+G1 X39.40 Y-47.05 Z1.99
+G1 X36.28 Y-45.25 Z1.99
+G1 X36.28 Y-41.05 Z1.99
+G1 X39.32 Y-39.30 Z1.99
+G1 X39.83 Y-39.30 Z1.99
+G1 X40.21 Y-39.52 Z1.99
+G1 X40.21 Y-46.78 Z1.99
+G1 X39.75 Y-47.05 Z1.99
+G1 X39.75 Y-51.25 Z1.99
+G1 X40.21 Y-51.52 Z1.99
+G1 X40.21 Y-58.78 Z1.99
+G1 X39.75 Y-59.05 Z1.99
+G1 X39.75 Y-63.25 Z1.99
+G1 X40.21 Y-63.52 Z1.99
+G1 X40.21 Y-70.78 Z1.99
+G1 X39.75 Y-71.05 Z1.99
+G1 X39.75 Y-73.64 Z1.99
+
+T1
+G1 X22.02 Y-73.09 Z2.99
+G1 X39.66 Y-73.09 Z2.99
+G1 X39.66 Y-45.29 Z2.99
+G1 X39.66 Y-39.85 Z2.99
+G1 X-15.94 Y-39.85 Z2.99
+G1 X-33.58 Y-39.85 Z2.99
+G1 X-33.58 Y-67.65 Z2.99
+G1 X-33.58 Y-73.09 Z2.99
+G1 X22.02 Y-73.09 Z2.99
+G1 X22.02 Y-73.09 Z2.99
+G1 X-33.58 Y-40.92 Z2.99
+G1 X-33.34 Y-41.05 Z2.99
+G1 X-33.34 Y-45.25 Z2.99
+G1 X-33.58 Y-45.39 Z2.99
+G1 X-33.58 Y-52.91 Z2.99
+G1 X-33.34 Y-53.05 Z2.99
+G1 X-33.34 Y-57.25 Z2.99
+G1 X-33.58 Y-57.39 Z2.99
+G1 X-33.58 Y-64.92 Z2.99
+G1 X-33.34 Y-65.05 Z2.99
+G1 X-33.34 Y-69.25 Z2.99
+G1 X-33.58 Y-69.39 Z2.99
+G1 X-29.88 Y-73.09 Z2.99
+G1 X-29.88 Y-71.05 Z2.99
+G1 X-33.00 Y-69.25 Z2.99
+G1 X-33.00 Y-65.05 Z2.99
+G1 X-29.88 Y-63.25 Z2.99
+G1 X-29.88 Y-59.05 Z2.99
+G1 X-33.00 Y-57.25 Z2.99
+G1 X-33.00 Y-53.05 Z2.99
+G1 X-29.88 Y-51.25 Z2.99
+G1 X-29.88 Y-47.05 Z2.99
+G1 X-33.00 Y-45.25 Z2.99
+G1 X-33.00 Y-41.05 Z2.99
+G1 X-30.92 Y-39.85 Z2.99
+G1 X-28.50 Y-39.85 Z2.99
+G1 X-26.42 Y-41.05 Z2.99
+G1 X-26.42 Y-45.25 Z2.99
+G1 X-29.53 Y-47.05 Z2.99
+G1 X-29.53 Y-51.25 Z2.99
+G1 X-26.42 Y-53.05 Z2.99
+G1 X-26.42 Y-57.25 Z2.99
+G1 X-29.53 Y-59.05 Z2.99
+G1 X-29.53 Y-63.25 Z2.99
+G1 X-26.42 Y-65.05 Z2.99
+G1 X-26.42 Y-69.25 Z2.99
+G1 X-29.53 Y-71.05 Z2.99
+G1 X-29.53 Y-73.09 Z2.99
+G1 X-22.95 Y-73.09 Z2.99
+G1 X-22.95 Y-71.05 Z2.99
+G1 X-26.07 Y-69.25 Z2.99
+G1 X-26.07 Y-65.05 Z2.99
+G1 X-22.95 Y-63.25 Z2.99
+G1 X-22.95 Y-59.05 Z2.99
+G1 X-26.07 Y-57.25 Z2.99
+G1 X-26.07 Y-53.05 Z2.99
+G1 X-22.95 Y-51.25 Z2.99
+G1 X-22.95 Y-47.05 Z2.99
+G1 X-26.07 Y-45.25 Z2.99
+G1 X-26.07 Y-41.05 Z2.99
+G1 X-23.99 Y-39.85 Z2.99
+G1 X-21.57 Y-39.85 Z2.99
+G1 X-19.49 Y-41.05 Z2.99
+G1 X-19.49 Y-45.25 Z2.99
+G1 X-22.61 Y-47.05 Z2.99
+G1 X-22.61 Y-51.25 Z2.99
+G1 X-19.49 Y-53.05 Z2.99
+G1 X-19.49 Y-57.25 Z2.99
+G1 X-22.61 Y-59.05 Z2.99
+G1 X-22.61 Y-63.25 Z2.99
+G1 X-19.49 Y-65.05 Z2.99
+G1 X-19.49 Y-69.25 Z2.99
+G1 X-22.61 Y-71.05 Z2.99
+G1 X-22.61 Y-73.09 Z2.99
+G1 X-16.02 Y-73.09 Z2.99
+G1 X-16.02 Y-71.05 Z2.99
+G1 X-19.14 Y-69.25 Z2.99
+G1 X-19.14 Y-65.05 Z2.99
+G1 X-16.02 Y-63.25 Z2.99
+G1 X-16.02 Y-59.05 Z2.99
+G1 X-19.14 Y-57.25 Z2.99
+G1 X-19.14 Y-53.05 Z2.99
+G1 X-16.02 Y-51.25 Z2.99
+G1 X-16.02 Y-47.05 Z2.99
+G1 X-19.14 Y-45.25 Z2.99
+G1 X-19.14 Y-41.05 Z2.99
+G1 X-17.06 Y-39.85 Z2.99
+G1 X-14.64 Y-39.85 Z2.99
+G1 X-12.56 Y-41.05 Z2.99
+G1 X-12.56 Y-45.25 Z2.99
+G1 X-15.68 Y-47.05 Z2.99
+G1 X-15.68 Y-51.25 Z2.99
+G1 X-12.56 Y-53.05 Z2.99
+G1 X-12.56 Y-57.25 Z2.99
+G1 X-15.68 Y-59.05 Z2.99
+G1 X-15.68 Y-63.25 Z2.99
+G1 X-12.56 Y-65.05 Z2.99
+G1 X-12.56 Y-69.25 Z2.99
+G1 X-15.68 Y-71.05 Z2.99
+G1 X-15.68 Y-73.09 Z2.99
+G1 X-9.10 Y-73.09 Z2.99
+G1 X-9.10 Y-71.05 Z2.99
+G1 X-12.21 Y-69.25 Z2.99
+G1 X-12.21 Y-65.05 Z2.99
+G1 X-9.10 Y-63.25 Z2.99
+G1 X-9.10 Y-59.05 Z2.99
+G1 X-12.21 Y-57.25 Z2.99
+G1 X-12.21 Y-53.05 Z2.99
+G1 X-9.10 Y-51.25 Z2.99
+G1 X-9.10 Y-47.05 Z2.99
+G1 X-12.21 Y-45.25 Z2.99
+G1 X-12.21 Y-41.05 Z2.99
+G1 X-10.14 Y-39.85 Z2.99
+G1 X-7.71 Y-39.85 Z2.99
+G1 X-5.63 Y-41.05 Z2.99
+G1 X-5.63 Y-45.25 Z2.99
+G1 X-8.75 Y-47.05 Z2.99
+G1 X-8.75 Y-51.25 Z2.99
+G1 X-5.63 Y-53.05 Z2.99
+G1 X-5.63 Y-57.25 Z2.99
+G1 X-8.75 Y-59.05 Z2.99
+G1 X-8.75 Y-63.25 Z2.99
+G1 X-5.63 Y-65.05 Z2.99
+G1 X-5.63 Y-69.25 Z2.99
+G1 X-8.75 Y-71.05 Z2.99
+G1 X-8.75 Y-73.09 Z2.99
+G1 X-2.17 Y-73.09 Z2.99
+G1 X-2.17 Y-71.05 Z2.99
+G1 X-5.28 Y-69.25 Z2.99
+G1 X-5.28 Y-65.05 Z2.99
+G1 X-2.17 Y-63.25 Z2.99
+G1 X-2.17 Y-59.05 Z2.99
+G1 X-5.28 Y-57.25 Z2.99
+G1 X-5.28 Y-53.05 Z2.99
+G1 X-2.17 Y-51.25 Z2.99
+G1 X-2.17 Y-47.05 Z2.99
+G1 X-5.28 Y-45.25 Z2.99
+G1 X-5.28 Y-41.05 Z2.99
+G1 X-3.21 Y-39.85 Z2.99
+G1 X-0.78 Y-39.85 Z2.99
+G1 X1.30 Y-41.05 Z2.99
+G1 X1.30 Y-45.25 Z2.99
+G1 X-1.82 Y-47.05 Z2.99
+G1 X-1.82 Y-51.25 Z2.99
+G1 X1.30 Y-53.05 Z2.99
+G1 X1.30 Y-57.25 Z2.99
+G1 X-1.82 Y-59.05 Z2.99
+G1 X-1.82 Y-63.25 Z2.99
+G1 X1.30 Y-65.05 Z2.99
+G1 X1.30 Y-69.25 Z2.99
+G1 X-1.82 Y-71.05 Z2.99
+G1 X-1.82 Y-73.09 Z2.99
+G1 X4.76 Y-73.09 Z2.99
+G1 X4.76 Y-71.05 Z2.99
+G1 X1.64 Y-69.25 Z2.99
+G1 X1.64 Y-65.05 Z2.99
+G1 X4.76 Y-63.25 Z2.99
+G1 X4.76 Y-59.05 Z2.99
+G1 X1.64 Y-57.25 Z2.99
+G1 X1.64 Y-53.05 Z2.99
+G1 X4.76 Y-51.25 Z2.99
+G1 X4.76 Y-47.05 Z2.99
+G1 X1.64 Y-45.25 Z2.99
+G1 X1.64 Y-41.05 Z2.99
+G1 X3.72 Y-39.85 Z2.99
+G1 X6.15 Y-39.85 Z2.99
+G1 X8.22 Y-41.05 Z2.99
+G1 X8.22 Y-45.25 Z2.99
+G1 X5.11 Y-47.05 Z2.99
+G1 X5.11 Y-51.25 Z2.99
+G1 X8.22 Y-53.05 Z2.99
+G1 X8.22 Y-57.25 Z2.99
+G1 X5.11 Y-59.05 Z2.99
+G1 X5.11 Y-63.25 Z2.99
+G1 X8.22 Y-65.05 Z2.99
+G1 X8.22 Y-69.25 Z2.99
+G1 X5.11 Y-71.05 Z2.99
+G1 X5.11 Y-73.09 Z2.99
+G1 X11.69 Y-73.09 Z2.99
+G1 X11.69 Y-71.05 Z2.99
+G1 X8.57 Y-69.25 Z2.99
+G1 X8.57 Y-65.05 Z2.99
+G1 X11.69 Y-63.25 Z2.99
+G1 X11.69 Y-59.05 Z2.99
+G1 X8.57 Y-57.25 Z2.99
+G1 X8.57 Y-53.05 Z2.99
+G1 X11.69 Y-51.25 Z2.99
+G1 X11.69 Y-47.05 Z2.99
+G1 X8.57 Y-45.25 Z2.99
+G1 X8.57 Y-41.05 Z2.99
+G1 X10.65 Y-39.85 Z2.99
+G1 X13.07 Y-39.85 Z2.99
+G1 X15.15 Y-41.05 Z2.99
+G1 X15.15 Y-45.25 Z2.99
+G1 X12.03 Y-47.05 Z2.99
+G1 X12.03 Y-51.25 Z2.99
+G1 X15.15 Y-53.05 Z2.99
+G1 X15.15 Y-57.25 Z2.99
+G1 X12.03 Y-59.05 Z2.99
+G1 X12.03 Y-63.25 Z2.99
+G1 X15.15 Y-65.05 Z2.99
+G1 X15.15 Y-69.25 Z2.99
+G1 X12.03 Y-71.05 Z2.99
+G1 X12.03 Y-73.09 Z2.99
+G1 X18.62 Y-73.09 Z2.99
+G1 X18.62 Y-71.05 Z2.99
+G1 X15.50 Y-69.25 Z2.99
+G1 X15.50 Y-65.05 Z2.99
+G1 X18.62 Y-63.25 Z2.99
+G1 X18.62 Y-59.05 Z2.99
+G1 X15.50 Y-57.25 Z2.99
+G1 X15.50 Y-53.05 Z2.99
+G1 X18.62 Y-51.25 Z2.99
+G1 X18.62 Y-47.05 Z2.99
+G1 X15.50 Y-45.25 Z2.99
+G1 X15.50 Y-41.05 Z2.99
+G1 X17.58 Y-39.85 Z2.99
+G1 X20.00 Y-39.85 Z2.99
+G1 X22.08 Y-41.05 Z2.99
+G1 X22.08 Y-45.25 Z2.99
+G1 X18.96 Y-47.05 Z2.99
+G1 X18.96 Y-51.25 Z2.99
+G1 X22.08 Y-53.05 Z2.99
+G1 X22.08 Y-57.25 Z2.99
+G1 X18.96 Y-59.05 Z2.99
+G1 X18.96 Y-63.25 Z2.99
+G1 X22.08 Y-65.05 Z2.99
+G1 X22.08 Y-69.25 Z2.99
+G1 X18.96 Y-71.05 Z2.99
+G1 X18.96 Y-73.09 Z2.99
+G1 X25.54 Y-73.09 Z2.99
+G1 X25.54 Y-71.05 Z2.99
+G1 X22.43 Y-69.25 Z2.99
+G1 X22.43 Y-65.05 Z2.99
+G1 X25.54 Y-63.25 Z2.99
+G1 X25.54 Y-59.05 Z2.99
+G1 X22.43 Y-57.25 Z2.99
+G1 X22.43 Y-53.05 Z2.99
+G1 X25.54 Y-51.25 Z2.99
+G1 X25.54 Y-47.05 Z2.99
+G1 X22.43 Y-45.25 Z2.99
+G1 X22.43 Y-41.05 Z2.99
+G1 X24.51 Y-39.85 Z2.99
+G1 X26.93 Y-39.85 Z2.99
+G1 X29.01 Y-41.05 Z2.99
+G1 X29.01 Y-45.25 Z2.99
+G1 X25.89 Y-47.05 Z2.99
+G1 X25.89 Y-51.25 Z2.99
+G1 X29.01 Y-53.05 Z2.99
+G1 X29.01 Y-57.25 Z2.99
+G1 X25.89 Y-59.05 Z2.99
+G1 X25.89 Y-63.25 Z2.99
+G1 X29.01 Y-65.05 Z2.99
+G1 X29.01 Y-69.25 Z2.99
+G1 X25.89 Y-71.05 Z2.99
+G1 X25.89 Y-73.09 Z2.99
+G1 X32.47 Y-73.09 Z2.99
+G1 X32.47 Y-71.05 Z2.99
+G1 X29.36 Y-69.25 Z2.99
+G1 X29.36 Y-65.05 Z2.99
+G1 X32.47 Y-63.25 Z2.99
+G1 X32.47 Y-59.05 Z2.99
+G1 X29.36 Y-57.25 Z2.99
+G1 X29.36 Y-53.05 Z2.99
+G1 X32.47 Y-51.25 Z2.99
+G1 X32.47 Y-47.05 Z2.99
+G1 X29.36 Y-45.25 Z2.99
+G1 X29.36 Y-41.05 Z2.99
+G1 X31.43 Y-39.85 Z2.99
+G1 X33.86 Y-39.85 Z2.99
+G1 X35.94 Y-41.05 Z2.99
+G1 X35.94 Y-45.25 Z2.99
+G1 X32.82 Y-47.05 Z2.99
+G1 X32.82 Y-51.25 Z2.99
+G1 X35.94 Y-53.05 Z2.99
+G1 X35.94 Y-57.25 Z2.99
+G1 X32.82 Y-59.05 Z2.99
+G1 X32.82 Y-63.25 Z2.99
+G1 X35.94 Y-65.05 Z2.99
+G1 X35.94 Y-69.25 Z2.99
+G1 X32.82 Y-71.05 Z2.99
+G1 X32.82 Y-73.09 Z2.99
+G1 X39.40 Y-73.09 Z2.99
+G1 X39.40 Y-71.05 Z2.99
+G1 X36.28 Y-69.25 Z2.99
+G1 X36.28 Y-65.05 Z2.99
+G1 X39.40 Y-63.25 Z2.99
+G1 X39.40 Y-59.05 Z2.99
+G1 X36.28 Y-57.25 Z2.99
+G1 X36.28 Y-53.05 Z2.99
+G1 X39.40 Y-51.25 Z2.99
+G1 X39.40 Y-47.05 Z2.99
+G1 X36.28 Y-45.25 Z2.99
+G1 X36.28 Y-41.05 Z2.99
+G1 X38.36 Y-39.85 Z2.99
+
+T1
+G1 X18.58 Y-72.53 Z3.99
+G1 X39.10 Y-72.53 Z3.99
+G1 X39.10 Y-46.73 Z3.99
+G1 X39.10 Y-40.41 Z3.99
+G1 X-12.50 Y-40.41 Z3.99
+G1 X-33.02 Y-40.41 Z3.99
+G1 X-33.02 Y-66.21 Z3.99
+G1 X-33.02 Y-72.53 Z3.99
+G1 X18.58 Y-72.53 Z3.99
+G1 X18.58 Y-72.53 Z3.99
+G1 X-29.88 Y-72.53 Z3.99
+G1 X-29.88 Y-71.05 Z3.99
+G1 X-33.00 Y-69.25 Z3.99
+G1 X-33.00 Y-65.05 Z3.99
+G1 X-29.88 Y-63.25 Z3.99
+G1 X-29.88 Y-59.05 Z3.99
+G1 X-33.00 Y-57.25 Z3.99
+G1 X-33.00 Y-53.05 Z3.99
+G1 X-29.88 Y-51.25 Z3.99
+G1 X-29.88 Y-47.05 Z3.99
+G1 X-33.00 Y-45.25 Z3.99
+G1 X-33.00 Y-41.05 Z3.99
+G1 X-31.88 Y-40.41 Z3.99
+G1 X-27.53 Y-40.41 Z3.99
+G1 X-26.42 Y-41.05 Z3.99
+G1 X-26.42 Y-45.25 Z3.99
+G1 X-29.53 Y-47.05 Z3.99
+G1 X-29.53 Y-51.25 Z3.99
+G1 X-26.42 Y-53.05 Z3.99
+G1 X-26.42 Y-57.25 Z3.99
+G1 X-29.53 Y-59.05 Z3.99
+G1 X-29.53 Y-63.25 Z3.99
+G1 X-26.42 Y-65.05 Z3.99
+G1 X-26.42 Y-69.25 Z3.99
+G1 X-29.53 Y-71.05 Z3.99
+G1 X-29.53 Y-72.53 Z3.99
+G1 X-22.95 Y-72.53 Z3.99
+G1 X-22.95 Y-71.05 Z3.99
+G1 X-26.07 Y-69.25 Z3.99
+G1 X-26.07 Y-65.05 Z3.99
+G1 X-22.95 Y-63.25 Z3.99
+G1 X-22.95 Y-59.05 Z3.99
+G1 X-26.07 Y-57.25 Z3.99
+G1 X-26.07 Y-53.05 Z3.99
+G1 X-22.95 Y-51.25 Z3.99
+G1 X-22.95 Y-47.05 Z3.99
+G1 X-26.07 Y-45.25 Z3.99
+G1 X-26.07 Y-41.05 Z3.99
+G1 X-24.95 Y-40.41 Z3.99
+G1 X-20.60 Y-40.41 Z3.99
+G1 X-19.49 Y-41.05 Z3.99
+G1 X-19.49 Y-45.25 Z3.99
+G1 X-22.61 Y-47.05 Z3.99
+G1 X-22.61 Y-51.25 Z3.99
+G1 X-19.49 Y-53.05 Z3.99
+G1 X-19.49 Y-57.25 Z3.99
+G1 X-22.61 Y-59.05 Z3.99
+G1 X-22.61 Y-63.25 Z3.99
+G1 X-19.49 Y-65.05 Z3.99
+G1 X-19.49 Y-69.25 Z3.99
+G1 X-22.61 Y-71.05 Z3.99
+G1 X-22.61 Y-72.53 Z3.99
+G1 X-16.02 Y-72.53 Z3.99
+G1 X-16.02 Y-71.05 Z3.99
+G1 X-19.14 Y-69.25 Z3.99
+G1 X-19.14 Y-65.05 Z3.99
+G1 X-16.02 Y-63.25 Z3.99
+G1 X-16.02 Y-59.05 Z3.99
+G1 X-19.14 Y-57.25 Z3.99
+G1 X-19.14 Y-53.05 Z3.99
+G1 X-16.02 Y-51.25 Z3.99
+G1 X-16.02 Y-47.05 Z3.99
+G1 X-19.14 Y-45.25 Z3.99
+G1 X-19.14 Y-41.05 Z3.99
+G1 X-18.02 Y-40.41 Z3.99
+G1 X-13.68 Y-40.41 Z3.99
+G1 X-12.56 Y-41.05 Z3.99
+G1 X-12.56 Y-45.25 Z3.99
+G1 X-15.68 Y-47.05 Z3.99
+G1 X-15.68 Y-51.25 Z3.99
+G1 X-12.56 Y-53.05 Z3.99
+G1 X-12.56 Y-57.25 Z3.99
+G1 X-15.68 Y-59.05 Z3.99
+G1 X-15.68 Y-63.25 Z3.99
+G1 X-12.56 Y-65.05 Z3.99
+G1 X-12.56 Y-69.25 Z3.99
+G1 X-15.68 Y-71.05 Z3.99
+G1 X-15.68 Y-72.53 Z3.99
+G1 X-9.10 Y-72.53 Z3.99
+G1 X-9.10 Y-71.05 Z3.99
+G1 X-12.21 Y-69.25 Z3.99
+G1 X-12.21 Y-65.05 Z3.99
+G1 X-9.10 Y-63.25 Z3.99
+G1 X-9.10 Y-59.05 Z3.99
+G1 X-12.21 Y-57.25 Z3.99
+G1 X-12.21 Y-53.05 Z3.99
+G1 X-9.10 Y-51.25 Z3.99
+G1 X-9.10 Y-47.05 Z3.99
+G1 X-12.21 Y-45.25 Z3.99
+G1 X-12.21 Y-41.05 Z3.99
+G1 X-11.10 Y-40.41 Z3.99
+G1 X-6.75 Y-40.41 Z3.99
+G1 X-5.63 Y-41.05 Z3.99
+G1 X-5.63 Y-45.25 Z3.99
+G1 X-8.75 Y-47.05 Z3.99
+G1 X-8.75 Y-51.25 Z3.99
+G1 X-5.63 Y-53.05 Z3.99
+G1 X-5.63 Y-57.25 Z3.99
+G1 X-8.75 Y-59.05 Z3.99
+G1 X-8.75 Y-63.25 Z3.99
+G1 X-5.63 Y-65.05 Z3.99
+G1 X-5.63 Y-69.25 Z3.99
+G1 X-8.75 Y-71.05 Z3.99
+G1 X-8.75 Y-72.53 Z3.99
+G1 X-2.17 Y-72.53 Z3.99
+G1 X-2.17 Y-71.05 Z3.99
+G1 X-5.28 Y-69.25 Z3.99
+G1 X-5.28 Y-65.05 Z3.99
+G1 X-2.17 Y-63.25 Z3.99
+G1 X-2.17 Y-59.05 Z3.99
+G1 X-5.28 Y-57.25 Z3.99
+G1 X-5.28 Y-53.05 Z3.99
+G1 X-2.17 Y-51.25 Z3.99
+G1 X-2.17 Y-47.05 Z3.99
+G1 X-5.28 Y-45.25 Z3.99
+G1 X-5.28 Y-41.05 Z3.99
+G1 X-4.17 Y-40.41 Z3.99
+G1 X0.18 Y-40.41 Z3.99
+G1 X1.30 Y-41.05 Z3.99
+G1 X1.30 Y-45.25 Z3.99
+G1 X-1.82 Y-47.05 Z3.99
+G1 X-1.82 Y-51.25 Z3.99
+G1 X1.30 Y-53.05 Z3.99
+G1 X1.30 Y-57.25 Z3.99
+G1 X-1.82 Y-59.05 Z3.99
+G1 X-1.82 Y-63.25 Z3.99
+G1 X1.30 Y-65.05 Z3.99
+G1 X1.30 Y-69.25 Z3.99
+G1 X-1.82 Y-71.05 Z3.99
+G1 X-1.82 Y-72.53 Z3.99
+G1 X4.76 Y-72.53 Z3.99
+G1 X4.76 Y-71.05 Z3.99
+G1 X1.64 Y-69.25 Z3.99
+G1 X1.64 Y-65.05 Z3.99
+G1 X4.76 Y-63.25 Z3.99
+G1 X4.76 Y-59.05 Z3.99
+G1 X1.64 Y-57.25 Z3.99
+G1 X1.64 Y-53.05 Z3.99
+G1 X4.76 Y-51.25 Z3.99
+G1 X4.76 Y-47.05 Z3.99
+G1 X1.64 Y-45.25 Z3.99
+G1 X1.64 Y-41.05 Z3.99
+G1 X2.76 Y-40.41 Z3.99
+G1 X7.11 Y-40.41 Z3.99
+G1 X8.22 Y-41.05 Z3.99
+G1 X8.22 Y-45.25 Z3.99
+G1 X5.11 Y-47.05 Z3.99
+G1 X5.11 Y-51.25 Z3.99
+G1 X8.22 Y-53.05 Z3.99
+G1 X8.22 Y-57.25 Z3.99
+G1 X5.11 Y-59.05 Z3.99
+G1 X5.11 Y-63.25 Z3.99
+G1 X8.22 Y-65.05 Z3.99
+G1 X8.22 Y-69.25 Z3.99
+G1 X5.11 Y-71.05 Z3.99
+G1 X5.11 Y-72.53 Z3.99
+G1 X11.69 Y-72.53 Z3.99
+G1 X11.69 Y-71.05 Z3.99
+G1 X8.57 Y-69.25 Z3.99
+G1 X8.57 Y-65.05 Z3.99
+G1 X11.69 Y-63.25 Z3.99
+G1 X11.69 Y-59.05 Z3.99
+G1 X8.57 Y-57.25 Z3.99
+G1 X8.57 Y-53.05 Z3.99
+G1 X11.69 Y-51.25 Z3.99
+G1 X11.69 Y-47.05 Z3.99
+G1 X8.57 Y-45.25 Z3.99
+G1 X8.57 Y-41.05 Z3.99
+G1 X9.69 Y-40.41 Z3.99
+G1 X14.04 Y-40.41 Z3.99
+G1 X15.15 Y-41.05 Z3.99
+G1 X15.15 Y-45.25 Z3.99
+G1 X12.03 Y-47.05 Z3.99
+G1 X12.03 Y-51.25 Z3.99
+G1 X15.15 Y-53.05 Z3.99
+G1 X15.15 Y-57.25 Z3.99
+G1 X12.03 Y-59.05 Z3.99
+G1 X12.03 Y-63.25 Z3.99
+G1 X15.15 Y-65.05 Z3.99
+G1 X15.15 Y-69.25 Z3.99
+G1 X12.03 Y-71.05 Z3.99
+G1 X12.03 Y-72.53 Z3.99
+G1 X18.62 Y-72.53 Z3.99
+G1 X18.62 Y-71.05 Z3.99
+G1 X15.50 Y-69.25 Z3.99
+G1 X15.50 Y-65.05 Z3.99
+G1 X18.62 Y-63.25 Z3.99
+G1 X18.62 Y-59.05 Z3.99
+G1 X15.50 Y-57.25 Z3.99
+G1 X15.50 Y-53.05 Z3.99
+G1 X18.62 Y-51.25 Z3.99
+G1 X18.62 Y-47.05 Z3.99
+G1 X15.50 Y-45.25 Z3.99
+G1 X15.50 Y-41.05 Z3.99
+G1 X16.62 Y-40.41 Z3.99
+G1 X20.97 Y-40.41 Z3.99
+G1 X22.08 Y-41.05 Z3.99
+G1 X22.08 Y-45.25 Z3.99
+G1 X18.96 Y-47.05 Z3.99
+G1 X18.96 Y-51.25 Z3.99
+G1 X22.08 Y-53.05 Z3.99
+G1 X22.08 Y-57.25 Z3.99
+G1 X18.96 Y-59.05 Z3.99
+G1 X18.96 Y-63.25 Z3.99
+G1 X22.08 Y-65.05 Z3.99
+G1 X22.08 Y-69.25 Z3.99
+G1 X18.96 Y-71.05 Z3.99
+G1 X18.96 Y-72.53 Z3.99
+G1 X25.54 Y-72.53 Z3.99
+G1 X25.54 Y-71.05 Z3.99
+G1 X22.43 Y-69.25 Z3.99
+G1 X22.43 Y-65.05 Z3.99
+G1 X25.54 Y-63.25 Z3.99
+G1 X25.54 Y-59.05 Z3.99
+G1 X22.43 Y-57.25 Z3.99
+G1 X22.43 Y-53.05 Z3.99
+G1 X25.54 Y-51.25 Z3.99
+G1 X25.54 Y-47.05 Z3.99
+G1 X22.43 Y-45.25 Z3.99
+G1 X22.43 Y-41.05 Z3.99
+G1 X23.54 Y-40.41 Z3.99
+G1 X27.89 Y-40.41 Z3.99
+G1 X29.01 Y-41.05 Z3.99
+G1 X29.01 Y-45.25 Z3.99
+G1 X25.89 Y-47.05 Z3.99
+G1 X25.89 Y-51.25 Z3.99
+G1 X29.01 Y-53.05 Z3.99
+G1 X29.01 Y-57.25 Z3.99
+G1 X25.89 Y-59.05 Z3.99
+G1 X25.89 Y-63.25 Z3.99
+G1 X29.01 Y-65.05 Z3.99
+G1 X29.01 Y-69.25 Z3.99
+G1 X25.89 Y-71.05 Z3.99
+G1 X25.89 Y-72.53 Z3.99
+G1 X32.47 Y-72.53 Z3.99
+G1 X32.47 Y-71.05 Z3.99
+G1 X29.36 Y-69.25 Z3.99
+G1 X29.36 Y-65.05 Z3.99
+G1 X32.47 Y-63.25 Z3.99
+G1 X32.47 Y-59.05 Z3.99
+G1 X29.36 Y-57.25 Z3.99
+G1 X29.36 Y-53.05 Z3.99
+G1 X32.47 Y-51.25 Z3.99
+G1 X32.47 Y-47.05 Z3.99
+G1 X29.36 Y-45.25 Z3.99
+G1 X29.36 Y-41.05 Z3.99
+G1 X30.47 Y-40.41 Z3.99
+G1 X34.82 Y-40.41 Z3.99
+G1 X35.94 Y-41.05 Z3.99
+G1 X35.94 Y-45.25 Z3.99
+G1 X32.82 Y-47.05 Z3.99
+G1 X32.82 Y-51.25 Z3.99
+G1 X35.94 Y-53.05 Z3.99
+G1 X35.94 Y-57.25 Z3.99
+G1 X32.82 Y-59.05 Z3.99
+G1 X32.82 Y-63.25 Z3.99
+G1 X35.94 Y-65.05 Z3.99
+G1 X35.94 Y-69.25 Z3.99
+G1 X32.82 Y-71.05 Z3.99
+G1 X32.82 Y-72.53 Z3.99
+G1 X39.10 Y-70.88 Z3.99
+G1 X36.28 Y-69.25 Z3.99
+G1 X36.28 Y-65.05 Z3.99
+G1 X39.10 Y-63.42 Z3.99
+G1 X39.10 Y-58.88 Z3.99
+G1 X36.28 Y-57.25 Z3.99
+G1 X36.28 Y-53.05 Z3.99
+G1 X39.10 Y-51.42 Z3.99
+G1 X39.10 Y-46.88 Z3.99
+G1 X36.28 Y-45.25 Z3.99
+G1 X36.28 Y-41.05 Z3.99
+G1 X37.40 Y-40.41 Z3.99
+
+T1
+G1 X15.13 Y-71.98 Z4.99
+G1 X38.55 Y-71.98 Z4.99
+G1 X38.55 Y-48.18 Z4.99
+G1 X38.55 Y-40.96 Z4.99
+G1 X-9.05 Y-40.96 Z4.99
+G1 X-32.47 Y-40.96 Z4.99
+G1 X-32.47 Y-64.76 Z4.99
+G1 X-32.47 Y-71.98 Z4.99
+G1 X15.13 Y-71.98 Z4.99
+G1 X15.13 Y-71.98 Z4.99
+G1 X-29.88 Y-71.98 Z4.99
+G1 X-29.88 Y-71.05 Z4.99
+G1 X-32.47 Y-69.56 Z4.99
+G1 X-32.47 Y-64.75 Z4.99
+G1 X-29.88 Y-63.25 Z4.99
+G1 X-29.88 Y-59.05 Z4.99
+G1 X-32.47 Y-57.56 Z4.99
+G1 X-32.47 Y-52.75 Z4.99
+G1 X-29.88 Y-51.25 Z4.99
+G1 X-29.88 Y-47.05 Z4.99
+G1 X-32.47 Y-45.56 Z4.99
+G1 X-26.57 Y-40.96 Z4.99
+G1 X-26.42 Y-41.05 Z4.99
+G1 X-26.42 Y-45.25 Z4.99
+G1 X-29.53 Y-47.05 Z4.99
+G1 X-29.53 Y-51.25 Z4.99
+G1 X-26.42 Y-53.05 Z4.99
+G1 X-26.42 Y-57.25 Z4.99
+G1 X-29.53 Y-59.05 Z4.99
+G1 X-29.53 Y-63.25 Z4.99
+G1 X-26.42 Y-65.05 Z4.99
+G1 X-26.42 Y-69.25 Z4.99
+G1 X-29.53 Y-71.05 Z4.99
+G1 X-29.53 Y-71.98 Z4.99
+G1 X-22.95 Y-71.98 Z4.99
+G1 X-22.95 Y-71.05 Z4.99
+G1 X-26.07 Y-69.25 Z4.99
+G1 X-26.07 Y-65.05 Z4.99
+G1 X-22.95 Y-63.25 Z4.99
+G1 X-22.95 Y-59.05 Z4.99
+G1 X-26.07 Y-57.25 Z4.99
+G1 X-26.07 Y-53.05 Z4.99
+G1 X-22.95 Y-51.25 Z4.99
+G1 X-22.95 Y-47.05 Z4.99
+G1 X-26.07 Y-45.25 Z4.99
+G1 X-26.07 Y-41.05 Z4.99
+G1 X-25.91 Y-40.96 Z4.99
+G1 X-19.65 Y-40.96 Z4.99
+G1 X-19.49 Y-41.05 Z4.99
+G1 X-19.49 Y-45.25 Z4.99
+G1 X-22.61 Y-47.05 Z4.99
+G1 X-22.61 Y-51.25 Z4.99
+G1 X-19.49 Y-53.05 Z4.99
+G1 X-19.49 Y-57.25 Z4.99
+G1 X-22.61 Y-59.05 Z4.99
+G1 X-22.61 Y-63.25 Z4.99
+G1 X-19.49 Y-65.05 Z4.99
+G1 X-19.49 Y-69.25 Z4.99
+G1 X-22.61 Y-71.05 Z4.99
+G1 X-22.61 Y-71.98 Z4.99
+G1 X-16.02 Y-71.98 Z4.99
+G1 X-16.02 Y-71.05 Z4.99
+G1 X-19.14 Y-69.25 Z4.99
+G1 X-19.14 Y-65.05 Z4.99
+G1 X-16.02 Y-63.25 Z4.99
+G1 X-16.02 Y-59.05 Z4.99
+G1 X-19.14 Y-57.25 Z4.99
+G1 X-19.14 Y-53.05 Z4.99
+G1 X-16.02 Y-51.25 Z4.99
+G1 X-16.02 Y-47.05 Z4.99
+G1 X-19.14 Y-45.25 Z4.99
+G1 X-19.14 Y-41.05 Z4.99
+G1 X-18.98 Y-40.96 Z4.99
+G1 X-12.72 Y-40.96 Z4.99
+G1 X-12.56 Y-41.05 Z4.99
+G1 X-12.56 Y-45.25 Z4.99
+G1 X-15.68 Y-47.05 Z4.99
+G1 X-15.68 Y-51.25 Z4.99
+G1 X-12.56 Y-53.05 Z4.99
+G1 X-12.56 Y-57.25 Z4.99
+G1 X-15.68 Y-59.05 Z4.99
+G1 X-15.68 Y-63.25 Z4.99
+G1 X-12.56 Y-65.05 Z4.99
+G1 X-12.56 Y-69.25 Z4.99
+G1 X-15.68 Y-71.05 Z4.99
+G1 X-15.68 Y-71.98 Z4.99
+G1 X-9.10 Y-71.98 Z4.99
+G1 X-9.10 Y-71.05 Z4.99
+G1 X-12.21 Y-69.25 Z4.99
+G1 X-12.21 Y-65.05 Z4.99
+G1 X-9.10 Y-63.25 Z4.99
+G1 X-9.10 Y-59.05 Z4.99
+G1 X-12.21 Y-57.25 Z4.99
+G1 X-12.21 Y-53.05 Z4.99
+G1 X-9.10 Y-51.25 Z4.99
+G1 X-9.10 Y-47.05 Z4.99
+G1 X-12.21 Y-45.25 Z4.99
+G1 X-12.21 Y-41.05 Z4.99
+G1 X-12.06 Y-40.96 Z4.99
+G1 X-5.79 Y-40.96 Z4.99
+G1 X-5.63 Y-41.05 Z4.99
+G1 X-5.63 Y-45.25 Z4.99
+G1 X-8.75 Y-47.05 Z4.99
+G1 X-8.75 Y-51.25 Z4.99
+G1 X-5.63 Y-53.05 Z4.99
+G1 X-5.63 Y-57.25 Z4.99
+G1 X-8.75 Y-59.05 Z4.99
+G1 X-8.75 Y-63.25 Z4.99
+G1 X-5.63 Y-65.05 Z4.99
+G1 X-5.63 Y-69.25 Z4.99
+G1 X-8.75 Y-71.05 Z4.99
+G1 X-8.75 Y-71.98 Z4.99
+G1 X-2.17 Y-71.98 Z4.99
+G1 X-2.17 Y-71.05 Z4.99
+G1 X-5.28 Y-69.25 Z4.99
+G1 X-5.28 Y-65.05 Z4.99
+G1 X-2.17 Y-63.25 Z4.99
+G1 X-2.17 Y-59.05 Z4.99
+G1 X-5.28 Y-57.25 Z4.99
+G1 X-5.28 Y-53.05 Z4.99
+G1 X-2.17 Y-51.25 Z4.99
+G1 X-2.17 Y-47.05 Z4.99
+G1 X-5.28 Y-45.25 Z4.99
+G1 X-5.28 Y-41.05 Z4.99
+G1 X-5.13 Y-40.96 Z4.99
+G1 X1.14 Y-40.96 Z4.99
+G1 X1.30 Y-41.05 Z4.99
+G1 X1.30 Y-45.25 Z4.99
+G1 X-1.82 Y-47.05 Z4.99
+G1 X-1.82 Y-51.25 Z4.99
+G1 X1.30 Y-53.05 Z4.99
+G1 X1.30 Y-57.25 Z4.99
+G1 X-1.82 Y-59.05 Z4.99
+G1 X-1.82 Y-63.25 Z4.99
+G1 X1.30 Y-65.05 Z4.99
+G1 X1.30 Y-69.25 Z4.99
+G1 X-1.82 Y-71.05 Z4.99
+G1 X-1.82 Y-71.98 Z4.99
+G1 X4.76 Y-71.98 Z4.99
+G1 X4.76 Y-71.05 Z4.99
+G1 X1.64 Y-69.25 Z4.99
+G1 X1.64 Y-65.05 Z4.99
+G1 X4.76 Y-63.25 Z4.99
+G1 X4.76 Y-59.05 Z4.99
+G1 X1.64 Y-57.25 Z4.99
+G1 X1.64 Y-53.05 Z4.99
+G1 X4.76 Y-51.25 Z4.99
+G1 X4.76 Y-47.05 Z4.99
+G1 X1.64 Y-45.25 Z4.99
+G1 X1.64 Y-41.05 Z4.99
+G1 X1.80 Y-40.96 Z4.99
+G1 X8.07 Y-40.96 Z4.99
+G1 X8.22 Y-41.05 Z4.99
+G1 X8.22 Y-45.25 Z4.99
+G1 X5.11 Y-47.05 Z4.99
+G1 X5.11 Y-51.25 Z4.99
+G1 X8.22 Y-53.05 Z4.99
+G1 X8.22 Y-57.25 Z4.99
+G1 X5.11 Y-59.05 Z4.99
+G1 X5.11 Y-63.25 Z4.99
+G1 X8.22 Y-65.05 Z4.99
+G1 X8.22 Y-69.25 Z4.99
+G1 X5.11 Y-71.05 Z4.99
+G1 X5.11 Y-71.98 Z4.99
+G1 X11.69 Y-71.98 Z4.99
+G1 X11.69 Y-71.05 Z4.99
+G1 X8.57 Y-69.25 Z4.99
+G1 X8.57 Y-65.05 Z4.99
+G1 X11.69 Y-63.25 Z4.99
+G1 X11.69 Y-59.05 Z4.99
+G1 X8.57 Y-57.25 Z4.99
+G1 X8.57 Y-53.05 Z4.99
+G1 X11.69 Y-51.25 Z4.99
+G1 X11.69 Y-47.05 Z4.99
+G1 X8.57 Y-45.25 Z4.99
+G1 X8.57 Y-41.05 Z4.99
+G1 X8.73 Y-40.96 Z4.99
+G1 X15.00 Y-40.96 Z4.99
+G1 X15.15 Y-41.05 Z4.99
+G1 X15.15 Y-45.25 Z4.99
+G1 X12.03 Y-47.05 Z4.99
+G1 X12.03 Y-51.25 Z4.99
+G1 X15.15 Y-53.05 Z4.99
+G1 X15.15 Y-57.25 Z4.99
+G1 X12.03 Y-59.05 Z4.99
+G1 X12.03 Y-63.25 Z4.99
+G1 X15.15 Y-65.05 Z4.99
+G1 X15.15 Y-69.25 Z4.99
+G1 X12.03 Y-71.05 Z4.99
+G1 X12.03 Y-71.98 Z4.99
+G1 X18.62 Y-71.98 Z4.99
+G1 X18.62 Y-71.05 Z4.99
+G1 X15.50 Y-69.25 Z4.99
+G1 X15.50 Y-65.05 Z4.99
+G1 X18.62 Y-63.25 Z4.99
+G1 X18.62 Y-59.05 Z4.99
+G1 X15.50 Y-57.25 Z4.99
+G1 X15.50 Y-53.05 Z4.99
+G1 X18.62 Y-51.25 Z4.99
+G1 X18.62 Y-47.05 Z4.99
+G1 X15.50 Y-45.25 Z4.99
+G1 X15.50 Y-41.05 Z4.99
+G1 X15.66 Y-40.96 Z4.99
+G1 X21.92 Y-40.96 Z4.99
+G1 X22.08 Y-41.05 Z4.99
+G1 X22.08 Y-45.25 Z4.99
+G1 X18.96 Y-47.05 Z4.99
+G1 X18.96 Y-51.25 Z4.99
+G1 X22.08 Y-53.05 Z4.99
+G1 X22.08 Y-57.25 Z4.99
+G1 X18.96 Y-59.05 Z4.99
+G1 X18.96 Y-63.25 Z4.99
+G1 X22.08 Y-65.05 Z4.99
+G1 X22.08 Y-69.25 Z4.99
+G1 X18.96 Y-71.05 Z4.99
+G1 X18.96 Y-71.98 Z4.99
+G1 X25.54 Y-71.98 Z4.99
+G1 X25.54 Y-71.05 Z4.99
+G1 X22.43 Y-69.25 Z4.99
+G1 X22.43 Y-65.05 Z4.99
+G1 X25.54 Y-63.25 Z4.99
+G1 X25.54 Y-59.05 Z4.99
+G1 X22.43 Y-57.25 Z4.99
+G1 X22.43 Y-53.05 Z4.99
+G1 X25.54 Y-51.25 Z4.99
+G1 X25.54 Y-47.05 Z4.99
+G1 X22.43 Y-45.25 Z4.99
+G1 X22.43 Y-41.05 Z4.99
+G1 X22.59 Y-40.96 Z4.99
+G1 X28.85 Y-40.96 Z4.99
+G1 X29.01 Y-41.05 Z4.99
+G1 X29.01 Y-45.25 Z4.99
+G1 X25.89 Y-47.05 Z4.99
+G1 X25.89 Y-51.25 Z4.99
+G1 X29.01 Y-53.05 Z4.99
+G1 X29.01 Y-57.25 Z4.99
+G1 X25.89 Y-59.05 Z4.99
+G1 X25.89 Y-63.25 Z4.99
+G1 X29.01 Y-65.05 Z4.99
+G1 X29.01 Y-69.25 Z4.99
+G1 X25.89 Y-71.05 Z4.99
+G1 X25.89 Y-71.98 Z4.99
+G1 X32.47 Y-71.98 Z4.99
+G1 X32.47 Y-71.05 Z4.99
+G1 X29.36 Y-69.25 Z4.99
+G1 X29.36 Y-65.05 Z4.99
+G1 X32.47 Y-63.25 Z4.99
+G1 X32.47 Y-59.05 Z4.99
+G1 X29.36 Y-57.25 Z4.99
+G1 X29.36 Y-53.05 Z4.99
+G1 X32.47 Y-51.25 Z4.99
+G1 X32.47 Y-47.05 Z4.99
+G1 X29.36 Y-45.25 Z4.99
+G1 X29.36 Y-41.05 Z4.99
+G1 X29.51 Y-40.96 Z4.99
+G1 X35.78 Y-40.96 Z4.99
+G1 X35.94 Y-41.05 Z4.99
+G1 X35.94 Y-45.25 Z4.99
+G1 X32.82 Y-47.05 Z4.99
+G1 X32.82 Y-51.25 Z4.99
+G1 X35.94 Y-53.05 Z4.99
+G1 X35.94 Y-57.25 Z4.99
+G1 X32.82 Y-59.05 Z4.99
+G1 X32.82 Y-63.25 Z4.99
+G1 X35.94 Y-65.05 Z4.99
+G1 X35.94 Y-69.25 Z4.99
+G1 X32.82 Y-71.05 Z4.99
+G1 X32.82 Y-71.98 Z4.99
+G1 X38.55 Y-70.56 Z4.99
+G1 X36.28 Y-69.25 Z4.99
+G1 X36.28 Y-65.05 Z4.99
+G1 X38.55 Y-63.74 Z4.99
+G1 X38.55 Y-58.56 Z4.99
+G1 X36.28 Y-57.25 Z4.99
+G1 X36.28 Y-53.05 Z4.99
+G1 X38.55 Y-51.74 Z4.99
+G1 X38.55 Y-46.56 Z4.99
+G1 X36.28 Y-45.25 Z4.99
+G1 X36.28 Y-41.05 Z4.99
+G1 X36.44 Y-40.96 Z4.99
+
+T1
+G1 X11.68 Y-71.43 Z5.99
+G1 X38.00 Y-71.43 Z5.99
+G1 X38.00 Y-49.63 Z5.99
+G1 X38.00 Y-41.51 Z5.99
+G1 X-5.60 Y-41.51 Z5.99
+G1 X-31.92 Y-41.51 Z5.99
+G1 X-31.92 Y-63.31 Z5.99
+G1 X-31.92 Y-71.43 Z5.99
+G1 X11.68 Y-71.43 Z5.99
+G1 X11.68 Y-71.43 Z5.99
+G1 X-29.88 Y-71.43 Z5.99
+G1 X-29.88 Y-71.05 Z5.99
+G1 X-31.92 Y-69.88 Z5.99
+G1 X-31.92 Y-64.43 Z5.99
+G1 X-29.88 Y-63.25 Z5.99
+G1 X-29.88 Y-59.05 Z5.99
+G1 X-31.92 Y-57.88 Z5.99
+G1 X-31.92 Y-52.43 Z5.99
+G1 X-29.88 Y-51.25 Z5.99
+G1 X-29.88 Y-47.05 Z5.99
+G1 X-31.92 Y-45.88 Z5.99
+G1 X-26.42 Y-41.51 Z5.99
+G1 X-26.42 Y-45.25 Z5.99
+G1 X-29.53 Y-47.05 Z5.99
+G1 X-29.53 Y-51.25 Z5.99
+G1 X-26.42 Y-53.05 Z5.99
+G1 X-26.42 Y-57.25 Z5.99
+G1 X-29.53 Y-59.05 Z5.99
+G1 X-29.53 Y-63.25 Z5.99
+G1 X-26.42 Y-65.05 Z5.99
+G1 X-26.42 Y-69.25 Z5.99
+G1 X-29.53 Y-71.05 Z5.99
+G1 X-29.53 Y-71.43 Z5.99
+G1 X-22.95 Y-71.43 Z5.99
+G1 X-22.95 Y-71.05 Z5.99
+G1 X-26.07 Y-69.25 Z5.99
+G1 X-26.07 Y-65.05 Z5.99
+G1 X-22.95 Y-63.25 Z5.99
+G1 X-22.95 Y-59.05 Z5.99
+G1 X-26.07 Y-57.25 Z5.99
+G1 X-26.07 Y-53.05 Z5.99
+G1 X-22.95 Y-51.25 Z5.99
+G1 X-22.95 Y-47.05 Z5.99
+G1 X-26.07 Y-45.25 Z5.99
+G1 X-26.07 Y-41.51 Z5.99
+G1 X-19.49 Y-41.51 Z5.99
+G1 X-19.49 Y-45.25 Z5.99
+G1 X-22.61 Y-47.05 Z5.99
+G1 X-22.61 Y-51.25 Z5.99
+G1 X-19.49 Y-53.05 Z5.99
+G1 X-19.49 Y-57.25 Z5.99
+G1 X-22.61 Y-59.05 Z5.99
+G1 X-22.61 Y-63.25 Z5.99
+G1 X-19.49 Y-65.05 Z5.99
+G1 X-19.49 Y-69.25 Z5.99
+G1 X-22.61 Y-71.05 Z5.99
+G1 X-22.61 Y-71.43 Z5.99
+G1 X-16.02 Y-71.43 Z5.99
+G1 X-16.02 Y-71.05 Z5.99
+G1 X-19.14 Y-69.25 Z5.99
+G1 X-19.14 Y-65.05 Z5.99
+G1 X-16.02 Y-63.25 Z5.99
+G1 X-16.02 Y-59.05 Z5.99
+G1 X-19.14 Y-57.25 Z5.99
+G1 X-19.14 Y-53.05 Z5.99
+G1 X-16.02 Y-51.25 Z5.99
+G1 X-16.02 Y-47.05 Z5.99
+G1 X-19.14 Y-45.25 Z5.99
+G1 X-19.14 Y-41.51 Z5.99
+G1 X-12.56 Y-41.51 Z5.99
+G1 X-12.56 Y-45.25 Z5.99
+G1 X-15.68 Y-47.05 Z5.99
+G1 X-15.68 Y-51.25 Z5.99
+G1 X-12.56 Y-53.05 Z5.99
+G1 X-12.56 Y-57.25 Z5.99
+G1 X-15.68 Y-59.05 Z5.99
+G1 X-15.68 Y-63.25 Z5.99
+G1 X-12.56 Y-65.05 Z5.99
+G1 X-12.56 Y-69.25 Z5.99
+G1 X-15.68 Y-71.05 Z5.99
+G1 X-15.68 Y-71.43 Z5.99
+G1 X-9.10 Y-71.43 Z5.99
+G1 X-9.10 Y-71.05 Z5.99
+G1 X-12.21 Y-69.25 Z5.99
+G1 X-12.21 Y-65.05 Z5.99
+G1 X-9.10 Y-63.25 Z5.99
+G1 X-9.10 Y-59.05 Z5.99
+G1 X-12.21 Y-57.25 Z5.99
+G1 X-12.21 Y-53.05 Z5.99
+G1 X-9.10 Y-51.25 Z5.99
+G1 X-9.10 Y-47.05 Z5.99
+G1 X-12.21 Y-45.25 Z5.99
+G1 X-12.21 Y-41.51 Z5.99
+G1 X-5.63 Y-41.51 Z5.99
+G1 X-5.63 Y-45.25 Z5.99
+G1 X-8.75 Y-47.05 Z5.99
+G1 X-8.75 Y-51.25 Z5.99
+G1 X-5.63 Y-53.05 Z5.99
+G1 X-5.63 Y-57.25 Z5.99
+G1 X-8.75 Y-59.05 Z5.99
+G1 X-8.75 Y-63.25 Z5.99
+G1 X-5.63 Y-65.05 Z5.99
+G1 X-5.63 Y-69.25 Z5.99
+G1 X-8.75 Y-71.05 Z5.99
+G1 X-8.75 Y-71.43 Z5.99
+G1 X-2.17 Y-71.43 Z5.99
+G1 X-2.17 Y-71.05 Z5.99
+G1 X-5.28 Y-69.25 Z5.99
+G1 X-5.28 Y-65.05 Z5.99
+G1 X-2.17 Y-63.25 Z5.99
+G1 X-2.17 Y-59.05 Z5.99
+G1 X-5.28 Y-57.25 Z5.99
+G1 X-5.28 Y-53.05 Z5.99
+G1 X-2.17 Y-51.25 Z5.99
+G1 X-2.17 Y-47.05 Z5.99
+G1 X-5.28 Y-45.25 Z5.99
+G1 X-5.28 Y-41.51 Z5.99
+G1 X1.30 Y-41.51 Z5.99
+G1 X1.30 Y-45.25 Z5.99
+G1 X-1.82 Y-47.05 Z5.99
+G1 X-1.82 Y-51.25 Z5.99
+G1 X1.30 Y-53.05 Z5.99
+G1 X1.30 Y-57.25 Z5.99
+G1 X-1.82 Y-59.05 Z5.99
+G1 X-1.82 Y-63.25 Z5.99
+G1 X1.30 Y-65.05 Z5.99
+G1 X1.30 Y-69.25 Z5.99
+G1 X-1.82 Y-71.05 Z5.99
+G1 X-1.82 Y-71.43 Z5.99
+G1 X4.76 Y-71.43 Z5.99
+G1 X4.76 Y-71.05 Z5.99
+G1 X1.64 Y-69.25 Z5.99
+G1 X1.64 Y-65.05 Z5.99
+G1 X4.76 Y-63.25 Z5.99
+G1 X4.76 Y-59.05 Z5.99
+G1 X1.64 Y-57.25 Z5.99
+G1 X1.64 Y-53.05 Z5.99
+G1 X4.76 Y-51.25 Z5.99
+G1 X4.76 Y-47.05 Z5.99
+G1 X1.64 Y-45.25 Z5.99
+G1 X1.64 Y-41.51 Z5.99
+G1 X8.22 Y-41.51 Z5.99
+G1 X8.22 Y-45.25 Z5.99
+G1 X5.11 Y-47.05 Z5.99
+G1 X5.11 Y-51.25 Z5.99
+G1 X8.22 Y-53.05 Z5.99
+G1 X8.22 Y-57.25 Z5.99
+G1 X5.11 Y-59.05 Z5.99
+G1 X5.11 Y-63.25 Z5.99
+G1 X8.22 Y-65.05 Z5.99
+G1 X8.22 Y-69.25 Z5.99
+G1 X5.11 Y-71.05 Z5.99
+G1 X5.11 Y-71.43 Z5.99
+G1 X11.69 Y-71.43 Z5.99
+G1 X11.69 Y-71.05 Z5.99
+G1 X8.57 Y-69.25 Z5.99
+G1 X8.57 Y-65.05 Z5.99
+G1 X11.69 Y-63.25 Z5.99
+G1 X11.69 Y-59.05 Z5.99
+G1 X8.57 Y-57.25 Z5.99
+G1 X8.57 Y-53.05 Z5.99
+G1 X11.69 Y-51.25 Z5.99
+G1 X11.69 Y-47.05 Z5.99
+G1 X8.57 Y-45.25 Z5.99
+G1 X8.57 Y-41.51 Z5.99
+G1 X15.15 Y-41.51 Z5.99
+G1 X15.15 Y-45.25 Z5.99
+G1 X12.03 Y-47.05 Z5.99
+G1 X12.03 Y-51.25 Z5.99
+G1 X15.15 Y-53.05 Z5.99
+G1 X15.15 Y-57.25 Z5.99
+G1 X12.03 Y-59.05 Z5.99
+G1 X12.03 Y-63.25 Z5.99
+G1 X15.15 Y-65.05 Z5.99
+G1 X15.15 Y-69.25 Z5.99
+G1 X12.03 Y-71.05 Z5.99
+G1 X12.03 Y-71.43 Z5.99
+G1 X18.62 Y-71.43 Z5.99
+G1 X18.62 Y-71.05 Z5.99
+G1 X15.50 Y-69.25 Z5.99
+G1 X15.50 Y-65.05 Z5.99
+G1 X18.62 Y-63.25 Z5.99
+G1 X18.62 Y-59.05 Z5.99
+G1 X15.50 Y-57.25 Z5.99
+G1 X15.50 Y-53.05 Z5.99
+G1 X18.62 Y-51.25 Z5.99
+G1 X18.62 Y-47.05 Z5.99
+G1 X15.50 Y-45.25 Z5.99
+G1 X15.50 Y-41.51 Z5.99
+G1 X22.08 Y-41.51 Z5.99
+G1 X22.08 Y-45.25 Z5.99
+G1 X18.96 Y-47.05 Z5.99
+G1 X18.96 Y-51.25 Z5.99
+G1 X22.08 Y-53.05 Z5.99
+G1 X22.08 Y-57.25 Z5.99
+G1 X18.96 Y-59.05 Z5.99
+G1 X18.96 Y-63.25 Z5.99
+G1 X22.08 Y-65.05 Z5.99
+G1 X22.08 Y-69.25 Z5.99
+G1 X18.96 Y-71.05 Z5.99
+G1 X18.96 Y-71.43 Z5.99
+G1 X25.54 Y-71.43 Z5.99
+G1 X25.54 Y-71.05 Z5.99
+G1 X22.43 Y-69.25 Z5.99
+G1 X22.43 Y-65.05 Z5.99
+G1 X25.54 Y-63.25 Z5.99
+G1 X25.54 Y-59.05 Z5.99
+G1 X22.43 Y-57.25 Z5.99
+G1 X22.43 Y-53.05 Z5.99
+G1 X25.54 Y-51.25 Z5.99
+G1 X25.54 Y-47.05 Z5.99
+G1 X22.43 Y-45.25 Z5.99
+G1 X22.43 Y-41.51 Z5.99
+G1 X29.01 Y-41.51 Z5.99
+G1 X29.01 Y-45.25 Z5.99
+G1 X25.89 Y-47.05 Z5.99
+G1 X25.89 Y-51.25 Z5.99
+G1 X29.01 Y-53.05 Z5.99
+G1 X29.01 Y-57.25 Z5.99
+G1 X25.89 Y-59.05 Z5.99
+G1 X25.89 Y-63.25 Z5.99
+G1 X29.01 Y-65.05 Z5.99
+G1 X29.01 Y-69.25 Z5.99
+G1 X25.89 Y-71.05 Z5.99
+G1 X25.89 Y-71.43 Z5.99
+G1 X32.47 Y-71.43 Z5.99
+G1 X32.47 Y-71.05 Z5.99
+G1 X29.36 Y-69.25 Z5.99
+G1 X29.36 Y-65.05 Z5.99
+G1 X32.47 Y-63.25 Z5.99
+G1 X32.47 Y-59.05 Z5.99
+G1 X29.36 Y-57.25 Z5.99
+G1 X29.36 Y-53.05 Z5.99
+G1 X32.47 Y-51.25 Z5.99
+G1 X32.47 Y-47.05 Z5.99
+G1 X29.36 Y-45.25 Z5.99
+G1 X29.36 Y-41.51 Z5.99
+G1 X35.94 Y-41.51 Z5.99
+G1 X35.94 Y-45.25 Z5.99
+G1 X32.82 Y-47.05 Z5.99
+G1 X32.82 Y-51.25 Z5.99
+G1 X35.94 Y-53.05 Z5.99
+G1 X35.94 Y-57.25 Z5.99
+G1 X32.82 Y-59.05 Z5.99
+G1 X32.82 Y-63.25 Z5.99
+G1 X35.94 Y-65.05 Z5.99
+G1 X35.94 Y-69.25 Z5.99
+G1 X32.82 Y-71.05 Z5.99
+G1 X32.82 Y-71.43 Z5.99
+G1 X38.00 Y-70.24 Z5.99
+G1 X36.28 Y-69.25 Z5.99
+G1 X36.28 Y-65.05 Z5.99
+G1 X38.00 Y-64.06 Z5.99
+G1 X38.00 Y-58.24 Z5.99
+G1 X36.28 Y-57.25 Z5.99
+G1 X36.28 Y-53.05 Z5.99
+G1 X38.00 Y-52.06 Z5.99
+G1 X38.00 Y-46.24 Z5.99
+G1 X36.28 Y-45.25 Z5.99
+G1 X36.28 Y-41.51 Z5.99
+
+T1
+G1 X8.24 Y-70.87 Z6.99
+G1 X37.44 Y-70.87 Z6.99
+G1 X37.44 Y-51.07 Z6.99
+G1 X37.44 Y-42.07 Z6.99
+G1 X-2.16 Y-42.07 Z6.99
+G1 X-31.36 Y-42.07 Z6.99
+G1 X-31.36 Y-61.87 Z6.99
+G1 X-31.36 Y-70.87 Z6.99
+G1 X8.24 Y-70.87 Z6.99
+G1 X8.24 Y-70.87 Z6.99
+G1 X-30.19 Y-70.87 Z6.99
+G1 X-31.36 Y-70.20 Z6.99
+G1 X-31.36 Y-64.11 Z6.99
+G1 X-29.88 Y-63.25 Z6.99
+G1 X-29.88 Y-59.05 Z6.99
+G1 X-31.36 Y-58.20 Z6.99
+G1 X-31.36 Y-52.11 Z6.99
+G1 X-29.88 Y-51.25 Z6.99
+G1 X-29.88 Y-47.05 Z6.99
+G1 X-31.36 Y-46.20 Z6.99
+G1 X-26.42 Y-42.07 Z6.99
+G1 X-26.42 Y-45.25 Z6.99
+G1 X-29.53 Y-47.05 Z6.99
+G1 X-29.53 Y-51.25 Z6.99
+G1 X-26.42 Y-53.05 Z6.99
+G1 X-26.42 Y-57.25 Z6.99
+G1 X-29.53 Y-59.05 Z6.99
+G1 X-29.53 Y-63.25 Z6.99
+G1 X-26.42 Y-65.05 Z6.99
+G1 X-26.42 Y-69.25 Z6.99
+G1 X-29.22 Y-70.87 Z6.99
+G1 X-23.26 Y-70.87 Z6.99
+G1 X-26.07 Y-69.25 Z6.99
+G1 X-26.07 Y-65.05 Z6.99
+G1 X-22.95 Y-63.25 Z6.99
+G1 X-22.95 Y-59.05 Z6.99
+G1 X-26.07 Y-57.25 Z6.99
+G1 X-26.07 Y-53.05 Z6.99
+G1 X-22.95 Y-51.25 Z6.99
+G1 X-22.95 Y-47.05 Z6.99
+G1 X-26.07 Y-45.25 Z6.99
+G1 X-26.07 Y-42.07 Z6.99
+G1 X-19.49 Y-42.07 Z6.99
+G1 X-19.49 Y-45.25 Z6.99
+G1 X-22.61 Y-47.05 Z6.99
+G1 X-22.61 Y-51.25 Z6.99
+G1 X-19.49 Y-53.05 Z6.99
+G1 X-19.49 Y-57.25 Z6.99
+G1 X-22.61 Y-59.05 Z6.99
+G1 X-22.61 Y-63.25 Z6.99
+G1 X-19.49 Y-65.05 Z6.99
+G1 X-19.49 Y-69.25 Z6.99
+G1 X-22.29 Y-70.87 Z6.99
+G1 X-16.34 Y-70.87 Z6.99
+G1 X-19.14 Y-69.25 Z6.99
+G1 X-19.14 Y-65.05 Z6.99
+G1 X-16.02 Y-63.25 Z6.99
+G1 X-16.02 Y-59.05 Z6.99
+G1 X-19.14 Y-57.25 Z6.99
+G1 X-19.14 Y-53.05 Z6.99
+G1 X-16.02 Y-51.25 Z6.99
+G1 X-16.02 Y-47.05 Z6.99
+G1 X-19.14 Y-45.25 Z6.99
+G1 X-19.14 Y-42.07 Z6.99
+G1 X-12.56 Y-42.07 Z6.99
+G1 X-12.56 Y-45.25 Z6.99
+G1 X-15.68 Y-47.05 Z6.99
+G1 X-15.68 Y-51.25 Z6.99
+G1 X-12.56 Y-53.05 Z6.99
+G1 X-12.56 Y-57.25 Z6.99
+G1 X-15.68 Y-59.05 Z6.99
+G1 X-15.68 Y-63.25 Z6.99
+G1 X-12.56 Y-65.05 Z6.99
+G1 X-12.56 Y-69.25 Z6.99
+G1 X-15.37 Y-70.87 Z6.99
+G1 X-9.41 Y-70.87 Z6.99
+G1 X-12.21 Y-69.25 Z6.99
+G1 X-12.21 Y-65.05 Z6.99
+G1 X-9.10 Y-63.25 Z6.99
+G1 X-9.10 Y-59.05 Z6.99
+G1 X-12.21 Y-57.25 Z6.99
+G1 X-12.21 Y-53.05 Z6.99
+G1 X-9.10 Y-51.25 Z6.99
+G1 X-9.10 Y-47.05 Z6.99
+G1 X-12.21 Y-45.25 Z6.99
+G1 X-12.21 Y-42.07 Z6.99
+G1 X-5.63 Y-42.07 Z6.99
+G1 X-5.63 Y-45.25 Z6.99
+G1 X-8.75 Y-47.05 Z6.99
+G1 X-8.75 Y-51.25 Z6.99
+G1 X-5.63 Y-53.05 Z6.99
+G1 X-5.63 Y-57.25 Z6.99
+G1 X-8.75 Y-59.05 Z6.99
+G1 X-8.75 Y-63.25 Z6.99
+G1 X-5.63 Y-65.05 Z6.99
+G1 X-5.63 Y-69.25 Z6.99
+G1 X-8.44 Y-70.87 Z6.99
+G1 X-2.48 Y-70.87 Z6.99
+G1 X-5.28 Y-69.25 Z6.99
+G1 X-5.28 Y-65.05 Z6.99
+G1 X-2.17 Y-63.25 Z6.99
+G1 X-2.17 Y-59.05 Z6.99
+G1 X-5.28 Y-57.25 Z6.99
+G1 X-5.28 Y-53.05 Z6.99
+G1 X-2.17 Y-51.25 Z6.99
+G1 X-2.17 Y-47.05 Z6.99
+G1 X-5.28 Y-45.25 Z6.99
+G1 X-5.28 Y-42.07 Z6.99
+G1 X1.30 Y-42.07 Z6.99
+G1 X1.30 Y-45.25 Z6.99
+G1 X-1.82 Y-47.05 Z6.99
+G1 X-1.82 Y-51.25 Z6.99
+G1 X1.30 Y-53.05 Z6.99
+G1 X1.30 Y-57.25 Z6.99
+G1 X-1.82 Y-59.05 Z6.99
+G1 X-1.82 Y-63.25 Z6.99
+G1 X1.30 Y-65.05 Z6.99
+G1 X1.30 Y-69.25 Z6.99
+G1 X-1.51 Y-70.87 Z6.99
+G1 X4.45 Y-70.87 Z6.99
+G1 X1.64 Y-69.25 Z6.99
+G1 X1.64 Y-65.05 Z6.99
+G1 X4.76 Y-63.25 Z6.99
+G1 X4.76 Y-59.05 Z6.99
+G1 X1.64 Y-57.25 Z6.99
+G1 X1.64 Y-53.05 Z6.99
+G1 X4.76 Y-51.25 Z6.99
+G1 X4.76 Y-47.05 Z6.99
+G1 X1.64 Y-45.25 Z6.99
+G1 X1.64 Y-42.07 Z6.99
+G1 X8.22 Y-42.07 Z6.99
+G1 X8.22 Y-45.25 Z6.99
+G1 X5.11 Y-47.05 Z6.99
+G1 X5.11 Y-51.25 Z6.99
+G1 X8.22 Y-53.05 Z6.99
+G1 X8.22 Y-57.25 Z6.99
+G1 X5.11 Y-59.05 Z6.99
+G1 X5.11 Y-63.25 Z6.99
+G1 X8.22 Y-65.05 Z6.99
+G1 X8.22 Y-69.25 Z6.99
+G1 X5.42 Y-70.87 Z6.99
+G1 X11.38 Y-70.87 Z6.99
+G1 X8.57 Y-69.25 Z6.99
+G1 X8.57 Y-65.05 Z6.99
+G1 X11.69 Y-63.25 Z6.99
+G1 X11.69 Y-59.05 Z6.99
+G1 X8.57 Y-57.25 Z6.99
+G1 X8.57 Y-53.05 Z6.99
+G1 X11.69 Y-51.25 Z6.99
+G1 X11.69 Y-47.05 Z6.99
+G1 X8.57 Y-45.25 Z6.99
+G1 X8.57 Y-42.07 Z6.99
+G1 X15.15 Y-42.07 Z6.99
+G1 X15.15 Y-45.25 Z6.99
+G1 X12.03 Y-47.05 Z6.99
+G1 X12.03 Y-51.25 Z6.99
+G1 X15.15 Y-53.05 Z6.99
+G1 X15.15 Y-57.25 Z6.99
+G1 X12.03 Y-59.05 Z6.99
+G1 X12.03 Y-63.25 Z6.99
+G1 X15.15 Y-65.05 Z6.99
+G1 X15.15 Y-69.25 Z6.99
+G1 X12.35 Y-70.87 Z6.99
+G1 X18.31 Y-70.87 Z6.99
+G1 X15.50 Y-69.25 Z6.99
+G1 X15.50 Y-65.05 Z6.99
+G1 X18.62 Y-63.25 Z6.99
+G1 X18.62 Y-59.05 Z6.99
+G1 X15.50 Y-57.25 Z6.99
+G1 X15.50 Y-53.05 Z6.99
+G1 X18.62 Y-51.25 Z6.99
+G1 X18.62 Y-47.05 Z6.99
+G1 X15.50 Y-45.25 Z6.99
+G1 X15.50 Y-42.07 Z6.99
+G1 X22.08 Y-42.07 Z6.99
+G1 X22.08 Y-45.25 Z6.99
+G1 X18.96 Y-47.05 Z6.99
+G1 X18.96 Y-51.25 Z6.99
+G1 X22.08 Y-53.05 Z6.99
+G1 X22.08 Y-57.25 Z6.99
+G1 X18.96 Y-59.05 Z6.99
+G1 X18.96 Y-63.25 Z6.99
+G1 X22.08 Y-65.05 Z6.99
+G1 X22.08 Y-69.25 Z6.99
+G1 X19.28 Y-70.87 Z6.99
+G1 X25.23 Y-70.87 Z6.99
+G1 X22.43 Y-69.25 Z6.99
+G1 X22.43 Y-65.05 Z6.99
+G1 X25.54 Y-63.25 Z6.99
+G1 X25.54 Y-59.05 Z6.99
+G1 X22.43 Y-57.25 Z6.99
+G1 X22.43 Y-53.05 Z6.99
+G1 X25.54 Y-51.25 Z6.99
+G1 X25.54 Y-47.05 Z6.99
+G1 X22.43 Y-45.25 Z6.99
+G1 X22.43 Y-42.07 Z6.99
+G1 X29.01 Y-42.07 Z6.99
+G1 X29.01 Y-45.25 Z6.99
+G1 X25.89 Y-47.05 Z6.99
+G1 X25.89 Y-51.25 Z6.99
+G1 X29.01 Y-53.05 Z6.99
+G1 X29.01 Y-57.25 Z6.99
+G1 X25.89 Y-59.05 Z6.99
+G1 X25.89 Y-63.25 Z6.99
+G1 X29.01 Y-65.05 Z6.99
+G1 X29.01 Y-69.25 Z6.99
+G1 X26.20 Y-70.87 Z6.99
+G1 X32.16 Y-70.87 Z6.99
+G1 X29.36 Y-69.25 Z6.99
+G1 X29.36 Y-65.05 Z6.99
+G1 X32.47 Y-63.25 Z6.99
+G1 X32.47 Y-59.05 Z6.99
+G1 X29.36 Y-57.25 Z6.99
+G1 X29.36 Y-53.05 Z6.99
+G1 X32.47 Y-51.25 Z6.99
+G1 X32.47 Y-47.05 Z6.99
+G1 X29.36 Y-45.25 Z6.99
+G1 X29.36 Y-42.07 Z6.99
+G1 X35.94 Y-42.07 Z6.99
+G1 X35.94 Y-45.25 Z6.99
+G1 X32.82 Y-47.05 Z6.99
+G1 X32.82 Y-51.25 Z6.99
+G1 X35.94 Y-53.05 Z6.99
+G1 X35.94 Y-57.25 Z6.99
+G1 X32.82 Y-59.05 Z6.99
+G1 X32.82 Y-63.25 Z6.99
+G1 X35.94 Y-65.05 Z6.99
+G1 X35.94 Y-69.25 Z6.99
+G1 X33.13 Y-70.87 Z6.99
+G1 X37.44 Y-69.92 Z6.99
+G1 X36.28 Y-69.25 Z6.99
+G1 X36.28 Y-65.05 Z6.99
+G1 X37.44 Y-64.38 Z6.99
+G1 X37.44 Y-57.92 Z6.99
+G1 X36.28 Y-57.25 Z6.99
+G1 X36.28 Y-53.05 Z6.99
+G1 X37.44 Y-52.38 Z6.99
+G1 X37.44 Y-45.92 Z6.99
+G1 X36.28 Y-45.25 Z6.99
+G1 X36.28 Y-42.07 Z6.99
+
+T1
+G1 X4.79 Y-70.32 Z7.99
+G1 X36.89 Y-70.32 Z7.99
+G1 X36.89 Y-52.52 Z7.99
+G1 X36.89 Y-42.62 Z7.99
+G1 X1.29 Y-42.62 Z7.99
+G1 X-30.81 Y-42.62 Z7.99
+G1 X-30.81 Y-60.42 Z7.99
+G1 X-30.81 Y-70.32 Z7.99
+G1 X4.79 Y-70.32 Z7.99
+G1 X4.79 Y-70.32 Z7.99
+G1 X-30.81 Y-63.79 Z7.99
+G1 X-29.88 Y-63.25 Z7.99
+G1 X-29.88 Y-59.05 Z7.99
+G1 X-30.81 Y-58.52 Z7.99
+G1 X-30.81 Y-51.79 Z7.99
+G1 X-29.88 Y-51.25 Z7.99
+G1 X-29.88 Y-47.05 Z7.99
+G1 X-30.81 Y-46.52 Z7.99
+G1 X-26.42 Y-42.62 Z7.99
+G1 X-26.42 Y-45.25 Z7.99
+G1 X-29.53 Y-47.05 Z7.99
+G1 X-29.53 Y-51.25 Z7.99
+G1 X-26.42 Y-53.05 Z7.99
+G1 X-26.42 Y-57.25 Z7.99
+G1 X-29.53 Y-59.05 Z7.99
+G1 X-29.53 Y-63.25 Z7.99
+G1 X-26.42 Y-65.05 Z7.99
+G1 X-26.42 Y-69.25 Z7.99
+G1 X-28.26 Y-70.32 Z7.99
+G1 X-24.22 Y-70.32 Z7.99
+G1 X-26.07 Y-69.25 Z7.99
+G1 X-26.07 Y-65.05 Z7.99
+G1 X-22.95 Y-63.25 Z7.99
+G1 X-22.95 Y-59.05 Z7.99
+G1 X-26.07 Y-57.25 Z7.99
+G1 X-26.07 Y-53.05 Z7.99
+G1 X-22.95 Y-51.25 Z7.99
+G1 X-22.95 Y-47.05 Z7.99
+G1 X-26.07 Y-45.25 Z7.99
+G1 X-26.07 Y-42.62 Z7.99
+G1 X-19.49 Y-42.62 Z7.99
+G1 X-19.49 Y-45.25 Z7.99
+G1 X-22.61 Y-47.05 Z7.99
+G1 X-22.61 Y-51.25 Z7.99
+G1 X-19.49 Y-53.05 Z7.99
+G1 X-19.49 Y-57.25 Z7.99
+G1 X-22.61 Y-59.05 Z7.99
+G1 X-22.61 Y-63.25 Z7.99
+G1 X-19.49 Y-65.05 Z7.99
+G1 X-19.49 Y-69.25 Z7.99
+G1 X-21.34 Y-70.32 Z7.99
+G1 X-17.29 Y-70.32 Z7.99
+G1 X-19.14 Y-69.25 Z7.99
+G1 X-19.14 Y-65.05 Z7.99
+G1 X-16.02 Y-63.25 Z7.99
+G1 X-16.02 Y-59.05 Z7.99
+G1 X-19.14 Y-57.25 Z7.99
+G1 X-19.14 Y-53.05 Z7.99
+G1 X-16.02 Y-51.25 Z7.99
+G1 X-16.02 Y-47.05 Z7.99
+G1 X-19.14 Y-45.25 Z7.99
+G1 X-19.14 Y-42.62 Z7.99
+G1 X-12.56 Y-42.62 Z7.99
+G1 X-12.56 Y-45.25 Z7.99
+G1 X-15.68 Y-47.05 Z7.99
+G1 X-15.68 Y-51.25 Z7.99
+G1 X-12.56 Y-53.05 Z7.99
+G1 X-12.56 Y-57.25 Z7.99
+G1 X-15.68 Y-59.05 Z7.99
+G1 X-15.68 Y-63.25 Z7.99
+G1 X-12.56 Y-65.05 Z7.99
+G1 X-12.56 Y-69.25 Z7.99
+G1 X-14.41 Y-70.32 Z7.99
+G1 X-10.37 Y-70.32 Z7.99
+G1 X-12.21 Y-69.25 Z7.99
+G1 X-12.21 Y-65.05 Z7.99
+G1 X-9.10 Y-63.25 Z7.99
+G1 X-9.10 Y-59.05 Z7.99
+G1 X-12.21 Y-57.25 Z7.99
+G1 X-12.21 Y-53.05 Z7.99
+G1 X-9.10 Y-51.25 Z7.99
+G1 X-9.10 Y-47.05 Z7.99
+G1 X-12.21 Y-45.25 Z7.99
+G1 X-12.21 Y-42.62 Z7.99
+G1 X-5.63 Y-42.62 Z7.99
+G1 X-5.63 Y-45.25 Z7.99
+G1 X-8.75 Y-47.05 Z7.99
+G1 X-8.75 Y-51.25 Z7.99
+G1 X-5.63 Y-53.05 Z7.99
+G1 X-5.63 Y-57.25 Z7.99
+G1 X-8.75 Y-59.05 Z7.99
+G1 X-8.75 Y-63.25 Z7.99
+G1 X-5.63 Y-65.05 Z7.99
+G1 X-5.63 Y-69.25 Z7.99
+G1 X-7.48 Y-70.32 Z7.99
+G1 X-3.44 Y-70.32 Z7.99
+G1 X-5.28 Y-69.25 Z7.99
+G1 X-5.28 Y-65.05 Z7.99
+G1 X-2.17 Y-63.25 Z7.99
+G1 X-2.17 Y-59.05 Z7.99
+G1 X-5.28 Y-57.25 Z7.99
+G1 X-5.28 Y-53.05 Z7.99
+G1 X-2.17 Y-51.25 Z7.99
+G1 X-2.17 Y-47.05 Z7.99
+G1 X-5.28 Y-45.25 Z7.99
+G1 X-5.28 Y-42.62 Z7.99
+G1 X1.30 Y-42.62 Z7.99
+G1 X1.30 Y-45.25 Z7.99
+G1 X-1.82 Y-47.05 Z7.99
+G1 X-1.82 Y-51.25 Z7.99
+G1 X1.30 Y-53.05 Z7.99
+G1 X1.30 Y-57.25 Z7.99
+G1 X-1.82 Y-59.05 Z7.99
+G1 X-1.82 Y-63.25 Z7.99
+G1 X1.30 Y-65.05 Z7.99
+G1 X1.30 Y-69.25 Z7.99
+G1 X-0.55 Y-70.32 Z7.99
+G1 X3.49 Y-70.32 Z7.99
+G1 X1.64 Y-69.25 Z7.99
+G1 X1.64 Y-65.05 Z7.99
+G1 X4.76 Y-63.25 Z7.99
+G1 X4.76 Y-59.05 Z7.99
+G1 X1.64 Y-57.25 Z7.99
+G1 X1.64 Y-53.05 Z7.99
+G1 X4.76 Y-51.25 Z7.99
+G1 X4.76 Y-47.05 Z7.99
+G1 X1.64 Y-45.25 Z7.99
+G1 X1.64 Y-42.62 Z7.99
+G1 X8.22 Y-42.62 Z7.99
+G1 X8.22 Y-45.25 Z7.99
+G1 X5.11 Y-47.05 Z7.99
+G1 X5.11 Y-51.25 Z7.99
+G1 X8.22 Y-53.05 Z7.99
+G1 X8.22 Y-57.25 Z7.99
+G1 X5.11 Y-59.05 Z7.99
+G1 X5.11 Y-63.25 Z7.99
+G1 X8.22 Y-65.05 Z7.99
+G1 X8.22 Y-69.25 Z7.99
+G1 X6.38 Y-70.32 Z7.99
+G1 X10.42 Y-70.32 Z7.99
+G1 X8.57 Y-69.25 Z7.99
+G1 X8.57 Y-65.05 Z7.99
+G1 X11.69 Y-63.25 Z7.99
+G1 X11.69 Y-59.05 Z7.99
+G1 X8.57 Y-57.25 Z7.99
+G1 X8.57 Y-53.05 Z7.99
+G1 X11.69 Y-51.25 Z7.99
+G1 X11.69 Y-47.05 Z7.99
+G1 X8.57 Y-45.25 Z7.99
+G1 X8.57 Y-42.62 Z7.99
+G1 X15.15 Y-42.62 Z7.99
+G1 X15.15 Y-45.25 Z7.99
+G1 X12.03 Y-47.05 Z7.99
+G1 X12.03 Y-51.25 Z7.99
+G1 X15.15 Y-53.05 Z7.99
+G1 X15.15 Y-57.25 Z7.99
+G1 X12.03 Y-59.05 Z7.99
+G1 X12.03 Y-63.25 Z7.99
+G1 X15.15 Y-65.05 Z7.99
+G1 X15.15 Y-69.25 Z7.99
+G1 X13.31 Y-70.32 Z7.99
+G1 X17.35 Y-70.32 Z7.99
+G1 X15.50 Y-69.25 Z7.99
+G1 X15.50 Y-65.05 Z7.99
+G1 X18.62 Y-63.25 Z7.99
+G1 X18.62 Y-59.05 Z7.99
+G1 X15.50 Y-57.25 Z7.99
+G1 X15.50 Y-53.05 Z7.99
+G1 X18.62 Y-51.25 Z7.99
+G1 X18.62 Y-47.05 Z7.99
+G1 X15.50 Y-45.25 Z7.99
+G1 X15.50 Y-42.62 Z7.99
+G1 X22.08 Y-42.62 Z7.99
+G1 X22.08 Y-45.25 Z7.99
+G1 X18.96 Y-47.05 Z7.99
+G1 X18.96 Y-51.25 Z7.99
+G1 X22.08 Y-53.05 Z7.99
+G1 X22.08 Y-57.25 Z7.99
+G1 X18.96 Y-59.05 Z7.99
+G1 X18.96 Y-63.25 Z7.99
+G1 X22.08 Y-65.05 Z7.99
+G1 X22.08 Y-69.25 Z7.99
+G1 X20.24 Y-70.32 Z7.99
+G1 X24.27 Y-70.32 Z7.99
+G1 X22.43 Y-69.25 Z7.99
+G1 X22.43 Y-65.05 Z7.99
+G1 X25.54 Y-63.25 Z7.99
+G1 X25.54 Y-59.05 Z7.99
+G1 X22.43 Y-57.25 Z7.99
+G1 X22.43 Y-53.05 Z7.99
+G1 X25.54 Y-51.25 Z7.99
+G1 X25.54 Y-47.05 Z7.99
+G1 X22.43 Y-45.25 Z7.99
+G1 X22.43 Y-42.62 Z7.99
+G1 X29.01 Y-42.62 Z7.99
+G1 X29.01 Y-45.25 Z7.99
+G1 X25.89 Y-47.05 Z7.99
+G1 X25.89 Y-51.25 Z7.99
+G1 X29.01 Y-53.05 Z7.99
+G1 X29.01 Y-57.25 Z7.99
+G1 X25.89 Y-59.05 Z7.99
+G1 X25.89 Y-63.25 Z7.99
+G1 X29.01 Y-65.05 Z7.99
+G1 X29.01 Y-69.25 Z7.99
+G1 X27.16 Y-70.32 Z7.99
+G1 X31.20 Y-70.32 Z7.99
+G1 X29.36 Y-69.25 Z7.99
+G1 X29.36 Y-65.05 Z7.99
+G1 X32.47 Y-63.25 Z7.99
+G1 X32.47 Y-59.05 Z7.99
+G1 X29.36 Y-57.25 Z7.99
+G1 X29.36 Y-53.05 Z7.99
+G1 X32.47 Y-51.25 Z7.99
+G1 X32.47 Y-47.05 Z7.99
+G1 X29.36 Y-45.25 Z7.99
+G1 X29.36 Y-42.62 Z7.99
+G1 X35.94 Y-42.62 Z7.99
+G1 X35.94 Y-45.25 Z7.99
+G1 X32.82 Y-47.05 Z7.99
+G1 X32.82 Y-51.25 Z7.99
+G1 X35.94 Y-53.05 Z7.99
+G1 X35.94 Y-57.25 Z7.99
+G1 X32.82 Y-59.05 Z7.99
+G1 X32.82 Y-63.25 Z7.99
+G1 X35.94 Y-65.05 Z7.99
+G1 X35.94 Y-69.25 Z7.99
+G1 X34.09 Y-70.32 Z7.99
+G1 X36.89 Y-69.60 Z7.99
+G1 X36.28 Y-69.25 Z7.99
+G1 X36.28 Y-65.05 Z7.99
+G1 X36.89 Y-64.70 Z7.99
+G1 X36.89 Y-57.60 Z7.99
+G1 X36.28 Y-57.25 Z7.99
+G1 X36.28 Y-53.05 Z7.99
+G1 X36.89 Y-52.70 Z7.99
+G1 X36.89 Y-45.60 Z7.99
+G1 X36.28 Y-45.25 Z7.99
+G1 X36.28 Y-42.62 Z7.99
+
+T1
+G1 X1.35 Y-69.76 Z8.99
+G1 X36.33 Y-69.76 Z8.99
+G1 X36.33 Y-53.96 Z8.99
+G1 X36.33 Y-43.18 Z8.99
+G1 X4.73 Y-43.18 Z8.99
+G1 X-30.25 Y-43.18 Z8.99
+G1 X-30.25 Y-58.98 Z8.99
+G1 X-30.25 Y-69.76 Z8.99
+G1 X1.35 Y-69.76 Z8.99
+G1 X1.35 Y-69.76 Z8.99
+G1 X-30.25 Y-63.47 Z8.99
+G1 X-29.88 Y-63.25 Z8.99
+G1 X-29.88 Y-59.05 Z8.99
+G1 X-30.25 Y-58.84 Z8.99
+G1 X-30.25 Y-51.47 Z8.99
+G1 X-29.88 Y-51.25 Z8.99
+G1 X-29.88 Y-47.05 Z8.99
+G1 X-30.25 Y-46.84 Z8.99
+G1 X-26.42 Y-43.18 Z8.99
+G1 X-26.42 Y-45.25 Z8.99
+G1 X-29.53 Y-47.05 Z8.99
+G1 X-29.53 Y-51.25 Z8.99
+G1 X-26.42 Y-53.05 Z8.99
+G1 X-26.42 Y-57.25 Z8.99
+G1 X-29.53 Y-59.05 Z8.99
+G1 X-29.53 Y-63.25 Z8.99
+G1 X-26.42 Y-65.05 Z8.99
+G1 X-26.42 Y-69.25 Z8.99
+G1 X-27.30 Y-69.76 Z8.99
+G1 X-25.18 Y-69.76 Z8.99
+G1 X-26.07 Y-69.25 Z8.99
+G1 X-26.07 Y-65.05 Z8.99
+G1 X-22.95 Y-63.25 Z8.99
+G1 X-22.95 Y-59.05 Z8.99
+G1 X-26.07 Y-57.25 Z8.99
+G1 X-26.07 Y-53.05 Z8.99
+G1 X-22.95 Y-51.25 Z8.99
+G1 X-22.95 Y-47.05 Z8.99
+G1 X-26.07 Y-45.25 Z8.99
+G1 X-26.07 Y-43.18 Z8.99
+G1 X-19.49 Y-43.18 Z8.99
+G1 X-19.49 Y-45.25 Z8.99
+G1 X-22.61 Y-47.05 Z8.99
+G1 X-22.61 Y-51.25 Z8.99
+G1 X-19.49 Y-53.05 Z8.99
+G1 X-19.49 Y-57.25 Z8.99
+G1 X-22.61 Y-59.05 Z8.99
+G1 X-22.61 Y-63.25 Z8.99
+G1 X-19.49 Y-65.05 Z8.99
+G1 X-19.49 Y-69.25 Z8.99
+G1 X-20.37 Y-69.76 Z8.99
+G1 X-18.25 Y-69.76 Z8.99
+G1 X-19.14 Y-69.25 Z8.99
+G1 X-19.14 Y-65.05 Z8.99
+G1 X-16.02 Y-63.25 Z8.99
+G1 X-16.02 Y-59.05 Z8.99
+G1 X-19.14 Y-57.25 Z8.99
+G1 X-19.14 Y-53.05 Z8.99
+G1 X-16.02 Y-51.25 Z8.99
+G1 X-16.02 Y-47.05 Z8.99
+G1 X-19.14 Y-45.25 Z8.99
+G1 X-19.14 Y-43.18 Z8.99
+G1 X-12.56 Y-43.18 Z8.99
+G1 X-12.56 Y-45.25 Z8.99
+G1 X-15.68 Y-47.05 Z8.99
+G1 X-15.68 Y-51.25 Z8.99
+G1 X-12.56 Y-53.05 Z8.99
+G1 X-12.56 Y-57.25 Z8.99
+G1 X-15.68 Y-59.05 Z8.99
+G1 X-15.68 Y-63.25 Z8.99
+G1 X-12.56 Y-65.05 Z8.99
+G1 X-12.56 Y-69.25 Z8.99
+G1 X-13.45 Y-69.76 Z8.99
+G1 X-11.33 Y-69.76 Z8.99
+G1 X-12.21 Y-69.25 Z8.99
+G1 X-12.21 Y-65.05 Z8.99
+G1 X-9.10 Y-63.25 Z8.99
+G1 X-9.10 Y-59.05 Z8.99
+G1 X-12.21 Y-57.25 Z8.99
+G1 X-12.21 Y-53.05 Z8.99
+G1 X-9.10 Y-51.25 Z8.99
+G1 X-9.10 Y-47.05 Z8.99
+G1 X-12.21 Y-45.25 Z8.99
+G1 X-12.21 Y-43.18 Z8.99
+G1 X-5.63 Y-43.18 Z8.99
+G1 X-5.63 Y-45.25 Z8.99
+G1 X-8.75 Y-47.05 Z8.99
+G1 X-8.75 Y-51.25 Z8.99
+G1 X-5.63 Y-53.05 Z8.99
+G1 X-5.63 Y-57.25 Z8.99
+G1 X-8.75 Y-59.05 Z8.99
+G1 X-8.75 Y-63.25 Z8.99
+G1 X-5.63 Y-65.05 Z8.99
+G1 X-5.63 Y-69.25 Z8.99
+G1 X-6.52 Y-69.76 Z8.99
+G1 X-4.40 Y-69.76 Z8.99
+G1 X-5.28 Y-69.25 Z8.99
+G1 X-5.28 Y-65.05 Z8.99
+G1 X-2.17 Y-63.25 Z8.99
+G1 X-2.17 Y-59.05 Z8.99
+G1 X-5.28 Y-57.25 Z8.99
+G1 X-5.28 Y-53.05 Z8.99
+G1 X-2.17 Y-51.25 Z8.99
+G1 X-2.17 Y-47.05 Z8.99
+G1 X-5.28 Y-45.25 Z8.99
+G1 X-5.28 Y-43.18 Z8.99
+G1 X1.30 Y-43.18 Z8.99
+G1 X1.30 Y-45.25 Z8.99
+G1 X-1.82 Y-47.05 Z8.99
+G1 X-1.82 Y-51.25 Z8.99
+G1 X1.30 Y-53.05 Z8.99
+G1 X1.30 Y-57.25 Z8.99
+G1 X-1.82 Y-59.05 Z8.99
+G1 X-1.82 Y-63.25 Z8.99
+G1 X1.30 Y-65.05 Z8.99
+G1 X1.30 Y-69.25 Z8.99
+G1 X0.41 Y-69.76 Z8.99
+G1 X2.53 Y-69.76 Z8.99
+G1 X1.64 Y-69.25 Z8.99
+G1 X1.64 Y-65.05 Z8.99
+G1 X4.76 Y-63.25 Z8.99
+G1 X4.76 Y-59.05 Z8.99
+G1 X1.64 Y-57.25 Z8.99
+G1 X1.64 Y-53.05 Z8.99
+G1 X4.76 Y-51.25 Z8.99
+G1 X4.76 Y-47.05 Z8.99
+G1 X1.64 Y-45.25 Z8.99
+G1 X1.64 Y-43.18 Z8.99
+G1 X8.22 Y-43.18 Z8.99
+G1 X8.22 Y-45.25 Z8.99
+G1 X5.11 Y-47.05 Z8.99
+G1 X5.11 Y-51.25 Z8.99
+G1 X8.22 Y-53.05 Z8.99
+G1 X8.22 Y-57.25 Z8.99
+G1 X5.11 Y-59.05 Z8.99
+G1 X5.11 Y-63.25 Z8.99
+G1 X8.22 Y-65.05 Z8.99
+G1 X8.22 Y-69.25 Z8.99
+G1 X7.34 Y-69.76 Z8.99
+G1 X9.46 Y-69.76 Z8.99
+G1 X8.57 Y-69.25 Z8.99
+G1 X8.57 Y-65.05 Z8.99
+G1 X11.69 Y-63.25 Z8.99
+G1 X11.69 Y-59.05 Z8.99
+G1 X8.57 Y-57.25 Z8.99
+G1 X8.57 Y-53.05 Z8.99
+G1 X11.69 Y-51.25 Z8.99
+G1 X11.69 Y-47.05 Z8.99
+G1 X8.57 Y-45.25 Z8.99
+G1 X8.57 Y-43.18 Z8.99
+G1 X15.15 Y-43.18 Z8.99
+G1 X15.15 Y-45.25 Z8.99
+G1 X12.03 Y-47.05 Z8.99
+G1 X12.03 Y-51.25 Z8.99
+G1 X15.15 Y-53.05 Z8.99
+G1 X15.15 Y-57.25 Z8.99
+G1 X12.03 Y-59.05 Z8.99
+G1 X12.03 Y-63.25 Z8.99
+G1 X15.15 Y-65.05 Z8.99
+G1 X15.15 Y-69.25 Z8.99
+G1 X14.27 Y-69.76 Z8.99
+G1 X16.39 Y-69.76 Z8.99
+G1 X15.50 Y-69.25 Z8.99
+G1 X15.50 Y-65.05 Z8.99
+G1 X18.62 Y-63.25 Z8.99
+G1 X18.62 Y-59.05 Z8.99
+G1 X15.50 Y-57.25 Z8.99
+G1 X15.50 Y-53.05 Z8.99
+G1 X18.62 Y-51.25 Z8.99
+G1 X18.62 Y-47.05 Z8.99
+G1 X15.50 Y-45.25 Z8.99
+G1 X15.50 Y-43.18 Z8.99
+G1 X22.08 Y-43.18 Z8.99
+G1 X22.08 Y-45.25 Z8.99
+G1 X18.96 Y-47.05 Z8.99
+G1 X18.96 Y-51.25 Z8.99
+G1 X22.08 Y-53.05 Z8.99
+G1 X22.08 Y-57.25 Z8.99
+G1 X18.96 Y-59.05 Z8.99
+G1 X18.96 Y-63.25 Z8.99
+G1 X22.08 Y-65.05 Z8.99
+G1 X22.08 Y-69.25 Z8.99
+G1 X21.20 Y-69.76 Z8.99
+G1 X23.31 Y-69.76 Z8.99
+G1 X22.43 Y-69.25 Z8.99
+G1 X22.43 Y-65.05 Z8.99
+G1 X25.54 Y-63.25 Z8.99
+G1 X25.54 Y-59.05 Z8.99
+G1 X22.43 Y-57.25 Z8.99
+G1 X22.43 Y-53.05 Z8.99
+G1 X25.54 Y-51.25 Z8.99
+G1 X25.54 Y-47.05 Z8.99
+G1 X22.43 Y-45.25 Z8.99
+G1 X22.43 Y-43.18 Z8.99
+G1 X29.01 Y-43.18 Z8.99
+G1 X29.01 Y-45.25 Z8.99
+G1 X25.89 Y-47.05 Z8.99
+G1 X25.89 Y-51.25 Z8.99
+G1 X29.01 Y-53.05 Z8.99
+G1 X29.01 Y-57.25 Z8.99
+G1 X25.89 Y-59.05 Z8.99
+G1 X25.89 Y-63.25 Z8.99
+G1 X29.01 Y-65.05 Z8.99
+G1 X29.01 Y-69.25 Z8.99
+G1 X28.12 Y-69.76 Z8.99
+G1 X30.24 Y-69.76 Z8.99
+G1 X29.36 Y-69.25 Z8.99
+G1 X29.36 Y-65.05 Z8.99
+G1 X32.47 Y-63.25 Z8.99
+G1 X32.47 Y-59.05 Z8.99
+G1 X29.36 Y-57.25 Z8.99
+G1 X29.36 Y-53.05 Z8.99
+G1 X32.47 Y-51.25 Z8.99
+G1 X32.47 Y-47.05 Z8.99
+G1 X29.36 Y-45.25 Z8.99
+G1 X29.36 Y-43.18 Z8.99
+G1 X35.94 Y-43.18 Z8.99
+G1 X35.94 Y-45.25 Z8.99
+G1 X32.82 Y-47.05 Z8.99
+G1 X32.82 Y-51.25 Z8.99
+G1 X35.94 Y-53.05 Z8.99
+G1 X35.94 Y-57.25 Z8.99
+G1 X32.82 Y-59.05 Z8.99
+G1 X32.82 Y-63.25 Z8.99
+G1 X35.94 Y-65.05 Z8.99
+G1 X35.94 Y-69.25 Z8.99
+G1 X35.05 Y-69.76 Z8.99
+G1 X36.33 Y-69.28 Z8.99
+G1 X36.28 Y-69.25 Z8.99
+G1 X36.28 Y-65.05 Z8.99
+G1 X36.33 Y-65.02 Z8.99
+G1 X36.33 Y-57.28 Z8.99
+G1 X36.28 Y-57.25 Z8.99
+G1 X36.28 Y-53.05 Z8.99
+G1 X36.33 Y-53.02 Z8.99
+G1 X36.33 Y-45.28 Z8.99
+G1 X36.28 Y-45.25 Z8.99
+G1 X36.28 Y-43.18 Z8.99
+
+T1
+G1 X35.78 Y-69.21 Z9.99
+G1 X35.78 Y-55.41 Z9.99
+G1 X35.78 Y-43.73 Z9.99
+G1 X8.18 Y-43.73 Z9.99
+G1 X-29.70 Y-43.73 Z9.99
+G1 X-29.70 Y-57.53 Z9.99
+G1 X-29.70 Y-69.21 Z9.99
+G1 X-2.10 Y-69.21 Z9.99
+G1 X35.78 Y-69.21 Z9.99
+G1 X35.78 Y-69.21 Z9.99
+G1 X-26.42 Y-43.73 Z9.99
+G1 X-26.42 Y-45.25 Z9.99
+G1 X-29.53 Y-47.05 Z9.99
+G1 X-29.53 Y-51.25 Z9.99
+G1 X-26.42 Y-53.05 Z9.99
+G1 X-26.42 Y-57.25 Z9.99
+G1 X-29.53 Y-59.05 Z9.99
+G1 X-29.53 Y-63.25 Z9.99
+G1 X-26.42 Y-65.05 Z9.99
+G1 X-26.42 Y-69.21 Z9.99
+G1 X-26.07 Y-69.21 Z9.99
+G1 X-26.07 Y-65.05 Z9.99
+G1 X-22.95 Y-63.25 Z9.99
+G1 X-22.95 Y-59.05 Z9.99
+G1 X-26.07 Y-57.25 Z9.99
+G1 X-26.07 Y-53.05 Z9.99
+G1 X-22.95 Y-51.25 Z9.99
+G1 X-22.95 Y-47.05 Z9.99
+G1 X-26.07 Y-45.25 Z9.99
+G1 X-26.07 Y-43.73 Z9.99
+G1 X-19.49 Y-43.73 Z9.99
+G1 X-19.49 Y-45.25 Z9.99
+G1 X-22.61 Y-47.05 Z9.99
+G1 X-22.61 Y-51.25 Z9.99
+G1 X-19.49 Y-53.05 Z9.99
+G1 X-19.49 Y-57.25 Z9.99
+G1 X-22.61 Y-59.05 Z9.99
+G1 X-22.61 Y-63.25 Z9.99
+G1 X-19.49 Y-65.05 Z9.99
+G1 X-19.49 Y-69.21 Z9.99
+G1 X-19.14 Y-69.21 Z9.99
+G1 X-19.14 Y-65.05 Z9.99
+G1 X-16.02 Y-63.25 Z9.99
+G1 X-16.02 Y-59.05 Z9.99
+G1 X-19.14 Y-57.25 Z9.99
+G1 X-19.14 Y-53.05 Z9.99
+G1 X-16.02 Y-51.25 Z9.99
+G1 X-16.02 Y-47.05 Z9.99
+G1 X-19.14 Y-45.25 Z9.99
+G1 X-19.14 Y-43.73 Z9.99
+G1 X-12.56 Y-43.73 Z9.99
+G1 X-12.56 Y-45.25 Z9.99
+G1 X-15.68 Y-47.05 Z9.99
+G1 X-15.68 Y-51.25 Z9.99
+G1 X-12.56 Y-53.05 Z9.99
+G1 X-12.56 Y-57.25 Z9.99
+G1 X-15.68 Y-59.05 Z9.99
+G1 X-15.68 Y-63.25 Z9.99
+G1 X-12.56 Y-65.05 Z9.99
+G1 X-12.56 Y-69.21 Z9.99
+G1 X-12.21 Y-69.21 Z9.99
+G1 X-12.21 Y-65.05 Z9.99
+G1 X-9.10 Y-63.25 Z9.99
+G1 X-9.10 Y-59.05 Z9.99
+G1 X-12.21 Y-57.25 Z9.99
+G1 X-12.21 Y-53.05 Z9.99
+G1 X-9.10 Y-51.25 Z9.99
+G1 X-9.10 Y-47.05 Z9.99
+G1 X-12.21 Y-45.25 Z9.99
+G1 X-12.21 Y-43.73 Z9.99
+G1 X-5.63 Y-43.73 Z9.99
+G1 X-5.63 Y-45.25 Z9.99
+G1 X-8.75 Y-47.05 Z9.99
+G1 X-8.75 Y-51.25 Z9.99
+G1 X-5.63 Y-53.05 Z9.99
+G1 X-5.63 Y-57.25 Z9.99
+G1 X-8.75 Y-59.05 Z9.99
+G1 X-8.75 Y-63.25 Z9.99
+G1 X-5.63 Y-65.05 Z9.99
+G1 X-5.63 Y-69.21 Z9.99
+G1 X-5.28 Y-69.21 Z9.99
+G1 X-5.28 Y-65.05 Z9.99
+G1 X-2.17 Y-63.25 Z9.99
+G1 X-2.17 Y-59.05 Z9.99
+G1 X-5.28 Y-57.25 Z9.99
+G1 X-5.28 Y-53.05 Z9.99
+G1 X-2.17 Y-51.25 Z9.99
+G1 X-2.17 Y-47.05 Z9.99
+G1 X-5.28 Y-45.25 Z9.99
+G1 X-5.28 Y-43.73 Z9.99
+G1 X1.30 Y-43.73 Z9.99
+G1 X1.30 Y-45.25 Z9.99
+G1 X-1.82 Y-47.05 Z9.99
+G1 X-1.82 Y-51.25 Z9.99
+G1 X1.30 Y-53.05 Z9.99
+G1 X1.30 Y-57.25 Z9.99
+G1 X-1.82 Y-59.05 Z9.99
+G1 X-1.82 Y-63.25 Z9.99
+G1 X1.30 Y-65.05 Z9.99
+G1 X1.30 Y-69.21 Z9.99
+G1 X1.64 Y-69.21 Z9.99
+G1 X1.64 Y-65.05 Z9.99
+G1 X4.76 Y-63.25 Z9.99
+G1 X4.76 Y-59.05 Z9.99
+G1 X1.64 Y-57.25 Z9.99
+G1 X1.64 Y-53.05 Z9.99
+G1 X4.76 Y-51.25 Z9.99
+G1 X4.76 Y-47.05 Z9.99
+G1 X1.64 Y-45.25 Z9.99
+G1 X1.64 Y-43.73 Z9.99
+G1 X8.22 Y-43.73 Z9.99
+G1 X8.22 Y-45.25 Z9.99
+G1 X5.11 Y-47.05 Z9.99
+G1 X5.11 Y-51.25 Z9.99
+G1 X8.22 Y-53.05 Z9.99
+G1 X8.22 Y-57.25 Z9.99
+G1 X5.11 Y-59.05 Z9.99
+G1 X5.11 Y-63.25 Z9.99
+G1 X8.22 Y-65.05 Z9.99
+G1 X8.22 Y-69.21 Z9.99
+G1 X8.57 Y-69.21 Z9.99
+G1 X8.57 Y-65.05 Z9.99
+G1 X11.69 Y-63.25 Z9.99
+G1 X11.69 Y-59.05 Z9.99
+G1 X8.57 Y-57.25 Z9.99
+G1 X8.57 Y-53.05 Z9.99
+G1 X11.69 Y-51.25 Z9.99
+G1 X11.69 Y-47.05 Z9.99
+G1 X8.57 Y-45.25 Z9.99
+G1 X8.57 Y-43.73 Z9.99
+G1 X15.15 Y-43.73 Z9.99
+G1 X15.15 Y-45.25 Z9.99
+G1 X12.03 Y-47.05 Z9.99
+G1 X12.03 Y-51.25 Z9.99
+G1 X15.15 Y-53.05 Z9.99
+G1 X15.15 Y-57.25 Z9.99
+G1 X12.03 Y-59.05 Z9.99
+G1 X12.03 Y-63.25 Z9.99
+G1 X15.15 Y-65.05 Z9.99
+G1 X15.15 Y-69.21 Z9.99
+G1 X15.50 Y-69.21 Z9.99
+G1 X15.50 Y-65.05 Z9.99
+G1 X18.62 Y-63.25 Z9.99
+G1 X18.62 Y-59.05 Z9.99
+G1 X15.50 Y-57.25 Z9.99
+G1 X15.50 Y-53.05 Z9.99
+G1 X18.62 Y-51.25 Z9.99
+G1 X18.62 Y-47.05 Z9.99
+G1 X15.50 Y-45.25 Z9.99
+G1 X15.50 Y-43.73 Z9.99
+G1 X22.08 Y-43.73 Z9.99
+G1 X22.08 Y-45.25 Z9.99
+G1 X18.96 Y-47.05 Z9.99
+G1 X18.96 Y-51.25 Z9.99
+G1 X22.08 Y-53.05 Z9.99
+G1 X22.08 Y-57.25 Z9.99
+G1 X18.96 Y-59.05 Z9.99
+G1 X18.96 Y-63.25 Z9.99
+G1 X22.08 Y-65.05 Z9.99
+G1 X22.08 Y-69.21 Z9.99
+G1 X22.43 Y-69.21 Z9.99
+G1 X22.43 Y-65.05 Z9.99
+G1 X25.54 Y-63.25 Z9.99
+G1 X25.54 Y-59.05 Z9.99
+G1 X22.43 Y-57.25 Z9.99
+G1 X22.43 Y-53.05 Z9.99
+G1 X25.54 Y-51.25 Z9.99
+G1 X25.54 Y-47.05 Z9.99
+G1 X22.43 Y-45.25 Z9.99
+G1 X22.43 Y-43.73 Z9.99
+G1 X29.01 Y-43.73 Z9.99
+G1 X29.01 Y-45.25 Z9.99
+G1 X25.89 Y-47.05 Z9.99
+G1 X25.89 Y-51.25 Z9.99
+G1 X29.01 Y-53.05 Z9.99
+G1 X29.01 Y-57.25 Z9.99
+G1 X25.89 Y-59.05 Z9.99
+G1 X25.89 Y-63.25 Z9.99
+G1 X29.01 Y-65.05 Z9.99
+G1 X29.01 Y-69.21 Z9.99
+G1 X29.36 Y-69.21 Z9.99
+G1 X29.36 Y-65.05 Z9.99
+G1 X32.47 Y-63.25 Z9.99
+G1 X32.47 Y-59.05 Z9.99
+G1 X29.36 Y-57.25 Z9.99
+G1 X29.36 Y-53.05 Z9.99
+G1 X32.47 Y-51.25 Z9.99
+G1 X32.47 Y-47.05 Z9.99
+G1 X29.36 Y-45.25 Z9.99
+G1 X29.36 Y-43.73 Z9.99
+G1 X35.78 Y-45.34 Z9.99
+G1 X32.82 Y-47.05 Z9.99
+G1 X32.82 Y-51.25 Z9.99
+G1 X35.78 Y-52.96 Z9.99
+G1 X35.78 Y-57.34 Z9.99
+G1 X32.82 Y-59.05 Z9.99
+G1 X32.82 Y-63.25 Z9.99
+G1 X35.78 Y-64.96 Z9.99
+
+T1
+G1 X35.22 Y-68.65 Z10.99
+G1 X35.22 Y-56.85 Z10.99
+G1 X35.22 Y-44.29 Z10.99
+G1 X11.62 Y-44.29 Z10.99
+G1 X-29.14 Y-44.29 Z10.99
+G1 X-29.14 Y-56.09 Z10.99
+G1 X-29.14 Y-68.65 Z10.99
+G1 X-5.54 Y-68.65 Z10.99
+G1 X35.22 Y-68.65 Z10.99
+G1 X35.22 Y-68.65 Z10.99
+G1 X-26.42 Y-44.29 Z10.99
+G1 X-26.42 Y-45.25 Z10.99
+G1 X-29.14 Y-46.83 Z10.99
+G1 X-29.14 Y-51.48 Z10.99
+G1 X-26.42 Y-53.05 Z10.99
+G1 X-26.42 Y-57.25 Z10.99
+G1 X-29.14 Y-58.83 Z10.99
+G1 X-29.14 Y-63.48 Z10.99
+G1 X-26.42 Y-65.05 Z10.99
+G1 X-26.42 Y-68.65 Z10.99
+G1 X-26.07 Y-68.65 Z10.99
+G1 X-26.07 Y-65.05 Z10.99
+G1 X-22.95 Y-63.25 Z10.99
+G1 X-22.95 Y-59.05 Z10.99
+G1 X-26.07 Y-57.25 Z10.99
+G1 X-26.07 Y-53.05 Z10.99
+G1 X-22.95 Y-51.25 Z10.99
+G1 X-22.95 Y-47.05 Z10.99
+G1 X-26.07 Y-45.25 Z10.99
+G1 X-26.07 Y-44.29 Z10.99
+G1 X-19.49 Y-44.29 Z10.99
+G1 X-19.49 Y-45.25 Z10.99
+G1 X-22.61 Y-47.05 Z10.99
+G1 X-22.61 Y-51.25 Z10.99
+G1 X-19.49 Y-53.05 Z10.99
+G1 X-19.49 Y-57.25 Z10.99
+G1 X-22.61 Y-59.05 Z10.99
+G1 X-22.61 Y-63.25 Z10.99
+G1 X-19.49 Y-65.05 Z10.99
+G1 X-19.49 Y-68.65 Z10.99
+G1 X-19.14 Y-68.65 Z10.99
+G1 X-19.14 Y-65.05 Z10.99
+G1 X-16.02 Y-63.25 Z10.99
+G1 X-16.02 Y-59.05 Z10.99
+G1 X-19.14 Y-57.25 Z10.99
+G1 X-19.14 Y-53.05 Z10.99
+G1 X-16.02 Y-51.25 Z10.99
+G1 X-16.02 Y-47.05 Z10.99
+G1 X-19.14 Y-45.25 Z10.99
+G1 X-19.14 Y-44.29 Z10.99
+G1 X-12.56 Y-44.29 Z10.99
+G1 X-12.56 Y-45.25 Z10.99
+G1 X-15.68 Y-47.05 Z10.99
+G1 X-15.68 Y-51.25 Z10.99
+G1 X-12.56 Y-53.05 Z10.99
+G1 X-12.56 Y-57.25 Z10.99
+G1 X-15.68 Y-59.05 Z10.99
+G1 X-15.68 Y-63.25 Z10.99
+G1 X-12.56 Y-65.05 Z10.99
+G1 X-12.56 Y-68.65 Z10.99
+G1 X-12.21 Y-68.65 Z10.99
+G1 X-12.21 Y-65.05 Z10.99
+G1 X-9.10 Y-63.25 Z10.99
+G1 X-9.10 Y-59.05 Z10.99
+G1 X-12.21 Y-57.25 Z10.99
+G1 X-12.21 Y-53.05 Z10.99
+G1 X-9.10 Y-51.25 Z10.99
+G1 X-9.10 Y-47.05 Z10.99
+G1 X-12.21 Y-45.25 Z10.99
+G1 X-12.21 Y-44.29 Z10.99
+G1 X-5.63 Y-44.29 Z10.99
+G1 X-5.63 Y-45.25 Z10.99
+G1 X-8.75 Y-47.05 Z10.99
+G1 X-8.75 Y-51.25 Z10.99
+G1 X-5.63 Y-53.05 Z10.99
+G1 X-5.63 Y-57.25 Z10.99
+G1 X-8.75 Y-59.05 Z10.99
+G1 X-8.75 Y-63.25 Z10.99
+G1 X-5.63 Y-65.05 Z10.99
+G1 X-5.63 Y-68.65 Z10.99
+G1 X-5.28 Y-68.65 Z10.99
+G1 X-5.28 Y-65.05 Z10.99
+G1 X-2.17 Y-63.25 Z10.99
+G1 X-2.17 Y-59.05 Z10.99
+G1 X-5.28 Y-57.25 Z10.99
+G1 X-5.28 Y-53.05 Z10.99
+G1 X-2.17 Y-51.25 Z10.99
+G1 X-2.17 Y-47.05 Z10.99
+G1 X-5.28 Y-45.25 Z10.99
+G1 X-5.28 Y-44.29 Z10.99
+G1 X1.30 Y-44.29 Z10.99
+G1 X1.30 Y-45.25 Z10.99
+G1 X-1.82 Y-47.05 Z10.99
+G1 X-1.82 Y-51.25 Z10.99
+G1 X1.30 Y-53.05 Z10.99
+G1 X1.30 Y-57.25 Z10.99
+G1 X-1.82 Y-59.05 Z10.99
+G1 X-1.82 Y-63.25 Z10.99
+G1 X1.30 Y-65.05 Z10.99
+G1 X1.30 Y-68.65 Z10.99
+G1 X1.64 Y-68.65 Z10.99
+G1 X1.64 Y-65.05 Z10.99
+G1 X4.76 Y-63.25 Z10.99
+G1 X4.76 Y-59.05 Z10.99
+G1 X1.64 Y-57.25 Z10.99
+G1 X1.64 Y-53.05 Z10.99
+G1 X4.76 Y-51.25 Z10.99
+G1 X4.76 Y-47.05 Z10.99
+G1 X1.64 Y-45.25 Z10.99
+G1 X1.64 Y-44.29 Z10.99
+G1 X8.22 Y-44.29 Z10.99
+G1 X8.22 Y-45.25 Z10.99
+G1 X5.11 Y-47.05 Z10.99
+G1 X5.11 Y-51.25 Z10.99
+G1 X8.22 Y-53.05 Z10.99
+G1 X8.22 Y-57.25 Z10.99
+G1 X5.11 Y-59.05 Z10.99
+G1 X5.11 Y-63.25 Z10.99
+G1 X8.22 Y-65.05 Z10.99
+G1 X8.22 Y-68.65 Z10.99
+G1 X8.57 Y-68.65 Z10.99
+G1 X8.57 Y-65.05 Z10.99
+G1 X11.69 Y-63.25 Z10.99
+G1 X11.69 Y-59.05 Z10.99
+G1 X8.57 Y-57.25 Z10.99
+G1 X8.57 Y-53.05 Z10.99
+G1 X11.69 Y-51.25 Z10.99
+G1 X11.69 Y-47.05 Z10.99
+G1 X8.57 Y-45.25 Z10.99
+G1 X8.57 Y-44.29 Z10.99
+G1 X15.15 Y-44.29 Z10.99
+G1 X15.15 Y-45.25 Z10.99
+G1 X12.03 Y-47.05 Z10.99
+G1 X12.03 Y-51.25 Z10.99
+G1 X15.15 Y-53.05 Z10.99
+G1 X15.15 Y-57.25 Z10.99
+G1 X12.03 Y-59.05 Z10.99
+G1 X12.03 Y-63.25 Z10.99
+G1 X15.15 Y-65.05 Z10.99
+G1 X15.15 Y-68.65 Z10.99
+G1 X15.50 Y-68.65 Z10.99
+G1 X15.50 Y-65.05 Z10.99
+G1 X18.62 Y-63.25 Z10.99
+G1 X18.62 Y-59.05 Z10.99
+G1 X15.50 Y-57.25 Z10.99
+G1 X15.50 Y-53.05 Z10.99
+G1 X18.62 Y-51.25 Z10.99
+G1 X18.62 Y-47.05 Z10.99
+G1 X15.50 Y-45.25 Z10.99
+G1 X15.50 Y-44.29 Z10.99
+G1 X22.08 Y-44.29 Z10.99
+G1 X22.08 Y-45.25 Z10.99
+G1 X18.96 Y-47.05 Z10.99
+G1 X18.96 Y-51.25 Z10.99
+G1 X22.08 Y-53.05 Z10.99
+G1 X22.08 Y-57.25 Z10.99
+G1 X18.96 Y-59.05 Z10.99
+G1 X18.96 Y-63.25 Z10.99
+G1 X22.08 Y-65.05 Z10.99
+G1 X22.08 Y-68.65 Z10.99
+G1 X22.43 Y-68.65 Z10.99
+G1 X22.43 Y-65.05 Z10.99
+G1 X25.54 Y-63.25 Z10.99
+G1 X25.54 Y-59.05 Z10.99
+G1 X22.43 Y-57.25 Z10.99
+G1 X22.43 Y-53.05 Z10.99
+G1 X25.54 Y-51.25 Z10.99
+G1 X25.54 Y-47.05 Z10.99
+G1 X22.43 Y-45.25 Z10.99
+G1 X22.43 Y-44.29 Z10.99
+G1 X29.01 Y-44.29 Z10.99
+G1 X29.01 Y-45.25 Z10.99
+G1 X25.89 Y-47.05 Z10.99
+G1 X25.89 Y-51.25 Z10.99
+G1 X29.01 Y-53.05 Z10.99
+G1 X29.01 Y-57.25 Z10.99
+G1 X25.89 Y-59.05 Z10.99
+G1 X25.89 Y-63.25 Z10.99
+G1 X29.01 Y-65.05 Z10.99
+G1 X29.01 Y-68.65 Z10.99
+G1 X29.36 Y-68.65 Z10.99
+G1 X29.36 Y-65.05 Z10.99
+G1 X32.47 Y-63.25 Z10.99
+G1 X32.47 Y-59.05 Z10.99
+G1 X29.36 Y-57.25 Z10.99
+G1 X29.36 Y-53.05 Z10.99
+G1 X32.47 Y-51.25 Z10.99
+G1 X32.47 Y-47.05 Z10.99
+G1 X29.36 Y-45.25 Z10.99
+G1 X29.36 Y-44.29 Z10.99
+G1 X35.22 Y-45.66 Z10.99
+G1 X32.82 Y-47.05 Z10.99
+G1 X32.82 Y-51.25 Z10.99
+G1 X35.22 Y-52.64 Z10.99
+G1 X35.22 Y-57.66 Z10.99
+G1 X32.82 Y-59.05 Z10.99
+G1 X32.82 Y-63.25 Z10.99
+G1 X35.22 Y-64.64 Z10.99
+
+T1
+G1 X34.67 Y-68.10 Z11.99
+G1 X34.67 Y-58.30 Z11.99
+G1 X34.67 Y-44.84 Z11.99
+G1 X15.07 Y-44.84 Z11.99
+G1 X-28.59 Y-44.84 Z11.99
+G1 X-28.59 Y-54.64 Z11.99
+G1 X-28.59 Y-68.10 Z11.99
+G1 X-8.99 Y-68.10 Z11.99
+G1 X34.67 Y-68.10 Z11.99
+G1 X34.67 Y-68.10 Z11.99
+G1 X-26.42 Y-44.84 Z11.99
+G1 X-26.42 Y-45.25 Z11.99
+G1 X-28.59 Y-46.51 Z11.99
+G1 X-28.59 Y-51.80 Z11.99
+G1 X-26.42 Y-53.05 Z11.99
+G1 X-26.42 Y-57.25 Z11.99
+G1 X-28.59 Y-58.51 Z11.99
+G1 X-28.59 Y-63.80 Z11.99
+G1 X-26.42 Y-65.05 Z11.99
+G1 X-26.42 Y-68.10 Z11.99
+G1 X-26.07 Y-68.10 Z11.99
+G1 X-26.07 Y-65.05 Z11.99
+G1 X-22.95 Y-63.25 Z11.99
+G1 X-22.95 Y-59.05 Z11.99
+G1 X-26.07 Y-57.25 Z11.99
+G1 X-26.07 Y-53.05 Z11.99
+G1 X-22.95 Y-51.25 Z11.99
+G1 X-22.95 Y-47.05 Z11.99
+G1 X-26.07 Y-45.25 Z11.99
+G1 X-26.07 Y-44.84 Z11.99
+G1 X-19.49 Y-44.84 Z11.99
+G1 X-19.49 Y-45.25 Z11.99
+G1 X-22.61 Y-47.05 Z11.99
+G1 X-22.61 Y-51.25 Z11.99
+G1 X-19.49 Y-53.05 Z11.99
+G1 X-19.49 Y-57.25 Z11.99
+G1 X-22.61 Y-59.05 Z11.99
+G1 X-22.61 Y-63.25 Z11.99
+G1 X-19.49 Y-65.05 Z11.99
+G1 X-19.49 Y-68.10 Z11.99
+G1 X-19.14 Y-68.10 Z11.99
+G1 X-19.14 Y-65.05 Z11.99
+G1 X-16.02 Y-63.25 Z11.99
+G1 X-16.02 Y-59.05 Z11.99
+G1 X-19.14 Y-57.25 Z11.99
+G1 X-19.14 Y-53.05 Z11.99
+G1 X-16.02 Y-51.25 Z11.99
+G1 X-16.02 Y-47.05 Z11.99
+G1 X-19.14 Y-45.25 Z11.99
+G1 X-19.14 Y-44.84 Z11.99
+G1 X-12.56 Y-44.84 Z11.99
+G1 X-12.56 Y-45.25 Z11.99
+G1 X-15.68 Y-47.05 Z11.99
+G1 X-15.68 Y-51.25 Z11.99
+G1 X-12.56 Y-53.05 Z11.99
+G1 X-12.56 Y-57.25 Z11.99
+G1 X-15.68 Y-59.05 Z11.99
+G1 X-15.68 Y-63.25 Z11.99
+G1 X-12.56 Y-65.05 Z11.99
+G1 X-12.56 Y-68.10 Z11.99
+G1 X-12.21 Y-68.10 Z11.99
+G1 X-12.21 Y-65.05 Z11.99
+G1 X-9.10 Y-63.25 Z11.99
+G1 X-9.10 Y-59.05 Z11.99
+G1 X-12.21 Y-57.25 Z11.99
+G1 X-12.21 Y-53.05 Z11.99
+G1 X-9.10 Y-51.25 Z11.99
+G1 X-9.10 Y-47.05 Z11.99
+G1 X-12.21 Y-45.25 Z11.99
+G1 X-12.21 Y-44.84 Z11.99
+G1 X-5.63 Y-44.84 Z11.99
+G1 X-5.63 Y-45.25 Z11.99
+G1 X-8.75 Y-47.05 Z11.99
+G1 X-8.75 Y-51.25 Z11.99
+G1 X-5.63 Y-53.05 Z11.99
+G1 X-5.63 Y-57.25 Z11.99
+G1 X-8.75 Y-59.05 Z11.99
+G1 X-8.75 Y-63.25 Z11.99
+G1 X-5.63 Y-65.05 Z11.99
+G1 X-5.63 Y-68.10 Z11.99
+G1 X-5.28 Y-68.10 Z11.99
+G1 X-5.28 Y-65.05 Z11.99
+G1 X-2.17 Y-63.25 Z11.99
+G1 X-2.17 Y-59.05 Z11.99
+G1 X-5.28 Y-57.25 Z11.99
+G1 X-5.28 Y-53.05 Z11.99
+G1 X-2.17 Y-51.25 Z11.99
+G1 X-2.17 Y-47.05 Z11.99
+G1 X-5.28 Y-45.25 Z11.99
+G1 X-5.28 Y-44.84 Z11.99
+G1 X1.30 Y-44.84 Z11.99
+G1 X1.30 Y-45.25 Z11.99
+G1 X-1.82 Y-47.05 Z11.99
+G1 X-1.82 Y-51.25 Z11.99
+G1 X1.30 Y-53.05 Z11.99
+G1 X1.30 Y-57.25 Z11.99
+G1 X-1.82 Y-59.05 Z11.99
+G1 X-1.82 Y-63.25 Z11.99
+G1 X1.30 Y-65.05 Z11.99
+G1 X1.30 Y-68.10 Z11.99
+G1 X1.64 Y-68.10 Z11.99
+G1 X1.64 Y-65.05 Z11.99
+G1 X4.76 Y-63.25 Z11.99
+G1 X4.76 Y-59.05 Z11.99
+G1 X1.64 Y-57.25 Z11.99
+G1 X1.64 Y-53.05 Z11.99
+G1 X4.76 Y-51.25 Z11.99
+G1 X4.76 Y-47.05 Z11.99
+G1 X1.64 Y-45.25 Z11.99
+G1 X1.64 Y-44.84 Z11.99
+G1 X8.22 Y-44.84 Z11.99
+G1 X8.22 Y-45.25 Z11.99
+G1 X5.11 Y-47.05 Z11.99
+G1 X5.11 Y-51.25 Z11.99
+G1 X8.22 Y-53.05 Z11.99
+G1 X8.22 Y-57.25 Z11.99
+G1 X5.11 Y-59.05 Z11.99
+G1 X5.11 Y-63.25 Z11.99
+G1 X8.22 Y-65.05 Z11.99
+G1 X8.22 Y-68.10 Z11.99
+G1 X8.57 Y-68.10 Z11.99
+G1 X8.57 Y-65.05 Z11.99
+G1 X11.69 Y-63.25 Z11.99
+G1 X11.69 Y-59.05 Z11.99
+G1 X8.57 Y-57.25 Z11.99
+G1 X8.57 Y-53.05 Z11.99
+G1 X11.69 Y-51.25 Z11.99
+G1 X11.69 Y-47.05 Z11.99
+G1 X8.57 Y-45.25 Z11.99
+G1 X8.57 Y-44.84 Z11.99
+G1 X15.15 Y-44.84 Z11.99
+G1 X15.15 Y-45.25 Z11.99
+G1 X12.03 Y-47.05 Z11.99
+G1 X12.03 Y-51.25 Z11.99
+G1 X15.15 Y-53.05 Z11.99
+G1 X15.15 Y-57.25 Z11.99
+G1 X12.03 Y-59.05 Z11.99
+G1 X12.03 Y-63.25 Z11.99
+G1 X15.15 Y-65.05 Z11.99
+G1 X15.15 Y-68.10 Z11.99
+G1 X15.50 Y-68.10 Z11.99
+G1 X15.50 Y-65.05 Z11.99
+G1 X18.62 Y-63.25 Z11.99
+G1 X18.62 Y-59.05 Z11.99
+G1 X15.50 Y-57.25 Z11.99
+G1 X15.50 Y-53.05 Z11.99
+G1 X18.62 Y-51.25 Z11.99
+G1 X18.62 Y-47.05 Z11.99
+G1 X15.50 Y-45.25 Z11.99
+G1 X15.50 Y-44.84 Z11.99
+G1 X22.08 Y-44.84 Z11.99
+G1 X22.08 Y-45.25 Z11.99
+G1 X18.96 Y-47.05 Z11.99
+G1 X18.96 Y-51.25 Z11.99
+G1 X22.08 Y-53.05 Z11.99
+G1 X22.08 Y-57.25 Z11.99
+G1 X18.96 Y-59.05 Z11.99
+G1 X18.96 Y-63.25 Z11.99
+G1 X22.08 Y-65.05 Z11.99
+G1 X22.08 Y-68.10 Z11.99
+G1 X22.43 Y-68.10 Z11.99
+G1 X22.43 Y-65.05 Z11.99
+G1 X25.54 Y-63.25 Z11.99
+G1 X25.54 Y-59.05 Z11.99
+G1 X22.43 Y-57.25 Z11.99
+G1 X22.43 Y-53.05 Z11.99
+G1 X25.54 Y-51.25 Z11.99
+G1 X25.54 Y-47.05 Z11.99
+G1 X22.43 Y-45.25 Z11.99
+G1 X22.43 Y-44.84 Z11.99
+G1 X29.01 Y-44.84 Z11.99
+G1 X29.01 Y-45.25 Z11.99
+G1 X25.89 Y-47.05 Z11.99
+G1 X25.89 Y-51.25 Z11.99
+G1 X29.01 Y-53.05 Z11.99
+G1 X29.01 Y-57.25 Z11.99
+G1 X25.89 Y-59.05 Z11.99
+G1 X25.89 Y-63.25 Z11.99
+G1 X29.01 Y-65.05 Z11.99
+G1 X29.01 Y-68.10 Z11.99
+G1 X29.36 Y-68.10 Z11.99
+G1 X29.36 Y-65.05 Z11.99
+G1 X32.47 Y-63.25 Z11.99
+G1 X32.47 Y-59.05 Z11.99
+G1 X29.36 Y-57.25 Z11.99
+G1 X29.36 Y-53.05 Z11.99
+G1 X32.47 Y-51.25 Z11.99
+G1 X32.47 Y-47.05 Z11.99
+G1 X29.36 Y-45.25 Z11.99
+G1 X29.36 Y-44.84 Z11.99
+G1 X34.67 Y-45.98 Z11.99
+G1 X32.82 Y-47.05 Z11.99
+G1 X32.82 Y-51.25 Z11.99
+G1 X34.67 Y-52.32 Z11.99
+G1 X34.67 Y-57.98 Z11.99
+G1 X32.82 Y-59.05 Z11.99
+G1 X32.82 Y-63.25 Z11.99
+G1 X34.67 Y-64.32 Z11.99
+
+T1
+G1 X34.12 Y-67.55 Z12.99
+G1 X34.12 Y-59.75 Z12.99
+G1 X34.12 Y-45.39 Z12.99
+G1 X18.52 Y-45.39 Z12.99
+G1 X-28.04 Y-45.39 Z12.99
+G1 X-28.04 Y-53.19 Z12.99
+G1 X-28.04 Y-67.55 Z12.99
+G1 X-12.44 Y-67.55 Z12.99
+G1 X34.12 Y-67.55 Z12.99
+G1 X34.12 Y-67.55 Z12.99
+G1 X-26.66 Y-45.39 Z12.99
+G1 X-28.04 Y-46.19 Z12.99
+G1 X-28.04 Y-52.12 Z12.99
+G1 X-26.42 Y-53.05 Z12.99
+G1 X-26.42 Y-57.25 Z12.99
+G1 X-28.04 Y-58.19 Z12.99
+G1 X-28.04 Y-64.12 Z12.99
+G1 X-26.42 Y-65.05 Z12.99
+G1 X-26.42 Y-67.55 Z12.99
+G1 X-26.07 Y-67.55 Z12.99
+G1 X-26.07 Y-65.05 Z12.99
+G1 X-22.95 Y-63.25 Z12.99
+G1 X-22.95 Y-59.05 Z12.99
+G1 X-26.07 Y-57.25 Z12.99
+G1 X-26.07 Y-53.05 Z12.99
+G1 X-22.95 Y-51.25 Z12.99
+G1 X-22.95 Y-47.05 Z12.99
+G1 X-25.82 Y-45.39 Z12.99
+G1 X-19.74 Y-45.39 Z12.99
+G1 X-22.61 Y-47.05 Z12.99
+G1 X-22.61 Y-51.25 Z12.99
+G1 X-19.49 Y-53.05 Z12.99
+G1 X-19.49 Y-57.25 Z12.99
+G1 X-22.61 Y-59.05 Z12.99
+G1 X-22.61 Y-63.25 Z12.99
+G1 X-19.49 Y-65.05 Z12.99
+G1 X-19.49 Y-67.55 Z12.99
+G1 X-19.14 Y-67.55 Z12.99
+G1 X-19.14 Y-65.05 Z12.99
+G1 X-16.02 Y-63.25 Z12.99
+G1 X-16.02 Y-59.05 Z12.99
+G1 X-19.14 Y-57.25 Z12.99
+G1 X-19.14 Y-53.05 Z12.99
+G1 X-16.02 Y-51.25 Z12.99
+G1 X-16.02 Y-47.05 Z12.99
+G1 X-18.89 Y-45.39 Z12.99
+G1 X-12.81 Y-45.39 Z12.99
+G1 X-15.68 Y-47.05 Z12.99
+G1 X-15.68 Y-51.25 Z12.99
+G1 X-12.56 Y-53.05 Z12.99
+G1 X-12.56 Y-57.25 Z12.99
+G1 X-15.68 Y-59.05 Z12.99
+G1 X-15.68 Y-63.25 Z12.99
+G1 X-12.56 Y-65.05 Z12.99
+G1 X-12.56 Y-67.55 Z12.99
+G1 X-12.21 Y-67.55 Z12.99
+G1 X-12.21 Y-65.05 Z12.99
+G1 X-9.10 Y-63.25 Z12.99
+G1 X-9.10 Y-59.05 Z12.99
+G1 X-12.21 Y-57.25 Z12.99
+G1 X-12.21 Y-53.05 Z12.99
+G1 X-9.10 Y-51.25 Z12.99
+G1 X-9.10 Y-47.05 Z12.99
+G1 X-11.97 Y-45.39 Z12.99
+G1 X-5.88 Y-45.39 Z12.99
+G1 X-8.75 Y-47.05 Z12.99
+G1 X-8.75 Y-51.25 Z12.99
+G1 X-5.63 Y-53.05 Z12.99
+G1 X-5.63 Y-57.25 Z12.99
+G1 X-8.75 Y-59.05 Z12.99
+G1 X-8.75 Y-63.25 Z12.99
+G1 X-5.63 Y-65.05 Z12.99
+G1 X-5.63 Y-67.55 Z12.99
+G1 X-5.28 Y-67.55 Z12.99
+G1 X-5.28 Y-65.05 Z12.99
+G1 X-2.17 Y-63.25 Z12.99
+G1 X-2.17 Y-59.05 Z12.99
+G1 X-5.28 Y-57.25 Z12.99
+G1 X-5.28 Y-53.05 Z12.99
+G1 X-2.17 Y-51.25 Z12.99
+G1 X-2.17 Y-47.05 Z12.99
+G1 X-5.04 Y-45.39 Z12.99
+G1 X1.05 Y-45.39 Z12.99
+G1 X-1.82 Y-47.05 Z12.99
+G1 X-1.82 Y-51.25 Z12.99
+G1 X1.30 Y-53.05 Z12.99
+G1 X1.30 Y-57.25 Z12.99
+G1 X-1.82 Y-59.05 Z12.99
+G1 X-1.82 Y-63.25 Z12.99
+G1 X1.30 Y-65.05 Z12.99
+G1 X1.30 Y-67.55 Z12.99
+G1 X1.64 Y-67.55 Z12.99
+G1 X1.64 Y-65.05 Z12.99
+G1 X4.76 Y-63.25 Z12.99
+G1 X4.76 Y-59.05 Z12.99
+G1 X1.64 Y-57.25 Z12.99
+G1 X1.64 Y-53.05 Z12.99
+G1 X4.76 Y-51.25 Z12.99
+G1 X4.76 Y-47.05 Z12.99
+G1 X1.89 Y-45.39 Z12.99
+G1 X7.98 Y-45.39 Z12.99
+G1 X5.11 Y-47.05 Z12.99
+G1 X5.11 Y-51.25 Z12.99
+G1 X8.22 Y-53.05 Z12.99
+G1 X8.22 Y-57.25 Z12.99
+G1 X5.11 Y-59.05 Z12.99
+G1 X5.11 Y-63.25 Z12.99
+G1 X8.22 Y-65.05 Z12.99
+G1 X8.22 Y-67.55 Z12.99
+G1 X8.57 Y-67.55 Z12.99
+G1 X8.57 Y-65.05 Z12.99
+G1 X11.69 Y-63.25 Z12.99
+G1 X11.69 Y-59.05 Z12.99
+G1 X8.57 Y-57.25 Z12.99
+G1 X8.57 Y-53.05 Z12.99
+G1 X11.69 Y-51.25 Z12.99
+G1 X11.69 Y-47.05 Z12.99
+G1 X8.82 Y-45.39 Z12.99
+G1 X14.91 Y-45.39 Z12.99
+G1 X12.03 Y-47.05 Z12.99
+G1 X12.03 Y-51.25 Z12.99
+G1 X15.15 Y-53.05 Z12.99
+G1 X15.15 Y-57.25 Z12.99
+G1 X12.03 Y-59.05 Z12.99
+G1 X12.03 Y-63.25 Z12.99
+G1 X15.15 Y-65.05 Z12.99
+G1 X15.15 Y-67.55 Z12.99
+G1 X15.50 Y-67.55 Z12.99
+G1 X15.50 Y-65.05 Z12.99
+G1 X18.62 Y-63.25 Z12.99
+G1 X18.62 Y-59.05 Z12.99
+G1 X15.50 Y-57.25 Z12.99
+G1 X15.50 Y-53.05 Z12.99
+G1 X18.62 Y-51.25 Z12.99
+G1 X18.62 Y-47.05 Z12.99
+G1 X15.75 Y-45.39 Z12.99
+G1 X21.83 Y-45.39 Z12.99
+G1 X18.96 Y-47.05 Z12.99
+G1 X18.96 Y-51.25 Z12.99
+G1 X22.08 Y-53.05 Z12.99
+G1 X22.08 Y-57.25 Z12.99
+G1 X18.96 Y-59.05 Z12.99
+G1 X18.96 Y-63.25 Z12.99
+G1 X22.08 Y-65.05 Z12.99
+G1 X22.08 Y-67.55 Z12.99
+G1 X22.43 Y-67.55 Z12.99
+G1 X22.43 Y-65.05 Z12.99
+G1 X25.54 Y-63.25 Z12.99
+G1 X25.54 Y-59.05 Z12.99
+G1 X22.43 Y-57.25 Z12.99
+G1 X22.43 Y-53.05 Z12.99
+G1 X25.54 Y-51.25 Z12.99
+G1 X25.54 Y-47.05 Z12.99
+G1 X22.68 Y-45.39 Z12.99
+G1 X28.76 Y-45.39 Z12.99
+G1 X25.89 Y-47.05 Z12.99
+G1 X25.89 Y-51.25 Z12.99
+G1 X29.01 Y-53.05 Z12.99
+G1 X29.01 Y-57.25 Z12.99
+G1 X25.89 Y-59.05 Z12.99
+G1 X25.89 Y-63.25 Z12.99
+G1 X29.01 Y-65.05 Z12.99
+G1 X29.01 Y-67.55 Z12.99
+G1 X29.36 Y-67.55 Z12.99
+G1 X29.36 Y-65.05 Z12.99
+G1 X32.47 Y-63.25 Z12.99
+G1 X32.47 Y-59.05 Z12.99
+G1 X29.36 Y-57.25 Z12.99
+G1 X29.36 Y-53.05 Z12.99
+G1 X32.47 Y-51.25 Z12.99
+G1 X32.47 Y-47.05 Z12.99
+G1 X29.60 Y-45.39 Z12.99
+G1 X34.12 Y-46.30 Z12.99
+G1 X32.82 Y-47.05 Z12.99
+G1 X32.82 Y-51.25 Z12.99
+G1 X34.12 Y-52.00 Z12.99
+G1 X34.12 Y-58.30 Z12.99
+G1 X32.82 Y-59.05 Z12.99
+G1 X32.82 Y-63.25 Z12.99
+G1 X34.12 Y-64.00 Z12.99
+
+T1
+G1 X33.56 Y-66.99 Z13.99
+G1 X33.56 Y-61.19 Z13.99
+G1 X33.56 Y-45.95 Z13.99
+G1 X21.96 Y-45.95 Z13.99
+G1 X-27.48 Y-45.95 Z13.99
+G1 X-27.48 Y-51.75 Z13.99
+G1 X-27.48 Y-66.99 Z13.99
+G1 X-15.88 Y-66.99 Z13.99
+G1 X33.56 Y-66.99 Z13.99
+G1 X33.56 Y-66.99 Z13.99
+G1 X-27.48 Y-52.44 Z13.99
+G1 X-26.42 Y-53.05 Z13.99
+G1 X-26.42 Y-57.25 Z13.99
+G1 X-27.48 Y-57.87 Z13.99
+G1 X-27.48 Y-64.44 Z13.99
+G1 X-26.42 Y-65.05 Z13.99
+G1 X-26.42 Y-66.99 Z13.99
+G1 X-26.07 Y-66.99 Z13.99
+G1 X-26.07 Y-65.05 Z13.99
+G1 X-22.95 Y-63.25 Z13.99
+G1 X-22.95 Y-59.05 Z13.99
+G1 X-26.07 Y-57.25 Z13.99
+G1 X-26.07 Y-53.05 Z13.99
+G1 X-22.95 Y-51.25 Z13.99
+G1 X-22.95 Y-47.05 Z13.99
+G1 X-24.86 Y-45.95 Z13.99
+G1 X-20.70 Y-45.95 Z13.99
+G1 X-22.61 Y-47.05 Z13.99
+G1 X-22.61 Y-51.25 Z13.99
+G1 X-19.49 Y-53.05 Z13.99
+G1 X-19.49 Y-57.25 Z13.99
+G1 X-22.61 Y-59.05 Z13.99
+G1 X-22.61 Y-63.25 Z13.99
+G1 X-19.49 Y-65.05 Z13.99
+G1 X-19.49 Y-66.99 Z13.99
+G1 X-19.14 Y-66.99 Z13.99
+G1 X-19.14 Y-65.05 Z13.99
+G1 X-16.02 Y-63.25 Z13.99
+G1 X-16.02 Y-59.05 Z13.99
+G1 X-19.14 Y-57.25 Z13.99
+G1 X-19.14 Y-53.05 Z13.99
+G1 X-16.02 Y-51.25 Z13.99
+G1 X-16.02 Y-47.05 Z13.99
+G1 X-17.93 Y-45.95 Z13.99
+G1 X-13.77 Y-45.95 Z13.99
+G1 X-15.68 Y-47.05 Z13.99
+G1 X-15.68 Y-51.25 Z13.99
+G1 X-12.56 Y-53.05 Z13.99
+G1 X-12.56 Y-57.25 Z13.99
+G1 X-15.68 Y-59.05 Z13.99
+G1 X-15.68 Y-63.25 Z13.99
+G1 X-12.56 Y-65.05 Z13.99
+G1 X-12.56 Y-66.99 Z13.99
+G1 X-12.21 Y-66.99 Z13.99
+G1 X-12.21 Y-65.05 Z13.99
+G1 X-9.10 Y-63.25 Z13.99
+G1 X-9.10 Y-59.05 Z13.99
+G1 X-12.21 Y-57.25 Z13.99
+G1 X-12.21 Y-53.05 Z13.99
+G1 X-9.10 Y-51.25 Z13.99
+G1 X-9.10 Y-47.05 Z13.99
+G1 X-11.00 Y-45.95 Z13.99
+G1 X-6.84 Y-45.95 Z13.99
+G1 X-8.75 Y-47.05 Z13.99
+G1 X-8.75 Y-51.25 Z13.99
+G1 X-5.63 Y-53.05 Z13.99
+G1 X-5.63 Y-57.25 Z13.99
+G1 X-8.75 Y-59.05 Z13.99
+G1 X-8.75 Y-63.25 Z13.99
+G1 X-5.63 Y-65.05 Z13.99
+G1 X-5.63 Y-66.99 Z13.99
+G1 X-5.28 Y-66.99 Z13.99
+G1 X-5.28 Y-65.05 Z13.99
+G1 X-2.17 Y-63.25 Z13.99
+G1 X-2.17 Y-59.05 Z13.99
+G1 X-5.28 Y-57.25 Z13.99
+G1 X-5.28 Y-53.05 Z13.99
+G1 X-2.17 Y-51.25 Z13.99
+G1 X-2.17 Y-47.05 Z13.99
+G1 X-4.08 Y-45.95 Z13.99
+G1 X0.09 Y-45.95 Z13.99
+G1 X-1.82 Y-47.05 Z13.99
+G1 X-1.82 Y-51.25 Z13.99
+G1 X1.30 Y-53.05 Z13.99
+G1 X1.30 Y-57.25 Z13.99
+G1 X-1.82 Y-59.05 Z13.99
+G1 X-1.82 Y-63.25 Z13.99
+G1 X1.30 Y-65.05 Z13.99
+G1 X1.30 Y-66.99 Z13.99
+G1 X1.64 Y-66.99 Z13.99
+G1 X1.64 Y-65.05 Z13.99
+G1 X4.76 Y-63.25 Z13.99
+G1 X4.76 Y-59.05 Z13.99
+G1 X1.64 Y-57.25 Z13.99
+G1 X1.64 Y-53.05 Z13.99
+G1 X4.76 Y-51.25 Z13.99
+G1 X4.76 Y-47.05 Z13.99
+G1 X2.85 Y-45.95 Z13.99
+G1 X7.02 Y-45.95 Z13.99
+G1 X5.11 Y-47.05 Z13.99
+G1 X5.11 Y-51.25 Z13.99
+G1 X8.22 Y-53.05 Z13.99
+G1 X8.22 Y-57.25 Z13.99
+G1 X5.11 Y-59.05 Z13.99
+G1 X5.11 Y-63.25 Z13.99
+G1 X8.22 Y-65.05 Z13.99
+G1 X8.22 Y-66.99 Z13.99
+G1 X8.57 Y-66.99 Z13.99
+G1 X8.57 Y-65.05 Z13.99
+G1 X11.69 Y-63.25 Z13.99
+G1 X11.69 Y-59.05 Z13.99
+G1 X8.57 Y-57.25 Z13.99
+G1 X8.57 Y-53.05 Z13.99
+G1 X11.69 Y-51.25 Z13.99
+G1 X11.69 Y-47.05 Z13.99
+G1 X9.78 Y-45.95 Z13.99
+G1 X13.94 Y-45.95 Z13.99
+G1 X12.03 Y-47.05 Z13.99
+G1 X12.03 Y-51.25 Z13.99
+G1 X15.15 Y-53.05 Z13.99
+G1 X15.15 Y-57.25 Z13.99
+G1 X12.03 Y-59.05 Z13.99
+G1 X12.03 Y-63.25 Z13.99
+G1 X15.15 Y-65.05 Z13.99
+G1 X15.15 Y-66.99 Z13.99
+G1 X15.50 Y-66.99 Z13.99
+G1 X15.50 Y-65.05 Z13.99
+G1 X18.62 Y-63.25 Z13.99
+G1 X18.62 Y-59.05 Z13.99
+G1 X15.50 Y-57.25 Z13.99
+G1 X15.50 Y-53.05 Z13.99
+G1 X18.62 Y-51.25 Z13.99
+G1 X18.62 Y-47.05 Z13.99
+G1 X16.71 Y-45.95 Z13.99
+G1 X20.87 Y-45.95 Z13.99
+G1 X18.96 Y-47.05 Z13.99
+G1 X18.96 Y-51.25 Z13.99
+G1 X22.08 Y-53.05 Z13.99
+G1 X22.08 Y-57.25 Z13.99
+G1 X18.96 Y-59.05 Z13.99
+G1 X18.96 Y-63.25 Z13.99
+G1 X22.08 Y-65.05 Z13.99
+G1 X22.08 Y-66.99 Z13.99
+G1 X22.43 Y-66.99 Z13.99
+G1 X22.43 Y-65.05 Z13.99
+G1 X25.54 Y-63.25 Z13.99
+G1 X25.54 Y-59.05 Z13.99
+G1 X22.43 Y-57.25 Z13.99
+G1 X22.43 Y-53.05 Z13.99
+G1 X25.54 Y-51.25 Z13.99
+G1 X25.54 Y-47.05 Z13.99
+G1 X23.64 Y-45.95 Z13.99
+G1 X27.80 Y-45.95 Z13.99
+G1 X25.89 Y-47.05 Z13.99
+G1 X25.89 Y-51.25 Z13.99
+G1 X29.01 Y-53.05 Z13.99
+G1 X29.01 Y-57.25 Z13.99
+G1 X25.89 Y-59.05 Z13.99
+G1 X25.89 Y-63.25 Z13.99
+G1 X29.01 Y-65.05 Z13.99
+G1 X29.01 Y-66.99 Z13.99
+G1 X29.36 Y-66.99 Z13.99
+G1 X29.36 Y-65.05 Z13.99
+G1 X32.47 Y-63.25 Z13.99
+G1 X32.47 Y-59.05 Z13.99
+G1 X29.36 Y-57.25 Z13.99
+G1 X29.36 Y-53.05 Z13.99
+G1 X32.47 Y-51.25 Z13.99
+G1 X32.47 Y-47.05 Z13.99
+G1 X30.56 Y-45.95 Z13.99
+G1 X33.56 Y-46.62 Z13.99
+G1 X32.82 Y-47.05 Z13.99
+G1 X32.82 Y-51.25 Z13.99
+G1 X33.56 Y-51.68 Z13.99
+G1 X33.56 Y-58.62 Z13.99
+G1 X32.82 Y-59.05 Z13.99
+G1 X32.82 Y-63.25 Z13.99
+G1 X33.56 Y-63.68 Z13.99
+
+T1
+G1 X33.01 Y-66.44 Z14.99
+G1 X33.01 Y-62.64 Z14.99
+G1 X33.01 Y-46.50 Z14.99
+G1 X25.41 Y-46.50 Z14.99
+G1 X-26.93 Y-46.50 Z14.99
+G1 X-26.93 Y-50.30 Z14.99
+G1 X-26.93 Y-66.44 Z14.99
+G1 X-19.33 Y-66.44 Z14.99
+G1 X33.01 Y-66.44 Z14.99
+G1 X33.01 Y-66.44 Z14.99
+G1 X-26.93 Y-52.76 Z14.99
+G1 X-26.42 Y-53.05 Z14.99
+G1 X-26.42 Y-57.25 Z14.99
+G1 X-26.93 Y-57.55 Z14.99
+G1 X-26.93 Y-64.76 Z14.99
+G1 X-26.42 Y-65.05 Z14.99
+G1 X-26.42 Y-66.44 Z14.99
+G1 X-26.07 Y-66.44 Z14.99
+G1 X-26.07 Y-65.05 Z14.99
+G1 X-22.95 Y-63.25 Z14.99
+G1 X-22.95 Y-59.05 Z14.99
+G1 X-26.07 Y-57.25 Z14.99
+G1 X-26.07 Y-53.05 Z14.99
+G1 X-22.95 Y-51.25 Z14.99
+G1 X-22.95 Y-47.05 Z14.99
+G1 X-23.90 Y-46.50 Z14.99
+G1 X-21.66 Y-46.50 Z14.99
+G1 X-22.61 Y-47.05 Z14.99
+G1 X-22.61 Y-51.25 Z14.99
+G1 X-19.49 Y-53.05 Z14.99
+G1 X-19.49 Y-57.25 Z14.99
+G1 X-22.61 Y-59.05 Z14.99
+G1 X-22.61 Y-63.25 Z14.99
+G1 X-19.49 Y-65.05 Z14.99
+G1 X-19.49 Y-66.44 Z14.99
+G1 X-19.14 Y-66.44 Z14.99
+G1 X-19.14 Y-65.05 Z14.99
+G1 X-16.02 Y-63.25 Z14.99
+G1 X-16.02 Y-59.05 Z14.99
+G1 X-19.14 Y-57.25 Z14.99
+G1 X-19.14 Y-53.05 Z14.99
+G1 X-16.02 Y-51.25 Z14.99
+G1 X-16.02 Y-47.05 Z14.99
+G1 X-16.97 Y-46.50 Z14.99
+G1 X-14.73 Y-46.50 Z14.99
+G1 X-15.68 Y-47.05 Z14.99
+G1 X-15.68 Y-51.25 Z14.99
+G1 X-12.56 Y-53.05 Z14.99
+G1 X-12.56 Y-57.25 Z14.99
+G1 X-15.68 Y-59.05 Z14.99
+G1 X-15.68 Y-63.25 Z14.99
+G1 X-12.56 Y-65.05 Z14.99
+G1 X-12.56 Y-66.44 Z14.99
+G1 X-12.21 Y-66.44 Z14.99
+G1 X-12.21 Y-65.05 Z14.99
+G1 X-9.10 Y-63.25 Z14.99
+G1 X-9.10 Y-59.05 Z14.99
+G1 X-12.21 Y-57.25 Z14.99
+G1 X-12.21 Y-53.05 Z14.99
+G1 X-9.10 Y-51.25 Z14.99
+G1 X-9.10 Y-47.05 Z14.99
+G1 X-10.05 Y-46.50 Z14.99
+G1 X-7.80 Y-46.50 Z14.99
+G1 X-8.75 Y-47.05 Z14.99
+G1 X-8.75 Y-51.25 Z14.99
+G1 X-5.63 Y-53.05 Z14.99
+G1 X-5.63 Y-57.25 Z14.99
+G1 X-8.75 Y-59.05 Z14.99
+G1 X-8.75 Y-63.25 Z14.99
+G1 X-5.63 Y-65.05 Z14.99
+G1 X-5.63 Y-66.44 Z14.99
+G1 X-5.28 Y-66.44 Z14.99
+G1 X-5.28 Y-65.05 Z14.99
+G1 X-2.17 Y-63.25 Z14.99
+G1 X-2.17 Y-59.05 Z14.99
+G1 X-5.28 Y-57.25 Z14.99
+G1 X-5.28 Y-53.05 Z14.99
+G1 X-2.17 Y-51.25 Z14.99
+G1 X-2.17 Y-47.05 Z14.99
+G1 X-3.12 Y-46.50 Z14.99
+G1 X-0.87 Y-46.50 Z14.99
+G1 X-1.82 Y-47.05 Z14.99
+G1 X-1.82 Y-51.25 Z14.99
+G1 X1.30 Y-53.05 Z14.99
+G1 X1.30 Y-57.25 Z14.99
+G1 X-1.82 Y-59.05 Z14.99
+G1 X-1.82 Y-63.25 Z14.99
+G1 X1.30 Y-65.05 Z14.99
+G1 X1.30 Y-66.44 Z14.99
+G1 X1.64 Y-66.44 Z14.99
+G1 X1.64 Y-65.05 Z14.99
+G1 X4.76 Y-63.25 Z14.99
+G1 X4.76 Y-59.05 Z14.99
+G1 X1.64 Y-57.25 Z14.99
+G1 X1.64 Y-53.05 Z14.99
+G1 X4.76 Y-51.25 Z14.99
+G1 X4.76 Y-47.05 Z14.99
+G1 X3.81 Y-46.50 Z14.99
+G1 X6.06 Y-46.50 Z14.99
+G1 X5.11 Y-47.05 Z14.99
+G1 X5.11 Y-51.25 Z14.99
+G1 X8.22 Y-53.05 Z14.99
+G1 X8.22 Y-57.25 Z14.99
+G1 X5.11 Y-59.05 Z14.99
+G1 X5.11 Y-63.25 Z14.99
+G1 X8.22 Y-65.05 Z14.99
+G1 X8.22 Y-66.44 Z14.99
+G1 X8.57 Y-66.44 Z14.99
+G1 X8.57 Y-65.05 Z14.99
+G1 X11.69 Y-63.25 Z14.99
+G1 X11.69 Y-59.05 Z14.99
+G1 X8.57 Y-57.25 Z14.99
+G1 X8.57 Y-53.05 Z14.99
+G1 X11.69 Y-51.25 Z14.99
+G1 X11.69 Y-47.05 Z14.99
+G1 X10.74 Y-46.50 Z14.99
+G1 X12.98 Y-46.50 Z14.99
+G1 X12.03 Y-47.05 Z14.99
+G1 X12.03 Y-51.25 Z14.99
+G1 X15.15 Y-53.05 Z14.99
+G1 X15.15 Y-57.25 Z14.99
+G1 X12.03 Y-59.05 Z14.99
+G1 X12.03 Y-63.25 Z14.99
+G1 X15.15 Y-65.05 Z14.99
+G1 X15.15 Y-66.44 Z14.99
+G1 X15.50 Y-66.44 Z14.99
+G1 X15.50 Y-65.05 Z14.99
+G1 X18.62 Y-63.25 Z14.99
+G1 X18.62 Y-59.05 Z14.99
+G1 X15.50 Y-57.25 Z14.99
+G1 X15.50 Y-53.05 Z14.99
+G1 X18.62 Y-51.25 Z14.99
+G1 X18.62 Y-47.05 Z14.99
+G1 X17.67 Y-46.50 Z14.99
+G1 X19.91 Y-46.50 Z14.99
+G1 X18.96 Y-47.05 Z14.99
+G1 X18.96 Y-51.25 Z14.99
+G1 X22.08 Y-53.05 Z14.99
+G1 X22.08 Y-57.25 Z14.99
+G1 X18.96 Y-59.05 Z14.99
+G1 X18.96 Y-63.25 Z14.99
+G1 X22.08 Y-65.05 Z14.99
+G1 X22.08 Y-66.44 Z14.99
+G1 X22.43 Y-66.44 Z14.99
+G1 X22.43 Y-65.05 Z14.99
+G1 X25.54 Y-63.25 Z14.99
+G1 X25.54 Y-59.05 Z14.99
+G1 X22.43 Y-57.25 Z14.99
+G1 X22.43 Y-53.05 Z14.99
+G1 X25.54 Y-51.25 Z14.99
+G1 X25.54 Y-47.05 Z14.99
+G1 X24.60 Y-46.50 Z14.99
+G1 X26.84 Y-46.50 Z14.99
+G1 X25.89 Y-47.05 Z14.99
+G1 X25.89 Y-51.25 Z14.99
+G1 X29.01 Y-53.05 Z14.99
+G1 X29.01 Y-57.25 Z14.99
+G1 X25.89 Y-59.05 Z14.99
+G1 X25.89 Y-63.25 Z14.99
+G1 X29.01 Y-65.05 Z14.99
+G1 X29.01 Y-66.44 Z14.99
+G1 X29.36 Y-66.44 Z14.99
+G1 X29.36 Y-65.05 Z14.99
+G1 X32.47 Y-63.25 Z14.99
+G1 X32.47 Y-59.05 Z14.99
+G1 X29.36 Y-57.25 Z14.99
+G1 X29.36 Y-53.05 Z14.99
+G1 X32.47 Y-51.25 Z14.99
+G1 X32.47 Y-47.05 Z14.99
+G1 X31.52 Y-46.50 Z14.99
+G1 X33.01 Y-46.94 Z14.99
+G1 X32.82 Y-47.05 Z14.99
+G1 X32.82 Y-51.25 Z14.99
+G1 X33.01 Y-51.36 Z14.99
+G1 X33.01 Y-58.94 Z14.99
+G1 X32.82 Y-59.05 Z14.99
+G1 X32.82 Y-63.25 Z14.99
+G1 X33.01 Y-63.36 Z14.99
+
+T1
+G1 X32.45 Y-65.88 Z15.99
+G1 X32.45 Y-64.08 Z15.99
+G1 X32.45 Y-47.06 Z15.99
+G1 X28.85 Y-47.06 Z15.99
+G1 X-26.37 Y-47.06 Z15.99
+G1 X-26.37 Y-48.86 Z15.99
+G1 X-26.37 Y-65.88 Z15.99
+G1 X-22.77 Y-65.88 Z15.99
+G1 X32.45 Y-65.88 Z15.99
+G1 X32.45 Y-65.88 Z15.99
+G1 X-26.07 Y-65.88 Z15.99
+G1 X-26.07 Y-65.05 Z15.99
+G1 X-22.95 Y-63.25 Z15.99
+G1 X-22.95 Y-59.05 Z15.99
+G1 X-26.07 Y-57.25 Z15.99
+G1 X-26.07 Y-53.05 Z15.99
+G1 X-22.95 Y-51.25 Z15.99
+G1 X-22.95 Y-47.06 Z15.99
+G1 X-22.61 Y-47.06 Z15.99
+G1 X-22.61 Y-51.25 Z15.99
+G1 X-19.49 Y-53.05 Z15.99
+G1 X-19.49 Y-57.25 Z15.99
+G1 X-22.61 Y-59.05 Z15.99
+G1 X-22.61 Y-63.25 Z15.99
+G1 X-19.49 Y-65.05 Z15.99
+G1 X-19.49 Y-65.88 Z15.99
+G1 X-19.14 Y-65.88 Z15.99
+G1 X-19.14 Y-65.05 Z15.99
+G1 X-16.02 Y-63.25 Z15.99
+G1 X-16.02 Y-59.05 Z15.99
+G1 X-19.14 Y-57.25 Z15.99
+G1 X-19.14 Y-53.05 Z15.99
+G1 X-16.02 Y-51.25 Z15.99
+G1 X-16.02 Y-47.06 Z15.99
+G1 X-15.68 Y-47.06 Z15.99
+G1 X-15.68 Y-51.25 Z15.99
+G1 X-12.56 Y-53.05 Z15.99
+G1 X-12.56 Y-57.25 Z15.99
+G1 X-15.68 Y-59.05 Z15.99
+G1 X-15.68 Y-63.25 Z15.99
+G1 X-12.56 Y-65.05 Z15.99
+G1 X-12.56 Y-65.88 Z15.99
+G1 X-12.21 Y-65.88 Z15.99
+G1 X-12.21 Y-65.05 Z15.99
+G1 X-9.10 Y-63.25 Z15.99
+G1 X-9.10 Y-59.05 Z15.99
+G1 X-12.21 Y-57.25 Z15.99
+G1 X-12.21 Y-53.05 Z15.99
+G1 X-9.10 Y-51.25 Z15.99
+G1 X-9.10 Y-47.06 Z15.99
+G1 X-8.75 Y-47.06 Z15.99
+G1 X-8.75 Y-51.25 Z15.99
+G1 X-5.63 Y-53.05 Z15.99
+G1 X-5.63 Y-57.25 Z15.99
+G1 X-8.75 Y-59.05 Z15.99
+G1 X-8.75 Y-63.25 Z15.99
+G1 X-5.63 Y-65.05 Z15.99
+G1 X-5.63 Y-65.88 Z15.99
+G1 X-5.28 Y-65.88 Z15.99
+G1 X-5.28 Y-65.05 Z15.99
+G1 X-2.17 Y-63.25 Z15.99
+G1 X-2.17 Y-59.05 Z15.99
+G1 X-5.28 Y-57.25 Z15.99
+G1 X-5.28 Y-53.05 Z15.99
+G1 X-2.17 Y-51.25 Z15.99
+G1 X-2.17 Y-47.06 Z15.99
+G1 X-1.82 Y-47.06 Z15.99
+G1 X-1.82 Y-51.25 Z15.99
+G1 X1.30 Y-53.05 Z15.99
+G1 X1.30 Y-57.25 Z15.99
+G1 X-1.82 Y-59.05 Z15.99
+G1 X-1.82 Y-63.25 Z15.99
+G1 X1.30 Y-65.05 Z15.99
+G1 X1.30 Y-65.88 Z15.99
+G1 X1.64 Y-65.88 Z15.99
+G1 X1.64 Y-65.05 Z15.99
+G1 X4.76 Y-63.25 Z15.99
+G1 X4.76 Y-59.05 Z15.99
+G1 X1.64 Y-57.25 Z15.99
+G1 X1.64 Y-53.05 Z15.99
+G1 X4.76 Y-51.25 Z15.99
+G1 X4.76 Y-47.06 Z15.99
+G1 X5.11 Y-47.06 Z15.99
+G1 X5.11 Y-51.25 Z15.99
+G1 X8.22 Y-53.05 Z15.99
+G1 X8.22 Y-57.25 Z15.99
+G1 X5.11 Y-59.05 Z15.99
+G1 X5.11 Y-63.25 Z15.99
+G1 X8.22 Y-65.05 Z15.99
+G1 X8.22 Y-65.88 Z15.99
+G1 X8.57 Y-65.88 Z15.99
+G1 X8.57 Y-65.05 Z15.99
+G1 X11.69 Y-63.25 Z15.99
+G1 X11.69 Y-59.05 Z15.99
+G1 X8.57 Y-57.25 Z15.99
+G1 X8.57 Y-53.05 Z15.99
+G1 X11.69 Y-51.25 Z15.99
+G1 X11.69 Y-47.06 Z15.99
+G1 X12.03 Y-47.06 Z15.99
+G1 X12.03 Y-51.25 Z15.99
+G1 X15.15 Y-53.05 Z15.99
+G1 X15.15 Y-57.25 Z15.99
+G1 X12.03 Y-59.05 Z15.99
+G1 X12.03 Y-63.25 Z15.99
+G1 X15.15 Y-65.05 Z15.99
+G1 X15.15 Y-65.88 Z15.99
+G1 X15.50 Y-65.88 Z15.99
+G1 X15.50 Y-65.05 Z15.99
+G1 X18.62 Y-63.25 Z15.99
+G1 X18.62 Y-59.05 Z15.99
+G1 X15.50 Y-57.25 Z15.99
+G1 X15.50 Y-53.05 Z15.99
+G1 X18.62 Y-51.25 Z15.99
+G1 X18.62 Y-47.06 Z15.99
+G1 X18.96 Y-47.06 Z15.99
+G1 X18.96 Y-51.25 Z15.99
+G1 X22.08 Y-53.05 Z15.99
+G1 X22.08 Y-57.25 Z15.99
+G1 X18.96 Y-59.05 Z15.99
+G1 X18.96 Y-63.25 Z15.99
+G1 X22.08 Y-65.05 Z15.99
+G1 X22.08 Y-65.88 Z15.99
+G1 X22.43 Y-65.88 Z15.99
+G1 X22.43 Y-65.05 Z15.99
+G1 X25.54 Y-63.25 Z15.99
+G1 X25.54 Y-59.05 Z15.99
+G1 X22.43 Y-57.25 Z15.99
+G1 X22.43 Y-53.05 Z15.99
+G1 X25.54 Y-51.25 Z15.99
+G1 X25.54 Y-47.06 Z15.99
+G1 X25.89 Y-47.06 Z15.99
+G1 X25.89 Y-51.25 Z15.99
+G1 X29.01 Y-53.05 Z15.99
+G1 X29.01 Y-57.25 Z15.99
+G1 X25.89 Y-59.05 Z15.99
+G1 X25.89 Y-63.25 Z15.99
+G1 X29.01 Y-65.05 Z15.99
+G1 X29.01 Y-65.88 Z15.99
+G1 X29.36 Y-65.88 Z15.99
+G1 X29.36 Y-65.05 Z15.99
+G1 X32.45 Y-63.26 Z15.99
+G1 X32.45 Y-59.04 Z15.99
+G1 X29.36 Y-57.25 Z15.99
+G1 X29.36 Y-53.05 Z15.99
+G1 X32.45 Y-51.26 Z15.99
@@ -0,0 +1,5190 @@
+T1
+G1 X42.99 Y-76.42 Z-3.01 J0.00 F500.0
+G1 X42.99 Y-36.61 Z-3.01 J39.01 F500.0
+G1 X42.99 Y-36.52 Z-3.01 J39.10 F500.0
+G1 X-36.62 Y-36.52 Z-3.01 J117.12 F500.0
+G1 X-36.91 Y-36.52 Z-3.01 J117.40 F500.0
+G1 X-36.91 Y-76.33 Z-3.01 J156.42 F500.0
+G1 X-36.91 Y-76.42 Z-3.01 J156.51 F500.0
+G1 X42.70 Y-76.42 Z-3.01 J234.52 F500.0
+G1 X42.70 Y-76.42 Z-3.01 J234.52 F500.0
+G1 X-36.91 Y-75.31 Z-3.01 J312.55 F500.0
+G1 X-36.81 Y-75.25 Z-3.01 J312.66 F500.0
+G1 X-36.81 Y-71.05 Z-3.01 J316.78 F500.0
+G1 X-36.91 Y-71.00 Z-3.01 J316.89 F500.0
+G1 X-36.91 Y-63.31 Z-3.01 J324.43 F500.0
+G1 X-36.81 Y-63.25 Z-3.01 J324.54 F500.0
+G1 X-36.81 Y-59.05 Z-3.01 J328.66 F500.0
+G1 X-36.91 Y-58.99 Z-3.01 J328.77 F500.0
+G1 X-36.91 Y-51.31 Z-3.01 J336.30 F500.0
+G1 X-36.81 Y-51.25 Z-3.01 J336.41 F500.0
+G1 X-36.81 Y-47.05 Z-3.01 J340.53 F500.0
+G1 X-36.91 Y-47.00 Z-3.01 J340.64 F500.0
+G1 X-36.91 Y-39.31 Z-3.01 J348.17 F500.0
+G1 X-36.81 Y-39.25 Z-3.01 J348.29 F500.0
+G1 X-36.81 Y-36.52 Z-3.01 J350.96 F500.0
+G1 X-36.46 Y-36.52 Z-3.01 J351.30 F500.0
+G1 X-36.46 Y-39.25 Z-3.01 J353.98 F500.0
+G1 X-33.34 Y-41.05 Z-3.01 J357.51 F500.0
+G1 X-33.34 Y-45.25 Z-3.01 J361.63 F500.0
+G1 X-36.46 Y-47.05 Z-3.01 J365.16 F500.0
+G1 X-36.46 Y-51.25 Z-3.01 J369.27 F500.0
+G1 X-33.34 Y-53.05 Z-3.01 J372.80 F500.0
+G1 X-33.34 Y-57.25 Z-3.01 J376.92 F500.0
+G1 X-36.46 Y-59.05 Z-3.01 J380.45 F500.0
+G1 X-36.46 Y-63.25 Z-3.01 J384.56 F500.0
+G1 X-33.34 Y-65.05 Z-3.01 J388.09 F500.0
+G1 X-33.34 Y-69.25 Z-3.01 J392.21 F500.0
+G1 X-36.46 Y-71.05 Z-3.01 J395.74 F500.0
+G1 X-36.46 Y-75.25 Z-3.01 J399.86 F500.0
+G1 X-34.45 Y-76.42 Z-3.01 J402.14 F500.0
+G1 X-31.90 Y-76.42 Z-3.01 J404.63 F500.0
+G1 X-29.88 Y-75.25 Z-3.01 J406.92 F500.0
+G1 X-29.88 Y-71.05 Z-3.01 J411.04 F500.0
+G1 X-33.00 Y-69.25 Z-3.01 J414.57 F500.0
+G1 X-33.00 Y-65.05 Z-3.01 J418.68 F500.0
+G1 X-29.88 Y-63.25 Z-3.01 J422.21 F500.0
+G1 X-29.88 Y-59.05 Z-3.01 J426.33 F500.0
+G1 X-33.00 Y-57.25 Z-3.01 J429.86 F500.0
+G1 X-33.00 Y-53.05 Z-3.01 J433.98 F500.0
+G1 X-29.88 Y-51.25 Z-3.01 J437.51 F500.0
+G1 X-29.88 Y-47.05 Z-3.01 J441.62 F500.0
+G1 X-33.00 Y-45.25 Z-3.01 J445.15 F500.0
+G1 X-33.00 Y-41.05 Z-3.01 J449.27 F500.0
+G1 X-29.88 Y-39.25 Z-3.01 J452.80 F500.0
+G1 X-29.88 Y-36.52 Z-3.01 J455.47 F500.0
+G1 X-29.53 Y-36.52 Z-3.01 J455.82 F500.0
+G1 X-29.53 Y-39.25 Z-3.01 J458.49 F500.0
+G1 X-26.42 Y-41.05 Z-3.01 J462.01 F500.0
+G1 X-26.42 Y-45.25 Z-3.01 J466.13 F500.0
+G1 X-29.53 Y-47.05 Z-3.01 J469.65 F500.0
+G1 X-29.53 Y-51.25 Z-3.01 J473.77 F500.0
+G1 X-26.42 Y-53.05 Z-3.01 J477.29 F500.0
+G1 X-26.42 Y-57.25 Z-3.01 J481.40 F500.0
+G1 X-29.53 Y-59.05 Z-3.01 J484.93 F500.0
+G1 X-29.53 Y-63.25 Z-3.01 J489.04 F500.0
+G1 X-26.42 Y-65.05 Z-3.01 J492.56 F500.0
+G1 X-26.42 Y-69.25 Z-3.01 J496.68 F500.0
+G1 X-29.53 Y-71.05 Z-3.01 J500.20 F500.0
+G1 X-29.53 Y-75.25 Z-3.01 J504.32 F500.0
+G1 X-27.52 Y-76.42 Z-3.01 J506.60 F500.0
+G1 X-24.97 Y-76.42 Z-3.01 J509.09 F500.0
+G1 X-22.95 Y-75.25 Z-3.01 J511.38 F500.0
+G1 X-22.95 Y-71.05 Z-3.01 J515.50 F500.0
+G1 X-26.07 Y-69.25 Z-3.01 J519.03 F500.0
+G1 X-26.07 Y-65.05 Z-3.01 J523.14 F500.0
+G1 X-22.95 Y-63.25 Z-3.01 J526.67 F500.0
+G1 X-22.95 Y-59.05 Z-3.01 J530.79 F500.0
+G1 X-26.07 Y-57.25 Z-3.01 J534.32 F500.0
+G1 X-26.07 Y-53.05 Z-3.01 J538.44 F500.0
+G1 X-22.95 Y-51.25 Z-3.01 J541.97 F500.0
+G1 X-22.95 Y-47.05 Z-3.01 J546.08 F500.0
+G1 X-26.07 Y-45.25 Z-3.01 J549.61 F500.0
+G1 X-26.07 Y-41.05 Z-3.01 J553.73 F500.0
+G1 X-22.95 Y-39.25 Z-3.01 J557.26 F500.0
+G1 X-22.95 Y-36.52 Z-3.01 J559.93 F500.0
+G1 X-22.61 Y-36.52 Z-3.01 J560.27 F500.0
+G1 X-22.61 Y-39.25 Z-3.01 J562.94 F500.0
+G1 X-19.49 Y-41.05 Z-3.01 J566.47 F500.0
+G1 X-19.49 Y-45.25 Z-3.01 J570.59 F500.0
+G1 X-22.61 Y-47.05 Z-3.01 J574.12 F500.0
+G1 X-22.61 Y-51.25 Z-3.01 J578.23 F500.0
+G1 X-19.49 Y-53.05 Z-3.01 J581.76 F500.0
+G1 X-19.49 Y-57.25 Z-3.01 J585.88 F500.0
+G1 X-22.61 Y-59.05 Z-3.01 J589.41 F500.0
+G1 X-22.61 Y-63.25 Z-3.01 J593.53 F500.0
+G1 X-19.49 Y-65.05 Z-3.01 J597.06 F500.0
+G1 X-19.49 Y-69.25 Z-3.01 J601.17 F500.0
+G1 X-22.61 Y-71.05 Z-3.01 J604.70 F500.0
+G1 X-22.61 Y-75.25 Z-3.01 J608.82 F500.0
+G1 X-20.59 Y-76.42 Z-3.01 J611.11 F500.0
+G1 X-18.04 Y-76.42 Z-3.01 J613.60 F500.0
+G1 X-16.02 Y-75.25 Z-3.01 J615.89 F500.0
+G1 X-16.02 Y-71.05 Z-3.01 J620.01 F500.0
+G1 X-19.14 Y-69.25 Z-3.01 J623.54 F500.0
+G1 X-19.14 Y-65.05 Z-3.01 J627.65 F500.0
+G1 X-16.02 Y-63.25 Z-3.01 J631.18 F500.0
+G1 X-16.02 Y-59.05 Z-3.01 J635.30 F500.0
+G1 X-19.14 Y-57.25 Z-3.01 J638.83 F500.0
+G1 X-19.14 Y-53.05 Z-3.01 J642.95 F500.0
+G1 X-16.02 Y-51.25 Z-3.01 J646.48 F500.0
+G1 X-16.02 Y-47.05 Z-3.01 J650.59 F500.0
+G1 X-19.14 Y-45.25 Z-3.01 J654.12 F500.0
+G1 X-19.14 Y-41.05 Z-3.01 J658.24 F500.0
+G1 X-16.02 Y-39.25 Z-3.01 J661.77 F500.0
+G1 X-16.02 Y-36.52 Z-3.01 J664.44 F500.0
+G1 X-15.68 Y-36.52 Z-3.01 J664.78 F500.0
+G1 X-15.68 Y-39.25 Z-3.01 J667.45 F500.0
+G1 X-12.56 Y-41.05 Z-3.01 J670.98 F500.0
+G1 X-12.56 Y-45.25 Z-3.01 J675.10 F500.0
+G1 X-15.68 Y-47.05 Z-3.01 J678.63 F500.0
+G1 X-15.68 Y-51.25 Z-3.01 J682.74 F500.0
+G1 X-12.56 Y-53.05 Z-3.01 J686.27 F500.0
+G1 X-12.56 Y-57.25 Z-3.01 J690.39 F500.0
+G1 X-15.68 Y-59.05 Z-3.01 J693.92 F500.0
+G1 X-15.68 Y-63.25 Z-3.01 J698.04 F500.0
+G1 X-12.56 Y-65.05 Z-3.01 J701.57 F500.0
+G1 X-12.56 Y-69.25 Z-3.01 J705.68 F500.0
+G1 X-15.68 Y-71.05 Z-3.01 J709.21 F500.0
+G1 X-15.68 Y-75.25 Z-3.01 J713.33 F500.0
+G1 X-13.66 Y-76.42 Z-3.01 J715.62 F500.0
+G1 X-11.11 Y-76.42 Z-3.01 J718.11 F500.0
+G1 X-9.10 Y-75.25 Z-3.01 J720.39 F500.0
+G1 X-9.10 Y-71.05 Z-3.01 J724.51 F500.0
+G1 X-12.21 Y-69.25 Z-3.01 J728.03 F500.0
+G1 X-12.21 Y-65.05 Z-3.01 J732.15 F500.0
+G1 X-9.10 Y-63.25 Z-3.01 J735.67 F500.0
+G1 X-9.10 Y-59.05 Z-3.01 J739.78 F500.0
+G1 X-12.21 Y-57.25 Z-3.01 J743.31 F500.0
+G1 X-12.21 Y-53.05 Z-3.01 J747.42 F500.0
+G1 X-9.10 Y-51.25 Z-3.01 J750.94 F500.0
+G1 X-9.10 Y-47.05 Z-3.01 J755.06 F500.0
+G1 X-12.21 Y-45.25 Z-3.01 J758.58 F500.0
+G1 X-12.21 Y-41.05 Z-3.01 J762.70 F500.0
+G1 X-9.10 Y-39.25 Z-3.01 J766.22 F500.0
+G1 X-9.10 Y-36.52 Z-3.01 J768.89 F500.0
+G1 X-8.75 Y-36.52 Z-3.01 J769.24 F500.0
+G1 X-8.75 Y-39.25 Z-3.01 J771.91 F500.0
+G1 X-5.63 Y-41.05 Z-3.01 J775.44 F500.0
+G1 X-5.63 Y-45.25 Z-3.01 J779.56 F500.0
+G1 X-8.75 Y-47.05 Z-3.01 J783.09 F500.0
+G1 X-8.75 Y-51.25 Z-3.01 J787.20 F500.0
+G1 X-5.63 Y-53.05 Z-3.01 J790.73 F500.0
+G1 X-5.63 Y-57.25 Z-3.01 J794.85 F500.0
+G1 X-8.75 Y-59.05 Z-3.01 J798.38 F500.0
+G1 X-8.75 Y-63.25 Z-3.01 J802.50 F500.0
+G1 X-5.63 Y-65.05 Z-3.01 J806.03 F500.0
+G1 X-5.63 Y-69.25 Z-3.01 J810.14 F500.0
+G1 X-8.75 Y-71.05 Z-3.01 J813.67 F500.0
+G1 X-8.75 Y-75.25 Z-3.01 J817.79 F500.0
+G1 X-6.73 Y-76.42 Z-3.01 J820.08 F500.0
+G1 X-4.18 Y-76.42 Z-3.01 J822.57 F500.0
+G1 X-2.17 Y-75.25 Z-3.01 J824.85 F500.0
+G1 X-2.17 Y-71.05 Z-3.01 J828.97 F500.0
+G1 X-5.28 Y-69.25 Z-3.01 J832.49 F500.0
+G1 X-5.28 Y-65.05 Z-3.01 J836.61 F500.0
+G1 X-2.17 Y-63.25 Z-3.01 J840.13 F500.0
+G1 X-2.17 Y-59.05 Z-3.01 J844.24 F500.0
+G1 X-5.28 Y-57.25 Z-3.01 J847.77 F500.0
+G1 X-5.28 Y-53.05 Z-3.01 J851.88 F500.0
+G1 X-2.17 Y-51.25 Z-3.01 J855.40 F500.0
+G1 X-2.17 Y-47.05 Z-3.01 J859.52 F500.0
+G1 X-5.28 Y-45.25 Z-3.01 J863.04 F500.0
+G1 X-5.28 Y-41.05 Z-3.01 J867.16 F500.0
+G1 X-2.17 Y-39.25 Z-3.01 J870.68 F500.0
+G1 X-2.17 Y-36.52 Z-3.01 J873.35 F500.0
+G1 X-1.82 Y-36.52 Z-3.01 J873.70 F500.0
+G1 X-1.82 Y-39.25 Z-3.01 J876.37 F500.0
+G1 X1.30 Y-41.05 Z-3.01 J879.90 F500.0
+G1 X1.30 Y-45.25 Z-3.01 J884.02 F500.0
+G1 X-1.82 Y-47.05 Z-3.01 J887.55 F500.0
+G1 X-1.82 Y-51.25 Z-3.01 J891.66 F500.0
+G1 X1.30 Y-53.05 Z-3.01 J895.19 F500.0
+G1 X1.30 Y-57.25 Z-3.01 J899.31 F500.0
+G1 X-1.82 Y-59.05 Z-3.01 J902.84 F500.0
+G1 X-1.82 Y-63.25 Z-3.01 J906.96 F500.0
+G1 X1.30 Y-65.05 Z-3.01 J910.49 F500.0
+G1 X1.30 Y-69.25 Z-3.01 J914.60 F500.0
+G1 X-1.82 Y-71.05 Z-3.01 J918.13 F500.0
+G1 X-1.82 Y-75.25 Z-3.01 J922.25 F500.0
+G1 X0.19 Y-76.42 Z-3.01 J924.53 F500.0
+G1 X2.75 Y-76.42 Z-3.01 J927.04 F500.0
+G1 X4.76 Y-75.25 Z-3.01 J929.32 F500.0
+G1 X4.76 Y-71.05 Z-3.01 J933.43 F500.0
+G1 X1.64 Y-69.25 Z-3.01 J936.96 F500.0
+G1 X1.64 Y-65.05 Z-3.01 J941.08 F500.0
+G1 X4.76 Y-63.25 Z-3.01 J944.61 F500.0
+G1 X4.76 Y-59.05 Z-3.01 J948.72 F500.0
+G1 X1.64 Y-57.25 Z-3.01 J952.25 F500.0
+G1 X1.64 Y-53.05 Z-3.01 J956.37 F500.0
+G1 X4.76 Y-51.25 Z-3.01 J959.90 F500.0
+G1 X4.76 Y-47.05 Z-3.01 J964.02 F500.0
+G1 X1.64 Y-45.25 Z-3.01 J967.55 F500.0
+G1 X1.64 Y-41.05 Z-3.01 J971.66 F500.0
+G1 X4.76 Y-39.25 Z-3.01 J975.19 F500.0
+G1 X4.76 Y-36.52 Z-3.01 J977.87 F500.0
+G1 X5.11 Y-36.52 Z-3.01 J978.21 F500.0
+G1 X5.11 Y-39.25 Z-3.01 J980.89 F500.0
+G1 X8.22 Y-41.05 Z-3.01 J984.41 F500.0
+G1 X8.22 Y-45.25 Z-3.01 J988.52 F500.0
+G1 X5.11 Y-47.05 Z-3.01 J992.04 F500.0
+G1 X5.11 Y-51.25 Z-3.01 J996.16 F500.0
+G1 X8.22 Y-53.05 Z-3.01 J999.68 F500.0
+G1 X8.22 Y-57.25 Z-3.01 J1003.80 F500.0
+G1 X5.11 Y-59.05 Z-3.01 J1007.32 F500.0
+G1 X5.11 Y-63.25 Z-3.01 J1011.43 F500.0
+G1 X8.22 Y-65.05 Z-3.01 J1014.96 F500.0
+G1 X8.22 Y-69.25 Z-3.01 J1019.07 F500.0
+G1 X5.11 Y-71.05 Z-3.01 J1022.59 F500.0
+G1 X5.11 Y-75.25 Z-3.01 J1026.71 F500.0
+G1 X7.12 Y-76.42 Z-3.01 J1028.99 F500.0
+G1 X9.67 Y-76.42 Z-3.01 J1031.49 F500.0
+G1 X11.69 Y-75.25 Z-3.01 J1033.78 F500.0
+G1 X11.69 Y-71.05 Z-3.01 J1037.89 F500.0
+G1 X8.57 Y-69.25 Z-3.01 J1041.42 F500.0
+G1 X8.57 Y-65.05 Z-3.01 J1045.54 F500.0
+G1 X11.69 Y-63.25 Z-3.01 J1049.07 F500.0
+G1 X11.69 Y-59.05 Z-3.01 J1053.18 F500.0
+G1 X8.57 Y-57.25 Z-3.01 J1056.71 F500.0
+G1 X8.57 Y-53.05 Z-3.01 J1060.83 F500.0
+G1 X11.69 Y-51.25 Z-3.01 J1064.36 F500.0
+G1 X11.69 Y-47.05 Z-3.01 J1068.48 F500.0
+G1 X8.57 Y-45.25 Z-3.01 J1072.01 F500.0
+G1 X8.57 Y-41.05 Z-3.01 J1076.12 F500.0
+G1 X11.69 Y-39.25 Z-3.01 J1079.65 F500.0
+G1 X11.69 Y-36.52 Z-3.01 J1082.33 F500.0
+G1 X12.03 Y-36.52 Z-3.01 J1082.66 F500.0
+G1 X12.03 Y-39.25 Z-3.01 J1085.34 F500.0
+G1 X15.15 Y-41.05 Z-3.01 J1088.87 F500.0
+G1 X15.15 Y-45.25 Z-3.01 J1092.98 F500.0
+G1 X12.03 Y-47.05 Z-3.01 J1096.51 F500.0
+G1 X12.03 Y-51.25 Z-3.01 J1100.63 F500.0
+G1 X15.15 Y-53.05 Z-3.01 J1104.16 F500.0
+G1 X15.15 Y-57.25 Z-3.01 J1108.27 F500.0
+G1 X12.03 Y-59.05 Z-3.01 J1111.80 F500.0
+G1 X12.03 Y-63.25 Z-3.01 J1115.92 F500.0
+G1 X15.15 Y-65.05 Z-3.01 J1119.45 F500.0
+G1 X15.15 Y-69.25 Z-3.01 J1123.57 F500.0
+G1 X12.03 Y-71.05 Z-3.01 J1127.10 F500.0
+G1 X12.03 Y-75.25 Z-3.01 J1131.21 F500.0
+G1 X14.05 Y-76.42 Z-3.01 J1133.50 F500.0
+G1 X16.60 Y-76.42 Z-3.01 J1136.00 F500.0
+G1 X18.62 Y-75.25 Z-3.01 J1138.29 F500.0
+G1 X18.62 Y-71.05 Z-3.01 J1142.40 F500.0
+G1 X15.50 Y-69.25 Z-3.01 J1145.93 F500.0
+G1 X15.50 Y-65.05 Z-3.01 J1150.05 F500.0
+G1 X18.62 Y-63.25 Z-3.01 J1153.58 F500.0
+G1 X18.62 Y-59.05 Z-3.01 J1157.69 F500.0
+G1 X15.50 Y-57.25 Z-3.01 J1161.22 F500.0
+G1 X15.50 Y-53.05 Z-3.01 J1165.34 F500.0
+G1 X18.62 Y-51.25 Z-3.01 J1168.87 F500.0
+G1 X18.62 Y-47.05 Z-3.01 J1172.99 F500.0
+G1 X15.50 Y-45.25 Z-3.01 J1176.52 F500.0
+G1 X15.50 Y-41.05 Z-3.01 J1180.63 F500.0
+G1 X18.62 Y-39.25 Z-3.01 J1184.16 F500.0
+G1 X18.62 Y-36.52 Z-3.01 J1186.84 F500.0
+G1 X18.96 Y-36.52 Z-3.01 J1187.17 F500.0
+G1 X18.96 Y-39.25 Z-3.01 J1189.85 F500.0
+G1 X22.08 Y-41.05 Z-3.01 J1193.38 F500.0
+G1 X22.08 Y-45.25 Z-3.01 J1197.49 F500.0
+G1 X18.96 Y-47.05 Z-3.01 J1201.02 F500.0
+G1 X18.96 Y-51.25 Z-3.01 J1205.14 F500.0
+G1 X22.08 Y-53.05 Z-3.01 J1208.67 F500.0
+G1 X22.08 Y-57.25 Z-3.01 J1212.78 F500.0
+G1 X18.96 Y-59.05 Z-3.01 J1216.31 F500.0
+G1 X18.96 Y-63.25 Z-3.01 J1220.43 F500.0
+G1 X22.08 Y-65.05 Z-3.01 J1223.96 F500.0
+G1 X22.08 Y-69.25 Z-3.01 J1228.08 F500.0
+G1 X18.96 Y-71.05 Z-3.01 J1231.61 F500.0
+G1 X18.96 Y-75.25 Z-3.01 J1235.72 F500.0
+G1 X20.98 Y-76.42 Z-3.01 J1238.01 F500.0
+G1 X23.53 Y-76.42 Z-3.01 J1240.51 F500.0
+G1 X25.54 Y-75.25 Z-3.01 J1242.79 F500.0
+G1 X25.54 Y-71.05 Z-3.01 J1246.90 F500.0
+G1 X22.43 Y-69.25 Z-3.01 J1250.42 F500.0
+G1 X22.43 Y-65.05 Z-3.01 J1254.54 F500.0
+G1 X25.54 Y-63.25 Z-3.01 J1258.06 F500.0
+G1 X25.54 Y-59.05 Z-3.01 J1262.18 F500.0
+G1 X22.43 Y-57.25 Z-3.01 J1265.70 F500.0
+G1 X22.43 Y-53.05 Z-3.01 J1269.82 F500.0
+G1 X25.54 Y-51.25 Z-3.01 J1273.34 F500.0
+G1 X25.54 Y-47.05 Z-3.01 J1277.45 F500.0
+G1 X22.43 Y-45.25 Z-3.01 J1280.97 F500.0
+G1 X22.43 Y-41.05 Z-3.01 J1285.09 F500.0
+G1 X25.54 Y-39.25 Z-3.01 J1288.61 F500.0
+G1 X25.54 Y-36.52 Z-3.01 J1291.29 F500.0
+G1 X25.89 Y-36.52 Z-3.01 J1291.63 F500.0
+G1 X25.89 Y-39.25 Z-3.01 J1294.31 F500.0
+G1 X29.01 Y-41.05 Z-3.01 J1297.84 F500.0
+G1 X29.01 Y-45.25 Z-3.01 J1301.95 F500.0
+G1 X25.89 Y-47.05 Z-3.01 J1305.48 F500.0
+G1 X25.89 Y-51.25 Z-3.01 J1309.60 F500.0
+G1 X29.01 Y-53.05 Z-3.01 J1313.13 F500.0
+G1 X29.01 Y-57.25 Z-3.01 J1317.24 F500.0
+G1 X25.89 Y-59.05 Z-3.01 J1320.77 F500.0
+G1 X25.89 Y-63.25 Z-3.01 J1324.89 F500.0
+G1 X29.01 Y-65.05 Z-3.01 J1328.42 F500.0
+G1 X29.01 Y-69.25 Z-3.01 J1332.54 F500.0
+G1 X25.89 Y-71.05 Z-3.01 J1336.07 F500.0
+G1 X25.89 Y-75.25 Z-3.01 J1340.18 F500.0
+G1 X27.91 Y-76.42 Z-3.01 J1342.47 F500.0
+G1 X30.46 Y-76.42 Z-3.01 J1344.97 F500.0
+G1 X32.47 Y-75.25 Z-3.01 J1347.25 F500.0
+G1 X32.47 Y-71.05 Z-3.01 J1351.36 F500.0
+G1 X29.36 Y-69.25 Z-3.01 J1354.88 F500.0
+G1 X29.36 Y-65.05 Z-3.01 J1359.00 F500.0
+G1 X32.47 Y-63.25 Z-3.01 J1362.52 F500.0
+G1 X32.47 Y-59.05 Z-3.01 J1366.64 F500.0
+G1 X29.36 Y-57.25 Z-3.01 J1370.16 F500.0
+G1 X29.36 Y-53.05 Z-3.01 J1374.28 F500.0
+G1 X32.47 Y-51.25 Z-3.01 J1377.80 F500.0
+G1 X32.47 Y-47.05 Z-3.01 J1381.91 F500.0
+G1 X29.36 Y-45.25 Z-3.01 J1385.43 F500.0
+G1 X29.36 Y-41.05 Z-3.01 J1389.55 F500.0
+G1 X32.47 Y-39.25 Z-3.01 J1393.07 F500.0
+G1 X32.47 Y-36.52 Z-3.01 J1395.75 F500.0
+G1 X32.82 Y-36.52 Z-3.01 J1396.09 F500.0
+G1 X32.82 Y-39.25 Z-3.01 J1398.77 F500.0
+G1 X35.94 Y-41.05 Z-3.01 J1402.30 F500.0
+G1 X35.94 Y-45.25 Z-3.01 J1406.41 F500.0
+G1 X32.82 Y-47.05 Z-3.01 J1409.94 F500.0
+G1 X32.82 Y-51.25 Z-3.01 J1414.06 F500.0
+G1 X35.94 Y-53.05 Z-3.01 J1417.59 F500.0
+G1 X35.94 Y-57.25 Z-3.01 J1421.70 F500.0
+G1 X32.82 Y-59.05 Z-3.01 J1425.23 F500.0
+G1 X32.82 Y-63.25 Z-3.01 J1429.35 F500.0
+G1 X35.94 Y-65.05 Z-3.01 J1432.88 F500.0
+G1 X35.94 Y-69.25 Z-3.01 J1437.00 F500.0
+G1 X32.82 Y-71.05 Z-3.01 J1440.53 F500.0
+G1 X32.82 Y-75.25 Z-3.01 J1444.64 F500.0
+G1 X34.84 Y-76.42 Z-3.01 J1446.93 F500.0
+G1 X37.39 Y-76.42 Z-3.01 J1449.43 F500.0
+G1 X39.40 Y-75.25 Z-3.01 J1451.71 F500.0
+G1 X39.40 Y-71.05 Z-3.01 J1455.82 F500.0
+G1 X36.28 Y-69.25 Z-3.01 J1459.35 F500.0
+G1 X36.28 Y-65.05 Z-3.01 J1463.47 F500.0
+G1 X39.40 Y-63.25 Z-3.01 J1467.00 F500.0
+G1 X39.40 Y-59.05 Z-3.01 J1471.12 F500.0
+G1 X36.28 Y-57.25 Z-3.01 J1474.65 F500.0
+G1 X36.28 Y-53.05 Z-3.01 J1478.76 F500.0
+G1 X39.40 Y-51.25 Z-3.01 J1482.29 F500.0
+G1 X39.40 Y-47.05 Z-3.01 J1486.41 F500.0
+G1 X36.28 Y-45.25 Z-3.01 J1489.94 F500.0
+G1 X36.28 Y-41.05 Z-3.01 J1494.05 F500.0
+G1 X39.40 Y-39.25 Z-3.01 J1497.58 F500.0
+G1 X39.40 Y-36.52 Z-3.01 J1500.26 F500.0
+G1 X39.75 Y-36.52 Z-3.01 J1500.60 F500.0
+G1 X39.75 Y-39.25 Z-3.01 J1503.28 F500.0
+G1 X42.87 Y-41.05 Z-3.01 J1506.81 F500.0
+G1 X42.87 Y-45.25 Z-3.01 J1510.92 F500.0
+G1 X39.75 Y-47.05 Z-3.01 J1514.45 F500.0
+G1 X39.75 Y-51.25 Z-3.01 J1518.57 F500.0
+G1 X42.87 Y-53.05 Z-3.01 J1522.10 F500.0
+G1 X42.87 Y-57.25 Z-3.01 J1526.22 F500.0
+G1 X39.75 Y-59.05 Z-3.01 J1529.75 F500.0
+G1 X39.75 Y-63.25 Z-3.01 J1533.86 F500.0
+G1 X42.87 Y-65.05 Z-3.01 J1537.39 F500.0
+G1 X42.87 Y-69.25 Z-3.01 J1541.51 F500.0
+G1 X39.75 Y-71.05 Z-3.01 J1545.04 F500.0
+G1 X39.75 Y-75.25 Z-3.01 J1549.15 F500.0
+G1 X41.76 Y-76.42 Z-3.01 J1551.43 F500.0
+
+T1
+G1 X39.25 Y-75.86 Z-2.01 J0.00 F500.0
+G1 X42.43 Y-75.86 Z-2.01 J3.12 F500.0
+G1 X42.43 Y-38.06 Z-2.01 J40.16 F500.0
+G1 X42.43 Y-37.08 Z-2.01 J41.12 F500.0
+G1 X-33.17 Y-37.08 Z-2.01 J115.21 F500.0
+G1 X-36.35 Y-37.08 Z-2.01 J118.33 F500.0
+G1 X-36.35 Y-74.88 Z-2.01 J155.37 F500.0
+G1 X-36.35 Y-75.86 Z-2.01 J156.33 F500.0
+G1 X39.25 Y-75.86 Z-2.01 J230.42 F500.0
+G1 X39.25 Y-75.86 Z-2.01 J230.42 F500.0
+G1 X-36.35 Y-39.32 Z-2.01 J312.71 F500.0
+G1 X-33.34 Y-41.05 Z-2.01 J316.11 F500.0
+G1 X-33.34 Y-45.25 Z-2.01 J320.22 F500.0
+G1 X-36.35 Y-46.99 Z-2.01 J323.63 F500.0
+G1 X-36.35 Y-51.32 Z-2.01 J327.87 F500.0
+G1 X-33.34 Y-53.05 Z-2.01 J331.28 F500.0
+G1 X-33.34 Y-57.25 Z-2.01 J335.39 F500.0
+G1 X-36.35 Y-58.99 Z-2.01 J338.80 F500.0
+G1 X-36.35 Y-63.32 Z-2.01 J343.04 F500.0
+G1 X-33.34 Y-65.05 Z-2.01 J346.45 F500.0
+G1 X-33.34 Y-69.25 Z-2.01 J350.56 F500.0
+G1 X-36.35 Y-70.99 Z-2.01 J353.97 F500.0
+G1 X-36.35 Y-75.32 Z-2.01 J358.21 F500.0
+G1 X-35.41 Y-75.86 Z-2.01 J359.27 F500.0
+G1 X-30.94 Y-75.86 Z-2.01 J363.66 F500.0
+G1 X-29.88 Y-75.25 Z-2.01 J364.85 F500.0
+G1 X-29.88 Y-71.05 Z-2.01 J368.97 F500.0
+G1 X-33.00 Y-69.25 Z-2.01 J372.50 F500.0
+G1 X-33.00 Y-65.05 Z-2.01 J376.62 F500.0
+G1 X-29.88 Y-63.25 Z-2.01 J380.15 F500.0
+G1 X-29.88 Y-59.05 Z-2.01 J384.26 F500.0
+G1 X-33.00 Y-57.25 Z-2.01 J387.79 F500.0
+G1 X-33.00 Y-53.05 Z-2.01 J391.91 F500.0
+G1 X-29.88 Y-51.25 Z-2.01 J395.44 F500.0
+G1 X-29.88 Y-47.05 Z-2.01 J399.55 F500.0
+G1 X-33.00 Y-45.25 Z-2.01 J403.08 F500.0
+G1 X-33.00 Y-41.05 Z-2.01 J407.20 F500.0
+G1 X-29.88 Y-39.25 Z-2.01 J410.73 F500.0
+G1 X-29.88 Y-37.08 Z-2.01 J412.86 F500.0
+G1 X-29.53 Y-37.08 Z-2.01 J413.20 F500.0
+G1 X-29.53 Y-39.25 Z-2.01 J415.33 F500.0
+G1 X-26.42 Y-41.05 Z-2.01 J418.85 F500.0
+G1 X-26.42 Y-45.25 Z-2.01 J422.96 F500.0
+G1 X-29.53 Y-47.05 Z-2.01 J426.48 F500.0
+G1 X-29.53 Y-51.25 Z-2.01 J430.60 F500.0
+G1 X-26.42 Y-53.05 Z-2.01 J434.12 F500.0
+G1 X-26.42 Y-57.25 Z-2.01 J438.24 F500.0
+G1 X-29.53 Y-59.05 Z-2.01 J441.76 F500.0
+G1 X-29.53 Y-63.25 Z-2.01 J445.88 F500.0
+G1 X-26.42 Y-65.05 Z-2.01 J449.40 F500.0
+G1 X-26.42 Y-69.25 Z-2.01 J453.51 F500.0
+G1 X-29.53 Y-71.05 Z-2.01 J457.03 F500.0
+G1 X-29.53 Y-75.25 Z-2.01 J461.15 F500.0
+G1 X-28.48 Y-75.86 Z-2.01 J462.34 F500.0
+G1 X-24.01 Y-75.86 Z-2.01 J466.72 F500.0
+G1 X-22.95 Y-75.25 Z-2.01 J467.92 F500.0
+G1 X-22.95 Y-71.05 Z-2.01 J472.04 F500.0
+G1 X-26.07 Y-69.25 Z-2.01 J475.57 F500.0
+G1 X-26.07 Y-65.05 Z-2.01 J479.68 F500.0
+G1 X-22.95 Y-63.25 Z-2.01 J483.21 F500.0
+G1 X-22.95 Y-59.05 Z-2.01 J487.33 F500.0
+G1 X-26.07 Y-57.25 Z-2.01 J490.86 F500.0
+G1 X-26.07 Y-53.05 Z-2.01 J494.97 F500.0
+G1 X-22.95 Y-51.25 Z-2.01 J498.50 F500.0
+G1 X-22.95 Y-47.05 Z-2.01 J502.62 F500.0
+G1 X-26.07 Y-45.25 Z-2.01 J506.15 F500.0
+G1 X-26.07 Y-41.05 Z-2.01 J510.27 F500.0
+G1 X-22.95 Y-39.25 Z-2.01 J513.80 F500.0
+G1 X-22.95 Y-37.08 Z-2.01 J515.92 F500.0
+G1 X-22.61 Y-37.08 Z-2.01 J516.26 F500.0
+G1 X-22.61 Y-39.25 Z-2.01 J518.38 F500.0
+G1 X-19.49 Y-41.05 Z-2.01 J521.91 F500.0
+G1 X-19.49 Y-45.25 Z-2.01 J526.03 F500.0
+G1 X-22.61 Y-47.05 Z-2.01 J529.56 F500.0
+G1 X-22.61 Y-51.25 Z-2.01 J533.67 F500.0
+G1 X-19.49 Y-53.05 Z-2.01 J537.20 F500.0
+G1 X-19.49 Y-57.25 Z-2.01 J541.32 F500.0
+G1 X-22.61 Y-59.05 Z-2.01 J544.85 F500.0
+G1 X-22.61 Y-63.25 Z-2.01 J548.97 F500.0
+G1 X-19.49 Y-65.05 Z-2.01 J552.50 F500.0
+G1 X-19.49 Y-69.25 Z-2.01 J556.61 F500.0
+G1 X-22.61 Y-71.05 Z-2.01 J560.14 F500.0
+G1 X-22.61 Y-75.25 Z-2.01 J564.26 F500.0
+G1 X-21.55 Y-75.86 Z-2.01 J565.46 F500.0
+G1 X-17.08 Y-75.86 Z-2.01 J569.84 F500.0
+G1 X-16.02 Y-75.25 Z-2.01 J571.04 F500.0
+G1 X-16.02 Y-71.05 Z-2.01 J575.15 F500.0
+G1 X-19.14 Y-69.25 Z-2.01 J578.68 F500.0
+G1 X-19.14 Y-65.05 Z-2.01 J582.80 F500.0
+G1 X-16.02 Y-63.25 Z-2.01 J586.33 F500.0
+G1 X-16.02 Y-59.05 Z-2.01 J590.44 F500.0
+G1 X-19.14 Y-57.25 Z-2.01 J593.97 F500.0
+G1 X-19.14 Y-53.05 Z-2.01 J598.09 F500.0
+G1 X-16.02 Y-51.25 Z-2.01 J601.62 F500.0
+G1 X-16.02 Y-47.05 Z-2.01 J605.74 F500.0
+G1 X-19.14 Y-45.25 Z-2.01 J609.27 F500.0
+G1 X-19.14 Y-41.05 Z-2.01 J613.38 F500.0
+G1 X-16.02 Y-39.25 Z-2.01 J616.91 F500.0
+G1 X-16.02 Y-37.08 Z-2.01 J619.04 F500.0
+G1 X-15.68 Y-37.08 Z-2.01 J619.37 F500.0
+G1 X-15.68 Y-39.25 Z-2.01 J621.50 F500.0
+G1 X-12.56 Y-41.05 Z-2.01 J625.03 F500.0
+G1 X-12.56 Y-45.25 Z-2.01 J629.14 F500.0
+G1 X-15.68 Y-47.05 Z-2.01 J632.67 F500.0
+G1 X-15.68 Y-51.25 Z-2.01 J636.79 F500.0
+G1 X-12.56 Y-53.05 Z-2.01 J640.32 F500.0
+G1 X-12.56 Y-57.25 Z-2.01 J644.44 F500.0
+G1 X-15.68 Y-59.05 Z-2.01 J647.97 F500.0
+G1 X-15.68 Y-63.25 Z-2.01 J652.08 F500.0
+G1 X-12.56 Y-65.05 Z-2.01 J655.61 F500.0
+G1 X-12.56 Y-69.25 Z-2.01 J659.73 F500.0
+G1 X-15.68 Y-71.05 Z-2.01 J663.26 F500.0
+G1 X-15.68 Y-75.25 Z-2.01 J667.37 F500.0
+G1 X-14.62 Y-75.86 Z-2.01 J668.57 F500.0
+G1 X-10.15 Y-75.86 Z-2.01 J672.95 F500.0
+G1 X-9.10 Y-75.25 Z-2.01 J674.14 F500.0
+G1 X-9.10 Y-71.05 Z-2.01 J678.26 F500.0
+G1 X-12.21 Y-69.25 Z-2.01 J681.78 F500.0
+G1 X-12.21 Y-65.05 Z-2.01 J685.90 F500.0
+G1 X-9.10 Y-63.25 Z-2.01 J689.42 F500.0
+G1 X-9.10 Y-59.05 Z-2.01 J693.53 F500.0
+G1 X-12.21 Y-57.25 Z-2.01 J697.05 F500.0
+G1 X-12.21 Y-53.05 Z-2.01 J701.17 F500.0
+G1 X-9.10 Y-51.25 Z-2.01 J704.69 F500.0
+G1 X-9.10 Y-47.05 Z-2.01 J708.81 F500.0
+G1 X-12.21 Y-45.25 Z-2.01 J712.33 F500.0
+G1 X-12.21 Y-41.05 Z-2.01 J716.45 F500.0
+G1 X-9.10 Y-39.25 Z-2.01 J719.97 F500.0
+G1 X-9.10 Y-37.08 Z-2.01 J722.09 F500.0
+G1 X-8.75 Y-37.08 Z-2.01 J722.44 F500.0
+G1 X-8.75 Y-39.25 Z-2.01 J724.56 F500.0
+G1 X-5.63 Y-41.05 Z-2.01 J728.09 F500.0
+G1 X-5.63 Y-45.25 Z-2.01 J732.21 F500.0
+G1 X-8.75 Y-47.05 Z-2.01 J735.74 F500.0
+G1 X-8.75 Y-51.25 Z-2.01 J739.86 F500.0
+G1 X-5.63 Y-53.05 Z-2.01 J743.39 F500.0
+G1 X-5.63 Y-57.25 Z-2.01 J747.50 F500.0
+G1 X-8.75 Y-59.05 Z-2.01 J751.03 F500.0
+G1 X-8.75 Y-63.25 Z-2.01 J755.15 F500.0
+G1 X-5.63 Y-65.05 Z-2.01 J758.68 F500.0
+G1 X-5.63 Y-69.25 Z-2.01 J762.79 F500.0
+G1 X-8.75 Y-71.05 Z-2.01 J766.32 F500.0
+G1 X-8.75 Y-75.25 Z-2.01 J770.44 F500.0
+G1 X-7.69 Y-75.86 Z-2.01 J771.64 F500.0
+G1 X-3.22 Y-75.86 Z-2.01 J776.02 F500.0
+G1 X-2.17 Y-75.25 Z-2.01 J777.21 F500.0
+G1 X-2.17 Y-71.05 Z-2.01 J781.32 F500.0
+G1 X-5.28 Y-69.25 Z-2.01 J784.85 F500.0
+G1 X-5.28 Y-65.05 Z-2.01 J788.96 F500.0
+G1 X-2.17 Y-63.25 Z-2.01 J792.48 F500.0
+G1 X-2.17 Y-59.05 Z-2.01 J796.60 F500.0
+G1 X-5.28 Y-57.25 Z-2.01 J800.12 F500.0
+G1 X-5.28 Y-53.05 Z-2.01 J804.24 F500.0
+G1 X-2.17 Y-51.25 Z-2.01 J807.76 F500.0
+G1 X-2.17 Y-47.05 Z-2.01 J811.87 F500.0
+G1 X-5.28 Y-45.25 Z-2.01 J815.40 F500.0
+G1 X-5.28 Y-41.05 Z-2.01 J819.51 F500.0
+G1 X-2.17 Y-39.25 Z-2.01 J823.03 F500.0
+G1 X-2.17 Y-37.08 Z-2.01 J825.16 F500.0
+G1 X-1.82 Y-37.08 Z-2.01 J825.50 F500.0
+G1 X-1.82 Y-39.25 Z-2.01 J827.63 F500.0
+G1 X1.30 Y-41.05 Z-2.01 J831.16 F500.0
+G1 X1.30 Y-45.25 Z-2.01 J835.28 F500.0
+G1 X-1.82 Y-47.05 Z-2.01 J838.81 F500.0
+G1 X-1.82 Y-51.25 Z-2.01 J842.92 F500.0
+G1 X1.30 Y-53.05 Z-2.01 J846.45 F500.0
+G1 X1.30 Y-57.25 Z-2.01 J850.57 F500.0
+G1 X-1.82 Y-59.05 Z-2.01 J854.10 F500.0
+G1 X-1.82 Y-63.25 Z-2.01 J858.21 F500.0
+G1 X1.30 Y-65.05 Z-2.01 J861.74 F500.0
+G1 X1.30 Y-69.25 Z-2.01 J865.86 F500.0
+G1 X-1.82 Y-71.05 Z-2.01 J869.39 F500.0
+G1 X-1.82 Y-75.25 Z-2.01 J873.51 F500.0
+G1 X-0.77 Y-75.86 Z-2.01 J874.70 F500.0
+G1 X3.71 Y-75.86 Z-2.01 J879.09 F500.0
+G1 X4.76 Y-75.25 Z-2.01 J880.28 F500.0
+G1 X4.76 Y-71.05 Z-2.01 J884.39 F500.0
+G1 X1.64 Y-69.25 Z-2.01 J887.92 F500.0
+G1 X1.64 Y-65.05 Z-2.01 J892.04 F500.0
+G1 X4.76 Y-63.25 Z-2.01 J895.57 F500.0
+G1 X4.76 Y-59.05 Z-2.01 J899.68 F500.0
+G1 X1.64 Y-57.25 Z-2.01 J903.21 F500.0
+G1 X1.64 Y-53.05 Z-2.01 J907.33 F500.0
+G1 X4.76 Y-51.25 Z-2.01 J910.86 F500.0
+G1 X4.76 Y-47.05 Z-2.01 J914.98 F500.0
+G1 X1.64 Y-45.25 Z-2.01 J918.51 F500.0
+G1 X1.64 Y-41.05 Z-2.01 J922.62 F500.0
+G1 X4.76 Y-39.25 Z-2.01 J926.15 F500.0
+G1 X4.76 Y-37.08 Z-2.01 J928.28 F500.0
+G1 X5.11 Y-37.08 Z-2.01 J928.62 F500.0
+G1 X5.11 Y-39.25 Z-2.01 J930.75 F500.0
+G1 X8.22 Y-41.05 Z-2.01 J934.27 F500.0
+G1 X8.22 Y-45.25 Z-2.01 J938.39 F500.0
+G1 X5.11 Y-47.05 Z-2.01 J941.91 F500.0
+G1 X5.11 Y-51.25 Z-2.01 J946.02 F500.0
+G1 X8.22 Y-53.05 Z-2.01 J949.54 F500.0
+G1 X8.22 Y-57.25 Z-2.01 J953.66 F500.0
+G1 X5.11 Y-59.05 Z-2.01 J957.18 F500.0
+G1 X5.11 Y-63.25 Z-2.01 J961.30 F500.0
+G1 X8.22 Y-65.05 Z-2.01 J964.82 F500.0
+G1 X8.22 Y-69.25 Z-2.01 J968.94 F500.0
+G1 X5.11 Y-71.05 Z-2.01 J972.46 F500.0
+G1 X5.11 Y-75.25 Z-2.01 J976.57 F500.0
+G1 X6.16 Y-75.86 Z-2.01 J977.76 F500.0
+G1 X10.63 Y-75.86 Z-2.01 J982.14 F500.0
+G1 X11.69 Y-75.25 Z-2.01 J983.34 F500.0
+G1 X11.69 Y-71.05 Z-2.01 J987.46 F500.0
+G1 X8.57 Y-69.25 Z-2.01 J990.99 F500.0
+G1 X8.57 Y-65.05 Z-2.01 J995.10 F500.0
+G1 X11.69 Y-63.25 Z-2.01 J998.63 F500.0
+G1 X11.69 Y-59.05 Z-2.01 J1002.75 F500.0
+G1 X8.57 Y-57.25 Z-2.01 J1006.28 F500.0
+G1 X8.57 Y-53.05 Z-2.01 J1010.40 F500.0
+G1 X11.69 Y-51.25 Z-2.01 J1013.93 F500.0
+G1 X11.69 Y-47.05 Z-2.01 J1018.04 F500.0
+G1 X8.57 Y-45.25 Z-2.01 J1021.57 F500.0
+G1 X8.57 Y-41.05 Z-2.01 J1025.69 F500.0
+G1 X11.69 Y-39.25 Z-2.01 J1029.22 F500.0
+G1 X11.69 Y-37.08 Z-2.01 J1031.34 F500.0
+G1 X12.03 Y-37.08 Z-2.01 J1031.68 F500.0
+G1 X12.03 Y-39.25 Z-2.01 J1033.80 F500.0
+G1 X15.15 Y-41.05 Z-2.01 J1037.33 F500.0
+G1 X15.15 Y-45.25 Z-2.01 J1041.45 F500.0
+G1 X12.03 Y-47.05 Z-2.01 J1044.98 F500.0
+G1 X12.03 Y-51.25 Z-2.01 J1049.10 F500.0
+G1 X15.15 Y-53.05 Z-2.01 J1052.63 F500.0
+G1 X15.15 Y-57.25 Z-2.01 J1056.74 F500.0
+G1 X12.03 Y-59.05 Z-2.01 J1060.27 F500.0
+G1 X12.03 Y-63.25 Z-2.01 J1064.39 F500.0
+G1 X15.15 Y-65.05 Z-2.01 J1067.92 F500.0
+G1 X15.15 Y-69.25 Z-2.01 J1072.03 F500.0
+G1 X12.03 Y-71.05 Z-2.01 J1075.56 F500.0
+G1 X12.03 Y-75.25 Z-2.01 J1079.68 F500.0
+G1 X13.09 Y-75.86 Z-2.01 J1080.88 F500.0
+G1 X17.56 Y-75.86 Z-2.01 J1085.26 F500.0
+G1 X18.62 Y-75.25 Z-2.01 J1086.46 F500.0
+G1 X18.62 Y-71.05 Z-2.01 J1090.57 F500.0
+G1 X15.50 Y-69.25 Z-2.01 J1094.10 F500.0
+G1 X15.50 Y-65.05 Z-2.01 J1098.22 F500.0
+G1 X18.62 Y-63.25 Z-2.01 J1101.75 F500.0
+G1 X18.62 Y-59.05 Z-2.01 J1105.87 F500.0
+G1 X15.50 Y-57.25 Z-2.01 J1109.40 F500.0
+G1 X15.50 Y-53.05 Z-2.01 J1113.51 F500.0
+G1 X18.62 Y-51.25 Z-2.01 J1117.04 F500.0
+G1 X18.62 Y-47.05 Z-2.01 J1121.16 F500.0
+G1 X15.50 Y-45.25 Z-2.01 J1124.69 F500.0
+G1 X15.50 Y-41.05 Z-2.01 J1128.80 F500.0
+G1 X18.62 Y-39.25 Z-2.01 J1132.33 F500.0
+G1 X18.62 Y-37.08 Z-2.01 J1134.46 F500.0
+G1 X18.96 Y-37.08 Z-2.01 J1134.79 F500.0
+G1 X18.96 Y-39.25 Z-2.01 J1136.92 F500.0
+G1 X22.08 Y-41.05 Z-2.01 J1140.45 F500.0
+G1 X22.08 Y-45.25 Z-2.01 J1144.57 F500.0
+G1 X18.96 Y-47.05 Z-2.01 J1148.10 F500.0
+G1 X18.96 Y-51.25 Z-2.01 J1152.21 F500.0
+G1 X22.08 Y-53.05 Z-2.01 J1155.74 F500.0
+G1 X22.08 Y-57.25 Z-2.01 J1159.86 F500.0
+G1 X18.96 Y-59.05 Z-2.01 J1163.39 F500.0
+G1 X18.96 Y-63.25 Z-2.01 J1167.50 F500.0
+G1 X22.08 Y-65.05 Z-2.01 J1171.03 F500.0
+G1 X22.08 Y-69.25 Z-2.01 J1175.15 F500.0
+G1 X18.96 Y-71.05 Z-2.01 J1178.68 F500.0
+G1 X18.96 Y-75.25 Z-2.01 J1182.80 F500.0
+G1 X20.02 Y-75.86 Z-2.01 J1183.99 F500.0
+G1 X24.49 Y-75.86 Z-2.01 J1188.37 F500.0
+G1 X25.54 Y-75.25 Z-2.01 J1189.56 F500.0
+G1 X25.54 Y-71.05 Z-2.01 J1193.68 F500.0
+G1 X22.43 Y-69.25 Z-2.01 J1197.20 F500.0
+G1 X22.43 Y-65.05 Z-2.01 J1201.32 F500.0
+G1 X25.54 Y-63.25 Z-2.01 J1204.84 F500.0
+G1 X25.54 Y-59.05 Z-2.01 J1208.96 F500.0
+G1 X22.43 Y-57.25 Z-2.01 J1212.48 F500.0
+G1 X22.43 Y-53.05 Z-2.01 J1216.59 F500.0
+G1 X25.54 Y-51.25 Z-2.01 J1220.11 F500.0
+G1 X25.54 Y-47.05 Z-2.01 J1224.23 F500.0
+G1 X22.43 Y-45.25 Z-2.01 J1227.75 F500.0
+G1 X22.43 Y-41.05 Z-2.01 J1231.87 F500.0
+G1 X25.54 Y-39.25 Z-2.01 J1235.39 F500.0
+G1 X25.54 Y-37.08 Z-2.01 J1237.52 F500.0
+G1 X25.89 Y-37.08 Z-2.01 J1237.86 F500.0
+G1 X25.89 Y-39.25 Z-2.01 J1239.99 F500.0
+G1 X29.01 Y-41.05 Z-2.01 J1243.52 F500.0
+G1 X29.01 Y-45.25 Z-2.01 J1247.63 F500.0
+G1 X25.89 Y-47.05 Z-2.01 J1251.16 F500.0
+G1 X25.89 Y-51.25 Z-2.01 J1255.28 F500.0
+G1 X29.01 Y-53.05 Z-2.01 J1258.81 F500.0
+G1 X29.01 Y-57.25 Z-2.01 J1262.92 F500.0
+G1 X25.89 Y-59.05 Z-2.01 J1266.45 F500.0
+G1 X25.89 Y-63.25 Z-2.01 J1270.57 F500.0
+G1 X29.01 Y-65.05 Z-2.01 J1274.10 F500.0
+G1 X29.01 Y-69.25 Z-2.01 J1278.22 F500.0
+G1 X25.89 Y-71.05 Z-2.01 J1281.75 F500.0
+G1 X25.89 Y-75.25 Z-2.01 J1285.86 F500.0
+G1 X26.95 Y-75.86 Z-2.01 J1287.06 F500.0
+G1 X31.42 Y-75.86 Z-2.01 J1291.44 F500.0
+G1 X32.47 Y-75.25 Z-2.01 J1292.63 F500.0
+G1 X32.47 Y-71.05 Z-2.01 J1296.75 F500.0
+G1 X29.36 Y-69.25 Z-2.01 J1300.27 F500.0
+G1 X29.36 Y-65.05 Z-2.01 J1304.38 F500.0
+G1 X32.47 Y-63.25 Z-2.01 J1307.91 F500.0
+G1 X32.47 Y-59.05 Z-2.01 J1312.02 F500.0
+G1 X29.36 Y-57.25 Z-2.01 J1315.54 F500.0
+G1 X29.36 Y-53.05 Z-2.01 J1319.66 F500.0
+G1 X32.47 Y-51.25 Z-2.01 J1323.18 F500.0
+G1 X32.47 Y-47.05 Z-2.01 J1327.30 F500.0
+G1 X29.36 Y-45.25 Z-2.01 J1330.82 F500.0
+G1 X29.36 Y-41.05 Z-2.01 J1334.93 F500.0
+G1 X32.47 Y-39.25 Z-2.01 J1338.46 F500.0
+G1 X32.47 Y-37.08 Z-2.01 J1340.58 F500.0
+G1 X32.82 Y-37.08 Z-2.01 J1340.92 F500.0
+G1 X32.82 Y-39.25 Z-2.01 J1343.05 F500.0
+G1 X35.94 Y-41.05 Z-2.01 J1346.58 F500.0
+G1 X35.94 Y-45.25 Z-2.01 J1350.70 F500.0
+G1 X32.82 Y-47.05 Z-2.01 J1354.23 F500.0
+G1 X32.82 Y-51.25 Z-2.01 J1358.34 F500.0
+G1 X35.94 Y-53.05 Z-2.01 J1361.87 F500.0
+G1 X35.94 Y-57.25 Z-2.01 J1365.99 F500.0
+G1 X32.82 Y-59.05 Z-2.01 J1369.52 F500.0
+G1 X32.82 Y-63.25 Z-2.01 J1373.64 F500.0
+G1 X35.94 Y-65.05 Z-2.01 J1377.17 F500.0
+G1 X35.94 Y-69.25 Z-2.01 J1381.28 F500.0
+G1 X32.82 Y-71.05 Z-2.01 J1384.81 F500.0
+G1 X32.82 Y-75.25 Z-2.01 J1388.93 F500.0
+G1 X33.88 Y-75.86 Z-2.01 J1390.13 F500.0
+G1 X38.35 Y-75.86 Z-2.01 J1394.51 F500.0
+G1 X39.40 Y-75.25 Z-2.01 J1395.70 F500.0
+G1 X39.40 Y-71.05 Z-2.01 J1399.81 F500.0
+G1 X36.28 Y-69.25 Z-2.01 J1403.34 F500.0
+G1 X36.28 Y-65.05 Z-2.01 J1407.46 F500.0
+G1 X39.40 Y-63.25 Z-2.01 J1410.99 F500.0
+G1 X39.40 Y-59.05 Z-2.01 J1415.10 F500.0
+G1 X36.28 Y-57.25 Z-2.01 J1418.63 F500.0
+G1 X36.28 Y-53.05 Z-2.01 J1422.75 F500.0
+G1 X39.40 Y-51.25 Z-2.01 J1426.28 F500.0
+G1 X39.40 Y-47.05 Z-2.01 J1430.40 F500.0
+G1 X36.28 Y-45.25 Z-2.01 J1433.93 F500.0
+G1 X36.28 Y-41.05 Z-2.01 J1438.04 F500.0
+G1 X39.40 Y-39.25 Z-2.01 J1441.57 F500.0
+G1 X39.40 Y-37.08 Z-2.01 J1443.70 F500.0
+G1 X39.75 Y-37.08 Z-2.01 J1444.04 F500.0
+G1 X39.75 Y-39.25 Z-2.01 J1446.17 F500.0
+G1 X42.43 Y-40.80 Z-2.01 J1449.20 F500.0
+G1 X42.43 Y-45.50 Z-2.01 J1453.81 F500.0
+G1 X39.75 Y-47.05 Z-2.01 J1456.84 F500.0
+G1 X39.75 Y-51.25 Z-2.01 J1460.96 F500.0
+G1 X42.43 Y-52.80 Z-2.01 J1463.99 F500.0
+G1 X42.43 Y-57.50 Z-2.01 J1468.60 F500.0
+G1 X39.75 Y-59.05 Z-2.01 J1471.63 F500.0
+G1 X39.75 Y-63.25 Z-2.01 J1475.75 F500.0
+G1 X42.43 Y-64.80 Z-2.01 J1478.78 F500.0
+G1 X42.43 Y-69.50 Z-2.01 J1483.39 F500.0
+G1 X39.75 Y-71.05 Z-2.01 J1486.42 F500.0
+G1 X39.75 Y-75.25 Z-2.01 J1490.54 F500.0
+G1 X40.80 Y-75.86 Z-2.01 J1491.73 F500.0
+
+T1
+G1 X35.80 Y-75.31 Z-1.01 J0.00 F500.0
+G1 X41.88 Y-75.31 Z-1.01 J5.96 F500.0
+G1 X41.88 Y-39.51 Z-1.01 J41.04 F500.0
+G1 X41.88 Y-37.63 Z-1.01 J42.88 F500.0
+G1 X-29.72 Y-37.63 Z-1.01 J113.05 F500.0
+G1 X-35.80 Y-37.63 Z-1.01 J119.01 F500.0
+G1 X-35.80 Y-73.43 Z-1.01 J154.10 F500.0
+G1 X-35.80 Y-75.31 Z-1.01 J155.94 F500.0
+G1 X35.80 Y-75.31 Z-1.01 J226.11 F500.0
+G1 X35.80 Y-75.31 Z-1.01 J226.11 F500.0
+G1 X-35.80 Y-39.63 Z-1.01 J304.50 F500.0
+G1 X-33.34 Y-41.05 Z-1.01 J307.29 F500.0
+G1 X-33.34 Y-45.25 Z-1.01 J311.40 F500.0
+G1 X-35.80 Y-46.67 Z-1.01 J314.19 F500.0
+G1 X-35.80 Y-51.64 Z-1.01 J319.06 F500.0
+G1 X-33.34 Y-53.05 Z-1.01 J321.84 F500.0
+G1 X-33.34 Y-57.25 Z-1.01 J325.95 F500.0
+G1 X-35.80 Y-58.67 Z-1.01 J328.74 F500.0
+G1 X-35.80 Y-63.64 Z-1.01 J333.61 F500.0
+G1 X-33.34 Y-65.05 Z-1.01 J336.38 F500.0
+G1 X-33.34 Y-69.25 Z-1.01 J340.50 F500.0
+G1 X-35.80 Y-70.67 Z-1.01 J343.28 F500.0
+G1 X-29.98 Y-75.31 Z-1.01 J350.58 F500.0
+G1 X-29.88 Y-75.25 Z-1.01 J350.69 F500.0
+G1 X-29.88 Y-71.05 Z-1.01 J354.81 F500.0
+G1 X-33.00 Y-69.25 Z-1.01 J358.34 F500.0
+G1 X-33.00 Y-65.05 Z-1.01 J362.46 F500.0
+G1 X-29.88 Y-63.25 Z-1.01 J365.98 F500.0
+G1 X-29.88 Y-59.05 Z-1.01 J370.10 F500.0
+G1 X-33.00 Y-57.25 Z-1.01 J373.63 F500.0
+G1 X-33.00 Y-53.05 Z-1.01 J377.75 F500.0
+G1 X-29.88 Y-51.25 Z-1.01 J381.28 F500.0
+G1 X-29.88 Y-47.05 Z-1.01 J385.39 F500.0
+G1 X-33.00 Y-45.25 Z-1.01 J388.92 F500.0
+G1 X-33.00 Y-41.05 Z-1.01 J393.04 F500.0
+G1 X-29.88 Y-39.25 Z-1.01 J396.57 F500.0
+G1 X-29.88 Y-37.63 Z-1.01 J398.16 F500.0
+G1 X-29.53 Y-37.63 Z-1.01 J398.50 F500.0
+G1 X-29.53 Y-39.25 Z-1.01 J400.09 F500.0
+G1 X-26.42 Y-41.05 Z-1.01 J403.61 F500.0
+G1 X-26.42 Y-45.25 Z-1.01 J407.72 F500.0
+G1 X-29.53 Y-47.05 Z-1.01 J411.25 F500.0
+G1 X-29.53 Y-51.25 Z-1.01 J415.36 F500.0
+G1 X-26.42 Y-53.05 Z-1.01 J418.88 F500.0
+G1 X-26.42 Y-57.25 Z-1.01 J423.00 F500.0
+G1 X-29.53 Y-59.05 Z-1.01 J426.52 F500.0
+G1 X-29.53 Y-63.25 Z-1.01 J430.64 F500.0
+G1 X-26.42 Y-65.05 Z-1.01 J434.16 F500.0
+G1 X-26.42 Y-69.25 Z-1.01 J438.27 F500.0
+G1 X-29.53 Y-71.05 Z-1.01 J441.80 F500.0
+G1 X-29.53 Y-75.25 Z-1.01 J445.91 F500.0
+G1 X-29.44 Y-75.31 Z-1.01 J446.02 F500.0
+G1 X-23.05 Y-75.31 Z-1.01 J452.28 F500.0
+G1 X-22.95 Y-75.25 Z-1.01 J452.39 F500.0
+G1 X-22.95 Y-71.05 Z-1.01 J456.51 F500.0
+G1 X-26.07 Y-69.25 Z-1.01 J460.04 F500.0
+G1 X-26.07 Y-65.05 Z-1.01 J464.16 F500.0
+G1 X-22.95 Y-63.25 Z-1.01 J467.69 F500.0
+G1 X-22.95 Y-59.05 Z-1.01 J471.80 F500.0
+G1 X-26.07 Y-57.25 Z-1.01 J475.33 F500.0
+G1 X-26.07 Y-53.05 Z-1.01 J479.45 F500.0
+G1 X-22.95 Y-51.25 Z-1.01 J482.98 F500.0
+G1 X-22.95 Y-47.05 Z-1.01 J487.09 F500.0
+G1 X-26.07 Y-45.25 Z-1.01 J490.62 F500.0
+G1 X-26.07 Y-41.05 Z-1.01 J494.74 F500.0
+G1 X-22.95 Y-39.25 Z-1.01 J498.27 F500.0
+G1 X-22.95 Y-37.63 Z-1.01 J499.86 F500.0
+G1 X-22.61 Y-37.63 Z-1.01 J500.19 F500.0
+G1 X-22.61 Y-39.25 Z-1.01 J501.78 F500.0
+G1 X-19.49 Y-41.05 Z-1.01 J505.31 F500.0
+G1 X-19.49 Y-45.25 Z-1.01 J509.42 F500.0
+G1 X-22.61 Y-47.05 Z-1.01 J512.95 F500.0
+G1 X-22.61 Y-51.25 Z-1.01 J517.07 F500.0
+G1 X-19.49 Y-53.05 Z-1.01 J520.60 F500.0
+G1 X-19.49 Y-57.25 Z-1.01 J524.72 F500.0
+G1 X-22.61 Y-59.05 Z-1.01 J528.25 F500.0
+G1 X-22.61 Y-63.25 Z-1.01 J532.36 F500.0
+G1 X-19.49 Y-65.05 Z-1.01 J535.89 F500.0
+G1 X-19.49 Y-69.25 Z-1.01 J540.01 F500.0
+G1 X-22.61 Y-71.05 Z-1.01 J543.54 F500.0
+G1 X-22.61 Y-75.25 Z-1.01 J547.65 F500.0
+G1 X-22.51 Y-75.31 Z-1.01 J547.77 F500.0
+G1 X-16.12 Y-75.31 Z-1.01 J554.03 F500.0
+G1 X-16.02 Y-75.25 Z-1.01 J554.15 F500.0
+G1 X-16.02 Y-71.05 Z-1.01 J558.26 F500.0
+G1 X-19.14 Y-69.25 Z-1.01 J561.79 F500.0
+G1 X-19.14 Y-65.05 Z-1.01 J565.91 F500.0
+G1 X-16.02 Y-63.25 Z-1.01 J569.44 F500.0
+G1 X-16.02 Y-59.05 Z-1.01 J573.55 F500.0
+G1 X-19.14 Y-57.25 Z-1.01 J577.08 F500.0
+G1 X-19.14 Y-53.05 Z-1.01 J581.20 F500.0
+G1 X-16.02 Y-51.25 Z-1.01 J584.73 F500.0
+G1 X-16.02 Y-47.05 Z-1.01 J588.84 F500.0
+G1 X-19.14 Y-45.25 Z-1.01 J592.37 F500.0
+G1 X-19.14 Y-41.05 Z-1.01 J596.49 F500.0
+G1 X-16.02 Y-39.25 Z-1.01 J600.02 F500.0
+G1 X-16.02 Y-37.63 Z-1.01 J601.61 F500.0
+G1 X-15.68 Y-37.63 Z-1.01 J601.94 F500.0
+G1 X-15.68 Y-39.25 Z-1.01 J603.53 F500.0
+G1 X-12.56 Y-41.05 Z-1.01 J607.06 F500.0
+G1 X-12.56 Y-45.25 Z-1.01 J611.18 F500.0
+G1 X-15.68 Y-47.05 Z-1.01 J614.71 F500.0
+G1 X-15.68 Y-51.25 Z-1.01 J618.82 F500.0
+G1 X-12.56 Y-53.05 Z-1.01 J622.35 F500.0
+G1 X-12.56 Y-57.25 Z-1.01 J626.47 F500.0
+G1 X-15.68 Y-59.05 Z-1.01 J630.00 F500.0
+G1 X-15.68 Y-63.25 Z-1.01 J634.11 F500.0
+G1 X-12.56 Y-65.05 Z-1.01 J637.64 F500.0
+G1 X-12.56 Y-69.25 Z-1.01 J641.76 F500.0
+G1 X-15.68 Y-71.05 Z-1.01 J645.29 F500.0
+G1 X-15.68 Y-75.25 Z-1.01 J649.40 F500.0
+G1 X-15.58 Y-75.31 Z-1.01 J649.52 F500.0
+G1 X-9.19 Y-75.31 Z-1.01 J655.78 F500.0
+G1 X-9.10 Y-75.25 Z-1.01 J655.89 F500.0
+G1 X-9.10 Y-71.05 Z-1.01 J660.00 F500.0
+G1 X-12.21 Y-69.25 Z-1.01 J663.52 F500.0
+G1 X-12.21 Y-65.05 Z-1.01 J667.64 F500.0
+G1 X-9.10 Y-63.25 Z-1.01 J671.16 F500.0
+G1 X-9.10 Y-59.05 Z-1.01 J675.28 F500.0
+G1 X-12.21 Y-57.25 Z-1.01 J678.80 F500.0
+G1 X-12.21 Y-53.05 Z-1.01 J682.92 F500.0
+G1 X-9.10 Y-51.25 Z-1.01 J686.44 F500.0
+G1 X-9.10 Y-47.05 Z-1.01 J690.55 F500.0
+G1 X-12.21 Y-45.25 Z-1.01 J694.07 F500.0
+G1 X-12.21 Y-41.05 Z-1.01 J698.19 F500.0
+G1 X-9.10 Y-39.25 Z-1.01 J701.71 F500.0
+G1 X-9.10 Y-37.63 Z-1.01 J703.30 F500.0
+G1 X-8.75 Y-37.63 Z-1.01 J703.64 F500.0
+G1 X-8.75 Y-39.25 Z-1.01 J705.23 F500.0
+G1 X-5.63 Y-41.05 Z-1.01 J708.76 F500.0
+G1 X-5.63 Y-45.25 Z-1.01 J712.88 F500.0
+G1 X-8.75 Y-47.05 Z-1.01 J716.41 F500.0
+G1 X-8.75 Y-51.25 Z-1.01 J720.52 F500.0
+G1 X-5.63 Y-53.05 Z-1.01 J724.05 F500.0
+G1 X-5.63 Y-57.25 Z-1.01 J728.17 F500.0
+G1 X-8.75 Y-59.05 Z-1.01 J731.70 F500.0
+G1 X-8.75 Y-63.25 Z-1.01 J735.81 F500.0
+G1 X-5.63 Y-65.05 Z-1.01 J739.34 F500.0
+G1 X-5.63 Y-69.25 Z-1.01 J743.46 F500.0
+G1 X-8.75 Y-71.05 Z-1.01 J746.99 F500.0
+G1 X-8.75 Y-75.25 Z-1.01 J751.11 F500.0
+G1 X-8.65 Y-75.31 Z-1.01 J751.22 F500.0
+G1 X-2.26 Y-75.31 Z-1.01 J757.48 F500.0
+G1 X-2.17 Y-75.25 Z-1.01 J757.59 F500.0
+G1 X-2.17 Y-71.05 Z-1.01 J761.70 F500.0
+G1 X-5.28 Y-69.25 Z-1.01 J765.23 F500.0
+G1 X-5.28 Y-65.05 Z-1.01 J769.34 F500.0
+G1 X-2.17 Y-63.25 Z-1.01 J772.86 F500.0
+G1 X-2.17 Y-59.05 Z-1.01 J776.98 F500.0
+G1 X-5.28 Y-57.25 Z-1.01 J780.50 F500.0
+G1 X-5.28 Y-53.05 Z-1.01 J784.62 F500.0
+G1 X-2.17 Y-51.25 Z-1.01 J788.14 F500.0
+G1 X-2.17 Y-47.05 Z-1.01 J792.25 F500.0
+G1 X-5.28 Y-45.25 Z-1.01 J795.78 F500.0
+G1 X-5.28 Y-41.05 Z-1.01 J799.89 F500.0
+G1 X-2.17 Y-39.25 Z-1.01 J803.41 F500.0
+G1 X-2.17 Y-37.63 Z-1.01 J805.00 F500.0
+G1 X-1.82 Y-37.63 Z-1.01 J805.34 F500.0
+G1 X-1.82 Y-39.25 Z-1.01 J806.93 F500.0
+G1 X1.30 Y-41.05 Z-1.01 J810.46 F500.0
+G1 X1.30 Y-45.25 Z-1.01 J814.58 F500.0
+G1 X-1.82 Y-47.05 Z-1.01 J818.11 F500.0
+G1 X-1.82 Y-51.25 Z-1.01 J822.22 F500.0
+G1 X1.30 Y-53.05 Z-1.01 J825.75 F500.0
+G1 X1.30 Y-57.25 Z-1.01 J829.87 F500.0
+G1 X-1.82 Y-59.05 Z-1.01 J833.40 F500.0
+G1 X-1.82 Y-63.25 Z-1.01 J837.52 F500.0
+G1 X1.30 Y-65.05 Z-1.01 J841.05 F500.0
+G1 X1.30 Y-69.25 Z-1.01 J845.16 F500.0
+G1 X-1.82 Y-71.05 Z-1.01 J848.69 F500.0
+G1 X-1.82 Y-75.25 Z-1.01 J852.81 F500.0
+G1 X-1.73 Y-75.31 Z-1.01 J852.91 F500.0
+G1 X4.67 Y-75.31 Z-1.01 J859.19 F500.0
+G1 X4.76 Y-75.25 Z-1.01 J859.29 F500.0
+G1 X4.76 Y-71.05 Z-1.01 J863.41 F500.0
+G1 X1.64 Y-69.25 Z-1.01 J866.94 F500.0
+G1 X1.64 Y-65.05 Z-1.01 J871.05 F500.0
+G1 X4.76 Y-63.25 Z-1.01 J874.58 F500.0
+G1 X4.76 Y-59.05 Z-1.01 J878.70 F500.0
+G1 X1.64 Y-57.25 Z-1.01 J882.23 F500.0
+G1 X1.64 Y-53.05 Z-1.01 J886.35 F500.0
+G1 X4.76 Y-51.25 Z-1.01 J889.88 F500.0
+G1 X4.76 Y-47.05 Z-1.01 J893.99 F500.0
+G1 X1.64 Y-45.25 Z-1.01 J897.52 F500.0
+G1 X1.64 Y-41.05 Z-1.01 J901.64 F500.0
+G1 X4.76 Y-39.25 Z-1.01 J905.17 F500.0
+G1 X4.76 Y-37.63 Z-1.01 J906.75 F500.0
+G1 X5.11 Y-37.63 Z-1.01 J907.10 F500.0
+G1 X5.11 Y-39.25 Z-1.01 J908.69 F500.0
+G1 X8.22 Y-41.05 Z-1.01 J912.21 F500.0
+G1 X8.22 Y-45.25 Z-1.01 J916.32 F500.0
+G1 X5.11 Y-47.05 Z-1.01 J919.84 F500.0
+G1 X5.11 Y-51.25 Z-1.01 J923.96 F500.0
+G1 X8.22 Y-53.05 Z-1.01 J927.48 F500.0
+G1 X8.22 Y-57.25 Z-1.01 J931.60 F500.0
+G1 X5.11 Y-59.05 Z-1.01 J935.12 F500.0
+G1 X5.11 Y-63.25 Z-1.01 J939.24 F500.0
+G1 X8.22 Y-65.05 Z-1.01 J942.76 F500.0
+G1 X8.22 Y-69.25 Z-1.01 J946.87 F500.0
+G1 X5.11 Y-71.05 Z-1.01 J950.39 F500.0
+G1 X5.11 Y-75.25 Z-1.01 J954.51 F500.0
+G1 X5.20 Y-75.31 Z-1.01 J954.62 F500.0
+G1 X11.59 Y-75.31 Z-1.01 J960.88 F500.0
+G1 X11.69 Y-75.25 Z-1.01 J960.99 F500.0
+G1 X11.69 Y-71.05 Z-1.01 J965.11 F500.0
+G1 X8.57 Y-69.25 Z-1.01 J968.64 F500.0
+G1 X8.57 Y-65.05 Z-1.01 J972.75 F500.0
+G1 X11.69 Y-63.25 Z-1.01 J976.28 F500.0
+G1 X11.69 Y-59.05 Z-1.01 J980.40 F500.0
+G1 X8.57 Y-57.25 Z-1.01 J983.93 F500.0
+G1 X8.57 Y-53.05 Z-1.01 J988.05 F500.0
+G1 X11.69 Y-51.25 Z-1.01 J991.58 F500.0
+G1 X11.69 Y-47.05 Z-1.01 J995.69 F500.0
+G1 X8.57 Y-45.25 Z-1.01 J999.22 F500.0
+G1 X8.57 Y-41.05 Z-1.01 J1003.34 F500.0
+G1 X11.69 Y-39.25 Z-1.01 J1006.87 F500.0
+G1 X11.69 Y-37.63 Z-1.01 J1008.46 F500.0
+G1 X12.03 Y-37.63 Z-1.01 J1008.79 F500.0
+G1 X12.03 Y-39.25 Z-1.01 J1010.38 F500.0
+G1 X15.15 Y-41.05 Z-1.01 J1013.91 F500.0
+G1 X15.15 Y-45.25 Z-1.01 J1018.02 F500.0
+G1 X12.03 Y-47.05 Z-1.01 J1021.55 F500.0
+G1 X12.03 Y-51.25 Z-1.01 J1025.67 F500.0
+G1 X15.15 Y-53.05 Z-1.01 J1029.20 F500.0
+G1 X15.15 Y-57.25 Z-1.01 J1033.31 F500.0
+G1 X12.03 Y-59.05 Z-1.01 J1036.84 F500.0
+G1 X12.03 Y-63.25 Z-1.01 J1040.96 F500.0
+G1 X15.15 Y-65.05 Z-1.01 J1044.49 F500.0
+G1 X15.15 Y-69.25 Z-1.01 J1048.61 F500.0
+G1 X12.03 Y-71.05 Z-1.01 J1052.14 F500.0
+G1 X12.03 Y-75.25 Z-1.01 J1056.25 F500.0
+G1 X12.13 Y-75.31 Z-1.01 J1056.37 F500.0
+G1 X18.52 Y-75.31 Z-1.01 J1062.63 F500.0
+G1 X18.62 Y-75.25 Z-1.01 J1062.74 F500.0
+G1 X18.62 Y-71.05 Z-1.01 J1066.86 F500.0
+G1 X15.50 Y-69.25 Z-1.01 J1070.39 F500.0
+G1 X15.50 Y-65.05 Z-1.01 J1074.51 F500.0
+G1 X18.62 Y-63.25 Z-1.01 J1078.04 F500.0
+G1 X18.62 Y-59.05 Z-1.01 J1082.15 F500.0
+G1 X15.50 Y-57.25 Z-1.01 J1085.68 F500.0
+G1 X15.50 Y-53.05 Z-1.01 J1089.80 F500.0
+G1 X18.62 Y-51.25 Z-1.01 J1093.33 F500.0
+G1 X18.62 Y-47.05 Z-1.01 J1097.44 F500.0
+G1 X15.50 Y-45.25 Z-1.01 J1100.97 F500.0
+G1 X15.50 Y-41.05 Z-1.01 J1105.09 F500.0
+G1 X18.62 Y-39.25 Z-1.01 J1108.62 F500.0
+G1 X18.62 Y-37.63 Z-1.01 J1110.21 F500.0
+G1 X18.96 Y-37.63 Z-1.01 J1110.54 F500.0
+G1 X18.96 Y-39.25 Z-1.01 J1112.13 F500.0
+G1 X22.08 Y-41.05 Z-1.01 J1115.66 F500.0
+G1 X22.08 Y-45.25 Z-1.01 J1119.77 F500.0
+G1 X18.96 Y-47.05 Z-1.01 J1123.30 F500.0
+G1 X18.96 Y-51.25 Z-1.01 J1127.42 F500.0
+G1 X22.08 Y-53.05 Z-1.01 J1130.95 F500.0
+G1 X22.08 Y-57.25 Z-1.01 J1135.07 F500.0
+G1 X18.96 Y-59.05 Z-1.01 J1138.60 F500.0
+G1 X18.96 Y-63.25 Z-1.01 J1142.71 F500.0
+G1 X22.08 Y-65.05 Z-1.01 J1146.24 F500.0
+G1 X22.08 Y-69.25 Z-1.01 J1150.36 F500.0
+G1 X18.96 Y-71.05 Z-1.01 J1153.89 F500.0
+G1 X18.96 Y-75.25 Z-1.01 J1158.00 F500.0
+G1 X19.06 Y-75.31 Z-1.01 J1158.12 F500.0
+G1 X25.45 Y-75.31 Z-1.01 J1164.38 F500.0
+G1 X25.54 Y-75.25 Z-1.01 J1164.49 F500.0
+G1 X25.54 Y-71.05 Z-1.01 J1168.60 F500.0
+G1 X22.43 Y-69.25 Z-1.01 J1172.12 F500.0
+G1 X22.43 Y-65.05 Z-1.01 J1176.24 F500.0
+G1 X25.54 Y-63.25 Z-1.01 J1179.76 F500.0
+G1 X25.54 Y-59.05 Z-1.01 J1183.88 F500.0
+G1 X22.43 Y-57.25 Z-1.01 J1187.40 F500.0
+G1 X22.43 Y-53.05 Z-1.01 J1191.51 F500.0
+G1 X25.54 Y-51.25 Z-1.01 J1195.04 F500.0
+G1 X25.54 Y-47.05 Z-1.01 J1199.15 F500.0
+G1 X22.43 Y-45.25 Z-1.01 J1202.67 F500.0
+G1 X22.43 Y-41.05 Z-1.01 J1206.79 F500.0
+G1 X25.54 Y-39.25 Z-1.01 J1210.31 F500.0
+G1 X25.54 Y-37.63 Z-1.01 J1211.90 F500.0
+G1 X25.89 Y-37.63 Z-1.01 J1212.24 F500.0
+G1 X25.89 Y-39.25 Z-1.01 J1213.83 F500.0
+G1 X29.01 Y-41.05 Z-1.01 J1217.36 F500.0
+G1 X29.01 Y-45.25 Z-1.01 J1221.47 F500.0
+G1 X25.89 Y-47.05 Z-1.01 J1225.00 F500.0
+G1 X25.89 Y-51.25 Z-1.01 J1229.12 F500.0
+G1 X29.01 Y-53.05 Z-1.01 J1232.65 F500.0
+G1 X29.01 Y-57.25 Z-1.01 J1236.77 F500.0
+G1 X25.89 Y-59.05 Z-1.01 J1240.30 F500.0
+G1 X25.89 Y-63.25 Z-1.01 J1244.41 F500.0
+G1 X29.01 Y-65.05 Z-1.01 J1247.94 F500.0
+G1 X29.01 Y-69.25 Z-1.01 J1252.06 F500.0
+G1 X25.89 Y-71.05 Z-1.01 J1255.59 F500.0
+G1 X25.89 Y-75.25 Z-1.01 J1259.70 F500.0
+G1 X25.99 Y-75.31 Z-1.01 J1259.82 F500.0
+G1 X32.38 Y-75.31 Z-1.01 J1266.08 F500.0
+G1 X32.47 Y-75.25 Z-1.01 J1266.19 F500.0
+G1 X32.47 Y-71.05 Z-1.01 J1270.30 F500.0
+G1 X29.36 Y-69.25 Z-1.01 J1273.82 F500.0
+G1 X29.36 Y-65.05 Z-1.01 J1277.94 F500.0
+G1 X32.47 Y-63.25 Z-1.01 J1281.46 F500.0
+G1 X32.47 Y-59.05 Z-1.01 J1285.58 F500.0
+G1 X29.36 Y-57.25 Z-1.01 J1289.10 F500.0
+G1 X29.36 Y-53.05 Z-1.01 J1293.22 F500.0
+G1 X32.47 Y-51.25 Z-1.01 J1296.74 F500.0
+G1 X32.47 Y-47.05 Z-1.01 J1300.85 F500.0
+G1 X29.36 Y-45.25 Z-1.01 J1304.37 F500.0
+G1 X29.36 Y-41.05 Z-1.01 J1308.49 F500.0
+G1 X32.47 Y-39.25 Z-1.01 J1312.01 F500.0
+G1 X32.47 Y-37.63 Z-1.01 J1313.60 F500.0
+G1 X32.82 Y-37.63 Z-1.01 J1313.94 F500.0
+G1 X32.82 Y-39.25 Z-1.01 J1315.53 F500.0
+G1 X35.94 Y-41.05 Z-1.01 J1319.06 F500.0
+G1 X35.94 Y-45.25 Z-1.01 J1323.18 F500.0
+G1 X32.82 Y-47.05 Z-1.01 J1326.71 F500.0
+G1 X32.82 Y-51.25 Z-1.01 J1330.82 F500.0
+G1 X35.94 Y-53.05 Z-1.01 J1334.35 F500.0
+G1 X35.94 Y-57.25 Z-1.01 J1338.47 F500.0
+G1 X32.82 Y-59.05 Z-1.01 J1342.00 F500.0
+G1 X32.82 Y-63.25 Z-1.01 J1346.11 F500.0
+G1 X35.94 Y-65.05 Z-1.01 J1349.64 F500.0
+G1 X35.94 Y-69.25 Z-1.01 J1353.76 F500.0
+G1 X32.82 Y-71.05 Z-1.01 J1357.29 F500.0
+G1 X32.82 Y-75.25 Z-1.01 J1361.41 F500.0
+G1 X32.92 Y-75.31 Z-1.01 J1361.52 F500.0
+G1 X39.31 Y-75.31 Z-1.01 J1367.78 F500.0
+G1 X39.40 Y-75.25 Z-1.01 J1367.89 F500.0
+G1 X39.40 Y-71.05 Z-1.01 J1372.00 F500.0
+G1 X36.28 Y-69.25 Z-1.01 J1375.53 F500.0
+G1 X36.28 Y-65.05 Z-1.01 J1379.65 F500.0
+G1 X39.40 Y-63.25 Z-1.01 J1383.18 F500.0
+G1 X39.40 Y-59.05 Z-1.01 J1387.30 F500.0
+G1 X36.28 Y-57.25 Z-1.01 J1390.83 F500.0
+G1 X36.28 Y-53.05 Z-1.01 J1394.94 F500.0
+G1 X39.40 Y-51.25 Z-1.01 J1398.47 F500.0
+G1 X39.40 Y-47.05 Z-1.01 J1402.59 F500.0
+G1 X36.28 Y-45.25 Z-1.01 J1406.12 F500.0
+G1 X36.28 Y-41.05 Z-1.01 J1410.23 F500.0
+G1 X39.40 Y-39.25 Z-1.01 J1413.76 F500.0
+G1 X39.40 Y-37.63 Z-1.01 J1415.35 F500.0
+G1 X39.75 Y-37.63 Z-1.01 J1415.69 F500.0
+G1 X39.75 Y-39.25 Z-1.01 J1417.28 F500.0
+G1 X41.88 Y-40.48 Z-1.01 J1419.69 F500.0
+G1 X41.88 Y-45.82 Z-1.01 J1424.93 F500.0
+G1 X39.75 Y-47.05 Z-1.01 J1427.34 F500.0
+G1 X39.75 Y-51.25 Z-1.01 J1431.45 F500.0
+G1 X41.88 Y-52.48 Z-1.01 J1433.86 F500.0
+G1 X41.88 Y-57.82 Z-1.01 J1439.10 F500.0
+G1 X39.75 Y-59.05 Z-1.01 J1441.51 F500.0
+G1 X39.75 Y-63.25 Z-1.01 J1445.62 F500.0
+G1 X41.88 Y-64.48 Z-1.01 J1448.03 F500.0
+G1 X41.88 Y-69.82 Z-1.01 J1453.27 F500.0
+G1 X39.75 Y-71.05 Z-1.01 J1455.68 F500.0
+G1 X39.75 Y-75.25 Z-1.01 J1459.79 F500.0
+G1 X39.84 Y-75.31 Z-1.01 J1459.90 F500.0
+
+T1
+G1 X32.36 Y-74.75 Z-0.01 J0.00 F500.0
+G1 X41.32 Y-74.75 Z-0.01 J8.78 F500.0
+G1 X41.32 Y-40.95 Z-0.01 J41.90 F500.0
+G1 X41.32 Y-38.19 Z-0.01 J44.61 F500.0
+G1 X-26.28 Y-38.19 Z-0.01 J110.86 F500.0
+G1 X-35.24 Y-38.19 Z-0.01 J119.64 F500.0
+G1 X-35.24 Y-71.99 Z-0.01 J152.76 F500.0
+G1 X-35.24 Y-74.75 Z-0.01 J155.47 F500.0
+G1 X32.36 Y-74.75 Z-0.01 J221.72 F500.0
+G1 X32.36 Y-74.75 Z-0.01 J221.72 F500.0
+G1 X-35.24 Y-39.95 Z-0.01 J296.23 F500.0
+G1 X-33.34 Y-41.05 Z-0.01 J298.38 F500.0
+G1 X-33.34 Y-45.25 Z-0.01 J302.49 F500.0
+G1 X-35.24 Y-46.35 Z-0.01 J304.65 F500.0
+G1 X-35.24 Y-51.96 Z-0.01 J310.14 F500.0
+G1 X-33.34 Y-53.05 Z-0.01 J312.29 F500.0
+G1 X-33.34 Y-57.25 Z-0.01 J316.41 F500.0
+G1 X-35.24 Y-58.35 Z-0.01 J318.56 F500.0
+G1 X-35.24 Y-63.96 Z-0.01 J324.06 F500.0
+G1 X-33.34 Y-65.05 Z-0.01 J326.20 F500.0
+G1 X-33.34 Y-69.25 Z-0.01 J330.32 F500.0
+G1 X-35.24 Y-70.35 Z-0.01 J332.47 F500.0
+G1 X-29.88 Y-74.75 Z-0.01 J339.27 F500.0
+G1 X-29.88 Y-71.05 Z-0.01 J342.89 F500.0
+G1 X-33.00 Y-69.25 Z-0.01 J346.42 F500.0
+G1 X-33.00 Y-65.05 Z-0.01 J350.54 F500.0
+G1 X-29.88 Y-63.25 Z-0.01 J354.07 F500.0
+G1 X-29.88 Y-59.05 Z-0.01 J358.18 F500.0
+G1 X-33.00 Y-57.25 Z-0.01 J361.71 F500.0
+G1 X-33.00 Y-53.05 Z-0.01 J365.83 F500.0
+G1 X-29.88 Y-51.25 Z-0.01 J369.36 F500.0
+G1 X-29.88 Y-47.05 Z-0.01 J373.48 F500.0
+G1 X-33.00 Y-45.25 Z-0.01 J377.00 F500.0
+G1 X-33.00 Y-41.05 Z-0.01 J381.12 F500.0
+G1 X-29.88 Y-39.25 Z-0.01 J384.65 F500.0
+G1 X-29.88 Y-38.19 Z-0.01 J385.69 F500.0
+G1 X-29.53 Y-38.19 Z-0.01 J386.03 F500.0
+G1 X-29.53 Y-39.25 Z-0.01 J387.07 F500.0
+G1 X-26.42 Y-41.05 Z-0.01 J390.59 F500.0
+G1 X-26.42 Y-45.25 Z-0.01 J394.71 F500.0
+G1 X-29.53 Y-47.05 Z-0.01 J398.23 F500.0
+G1 X-29.53 Y-51.25 Z-0.01 J402.35 F500.0
+G1 X-26.42 Y-53.05 Z-0.01 J405.87 F500.0
+G1 X-26.42 Y-57.25 Z-0.01 J409.98 F500.0
+G1 X-29.53 Y-59.05 Z-0.01 J413.51 F500.0
+G1 X-29.53 Y-63.25 Z-0.01 J417.62 F500.0
+G1 X-26.42 Y-65.05 Z-0.01 J421.14 F500.0
+G1 X-26.42 Y-69.25 Z-0.01 J425.26 F500.0
+G1 X-29.53 Y-71.05 Z-0.01 J428.78 F500.0
+G1 X-29.53 Y-74.75 Z-0.01 J432.41 F500.0
+G1 X-22.95 Y-74.75 Z-0.01 J438.85 F500.0
+G1 X-22.95 Y-71.05 Z-0.01 J442.48 F500.0
+G1 X-26.07 Y-69.25 Z-0.01 J446.01 F500.0
+G1 X-26.07 Y-65.05 Z-0.01 J450.13 F500.0
+G1 X-22.95 Y-63.25 Z-0.01 J453.66 F500.0
+G1 X-22.95 Y-59.05 Z-0.01 J457.77 F500.0
+G1 X-26.07 Y-57.25 Z-0.01 J461.30 F500.0
+G1 X-26.07 Y-53.05 Z-0.01 J465.42 F500.0
+G1 X-22.95 Y-51.25 Z-0.01 J468.95 F500.0
+G1 X-22.95 Y-47.05 Z-0.01 J473.06 F500.0
+G1 X-26.07 Y-45.25 Z-0.01 J476.59 F500.0
+G1 X-26.07 Y-41.05 Z-0.01 J480.71 F500.0
+G1 X-22.95 Y-39.25 Z-0.01 J484.24 F500.0
+G1 X-22.95 Y-38.19 Z-0.01 J485.28 F500.0
+G1 X-22.61 Y-38.19 Z-0.01 J485.61 F500.0
+G1 X-22.61 Y-39.25 Z-0.01 J486.65 F500.0
+G1 X-19.49 Y-41.05 Z-0.01 J490.18 F500.0
+G1 X-19.49 Y-45.25 Z-0.01 J494.30 F500.0
+G1 X-22.61 Y-47.05 Z-0.01 J497.83 F500.0
+G1 X-22.61 Y-51.25 Z-0.01 J501.94 F500.0
+G1 X-19.49 Y-53.05 Z-0.01 J505.47 F500.0
+G1 X-19.49 Y-57.25 Z-0.01 J509.59 F500.0
+G1 X-22.61 Y-59.05 Z-0.01 J513.12 F500.0
+G1 X-22.61 Y-63.25 Z-0.01 J517.24 F500.0
+G1 X-19.49 Y-65.05 Z-0.01 J520.77 F500.0
+G1 X-19.49 Y-69.25 Z-0.01 J524.88 F500.0
+G1 X-22.61 Y-71.05 Z-0.01 J528.41 F500.0
+G1 X-22.61 Y-74.75 Z-0.01 J532.04 F500.0
+G1 X-16.02 Y-74.75 Z-0.01 J538.50 F500.0
+G1 X-16.02 Y-71.05 Z-0.01 J542.12 F500.0
+G1 X-19.14 Y-69.25 Z-0.01 J545.65 F500.0
+G1 X-19.14 Y-65.05 Z-0.01 J549.77 F500.0
+G1 X-16.02 Y-63.25 Z-0.01 J553.30 F500.0
+G1 X-16.02 Y-59.05 Z-0.01 J557.41 F500.0
+G1 X-19.14 Y-57.25 Z-0.01 J560.94 F500.0
+G1 X-19.14 Y-53.05 Z-0.01 J565.06 F500.0
+G1 X-16.02 Y-51.25 Z-0.01 J568.59 F500.0
+G1 X-16.02 Y-47.05 Z-0.01 J572.71 F500.0
+G1 X-19.14 Y-45.25 Z-0.01 J576.24 F500.0
+G1 X-19.14 Y-41.05 Z-0.01 J580.35 F500.0
+G1 X-16.02 Y-39.25 Z-0.01 J583.88 F500.0
+G1 X-16.02 Y-38.19 Z-0.01 J584.92 F500.0
+G1 X-15.68 Y-38.19 Z-0.01 J585.25 F500.0
+G1 X-15.68 Y-39.25 Z-0.01 J586.29 F500.0
+G1 X-12.56 Y-41.05 Z-0.01 J589.82 F500.0
+G1 X-12.56 Y-45.25 Z-0.01 J593.94 F500.0
+G1 X-15.68 Y-47.05 Z-0.01 J597.47 F500.0
+G1 X-15.68 Y-51.25 Z-0.01 J601.58 F500.0
+G1 X-12.56 Y-53.05 Z-0.01 J605.11 F500.0
+G1 X-12.56 Y-57.25 Z-0.01 J609.23 F500.0
+G1 X-15.68 Y-59.05 Z-0.01 J612.76 F500.0
+G1 X-15.68 Y-63.25 Z-0.01 J616.88 F500.0
+G1 X-12.56 Y-65.05 Z-0.01 J620.41 F500.0
+G1 X-12.56 Y-69.25 Z-0.01 J624.52 F500.0
+G1 X-15.68 Y-71.05 Z-0.01 J628.05 F500.0
+G1 X-15.68 Y-74.75 Z-0.01 J631.68 F500.0
+G1 X-9.10 Y-74.75 Z-0.01 J638.13 F500.0
+G1 X-9.10 Y-71.05 Z-0.01 J641.75 F500.0
+G1 X-12.21 Y-69.25 Z-0.01 J645.27 F500.0
+G1 X-12.21 Y-65.05 Z-0.01 J649.39 F500.0
+G1 X-9.10 Y-63.25 Z-0.01 J652.91 F500.0
+G1 X-9.10 Y-59.05 Z-0.01 J657.03 F500.0
+G1 X-12.21 Y-57.25 Z-0.01 J660.55 F500.0
+G1 X-12.21 Y-53.05 Z-0.01 J664.66 F500.0
+G1 X-9.10 Y-51.25 Z-0.01 J668.19 F500.0
+G1 X-9.10 Y-47.05 Z-0.01 J672.30 F500.0
+G1 X-12.21 Y-45.25 Z-0.01 J675.82 F500.0
+G1 X-12.21 Y-41.05 Z-0.01 J679.94 F500.0
+G1 X-9.10 Y-39.25 Z-0.01 J683.46 F500.0
+G1 X-9.10 Y-38.19 Z-0.01 J684.50 F500.0
+G1 X-8.75 Y-38.19 Z-0.01 J684.84 F500.0
+G1 X-8.75 Y-39.25 Z-0.01 J685.88 F500.0
+G1 X-5.63 Y-41.05 Z-0.01 J689.41 F500.0
+G1 X-5.63 Y-45.25 Z-0.01 J693.53 F500.0
+G1 X-8.75 Y-47.05 Z-0.01 J697.06 F500.0
+G1 X-8.75 Y-51.25 Z-0.01 J701.17 F500.0
+G1 X-5.63 Y-53.05 Z-0.01 J704.70 F500.0
+G1 X-5.63 Y-57.25 Z-0.01 J708.82 F500.0
+G1 X-8.75 Y-59.05 Z-0.01 J712.35 F500.0
+G1 X-8.75 Y-63.25 Z-0.01 J716.47 F500.0
+G1 X-5.63 Y-65.05 Z-0.01 J720.00 F500.0
+G1 X-5.63 Y-69.25 Z-0.01 J724.11 F500.0
+G1 X-8.75 Y-71.05 Z-0.01 J727.64 F500.0
+G1 X-8.75 Y-74.75 Z-0.01 J731.27 F500.0
+G1 X-2.17 Y-74.75 Z-0.01 J737.72 F500.0
+G1 X-2.17 Y-71.05 Z-0.01 J741.34 F500.0
+G1 X-5.28 Y-69.25 Z-0.01 J744.86 F500.0
+G1 X-5.28 Y-65.05 Z-0.01 J748.98 F500.0
+G1 X-2.17 Y-63.25 Z-0.01 J752.50 F500.0
+G1 X-2.17 Y-59.05 Z-0.01 J756.62 F500.0
+G1 X-5.28 Y-57.25 Z-0.01 J760.14 F500.0
+G1 X-5.28 Y-53.05 Z-0.01 J764.25 F500.0
+G1 X-2.17 Y-51.25 Z-0.01 J767.78 F500.0
+G1 X-2.17 Y-47.05 Z-0.01 J771.89 F500.0
+G1 X-5.28 Y-45.25 Z-0.01 J775.41 F500.0
+G1 X-5.28 Y-41.05 Z-0.01 J779.53 F500.0
+G1 X-2.17 Y-39.25 Z-0.01 J783.05 F500.0
+G1 X-2.17 Y-38.19 Z-0.01 J784.09 F500.0
+G1 X-1.82 Y-38.19 Z-0.01 J784.43 F500.0
+G1 X-1.82 Y-39.25 Z-0.01 J785.47 F500.0
+G1 X1.30 Y-41.05 Z-0.01 J789.00 F500.0
+G1 X1.30 Y-45.25 Z-0.01 J793.12 F500.0
+G1 X-1.82 Y-47.05 Z-0.01 J796.65 F500.0
+G1 X-1.82 Y-51.25 Z-0.01 J800.76 F500.0
+G1 X1.30 Y-53.05 Z-0.01 J804.29 F500.0
+G1 X1.30 Y-57.25 Z-0.01 J808.41 F500.0
+G1 X-1.82 Y-59.05 Z-0.01 J811.94 F500.0
+G1 X-1.82 Y-63.25 Z-0.01 J816.05 F500.0
+G1 X1.30 Y-65.05 Z-0.01 J819.58 F500.0
+G1 X1.30 Y-69.25 Z-0.01 J823.70 F500.0
+G1 X-1.82 Y-71.05 Z-0.01 J827.23 F500.0
+G1 X-1.82 Y-74.75 Z-0.01 J830.86 F500.0
+G1 X4.76 Y-74.75 Z-0.01 J837.31 F500.0
+G1 X4.76 Y-71.05 Z-0.01 J840.93 F500.0
+G1 X1.64 Y-69.25 Z-0.01 J844.46 F500.0
+G1 X1.64 Y-65.05 Z-0.01 J848.58 F500.0
+G1 X4.76 Y-63.25 Z-0.01 J852.11 F500.0
+G1 X4.76 Y-59.05 Z-0.01 J856.22 F500.0
+G1 X1.64 Y-57.25 Z-0.01 J859.75 F500.0
+G1 X1.64 Y-53.05 Z-0.01 J863.87 F500.0
+G1 X4.76 Y-51.25 Z-0.01 J867.40 F500.0
+G1 X4.76 Y-47.05 Z-0.01 J871.52 F500.0
+G1 X1.64 Y-45.25 Z-0.01 J875.05 F500.0
+G1 X1.64 Y-41.05 Z-0.01 J879.16 F500.0
+G1 X4.76 Y-39.25 Z-0.01 J882.69 F500.0
+G1 X4.76 Y-38.19 Z-0.01 J883.73 F500.0
+G1 X5.11 Y-38.19 Z-0.01 J884.07 F500.0
+G1 X5.11 Y-39.25 Z-0.01 J885.11 F500.0
+G1 X8.22 Y-41.05 Z-0.01 J888.63 F500.0
+G1 X8.22 Y-45.25 Z-0.01 J892.75 F500.0
+G1 X5.11 Y-47.05 Z-0.01 J896.27 F500.0
+G1 X5.11 Y-51.25 Z-0.01 J900.39 F500.0
+G1 X8.22 Y-53.05 Z-0.01 J903.91 F500.0
+G1 X8.22 Y-57.25 Z-0.01 J908.02 F500.0
+G1 X5.11 Y-59.05 Z-0.01 J911.55 F500.0
+G1 X5.11 Y-63.25 Z-0.01 J915.66 F500.0
+G1 X8.22 Y-65.05 Z-0.01 J919.18 F500.0
+G1 X8.22 Y-69.25 Z-0.01 J923.30 F500.0
+G1 X5.11 Y-71.05 Z-0.01 J926.82 F500.0
+G1 X5.11 Y-74.75 Z-0.01 J930.45 F500.0
+G1 X11.69 Y-74.75 Z-0.01 J936.89 F500.0
+G1 X11.69 Y-71.05 Z-0.01 J940.52 F500.0
+G1 X8.57 Y-69.25 Z-0.01 J944.05 F500.0
+G1 X8.57 Y-65.05 Z-0.01 J948.17 F500.0
+G1 X11.69 Y-63.25 Z-0.01 J951.70 F500.0
+G1 X11.69 Y-59.05 Z-0.01 J955.81 F500.0
+G1 X8.57 Y-57.25 Z-0.01 J959.34 F500.0
+G1 X8.57 Y-53.05 Z-0.01 J963.46 F500.0
+G1 X11.69 Y-51.25 Z-0.01 J966.99 F500.0
+G1 X11.69 Y-47.05 Z-0.01 J971.10 F500.0
+G1 X8.57 Y-45.25 Z-0.01 J974.63 F500.0
+G1 X8.57 Y-41.05 Z-0.01 J978.75 F500.0
+G1 X11.69 Y-39.25 Z-0.01 J982.28 F500.0
+G1 X11.69 Y-38.19 Z-0.01 J983.32 F500.0
+G1 X12.03 Y-38.19 Z-0.01 J983.65 F500.0
+G1 X12.03 Y-39.25 Z-0.01 J984.69 F500.0
+G1 X15.15 Y-41.05 Z-0.01 J988.22 F500.0
+G1 X15.15 Y-45.25 Z-0.01 J992.34 F500.0
+G1 X12.03 Y-47.05 Z-0.01 J995.87 F500.0
+G1 X12.03 Y-51.25 Z-0.01 J999.98 F500.0
+G1 X15.15 Y-53.05 Z-0.01 J1003.51 F500.0
+G1 X15.15 Y-57.25 Z-0.01 J1007.63 F500.0
+G1 X12.03 Y-59.05 Z-0.01 J1011.16 F500.0
+G1 X12.03 Y-63.25 Z-0.01 J1015.28 F500.0
+G1 X15.15 Y-65.05 Z-0.01 J1018.81 F500.0
+G1 X15.15 Y-69.25 Z-0.01 J1022.92 F500.0
+G1 X12.03 Y-71.05 Z-0.01 J1026.45 F500.0
+G1 X12.03 Y-74.75 Z-0.01 J1030.08 F500.0
+G1 X18.62 Y-74.75 Z-0.01 J1036.54 F500.0
+G1 X18.62 Y-71.05 Z-0.01 J1040.16 F500.0
+G1 X15.50 Y-69.25 Z-0.01 J1043.69 F500.0
+G1 X15.50 Y-65.05 Z-0.01 J1047.81 F500.0
+G1 X18.62 Y-63.25 Z-0.01 J1051.34 F500.0
+G1 X18.62 Y-59.05 Z-0.01 J1055.45 F500.0
+G1 X15.50 Y-57.25 Z-0.01 J1058.98 F500.0
+G1 X15.50 Y-53.05 Z-0.01 J1063.10 F500.0
+G1 X18.62 Y-51.25 Z-0.01 J1066.63 F500.0
+G1 X18.62 Y-47.05 Z-0.01 J1070.75 F500.0
+G1 X15.50 Y-45.25 Z-0.01 J1074.28 F500.0
+G1 X15.50 Y-41.05 Z-0.01 J1078.39 F500.0
+G1 X18.62 Y-39.25 Z-0.01 J1081.92 F500.0
+G1 X18.62 Y-38.19 Z-0.01 J1082.96 F500.0
+G1 X18.96 Y-38.19 Z-0.01 J1083.29 F500.0
+G1 X18.96 Y-39.25 Z-0.01 J1084.33 F500.0
+G1 X22.08 Y-41.05 Z-0.01 J1087.86 F500.0
+G1 X22.08 Y-45.25 Z-0.01 J1091.98 F500.0
+G1 X18.96 Y-47.05 Z-0.01 J1095.51 F500.0
+G1 X18.96 Y-51.25 Z-0.01 J1099.62 F500.0
+G1 X22.08 Y-53.05 Z-0.01 J1103.15 F500.0
+G1 X22.08 Y-57.25 Z-0.01 J1107.27 F500.0
+G1 X18.96 Y-59.05 Z-0.01 J1110.80 F500.0
+G1 X18.96 Y-63.25 Z-0.01 J1114.92 F500.0
+G1 X22.08 Y-65.05 Z-0.01 J1118.45 F500.0
+G1 X22.08 Y-69.25 Z-0.01 J1122.56 F500.0
+G1 X18.96 Y-71.05 Z-0.01 J1126.09 F500.0
+G1 X18.96 Y-74.75 Z-0.01 J1129.72 F500.0
+G1 X25.54 Y-74.75 Z-0.01 J1136.17 F500.0
+G1 X25.54 Y-71.05 Z-0.01 J1139.79 F500.0
+G1 X22.43 Y-69.25 Z-0.01 J1143.31 F500.0
+G1 X22.43 Y-65.05 Z-0.01 J1147.43 F500.0
+G1 X25.54 Y-63.25 Z-0.01 J1150.95 F500.0
+G1 X25.54 Y-59.05 Z-0.01 J1155.07 F500.0
+G1 X22.43 Y-57.25 Z-0.01 J1158.59 F500.0
+G1 X22.43 Y-53.05 Z-0.01 J1162.70 F500.0
+G1 X25.54 Y-51.25 Z-0.01 J1166.23 F500.0
+G1 X25.54 Y-47.05 Z-0.01 J1170.34 F500.0
+G1 X22.43 Y-45.25 Z-0.01 J1173.86 F500.0
+G1 X22.43 Y-41.05 Z-0.01 J1177.98 F500.0
+G1 X25.54 Y-39.25 Z-0.01 J1181.50 F500.0
+G1 X25.54 Y-38.19 Z-0.01 J1182.54 F500.0
+G1 X25.89 Y-38.19 Z-0.01 J1182.88 F500.0
+G1 X25.89 Y-39.25 Z-0.01 J1183.92 F500.0
+G1 X29.01 Y-41.05 Z-0.01 J1187.45 F500.0
+G1 X29.01 Y-45.25 Z-0.01 J1191.57 F500.0
+G1 X25.89 Y-47.05 Z-0.01 J1195.10 F500.0
+G1 X25.89 Y-51.25 Z-0.01 J1199.21 F500.0
+G1 X29.01 Y-53.05 Z-0.01 J1202.74 F500.0
+G1 X29.01 Y-57.25 Z-0.01 J1206.86 F500.0
+G1 X25.89 Y-59.05 Z-0.01 J1210.39 F500.0
+G1 X25.89 Y-63.25 Z-0.01 J1214.51 F500.0
+G1 X29.01 Y-65.05 Z-0.01 J1218.04 F500.0
+G1 X29.01 Y-69.25 Z-0.01 J1222.15 F500.0
+G1 X25.89 Y-71.05 Z-0.01 J1225.68 F500.0
+G1 X25.89 Y-74.75 Z-0.01 J1229.31 F500.0
+G1 X32.47 Y-74.75 Z-0.01 J1235.76 F500.0
+G1 X32.47 Y-71.05 Z-0.01 J1239.38 F500.0
+G1 X29.36 Y-69.25 Z-0.01 J1242.90 F500.0
+G1 X29.36 Y-65.05 Z-0.01 J1247.02 F500.0
+G1 X32.47 Y-63.25 Z-0.01 J1250.54 F500.0
+G1 X32.47 Y-59.05 Z-0.01 J1254.66 F500.0
+G1 X29.36 Y-57.25 Z-0.01 J1258.18 F500.0
+G1 X29.36 Y-53.05 Z-0.01 J1262.29 F500.0
+G1 X32.47 Y-51.25 Z-0.01 J1265.82 F500.0
+G1 X32.47 Y-47.05 Z-0.01 J1269.93 F500.0
+G1 X29.36 Y-45.25 Z-0.01 J1273.45 F500.0
+G1 X29.36 Y-41.05 Z-0.01 J1277.57 F500.0
+G1 X32.47 Y-39.25 Z-0.01 J1281.09 F500.0
+G1 X32.47 Y-38.19 Z-0.01 J1282.13 F500.0
+G1 X32.82 Y-38.19 Z-0.01 J1282.47 F500.0
+G1 X32.82 Y-39.25 Z-0.01 J1283.51 F500.0
+G1 X35.94 Y-41.05 Z-0.01 J1287.04 F500.0
+G1 X35.94 Y-45.25 Z-0.01 J1291.16 F500.0
+G1 X32.82 Y-47.05 Z-0.01 J1294.69 F500.0
+G1 X32.82 Y-51.25 Z-0.01 J1298.80 F500.0
+G1 X35.94 Y-53.05 Z-0.01 J1302.33 F500.0
+G1 X35.94 Y-57.25 Z-0.01 J1306.45 F500.0
+G1 X32.82 Y-59.05 Z-0.01 J1309.98 F500.0
+G1 X32.82 Y-63.25 Z-0.01 J1314.09 F500.0
+G1 X35.94 Y-65.05 Z-0.01 J1317.62 F500.0
+G1 X35.94 Y-69.25 Z-0.01 J1321.74 F500.0
+G1 X32.82 Y-71.05 Z-0.01 J1325.27 F500.0
+G1 X32.82 Y-74.75 Z-0.01 J1328.90 F500.0
+G1 X39.40 Y-74.75 Z-0.01 J1335.35 F500.0
+G1 X39.40 Y-71.05 Z-0.01 J1338.97 F500.0
+G1 X36.28 Y-69.25 Z-0.01 J1342.50 F500.0
+G1 X36.28 Y-65.05 Z-0.01 J1346.62 F500.0
+G1 X39.40 Y-63.25 Z-0.01 J1350.15 F500.0
+G1 X39.40 Y-59.05 Z-0.01 J1354.26 F500.0
+G1 X36.28 Y-57.25 Z-0.01 J1357.79 F500.0
+G1 X36.28 Y-53.05 Z-0.01 J1361.91 F500.0
+G1 X39.40 Y-51.25 Z-0.01 J1365.44 F500.0
+G1 X39.40 Y-47.05 Z-0.01 J1369.56 F500.0
+G1 X36.28 Y-45.25 Z-0.01 J1373.09 F500.0
+G1 X36.28 Y-41.05 Z-0.01 J1377.20 F500.0
+G1 X39.40 Y-39.25 Z-0.01 J1380.73 F500.0
+G1 X39.40 Y-38.19 Z-0.01 J1381.77 F500.0
+G1 X39.75 Y-38.19 Z-0.01 J1382.11 F500.0
+G1 X39.75 Y-39.25 Z-0.01 J1383.15 F500.0
+G1 X41.32 Y-40.16 Z-0.01 J1384.93 F500.0
+G1 X41.32 Y-46.14 Z-0.01 J1390.79 F500.0
+G1 X39.75 Y-47.05 Z-0.01 J1392.57 F500.0
+G1 X39.75 Y-51.25 Z-0.01 J1396.68 F500.0
+G1 X41.32 Y-52.16 Z-0.01 J1398.46 F500.0
+G1 X41.32 Y-58.14 Z-0.01 J1404.32 F500.0
+G1 X39.75 Y-59.05 Z-0.01 J1406.10 F500.0
+G1 X39.75 Y-63.25 Z-0.01 J1410.22 F500.0
+G1 X41.32 Y-64.16 Z-0.01 J1412.00 F500.0
+G1 X41.32 Y-70.14 Z-0.01 J1417.86 F500.0
+G1 X39.75 Y-71.05 Z-0.01 J1419.64 F500.0
+G1 X39.75 Y-74.75 Z-0.01 J1423.26 F500.0
+
+T1
+G1 X28.91 Y-74.20 Z0.99 J0.00 F500.0
+G1 X40.77 Y-74.20 Z0.99 J11.62 F500.0
+G1 X40.77 Y-42.40 Z0.99 J42.79 F500.0
+G1 X40.77 Y-38.74 Z0.99 J46.37 F500.0
+G1 X-22.83 Y-38.74 Z0.99 J108.70 F500.0
+G1 X-34.69 Y-38.74 Z0.99 J120.32 F500.0
+G1 X-34.69 Y-70.54 Z0.99 J151.49 F500.0
+G1 X-34.69 Y-74.20 Z0.99 J155.08 F500.0
+G1 X28.91 Y-74.20 Z0.99 J217.40 F500.0
+G1 X28.91 Y-74.20 Z0.99 J217.40 F500.0
+G1 X-34.69 Y-40.28 Z0.99 J288.04 F500.0
+G1 X-33.34 Y-41.05 Z0.99 J289.56 F500.0
+G1 X-33.34 Y-45.25 Z0.99 J293.68 F500.0
+G1 X-34.69 Y-46.03 Z0.99 J295.21 F500.0
+G1 X-34.69 Y-52.28 Z0.99 J301.33 F500.0
+G1 X-33.34 Y-53.05 Z0.99 J302.86 F500.0
+G1 X-33.34 Y-57.25 Z0.99 J306.97 F500.0
+G1 X-34.69 Y-58.03 Z0.99 J308.50 F500.0
+G1 X-34.69 Y-64.28 Z0.99 J314.63 F500.0
+G1 X-33.34 Y-65.05 Z0.99 J316.15 F500.0
+G1 X-33.34 Y-69.25 Z0.99 J320.26 F500.0
+G1 X-34.69 Y-70.03 Z0.99 J321.79 F500.0
+G1 X-29.88 Y-74.20 Z0.99 J328.03 F500.0
+G1 X-29.88 Y-71.05 Z0.99 J331.12 F500.0
+G1 X-33.00 Y-69.25 Z0.99 J334.65 F500.0
+G1 X-33.00 Y-65.05 Z0.99 J338.76 F500.0
+G1 X-29.88 Y-63.25 Z0.99 J342.29 F500.0
+G1 X-29.88 Y-59.05 Z0.99 J346.41 F500.0
+G1 X-33.00 Y-57.25 Z0.99 J349.94 F500.0
+G1 X-33.00 Y-53.05 Z0.99 J354.06 F500.0
+G1 X-29.88 Y-51.25 Z0.99 J357.59 F500.0
+G1 X-29.88 Y-47.05 Z0.99 J361.70 F500.0
+G1 X-33.00 Y-45.25 Z0.99 J365.23 F500.0
+G1 X-33.00 Y-41.05 Z0.99 J369.35 F500.0
+G1 X-29.88 Y-39.25 Z0.99 J372.88 F500.0
+G1 X-29.88 Y-38.74 Z0.99 J373.38 F500.0
+G1 X-29.53 Y-38.74 Z0.99 J373.72 F500.0
+G1 X-29.53 Y-39.25 Z0.99 J374.22 F500.0
+G1 X-26.42 Y-41.05 Z0.99 J377.74 F500.0
+G1 X-26.42 Y-45.25 Z0.99 J381.86 F500.0
+G1 X-29.53 Y-47.05 Z0.99 J385.38 F500.0
+G1 X-29.53 Y-51.25 Z0.99 J389.50 F500.0
+G1 X-26.42 Y-53.05 Z0.99 J393.02 F500.0
+G1 X-26.42 Y-57.25 Z0.99 J397.13 F500.0
+G1 X-29.53 Y-59.05 Z0.99 J400.65 F500.0
+G1 X-29.53 Y-63.25 Z0.99 J404.77 F500.0
+G1 X-26.42 Y-65.05 Z0.99 J408.29 F500.0
+G1 X-26.42 Y-69.25 Z0.99 J412.41 F500.0
+G1 X-29.53 Y-71.05 Z0.99 J415.93 F500.0
+G1 X-29.53 Y-74.20 Z0.99 J419.02 F500.0
+G1 X-22.95 Y-74.20 Z0.99 J425.46 F500.0
+G1 X-22.95 Y-71.05 Z0.99 J428.55 F500.0
+G1 X-26.07 Y-69.25 Z0.99 J432.08 F500.0
+G1 X-26.07 Y-65.05 Z0.99 J436.20 F500.0
+G1 X-22.95 Y-63.25 Z0.99 J439.73 F500.0
+G1 X-22.95 Y-59.05 Z0.99 J443.84 F500.0
+G1 X-26.07 Y-57.25 Z0.99 J447.37 F500.0
+G1 X-26.07 Y-53.05 Z0.99 J451.49 F500.0
+G1 X-22.95 Y-51.25 Z0.99 J455.02 F500.0
+G1 X-22.95 Y-47.05 Z0.99 J459.14 F500.0
+G1 X-26.07 Y-45.25 Z0.99 J462.67 F500.0
+G1 X-26.07 Y-41.05 Z0.99 J466.78 F500.0
+G1 X-22.95 Y-39.25 Z0.99 J470.31 F500.0
+G1 X-22.95 Y-38.74 Z0.99 J470.81 F500.0
+G1 X-22.61 Y-38.74 Z0.99 J471.14 F500.0
+G1 X-22.61 Y-39.25 Z0.99 J471.64 F500.0
+G1 X-19.49 Y-41.05 Z0.99 J475.17 F500.0
+G1 X-19.49 Y-45.25 Z0.99 J479.29 F500.0
+G1 X-22.61 Y-47.05 Z0.99 J482.82 F500.0
+G1 X-22.61 Y-51.25 Z0.99 J486.94 F500.0
+G1 X-19.49 Y-53.05 Z0.99 J490.47 F500.0
+G1 X-19.49 Y-57.25 Z0.99 J494.58 F500.0
+G1 X-22.61 Y-59.05 Z0.99 J498.11 F500.0
+G1 X-22.61 Y-63.25 Z0.99 J502.23 F500.0
+G1 X-19.49 Y-65.05 Z0.99 J505.76 F500.0
+G1 X-19.49 Y-69.25 Z0.99 J509.87 F500.0
+G1 X-22.61 Y-71.05 Z0.99 J513.40 F500.0
+G1 X-22.61 Y-74.20 Z0.99 J516.49 F500.0
+G1 X-16.02 Y-74.20 Z0.99 J522.95 F500.0
+G1 X-16.02 Y-71.05 Z0.99 J526.04 F500.0
+G1 X-19.14 Y-69.25 Z0.99 J529.57 F500.0
+G1 X-19.14 Y-65.05 Z0.99 J533.68 F500.0
+G1 X-16.02 Y-63.25 Z0.99 J537.21 F500.0
+G1 X-16.02 Y-59.05 Z0.99 J541.33 F500.0
+G1 X-19.14 Y-57.25 Z0.99 J544.86 F500.0
+G1 X-19.14 Y-53.05 Z0.99 J548.97 F500.0
+G1 X-16.02 Y-51.25 Z0.99 J552.50 F500.0
+G1 X-16.02 Y-47.05 Z0.99 J556.62 F500.0
+G1 X-19.14 Y-45.25 Z0.99 J560.15 F500.0
+G1 X-19.14 Y-41.05 Z0.99 J564.27 F500.0
+G1 X-16.02 Y-39.25 Z0.99 J567.80 F500.0
+G1 X-16.02 Y-38.74 Z0.99 J568.30 F500.0
+G1 X-15.68 Y-38.74 Z0.99 J568.63 F500.0
+G1 X-15.68 Y-39.25 Z0.99 J569.13 F500.0
+G1 X-12.56 Y-41.05 Z0.99 J572.66 F500.0
+G1 X-12.56 Y-45.25 Z0.99 J576.77 F500.0
+G1 X-15.68 Y-47.05 Z0.99 J580.30 F500.0
+G1 X-15.68 Y-51.25 Z0.99 J584.42 F500.0
+G1 X-12.56 Y-53.05 Z0.99 J587.95 F500.0
+G1 X-12.56 Y-57.25 Z0.99 J592.07 F500.0
+G1 X-15.68 Y-59.05 Z0.99 J595.60 F500.0
+G1 X-15.68 Y-63.25 Z0.99 J599.71 F500.0
+G1 X-12.56 Y-65.05 Z0.99 J603.24 F500.0
+G1 X-12.56 Y-69.25 Z0.99 J607.36 F500.0
+G1 X-15.68 Y-71.05 Z0.99 J610.89 F500.0
+G1 X-15.68 Y-74.20 Z0.99 J613.98 F500.0
+G1 X-9.10 Y-74.20 Z0.99 J620.42 F500.0
+G1 X-9.10 Y-71.05 Z0.99 J623.51 F500.0
+G1 X-12.21 Y-69.25 Z0.99 J627.03 F500.0
+G1 X-12.21 Y-65.05 Z0.99 J631.15 F500.0
+G1 X-9.10 Y-63.25 Z0.99 J634.67 F500.0
+G1 X-9.10 Y-59.05 Z0.99 J638.79 F500.0
+G1 X-12.21 Y-57.25 Z0.99 J642.31 F500.0
+G1 X-12.21 Y-53.05 Z0.99 J646.42 F500.0
+G1 X-9.10 Y-51.25 Z0.99 J649.95 F500.0
+G1 X-9.10 Y-47.05 Z0.99 J654.06 F500.0
+G1 X-12.21 Y-45.25 Z0.99 J657.58 F500.0
+G1 X-12.21 Y-41.05 Z0.99 J661.70 F500.0
+G1 X-9.10 Y-39.25 Z0.99 J665.22 F500.0
+G1 X-9.10 Y-38.74 Z0.99 J665.72 F500.0
+G1 X-8.75 Y-38.74 Z0.99 J666.06 F500.0
+G1 X-8.75 Y-39.25 Z0.99 J666.56 F500.0
+G1 X-5.63 Y-41.05 Z0.99 J670.09 F500.0
+G1 X-5.63 Y-45.25 Z0.99 J674.21 F500.0
+G1 X-8.75 Y-47.05 Z0.99 J677.74 F500.0
+G1 X-8.75 Y-51.25 Z0.99 J681.85 F500.0
+G1 X-5.63 Y-53.05 Z0.99 J685.38 F500.0
+G1 X-5.63 Y-57.25 Z0.99 J689.50 F500.0
+G1 X-8.75 Y-59.05 Z0.99 J693.03 F500.0
+G1 X-8.75 Y-63.25 Z0.99 J697.15 F500.0
+G1 X-5.63 Y-65.05 Z0.99 J700.68 F500.0
+G1 X-5.63 Y-69.25 Z0.99 J704.79 F500.0
+G1 X-8.75 Y-71.05 Z0.99 J708.32 F500.0
+G1 X-8.75 Y-74.20 Z0.99 J711.41 F500.0
+G1 X-2.17 Y-74.20 Z0.99 J717.86 F500.0
+G1 X-2.17 Y-71.05 Z0.99 J720.94 F500.0
+G1 X-5.28 Y-69.25 Z0.99 J724.47 F500.0
+G1 X-5.28 Y-65.05 Z0.99 J728.58 F500.0
+G1 X-2.17 Y-63.25 Z0.99 J732.10 F500.0
+G1 X-2.17 Y-59.05 Z0.99 J736.22 F500.0
+G1 X-5.28 Y-57.25 Z0.99 J739.74 F500.0
+G1 X-5.28 Y-53.05 Z0.99 J743.86 F500.0
+G1 X-2.17 Y-51.25 Z0.99 J747.38 F500.0
+G1 X-2.17 Y-47.05 Z0.99 J751.49 F500.0
+G1 X-5.28 Y-45.25 Z0.99 J755.02 F500.0
+G1 X-5.28 Y-41.05 Z0.99 J759.13 F500.0
+G1 X-2.17 Y-39.25 Z0.99 J762.65 F500.0
+G1 X-2.17 Y-38.74 Z0.99 J763.15 F500.0
+G1 X-1.82 Y-38.74 Z0.99 J763.50 F500.0
+G1 X-1.82 Y-39.25 Z0.99 J764.00 F500.0
+G1 X1.30 Y-41.05 Z0.99 J767.53 F500.0
+G1 X1.30 Y-45.25 Z0.99 J771.64 F500.0
+G1 X-1.82 Y-47.05 Z0.99 J775.17 F500.0
+G1 X-1.82 Y-51.25 Z0.99 J779.29 F500.0
+G1 X1.30 Y-53.05 Z0.99 J782.82 F500.0
+G1 X1.30 Y-57.25 Z0.99 J786.93 F500.0
+G1 X-1.82 Y-59.05 Z0.99 J790.46 F500.0
+G1 X-1.82 Y-63.25 Z0.99 J794.58 F500.0
+G1 X1.30 Y-65.05 Z0.99 J798.11 F500.0
+G1 X1.30 Y-69.25 Z0.99 J802.23 F500.0
+G1 X-1.82 Y-71.05 Z0.99 J805.76 F500.0
+G1 X-1.82 Y-74.20 Z0.99 J808.84 F500.0
+G1 X4.76 Y-74.20 Z0.99 J815.29 F500.0
+G1 X4.76 Y-71.05 Z0.99 J818.38 F500.0
+G1 X1.64 Y-69.25 Z0.99 J821.91 F500.0
+G1 X1.64 Y-65.05 Z0.99 J826.02 F500.0
+G1 X4.76 Y-63.25 Z0.99 J829.55 F500.0
+G1 X4.76 Y-59.05 Z0.99 J833.67 F500.0
+G1 X1.64 Y-57.25 Z0.99 J837.20 F500.0
+G1 X1.64 Y-53.05 Z0.99 J841.32 F500.0
+G1 X4.76 Y-51.25 Z0.99 J844.85 F500.0
+G1 X4.76 Y-47.05 Z0.99 J848.96 F500.0
+G1 X1.64 Y-45.25 Z0.99 J852.49 F500.0
+G1 X1.64 Y-41.05 Z0.99 J856.61 F500.0
+G1 X4.76 Y-39.25 Z0.99 J860.14 F500.0
+G1 X4.76 Y-38.74 Z0.99 J860.64 F500.0
+G1 X5.11 Y-38.74 Z0.99 J860.98 F500.0
+G1 X5.11 Y-39.25 Z0.99 J861.48 F500.0
+G1 X8.22 Y-41.05 Z0.99 J865.00 F500.0
+G1 X8.22 Y-45.25 Z0.99 J869.12 F500.0
+G1 X5.11 Y-47.05 Z0.99 J872.64 F500.0
+G1 X5.11 Y-51.25 Z0.99 J876.76 F500.0
+G1 X8.22 Y-53.05 Z0.99 J880.28 F500.0
+G1 X8.22 Y-57.25 Z0.99 J884.39 F500.0
+G1 X5.11 Y-59.05 Z0.99 J887.91 F500.0
+G1 X5.11 Y-63.25 Z0.99 J892.03 F500.0
+G1 X8.22 Y-65.05 Z0.99 J895.55 F500.0
+G1 X8.22 Y-69.25 Z0.99 J899.67 F500.0
+G1 X5.11 Y-71.05 Z0.99 J903.19 F500.0
+G1 X5.11 Y-74.20 Z0.99 J906.28 F500.0
+G1 X11.69 Y-74.20 Z0.99 J912.72 F500.0
+G1 X11.69 Y-71.05 Z0.99 J915.81 F500.0
+G1 X8.57 Y-69.25 Z0.99 J919.34 F500.0
+G1 X8.57 Y-65.05 Z0.99 J923.46 F500.0
+G1 X11.69 Y-63.25 Z0.99 J926.99 F500.0
+G1 X11.69 Y-59.05 Z0.99 J931.10 F500.0
+G1 X8.57 Y-57.25 Z0.99 J934.63 F500.0
+G1 X8.57 Y-53.05 Z0.99 J938.75 F500.0
+G1 X11.69 Y-51.25 Z0.99 J942.28 F500.0
+G1 X11.69 Y-47.05 Z0.99 J946.40 F500.0
+G1 X8.57 Y-45.25 Z0.99 J949.93 F500.0
+G1 X8.57 Y-41.05 Z0.99 J954.04 F500.0
+G1 X11.69 Y-39.25 Z0.99 J957.57 F500.0
+G1 X11.69 Y-38.74 Z0.99 J958.07 F500.0
+G1 X12.03 Y-38.74 Z0.99 J958.40 F500.0
+G1 X12.03 Y-39.25 Z0.99 J958.90 F500.0
+G1 X15.15 Y-41.05 Z0.99 J962.43 F500.0
+G1 X15.15 Y-45.25 Z0.99 J966.55 F500.0
+G1 X12.03 Y-47.05 Z0.99 J970.08 F500.0
+G1 X12.03 Y-51.25 Z0.99 J974.20 F500.0
+G1 X15.15 Y-53.05 Z0.99 J977.73 F500.0
+G1 X15.15 Y-57.25 Z0.99 J981.84 F500.0
+G1 X12.03 Y-59.05 Z0.99 J985.37 F500.0
+G1 X12.03 Y-63.25 Z0.99 J989.49 F500.0
+G1 X15.15 Y-65.05 Z0.99 J993.02 F500.0
+G1 X15.15 Y-69.25 Z0.99 J997.13 F500.0
+G1 X12.03 Y-71.05 Z0.99 J1000.66 F500.0
+G1 X12.03 Y-74.20 Z0.99 J1003.75 F500.0
+G1 X18.62 Y-74.20 Z0.99 J1010.21 F500.0
+G1 X18.62 Y-71.05 Z0.99 J1013.30 F500.0
+G1 X15.50 Y-69.25 Z0.99 J1016.83 F500.0
+G1 X15.50 Y-65.05 Z0.99 J1020.94 F500.0
+G1 X18.62 Y-63.25 Z0.99 J1024.47 F500.0
+G1 X18.62 Y-59.05 Z0.99 J1028.59 F500.0
+G1 X15.50 Y-57.25 Z0.99 J1032.12 F500.0
+G1 X15.50 Y-53.05 Z0.99 J1036.23 F500.0
+G1 X18.62 Y-51.25 Z0.99 J1039.76 F500.0
+G1 X18.62 Y-47.05 Z0.99 J1043.88 F500.0
+G1 X15.50 Y-45.25 Z0.99 J1047.41 F500.0
+G1 X15.50 Y-41.05 Z0.99 J1051.53 F500.0
+G1 X18.62 Y-39.25 Z0.99 J1055.06 F500.0
+G1 X18.62 Y-38.74 Z0.99 J1055.56 F500.0
+G1 X18.96 Y-38.74 Z0.99 J1055.89 F500.0
+G1 X18.96 Y-39.25 Z0.99 J1056.39 F500.0
+G1 X22.08 Y-41.05 Z0.99 J1059.92 F500.0
+G1 X22.08 Y-45.25 Z0.99 J1064.03 F500.0
+G1 X18.96 Y-47.05 Z0.99 J1067.56 F500.0
+G1 X18.96 Y-51.25 Z0.99 J1071.68 F500.0
+G1 X22.08 Y-53.05 Z0.99 J1075.21 F500.0
+G1 X22.08 Y-57.25 Z0.99 J1079.33 F500.0
+G1 X18.96 Y-59.05 Z0.99 J1082.86 F500.0
+G1 X18.96 Y-63.25 Z0.99 J1086.97 F500.0
+G1 X22.08 Y-65.05 Z0.99 J1090.50 F500.0
+G1 X22.08 Y-69.25 Z0.99 J1094.62 F500.0
+G1 X18.96 Y-71.05 Z0.99 J1098.15 F500.0
+G1 X18.96 Y-74.20 Z0.99 J1101.24 F500.0
+G1 X25.54 Y-74.20 Z0.99 J1107.68 F500.0
+G1 X25.54 Y-71.05 Z0.99 J1110.77 F500.0
+G1 X22.43 Y-69.25 Z0.99 J1114.29 F500.0
+G1 X22.43 Y-65.05 Z0.99 J1118.41 F500.0
+G1 X25.54 Y-63.25 Z0.99 J1121.93 F500.0
+G1 X25.54 Y-59.05 Z0.99 J1126.05 F500.0
+G1 X22.43 Y-57.25 Z0.99 J1129.57 F500.0
+G1 X22.43 Y-53.05 Z0.99 J1133.68 F500.0
+G1 X25.54 Y-51.25 Z0.99 J1137.21 F500.0
+G1 X25.54 Y-47.05 Z0.99 J1141.32 F500.0
+G1 X22.43 Y-45.25 Z0.99 J1144.84 F500.0
+G1 X22.43 Y-41.05 Z0.99 J1148.96 F500.0
+G1 X25.54 Y-39.25 Z0.99 J1152.48 F500.0
+G1 X25.54 Y-38.74 Z0.99 J1152.98 F500.0
+G1 X25.89 Y-38.74 Z0.99 J1153.32 F500.0
+G1 X25.89 Y-39.25 Z0.99 J1153.82 F500.0
+G1 X29.01 Y-41.05 Z0.99 J1157.35 F500.0
+G1 X29.01 Y-45.25 Z0.99 J1161.47 F500.0
+G1 X25.89 Y-47.05 Z0.99 J1165.00 F500.0
+G1 X25.89 Y-51.25 Z0.99 J1169.11 F500.0
+G1 X29.01 Y-53.05 Z0.99 J1172.64 F500.0
+G1 X29.01 Y-57.25 Z0.99 J1176.76 F500.0
+G1 X25.89 Y-59.05 Z0.99 J1180.29 F500.0
+G1 X25.89 Y-63.25 Z0.99 J1184.41 F500.0
+G1 X29.01 Y-65.05 Z0.99 J1187.94 F500.0
+G1 X29.01 Y-69.25 Z0.99 J1192.05 F500.0
+G1 X25.89 Y-71.05 Z0.99 J1195.58 F500.0
+G1 X25.89 Y-74.20 Z0.99 J1198.67 F500.0
+G1 X32.47 Y-74.20 Z0.99 J1205.12 F500.0
+G1 X32.47 Y-71.05 Z0.99 J1208.20 F500.0
+G1 X29.36 Y-69.25 Z0.99 J1211.73 F500.0
+G1 X29.36 Y-65.05 Z0.99 J1215.84 F500.0
+G1 X32.47 Y-63.25 Z0.99 J1219.36 F500.0
+G1 X32.47 Y-59.05 Z0.99 J1223.48 F500.0
+G1 X29.36 Y-57.25 Z0.99 J1227.00 F500.0
+G1 X29.36 Y-53.05 Z0.99 J1231.12 F500.0
+G1 X32.47 Y-51.25 Z0.99 J1234.64 F500.0
+G1 X32.47 Y-47.05 Z0.99 J1238.75 F500.0
+G1 X29.36 Y-45.25 Z0.99 J1242.28 F500.0
+G1 X29.36 Y-41.05 Z0.99 J1246.39 F500.0
+G1 X32.47 Y-39.25 Z0.99 J1249.91 F500.0
+G1 X32.47 Y-38.74 Z0.99 J1250.41 F500.0
+G1 X32.82 Y-38.74 Z0.99 J1250.76 F500.0
+G1 X32.82 Y-39.25 Z0.99 J1251.26 F500.0
+G1 X35.94 Y-41.05 Z0.99 J1254.79 F500.0
+G1 X35.94 Y-45.25 Z0.99 J1258.90 F500.0
+G1 X32.82 Y-47.05 Z0.99 J1262.43 F500.0
+G1 X32.82 Y-51.25 Z0.99 J1266.55 F500.0
+G1 X35.94 Y-53.05 Z0.99 J1270.08 F500.0
+G1 X35.94 Y-57.25 Z0.99 J1274.19 F500.0
+G1 X32.82 Y-59.05 Z0.99 J1277.72 F500.0
+G1 X32.82 Y-63.25 Z0.99 J1281.84 F500.0
+G1 X35.94 Y-65.05 Z0.99 J1285.37 F500.0
+G1 X35.94 Y-69.25 Z0.99 J1289.49 F500.0
+G1 X32.82 Y-71.05 Z0.99 J1293.02 F500.0
+G1 X32.82 Y-74.20 Z0.99 J1296.10 F500.0
+G1 X39.40 Y-74.20 Z0.99 J1302.55 F500.0
+G1 X39.40 Y-71.05 Z0.99 J1305.64 F500.0
+G1 X36.28 Y-69.25 Z0.99 J1309.17 F500.0
+G1 X36.28 Y-65.05 Z0.99 J1313.28 F500.0
+G1 X39.40 Y-63.25 Z0.99 J1316.81 F500.0
+G1 X39.40 Y-59.05 Z0.99 J1320.93 F500.0
+G1 X36.28 Y-57.25 Z0.99 J1324.46 F500.0
+G1 X36.28 Y-53.05 Z0.99 J1328.58 F500.0
+G1 X39.40 Y-51.25 Z0.99 J1332.11 F500.0
+G1 X39.40 Y-47.05 Z0.99 J1336.22 F500.0
+G1 X36.28 Y-45.25 Z0.99 J1339.75 F500.0
+G1 X36.28 Y-41.05 Z0.99 J1343.87 F500.0
+G1 X39.40 Y-39.25 Z0.99 J1347.40 F500.0
+G1 X39.40 Y-38.74 Z0.99 J1347.90 F500.0
+G1 X39.75 Y-38.74 Z0.99 J1348.24 F500.0
+G1 X39.75 Y-39.25 Z0.99 J1348.74 F500.0
+G1 X40.77 Y-39.84 Z0.99 J1349.90 F500.0
+G1 X40.77 Y-46.46 Z0.99 J1356.38 F500.0
+G1 X39.75 Y-47.05 Z0.99 J1357.54 F500.0
+G1 X39.75 Y-51.25 Z0.99 J1361.65 F500.0
+G1 X40.77 Y-51.84 Z0.99 J1362.81 F500.0
+G1 X40.77 Y-58.46 Z0.99 J1369.30 F500.0
+G1 X39.75 Y-59.05 Z0.99 J1370.45 F500.0
+G1 X39.75 Y-63.25 Z0.99 J1374.57 F500.0
+G1 X40.77 Y-63.84 Z0.99 J1375.72 F500.0
+G1 X40.77 Y-70.46 Z0.99 J1382.21 F500.0
+G1 X39.75 Y-71.05 Z0.99 J1383.36 F500.0
+G1 X39.75 Y-74.20 Z0.99 J1386.45 F500.0
+
+T1
+G1 X25.47 Y-73.64 Z1.99 J0.00 F500.0
+G1 X40.21 Y-73.64 Z1.99 J14.45 F500.0
+G1 X40.21 Y-43.84 Z1.99 J43.65 F500.0
+G1 X40.21 Y-39.30 Z1.99 J48.10 F500.0
+G1 X-19.39 Y-39.30 Z1.99 J106.51 F500.0
+G1 X-34.13 Y-39.30 Z1.99 J120.95 F500.0
+G1 X-34.13 Y-69.10 Z1.99 J150.16 F500.0
+G1 X-34.13 Y-73.64 Z1.99 J154.60 F500.0
+G1 X25.47 Y-73.64 Z1.99 J213.01 F500.0
+G1 X25.47 Y-73.64 Z1.99 J213.01 F500.0
+G1 X-34.13 Y-40.60 Z1.99 J279.80 F500.0
+G1 X-33.34 Y-41.05 Z1.99 J280.69 F500.0
+G1 X-33.34 Y-45.25 Z1.99 J284.80 F500.0
+G1 X-34.13 Y-45.71 Z1.99 J285.70 F500.0
+G1 X-34.13 Y-52.60 Z1.99 J292.45 F500.0
+G1 X-33.34 Y-53.05 Z1.99 J293.34 F500.0
+G1 X-33.34 Y-57.25 Z1.99 J297.46 F500.0
+G1 X-34.13 Y-57.71 Z1.99 J298.35 F500.0
+G1 X-34.13 Y-64.60 Z1.99 J305.11 F500.0
+G1 X-33.34 Y-65.05 Z1.99 J306.00 F500.0
+G1 X-33.34 Y-69.25 Z1.99 J310.11 F500.0
+G1 X-34.13 Y-69.71 Z1.99 J311.01 F500.0
+G1 X-29.88 Y-73.64 Z1.99 J316.68 F500.0
+G1 X-29.88 Y-71.05 Z1.99 J319.22 F500.0
+G1 X-33.00 Y-69.25 Z1.99 J322.75 F500.0
+G1 X-33.00 Y-65.05 Z1.99 J326.87 F500.0
+G1 X-29.88 Y-63.25 Z1.99 J330.40 F500.0
+G1 X-29.88 Y-59.05 Z1.99 J334.51 F500.0
+G1 X-33.00 Y-57.25 Z1.99 J338.04 F500.0
+G1 X-33.00 Y-53.05 Z1.99 J342.16 F500.0
+G1 X-29.88 Y-51.25 Z1.99 J345.69 F500.0
+G1 X-29.88 Y-47.05 Z1.99 J349.80 F500.0
+G1 X-33.00 Y-45.25 Z1.99 J353.33 F500.0
+G1 X-33.00 Y-41.05 Z1.99 J357.45 F500.0
+G1 X-29.96 Y-39.30 Z1.99 J360.89 F500.0
+G1 X-29.45 Y-39.30 Z1.99 J361.39 F500.0
+G1 X-26.42 Y-41.05 Z1.99 J364.82 F500.0
+G1 X-26.42 Y-45.25 Z1.99 J368.93 F500.0
+G1 X-29.53 Y-47.05 Z1.99 J372.45 F500.0
+G1 X-29.53 Y-51.25 Z1.99 J376.57 F500.0
+G1 X-26.42 Y-53.05 Z1.99 J380.09 F500.0
+G1 X-26.42 Y-57.25 Z1.99 J384.21 F500.0
+G1 X-29.53 Y-59.05 Z1.99 J387.73 F500.0
+G1 X-29.53 Y-63.25 Z1.99 J391.84 F500.0
+G1 X-26.42 Y-65.05 Z1.99 J395.37 F500.0
+G1 X-26.42 Y-69.25 Z1.99 J399.48 F500.0
+G1 X-29.53 Y-71.05 Z1.99 J403.00 F500.0
+G1 X-29.53 Y-73.64 Z1.99 J405.54 F500.0
+G1 X-22.95 Y-73.64 Z1.99 J411.99 F500.0
+G1 X-22.95 Y-71.05 Z1.99 J414.53 F500.0
+G1 X-26.07 Y-69.25 Z1.99 J418.06 F500.0
+G1 X-26.07 Y-65.05 Z1.99 J422.17 F500.0
+G1 X-22.95 Y-63.25 Z1.99 J425.70 F500.0
+G1 X-22.95 Y-59.05 Z1.99 J429.82 F500.0
+G1 X-26.07 Y-57.25 Z1.99 J433.35 F500.0
+G1 X-26.07 Y-53.05 Z1.99 J437.47 F500.0
+G1 X-22.95 Y-51.25 Z1.99 J441.00 F500.0
+G1 X-22.95 Y-47.05 Z1.99 J445.11 F500.0
+G1 X-26.07 Y-45.25 Z1.99 J448.64 F500.0
+G1 X-26.07 Y-41.05 Z1.99 J452.76 F500.0
+G1 X-23.03 Y-39.30 Z1.99 J456.20 F500.0
+G1 X-22.53 Y-39.30 Z1.99 J456.69 F500.0
+G1 X-19.49 Y-41.05 Z1.99 J460.12 F500.0
+G1 X-19.49 Y-45.25 Z1.99 J464.24 F500.0
+G1 X-22.61 Y-47.05 Z1.99 J467.77 F500.0
+G1 X-22.61 Y-51.25 Z1.99 J471.88 F500.0
+G1 X-19.49 Y-53.05 Z1.99 J475.41 F500.0
+G1 X-19.49 Y-57.25 Z1.99 J479.53 F500.0
+G1 X-22.61 Y-59.05 Z1.99 J483.06 F500.0
+G1 X-22.61 Y-63.25 Z1.99 J487.18 F500.0
+G1 X-19.49 Y-65.05 Z1.99 J490.71 F500.0
+G1 X-19.49 Y-69.25 Z1.99 J494.82 F500.0
+G1 X-22.61 Y-71.05 Z1.99 J498.35 F500.0
+G1 X-22.61 Y-73.64 Z1.99 J500.89 F500.0
+G1 X-16.02 Y-73.64 Z1.99 J507.35 F500.0
+G1 X-16.02 Y-71.05 Z1.99 J509.89 F500.0
+G1 X-19.14 Y-69.25 Z1.99 J513.42 F500.0
+G1 X-19.14 Y-65.05 Z1.99 J517.53 F500.0
+G1 X-16.02 Y-63.25 Z1.99 J521.06 F500.0
+G1 X-16.02 Y-59.05 Z1.99 J525.18 F500.0
+G1 X-19.14 Y-57.25 Z1.99 J528.71 F500.0
+G1 X-19.14 Y-53.05 Z1.99 J532.82 F500.0
+G1 X-16.02 Y-51.25 Z1.99 J536.35 F500.0
+G1 X-16.02 Y-47.05 Z1.99 J540.47 F500.0
+G1 X-19.14 Y-45.25 Z1.99 J544.00 F500.0
+G1 X-19.14 Y-41.05 Z1.99 J548.12 F500.0
+G1 X-16.10 Y-39.30 Z1.99 J551.55 F500.0
+G1 X-15.60 Y-39.30 Z1.99 J552.04 F500.0
+G1 X-12.56 Y-41.05 Z1.99 J555.48 F500.0
+G1 X-12.56 Y-45.25 Z1.99 J559.60 F500.0
+G1 X-15.68 Y-47.05 Z1.99 J563.13 F500.0
+G1 X-15.68 Y-51.25 Z1.99 J567.24 F500.0
+G1 X-12.56 Y-53.05 Z1.99 J570.77 F500.0
+G1 X-12.56 Y-57.25 Z1.99 J574.89 F500.0
+G1 X-15.68 Y-59.05 Z1.99 J578.42 F500.0
+G1 X-15.68 Y-63.25 Z1.99 J582.54 F500.0
+G1 X-12.56 Y-65.05 Z1.99 J586.07 F500.0
+G1 X-12.56 Y-69.25 Z1.99 J590.18 F500.0
+G1 X-15.68 Y-71.05 Z1.99 J593.71 F500.0
+G1 X-15.68 Y-73.64 Z1.99 J596.25 F500.0
+G1 X-9.10 Y-73.64 Z1.99 J602.70 F500.0
+G1 X-9.10 Y-71.05 Z1.99 J605.24 F500.0
+G1 X-12.21 Y-69.25 Z1.99 J608.76 F500.0
+G1 X-12.21 Y-65.05 Z1.99 J612.87 F500.0
+G1 X-9.10 Y-63.25 Z1.99 J616.40 F500.0
+G1 X-9.10 Y-59.05 Z1.99 J620.51 F500.0
+G1 X-12.21 Y-57.25 Z1.99 J624.03 F500.0
+G1 X-12.21 Y-53.05 Z1.99 J628.15 F500.0
+G1 X-9.10 Y-51.25 Z1.99 J631.67 F500.0
+G1 X-9.10 Y-47.05 Z1.99 J635.79 F500.0
+G1 X-12.21 Y-45.25 Z1.99 J639.31 F500.0
+G1 X-12.21 Y-41.05 Z1.99 J643.42 F500.0
+G1 X-9.18 Y-39.30 Z1.99 J646.85 F500.0
+G1 X-8.67 Y-39.30 Z1.99 J647.35 F500.0
+G1 X-5.63 Y-41.05 Z1.99 J650.79 F500.0
+G1 X-5.63 Y-45.25 Z1.99 J654.91 F500.0
+G1 X-8.75 Y-47.05 Z1.99 J658.44 F500.0
+G1 X-8.75 Y-51.25 Z1.99 J662.55 F500.0
+G1 X-5.63 Y-53.05 Z1.99 J666.08 F500.0
+G1 X-5.63 Y-57.25 Z1.99 J670.20 F500.0
+G1 X-8.75 Y-59.05 Z1.99 J673.73 F500.0
+G1 X-8.75 Y-63.25 Z1.99 J677.84 F500.0
+G1 X-5.63 Y-65.05 Z1.99 J681.37 F500.0
+G1 X-5.63 Y-69.25 Z1.99 J685.49 F500.0
+G1 X-8.75 Y-71.05 Z1.99 J689.02 F500.0
+G1 X-8.75 Y-73.64 Z1.99 J691.56 F500.0
+G1 X-2.17 Y-73.64 Z1.99 J698.01 F500.0
+G1 X-2.17 Y-71.05 Z1.99 J700.55 F500.0
+G1 X-5.28 Y-69.25 Z1.99 J704.07 F500.0
+G1 X-5.28 Y-65.05 Z1.99 J708.18 F500.0
+G1 X-2.17 Y-63.25 Z1.99 J711.70 F500.0
+G1 X-2.17 Y-59.05 Z1.99 J715.82 F500.0
+G1 X-5.28 Y-57.25 Z1.99 J719.34 F500.0
+G1 X-5.28 Y-53.05 Z1.99 J723.46 F500.0
+G1 X-2.17 Y-51.25 Z1.99 J726.98 F500.0
+G1 X-2.17 Y-47.05 Z1.99 J731.09 F500.0
+G1 X-5.28 Y-45.25 Z1.99 J734.62 F500.0
+G1 X-5.28 Y-41.05 Z1.99 J738.73 F500.0
+G1 X-2.25 Y-39.30 Z1.99 J742.16 F500.0
+G1 X-1.74 Y-39.30 Z1.99 J742.66 F500.0
+G1 X1.30 Y-41.05 Z1.99 J746.10 F500.0
+G1 X1.30 Y-45.25 Z1.99 J750.21 F500.0
+G1 X-1.82 Y-47.05 Z1.99 J753.74 F500.0
+G1 X-1.82 Y-51.25 Z1.99 J757.86 F500.0
+G1 X1.30 Y-53.05 Z1.99 J761.39 F500.0
+G1 X1.30 Y-57.25 Z1.99 J765.51 F500.0
+G1 X-1.82 Y-59.05 Z1.99 J769.04 F500.0
+G1 X-1.82 Y-63.25 Z1.99 J773.15 F500.0
+G1 X1.30 Y-65.05 Z1.99 J776.68 F500.0
+G1 X1.30 Y-69.25 Z1.99 J780.80 F500.0
+G1 X-1.82 Y-71.05 Z1.99 J784.33 F500.0
+G1 X-1.82 Y-73.64 Z1.99 J786.87 F500.0
+G1 X4.76 Y-73.64 Z1.99 J793.32 F500.0
+G1 X4.76 Y-71.05 Z1.99 J795.85 F500.0
+G1 X1.64 Y-69.25 Z1.99 J799.38 F500.0
+G1 X1.64 Y-65.05 Z1.99 J803.50 F500.0
+G1 X4.76 Y-63.25 Z1.99 J807.03 F500.0
+G1 X4.76 Y-59.05 Z1.99 J811.15 F500.0
+G1 X1.64 Y-57.25 Z1.99 J814.68 F500.0
+G1 X1.64 Y-53.05 Z1.99 J818.79 F500.0
+G1 X4.76 Y-51.25 Z1.99 J822.32 F500.0
+G1 X4.76 Y-47.05 Z1.99 J826.44 F500.0
+G1 X1.64 Y-45.25 Z1.99 J829.97 F500.0
+G1 X1.64 Y-41.05 Z1.99 J834.08 F500.0
+G1 X4.68 Y-39.30 Z1.99 J837.52 F500.0
+G1 X5.19 Y-39.30 Z1.99 J838.02 F500.0
+G1 X8.22 Y-41.05 Z1.99 J841.45 F500.0
+G1 X8.22 Y-45.25 Z1.99 J845.57 F500.0
+G1 X5.11 Y-47.05 Z1.99 J849.09 F500.0
+G1 X5.11 Y-51.25 Z1.99 J853.20 F500.0
+G1 X8.22 Y-53.05 Z1.99 J856.72 F500.0
+G1 X8.22 Y-57.25 Z1.99 J860.84 F500.0
+G1 X5.11 Y-59.05 Z1.99 J864.36 F500.0
+G1 X5.11 Y-63.25 Z1.99 J868.48 F500.0
+G1 X8.22 Y-65.05 Z1.99 J872.00 F500.0
+G1 X8.22 Y-69.25 Z1.99 J876.12 F500.0
+G1 X5.11 Y-71.05 Z1.99 J879.64 F500.0
+G1 X5.11 Y-73.64 Z1.99 J882.18 F500.0
+G1 X11.69 Y-73.64 Z1.99 J888.62 F500.0
+G1 X11.69 Y-71.05 Z1.99 J891.16 F500.0
+G1 X8.57 Y-69.25 Z1.99 J894.69 F500.0
+G1 X8.57 Y-65.05 Z1.99 J898.81 F500.0
+G1 X11.69 Y-63.25 Z1.99 J902.34 F500.0
+G1 X11.69 Y-59.05 Z1.99 J906.45 F500.0
+G1 X8.57 Y-57.25 Z1.99 J909.98 F500.0
+G1 X8.57 Y-53.05 Z1.99 J914.10 F500.0
+G1 X11.69 Y-51.25 Z1.99 J917.63 F500.0
+G1 X11.69 Y-47.05 Z1.99 J921.75 F500.0
+G1 X8.57 Y-45.25 Z1.99 J925.28 F500.0
+G1 X8.57 Y-41.05 Z1.99 J929.39 F500.0
+G1 X11.61 Y-39.30 Z1.99 J932.83 F500.0
+G1 X12.11 Y-39.30 Z1.99 J933.32 F500.0
+G1 X15.15 Y-41.05 Z1.99 J936.76 F500.0
+G1 X15.15 Y-45.25 Z1.99 J940.87 F500.0
+G1 X12.03 Y-47.05 Z1.99 J944.40 F500.0
+G1 X12.03 Y-51.25 Z1.99 J948.52 F500.0
+G1 X15.15 Y-53.05 Z1.99 J952.05 F500.0
+G1 X15.15 Y-57.25 Z1.99 J956.16 F500.0
+G1 X12.03 Y-59.05 Z1.99 J959.69 F500.0
+G1 X12.03 Y-63.25 Z1.99 J963.81 F500.0
+G1 X15.15 Y-65.05 Z1.99 J967.34 F500.0
+G1 X15.15 Y-69.25 Z1.99 J971.46 F500.0
+G1 X12.03 Y-71.05 Z1.99 J974.99 F500.0
+G1 X12.03 Y-73.64 Z1.99 J977.52 F500.0
+G1 X18.62 Y-73.64 Z1.99 J983.98 F500.0
+G1 X18.62 Y-71.05 Z1.99 J986.52 F500.0
+G1 X15.50 Y-69.25 Z1.99 J990.05 F500.0
+G1 X15.50 Y-65.05 Z1.99 J994.17 F500.0
+G1 X18.62 Y-63.25 Z1.99 J997.70 F500.0
+G1 X18.62 Y-59.05 Z1.99 J1001.81 F500.0
+G1 X15.50 Y-57.25 Z1.99 J1005.34 F500.0
+G1 X15.50 Y-53.05 Z1.99 J1009.46 F500.0
+G1 X18.62 Y-51.25 Z1.99 J1012.99 F500.0
+G1 X18.62 Y-47.05 Z1.99 J1017.11 F500.0
+G1 X15.50 Y-45.25 Z1.99 J1020.63 F500.0
+G1 X15.50 Y-41.05 Z1.99 J1024.75 F500.0
+G1 X18.54 Y-39.30 Z1.99 J1028.19 F500.0
+G1 X19.04 Y-39.30 Z1.99 J1028.68 F500.0
+G1 X22.08 Y-41.05 Z1.99 J1032.12 F500.0
+G1 X22.08 Y-45.25 Z1.99 J1036.23 F500.0
+G1 X18.96 Y-47.05 Z1.99 J1039.76 F500.0
+G1 X18.96 Y-51.25 Z1.99 J1043.88 F500.0
+G1 X22.08 Y-53.05 Z1.99 J1047.41 F500.0
+G1 X22.08 Y-57.25 Z1.99 J1051.52 F500.0
+G1 X18.96 Y-59.05 Z1.99 J1055.05 F500.0
+G1 X18.96 Y-63.25 Z1.99 J1059.17 F500.0
+G1 X22.08 Y-65.05 Z1.99 J1062.70 F500.0
+G1 X22.08 Y-69.25 Z1.99 J1066.82 F500.0
+G1 X18.96 Y-71.05 Z1.99 J1070.35 F500.0
+G1 X18.96 Y-73.64 Z1.99 J1072.88 F500.0
+G1 X25.54 Y-73.64 Z1.99 J1079.33 F500.0
+G1 X25.54 Y-71.05 Z1.99 J1081.87 F500.0
+G1 X22.43 Y-69.25 Z1.99 J1085.39 F500.0
+G1 X22.43 Y-65.05 Z1.99 J1089.51 F500.0
+G1 X25.54 Y-63.25 Z1.99 J1093.03 F500.0
+G1 X25.54 Y-59.05 Z1.99 J1097.15 F500.0
+G1 X22.43 Y-57.25 Z1.99 J1100.67 F500.0
+G1 X22.43 Y-53.05 Z1.99 J1104.78 F500.0
+G1 X25.54 Y-51.25 Z1.99 J1108.30 F500.0
+G1 X25.54 Y-47.05 Z1.99 J1112.42 F500.0
+G1 X22.43 Y-45.25 Z1.99 J1115.94 F500.0
+G1 X22.43 Y-41.05 Z1.99 J1120.06 F500.0
+G1 X25.47 Y-39.30 Z1.99 J1123.50 F500.0
+G1 X25.97 Y-39.30 Z1.99 J1123.99 F500.0
+G1 X29.01 Y-41.05 Z1.99 J1127.42 F500.0
+G1 X29.01 Y-45.25 Z1.99 J1131.54 F500.0
+G1 X25.89 Y-47.05 Z1.99 J1135.07 F500.0
+G1 X25.89 Y-51.25 Z1.99 J1139.19 F500.0
+G1 X29.01 Y-53.05 Z1.99 J1142.72 F500.0
+G1 X29.01 Y-57.25 Z1.99 J1146.83 F500.0
+G1 X25.89 Y-59.05 Z1.99 J1150.36 F500.0
+G1 X25.89 Y-63.25 Z1.99 J1154.48 F500.0
+G1 X29.01 Y-65.05 Z1.99 J1158.01 F500.0
+G1 X29.01 Y-69.25 Z1.99 J1162.12 F500.0
+G1 X25.89 Y-71.05 Z1.99 J1165.65 F500.0
+G1 X25.89 Y-73.64 Z1.99 J1168.19 F500.0
+G1 X32.47 Y-73.64 Z1.99 J1174.64 F500.0
+G1 X32.47 Y-71.05 Z1.99 J1177.18 F500.0
+G1 X29.36 Y-69.25 Z1.99 J1180.70 F500.0
+G1 X29.36 Y-65.05 Z1.99 J1184.82 F500.0
+G1 X32.47 Y-63.25 Z1.99 J1188.34 F500.0
+G1 X32.47 Y-59.05 Z1.99 J1192.45 F500.0
+G1 X29.36 Y-57.25 Z1.99 J1195.97 F500.0
+G1 X29.36 Y-53.05 Z1.99 J1200.09 F500.0
+G1 X32.47 Y-51.25 Z1.99 J1203.61 F500.0
+G1 X32.47 Y-47.05 Z1.99 J1207.73 F500.0
+G1 X29.36 Y-45.25 Z1.99 J1211.25 F500.0
+G1 X29.36 Y-41.05 Z1.99 J1215.37 F500.0
+G1 X32.39 Y-39.30 Z1.99 J1218.79 F500.0
+G1 X32.90 Y-39.30 Z1.99 J1219.29 F500.0
+G1 X35.94 Y-41.05 Z1.99 J1222.73 F500.0
+G1 X35.94 Y-45.25 Z1.99 J1226.85 F500.0
+G1 X32.82 Y-47.05 Z1.99 J1230.38 F500.0
+G1 X32.82 Y-51.25 Z1.99 J1234.49 F500.0
+G1 X35.94 Y-53.05 Z1.99 J1238.02 F500.0
+G1 X35.94 Y-57.25 Z1.99 J1242.14 F500.0
+G1 X32.82 Y-59.05 Z1.99 J1245.67 F500.0
+G1 X32.82 Y-63.25 Z1.99 J1249.79 F500.0
+G1 X35.94 Y-65.05 Z1.99 J1253.32 F500.0
+G1 X35.94 Y-69.25 Z1.99 J1257.43 F500.0
+G1 X32.82 Y-71.05 Z1.99 J1260.96 F500.0
+G1 X32.82 Y-73.64 Z1.99 J1263.50 F500.0
+G1 X39.40 Y-73.64 Z1.99 J1269.95 F500.0
+G1 X39.40 Y-71.05 Z1.99 J1272.49 F500.0
+G1 X36.28 Y-69.25 Z1.99 J1276.02 F500.0
+G1 X36.28 Y-65.05 Z1.99 J1280.13 F500.0
+G1 X39.40 Y-63.25 Z1.99 J1283.66 F500.0
+G1 X39.40 Y-59.05 Z1.99 J1287.78 F500.0
+G1 X36.28 Y-57.25 Z1.99 J1291.31 F500.0
+G1 X36.28 Y-53.05 Z1.99 J1295.42 F500.0
+G1 X39.40 Y-51.25 Z1.99 J1298.95 F500.0
+G1 X39.40 Y-47.05 Z1.99 J1303.07 F500.0
+G1 X36.28 Y-45.25 Z1.99 J1306.60 F500.0
+G1 X36.28 Y-41.05 Z1.99 J1310.72 F500.0
+G1 X39.32 Y-39.30 Z1.99 J1314.15 F500.0
+G1 X39.83 Y-39.30 Z1.99 J1314.65 F500.0
+G1 X40.21 Y-39.52 Z1.99 J1315.08 F500.0
+G1 X40.21 Y-46.78 Z1.99 J1322.20 F500.0
+G1 X39.75 Y-47.05 Z1.99 J1322.72 F500.0
+G1 X39.75 Y-51.25 Z1.99 J1326.84 F500.0
+G1 X40.21 Y-51.52 Z1.99 J1327.36 F500.0
+G1 X40.21 Y-58.78 Z1.99 J1334.47 F500.0
+G1 X39.75 Y-59.05 Z1.99 J1335.00 F500.0
+G1 X39.75 Y-63.25 Z1.99 J1339.11 F500.0
+G1 X40.21 Y-63.52 Z1.99 J1339.64 F500.0
+G1 X40.21 Y-70.78 Z1.99 J1346.75 F500.0
+G1 X39.75 Y-71.05 Z1.99 J1347.27 F500.0
+G1 X39.75 Y-73.64 Z1.99 J1349.81 F500.0
+
+T1
+G1 X22.02 Y-73.09 Z2.99 J0.00 F500.0
+G1 X39.66 Y-73.09 Z2.99 J17.29 F500.0
+G1 X39.66 Y-45.29 Z2.99 J44.53 F500.0
+G1 X39.66 Y-39.85 Z2.99 J49.86 F500.0
+G1 X-15.94 Y-39.85 Z2.99 J104.35 F500.0
+G1 X-33.58 Y-39.85 Z2.99 J121.64 F500.0
+G1 X-33.58 Y-67.65 Z2.99 J148.88 F500.0
+G1 X-33.58 Y-73.09 Z2.99 J154.21 F500.0
+G1 X22.02 Y-73.09 Z2.99 J208.70 F500.0
+G1 X22.02 Y-73.09 Z2.99 J208.70 F500.0
+G1 X-33.58 Y-40.92 Z2.99 J271.65 F500.0
+G1 X-33.34 Y-41.05 Z2.99 J271.92 F500.0
+G1 X-33.34 Y-45.25 Z2.99 J276.04 F500.0
+G1 X-33.58 Y-45.39 Z2.99 J276.31 F500.0
+G1 X-33.58 Y-52.91 Z2.99 J283.68 F500.0
+G1 X-33.34 Y-53.05 Z2.99 J283.95 F500.0
+G1 X-33.34 Y-57.25 Z2.99 J288.07 F500.0
+G1 X-33.58 Y-57.39 Z2.99 J288.34 F500.0
+G1 X-33.58 Y-64.92 Z2.99 J295.72 F500.0
+G1 X-33.34 Y-65.05 Z2.99 J295.98 F500.0
+G1 X-33.34 Y-69.25 Z2.99 J300.10 F500.0
+G1 X-33.58 Y-69.39 Z2.99 J300.37 F500.0
+G1 X-29.88 Y-73.09 Z2.99 J305.50 F500.0
+G1 X-29.88 Y-71.05 Z2.99 J307.50 F500.0
+G1 X-33.00 Y-69.25 Z2.99 J311.03 F500.0
+G1 X-33.00 Y-65.05 Z2.99 J315.15 F500.0
+G1 X-29.88 Y-63.25 Z2.99 J318.68 F500.0
+G1 X-29.88 Y-59.05 Z2.99 J322.79 F500.0
+G1 X-33.00 Y-57.25 Z2.99 J326.32 F500.0
+G1 X-33.00 Y-53.05 Z2.99 J330.44 F500.0
+G1 X-29.88 Y-51.25 Z2.99 J333.97 F500.0
+G1 X-29.88 Y-47.05 Z2.99 J338.08 F500.0
+G1 X-33.00 Y-45.25 Z2.99 J341.61 F500.0
+G1 X-33.00 Y-41.05 Z2.99 J345.73 F500.0
+G1 X-30.92 Y-39.85 Z2.99 J348.08 F500.0
+G1 X-28.50 Y-39.85 Z2.99 J350.46 F500.0
+G1 X-26.42 Y-41.05 Z2.99 J352.81 F500.0
+G1 X-26.42 Y-45.25 Z2.99 J356.92 F500.0
+G1 X-29.53 Y-47.05 Z2.99 J360.45 F500.0
+G1 X-29.53 Y-51.25 Z2.99 J364.56 F500.0
+G1 X-26.42 Y-53.05 Z2.99 J368.08 F500.0
+G1 X-26.42 Y-57.25 Z2.99 J372.20 F500.0
+G1 X-29.53 Y-59.05 Z2.99 J375.72 F500.0
+G1 X-29.53 Y-63.25 Z2.99 J379.84 F500.0
+G1 X-26.42 Y-65.05 Z2.99 J383.36 F500.0
+G1 X-26.42 Y-69.25 Z2.99 J387.47 F500.0
+G1 X-29.53 Y-71.05 Z2.99 J391.00 F500.0
+G1 X-29.53 Y-73.09 Z2.99 J392.99 F500.0
+G1 X-22.95 Y-73.09 Z2.99 J399.44 F500.0
+G1 X-22.95 Y-71.05 Z2.99 J401.44 F500.0
+G1 X-26.07 Y-69.25 Z2.99 J404.97 F500.0
+G1 X-26.07 Y-65.05 Z2.99 J409.09 F500.0
+G1 X-22.95 Y-63.25 Z2.99 J412.62 F500.0
+G1 X-22.95 Y-59.05 Z2.99 J416.73 F500.0
+G1 X-26.07 Y-57.25 Z2.99 J420.26 F500.0
+G1 X-26.07 Y-53.05 Z2.99 J424.38 F500.0
+G1 X-22.95 Y-51.25 Z2.99 J427.91 F500.0
+G1 X-22.95 Y-47.05 Z2.99 J432.03 F500.0
+G1 X-26.07 Y-45.25 Z2.99 J435.56 F500.0
+G1 X-26.07 Y-41.05 Z2.99 J439.67 F500.0
+G1 X-23.99 Y-39.85 Z2.99 J442.03 F500.0
+G1 X-21.57 Y-39.85 Z2.99 J444.40 F500.0
+G1 X-19.49 Y-41.05 Z2.99 J446.75 F500.0
+G1 X-19.49 Y-45.25 Z2.99 J450.87 F500.0
+G1 X-22.61 Y-47.05 Z2.99 J454.40 F500.0
+G1 X-22.61 Y-51.25 Z2.99 J458.51 F500.0
+G1 X-19.49 Y-53.05 Z2.99 J462.04 F500.0
+G1 X-19.49 Y-57.25 Z2.99 J466.16 F500.0
+G1 X-22.61 Y-59.05 Z2.99 J469.69 F500.0
+G1 X-22.61 Y-63.25 Z2.99 J473.80 F500.0
+G1 X-19.49 Y-65.05 Z2.99 J477.33 F500.0
+G1 X-19.49 Y-69.25 Z2.99 J481.45 F500.0
+G1 X-22.61 Y-71.05 Z2.99 J484.98 F500.0
+G1 X-22.61 Y-73.09 Z2.99 J486.98 F500.0
+G1 X-16.02 Y-73.09 Z2.99 J493.44 F500.0
+G1 X-16.02 Y-71.05 Z2.99 J495.44 F500.0
+G1 X-19.14 Y-69.25 Z2.99 J498.97 F500.0
+G1 X-19.14 Y-65.05 Z2.99 J503.08 F500.0
+G1 X-16.02 Y-63.25 Z2.99 J506.61 F500.0
+G1 X-16.02 Y-59.05 Z2.99 J510.73 F500.0
+G1 X-19.14 Y-57.25 Z2.99 J514.26 F500.0
+G1 X-19.14 Y-53.05 Z2.99 J518.37 F500.0
+G1 X-16.02 Y-51.25 Z2.99 J521.90 F500.0
+G1 X-16.02 Y-47.05 Z2.99 J526.02 F500.0
+G1 X-19.14 Y-45.25 Z2.99 J529.55 F500.0
+G1 X-19.14 Y-41.05 Z2.99 J533.67 F500.0
+G1 X-17.06 Y-39.85 Z2.99 J536.02 F500.0
+G1 X-14.64 Y-39.85 Z2.99 J538.39 F500.0
+G1 X-12.56 Y-41.05 Z2.99 J540.74 F500.0
+G1 X-12.56 Y-45.25 Z2.99 J544.86 F500.0
+G1 X-15.68 Y-47.05 Z2.99 J548.39 F500.0
+G1 X-15.68 Y-51.25 Z2.99 J552.51 F500.0
+G1 X-12.56 Y-53.05 Z2.99 J556.04 F500.0
+G1 X-12.56 Y-57.25 Z2.99 J560.15 F500.0
+G1 X-15.68 Y-59.05 Z2.99 J563.68 F500.0
+G1 X-15.68 Y-63.25 Z2.99 J567.80 F500.0
+G1 X-12.56 Y-65.05 Z2.99 J571.33 F500.0
+G1 X-12.56 Y-69.25 Z2.99 J575.44 F500.0
+G1 X-15.68 Y-71.05 Z2.99 J578.97 F500.0
+G1 X-15.68 Y-73.09 Z2.99 J580.97 F500.0
+G1 X-9.10 Y-73.09 Z2.99 J587.42 F500.0
+G1 X-9.10 Y-71.05 Z2.99 J589.42 F500.0
+G1 X-12.21 Y-69.25 Z2.99 J592.94 F500.0
+G1 X-12.21 Y-65.05 Z2.99 J597.06 F500.0
+G1 X-9.10 Y-63.25 Z2.99 J600.58 F500.0
+G1 X-9.10 Y-59.05 Z2.99 J604.70 F500.0
+G1 X-12.21 Y-57.25 Z2.99 J608.22 F500.0
+G1 X-12.21 Y-53.05 Z2.99 J612.33 F500.0
+G1 X-9.10 Y-51.25 Z2.99 J615.86 F500.0
+G1 X-9.10 Y-47.05 Z2.99 J619.97 F500.0
+G1 X-12.21 Y-45.25 Z2.99 J623.49 F500.0
+G1 X-12.21 Y-41.05 Z2.99 J627.61 F500.0
+G1 X-10.14 Y-39.85 Z2.99 J629.95 F500.0
+G1 X-7.71 Y-39.85 Z2.99 J632.34 F500.0
+G1 X-5.63 Y-41.05 Z2.99 J634.69 F500.0
+G1 X-5.63 Y-45.25 Z2.99 J638.80 F500.0
+G1 X-8.75 Y-47.05 Z2.99 J642.33 F500.0
+G1 X-8.75 Y-51.25 Z2.99 J646.45 F500.0
+G1 X-5.63 Y-53.05 Z2.99 J649.98 F500.0
+G1 X-5.63 Y-57.25 Z2.99 J654.10 F500.0
+G1 X-8.75 Y-59.05 Z2.99 J657.63 F500.0
+G1 X-8.75 Y-63.25 Z2.99 J661.74 F500.0
+G1 X-5.63 Y-65.05 Z2.99 J665.27 F500.0
+G1 X-5.63 Y-69.25 Z2.99 J669.39 F500.0
+G1 X-8.75 Y-71.05 Z2.99 J672.92 F500.0
+G1 X-8.75 Y-73.09 Z2.99 J674.92 F500.0
+G1 X-2.17 Y-73.09 Z2.99 J681.37 F500.0
+G1 X-2.17 Y-71.05 Z2.99 J683.37 F500.0
+G1 X-5.28 Y-69.25 Z2.99 J686.89 F500.0
+G1 X-5.28 Y-65.05 Z2.99 J691.00 F500.0
+G1 X-2.17 Y-63.25 Z2.99 J694.52 F500.0
+G1 X-2.17 Y-59.05 Z2.99 J698.64 F500.0
+G1 X-5.28 Y-57.25 Z2.99 J702.16 F500.0
+G1 X-5.28 Y-53.05 Z2.99 J706.28 F500.0
+G1 X-2.17 Y-51.25 Z2.99 J709.80 F500.0
+G1 X-2.17 Y-47.05 Z2.99 J713.91 F500.0
+G1 X-5.28 Y-45.25 Z2.99 J717.44 F500.0
+G1 X-5.28 Y-41.05 Z2.99 J721.55 F500.0
+G1 X-3.21 Y-39.85 Z2.99 J723.90 F500.0
+G1 X-0.78 Y-39.85 Z2.99 J726.28 F500.0
+G1 X1.30 Y-41.05 Z2.99 J728.63 F500.0
+G1 X1.30 Y-45.25 Z2.99 J732.75 F500.0
+G1 X-1.82 Y-47.05 Z2.99 J736.28 F500.0
+G1 X-1.82 Y-51.25 Z2.99 J740.39 F500.0
+G1 X1.30 Y-53.05 Z2.99 J743.92 F500.0
+G1 X1.30 Y-57.25 Z2.99 J748.04 F500.0
+G1 X-1.82 Y-59.05 Z2.99 J751.57 F500.0
+G1 X-1.82 Y-63.25 Z2.99 J755.69 F500.0
+G1 X1.30 Y-65.05 Z2.99 J759.22 F500.0
+G1 X1.30 Y-69.25 Z2.99 J763.33 F500.0
+G1 X-1.82 Y-71.05 Z2.99 J766.86 F500.0
+G1 X-1.82 Y-73.09 Z2.99 J768.86 F500.0
+G1 X4.76 Y-73.09 Z2.99 J775.31 F500.0
+G1 X4.76 Y-71.05 Z2.99 J777.31 F500.0
+G1 X1.64 Y-69.25 Z2.99 J780.84 F500.0
+G1 X1.64 Y-65.05 Z2.99 J784.95 F500.0
+G1 X4.76 Y-63.25 Z2.99 J788.48 F500.0
+G1 X4.76 Y-59.05 Z2.99 J792.60 F500.0
+G1 X1.64 Y-57.25 Z2.99 J796.13 F500.0
+G1 X1.64 Y-53.05 Z2.99 J800.25 F500.0
+G1 X4.76 Y-51.25 Z2.99 J803.78 F500.0
+G1 X4.76 Y-47.05 Z2.99 J807.89 F500.0
+G1 X1.64 Y-45.25 Z2.99 J811.42 F500.0
+G1 X1.64 Y-41.05 Z2.99 J815.54 F500.0
+G1 X3.72 Y-39.85 Z2.99 J817.89 F500.0
+G1 X6.15 Y-39.85 Z2.99 J820.27 F500.0
+G1 X8.22 Y-41.05 Z2.99 J822.62 F500.0
+G1 X8.22 Y-45.25 Z2.99 J826.73 F500.0
+G1 X5.11 Y-47.05 Z2.99 J830.26 F500.0
+G1 X5.11 Y-51.25 Z2.99 J834.37 F500.0
+G1 X8.22 Y-53.05 Z2.99 J837.89 F500.0
+G1 X8.22 Y-57.25 Z2.99 J842.01 F500.0
+G1 X5.11 Y-59.05 Z2.99 J845.53 F500.0
+G1 X5.11 Y-63.25 Z2.99 J849.65 F500.0
+G1 X8.22 Y-65.05 Z2.99 J853.17 F500.0
+G1 X8.22 Y-69.25 Z2.99 J857.28 F500.0
+G1 X5.11 Y-71.05 Z2.99 J860.81 F500.0
+G1 X5.11 Y-73.09 Z2.99 J862.80 F500.0
+G1 X11.69 Y-73.09 Z2.99 J869.25 F500.0
+G1 X11.69 Y-71.05 Z2.99 J871.25 F500.0
+G1 X8.57 Y-69.25 Z2.99 J874.78 F500.0
+G1 X8.57 Y-65.05 Z2.99 J878.90 F500.0
+G1 X11.69 Y-63.25 Z2.99 J882.43 F500.0
+G1 X11.69 Y-59.05 Z2.99 J886.54 F500.0
+G1 X8.57 Y-57.25 Z2.99 J890.07 F500.0
+G1 X8.57 Y-53.05 Z2.99 J894.19 F500.0
+G1 X11.69 Y-51.25 Z2.99 J897.72 F500.0
+G1 X11.69 Y-47.05 Z2.99 J901.84 F500.0
+G1 X8.57 Y-45.25 Z2.99 J905.37 F500.0
+G1 X8.57 Y-41.05 Z2.99 J909.48 F500.0
+G1 X10.65 Y-39.85 Z2.99 J911.84 F500.0
+G1 X13.07 Y-39.85 Z2.99 J914.21 F500.0
+G1 X15.15 Y-41.05 Z2.99 J916.56 F500.0
+G1 X15.15 Y-45.25 Z2.99 J920.68 F500.0
+G1 X12.03 Y-47.05 Z2.99 J924.21 F500.0
+G1 X12.03 Y-51.25 Z2.99 J928.32 F500.0
+G1 X15.15 Y-53.05 Z2.99 J931.85 F500.0
+G1 X15.15 Y-57.25 Z2.99 J935.97 F500.0
+G1 X12.03 Y-59.05 Z2.99 J939.50 F500.0
+G1 X12.03 Y-63.25 Z2.99 J943.61 F500.0
+G1 X15.15 Y-65.05 Z2.99 J947.14 F500.0
+G1 X15.15 Y-69.25 Z2.99 J951.26 F500.0
+G1 X12.03 Y-71.05 Z2.99 J954.79 F500.0
+G1 X12.03 Y-73.09 Z2.99 J956.79 F500.0
+G1 X18.62 Y-73.09 Z2.99 J963.25 F500.0
+G1 X18.62 Y-71.05 Z2.99 J965.25 F500.0
+G1 X15.50 Y-69.25 Z2.99 J968.78 F500.0
+G1 X15.50 Y-65.05 Z2.99 J972.89 F500.0
+G1 X18.62 Y-63.25 Z2.99 J976.42 F500.0
+G1 X18.62 Y-59.05 Z2.99 J980.54 F500.0
+G1 X15.50 Y-57.25 Z2.99 J984.07 F500.0
+G1 X15.50 Y-53.05 Z2.99 J988.18 F500.0
+G1 X18.62 Y-51.25 Z2.99 J991.71 F500.0
+G1 X18.62 Y-47.05 Z2.99 J995.83 F500.0
+G1 X15.50 Y-45.25 Z2.99 J999.36 F500.0
+G1 X15.50 Y-41.05 Z2.99 J1003.48 F500.0
+G1 X17.58 Y-39.85 Z2.99 J1005.83 F500.0
+G1 X20.00 Y-39.85 Z2.99 J1008.20 F500.0
+G1 X22.08 Y-41.05 Z2.99 J1010.55 F500.0
+G1 X22.08 Y-45.25 Z2.99 J1014.67 F500.0
+G1 X18.96 Y-47.05 Z2.99 J1018.20 F500.0
+G1 X18.96 Y-51.25 Z2.99 J1022.32 F500.0
+G1 X22.08 Y-53.05 Z2.99 J1025.85 F500.0
+G1 X22.08 Y-57.25 Z2.99 J1029.96 F500.0
+G1 X18.96 Y-59.05 Z2.99 J1033.49 F500.0
+G1 X18.96 Y-63.25 Z2.99 J1037.61 F500.0
+G1 X22.08 Y-65.05 Z2.99 J1041.14 F500.0
+G1 X22.08 Y-69.25 Z2.99 J1045.25 F500.0
+G1 X18.96 Y-71.05 Z2.99 J1048.78 F500.0
+G1 X18.96 Y-73.09 Z2.99 J1050.78 F500.0
+G1 X25.54 Y-73.09 Z2.99 J1057.23 F500.0
+G1 X25.54 Y-71.05 Z2.99 J1059.23 F500.0
+G1 X22.43 Y-69.25 Z2.99 J1062.75 F500.0
+G1 X22.43 Y-65.05 Z2.99 J1066.87 F500.0
+G1 X25.54 Y-63.25 Z2.99 J1070.39 F500.0
+G1 X25.54 Y-59.05 Z2.99 J1074.51 F500.0
+G1 X22.43 Y-57.25 Z2.99 J1078.03 F500.0
+G1 X22.43 Y-53.05 Z2.99 J1082.14 F500.0
+G1 X25.54 Y-51.25 Z2.99 J1085.67 F500.0
+G1 X25.54 Y-47.05 Z2.99 J1089.78 F500.0
+G1 X22.43 Y-45.25 Z2.99 J1093.30 F500.0
+G1 X22.43 Y-41.05 Z2.99 J1097.42 F500.0
+G1 X24.51 Y-39.85 Z2.99 J1099.77 F500.0
+G1 X26.93 Y-39.85 Z2.99 J1102.14 F500.0
+G1 X29.01 Y-41.05 Z2.99 J1104.50 F500.0
+G1 X29.01 Y-45.25 Z2.99 J1108.61 F500.0
+G1 X25.89 Y-47.05 Z2.99 J1112.14 F500.0
+G1 X25.89 Y-51.25 Z2.99 J1116.26 F500.0
+G1 X29.01 Y-53.05 Z2.99 J1119.79 F500.0
+G1 X29.01 Y-57.25 Z2.99 J1123.90 F500.0
+G1 X25.89 Y-59.05 Z2.99 J1127.43 F500.0
+G1 X25.89 Y-63.25 Z2.99 J1131.55 F500.0
+G1 X29.01 Y-65.05 Z2.99 J1135.08 F500.0
+G1 X29.01 Y-69.25 Z2.99 J1139.20 F500.0
+G1 X25.89 Y-71.05 Z2.99 J1142.73 F500.0
+G1 X25.89 Y-73.09 Z2.99 J1144.73 F500.0
+G1 X32.47 Y-73.09 Z2.99 J1151.17 F500.0
+G1 X32.47 Y-71.05 Z2.99 J1153.17 F500.0
+G1 X29.36 Y-69.25 Z2.99 J1156.69 F500.0
+G1 X29.36 Y-65.05 Z2.99 J1160.81 F500.0
+G1 X32.47 Y-63.25 Z2.99 J1164.33 F500.0
+G1 X32.47 Y-59.05 Z2.99 J1168.45 F500.0
+G1 X29.36 Y-57.25 Z2.99 J1171.97 F500.0
+G1 X29.36 Y-53.05 Z2.99 J1176.09 F500.0
+G1 X32.47 Y-51.25 Z2.99 J1179.61 F500.0
+G1 X32.47 Y-47.05 Z2.99 J1183.72 F500.0
+G1 X29.36 Y-45.25 Z2.99 J1187.24 F500.0
+G1 X29.36 Y-41.05 Z2.99 J1191.36 F500.0
+G1 X31.43 Y-39.85 Z2.99 J1193.71 F500.0
+G1 X33.86 Y-39.85 Z2.99 J1196.09 F500.0
+G1 X35.94 Y-41.05 Z2.99 J1198.44 F500.0
+G1 X35.94 Y-45.25 Z2.99 J1202.56 F500.0
+G1 X32.82 Y-47.05 Z2.99 J1206.09 F500.0
+G1 X32.82 Y-51.25 Z2.99 J1210.20 F500.0
+G1 X35.94 Y-53.05 Z2.99 J1213.73 F500.0
+G1 X35.94 Y-57.25 Z2.99 J1217.85 F500.0
+G1 X32.82 Y-59.05 Z2.99 J1221.38 F500.0
+G1 X32.82 Y-63.25 Z2.99 J1225.49 F500.0
+G1 X35.94 Y-65.05 Z2.99 J1229.02 F500.0
+G1 X35.94 Y-69.25 Z2.99 J1233.14 F500.0
+G1 X32.82 Y-71.05 Z2.99 J1236.67 F500.0
+G1 X32.82 Y-73.09 Z2.99 J1238.67 F500.0
+G1 X39.40 Y-73.09 Z2.99 J1245.12 F500.0
+G1 X39.40 Y-71.05 Z2.99 J1247.12 F500.0
+G1 X36.28 Y-69.25 Z2.99 J1250.65 F500.0
+G1 X36.28 Y-65.05 Z2.99 J1254.76 F500.0
+G1 X39.40 Y-63.25 Z2.99 J1258.29 F500.0
+G1 X39.40 Y-59.05 Z2.99 J1262.41 F500.0
+G1 X36.28 Y-57.25 Z2.99 J1265.94 F500.0
+G1 X36.28 Y-53.05 Z2.99 J1270.05 F500.0
+G1 X39.40 Y-51.25 Z2.99 J1273.58 F500.0
+G1 X39.40 Y-47.05 Z2.99 J1277.70 F500.0
+G1 X36.28 Y-45.25 Z2.99 J1281.23 F500.0
+G1 X36.28 Y-41.05 Z2.99 J1285.35 F500.0
+G1 X38.36 Y-39.85 Z2.99 J1287.70 F500.0
+
+T1
+G1 X18.58 Y-72.53 Z3.99 J0.00 F500.0
+G1 X39.10 Y-72.53 Z3.99 J20.11 F500.0
+G1 X39.10 Y-46.73 Z3.99 J45.39 F500.0
+G1 X39.10 Y-40.41 Z3.99 J51.59 F500.0
+G1 X-12.50 Y-40.41 Z3.99 J102.16 F500.0
+G1 X-33.02 Y-40.41 Z3.99 J122.26 F500.0
+G1 X-33.02 Y-66.21 Z3.99 J147.55 F500.0
+G1 X-33.02 Y-72.53 Z3.99 J153.74 F500.0
+G1 X18.58 Y-72.53 Z3.99 J204.31 F500.0
+G1 X18.58 Y-72.53 Z3.99 J204.31 F500.0
+G1 X-29.88 Y-72.53 Z3.99 J251.80 F500.0
+G1 X-29.88 Y-71.05 Z3.99 J253.25 F500.0
+G1 X-33.00 Y-69.25 Z3.99 J256.78 F500.0
+G1 X-33.00 Y-65.05 Z3.99 J260.90 F500.0
+G1 X-29.88 Y-63.25 Z3.99 J264.43 F500.0
+G1 X-29.88 Y-59.05 Z3.99 J268.54 F500.0
+G1 X-33.00 Y-57.25 Z3.99 J272.07 F500.0
+G1 X-33.00 Y-53.05 Z3.99 J276.19 F500.0
+G1 X-29.88 Y-51.25 Z3.99 J279.72 F500.0
+G1 X-29.88 Y-47.05 Z3.99 J283.84 F500.0
+G1 X-33.00 Y-45.25 Z3.99 J287.37 F500.0
+G1 X-33.00 Y-41.05 Z3.99 J291.48 F500.0
+G1 X-31.88 Y-40.41 Z3.99 J292.75 F500.0
+G1 X-27.53 Y-40.41 Z3.99 J297.01 F500.0
+G1 X-26.42 Y-41.05 Z3.99 J298.26 F500.0
+G1 X-26.42 Y-45.25 Z3.99 J302.38 F500.0
+G1 X-29.53 Y-47.05 Z3.99 J305.90 F500.0
+G1 X-29.53 Y-51.25 Z3.99 J310.02 F500.0
+G1 X-26.42 Y-53.05 Z3.99 J313.54 F500.0
+G1 X-26.42 Y-57.25 Z3.99 J317.66 F500.0
+G1 X-29.53 Y-59.05 Z3.99 J321.18 F500.0
+G1 X-29.53 Y-63.25 Z3.99 J325.29 F500.0
+G1 X-26.42 Y-65.05 Z3.99 J328.81 F500.0
+G1 X-26.42 Y-69.25 Z3.99 J332.93 F500.0
+G1 X-29.53 Y-71.05 Z3.99 J336.45 F500.0
+G1 X-29.53 Y-72.53 Z3.99 J337.90 F500.0
+G1 X-22.95 Y-72.53 Z3.99 J344.35 F500.0
+G1 X-22.95 Y-71.05 Z3.99 J345.80 F500.0
+G1 X-26.07 Y-69.25 Z3.99 J349.33 F500.0
+G1 X-26.07 Y-65.05 Z3.99 J353.45 F500.0
+G1 X-22.95 Y-63.25 Z3.99 J356.98 F500.0
+G1 X-22.95 Y-59.05 Z3.99 J361.09 F500.0
+G1 X-26.07 Y-57.25 Z3.99 J364.62 F500.0
+G1 X-26.07 Y-53.05 Z3.99 J368.74 F500.0
+G1 X-22.95 Y-51.25 Z3.99 J372.27 F500.0
+G1 X-22.95 Y-47.05 Z3.99 J376.38 F500.0
+G1 X-26.07 Y-45.25 Z3.99 J379.91 F500.0
+G1 X-26.07 Y-41.05 Z3.99 J384.03 F500.0
+G1 X-24.95 Y-40.41 Z3.99 J385.29 F500.0
+G1 X-20.60 Y-40.41 Z3.99 J389.56 F500.0
+G1 X-19.49 Y-41.05 Z3.99 J390.81 F500.0
+G1 X-19.49 Y-45.25 Z3.99 J394.93 F500.0
+G1 X-22.61 Y-47.05 Z3.99 J398.46 F500.0
+G1 X-22.61 Y-51.25 Z3.99 J402.58 F500.0
+G1 X-19.49 Y-53.05 Z3.99 J406.11 F500.0
+G1 X-19.49 Y-57.25 Z3.99 J410.22 F500.0
+G1 X-22.61 Y-59.05 Z3.99 J413.75 F500.0
+G1 X-22.61 Y-63.25 Z3.99 J417.87 F500.0
+G1 X-19.49 Y-65.05 Z3.99 J421.40 F500.0
+G1 X-19.49 Y-69.25 Z3.99 J425.51 F500.0
+G1 X-22.61 Y-71.05 Z3.99 J429.04 F500.0
+G1 X-22.61 Y-72.53 Z3.99 J430.49 F500.0
+G1 X-16.02 Y-72.53 Z3.99 J436.95 F500.0
+G1 X-16.02 Y-71.05 Z3.99 J438.40 F500.0
+G1 X-19.14 Y-69.25 Z3.99 J441.93 F500.0
+G1 X-19.14 Y-65.05 Z3.99 J446.05 F500.0
+G1 X-16.02 Y-63.25 Z3.99 J449.58 F500.0
+G1 X-16.02 Y-59.05 Z3.99 J453.69 F500.0
+G1 X-19.14 Y-57.25 Z3.99 J457.22 F500.0
+G1 X-19.14 Y-53.05 Z3.99 J461.34 F500.0
+G1 X-16.02 Y-51.25 Z3.99 J464.87 F500.0
+G1 X-16.02 Y-47.05 Z3.99 J468.99 F500.0
+G1 X-19.14 Y-45.25 Z3.99 J472.52 F500.0
+G1 X-19.14 Y-41.05 Z3.99 J476.63 F500.0
+G1 X-18.02 Y-40.41 Z3.99 J477.90 F500.0
+G1 X-13.68 Y-40.41 Z3.99 J482.15 F500.0
+G1 X-12.56 Y-41.05 Z3.99 J483.41 F500.0
+G1 X-12.56 Y-45.25 Z3.99 J487.53 F500.0
+G1 X-15.68 Y-47.05 Z3.99 J491.06 F500.0
+G1 X-15.68 Y-51.25 Z3.99 J495.18 F500.0
+G1 X-12.56 Y-53.05 Z3.99 J498.71 F500.0
+G1 X-12.56 Y-57.25 Z3.99 J502.82 F500.0
+G1 X-15.68 Y-59.05 Z3.99 J506.35 F500.0
+G1 X-15.68 Y-63.25 Z3.99 J510.47 F500.0
+G1 X-12.56 Y-65.05 Z3.99 J514.00 F500.0
+G1 X-12.56 Y-69.25 Z3.99 J518.11 F500.0
+G1 X-15.68 Y-71.05 Z3.99 J521.64 F500.0
+G1 X-15.68 Y-72.53 Z3.99 J523.09 F500.0
+G1 X-9.10 Y-72.53 Z3.99 J529.54 F500.0
+G1 X-9.10 Y-71.05 Z3.99 J530.99 F500.0
+G1 X-12.21 Y-69.25 Z3.99 J534.51 F500.0
+G1 X-12.21 Y-65.05 Z3.99 J538.63 F500.0
+G1 X-9.10 Y-63.25 Z3.99 J542.15 F500.0
+G1 X-9.10 Y-59.05 Z3.99 J546.27 F500.0
+G1 X-12.21 Y-57.25 Z3.99 J549.79 F500.0
+G1 X-12.21 Y-53.05 Z3.99 J553.90 F500.0
+G1 X-9.10 Y-51.25 Z3.99 J557.43 F500.0
+G1 X-9.10 Y-47.05 Z3.99 J561.54 F500.0
+G1 X-12.21 Y-45.25 Z3.99 J565.06 F500.0
+G1 X-12.21 Y-41.05 Z3.99 J569.18 F500.0
+G1 X-11.10 Y-40.41 Z3.99 J570.44 F500.0
+G1 X-6.75 Y-40.41 Z3.99 J574.70 F500.0
+G1 X-5.63 Y-41.05 Z3.99 J575.96 F500.0
+G1 X-5.63 Y-45.25 Z3.99 J580.08 F500.0
+G1 X-8.75 Y-47.05 Z3.99 J583.61 F500.0
+G1 X-8.75 Y-51.25 Z3.99 J587.72 F500.0
+G1 X-5.63 Y-53.05 Z3.99 J591.25 F500.0
+G1 X-5.63 Y-57.25 Z3.99 J595.37 F500.0
+G1 X-8.75 Y-59.05 Z3.99 J598.90 F500.0
+G1 X-8.75 Y-63.25 Z3.99 J603.02 F500.0
+G1 X-5.63 Y-65.05 Z3.99 J606.55 F500.0
+G1 X-5.63 Y-69.25 Z3.99 J610.66 F500.0
+G1 X-8.75 Y-71.05 Z3.99 J614.19 F500.0
+G1 X-8.75 Y-72.53 Z3.99 J615.64 F500.0
+G1 X-2.17 Y-72.53 Z3.99 J622.09 F500.0
+G1 X-2.17 Y-71.05 Z3.99 J623.54 F500.0
+G1 X-5.28 Y-69.25 Z3.99 J627.06 F500.0
+G1 X-5.28 Y-65.05 Z3.99 J631.18 F500.0
+G1 X-2.17 Y-63.25 Z3.99 J634.70 F500.0
+G1 X-2.17 Y-59.05 Z3.99 J638.82 F500.0
+G1 X-5.28 Y-57.25 Z3.99 J642.34 F500.0
+G1 X-5.28 Y-53.05 Z3.99 J646.45 F500.0
+G1 X-2.17 Y-51.25 Z3.99 J649.98 F500.0
+G1 X-2.17 Y-47.05 Z3.99 J654.09 F500.0
+G1 X-5.28 Y-45.25 Z3.99 J657.61 F500.0
+G1 X-5.28 Y-41.05 Z3.99 J661.73 F500.0
+G1 X-4.17 Y-40.41 Z3.99 J662.98 F500.0
+G1 X0.18 Y-40.41 Z3.99 J667.25 F500.0
+G1 X1.30 Y-41.05 Z3.99 J668.51 F500.0
+G1 X1.30 Y-45.25 Z3.99 J672.63 F500.0
+G1 X-1.82 Y-47.05 Z3.99 J676.16 F500.0
+G1 X-1.82 Y-51.25 Z3.99 J680.27 F500.0
+G1 X1.30 Y-53.05 Z3.99 J683.80 F500.0
+G1 X1.30 Y-57.25 Z3.99 J687.92 F500.0
+G1 X-1.82 Y-59.05 Z3.99 J691.45 F500.0
+G1 X-1.82 Y-63.25 Z3.99 J695.57 F500.0
+G1 X1.30 Y-65.05 Z3.99 J699.10 F500.0
+G1 X1.30 Y-69.25 Z3.99 J703.21 F500.0
+G1 X-1.82 Y-71.05 Z3.99 J706.74 F500.0
+G1 X-1.82 Y-72.53 Z3.99 J708.19 F500.0
+G1 X4.76 Y-72.53 Z3.99 J714.64 F500.0
+G1 X4.76 Y-71.05 Z3.99 J716.09 F500.0
+G1 X1.64 Y-69.25 Z3.99 J719.62 F500.0
+G1 X1.64 Y-65.05 Z3.99 J723.74 F500.0
+G1 X4.76 Y-63.25 Z3.99 J727.27 F500.0
+G1 X4.76 Y-59.05 Z3.99 J731.38 F500.0
+G1 X1.64 Y-57.25 Z3.99 J734.91 F500.0
+G1 X1.64 Y-53.05 Z3.99 J739.03 F500.0
+G1 X4.76 Y-51.25 Z3.99 J742.56 F500.0
+G1 X4.76 Y-47.05 Z3.99 J746.67 F500.0
+G1 X1.64 Y-45.25 Z3.99 J750.20 F500.0
+G1 X1.64 Y-41.05 Z3.99 J754.32 F500.0
+G1 X2.76 Y-40.41 Z3.99 J755.58 F500.0
+G1 X7.11 Y-40.41 Z3.99 J759.85 F500.0
+G1 X8.22 Y-41.05 Z3.99 J761.10 F500.0
+G1 X8.22 Y-45.25 Z3.99 J765.22 F500.0
+G1 X5.11 Y-47.05 Z3.99 J768.74 F500.0
+G1 X5.11 Y-51.25 Z3.99 J772.86 F500.0
+G1 X8.22 Y-53.05 Z3.99 J776.38 F500.0
+G1 X8.22 Y-57.25 Z3.99 J780.49 F500.0
+G1 X5.11 Y-59.05 Z3.99 J784.02 F500.0
+G1 X5.11 Y-63.25 Z3.99 J788.13 F500.0
+G1 X8.22 Y-65.05 Z3.99 J791.65 F500.0
+G1 X8.22 Y-69.25 Z3.99 J795.77 F500.0
+G1 X5.11 Y-71.05 Z3.99 J799.29 F500.0
+G1 X5.11 Y-72.53 Z3.99 J800.74 F500.0
+G1 X11.69 Y-72.53 Z3.99 J807.19 F500.0
+G1 X11.69 Y-71.05 Z3.99 J808.64 F500.0
+G1 X8.57 Y-69.25 Z3.99 J812.17 F500.0
+G1 X8.57 Y-65.05 Z3.99 J816.29 F500.0
+G1 X11.69 Y-63.25 Z3.99 J819.82 F500.0
+G1 X11.69 Y-59.05 Z3.99 J823.93 F500.0
+G1 X8.57 Y-57.25 Z3.99 J827.46 F500.0
+G1 X8.57 Y-53.05 Z3.99 J831.58 F500.0
+G1 X11.69 Y-51.25 Z3.99 J835.11 F500.0
+G1 X11.69 Y-47.05 Z3.99 J839.22 F500.0
+G1 X8.57 Y-45.25 Z3.99 J842.75 F500.0
+G1 X8.57 Y-41.05 Z3.99 J846.87 F500.0
+G1 X9.69 Y-40.41 Z3.99 J848.13 F500.0
+G1 X14.04 Y-40.41 Z3.99 J852.40 F500.0
+G1 X15.15 Y-41.05 Z3.99 J853.65 F500.0
+G1 X15.15 Y-45.25 Z3.99 J857.77 F500.0
+G1 X12.03 Y-47.05 Z3.99 J861.30 F500.0
+G1 X12.03 Y-51.25 Z3.99 J865.41 F500.0
+G1 X15.15 Y-53.05 Z3.99 J868.94 F500.0
+G1 X15.15 Y-57.25 Z3.99 J873.06 F500.0
+G1 X12.03 Y-59.05 Z3.99 J876.59 F500.0
+G1 X12.03 Y-63.25 Z3.99 J880.71 F500.0
+G1 X15.15 Y-65.05 Z3.99 J884.24 F500.0
+G1 X15.15 Y-69.25 Z3.99 J888.35 F500.0
+G1 X12.03 Y-71.05 Z3.99 J891.88 F500.0
+G1 X12.03 Y-72.53 Z3.99 J893.33 F500.0
+G1 X18.62 Y-72.53 Z3.99 J899.79 F500.0
+G1 X18.62 Y-71.05 Z3.99 J901.24 F500.0
+G1 X15.50 Y-69.25 Z3.99 J904.77 F500.0
+G1 X15.50 Y-65.05 Z3.99 J908.89 F500.0
+G1 X18.62 Y-63.25 Z3.99 J912.42 F500.0
+G1 X18.62 Y-59.05 Z3.99 J916.53 F500.0
+G1 X15.50 Y-57.25 Z3.99 J920.06 F500.0
+G1 X15.50 Y-53.05 Z3.99 J924.18 F500.0
+G1 X18.62 Y-51.25 Z3.99 J927.71 F500.0
+G1 X18.62 Y-47.05 Z3.99 J931.83 F500.0
+G1 X15.50 Y-45.25 Z3.99 J935.36 F500.0
+G1 X15.50 Y-41.05 Z3.99 J939.47 F500.0
+G1 X16.62 Y-40.41 Z3.99 J940.74 F500.0
+G1 X20.97 Y-40.41 Z3.99 J945.00 F500.0
+G1 X22.08 Y-41.05 Z3.99 J946.25 F500.0
+G1 X22.08 Y-45.25 Z3.99 J950.37 F500.0
+G1 X18.96 Y-47.05 Z3.99 J953.90 F500.0
+G1 X18.96 Y-51.25 Z3.99 J958.02 F500.0
+G1 X22.08 Y-53.05 Z3.99 J961.55 F500.0
+G1 X22.08 Y-57.25 Z3.99 J965.66 F500.0
+G1 X18.96 Y-59.05 Z3.99 J969.19 F500.0
+G1 X18.96 Y-63.25 Z3.99 J973.31 F500.0
+G1 X22.08 Y-65.05 Z3.99 J976.84 F500.0
+G1 X22.08 Y-69.25 Z3.99 J980.95 F500.0
+G1 X18.96 Y-71.05 Z3.99 J984.48 F500.0
+G1 X18.96 Y-72.53 Z3.99 J985.93 F500.0
+G1 X25.54 Y-72.53 Z3.99 J992.38 F500.0
+G1 X25.54 Y-71.05 Z3.99 J993.83 F500.0
+G1 X22.43 Y-69.25 Z3.99 J997.35 F500.0
+G1 X22.43 Y-65.05 Z3.99 J1001.47 F500.0
+G1 X25.54 Y-63.25 Z3.99 J1004.99 F500.0
+G1 X25.54 Y-59.05 Z3.99 J1009.11 F500.0
+G1 X22.43 Y-57.25 Z3.99 J1012.63 F500.0
+G1 X22.43 Y-53.05 Z3.99 J1016.75 F500.0
+G1 X25.54 Y-51.25 Z3.99 J1020.27 F500.0
+G1 X25.54 Y-47.05 Z3.99 J1024.38 F500.0
+G1 X22.43 Y-45.25 Z3.99 J1027.90 F500.0
+G1 X22.43 Y-41.05 Z3.99 J1032.02 F500.0
+G1 X23.54 Y-40.41 Z3.99 J1033.28 F500.0
+G1 X27.89 Y-40.41 Z3.99 J1037.54 F500.0
+G1 X29.01 Y-41.05 Z3.99 J1038.80 F500.0
+G1 X29.01 Y-45.25 Z3.99 J1042.92 F500.0
+G1 X25.89 Y-47.05 Z3.99 J1046.45 F500.0
+G1 X25.89 Y-51.25 Z3.99 J1050.57 F500.0
+G1 X29.01 Y-53.05 Z3.99 J1054.10 F500.0
+G1 X29.01 Y-57.25 Z3.99 J1058.21 F500.0
+G1 X25.89 Y-59.05 Z3.99 J1061.74 F500.0
+G1 X25.89 Y-63.25 Z3.99 J1065.86 F500.0
+G1 X29.01 Y-65.05 Z3.99 J1069.39 F500.0
+G1 X29.01 Y-69.25 Z3.99 J1073.50 F500.0
+G1 X25.89 Y-71.05 Z3.99 J1077.03 F500.0
+G1 X25.89 Y-72.53 Z3.99 J1078.48 F500.0
+G1 X32.47 Y-72.53 Z3.99 J1084.93 F500.0
+G1 X32.47 Y-71.05 Z3.99 J1086.38 F500.0
+G1 X29.36 Y-69.25 Z3.99 J1089.90 F500.0
+G1 X29.36 Y-65.05 Z3.99 J1094.02 F500.0
+G1 X32.47 Y-63.25 Z3.99 J1097.54 F500.0
+G1 X32.47 Y-59.05 Z3.99 J1101.66 F500.0
+G1 X29.36 Y-57.25 Z3.99 J1105.18 F500.0
+G1 X29.36 Y-53.05 Z3.99 J1109.29 F500.0
+G1 X32.47 Y-51.25 Z3.99 J1112.82 F500.0
+G1 X32.47 Y-47.05 Z3.99 J1116.93 F500.0
+G1 X29.36 Y-45.25 Z3.99 J1120.45 F500.0
+G1 X29.36 Y-41.05 Z3.99 J1124.57 F500.0
+G1 X30.47 Y-40.41 Z3.99 J1125.83 F500.0
+G1 X34.82 Y-40.41 Z3.99 J1130.09 F500.0
+G1 X35.94 Y-41.05 Z3.99 J1131.35 F500.0
+G1 X35.94 Y-45.25 Z3.99 J1135.47 F500.0
+G1 X32.82 Y-47.05 Z3.99 J1139.00 F500.0
+G1 X32.82 Y-51.25 Z3.99 J1143.11 F500.0
+G1 X35.94 Y-53.05 Z3.99 J1146.64 F500.0
+G1 X35.94 Y-57.25 Z3.99 J1150.76 F500.0
+G1 X32.82 Y-59.05 Z3.99 J1154.29 F500.0
+G1 X32.82 Y-63.25 Z3.99 J1158.41 F500.0
+G1 X35.94 Y-65.05 Z3.99 J1161.94 F500.0
+G1 X35.94 Y-69.25 Z3.99 J1166.05 F500.0
+G1 X32.82 Y-71.05 Z3.99 J1169.58 F500.0
+G1 X32.82 Y-72.53 Z3.99 J1171.03 F500.0
+G1 X39.10 Y-70.88 Z3.99 J1177.40 F500.0
+G1 X36.28 Y-69.25 Z3.99 J1180.59 F500.0
+G1 X36.28 Y-65.05 Z3.99 J1184.70 F500.0
+G1 X39.10 Y-63.42 Z3.99 J1187.90 F500.0
+G1 X39.10 Y-58.88 Z3.99 J1192.35 F500.0
+G1 X36.28 Y-57.25 Z3.99 J1195.54 F500.0
+G1 X36.28 Y-53.05 Z3.99 J1199.65 F500.0
+G1 X39.10 Y-51.42 Z3.99 J1202.85 F500.0
+G1 X39.10 Y-46.88 Z3.99 J1207.29 F500.0
+G1 X36.28 Y-45.25 Z3.99 J1210.49 F500.0
+G1 X36.28 Y-41.05 Z3.99 J1214.60 F500.0
+G1 X37.40 Y-40.41 Z3.99 J1215.87 F500.0
+
+T1
+G1 X15.13 Y-71.98 Z4.99 J0.00 F500.0
+G1 X38.55 Y-71.98 Z4.99 J22.95 F500.0
+G1 X38.55 Y-48.18 Z4.99 J46.28 F500.0
+G1 X38.55 Y-40.96 Z4.99 J53.35 F500.0
+G1 X-9.05 Y-40.96 Z4.99 J100.00 F500.0
+G1 X-32.47 Y-40.96 Z4.99 J122.95 F500.0
+G1 X-32.47 Y-64.76 Z4.99 J146.27 F500.0
+G1 X-32.47 Y-71.98 Z4.99 J153.35 F500.0
+G1 X15.13 Y-71.98 Z4.99 J200.00 F500.0
+G1 X15.13 Y-71.98 Z4.99 J200.00 F500.0
+G1 X-29.88 Y-71.98 Z4.99 J244.11 F500.0
+G1 X-29.88 Y-71.05 Z4.99 J245.02 F500.0
+G1 X-32.47 Y-69.56 Z4.99 J247.95 F500.0
+G1 X-32.47 Y-64.75 Z4.99 J252.66 F500.0
+G1 X-29.88 Y-63.25 Z4.99 J255.59 F500.0
+G1 X-29.88 Y-59.05 Z4.99 J259.71 F500.0
+G1 X-32.47 Y-57.56 Z4.99 J262.64 F500.0
+G1 X-32.47 Y-52.75 Z4.99 J267.35 F500.0
+G1 X-29.88 Y-51.25 Z4.99 J270.29 F500.0
+G1 X-29.88 Y-47.05 Z4.99 J274.40 F500.0
+G1 X-32.47 Y-45.56 Z4.99 J277.33 F500.0
+G1 X-26.57 Y-40.96 Z4.99 J284.66 F500.0
+G1 X-26.42 Y-41.05 Z4.99 J284.83 F500.0
+G1 X-26.42 Y-45.25 Z4.99 J288.95 F500.0
+G1 X-29.53 Y-47.05 Z4.99 J292.47 F500.0
+G1 X-29.53 Y-51.25 Z4.99 J296.59 F500.0
+G1 X-26.42 Y-53.05 Z4.99 J300.11 F500.0
+G1 X-26.42 Y-57.25 Z4.99 J304.22 F500.0
+G1 X-29.53 Y-59.05 Z4.99 J307.75 F500.0
+G1 X-29.53 Y-63.25 Z4.99 J311.86 F500.0
+G1 X-26.42 Y-65.05 Z4.99 J315.38 F500.0
+G1 X-26.42 Y-69.25 Z4.99 J319.50 F500.0
+G1 X-29.53 Y-71.05 Z4.99 J323.02 F500.0
+G1 X-29.53 Y-71.98 Z4.99 J323.93 F500.0
+G1 X-22.95 Y-71.98 Z4.99 J330.38 F500.0
+G1 X-22.95 Y-71.05 Z4.99 J331.29 F500.0
+G1 X-26.07 Y-69.25 Z4.99 J334.82 F500.0
+G1 X-26.07 Y-65.05 Z4.99 J338.94 F500.0
+G1 X-22.95 Y-63.25 Z4.99 J342.47 F500.0
+G1 X-22.95 Y-59.05 Z4.99 J346.58 F500.0
+G1 X-26.07 Y-57.25 Z4.99 J350.11 F500.0
+G1 X-26.07 Y-53.05 Z4.99 J354.23 F500.0
+G1 X-22.95 Y-51.25 Z4.99 J357.76 F500.0
+G1 X-22.95 Y-47.05 Z4.99 J361.88 F500.0
+G1 X-26.07 Y-45.25 Z4.99 J365.41 F500.0
+G1 X-26.07 Y-41.05 Z4.99 J369.52 F500.0
+G1 X-25.91 Y-40.96 Z4.99 J369.70 F500.0
+G1 X-19.65 Y-40.96 Z4.99 J375.84 F500.0
+G1 X-19.49 Y-41.05 Z4.99 J376.02 F500.0
+G1 X-19.49 Y-45.25 Z4.99 J380.13 F500.0
+G1 X-22.61 Y-47.05 Z4.99 J383.66 F500.0
+G1 X-22.61 Y-51.25 Z4.99 J387.78 F500.0
+G1 X-19.49 Y-53.05 Z4.99 J391.31 F500.0
+G1 X-19.49 Y-57.25 Z4.99 J395.42 F500.0
+G1 X-22.61 Y-59.05 Z4.99 J398.95 F500.0
+G1 X-22.61 Y-63.25 Z4.99 J403.07 F500.0
+G1 X-19.49 Y-65.05 Z4.99 J406.60 F500.0
+G1 X-19.49 Y-69.25 Z4.99 J410.72 F500.0
+G1 X-22.61 Y-71.05 Z4.99 J414.25 F500.0
+G1 X-22.61 Y-71.98 Z4.99 J415.16 F500.0
+G1 X-16.02 Y-71.98 Z4.99 J421.62 F500.0
+G1 X-16.02 Y-71.05 Z4.99 J422.53 F500.0
+G1 X-19.14 Y-69.25 Z4.99 J426.06 F500.0
+G1 X-19.14 Y-65.05 Z4.99 J430.17 F500.0
+G1 X-16.02 Y-63.25 Z4.99 J433.70 F500.0
+G1 X-16.02 Y-59.05 Z4.99 J437.82 F500.0
+G1 X-19.14 Y-57.25 Z4.99 J441.35 F500.0
+G1 X-19.14 Y-53.05 Z4.99 J445.47 F500.0
+G1 X-16.02 Y-51.25 Z4.99 J448.99 F500.0
+G1 X-16.02 Y-47.05 Z4.99 J453.11 F500.0
+G1 X-19.14 Y-45.25 Z4.99 J456.64 F500.0
+G1 X-19.14 Y-41.05 Z4.99 J460.76 F500.0
+G1 X-18.98 Y-40.96 Z4.99 J460.94 F500.0
+G1 X-12.72 Y-40.96 Z4.99 J467.07 F500.0
+G1 X-12.56 Y-41.05 Z4.99 J467.25 F500.0
+G1 X-12.56 Y-45.25 Z4.99 J471.37 F500.0
+G1 X-15.68 Y-47.05 Z4.99 J474.90 F500.0
+G1 X-15.68 Y-51.25 Z4.99 J479.01 F500.0
+G1 X-12.56 Y-53.05 Z4.99 J482.54 F500.0
+G1 X-12.56 Y-57.25 Z4.99 J486.66 F500.0
+G1 X-15.68 Y-59.05 Z4.99 J490.19 F500.0
+G1 X-15.68 Y-63.25 Z4.99 J494.31 F500.0
+G1 X-12.56 Y-65.05 Z4.99 J497.84 F500.0
+G1 X-12.56 Y-69.25 Z4.99 J501.95 F500.0
+G1 X-15.68 Y-71.05 Z4.99 J505.48 F500.0
+G1 X-15.68 Y-71.98 Z4.99 J506.39 F500.0
+G1 X-9.10 Y-71.98 Z4.99 J512.84 F500.0
+G1 X-9.10 Y-71.05 Z4.99 J513.75 F500.0
+G1 X-12.21 Y-69.25 Z4.99 J517.27 F500.0
+G1 X-12.21 Y-65.05 Z4.99 J521.39 F500.0
+G1 X-9.10 Y-63.25 Z4.99 J524.91 F500.0
+G1 X-9.10 Y-59.05 Z4.99 J529.03 F500.0
+G1 X-12.21 Y-57.25 Z4.99 J532.55 F500.0
+G1 X-12.21 Y-53.05 Z4.99 J536.66 F500.0
+G1 X-9.10 Y-51.25 Z4.99 J540.19 F500.0
+G1 X-9.10 Y-47.05 Z4.99 J544.30 F500.0
+G1 X-12.21 Y-45.25 Z4.99 J547.82 F500.0
+G1 X-12.21 Y-41.05 Z4.99 J551.94 F500.0
+G1 X-12.06 Y-40.96 Z4.99 J552.11 F500.0
+G1 X-5.79 Y-40.96 Z4.99 J558.26 F500.0
+G1 X-5.63 Y-41.05 Z4.99 J558.44 F500.0
+G1 X-5.63 Y-45.25 Z4.99 J562.55 F500.0
+G1 X-8.75 Y-47.05 Z4.99 J566.08 F500.0
+G1 X-8.75 Y-51.25 Z4.99 J570.20 F500.0
+G1 X-5.63 Y-53.05 Z4.99 J573.73 F500.0
+G1 X-5.63 Y-57.25 Z4.99 J577.84 F500.0
+G1 X-8.75 Y-59.05 Z4.99 J581.37 F500.0
+G1 X-8.75 Y-63.25 Z4.99 J585.49 F500.0
+G1 X-5.63 Y-65.05 Z4.99 J589.02 F500.0
+G1 X-5.63 Y-69.25 Z4.99 J593.14 F500.0
+G1 X-8.75 Y-71.05 Z4.99 J596.67 F500.0
+G1 X-8.75 Y-71.98 Z4.99 J597.58 F500.0
+G1 X-2.17 Y-71.98 Z4.99 J604.03 F500.0
+G1 X-2.17 Y-71.05 Z4.99 J604.94 F500.0
+G1 X-5.28 Y-69.25 Z4.99 J608.46 F500.0
+G1 X-5.28 Y-65.05 Z4.99 J612.57 F500.0
+G1 X-2.17 Y-63.25 Z4.99 J616.10 F500.0
+G1 X-2.17 Y-59.05 Z4.99 J620.21 F500.0
+G1 X-5.28 Y-57.25 Z4.99 J623.73 F500.0
+G1 X-5.28 Y-53.05 Z4.99 J627.85 F500.0
+G1 X-2.17 Y-51.25 Z4.99 J631.37 F500.0
+G1 X-2.17 Y-47.05 Z4.99 J635.49 F500.0
+G1 X-5.28 Y-45.25 Z4.99 J639.01 F500.0
+G1 X-5.28 Y-41.05 Z4.99 J643.12 F500.0
+G1 X-5.13 Y-40.96 Z4.99 J643.30 F500.0
+G1 X1.14 Y-40.96 Z4.99 J649.44 F500.0
+G1 X1.30 Y-41.05 Z4.99 J649.62 F500.0
+G1 X1.30 Y-45.25 Z4.99 J653.74 F500.0
+G1 X-1.82 Y-47.05 Z4.99 J657.27 F500.0
+G1 X-1.82 Y-51.25 Z4.99 J661.38 F500.0
+G1 X1.30 Y-53.05 Z4.99 J664.91 F500.0
+G1 X1.30 Y-57.25 Z4.99 J669.03 F500.0
+G1 X-1.82 Y-59.05 Z4.99 J672.56 F500.0
+G1 X-1.82 Y-63.25 Z4.99 J676.67 F500.0
+G1 X1.30 Y-65.05 Z4.99 J680.20 F500.0
+G1 X1.30 Y-69.25 Z4.99 J684.32 F500.0
+G1 X-1.82 Y-71.05 Z4.99 J687.85 F500.0
+G1 X-1.82 Y-71.98 Z4.99 J688.76 F500.0
+G1 X4.76 Y-71.98 Z4.99 J695.21 F500.0
+G1 X4.76 Y-71.05 Z4.99 J696.12 F500.0
+G1 X1.64 Y-69.25 Z4.99 J699.65 F500.0
+G1 X1.64 Y-65.05 Z4.99 J703.77 F500.0
+G1 X4.76 Y-63.25 Z4.99 J707.30 F500.0
+G1 X4.76 Y-59.05 Z4.99 J711.41 F500.0
+G1 X1.64 Y-57.25 Z4.99 J714.94 F500.0
+G1 X1.64 Y-53.05 Z4.99 J719.06 F500.0
+G1 X4.76 Y-51.25 Z4.99 J722.59 F500.0
+G1 X4.76 Y-47.05 Z4.99 J726.70 F500.0
+G1 X1.64 Y-45.25 Z4.99 J730.23 F500.0
+G1 X1.64 Y-41.05 Z4.99 J734.35 F500.0
+G1 X1.80 Y-40.96 Z4.99 J734.53 F500.0
+G1 X8.07 Y-40.96 Z4.99 J740.68 F500.0
+G1 X8.22 Y-41.05 Z4.99 J740.85 F500.0
+G1 X8.22 Y-45.25 Z4.99 J744.96 F500.0
+G1 X5.11 Y-47.05 Z4.99 J748.48 F500.0
+G1 X5.11 Y-51.25 Z4.99 J752.60 F500.0
+G1 X8.22 Y-53.05 Z4.99 J756.12 F500.0
+G1 X8.22 Y-57.25 Z4.99 J760.24 F500.0
+G1 X5.11 Y-59.05 Z4.99 J763.76 F500.0
+G1 X5.11 Y-63.25 Z4.99 J767.88 F500.0
+G1 X8.22 Y-65.05 Z4.99 J771.40 F500.0
+G1 X8.22 Y-69.25 Z4.99 J775.51 F500.0
+G1 X5.11 Y-71.05 Z4.99 J779.03 F500.0
+G1 X5.11 Y-71.98 Z4.99 J779.95 F500.0
+G1 X11.69 Y-71.98 Z4.99 J786.39 F500.0
+G1 X11.69 Y-71.05 Z4.99 J787.31 F500.0
+G1 X8.57 Y-69.25 Z4.99 J790.84 F500.0
+G1 X8.57 Y-65.05 Z4.99 J794.95 F500.0
+G1 X11.69 Y-63.25 Z4.99 J798.48 F500.0
+G1 X11.69 Y-59.05 Z4.99 J802.60 F500.0
+G1 X8.57 Y-57.25 Z4.99 J806.13 F500.0
+G1 X8.57 Y-53.05 Z4.99 J810.24 F500.0
+G1 X11.69 Y-51.25 Z4.99 J813.77 F500.0
+G1 X11.69 Y-47.05 Z4.99 J817.89 F500.0
+G1 X8.57 Y-45.25 Z4.99 J821.42 F500.0
+G1 X8.57 Y-41.05 Z4.99 J825.54 F500.0
+G1 X8.73 Y-40.96 Z4.99 J825.72 F500.0
+G1 X15.00 Y-40.96 Z4.99 J831.86 F500.0
+G1 X15.15 Y-41.05 Z4.99 J832.03 F500.0
+G1 X15.15 Y-45.25 Z4.99 J836.15 F500.0
+G1 X12.03 Y-47.05 Z4.99 J839.68 F500.0
+G1 X12.03 Y-51.25 Z4.99 J843.79 F500.0
+G1 X15.15 Y-53.05 Z4.99 J847.32 F500.0
+G1 X15.15 Y-57.25 Z4.99 J851.44 F500.0
+G1 X12.03 Y-59.05 Z4.99 J854.97 F500.0
+G1 X12.03 Y-63.25 Z4.99 J859.09 F500.0
+G1 X15.15 Y-65.05 Z4.99 J862.62 F500.0
+G1 X15.15 Y-69.25 Z4.99 J866.73 F500.0
+G1 X12.03 Y-71.05 Z4.99 J870.26 F500.0
+G1 X12.03 Y-71.98 Z4.99 J871.17 F500.0
+G1 X18.62 Y-71.98 Z4.99 J877.63 F500.0
+G1 X18.62 Y-71.05 Z4.99 J878.54 F500.0
+G1 X15.50 Y-69.25 Z4.99 J882.07 F500.0
+G1 X15.50 Y-65.05 Z4.99 J886.19 F500.0
+G1 X18.62 Y-63.25 Z4.99 J889.72 F500.0
+G1 X18.62 Y-59.05 Z4.99 J893.83 F500.0
+G1 X15.50 Y-57.25 Z4.99 J897.36 F500.0
+G1 X15.50 Y-53.05 Z4.99 J901.48 F500.0
+G1 X18.62 Y-51.25 Z4.99 J905.01 F500.0
+G1 X18.62 Y-47.05 Z4.99 J909.13 F500.0
+G1 X15.50 Y-45.25 Z4.99 J912.66 F500.0
+G1 X15.50 Y-41.05 Z4.99 J916.77 F500.0
+G1 X15.66 Y-40.96 Z4.99 J916.95 F500.0
+G1 X21.92 Y-40.96 Z4.99 J923.09 F500.0
+G1 X22.08 Y-41.05 Z4.99 J923.27 F500.0
+G1 X22.08 Y-45.25 Z4.99 J927.38 F500.0
+G1 X18.96 Y-47.05 Z4.99 J930.91 F500.0
+G1 X18.96 Y-51.25 Z4.99 J935.03 F500.0
+G1 X22.08 Y-53.05 Z4.99 J938.56 F500.0
+G1 X22.08 Y-57.25 Z4.99 J942.67 F500.0
+G1 X18.96 Y-59.05 Z4.99 J946.20 F500.0
+G1 X18.96 Y-63.25 Z4.99 J950.32 F500.0
+G1 X22.08 Y-65.05 Z4.99 J953.85 F500.0
+G1 X22.08 Y-69.25 Z4.99 J957.97 F500.0
+G1 X18.96 Y-71.05 Z4.99 J961.50 F500.0
+G1 X18.96 Y-71.98 Z4.99 J962.41 F500.0
+G1 X25.54 Y-71.98 Z4.99 J968.86 F500.0
+G1 X25.54 Y-71.05 Z4.99 J969.77 F500.0
+G1 X22.43 Y-69.25 Z4.99 J973.29 F500.0
+G1 X22.43 Y-65.05 Z4.99 J977.40 F500.0
+G1 X25.54 Y-63.25 Z4.99 J980.93 F500.0
+G1 X25.54 Y-59.05 Z4.99 J985.04 F500.0
+G1 X22.43 Y-57.25 Z4.99 J988.56 F500.0
+G1 X22.43 Y-53.05 Z4.99 J992.68 F500.0
+G1 X25.54 Y-51.25 Z4.99 J996.20 F500.0
+G1 X25.54 Y-47.05 Z4.99 J1000.32 F500.0
+G1 X22.43 Y-45.25 Z4.99 J1003.84 F500.0
+G1 X22.43 Y-41.05 Z4.99 J1007.95 F500.0
+G1 X22.59 Y-40.96 Z4.99 J1008.13 F500.0
+G1 X28.85 Y-40.96 Z4.99 J1014.27 F500.0
+G1 X29.01 Y-41.05 Z4.99 J1014.45 F500.0
+G1 X29.01 Y-45.25 Z4.99 J1018.57 F500.0
+G1 X25.89 Y-47.05 Z4.99 J1022.10 F500.0
+G1 X25.89 Y-51.25 Z4.99 J1026.21 F500.0
+G1 X29.01 Y-53.05 Z4.99 J1029.74 F500.0
+G1 X29.01 Y-57.25 Z4.99 J1033.86 F500.0
+G1 X25.89 Y-59.05 Z4.99 J1037.39 F500.0
+G1 X25.89 Y-63.25 Z4.99 J1041.50 F500.0
+G1 X29.01 Y-65.05 Z4.99 J1045.03 F500.0
+G1 X29.01 Y-69.25 Z4.99 J1049.15 F500.0
+G1 X25.89 Y-71.05 Z4.99 J1052.68 F500.0
+G1 X25.89 Y-71.98 Z4.99 J1053.59 F500.0
+G1 X32.47 Y-71.98 Z4.99 J1060.04 F500.0
+G1 X32.47 Y-71.05 Z4.99 J1060.95 F500.0
+G1 X29.36 Y-69.25 Z4.99 J1064.47 F500.0
+G1 X29.36 Y-65.05 Z4.99 J1068.59 F500.0
+G1 X32.47 Y-63.25 Z4.99 J1072.11 F500.0
+G1 X32.47 Y-59.05 Z4.99 J1076.23 F500.0
+G1 X29.36 Y-57.25 Z4.99 J1079.75 F500.0
+G1 X29.36 Y-53.05 Z4.99 J1083.86 F500.0
+G1 X32.47 Y-51.25 Z4.99 J1087.38 F500.0
+G1 X32.47 Y-47.05 Z4.99 J1091.50 F500.0
+G1 X29.36 Y-45.25 Z4.99 J1095.02 F500.0
+G1 X29.36 Y-41.05 Z4.99 J1099.14 F500.0
+G1 X29.51 Y-40.96 Z4.99 J1099.31 F500.0
+G1 X35.78 Y-40.96 Z4.99 J1105.45 F500.0
+G1 X35.94 Y-41.05 Z4.99 J1105.63 F500.0
+G1 X35.94 Y-45.25 Z4.99 J1109.75 F500.0
+G1 X32.82 Y-47.05 Z4.99 J1113.28 F500.0
+G1 X32.82 Y-51.25 Z4.99 J1117.40 F500.0
+G1 X35.94 Y-53.05 Z4.99 J1120.93 F500.0
+G1 X35.94 Y-57.25 Z4.99 J1125.04 F500.0
+G1 X32.82 Y-59.05 Z4.99 J1128.57 F500.0
+G1 X32.82 Y-63.25 Z4.99 J1132.69 F500.0
+G1 X35.94 Y-65.05 Z4.99 J1136.22 F500.0
+G1 X35.94 Y-69.25 Z4.99 J1140.33 F500.0
+G1 X32.82 Y-71.05 Z4.99 J1143.86 F500.0
+G1 X32.82 Y-71.98 Z4.99 J1144.77 F500.0
+G1 X38.55 Y-70.56 Z4.99 J1150.56 F500.0
+G1 X36.28 Y-69.25 Z4.99 J1153.13 F500.0
+G1 X36.28 Y-65.05 Z4.99 J1157.24 F500.0
+G1 X38.55 Y-63.74 Z4.99 J1159.81 F500.0
+G1 X38.55 Y-58.56 Z4.99 J1164.89 F500.0
+G1 X36.28 Y-57.25 Z4.99 J1167.46 F500.0
+G1 X36.28 Y-53.05 Z4.99 J1171.57 F500.0
+G1 X38.55 Y-51.74 Z4.99 J1174.14 F500.0
+G1 X38.55 Y-46.56 Z4.99 J1179.22 F500.0
+G1 X36.28 Y-45.25 Z4.99 J1181.79 F500.0
+G1 X36.28 Y-41.05 Z4.99 J1185.90 F500.0
+G1 X36.44 Y-40.96 Z4.99 J1186.08 F500.0
+
+T1
+G1 X11.68 Y-71.43 Z5.99 J0.00 F500.0
+G1 X38.00 Y-71.43 Z5.99 J25.79 F500.0
+G1 X38.00 Y-49.63 Z5.99 J47.16 F500.0
+G1 X38.00 Y-41.51 Z5.99 J55.12 F500.0
+G1 X-5.60 Y-41.51 Z5.99 J97.84 F500.0
+G1 X-31.92 Y-41.51 Z5.99 J123.64 F500.0
+G1 X-31.92 Y-63.31 Z5.99 J145.00 F500.0
+G1 X-31.92 Y-71.43 Z5.99 J152.96 F500.0
+G1 X11.68 Y-71.43 Z5.99 J195.69 F500.0
+G1 X11.68 Y-71.43 Z5.99 J195.69 F500.0
+G1 X-29.88 Y-71.43 Z5.99 J236.42 F500.0
+G1 X-29.88 Y-71.05 Z5.99 J236.79 F500.0
+G1 X-31.92 Y-69.88 Z5.99 J239.09 F500.0
+G1 X-31.92 Y-64.43 Z5.99 J244.43 F500.0
+G1 X-29.88 Y-63.25 Z5.99 J246.74 F500.0
+G1 X-29.88 Y-59.05 Z5.99 J250.86 F500.0
+G1 X-31.92 Y-57.88 Z5.99 J253.16 F500.0
+G1 X-31.92 Y-52.43 Z5.99 J258.50 F500.0
+G1 X-29.88 Y-51.25 Z5.99 J260.81 F500.0
+G1 X-29.88 Y-47.05 Z5.99 J264.93 F500.0
+G1 X-31.92 Y-45.88 Z5.99 J267.23 F500.0
+G1 X-26.42 Y-41.51 Z5.99 J274.12 F500.0
+G1 X-26.42 Y-45.25 Z5.99 J277.78 F500.0
+G1 X-29.53 Y-47.05 Z5.99 J281.31 F500.0
+G1 X-29.53 Y-51.25 Z5.99 J285.42 F500.0
+G1 X-26.42 Y-53.05 Z5.99 J288.94 F500.0
+G1 X-26.42 Y-57.25 Z5.99 J293.06 F500.0
+G1 X-29.53 Y-59.05 Z5.99 J296.58 F500.0
+G1 X-29.53 Y-63.25 Z5.99 J300.70 F500.0
+G1 X-26.42 Y-65.05 Z5.99 J304.22 F500.0
+G1 X-26.42 Y-69.25 Z5.99 J308.33 F500.0
+G1 X-29.53 Y-71.05 Z5.99 J311.86 F500.0
+G1 X-29.53 Y-71.43 Z5.99 J312.23 F500.0
+G1 X-22.95 Y-71.43 Z5.99 J318.68 F500.0
+G1 X-22.95 Y-71.05 Z5.99 J319.05 F500.0
+G1 X-26.07 Y-69.25 Z5.99 J322.58 F500.0
+G1 X-26.07 Y-65.05 Z5.99 J326.69 F500.0
+G1 X-22.95 Y-63.25 Z5.99 J330.22 F500.0
+G1 X-22.95 Y-59.05 Z5.99 J334.34 F500.0
+G1 X-26.07 Y-57.25 Z5.99 J337.87 F500.0
+G1 X-26.07 Y-53.05 Z5.99 J341.99 F500.0
+G1 X-22.95 Y-51.25 Z5.99 J345.52 F500.0
+G1 X-22.95 Y-47.05 Z5.99 J349.63 F500.0
+G1 X-26.07 Y-45.25 Z5.99 J353.16 F500.0
+G1 X-26.07 Y-41.51 Z5.99 J356.83 F500.0
+G1 X-19.49 Y-41.51 Z5.99 J363.28 F500.0
+G1 X-19.49 Y-45.25 Z5.99 J366.94 F500.0
+G1 X-22.61 Y-47.05 Z5.99 J370.47 F500.0
+G1 X-22.61 Y-51.25 Z5.99 J374.59 F500.0
+G1 X-19.49 Y-53.05 Z5.99 J378.12 F500.0
+G1 X-19.49 Y-57.25 Z5.99 J382.23 F500.0
+G1 X-22.61 Y-59.05 Z5.99 J385.76 F500.0
+G1 X-22.61 Y-63.25 Z5.99 J389.88 F500.0
+G1 X-19.49 Y-65.05 Z5.99 J393.41 F500.0
+G1 X-19.49 Y-69.25 Z5.99 J397.53 F500.0
+G1 X-22.61 Y-71.05 Z5.99 J401.06 F500.0
+G1 X-22.61 Y-71.43 Z5.99 J401.43 F500.0
+G1 X-16.02 Y-71.43 Z5.99 J407.89 F500.0
+G1 X-16.02 Y-71.05 Z5.99 J408.26 F500.0
+G1 X-19.14 Y-69.25 Z5.99 J411.79 F500.0
+G1 X-19.14 Y-65.05 Z5.99 J415.90 F500.0
+G1 X-16.02 Y-63.25 Z5.99 J419.43 F500.0
+G1 X-16.02 Y-59.05 Z5.99 J423.55 F500.0
+G1 X-19.14 Y-57.25 Z5.99 J427.08 F500.0
+G1 X-19.14 Y-53.05 Z5.99 J431.20 F500.0
+G1 X-16.02 Y-51.25 Z5.99 J434.73 F500.0
+G1 X-16.02 Y-47.05 Z5.99 J438.84 F500.0
+G1 X-19.14 Y-45.25 Z5.99 J442.37 F500.0
+G1 X-19.14 Y-41.51 Z5.99 J446.04 F500.0
+G1 X-12.56 Y-41.51 Z5.99 J452.49 F500.0
+G1 X-12.56 Y-45.25 Z5.99 J456.15 F500.0
+G1 X-15.68 Y-47.05 Z5.99 J459.68 F500.0
+G1 X-15.68 Y-51.25 Z5.99 J463.80 F500.0
+G1 X-12.56 Y-53.05 Z5.99 J467.33 F500.0
+G1 X-12.56 Y-57.25 Z5.99 J471.44 F500.0
+G1 X-15.68 Y-59.05 Z5.99 J474.97 F500.0
+G1 X-15.68 Y-63.25 Z5.99 J479.09 F500.0
+G1 X-12.56 Y-65.05 Z5.99 J482.62 F500.0
+G1 X-12.56 Y-69.25 Z5.99 J486.73 F500.0
+G1 X-15.68 Y-71.05 Z5.99 J490.26 F500.0
+G1 X-15.68 Y-71.43 Z5.99 J490.64 F500.0
+G1 X-9.10 Y-71.43 Z5.99 J497.09 F500.0
+G1 X-9.10 Y-71.05 Z5.99 J497.46 F500.0
+G1 X-12.21 Y-69.25 Z5.99 J500.98 F500.0
+G1 X-12.21 Y-65.05 Z5.99 J505.10 F500.0
+G1 X-9.10 Y-63.25 Z5.99 J508.62 F500.0
+G1 X-9.10 Y-59.05 Z5.99 J512.73 F500.0
+G1 X-12.21 Y-57.25 Z5.99 J516.25 F500.0
+G1 X-12.21 Y-53.05 Z5.99 J520.37 F500.0
+G1 X-9.10 Y-51.25 Z5.99 J523.89 F500.0
+G1 X-9.10 Y-47.05 Z5.99 J528.01 F500.0
+G1 X-12.21 Y-45.25 Z5.99 J531.53 F500.0
+G1 X-12.21 Y-41.51 Z5.99 J535.19 F500.0
+G1 X-5.63 Y-41.51 Z5.99 J541.64 F500.0
+G1 X-5.63 Y-45.25 Z5.99 J545.31 F500.0
+G1 X-8.75 Y-47.05 Z5.99 J548.84 F500.0
+G1 X-8.75 Y-51.25 Z5.99 J552.95 F500.0
+G1 X-5.63 Y-53.05 Z5.99 J556.48 F500.0
+G1 X-5.63 Y-57.25 Z5.99 J560.60 F500.0
+G1 X-8.75 Y-59.05 Z5.99 J564.13 F500.0
+G1 X-8.75 Y-63.25 Z5.99 J568.25 F500.0
+G1 X-5.63 Y-65.05 Z5.99 J571.78 F500.0
+G1 X-5.63 Y-69.25 Z5.99 J575.89 F500.0
+G1 X-8.75 Y-71.05 Z5.99 J579.42 F500.0
+G1 X-8.75 Y-71.43 Z5.99 J579.79 F500.0
+G1 X-2.17 Y-71.43 Z5.99 J586.24 F500.0
+G1 X-2.17 Y-71.05 Z5.99 J586.61 F500.0
+G1 X-5.28 Y-69.25 Z5.99 J590.14 F500.0
+G1 X-5.28 Y-65.05 Z5.99 J594.25 F500.0
+G1 X-2.17 Y-63.25 Z5.99 J597.77 F500.0
+G1 X-2.17 Y-59.05 Z5.99 J601.89 F500.0
+G1 X-5.28 Y-57.25 Z5.99 J605.41 F500.0
+G1 X-5.28 Y-53.05 Z5.99 J609.53 F500.0
+G1 X-2.17 Y-51.25 Z5.99 J613.05 F500.0
+G1 X-2.17 Y-47.05 Z5.99 J617.16 F500.0
+G1 X-5.28 Y-45.25 Z5.99 J620.69 F500.0
+G1 X-5.28 Y-41.51 Z5.99 J624.35 F500.0
+G1 X1.30 Y-41.51 Z5.99 J630.80 F500.0
+G1 X1.30 Y-45.25 Z5.99 J634.47 F500.0
+G1 X-1.82 Y-47.05 Z5.99 J638.00 F500.0
+G1 X-1.82 Y-51.25 Z5.99 J642.11 F500.0
+G1 X1.30 Y-53.05 Z5.99 J645.64 F500.0
+G1 X1.30 Y-57.25 Z5.99 J649.76 F500.0
+G1 X-1.82 Y-59.05 Z5.99 J653.29 F500.0
+G1 X-1.82 Y-63.25 Z5.99 J657.40 F500.0
+G1 X1.30 Y-65.05 Z5.99 J660.93 F500.0
+G1 X1.30 Y-69.25 Z5.99 J665.05 F500.0
+G1 X-1.82 Y-71.05 Z5.99 J668.58 F500.0
+G1 X-1.82 Y-71.43 Z5.99 J668.95 F500.0
+G1 X4.76 Y-71.43 Z5.99 J675.40 F500.0
+G1 X4.76 Y-71.05 Z5.99 J675.77 F500.0
+G1 X1.64 Y-69.25 Z5.99 J679.30 F500.0
+G1 X1.64 Y-65.05 Z5.99 J683.42 F500.0
+G1 X4.76 Y-63.25 Z5.99 J686.95 F500.0
+G1 X4.76 Y-59.05 Z5.99 J691.06 F500.0
+G1 X1.64 Y-57.25 Z5.99 J694.59 F500.0
+G1 X1.64 Y-53.05 Z5.99 J698.71 F500.0
+G1 X4.76 Y-51.25 Z5.99 J702.24 F500.0
+G1 X4.76 Y-47.05 Z5.99 J706.36 F500.0
+G1 X1.64 Y-45.25 Z5.99 J709.89 F500.0
+G1 X1.64 Y-41.51 Z5.99 J713.55 F500.0
+G1 X8.22 Y-41.51 Z5.99 J720.00 F500.0
+G1 X8.22 Y-45.25 Z5.99 J723.66 F500.0
+G1 X5.11 Y-47.05 Z5.99 J727.19 F500.0
+G1 X5.11 Y-51.25 Z5.99 J731.30 F500.0
+G1 X8.22 Y-53.05 Z5.99 J734.82 F500.0
+G1 X8.22 Y-57.25 Z5.99 J738.94 F500.0
+G1 X5.11 Y-59.05 Z5.99 J742.46 F500.0
+G1 X5.11 Y-63.25 Z5.99 J746.58 F500.0
+G1 X8.22 Y-65.05 Z5.99 J750.10 F500.0
+G1 X8.22 Y-69.25 Z5.99 J754.21 F500.0
+G1 X5.11 Y-71.05 Z5.99 J757.74 F500.0
+G1 X5.11 Y-71.43 Z5.99 J758.11 F500.0
+G1 X11.69 Y-71.43 Z5.99 J764.56 F500.0
+G1 X11.69 Y-71.05 Z5.99 J764.93 F500.0
+G1 X8.57 Y-69.25 Z5.99 J768.46 F500.0
+G1 X8.57 Y-65.05 Z5.99 J772.58 F500.0
+G1 X11.69 Y-63.25 Z5.99 J776.11 F500.0
+G1 X11.69 Y-59.05 Z5.99 J780.22 F500.0
+G1 X8.57 Y-57.25 Z5.99 J783.75 F500.0
+G1 X8.57 Y-53.05 Z5.99 J787.87 F500.0
+G1 X11.69 Y-51.25 Z5.99 J791.40 F500.0
+G1 X11.69 Y-47.05 Z5.99 J795.51 F500.0
+G1 X8.57 Y-45.25 Z5.99 J799.04 F500.0
+G1 X8.57 Y-41.51 Z5.99 J802.71 F500.0
+G1 X15.15 Y-41.51 Z5.99 J809.16 F500.0
+G1 X15.15 Y-45.25 Z5.99 J812.82 F500.0
+G1 X12.03 Y-47.05 Z5.99 J816.35 F500.0
+G1 X12.03 Y-51.25 Z5.99 J820.47 F500.0
+G1 X15.15 Y-53.05 Z5.99 J824.00 F500.0
+G1 X15.15 Y-57.25 Z5.99 J828.11 F500.0
+G1 X12.03 Y-59.05 Z5.99 J831.64 F500.0
+G1 X12.03 Y-63.25 Z5.99 J835.76 F500.0
+G1 X15.15 Y-65.05 Z5.99 J839.29 F500.0
+G1 X15.15 Y-69.25 Z5.99 J843.41 F500.0
+G1 X12.03 Y-71.05 Z5.99 J846.94 F500.0
+G1 X12.03 Y-71.43 Z5.99 J847.31 F500.0
+G1 X18.62 Y-71.43 Z5.99 J853.77 F500.0
+G1 X18.62 Y-71.05 Z5.99 J854.14 F500.0
+G1 X15.50 Y-69.25 Z5.99 J857.67 F500.0
+G1 X15.50 Y-65.05 Z5.99 J861.78 F500.0
+G1 X18.62 Y-63.25 Z5.99 J865.31 F500.0
+G1 X18.62 Y-59.05 Z5.99 J869.43 F500.0
+G1 X15.50 Y-57.25 Z5.99 J872.96 F500.0
+G1 X15.50 Y-53.05 Z5.99 J877.08 F500.0
+G1 X18.62 Y-51.25 Z5.99 J880.61 F500.0
+G1 X18.62 Y-47.05 Z5.99 J884.72 F500.0
+G1 X15.50 Y-45.25 Z5.99 J888.25 F500.0
+G1 X15.50 Y-41.51 Z5.99 J891.92 F500.0
+G1 X22.08 Y-41.51 Z5.99 J898.37 F500.0
+G1 X22.08 Y-45.25 Z5.99 J902.03 F500.0
+G1 X18.96 Y-47.05 Z5.99 J905.56 F500.0
+G1 X18.96 Y-51.25 Z5.99 J909.68 F500.0
+G1 X22.08 Y-53.05 Z5.99 J913.21 F500.0
+G1 X22.08 Y-57.25 Z5.99 J917.32 F500.0
+G1 X18.96 Y-59.05 Z5.99 J920.85 F500.0
+G1 X18.96 Y-63.25 Z5.99 J924.97 F500.0
+G1 X22.08 Y-65.05 Z5.99 J928.50 F500.0
+G1 X22.08 Y-69.25 Z5.99 J932.62 F500.0
+G1 X18.96 Y-71.05 Z5.99 J936.15 F500.0
+G1 X18.96 Y-71.43 Z5.99 J936.52 F500.0
+G1 X25.54 Y-71.43 Z5.99 J942.97 F500.0
+G1 X25.54 Y-71.05 Z5.99 J943.34 F500.0
+G1 X22.43 Y-69.25 Z5.99 J946.86 F500.0
+G1 X22.43 Y-65.05 Z5.99 J950.98 F500.0
+G1 X25.54 Y-63.25 Z5.99 J954.50 F500.0
+G1 X25.54 Y-59.05 Z5.99 J958.61 F500.0
+G1 X22.43 Y-57.25 Z5.99 J962.13 F500.0
+G1 X22.43 Y-53.05 Z5.99 J966.25 F500.0
+G1 X25.54 Y-51.25 Z5.99 J969.77 F500.0
+G1 X25.54 Y-47.05 Z5.99 J973.89 F500.0
+G1 X22.43 Y-45.25 Z5.99 J977.41 F500.0
+G1 X22.43 Y-41.51 Z5.99 J981.07 F500.0
+G1 X29.01 Y-41.51 Z5.99 J987.52 F500.0
+G1 X29.01 Y-45.25 Z5.99 J991.19 F500.0
+G1 X25.89 Y-47.05 Z5.99 J994.72 F500.0
+G1 X25.89 Y-51.25 Z5.99 J998.83 F500.0
+G1 X29.01 Y-53.05 Z5.99 J1002.36 F500.0
+G1 X29.01 Y-57.25 Z5.99 J1006.48 F500.0
+G1 X25.89 Y-59.05 Z5.99 J1010.01 F500.0
+G1 X25.89 Y-63.25 Z5.99 J1014.13 F500.0
+G1 X29.01 Y-65.05 Z5.99 J1017.66 F500.0
+G1 X29.01 Y-69.25 Z5.99 J1021.77 F500.0
+G1 X25.89 Y-71.05 Z5.99 J1025.30 F500.0
+G1 X25.89 Y-71.43 Z5.99 J1025.67 F500.0
+G1 X32.47 Y-71.43 Z5.99 J1032.12 F500.0
+G1 X32.47 Y-71.05 Z5.99 J1032.50 F500.0
+G1 X29.36 Y-69.25 Z5.99 J1036.02 F500.0
+G1 X29.36 Y-65.05 Z5.99 J1040.13 F500.0
+G1 X32.47 Y-63.25 Z5.99 J1043.65 F500.0
+G1 X32.47 Y-59.05 Z5.99 J1047.77 F500.0
+G1 X29.36 Y-57.25 Z5.99 J1051.29 F500.0
+G1 X29.36 Y-53.05 Z5.99 J1055.41 F500.0
+G1 X32.47 Y-51.25 Z5.99 J1058.93 F500.0
+G1 X32.47 Y-47.05 Z5.99 J1063.05 F500.0
+G1 X29.36 Y-45.25 Z5.99 J1066.57 F500.0
+G1 X29.36 Y-41.51 Z5.99 J1070.23 F500.0
+G1 X35.94 Y-41.51 Z5.99 J1076.68 F500.0
+G1 X35.94 Y-45.25 Z5.99 J1080.35 F500.0
+G1 X32.82 Y-47.05 Z5.99 J1083.88 F500.0
+G1 X32.82 Y-51.25 Z5.99 J1087.99 F500.0
+G1 X35.94 Y-53.05 Z5.99 J1091.52 F500.0
+G1 X35.94 Y-57.25 Z5.99 J1095.64 F500.0
+G1 X32.82 Y-59.05 Z5.99 J1099.17 F500.0
+G1 X32.82 Y-63.25 Z5.99 J1103.28 F500.0
+G1 X35.94 Y-65.05 Z5.99 J1106.81 F500.0
+G1 X35.94 Y-69.25 Z5.99 J1110.93 F500.0
+G1 X32.82 Y-71.05 Z5.99 J1114.46 F500.0
+G1 X32.82 Y-71.43 Z5.99 J1114.83 F500.0
+G1 X38.00 Y-70.24 Z5.99 J1120.04 F500.0
+G1 X36.28 Y-69.25 Z5.99 J1121.99 F500.0
+G1 X36.28 Y-65.05 Z5.99 J1126.10 F500.0
+G1 X38.00 Y-64.06 Z5.99 J1128.05 F500.0
+G1 X38.00 Y-58.24 Z5.99 J1133.75 F500.0
+G1 X36.28 Y-57.25 Z5.99 J1135.69 F500.0
+G1 X36.28 Y-53.05 Z5.99 J1139.81 F500.0
+G1 X38.00 Y-52.06 Z5.99 J1141.76 F500.0
+G1 X38.00 Y-46.24 Z5.99 J1147.46 F500.0
+G1 X36.28 Y-45.25 Z5.99 J1149.40 F500.0
+G1 X36.28 Y-41.51 Z5.99 J1153.07 F500.0
+
+T1
+G1 X8.24 Y-70.87 Z6.99 J0.00 F500.0
+G1 X37.44 Y-70.87 Z6.99 J28.62 F500.0
+G1 X37.44 Y-51.07 Z6.99 J48.02 F500.0
+G1 X37.44 Y-42.07 Z6.99 J56.84 F500.0
+G1 X-2.16 Y-42.07 Z6.99 J95.65 F500.0
+G1 X-31.36 Y-42.07 Z6.99 J124.26 F500.0
+G1 X-31.36 Y-61.87 Z6.99 J143.67 F500.0
+G1 X-31.36 Y-70.87 Z6.99 J152.49 F500.0
+G1 X8.24 Y-70.87 Z6.99 J191.30 F500.0
+G1 X8.24 Y-70.87 Z6.99 J191.30 F500.0
+G1 X-30.19 Y-70.87 Z6.99 J228.96 F500.0
+G1 X-31.36 Y-70.20 Z6.99 J230.28 F500.0
+G1 X-31.36 Y-64.11 Z6.99 J236.25 F500.0
+G1 X-29.88 Y-63.25 Z6.99 J237.92 F500.0
+G1 X-29.88 Y-59.05 Z6.99 J242.04 F500.0
+G1 X-31.36 Y-58.20 Z6.99 J243.71 F500.0
+G1 X-31.36 Y-52.11 Z6.99 J249.68 F500.0
+G1 X-29.88 Y-51.25 Z6.99 J251.36 F500.0
+G1 X-29.88 Y-47.05 Z6.99 J255.47 F500.0
+G1 X-31.36 Y-46.20 Z6.99 J257.15 F500.0
+G1 X-26.42 Y-42.07 Z6.99 J263.46 F500.0
+G1 X-26.42 Y-45.25 Z6.99 J266.57 F500.0
+G1 X-29.53 Y-47.05 Z6.99 J270.10 F500.0
+G1 X-29.53 Y-51.25 Z6.99 J274.21 F500.0
+G1 X-26.42 Y-53.05 Z6.99 J277.73 F500.0
+G1 X-26.42 Y-57.25 Z6.99 J281.85 F500.0
+G1 X-29.53 Y-59.05 Z6.99 J285.37 F500.0
+G1 X-29.53 Y-63.25 Z6.99 J289.49 F500.0
+G1 X-26.42 Y-65.05 Z6.99 J293.01 F500.0
+G1 X-26.42 Y-69.25 Z6.99 J297.12 F500.0
+G1 X-29.22 Y-70.87 Z6.99 J300.29 F500.0
+G1 X-23.26 Y-70.87 Z6.99 J306.13 F500.0
+G1 X-26.07 Y-69.25 Z6.99 J309.31 F500.0
+G1 X-26.07 Y-65.05 Z6.99 J313.43 F500.0
+G1 X-22.95 Y-63.25 Z6.99 J316.96 F500.0
+G1 X-22.95 Y-59.05 Z6.99 J321.08 F500.0
+G1 X-26.07 Y-57.25 Z6.99 J324.61 F500.0
+G1 X-26.07 Y-53.05 Z6.99 J328.72 F500.0
+G1 X-22.95 Y-51.25 Z6.99 J332.25 F500.0
+G1 X-22.95 Y-47.05 Z6.99 J336.37 F500.0
+G1 X-26.07 Y-45.25 Z6.99 J339.90 F500.0
+G1 X-26.07 Y-42.07 Z6.99 J343.01 F500.0
+G1 X-19.49 Y-42.07 Z6.99 J349.46 F500.0
+G1 X-19.49 Y-45.25 Z6.99 J352.58 F500.0
+G1 X-22.61 Y-47.05 Z6.99 J356.11 F500.0
+G1 X-22.61 Y-51.25 Z6.99 J360.22 F500.0
+G1 X-19.49 Y-53.05 Z6.99 J363.75 F500.0
+G1 X-19.49 Y-57.25 Z6.99 J367.87 F500.0
+G1 X-22.61 Y-59.05 Z6.99 J371.40 F500.0
+G1 X-22.61 Y-63.25 Z6.99 J375.52 F500.0
+G1 X-19.49 Y-65.05 Z6.99 J379.05 F500.0
+G1 X-19.49 Y-69.25 Z6.99 J383.16 F500.0
+G1 X-22.29 Y-70.87 Z6.99 J386.33 F500.0
+G1 X-16.34 Y-70.87 Z6.99 J392.16 F500.0
+G1 X-19.14 Y-69.25 Z6.99 J395.33 F500.0
+G1 X-19.14 Y-65.05 Z6.99 J399.45 F500.0
+G1 X-16.02 Y-63.25 Z6.99 J402.98 F500.0
+G1 X-16.02 Y-59.05 Z6.99 J407.10 F500.0
+G1 X-19.14 Y-57.25 Z6.99 J410.63 F500.0
+G1 X-19.14 Y-53.05 Z6.99 J414.74 F500.0
+G1 X-16.02 Y-51.25 Z6.99 J418.27 F500.0
+G1 X-16.02 Y-47.05 Z6.99 J422.39 F500.0
+G1 X-19.14 Y-45.25 Z6.99 J425.92 F500.0
+G1 X-19.14 Y-42.07 Z6.99 J429.03 F500.0
+G1 X-12.56 Y-42.07 Z6.99 J435.48 F500.0
+G1 X-12.56 Y-45.25 Z6.99 J438.60 F500.0
+G1 X-15.68 Y-47.05 Z6.99 J442.13 F500.0
+G1 X-15.68 Y-51.25 Z6.99 J446.24 F500.0
+G1 X-12.56 Y-53.05 Z6.99 J449.77 F500.0
+G1 X-12.56 Y-57.25 Z6.99 J453.89 F500.0
+G1 X-15.68 Y-59.05 Z6.99 J457.42 F500.0
+G1 X-15.68 Y-63.25 Z6.99 J461.54 F500.0
+G1 X-12.56 Y-65.05 Z6.99 J465.07 F500.0
+G1 X-12.56 Y-69.25 Z6.99 J469.18 F500.0
+G1 X-15.37 Y-70.87 Z6.99 J472.36 F500.0
+G1 X-9.41 Y-70.87 Z6.99 J478.20 F500.0
+G1 X-12.21 Y-69.25 Z6.99 J481.37 F500.0
+G1 X-12.21 Y-65.05 Z6.99 J485.49 F500.0
+G1 X-9.10 Y-63.25 Z6.99 J489.01 F500.0
+G1 X-9.10 Y-59.05 Z6.99 J493.13 F500.0
+G1 X-12.21 Y-57.25 Z6.99 J496.65 F500.0
+G1 X-12.21 Y-53.05 Z6.99 J500.76 F500.0
+G1 X-9.10 Y-51.25 Z6.99 J504.28 F500.0
+G1 X-9.10 Y-47.05 Z6.99 J508.40 F500.0
+G1 X-12.21 Y-45.25 Z6.99 J511.92 F500.0
+G1 X-12.21 Y-42.07 Z6.99 J515.04 F500.0
+G1 X-5.63 Y-42.07 Z6.99 J521.49 F500.0
+G1 X-5.63 Y-45.25 Z6.99 J524.60 F500.0
+G1 X-8.75 Y-47.05 Z6.99 J528.13 F500.0
+G1 X-8.75 Y-51.25 Z6.99 J532.25 F500.0
+G1 X-5.63 Y-53.05 Z6.99 J535.78 F500.0
+G1 X-5.63 Y-57.25 Z6.99 J539.90 F500.0
+G1 X-8.75 Y-59.05 Z6.99 J543.43 F500.0
+G1 X-8.75 Y-63.25 Z6.99 J547.54 F500.0
+G1 X-5.63 Y-65.05 Z6.99 J551.07 F500.0
+G1 X-5.63 Y-69.25 Z6.99 J555.19 F500.0
+G1 X-8.44 Y-70.87 Z6.99 J558.37 F500.0
+G1 X-2.48 Y-70.87 Z6.99 J564.21 F500.0
+G1 X-5.28 Y-69.25 Z6.99 J567.38 F500.0
+G1 X-5.28 Y-65.05 Z6.99 J571.49 F500.0
+G1 X-2.17 Y-63.25 Z6.99 J575.01 F500.0
+G1 X-2.17 Y-59.05 Z6.99 J579.13 F500.0
+G1 X-5.28 Y-57.25 Z6.99 J582.65 F500.0
+G1 X-5.28 Y-53.05 Z6.99 J586.77 F500.0
+G1 X-2.17 Y-51.25 Z6.99 J590.29 F500.0
+G1 X-2.17 Y-47.05 Z6.99 J594.41 F500.0
+G1 X-5.28 Y-45.25 Z6.99 J597.93 F500.0
+G1 X-5.28 Y-42.07 Z6.99 J601.04 F500.0
+G1 X1.30 Y-42.07 Z6.99 J607.49 F500.0
+G1 X1.30 Y-45.25 Z6.99 J610.61 F500.0
+G1 X-1.82 Y-47.05 Z6.99 J614.14 F500.0
+G1 X-1.82 Y-51.25 Z6.99 J618.25 F500.0
+G1 X1.30 Y-53.05 Z6.99 J621.78 F500.0
+G1 X1.30 Y-57.25 Z6.99 J625.90 F500.0
+G1 X-1.82 Y-59.05 Z6.99 J629.43 F500.0
+G1 X-1.82 Y-63.25 Z6.99 J633.55 F500.0
+G1 X1.30 Y-65.05 Z6.99 J637.08 F500.0
+G1 X1.30 Y-69.25 Z6.99 J641.19 F500.0
+G1 X-1.51 Y-70.87 Z6.99 J644.37 F500.0
+G1 X4.45 Y-70.87 Z6.99 J650.21 F500.0
+G1 X1.64 Y-69.25 Z6.99 J653.39 F500.0
+G1 X1.64 Y-65.05 Z6.99 J657.51 F500.0
+G1 X4.76 Y-63.25 Z6.99 J661.04 F500.0
+G1 X4.76 Y-59.05 Z6.99 J665.15 F500.0
+G1 X1.64 Y-57.25 Z6.99 J668.68 F500.0
+G1 X1.64 Y-53.05 Z6.99 J672.80 F500.0
+G1 X4.76 Y-51.25 Z6.99 J676.33 F500.0
+G1 X4.76 Y-47.05 Z6.99 J680.44 F500.0
+G1 X1.64 Y-45.25 Z6.99 J683.97 F500.0
+G1 X1.64 Y-42.07 Z6.99 J687.09 F500.0
+G1 X8.22 Y-42.07 Z6.99 J693.54 F500.0
+G1 X8.22 Y-45.25 Z6.99 J696.65 F500.0
+G1 X5.11 Y-47.05 Z6.99 J700.18 F500.0
+G1 X5.11 Y-51.25 Z6.99 J704.29 F500.0
+G1 X8.22 Y-53.05 Z6.99 J707.81 F500.0
+G1 X8.22 Y-57.25 Z6.99 J711.93 F500.0
+G1 X5.11 Y-59.05 Z6.99 J715.45 F500.0
+G1 X5.11 Y-63.25 Z6.99 J719.57 F500.0
+G1 X8.22 Y-65.05 Z6.99 J723.09 F500.0
+G1 X8.22 Y-69.25 Z6.99 J727.20 F500.0
+G1 X5.42 Y-70.87 Z6.99 J730.37 F500.0
+G1 X11.38 Y-70.87 Z6.99 J736.22 F500.0
+G1 X8.57 Y-69.25 Z6.99 J739.39 F500.0
+G1 X8.57 Y-65.05 Z6.99 J743.51 F500.0
+G1 X11.69 Y-63.25 Z6.99 J747.04 F500.0
+G1 X11.69 Y-59.05 Z6.99 J751.16 F500.0
+G1 X8.57 Y-57.25 Z6.99 J754.69 F500.0
+G1 X8.57 Y-53.05 Z6.99 J758.80 F500.0
+G1 X11.69 Y-51.25 Z6.99 J762.33 F500.0
+G1 X11.69 Y-47.05 Z6.99 J766.45 F500.0
+G1 X8.57 Y-45.25 Z6.99 J769.98 F500.0
+G1 X8.57 Y-42.07 Z6.99 J773.09 F500.0
+G1 X15.15 Y-42.07 Z6.99 J779.54 F500.0
+G1 X15.15 Y-45.25 Z6.99 J782.66 F500.0
+G1 X12.03 Y-47.05 Z6.99 J786.19 F500.0
+G1 X12.03 Y-51.25 Z6.99 J790.31 F500.0
+G1 X15.15 Y-53.05 Z6.99 J793.84 F500.0
+G1 X15.15 Y-57.25 Z6.99 J797.95 F500.0
+G1 X12.03 Y-59.05 Z6.99 J801.48 F500.0
+G1 X12.03 Y-63.25 Z6.99 J805.60 F500.0
+G1 X15.15 Y-65.05 Z6.99 J809.13 F500.0
+G1 X15.15 Y-69.25 Z6.99 J813.24 F500.0
+G1 X12.35 Y-70.87 Z6.99 J816.41 F500.0
+G1 X18.31 Y-70.87 Z6.99 J822.25 F500.0
+G1 X15.50 Y-69.25 Z6.99 J825.43 F500.0
+G1 X15.50 Y-65.05 Z6.99 J829.55 F500.0
+G1 X18.62 Y-63.25 Z6.99 J833.08 F500.0
+G1 X18.62 Y-59.05 Z6.99 J837.19 F500.0
+G1 X15.50 Y-57.25 Z6.99 J840.72 F500.0
+G1 X15.50 Y-53.05 Z6.99 J844.84 F500.0
+G1 X18.62 Y-51.25 Z6.99 J848.37 F500.0
+G1 X18.62 Y-47.05 Z6.99 J852.49 F500.0
+G1 X15.50 Y-45.25 Z6.99 J856.02 F500.0
+G1 X15.50 Y-42.07 Z6.99 J859.13 F500.0
+G1 X22.08 Y-42.07 Z6.99 J865.58 F500.0
+G1 X22.08 Y-45.25 Z6.99 J868.70 F500.0
+G1 X18.96 Y-47.05 Z6.99 J872.23 F500.0
+G1 X18.96 Y-51.25 Z6.99 J876.34 F500.0
+G1 X22.08 Y-53.05 Z6.99 J879.87 F500.0
+G1 X22.08 Y-57.25 Z6.99 J883.99 F500.0
+G1 X18.96 Y-59.05 Z6.99 J887.52 F500.0
+G1 X18.96 Y-63.25 Z6.99 J891.64 F500.0
+G1 X22.08 Y-65.05 Z6.99 J895.17 F500.0
+G1 X22.08 Y-69.25 Z6.99 J899.28 F500.0
+G1 X19.28 Y-70.87 Z6.99 J902.45 F500.0
+G1 X25.23 Y-70.87 Z6.99 J908.28 F500.0
+G1 X22.43 Y-69.25 Z6.99 J911.45 F500.0
+G1 X22.43 Y-65.05 Z6.99 J915.57 F500.0
+G1 X25.54 Y-63.25 Z6.99 J919.09 F500.0
+G1 X25.54 Y-59.05 Z6.99 J923.21 F500.0
+G1 X22.43 Y-57.25 Z6.99 J926.73 F500.0
+G1 X22.43 Y-53.05 Z6.99 J930.84 F500.0
+G1 X25.54 Y-51.25 Z6.99 J934.37 F500.0
+G1 X25.54 Y-47.05 Z6.99 J938.48 F500.0
+G1 X22.43 Y-45.25 Z6.99 J942.00 F500.0
+G1 X22.43 Y-42.07 Z6.99 J945.12 F500.0
+G1 X29.01 Y-42.07 Z6.99 J951.57 F500.0
+G1 X29.01 Y-45.25 Z6.99 J954.68 F500.0
+G1 X25.89 Y-47.05 Z6.99 J958.21 F500.0
+G1 X25.89 Y-51.25 Z6.99 J962.33 F500.0
+G1 X29.01 Y-53.05 Z6.99 J965.86 F500.0
+G1 X29.01 Y-57.25 Z6.99 J969.98 F500.0
+G1 X25.89 Y-59.05 Z6.99 J973.51 F500.0
+G1 X25.89 Y-63.25 Z6.99 J977.62 F500.0
+G1 X29.01 Y-65.05 Z6.99 J981.15 F500.0
+G1 X29.01 Y-69.25 Z6.99 J985.27 F500.0
+G1 X26.20 Y-70.87 Z6.99 J988.45 F500.0
+G1 X32.16 Y-70.87 Z6.99 J994.29 F500.0
+G1 X29.36 Y-69.25 Z6.99 J997.46 F500.0
+G1 X29.36 Y-65.05 Z6.99 J1001.57 F500.0
+G1 X32.47 Y-63.25 Z6.99 J1005.10 F500.0
+G1 X32.47 Y-59.05 Z6.99 J1009.21 F500.0
+G1 X29.36 Y-57.25 Z6.99 J1012.73 F500.0
+G1 X29.36 Y-53.05 Z6.99 J1016.85 F500.0
+G1 X32.47 Y-51.25 Z6.99 J1020.37 F500.0
+G1 X32.47 Y-47.05 Z6.99 J1024.49 F500.0
+G1 X29.36 Y-45.25 Z6.99 J1028.01 F500.0
+G1 X29.36 Y-42.07 Z6.99 J1031.12 F500.0
+G1 X35.94 Y-42.07 Z6.99 J1037.57 F500.0
+G1 X35.94 Y-45.25 Z6.99 J1040.69 F500.0
+G1 X32.82 Y-47.05 Z6.99 J1044.22 F500.0
+G1 X32.82 Y-51.25 Z6.99 J1048.33 F500.0
+G1 X35.94 Y-53.05 Z6.99 J1051.86 F500.0
+G1 X35.94 Y-57.25 Z6.99 J1055.98 F500.0
+G1 X32.82 Y-59.05 Z6.99 J1059.51 F500.0
+G1 X32.82 Y-63.25 Z6.99 J1063.63 F500.0
+G1 X35.94 Y-65.05 Z6.99 J1067.16 F500.0
+G1 X35.94 Y-69.25 Z6.99 J1071.27 F500.0
+G1 X33.13 Y-70.87 Z6.99 J1074.45 F500.0
+G1 X37.44 Y-69.92 Z6.99 J1078.78 F500.0
+G1 X36.28 Y-69.25 Z6.99 J1080.09 F500.0
+G1 X36.28 Y-65.05 Z6.99 J1084.21 F500.0
+G1 X37.44 Y-64.38 Z6.99 J1085.52 F500.0
+G1 X37.44 Y-57.92 Z6.99 J1091.85 F500.0
+G1 X36.28 Y-57.25 Z6.99 J1093.16 F500.0
+G1 X36.28 Y-53.05 Z6.99 J1097.28 F500.0
+G1 X37.44 Y-52.38 Z6.99 J1098.59 F500.0
+G1 X37.44 Y-45.92 Z6.99 J1104.92 F500.0
+G1 X36.28 Y-45.25 Z6.99 J1106.23 F500.0
+G1 X36.28 Y-42.07 Z6.99 J1109.35 F500.0
+
+T1
+G1 X4.79 Y-70.32 Z7.99 J0.00 F500.0
+G1 X36.89 Y-70.32 Z7.99 J31.46 F500.0
+G1 X36.89 Y-52.52 Z7.99 J48.90 F500.0
+G1 X36.89 Y-42.62 Z7.99 J58.60 F500.0
+G1 X1.29 Y-42.62 Z7.99 J93.49 F500.0
+G1 X-30.81 Y-42.62 Z7.99 J124.95 F500.0
+G1 X-30.81 Y-60.42 Z7.99 J142.39 F500.0
+G1 X-30.81 Y-70.32 Z7.99 J152.10 F500.0
+G1 X4.79 Y-70.32 Z7.99 J186.98 F500.0
+G1 X4.79 Y-70.32 Z7.99 J186.98 F500.0
+G1 X-30.81 Y-63.79 Z7.99 J222.45 F500.0
+G1 X-29.88 Y-63.25 Z7.99 J223.51 F500.0
+G1 X-29.88 Y-59.05 Z7.99 J227.62 F500.0
+G1 X-30.81 Y-58.52 Z7.99 J228.67 F500.0
+G1 X-30.81 Y-51.79 Z7.99 J235.27 F500.0
+G1 X-29.88 Y-51.25 Z7.99 J236.32 F500.0
+G1 X-29.88 Y-47.05 Z7.99 J240.44 F500.0
+G1 X-30.81 Y-46.52 Z7.99 J241.49 F500.0
+G1 X-26.42 Y-42.62 Z7.99 J247.24 F500.0
+G1 X-26.42 Y-45.25 Z7.99 J249.82 F500.0
+G1 X-29.53 Y-47.05 Z7.99 J253.34 F500.0
+G1 X-29.53 Y-51.25 Z7.99 J257.46 F500.0
+G1 X-26.42 Y-53.05 Z7.99 J260.98 F500.0
+G1 X-26.42 Y-57.25 Z7.99 J265.09 F500.0
+G1 X-29.53 Y-59.05 Z7.99 J268.62 F500.0
+G1 X-29.53 Y-63.25 Z7.99 J272.73 F500.0
+G1 X-26.42 Y-65.05 Z7.99 J276.25 F500.0
+G1 X-26.42 Y-69.25 Z7.99 J280.37 F500.0
+G1 X-28.26 Y-70.32 Z7.99 J282.46 F500.0
+G1 X-24.22 Y-70.32 Z7.99 J286.41 F500.0
+G1 X-26.07 Y-69.25 Z7.99 J288.51 F500.0
+G1 X-26.07 Y-65.05 Z7.99 J292.62 F500.0
+G1 X-22.95 Y-63.25 Z7.99 J296.15 F500.0
+G1 X-22.95 Y-59.05 Z7.99 J300.27 F500.0
+G1 X-26.07 Y-57.25 Z7.99 J303.80 F500.0
+G1 X-26.07 Y-53.05 Z7.99 J307.92 F500.0
+G1 X-22.95 Y-51.25 Z7.99 J311.45 F500.0
+G1 X-22.95 Y-47.05 Z7.99 J315.56 F500.0
+G1 X-26.07 Y-45.25 Z7.99 J319.09 F500.0
+G1 X-26.07 Y-42.62 Z7.99 J321.67 F500.0
+G1 X-19.49 Y-42.62 Z7.99 J328.12 F500.0
+G1 X-19.49 Y-45.25 Z7.99 J330.70 F500.0
+G1 X-22.61 Y-47.05 Z7.99 J334.23 F500.0
+G1 X-22.61 Y-51.25 Z7.99 J338.34 F500.0
+G1 X-19.49 Y-53.05 Z7.99 J341.87 F500.0
+G1 X-19.49 Y-57.25 Z7.99 J345.99 F500.0
+G1 X-22.61 Y-59.05 Z7.99 J349.52 F500.0
+G1 X-22.61 Y-63.25 Z7.99 J353.63 F500.0
+G1 X-19.49 Y-65.05 Z7.99 J357.16 F500.0
+G1 X-19.49 Y-69.25 Z7.99 J361.28 F500.0
+G1 X-21.34 Y-70.32 Z7.99 J363.37 F500.0
+G1 X-17.29 Y-70.32 Z7.99 J367.34 F500.0
+G1 X-19.14 Y-69.25 Z7.99 J369.44 F500.0
+G1 X-19.14 Y-65.05 Z7.99 J373.55 F500.0
+G1 X-16.02 Y-63.25 Z7.99 J377.08 F500.0
+G1 X-16.02 Y-59.05 Z7.99 J381.20 F500.0
+G1 X-19.14 Y-57.25 Z7.99 J384.73 F500.0
+G1 X-19.14 Y-53.05 Z7.99 J388.85 F500.0
+G1 X-16.02 Y-51.25 Z7.99 J392.38 F500.0
+G1 X-16.02 Y-47.05 Z7.99 J396.49 F500.0
+G1 X-19.14 Y-45.25 Z7.99 J400.02 F500.0
+G1 X-19.14 Y-42.62 Z7.99 J402.60 F500.0
+G1 X-12.56 Y-42.62 Z7.99 J409.05 F500.0
+G1 X-12.56 Y-45.25 Z7.99 J411.62 F500.0
+G1 X-15.68 Y-47.05 Z7.99 J415.15 F500.0
+G1 X-15.68 Y-51.25 Z7.99 J419.27 F500.0
+G1 X-12.56 Y-53.05 Z7.99 J422.80 F500.0
+G1 X-12.56 Y-57.25 Z7.99 J426.92 F500.0
+G1 X-15.68 Y-59.05 Z7.99 J430.45 F500.0
+G1 X-15.68 Y-63.25 Z7.99 J434.56 F500.0
+G1 X-12.56 Y-65.05 Z7.99 J438.09 F500.0
+G1 X-12.56 Y-69.25 Z7.99 J442.21 F500.0
+G1 X-14.41 Y-70.32 Z7.99 J444.30 F500.0
+G1 X-10.37 Y-70.32 Z7.99 J448.26 F500.0
+G1 X-12.21 Y-69.25 Z7.99 J450.35 F500.0
+G1 X-12.21 Y-65.05 Z7.99 J454.46 F500.0
+G1 X-9.10 Y-63.25 Z7.99 J457.99 F500.0
+G1 X-9.10 Y-59.05 Z7.99 J462.10 F500.0
+G1 X-12.21 Y-57.25 Z7.99 J465.62 F500.0
+G1 X-12.21 Y-53.05 Z7.99 J469.74 F500.0
+G1 X-9.10 Y-51.25 Z7.99 J473.26 F500.0
+G1 X-9.10 Y-47.05 Z7.99 J477.38 F500.0
+G1 X-12.21 Y-45.25 Z7.99 J480.90 F500.0
+G1 X-12.21 Y-42.62 Z7.99 J483.48 F500.0
+G1 X-5.63 Y-42.62 Z7.99 J489.92 F500.0
+G1 X-5.63 Y-45.25 Z7.99 J492.50 F500.0
+G1 X-8.75 Y-47.05 Z7.99 J496.03 F500.0
+G1 X-8.75 Y-51.25 Z7.99 J500.15 F500.0
+G1 X-5.63 Y-53.05 Z7.99 J503.68 F500.0
+G1 X-5.63 Y-57.25 Z7.99 J507.79 F500.0
+G1 X-8.75 Y-59.05 Z7.99 J511.32 F500.0
+G1 X-8.75 Y-63.25 Z7.99 J515.44 F500.0
+G1 X-5.63 Y-65.05 Z7.99 J518.97 F500.0
+G1 X-5.63 Y-69.25 Z7.99 J523.08 F500.0
+G1 X-7.48 Y-70.32 Z7.99 J525.18 F500.0
+G1 X-3.44 Y-70.32 Z7.99 J529.14 F500.0
+G1 X-5.28 Y-69.25 Z7.99 J531.22 F500.0
+G1 X-5.28 Y-65.05 Z7.99 J535.34 F500.0
+G1 X-2.17 Y-63.25 Z7.99 J538.86 F500.0
+G1 X-2.17 Y-59.05 Z7.99 J542.98 F500.0
+G1 X-5.28 Y-57.25 Z7.99 J546.50 F500.0
+G1 X-5.28 Y-53.05 Z7.99 J550.62 F500.0
+G1 X-2.17 Y-51.25 Z7.99 J554.14 F500.0
+G1 X-2.17 Y-47.05 Z7.99 J558.25 F500.0
+G1 X-5.28 Y-45.25 Z7.99 J561.77 F500.0
+G1 X-5.28 Y-42.62 Z7.99 J564.35 F500.0
+G1 X1.30 Y-42.62 Z7.99 J570.80 F500.0
+G1 X1.30 Y-45.25 Z7.99 J573.38 F500.0
+G1 X-1.82 Y-47.05 Z7.99 J576.91 F500.0
+G1 X-1.82 Y-51.25 Z7.99 J581.02 F500.0
+G1 X1.30 Y-53.05 Z7.99 J584.55 F500.0
+G1 X1.30 Y-57.25 Z7.99 J588.67 F500.0
+G1 X-1.82 Y-59.05 Z7.99 J592.20 F500.0
+G1 X-1.82 Y-63.25 Z7.99 J596.32 F500.0
+G1 X1.30 Y-65.05 Z7.99 J599.85 F500.0
+G1 X1.30 Y-69.25 Z7.99 J603.96 F500.0
+G1 X-0.55 Y-70.32 Z7.99 J606.06 F500.0
+G1 X3.49 Y-70.32 Z7.99 J610.01 F500.0
+G1 X1.64 Y-69.25 Z7.99 J612.11 F500.0
+G1 X1.64 Y-65.05 Z7.99 J616.23 F500.0
+G1 X4.76 Y-63.25 Z7.99 J619.76 F500.0
+G1 X4.76 Y-59.05 Z7.99 J623.87 F500.0
+G1 X1.64 Y-57.25 Z7.99 J627.40 F500.0
+G1 X1.64 Y-53.05 Z7.99 J631.52 F500.0
+G1 X4.76 Y-51.25 Z7.99 J635.05 F500.0
+G1 X4.76 Y-47.05 Z7.99 J639.16 F500.0
+G1 X1.64 Y-45.25 Z7.99 J642.69 F500.0
+G1 X1.64 Y-42.62 Z7.99 J645.27 F500.0
+G1 X8.22 Y-42.62 Z7.99 J651.72 F500.0
+G1 X8.22 Y-45.25 Z7.99 J654.30 F500.0
+G1 X5.11 Y-47.05 Z7.99 J657.82 F500.0
+G1 X5.11 Y-51.25 Z7.99 J661.93 F500.0
+G1 X8.22 Y-53.05 Z7.99 J665.46 F500.0
+G1 X8.22 Y-57.25 Z7.99 J669.57 F500.0
+G1 X5.11 Y-59.05 Z7.99 J673.09 F500.0
+G1 X5.11 Y-63.25 Z7.99 J677.21 F500.0
+G1 X8.22 Y-65.05 Z7.99 J680.73 F500.0
+G1 X8.22 Y-69.25 Z7.99 J684.85 F500.0
+G1 X6.38 Y-70.32 Z7.99 J686.93 F500.0
+G1 X10.42 Y-70.32 Z7.99 J690.89 F500.0
+G1 X8.57 Y-69.25 Z7.99 J692.99 F500.0
+G1 X8.57 Y-65.05 Z7.99 J697.10 F500.0
+G1 X11.69 Y-63.25 Z7.99 J700.63 F500.0
+G1 X11.69 Y-59.05 Z7.99 J704.75 F500.0
+G1 X8.57 Y-57.25 Z7.99 J708.28 F500.0
+G1 X8.57 Y-53.05 Z7.99 J712.39 F500.0
+G1 X11.69 Y-51.25 Z7.99 J715.92 F500.0
+G1 X11.69 Y-47.05 Z7.99 J720.04 F500.0
+G1 X8.57 Y-45.25 Z7.99 J723.57 F500.0
+G1 X8.57 Y-42.62 Z7.99 J726.15 F500.0
+G1 X15.15 Y-42.62 Z7.99 J732.60 F500.0
+G1 X15.15 Y-45.25 Z7.99 J735.17 F500.0
+G1 X12.03 Y-47.05 Z7.99 J738.70 F500.0
+G1 X12.03 Y-51.25 Z7.99 J742.82 F500.0
+G1 X15.15 Y-53.05 Z7.99 J746.35 F500.0
+G1 X15.15 Y-57.25 Z7.99 J750.46 F500.0
+G1 X12.03 Y-59.05 Z7.99 J753.99 F500.0
+G1 X12.03 Y-63.25 Z7.99 J758.11 F500.0
+G1 X15.15 Y-65.05 Z7.99 J761.64 F500.0
+G1 X15.15 Y-69.25 Z7.99 J765.76 F500.0
+G1 X13.31 Y-70.32 Z7.99 J767.84 F500.0
+G1 X17.35 Y-70.32 Z7.99 J771.80 F500.0
+G1 X15.50 Y-69.25 Z7.99 J773.90 F500.0
+G1 X15.50 Y-65.05 Z7.99 J778.01 F500.0
+G1 X18.62 Y-63.25 Z7.99 J781.54 F500.0
+G1 X18.62 Y-59.05 Z7.99 J785.66 F500.0
+G1 X15.50 Y-57.25 Z7.99 J789.19 F500.0
+G1 X15.50 Y-53.05 Z7.99 J793.30 F500.0
+G1 X18.62 Y-51.25 Z7.99 J796.83 F500.0
+G1 X18.62 Y-47.05 Z7.99 J800.95 F500.0
+G1 X15.50 Y-45.25 Z7.99 J804.48 F500.0
+G1 X15.50 Y-42.62 Z7.99 J807.06 F500.0
+G1 X22.08 Y-42.62 Z7.99 J813.51 F500.0
+G1 X22.08 Y-45.25 Z7.99 J816.08 F500.0
+G1 X18.96 Y-47.05 Z7.99 J819.61 F500.0
+G1 X18.96 Y-51.25 Z7.99 J823.73 F500.0
+G1 X22.08 Y-53.05 Z7.99 J827.26 F500.0
+G1 X22.08 Y-57.25 Z7.99 J831.38 F500.0
+G1 X18.96 Y-59.05 Z7.99 J834.91 F500.0
+G1 X18.96 Y-63.25 Z7.99 J839.02 F500.0
+G1 X22.08 Y-65.05 Z7.99 J842.55 F500.0
+G1 X22.08 Y-69.25 Z7.99 J846.67 F500.0
+G1 X20.24 Y-70.32 Z7.99 J848.75 F500.0
+G1 X24.27 Y-70.32 Z7.99 J852.70 F500.0
+G1 X22.43 Y-69.25 Z7.99 J854.79 F500.0
+G1 X22.43 Y-65.05 Z7.99 J858.90 F500.0
+G1 X25.54 Y-63.25 Z7.99 J862.43 F500.0
+G1 X25.54 Y-59.05 Z7.99 J866.54 F500.0
+G1 X22.43 Y-57.25 Z7.99 J870.06 F500.0
+G1 X22.43 Y-53.05 Z7.99 J874.18 F500.0
+G1 X25.54 Y-51.25 Z7.99 J877.70 F500.0
+G1 X25.54 Y-47.05 Z7.99 J881.82 F500.0
+G1 X22.43 Y-45.25 Z7.99 J885.34 F500.0
+G1 X22.43 Y-42.62 Z7.99 J887.92 F500.0
+G1 X29.01 Y-42.62 Z7.99 J894.36 F500.0
+G1 X29.01 Y-45.25 Z7.99 J896.94 F500.0
+G1 X25.89 Y-47.05 Z7.99 J900.47 F500.0
+G1 X25.89 Y-51.25 Z7.99 J904.59 F500.0
+G1 X29.01 Y-53.05 Z7.99 J908.12 F500.0
+G1 X29.01 Y-57.25 Z7.99 J912.23 F500.0
+G1 X25.89 Y-59.05 Z7.99 J915.76 F500.0
+G1 X25.89 Y-63.25 Z7.99 J919.88 F500.0
+G1 X29.01 Y-65.05 Z7.99 J923.41 F500.0
+G1 X29.01 Y-69.25 Z7.99 J927.53 F500.0
+G1 X27.16 Y-70.32 Z7.99 J929.62 F500.0
+G1 X31.20 Y-70.32 Z7.99 J933.58 F500.0
+G1 X29.36 Y-69.25 Z7.99 J935.66 F500.0
+G1 X29.36 Y-65.05 Z7.99 J939.78 F500.0
+G1 X32.47 Y-63.25 Z7.99 J943.30 F500.0
+G1 X32.47 Y-59.05 Z7.99 J947.42 F500.0
+G1 X29.36 Y-57.25 Z7.99 J950.94 F500.0
+G1 X29.36 Y-53.05 Z7.99 J955.06 F500.0
+G1 X32.47 Y-51.25 Z7.99 J958.58 F500.0
+G1 X32.47 Y-47.05 Z7.99 J962.69 F500.0
+G1 X29.36 Y-45.25 Z7.99 J966.21 F500.0
+G1 X29.36 Y-42.62 Z7.99 J968.79 F500.0
+G1 X35.94 Y-42.62 Z7.99 J975.24 F500.0
+G1 X35.94 Y-45.25 Z7.99 J977.82 F500.0
+G1 X32.82 Y-47.05 Z7.99 J981.35 F500.0
+G1 X32.82 Y-51.25 Z7.99 J985.46 F500.0
+G1 X35.94 Y-53.05 Z7.99 J988.99 F500.0
+G1 X35.94 Y-57.25 Z7.99 J993.11 F500.0
+G1 X32.82 Y-59.05 Z7.99 J996.64 F500.0
+G1 X32.82 Y-63.25 Z7.99 J1000.76 F500.0
+G1 X35.94 Y-65.05 Z7.99 J1004.29 F500.0
+G1 X35.94 Y-69.25 Z7.99 J1008.40 F500.0
+G1 X34.09 Y-70.32 Z7.99 J1010.50 F500.0
+G1 X36.89 Y-69.60 Z7.99 J1013.33 F500.0
+G1 X36.28 Y-69.25 Z7.99 J1014.02 F500.0
+G1 X36.28 Y-65.05 Z7.99 J1018.13 F500.0
+G1 X36.89 Y-64.70 Z7.99 J1018.82 F500.0
+G1 X36.89 Y-57.60 Z7.99 J1025.78 F500.0
+G1 X36.28 Y-57.25 Z7.99 J1026.47 F500.0
+G1 X36.28 Y-53.05 Z7.99 J1030.59 F500.0
+G1 X36.89 Y-52.70 Z7.99 J1031.28 F500.0
+G1 X36.89 Y-45.60 Z7.99 J1038.23 F500.0
+G1 X36.28 Y-45.25 Z7.99 J1038.92 F500.0
+G1 X36.28 Y-42.62 Z7.99 J1041.50 F500.0
+
+T1
+G1 X1.35 Y-69.76 Z8.99 J0.00 F500.0
+G1 X36.33 Y-69.76 Z8.99 J34.28 F500.0
+G1 X36.33 Y-53.96 Z8.99 J49.76 F500.0
+G1 X36.33 Y-43.18 Z8.99 J60.33 F500.0
+G1 X4.73 Y-43.18 Z8.99 J91.30 F500.0
+G1 X-30.25 Y-43.18 Z8.99 J125.58 F500.0
+G1 X-30.25 Y-58.98 Z8.99 J141.06 F500.0
+G1 X-30.25 Y-69.76 Z8.99 J151.63 F500.0
+G1 X1.35 Y-69.76 Z8.99 J182.59 F500.0
+G1 X1.35 Y-69.76 Z8.99 J182.59 F500.0
+G1 X-30.25 Y-63.47 Z8.99 J214.17 F500.0
+G1 X-29.88 Y-63.25 Z8.99 J214.59 F500.0
+G1 X-29.88 Y-59.05 Z8.99 J218.71 F500.0
+G1 X-30.25 Y-58.84 Z8.99 J219.12 F500.0
+G1 X-30.25 Y-51.47 Z8.99 J226.35 F500.0
+G1 X-29.88 Y-51.25 Z8.99 J226.77 F500.0
+G1 X-29.88 Y-47.05 Z8.99 J230.88 F500.0
+G1 X-30.25 Y-46.84 Z8.99 J231.30 F500.0
+G1 X-26.42 Y-43.18 Z8.99 J236.49 F500.0
+G1 X-26.42 Y-45.25 Z8.99 J238.52 F500.0
+G1 X-29.53 Y-47.05 Z8.99 J242.04 F500.0
+G1 X-29.53 Y-51.25 Z8.99 J246.16 F500.0
+G1 X-26.42 Y-53.05 Z8.99 J249.68 F500.0
+G1 X-26.42 Y-57.25 Z8.99 J253.80 F500.0
+G1 X-29.53 Y-59.05 Z8.99 J257.32 F500.0
+G1 X-29.53 Y-63.25 Z8.99 J261.43 F500.0
+G1 X-26.42 Y-65.05 Z8.99 J264.96 F500.0
+G1 X-26.42 Y-69.25 Z8.99 J269.07 F500.0
+G1 X-27.30 Y-69.76 Z8.99 J270.07 F500.0
+G1 X-25.18 Y-69.76 Z8.99 J272.15 F500.0
+G1 X-26.07 Y-69.25 Z8.99 J273.15 F500.0
+G1 X-26.07 Y-65.05 Z8.99 J277.27 F500.0
+G1 X-22.95 Y-63.25 Z8.99 J280.80 F500.0
+G1 X-22.95 Y-59.05 Z8.99 J284.91 F500.0
+G1 X-26.07 Y-57.25 Z8.99 J288.44 F500.0
+G1 X-26.07 Y-53.05 Z8.99 J292.56 F500.0
+G1 X-22.95 Y-51.25 Z8.99 J296.09 F500.0
+G1 X-22.95 Y-47.05 Z8.99 J300.20 F500.0
+G1 X-26.07 Y-45.25 Z8.99 J303.73 F500.0
+G1 X-26.07 Y-43.18 Z8.99 J305.76 F500.0
+G1 X-19.49 Y-43.18 Z8.99 J312.21 F500.0
+G1 X-19.49 Y-45.25 Z8.99 J314.24 F500.0
+G1 X-22.61 Y-47.05 Z8.99 J317.77 F500.0
+G1 X-22.61 Y-51.25 Z8.99 J321.89 F500.0
+G1 X-19.49 Y-53.05 Z8.99 J325.42 F500.0
+G1 X-19.49 Y-57.25 Z8.99 J329.53 F500.0
+G1 X-22.61 Y-59.05 Z8.99 J333.06 F500.0
+G1 X-22.61 Y-63.25 Z8.99 J337.18 F500.0
+G1 X-19.49 Y-65.05 Z8.99 J340.71 F500.0
+G1 X-19.49 Y-69.25 Z8.99 J344.82 F500.0
+G1 X-20.37 Y-69.76 Z8.99 J345.82 F500.0
+G1 X-18.25 Y-69.76 Z8.99 J347.90 F500.0
+G1 X-19.14 Y-69.25 Z8.99 J348.90 F500.0
+G1 X-19.14 Y-65.05 Z8.99 J353.02 F500.0
+G1 X-16.02 Y-63.25 Z8.99 J356.55 F500.0
+G1 X-16.02 Y-59.05 Z8.99 J360.67 F500.0
+G1 X-19.14 Y-57.25 Z8.99 J364.20 F500.0
+G1 X-19.14 Y-53.05 Z8.99 J368.31 F500.0
+G1 X-16.02 Y-51.25 Z8.99 J371.84 F500.0
+G1 X-16.02 Y-47.05 Z8.99 J375.96 F500.0
+G1 X-19.14 Y-45.25 Z8.99 J379.49 F500.0
+G1 X-19.14 Y-43.18 Z8.99 J381.52 F500.0
+G1 X-12.56 Y-43.18 Z8.99 J387.96 F500.0
+G1 X-12.56 Y-45.25 Z8.99 J389.99 F500.0
+G1 X-15.68 Y-47.05 Z8.99 J393.52 F500.0
+G1 X-15.68 Y-51.25 Z8.99 J397.64 F500.0
+G1 X-12.56 Y-53.05 Z8.99 J401.17 F500.0
+G1 X-12.56 Y-57.25 Z8.99 J405.29 F500.0
+G1 X-15.68 Y-59.05 Z8.99 J408.82 F500.0
+G1 X-15.68 Y-63.25 Z8.99 J412.93 F500.0
+G1 X-12.56 Y-65.05 Z8.99 J416.46 F500.0
+G1 X-12.56 Y-69.25 Z8.99 J420.58 F500.0
+G1 X-13.45 Y-69.76 Z8.99 J421.58 F500.0
+G1 X-11.33 Y-69.76 Z8.99 J423.66 F500.0
+G1 X-12.21 Y-69.25 Z8.99 J424.66 F500.0
+G1 X-12.21 Y-65.05 Z8.99 J428.77 F500.0
+G1 X-9.10 Y-63.25 Z8.99 J432.29 F500.0
+G1 X-9.10 Y-59.05 Z8.99 J436.41 F500.0
+G1 X-12.21 Y-57.25 Z8.99 J439.93 F500.0
+G1 X-12.21 Y-53.05 Z8.99 J444.05 F500.0
+G1 X-9.10 Y-51.25 Z8.99 J447.57 F500.0
+G1 X-9.10 Y-47.05 Z8.99 J451.69 F500.0
+G1 X-12.21 Y-45.25 Z8.99 J455.21 F500.0
+G1 X-12.21 Y-43.18 Z8.99 J457.24 F500.0
+G1 X-5.63 Y-43.18 Z8.99 J463.68 F500.0
+G1 X-5.63 Y-45.25 Z8.99 J465.71 F500.0
+G1 X-8.75 Y-47.05 Z8.99 J469.24 F500.0
+G1 X-8.75 Y-51.25 Z8.99 J473.36 F500.0
+G1 X-5.63 Y-53.05 Z8.99 J476.89 F500.0
+G1 X-5.63 Y-57.25 Z8.99 J481.00 F500.0
+G1 X-8.75 Y-59.05 Z8.99 J484.53 F500.0
+G1 X-8.75 Y-63.25 Z8.99 J488.65 F500.0
+G1 X-5.63 Y-65.05 Z8.99 J492.18 F500.0
+G1 X-5.63 Y-69.25 Z8.99 J496.30 F500.0
+G1 X-6.52 Y-69.76 Z8.99 J497.30 F500.0
+G1 X-4.40 Y-69.76 Z8.99 J499.38 F500.0
+G1 X-5.28 Y-69.25 Z8.99 J500.38 F500.0
+G1 X-5.28 Y-65.05 Z8.99 J504.49 F500.0
+G1 X-2.17 Y-63.25 Z8.99 J508.01 F500.0
+G1 X-2.17 Y-59.05 Z8.99 J512.13 F500.0
+G1 X-5.28 Y-57.25 Z8.99 J515.65 F500.0
+G1 X-5.28 Y-53.05 Z8.99 J519.77 F500.0
+G1 X-2.17 Y-51.25 Z8.99 J523.29 F500.0
+G1 X-2.17 Y-47.05 Z8.99 J527.40 F500.0
+G1 X-5.28 Y-45.25 Z8.99 J530.93 F500.0
+G1 X-5.28 Y-43.18 Z8.99 J532.95 F500.0
+G1 X1.30 Y-43.18 Z8.99 J539.40 F500.0
+G1 X1.30 Y-45.25 Z8.99 J541.43 F500.0
+G1 X-1.82 Y-47.05 Z8.99 J544.96 F500.0
+G1 X-1.82 Y-51.25 Z8.99 J549.08 F500.0
+G1 X1.30 Y-53.05 Z8.99 J552.61 F500.0
+G1 X1.30 Y-57.25 Z8.99 J556.72 F500.0
+G1 X-1.82 Y-59.05 Z8.99 J560.25 F500.0
+G1 X-1.82 Y-63.25 Z8.99 J564.37 F500.0
+G1 X1.30 Y-65.05 Z8.99 J567.90 F500.0
+G1 X1.30 Y-69.25 Z8.99 J572.02 F500.0
+G1 X0.41 Y-69.76 Z8.99 J573.02 F500.0
+G1 X2.53 Y-69.76 Z8.99 J575.10 F500.0
+G1 X1.64 Y-69.25 Z8.99 J576.10 F500.0
+G1 X1.64 Y-65.05 Z8.99 J580.22 F500.0
+G1 X4.76 Y-63.25 Z8.99 J583.75 F500.0
+G1 X4.76 Y-59.05 Z8.99 J587.87 F500.0
+G1 X1.64 Y-57.25 Z8.99 J591.40 F500.0
+G1 X1.64 Y-53.05 Z8.99 J595.51 F500.0
+G1 X4.76 Y-51.25 Z8.99 J599.04 F500.0
+G1 X4.76 Y-47.05 Z8.99 J603.16 F500.0
+G1 X1.64 Y-45.25 Z8.99 J606.69 F500.0
+G1 X1.64 Y-43.18 Z8.99 J608.72 F500.0
+G1 X8.22 Y-43.18 Z8.99 J615.16 F500.0
+G1 X8.22 Y-45.25 Z8.99 J617.19 F500.0
+G1 X5.11 Y-47.05 Z8.99 J620.71 F500.0
+G1 X5.11 Y-51.25 Z8.99 J624.83 F500.0
+G1 X8.22 Y-53.05 Z8.99 J628.35 F500.0
+G1 X8.22 Y-57.25 Z8.99 J632.47 F500.0
+G1 X5.11 Y-59.05 Z8.99 J635.99 F500.0
+G1 X5.11 Y-63.25 Z8.99 J640.11 F500.0
+G1 X8.22 Y-65.05 Z8.99 J643.63 F500.0
+G1 X8.22 Y-69.25 Z8.99 J647.74 F500.0
+G1 X7.34 Y-69.76 Z8.99 J648.74 F500.0
+G1 X9.46 Y-69.76 Z8.99 J650.82 F500.0
+G1 X8.57 Y-69.25 Z8.99 J651.82 F500.0
+G1 X8.57 Y-65.05 Z8.99 J655.94 F500.0
+G1 X11.69 Y-63.25 Z8.99 J659.47 F500.0
+G1 X11.69 Y-59.05 Z8.99 J663.58 F500.0
+G1 X8.57 Y-57.25 Z8.99 J667.11 F500.0
+G1 X8.57 Y-53.05 Z8.99 J671.23 F500.0
+G1 X11.69 Y-51.25 Z8.99 J674.76 F500.0
+G1 X11.69 Y-47.05 Z8.99 J678.88 F500.0
+G1 X8.57 Y-45.25 Z8.99 J682.41 F500.0
+G1 X8.57 Y-43.18 Z8.99 J684.43 F500.0
+G1 X15.15 Y-43.18 Z8.99 J690.88 F500.0
+G1 X15.15 Y-45.25 Z8.99 J692.91 F500.0
+G1 X12.03 Y-47.05 Z8.99 J696.44 F500.0
+G1 X12.03 Y-51.25 Z8.99 J700.56 F500.0
+G1 X15.15 Y-53.05 Z8.99 J704.09 F500.0
+G1 X15.15 Y-57.25 Z8.99 J708.20 F500.0
+G1 X12.03 Y-59.05 Z8.99 J711.73 F500.0
+G1 X12.03 Y-63.25 Z8.99 J715.85 F500.0
+G1 X15.15 Y-65.05 Z8.99 J719.38 F500.0
+G1 X15.15 Y-69.25 Z8.99 J723.50 F500.0
+G1 X14.27 Y-69.76 Z8.99 J724.49 F500.0
+G1 X16.39 Y-69.76 Z8.99 J726.57 F500.0
+G1 X15.50 Y-69.25 Z8.99 J727.58 F500.0
+G1 X15.50 Y-65.05 Z8.99 J731.69 F500.0
+G1 X18.62 Y-63.25 Z8.99 J735.22 F500.0
+G1 X18.62 Y-59.05 Z8.99 J739.34 F500.0
+G1 X15.50 Y-57.25 Z8.99 J742.87 F500.0
+G1 X15.50 Y-53.05 Z8.99 J746.98 F500.0
+G1 X18.62 Y-51.25 Z8.99 J750.51 F500.0
+G1 X18.62 Y-47.05 Z8.99 J754.63 F500.0
+G1 X15.50 Y-45.25 Z8.99 J758.16 F500.0
+G1 X15.50 Y-43.18 Z8.99 J760.19 F500.0
+G1 X22.08 Y-43.18 Z8.99 J766.64 F500.0
+G1 X22.08 Y-45.25 Z8.99 J768.66 F500.0
+G1 X18.96 Y-47.05 Z8.99 J772.19 F500.0
+G1 X18.96 Y-51.25 Z8.99 J776.31 F500.0
+G1 X22.08 Y-53.05 Z8.99 J779.84 F500.0
+G1 X22.08 Y-57.25 Z8.99 J783.96 F500.0
+G1 X18.96 Y-59.05 Z8.99 J787.49 F500.0
+G1 X18.96 Y-63.25 Z8.99 J791.60 F500.0
+G1 X22.08 Y-65.05 Z8.99 J795.13 F500.0
+G1 X22.08 Y-69.25 Z8.99 J799.25 F500.0
+G1 X21.20 Y-69.76 Z8.99 J800.25 F500.0
+G1 X23.31 Y-69.76 Z8.99 J802.31 F500.0
+G1 X22.43 Y-69.25 Z8.99 J803.31 F500.0
+G1 X22.43 Y-65.05 Z8.99 J807.43 F500.0
+G1 X25.54 Y-63.25 Z8.99 J810.95 F500.0
+G1 X25.54 Y-59.05 Z8.99 J815.06 F500.0
+G1 X22.43 Y-57.25 Z8.99 J818.58 F500.0
+G1 X22.43 Y-53.05 Z8.99 J822.70 F500.0
+G1 X25.54 Y-51.25 Z8.99 J826.22 F500.0
+G1 X25.54 Y-47.05 Z8.99 J830.34 F500.0
+G1 X22.43 Y-45.25 Z8.99 J833.86 F500.0
+G1 X22.43 Y-43.18 Z8.99 J835.89 F500.0
+G1 X29.01 Y-43.18 Z8.99 J842.34 F500.0
+G1 X29.01 Y-45.25 Z8.99 J844.37 F500.0
+G1 X25.89 Y-47.05 Z8.99 J847.90 F500.0
+G1 X25.89 Y-51.25 Z8.99 J852.01 F500.0
+G1 X29.01 Y-53.05 Z8.99 J855.54 F500.0
+G1 X29.01 Y-57.25 Z8.99 J859.66 F500.0
+G1 X25.89 Y-59.05 Z8.99 J863.19 F500.0
+G1 X25.89 Y-63.25 Z8.99 J867.30 F500.0
+G1 X29.01 Y-65.05 Z8.99 J870.83 F500.0
+G1 X29.01 Y-69.25 Z8.99 J874.95 F500.0
+G1 X28.12 Y-69.76 Z8.99 J875.95 F500.0
+G1 X30.24 Y-69.76 Z8.99 J878.03 F500.0
+G1 X29.36 Y-69.25 Z8.99 J879.03 F500.0
+G1 X29.36 Y-65.05 Z8.99 J883.14 F500.0
+G1 X32.47 Y-63.25 Z8.99 J886.67 F500.0
+G1 X32.47 Y-59.05 Z8.99 J890.78 F500.0
+G1 X29.36 Y-57.25 Z8.99 J894.30 F500.0
+G1 X29.36 Y-53.05 Z8.99 J898.42 F500.0
+G1 X32.47 Y-51.25 Z8.99 J901.94 F500.0
+G1 X32.47 Y-47.05 Z8.99 J906.06 F500.0
+G1 X29.36 Y-45.25 Z8.99 J909.58 F500.0
+G1 X29.36 Y-43.18 Z8.99 J911.61 F500.0
+G1 X35.94 Y-43.18 Z8.99 J918.06 F500.0
+G1 X35.94 Y-45.25 Z8.99 J920.08 F500.0
+G1 X32.82 Y-47.05 Z8.99 J923.61 F500.0
+G1 X32.82 Y-51.25 Z8.99 J927.73 F500.0
+G1 X35.94 Y-53.05 Z8.99 J931.26 F500.0
+G1 X35.94 Y-57.25 Z8.99 J935.38 F500.0
+G1 X32.82 Y-59.05 Z8.99 J938.91 F500.0
+G1 X32.82 Y-63.25 Z8.99 J943.02 F500.0
+G1 X35.94 Y-65.05 Z8.99 J946.55 F500.0
+G1 X35.94 Y-69.25 Z8.99 J950.67 F500.0
+G1 X35.05 Y-69.76 Z8.99 J951.67 F500.0
+G1 X36.33 Y-69.28 Z8.99 J953.01 F500.0
+G1 X36.28 Y-69.25 Z8.99 J953.07 F500.0
+G1 X36.28 Y-65.05 Z8.99 J957.19 F500.0
+G1 X36.33 Y-65.02 Z8.99 J957.24 F500.0
+G1 X36.33 Y-57.28 Z8.99 J964.83 F500.0
+G1 X36.28 Y-57.25 Z8.99 J964.89 F500.0
+G1 X36.28 Y-53.05 Z8.99 J969.00 F500.0
+G1 X36.33 Y-53.02 Z8.99 J969.06 F500.0
+G1 X36.33 Y-45.28 Z8.99 J976.64 F500.0
+G1 X36.28 Y-45.25 Z8.99 J976.70 F500.0
+G1 X36.28 Y-43.18 Z8.99 J978.73 F500.0
+
+T1
+G1 X35.78 Y-69.21 Z9.99 J0.00 F500.0
+G1 X35.78 Y-55.41 Z9.99 J13.52 F500.0
+G1 X35.78 Y-43.73 Z9.99 J24.97 F500.0
+G1 X8.18 Y-43.73 Z9.99 J52.02 F500.0
+G1 X-29.70 Y-43.73 Z9.99 J89.14 F500.0
+G1 X-29.70 Y-57.53 Z9.99 J102.66 F500.0
+G1 X-29.70 Y-69.21 Z9.99 J114.11 F500.0
+G1 X-2.10 Y-69.21 Z9.99 J141.16 F500.0
+G1 X35.78 Y-69.21 Z9.99 J178.28 F500.0
+G1 X35.78 Y-69.21 Z9.99 J178.28 F500.0
+G1 X-26.42 Y-43.73 Z9.99 J244.15 F500.0
+G1 X-26.42 Y-45.25 Z9.99 J245.64 F500.0
+G1 X-29.53 Y-47.05 Z9.99 J249.16 F500.0
+G1 X-29.53 Y-51.25 Z9.99 J253.28 F500.0
+G1 X-26.42 Y-53.05 Z9.99 J256.80 F500.0
+G1 X-26.42 Y-57.25 Z9.99 J260.92 F500.0
+G1 X-29.53 Y-59.05 Z9.99 J264.44 F500.0
+G1 X-29.53 Y-63.25 Z9.99 J268.56 F500.0
+G1 X-26.42 Y-65.05 Z9.99 J272.08 F500.0
+G1 X-26.42 Y-69.21 Z9.99 J276.15 F500.0
+G1 X-26.07 Y-69.21 Z9.99 J276.50 F500.0
+G1 X-26.07 Y-65.05 Z9.99 J280.57 F500.0
+G1 X-22.95 Y-63.25 Z9.99 J284.10 F500.0
+G1 X-22.95 Y-59.05 Z9.99 J288.22 F500.0
+G1 X-26.07 Y-57.25 Z9.99 J291.75 F500.0
+G1 X-26.07 Y-53.05 Z9.99 J295.87 F500.0
+G1 X-22.95 Y-51.25 Z9.99 J299.40 F500.0
+G1 X-22.95 Y-47.05 Z9.99 J303.51 F500.0
+G1 X-26.07 Y-45.25 Z9.99 J307.04 F500.0
+G1 X-26.07 Y-43.73 Z9.99 J308.53 F500.0
+G1 X-19.49 Y-43.73 Z9.99 J314.98 F500.0
+G1 X-19.49 Y-45.25 Z9.99 J316.47 F500.0
+G1 X-22.61 Y-47.05 Z9.99 J320.00 F500.0
+G1 X-22.61 Y-51.25 Z9.99 J324.12 F500.0
+G1 X-19.49 Y-53.05 Z9.99 J327.65 F500.0
+G1 X-19.49 Y-57.25 Z9.99 J331.76 F500.0
+G1 X-22.61 Y-59.05 Z9.99 J335.29 F500.0
+G1 X-22.61 Y-63.25 Z9.99 J339.41 F500.0
+G1 X-19.49 Y-65.05 Z9.99 J342.94 F500.0
+G1 X-19.49 Y-69.21 Z9.99 J347.01 F500.0
+G1 X-19.14 Y-69.21 Z9.99 J347.36 F500.0
+G1 X-19.14 Y-65.05 Z9.99 J351.43 F500.0
+G1 X-16.02 Y-63.25 Z9.99 J354.96 F500.0
+G1 X-16.02 Y-59.05 Z9.99 J359.08 F500.0
+G1 X-19.14 Y-57.25 Z9.99 J362.61 F500.0
+G1 X-19.14 Y-53.05 Z9.99 J366.73 F500.0
+G1 X-16.02 Y-51.25 Z9.99 J370.26 F500.0
+G1 X-16.02 Y-47.05 Z9.99 J374.37 F500.0
+G1 X-19.14 Y-45.25 Z9.99 J377.90 F500.0
+G1 X-19.14 Y-43.73 Z9.99 J379.39 F500.0
+G1 X-12.56 Y-43.73 Z9.99 J385.84 F500.0
+G1 X-12.56 Y-45.25 Z9.99 J387.33 F500.0
+G1 X-15.68 Y-47.05 Z9.99 J390.86 F500.0
+G1 X-15.68 Y-51.25 Z9.99 J394.98 F500.0
+G1 X-12.56 Y-53.05 Z9.99 J398.51 F500.0
+G1 X-12.56 Y-57.25 Z9.99 J402.62 F500.0
+G1 X-15.68 Y-59.05 Z9.99 J406.15 F500.0
+G1 X-15.68 Y-63.25 Z9.99 J410.27 F500.0
+G1 X-12.56 Y-65.05 Z9.99 J413.80 F500.0
+G1 X-12.56 Y-69.21 Z9.99 J417.87 F500.0
+G1 X-12.21 Y-69.21 Z9.99 J418.22 F500.0
+G1 X-12.21 Y-65.05 Z9.99 J422.29 F500.0
+G1 X-9.10 Y-63.25 Z9.99 J425.82 F500.0
+G1 X-9.10 Y-59.05 Z9.99 J429.93 F500.0
+G1 X-12.21 Y-57.25 Z9.99 J433.45 F500.0
+G1 X-12.21 Y-53.05 Z9.99 J437.57 F500.0
+G1 X-9.10 Y-51.25 Z9.99 J441.09 F500.0
+G1 X-9.10 Y-47.05 Z9.99 J445.21 F500.0
+G1 X-12.21 Y-45.25 Z9.99 J448.73 F500.0
+G1 X-12.21 Y-43.73 Z9.99 J450.22 F500.0
+G1 X-5.63 Y-43.73 Z9.99 J456.67 F500.0
+G1 X-5.63 Y-45.25 Z9.99 J458.16 F500.0
+G1 X-8.75 Y-47.05 Z9.99 J461.69 F500.0
+G1 X-8.75 Y-51.25 Z9.99 J465.80 F500.0
+G1 X-5.63 Y-53.05 Z9.99 J469.33 F500.0
+G1 X-5.63 Y-57.25 Z9.99 J473.45 F500.0
+G1 X-8.75 Y-59.05 Z9.99 J476.98 F500.0
+G1 X-8.75 Y-63.25 Z9.99 J481.09 F500.0
+G1 X-5.63 Y-65.05 Z9.99 J484.62 F500.0
+G1 X-5.63 Y-69.21 Z9.99 J488.70 F500.0
+G1 X-5.28 Y-69.21 Z9.99 J489.04 F500.0
+G1 X-5.28 Y-65.05 Z9.99 J493.12 F500.0
+G1 X-2.17 Y-63.25 Z9.99 J496.64 F500.0
+G1 X-2.17 Y-59.05 Z9.99 J500.76 F500.0
+G1 X-5.28 Y-57.25 Z9.99 J504.28 F500.0
+G1 X-5.28 Y-53.05 Z9.99 J508.39 F500.0
+G1 X-2.17 Y-51.25 Z9.99 J511.92 F500.0
+G1 X-2.17 Y-47.05 Z9.99 J516.03 F500.0
+G1 X-5.28 Y-45.25 Z9.99 J519.55 F500.0
+G1 X-5.28 Y-43.73 Z9.99 J521.04 F500.0
+G1 X1.30 Y-43.73 Z9.99 J527.49 F500.0
+G1 X1.30 Y-45.25 Z9.99 J528.98 F500.0
+G1 X-1.82 Y-47.05 Z9.99 J532.51 F500.0
+G1 X-1.82 Y-51.25 Z9.99 J536.63 F500.0
+G1 X1.30 Y-53.05 Z9.99 J540.16 F500.0
+G1 X1.30 Y-57.25 Z9.99 J544.27 F500.0
+G1 X-1.82 Y-59.05 Z9.99 J547.80 F500.0
+G1 X-1.82 Y-63.25 Z9.99 J551.92 F500.0
+G1 X1.30 Y-65.05 Z9.99 J555.45 F500.0
+G1 X1.30 Y-69.21 Z9.99 J559.53 F500.0
+G1 X1.64 Y-69.21 Z9.99 J559.86 F500.0
+G1 X1.64 Y-65.05 Z9.99 J563.94 F500.0
+G1 X4.76 Y-63.25 Z9.99 J567.47 F500.0
+G1 X4.76 Y-59.05 Z9.99 J571.58 F500.0
+G1 X1.64 Y-57.25 Z9.99 J575.11 F500.0
+G1 X1.64 Y-53.05 Z9.99 J579.23 F500.0
+G1 X4.76 Y-51.25 Z9.99 J582.76 F500.0
+G1 X4.76 Y-47.05 Z9.99 J586.87 F500.0
+G1 X1.64 Y-45.25 Z9.99 J590.40 F500.0
+G1 X1.64 Y-43.73 Z9.99 J591.89 F500.0
+G1 X8.22 Y-43.73 Z9.99 J598.34 F500.0
+G1 X8.22 Y-45.25 Z9.99 J599.83 F500.0
+G1 X5.11 Y-47.05 Z9.99 J603.35 F500.0
+G1 X5.11 Y-51.25 Z9.99 J607.47 F500.0
+G1 X8.22 Y-53.05 Z9.99 J610.99 F500.0
+G1 X8.22 Y-57.25 Z9.99 J615.11 F500.0
+G1 X5.11 Y-59.05 Z9.99 J618.63 F500.0
+G1 X5.11 Y-63.25 Z9.99 J622.74 F500.0
+G1 X8.22 Y-65.05 Z9.99 J626.27 F500.0
+G1 X8.22 Y-69.21 Z9.99 J630.34 F500.0
+G1 X8.57 Y-69.21 Z9.99 J630.68 F500.0
+G1 X8.57 Y-65.05 Z9.99 J634.76 F500.0
+G1 X11.69 Y-63.25 Z9.99 J638.29 F500.0
+G1 X11.69 Y-59.05 Z9.99 J642.41 F500.0
+G1 X8.57 Y-57.25 Z9.99 J645.94 F500.0
+G1 X8.57 Y-53.05 Z9.99 J650.05 F500.0
+G1 X11.69 Y-51.25 Z9.99 J653.58 F500.0
+G1 X11.69 Y-47.05 Z9.99 J657.70 F500.0
+G1 X8.57 Y-45.25 Z9.99 J661.23 F500.0
+G1 X8.57 Y-43.73 Z9.99 J662.72 F500.0
+G1 X15.15 Y-43.73 Z9.99 J669.17 F500.0
+G1 X15.15 Y-45.25 Z9.99 J670.66 F500.0
+G1 X12.03 Y-47.05 Z9.99 J674.19 F500.0
+G1 X12.03 Y-51.25 Z9.99 J678.30 F500.0
+G1 X15.15 Y-53.05 Z9.99 J681.83 F500.0
+G1 X15.15 Y-57.25 Z9.99 J685.95 F500.0
+G1 X12.03 Y-59.05 Z9.99 J689.48 F500.0
+G1 X12.03 Y-63.25 Z9.99 J693.60 F500.0
+G1 X15.15 Y-65.05 Z9.99 J697.12 F500.0
+G1 X15.15 Y-69.21 Z9.99 J701.20 F500.0
+G1 X15.50 Y-69.21 Z9.99 J701.54 F500.0
+G1 X15.50 Y-65.05 Z9.99 J705.62 F500.0
+G1 X18.62 Y-63.25 Z9.99 J709.15 F500.0
+G1 X18.62 Y-59.05 Z9.99 J713.27 F500.0
+G1 X15.50 Y-57.25 Z9.99 J716.80 F500.0
+G1 X15.50 Y-53.05 Z9.99 J720.91 F500.0
+G1 X18.62 Y-51.25 Z9.99 J724.44 F500.0
+G1 X18.62 Y-47.05 Z9.99 J728.56 F500.0
+G1 X15.50 Y-45.25 Z9.99 J732.09 F500.0
+G1 X15.50 Y-43.73 Z9.99 J733.58 F500.0
+G1 X22.08 Y-43.73 Z9.99 J740.03 F500.0
+G1 X22.08 Y-45.25 Z9.99 J741.52 F500.0
+G1 X18.96 Y-47.05 Z9.99 J745.05 F500.0
+G1 X18.96 Y-51.25 Z9.99 J749.16 F500.0
+G1 X22.08 Y-53.05 Z9.99 J752.69 F500.0
+G1 X22.08 Y-57.25 Z9.99 J756.81 F500.0
+G1 X18.96 Y-59.05 Z9.99 J760.34 F500.0
+G1 X18.96 Y-63.25 Z9.99 J764.45 F500.0
+G1 X22.08 Y-65.05 Z9.99 J767.98 F500.0
+G1 X22.08 Y-69.21 Z9.99 J772.06 F500.0
+G1 X22.43 Y-69.21 Z9.99 J772.40 F500.0
+G1 X22.43 Y-65.05 Z9.99 J776.48 F500.0
+G1 X25.54 Y-63.25 Z9.99 J780.00 F500.0
+G1 X25.54 Y-59.05 Z9.99 J784.12 F500.0
+G1 X22.43 Y-57.25 Z9.99 J787.64 F500.0
+G1 X22.43 Y-53.05 Z9.99 J791.76 F500.0
+G1 X25.54 Y-51.25 Z9.99 J795.28 F500.0
+G1 X25.54 Y-47.05 Z9.99 J799.39 F500.0
+G1 X22.43 Y-45.25 Z9.99 J802.92 F500.0
+G1 X22.43 Y-43.73 Z9.99 J804.40 F500.0
+G1 X29.01 Y-43.73 Z9.99 J810.85 F500.0
+G1 X29.01 Y-45.25 Z9.99 J812.34 F500.0
+G1 X25.89 Y-47.05 Z9.99 J815.87 F500.0
+G1 X25.89 Y-51.25 Z9.99 J819.99 F500.0
+G1 X29.01 Y-53.05 Z9.99 J823.52 F500.0
+G1 X29.01 Y-57.25 Z9.99 J827.63 F500.0
+G1 X25.89 Y-59.05 Z9.99 J831.16 F500.0
+G1 X25.89 Y-63.25 Z9.99 J835.28 F500.0
+G1 X29.01 Y-65.05 Z9.99 J838.81 F500.0
+G1 X29.01 Y-69.21 Z9.99 J842.89 F500.0
+G1 X29.36 Y-69.21 Z9.99 J843.23 F500.0
+G1 X29.36 Y-65.05 Z9.99 J847.31 F500.0
+G1 X32.47 Y-63.25 Z9.99 J850.83 F500.0
+G1 X32.47 Y-59.05 Z9.99 J854.94 F500.0
+G1 X29.36 Y-57.25 Z9.99 J858.47 F500.0
+G1 X29.36 Y-53.05 Z9.99 J862.58 F500.0
+G1 X32.47 Y-51.25 Z9.99 J866.10 F500.0
+G1 X32.47 Y-47.05 Z9.99 J870.22 F500.0
+G1 X29.36 Y-45.25 Z9.99 J873.74 F500.0
+G1 X29.36 Y-43.73 Z9.99 J875.23 F500.0
+G1 X35.78 Y-45.34 Z9.99 J881.72 F500.0
+G1 X32.82 Y-47.05 Z9.99 J885.07 F500.0
+G1 X32.82 Y-51.25 Z9.99 J889.18 F500.0
+G1 X35.78 Y-52.96 Z9.99 J892.53 F500.0
+G1 X35.78 Y-57.34 Z9.99 J896.83 F500.0
+G1 X32.82 Y-59.05 Z9.99 J900.18 F500.0
+G1 X32.82 Y-63.25 Z9.99 J904.29 F500.0
+G1 X35.78 Y-64.96 Z9.99 J907.64 F500.0
+
+T1
+G1 X35.22 Y-68.65 Z10.99 J0.00 F500.0
+G1 X35.22 Y-56.85 Z10.99 J11.56 F500.0
+G1 X35.22 Y-44.29 Z10.99 J23.87 F500.0
+G1 X11.62 Y-44.29 Z10.99 J47.00 F500.0
+G1 X-29.14 Y-44.29 Z10.99 J86.95 F500.0
+G1 X-29.14 Y-56.09 Z10.99 J98.51 F500.0
+G1 X-29.14 Y-68.65 Z10.99 J110.82 F500.0
+G1 X-5.54 Y-68.65 Z10.99 J133.95 F500.0
+G1 X35.22 Y-68.65 Z10.99 J173.89 F500.0
+G1 X35.22 Y-68.65 Z10.99 J173.89 F500.0
+G1 X-26.42 Y-44.29 Z10.99 J238.84 F500.0
+G1 X-26.42 Y-45.25 Z10.99 J239.79 F500.0
+G1 X-29.14 Y-46.83 Z10.99 J242.87 F500.0
+G1 X-29.14 Y-51.48 Z10.99 J247.43 F500.0
+G1 X-26.42 Y-53.05 Z10.99 J250.50 F500.0
+G1 X-26.42 Y-57.25 Z10.99 J254.62 F500.0
+G1 X-29.14 Y-58.83 Z10.99 J257.70 F500.0
+G1 X-29.14 Y-63.48 Z10.99 J262.26 F500.0
+G1 X-26.42 Y-65.05 Z10.99 J265.34 F500.0
+G1 X-26.42 Y-68.65 Z10.99 J268.86 F500.0
+G1 X-26.07 Y-68.65 Z10.99 J269.21 F500.0
+G1 X-26.07 Y-65.05 Z10.99 J272.74 F500.0
+G1 X-22.95 Y-63.25 Z10.99 J276.27 F500.0
+G1 X-22.95 Y-59.05 Z10.99 J280.38 F500.0
+G1 X-26.07 Y-57.25 Z10.99 J283.91 F500.0
+G1 X-26.07 Y-53.05 Z10.99 J288.03 F500.0
+G1 X-22.95 Y-51.25 Z10.99 J291.56 F500.0
+G1 X-22.95 Y-47.05 Z10.99 J295.67 F500.0
+G1 X-26.07 Y-45.25 Z10.99 J299.20 F500.0
+G1 X-26.07 Y-44.29 Z10.99 J300.14 F500.0
+G1 X-19.49 Y-44.29 Z10.99 J306.59 F500.0
+G1 X-19.49 Y-45.25 Z10.99 J307.53 F500.0
+G1 X-22.61 Y-47.05 Z10.99 J311.06 F500.0
+G1 X-22.61 Y-51.25 Z10.99 J315.18 F500.0
+G1 X-19.49 Y-53.05 Z10.99 J318.71 F500.0
+G1 X-19.49 Y-57.25 Z10.99 J322.83 F500.0
+G1 X-22.61 Y-59.05 Z10.99 J326.36 F500.0
+G1 X-22.61 Y-63.25 Z10.99 J330.47 F500.0
+G1 X-19.49 Y-65.05 Z10.99 J334.00 F500.0
+G1 X-19.49 Y-68.65 Z10.99 J337.53 F500.0
+G1 X-19.14 Y-68.65 Z10.99 J337.87 F500.0
+G1 X-19.14 Y-65.05 Z10.99 J341.40 F500.0
+G1 X-16.02 Y-63.25 Z10.99 J344.93 F500.0
+G1 X-16.02 Y-59.05 Z10.99 J349.05 F500.0
+G1 X-19.14 Y-57.25 Z10.99 J352.58 F500.0
+G1 X-19.14 Y-53.05 Z10.99 J356.69 F500.0
+G1 X-16.02 Y-51.25 Z10.99 J360.22 F500.0
+G1 X-16.02 Y-47.05 Z10.99 J364.34 F500.0
+G1 X-19.14 Y-45.25 Z10.99 J367.87 F500.0
+G1 X-19.14 Y-44.29 Z10.99 J368.81 F500.0
+G1 X-12.56 Y-44.29 Z10.99 J375.26 F500.0
+G1 X-12.56 Y-45.25 Z10.99 J376.20 F500.0
+G1 X-15.68 Y-47.05 Z10.99 J379.73 F500.0
+G1 X-15.68 Y-51.25 Z10.99 J383.84 F500.0
+G1 X-12.56 Y-53.05 Z10.99 J387.37 F500.0
+G1 X-12.56 Y-57.25 Z10.99 J391.49 F500.0
+G1 X-15.68 Y-59.05 Z10.99 J395.02 F500.0
+G1 X-15.68 Y-63.25 Z10.99 J399.14 F500.0
+G1 X-12.56 Y-65.05 Z10.99 J402.67 F500.0
+G1 X-12.56 Y-68.65 Z10.99 J406.19 F500.0
+G1 X-12.21 Y-68.65 Z10.99 J406.54 F500.0
+G1 X-12.21 Y-65.05 Z10.99 J410.06 F500.0
+G1 X-9.10 Y-63.25 Z10.99 J413.59 F500.0
+G1 X-9.10 Y-59.05 Z10.99 J417.70 F500.0
+G1 X-12.21 Y-57.25 Z10.99 J421.22 F500.0
+G1 X-12.21 Y-53.05 Z10.99 J425.34 F500.0
+G1 X-9.10 Y-51.25 Z10.99 J428.86 F500.0
+G1 X-9.10 Y-47.05 Z10.99 J432.98 F500.0
+G1 X-12.21 Y-45.25 Z10.99 J436.50 F500.0
+G1 X-12.21 Y-44.29 Z10.99 J437.44 F500.0
+G1 X-5.63 Y-44.29 Z10.99 J443.89 F500.0
+G1 X-5.63 Y-45.25 Z10.99 J444.83 F500.0
+G1 X-8.75 Y-47.05 Z10.99 J448.36 F500.0
+G1 X-8.75 Y-51.25 Z10.99 J452.47 F500.0
+G1 X-5.63 Y-53.05 Z10.99 J456.00 F500.0
+G1 X-5.63 Y-57.25 Z10.99 J460.12 F500.0
+G1 X-8.75 Y-59.05 Z10.99 J463.65 F500.0
+G1 X-8.75 Y-63.25 Z10.99 J467.77 F500.0
+G1 X-5.63 Y-65.05 Z10.99 J471.30 F500.0
+G1 X-5.63 Y-68.65 Z10.99 J474.82 F500.0
+G1 X-5.28 Y-68.65 Z10.99 J475.17 F500.0
+G1 X-5.28 Y-65.05 Z10.99 J478.70 F500.0
+G1 X-2.17 Y-63.25 Z10.99 J482.22 F500.0
+G1 X-2.17 Y-59.05 Z10.99 J486.33 F500.0
+G1 X-5.28 Y-57.25 Z10.99 J489.85 F500.0
+G1 X-5.28 Y-53.05 Z10.99 J493.97 F500.0
+G1 X-2.17 Y-51.25 Z10.99 J497.49 F500.0
+G1 X-2.17 Y-47.05 Z10.99 J501.61 F500.0
+G1 X-5.28 Y-45.25 Z10.99 J505.13 F500.0
+G1 X-5.28 Y-44.29 Z10.99 J506.07 F500.0
+G1 X1.30 Y-44.29 Z10.99 J512.52 F500.0
+G1 X1.30 Y-45.25 Z10.99 J513.46 F500.0
+G1 X-1.82 Y-47.05 Z10.99 J516.99 F500.0
+G1 X-1.82 Y-51.25 Z10.99 J521.11 F500.0
+G1 X1.30 Y-53.05 Z10.99 J524.64 F500.0
+G1 X1.30 Y-57.25 Z10.99 J528.75 F500.0
+G1 X-1.82 Y-59.05 Z10.99 J532.28 F500.0
+G1 X-1.82 Y-63.25 Z10.99 J536.40 F500.0
+G1 X1.30 Y-65.05 Z10.99 J539.93 F500.0
+G1 X1.30 Y-68.65 Z10.99 J543.46 F500.0
+G1 X1.64 Y-68.65 Z10.99 J543.79 F500.0
+G1 X1.64 Y-65.05 Z10.99 J547.32 F500.0
+G1 X4.76 Y-63.25 Z10.99 J550.85 F500.0
+G1 X4.76 Y-59.05 Z10.99 J554.96 F500.0
+G1 X1.64 Y-57.25 Z10.99 J558.49 F500.0
+G1 X1.64 Y-53.05 Z10.99 J562.61 F500.0
+G1 X4.76 Y-51.25 Z10.99 J566.14 F500.0
+G1 X4.76 Y-47.05 Z10.99 J570.25 F500.0
+G1 X1.64 Y-45.25 Z10.99 J573.78 F500.0
+G1 X1.64 Y-44.29 Z10.99 J574.72 F500.0
+G1 X8.22 Y-44.29 Z10.99 J581.17 F500.0
+G1 X8.22 Y-45.25 Z10.99 J582.11 F500.0
+G1 X5.11 Y-47.05 Z10.99 J585.64 F500.0
+G1 X5.11 Y-51.25 Z10.99 J589.75 F500.0
+G1 X8.22 Y-53.05 Z10.99 J593.27 F500.0
+G1 X8.22 Y-57.25 Z10.99 J597.39 F500.0
+G1 X5.11 Y-59.05 Z10.99 J600.91 F500.0
+G1 X5.11 Y-63.25 Z10.99 J605.03 F500.0
+G1 X8.22 Y-65.05 Z10.99 J608.55 F500.0
+G1 X8.22 Y-68.65 Z10.99 J612.08 F500.0
+G1 X8.57 Y-68.65 Z10.99 J612.42 F500.0
+G1 X8.57 Y-65.05 Z10.99 J615.95 F500.0
+G1 X11.69 Y-63.25 Z10.99 J619.48 F500.0
+G1 X11.69 Y-59.05 Z10.99 J623.59 F500.0
+G1 X8.57 Y-57.25 Z10.99 J627.12 F500.0
+G1 X8.57 Y-53.05 Z10.99 J631.24 F500.0
+G1 X11.69 Y-51.25 Z10.99 J634.77 F500.0
+G1 X11.69 Y-47.05 Z10.99 J638.88 F500.0
+G1 X8.57 Y-45.25 Z10.99 J642.41 F500.0
+G1 X8.57 Y-44.29 Z10.99 J643.36 F500.0
+G1 X15.15 Y-44.29 Z10.99 J649.80 F500.0
+G1 X15.15 Y-45.25 Z10.99 J650.74 F500.0
+G1 X12.03 Y-47.05 Z10.99 J654.27 F500.0
+G1 X12.03 Y-51.25 Z10.99 J658.39 F500.0
+G1 X15.15 Y-53.05 Z10.99 J661.92 F500.0
+G1 X15.15 Y-57.25 Z10.99 J666.04 F500.0
+G1 X12.03 Y-59.05 Z10.99 J669.57 F500.0
+G1 X12.03 Y-63.25 Z10.99 J673.68 F500.0
+G1 X15.15 Y-65.05 Z10.99 J677.21 F500.0
+G1 X15.15 Y-68.65 Z10.99 J680.74 F500.0
+G1 X15.50 Y-68.65 Z10.99 J681.08 F500.0
+G1 X15.50 Y-65.05 Z10.99 J684.61 F500.0
+G1 X18.62 Y-63.25 Z10.99 J688.14 F500.0
+G1 X18.62 Y-59.05 Z10.99 J692.26 F500.0
+G1 X15.50 Y-57.25 Z10.99 J695.79 F500.0
+G1 X15.50 Y-53.05 Z10.99 J699.90 F500.0
+G1 X18.62 Y-51.25 Z10.99 J703.43 F500.0
+G1 X18.62 Y-47.05 Z10.99 J707.55 F500.0
+G1 X15.50 Y-45.25 Z10.99 J711.08 F500.0
+G1 X15.50 Y-44.29 Z10.99 J712.02 F500.0
+G1 X22.08 Y-44.29 Z10.99 J718.47 F500.0
+G1 X22.08 Y-45.25 Z10.99 J719.41 F500.0
+G1 X18.96 Y-47.05 Z10.99 J722.94 F500.0
+G1 X18.96 Y-51.25 Z10.99 J727.06 F500.0
+G1 X22.08 Y-53.05 Z10.99 J730.59 F500.0
+G1 X22.08 Y-57.25 Z10.99 J734.70 F500.0
+G1 X18.96 Y-59.05 Z10.99 J738.23 F500.0
+G1 X18.96 Y-63.25 Z10.99 J742.35 F500.0
+G1 X22.08 Y-65.05 Z10.99 J745.88 F500.0
+G1 X22.08 Y-68.65 Z10.99 J749.41 F500.0
+G1 X22.43 Y-68.65 Z10.99 J749.75 F500.0
+G1 X22.43 Y-65.05 Z10.99 J753.28 F500.0
+G1 X25.54 Y-63.25 Z10.99 J756.80 F500.0
+G1 X25.54 Y-59.05 Z10.99 J760.91 F500.0
+G1 X22.43 Y-57.25 Z10.99 J764.44 F500.0
+G1 X22.43 Y-53.05 Z10.99 J768.55 F500.0
+G1 X25.54 Y-51.25 Z10.99 J772.07 F500.0
+G1 X25.54 Y-47.05 Z10.99 J776.19 F500.0
+G1 X22.43 Y-45.25 Z10.99 J779.71 F500.0
+G1 X22.43 Y-44.29 Z10.99 J780.65 F500.0
+G1 X29.01 Y-44.29 Z10.99 J787.10 F500.0
+G1 X29.01 Y-45.25 Z10.99 J788.04 F500.0
+G1 X25.89 Y-47.05 Z10.99 J791.57 F500.0
+G1 X25.89 Y-51.25 Z10.99 J795.69 F500.0
+G1 X29.01 Y-53.05 Z10.99 J799.22 F500.0
+G1 X29.01 Y-57.25 Z10.99 J803.33 F500.0
+G1 X25.89 Y-59.05 Z10.99 J806.86 F500.0
+G1 X25.89 Y-63.25 Z10.99 J810.98 F500.0
+G1 X29.01 Y-65.05 Z10.99 J814.51 F500.0
+G1 X29.01 Y-68.65 Z10.99 J818.04 F500.0
+G1 X29.36 Y-68.65 Z10.99 J818.38 F500.0
+G1 X29.36 Y-65.05 Z10.99 J821.91 F500.0
+G1 X32.47 Y-63.25 Z10.99 J825.43 F500.0
+G1 X32.47 Y-59.05 Z10.99 J829.54 F500.0
+G1 X29.36 Y-57.25 Z10.99 J833.07 F500.0
+G1 X29.36 Y-53.05 Z10.99 J837.18 F500.0
+G1 X32.47 Y-51.25 Z10.99 J840.70 F500.0
+G1 X32.47 Y-47.05 Z10.99 J844.82 F500.0
+G1 X29.36 Y-45.25 Z10.99 J848.34 F500.0
+G1 X29.36 Y-44.29 Z10.99 J849.28 F500.0
+G1 X35.22 Y-45.66 Z10.99 J855.18 F500.0
+G1 X32.82 Y-47.05 Z10.99 J857.90 F500.0
+G1 X32.82 Y-51.25 Z10.99 J862.01 F500.0
+G1 X35.22 Y-52.64 Z10.99 J864.73 F500.0
+G1 X35.22 Y-57.66 Z10.99 J869.65 F500.0
+G1 X32.82 Y-59.05 Z10.99 J872.37 F500.0
+G1 X32.82 Y-63.25 Z10.99 J876.49 F500.0
+G1 X35.22 Y-64.64 Z10.99 J879.20 F500.0
+
+T1
+G1 X34.67 Y-68.10 Z11.99 J0.00 F500.0
+G1 X34.67 Y-58.30 Z11.99 J9.60 F500.0
+G1 X34.67 Y-44.84 Z11.99 J22.79 F500.0
+G1 X15.07 Y-44.84 Z11.99 J42.00 F500.0
+G1 X-28.59 Y-44.84 Z11.99 J84.79 F500.0
+G1 X-28.59 Y-54.64 Z11.99 J94.39 F500.0
+G1 X-28.59 Y-68.10 Z11.99 J107.58 F500.0
+G1 X-8.99 Y-68.10 Z11.99 J126.79 F500.0
+G1 X34.67 Y-68.10 Z11.99 J169.58 F500.0
+G1 X34.67 Y-68.10 Z11.99 J169.58 F500.0
+G1 X-26.42 Y-44.84 Z11.99 J233.64 F500.0
+G1 X-26.42 Y-45.25 Z11.99 J234.04 F500.0
+G1 X-28.59 Y-46.51 Z11.99 J236.50 F500.0
+G1 X-28.59 Y-51.80 Z11.99 J241.69 F500.0
+G1 X-26.42 Y-53.05 Z11.99 J244.14 F500.0
+G1 X-26.42 Y-57.25 Z11.99 J248.26 F500.0
+G1 X-28.59 Y-58.51 Z11.99 J250.71 F500.0
+G1 X-28.59 Y-63.80 Z11.99 J255.90 F500.0
+G1 X-26.42 Y-65.05 Z11.99 J258.35 F500.0
+G1 X-26.42 Y-68.10 Z11.99 J261.34 F500.0
+G1 X-26.07 Y-68.10 Z11.99 J261.68 F500.0
+G1 X-26.07 Y-65.05 Z11.99 J264.67 F500.0
+G1 X-22.95 Y-63.25 Z11.99 J268.20 F500.0
+G1 X-22.95 Y-59.05 Z11.99 J272.32 F500.0
+G1 X-26.07 Y-57.25 Z11.99 J275.85 F500.0
+G1 X-26.07 Y-53.05 Z11.99 J279.97 F500.0
+G1 X-22.95 Y-51.25 Z11.99 J283.50 F500.0
+G1 X-22.95 Y-47.05 Z11.99 J287.61 F500.0
+G1 X-26.07 Y-45.25 Z11.99 J291.14 F500.0
+G1 X-26.07 Y-44.84 Z11.99 J291.54 F500.0
+G1 X-19.49 Y-44.84 Z11.99 J297.99 F500.0
+G1 X-19.49 Y-45.25 Z11.99 J298.39 F500.0
+G1 X-22.61 Y-47.05 Z11.99 J301.92 F500.0
+G1 X-22.61 Y-51.25 Z11.99 J306.04 F500.0
+G1 X-19.49 Y-53.05 Z11.99 J309.57 F500.0
+G1 X-19.49 Y-57.25 Z11.99 J313.69 F500.0
+G1 X-22.61 Y-59.05 Z11.99 J317.22 F500.0
+G1 X-22.61 Y-63.25 Z11.99 J321.33 F500.0
+G1 X-19.49 Y-65.05 Z11.99 J324.86 F500.0
+G1 X-19.49 Y-68.10 Z11.99 J327.85 F500.0
+G1 X-19.14 Y-68.10 Z11.99 J328.19 F500.0
+G1 X-19.14 Y-65.05 Z11.99 J331.18 F500.0
+G1 X-16.02 Y-63.25 Z11.99 J334.71 F500.0
+G1 X-16.02 Y-59.05 Z11.99 J338.83 F500.0
+G1 X-19.14 Y-57.25 Z11.99 J342.36 F500.0
+G1 X-19.14 Y-53.05 Z11.99 J346.47 F500.0
+G1 X-16.02 Y-51.25 Z11.99 J350.00 F500.0
+G1 X-16.02 Y-47.05 Z11.99 J354.12 F500.0
+G1 X-19.14 Y-45.25 Z11.99 J357.65 F500.0
+G1 X-19.14 Y-44.84 Z11.99 J358.05 F500.0
+G1 X-12.56 Y-44.84 Z11.99 J364.50 F500.0
+G1 X-12.56 Y-45.25 Z11.99 J364.90 F500.0
+G1 X-15.68 Y-47.05 Z11.99 J368.43 F500.0
+G1 X-15.68 Y-51.25 Z11.99 J372.55 F500.0
+G1 X-12.56 Y-53.05 Z11.99 J376.08 F500.0
+G1 X-12.56 Y-57.25 Z11.99 J380.19 F500.0
+G1 X-15.68 Y-59.05 Z11.99 J383.72 F500.0
+G1 X-15.68 Y-63.25 Z11.99 J387.84 F500.0
+G1 X-12.56 Y-65.05 Z11.99 J391.37 F500.0
+G1 X-12.56 Y-68.10 Z11.99 J394.36 F500.0
+G1 X-12.21 Y-68.10 Z11.99 J394.70 F500.0
+G1 X-12.21 Y-65.05 Z11.99 J397.69 F500.0
+G1 X-9.10 Y-63.25 Z11.99 J401.21 F500.0
+G1 X-9.10 Y-59.05 Z11.99 J405.33 F500.0
+G1 X-12.21 Y-57.25 Z11.99 J408.85 F500.0
+G1 X-12.21 Y-53.05 Z11.99 J412.97 F500.0
+G1 X-9.10 Y-51.25 Z11.99 J416.49 F500.0
+G1 X-9.10 Y-47.05 Z11.99 J420.60 F500.0
+G1 X-12.21 Y-45.25 Z11.99 J424.13 F500.0
+G1 X-12.21 Y-44.84 Z11.99 J424.53 F500.0
+G1 X-5.63 Y-44.84 Z11.99 J430.98 F500.0
+G1 X-5.63 Y-45.25 Z11.99 J431.38 F500.0
+G1 X-8.75 Y-47.05 Z11.99 J434.91 F500.0
+G1 X-8.75 Y-51.25 Z11.99 J439.02 F500.0
+G1 X-5.63 Y-53.05 Z11.99 J442.55 F500.0
+G1 X-5.63 Y-57.25 Z11.99 J446.67 F500.0
+G1 X-8.75 Y-59.05 Z11.99 J450.20 F500.0
+G1 X-8.75 Y-63.25 Z11.99 J454.32 F500.0
+G1 X-5.63 Y-65.05 Z11.99 J457.85 F500.0
+G1 X-5.63 Y-68.10 Z11.99 J460.83 F500.0
+G1 X-5.28 Y-68.10 Z11.99 J461.18 F500.0
+G1 X-5.28 Y-65.05 Z11.99 J464.17 F500.0
+G1 X-2.17 Y-63.25 Z11.99 J467.69 F500.0
+G1 X-2.17 Y-59.05 Z11.99 J471.80 F500.0
+G1 X-5.28 Y-57.25 Z11.99 J475.32 F500.0
+G1 X-5.28 Y-53.05 Z11.99 J479.44 F500.0
+G1 X-2.17 Y-51.25 Z11.99 J482.96 F500.0
+G1 X-2.17 Y-47.05 Z11.99 J487.08 F500.0
+G1 X-5.28 Y-45.25 Z11.99 J490.60 F500.0
+G1 X-5.28 Y-44.84 Z11.99 J491.00 F500.0
+G1 X1.30 Y-44.84 Z11.99 J497.45 F500.0
+G1 X1.30 Y-45.25 Z11.99 J497.85 F500.0
+G1 X-1.82 Y-47.05 Z11.99 J501.38 F500.0
+G1 X-1.82 Y-51.25 Z11.99 J505.50 F500.0
+G1 X1.30 Y-53.05 Z11.99 J509.03 F500.0
+G1 X1.30 Y-57.25 Z11.99 J513.14 F500.0
+G1 X-1.82 Y-59.05 Z11.99 J516.67 F500.0
+G1 X-1.82 Y-63.25 Z11.99 J520.79 F500.0
+G1 X1.30 Y-65.05 Z11.99 J524.32 F500.0
+G1 X1.30 Y-68.10 Z11.99 J527.31 F500.0
+G1 X1.64 Y-68.10 Z11.99 J527.64 F500.0
+G1 X1.64 Y-65.05 Z11.99 J530.63 F500.0
+G1 X4.76 Y-63.25 Z11.99 J534.16 F500.0
+G1 X4.76 Y-59.05 Z11.99 J538.28 F500.0
+G1 X1.64 Y-57.25 Z11.99 J541.81 F500.0
+G1 X1.64 Y-53.05 Z11.99 J545.92 F500.0
+G1 X4.76 Y-51.25 Z11.99 J549.45 F500.0
+G1 X4.76 Y-47.05 Z11.99 J553.57 F500.0
+G1 X1.64 Y-45.25 Z11.99 J557.10 F500.0
+G1 X1.64 Y-44.84 Z11.99 J557.50 F500.0
+G1 X8.22 Y-44.84 Z11.99 J563.95 F500.0
+G1 X8.22 Y-45.25 Z11.99 J564.35 F500.0
+G1 X5.11 Y-47.05 Z11.99 J567.87 F500.0
+G1 X5.11 Y-51.25 Z11.99 J571.99 F500.0
+G1 X8.22 Y-53.05 Z11.99 J575.51 F500.0
+G1 X8.22 Y-57.25 Z11.99 J579.63 F500.0
+G1 X5.11 Y-59.05 Z11.99 J583.15 F500.0
+G1 X5.11 Y-63.25 Z11.99 J587.26 F500.0
+G1 X8.22 Y-65.05 Z11.99 J590.78 F500.0
+G1 X8.22 Y-68.10 Z11.99 J593.77 F500.0
+G1 X8.57 Y-68.10 Z11.99 J594.12 F500.0
+G1 X8.57 Y-65.05 Z11.99 J597.11 F500.0
+G1 X11.69 Y-63.25 Z11.99 J600.64 F500.0
+G1 X11.69 Y-59.05 Z11.99 J604.75 F500.0
+G1 X8.57 Y-57.25 Z11.99 J608.28 F500.0
+G1 X8.57 Y-53.05 Z11.99 J612.40 F500.0
+G1 X11.69 Y-51.25 Z11.99 J615.93 F500.0
+G1 X11.69 Y-47.05 Z11.99 J620.04 F500.0
+G1 X8.57 Y-45.25 Z11.99 J623.57 F500.0
+G1 X8.57 Y-44.84 Z11.99 J623.98 F500.0
+G1 X15.15 Y-44.84 Z11.99 J630.42 F500.0
+G1 X15.15 Y-45.25 Z11.99 J630.83 F500.0
+G1 X12.03 Y-47.05 Z11.99 J634.36 F500.0
+G1 X12.03 Y-51.25 Z11.99 J638.47 F500.0
+G1 X15.15 Y-53.05 Z11.99 J642.00 F500.0
+G1 X15.15 Y-57.25 Z11.99 J646.12 F500.0
+G1 X12.03 Y-59.05 Z11.99 J649.65 F500.0
+G1 X12.03 Y-63.25 Z11.99 J653.76 F500.0
+G1 X15.15 Y-65.05 Z11.99 J657.29 F500.0
+G1 X15.15 Y-68.10 Z11.99 J660.28 F500.0
+G1 X15.50 Y-68.10 Z11.99 J660.63 F500.0
+G1 X15.50 Y-65.05 Z11.99 J663.61 F500.0
+G1 X18.62 Y-63.25 Z11.99 J667.14 F500.0
+G1 X18.62 Y-59.05 Z11.99 J671.26 F500.0
+G1 X15.50 Y-57.25 Z11.99 J674.79 F500.0
+G1 X15.50 Y-53.05 Z11.99 J678.91 F500.0
+G1 X18.62 Y-51.25 Z11.99 J682.44 F500.0
+G1 X18.62 Y-47.05 Z11.99 J686.55 F500.0
+G1 X15.50 Y-45.25 Z11.99 J690.08 F500.0
+G1 X15.50 Y-44.84 Z11.99 J690.48 F500.0
+G1 X22.08 Y-44.84 Z11.99 J696.93 F500.0
+G1 X22.08 Y-45.25 Z11.99 J697.33 F500.0
+G1 X18.96 Y-47.05 Z11.99 J700.86 F500.0
+G1 X18.96 Y-51.25 Z11.99 J704.98 F500.0
+G1 X22.08 Y-53.05 Z11.99 J708.51 F500.0
+G1 X22.08 Y-57.25 Z11.99 J712.63 F500.0
+G1 X18.96 Y-59.05 Z11.99 J716.16 F500.0
+G1 X18.96 Y-63.25 Z11.99 J720.27 F500.0
+G1 X22.08 Y-65.05 Z11.99 J723.80 F500.0
+G1 X22.08 Y-68.10 Z11.99 J726.79 F500.0
+G1 X22.43 Y-68.10 Z11.99 J727.13 F500.0
+G1 X22.43 Y-65.05 Z11.99 J730.12 F500.0
+G1 X25.54 Y-63.25 Z11.99 J733.64 F500.0
+G1 X25.54 Y-59.05 Z11.99 J737.76 F500.0
+G1 X22.43 Y-57.25 Z11.99 J741.28 F500.0
+G1 X22.43 Y-53.05 Z11.99 J745.40 F500.0
+G1 X25.54 Y-51.25 Z11.99 J748.92 F500.0
+G1 X25.54 Y-47.05 Z11.99 J753.04 F500.0
+G1 X22.43 Y-45.25 Z11.99 J756.56 F500.0
+G1 X22.43 Y-44.84 Z11.99 J756.96 F500.0
+G1 X29.01 Y-44.84 Z11.99 J763.41 F500.0
+G1 X29.01 Y-45.25 Z11.99 J763.81 F500.0
+G1 X25.89 Y-47.05 Z11.99 J767.34 F500.0
+G1 X25.89 Y-51.25 Z11.99 J771.45 F500.0
+G1 X29.01 Y-53.05 Z11.99 J774.98 F500.0
+G1 X29.01 Y-57.25 Z11.99 J779.10 F500.0
+G1 X25.89 Y-59.05 Z11.99 J782.63 F500.0
+G1 X25.89 Y-63.25 Z11.99 J786.75 F500.0
+G1 X29.01 Y-65.05 Z11.99 J790.28 F500.0
+G1 X29.01 Y-68.10 Z11.99 J793.27 F500.0
+G1 X29.36 Y-68.10 Z11.99 J793.61 F500.0
+G1 X29.36 Y-65.05 Z11.99 J796.60 F500.0
+G1 X32.47 Y-63.25 Z11.99 J800.12 F500.0
+G1 X32.47 Y-59.05 Z11.99 J804.24 F500.0
+G1 X29.36 Y-57.25 Z11.99 J807.76 F500.0
+G1 X29.36 Y-53.05 Z11.99 J811.87 F500.0
+G1 X32.47 Y-51.25 Z11.99 J815.39 F500.0
+G1 X32.47 Y-47.05 Z11.99 J819.51 F500.0
+G1 X29.36 Y-45.25 Z11.99 J823.03 F500.0
+G1 X29.36 Y-44.84 Z11.99 J823.43 F500.0
+G1 X34.67 Y-45.98 Z11.99 J828.76 F500.0
+G1 X32.82 Y-47.05 Z11.99 J830.85 F500.0
+G1 X32.82 Y-51.25 Z11.99 J834.97 F500.0
+G1 X34.67 Y-52.32 Z11.99 J837.06 F500.0
+G1 X34.67 Y-57.98 Z11.99 J842.61 F500.0
+G1 X32.82 Y-59.05 Z11.99 J844.70 F500.0
+G1 X32.82 Y-63.25 Z11.99 J848.82 F500.0
+G1 X34.67 Y-64.32 Z11.99 J850.91 F500.0
+
+T1
+G1 X34.12 Y-67.55 Z12.99 J0.00 F500.0
+G1 X34.12 Y-59.75 Z12.99 J7.64 F500.0
+G1 X34.12 Y-45.39 Z12.99 J21.72 F500.0
+G1 X18.52 Y-45.39 Z12.99 J37.00 F500.0
+G1 X-28.04 Y-45.39 Z12.99 J82.63 F500.0
+G1 X-28.04 Y-53.19 Z12.99 J90.28 F500.0
+G1 X-28.04 Y-67.55 Z12.99 J104.35 F500.0
+G1 X-12.44 Y-67.55 Z12.99 J119.64 F500.0
+G1 X34.12 Y-67.55 Z12.99 J165.27 F500.0
+G1 X34.12 Y-67.55 Z12.99 J165.27 F500.0
+G1 X-26.66 Y-45.39 Z12.99 J228.67 F500.0
+G1 X-28.04 Y-46.19 Z12.99 J230.23 F500.0
+G1 X-28.04 Y-52.12 Z12.99 J236.04 F500.0
+G1 X-26.42 Y-53.05 Z12.99 J237.87 F500.0
+G1 X-26.42 Y-57.25 Z12.99 J241.99 F500.0
+G1 X-28.04 Y-58.19 Z12.99 J243.82 F500.0
+G1 X-28.04 Y-64.12 Z12.99 J249.64 F500.0
+G1 X-26.42 Y-65.05 Z12.99 J251.47 F500.0
+G1 X-26.42 Y-67.55 Z12.99 J253.92 F500.0
+G1 X-26.07 Y-67.55 Z12.99 J254.26 F500.0
+G1 X-26.07 Y-65.05 Z12.99 J256.71 F500.0
+G1 X-22.95 Y-63.25 Z12.99 J260.24 F500.0
+G1 X-22.95 Y-59.05 Z12.99 J264.35 F500.0
+G1 X-26.07 Y-57.25 Z12.99 J267.88 F500.0
+G1 X-26.07 Y-53.05 Z12.99 J272.00 F500.0
+G1 X-22.95 Y-51.25 Z12.99 J275.53 F500.0
+G1 X-22.95 Y-47.05 Z12.99 J279.65 F500.0
+G1 X-25.82 Y-45.39 Z12.99 J282.90 F500.0
+G1 X-19.74 Y-45.39 Z12.99 J288.85 F500.0
+G1 X-22.61 Y-47.05 Z12.99 J292.10 F500.0
+G1 X-22.61 Y-51.25 Z12.99 J296.22 F500.0
+G1 X-19.49 Y-53.05 Z12.99 J299.75 F500.0
+G1 X-19.49 Y-57.25 Z12.99 J303.87 F500.0
+G1 X-22.61 Y-59.05 Z12.99 J307.40 F500.0
+G1 X-22.61 Y-63.25 Z12.99 J311.51 F500.0
+G1 X-19.49 Y-65.05 Z12.99 J315.04 F500.0
+G1 X-19.49 Y-67.55 Z12.99 J317.49 F500.0
+G1 X-19.14 Y-67.55 Z12.99 J317.83 F500.0
+G1 X-19.14 Y-65.05 Z12.99 J320.28 F500.0
+G1 X-16.02 Y-63.25 Z12.99 J323.81 F500.0
+G1 X-16.02 Y-59.05 Z12.99 J327.93 F500.0
+G1 X-19.14 Y-57.25 Z12.99 J331.46 F500.0
+G1 X-19.14 Y-53.05 Z12.99 J335.58 F500.0
+G1 X-16.02 Y-51.25 Z12.99 J339.11 F500.0
+G1 X-16.02 Y-47.05 Z12.99 J343.22 F500.0
+G1 X-18.89 Y-45.39 Z12.99 J346.47 F500.0
+G1 X-12.81 Y-45.39 Z12.99 J352.43 F500.0
+G1 X-15.68 Y-47.05 Z12.99 J355.68 F500.0
+G1 X-15.68 Y-51.25 Z12.99 J359.79 F500.0
+G1 X-12.56 Y-53.05 Z12.99 J363.32 F500.0
+G1 X-12.56 Y-57.25 Z12.99 J367.44 F500.0
+G1 X-15.68 Y-59.05 Z12.99 J370.97 F500.0
+G1 X-15.68 Y-63.25 Z12.99 J375.09 F500.0
+G1 X-12.56 Y-65.05 Z12.99 J378.62 F500.0
+G1 X-12.56 Y-67.55 Z12.99 J381.07 F500.0
+G1 X-12.21 Y-67.55 Z12.99 J381.41 F500.0
+G1 X-12.21 Y-65.05 Z12.99 J383.86 F500.0
+G1 X-9.10 Y-63.25 Z12.99 J387.38 F500.0
+G1 X-9.10 Y-59.05 Z12.99 J391.50 F500.0
+G1 X-12.21 Y-57.25 Z12.99 J395.02 F500.0
+G1 X-12.21 Y-53.05 Z12.99 J399.13 F500.0
+G1 X-9.10 Y-51.25 Z12.99 J402.66 F500.0
+G1 X-9.10 Y-47.05 Z12.99 J406.77 F500.0
+G1 X-11.97 Y-45.39 Z12.99 J410.02 F500.0
+G1 X-5.88 Y-45.39 Z12.99 J415.99 F500.0
+G1 X-8.75 Y-47.05 Z12.99 J419.24 F500.0
+G1 X-8.75 Y-51.25 Z12.99 J423.35 F500.0
+G1 X-5.63 Y-53.05 Z12.99 J426.88 F500.0
+G1 X-5.63 Y-57.25 Z12.99 J431.00 F500.0
+G1 X-8.75 Y-59.05 Z12.99 J434.53 F500.0
+G1 X-8.75 Y-63.25 Z12.99 J438.65 F500.0
+G1 X-5.63 Y-65.05 Z12.99 J442.18 F500.0
+G1 X-5.63 Y-67.55 Z12.99 J444.63 F500.0
+G1 X-5.28 Y-67.55 Z12.99 J444.97 F500.0
+G1 X-5.28 Y-65.05 Z12.99 J447.42 F500.0
+G1 X-2.17 Y-63.25 Z12.99 J450.94 F500.0
+G1 X-2.17 Y-59.05 Z12.99 J455.06 F500.0
+G1 X-5.28 Y-57.25 Z12.99 J458.58 F500.0
+G1 X-5.28 Y-53.05 Z12.99 J462.69 F500.0
+G1 X-2.17 Y-51.25 Z12.99 J466.22 F500.0
+G1 X-2.17 Y-47.05 Z12.99 J470.33 F500.0
+G1 X-5.04 Y-45.39 Z12.99 J473.58 F500.0
+G1 X1.05 Y-45.39 Z12.99 J479.55 F500.0
+G1 X-1.82 Y-47.05 Z12.99 J482.80 F500.0
+G1 X-1.82 Y-51.25 Z12.99 J486.91 F500.0
+G1 X1.30 Y-53.05 Z12.99 J490.44 F500.0
+G1 X1.30 Y-57.25 Z12.99 J494.56 F500.0
+G1 X-1.82 Y-59.05 Z12.99 J498.09 F500.0
+G1 X-1.82 Y-63.25 Z12.99 J502.21 F500.0
+G1 X1.30 Y-65.05 Z12.99 J505.74 F500.0
+G1 X1.30 Y-67.55 Z12.99 J508.19 F500.0
+G1 X1.64 Y-67.55 Z12.99 J508.52 F500.0
+G1 X1.64 Y-65.05 Z12.99 J510.97 F500.0
+G1 X4.76 Y-63.25 Z12.99 J514.50 F500.0
+G1 X4.76 Y-59.05 Z12.99 J518.62 F500.0
+G1 X1.64 Y-57.25 Z12.99 J522.15 F500.0
+G1 X1.64 Y-53.05 Z12.99 J526.26 F500.0
+G1 X4.76 Y-51.25 Z12.99 J529.79 F500.0
+G1 X4.76 Y-47.05 Z12.99 J533.91 F500.0
+G1 X1.89 Y-45.39 Z12.99 J537.16 F500.0
+G1 X7.98 Y-45.39 Z12.99 J543.13 F500.0
+G1 X5.11 Y-47.05 Z12.99 J546.37 F500.0
+G1 X5.11 Y-51.25 Z12.99 J550.49 F500.0
+G1 X8.22 Y-53.05 Z12.99 J554.01 F500.0
+G1 X8.22 Y-57.25 Z12.99 J558.13 F500.0
+G1 X5.11 Y-59.05 Z12.99 J561.65 F500.0
+G1 X5.11 Y-63.25 Z12.99 J565.77 F500.0
+G1 X8.22 Y-65.05 Z12.99 J569.29 F500.0
+G1 X8.22 Y-67.55 Z12.99 J571.74 F500.0
+G1 X8.57 Y-67.55 Z12.99 J572.08 F500.0
+G1 X8.57 Y-65.05 Z12.99 J574.53 F500.0
+G1 X11.69 Y-63.25 Z12.99 J578.06 F500.0
+G1 X11.69 Y-59.05 Z12.99 J582.18 F500.0
+G1 X8.57 Y-57.25 Z12.99 J585.71 F500.0
+G1 X8.57 Y-53.05 Z12.99 J589.82 F500.0
+G1 X11.69 Y-51.25 Z12.99 J593.35 F500.0
+G1 X11.69 Y-47.05 Z12.99 J597.47 F500.0
+G1 X8.82 Y-45.39 Z12.99 J600.72 F500.0
+G1 X14.91 Y-45.39 Z12.99 J606.68 F500.0
+G1 X12.03 Y-47.05 Z12.99 J609.94 F500.0
+G1 X12.03 Y-51.25 Z12.99 J614.06 F500.0
+G1 X15.15 Y-53.05 Z12.99 J617.59 F500.0
+G1 X15.15 Y-57.25 Z12.99 J621.70 F500.0
+G1 X12.03 Y-59.05 Z12.99 J625.23 F500.0
+G1 X12.03 Y-63.25 Z12.99 J629.35 F500.0
+G1 X15.15 Y-65.05 Z12.99 J632.88 F500.0
+G1 X15.15 Y-67.55 Z12.99 J635.33 F500.0
+G1 X15.50 Y-67.55 Z12.99 J635.67 F500.0
+G1 X15.50 Y-65.05 Z12.99 J638.12 F500.0
+G1 X18.62 Y-63.25 Z12.99 J641.65 F500.0
+G1 X18.62 Y-59.05 Z12.99 J645.77 F500.0
+G1 X15.50 Y-57.25 Z12.99 J649.30 F500.0
+G1 X15.50 Y-53.05 Z12.99 J653.42 F500.0
+G1 X18.62 Y-51.25 Z12.99 J656.95 F500.0
+G1 X18.62 Y-47.05 Z12.99 J661.06 F500.0
+G1 X15.75 Y-45.39 Z12.99 J664.31 F500.0
+G1 X21.83 Y-45.39 Z12.99 J670.27 F500.0
+G1 X18.96 Y-47.05 Z12.99 J673.52 F500.0
+G1 X18.96 Y-51.25 Z12.99 J677.63 F500.0
+G1 X22.08 Y-53.05 Z12.99 J681.16 F500.0
+G1 X22.08 Y-57.25 Z12.99 J685.28 F500.0
+G1 X18.96 Y-59.05 Z12.99 J688.81 F500.0
+G1 X18.96 Y-63.25 Z12.99 J692.93 F500.0
+G1 X22.08 Y-65.05 Z12.99 J696.46 F500.0
+G1 X22.08 Y-67.55 Z12.99 J698.91 F500.0
+G1 X22.43 Y-67.55 Z12.99 J699.25 F500.0
+G1 X22.43 Y-65.05 Z12.99 J701.70 F500.0
+G1 X25.54 Y-63.25 Z12.99 J705.22 F500.0
+G1 X25.54 Y-59.05 Z12.99 J709.34 F500.0
+G1 X22.43 Y-57.25 Z12.99 J712.86 F500.0
+G1 X22.43 Y-53.05 Z12.99 J716.97 F500.0
+G1 X25.54 Y-51.25 Z12.99 J720.50 F500.0
+G1 X25.54 Y-47.05 Z12.99 J724.61 F500.0
+G1 X22.68 Y-45.39 Z12.99 J727.85 F500.0
+G1 X28.76 Y-45.39 Z12.99 J733.81 F500.0
+G1 X25.89 Y-47.05 Z12.99 J737.06 F500.0
+G1 X25.89 Y-51.25 Z12.99 J741.18 F500.0
+G1 X29.01 Y-53.05 Z12.99 J744.71 F500.0
+G1 X29.01 Y-57.25 Z12.99 J748.82 F500.0
+G1 X25.89 Y-59.05 Z12.99 J752.35 F500.0
+G1 X25.89 Y-63.25 Z12.99 J756.47 F500.0
+G1 X29.01 Y-65.05 Z12.99 J760.00 F500.0
+G1 X29.01 Y-67.55 Z12.99 J762.45 F500.0
+G1 X29.36 Y-67.55 Z12.99 J762.79 F500.0
+G1 X29.36 Y-65.05 Z12.99 J765.24 F500.0
+G1 X32.47 Y-63.25 Z12.99 J768.76 F500.0
+G1 X32.47 Y-59.05 Z12.99 J772.88 F500.0
+G1 X29.36 Y-57.25 Z12.99 J776.40 F500.0
+G1 X29.36 Y-53.05 Z12.99 J780.52 F500.0
+G1 X32.47 Y-51.25 Z12.99 J784.04 F500.0
+G1 X32.47 Y-47.05 Z12.99 J788.15 F500.0
+G1 X29.60 Y-45.39 Z12.99 J791.40 F500.0
+G1 X34.12 Y-46.30 Z12.99 J795.92 F500.0
+G1 X32.82 Y-47.05 Z12.99 J797.39 F500.0
+G1 X32.82 Y-51.25 Z12.99 J801.51 F500.0
+G1 X34.12 Y-52.00 Z12.99 J802.98 F500.0
+G1 X34.12 Y-58.30 Z12.99 J809.15 F500.0
+G1 X32.82 Y-59.05 Z12.99 J810.62 F500.0
+G1 X32.82 Y-63.25 Z12.99 J814.74 F500.0
+G1 X34.12 Y-64.00 Z12.99 J816.21 F500.0
+
+T1
+G1 X33.56 Y-66.99 Z13.99 J0.00 F500.0
+G1 X33.56 Y-61.19 Z13.99 J5.68 F500.0
+G1 X33.56 Y-45.95 Z13.99 J20.62 F500.0
+G1 X21.96 Y-45.95 Z13.99 J31.99 F500.0
+G1 X-27.48 Y-45.95 Z13.99 J80.44 F500.0
+G1 X-27.48 Y-51.75 Z13.99 J86.12 F500.0
+G1 X-27.48 Y-66.99 Z13.99 J101.06 F500.0
+G1 X-15.88 Y-66.99 Z13.99 J112.43 F500.0
+G1 X33.56 Y-66.99 Z13.99 J160.88 F500.0
+G1 X33.56 Y-66.99 Z13.99 J160.88 F500.0
+G1 X-27.48 Y-52.44 Z13.99 J222.37 F500.0
+G1 X-26.42 Y-53.05 Z13.99 J223.57 F500.0
+G1 X-26.42 Y-57.25 Z13.99 J227.69 F500.0
+G1 X-27.48 Y-57.87 Z13.99 J228.89 F500.0
+G1 X-27.48 Y-64.44 Z13.99 J235.33 F500.0
+G1 X-26.42 Y-65.05 Z13.99 J236.53 F500.0
+G1 X-26.42 Y-66.99 Z13.99 J238.43 F500.0
+G1 X-26.07 Y-66.99 Z13.99 J238.77 F500.0
+G1 X-26.07 Y-65.05 Z13.99 J240.67 F500.0
+G1 X-22.95 Y-63.25 Z13.99 J244.20 F500.0
+G1 X-22.95 Y-59.05 Z13.99 J248.32 F500.0
+G1 X-26.07 Y-57.25 Z13.99 J251.85 F500.0
+G1 X-26.07 Y-53.05 Z13.99 J255.96 F500.0
+G1 X-22.95 Y-51.25 Z13.99 J259.49 F500.0
+G1 X-22.95 Y-47.05 Z13.99 J263.61 F500.0
+G1 X-24.86 Y-45.95 Z13.99 J265.77 F500.0
+G1 X-20.70 Y-45.95 Z13.99 J269.85 F500.0
+G1 X-22.61 Y-47.05 Z13.99 J272.01 F500.0
+G1 X-22.61 Y-51.25 Z13.99 J276.12 F500.0
+G1 X-19.49 Y-53.05 Z13.99 J279.65 F500.0
+G1 X-19.49 Y-57.25 Z13.99 J283.77 F500.0
+G1 X-22.61 Y-59.05 Z13.99 J287.30 F500.0
+G1 X-22.61 Y-63.25 Z13.99 J291.42 F500.0
+G1 X-19.49 Y-65.05 Z13.99 J294.95 F500.0
+G1 X-19.49 Y-66.99 Z13.99 J296.85 F500.0
+G1 X-19.14 Y-66.99 Z13.99 J297.19 F500.0
+G1 X-19.14 Y-65.05 Z13.99 J299.09 F500.0
+G1 X-16.02 Y-63.25 Z13.99 J302.62 F500.0
+G1 X-16.02 Y-59.05 Z13.99 J306.74 F500.0
+G1 X-19.14 Y-57.25 Z13.99 J310.27 F500.0
+G1 X-19.14 Y-53.05 Z13.99 J314.38 F500.0
+G1 X-16.02 Y-51.25 Z13.99 J317.91 F500.0
+G1 X-16.02 Y-47.05 Z13.99 J322.03 F500.0
+G1 X-17.93 Y-45.95 Z13.99 J324.19 F500.0
+G1 X-13.77 Y-45.95 Z13.99 J328.27 F500.0
+G1 X-15.68 Y-47.05 Z13.99 J330.43 F500.0
+G1 X-15.68 Y-51.25 Z13.99 J334.54 F500.0
+G1 X-12.56 Y-53.05 Z13.99 J338.07 F500.0
+G1 X-12.56 Y-57.25 Z13.99 J342.19 F500.0
+G1 X-15.68 Y-59.05 Z13.99 J345.72 F500.0
+G1 X-15.68 Y-63.25 Z13.99 J349.83 F500.0
+G1 X-12.56 Y-65.05 Z13.99 J353.36 F500.0
+G1 X-12.56 Y-66.99 Z13.99 J355.26 F500.0
+G1 X-12.21 Y-66.99 Z13.99 J355.61 F500.0
+G1 X-12.21 Y-65.05 Z13.99 J357.51 F500.0
+G1 X-9.10 Y-63.25 Z13.99 J361.03 F500.0
+G1 X-9.10 Y-59.05 Z13.99 J365.15 F500.0
+G1 X-12.21 Y-57.25 Z13.99 J368.67 F500.0
+G1 X-12.21 Y-53.05 Z13.99 J372.78 F500.0
+G1 X-9.10 Y-51.25 Z13.99 J376.30 F500.0
+G1 X-9.10 Y-47.05 Z13.99 J380.42 F500.0
+G1 X-11.00 Y-45.95 Z13.99 J382.57 F500.0
+G1 X-6.84 Y-45.95 Z13.99 J386.65 F500.0
+G1 X-8.75 Y-47.05 Z13.99 J388.81 F500.0
+G1 X-8.75 Y-51.25 Z13.99 J392.93 F500.0
+G1 X-5.63 Y-53.05 Z13.99 J396.46 F500.0
+G1 X-5.63 Y-57.25 Z13.99 J400.57 F500.0
+G1 X-8.75 Y-59.05 Z13.99 J404.10 F500.0
+G1 X-8.75 Y-63.25 Z13.99 J408.22 F500.0
+G1 X-5.63 Y-65.05 Z13.99 J411.75 F500.0
+G1 X-5.63 Y-66.99 Z13.99 J413.65 F500.0
+G1 X-5.28 Y-66.99 Z13.99 J413.99 F500.0
+G1 X-5.28 Y-65.05 Z13.99 J415.89 F500.0
+G1 X-2.17 Y-63.25 Z13.99 J419.41 F500.0
+G1 X-2.17 Y-59.05 Z13.99 J423.53 F500.0
+G1 X-5.28 Y-57.25 Z13.99 J427.05 F500.0
+G1 X-5.28 Y-53.05 Z13.99 J431.17 F500.0
+G1 X-2.17 Y-51.25 Z13.99 J434.69 F500.0
+G1 X-2.17 Y-47.05 Z13.99 J438.80 F500.0
+G1 X-4.08 Y-45.95 Z13.99 J440.97 F500.0
+G1 X0.09 Y-45.95 Z13.99 J445.05 F500.0
+G1 X-1.82 Y-47.05 Z13.99 J447.21 F500.0
+G1 X-1.82 Y-51.25 Z13.99 J451.33 F500.0
+G1 X1.30 Y-53.05 Z13.99 J454.86 F500.0
+G1 X1.30 Y-57.25 Z13.99 J458.97 F500.0
+G1 X-1.82 Y-59.05 Z13.99 J462.50 F500.0
+G1 X-1.82 Y-63.25 Z13.99 J466.62 F500.0
+G1 X1.30 Y-65.05 Z13.99 J470.15 F500.0
+G1 X1.30 Y-66.99 Z13.99 J472.05 F500.0
+G1 X1.64 Y-66.99 Z13.99 J472.38 F500.0
+G1 X1.64 Y-65.05 Z13.99 J474.29 F500.0
+G1 X4.76 Y-63.25 Z13.99 J477.82 F500.0
+G1 X4.76 Y-59.05 Z13.99 J481.93 F500.0
+G1 X1.64 Y-57.25 Z13.99 J485.46 F500.0
+G1 X1.64 Y-53.05 Z13.99 J489.58 F500.0
+G1 X4.76 Y-51.25 Z13.99 J493.11 F500.0
+G1 X4.76 Y-47.05 Z13.99 J497.22 F500.0
+G1 X2.85 Y-45.95 Z13.99 J499.38 F500.0
+G1 X7.02 Y-45.95 Z13.99 J503.47 F500.0
+G1 X5.11 Y-47.05 Z13.99 J505.63 F500.0
+G1 X5.11 Y-51.25 Z13.99 J509.75 F500.0
+G1 X8.22 Y-53.05 Z13.99 J513.27 F500.0
+G1 X8.22 Y-57.25 Z13.99 J517.38 F500.0
+G1 X5.11 Y-59.05 Z13.99 J520.90 F500.0
+G1 X5.11 Y-63.25 Z13.99 J525.02 F500.0
+G1 X8.22 Y-65.05 Z13.99 J528.54 F500.0
+G1 X8.22 Y-66.99 Z13.99 J530.44 F500.0
+G1 X8.57 Y-66.99 Z13.99 J530.79 F500.0
+G1 X8.57 Y-65.05 Z13.99 J532.69 F500.0
+G1 X11.69 Y-63.25 Z13.99 J536.22 F500.0
+G1 X11.69 Y-59.05 Z13.99 J540.33 F500.0
+G1 X8.57 Y-57.25 Z13.99 J543.86 F500.0
+G1 X8.57 Y-53.05 Z13.99 J547.98 F500.0
+G1 X11.69 Y-51.25 Z13.99 J551.51 F500.0
+G1 X11.69 Y-47.05 Z13.99 J555.63 F500.0
+G1 X9.78 Y-45.95 Z13.99 J557.79 F500.0
+G1 X13.94 Y-45.95 Z13.99 J561.86 F500.0
+G1 X12.03 Y-47.05 Z13.99 J564.02 F500.0
+G1 X12.03 Y-51.25 Z13.99 J568.14 F500.0
+G1 X15.15 Y-53.05 Z13.99 J571.67 F500.0
+G1 X15.15 Y-57.25 Z13.99 J575.78 F500.0
+G1 X12.03 Y-59.05 Z13.99 J579.31 F500.0
+G1 X12.03 Y-63.25 Z13.99 J583.43 F500.0
+G1 X15.15 Y-65.05 Z13.99 J586.96 F500.0
+G1 X15.15 Y-66.99 Z13.99 J588.86 F500.0
+G1 X15.50 Y-66.99 Z13.99 J589.20 F500.0
+G1 X15.50 Y-65.05 Z13.99 J591.11 F500.0
+G1 X18.62 Y-63.25 Z13.99 J594.64 F500.0
+G1 X18.62 Y-59.05 Z13.99 J598.75 F500.0
+G1 X15.50 Y-57.25 Z13.99 J602.28 F500.0
+G1 X15.50 Y-53.05 Z13.99 J606.40 F500.0
+G1 X18.62 Y-51.25 Z13.99 J609.93 F500.0
+G1 X18.62 Y-47.05 Z13.99 J614.04 F500.0
+G1 X16.71 Y-45.95 Z13.99 J616.20 F500.0
+G1 X20.87 Y-45.95 Z13.99 J620.28 F500.0
+G1 X18.96 Y-47.05 Z13.99 J622.44 F500.0
+G1 X18.96 Y-51.25 Z13.99 J626.56 F500.0
+G1 X22.08 Y-53.05 Z13.99 J630.09 F500.0
+G1 X22.08 Y-57.25 Z13.99 J634.20 F500.0
+G1 X18.96 Y-59.05 Z13.99 J637.73 F500.0
+G1 X18.96 Y-63.25 Z13.99 J641.85 F500.0
+G1 X22.08 Y-65.05 Z13.99 J645.38 F500.0
+G1 X22.08 Y-66.99 Z13.99 J647.28 F500.0
+G1 X22.43 Y-66.99 Z13.99 J647.62 F500.0
+G1 X22.43 Y-65.05 Z13.99 J649.52 F500.0
+G1 X25.54 Y-63.25 Z13.99 J653.04 F500.0
+G1 X25.54 Y-59.05 Z13.99 J657.16 F500.0
+G1 X22.43 Y-57.25 Z13.99 J660.68 F500.0
+G1 X22.43 Y-53.05 Z13.99 J664.80 F500.0
+G1 X25.54 Y-51.25 Z13.99 J668.32 F500.0
+G1 X25.54 Y-47.05 Z13.99 J672.44 F500.0
+G1 X23.64 Y-45.95 Z13.99 J674.59 F500.0
+G1 X27.80 Y-45.95 Z13.99 J678.66 F500.0
+G1 X25.89 Y-47.05 Z13.99 J680.82 F500.0
+G1 X25.89 Y-51.25 Z13.99 J684.94 F500.0
+G1 X29.01 Y-53.05 Z13.99 J688.47 F500.0
+G1 X29.01 Y-57.25 Z13.99 J692.59 F500.0
+G1 X25.89 Y-59.05 Z13.99 J696.12 F500.0
+G1 X25.89 Y-63.25 Z13.99 J700.23 F500.0
+G1 X29.01 Y-65.05 Z13.99 J703.76 F500.0
+G1 X29.01 Y-66.99 Z13.99 J705.66 F500.0
+G1 X29.36 Y-66.99 Z13.99 J706.01 F500.0
+G1 X29.36 Y-65.05 Z13.99 J707.91 F500.0
+G1 X32.47 Y-63.25 Z13.99 J711.43 F500.0
+G1 X32.47 Y-59.05 Z13.99 J715.55 F500.0
+G1 X29.36 Y-57.25 Z13.99 J719.07 F500.0
+G1 X29.36 Y-53.05 Z13.99 J723.18 F500.0
+G1 X32.47 Y-51.25 Z13.99 J726.70 F500.0
+G1 X32.47 Y-47.05 Z13.99 J730.82 F500.0
+G1 X30.56 Y-45.95 Z13.99 J732.98 F500.0
+G1 X33.56 Y-46.62 Z13.99 J735.99 F500.0
+G1 X32.82 Y-47.05 Z13.99 J736.83 F500.0
+G1 X32.82 Y-51.25 Z13.99 J740.95 F500.0
+G1 X33.56 Y-51.68 Z13.99 J741.79 F500.0
+G1 X33.56 Y-58.62 Z13.99 J748.59 F500.0
+G1 X32.82 Y-59.05 Z13.99 J749.43 F500.0
+G1 X32.82 Y-63.25 Z13.99 J753.54 F500.0
+G1 X33.56 Y-63.68 Z13.99 J754.38 F500.0
+
+T1
+G1 X33.01 Y-66.44 Z14.99 J0.00 F500.0
+G1 X33.01 Y-62.64 Z14.99 J3.72 F500.0
+G1 X33.01 Y-46.50 Z14.99 J19.54 F500.0
+G1 X25.41 Y-46.50 Z14.99 J26.99 F500.0
+G1 X-26.93 Y-46.50 Z14.99 J78.28 F500.0
+G1 X-26.93 Y-50.30 Z14.99 J82.01 F500.0
+G1 X-26.93 Y-66.44 Z14.99 J97.82 F500.0
+G1 X-19.33 Y-66.44 Z14.99 J105.27 F500.0
+G1 X33.01 Y-66.44 Z14.99 J156.56 F500.0
+G1 X33.01 Y-66.44 Z14.99 J156.56 F500.0
+G1 X-26.93 Y-52.76 Z14.99 J216.82 F500.0
+G1 X-26.42 Y-53.05 Z14.99 J217.39 F500.0
+G1 X-26.42 Y-57.25 Z14.99 J221.51 F500.0
+G1 X-26.93 Y-57.55 Z14.99 J222.09 F500.0
+G1 X-26.93 Y-64.76 Z14.99 J229.15 F500.0
+G1 X-26.42 Y-65.05 Z14.99 J229.73 F500.0
+G1 X-26.42 Y-66.44 Z14.99 J231.09 F500.0
+G1 X-26.07 Y-66.44 Z14.99 J231.43 F500.0
+G1 X-26.07 Y-65.05 Z14.99 J232.80 F500.0
+G1 X-22.95 Y-63.25 Z14.99 J236.33 F500.0
+G1 X-22.95 Y-59.05 Z14.99 J240.44 F500.0
+G1 X-26.07 Y-57.25 Z14.99 J243.97 F500.0
+G1 X-26.07 Y-53.05 Z14.99 J248.09 F500.0
+G1 X-22.95 Y-51.25 Z14.99 J251.62 F500.0
+G1 X-22.95 Y-47.05 Z14.99 J255.73 F500.0
+G1 X-23.90 Y-46.50 Z14.99 J256.81 F500.0
+G1 X-21.66 Y-46.50 Z14.99 J259.00 F500.0
+G1 X-22.61 Y-47.05 Z14.99 J260.08 F500.0
+G1 X-22.61 Y-51.25 Z14.99 J264.20 F500.0
+G1 X-19.49 Y-53.05 Z14.99 J267.73 F500.0
+G1 X-19.49 Y-57.25 Z14.99 J271.84 F500.0
+G1 X-22.61 Y-59.05 Z14.99 J275.37 F500.0
+G1 X-22.61 Y-63.25 Z14.99 J279.49 F500.0
+G1 X-19.49 Y-65.05 Z14.99 J283.02 F500.0
+G1 X-19.49 Y-66.44 Z14.99 J284.38 F500.0
+G1 X-19.14 Y-66.44 Z14.99 J284.72 F500.0
+G1 X-19.14 Y-65.05 Z14.99 J286.09 F500.0
+G1 X-16.02 Y-63.25 Z14.99 J289.62 F500.0
+G1 X-16.02 Y-59.05 Z14.99 J293.73 F500.0
+G1 X-19.14 Y-57.25 Z14.99 J297.26 F500.0
+G1 X-19.14 Y-53.05 Z14.99 J301.38 F500.0
+G1 X-16.02 Y-51.25 Z14.99 J304.91 F500.0
+G1 X-16.02 Y-47.05 Z14.99 J309.02 F500.0
+G1 X-16.97 Y-46.50 Z14.99 J310.10 F500.0
+G1 X-14.73 Y-46.50 Z14.99 J312.29 F500.0
+G1 X-15.68 Y-47.05 Z14.99 J313.37 F500.0
+G1 X-15.68 Y-51.25 Z14.99 J317.49 F500.0
+G1 X-12.56 Y-53.05 Z14.99 J321.02 F500.0
+G1 X-12.56 Y-57.25 Z14.99 J325.13 F500.0
+G1 X-15.68 Y-59.05 Z14.99 J328.66 F500.0
+G1 X-15.68 Y-63.25 Z14.99 J332.78 F500.0
+G1 X-12.56 Y-65.05 Z14.99 J336.31 F500.0
+G1 X-12.56 Y-66.44 Z14.99 J337.67 F500.0
+G1 X-12.21 Y-66.44 Z14.99 J338.01 F500.0
+G1 X-12.21 Y-65.05 Z14.99 J339.38 F500.0
+G1 X-9.10 Y-63.25 Z14.99 J342.90 F500.0
+G1 X-9.10 Y-59.05 Z14.99 J347.01 F500.0
+G1 X-12.21 Y-57.25 Z14.99 J350.53 F500.0
+G1 X-12.21 Y-53.05 Z14.99 J354.65 F500.0
+G1 X-9.10 Y-51.25 Z14.99 J358.17 F500.0
+G1 X-9.10 Y-47.05 Z14.99 J362.29 F500.0
+G1 X-10.05 Y-46.50 Z14.99 J363.36 F500.0
+G1 X-7.80 Y-46.50 Z14.99 J365.57 F500.0
+G1 X-8.75 Y-47.05 Z14.99 J366.64 F500.0
+G1 X-8.75 Y-51.25 Z14.99 J370.76 F500.0
+G1 X-5.63 Y-53.05 Z14.99 J374.29 F500.0
+G1 X-5.63 Y-57.25 Z14.99 J378.41 F500.0
+G1 X-8.75 Y-59.05 Z14.99 J381.94 F500.0
+G1 X-8.75 Y-63.25 Z14.99 J386.05 F500.0
+G1 X-5.63 Y-65.05 Z14.99 J389.58 F500.0
+G1 X-5.63 Y-66.44 Z14.99 J390.94 F500.0
+G1 X-5.28 Y-66.44 Z14.99 J391.29 F500.0
+G1 X-5.28 Y-65.05 Z14.99 J392.65 F500.0
+G1 X-2.17 Y-63.25 Z14.99 J396.17 F500.0
+G1 X-2.17 Y-59.05 Z14.99 J400.29 F500.0
+G1 X-5.28 Y-57.25 Z14.99 J403.81 F500.0
+G1 X-5.28 Y-53.05 Z14.99 J407.92 F500.0
+G1 X-2.17 Y-51.25 Z14.99 J411.45 F500.0
+G1 X-2.17 Y-47.05 Z14.99 J415.56 F500.0
+G1 X-3.12 Y-46.50 Z14.99 J416.64 F500.0
+G1 X-0.87 Y-46.50 Z14.99 J418.84 F500.0
+G1 X-1.82 Y-47.05 Z14.99 J419.92 F500.0
+G1 X-1.82 Y-51.25 Z14.99 J424.03 F500.0
+G1 X1.30 Y-53.05 Z14.99 J427.56 F500.0
+G1 X1.30 Y-57.25 Z14.99 J431.68 F500.0
+G1 X-1.82 Y-59.05 Z14.99 J435.21 F500.0
+G1 X-1.82 Y-63.25 Z14.99 J439.33 F500.0
+G1 X1.30 Y-65.05 Z14.99 J442.86 F500.0
+G1 X1.30 Y-66.44 Z14.99 J444.22 F500.0
+G1 X1.64 Y-66.44 Z14.99 J444.55 F500.0
+G1 X1.64 Y-65.05 Z14.99 J445.91 F500.0
+G1 X4.76 Y-63.25 Z14.99 J449.44 F500.0
+G1 X4.76 Y-59.05 Z14.99 J453.56 F500.0
+G1 X1.64 Y-57.25 Z14.99 J457.09 F500.0
+G1 X1.64 Y-53.05 Z14.99 J461.21 F500.0
+G1 X4.76 Y-51.25 Z14.99 J464.74 F500.0
+G1 X4.76 Y-47.05 Z14.99 J468.85 F500.0
+G1 X3.81 Y-46.50 Z14.99 J469.93 F500.0
+G1 X6.06 Y-46.50 Z14.99 J472.13 F500.0
+G1 X5.11 Y-47.05 Z14.99 J473.21 F500.0
+G1 X5.11 Y-51.25 Z14.99 J477.32 F500.0
+G1 X8.22 Y-53.05 Z14.99 J480.85 F500.0
+G1 X8.22 Y-57.25 Z14.99 J484.96 F500.0
+G1 X5.11 Y-59.05 Z14.99 J488.48 F500.0
+G1 X5.11 Y-63.25 Z14.99 J492.60 F500.0
+G1 X8.22 Y-65.05 Z14.99 J496.12 F500.0
+G1 X8.22 Y-66.44 Z14.99 J497.48 F500.0
+G1 X8.57 Y-66.44 Z14.99 J497.83 F500.0
+G1 X8.57 Y-65.05 Z14.99 J499.19 F500.0
+G1 X11.69 Y-63.25 Z14.99 J502.72 F500.0
+G1 X11.69 Y-59.05 Z14.99 J506.83 F500.0
+G1 X8.57 Y-57.25 Z14.99 J510.36 F500.0
+G1 X8.57 Y-53.05 Z14.99 J514.48 F500.0
+G1 X11.69 Y-51.25 Z14.99 J518.01 F500.0
+G1 X11.69 Y-47.05 Z14.99 J522.13 F500.0
+G1 X10.74 Y-46.50 Z14.99 J523.20 F500.0
+G1 X12.98 Y-46.50 Z14.99 J525.40 F500.0
+G1 X12.03 Y-47.05 Z14.99 J526.47 F500.0
+G1 X12.03 Y-51.25 Z14.99 J530.59 F500.0
+G1 X15.15 Y-53.05 Z14.99 J534.12 F500.0
+G1 X15.15 Y-57.25 Z14.99 J538.23 F500.0
+G1 X12.03 Y-59.05 Z14.99 J541.76 F500.0
+G1 X12.03 Y-63.25 Z14.99 J545.88 F500.0
+G1 X15.15 Y-65.05 Z14.99 J549.41 F500.0
+G1 X15.15 Y-66.44 Z14.99 J550.77 F500.0
+G1 X15.50 Y-66.44 Z14.99 J551.12 F500.0
+G1 X15.50 Y-65.05 Z14.99 J552.48 F500.0
+G1 X18.62 Y-63.25 Z14.99 J556.01 F500.0
+G1 X18.62 Y-59.05 Z14.99 J560.12 F500.0
+G1 X15.50 Y-57.25 Z14.99 J563.65 F500.0
+G1 X15.50 Y-53.05 Z14.99 J567.77 F500.0
+G1 X18.62 Y-51.25 Z14.99 J571.30 F500.0
+G1 X18.62 Y-47.05 Z14.99 J575.42 F500.0
+G1 X17.67 Y-46.50 Z14.99 J576.49 F500.0
+G1 X19.91 Y-46.50 Z14.99 J578.69 F500.0
+G1 X18.96 Y-47.05 Z14.99 J579.76 F500.0
+G1 X18.96 Y-51.25 Z14.99 J583.88 F500.0
+G1 X22.08 Y-53.05 Z14.99 J587.41 F500.0
+G1 X22.08 Y-57.25 Z14.99 J591.52 F500.0
+G1 X18.96 Y-59.05 Z14.99 J595.05 F500.0
+G1 X18.96 Y-63.25 Z14.99 J599.17 F500.0
+G1 X22.08 Y-65.05 Z14.99 J602.70 F500.0
+G1 X22.08 Y-66.44 Z14.99 J604.06 F500.0
+G1 X22.43 Y-66.44 Z14.99 J604.41 F500.0
+G1 X22.43 Y-65.05 Z14.99 J605.77 F500.0
+G1 X25.54 Y-63.25 Z14.99 J609.29 F500.0
+G1 X25.54 Y-59.05 Z14.99 J613.41 F500.0
+G1 X22.43 Y-57.25 Z14.99 J616.93 F500.0
+G1 X22.43 Y-53.05 Z14.99 J621.04 F500.0
+G1 X25.54 Y-51.25 Z14.99 J624.56 F500.0
+G1 X25.54 Y-47.05 Z14.99 J628.68 F500.0
+G1 X24.60 Y-46.50 Z14.99 J629.75 F500.0
+G1 X26.84 Y-46.50 Z14.99 J631.94 F500.0
+G1 X25.89 Y-47.05 Z14.99 J633.02 F500.0
+G1 X25.89 Y-51.25 Z14.99 J637.13 F500.0
+G1 X29.01 Y-53.05 Z14.99 J640.66 F500.0
+G1 X29.01 Y-57.25 Z14.99 J644.78 F500.0
+G1 X25.89 Y-59.05 Z14.99 J648.31 F500.0
+G1 X25.89 Y-63.25 Z14.99 J652.43 F500.0
+G1 X29.01 Y-65.05 Z14.99 J655.96 F500.0
+G1 X29.01 Y-66.44 Z14.99 J657.32 F500.0
+G1 X29.36 Y-66.44 Z14.99 J657.66 F500.0
+G1 X29.36 Y-65.05 Z14.99 J659.02 F500.0
+G1 X32.47 Y-63.25 Z14.99 J662.55 F500.0
+G1 X32.47 Y-59.05 Z14.99 J666.66 F500.0
+G1 X29.36 Y-57.25 Z14.99 J670.18 F500.0
+G1 X29.36 Y-53.05 Z14.99 J674.30 F500.0
+G1 X32.47 Y-51.25 Z14.99 J677.82 F500.0
+G1 X32.47 Y-47.05 Z14.99 J681.94 F500.0
+G1 X31.52 Y-46.50 Z14.99 J683.01 F500.0
+G1 X33.01 Y-46.94 Z14.99 J684.53 F500.0
+G1 X32.82 Y-47.05 Z14.99 J684.75 F500.0
+G1 X32.82 Y-51.25 Z14.99 J688.87 F500.0
+G1 X33.01 Y-51.36 Z14.99 J689.08 F500.0
+G1 X33.01 Y-58.94 Z14.99 J696.51 F500.0
+G1 X32.82 Y-59.05 Z14.99 J696.72 F500.0
+G1 X32.82 Y-63.25 Z14.99 J700.84 F500.0
+G1 X33.01 Y-63.36 Z14.99 J701.06 F500.0
+
+T1
+G1 X32.45 Y-65.88 Z15.99 J0.00 F500.0
+G1 X32.45 Y-64.08 Z15.99 J1.76 F500.0
+G1 X32.45 Y-47.06 Z15.99 J18.44 F500.0
+G1 X28.85 Y-47.06 Z15.99 J21.97 F500.0
+G1 X-26.37 Y-47.06 Z15.99 J76.09 F500.0
+G1 X-26.37 Y-48.86 Z15.99 J77.85 F500.0
+G1 X-26.37 Y-65.88 Z15.99 J94.53 F500.0
+G1 X-22.77 Y-65.88 Z15.99 J98.06 F500.0
+G1 X32.45 Y-65.88 Z15.99 J152.17 F500.0
+G1 X32.45 Y-65.88 Z15.99 J152.17 F500.0
+G1 X-26.07 Y-65.88 Z15.99 J209.52 F500.0
+G1 X-26.07 Y-65.05 Z15.99 J210.34 F500.0
+G1 X-22.95 Y-63.25 Z15.99 J213.87 F500.0
+G1 X-22.95 Y-59.05 Z15.99 J217.98 F500.0
+G1 X-26.07 Y-57.25 Z15.99 J221.51 F500.0
+G1 X-26.07 Y-53.05 Z15.99 J225.63 F500.0
+G1 X-22.95 Y-51.25 Z15.99 J229.16 F500.0
+G1 X-22.95 Y-47.06 Z15.99 J233.27 F500.0
+G1 X-22.61 Y-47.06 Z15.99 J233.60 F500.0
+G1 X-22.61 Y-51.25 Z15.99 J237.70 F500.0
+G1 X-19.49 Y-53.05 Z15.99 J241.23 F500.0
+G1 X-19.49 Y-57.25 Z15.99 J245.35 F500.0
+G1 X-22.61 Y-59.05 Z15.99 J248.88 F500.0
+G1 X-22.61 Y-63.25 Z15.99 J253.00 F500.0
+G1 X-19.49 Y-65.05 Z15.99 J256.53 F500.0
+G1 X-19.49 Y-65.88 Z15.99 J257.34 F500.0
+G1 X-19.14 Y-65.88 Z15.99 J257.68 F500.0
+G1 X-19.14 Y-65.05 Z15.99 J258.50 F500.0
+G1 X-16.02 Y-63.25 Z15.99 J262.03 F500.0
+G1 X-16.02 Y-59.05 Z15.99 J266.14 F500.0
+G1 X-19.14 Y-57.25 Z15.99 J269.67 F500.0
+G1 X-19.14 Y-53.05 Z15.99 J273.79 F500.0
+G1 X-16.02 Y-51.25 Z15.99 J277.32 F500.0
+G1 X-16.02 Y-47.06 Z15.99 J281.42 F500.0
+G1 X-15.68 Y-47.06 Z15.99 J281.76 F500.0
+G1 X-15.68 Y-51.25 Z15.99 J285.86 F500.0
+G1 X-12.56 Y-53.05 Z15.99 J289.39 F500.0
+G1 X-12.56 Y-57.25 Z15.99 J293.51 F500.0
+G1 X-15.68 Y-59.05 Z15.99 J297.04 F500.0
+G1 X-15.68 Y-63.25 Z15.99 J301.16 F500.0
+G1 X-12.56 Y-65.05 Z15.99 J304.69 F500.0
+G1 X-12.56 Y-65.88 Z15.99 J305.50 F500.0
+G1 X-12.21 Y-65.88 Z15.99 J305.84 F500.0
+G1 X-12.21 Y-65.05 Z15.99 J306.66 F500.0
+G1 X-9.10 Y-63.25 Z15.99 J310.18 F500.0
+G1 X-9.10 Y-59.05 Z15.99 J314.29 F500.0
+G1 X-12.21 Y-57.25 Z15.99 J317.81 F500.0
+G1 X-12.21 Y-53.05 Z15.99 J321.93 F500.0
+G1 X-9.10 Y-51.25 Z15.99 J325.45 F500.0
+G1 X-9.10 Y-47.06 Z15.99 J329.56 F500.0
+G1 X-8.75 Y-47.06 Z15.99 J329.90 F500.0
+G1 X-8.75 Y-51.25 Z15.99 J334.01 F500.0
+G1 X-5.63 Y-53.05 Z15.99 J337.54 F500.0
+G1 X-5.63 Y-57.25 Z15.99 J341.65 F500.0
+G1 X-8.75 Y-59.05 Z15.99 J345.18 F500.0
+G1 X-8.75 Y-63.25 Z15.99 J349.30 F500.0
+G1 X-5.63 Y-65.05 Z15.99 J352.83 F500.0
+G1 X-5.63 Y-65.88 Z15.99 J353.64 F500.0
+G1 X-5.28 Y-65.88 Z15.99 J353.99 F500.0
+G1 X-5.28 Y-65.05 Z15.99 J354.80 F500.0
+G1 X-2.17 Y-63.25 Z15.99 J358.32 F500.0
+G1 X-2.17 Y-59.05 Z15.99 J362.44 F500.0
+G1 X-5.28 Y-57.25 Z15.99 J365.96 F500.0
+G1 X-5.28 Y-53.05 Z15.99 J370.07 F500.0
+G1 X-2.17 Y-51.25 Z15.99 J373.60 F500.0
+G1 X-2.17 Y-47.06 Z15.99 J377.70 F500.0
+G1 X-1.82 Y-47.06 Z15.99 J378.04 F500.0
+G1 X-1.82 Y-51.25 Z15.99 J382.15 F500.0
+G1 X1.30 Y-53.05 Z15.99 J385.68 F500.0
+G1 X1.30 Y-57.25 Z15.99 J389.80 F500.0
+G1 X-1.82 Y-59.05 Z15.99 J393.33 F500.0
+G1 X-1.82 Y-63.25 Z15.99 J397.44 F500.0
+G1 X1.30 Y-65.05 Z15.99 J400.97 F500.0
+G1 X1.30 Y-65.88 Z15.99 J401.79 F500.0
+G1 X1.64 Y-65.88 Z15.99 J402.12 F500.0
+G1 X1.64 Y-65.05 Z15.99 J402.93 F500.0
+G1 X4.76 Y-63.25 Z15.99 J406.46 F500.0
+G1 X4.76 Y-59.05 Z15.99 J410.58 F500.0
+G1 X1.64 Y-57.25 Z15.99 J414.11 F500.0
+G1 X1.64 Y-53.05 Z15.99 J418.22 F500.0
+G1 X4.76 Y-51.25 Z15.99 J421.75 F500.0
+G1 X4.76 Y-47.06 Z15.99 J425.86 F500.0
+G1 X5.11 Y-47.06 Z15.99 J426.20 F500.0
+G1 X5.11 Y-51.25 Z15.99 J430.31 F500.0
+G1 X8.22 Y-53.05 Z15.99 J433.83 F500.0
+G1 X8.22 Y-57.25 Z15.99 J437.95 F500.0
+G1 X5.11 Y-59.05 Z15.99 J441.47 F500.0
+G1 X5.11 Y-63.25 Z15.99 J445.59 F500.0
+G1 X8.22 Y-65.05 Z15.99 J449.11 F500.0
+G1 X8.22 Y-65.88 Z15.99 J449.92 F500.0
+G1 X8.57 Y-65.88 Z15.99 J450.26 F500.0
+G1 X8.57 Y-65.05 Z15.99 J451.08 F500.0
+G1 X11.69 Y-63.25 Z15.99 J454.61 F500.0
+G1 X11.69 Y-59.05 Z15.99 J458.72 F500.0
+G1 X8.57 Y-57.25 Z15.99 J462.25 F500.0
+G1 X8.57 Y-53.05 Z15.99 J466.37 F500.0
+G1 X11.69 Y-51.25 Z15.99 J469.90 F500.0
+G1 X11.69 Y-47.06 Z15.99 J474.00 F500.0
+G1 X12.03 Y-47.06 Z15.99 J474.34 F500.0
+G1 X12.03 Y-51.25 Z15.99 J478.44 F500.0
+G1 X15.15 Y-53.05 Z15.99 J481.97 F500.0
+G1 X15.15 Y-57.25 Z15.99 J486.09 F500.0
+G1 X12.03 Y-59.05 Z15.99 J489.62 F500.0
+G1 X12.03 Y-63.25 Z15.99 J493.74 F500.0
+G1 X15.15 Y-65.05 Z15.99 J497.27 F500.0
+G1 X15.15 Y-65.88 Z15.99 J498.08 F500.0
+G1 X15.50 Y-65.88 Z15.99 J498.42 F500.0
+G1 X15.50 Y-65.05 Z15.99 J499.24 F500.0
+G1 X18.62 Y-63.25 Z15.99 J502.77 F500.0
+G1 X18.62 Y-59.05 Z15.99 J506.88 F500.0
+G1 X15.50 Y-57.25 Z15.99 J510.41 F500.0
+G1 X15.50 Y-53.05 Z15.99 J514.53 F500.0
+G1 X18.62 Y-51.25 Z15.99 J518.06 F500.0
+G1 X18.62 Y-47.06 Z15.99 J522.16 F500.0
+G1 X18.96 Y-47.06 Z15.99 J522.50 F500.0
+G1 X18.96 Y-51.25 Z15.99 J526.60 F500.0
+G1 X22.08 Y-53.05 Z15.99 J530.13 F500.0
+G1 X22.08 Y-57.25 Z15.99 J534.25 F500.0
+G1 X18.96 Y-59.05 Z15.99 J537.78 F500.0
+G1 X18.96 Y-63.25 Z15.99 J541.89 F500.0
+G1 X22.08 Y-65.05 Z15.99 J545.42 F500.0
+G1 X22.08 Y-65.88 Z15.99 J546.24 F500.0
+G1 X22.43 Y-65.88 Z15.99 J546.58 F500.0
+G1 X22.43 Y-65.05 Z15.99 J547.39 F500.0
+G1 X25.54 Y-63.25 Z15.99 J550.92 F500.0
+G1 X25.54 Y-59.05 Z15.99 J555.03 F500.0
+G1 X22.43 Y-57.25 Z15.99 J558.55 F500.0
+G1 X22.43 Y-53.05 Z15.99 J562.67 F500.0
+G1 X25.54 Y-51.25 Z15.99 J566.19 F500.0
+G1 X25.54 Y-47.06 Z15.99 J570.30 F500.0
+G1 X25.89 Y-47.06 Z15.99 J570.64 F500.0
+G1 X25.89 Y-51.25 Z15.99 J574.75 F500.0
+G1 X29.01 Y-53.05 Z15.99 J578.28 F500.0
+G1 X29.01 Y-57.25 Z15.99 J582.39 F500.0
+G1 X25.89 Y-59.05 Z15.99 J585.92 F500.0
+G1 X25.89 Y-63.25 Z15.99 J590.04 F500.0
+G1 X29.01 Y-65.05 Z15.99 J593.57 F500.0
+G1 X29.01 Y-65.88 Z15.99 J594.38 F500.0
+G1 X29.36 Y-65.88 Z15.99 J594.72 F500.0
+G1 X29.36 Y-65.05 Z15.99 J595.54 F500.0
+G1 X32.45 Y-63.26 Z15.99 J599.04 F500.0
+G1 X32.45 Y-59.04 Z15.99 J603.17 F500.0
+G1 X29.36 Y-57.25 Z15.99 J606.67 F500.0
+G1 X29.36 Y-53.05 Z15.99 J610.79 F500.0
+G1 X32.45 Y-51.26 Z15.99 J614.29 F500.0
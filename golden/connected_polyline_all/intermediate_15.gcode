@@ -0,0 +1,5548 @@
+T1
+G1 X42.99 Y-76.42 Z-3.01 J0.00 F300.0
+G1 X42.99 Y-36.61 Z-3.01 J39.01 F300.0
+G1 X42.99 Y-36.52 Z-3.01 J39.10 F300.0
+G1 X-36.62 Y-36.52 Z-3.01 J117.12 F300.0
+G1 X-36.91 Y-36.52 Z-3.01 J117.40 F500.0
+G1 X-36.91 Y-76.33 Z-3.01 J156.42 F500.0
+G1 X-36.91 Y-76.42 Z-3.01 J156.51 F500.0
+G1 X37.70 Y-76.42 Z-3.01 J234.62 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X42.70 Y-76.42 Z-3.01 J234.62 F800.0
+G1 X42.70 Y-76.42 Z6.99 J234.62 F800.0
+G1 X37.70 Y-81.42 Z6.99 J244.62 F800.0
+
+T1
+G1 X42.70 Y-76.42 Z-3.01 J0.00 F300.0
+G1 X-36.91 Y-75.31 Z-3.01 J78.03 F300.0
+G1 X-36.81 Y-75.25 Z-3.01 J78.14 F300.0
+G1 X-36.81 Y-71.05 Z-3.01 J82.26 F300.0
+G1 X-36.91 Y-71.00 Z-3.01 J82.37 F500.0
+G1 X-36.91 Y-63.31 Z-3.01 J89.91 F500.0
+G1 X-36.81 Y-63.25 Z-3.01 J90.02 F500.0
+G1 X-36.81 Y-59.05 Z-3.01 J94.14 F500.0
+G1 X-36.91 Y-58.99 Z-3.01 J94.25 F500.0
+G1 X-36.91 Y-51.31 Z-3.01 J101.78 F500.0
+G1 X-36.81 Y-51.25 Z-3.01 J101.89 F500.0
+G1 X-36.81 Y-47.05 Z-3.01 J106.01 F500.0
+G1 X-36.91 Y-47.00 Z-3.01 J106.12 F500.0
+G1 X-36.91 Y-39.31 Z-3.01 J113.65 F500.0
+G1 X-36.81 Y-39.25 Z-3.01 J113.77 F500.0
+G1 X-36.81 Y-36.52 Z-3.01 J116.44 F500.0
+G1 X-36.46 Y-36.52 Z-3.01 J116.78 F500.0
+G1 X-36.46 Y-39.25 Z-3.01 J119.46 F500.0
+G1 X-33.34 Y-41.05 Z-3.01 J122.99 F500.0
+G1 X-33.34 Y-45.25 Z-3.01 J127.11 F500.0
+G1 X-36.46 Y-47.05 Z-3.01 J130.64 F500.0
+G1 X-36.46 Y-51.25 Z-3.01 J134.75 F500.0
+G1 X-33.34 Y-53.05 Z-3.01 J138.28 F500.0
+G1 X-33.34 Y-57.25 Z-3.01 J142.40 F500.0
+G1 X-36.46 Y-59.05 Z-3.01 J145.93 F500.0
+G1 X-36.46 Y-63.25 Z-3.01 J150.04 F500.0
+G1 X-33.34 Y-65.05 Z-3.01 J153.57 F500.0
+G1 X-33.34 Y-69.25 Z-3.01 J157.69 F500.0
+G1 X-36.46 Y-71.05 Z-3.01 J161.22 F500.0
+G1 X-36.46 Y-75.25 Z-3.01 J165.34 F500.0
+G1 X-34.45 Y-76.42 Z-3.01 J167.62 F500.0
+G1 X-31.90 Y-76.42 Z-3.01 J170.11 F500.0
+G1 X-29.88 Y-75.25 Z-3.01 J172.40 F500.0
+G1 X-29.88 Y-71.05 Z-3.01 J176.52 F500.0
+G1 X-33.00 Y-69.25 Z-3.01 J180.05 F500.0
+G1 X-33.00 Y-65.05 Z-3.01 J184.16 F500.0
+G1 X-29.88 Y-63.25 Z-3.01 J187.69 F500.0
+G1 X-29.88 Y-59.05 Z-3.01 J191.81 F500.0
+G1 X-33.00 Y-57.25 Z-3.01 J195.34 F500.0
+G1 X-33.00 Y-53.05 Z-3.01 J199.46 F500.0
+G1 X-29.88 Y-51.25 Z-3.01 J202.99 F500.0
+G1 X-29.88 Y-47.05 Z-3.01 J207.10 F500.0
+G1 X-33.00 Y-45.25 Z-3.01 J210.63 F500.0
+G1 X-33.00 Y-41.05 Z-3.01 J214.75 F500.0
+G1 X-29.88 Y-39.25 Z-3.01 J218.28 F500.0
+G1 X-29.88 Y-36.52 Z-3.01 J220.95 F500.0
+G1 X-29.53 Y-36.52 Z-3.01 J221.30 F500.0
+G1 X-29.53 Y-39.25 Z-3.01 J223.97 F500.0
+G1 X-26.42 Y-41.05 Z-3.01 J227.49 F500.0
+G1 X-26.42 Y-45.25 Z-3.01 J231.61 F500.0
+G1 X-29.53 Y-47.05 Z-3.01 J235.13 F500.0
+G1 X-29.53 Y-51.25 Z-3.01 J239.25 F500.0
+G1 X-26.42 Y-53.05 Z-3.01 J242.77 F500.0
+G1 X-26.42 Y-57.25 Z-3.01 J246.88 F500.0
+G1 X-29.53 Y-59.05 Z-3.01 J250.41 F500.0
+G1 X-29.53 Y-63.25 Z-3.01 J254.52 F500.0
+G1 X-26.42 Y-65.05 Z-3.01 J258.04 F500.0
+G1 X-26.42 Y-69.25 Z-3.01 J262.16 F500.0
+G1 X-29.53 Y-71.05 Z-3.01 J265.68 F500.0
+G1 X-29.53 Y-75.25 Z-3.01 J269.80 F500.0
+G1 X-27.52 Y-76.42 Z-3.01 J272.08 F500.0
+G1 X-24.97 Y-76.42 Z-3.01 J274.57 F500.0
+G1 X-22.95 Y-75.25 Z-3.01 J276.86 F500.0
+G1 X-22.95 Y-71.05 Z-3.01 J280.98 F500.0
+G1 X-26.07 Y-69.25 Z-3.01 J284.51 F500.0
+G1 X-26.07 Y-65.05 Z-3.01 J288.62 F500.0
+G1 X-22.95 Y-63.25 Z-3.01 J292.15 F500.0
+G1 X-22.95 Y-59.05 Z-3.01 J296.27 F500.0
+G1 X-26.07 Y-57.25 Z-3.01 J299.80 F500.0
+G1 X-26.07 Y-53.05 Z-3.01 J303.92 F500.0
+G1 X-22.95 Y-51.25 Z-3.01 J307.45 F500.0
+G1 X-22.95 Y-47.05 Z-3.01 J311.56 F500.0
+G1 X-26.07 Y-45.25 Z-3.01 J315.09 F500.0
+G1 X-26.07 Y-41.05 Z-3.01 J319.21 F500.0
+G1 X-22.95 Y-39.25 Z-3.01 J322.74 F500.0
+G1 X-22.95 Y-36.52 Z-3.01 J325.41 F500.0
+G1 X-22.61 Y-36.52 Z-3.01 J325.75 F500.0
+G1 X-22.61 Y-39.25 Z-3.01 J328.42 F500.0
+G1 X-19.49 Y-41.05 Z-3.01 J331.95 F500.0
+G1 X-19.49 Y-45.25 Z-3.01 J336.07 F500.0
+G1 X-22.61 Y-47.05 Z-3.01 J339.60 F500.0
+G1 X-22.61 Y-51.25 Z-3.01 J343.71 F500.0
+G1 X-19.49 Y-53.05 Z-3.01 J347.24 F500.0
+G1 X-19.49 Y-57.25 Z-3.01 J351.36 F500.0
+G1 X-22.61 Y-59.05 Z-3.01 J354.89 F500.0
+G1 X-22.61 Y-63.25 Z-3.01 J359.01 F500.0
+G1 X-19.49 Y-65.05 Z-3.01 J362.54 F500.0
+G1 X-19.49 Y-69.25 Z-3.01 J366.65 F500.0
+G1 X-22.61 Y-71.05 Z-3.01 J370.18 F500.0
+G1 X-22.61 Y-75.25 Z-3.01 J374.30 F500.0
+G1 X-20.59 Y-76.42 Z-3.01 J376.59 F500.0
+G1 X-18.04 Y-76.42 Z-3.01 J379.08 F500.0
+G1 X-16.02 Y-75.25 Z-3.01 J381.37 F500.0
+G1 X-16.02 Y-71.05 Z-3.01 J385.49 F500.0
+G1 X-19.14 Y-69.25 Z-3.01 J389.02 F500.0
+G1 X-19.14 Y-65.05 Z-3.01 J393.13 F500.0
+G1 X-16.02 Y-63.25 Z-3.01 J396.66 F500.0
+G1 X-16.02 Y-59.05 Z-3.01 J400.78 F500.0
+G1 X-19.14 Y-57.25 Z-3.01 J404.31 F500.0
+G1 X-19.14 Y-53.05 Z-3.01 J408.43 F500.0
+G1 X-16.02 Y-51.25 Z-3.01 J411.96 F500.0
+G1 X-16.02 Y-47.05 Z-3.01 J416.07 F500.0
+G1 X-19.14 Y-45.25 Z-3.01 J419.60 F500.0
+G1 X-19.14 Y-41.05 Z-3.01 J423.72 F500.0
+G1 X-16.02 Y-39.25 Z-3.01 J427.25 F500.0
+G1 X-16.02 Y-36.52 Z-3.01 J429.92 F500.0
+G1 X-15.68 Y-36.52 Z-3.01 J430.26 F500.0
+G1 X-15.68 Y-39.25 Z-3.01 J432.93 F500.0
+G1 X-12.56 Y-41.05 Z-3.01 J436.46 F500.0
+G1 X-12.56 Y-45.25 Z-3.01 J440.58 F500.0
+G1 X-15.68 Y-47.05 Z-3.01 J444.11 F500.0
+G1 X-15.68 Y-51.25 Z-3.01 J448.22 F500.0
+G1 X-12.56 Y-53.05 Z-3.01 J451.75 F500.0
+G1 X-12.56 Y-57.25 Z-3.01 J455.87 F500.0
+G1 X-15.68 Y-59.05 Z-3.01 J459.40 F500.0
+G1 X-15.68 Y-63.25 Z-3.01 J463.52 F500.0
+G1 X-12.56 Y-65.05 Z-3.01 J467.05 F500.0
+G1 X-12.56 Y-69.25 Z-3.01 J471.16 F500.0
+G1 X-15.68 Y-71.05 Z-3.01 J474.69 F500.0
+G1 X-15.68 Y-75.25 Z-3.01 J478.81 F500.0
+G1 X-13.66 Y-76.42 Z-3.01 J481.10 F500.0
+G1 X-11.11 Y-76.42 Z-3.01 J483.59 F500.0
+G1 X-9.10 Y-75.25 Z-3.01 J485.87 F500.0
+G1 X-9.10 Y-71.05 Z-3.01 J489.99 F500.0
+G1 X-12.21 Y-69.25 Z-3.01 J493.51 F500.0
+G1 X-12.21 Y-65.05 Z-3.01 J497.63 F500.0
+G1 X-9.10 Y-63.25 Z-3.01 J501.15 F500.0
+G1 X-9.10 Y-59.05 Z-3.01 J505.26 F500.0
+G1 X-12.21 Y-57.25 Z-3.01 J508.79 F500.0
+G1 X-12.21 Y-53.05 Z-3.01 J512.90 F500.0
+G1 X-9.10 Y-51.25 Z-3.01 J516.42 F500.0
+G1 X-9.10 Y-47.05 Z-3.01 J520.54 F500.0
+G1 X-12.21 Y-45.25 Z-3.01 J524.06 F500.0
+G1 X-12.21 Y-41.05 Z-3.01 J528.18 F500.0
+G1 X-9.10 Y-39.25 Z-3.01 J531.70 F500.0
+G1 X-9.10 Y-36.52 Z-3.01 J534.37 F500.0
+G1 X-8.75 Y-36.52 Z-3.01 J534.72 F500.0
+G1 X-8.75 Y-39.25 Z-3.01 J537.39 F500.0
+G1 X-5.63 Y-41.05 Z-3.01 J540.92 F500.0
+G1 X-5.63 Y-45.25 Z-3.01 J545.04 F500.0
+G1 X-8.75 Y-47.05 Z-3.01 J548.57 F500.0
+G1 X-8.75 Y-51.25 Z-3.01 J552.68 F500.0
+G1 X-5.63 Y-53.05 Z-3.01 J556.21 F500.0
+G1 X-5.63 Y-57.25 Z-3.01 J560.33 F500.0
+G1 X-8.75 Y-59.05 Z-3.01 J563.86 F500.0
+G1 X-8.75 Y-63.25 Z-3.01 J567.98 F500.0
+G1 X-5.63 Y-65.05 Z-3.01 J571.51 F500.0
+G1 X-5.63 Y-69.25 Z-3.01 J575.62 F500.0
+G1 X-8.75 Y-71.05 Z-3.01 J579.15 F500.0
+G1 X-8.75 Y-75.25 Z-3.01 J583.27 F500.0
+G1 X-6.73 Y-76.42 Z-3.01 J585.56 F500.0
+G1 X-4.18 Y-76.42 Z-3.01 J588.05 F500.0
+G1 X-2.17 Y-75.25 Z-3.01 J590.33 F500.0
+G1 X-2.17 Y-71.05 Z-3.01 J594.45 F500.0
+G1 X-5.28 Y-69.25 Z-3.01 J597.97 F500.0
+G1 X-5.28 Y-65.05 Z-3.01 J602.09 F500.0
+G1 X-2.17 Y-63.25 Z-3.01 J605.61 F500.0
+G1 X-2.17 Y-59.05 Z-3.01 J609.72 F500.0
+G1 X-5.28 Y-57.25 Z-3.01 J613.25 F500.0
+G1 X-5.28 Y-53.05 Z-3.01 J617.36 F500.0
+G1 X-2.17 Y-51.25 Z-3.01 J620.88 F500.0
+G1 X-2.17 Y-47.05 Z-3.01 J625.00 F500.0
+G1 X-5.28 Y-45.25 Z-3.01 J628.52 F500.0
+G1 X-5.28 Y-41.05 Z-3.01 J632.64 F500.0
+G1 X-2.17 Y-39.25 Z-3.01 J636.16 F500.0
+G1 X-2.17 Y-36.52 Z-3.01 J638.83 F500.0
+G1 X-1.82 Y-36.52 Z-3.01 J639.18 F500.0
+G1 X-1.82 Y-39.25 Z-3.01 J641.85 F500.0
+G1 X1.30 Y-41.05 Z-3.01 J645.38 F500.0
+G1 X1.30 Y-45.25 Z-3.01 J649.50 F500.0
+G1 X-1.82 Y-47.05 Z-3.01 J653.03 F500.0
+G1 X-1.82 Y-51.25 Z-3.01 J657.14 F500.0
+G1 X1.30 Y-53.05 Z-3.01 J660.67 F500.0
+G1 X1.30 Y-57.25 Z-3.01 J664.79 F500.0
+G1 X-1.82 Y-59.05 Z-3.01 J668.32 F500.0
+G1 X-1.82 Y-63.25 Z-3.01 J672.44 F500.0
+G1 X1.30 Y-65.05 Z-3.01 J675.97 F500.0
+G1 X1.30 Y-69.25 Z-3.01 J680.08 F500.0
+G1 X-1.82 Y-71.05 Z-3.01 J683.61 F500.0
+G1 X-1.82 Y-75.25 Z-3.01 J687.73 F500.0
+G1 X0.19 Y-76.42 Z-3.01 J690.01 F500.0
+G1 X2.75 Y-76.42 Z-3.01 J692.52 F500.0
+G1 X4.76 Y-75.25 Z-3.01 J694.80 F500.0
+G1 X4.76 Y-71.05 Z-3.01 J698.91 F500.0
+G1 X1.64 Y-69.25 Z-3.01 J702.44 F500.0
+G1 X1.64 Y-65.05 Z-3.01 J706.56 F500.0
+G1 X4.76 Y-63.25 Z-3.01 J710.09 F500.0
+G1 X4.76 Y-59.05 Z-3.01 J714.20 F500.0
+G1 X1.64 Y-57.25 Z-3.01 J717.73 F500.0
+G1 X1.64 Y-53.05 Z-3.01 J721.85 F500.0
+G1 X4.76 Y-51.25 Z-3.01 J725.38 F500.0
+G1 X4.76 Y-47.05 Z-3.01 J729.50 F500.0
+G1 X1.64 Y-45.25 Z-3.01 J733.03 F500.0
+G1 X1.64 Y-41.05 Z-3.01 J737.14 F500.0
+G1 X4.76 Y-39.25 Z-3.01 J740.67 F500.0
+G1 X4.76 Y-36.52 Z-3.01 J743.35 F500.0
+G1 X5.11 Y-36.52 Z-3.01 J743.69 F500.0
+G1 X5.11 Y-39.25 Z-3.01 J746.37 F500.0
+G1 X8.22 Y-41.05 Z-3.01 J749.89 F500.0
+G1 X8.22 Y-45.25 Z-3.01 J754.00 F500.0
+G1 X5.11 Y-47.05 Z-3.01 J757.52 F500.0
+G1 X5.11 Y-51.25 Z-3.01 J761.64 F500.0
+G1 X8.22 Y-53.05 Z-3.01 J765.16 F500.0
+G1 X8.22 Y-57.25 Z-3.01 J769.28 F500.0
+G1 X5.11 Y-59.05 Z-3.01 J772.80 F500.0
+G1 X5.11 Y-63.25 Z-3.01 J776.91 F500.0
+G1 X8.22 Y-65.05 Z-3.01 J780.44 F500.0
+G1 X8.22 Y-69.25 Z-3.01 J784.55 F500.0
+G1 X5.11 Y-71.05 Z-3.01 J788.07 F500.0
+G1 X5.11 Y-75.25 Z-3.01 J792.19 F500.0
+G1 X7.12 Y-76.42 Z-3.01 J794.47 F500.0
+G1 X9.67 Y-76.42 Z-3.01 J796.97 F500.0
+G1 X11.69 Y-75.25 Z-3.01 J799.26 F500.0
+G1 X11.69 Y-71.05 Z-3.01 J803.37 F500.0
+G1 X8.57 Y-69.25 Z-3.01 J806.90 F500.0
+G1 X8.57 Y-65.05 Z-3.01 J811.02 F500.0
+G1 X11.69 Y-63.25 Z-3.01 J814.55 F500.0
+G1 X11.69 Y-59.05 Z-3.01 J818.66 F500.0
+G1 X8.57 Y-57.25 Z-3.01 J822.19 F500.0
+G1 X8.57 Y-53.05 Z-3.01 J826.31 F500.0
+G1 X11.69 Y-51.25 Z-3.01 J829.84 F500.0
+G1 X11.69 Y-47.05 Z-3.01 J833.96 F500.0
+G1 X8.57 Y-45.25 Z-3.01 J837.49 F500.0
+G1 X8.57 Y-41.05 Z-3.01 J841.60 F500.0
+G1 X11.69 Y-39.25 Z-3.01 J845.13 F500.0
+G1 X11.69 Y-36.52 Z-3.01 J847.81 F500.0
+G1 X12.03 Y-36.52 Z-3.01 J848.14 F500.0
+G1 X12.03 Y-39.25 Z-3.01 J850.82 F500.0
+G1 X15.15 Y-41.05 Z-3.01 J854.35 F500.0
+G1 X15.15 Y-45.25 Z-3.01 J858.46 F500.0
+G1 X12.03 Y-47.05 Z-3.01 J861.99 F500.0
+G1 X12.03 Y-51.25 Z-3.01 J866.11 F500.0
+G1 X15.15 Y-53.05 Z-3.01 J869.64 F500.0
+G1 X15.15 Y-57.25 Z-3.01 J873.75 F500.0
+G1 X12.03 Y-59.05 Z-3.01 J877.28 F500.0
+G1 X12.03 Y-63.25 Z-3.01 J881.40 F500.0
+G1 X15.15 Y-65.05 Z-3.01 J884.93 F500.0
+G1 X15.15 Y-69.25 Z-3.01 J889.05 F500.0
+G1 X12.03 Y-71.05 Z-3.01 J892.58 F500.0
+G1 X12.03 Y-75.25 Z-3.01 J896.69 F500.0
+G1 X14.05 Y-76.42 Z-3.01 J898.98 F500.0
+G1 X16.60 Y-76.42 Z-3.01 J901.48 F500.0
+G1 X18.62 Y-75.25 Z-3.01 J903.77 F500.0
+G1 X18.62 Y-71.05 Z-3.01 J907.88 F500.0
+G1 X15.50 Y-69.25 Z-3.01 J911.41 F500.0
+G1 X15.50 Y-65.05 Z-3.01 J915.53 F500.0
+G1 X18.62 Y-63.25 Z-3.01 J919.06 F500.0
+G1 X18.62 Y-59.05 Z-3.01 J923.17 F500.0
+G1 X15.50 Y-57.25 Z-3.01 J926.70 F500.0
+G1 X15.50 Y-53.05 Z-3.01 J930.82 F500.0
+G1 X18.62 Y-51.25 Z-3.01 J934.35 F500.0
+G1 X18.62 Y-47.05 Z-3.01 J938.47 F500.0
+G1 X15.50 Y-45.25 Z-3.01 J942.00 F500.0
+G1 X15.50 Y-41.05 Z-3.01 J946.11 F500.0
+G1 X18.62 Y-39.25 Z-3.01 J949.64 F500.0
+G1 X18.62 Y-36.52 Z-3.01 J952.32 F500.0
+G1 X18.96 Y-36.52 Z-3.01 J952.65 F500.0
+G1 X18.96 Y-39.25 Z-3.01 J955.33 F500.0
+G1 X22.08 Y-41.05 Z-3.01 J958.86 F500.0
+G1 X22.08 Y-45.25 Z-3.01 J962.97 F500.0
+G1 X18.96 Y-47.05 Z-3.01 J966.50 F500.0
+G1 X18.96 Y-51.25 Z-3.01 J970.62 F500.0
+G1 X22.08 Y-53.05 Z-3.01 J974.15 F500.0
+G1 X22.08 Y-57.25 Z-3.01 J978.26 F500.0
+G1 X18.96 Y-59.05 Z-3.01 J981.79 F500.0
+G1 X18.96 Y-63.25 Z-3.01 J985.91 F500.0
+G1 X22.08 Y-65.05 Z-3.01 J989.44 F500.0
+G1 X22.08 Y-69.25 Z-3.01 J993.56 F500.0
+G1 X18.96 Y-71.05 Z-3.01 J997.09 F500.0
+G1 X18.96 Y-75.25 Z-3.01 J1001.20 F500.0
+G1 X20.98 Y-76.42 Z-3.01 J1003.49 F500.0
+G1 X23.53 Y-76.42 Z-3.01 J1005.99 F500.0
+G1 X25.54 Y-75.25 Z-3.01 J1008.27 F500.0
+G1 X25.54 Y-71.05 Z-3.01 J1012.38 F500.0
+G1 X22.43 Y-69.25 Z-3.01 J1015.90 F500.0
+G1 X22.43 Y-65.05 Z-3.01 J1020.02 F500.0
+G1 X25.54 Y-63.25 Z-3.01 J1023.54 F500.0
+G1 X25.54 Y-59.05 Z-3.01 J1027.66 F500.0
+G1 X22.43 Y-57.25 Z-3.01 J1031.18 F500.0
+G1 X22.43 Y-53.05 Z-3.01 J1035.30 F500.0
+G1 X25.54 Y-51.25 Z-3.01 J1038.82 F500.0
+G1 X25.54 Y-47.05 Z-3.01 J1042.93 F500.0
+G1 X22.43 Y-45.25 Z-3.01 J1046.45 F500.0
+G1 X22.43 Y-41.05 Z-3.01 J1050.57 F500.0
+G1 X25.54 Y-39.25 Z-3.01 J1054.09 F500.0
+G1 X25.54 Y-36.52 Z-3.01 J1056.77 F500.0
+G1 X25.89 Y-36.52 Z-3.01 J1057.11 F500.0
+G1 X25.89 Y-39.25 Z-3.01 J1059.79 F500.0
+G1 X29.01 Y-41.05 Z-3.01 J1063.32 F500.0
+G1 X29.01 Y-45.25 Z-3.01 J1067.43 F500.0
+G1 X25.89 Y-47.05 Z-3.01 J1070.96 F500.0
+G1 X25.89 Y-51.25 Z-3.01 J1075.08 F500.0
+G1 X29.01 Y-53.05 Z-3.01 J1078.61 F500.0
+G1 X29.01 Y-57.25 Z-3.01 J1082.72 F500.0
+G1 X25.89 Y-59.05 Z-3.01 J1086.25 F500.0
+G1 X25.89 Y-63.25 Z-3.01 J1090.37 F500.0
+G1 X29.01 Y-65.05 Z-3.01 J1093.90 F500.0
+G1 X29.01 Y-69.25 Z-3.01 J1098.02 F500.0
+G1 X25.89 Y-71.05 Z-3.01 J1101.55 F500.0
+G1 X25.89 Y-75.25 Z-3.01 J1105.66 F500.0
+G1 X27.91 Y-76.42 Z-3.01 J1107.95 F500.0
+G1 X30.46 Y-76.42 Z-3.01 J1110.45 F500.0
+G1 X32.47 Y-75.25 Z-3.01 J1112.73 F500.0
+G1 X32.47 Y-71.05 Z-3.01 J1116.84 F500.0
+G1 X29.36 Y-69.25 Z-3.01 J1120.36 F500.0
+G1 X29.36 Y-65.05 Z-3.01 J1124.48 F500.0
+G1 X32.47 Y-63.25 Z-3.01 J1128.00 F500.0
+G1 X32.47 Y-59.05 Z-3.01 J1132.12 F500.0
+G1 X29.36 Y-57.25 Z-3.01 J1135.64 F500.0
+G1 X29.36 Y-53.05 Z-3.01 J1139.76 F500.0
+G1 X32.47 Y-51.25 Z-3.01 J1143.28 F500.0
+G1 X32.47 Y-47.05 Z-3.01 J1147.39 F500.0
+G1 X29.36 Y-45.25 Z-3.01 J1150.91 F500.0
+G1 X29.36 Y-41.05 Z-3.01 J1155.03 F500.0
+G1 X32.47 Y-39.25 Z-3.01 J1158.55 F500.0
+G1 X32.47 Y-36.52 Z-3.01 J1161.23 F500.0
+G1 X32.82 Y-36.52 Z-3.01 J1161.57 F500.0
+G1 X32.82 Y-39.25 Z-3.01 J1164.25 F500.0
+G1 X35.94 Y-41.05 Z-3.01 J1167.78 F500.0
+G1 X35.94 Y-45.25 Z-3.01 J1171.89 F500.0
+G1 X32.82 Y-47.05 Z-3.01 J1175.42 F500.0
+G1 X32.82 Y-51.25 Z-3.01 J1179.54 F500.0
+G1 X35.94 Y-53.05 Z-3.01 J1183.07 F500.0
+G1 X35.94 Y-57.25 Z-3.01 J1187.18 F500.0
+G1 X32.82 Y-59.05 Z-3.01 J1190.71 F500.0
+G1 X32.82 Y-63.25 Z-3.01 J1194.83 F500.0
+G1 X35.94 Y-65.05 Z-3.01 J1198.36 F500.0
+G1 X35.94 Y-69.25 Z-3.01 J1202.48 F500.0
+G1 X32.82 Y-71.05 Z-3.01 J1206.01 F500.0
+G1 X32.82 Y-75.25 Z-3.01 J1210.12 F500.0
+G1 X34.84 Y-76.42 Z-3.01 J1212.41 F500.0
+G1 X37.39 Y-76.42 Z-3.01 J1214.91 F500.0
+G1 X39.40 Y-75.25 Z-3.01 J1217.19 F500.0
+G1 X39.40 Y-71.05 Z-3.01 J1221.30 F500.0
+G1 X36.28 Y-69.25 Z-3.01 J1224.83 F500.0
+G1 X36.28 Y-65.05 Z-3.01 J1228.95 F500.0
+G1 X39.40 Y-63.25 Z-3.01 J1232.48 F500.0
+G1 X39.40 Y-59.05 Z-3.01 J1236.60 F500.0
+G1 X36.28 Y-57.25 Z-3.01 J1240.13 F500.0
+G1 X36.28 Y-53.05 Z-3.01 J1244.24 F500.0
+G1 X39.40 Y-51.25 Z-3.01 J1247.77 F500.0
+G1 X39.40 Y-47.05 Z-3.01 J1251.89 F500.0
+G1 X36.28 Y-45.25 Z-3.01 J1255.42 F500.0
+G1 X36.28 Y-41.05 Z-3.01 J1259.53 F500.0
+G1 X39.40 Y-39.25 Z-3.01 J1263.06 F500.0
+G1 X39.40 Y-36.52 Z-3.01 J1265.74 F500.0
+G1 X39.75 Y-36.52 Z-3.01 J1266.08 F500.0
+G1 X39.75 Y-39.25 Z-3.01 J1268.76 F500.0
+G1 X42.87 Y-41.05 Z-3.01 J1272.29 F500.0
+G1 X42.87 Y-45.25 Z-3.01 J1276.40 F500.0
+G1 X39.75 Y-47.05 Z-3.01 J1279.93 F500.0
+G1 X39.75 Y-51.25 Z-3.01 J1284.05 F500.0
+G1 X42.87 Y-53.05 Z-3.01 J1287.58 F500.0
+G1 X42.87 Y-57.25 Z-3.01 J1291.70 F500.0
+G1 X39.75 Y-59.05 Z-3.01 J1295.23 F500.0
+G1 X39.75 Y-63.25 Z-3.01 J1299.34 F500.0
+G1 X42.87 Y-65.05 Z-3.01 J1302.87 F500.0
+G1 X42.87 Y-69.25 Z-3.01 J1306.99 F500.0
+G1 X39.75 Y-71.05 Z-3.01 J1310.52 F500.0
+G1 X39.75 Y-72.58 Z-3.01 J1317.01 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X39.75 Y-75.25 Z-3.01 J1317.01 F800.0
+G1 X41.76 Y-76.42 Z-3.01 J1317.01 F800.0
+G1 X41.76 Y-76.42 Z6.99 J1317.01 F800.0
+G1 X34.25 Y-80.86 Z6.99 J1327.01 F800.0
+
+T1
+G1 X39.25 Y-75.86 Z-2.01 J0.00 F300.0
+G1 X42.43 Y-75.86 Z-2.01 J3.12 F300.0
+G1 X42.43 Y-38.06 Z-2.01 J40.16 F300.0
+G1 X42.43 Y-37.08 Z-2.01 J41.12 F300.0
+G1 X-33.17 Y-37.08 Z-2.01 J115.21 F500.0
+G1 X-36.35 Y-37.08 Z-2.01 J118.33 F500.0
+G1 X-36.35 Y-74.88 Z-2.01 J155.37 F500.0
+G1 X-36.35 Y-75.86 Z-2.01 J156.33 F500.0
+G1 X34.25 Y-75.86 Z-2.01 J230.52 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X39.25 Y-75.86 Z-2.01 J230.52 F800.0
+G1 X39.25 Y-75.86 Z7.99 J230.52 F800.0
+G1 X34.25 Y-80.86 Z7.99 J240.52 F800.0
+
+T1
+G1 X39.25 Y-75.86 Z-2.01 J0.00 F300.0
+G1 X-36.35 Y-39.32 Z-2.01 J82.29 F300.0
+G1 X-33.34 Y-41.05 Z-2.01 J85.69 F300.0
+G1 X-33.34 Y-45.25 Z-2.01 J89.80 F300.0
+G1 X-36.35 Y-46.99 Z-2.01 J93.21 F500.0
+G1 X-36.35 Y-51.32 Z-2.01 J97.45 F500.0
+G1 X-33.34 Y-53.05 Z-2.01 J100.86 F500.0
+G1 X-33.34 Y-57.25 Z-2.01 J104.97 F500.0
+G1 X-36.35 Y-58.99 Z-2.01 J108.38 F500.0
+G1 X-36.35 Y-63.32 Z-2.01 J112.62 F500.0
+G1 X-33.34 Y-65.05 Z-2.01 J116.03 F500.0
+G1 X-33.34 Y-69.25 Z-2.01 J120.14 F500.0
+G1 X-36.35 Y-70.99 Z-2.01 J123.55 F500.0
+G1 X-36.35 Y-75.32 Z-2.01 J127.79 F500.0
+G1 X-35.41 Y-75.86 Z-2.01 J128.85 F500.0
+G1 X-30.94 Y-75.86 Z-2.01 J133.24 F500.0
+G1 X-29.88 Y-75.25 Z-2.01 J134.43 F500.0
+G1 X-29.88 Y-71.05 Z-2.01 J138.55 F500.0
+G1 X-33.00 Y-69.25 Z-2.01 J142.08 F500.0
+G1 X-33.00 Y-65.05 Z-2.01 J146.20 F500.0
+G1 X-29.88 Y-63.25 Z-2.01 J149.73 F500.0
+G1 X-29.88 Y-59.05 Z-2.01 J153.84 F500.0
+G1 X-33.00 Y-57.25 Z-2.01 J157.37 F500.0
+G1 X-33.00 Y-53.05 Z-2.01 J161.49 F500.0
+G1 X-29.88 Y-51.25 Z-2.01 J165.02 F500.0
+G1 X-29.88 Y-47.05 Z-2.01 J169.13 F500.0
+G1 X-33.00 Y-45.25 Z-2.01 J172.66 F500.0
+G1 X-33.00 Y-41.05 Z-2.01 J176.78 F500.0
+G1 X-29.88 Y-39.25 Z-2.01 J180.31 F500.0
+G1 X-29.88 Y-37.08 Z-2.01 J182.44 F500.0
+G1 X-29.53 Y-37.08 Z-2.01 J182.78 F500.0
+G1 X-29.53 Y-39.25 Z-2.01 J184.91 F500.0
+G1 X-26.42 Y-41.05 Z-2.01 J188.43 F500.0
+G1 X-26.42 Y-45.25 Z-2.01 J192.54 F500.0
+G1 X-29.53 Y-47.05 Z-2.01 J196.06 F500.0
+G1 X-29.53 Y-51.25 Z-2.01 J200.18 F500.0
+G1 X-26.42 Y-53.05 Z-2.01 J203.70 F500.0
+G1 X-26.42 Y-57.25 Z-2.01 J207.82 F500.0
+G1 X-29.53 Y-59.05 Z-2.01 J211.34 F500.0
+G1 X-29.53 Y-63.25 Z-2.01 J215.46 F500.0
+G1 X-26.42 Y-65.05 Z-2.01 J218.98 F500.0
+G1 X-26.42 Y-69.25 Z-2.01 J223.09 F500.0
+G1 X-29.53 Y-71.05 Z-2.01 J226.61 F500.0
+G1 X-29.53 Y-75.25 Z-2.01 J230.73 F500.0
+G1 X-28.48 Y-75.86 Z-2.01 J231.92 F500.0
+G1 X-24.01 Y-75.86 Z-2.01 J236.30 F500.0
+G1 X-22.95 Y-75.25 Z-2.01 J237.50 F500.0
+G1 X-22.95 Y-71.05 Z-2.01 J241.62 F500.0
+G1 X-26.07 Y-69.25 Z-2.01 J245.15 F500.0
+G1 X-26.07 Y-65.05 Z-2.01 J249.26 F500.0
+G1 X-22.95 Y-63.25 Z-2.01 J252.79 F500.0
+G1 X-22.95 Y-59.05 Z-2.01 J256.91 F500.0
+G1 X-26.07 Y-57.25 Z-2.01 J260.44 F500.0
+G1 X-26.07 Y-53.05 Z-2.01 J264.55 F500.0
+G1 X-22.95 Y-51.25 Z-2.01 J268.08 F500.0
+G1 X-22.95 Y-47.05 Z-2.01 J272.20 F500.0
+G1 X-26.07 Y-45.25 Z-2.01 J275.73 F500.0
+G1 X-26.07 Y-41.05 Z-2.01 J279.85 F500.0
+G1 X-22.95 Y-39.25 Z-2.01 J283.38 F500.0
+G1 X-22.95 Y-37.08 Z-2.01 J285.50 F500.0
+G1 X-22.61 Y-37.08 Z-2.01 J285.84 F500.0
+G1 X-22.61 Y-39.25 Z-2.01 J287.96 F500.0
+G1 X-19.49 Y-41.05 Z-2.01 J291.49 F500.0
+G1 X-19.49 Y-45.25 Z-2.01 J295.61 F500.0
+G1 X-22.61 Y-47.05 Z-2.01 J299.14 F500.0
+G1 X-22.61 Y-51.25 Z-2.01 J303.25 F500.0
+G1 X-19.49 Y-53.05 Z-2.01 J306.78 F500.0
+G1 X-19.49 Y-57.25 Z-2.01 J310.90 F500.0
+G1 X-22.61 Y-59.05 Z-2.01 J314.43 F500.0
+G1 X-22.61 Y-63.25 Z-2.01 J318.55 F500.0
+G1 X-19.49 Y-65.05 Z-2.01 J322.08 F500.0
+G1 X-19.49 Y-69.25 Z-2.01 J326.19 F500.0
+G1 X-22.61 Y-71.05 Z-2.01 J329.72 F500.0
+G1 X-22.61 Y-75.25 Z-2.01 J333.84 F500.0
+G1 X-21.55 Y-75.86 Z-2.01 J335.04 F500.0
+G1 X-17.08 Y-75.86 Z-2.01 J339.42 F500.0
+G1 X-16.02 Y-75.25 Z-2.01 J340.62 F500.0
+G1 X-16.02 Y-71.05 Z-2.01 J344.73 F500.0
+G1 X-19.14 Y-69.25 Z-2.01 J348.26 F500.0
+G1 X-19.14 Y-65.05 Z-2.01 J352.38 F500.0
+G1 X-16.02 Y-63.25 Z-2.01 J355.91 F500.0
+G1 X-16.02 Y-59.05 Z-2.01 J360.02 F500.0
+G1 X-19.14 Y-57.25 Z-2.01 J363.55 F500.0
+G1 X-19.14 Y-53.05 Z-2.01 J367.67 F500.0
+G1 X-16.02 Y-51.25 Z-2.01 J371.20 F500.0
+G1 X-16.02 Y-47.05 Z-2.01 J375.32 F500.0
+G1 X-19.14 Y-45.25 Z-2.01 J378.85 F500.0
+G1 X-19.14 Y-41.05 Z-2.01 J382.96 F500.0
+G1 X-16.02 Y-39.25 Z-2.01 J386.49 F500.0
+G1 X-16.02 Y-37.08 Z-2.01 J388.62 F500.0
+G1 X-15.68 Y-37.08 Z-2.01 J388.95 F500.0
+G1 X-15.68 Y-39.25 Z-2.01 J391.08 F500.0
+G1 X-12.56 Y-41.05 Z-2.01 J394.61 F500.0
+G1 X-12.56 Y-45.25 Z-2.01 J398.72 F500.0
+G1 X-15.68 Y-47.05 Z-2.01 J402.25 F500.0
+G1 X-15.68 Y-51.25 Z-2.01 J406.37 F500.0
+G1 X-12.56 Y-53.05 Z-2.01 J409.90 F500.0
+G1 X-12.56 Y-57.25 Z-2.01 J414.02 F500.0
+G1 X-15.68 Y-59.05 Z-2.01 J417.55 F500.0
+G1 X-15.68 Y-63.25 Z-2.01 J421.66 F500.0
+G1 X-12.56 Y-65.05 Z-2.01 J425.19 F500.0
+G1 X-12.56 Y-69.25 Z-2.01 J429.31 F500.0
+G1 X-15.68 Y-71.05 Z-2.01 J432.84 F500.0
+G1 X-15.68 Y-75.25 Z-2.01 J436.95 F500.0
+G1 X-14.62 Y-75.86 Z-2.01 J438.15 F500.0
+G1 X-10.15 Y-75.86 Z-2.01 J442.53 F500.0
+G1 X-9.10 Y-75.25 Z-2.01 J443.72 F500.0
+G1 X-9.10 Y-71.05 Z-2.01 J447.84 F500.0
+G1 X-12.21 Y-69.25 Z-2.01 J451.36 F500.0
+G1 X-12.21 Y-65.05 Z-2.01 J455.48 F500.0
+G1 X-9.10 Y-63.25 Z-2.01 J459.00 F500.0
+G1 X-9.10 Y-59.05 Z-2.01 J463.11 F500.0
+G1 X-12.21 Y-57.25 Z-2.01 J466.63 F500.0
+G1 X-12.21 Y-53.05 Z-2.01 J470.75 F500.0
+G1 X-9.10 Y-51.25 Z-2.01 J474.27 F500.0
+G1 X-9.10 Y-47.05 Z-2.01 J478.39 F500.0
+G1 X-12.21 Y-45.25 Z-2.01 J481.91 F500.0
+G1 X-12.21 Y-41.05 Z-2.01 J486.03 F500.0
+G1 X-9.10 Y-39.25 Z-2.01 J489.55 F500.0
+G1 X-9.10 Y-37.08 Z-2.01 J491.67 F500.0
+G1 X-8.75 Y-37.08 Z-2.01 J492.02 F500.0
+G1 X-8.75 Y-39.25 Z-2.01 J494.14 F500.0
+G1 X-5.63 Y-41.05 Z-2.01 J497.67 F500.0
+G1 X-5.63 Y-45.25 Z-2.01 J501.79 F500.0
+G1 X-8.75 Y-47.05 Z-2.01 J505.32 F500.0
+G1 X-8.75 Y-51.25 Z-2.01 J509.44 F500.0
+G1 X-5.63 Y-53.05 Z-2.01 J512.97 F500.0
+G1 X-5.63 Y-57.25 Z-2.01 J517.08 F500.0
+G1 X-8.75 Y-59.05 Z-2.01 J520.61 F500.0
+G1 X-8.75 Y-63.25 Z-2.01 J524.73 F500.0
+G1 X-5.63 Y-65.05 Z-2.01 J528.26 F500.0
+G1 X-5.63 Y-69.25 Z-2.01 J532.37 F500.0
+G1 X-8.75 Y-71.05 Z-2.01 J535.90 F500.0
+G1 X-8.75 Y-75.25 Z-2.01 J540.02 F500.0
+G1 X-7.69 Y-75.86 Z-2.01 J541.22 F500.0
+G1 X-3.22 Y-75.86 Z-2.01 J545.60 F500.0
+G1 X-2.17 Y-75.25 Z-2.01 J546.79 F500.0
+G1 X-2.17 Y-71.05 Z-2.01 J550.90 F500.0
+G1 X-5.28 Y-69.25 Z-2.01 J554.43 F500.0
+G1 X-5.28 Y-65.05 Z-2.01 J558.54 F500.0
+G1 X-2.17 Y-63.25 Z-2.01 J562.06 F500.0
+G1 X-2.17 Y-59.05 Z-2.01 J566.18 F500.0
+G1 X-5.28 Y-57.25 Z-2.01 J569.70 F500.0
+G1 X-5.28 Y-53.05 Z-2.01 J573.82 F500.0
+G1 X-2.17 Y-51.25 Z-2.01 J577.34 F500.0
+G1 X-2.17 Y-47.05 Z-2.01 J581.45 F500.0
+G1 X-5.28 Y-45.25 Z-2.01 J584.98 F500.0
+G1 X-5.28 Y-41.05 Z-2.01 J589.09 F500.0
+G1 X-2.17 Y-39.25 Z-2.01 J592.61 F500.0
+G1 X-2.17 Y-37.08 Z-2.01 J594.74 F500.0
+G1 X-1.82 Y-37.08 Z-2.01 J595.08 F500.0
+G1 X-1.82 Y-39.25 Z-2.01 J597.21 F500.0
+G1 X1.30 Y-41.05 Z-2.01 J600.74 F500.0
+G1 X1.30 Y-45.25 Z-2.01 J604.86 F500.0
+G1 X-1.82 Y-47.05 Z-2.01 J608.39 F500.0
+G1 X-1.82 Y-51.25 Z-2.01 J612.50 F500.0
+G1 X1.30 Y-53.05 Z-2.01 J616.03 F500.0
+G1 X1.30 Y-57.25 Z-2.01 J620.15 F500.0
+G1 X-1.82 Y-59.05 Z-2.01 J623.68 F500.0
+G1 X-1.82 Y-63.25 Z-2.01 J627.79 F500.0
+G1 X1.30 Y-65.05 Z-2.01 J631.32 F500.0
+G1 X1.30 Y-69.25 Z-2.01 J635.44 F500.0
+G1 X-1.82 Y-71.05 Z-2.01 J638.97 F500.0
+G1 X-1.82 Y-75.25 Z-2.01 J643.09 F500.0
+G1 X-0.77 Y-75.86 Z-2.01 J644.28 F500.0
+G1 X3.71 Y-75.86 Z-2.01 J648.67 F500.0
+G1 X4.76 Y-75.25 Z-2.01 J649.86 F500.0
+G1 X4.76 Y-71.05 Z-2.01 J653.97 F500.0
+G1 X1.64 Y-69.25 Z-2.01 J657.50 F500.0
+G1 X1.64 Y-65.05 Z-2.01 J661.62 F500.0
+G1 X4.76 Y-63.25 Z-2.01 J665.15 F500.0
+G1 X4.76 Y-59.05 Z-2.01 J669.26 F500.0
+G1 X1.64 Y-57.25 Z-2.01 J672.79 F500.0
+G1 X1.64 Y-53.05 Z-2.01 J676.91 F500.0
+G1 X4.76 Y-51.25 Z-2.01 J680.44 F500.0
+G1 X4.76 Y-47.05 Z-2.01 J684.56 F500.0
+G1 X1.64 Y-45.25 Z-2.01 J688.09 F500.0
+G1 X1.64 Y-41.05 Z-2.01 J692.20 F500.0
+G1 X4.76 Y-39.25 Z-2.01 J695.73 F500.0
+G1 X4.76 Y-37.08 Z-2.01 J697.86 F500.0
+G1 X5.11 Y-37.08 Z-2.01 J698.20 F500.0
+G1 X5.11 Y-39.25 Z-2.01 J700.33 F500.0
+G1 X8.22 Y-41.05 Z-2.01 J703.85 F500.0
+G1 X8.22 Y-45.25 Z-2.01 J707.97 F500.0
+G1 X5.11 Y-47.05 Z-2.01 J711.49 F500.0
+G1 X5.11 Y-51.25 Z-2.01 J715.60 F500.0
+G1 X8.22 Y-53.05 Z-2.01 J719.12 F500.0
+G1 X8.22 Y-57.25 Z-2.01 J723.24 F500.0
+G1 X5.11 Y-59.05 Z-2.01 J726.76 F500.0
+G1 X5.11 Y-63.25 Z-2.01 J730.88 F500.0
+G1 X8.22 Y-65.05 Z-2.01 J734.40 F500.0
+G1 X8.22 Y-69.25 Z-2.01 J738.52 F500.0
+G1 X5.11 Y-71.05 Z-2.01 J742.04 F500.0
+G1 X5.11 Y-75.25 Z-2.01 J746.15 F500.0
+G1 X6.16 Y-75.86 Z-2.01 J747.34 F500.0
+G1 X10.63 Y-75.86 Z-2.01 J751.72 F500.0
+G1 X11.69 Y-75.25 Z-2.01 J752.92 F500.0
+G1 X11.69 Y-71.05 Z-2.01 J757.04 F500.0
+G1 X8.57 Y-69.25 Z-2.01 J760.57 F500.0
+G1 X8.57 Y-65.05 Z-2.01 J764.68 F500.0
+G1 X11.69 Y-63.25 Z-2.01 J768.21 F500.0
+G1 X11.69 Y-59.05 Z-2.01 J772.33 F500.0
+G1 X8.57 Y-57.25 Z-2.01 J775.86 F500.0
+G1 X8.57 Y-53.05 Z-2.01 J779.98 F500.0
+G1 X11.69 Y-51.25 Z-2.01 J783.51 F500.0
+G1 X11.69 Y-47.05 Z-2.01 J787.62 F500.0
+G1 X8.57 Y-45.25 Z-2.01 J791.15 F500.0
+G1 X8.57 Y-41.05 Z-2.01 J795.27 F500.0
+G1 X11.69 Y-39.25 Z-2.01 J798.80 F500.0
+G1 X11.69 Y-37.08 Z-2.01 J800.92 F500.0
+G1 X12.03 Y-37.08 Z-2.01 J801.26 F500.0
+G1 X12.03 Y-39.25 Z-2.01 J803.38 F500.0
+G1 X15.15 Y-41.05 Z-2.01 J806.91 F500.0
+G1 X15.15 Y-45.25 Z-2.01 J811.03 F500.0
+G1 X12.03 Y-47.05 Z-2.01 J814.56 F500.0
+G1 X12.03 Y-51.25 Z-2.01 J818.68 F500.0
+G1 X15.15 Y-53.05 Z-2.01 J822.21 F500.0
+G1 X15.15 Y-57.25 Z-2.01 J826.32 F500.0
+G1 X12.03 Y-59.05 Z-2.01 J829.85 F500.0
+G1 X12.03 Y-63.25 Z-2.01 J833.97 F500.0
+G1 X15.15 Y-65.05 Z-2.01 J837.50 F500.0
+G1 X15.15 Y-69.25 Z-2.01 J841.61 F500.0
+G1 X12.03 Y-71.05 Z-2.01 J845.14 F500.0
+G1 X12.03 Y-75.25 Z-2.01 J849.26 F500.0
+G1 X13.09 Y-75.86 Z-2.01 J850.46 F500.0
+G1 X17.56 Y-75.86 Z-2.01 J854.84 F500.0
+G1 X18.62 Y-75.25 Z-2.01 J856.04 F500.0
+G1 X18.62 Y-71.05 Z-2.01 J860.15 F500.0
+G1 X15.50 Y-69.25 Z-2.01 J863.68 F500.0
+G1 X15.50 Y-65.05 Z-2.01 J867.80 F500.0
+G1 X18.62 Y-63.25 Z-2.01 J871.33 F500.0
+G1 X18.62 Y-59.05 Z-2.01 J875.45 F500.0
+G1 X15.50 Y-57.25 Z-2.01 J878.98 F500.0
+G1 X15.50 Y-53.05 Z-2.01 J883.09 F500.0
+G1 X18.62 Y-51.25 Z-2.01 J886.62 F500.0
+G1 X18.62 Y-47.05 Z-2.01 J890.74 F500.0
+G1 X15.50 Y-45.25 Z-2.01 J894.27 F500.0
+G1 X15.50 Y-41.05 Z-2.01 J898.38 F500.0
+G1 X18.62 Y-39.25 Z-2.01 J901.91 F500.0
+G1 X18.62 Y-37.08 Z-2.01 J904.04 F500.0
+G1 X18.96 Y-37.08 Z-2.01 J904.37 F500.0
+G1 X18.96 Y-39.25 Z-2.01 J906.50 F500.0
+G1 X22.08 Y-41.05 Z-2.01 J910.03 F500.0
+G1 X22.08 Y-45.25 Z-2.01 J914.15 F500.0
+G1 X18.96 Y-47.05 Z-2.01 J917.68 F500.0
+G1 X18.96 Y-51.25 Z-2.01 J921.79 F500.0
+G1 X22.08 Y-53.05 Z-2.01 J925.32 F500.0
+G1 X22.08 Y-57.25 Z-2.01 J929.44 F500.0
+G1 X18.96 Y-59.05 Z-2.01 J932.97 F500.0
+G1 X18.96 Y-63.25 Z-2.01 J937.08 F500.0
+G1 X22.08 Y-65.05 Z-2.01 J940.61 F500.0
+G1 X22.08 Y-69.25 Z-2.01 J944.73 F500.0
+G1 X18.96 Y-71.05 Z-2.01 J948.26 F500.0
+G1 X18.96 Y-75.25 Z-2.01 J952.38 F500.0
+G1 X20.02 Y-75.86 Z-2.01 J953.57 F500.0
+G1 X24.49 Y-75.86 Z-2.01 J957.95 F500.0
+G1 X25.54 Y-75.25 Z-2.01 J959.14 F500.0
+G1 X25.54 Y-71.05 Z-2.01 J963.26 F500.0
+G1 X22.43 Y-69.25 Z-2.01 J966.78 F500.0
+G1 X22.43 Y-65.05 Z-2.01 J970.90 F500.0
+G1 X25.54 Y-63.25 Z-2.01 J974.42 F500.0
+G1 X25.54 Y-59.05 Z-2.01 J978.54 F500.0
+G1 X22.43 Y-57.25 Z-2.01 J982.06 F500.0
+G1 X22.43 Y-53.05 Z-2.01 J986.17 F500.0
+G1 X25.54 Y-51.25 Z-2.01 J989.69 F500.0
+G1 X25.54 Y-47.05 Z-2.01 J993.81 F500.0
+G1 X22.43 Y-45.25 Z-2.01 J997.33 F500.0
+G1 X22.43 Y-41.05 Z-2.01 J1001.45 F500.0
+G1 X25.54 Y-39.25 Z-2.01 J1004.97 F500.0
+G1 X25.54 Y-37.08 Z-2.01 J1007.10 F500.0
+G1 X25.89 Y-37.08 Z-2.01 J1007.44 F500.0
+G1 X25.89 Y-39.25 Z-2.01 J1009.57 F500.0
+G1 X29.01 Y-41.05 Z-2.01 J1013.10 F500.0
+G1 X29.01 Y-45.25 Z-2.01 J1017.21 F500.0
+G1 X25.89 Y-47.05 Z-2.01 J1020.74 F500.0
+G1 X25.89 Y-51.25 Z-2.01 J1024.86 F500.0
+G1 X29.01 Y-53.05 Z-2.01 J1028.39 F500.0
+G1 X29.01 Y-57.25 Z-2.01 J1032.50 F500.0
+G1 X25.89 Y-59.05 Z-2.01 J1036.03 F500.0
+G1 X25.89 Y-63.25 Z-2.01 J1040.15 F500.0
+G1 X29.01 Y-65.05 Z-2.01 J1043.68 F500.0
+G1 X29.01 Y-69.25 Z-2.01 J1047.80 F500.0
+G1 X25.89 Y-71.05 Z-2.01 J1051.33 F500.0
+G1 X25.89 Y-75.25 Z-2.01 J1055.44 F500.0
+G1 X26.95 Y-75.86 Z-2.01 J1056.64 F500.0
+G1 X31.42 Y-75.86 Z-2.01 J1061.02 F500.0
+G1 X32.47 Y-75.25 Z-2.01 J1062.21 F500.0
+G1 X32.47 Y-71.05 Z-2.01 J1066.33 F500.0
+G1 X29.36 Y-69.25 Z-2.01 J1069.85 F500.0
+G1 X29.36 Y-65.05 Z-2.01 J1073.96 F500.0
+G1 X32.47 Y-63.25 Z-2.01 J1077.49 F500.0
+G1 X32.47 Y-59.05 Z-2.01 J1081.60 F500.0
+G1 X29.36 Y-57.25 Z-2.01 J1085.12 F500.0
+G1 X29.36 Y-53.05 Z-2.01 J1089.24 F500.0
+G1 X32.47 Y-51.25 Z-2.01 J1092.76 F500.0
+G1 X32.47 Y-47.05 Z-2.01 J1096.88 F500.0
+G1 X29.36 Y-45.25 Z-2.01 J1100.40 F500.0
+G1 X29.36 Y-41.05 Z-2.01 J1104.51 F500.0
+G1 X32.47 Y-39.25 Z-2.01 J1108.04 F500.0
+G1 X32.47 Y-37.08 Z-2.01 J1110.16 F500.0
+G1 X32.82 Y-37.08 Z-2.01 J1110.50 F500.0
+G1 X32.82 Y-39.25 Z-2.01 J1112.63 F500.0
+G1 X35.94 Y-41.05 Z-2.01 J1116.16 F500.0
+G1 X35.94 Y-45.25 Z-2.01 J1120.28 F500.0
+G1 X32.82 Y-47.05 Z-2.01 J1123.81 F500.0
+G1 X32.82 Y-51.25 Z-2.01 J1127.92 F500.0
+G1 X35.94 Y-53.05 Z-2.01 J1131.45 F500.0
+G1 X35.94 Y-57.25 Z-2.01 J1135.57 F500.0
+G1 X32.82 Y-59.05 Z-2.01 J1139.10 F500.0
+G1 X32.82 Y-63.25 Z-2.01 J1143.22 F500.0
+G1 X35.94 Y-65.05 Z-2.01 J1146.75 F500.0
+G1 X35.94 Y-69.25 Z-2.01 J1150.86 F500.0
+G1 X32.82 Y-71.05 Z-2.01 J1154.39 F500.0
+G1 X32.82 Y-75.25 Z-2.01 J1158.51 F500.0
+G1 X33.88 Y-75.86 Z-2.01 J1159.71 F500.0
+G1 X38.35 Y-75.86 Z-2.01 J1164.09 F500.0
+G1 X39.40 Y-75.25 Z-2.01 J1165.28 F500.0
+G1 X39.40 Y-71.05 Z-2.01 J1169.39 F500.0
+G1 X36.28 Y-69.25 Z-2.01 J1172.92 F500.0
+G1 X36.28 Y-65.05 Z-2.01 J1177.04 F500.0
+G1 X39.40 Y-63.25 Z-2.01 J1180.57 F500.0
+G1 X39.40 Y-59.05 Z-2.01 J1184.68 F500.0
+G1 X36.28 Y-57.25 Z-2.01 J1188.21 F500.0
+G1 X36.28 Y-53.05 Z-2.01 J1192.33 F500.0
+G1 X39.40 Y-51.25 Z-2.01 J1195.86 F500.0
+G1 X39.40 Y-47.05 Z-2.01 J1199.98 F500.0
+G1 X36.28 Y-45.25 Z-2.01 J1203.51 F500.0
+G1 X36.28 Y-41.05 Z-2.01 J1207.62 F500.0
+G1 X39.40 Y-39.25 Z-2.01 J1211.15 F500.0
+G1 X39.40 Y-37.08 Z-2.01 J1213.28 F500.0
+G1 X39.75 Y-37.08 Z-2.01 J1213.62 F500.0
+G1 X39.75 Y-39.25 Z-2.01 J1215.75 F500.0
+G1 X42.43 Y-40.80 Z-2.01 J1218.78 F500.0
+G1 X42.43 Y-45.50 Z-2.01 J1223.39 F500.0
+G1 X39.75 Y-47.05 Z-2.01 J1226.42 F500.0
+G1 X39.75 Y-51.25 Z-2.01 J1230.54 F500.0
+G1 X42.43 Y-52.80 Z-2.01 J1233.57 F500.0
+G1 X42.43 Y-57.50 Z-2.01 J1238.18 F500.0
+G1 X39.75 Y-59.05 Z-2.01 J1241.21 F500.0
+G1 X39.75 Y-63.25 Z-2.01 J1245.33 F500.0
+G1 X42.43 Y-64.80 Z-2.01 J1248.36 F500.0
+G1 X42.43 Y-69.50 Z-2.01 J1252.97 F500.0
+G1 X39.75 Y-71.05 Z-2.01 J1256.00 F500.0
+G1 X39.75 Y-71.46 Z-2.01 J1261.41 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X39.75 Y-75.25 Z-2.01 J1261.41 F800.0
+G1 X40.80 Y-75.86 Z-2.01 J1261.41 F800.0
+G1 X40.80 Y-75.86 Z7.99 J1261.41 F800.0
+G1 X30.80 Y-80.31 Z7.99 J1271.41 F800.0
+
+T1
+G1 X35.80 Y-75.31 Z-1.01 J0.00 F300.0
+G1 X41.88 Y-75.31 Z-1.01 J5.96 F300.0
+G1 X41.88 Y-39.51 Z-1.01 J41.04 F300.0
+G1 X41.88 Y-37.63 Z-1.01 J42.88 F300.0
+G1 X-29.72 Y-37.63 Z-1.01 J113.05 F500.0
+G1 X-35.80 Y-37.63 Z-1.01 J119.01 F500.0
+G1 X-35.80 Y-73.43 Z-1.01 J154.10 F500.0
+G1 X-35.80 Y-75.31 Z-1.01 J155.94 F500.0
+G1 X30.80 Y-75.31 Z-1.01 J226.21 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X35.80 Y-75.31 Z-1.01 J226.21 F800.0
+G1 X35.80 Y-75.31 Z8.99 J226.21 F800.0
+G1 X30.80 Y-80.31 Z8.99 J236.21 F800.0
+
+T1
+G1 X35.80 Y-75.31 Z-1.01 J0.00 F300.0
+G1 X-35.80 Y-39.63 Z-1.01 J78.39 F300.0
+G1 X-33.34 Y-41.05 Z-1.01 J81.18 F300.0
+G1 X-33.34 Y-45.25 Z-1.01 J85.29 F300.0
+G1 X-35.80 Y-46.67 Z-1.01 J88.08 F500.0
+G1 X-35.80 Y-51.64 Z-1.01 J92.95 F500.0
+G1 X-33.34 Y-53.05 Z-1.01 J95.73 F500.0
+G1 X-33.34 Y-57.25 Z-1.01 J99.84 F500.0
+G1 X-35.80 Y-58.67 Z-1.01 J102.63 F500.0
+G1 X-35.80 Y-63.64 Z-1.01 J107.50 F500.0
+G1 X-33.34 Y-65.05 Z-1.01 J110.27 F500.0
+G1 X-33.34 Y-69.25 Z-1.01 J114.39 F500.0
+G1 X-35.80 Y-70.67 Z-1.01 J117.17 F500.0
+G1 X-29.98 Y-75.31 Z-1.01 J124.47 F500.0
+G1 X-29.88 Y-75.25 Z-1.01 J124.58 F500.0
+G1 X-29.88 Y-71.05 Z-1.01 J128.70 F500.0
+G1 X-33.00 Y-69.25 Z-1.01 J132.23 F500.0
+G1 X-33.00 Y-65.05 Z-1.01 J136.35 F500.0
+G1 X-29.88 Y-63.25 Z-1.01 J139.87 F500.0
+G1 X-29.88 Y-59.05 Z-1.01 J143.99 F500.0
+G1 X-33.00 Y-57.25 Z-1.01 J147.52 F500.0
+G1 X-33.00 Y-53.05 Z-1.01 J151.64 F500.0
+G1 X-29.88 Y-51.25 Z-1.01 J155.17 F500.0
+G1 X-29.88 Y-47.05 Z-1.01 J159.28 F500.0
+G1 X-33.00 Y-45.25 Z-1.01 J162.81 F500.0
+G1 X-33.00 Y-41.05 Z-1.01 J166.93 F500.0
+G1 X-29.88 Y-39.25 Z-1.01 J170.46 F500.0
+G1 X-29.88 Y-37.63 Z-1.01 J172.05 F500.0
+G1 X-29.53 Y-37.63 Z-1.01 J172.39 F500.0
+G1 X-29.53 Y-39.25 Z-1.01 J173.98 F500.0
+G1 X-26.42 Y-41.05 Z-1.01 J177.50 F500.0
+G1 X-26.42 Y-45.25 Z-1.01 J181.61 F500.0
+G1 X-29.53 Y-47.05 Z-1.01 J185.14 F500.0
+G1 X-29.53 Y-51.25 Z-1.01 J189.25 F500.0
+G1 X-26.42 Y-53.05 Z-1.01 J192.77 F500.0
+G1 X-26.42 Y-57.25 Z-1.01 J196.89 F500.0
+G1 X-29.53 Y-59.05 Z-1.01 J200.41 F500.0
+G1 X-29.53 Y-63.25 Z-1.01 J204.53 F500.0
+G1 X-26.42 Y-65.05 Z-1.01 J208.05 F500.0
+G1 X-26.42 Y-69.25 Z-1.01 J212.16 F500.0
+G1 X-29.53 Y-71.05 Z-1.01 J215.69 F500.0
+G1 X-29.53 Y-75.25 Z-1.01 J219.80 F500.0
+G1 X-29.44 Y-75.31 Z-1.01 J219.91 F500.0
+G1 X-23.05 Y-75.31 Z-1.01 J226.17 F500.0
+G1 X-22.95 Y-75.25 Z-1.01 J226.28 F500.0
+G1 X-22.95 Y-71.05 Z-1.01 J230.40 F500.0
+G1 X-26.07 Y-69.25 Z-1.01 J233.93 F500.0
+G1 X-26.07 Y-65.05 Z-1.01 J238.05 F500.0
+G1 X-22.95 Y-63.25 Z-1.01 J241.58 F500.0
+G1 X-22.95 Y-59.05 Z-1.01 J245.69 F500.0
+G1 X-26.07 Y-57.25 Z-1.01 J249.22 F500.0
+G1 X-26.07 Y-53.05 Z-1.01 J253.34 F500.0
+G1 X-22.95 Y-51.25 Z-1.01 J256.87 F500.0
+G1 X-22.95 Y-47.05 Z-1.01 J260.98 F500.0
+G1 X-26.07 Y-45.25 Z-1.01 J264.51 F500.0
+G1 X-26.07 Y-41.05 Z-1.01 J268.63 F500.0
+G1 X-22.95 Y-39.25 Z-1.01 J272.16 F500.0
+G1 X-22.95 Y-37.63 Z-1.01 J273.75 F500.0
+G1 X-22.61 Y-37.63 Z-1.01 J274.08 F500.0
+G1 X-22.61 Y-39.25 Z-1.01 J275.67 F500.0
+G1 X-19.49 Y-41.05 Z-1.01 J279.20 F500.0
+G1 X-19.49 Y-45.25 Z-1.01 J283.31 F500.0
+G1 X-22.61 Y-47.05 Z-1.01 J286.84 F500.0
+G1 X-22.61 Y-51.25 Z-1.01 J290.96 F500.0
+G1 X-19.49 Y-53.05 Z-1.01 J294.49 F500.0
+G1 X-19.49 Y-57.25 Z-1.01 J298.61 F500.0
+G1 X-22.61 Y-59.05 Z-1.01 J302.14 F500.0
+G1 X-22.61 Y-63.25 Z-1.01 J306.25 F500.0
+G1 X-19.49 Y-65.05 Z-1.01 J309.78 F500.0
+G1 X-19.49 Y-69.25 Z-1.01 J313.90 F500.0
+G1 X-22.61 Y-71.05 Z-1.01 J317.43 F500.0
+G1 X-22.61 Y-75.25 Z-1.01 J321.54 F500.0
+G1 X-22.51 Y-75.31 Z-1.01 J321.66 F500.0
+G1 X-16.12 Y-75.31 Z-1.01 J327.92 F500.0
+G1 X-16.02 Y-75.25 Z-1.01 J328.04 F500.0
+G1 X-16.02 Y-71.05 Z-1.01 J332.15 F500.0
+G1 X-19.14 Y-69.25 Z-1.01 J335.68 F500.0
+G1 X-19.14 Y-65.05 Z-1.01 J339.80 F500.0
+G1 X-16.02 Y-63.25 Z-1.01 J343.33 F500.0
+G1 X-16.02 Y-59.05 Z-1.01 J347.44 F500.0
+G1 X-19.14 Y-57.25 Z-1.01 J350.97 F500.0
+G1 X-19.14 Y-53.05 Z-1.01 J355.09 F500.0
+G1 X-16.02 Y-51.25 Z-1.01 J358.62 F500.0
+G1 X-16.02 Y-47.05 Z-1.01 J362.73 F500.0
+G1 X-19.14 Y-45.25 Z-1.01 J366.26 F500.0
+G1 X-19.14 Y-41.05 Z-1.01 J370.38 F500.0
+G1 X-16.02 Y-39.25 Z-1.01 J373.91 F500.0
+G1 X-16.02 Y-37.63 Z-1.01 J375.50 F500.0
+G1 X-15.68 Y-37.63 Z-1.01 J375.83 F500.0
+G1 X-15.68 Y-39.25 Z-1.01 J377.42 F500.0
+G1 X-12.56 Y-41.05 Z-1.01 J380.95 F500.0
+G1 X-12.56 Y-45.25 Z-1.01 J385.07 F500.0
+G1 X-15.68 Y-47.05 Z-1.01 J388.60 F500.0
+G1 X-15.68 Y-51.25 Z-1.01 J392.71 F500.0
+G1 X-12.56 Y-53.05 Z-1.01 J396.24 F500.0
+G1 X-12.56 Y-57.25 Z-1.01 J400.36 F500.0
+G1 X-15.68 Y-59.05 Z-1.01 J403.89 F500.0
+G1 X-15.68 Y-63.25 Z-1.01 J408.00 F500.0
+G1 X-12.56 Y-65.05 Z-1.01 J411.53 F500.0
+G1 X-12.56 Y-69.25 Z-1.01 J415.65 F500.0
+G1 X-15.68 Y-71.05 Z-1.01 J419.18 F500.0
+G1 X-15.68 Y-75.25 Z-1.01 J423.29 F500.0
+G1 X-15.58 Y-75.31 Z-1.01 J423.41 F500.0
+G1 X-9.19 Y-75.31 Z-1.01 J429.67 F500.0
+G1 X-9.10 Y-75.25 Z-1.01 J429.78 F500.0
+G1 X-9.10 Y-71.05 Z-1.01 J433.89 F500.0
+G1 X-12.21 Y-69.25 Z-1.01 J437.41 F500.0
+G1 X-12.21 Y-65.05 Z-1.01 J441.53 F500.0
+G1 X-9.10 Y-63.25 Z-1.01 J445.05 F500.0
+G1 X-9.10 Y-59.05 Z-1.01 J449.17 F500.0
+G1 X-12.21 Y-57.25 Z-1.01 J452.69 F500.0
+G1 X-12.21 Y-53.05 Z-1.01 J456.81 F500.0
+G1 X-9.10 Y-51.25 Z-1.01 J460.33 F500.0
+G1 X-9.10 Y-47.05 Z-1.01 J464.44 F500.0
+G1 X-12.21 Y-45.25 Z-1.01 J467.96 F500.0
+G1 X-12.21 Y-41.05 Z-1.01 J472.08 F500.0
+G1 X-9.10 Y-39.25 Z-1.01 J475.60 F500.0
+G1 X-9.10 Y-37.63 Z-1.01 J477.19 F500.0
+G1 X-8.75 Y-37.63 Z-1.01 J477.53 F500.0
+G1 X-8.75 Y-39.25 Z-1.01 J479.12 F500.0
+G1 X-5.63 Y-41.05 Z-1.01 J482.65 F500.0
+G1 X-5.63 Y-45.25 Z-1.01 J486.77 F500.0
+G1 X-8.75 Y-47.05 Z-1.01 J490.30 F500.0
+G1 X-8.75 Y-51.25 Z-1.01 J494.41 F500.0
+G1 X-5.63 Y-53.05 Z-1.01 J497.94 F500.0
+G1 X-5.63 Y-57.25 Z-1.01 J502.06 F500.0
+G1 X-8.75 Y-59.05 Z-1.01 J505.59 F500.0
+G1 X-8.75 Y-63.25 Z-1.01 J509.70 F500.0
+G1 X-5.63 Y-65.05 Z-1.01 J513.23 F500.0
+G1 X-5.63 Y-69.25 Z-1.01 J517.35 F500.0
+G1 X-8.75 Y-71.05 Z-1.01 J520.88 F500.0
+G1 X-8.75 Y-75.25 Z-1.01 J525.00 F500.0
+G1 X-8.65 Y-75.31 Z-1.01 J525.11 F500.0
+G1 X-2.26 Y-75.31 Z-1.01 J531.37 F500.0
+G1 X-2.17 Y-75.25 Z-1.01 J531.48 F500.0
+G1 X-2.17 Y-71.05 Z-1.01 J535.59 F500.0
+G1 X-5.28 Y-69.25 Z-1.01 J539.12 F500.0
+G1 X-5.28 Y-65.05 Z-1.01 J543.23 F500.0
+G1 X-2.17 Y-63.25 Z-1.01 J546.75 F500.0
+G1 X-2.17 Y-59.05 Z-1.01 J550.87 F500.0
+G1 X-5.28 Y-57.25 Z-1.01 J554.39 F500.0
+G1 X-5.28 Y-53.05 Z-1.01 J558.51 F500.0
+G1 X-2.17 Y-51.25 Z-1.01 J562.03 F500.0
+G1 X-2.17 Y-47.05 Z-1.01 J566.14 F500.0
+G1 X-5.28 Y-45.25 Z-1.01 J569.67 F500.0
+G1 X-5.28 Y-41.05 Z-1.01 J573.78 F500.0
+G1 X-2.17 Y-39.25 Z-1.01 J577.30 F500.0
+G1 X-2.17 Y-37.63 Z-1.01 J578.89 F500.0
+G1 X-1.82 Y-37.63 Z-1.01 J579.23 F500.0
+G1 X-1.82 Y-39.25 Z-1.01 J580.82 F500.0
+G1 X1.30 Y-41.05 Z-1.01 J584.35 F500.0
+G1 X1.30 Y-45.25 Z-1.01 J588.47 F500.0
+G1 X-1.82 Y-47.05 Z-1.01 J592.00 F500.0
+G1 X-1.82 Y-51.25 Z-1.01 J596.11 F500.0
+G1 X1.30 Y-53.05 Z-1.01 J599.64 F500.0
+G1 X1.30 Y-57.25 Z-1.01 J603.76 F500.0
+G1 X-1.82 Y-59.05 Z-1.01 J607.29 F500.0
+G1 X-1.82 Y-63.25 Z-1.01 J611.41 F500.0
+G1 X1.30 Y-65.05 Z-1.01 J614.94 F500.0
+G1 X1.30 Y-69.25 Z-1.01 J619.05 F500.0
+G1 X-1.82 Y-71.05 Z-1.01 J622.58 F500.0
+G1 X-1.82 Y-75.25 Z-1.01 J626.70 F500.0
+G1 X-1.73 Y-75.31 Z-1.01 J626.80 F500.0
+G1 X4.67 Y-75.31 Z-1.01 J633.08 F500.0
+G1 X4.76 Y-75.25 Z-1.01 J633.18 F500.0
+G1 X4.76 Y-71.05 Z-1.01 J637.30 F500.0
+G1 X1.64 Y-69.25 Z-1.01 J640.83 F500.0
+G1 X1.64 Y-65.05 Z-1.01 J644.94 F500.0
+G1 X4.76 Y-63.25 Z-1.01 J648.47 F500.0
+G1 X4.76 Y-59.05 Z-1.01 J652.59 F500.0
+G1 X1.64 Y-57.25 Z-1.01 J656.12 F500.0
+G1 X1.64 Y-53.05 Z-1.01 J660.24 F500.0
+G1 X4.76 Y-51.25 Z-1.01 J663.77 F500.0
+G1 X4.76 Y-47.05 Z-1.01 J667.88 F500.0
+G1 X1.64 Y-45.25 Z-1.01 J671.41 F500.0
+G1 X1.64 Y-41.05 Z-1.01 J675.53 F500.0
+G1 X4.76 Y-39.25 Z-1.01 J679.06 F500.0
+G1 X4.76 Y-37.63 Z-1.01 J680.64 F500.0
+G1 X5.11 Y-37.63 Z-1.01 J680.99 F500.0
+G1 X5.11 Y-39.25 Z-1.01 J682.58 F500.0
+G1 X8.22 Y-41.05 Z-1.01 J686.10 F500.0
+G1 X8.22 Y-45.25 Z-1.01 J690.21 F500.0
+G1 X5.11 Y-47.05 Z-1.01 J693.73 F500.0
+G1 X5.11 Y-51.25 Z-1.01 J697.85 F500.0
+G1 X8.22 Y-53.05 Z-1.01 J701.37 F500.0
+G1 X8.22 Y-57.25 Z-1.01 J705.49 F500.0
+G1 X5.11 Y-59.05 Z-1.01 J709.01 F500.0
+G1 X5.11 Y-63.25 Z-1.01 J713.13 F500.0
+G1 X8.22 Y-65.05 Z-1.01 J716.65 F500.0
+G1 X8.22 Y-69.25 Z-1.01 J720.76 F500.0
+G1 X5.11 Y-71.05 Z-1.01 J724.28 F500.0
+G1 X5.11 Y-75.25 Z-1.01 J728.40 F500.0
+G1 X5.20 Y-75.31 Z-1.01 J728.51 F500.0
+G1 X11.59 Y-75.31 Z-1.01 J734.77 F500.0
+G1 X11.69 Y-75.25 Z-1.01 J734.88 F500.0
+G1 X11.69 Y-71.05 Z-1.01 J739.00 F500.0
+G1 X8.57 Y-69.25 Z-1.01 J742.53 F500.0
+G1 X8.57 Y-65.05 Z-1.01 J746.64 F500.0
+G1 X11.69 Y-63.25 Z-1.01 J750.17 F500.0
+G1 X11.69 Y-59.05 Z-1.01 J754.29 F500.0
+G1 X8.57 Y-57.25 Z-1.01 J757.82 F500.0
+G1 X8.57 Y-53.05 Z-1.01 J761.94 F500.0
+G1 X11.69 Y-51.25 Z-1.01 J765.47 F500.0
+G1 X11.69 Y-47.05 Z-1.01 J769.58 F500.0
+G1 X8.57 Y-45.25 Z-1.01 J773.11 F500.0
+G1 X8.57 Y-41.05 Z-1.01 J777.23 F500.0
+G1 X11.69 Y-39.25 Z-1.01 J780.76 F500.0
+G1 X11.69 Y-37.63 Z-1.01 J782.35 F500.0
+G1 X12.03 Y-37.63 Z-1.01 J782.68 F500.0
+G1 X12.03 Y-39.25 Z-1.01 J784.27 F500.0
+G1 X15.15 Y-41.05 Z-1.01 J787.80 F500.0
+G1 X15.15 Y-45.25 Z-1.01 J791.91 F500.0
+G1 X12.03 Y-47.05 Z-1.01 J795.44 F500.0
+G1 X12.03 Y-51.25 Z-1.01 J799.56 F500.0
+G1 X15.15 Y-53.05 Z-1.01 J803.09 F500.0
+G1 X15.15 Y-57.25 Z-1.01 J807.20 F500.0
+G1 X12.03 Y-59.05 Z-1.01 J810.73 F500.0
+G1 X12.03 Y-63.25 Z-1.01 J814.85 F500.0
+G1 X15.15 Y-65.05 Z-1.01 J818.38 F500.0
+G1 X15.15 Y-69.25 Z-1.01 J822.50 F500.0
+G1 X12.03 Y-71.05 Z-1.01 J826.03 F500.0
+G1 X12.03 Y-75.25 Z-1.01 J830.14 F500.0
+G1 X12.13 Y-75.31 Z-1.01 J830.26 F500.0
+G1 X18.52 Y-75.31 Z-1.01 J836.52 F500.0
+G1 X18.62 Y-75.25 Z-1.01 J836.63 F500.0
+G1 X18.62 Y-71.05 Z-1.01 J840.75 F500.0
+G1 X15.50 Y-69.25 Z-1.01 J844.28 F500.0
+G1 X15.50 Y-65.05 Z-1.01 J848.40 F500.0
+G1 X18.62 Y-63.25 Z-1.01 J851.93 F500.0
+G1 X18.62 Y-59.05 Z-1.01 J856.04 F500.0
+G1 X15.50 Y-57.25 Z-1.01 J859.57 F500.0
+G1 X15.50 Y-53.05 Z-1.01 J863.69 F500.0
+G1 X18.62 Y-51.25 Z-1.01 J867.22 F500.0
+G1 X18.62 Y-47.05 Z-1.01 J871.33 F500.0
+G1 X15.50 Y-45.25 Z-1.01 J874.86 F500.0
+G1 X15.50 Y-41.05 Z-1.01 J878.98 F500.0
+G1 X18.62 Y-39.25 Z-1.01 J882.51 F500.0
+G1 X18.62 Y-37.63 Z-1.01 J884.10 F500.0
+G1 X18.96 Y-37.63 Z-1.01 J884.43 F500.0
+G1 X18.96 Y-39.25 Z-1.01 J886.02 F500.0
+G1 X22.08 Y-41.05 Z-1.01 J889.55 F500.0
+G1 X22.08 Y-45.25 Z-1.01 J893.66 F500.0
+G1 X18.96 Y-47.05 Z-1.01 J897.19 F500.0
+G1 X18.96 Y-51.25 Z-1.01 J901.31 F500.0
+G1 X22.08 Y-53.05 Z-1.01 J904.84 F500.0
+G1 X22.08 Y-57.25 Z-1.01 J908.96 F500.0
+G1 X18.96 Y-59.05 Z-1.01 J912.49 F500.0
+G1 X18.96 Y-63.25 Z-1.01 J916.60 F500.0
+G1 X22.08 Y-65.05 Z-1.01 J920.13 F500.0
+G1 X22.08 Y-69.25 Z-1.01 J924.25 F500.0
+G1 X18.96 Y-71.05 Z-1.01 J927.78 F500.0
+G1 X18.96 Y-75.25 Z-1.01 J931.89 F500.0
+G1 X19.06 Y-75.31 Z-1.01 J932.01 F500.0
+G1 X25.45 Y-75.31 Z-1.01 J938.27 F500.0
+G1 X25.54 Y-75.25 Z-1.01 J938.38 F500.0
+G1 X25.54 Y-71.05 Z-1.01 J942.49 F500.0
+G1 X22.43 Y-69.25 Z-1.01 J946.01 F500.0
+G1 X22.43 Y-65.05 Z-1.01 J950.13 F500.0
+G1 X25.54 Y-63.25 Z-1.01 J953.65 F500.0
+G1 X25.54 Y-59.05 Z-1.01 J957.77 F500.0
+G1 X22.43 Y-57.25 Z-1.01 J961.29 F500.0
+G1 X22.43 Y-53.05 Z-1.01 J965.40 F500.0
+G1 X25.54 Y-51.25 Z-1.01 J968.93 F500.0
+G1 X25.54 Y-47.05 Z-1.01 J973.04 F500.0
+G1 X22.43 Y-45.25 Z-1.01 J976.56 F500.0
+G1 X22.43 Y-41.05 Z-1.01 J980.68 F500.0
+G1 X25.54 Y-39.25 Z-1.01 J984.20 F500.0
+G1 X25.54 Y-37.63 Z-1.01 J985.79 F500.0
+G1 X25.89 Y-37.63 Z-1.01 J986.13 F500.0
+G1 X25.89 Y-39.25 Z-1.01 J987.72 F500.0
+G1 X29.01 Y-41.05 Z-1.01 J991.25 F500.0
+G1 X29.01 Y-45.25 Z-1.01 J995.36 F500.0
+G1 X25.89 Y-47.05 Z-1.01 J998.89 F500.0
+G1 X25.89 Y-51.25 Z-1.01 J1003.01 F500.0
+G1 X29.01 Y-53.05 Z-1.01 J1006.54 F500.0
+G1 X29.01 Y-57.25 Z-1.01 J1010.66 F500.0
+G1 X25.89 Y-59.05 Z-1.01 J1014.19 F500.0
+G1 X25.89 Y-63.25 Z-1.01 J1018.30 F500.0
+G1 X29.01 Y-65.05 Z-1.01 J1021.83 F500.0
+G1 X29.01 Y-69.25 Z-1.01 J1025.95 F500.0
+G1 X25.89 Y-71.05 Z-1.01 J1029.48 F500.0
+G1 X25.89 Y-75.25 Z-1.01 J1033.59 F500.0
+G1 X25.99 Y-75.31 Z-1.01 J1033.71 F500.0
+G1 X32.38 Y-75.31 Z-1.01 J1039.97 F500.0
+G1 X32.47 Y-75.25 Z-1.01 J1040.08 F500.0
+G1 X32.47 Y-71.05 Z-1.01 J1044.19 F500.0
+G1 X29.36 Y-69.25 Z-1.01 J1047.71 F500.0
+G1 X29.36 Y-65.05 Z-1.01 J1051.83 F500.0
+G1 X32.47 Y-63.25 Z-1.01 J1055.35 F500.0
+G1 X32.47 Y-59.05 Z-1.01 J1059.47 F500.0
+G1 X29.36 Y-57.25 Z-1.01 J1062.99 F500.0
+G1 X29.36 Y-53.05 Z-1.01 J1067.11 F500.0
+G1 X32.47 Y-51.25 Z-1.01 J1070.63 F500.0
+G1 X32.47 Y-47.05 Z-1.01 J1074.74 F500.0
+G1 X29.36 Y-45.25 Z-1.01 J1078.26 F500.0
+G1 X29.36 Y-41.05 Z-1.01 J1082.38 F500.0
+G1 X32.47 Y-39.25 Z-1.01 J1085.90 F500.0
+G1 X32.47 Y-37.63 Z-1.01 J1087.49 F500.0
+G1 X32.82 Y-37.63 Z-1.01 J1087.83 F500.0
+G1 X32.82 Y-39.25 Z-1.01 J1089.42 F500.0
+G1 X35.94 Y-41.05 Z-1.01 J1092.95 F500.0
+G1 X35.94 Y-45.25 Z-1.01 J1097.07 F500.0
+G1 X32.82 Y-47.05 Z-1.01 J1100.60 F500.0
+G1 X32.82 Y-51.25 Z-1.01 J1104.71 F500.0
+G1 X35.94 Y-53.05 Z-1.01 J1108.24 F500.0
+G1 X35.94 Y-57.25 Z-1.01 J1112.36 F500.0
+G1 X32.82 Y-59.05 Z-1.01 J1115.89 F500.0
+G1 X32.82 Y-63.25 Z-1.01 J1120.00 F500.0
+G1 X35.94 Y-65.05 Z-1.01 J1123.53 F500.0
+G1 X35.94 Y-69.25 Z-1.01 J1127.65 F500.0
+G1 X32.82 Y-71.05 Z-1.01 J1131.18 F500.0
+G1 X32.82 Y-75.25 Z-1.01 J1135.30 F500.0
+G1 X32.92 Y-75.31 Z-1.01 J1135.41 F500.0
+G1 X39.31 Y-75.31 Z-1.01 J1141.67 F500.0
+G1 X39.40 Y-75.25 Z-1.01 J1141.78 F500.0
+G1 X39.40 Y-71.05 Z-1.01 J1145.89 F500.0
+G1 X36.28 Y-69.25 Z-1.01 J1149.42 F500.0
+G1 X36.28 Y-65.05 Z-1.01 J1153.54 F500.0
+G1 X39.40 Y-63.25 Z-1.01 J1157.07 F500.0
+G1 X39.40 Y-59.05 Z-1.01 J1161.19 F500.0
+G1 X36.28 Y-57.25 Z-1.01 J1164.72 F500.0
+G1 X36.28 Y-53.05 Z-1.01 J1168.83 F500.0
+G1 X39.40 Y-51.25 Z-1.01 J1172.36 F500.0
+G1 X39.40 Y-47.05 Z-1.01 J1176.48 F500.0
+G1 X36.28 Y-45.25 Z-1.01 J1180.01 F500.0
+G1 X36.28 Y-41.05 Z-1.01 J1184.12 F500.0
+G1 X39.40 Y-39.25 Z-1.01 J1187.65 F500.0
+G1 X39.40 Y-37.63 Z-1.01 J1189.24 F500.0
+G1 X39.75 Y-37.63 Z-1.01 J1189.58 F500.0
+G1 X39.75 Y-39.25 Z-1.01 J1191.17 F500.0
+G1 X41.88 Y-40.48 Z-1.01 J1193.58 F500.0
+G1 X41.88 Y-45.82 Z-1.01 J1198.82 F500.0
+G1 X39.75 Y-47.05 Z-1.01 J1201.23 F500.0
+G1 X39.75 Y-51.25 Z-1.01 J1205.34 F500.0
+G1 X41.88 Y-52.48 Z-1.01 J1207.75 F500.0
+G1 X41.88 Y-57.82 Z-1.01 J1212.99 F500.0
+G1 X39.75 Y-59.05 Z-1.01 J1215.40 F500.0
+G1 X39.75 Y-63.25 Z-1.01 J1219.51 F500.0
+G1 X41.88 Y-64.48 Z-1.01 J1221.92 F500.0
+G1 X41.88 Y-69.82 Z-1.01 J1227.16 F500.0
+G1 X40.35 Y-70.70 Z-1.01 J1233.89 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X39.75 Y-71.05 Z-1.01 J1233.89 F800.0
+G1 X39.75 Y-75.25 Z-1.01 J1233.89 F800.0
+G1 X39.84 Y-75.31 Z-1.01 J1233.89 F800.0
+G1 X39.84 Y-75.31 Z8.99 J1233.89 F800.0
+G1 X27.36 Y-79.75 Z8.99 J1243.89 F800.0
+
+T1
+G1 X32.36 Y-74.75 Z-0.01 J0.00 F300.0
+G1 X41.32 Y-74.75 Z-0.01 J8.78 F300.0
+G1 X41.32 Y-40.95 Z-0.01 J41.90 F300.0
+G1 X41.32 Y-38.19 Z-0.01 J44.61 F300.0
+G1 X-26.28 Y-38.19 Z-0.01 J110.86 F500.0
+G1 X-35.24 Y-38.19 Z-0.01 J119.64 F500.0
+G1 X-35.24 Y-71.99 Z-0.01 J152.76 F500.0
+G1 X-35.24 Y-74.75 Z-0.01 J155.47 F500.0
+G1 X27.36 Y-74.75 Z-0.01 J221.82 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X32.36 Y-74.75 Z-0.01 J221.82 F800.0
+G1 X32.36 Y-74.75 Z9.99 J221.82 F800.0
+G1 X27.36 Y-79.75 Z9.99 J231.82 F800.0
+
+T1
+G1 X32.36 Y-74.75 Z-0.01 J0.00 F300.0
+G1 X-35.24 Y-39.95 Z-0.01 J74.51 F300.0
+G1 X-33.34 Y-41.05 Z-0.01 J76.66 F300.0
+G1 X-33.34 Y-45.25 Z-0.01 J80.77 F300.0
+G1 X-35.24 Y-46.35 Z-0.01 J82.93 F500.0
+G1 X-35.24 Y-51.96 Z-0.01 J88.42 F500.0
+G1 X-33.34 Y-53.05 Z-0.01 J90.57 F500.0
+G1 X-33.34 Y-57.25 Z-0.01 J94.69 F500.0
+G1 X-35.24 Y-58.35 Z-0.01 J96.84 F500.0
+G1 X-35.24 Y-63.96 Z-0.01 J102.34 F500.0
+G1 X-33.34 Y-65.05 Z-0.01 J104.48 F500.0
+G1 X-33.34 Y-69.25 Z-0.01 J108.60 F500.0
+G1 X-35.24 Y-70.35 Z-0.01 J110.75 F500.0
+G1 X-29.88 Y-74.75 Z-0.01 J117.55 F500.0
+G1 X-29.88 Y-71.05 Z-0.01 J121.17 F500.0
+G1 X-33.00 Y-69.25 Z-0.01 J124.70 F500.0
+G1 X-33.00 Y-65.05 Z-0.01 J128.82 F500.0
+G1 X-29.88 Y-63.25 Z-0.01 J132.35 F500.0
+G1 X-29.88 Y-59.05 Z-0.01 J136.46 F500.0
+G1 X-33.00 Y-57.25 Z-0.01 J139.99 F500.0
+G1 X-33.00 Y-53.05 Z-0.01 J144.11 F500.0
+G1 X-29.88 Y-51.25 Z-0.01 J147.64 F500.0
+G1 X-29.88 Y-47.05 Z-0.01 J151.76 F500.0
+G1 X-33.00 Y-45.25 Z-0.01 J155.28 F500.0
+G1 X-33.00 Y-41.05 Z-0.01 J159.40 F500.0
+G1 X-29.88 Y-39.25 Z-0.01 J162.93 F500.0
+G1 X-29.88 Y-38.19 Z-0.01 J163.97 F500.0
+G1 X-29.53 Y-38.19 Z-0.01 J164.31 F500.0
+G1 X-29.53 Y-39.25 Z-0.01 J165.35 F500.0
+G1 X-26.42 Y-41.05 Z-0.01 J168.87 F500.0
+G1 X-26.42 Y-45.25 Z-0.01 J172.99 F500.0
+G1 X-29.53 Y-47.05 Z-0.01 J176.51 F500.0
+G1 X-29.53 Y-51.25 Z-0.01 J180.63 F500.0
+G1 X-26.42 Y-53.05 Z-0.01 J184.15 F500.0
+G1 X-26.42 Y-57.25 Z-0.01 J188.26 F500.0
+G1 X-29.53 Y-59.05 Z-0.01 J191.79 F500.0
+G1 X-29.53 Y-63.25 Z-0.01 J195.90 F500.0
+G1 X-26.42 Y-65.05 Z-0.01 J199.42 F500.0
+G1 X-26.42 Y-69.25 Z-0.01 J203.54 F500.0
+G1 X-29.53 Y-71.05 Z-0.01 J207.06 F500.0
+G1 X-29.53 Y-74.75 Z-0.01 J210.69 F500.0
+G1 X-22.95 Y-74.75 Z-0.01 J217.13 F500.0
+G1 X-22.95 Y-71.05 Z-0.01 J220.76 F500.0
+G1 X-26.07 Y-69.25 Z-0.01 J224.29 F500.0
+G1 X-26.07 Y-65.05 Z-0.01 J228.41 F500.0
+G1 X-22.95 Y-63.25 Z-0.01 J231.94 F500.0
+G1 X-22.95 Y-59.05 Z-0.01 J236.05 F500.0
+G1 X-26.07 Y-57.25 Z-0.01 J239.58 F500.0
+G1 X-26.07 Y-53.05 Z-0.01 J243.70 F500.0
+G1 X-22.95 Y-51.25 Z-0.01 J247.23 F500.0
+G1 X-22.95 Y-47.05 Z-0.01 J251.34 F500.0
+G1 X-26.07 Y-45.25 Z-0.01 J254.87 F500.0
+G1 X-26.07 Y-41.05 Z-0.01 J258.99 F500.0
+G1 X-22.95 Y-39.25 Z-0.01 J262.52 F500.0
+G1 X-22.95 Y-38.19 Z-0.01 J263.56 F500.0
+G1 X-22.61 Y-38.19 Z-0.01 J263.89 F500.0
+G1 X-22.61 Y-39.25 Z-0.01 J264.93 F500.0
+G1 X-19.49 Y-41.05 Z-0.01 J268.46 F500.0
+G1 X-19.49 Y-45.25 Z-0.01 J272.58 F500.0
+G1 X-22.61 Y-47.05 Z-0.01 J276.11 F500.0
+G1 X-22.61 Y-51.25 Z-0.01 J280.22 F500.0
+G1 X-19.49 Y-53.05 Z-0.01 J283.75 F500.0
+G1 X-19.49 Y-57.25 Z-0.01 J287.87 F500.0
+G1 X-22.61 Y-59.05 Z-0.01 J291.40 F500.0
+G1 X-22.61 Y-63.25 Z-0.01 J295.52 F500.0
+G1 X-19.49 Y-65.05 Z-0.01 J299.05 F500.0
+G1 X-19.49 Y-69.25 Z-0.01 J303.16 F500.0
+G1 X-22.61 Y-71.05 Z-0.01 J306.69 F500.0
+G1 X-22.61 Y-74.75 Z-0.01 J310.32 F500.0
+G1 X-16.02 Y-74.75 Z-0.01 J316.78 F500.0
+G1 X-16.02 Y-71.05 Z-0.01 J320.40 F500.0
+G1 X-19.14 Y-69.25 Z-0.01 J323.93 F500.0
+G1 X-19.14 Y-65.05 Z-0.01 J328.05 F500.0
+G1 X-16.02 Y-63.25 Z-0.01 J331.58 F500.0
+G1 X-16.02 Y-59.05 Z-0.01 J335.69 F500.0
+G1 X-19.14 Y-57.25 Z-0.01 J339.22 F500.0
+G1 X-19.14 Y-53.05 Z-0.01 J343.34 F500.0
+G1 X-16.02 Y-51.25 Z-0.01 J346.87 F500.0
+G1 X-16.02 Y-47.05 Z-0.01 J350.99 F500.0
+G1 X-19.14 Y-45.25 Z-0.01 J354.52 F500.0
+G1 X-19.14 Y-41.05 Z-0.01 J358.63 F500.0
+G1 X-16.02 Y-39.25 Z-0.01 J362.16 F500.0
+G1 X-16.02 Y-38.19 Z-0.01 J363.20 F500.0
+G1 X-15.68 Y-38.19 Z-0.01 J363.53 F500.0
+G1 X-15.68 Y-39.25 Z-0.01 J364.57 F500.0
+G1 X-12.56 Y-41.05 Z-0.01 J368.10 F500.0
+G1 X-12.56 Y-45.25 Z-0.01 J372.22 F500.0
+G1 X-15.68 Y-47.05 Z-0.01 J375.75 F500.0
+G1 X-15.68 Y-51.25 Z-0.01 J379.86 F500.0
+G1 X-12.56 Y-53.05 Z-0.01 J383.39 F500.0
+G1 X-12.56 Y-57.25 Z-0.01 J387.51 F500.0
+G1 X-15.68 Y-59.05 Z-0.01 J391.04 F500.0
+G1 X-15.68 Y-63.25 Z-0.01 J395.16 F500.0
+G1 X-12.56 Y-65.05 Z-0.01 J398.69 F500.0
+G1 X-12.56 Y-69.25 Z-0.01 J402.80 F500.0
+G1 X-15.68 Y-71.05 Z-0.01 J406.33 F500.0
+G1 X-15.68 Y-74.75 Z-0.01 J409.96 F500.0
+G1 X-9.10 Y-74.75 Z-0.01 J416.41 F500.0
+G1 X-9.10 Y-71.05 Z-0.01 J420.03 F500.0
+G1 X-12.21 Y-69.25 Z-0.01 J423.55 F500.0
+G1 X-12.21 Y-65.05 Z-0.01 J427.67 F500.0
+G1 X-9.10 Y-63.25 Z-0.01 J431.19 F500.0
+G1 X-9.10 Y-59.05 Z-0.01 J435.31 F500.0
+G1 X-12.21 Y-57.25 Z-0.01 J438.83 F500.0
+G1 X-12.21 Y-53.05 Z-0.01 J442.94 F500.0
+G1 X-9.10 Y-51.25 Z-0.01 J446.47 F500.0
+G1 X-9.10 Y-47.05 Z-0.01 J450.58 F500.0
+G1 X-12.21 Y-45.25 Z-0.01 J454.10 F500.0
+G1 X-12.21 Y-41.05 Z-0.01 J458.22 F500.0
+G1 X-9.10 Y-39.25 Z-0.01 J461.74 F500.0
+G1 X-9.10 Y-38.19 Z-0.01 J462.78 F500.0
+G1 X-8.75 Y-38.19 Z-0.01 J463.12 F500.0
+G1 X-8.75 Y-39.25 Z-0.01 J464.16 F500.0
+G1 X-5.63 Y-41.05 Z-0.01 J467.69 F500.0
+G1 X-5.63 Y-45.25 Z-0.01 J471.81 F500.0
+G1 X-8.75 Y-47.05 Z-0.01 J475.34 F500.0
+G1 X-8.75 Y-51.25 Z-0.01 J479.45 F500.0
+G1 X-5.63 Y-53.05 Z-0.01 J482.98 F500.0
+G1 X-5.63 Y-57.25 Z-0.01 J487.10 F500.0
+G1 X-8.75 Y-59.05 Z-0.01 J490.63 F500.0
+G1 X-8.75 Y-63.25 Z-0.01 J494.75 F500.0
+G1 X-5.63 Y-65.05 Z-0.01 J498.28 F500.0
+G1 X-5.63 Y-69.25 Z-0.01 J502.39 F500.0
+G1 X-8.75 Y-71.05 Z-0.01 J505.92 F500.0
+G1 X-8.75 Y-74.75 Z-0.01 J509.55 F500.0
+G1 X-2.17 Y-74.75 Z-0.01 J516.00 F500.0
+G1 X-2.17 Y-71.05 Z-0.01 J519.62 F500.0
+G1 X-5.28 Y-69.25 Z-0.01 J523.14 F500.0
+G1 X-5.28 Y-65.05 Z-0.01 J527.26 F500.0
+G1 X-2.17 Y-63.25 Z-0.01 J530.78 F500.0
+G1 X-2.17 Y-59.05 Z-0.01 J534.90 F500.0
+G1 X-5.28 Y-57.25 Z-0.01 J538.42 F500.0
+G1 X-5.28 Y-53.05 Z-0.01 J542.53 F500.0
+G1 X-2.17 Y-51.25 Z-0.01 J546.06 F500.0
+G1 X-2.17 Y-47.05 Z-0.01 J550.17 F500.0
+G1 X-5.28 Y-45.25 Z-0.01 J553.69 F500.0
+G1 X-5.28 Y-41.05 Z-0.01 J557.81 F500.0
+G1 X-2.17 Y-39.25 Z-0.01 J561.33 F500.0
+G1 X-2.17 Y-38.19 Z-0.01 J562.37 F500.0
+G1 X-1.82 Y-38.19 Z-0.01 J562.71 F500.0
+G1 X-1.82 Y-39.25 Z-0.01 J563.75 F500.0
+G1 X1.30 Y-41.05 Z-0.01 J567.28 F500.0
+G1 X1.30 Y-45.25 Z-0.01 J571.40 F500.0
+G1 X-1.82 Y-47.05 Z-0.01 J574.93 F500.0
+G1 X-1.82 Y-51.25 Z-0.01 J579.04 F500.0
+G1 X1.30 Y-53.05 Z-0.01 J582.57 F500.0
+G1 X1.30 Y-57.25 Z-0.01 J586.69 F500.0
+G1 X-1.82 Y-59.05 Z-0.01 J590.22 F500.0
+G1 X-1.82 Y-63.25 Z-0.01 J594.33 F500.0
+G1 X1.30 Y-65.05 Z-0.01 J597.86 F500.0
+G1 X1.30 Y-69.25 Z-0.01 J601.98 F500.0
+G1 X-1.82 Y-71.05 Z-0.01 J605.51 F500.0
+G1 X-1.82 Y-74.75 Z-0.01 J609.14 F500.0
+G1 X4.76 Y-74.75 Z-0.01 J615.59 F500.0
+G1 X4.76 Y-71.05 Z-0.01 J619.21 F500.0
+G1 X1.64 Y-69.25 Z-0.01 J622.74 F500.0
+G1 X1.64 Y-65.05 Z-0.01 J626.86 F500.0
+G1 X4.76 Y-63.25 Z-0.01 J630.39 F500.0
+G1 X4.76 Y-59.05 Z-0.01 J634.50 F500.0
+G1 X1.64 Y-57.25 Z-0.01 J638.03 F500.0
+G1 X1.64 Y-53.05 Z-0.01 J642.15 F500.0
+G1 X4.76 Y-51.25 Z-0.01 J645.68 F500.0
+G1 X4.76 Y-47.05 Z-0.01 J649.80 F500.0
+G1 X1.64 Y-45.25 Z-0.01 J653.33 F500.0
+G1 X1.64 Y-41.05 Z-0.01 J657.44 F500.0
+G1 X4.76 Y-39.25 Z-0.01 J660.97 F500.0
+G1 X4.76 Y-38.19 Z-0.01 J662.01 F500.0
+G1 X5.11 Y-38.19 Z-0.01 J662.35 F500.0
+G1 X5.11 Y-39.25 Z-0.01 J663.39 F500.0
+G1 X8.22 Y-41.05 Z-0.01 J666.91 F500.0
+G1 X8.22 Y-45.25 Z-0.01 J671.03 F500.0
+G1 X5.11 Y-47.05 Z-0.01 J674.55 F500.0
+G1 X5.11 Y-51.25 Z-0.01 J678.67 F500.0
+G1 X8.22 Y-53.05 Z-0.01 J682.19 F500.0
+G1 X8.22 Y-57.25 Z-0.01 J686.30 F500.0
+G1 X5.11 Y-59.05 Z-0.01 J689.83 F500.0
+G1 X5.11 Y-63.25 Z-0.01 J693.94 F500.0
+G1 X8.22 Y-65.05 Z-0.01 J697.46 F500.0
+G1 X8.22 Y-69.25 Z-0.01 J701.58 F500.0
+G1 X5.11 Y-71.05 Z-0.01 J705.10 F500.0
+G1 X5.11 Y-74.75 Z-0.01 J708.73 F500.0
+G1 X11.69 Y-74.75 Z-0.01 J715.17 F500.0
+G1 X11.69 Y-71.05 Z-0.01 J718.80 F500.0
+G1 X8.57 Y-69.25 Z-0.01 J722.33 F500.0
+G1 X8.57 Y-65.05 Z-0.01 J726.45 F500.0
+G1 X11.69 Y-63.25 Z-0.01 J729.98 F500.0
+G1 X11.69 Y-59.05 Z-0.01 J734.09 F500.0
+G1 X8.57 Y-57.25 Z-0.01 J737.62 F500.0
+G1 X8.57 Y-53.05 Z-0.01 J741.74 F500.0
+G1 X11.69 Y-51.25 Z-0.01 J745.27 F500.0
+G1 X11.69 Y-47.05 Z-0.01 J749.38 F500.0
+G1 X8.57 Y-45.25 Z-0.01 J752.91 F500.0
+G1 X8.57 Y-41.05 Z-0.01 J757.03 F500.0
+G1 X11.69 Y-39.25 Z-0.01 J760.56 F500.0
+G1 X11.69 Y-38.19 Z-0.01 J761.60 F500.0
+G1 X12.03 Y-38.19 Z-0.01 J761.93 F500.0
+G1 X12.03 Y-39.25 Z-0.01 J762.97 F500.0
+G1 X15.15 Y-41.05 Z-0.01 J766.50 F500.0
+G1 X15.15 Y-45.25 Z-0.01 J770.62 F500.0
+G1 X12.03 Y-47.05 Z-0.01 J774.15 F500.0
+G1 X12.03 Y-51.25 Z-0.01 J778.26 F500.0
+G1 X15.15 Y-53.05 Z-0.01 J781.79 F500.0
+G1 X15.15 Y-57.25 Z-0.01 J785.91 F500.0
+G1 X12.03 Y-59.05 Z-0.01 J789.44 F500.0
+G1 X12.03 Y-63.25 Z-0.01 J793.56 F500.0
+G1 X15.15 Y-65.05 Z-0.01 J797.09 F500.0
+G1 X15.15 Y-69.25 Z-0.01 J801.20 F500.0
+G1 X12.03 Y-71.05 Z-0.01 J804.73 F500.0
+G1 X12.03 Y-74.75 Z-0.01 J808.36 F500.0
+G1 X18.62 Y-74.75 Z-0.01 J814.82 F500.0
+G1 X18.62 Y-71.05 Z-0.01 J818.44 F500.0
+G1 X15.50 Y-69.25 Z-0.01 J821.97 F500.0
+G1 X15.50 Y-65.05 Z-0.01 J826.09 F500.0
+G1 X18.62 Y-63.25 Z-0.01 J829.62 F500.0
+G1 X18.62 Y-59.05 Z-0.01 J833.73 F500.0
+G1 X15.50 Y-57.25 Z-0.01 J837.26 F500.0
+G1 X15.50 Y-53.05 Z-0.01 J841.38 F500.0
+G1 X18.62 Y-51.25 Z-0.01 J844.91 F500.0
+G1 X18.62 Y-47.05 Z-0.01 J849.03 F500.0
+G1 X15.50 Y-45.25 Z-0.01 J852.56 F500.0
+G1 X15.50 Y-41.05 Z-0.01 J856.67 F500.0
+G1 X18.62 Y-39.25 Z-0.01 J860.20 F500.0
+G1 X18.62 Y-38.19 Z-0.01 J861.24 F500.0
+G1 X18.96 Y-38.19 Z-0.01 J861.57 F500.0
+G1 X18.96 Y-39.25 Z-0.01 J862.61 F500.0
+G1 X22.08 Y-41.05 Z-0.01 J866.14 F500.0
+G1 X22.08 Y-45.25 Z-0.01 J870.26 F500.0
+G1 X18.96 Y-47.05 Z-0.01 J873.79 F500.0
+G1 X18.96 Y-51.25 Z-0.01 J877.90 F500.0
+G1 X22.08 Y-53.05 Z-0.01 J881.43 F500.0
+G1 X22.08 Y-57.25 Z-0.01 J885.55 F500.0
+G1 X18.96 Y-59.05 Z-0.01 J889.08 F500.0
+G1 X18.96 Y-63.25 Z-0.01 J893.20 F500.0
+G1 X22.08 Y-65.05 Z-0.01 J896.73 F500.0
+G1 X22.08 Y-69.25 Z-0.01 J900.84 F500.0
+G1 X18.96 Y-71.05 Z-0.01 J904.37 F500.0
+G1 X18.96 Y-74.75 Z-0.01 J908.00 F500.0
+G1 X25.54 Y-74.75 Z-0.01 J914.45 F500.0
+G1 X25.54 Y-71.05 Z-0.01 J918.07 F500.0
+G1 X22.43 Y-69.25 Z-0.01 J921.59 F500.0
+G1 X22.43 Y-65.05 Z-0.01 J925.71 F500.0
+G1 X25.54 Y-63.25 Z-0.01 J929.23 F500.0
+G1 X25.54 Y-59.05 Z-0.01 J933.35 F500.0
+G1 X22.43 Y-57.25 Z-0.01 J936.87 F500.0
+G1 X22.43 Y-53.05 Z-0.01 J940.98 F500.0
+G1 X25.54 Y-51.25 Z-0.01 J944.51 F500.0
+G1 X25.54 Y-47.05 Z-0.01 J948.62 F500.0
+G1 X22.43 Y-45.25 Z-0.01 J952.14 F500.0
+G1 X22.43 Y-41.05 Z-0.01 J956.26 F500.0
+G1 X25.54 Y-39.25 Z-0.01 J959.78 F500.0
+G1 X25.54 Y-38.19 Z-0.01 J960.82 F500.0
+G1 X25.89 Y-38.19 Z-0.01 J961.16 F500.0
+G1 X25.89 Y-39.25 Z-0.01 J962.20 F500.0
+G1 X29.01 Y-41.05 Z-0.01 J965.73 F500.0
+G1 X29.01 Y-45.25 Z-0.01 J969.85 F500.0
+G1 X25.89 Y-47.05 Z-0.01 J973.38 F500.0
+G1 X25.89 Y-51.25 Z-0.01 J977.49 F500.0
+G1 X29.01 Y-53.05 Z-0.01 J981.02 F500.0
+G1 X29.01 Y-57.25 Z-0.01 J985.14 F500.0
+G1 X25.89 Y-59.05 Z-0.01 J988.67 F500.0
+G1 X25.89 Y-63.25 Z-0.01 J992.79 F500.0
+G1 X29.01 Y-65.05 Z-0.01 J996.32 F500.0
+G1 X29.01 Y-69.25 Z-0.01 J1000.43 F500.0
+G1 X25.89 Y-71.05 Z-0.01 J1003.96 F500.0
+G1 X25.89 Y-74.75 Z-0.01 J1007.59 F500.0
+G1 X32.47 Y-74.75 Z-0.01 J1014.04 F500.0
+G1 X32.47 Y-71.05 Z-0.01 J1017.66 F500.0
+G1 X29.36 Y-69.25 Z-0.01 J1021.18 F500.0
+G1 X29.36 Y-65.05 Z-0.01 J1025.30 F500.0
+G1 X32.47 Y-63.25 Z-0.01 J1028.82 F500.0
+G1 X32.47 Y-59.05 Z-0.01 J1032.94 F500.0
+G1 X29.36 Y-57.25 Z-0.01 J1036.46 F500.0
+G1 X29.36 Y-53.05 Z-0.01 J1040.57 F500.0
+G1 X32.47 Y-51.25 Z-0.01 J1044.10 F500.0
+G1 X32.47 Y-47.05 Z-0.01 J1048.21 F500.0
+G1 X29.36 Y-45.25 Z-0.01 J1051.73 F500.0
+G1 X29.36 Y-41.05 Z-0.01 J1055.85 F500.0
+G1 X32.47 Y-39.25 Z-0.01 J1059.37 F500.0
+G1 X32.47 Y-38.19 Z-0.01 J1060.41 F500.0
+G1 X32.82 Y-38.19 Z-0.01 J1060.75 F500.0
+G1 X32.82 Y-39.25 Z-0.01 J1061.79 F500.0
+G1 X35.94 Y-41.05 Z-0.01 J1065.32 F500.0
+G1 X35.94 Y-45.25 Z-0.01 J1069.44 F500.0
+G1 X32.82 Y-47.05 Z-0.01 J1072.97 F500.0
+G1 X32.82 Y-51.25 Z-0.01 J1077.08 F500.0
+G1 X35.94 Y-53.05 Z-0.01 J1080.61 F500.0
+G1 X35.94 Y-57.25 Z-0.01 J1084.73 F500.0
+G1 X32.82 Y-59.05 Z-0.01 J1088.26 F500.0
+G1 X32.82 Y-63.25 Z-0.01 J1092.37 F500.0
+G1 X35.94 Y-65.05 Z-0.01 J1095.90 F500.0
+G1 X35.94 Y-69.25 Z-0.01 J1100.02 F500.0
+G1 X32.82 Y-71.05 Z-0.01 J1103.55 F500.0
+G1 X32.82 Y-74.75 Z-0.01 J1107.18 F500.0
+G1 X39.40 Y-74.75 Z-0.01 J1113.63 F500.0
+G1 X39.40 Y-71.05 Z-0.01 J1117.25 F500.0
+G1 X36.28 Y-69.25 Z-0.01 J1120.78 F500.0
+G1 X36.28 Y-65.05 Z-0.01 J1124.90 F500.0
+G1 X39.40 Y-63.25 Z-0.01 J1128.43 F500.0
+G1 X39.40 Y-59.05 Z-0.01 J1132.54 F500.0
+G1 X36.28 Y-57.25 Z-0.01 J1136.07 F500.0
+G1 X36.28 Y-53.05 Z-0.01 J1140.19 F500.0
+G1 X39.40 Y-51.25 Z-0.01 J1143.72 F500.0
+G1 X39.40 Y-47.05 Z-0.01 J1147.84 F500.0
+G1 X36.28 Y-45.25 Z-0.01 J1151.37 F500.0
+G1 X36.28 Y-41.05 Z-0.01 J1155.48 F500.0
+G1 X39.40 Y-39.25 Z-0.01 J1159.01 F500.0
+G1 X39.40 Y-38.19 Z-0.01 J1160.05 F500.0
+G1 X39.75 Y-38.19 Z-0.01 J1160.39 F500.0
+G1 X39.75 Y-39.25 Z-0.01 J1161.43 F500.0
+G1 X41.32 Y-40.16 Z-0.01 J1163.21 F500.0
+G1 X41.32 Y-46.14 Z-0.01 J1169.07 F500.0
+G1 X39.75 Y-47.05 Z-0.01 J1170.85 F500.0
+G1 X39.75 Y-51.25 Z-0.01 J1174.96 F500.0
+G1 X41.32 Y-52.16 Z-0.01 J1176.74 F500.0
+G1 X41.32 Y-58.14 Z-0.01 J1182.60 F500.0
+G1 X39.75 Y-59.05 Z-0.01 J1184.38 F500.0
+G1 X39.75 Y-63.25 Z-0.01 J1188.50 F500.0
+G1 X41.32 Y-64.16 Z-0.01 J1190.28 F500.0
+G1 X41.32 Y-70.14 Z-0.01 J1196.14 F500.0
+G1 X40.87 Y-70.40 Z-0.01 J1201.64 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X39.75 Y-71.05 Z-0.01 J1201.64 F800.0
+G1 X39.75 Y-74.75 Z-0.01 J1201.64 F800.0
+G1 X39.75 Y-74.75 Z9.99 J1201.64 F800.0
+G1 X23.91 Y-79.20 Z9.99 J1211.64 F800.0
+
+T1
+G1 X28.91 Y-74.20 Z0.99 J0.00 F300.0
+G1 X40.77 Y-74.20 Z0.99 J11.62 F300.0
+G1 X40.77 Y-42.40 Z0.99 J42.79 F300.0
+G1 X40.77 Y-38.74 Z0.99 J46.37 F300.0
+G1 X-22.83 Y-38.74 Z0.99 J108.70 F500.0
+G1 X-34.69 Y-38.74 Z0.99 J120.32 F500.0
+G1 X-34.69 Y-70.54 Z0.99 J151.49 F500.0
+G1 X-34.69 Y-74.20 Z0.99 J155.08 F500.0
+G1 X23.91 Y-74.20 Z0.99 J217.50 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X28.91 Y-74.20 Z0.99 J217.50 F800.0
+G1 X28.91 Y-74.20 Z10.99 J217.50 F800.0
+G1 X23.91 Y-79.20 Z10.99 J227.50 F800.0
+
+T1
+G1 X28.91 Y-74.20 Z0.99 J0.00 F300.0
+G1 X-34.69 Y-40.28 Z0.99 J70.64 F300.0
+G1 X-33.34 Y-41.05 Z0.99 J72.16 F300.0
+G1 X-33.34 Y-45.25 Z0.99 J76.28 F300.0
+G1 X-34.69 Y-46.03 Z0.99 J77.81 F500.0
+G1 X-34.69 Y-52.28 Z0.99 J83.93 F500.0
+G1 X-33.34 Y-53.05 Z0.99 J85.46 F500.0
+G1 X-33.34 Y-57.25 Z0.99 J89.57 F500.0
+G1 X-34.69 Y-58.03 Z0.99 J91.10 F500.0
+G1 X-34.69 Y-64.28 Z0.99 J97.23 F500.0
+G1 X-33.34 Y-65.05 Z0.99 J98.75 F500.0
+G1 X-33.34 Y-69.25 Z0.99 J102.86 F500.0
+G1 X-34.69 Y-70.03 Z0.99 J104.39 F500.0
+G1 X-29.88 Y-74.20 Z0.99 J110.63 F500.0
+G1 X-29.88 Y-71.05 Z0.99 J113.72 F500.0
+G1 X-33.00 Y-69.25 Z0.99 J117.25 F500.0
+G1 X-33.00 Y-65.05 Z0.99 J121.36 F500.0
+G1 X-29.88 Y-63.25 Z0.99 J124.89 F500.0
+G1 X-29.88 Y-59.05 Z0.99 J129.01 F500.0
+G1 X-33.00 Y-57.25 Z0.99 J132.54 F500.0
+G1 X-33.00 Y-53.05 Z0.99 J136.66 F500.0
+G1 X-29.88 Y-51.25 Z0.99 J140.19 F500.0
+G1 X-29.88 Y-47.05 Z0.99 J144.30 F500.0
+G1 X-33.00 Y-45.25 Z0.99 J147.83 F500.0
+G1 X-33.00 Y-41.05 Z0.99 J151.95 F500.0
+G1 X-29.88 Y-39.25 Z0.99 J155.48 F500.0
+G1 X-29.88 Y-38.74 Z0.99 J155.98 F500.0
+G1 X-29.53 Y-38.74 Z0.99 J156.32 F500.0
+G1 X-29.53 Y-39.25 Z0.99 J156.82 F500.0
+G1 X-26.42 Y-41.05 Z0.99 J160.34 F500.0
+G1 X-26.42 Y-45.25 Z0.99 J164.46 F500.0
+G1 X-29.53 Y-47.05 Z0.99 J167.98 F500.0
+G1 X-29.53 Y-51.25 Z0.99 J172.10 F500.0
+G1 X-26.42 Y-53.05 Z0.99 J175.62 F500.0
+G1 X-26.42 Y-57.25 Z0.99 J179.73 F500.0
+G1 X-29.53 Y-59.05 Z0.99 J183.25 F500.0
+G1 X-29.53 Y-63.25 Z0.99 J187.37 F500.0
+G1 X-26.42 Y-65.05 Z0.99 J190.89 F500.0
+G1 X-26.42 Y-69.25 Z0.99 J195.01 F500.0
+G1 X-29.53 Y-71.05 Z0.99 J198.53 F500.0
+G1 X-29.53 Y-74.20 Z0.99 J201.62 F500.0
+G1 X-22.95 Y-74.20 Z0.99 J208.06 F500.0
+G1 X-22.95 Y-71.05 Z0.99 J211.15 F500.0
+G1 X-26.07 Y-69.25 Z0.99 J214.68 F500.0
+G1 X-26.07 Y-65.05 Z0.99 J218.80 F500.0
+G1 X-22.95 Y-63.25 Z0.99 J222.33 F500.0
+G1 X-22.95 Y-59.05 Z0.99 J226.44 F500.0
+G1 X-26.07 Y-57.25 Z0.99 J229.97 F500.0
+G1 X-26.07 Y-53.05 Z0.99 J234.09 F500.0
+G1 X-22.95 Y-51.25 Z0.99 J237.62 F500.0
+G1 X-22.95 Y-47.05 Z0.99 J241.74 F500.0
+G1 X-26.07 Y-45.25 Z0.99 J245.27 F500.0
+G1 X-26.07 Y-41.05 Z0.99 J249.38 F500.0
+G1 X-22.95 Y-39.25 Z0.99 J252.91 F500.0
+G1 X-22.95 Y-38.74 Z0.99 J253.41 F500.0
+G1 X-22.61 Y-38.74 Z0.99 J253.74 F500.0
+G1 X-22.61 Y-39.25 Z0.99 J254.24 F500.0
+G1 X-19.49 Y-41.05 Z0.99 J257.77 F500.0
+G1 X-19.49 Y-45.25 Z0.99 J261.89 F500.0
+G1 X-22.61 Y-47.05 Z0.99 J265.42 F500.0
+G1 X-22.61 Y-51.25 Z0.99 J269.54 F500.0
+G1 X-19.49 Y-53.05 Z0.99 J273.07 F500.0
+G1 X-19.49 Y-57.25 Z0.99 J277.18 F500.0
+G1 X-22.61 Y-59.05 Z0.99 J280.71 F500.0
+G1 X-22.61 Y-63.25 Z0.99 J284.83 F500.0
+G1 X-19.49 Y-65.05 Z0.99 J288.36 F500.0
+G1 X-19.49 Y-69.25 Z0.99 J292.47 F500.0
+G1 X-22.61 Y-71.05 Z0.99 J296.00 F500.0
+G1 X-22.61 Y-74.20 Z0.99 J299.09 F500.0
+G1 X-16.02 Y-74.20 Z0.99 J305.55 F500.0
+G1 X-16.02 Y-71.05 Z0.99 J308.64 F500.0
+G1 X-19.14 Y-69.25 Z0.99 J312.17 F500.0
+G1 X-19.14 Y-65.05 Z0.99 J316.28 F500.0
+G1 X-16.02 Y-63.25 Z0.99 J319.81 F500.0
+G1 X-16.02 Y-59.05 Z0.99 J323.93 F500.0
+G1 X-19.14 Y-57.25 Z0.99 J327.46 F500.0
+G1 X-19.14 Y-53.05 Z0.99 J331.57 F500.0
+G1 X-16.02 Y-51.25 Z0.99 J335.10 F500.0
+G1 X-16.02 Y-47.05 Z0.99 J339.22 F500.0
+G1 X-19.14 Y-45.25 Z0.99 J342.75 F500.0
+G1 X-19.14 Y-41.05 Z0.99 J346.87 F500.0
+G1 X-16.02 Y-39.25 Z0.99 J350.40 F500.0
+G1 X-16.02 Y-38.74 Z0.99 J350.90 F500.0
+G1 X-15.68 Y-38.74 Z0.99 J351.23 F500.0
+G1 X-15.68 Y-39.25 Z0.99 J351.73 F500.0
+G1 X-12.56 Y-41.05 Z0.99 J355.26 F500.0
+G1 X-12.56 Y-45.25 Z0.99 J359.37 F500.0
+G1 X-15.68 Y-47.05 Z0.99 J362.90 F500.0
+G1 X-15.68 Y-51.25 Z0.99 J367.02 F500.0
+G1 X-12.56 Y-53.05 Z0.99 J370.55 F500.0
+G1 X-12.56 Y-57.25 Z0.99 J374.67 F500.0
+G1 X-15.68 Y-59.05 Z0.99 J378.20 F500.0
+G1 X-15.68 Y-63.25 Z0.99 J382.31 F500.0
+G1 X-12.56 Y-65.05 Z0.99 J385.84 F500.0
+G1 X-12.56 Y-69.25 Z0.99 J389.96 F500.0
+G1 X-15.68 Y-71.05 Z0.99 J393.49 F500.0
+G1 X-15.68 Y-74.20 Z0.99 J396.58 F500.0
+G1 X-9.10 Y-74.20 Z0.99 J403.02 F500.0
+G1 X-9.10 Y-71.05 Z0.99 J406.11 F500.0
+G1 X-12.21 Y-69.25 Z0.99 J409.63 F500.0
+G1 X-12.21 Y-65.05 Z0.99 J413.75 F500.0
+G1 X-9.10 Y-63.25 Z0.99 J417.27 F500.0
+G1 X-9.10 Y-59.05 Z0.99 J421.39 F500.0
+G1 X-12.21 Y-57.25 Z0.99 J424.91 F500.0
+G1 X-12.21 Y-53.05 Z0.99 J429.02 F500.0
+G1 X-9.10 Y-51.25 Z0.99 J432.55 F500.0
+G1 X-9.10 Y-47.05 Z0.99 J436.66 F500.0
+G1 X-12.21 Y-45.25 Z0.99 J440.18 F500.0
+G1 X-12.21 Y-41.05 Z0.99 J444.30 F500.0
+G1 X-9.10 Y-39.25 Z0.99 J447.82 F500.0
+G1 X-9.10 Y-38.74 Z0.99 J448.32 F500.0
+G1 X-8.75 Y-38.74 Z0.99 J448.66 F500.0
+G1 X-8.75 Y-39.25 Z0.99 J449.16 F500.0
+G1 X-5.63 Y-41.05 Z0.99 J452.69 F500.0
+G1 X-5.63 Y-45.25 Z0.99 J456.81 F500.0
+G1 X-8.75 Y-47.05 Z0.99 J460.34 F500.0
+G1 X-8.75 Y-51.25 Z0.99 J464.45 F500.0
+G1 X-5.63 Y-53.05 Z0.99 J467.98 F500.0
+G1 X-5.63 Y-57.25 Z0.99 J472.10 F500.0
+G1 X-8.75 Y-59.05 Z0.99 J475.63 F500.0
+G1 X-8.75 Y-63.25 Z0.99 J479.75 F500.0
+G1 X-5.63 Y-65.05 Z0.99 J483.28 F500.0
+G1 X-5.63 Y-69.25 Z0.99 J487.39 F500.0
+G1 X-8.75 Y-71.05 Z0.99 J490.92 F500.0
+G1 X-8.75 Y-74.20 Z0.99 J494.01 F500.0
+G1 X-2.17 Y-74.20 Z0.99 J500.46 F500.0
+G1 X-2.17 Y-71.05 Z0.99 J503.54 F500.0
+G1 X-5.28 Y-69.25 Z0.99 J507.07 F500.0
+G1 X-5.28 Y-65.05 Z0.99 J511.18 F500.0
+G1 X-2.17 Y-63.25 Z0.99 J514.70 F500.0
+G1 X-2.17 Y-59.05 Z0.99 J518.82 F500.0
+G1 X-5.28 Y-57.25 Z0.99 J522.34 F500.0
+G1 X-5.28 Y-53.05 Z0.99 J526.46 F500.0
+G1 X-2.17 Y-51.25 Z0.99 J529.98 F500.0
+G1 X-2.17 Y-47.05 Z0.99 J534.09 F500.0
+G1 X-5.28 Y-45.25 Z0.99 J537.62 F500.0
+G1 X-5.28 Y-41.05 Z0.99 J541.73 F500.0
+G1 X-2.17 Y-39.25 Z0.99 J545.25 F500.0
+G1 X-2.17 Y-38.74 Z0.99 J545.75 F500.0
+G1 X-1.82 Y-38.74 Z0.99 J546.10 F500.0
+G1 X-1.82 Y-39.25 Z0.99 J546.60 F500.0
+G1 X1.30 Y-41.05 Z0.99 J550.13 F500.0
+G1 X1.30 Y-45.25 Z0.99 J554.24 F500.0
+G1 X-1.82 Y-47.05 Z0.99 J557.77 F500.0
+G1 X-1.82 Y-51.25 Z0.99 J561.89 F500.0
+G1 X1.30 Y-53.05 Z0.99 J565.42 F500.0
+G1 X1.30 Y-57.25 Z0.99 J569.53 F500.0
+G1 X-1.82 Y-59.05 Z0.99 J573.06 F500.0
+G1 X-1.82 Y-63.25 Z0.99 J577.18 F500.0
+G1 X1.30 Y-65.05 Z0.99 J580.71 F500.0
+G1 X1.30 Y-69.25 Z0.99 J584.83 F500.0
+G1 X-1.82 Y-71.05 Z0.99 J588.36 F500.0
+G1 X-1.82 Y-74.20 Z0.99 J591.44 F500.0
+G1 X4.76 Y-74.20 Z0.99 J597.89 F500.0
+G1 X4.76 Y-71.05 Z0.99 J600.98 F500.0
+G1 X1.64 Y-69.25 Z0.99 J604.51 F500.0
+G1 X1.64 Y-65.05 Z0.99 J608.62 F500.0
+G1 X4.76 Y-63.25 Z0.99 J612.15 F500.0
+G1 X4.76 Y-59.05 Z0.99 J616.27 F500.0
+G1 X1.64 Y-57.25 Z0.99 J619.80 F500.0
+G1 X1.64 Y-53.05 Z0.99 J623.92 F500.0
+G1 X4.76 Y-51.25 Z0.99 J627.45 F500.0
+G1 X4.76 Y-47.05 Z0.99 J631.56 F500.0
+G1 X1.64 Y-45.25 Z0.99 J635.09 F500.0
+G1 X1.64 Y-41.05 Z0.99 J639.21 F500.0
+G1 X4.76 Y-39.25 Z0.99 J642.74 F500.0
+G1 X4.76 Y-38.74 Z0.99 J643.24 F500.0
+G1 X5.11 Y-38.74 Z0.99 J643.58 F500.0
+G1 X5.11 Y-39.25 Z0.99 J644.08 F500.0
+G1 X8.22 Y-41.05 Z0.99 J647.60 F500.0
+G1 X8.22 Y-45.25 Z0.99 J651.72 F500.0
+G1 X5.11 Y-47.05 Z0.99 J655.24 F500.0
+G1 X5.11 Y-51.25 Z0.99 J659.36 F500.0
+G1 X8.22 Y-53.05 Z0.99 J662.88 F500.0
+G1 X8.22 Y-57.25 Z0.99 J666.99 F500.0
+G1 X5.11 Y-59.05 Z0.99 J670.51 F500.0
+G1 X5.11 Y-63.25 Z0.99 J674.63 F500.0
+G1 X8.22 Y-65.05 Z0.99 J678.15 F500.0
+G1 X8.22 Y-69.25 Z0.99 J682.27 F500.0
+G1 X5.11 Y-71.05 Z0.99 J685.79 F500.0
+G1 X5.11 Y-74.20 Z0.99 J688.88 F500.0
+G1 X11.69 Y-74.20 Z0.99 J695.32 F500.0
+G1 X11.69 Y-71.05 Z0.99 J698.41 F500.0
+G1 X8.57 Y-69.25 Z0.99 J701.94 F500.0
+G1 X8.57 Y-65.05 Z0.99 J706.06 F500.0
+G1 X11.69 Y-63.25 Z0.99 J709.59 F500.0
+G1 X11.69 Y-59.05 Z0.99 J713.70 F500.0
+G1 X8.57 Y-57.25 Z0.99 J717.23 F500.0
+G1 X8.57 Y-53.05 Z0.99 J721.35 F500.0
+G1 X11.69 Y-51.25 Z0.99 J724.88 F500.0
+G1 X11.69 Y-47.05 Z0.99 J729.00 F500.0
+G1 X8.57 Y-45.25 Z0.99 J732.53 F500.0
+G1 X8.57 Y-41.05 Z0.99 J736.64 F500.0
+G1 X11.69 Y-39.25 Z0.99 J740.17 F500.0
+G1 X11.69 Y-38.74 Z0.99 J740.67 F500.0
+G1 X12.03 Y-38.74 Z0.99 J741.00 F500.0
+G1 X12.03 Y-39.25 Z0.99 J741.50 F500.0
+G1 X15.15 Y-41.05 Z0.99 J745.03 F500.0
+G1 X15.15 Y-45.25 Z0.99 J749.15 F500.0
+G1 X12.03 Y-47.05 Z0.99 J752.68 F500.0
+G1 X12.03 Y-51.25 Z0.99 J756.80 F500.0
+G1 X15.15 Y-53.05 Z0.99 J760.33 F500.0
+G1 X15.15 Y-57.25 Z0.99 J764.44 F500.0
+G1 X12.03 Y-59.05 Z0.99 J767.97 F500.0
+G1 X12.03 Y-63.25 Z0.99 J772.09 F500.0
+G1 X15.15 Y-65.05 Z0.99 J775.62 F500.0
+G1 X15.15 Y-69.25 Z0.99 J779.73 F500.0
+G1 X12.03 Y-71.05 Z0.99 J783.26 F500.0
+G1 X12.03 Y-74.20 Z0.99 J786.35 F500.0
+G1 X18.62 Y-74.20 Z0.99 J792.81 F500.0
+G1 X18.62 Y-71.05 Z0.99 J795.90 F500.0
+G1 X15.50 Y-69.25 Z0.99 J799.43 F500.0
+G1 X15.50 Y-65.05 Z0.99 J803.54 F500.0
+G1 X18.62 Y-63.25 Z0.99 J807.07 F500.0
+G1 X18.62 Y-59.05 Z0.99 J811.19 F500.0
+G1 X15.50 Y-57.25 Z0.99 J814.72 F500.0
+G1 X15.50 Y-53.05 Z0.99 J818.83 F500.0
+G1 X18.62 Y-51.25 Z0.99 J822.36 F500.0
+G1 X18.62 Y-47.05 Z0.99 J826.48 F500.0
+G1 X15.50 Y-45.25 Z0.99 J830.01 F500.0
+G1 X15.50 Y-41.05 Z0.99 J834.13 F500.0
+G1 X18.62 Y-39.25 Z0.99 J837.66 F500.0
+G1 X18.62 Y-38.74 Z0.99 J838.16 F500.0
+G1 X18.96 Y-38.74 Z0.99 J838.49 F500.0
+G1 X18.96 Y-39.25 Z0.99 J838.99 F500.0
+G1 X22.08 Y-41.05 Z0.99 J842.52 F500.0
+G1 X22.08 Y-45.25 Z0.99 J846.63 F500.0
+G1 X18.96 Y-47.05 Z0.99 J850.16 F500.0
+G1 X18.96 Y-51.25 Z0.99 J854.28 F500.0
+G1 X22.08 Y-53.05 Z0.99 J857.81 F500.0
+G1 X22.08 Y-57.25 Z0.99 J861.93 F500.0
+G1 X18.96 Y-59.05 Z0.99 J865.46 F500.0
+G1 X18.96 Y-63.25 Z0.99 J869.57 F500.0
+G1 X22.08 Y-65.05 Z0.99 J873.10 F500.0
+G1 X22.08 Y-69.25 Z0.99 J877.22 F500.0
+G1 X18.96 Y-71.05 Z0.99 J880.75 F500.0
+G1 X18.96 Y-74.20 Z0.99 J883.84 F500.0
+G1 X25.54 Y-74.20 Z0.99 J890.28 F500.0
+G1 X25.54 Y-71.05 Z0.99 J893.37 F500.0
+G1 X22.43 Y-69.25 Z0.99 J896.89 F500.0
+G1 X22.43 Y-65.05 Z0.99 J901.01 F500.0
+G1 X25.54 Y-63.25 Z0.99 J904.53 F500.0
+G1 X25.54 Y-59.05 Z0.99 J908.65 F500.0
+G1 X22.43 Y-57.25 Z0.99 J912.17 F500.0
+G1 X22.43 Y-53.05 Z0.99 J916.28 F500.0
+G1 X25.54 Y-51.25 Z0.99 J919.81 F500.0
+G1 X25.54 Y-47.05 Z0.99 J923.92 F500.0
+G1 X22.43 Y-45.25 Z0.99 J927.44 F500.0
+G1 X22.43 Y-41.05 Z0.99 J931.56 F500.0
+G1 X25.54 Y-39.25 Z0.99 J935.08 F500.0
+G1 X25.54 Y-38.74 Z0.99 J935.58 F500.0
+G1 X25.89 Y-38.74 Z0.99 J935.92 F500.0
+G1 X25.89 Y-39.25 Z0.99 J936.42 F500.0
+G1 X29.01 Y-41.05 Z0.99 J939.95 F500.0
+G1 X29.01 Y-45.25 Z0.99 J944.07 F500.0
+G1 X25.89 Y-47.05 Z0.99 J947.60 F500.0
+G1 X25.89 Y-51.25 Z0.99 J951.71 F500.0
+G1 X29.01 Y-53.05 Z0.99 J955.24 F500.0
+G1 X29.01 Y-57.25 Z0.99 J959.36 F500.0
+G1 X25.89 Y-59.05 Z0.99 J962.89 F500.0
+G1 X25.89 Y-63.25 Z0.99 J967.01 F500.0
+G1 X29.01 Y-65.05 Z0.99 J970.54 F500.0
+G1 X29.01 Y-69.25 Z0.99 J974.65 F500.0
+G1 X25.89 Y-71.05 Z0.99 J978.18 F500.0
+G1 X25.89 Y-74.20 Z0.99 J981.27 F500.0
+G1 X32.47 Y-74.20 Z0.99 J987.72 F500.0
+G1 X32.47 Y-71.05 Z0.99 J990.80 F500.0
+G1 X29.36 Y-69.25 Z0.99 J994.33 F500.0
+G1 X29.36 Y-65.05 Z0.99 J998.44 F500.0
+G1 X32.47 Y-63.25 Z0.99 J1001.96 F500.0
+G1 X32.47 Y-59.05 Z0.99 J1006.08 F500.0
+G1 X29.36 Y-57.25 Z0.99 J1009.60 F500.0
+G1 X29.36 Y-53.05 Z0.99 J1013.72 F500.0
+G1 X32.47 Y-51.25 Z0.99 J1017.24 F500.0
+G1 X32.47 Y-47.05 Z0.99 J1021.35 F500.0
+G1 X29.36 Y-45.25 Z0.99 J1024.88 F500.0
+G1 X29.36 Y-41.05 Z0.99 J1028.99 F500.0
+G1 X32.47 Y-39.25 Z0.99 J1032.51 F500.0
+G1 X32.47 Y-38.74 Z0.99 J1033.01 F500.0
+G1 X32.82 Y-38.74 Z0.99 J1033.36 F500.0
+G1 X32.82 Y-39.25 Z0.99 J1033.86 F500.0
+G1 X35.94 Y-41.05 Z0.99 J1037.39 F500.0
+G1 X35.94 Y-45.25 Z0.99 J1041.50 F500.0
+G1 X32.82 Y-47.05 Z0.99 J1045.03 F500.0
+G1 X32.82 Y-51.25 Z0.99 J1049.15 F500.0
+G1 X35.94 Y-53.05 Z0.99 J1052.68 F500.0
+G1 X35.94 Y-57.25 Z0.99 J1056.79 F500.0
+G1 X32.82 Y-59.05 Z0.99 J1060.32 F500.0
+G1 X32.82 Y-63.25 Z0.99 J1064.44 F500.0
+G1 X35.94 Y-65.05 Z0.99 J1067.97 F500.0
+G1 X35.94 Y-69.25 Z0.99 J1072.09 F500.0
+G1 X32.82 Y-71.05 Z0.99 J1075.62 F500.0
+G1 X32.82 Y-74.20 Z0.99 J1078.70 F500.0
+G1 X39.40 Y-74.20 Z0.99 J1085.15 F500.0
+G1 X39.40 Y-71.05 Z0.99 J1088.24 F500.0
+G1 X36.28 Y-69.25 Z0.99 J1091.77 F500.0
+G1 X36.28 Y-65.05 Z0.99 J1095.88 F500.0
+G1 X39.40 Y-63.25 Z0.99 J1099.41 F500.0
+G1 X39.40 Y-59.05 Z0.99 J1103.53 F500.0
+G1 X36.28 Y-57.25 Z0.99 J1107.06 F500.0
+G1 X36.28 Y-53.05 Z0.99 J1111.18 F500.0
+G1 X39.40 Y-51.25 Z0.99 J1114.71 F500.0
+G1 X39.40 Y-47.05 Z0.99 J1118.82 F500.0
+G1 X36.28 Y-45.25 Z0.99 J1122.35 F500.0
+G1 X36.28 Y-41.05 Z0.99 J1126.47 F500.0
+G1 X39.40 Y-39.25 Z0.99 J1130.00 F500.0
+G1 X39.40 Y-38.74 Z0.99 J1130.50 F500.0
+G1 X39.75 Y-38.74 Z0.99 J1130.84 F500.0
+G1 X39.75 Y-39.25 Z0.99 J1131.34 F500.0
+G1 X40.77 Y-39.84 Z0.99 J1132.50 F500.0
+G1 X40.77 Y-46.46 Z0.99 J1138.98 F500.0
+G1 X39.75 Y-47.05 Z0.99 J1140.14 F500.0
+G1 X39.75 Y-51.25 Z0.99 J1144.25 F500.0
+G1 X40.77 Y-51.84 Z0.99 J1145.41 F500.0
+G1 X40.77 Y-58.46 Z0.99 J1151.90 F500.0
+G1 X39.75 Y-59.05 Z0.99 J1153.05 F500.0
+G1 X39.75 Y-63.25 Z0.99 J1157.17 F500.0
+G1 X40.77 Y-63.84 Z0.99 J1158.32 F500.0
+G1 X40.77 Y-69.79 Z0.99 J1169.15 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X40.77 Y-70.46 Z0.99 J1169.15 F800.0
+G1 X39.75 Y-71.05 Z0.99 J1169.15 F800.0
+G1 X39.75 Y-74.20 Z0.99 J1169.15 F800.0
+G1 X39.75 Y-74.20 Z10.99 J1169.15 F800.0
+G1 X20.47 Y-78.64 Z10.99 J1179.15 F800.0
+
+T1
+G1 X25.47 Y-73.64 Z1.99 J0.00 F300.0
+G1 X40.21 Y-73.64 Z1.99 J14.45 F300.0
+G1 X40.21 Y-43.84 Z1.99 J43.65 F300.0
+G1 X40.21 Y-39.30 Z1.99 J48.10 F300.0
+G1 X-19.39 Y-39.30 Z1.99 J106.51 F500.0
+G1 X-34.13 Y-39.30 Z1.99 J120.95 F500.0
+G1 X-34.13 Y-69.10 Z1.99 J150.16 F500.0
+G1 X-34.13 Y-73.64 Z1.99 J154.60 F500.0
+G1 X20.47 Y-73.64 Z1.99 J213.11 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X25.47 Y-73.64 Z1.99 J213.11 F800.0
+G1 X25.47 Y-73.64 Z11.99 J213.11 F800.0
+G1 X20.47 Y-78.64 Z11.99 J223.11 F800.0
+
+T1
+G1 X25.47 Y-73.64 Z1.99 J0.00 F300.0
+G1 X-34.13 Y-40.60 Z1.99 J66.79 F300.0
+G1 X-33.34 Y-41.05 Z1.99 J67.68 F300.0
+G1 X-33.34 Y-45.25 Z1.99 J71.79 F300.0
+G1 X-34.13 Y-45.71 Z1.99 J72.69 F500.0
+G1 X-34.13 Y-52.60 Z1.99 J79.44 F500.0
+G1 X-33.34 Y-53.05 Z1.99 J80.33 F500.0
+G1 X-33.34 Y-57.25 Z1.99 J84.45 F500.0
+G1 X-34.13 Y-57.71 Z1.99 J85.34 F500.0
+G1 X-34.13 Y-64.60 Z1.99 J92.10 F500.0
+G1 X-33.34 Y-65.05 Z1.99 J92.99 F500.0
+G1 X-33.34 Y-69.25 Z1.99 J97.10 F500.0
+G1 X-34.13 Y-69.71 Z1.99 J98.00 F500.0
+G1 X-29.88 Y-73.64 Z1.99 J103.67 F500.0
+G1 X-29.88 Y-71.05 Z1.99 J106.21 F500.0
+G1 X-33.00 Y-69.25 Z1.99 J109.74 F500.0
+G1 X-33.00 Y-65.05 Z1.99 J113.86 F500.0
+G1 X-29.88 Y-63.25 Z1.99 J117.39 F500.0
+G1 X-29.88 Y-59.05 Z1.99 J121.50 F500.0
+G1 X-33.00 Y-57.25 Z1.99 J125.03 F500.0
+G1 X-33.00 Y-53.05 Z1.99 J129.15 F500.0
+G1 X-29.88 Y-51.25 Z1.99 J132.68 F500.0
+G1 X-29.88 Y-47.05 Z1.99 J136.79 F500.0
+G1 X-33.00 Y-45.25 Z1.99 J140.32 F500.0
+G1 X-33.00 Y-41.05 Z1.99 J144.44 F500.0
+G1 X-29.96 Y-39.30 Z1.99 J147.88 F500.0
+G1 X-29.45 Y-39.30 Z1.99 J148.38 F500.0
+G1 X-26.42 Y-41.05 Z1.99 J151.81 F500.0
+G1 X-26.42 Y-45.25 Z1.99 J155.92 F500.0
+G1 X-29.53 Y-47.05 Z1.99 J159.44 F500.0
+G1 X-29.53 Y-51.25 Z1.99 J163.56 F500.0
+G1 X-26.42 Y-53.05 Z1.99 J167.08 F500.0
+G1 X-26.42 Y-57.25 Z1.99 J171.20 F500.0
+G1 X-29.53 Y-59.05 Z1.99 J174.72 F500.0
+G1 X-29.53 Y-63.25 Z1.99 J178.83 F500.0
+G1 X-26.42 Y-65.05 Z1.99 J182.36 F500.0
+G1 X-26.42 Y-69.25 Z1.99 J186.47 F500.0
+G1 X-29.53 Y-71.05 Z1.99 J189.99 F500.0
+G1 X-29.53 Y-73.64 Z1.99 J192.53 F500.0
+G1 X-22.95 Y-73.64 Z1.99 J198.98 F500.0
+G1 X-22.95 Y-71.05 Z1.99 J201.52 F500.0
+G1 X-26.07 Y-69.25 Z1.99 J205.05 F500.0
+G1 X-26.07 Y-65.05 Z1.99 J209.16 F500.0
+G1 X-22.95 Y-63.25 Z1.99 J212.69 F500.0
+G1 X-22.95 Y-59.05 Z1.99 J216.81 F500.0
+G1 X-26.07 Y-57.25 Z1.99 J220.34 F500.0
+G1 X-26.07 Y-53.05 Z1.99 J224.46 F500.0
+G1 X-22.95 Y-51.25 Z1.99 J227.99 F500.0
+G1 X-22.95 Y-47.05 Z1.99 J232.10 F500.0
+G1 X-26.07 Y-45.25 Z1.99 J235.63 F500.0
+G1 X-26.07 Y-41.05 Z1.99 J239.75 F500.0
+G1 X-23.03 Y-39.30 Z1.99 J243.19 F500.0
+G1 X-22.53 Y-39.30 Z1.99 J243.68 F500.0
+G1 X-19.49 Y-41.05 Z1.99 J247.11 F500.0
+G1 X-19.49 Y-45.25 Z1.99 J251.23 F500.0
+G1 X-22.61 Y-47.05 Z1.99 J254.76 F500.0
+G1 X-22.61 Y-51.25 Z1.99 J258.87 F500.0
+G1 X-19.49 Y-53.05 Z1.99 J262.40 F500.0
+G1 X-19.49 Y-57.25 Z1.99 J266.52 F500.0
+G1 X-22.61 Y-59.05 Z1.99 J270.05 F500.0
+G1 X-22.61 Y-63.25 Z1.99 J274.17 F500.0
+G1 X-19.49 Y-65.05 Z1.99 J277.70 F500.0
+G1 X-19.49 Y-69.25 Z1.99 J281.81 F500.0
+G1 X-22.61 Y-71.05 Z1.99 J285.34 F500.0
+G1 X-22.61 Y-73.64 Z1.99 J287.88 F500.0
+G1 X-16.02 Y-73.64 Z1.99 J294.34 F500.0
+G1 X-16.02 Y-71.05 Z1.99 J296.88 F500.0
+G1 X-19.14 Y-69.25 Z1.99 J300.41 F500.0
+G1 X-19.14 Y-65.05 Z1.99 J304.52 F500.0
+G1 X-16.02 Y-63.25 Z1.99 J308.05 F500.0
+G1 X-16.02 Y-59.05 Z1.99 J312.17 F500.0
+G1 X-19.14 Y-57.25 Z1.99 J315.70 F500.0
+G1 X-19.14 Y-53.05 Z1.99 J319.81 F500.0
+G1 X-16.02 Y-51.25 Z1.99 J323.34 F500.0
+G1 X-16.02 Y-47.05 Z1.99 J327.46 F500.0
+G1 X-19.14 Y-45.25 Z1.99 J330.99 F500.0
+G1 X-19.14 Y-41.05 Z1.99 J335.11 F500.0
+G1 X-16.10 Y-39.30 Z1.99 J338.54 F500.0
+G1 X-15.60 Y-39.30 Z1.99 J339.03 F500.0
+G1 X-12.56 Y-41.05 Z1.99 J342.47 F500.0
+G1 X-12.56 Y-45.25 Z1.99 J346.59 F500.0
+G1 X-15.68 Y-47.05 Z1.99 J350.12 F500.0
+G1 X-15.68 Y-51.25 Z1.99 J354.23 F500.0
+G1 X-12.56 Y-53.05 Z1.99 J357.76 F500.0
+G1 X-12.56 Y-57.25 Z1.99 J361.88 F500.0
+G1 X-15.68 Y-59.05 Z1.99 J365.41 F500.0
+G1 X-15.68 Y-63.25 Z1.99 J369.53 F500.0
+G1 X-12.56 Y-65.05 Z1.99 J373.06 F500.0
+G1 X-12.56 Y-69.25 Z1.99 J377.17 F500.0
+G1 X-15.68 Y-71.05 Z1.99 J380.70 F500.0
+G1 X-15.68 Y-73.64 Z1.99 J383.24 F500.0
+G1 X-9.10 Y-73.64 Z1.99 J389.69 F500.0
+G1 X-9.10 Y-71.05 Z1.99 J392.23 F500.0
+G1 X-12.21 Y-69.25 Z1.99 J395.75 F500.0
+G1 X-12.21 Y-65.05 Z1.99 J399.86 F500.0
+G1 X-9.10 Y-63.25 Z1.99 J403.39 F500.0
+G1 X-9.10 Y-59.05 Z1.99 J407.50 F500.0
+G1 X-12.21 Y-57.25 Z1.99 J411.02 F500.0
+G1 X-12.21 Y-53.05 Z1.99 J415.14 F500.0
+G1 X-9.10 Y-51.25 Z1.99 J418.66 F500.0
+G1 X-9.10 Y-47.05 Z1.99 J422.78 F500.0
+G1 X-12.21 Y-45.25 Z1.99 J426.30 F500.0
+G1 X-12.21 Y-41.05 Z1.99 J430.41 F500.0
+G1 X-9.18 Y-39.30 Z1.99 J433.84 F500.0
+G1 X-8.67 Y-39.30 Z1.99 J434.34 F500.0
+G1 X-5.63 Y-41.05 Z1.99 J437.78 F500.0
+G1 X-5.63 Y-45.25 Z1.99 J441.90 F500.0
+G1 X-8.75 Y-47.05 Z1.99 J445.43 F500.0
+G1 X-8.75 Y-51.25 Z1.99 J449.54 F500.0
+G1 X-5.63 Y-53.05 Z1.99 J453.07 F500.0
+G1 X-5.63 Y-57.25 Z1.99 J457.19 F500.0
+G1 X-8.75 Y-59.05 Z1.99 J460.72 F500.0
+G1 X-8.75 Y-63.25 Z1.99 J464.83 F500.0
+G1 X-5.63 Y-65.05 Z1.99 J468.36 F500.0
+G1 X-5.63 Y-69.25 Z1.99 J472.48 F500.0
+G1 X-8.75 Y-71.05 Z1.99 J476.01 F500.0
+G1 X-8.75 Y-73.64 Z1.99 J478.55 F500.0
+G1 X-2.17 Y-73.64 Z1.99 J485.00 F500.0
+G1 X-2.17 Y-71.05 Z1.99 J487.54 F500.0
+G1 X-5.28 Y-69.25 Z1.99 J491.06 F500.0
+G1 X-5.28 Y-65.05 Z1.99 J495.17 F500.0
+G1 X-2.17 Y-63.25 Z1.99 J498.69 F500.0
+G1 X-2.17 Y-59.05 Z1.99 J502.81 F500.0
+G1 X-5.28 Y-57.25 Z1.99 J506.33 F500.0
+G1 X-5.28 Y-53.05 Z1.99 J510.45 F500.0
+G1 X-2.17 Y-51.25 Z1.99 J513.97 F500.0
+G1 X-2.17 Y-47.05 Z1.99 J518.08 F500.0
+G1 X-5.28 Y-45.25 Z1.99 J521.61 F500.0
+G1 X-5.28 Y-41.05 Z1.99 J525.72 F500.0
+G1 X-2.25 Y-39.30 Z1.99 J529.15 F500.0
+G1 X-1.74 Y-39.30 Z1.99 J529.65 F500.0
+G1 X1.30 Y-41.05 Z1.99 J533.09 F500.0
+G1 X1.30 Y-45.25 Z1.99 J537.20 F500.0
+G1 X-1.82 Y-47.05 Z1.99 J540.73 F500.0
+G1 X-1.82 Y-51.25 Z1.99 J544.85 F500.0
+G1 X1.30 Y-53.05 Z1.99 J548.38 F500.0
+G1 X1.30 Y-57.25 Z1.99 J552.50 F500.0
+G1 X-1.82 Y-59.05 Z1.99 J556.03 F500.0
+G1 X-1.82 Y-63.25 Z1.99 J560.14 F500.0
+G1 X1.30 Y-65.05 Z1.99 J563.67 F500.0
+G1 X1.30 Y-69.25 Z1.99 J567.79 F500.0
+G1 X-1.82 Y-71.05 Z1.99 J571.32 F500.0
+G1 X-1.82 Y-73.64 Z1.99 J573.86 F500.0
+G1 X4.76 Y-73.64 Z1.99 J580.31 F500.0
+G1 X4.76 Y-71.05 Z1.99 J582.84 F500.0
+G1 X1.64 Y-69.25 Z1.99 J586.37 F500.0
+G1 X1.64 Y-65.05 Z1.99 J590.49 F500.0
+G1 X4.76 Y-63.25 Z1.99 J594.02 F500.0
+G1 X4.76 Y-59.05 Z1.99 J598.14 F500.0
+G1 X1.64 Y-57.25 Z1.99 J601.67 F500.0
+G1 X1.64 Y-53.05 Z1.99 J605.78 F500.0
+G1 X4.76 Y-51.25 Z1.99 J609.31 F500.0
+G1 X4.76 Y-47.05 Z1.99 J613.43 F500.0
+G1 X1.64 Y-45.25 Z1.99 J616.96 F500.0
+G1 X1.64 Y-41.05 Z1.99 J621.07 F500.0
+G1 X4.68 Y-39.30 Z1.99 J624.51 F500.0
+G1 X5.19 Y-39.30 Z1.99 J625.01 F500.0
+G1 X8.22 Y-41.05 Z1.99 J628.44 F500.0
+G1 X8.22 Y-45.25 Z1.99 J632.56 F500.0
+G1 X5.11 Y-47.05 Z1.99 J636.08 F500.0
+G1 X5.11 Y-51.25 Z1.99 J640.19 F500.0
+G1 X8.22 Y-53.05 Z1.99 J643.71 F500.0
+G1 X8.22 Y-57.25 Z1.99 J647.83 F500.0
+G1 X5.11 Y-59.05 Z1.99 J651.35 F500.0
+G1 X5.11 Y-63.25 Z1.99 J655.47 F500.0
+G1 X8.22 Y-65.05 Z1.99 J658.99 F500.0
+G1 X8.22 Y-69.25 Z1.99 J663.11 F500.0
+G1 X5.11 Y-71.05 Z1.99 J666.63 F500.0
+G1 X5.11 Y-73.64 Z1.99 J669.17 F500.0
+G1 X11.69 Y-73.64 Z1.99 J675.61 F500.0
+G1 X11.69 Y-71.05 Z1.99 J678.15 F500.0
+G1 X8.57 Y-69.25 Z1.99 J681.68 F500.0
+G1 X8.57 Y-65.05 Z1.99 J685.80 F500.0
+G1 X11.69 Y-63.25 Z1.99 J689.33 F500.0
+G1 X11.69 Y-59.05 Z1.99 J693.44 F500.0
+G1 X8.57 Y-57.25 Z1.99 J696.97 F500.0
+G1 X8.57 Y-53.05 Z1.99 J701.09 F500.0
+G1 X11.69 Y-51.25 Z1.99 J704.62 F500.0
+G1 X11.69 Y-47.05 Z1.99 J708.74 F500.0
+G1 X8.57 Y-45.25 Z1.99 J712.27 F500.0
+G1 X8.57 Y-41.05 Z1.99 J716.38 F500.0
+G1 X11.61 Y-39.30 Z1.99 J719.82 F500.0
+G1 X12.11 Y-39.30 Z1.99 J720.31 F500.0
+G1 X15.15 Y-41.05 Z1.99 J723.75 F500.0
+G1 X15.15 Y-45.25 Z1.99 J727.86 F500.0
+G1 X12.03 Y-47.05 Z1.99 J731.39 F500.0
+G1 X12.03 Y-51.25 Z1.99 J735.51 F500.0
+G1 X15.15 Y-53.05 Z1.99 J739.04 F500.0
+G1 X15.15 Y-57.25 Z1.99 J743.15 F500.0
+G1 X12.03 Y-59.05 Z1.99 J746.68 F500.0
+G1 X12.03 Y-63.25 Z1.99 J750.80 F500.0
+G1 X15.15 Y-65.05 Z1.99 J754.33 F500.0
+G1 X15.15 Y-69.25 Z1.99 J758.45 F500.0
+G1 X12.03 Y-71.05 Z1.99 J761.98 F500.0
+G1 X12.03 Y-73.64 Z1.99 J764.51 F500.0
+G1 X18.62 Y-73.64 Z1.99 J770.97 F500.0
+G1 X18.62 Y-71.05 Z1.99 J773.51 F500.0
+G1 X15.50 Y-69.25 Z1.99 J777.04 F500.0
+G1 X15.50 Y-65.05 Z1.99 J781.16 F500.0
+G1 X18.62 Y-63.25 Z1.99 J784.69 F500.0
+G1 X18.62 Y-59.05 Z1.99 J788.80 F500.0
+G1 X15.50 Y-57.25 Z1.99 J792.33 F500.0
+G1 X15.50 Y-53.05 Z1.99 J796.45 F500.0
+G1 X18.62 Y-51.25 Z1.99 J799.98 F500.0
+G1 X18.62 Y-47.05 Z1.99 J804.10 F500.0
+G1 X15.50 Y-45.25 Z1.99 J807.62 F500.0
+G1 X15.50 Y-41.05 Z1.99 J811.74 F500.0
+G1 X18.54 Y-39.30 Z1.99 J815.18 F500.0
+G1 X19.04 Y-39.30 Z1.99 J815.67 F500.0
+G1 X22.08 Y-41.05 Z1.99 J819.11 F500.0
+G1 X22.08 Y-45.25 Z1.99 J823.22 F500.0
+G1 X18.96 Y-47.05 Z1.99 J826.75 F500.0
+G1 X18.96 Y-51.25 Z1.99 J830.87 F500.0
+G1 X22.08 Y-53.05 Z1.99 J834.40 F500.0
+G1 X22.08 Y-57.25 Z1.99 J838.51 F500.0
+G1 X18.96 Y-59.05 Z1.99 J842.04 F500.0
+G1 X18.96 Y-63.25 Z1.99 J846.16 F500.0
+G1 X22.08 Y-65.05 Z1.99 J849.69 F500.0
+G1 X22.08 Y-69.25 Z1.99 J853.81 F500.0
+G1 X18.96 Y-71.05 Z1.99 J857.34 F500.0
+G1 X18.96 Y-73.64 Z1.99 J859.87 F500.0
+G1 X25.54 Y-73.64 Z1.99 J866.32 F500.0
+G1 X25.54 Y-71.05 Z1.99 J868.86 F500.0
+G1 X22.43 Y-69.25 Z1.99 J872.38 F500.0
+G1 X22.43 Y-65.05 Z1.99 J876.50 F500.0
+G1 X25.54 Y-63.25 Z1.99 J880.02 F500.0
+G1 X25.54 Y-59.05 Z1.99 J884.14 F500.0
+G1 X22.43 Y-57.25 Z1.99 J887.66 F500.0
+G1 X22.43 Y-53.05 Z1.99 J891.77 F500.0
+G1 X25.54 Y-51.25 Z1.99 J895.29 F500.0
+G1 X25.54 Y-47.05 Z1.99 J899.41 F500.0
+G1 X22.43 Y-45.25 Z1.99 J902.93 F500.0
+G1 X22.43 Y-41.05 Z1.99 J907.05 F500.0
+G1 X25.47 Y-39.30 Z1.99 J910.49 F500.0
+G1 X25.97 Y-39.30 Z1.99 J910.98 F500.0
+G1 X29.01 Y-41.05 Z1.99 J914.41 F500.0
+G1 X29.01 Y-45.25 Z1.99 J918.53 F500.0
+G1 X25.89 Y-47.05 Z1.99 J922.06 F500.0
+G1 X25.89 Y-51.25 Z1.99 J926.18 F500.0
+G1 X29.01 Y-53.05 Z1.99 J929.71 F500.0
+G1 X29.01 Y-57.25 Z1.99 J933.82 F500.0
+G1 X25.89 Y-59.05 Z1.99 J937.35 F500.0
+G1 X25.89 Y-63.25 Z1.99 J941.47 F500.0
+G1 X29.01 Y-65.05 Z1.99 J945.00 F500.0
+G1 X29.01 Y-69.25 Z1.99 J949.11 F500.0
+G1 X25.89 Y-71.05 Z1.99 J952.64 F500.0
+G1 X25.89 Y-73.64 Z1.99 J955.18 F500.0
+G1 X32.47 Y-73.64 Z1.99 J961.63 F500.0
+G1 X32.47 Y-71.05 Z1.99 J964.17 F500.0
+G1 X29.36 Y-69.25 Z1.99 J967.69 F500.0
+G1 X29.36 Y-65.05 Z1.99 J971.81 F500.0
+G1 X32.47 Y-63.25 Z1.99 J975.33 F500.0
+G1 X32.47 Y-59.05 Z1.99 J979.44 F500.0
+G1 X29.36 Y-57.25 Z1.99 J982.96 F500.0
+G1 X29.36 Y-53.05 Z1.99 J987.08 F500.0
+G1 X32.47 Y-51.25 Z1.99 J990.60 F500.0
+G1 X32.47 Y-47.05 Z1.99 J994.72 F500.0
+G1 X29.36 Y-45.25 Z1.99 J998.24 F500.0
+G1 X29.36 Y-41.05 Z1.99 J1002.36 F500.0
+G1 X32.39 Y-39.30 Z1.99 J1005.78 F500.0
+G1 X32.90 Y-39.30 Z1.99 J1006.28 F500.0
+G1 X35.94 Y-41.05 Z1.99 J1009.72 F500.0
+G1 X35.94 Y-45.25 Z1.99 J1013.84 F500.0
+G1 X32.82 Y-47.05 Z1.99 J1017.37 F500.0
+G1 X32.82 Y-51.25 Z1.99 J1021.48 F500.0
+G1 X35.94 Y-53.05 Z1.99 J1025.01 F500.0
+G1 X35.94 Y-57.25 Z1.99 J1029.13 F500.0
+G1 X32.82 Y-59.05 Z1.99 J1032.66 F500.0
+G1 X32.82 Y-63.25 Z1.99 J1036.78 F500.0
+G1 X35.94 Y-65.05 Z1.99 J1040.31 F500.0
+G1 X35.94 Y-69.25 Z1.99 J1044.42 F500.0
+G1 X32.82 Y-71.05 Z1.99 J1047.95 F500.0
+G1 X32.82 Y-73.64 Z1.99 J1050.49 F500.0
+G1 X39.40 Y-73.64 Z1.99 J1056.94 F500.0
+G1 X39.40 Y-71.05 Z1.99 J1059.48 F500.0
+G1 X36.28 Y-69.25 Z1.99 J1063.01 F500.0
+G1 X36.28 Y-65.05 Z1.99 J1067.12 F500.0
+G1 X39.40 Y-63.25 Z1.99 J1070.65 F500.0
+G1 X39.40 Y-59.05 Z1.99 J1074.77 F500.0
+G1 X36.28 Y-57.25 Z1.99 J1078.30 F500.0
+G1 X36.28 Y-53.05 Z1.99 J1082.41 F500.0
+G1 X39.40 Y-51.25 Z1.99 J1085.94 F500.0
+G1 X39.40 Y-47.05 Z1.99 J1090.06 F500.0
+G1 X36.28 Y-45.25 Z1.99 J1093.59 F500.0
+G1 X36.28 Y-41.05 Z1.99 J1097.71 F500.0
+G1 X39.32 Y-39.30 Z1.99 J1101.14 F500.0
+G1 X39.83 Y-39.30 Z1.99 J1101.64 F500.0
+G1 X40.21 Y-39.52 Z1.99 J1102.07 F500.0
+G1 X40.21 Y-46.78 Z1.99 J1109.19 F500.0
+G1 X39.75 Y-47.05 Z1.99 J1109.71 F500.0
+G1 X39.75 Y-51.25 Z1.99 J1113.83 F500.0
+G1 X40.21 Y-51.52 Z1.99 J1114.35 F500.0
+G1 X40.21 Y-58.78 Z1.99 J1121.46 F500.0
+G1 X39.75 Y-59.05 Z1.99 J1121.99 F500.0
+G1 X39.75 Y-63.25 Z1.99 J1126.10 F500.0
+G1 X40.21 Y-63.52 Z1.99 J1126.63 F500.0
+G1 X40.21 Y-68.90 Z1.99 J1136.90 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X40.21 Y-70.78 Z1.99 J1136.90 F800.0
+G1 X39.75 Y-71.05 Z1.99 J1136.90 F800.0
+G1 X39.75 Y-73.64 Z1.99 J1136.90 F800.0
+G1 X39.75 Y-73.64 Z11.99 J1136.90 F800.0
+G1 X17.02 Y-78.09 Z11.99 J1146.90 F800.0
+
+T1
+G1 X22.02 Y-73.09 Z2.99 J0.00 F300.0
+G1 X39.66 Y-73.09 Z2.99 J17.29 F300.0
+G1 X39.66 Y-45.29 Z2.99 J44.53 F300.0
+G1 X39.66 Y-39.85 Z2.99 J49.86 F300.0
+G1 X-15.94 Y-39.85 Z2.99 J104.35 F500.0
+G1 X-33.58 Y-39.85 Z2.99 J121.64 F500.0
+G1 X-33.58 Y-67.65 Z2.99 J148.88 F500.0
+G1 X-33.58 Y-73.09 Z2.99 J154.21 F500.0
+G1 X17.02 Y-73.09 Z2.99 J208.80 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X22.02 Y-73.09 Z2.99 J208.80 F800.0
+G1 X22.02 Y-73.09 Z12.99 J208.80 F800.0
+G1 X17.02 Y-78.09 Z12.99 J218.80 F800.0
+
+T1
+G1 X22.02 Y-73.09 Z2.99 J0.00 F300.0
+G1 X-33.58 Y-40.92 Z2.99 J62.95 F300.0
+G1 X-33.34 Y-41.05 Z2.99 J63.22 F300.0
+G1 X-33.34 Y-45.25 Z2.99 J67.34 F300.0
+G1 X-33.58 Y-45.39 Z2.99 J67.61 F500.0
+G1 X-33.58 Y-52.91 Z2.99 J74.98 F500.0
+G1 X-33.34 Y-53.05 Z2.99 J75.25 F500.0
+G1 X-33.34 Y-57.25 Z2.99 J79.37 F500.0
+G1 X-33.58 Y-57.39 Z2.99 J79.64 F500.0
+G1 X-33.58 Y-64.92 Z2.99 J87.02 F500.0
+G1 X-33.34 Y-65.05 Z2.99 J87.28 F500.0
+G1 X-33.34 Y-69.25 Z2.99 J91.40 F500.0
+G1 X-33.58 Y-69.39 Z2.99 J91.67 F500.0
+G1 X-29.88 Y-73.09 Z2.99 J96.80 F500.0
+G1 X-29.88 Y-71.05 Z2.99 J98.80 F500.0
+G1 X-33.00 Y-69.25 Z2.99 J102.33 F500.0
+G1 X-33.00 Y-65.05 Z2.99 J106.45 F500.0
+G1 X-29.88 Y-63.25 Z2.99 J109.98 F500.0
+G1 X-29.88 Y-59.05 Z2.99 J114.09 F500.0
+G1 X-33.00 Y-57.25 Z2.99 J117.62 F500.0
+G1 X-33.00 Y-53.05 Z2.99 J121.74 F500.0
+G1 X-29.88 Y-51.25 Z2.99 J125.27 F500.0
+G1 X-29.88 Y-47.05 Z2.99 J129.38 F500.0
+G1 X-33.00 Y-45.25 Z2.99 J132.91 F500.0
+G1 X-33.00 Y-41.05 Z2.99 J137.03 F500.0
+G1 X-30.92 Y-39.85 Z2.99 J139.38 F500.0
+G1 X-28.50 Y-39.85 Z2.99 J141.76 F500.0
+G1 X-26.42 Y-41.05 Z2.99 J144.11 F500.0
+G1 X-26.42 Y-45.25 Z2.99 J148.22 F500.0
+G1 X-29.53 Y-47.05 Z2.99 J151.75 F500.0
+G1 X-29.53 Y-51.25 Z2.99 J155.86 F500.0
+G1 X-26.42 Y-53.05 Z2.99 J159.38 F500.0
+G1 X-26.42 Y-57.25 Z2.99 J163.50 F500.0
+G1 X-29.53 Y-59.05 Z2.99 J167.02 F500.0
+G1 X-29.53 Y-63.25 Z2.99 J171.14 F500.0
+G1 X-26.42 Y-65.05 Z2.99 J174.66 F500.0
+G1 X-26.42 Y-69.25 Z2.99 J178.77 F500.0
+G1 X-29.53 Y-71.05 Z2.99 J182.30 F500.0
+G1 X-29.53 Y-73.09 Z2.99 J184.29 F500.0
+G1 X-22.95 Y-73.09 Z2.99 J190.74 F500.0
+G1 X-22.95 Y-71.05 Z2.99 J192.74 F500.0
+G1 X-26.07 Y-69.25 Z2.99 J196.27 F500.0
+G1 X-26.07 Y-65.05 Z2.99 J200.39 F500.0
+G1 X-22.95 Y-63.25 Z2.99 J203.92 F500.0
+G1 X-22.95 Y-59.05 Z2.99 J208.03 F500.0
+G1 X-26.07 Y-57.25 Z2.99 J211.56 F500.0
+G1 X-26.07 Y-53.05 Z2.99 J215.68 F500.0
+G1 X-22.95 Y-51.25 Z2.99 J219.21 F500.0
+G1 X-22.95 Y-47.05 Z2.99 J223.33 F500.0
+G1 X-26.07 Y-45.25 Z2.99 J226.86 F500.0
+G1 X-26.07 Y-41.05 Z2.99 J230.97 F500.0
+G1 X-23.99 Y-39.85 Z2.99 J233.33 F500.0
+G1 X-21.57 Y-39.85 Z2.99 J235.70 F500.0
+G1 X-19.49 Y-41.05 Z2.99 J238.05 F500.0
+G1 X-19.49 Y-45.25 Z2.99 J242.17 F500.0
+G1 X-22.61 Y-47.05 Z2.99 J245.70 F500.0
+G1 X-22.61 Y-51.25 Z2.99 J249.81 F500.0
+G1 X-19.49 Y-53.05 Z2.99 J253.34 F500.0
+G1 X-19.49 Y-57.25 Z2.99 J257.46 F500.0
+G1 X-22.61 Y-59.05 Z2.99 J260.99 F500.0
+G1 X-22.61 Y-63.25 Z2.99 J265.10 F500.0
+G1 X-19.49 Y-65.05 Z2.99 J268.63 F500.0
+G1 X-19.49 Y-69.25 Z2.99 J272.75 F500.0
+G1 X-22.61 Y-71.05 Z2.99 J276.28 F500.0
+G1 X-22.61 Y-73.09 Z2.99 J278.28 F500.0
+G1 X-16.02 Y-73.09 Z2.99 J284.74 F500.0
+G1 X-16.02 Y-71.05 Z2.99 J286.74 F500.0
+G1 X-19.14 Y-69.25 Z2.99 J290.27 F500.0
+G1 X-19.14 Y-65.05 Z2.99 J294.38 F500.0
+G1 X-16.02 Y-63.25 Z2.99 J297.91 F500.0
+G1 X-16.02 Y-59.05 Z2.99 J302.03 F500.0
+G1 X-19.14 Y-57.25 Z2.99 J305.56 F500.0
+G1 X-19.14 Y-53.05 Z2.99 J309.67 F500.0
+G1 X-16.02 Y-51.25 Z2.99 J313.20 F500.0
+G1 X-16.02 Y-47.05 Z2.99 J317.32 F500.0
+G1 X-19.14 Y-45.25 Z2.99 J320.85 F500.0
+G1 X-19.14 Y-41.05 Z2.99 J324.97 F500.0
+G1 X-17.06 Y-39.85 Z2.99 J327.32 F500.0
+G1 X-14.64 Y-39.85 Z2.99 J329.69 F500.0
+G1 X-12.56 Y-41.05 Z2.99 J332.04 F500.0
+G1 X-12.56 Y-45.25 Z2.99 J336.16 F500.0
+G1 X-15.68 Y-47.05 Z2.99 J339.69 F500.0
+G1 X-15.68 Y-51.25 Z2.99 J343.81 F500.0
+G1 X-12.56 Y-53.05 Z2.99 J347.34 F500.0
+G1 X-12.56 Y-57.25 Z2.99 J351.45 F500.0
+G1 X-15.68 Y-59.05 Z2.99 J354.98 F500.0
+G1 X-15.68 Y-63.25 Z2.99 J359.10 F500.0
+G1 X-12.56 Y-65.05 Z2.99 J362.63 F500.0
+G1 X-12.56 Y-69.25 Z2.99 J366.74 F500.0
+G1 X-15.68 Y-71.05 Z2.99 J370.27 F500.0
+G1 X-15.68 Y-73.09 Z2.99 J372.27 F500.0
+G1 X-9.10 Y-73.09 Z2.99 J378.72 F500.0
+G1 X-9.10 Y-71.05 Z2.99 J380.72 F500.0
+G1 X-12.21 Y-69.25 Z2.99 J384.24 F500.0
+G1 X-12.21 Y-65.05 Z2.99 J388.36 F500.0
+G1 X-9.10 Y-63.25 Z2.99 J391.88 F500.0
+G1 X-9.10 Y-59.05 Z2.99 J396.00 F500.0
+G1 X-12.21 Y-57.25 Z2.99 J399.52 F500.0
+G1 X-12.21 Y-53.05 Z2.99 J403.63 F500.0
+G1 X-9.10 Y-51.25 Z2.99 J407.16 F500.0
+G1 X-9.10 Y-47.05 Z2.99 J411.27 F500.0
+G1 X-12.21 Y-45.25 Z2.99 J414.79 F500.0
+G1 X-12.21 Y-41.05 Z2.99 J418.91 F500.0
+G1 X-10.14 Y-39.85 Z2.99 J421.25 F500.0
+G1 X-7.71 Y-39.85 Z2.99 J423.64 F500.0
+G1 X-5.63 Y-41.05 Z2.99 J425.99 F500.0
+G1 X-5.63 Y-45.25 Z2.99 J430.10 F500.0
+G1 X-8.75 Y-47.05 Z2.99 J433.63 F500.0
+G1 X-8.75 Y-51.25 Z2.99 J437.75 F500.0
+G1 X-5.63 Y-53.05 Z2.99 J441.28 F500.0
+G1 X-5.63 Y-57.25 Z2.99 J445.40 F500.0
+G1 X-8.75 Y-59.05 Z2.99 J448.93 F500.0
+G1 X-8.75 Y-63.25 Z2.99 J453.04 F500.0
+G1 X-5.63 Y-65.05 Z2.99 J456.57 F500.0
+G1 X-5.63 Y-69.25 Z2.99 J460.69 F500.0
+G1 X-8.75 Y-71.05 Z2.99 J464.22 F500.0
+G1 X-8.75 Y-73.09 Z2.99 J466.22 F500.0
+G1 X-2.17 Y-73.09 Z2.99 J472.67 F500.0
+G1 X-2.17 Y-71.05 Z2.99 J474.67 F500.0
+G1 X-5.28 Y-69.25 Z2.99 J478.19 F500.0
+G1 X-5.28 Y-65.05 Z2.99 J482.30 F500.0
+G1 X-2.17 Y-63.25 Z2.99 J485.82 F500.0
+G1 X-2.17 Y-59.05 Z2.99 J489.94 F500.0
+G1 X-5.28 Y-57.25 Z2.99 J493.46 F500.0
+G1 X-5.28 Y-53.05 Z2.99 J497.58 F500.0
+G1 X-2.17 Y-51.25 Z2.99 J501.10 F500.0
+G1 X-2.17 Y-47.05 Z2.99 J505.21 F500.0
+G1 X-5.28 Y-45.25 Z2.99 J508.74 F500.0
+G1 X-5.28 Y-41.05 Z2.99 J512.85 F500.0
+G1 X-3.21 Y-39.85 Z2.99 J515.20 F500.0
+G1 X-0.78 Y-39.85 Z2.99 J517.58 F500.0
+G1 X1.30 Y-41.05 Z2.99 J519.93 F500.0
+G1 X1.30 Y-45.25 Z2.99 J524.05 F500.0
+G1 X-1.82 Y-47.05 Z2.99 J527.58 F500.0
+G1 X-1.82 Y-51.25 Z2.99 J531.69 F500.0
+G1 X1.30 Y-53.05 Z2.99 J535.22 F500.0
+G1 X1.30 Y-57.25 Z2.99 J539.34 F500.0
+G1 X-1.82 Y-59.05 Z2.99 J542.87 F500.0
+G1 X-1.82 Y-63.25 Z2.99 J546.99 F500.0
+G1 X1.30 Y-65.05 Z2.99 J550.52 F500.0
+G1 X1.30 Y-69.25 Z2.99 J554.63 F500.0
+G1 X-1.82 Y-71.05 Z2.99 J558.16 F500.0
+G1 X-1.82 Y-73.09 Z2.99 J560.16 F500.0
+G1 X4.76 Y-73.09 Z2.99 J566.61 F500.0
+G1 X4.76 Y-71.05 Z2.99 J568.61 F500.0
+G1 X1.64 Y-69.25 Z2.99 J572.14 F500.0
+G1 X1.64 Y-65.05 Z2.99 J576.25 F500.0
+G1 X4.76 Y-63.25 Z2.99 J579.78 F500.0
+G1 X4.76 Y-59.05 Z2.99 J583.90 F500.0
+G1 X1.64 Y-57.25 Z2.99 J587.43 F500.0
+G1 X1.64 Y-53.05 Z2.99 J591.55 F500.0
+G1 X4.76 Y-51.25 Z2.99 J595.08 F500.0
+G1 X4.76 Y-47.05 Z2.99 J599.19 F500.0
+G1 X1.64 Y-45.25 Z2.99 J602.72 F500.0
+G1 X1.64 Y-41.05 Z2.99 J606.84 F500.0
+G1 X3.72 Y-39.85 Z2.99 J609.19 F500.0
+G1 X6.15 Y-39.85 Z2.99 J611.57 F500.0
+G1 X8.22 Y-41.05 Z2.99 J613.92 F500.0
+G1 X8.22 Y-45.25 Z2.99 J618.03 F500.0
+G1 X5.11 Y-47.05 Z2.99 J621.56 F500.0
+G1 X5.11 Y-51.25 Z2.99 J625.67 F500.0
+G1 X8.22 Y-53.05 Z2.99 J629.19 F500.0
+G1 X8.22 Y-57.25 Z2.99 J633.31 F500.0
+G1 X5.11 Y-59.05 Z2.99 J636.83 F500.0
+G1 X5.11 Y-63.25 Z2.99 J640.95 F500.0
+G1 X8.22 Y-65.05 Z2.99 J644.47 F500.0
+G1 X8.22 Y-69.25 Z2.99 J648.58 F500.0
+G1 X5.11 Y-71.05 Z2.99 J652.11 F500.0
+G1 X5.11 Y-73.09 Z2.99 J654.10 F500.0
+G1 X11.69 Y-73.09 Z2.99 J660.55 F500.0
+G1 X11.69 Y-71.05 Z2.99 J662.55 F500.0
+G1 X8.57 Y-69.25 Z2.99 J666.08 F500.0
+G1 X8.57 Y-65.05 Z2.99 J670.20 F500.0
+G1 X11.69 Y-63.25 Z2.99 J673.73 F500.0
+G1 X11.69 Y-59.05 Z2.99 J677.84 F500.0
+G1 X8.57 Y-57.25 Z2.99 J681.37 F500.0
+G1 X8.57 Y-53.05 Z2.99 J685.49 F500.0
+G1 X11.69 Y-51.25 Z2.99 J689.02 F500.0
+G1 X11.69 Y-47.05 Z2.99 J693.14 F500.0
+G1 X8.57 Y-45.25 Z2.99 J696.67 F500.0
+G1 X8.57 Y-41.05 Z2.99 J700.78 F500.0
+G1 X10.65 Y-39.85 Z2.99 J703.14 F500.0
+G1 X13.07 Y-39.85 Z2.99 J705.51 F500.0
+G1 X15.15 Y-41.05 Z2.99 J707.86 F500.0
+G1 X15.15 Y-45.25 Z2.99 J711.98 F500.0
+G1 X12.03 Y-47.05 Z2.99 J715.51 F500.0
+G1 X12.03 Y-51.25 Z2.99 J719.62 F500.0
+G1 X15.15 Y-53.05 Z2.99 J723.15 F500.0
+G1 X15.15 Y-57.25 Z2.99 J727.27 F500.0
+G1 X12.03 Y-59.05 Z2.99 J730.80 F500.0
+G1 X12.03 Y-63.25 Z2.99 J734.91 F500.0
+G1 X15.15 Y-65.05 Z2.99 J738.44 F500.0
+G1 X15.15 Y-69.25 Z2.99 J742.56 F500.0
+G1 X12.03 Y-71.05 Z2.99 J746.09 F500.0
+G1 X12.03 Y-73.09 Z2.99 J748.09 F500.0
+G1 X18.62 Y-73.09 Z2.99 J754.55 F500.0
+G1 X18.62 Y-71.05 Z2.99 J756.55 F500.0
+G1 X15.50 Y-69.25 Z2.99 J760.08 F500.0
+G1 X15.50 Y-65.05 Z2.99 J764.19 F500.0
+G1 X18.62 Y-63.25 Z2.99 J767.72 F500.0
+G1 X18.62 Y-59.05 Z2.99 J771.84 F500.0
+G1 X15.50 Y-57.25 Z2.99 J775.37 F500.0
+G1 X15.50 Y-53.05 Z2.99 J779.48 F500.0
+G1 X18.62 Y-51.25 Z2.99 J783.01 F500.0
+G1 X18.62 Y-47.05 Z2.99 J787.13 F500.0
+G1 X15.50 Y-45.25 Z2.99 J790.66 F500.0
+G1 X15.50 Y-41.05 Z2.99 J794.78 F500.0
+G1 X17.58 Y-39.85 Z2.99 J797.13 F500.0
+G1 X20.00 Y-39.85 Z2.99 J799.50 F500.0
+G1 X22.08 Y-41.05 Z2.99 J801.85 F500.0
+G1 X22.08 Y-45.25 Z2.99 J805.97 F500.0
+G1 X18.96 Y-47.05 Z2.99 J809.50 F500.0
+G1 X18.96 Y-51.25 Z2.99 J813.62 F500.0
+G1 X22.08 Y-53.05 Z2.99 J817.15 F500.0
+G1 X22.08 Y-57.25 Z2.99 J821.26 F500.0
+G1 X18.96 Y-59.05 Z2.99 J824.79 F500.0
+G1 X18.96 Y-63.25 Z2.99 J828.91 F500.0
+G1 X22.08 Y-65.05 Z2.99 J832.44 F500.0
+G1 X22.08 Y-69.25 Z2.99 J836.55 F500.0
+G1 X18.96 Y-71.05 Z2.99 J840.08 F500.0
+G1 X18.96 Y-73.09 Z2.99 J842.08 F500.0
+G1 X25.54 Y-73.09 Z2.99 J848.53 F500.0
+G1 X25.54 Y-71.05 Z2.99 J850.53 F500.0
+G1 X22.43 Y-69.25 Z2.99 J854.05 F500.0
+G1 X22.43 Y-65.05 Z2.99 J858.17 F500.0
+G1 X25.54 Y-63.25 Z2.99 J861.69 F500.0
+G1 X25.54 Y-59.05 Z2.99 J865.81 F500.0
+G1 X22.43 Y-57.25 Z2.99 J869.33 F500.0
+G1 X22.43 Y-53.05 Z2.99 J873.44 F500.0
+G1 X25.54 Y-51.25 Z2.99 J876.97 F500.0
+G1 X25.54 Y-47.05 Z2.99 J881.08 F500.0
+G1 X22.43 Y-45.25 Z2.99 J884.60 F500.0
+G1 X22.43 Y-41.05 Z2.99 J888.72 F500.0
+G1 X24.51 Y-39.85 Z2.99 J891.07 F500.0
+G1 X26.93 Y-39.85 Z2.99 J893.44 F500.0
+G1 X29.01 Y-41.05 Z2.99 J895.80 F500.0
+G1 X29.01 Y-45.25 Z2.99 J899.91 F500.0
+G1 X25.89 Y-47.05 Z2.99 J903.44 F500.0
+G1 X25.89 Y-51.25 Z2.99 J907.56 F500.0
+G1 X29.01 Y-53.05 Z2.99 J911.09 F500.0
+G1 X29.01 Y-57.25 Z2.99 J915.20 F500.0
+G1 X25.89 Y-59.05 Z2.99 J918.73 F500.0
+G1 X25.89 Y-63.25 Z2.99 J922.85 F500.0
+G1 X29.01 Y-65.05 Z2.99 J926.38 F500.0
+G1 X29.01 Y-69.25 Z2.99 J930.50 F500.0
+G1 X25.89 Y-71.05 Z2.99 J934.03 F500.0
+G1 X25.89 Y-73.09 Z2.99 J936.03 F500.0
+G1 X32.47 Y-73.09 Z2.99 J942.47 F500.0
+G1 X32.47 Y-71.05 Z2.99 J944.47 F500.0
+G1 X29.36 Y-69.25 Z2.99 J947.99 F500.0
+G1 X29.36 Y-65.05 Z2.99 J952.11 F500.0
+G1 X32.47 Y-63.25 Z2.99 J955.63 F500.0
+G1 X32.47 Y-59.05 Z2.99 J959.75 F500.0
+G1 X29.36 Y-57.25 Z2.99 J963.27 F500.0
+G1 X29.36 Y-53.05 Z2.99 J967.39 F500.0
+G1 X32.47 Y-51.25 Z2.99 J970.91 F500.0
+G1 X32.47 Y-47.05 Z2.99 J975.02 F500.0
+G1 X29.36 Y-45.25 Z2.99 J978.54 F500.0
+G1 X29.36 Y-41.05 Z2.99 J982.66 F500.0
+G1 X31.43 Y-39.85 Z2.99 J985.01 F500.0
+G1 X33.86 Y-39.85 Z2.99 J987.39 F500.0
+G1 X35.94 Y-41.05 Z2.99 J989.74 F500.0
+G1 X35.94 Y-45.25 Z2.99 J993.86 F500.0
+G1 X32.82 Y-47.05 Z2.99 J997.39 F500.0
+G1 X32.82 Y-51.25 Z2.99 J1001.50 F500.0
+G1 X35.94 Y-53.05 Z2.99 J1005.03 F500.0
+G1 X35.94 Y-57.25 Z2.99 J1009.15 F500.0
+G1 X32.82 Y-59.05 Z2.99 J1012.68 F500.0
+G1 X32.82 Y-63.25 Z2.99 J1016.79 F500.0
+G1 X35.94 Y-65.05 Z2.99 J1020.32 F500.0
+G1 X35.94 Y-69.25 Z2.99 J1024.44 F500.0
+G1 X32.82 Y-71.05 Z2.99 J1027.97 F500.0
+G1 X32.82 Y-73.09 Z2.99 J1029.97 F500.0
+G1 X39.40 Y-73.09 Z2.99 J1036.42 F500.0
+G1 X39.40 Y-71.05 Z2.99 J1038.42 F500.0
+G1 X36.28 Y-69.25 Z2.99 J1041.95 F500.0
+G1 X36.28 Y-65.05 Z2.99 J1046.06 F500.0
+G1 X39.40 Y-63.25 Z2.99 J1049.59 F500.0
+G1 X39.40 Y-59.05 Z2.99 J1053.71 F500.0
+G1 X36.28 Y-57.25 Z2.99 J1057.24 F500.0
+G1 X36.28 Y-53.05 Z2.99 J1061.35 F500.0
+G1 X39.40 Y-51.25 Z2.99 J1064.88 F500.0
+G1 X39.40 Y-47.05 Z2.99 J1069.00 F500.0
+G1 X36.28 Y-45.25 Z2.99 J1072.53 F500.0
+G1 X36.28 Y-43.65 Z2.99 J1079.10 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X36.28 Y-41.05 Z2.99 J1079.10 F800.0
+G1 X38.36 Y-39.85 Z2.99 J1079.10 F800.0
+G1 X38.36 Y-39.85 Z12.99 J1079.10 F800.0
+G1 X13.58 Y-77.53 Z12.99 J1089.10 F800.0
+
+T1
+G1 X18.58 Y-72.53 Z3.99 J0.00 F300.0
+G1 X39.10 Y-72.53 Z3.99 J20.11 F300.0
+G1 X39.10 Y-46.73 Z3.99 J45.39 F300.0
+G1 X39.10 Y-40.41 Z3.99 J51.59 F300.0
+G1 X-12.50 Y-40.41 Z3.99 J102.16 F500.0
+G1 X-33.02 Y-40.41 Z3.99 J122.26 F500.0
+G1 X-33.02 Y-66.21 Z3.99 J147.55 F500.0
+G1 X-33.02 Y-72.53 Z3.99 J153.74 F500.0
+G1 X13.58 Y-72.53 Z3.99 J204.41 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X18.58 Y-72.53 Z3.99 J204.41 F800.0
+G1 X18.58 Y-72.53 Z13.99 J204.41 F800.0
+G1 X13.58 Y-77.53 Z13.99 J214.41 F800.0
+
+T1
+G1 X18.58 Y-72.53 Z3.99 J0.00 F300.0
+G1 X-29.88 Y-72.53 Z3.99 J47.49 F300.0
+G1 X-29.88 Y-71.05 Z3.99 J48.94 F300.0
+G1 X-33.00 Y-69.25 Z3.99 J52.47 F300.0
+G1 X-33.00 Y-65.05 Z3.99 J56.59 F500.0
+G1 X-29.88 Y-63.25 Z3.99 J60.12 F500.0
+G1 X-29.88 Y-59.05 Z3.99 J64.23 F500.0
+G1 X-33.00 Y-57.25 Z3.99 J67.76 F500.0
+G1 X-33.00 Y-53.05 Z3.99 J71.88 F500.0
+G1 X-29.88 Y-51.25 Z3.99 J75.41 F500.0
+G1 X-29.88 Y-47.05 Z3.99 J79.53 F500.0
+G1 X-33.00 Y-45.25 Z3.99 J83.06 F500.0
+G1 X-33.00 Y-41.05 Z3.99 J87.17 F500.0
+G1 X-31.88 Y-40.41 Z3.99 J88.44 F500.0
+G1 X-27.53 Y-40.41 Z3.99 J92.70 F500.0
+G1 X-26.42 Y-41.05 Z3.99 J93.95 F500.0
+G1 X-26.42 Y-45.25 Z3.99 J98.07 F500.0
+G1 X-29.53 Y-47.05 Z3.99 J101.59 F500.0
+G1 X-29.53 Y-51.25 Z3.99 J105.71 F500.0
+G1 X-26.42 Y-53.05 Z3.99 J109.23 F500.0
+G1 X-26.42 Y-57.25 Z3.99 J113.35 F500.0
+G1 X-29.53 Y-59.05 Z3.99 J116.87 F500.0
+G1 X-29.53 Y-63.25 Z3.99 J120.98 F500.0
+G1 X-26.42 Y-65.05 Z3.99 J124.50 F500.0
+G1 X-26.42 Y-69.25 Z3.99 J128.62 F500.0
+G1 X-29.53 Y-71.05 Z3.99 J132.14 F500.0
+G1 X-29.53 Y-72.53 Z3.99 J133.59 F500.0
+G1 X-22.95 Y-72.53 Z3.99 J140.04 F500.0
+G1 X-22.95 Y-71.05 Z3.99 J141.49 F500.0
+G1 X-26.07 Y-69.25 Z3.99 J145.02 F500.0
+G1 X-26.07 Y-65.05 Z3.99 J149.14 F500.0
+G1 X-22.95 Y-63.25 Z3.99 J152.67 F500.0
+G1 X-22.95 Y-59.05 Z3.99 J156.78 F500.0
+G1 X-26.07 Y-57.25 Z3.99 J160.31 F500.0
+G1 X-26.07 Y-53.05 Z3.99 J164.43 F500.0
+G1 X-22.95 Y-51.25 Z3.99 J167.96 F500.0
+G1 X-22.95 Y-47.05 Z3.99 J172.07 F500.0
+G1 X-26.07 Y-45.25 Z3.99 J175.60 F500.0
+G1 X-26.07 Y-41.05 Z3.99 J179.72 F500.0
+G1 X-24.95 Y-40.41 Z3.99 J180.98 F500.0
+G1 X-20.60 Y-40.41 Z3.99 J185.25 F500.0
+G1 X-19.49 Y-41.05 Z3.99 J186.50 F500.0
+G1 X-19.49 Y-45.25 Z3.99 J190.62 F500.0
+G1 X-22.61 Y-47.05 Z3.99 J194.15 F500.0
+G1 X-22.61 Y-51.25 Z3.99 J198.27 F500.0
+G1 X-19.49 Y-53.05 Z3.99 J201.80 F500.0
+G1 X-19.49 Y-57.25 Z3.99 J205.91 F500.0
+G1 X-22.61 Y-59.05 Z3.99 J209.44 F500.0
+G1 X-22.61 Y-63.25 Z3.99 J213.56 F500.0
+G1 X-19.49 Y-65.05 Z3.99 J217.09 F500.0
+G1 X-19.49 Y-69.25 Z3.99 J221.20 F500.0
+G1 X-22.61 Y-71.05 Z3.99 J224.73 F500.0
+G1 X-22.61 Y-72.53 Z3.99 J226.18 F500.0
+G1 X-16.02 Y-72.53 Z3.99 J232.64 F500.0
+G1 X-16.02 Y-71.05 Z3.99 J234.09 F500.0
+G1 X-19.14 Y-69.25 Z3.99 J237.62 F500.0
+G1 X-19.14 Y-65.05 Z3.99 J241.74 F500.0
+G1 X-16.02 Y-63.25 Z3.99 J245.27 F500.0
+G1 X-16.02 Y-59.05 Z3.99 J249.38 F500.0
+G1 X-19.14 Y-57.25 Z3.99 J252.91 F500.0
+G1 X-19.14 Y-53.05 Z3.99 J257.03 F500.0
+G1 X-16.02 Y-51.25 Z3.99 J260.56 F500.0
+G1 X-16.02 Y-47.05 Z3.99 J264.68 F500.0
+G1 X-19.14 Y-45.25 Z3.99 J268.21 F500.0
+G1 X-19.14 Y-41.05 Z3.99 J272.32 F500.0
+G1 X-18.02 Y-40.41 Z3.99 J273.59 F500.0
+G1 X-13.68 Y-40.41 Z3.99 J277.84 F500.0
+G1 X-12.56 Y-41.05 Z3.99 J279.10 F500.0
+G1 X-12.56 Y-45.25 Z3.99 J283.22 F500.0
+G1 X-15.68 Y-47.05 Z3.99 J286.75 F500.0
+G1 X-15.68 Y-51.25 Z3.99 J290.87 F500.0
+G1 X-12.56 Y-53.05 Z3.99 J294.40 F500.0
+G1 X-12.56 Y-57.25 Z3.99 J298.51 F500.0
+G1 X-15.68 Y-59.05 Z3.99 J302.04 F500.0
+G1 X-15.68 Y-63.25 Z3.99 J306.16 F500.0
+G1 X-12.56 Y-65.05 Z3.99 J309.69 F500.0
+G1 X-12.56 Y-69.25 Z3.99 J313.80 F500.0
+G1 X-15.68 Y-71.05 Z3.99 J317.33 F500.0
+G1 X-15.68 Y-72.53 Z3.99 J318.78 F500.0
+G1 X-9.10 Y-72.53 Z3.99 J325.23 F500.0
+G1 X-9.10 Y-71.05 Z3.99 J326.68 F500.0
+G1 X-12.21 Y-69.25 Z3.99 J330.20 F500.0
+G1 X-12.21 Y-65.05 Z3.99 J334.32 F500.0
+G1 X-9.10 Y-63.25 Z3.99 J337.84 F500.0
+G1 X-9.10 Y-59.05 Z3.99 J341.96 F500.0
+G1 X-12.21 Y-57.25 Z3.99 J345.48 F500.0
+G1 X-12.21 Y-53.05 Z3.99 J349.59 F500.0
+G1 X-9.10 Y-51.25 Z3.99 J353.12 F500.0
+G1 X-9.10 Y-47.05 Z3.99 J357.23 F500.0
+G1 X-12.21 Y-45.25 Z3.99 J360.75 F500.0
+G1 X-12.21 Y-41.05 Z3.99 J364.87 F500.0
+G1 X-11.10 Y-40.41 Z3.99 J366.13 F500.0
+G1 X-6.75 Y-40.41 Z3.99 J370.39 F500.0
+G1 X-5.63 Y-41.05 Z3.99 J371.65 F500.0
+G1 X-5.63 Y-45.25 Z3.99 J375.77 F500.0
+G1 X-8.75 Y-47.05 Z3.99 J379.30 F500.0
+G1 X-8.75 Y-51.25 Z3.99 J383.41 F500.0
+G1 X-5.63 Y-53.05 Z3.99 J386.94 F500.0
+G1 X-5.63 Y-57.25 Z3.99 J391.06 F500.0
+G1 X-8.75 Y-59.05 Z3.99 J394.59 F500.0
+G1 X-8.75 Y-63.25 Z3.99 J398.71 F500.0
+G1 X-5.63 Y-65.05 Z3.99 J402.24 F500.0
+G1 X-5.63 Y-69.25 Z3.99 J406.35 F500.0
+G1 X-8.75 Y-71.05 Z3.99 J409.88 F500.0
+G1 X-8.75 Y-72.53 Z3.99 J411.33 F500.0
+G1 X-2.17 Y-72.53 Z3.99 J417.78 F500.0
+G1 X-2.17 Y-71.05 Z3.99 J419.23 F500.0
+G1 X-5.28 Y-69.25 Z3.99 J422.75 F500.0
+G1 X-5.28 Y-65.05 Z3.99 J426.87 F500.0
+G1 X-2.17 Y-63.25 Z3.99 J430.39 F500.0
+G1 X-2.17 Y-59.05 Z3.99 J434.51 F500.0
+G1 X-5.28 Y-57.25 Z3.99 J438.03 F500.0
+G1 X-5.28 Y-53.05 Z3.99 J442.14 F500.0
+G1 X-2.17 Y-51.25 Z3.99 J445.67 F500.0
+G1 X-2.17 Y-47.05 Z3.99 J449.78 F500.0
+G1 X-5.28 Y-45.25 Z3.99 J453.30 F500.0
+G1 X-5.28 Y-41.05 Z3.99 J457.42 F500.0
+G1 X-4.17 Y-40.41 Z3.99 J458.67 F500.0
+G1 X0.18 Y-40.41 Z3.99 J462.94 F500.0
+G1 X1.30 Y-41.05 Z3.99 J464.20 F500.0
+G1 X1.30 Y-45.25 Z3.99 J468.32 F500.0
+G1 X-1.82 Y-47.05 Z3.99 J471.85 F500.0
+G1 X-1.82 Y-51.25 Z3.99 J475.96 F500.0
+G1 X1.30 Y-53.05 Z3.99 J479.49 F500.0
+G1 X1.30 Y-57.25 Z3.99 J483.61 F500.0
+G1 X-1.82 Y-59.05 Z3.99 J487.14 F500.0
+G1 X-1.82 Y-63.25 Z3.99 J491.26 F500.0
+G1 X1.30 Y-65.05 Z3.99 J494.79 F500.0
+G1 X1.30 Y-69.25 Z3.99 J498.90 F500.0
+G1 X-1.82 Y-71.05 Z3.99 J502.43 F500.0
+G1 X-1.82 Y-72.53 Z3.99 J503.88 F500.0
+G1 X4.76 Y-72.53 Z3.99 J510.33 F500.0
+G1 X4.76 Y-71.05 Z3.99 J511.78 F500.0
+G1 X1.64 Y-69.25 Z3.99 J515.31 F500.0
+G1 X1.64 Y-65.05 Z3.99 J519.43 F500.0
+G1 X4.76 Y-63.25 Z3.99 J522.96 F500.0
+G1 X4.76 Y-59.05 Z3.99 J527.07 F500.0
+G1 X1.64 Y-57.25 Z3.99 J530.60 F500.0
+G1 X1.64 Y-53.05 Z3.99 J534.72 F500.0
+G1 X4.76 Y-51.25 Z3.99 J538.25 F500.0
+G1 X4.76 Y-47.05 Z3.99 J542.36 F500.0
+G1 X1.64 Y-45.25 Z3.99 J545.89 F500.0
+G1 X1.64 Y-41.05 Z3.99 J550.01 F500.0
+G1 X2.76 Y-40.41 Z3.99 J551.27 F500.0
+G1 X7.11 Y-40.41 Z3.99 J555.54 F500.0
+G1 X8.22 Y-41.05 Z3.99 J556.79 F500.0
+G1 X8.22 Y-45.25 Z3.99 J560.91 F500.0
+G1 X5.11 Y-47.05 Z3.99 J564.43 F500.0
+G1 X5.11 Y-51.25 Z3.99 J568.55 F500.0
+G1 X8.22 Y-53.05 Z3.99 J572.07 F500.0
+G1 X8.22 Y-57.25 Z3.99 J576.18 F500.0
+G1 X5.11 Y-59.05 Z3.99 J579.71 F500.0
+G1 X5.11 Y-63.25 Z3.99 J583.82 F500.0
+G1 X8.22 Y-65.05 Z3.99 J587.34 F500.0
+G1 X8.22 Y-69.25 Z3.99 J591.46 F500.0
+G1 X5.11 Y-71.05 Z3.99 J594.98 F500.0
+G1 X5.11 Y-72.53 Z3.99 J596.43 F500.0
+G1 X11.69 Y-72.53 Z3.99 J602.88 F500.0
+G1 X11.69 Y-71.05 Z3.99 J604.33 F500.0
+G1 X8.57 Y-69.25 Z3.99 J607.86 F500.0
+G1 X8.57 Y-65.05 Z3.99 J611.98 F500.0
+G1 X11.69 Y-63.25 Z3.99 J615.51 F500.0
+G1 X11.69 Y-59.05 Z3.99 J619.62 F500.0
+G1 X8.57 Y-57.25 Z3.99 J623.15 F500.0
+G1 X8.57 Y-53.05 Z3.99 J627.27 F500.0
+G1 X11.69 Y-51.25 Z3.99 J630.80 F500.0
+G1 X11.69 Y-47.05 Z3.99 J634.91 F500.0
+G1 X8.57 Y-45.25 Z3.99 J638.44 F500.0
+G1 X8.57 Y-41.05 Z3.99 J642.56 F500.0
+G1 X9.69 Y-40.41 Z3.99 J643.82 F500.0
+G1 X14.04 Y-40.41 Z3.99 J648.09 F500.0
+G1 X15.15 Y-41.05 Z3.99 J649.34 F500.0
+G1 X15.15 Y-45.25 Z3.99 J653.46 F500.0
+G1 X12.03 Y-47.05 Z3.99 J656.99 F500.0
+G1 X12.03 Y-51.25 Z3.99 J661.10 F500.0
+G1 X15.15 Y-53.05 Z3.99 J664.63 F500.0
+G1 X15.15 Y-57.25 Z3.99 J668.75 F500.0
+G1 X12.03 Y-59.05 Z3.99 J672.28 F500.0
+G1 X12.03 Y-63.25 Z3.99 J676.40 F500.0
+G1 X15.15 Y-65.05 Z3.99 J679.93 F500.0
+G1 X15.15 Y-69.25 Z3.99 J684.04 F500.0
+G1 X12.03 Y-71.05 Z3.99 J687.57 F500.0
+G1 X12.03 Y-72.53 Z3.99 J689.02 F500.0
+G1 X18.62 Y-72.53 Z3.99 J695.48 F500.0
+G1 X18.62 Y-71.05 Z3.99 J696.93 F500.0
+G1 X15.50 Y-69.25 Z3.99 J700.46 F500.0
+G1 X15.50 Y-65.05 Z3.99 J704.58 F500.0
+G1 X18.62 Y-63.25 Z3.99 J708.11 F500.0
+G1 X18.62 Y-59.05 Z3.99 J712.22 F500.0
+G1 X15.50 Y-57.25 Z3.99 J715.75 F500.0
+G1 X15.50 Y-53.05 Z3.99 J719.87 F500.0
+G1 X18.62 Y-51.25 Z3.99 J723.40 F500.0
+G1 X18.62 Y-47.05 Z3.99 J727.52 F500.0
+G1 X15.50 Y-45.25 Z3.99 J731.05 F500.0
+G1 X15.50 Y-41.05 Z3.99 J735.16 F500.0
+G1 X16.62 Y-40.41 Z3.99 J736.43 F500.0
+G1 X20.97 Y-40.41 Z3.99 J740.69 F500.0
+G1 X22.08 Y-41.05 Z3.99 J741.94 F500.0
+G1 X22.08 Y-45.25 Z3.99 J746.06 F500.0
+G1 X18.96 Y-47.05 Z3.99 J749.59 F500.0
+G1 X18.96 Y-51.25 Z3.99 J753.71 F500.0
+G1 X22.08 Y-53.05 Z3.99 J757.24 F500.0
+G1 X22.08 Y-57.25 Z3.99 J761.35 F500.0
+G1 X18.96 Y-59.05 Z3.99 J764.88 F500.0
+G1 X18.96 Y-63.25 Z3.99 J769.00 F500.0
+G1 X22.08 Y-65.05 Z3.99 J772.53 F500.0
+G1 X22.08 Y-69.25 Z3.99 J776.64 F500.0
+G1 X18.96 Y-71.05 Z3.99 J780.17 F500.0
+G1 X18.96 Y-72.53 Z3.99 J781.62 F500.0
+G1 X25.54 Y-72.53 Z3.99 J788.07 F500.0
+G1 X25.54 Y-71.05 Z3.99 J789.52 F500.0
+G1 X22.43 Y-69.25 Z3.99 J793.04 F500.0
+G1 X22.43 Y-65.05 Z3.99 J797.16 F500.0
+G1 X25.54 Y-63.25 Z3.99 J800.68 F500.0
+G1 X25.54 Y-59.05 Z3.99 J804.80 F500.0
+G1 X22.43 Y-57.25 Z3.99 J808.32 F500.0
+G1 X22.43 Y-53.05 Z3.99 J812.44 F500.0
+G1 X25.54 Y-51.25 Z3.99 J815.96 F500.0
+G1 X25.54 Y-47.05 Z3.99 J820.07 F500.0
+G1 X22.43 Y-45.25 Z3.99 J823.59 F500.0
+G1 X22.43 Y-41.05 Z3.99 J827.71 F500.0
+G1 X23.54 Y-40.41 Z3.99 J828.97 F500.0
+G1 X27.89 Y-40.41 Z3.99 J833.23 F500.0
+G1 X29.01 Y-41.05 Z3.99 J834.49 F500.0
+G1 X29.01 Y-45.25 Z3.99 J838.61 F500.0
+G1 X25.89 Y-47.05 Z3.99 J842.14 F500.0
+G1 X25.89 Y-51.25 Z3.99 J846.26 F500.0
+G1 X29.01 Y-53.05 Z3.99 J849.79 F500.0
+G1 X29.01 Y-57.25 Z3.99 J853.90 F500.0
+G1 X25.89 Y-59.05 Z3.99 J857.43 F500.0
+G1 X25.89 Y-63.25 Z3.99 J861.55 F500.0
+G1 X29.01 Y-65.05 Z3.99 J865.08 F500.0
+G1 X29.01 Y-69.25 Z3.99 J869.19 F500.0
+G1 X25.89 Y-71.05 Z3.99 J872.72 F500.0
+G1 X25.89 Y-72.53 Z3.99 J874.17 F500.0
+G1 X32.47 Y-72.53 Z3.99 J880.62 F500.0
+G1 X32.47 Y-71.05 Z3.99 J882.07 F500.0
+G1 X29.36 Y-69.25 Z3.99 J885.59 F500.0
+G1 X29.36 Y-65.05 Z3.99 J889.71 F500.0
+G1 X32.47 Y-63.25 Z3.99 J893.23 F500.0
+G1 X32.47 Y-59.05 Z3.99 J897.35 F500.0
+G1 X29.36 Y-57.25 Z3.99 J900.87 F500.0
+G1 X29.36 Y-53.05 Z3.99 J904.98 F500.0
+G1 X32.47 Y-51.25 Z3.99 J908.51 F500.0
+G1 X32.47 Y-47.05 Z3.99 J912.62 F500.0
+G1 X29.36 Y-45.25 Z3.99 J916.14 F500.0
+G1 X29.36 Y-41.05 Z3.99 J920.26 F500.0
+G1 X30.47 Y-40.41 Z3.99 J921.52 F500.0
+G1 X34.82 Y-40.41 Z3.99 J925.78 F500.0
+G1 X35.94 Y-41.05 Z3.99 J927.04 F500.0
+G1 X35.94 Y-45.25 Z3.99 J931.16 F500.0
+G1 X32.82 Y-47.05 Z3.99 J934.69 F500.0
+G1 X32.82 Y-51.25 Z3.99 J938.80 F500.0
+G1 X35.94 Y-53.05 Z3.99 J942.33 F500.0
+G1 X35.94 Y-57.25 Z3.99 J946.45 F500.0
+G1 X32.82 Y-59.05 Z3.99 J949.98 F500.0
+G1 X32.82 Y-63.25 Z3.99 J954.10 F500.0
+G1 X35.94 Y-65.05 Z3.99 J957.63 F500.0
+G1 X35.94 Y-69.25 Z3.99 J961.74 F500.0
+G1 X32.82 Y-71.05 Z3.99 J965.27 F500.0
+G1 X32.82 Y-72.53 Z3.99 J966.72 F500.0
+G1 X39.10 Y-70.88 Z3.99 J973.09 F500.0
+G1 X36.28 Y-69.25 Z3.99 J976.28 F500.0
+G1 X36.28 Y-65.05 Z3.99 J980.39 F500.0
+G1 X39.10 Y-63.42 Z3.99 J983.59 F500.0
+G1 X39.10 Y-58.88 Z3.99 J988.04 F500.0
+G1 X36.28 Y-57.25 Z3.99 J991.23 F500.0
+G1 X36.28 Y-53.05 Z3.99 J995.34 F500.0
+G1 X39.10 Y-51.42 Z3.99 J998.54 F500.0
+G1 X39.10 Y-46.88 Z3.99 J1002.98 F500.0
+G1 X36.28 Y-45.25 Z3.99 J1006.18 F500.0
+G1 X36.28 Y-44.76 Z3.99 J1011.66 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X36.28 Y-41.05 Z3.99 J1011.66 F800.0
+G1 X37.40 Y-40.41 Z3.99 J1011.66 F800.0
+G1 X37.40 Y-40.41 Z13.99 J1011.66 F800.0
+G1 X10.13 Y-76.98 Z13.99 J1021.66 F800.0
+
+T1
+G1 X15.13 Y-71.98 Z4.99 J0.00 F300.0
+G1 X38.55 Y-71.98 Z4.99 J22.95 F300.0
+G1 X38.55 Y-48.18 Z4.99 J46.28 F300.0
+G1 X38.55 Y-40.96 Z4.99 J53.35 F300.0
+G1 X-9.05 Y-40.96 Z4.99 J100.00 F500.0
+G1 X-32.47 Y-40.96 Z4.99 J122.95 F500.0
+G1 X-32.47 Y-64.76 Z4.99 J146.27 F500.0
+G1 X-32.47 Y-71.98 Z4.99 J153.35 F500.0
+G1 X10.13 Y-71.98 Z4.99 J200.10 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X15.13 Y-71.98 Z4.99 J200.10 F800.0
+G1 X15.13 Y-71.98 Z14.99 J200.10 F800.0
+G1 X10.13 Y-76.98 Z14.99 J210.10 F800.0
+
+T1
+G1 X15.13 Y-71.98 Z4.99 J0.00 F300.0
+G1 X-29.88 Y-71.98 Z4.99 J44.11 F300.0
+G1 X-29.88 Y-71.05 Z4.99 J45.02 F300.0
+G1 X-32.47 Y-69.56 Z4.99 J47.95 F300.0
+G1 X-32.47 Y-64.75 Z4.99 J52.66 F500.0
+G1 X-29.88 Y-63.25 Z4.99 J55.59 F500.0
+G1 X-29.88 Y-59.05 Z4.99 J59.71 F500.0
+G1 X-32.47 Y-57.56 Z4.99 J62.64 F500.0
+G1 X-32.47 Y-52.75 Z4.99 J67.35 F500.0
+G1 X-29.88 Y-51.25 Z4.99 J70.29 F500.0
+G1 X-29.88 Y-47.05 Z4.99 J74.40 F500.0
+G1 X-32.47 Y-45.56 Z4.99 J77.33 F500.0
+G1 X-26.57 Y-40.96 Z4.99 J84.66 F500.0
+G1 X-26.42 Y-41.05 Z4.99 J84.83 F500.0
+G1 X-26.42 Y-45.25 Z4.99 J88.95 F500.0
+G1 X-29.53 Y-47.05 Z4.99 J92.47 F500.0
+G1 X-29.53 Y-51.25 Z4.99 J96.59 F500.0
+G1 X-26.42 Y-53.05 Z4.99 J100.11 F500.0
+G1 X-26.42 Y-57.25 Z4.99 J104.22 F500.0
+G1 X-29.53 Y-59.05 Z4.99 J107.75 F500.0
+G1 X-29.53 Y-63.25 Z4.99 J111.86 F500.0
+G1 X-26.42 Y-65.05 Z4.99 J115.38 F500.0
+G1 X-26.42 Y-69.25 Z4.99 J119.50 F500.0
+G1 X-29.53 Y-71.05 Z4.99 J123.02 F500.0
+G1 X-29.53 Y-71.98 Z4.99 J123.93 F500.0
+G1 X-22.95 Y-71.98 Z4.99 J130.38 F500.0
+G1 X-22.95 Y-71.05 Z4.99 J131.29 F500.0
+G1 X-26.07 Y-69.25 Z4.99 J134.82 F500.0
+G1 X-26.07 Y-65.05 Z4.99 J138.94 F500.0
+G1 X-22.95 Y-63.25 Z4.99 J142.47 F500.0
+G1 X-22.95 Y-59.05 Z4.99 J146.58 F500.0
+G1 X-26.07 Y-57.25 Z4.99 J150.11 F500.0
+G1 X-26.07 Y-53.05 Z4.99 J154.23 F500.0
+G1 X-22.95 Y-51.25 Z4.99 J157.76 F500.0
+G1 X-22.95 Y-47.05 Z4.99 J161.88 F500.0
+G1 X-26.07 Y-45.25 Z4.99 J165.41 F500.0
+G1 X-26.07 Y-41.05 Z4.99 J169.52 F500.0
+G1 X-25.91 Y-40.96 Z4.99 J169.70 F500.0
+G1 X-19.65 Y-40.96 Z4.99 J175.84 F500.0
+G1 X-19.49 Y-41.05 Z4.99 J176.02 F500.0
+G1 X-19.49 Y-45.25 Z4.99 J180.13 F500.0
+G1 X-22.61 Y-47.05 Z4.99 J183.66 F500.0
+G1 X-22.61 Y-51.25 Z4.99 J187.78 F500.0
+G1 X-19.49 Y-53.05 Z4.99 J191.31 F500.0
+G1 X-19.49 Y-57.25 Z4.99 J195.42 F500.0
+G1 X-22.61 Y-59.05 Z4.99 J198.95 F500.0
+G1 X-22.61 Y-63.25 Z4.99 J203.07 F500.0
+G1 X-19.49 Y-65.05 Z4.99 J206.60 F500.0
+G1 X-19.49 Y-69.25 Z4.99 J210.72 F500.0
+G1 X-22.61 Y-71.05 Z4.99 J214.25 F500.0
+G1 X-22.61 Y-71.98 Z4.99 J215.16 F500.0
+G1 X-16.02 Y-71.98 Z4.99 J221.62 F500.0
+G1 X-16.02 Y-71.05 Z4.99 J222.53 F500.0
+G1 X-19.14 Y-69.25 Z4.99 J226.06 F500.0
+G1 X-19.14 Y-65.05 Z4.99 J230.17 F500.0
+G1 X-16.02 Y-63.25 Z4.99 J233.70 F500.0
+G1 X-16.02 Y-59.05 Z4.99 J237.82 F500.0
+G1 X-19.14 Y-57.25 Z4.99 J241.35 F500.0
+G1 X-19.14 Y-53.05 Z4.99 J245.47 F500.0
+G1 X-16.02 Y-51.25 Z4.99 J248.99 F500.0
+G1 X-16.02 Y-47.05 Z4.99 J253.11 F500.0
+G1 X-19.14 Y-45.25 Z4.99 J256.64 F500.0
+G1 X-19.14 Y-41.05 Z4.99 J260.76 F500.0
+G1 X-18.98 Y-40.96 Z4.99 J260.94 F500.0
+G1 X-12.72 Y-40.96 Z4.99 J267.07 F500.0
+G1 X-12.56 Y-41.05 Z4.99 J267.25 F500.0
+G1 X-12.56 Y-45.25 Z4.99 J271.37 F500.0
+G1 X-15.68 Y-47.05 Z4.99 J274.90 F500.0
+G1 X-15.68 Y-51.25 Z4.99 J279.01 F500.0
+G1 X-12.56 Y-53.05 Z4.99 J282.54 F500.0
+G1 X-12.56 Y-57.25 Z4.99 J286.66 F500.0
+G1 X-15.68 Y-59.05 Z4.99 J290.19 F500.0
+G1 X-15.68 Y-63.25 Z4.99 J294.31 F500.0
+G1 X-12.56 Y-65.05 Z4.99 J297.84 F500.0
+G1 X-12.56 Y-69.25 Z4.99 J301.95 F500.0
+G1 X-15.68 Y-71.05 Z4.99 J305.48 F500.0
+G1 X-15.68 Y-71.98 Z4.99 J306.39 F500.0
+G1 X-9.10 Y-71.98 Z4.99 J312.84 F500.0
+G1 X-9.10 Y-71.05 Z4.99 J313.75 F500.0
+G1 X-12.21 Y-69.25 Z4.99 J317.27 F500.0
+G1 X-12.21 Y-65.05 Z4.99 J321.39 F500.0
+G1 X-9.10 Y-63.25 Z4.99 J324.91 F500.0
+G1 X-9.10 Y-59.05 Z4.99 J329.03 F500.0
+G1 X-12.21 Y-57.25 Z4.99 J332.55 F500.0
+G1 X-12.21 Y-53.05 Z4.99 J336.66 F500.0
+G1 X-9.10 Y-51.25 Z4.99 J340.19 F500.0
+G1 X-9.10 Y-47.05 Z4.99 J344.30 F500.0
+G1 X-12.21 Y-45.25 Z4.99 J347.82 F500.0
+G1 X-12.21 Y-41.05 Z4.99 J351.94 F500.0
+G1 X-12.06 Y-40.96 Z4.99 J352.11 F500.0
+G1 X-5.79 Y-40.96 Z4.99 J358.26 F500.0
+G1 X-5.63 Y-41.05 Z4.99 J358.44 F500.0
+G1 X-5.63 Y-45.25 Z4.99 J362.55 F500.0
+G1 X-8.75 Y-47.05 Z4.99 J366.08 F500.0
+G1 X-8.75 Y-51.25 Z4.99 J370.20 F500.0
+G1 X-5.63 Y-53.05 Z4.99 J373.73 F500.0
+G1 X-5.63 Y-57.25 Z4.99 J377.84 F500.0
+G1 X-8.75 Y-59.05 Z4.99 J381.37 F500.0
+G1 X-8.75 Y-63.25 Z4.99 J385.49 F500.0
+G1 X-5.63 Y-65.05 Z4.99 J389.02 F500.0
+G1 X-5.63 Y-69.25 Z4.99 J393.14 F500.0
+G1 X-8.75 Y-71.05 Z4.99 J396.67 F500.0
+G1 X-8.75 Y-71.98 Z4.99 J397.58 F500.0
+G1 X-2.17 Y-71.98 Z4.99 J404.03 F500.0
+G1 X-2.17 Y-71.05 Z4.99 J404.94 F500.0
+G1 X-5.28 Y-69.25 Z4.99 J408.46 F500.0
+G1 X-5.28 Y-65.05 Z4.99 J412.57 F500.0
+G1 X-2.17 Y-63.25 Z4.99 J416.10 F500.0
+G1 X-2.17 Y-59.05 Z4.99 J420.21 F500.0
+G1 X-5.28 Y-57.25 Z4.99 J423.73 F500.0
+G1 X-5.28 Y-53.05 Z4.99 J427.85 F500.0
+G1 X-2.17 Y-51.25 Z4.99 J431.37 F500.0
+G1 X-2.17 Y-47.05 Z4.99 J435.49 F500.0
+G1 X-5.28 Y-45.25 Z4.99 J439.01 F500.0
+G1 X-5.28 Y-41.05 Z4.99 J443.12 F500.0
+G1 X-5.13 Y-40.96 Z4.99 J443.30 F500.0
+G1 X1.14 Y-40.96 Z4.99 J449.44 F500.0
+G1 X1.30 Y-41.05 Z4.99 J449.62 F500.0
+G1 X1.30 Y-45.25 Z4.99 J453.74 F500.0
+G1 X-1.82 Y-47.05 Z4.99 J457.27 F500.0
+G1 X-1.82 Y-51.25 Z4.99 J461.38 F500.0
+G1 X1.30 Y-53.05 Z4.99 J464.91 F500.0
+G1 X1.30 Y-57.25 Z4.99 J469.03 F500.0
+G1 X-1.82 Y-59.05 Z4.99 J472.56 F500.0
+G1 X-1.82 Y-63.25 Z4.99 J476.67 F500.0
+G1 X1.30 Y-65.05 Z4.99 J480.20 F500.0
+G1 X1.30 Y-69.25 Z4.99 J484.32 F500.0
+G1 X-1.82 Y-71.05 Z4.99 J487.85 F500.0
+G1 X-1.82 Y-71.98 Z4.99 J488.76 F500.0
+G1 X4.76 Y-71.98 Z4.99 J495.21 F500.0
+G1 X4.76 Y-71.05 Z4.99 J496.12 F500.0
+G1 X1.64 Y-69.25 Z4.99 J499.65 F500.0
+G1 X1.64 Y-65.05 Z4.99 J503.77 F500.0
+G1 X4.76 Y-63.25 Z4.99 J507.30 F500.0
+G1 X4.76 Y-59.05 Z4.99 J511.41 F500.0
+G1 X1.64 Y-57.25 Z4.99 J514.94 F500.0
+G1 X1.64 Y-53.05 Z4.99 J519.06 F500.0
+G1 X4.76 Y-51.25 Z4.99 J522.59 F500.0
+G1 X4.76 Y-47.05 Z4.99 J526.70 F500.0
+G1 X1.64 Y-45.25 Z4.99 J530.23 F500.0
+G1 X1.64 Y-41.05 Z4.99 J534.35 F500.0
+G1 X1.80 Y-40.96 Z4.99 J534.53 F500.0
+G1 X8.07 Y-40.96 Z4.99 J540.68 F500.0
+G1 X8.22 Y-41.05 Z4.99 J540.85 F500.0
+G1 X8.22 Y-45.25 Z4.99 J544.96 F500.0
+G1 X5.11 Y-47.05 Z4.99 J548.48 F500.0
+G1 X5.11 Y-51.25 Z4.99 J552.60 F500.0
+G1 X8.22 Y-53.05 Z4.99 J556.12 F500.0
+G1 X8.22 Y-57.25 Z4.99 J560.24 F500.0
+G1 X5.11 Y-59.05 Z4.99 J563.76 F500.0
+G1 X5.11 Y-63.25 Z4.99 J567.88 F500.0
+G1 X8.22 Y-65.05 Z4.99 J571.40 F500.0
+G1 X8.22 Y-69.25 Z4.99 J575.51 F500.0
+G1 X5.11 Y-71.05 Z4.99 J579.03 F500.0
+G1 X5.11 Y-71.98 Z4.99 J579.95 F500.0
+G1 X11.69 Y-71.98 Z4.99 J586.39 F500.0
+G1 X11.69 Y-71.05 Z4.99 J587.31 F500.0
+G1 X8.57 Y-69.25 Z4.99 J590.84 F500.0
+G1 X8.57 Y-65.05 Z4.99 J594.95 F500.0
+G1 X11.69 Y-63.25 Z4.99 J598.48 F500.0
+G1 X11.69 Y-59.05 Z4.99 J602.60 F500.0
+G1 X8.57 Y-57.25 Z4.99 J606.13 F500.0
+G1 X8.57 Y-53.05 Z4.99 J610.24 F500.0
+G1 X11.69 Y-51.25 Z4.99 J613.77 F500.0
+G1 X11.69 Y-47.05 Z4.99 J617.89 F500.0
+G1 X8.57 Y-45.25 Z4.99 J621.42 F500.0
+G1 X8.57 Y-41.05 Z4.99 J625.54 F500.0
+G1 X8.73 Y-40.96 Z4.99 J625.72 F500.0
+G1 X15.00 Y-40.96 Z4.99 J631.86 F500.0
+G1 X15.15 Y-41.05 Z4.99 J632.03 F500.0
+G1 X15.15 Y-45.25 Z4.99 J636.15 F500.0
+G1 X12.03 Y-47.05 Z4.99 J639.68 F500.0
+G1 X12.03 Y-51.25 Z4.99 J643.79 F500.0
+G1 X15.15 Y-53.05 Z4.99 J647.32 F500.0
+G1 X15.15 Y-57.25 Z4.99 J651.44 F500.0
+G1 X12.03 Y-59.05 Z4.99 J654.97 F500.0
+G1 X12.03 Y-63.25 Z4.99 J659.09 F500.0
+G1 X15.15 Y-65.05 Z4.99 J662.62 F500.0
+G1 X15.15 Y-69.25 Z4.99 J666.73 F500.0
+G1 X12.03 Y-71.05 Z4.99 J670.26 F500.0
+G1 X12.03 Y-71.98 Z4.99 J671.17 F500.0
+G1 X18.62 Y-71.98 Z4.99 J677.63 F500.0
+G1 X18.62 Y-71.05 Z4.99 J678.54 F500.0
+G1 X15.50 Y-69.25 Z4.99 J682.07 F500.0
+G1 X15.50 Y-65.05 Z4.99 J686.19 F500.0
+G1 X18.62 Y-63.25 Z4.99 J689.72 F500.0
+G1 X18.62 Y-59.05 Z4.99 J693.83 F500.0
+G1 X15.50 Y-57.25 Z4.99 J697.36 F500.0
+G1 X15.50 Y-53.05 Z4.99 J701.48 F500.0
+G1 X18.62 Y-51.25 Z4.99 J705.01 F500.0
+G1 X18.62 Y-47.05 Z4.99 J709.13 F500.0
+G1 X15.50 Y-45.25 Z4.99 J712.66 F500.0
+G1 X15.50 Y-41.05 Z4.99 J716.77 F500.0
+G1 X15.66 Y-40.96 Z4.99 J716.95 F500.0
+G1 X21.92 Y-40.96 Z4.99 J723.09 F500.0
+G1 X22.08 Y-41.05 Z4.99 J723.27 F500.0
+G1 X22.08 Y-45.25 Z4.99 J727.38 F500.0
+G1 X18.96 Y-47.05 Z4.99 J730.91 F500.0
+G1 X18.96 Y-51.25 Z4.99 J735.03 F500.0
+G1 X22.08 Y-53.05 Z4.99 J738.56 F500.0
+G1 X22.08 Y-57.25 Z4.99 J742.67 F500.0
+G1 X18.96 Y-59.05 Z4.99 J746.20 F500.0
+G1 X18.96 Y-63.25 Z4.99 J750.32 F500.0
+G1 X22.08 Y-65.05 Z4.99 J753.85 F500.0
+G1 X22.08 Y-69.25 Z4.99 J757.97 F500.0
+G1 X18.96 Y-71.05 Z4.99 J761.50 F500.0
+G1 X18.96 Y-71.98 Z4.99 J762.41 F500.0
+G1 X25.54 Y-71.98 Z4.99 J768.86 F500.0
+G1 X25.54 Y-71.05 Z4.99 J769.77 F500.0
+G1 X22.43 Y-69.25 Z4.99 J773.29 F500.0
+G1 X22.43 Y-65.05 Z4.99 J777.40 F500.0
+G1 X25.54 Y-63.25 Z4.99 J780.93 F500.0
+G1 X25.54 Y-59.05 Z4.99 J785.04 F500.0
+G1 X22.43 Y-57.25 Z4.99 J788.56 F500.0
+G1 X22.43 Y-53.05 Z4.99 J792.68 F500.0
+G1 X25.54 Y-51.25 Z4.99 J796.20 F500.0
+G1 X25.54 Y-47.05 Z4.99 J800.32 F500.0
+G1 X22.43 Y-45.25 Z4.99 J803.84 F500.0
+G1 X22.43 Y-41.05 Z4.99 J807.95 F500.0
+G1 X22.59 Y-40.96 Z4.99 J808.13 F500.0
+G1 X28.85 Y-40.96 Z4.99 J814.27 F500.0
+G1 X29.01 Y-41.05 Z4.99 J814.45 F500.0
+G1 X29.01 Y-45.25 Z4.99 J818.57 F500.0
+G1 X25.89 Y-47.05 Z4.99 J822.10 F500.0
+G1 X25.89 Y-51.25 Z4.99 J826.21 F500.0
+G1 X29.01 Y-53.05 Z4.99 J829.74 F500.0
+G1 X29.01 Y-57.25 Z4.99 J833.86 F500.0
+G1 X25.89 Y-59.05 Z4.99 J837.39 F500.0
+G1 X25.89 Y-63.25 Z4.99 J841.50 F500.0
+G1 X29.01 Y-65.05 Z4.99 J845.03 F500.0
+G1 X29.01 Y-69.25 Z4.99 J849.15 F500.0
+G1 X25.89 Y-71.05 Z4.99 J852.68 F500.0
+G1 X25.89 Y-71.98 Z4.99 J853.59 F500.0
+G1 X32.47 Y-71.98 Z4.99 J860.04 F500.0
+G1 X32.47 Y-71.05 Z4.99 J860.95 F500.0
+G1 X29.36 Y-69.25 Z4.99 J864.47 F500.0
+G1 X29.36 Y-65.05 Z4.99 J868.59 F500.0
+G1 X32.47 Y-63.25 Z4.99 J872.11 F500.0
+G1 X32.47 Y-59.05 Z4.99 J876.23 F500.0
+G1 X29.36 Y-57.25 Z4.99 J879.75 F500.0
+G1 X29.36 Y-53.05 Z4.99 J883.86 F500.0
+G1 X32.47 Y-51.25 Z4.99 J887.38 F500.0
+G1 X32.47 Y-47.05 Z4.99 J891.50 F500.0
+G1 X29.36 Y-45.25 Z4.99 J895.02 F500.0
+G1 X29.36 Y-41.05 Z4.99 J899.14 F500.0
+G1 X29.51 Y-40.96 Z4.99 J899.31 F500.0
+G1 X35.78 Y-40.96 Z4.99 J905.45 F500.0
+G1 X35.94 Y-41.05 Z4.99 J905.63 F500.0
+G1 X35.94 Y-45.25 Z4.99 J909.75 F500.0
+G1 X32.82 Y-47.05 Z4.99 J913.28 F500.0
+G1 X32.82 Y-51.25 Z4.99 J917.40 F500.0
+G1 X35.94 Y-53.05 Z4.99 J920.93 F500.0
+G1 X35.94 Y-57.25 Z4.99 J925.04 F500.0
+G1 X32.82 Y-59.05 Z4.99 J928.57 F500.0
+G1 X32.82 Y-63.25 Z4.99 J932.69 F500.0
+G1 X35.94 Y-65.05 Z4.99 J936.22 F500.0
+G1 X35.94 Y-69.25 Z4.99 J940.33 F500.0
+G1 X32.82 Y-71.05 Z4.99 J943.86 F500.0
+G1 X32.82 Y-71.98 Z4.99 J944.77 F500.0
+G1 X38.55 Y-70.56 Z4.99 J950.56 F500.0
+G1 X36.28 Y-69.25 Z4.99 J953.13 F500.0
+G1 X36.28 Y-65.05 Z4.99 J957.24 F500.0
+G1 X38.55 Y-63.74 Z4.99 J959.81 F500.0
+G1 X38.55 Y-58.56 Z4.99 J964.89 F500.0
+G1 X36.28 Y-57.25 Z4.99 J967.46 F500.0
+G1 X36.28 Y-53.05 Z4.99 J971.57 F500.0
+G1 X38.55 Y-51.74 Z4.99 J974.14 F500.0
+G1 X38.55 Y-46.56 Z4.99 J979.22 F500.0
+G1 X36.81 Y-45.56 Z4.99 J986.19 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X36.28 Y-45.25 Z4.99 J986.19 F800.0
+G1 X36.28 Y-41.05 Z4.99 J986.19 F800.0
+G1 X36.44 Y-40.96 Z4.99 J986.19 F800.0
+G1 X36.44 Y-40.96 Z14.99 J986.19 F800.0
+G1 X6.68 Y-76.43 Z14.99 J996.19 F800.0
+
+T1
+G1 X11.68 Y-71.43 Z5.99 J0.00 F300.0
+G1 X38.00 Y-71.43 Z5.99 J25.79 F300.0
+G1 X38.00 Y-49.63 Z5.99 J47.16 F300.0
+G1 X38.00 Y-41.51 Z5.99 J55.12 F300.0
+G1 X-5.60 Y-41.51 Z5.99 J97.84 F500.0
+G1 X-31.92 Y-41.51 Z5.99 J123.64 F500.0
+G1 X-31.92 Y-63.31 Z5.99 J145.00 F500.0
+G1 X-31.92 Y-71.43 Z5.99 J152.96 F500.0
+G1 X6.68 Y-71.43 Z5.99 J195.79 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X11.68 Y-71.43 Z5.99 J195.79 F800.0
+G1 X11.68 Y-71.43 Z15.99 J195.79 F800.0
+G1 X6.68 Y-76.43 Z15.99 J205.79 F800.0
+
+T1
+G1 X11.68 Y-71.43 Z5.99 J0.00 F300.0
+G1 X-29.88 Y-71.43 Z5.99 J40.73 F300.0
+G1 X-29.88 Y-71.05 Z5.99 J41.10 F300.0
+G1 X-31.92 Y-69.88 Z5.99 J43.40 F300.0
+G1 X-31.92 Y-64.43 Z5.99 J48.74 F500.0
+G1 X-29.88 Y-63.25 Z5.99 J51.05 F500.0
+G1 X-29.88 Y-59.05 Z5.99 J55.17 F500.0
+G1 X-31.92 Y-57.88 Z5.99 J57.47 F500.0
+G1 X-31.92 Y-52.43 Z5.99 J62.81 F500.0
+G1 X-29.88 Y-51.25 Z5.99 J65.12 F500.0
+G1 X-29.88 Y-47.05 Z5.99 J69.24 F500.0
+G1 X-31.92 Y-45.88 Z5.99 J71.54 F500.0
+G1 X-26.42 Y-41.51 Z5.99 J78.43 F500.0
+G1 X-26.42 Y-45.25 Z5.99 J82.09 F500.0
+G1 X-29.53 Y-47.05 Z5.99 J85.62 F500.0
+G1 X-29.53 Y-51.25 Z5.99 J89.73 F500.0
+G1 X-26.42 Y-53.05 Z5.99 J93.25 F500.0
+G1 X-26.42 Y-57.25 Z5.99 J97.37 F500.0
+G1 X-29.53 Y-59.05 Z5.99 J100.89 F500.0
+G1 X-29.53 Y-63.25 Z5.99 J105.01 F500.0
+G1 X-26.42 Y-65.05 Z5.99 J108.53 F500.0
+G1 X-26.42 Y-69.25 Z5.99 J112.64 F500.0
+G1 X-29.53 Y-71.05 Z5.99 J116.17 F500.0
+G1 X-29.53 Y-71.43 Z5.99 J116.54 F500.0
+G1 X-22.95 Y-71.43 Z5.99 J122.99 F500.0
+G1 X-22.95 Y-71.05 Z5.99 J123.36 F500.0
+G1 X-26.07 Y-69.25 Z5.99 J126.89 F500.0
+G1 X-26.07 Y-65.05 Z5.99 J131.00 F500.0
+G1 X-22.95 Y-63.25 Z5.99 J134.53 F500.0
+G1 X-22.95 Y-59.05 Z5.99 J138.65 F500.0
+G1 X-26.07 Y-57.25 Z5.99 J142.18 F500.0
+G1 X-26.07 Y-53.05 Z5.99 J146.30 F500.0
+G1 X-22.95 Y-51.25 Z5.99 J149.83 F500.0
+G1 X-22.95 Y-47.05 Z5.99 J153.94 F500.0
+G1 X-26.07 Y-45.25 Z5.99 J157.47 F500.0
+G1 X-26.07 Y-41.51 Z5.99 J161.14 F500.0
+G1 X-19.49 Y-41.51 Z5.99 J167.59 F500.0
+G1 X-19.49 Y-45.25 Z5.99 J171.25 F500.0
+G1 X-22.61 Y-47.05 Z5.99 J174.78 F500.0
+G1 X-22.61 Y-51.25 Z5.99 J178.90 F500.0
+G1 X-19.49 Y-53.05 Z5.99 J182.43 F500.0
+G1 X-19.49 Y-57.25 Z5.99 J186.54 F500.0
+G1 X-22.61 Y-59.05 Z5.99 J190.07 F500.0
+G1 X-22.61 Y-63.25 Z5.99 J194.19 F500.0
+G1 X-19.49 Y-65.05 Z5.99 J197.72 F500.0
+G1 X-19.49 Y-69.25 Z5.99 J201.84 F500.0
+G1 X-22.61 Y-71.05 Z5.99 J205.37 F500.0
+G1 X-22.61 Y-71.43 Z5.99 J205.74 F500.0
+G1 X-16.02 Y-71.43 Z5.99 J212.20 F500.0
+G1 X-16.02 Y-71.05 Z5.99 J212.57 F500.0
+G1 X-19.14 Y-69.25 Z5.99 J216.10 F500.0
+G1 X-19.14 Y-65.05 Z5.99 J220.21 F500.0
+G1 X-16.02 Y-63.25 Z5.99 J223.74 F500.0
+G1 X-16.02 Y-59.05 Z5.99 J227.86 F500.0
+G1 X-19.14 Y-57.25 Z5.99 J231.39 F500.0
+G1 X-19.14 Y-53.05 Z5.99 J235.51 F500.0
+G1 X-16.02 Y-51.25 Z5.99 J239.04 F500.0
+G1 X-16.02 Y-47.05 Z5.99 J243.15 F500.0
+G1 X-19.14 Y-45.25 Z5.99 J246.68 F500.0
+G1 X-19.14 Y-41.51 Z5.99 J250.35 F500.0
+G1 X-12.56 Y-41.51 Z5.99 J256.80 F500.0
+G1 X-12.56 Y-45.25 Z5.99 J260.46 F500.0
+G1 X-15.68 Y-47.05 Z5.99 J263.99 F500.0
+G1 X-15.68 Y-51.25 Z5.99 J268.11 F500.0
+G1 X-12.56 Y-53.05 Z5.99 J271.64 F500.0
+G1 X-12.56 Y-57.25 Z5.99 J275.75 F500.0
+G1 X-15.68 Y-59.05 Z5.99 J279.28 F500.0
+G1 X-15.68 Y-63.25 Z5.99 J283.40 F500.0
+G1 X-12.56 Y-65.05 Z5.99 J286.93 F500.0
+G1 X-12.56 Y-69.25 Z5.99 J291.04 F500.0
+G1 X-15.68 Y-71.05 Z5.99 J294.57 F500.0
+G1 X-15.68 Y-71.43 Z5.99 J294.95 F500.0
+G1 X-9.10 Y-71.43 Z5.99 J301.40 F500.0
+G1 X-9.10 Y-71.05 Z5.99 J301.77 F500.0
+G1 X-12.21 Y-69.25 Z5.99 J305.29 F500.0
+G1 X-12.21 Y-65.05 Z5.99 J309.41 F500.0
+G1 X-9.10 Y-63.25 Z5.99 J312.93 F500.0
+G1 X-9.10 Y-59.05 Z5.99 J317.04 F500.0
+G1 X-12.21 Y-57.25 Z5.99 J320.56 F500.0
+G1 X-12.21 Y-53.05 Z5.99 J324.68 F500.0
+G1 X-9.10 Y-51.25 Z5.99 J328.20 F500.0
+G1 X-9.10 Y-47.05 Z5.99 J332.32 F500.0
+G1 X-12.21 Y-45.25 Z5.99 J335.84 F500.0
+G1 X-12.21 Y-41.51 Z5.99 J339.50 F500.0
+G1 X-5.63 Y-41.51 Z5.99 J345.95 F500.0
+G1 X-5.63 Y-45.25 Z5.99 J349.62 F500.0
+G1 X-8.75 Y-47.05 Z5.99 J353.15 F500.0
+G1 X-8.75 Y-51.25 Z5.99 J357.26 F500.0
+G1 X-5.63 Y-53.05 Z5.99 J360.79 F500.0
+G1 X-5.63 Y-57.25 Z5.99 J364.91 F500.0
+G1 X-8.75 Y-59.05 Z5.99 J368.44 F500.0
+G1 X-8.75 Y-63.25 Z5.99 J372.56 F500.0
+G1 X-5.63 Y-65.05 Z5.99 J376.09 F500.0
+G1 X-5.63 Y-69.25 Z5.99 J380.20 F500.0
+G1 X-8.75 Y-71.05 Z5.99 J383.73 F500.0
+G1 X-8.75 Y-71.43 Z5.99 J384.10 F500.0
+G1 X-2.17 Y-71.43 Z5.99 J390.55 F500.0
+G1 X-2.17 Y-71.05 Z5.99 J390.92 F500.0
+G1 X-5.28 Y-69.25 Z5.99 J394.45 F500.0
+G1 X-5.28 Y-65.05 Z5.99 J398.56 F500.0
+G1 X-2.17 Y-63.25 Z5.99 J402.08 F500.0
+G1 X-2.17 Y-59.05 Z5.99 J406.20 F500.0
+G1 X-5.28 Y-57.25 Z5.99 J409.72 F500.0
+G1 X-5.28 Y-53.05 Z5.99 J413.84 F500.0
+G1 X-2.17 Y-51.25 Z5.99 J417.36 F500.0
+G1 X-2.17 Y-47.05 Z5.99 J421.47 F500.0
+G1 X-5.28 Y-45.25 Z5.99 J425.00 F500.0
+G1 X-5.28 Y-41.51 Z5.99 J428.66 F500.0
+G1 X1.30 Y-41.51 Z5.99 J435.11 F500.0
+G1 X1.30 Y-45.25 Z5.99 J438.78 F500.0
+G1 X-1.82 Y-47.05 Z5.99 J442.31 F500.0
+G1 X-1.82 Y-51.25 Z5.99 J446.42 F500.0
+G1 X1.30 Y-53.05 Z5.99 J449.95 F500.0
+G1 X1.30 Y-57.25 Z5.99 J454.07 F500.0
+G1 X-1.82 Y-59.05 Z5.99 J457.60 F500.0
+G1 X-1.82 Y-63.25 Z5.99 J461.71 F500.0
+G1 X1.30 Y-65.05 Z5.99 J465.24 F500.0
+G1 X1.30 Y-69.25 Z5.99 J469.36 F500.0
+G1 X-1.82 Y-71.05 Z5.99 J472.89 F500.0
+G1 X-1.82 Y-71.43 Z5.99 J473.26 F500.0
+G1 X4.76 Y-71.43 Z5.99 J479.71 F500.0
+G1 X4.76 Y-71.05 Z5.99 J480.08 F500.0
+G1 X1.64 Y-69.25 Z5.99 J483.61 F500.0
+G1 X1.64 Y-65.05 Z5.99 J487.73 F500.0
+G1 X4.76 Y-63.25 Z5.99 J491.26 F500.0
+G1 X4.76 Y-59.05 Z5.99 J495.37 F500.0
+G1 X1.64 Y-57.25 Z5.99 J498.90 F500.0
+G1 X1.64 Y-53.05 Z5.99 J503.02 F500.0
+G1 X4.76 Y-51.25 Z5.99 J506.55 F500.0
+G1 X4.76 Y-47.05 Z5.99 J510.67 F500.0
+G1 X1.64 Y-45.25 Z5.99 J514.20 F500.0
+G1 X1.64 Y-41.51 Z5.99 J517.86 F500.0
+G1 X8.22 Y-41.51 Z5.99 J524.31 F500.0
+G1 X8.22 Y-45.25 Z5.99 J527.97 F500.0
+G1 X5.11 Y-47.05 Z5.99 J531.50 F500.0
+G1 X5.11 Y-51.25 Z5.99 J535.61 F500.0
+G1 X8.22 Y-53.05 Z5.99 J539.13 F500.0
+G1 X8.22 Y-57.25 Z5.99 J543.25 F500.0
+G1 X5.11 Y-59.05 Z5.99 J546.77 F500.0
+G1 X5.11 Y-63.25 Z5.99 J550.89 F500.0
+G1 X8.22 Y-65.05 Z5.99 J554.41 F500.0
+G1 X8.22 Y-69.25 Z5.99 J558.52 F500.0
+G1 X5.11 Y-71.05 Z5.99 J562.05 F500.0
+G1 X5.11 Y-71.43 Z5.99 J562.42 F500.0
+G1 X11.69 Y-71.43 Z5.99 J568.87 F500.0
+G1 X11.69 Y-71.05 Z5.99 J569.24 F500.0
+G1 X8.57 Y-69.25 Z5.99 J572.77 F500.0
+G1 X8.57 Y-65.05 Z5.99 J576.89 F500.0
+G1 X11.69 Y-63.25 Z5.99 J580.42 F500.0
+G1 X11.69 Y-59.05 Z5.99 J584.53 F500.0
+G1 X8.57 Y-57.25 Z5.99 J588.06 F500.0
+G1 X8.57 Y-53.05 Z5.99 J592.18 F500.0
+G1 X11.69 Y-51.25 Z5.99 J595.71 F500.0
+G1 X11.69 Y-47.05 Z5.99 J599.82 F500.0
+G1 X8.57 Y-45.25 Z5.99 J603.35 F500.0
+G1 X8.57 Y-41.51 Z5.99 J607.02 F500.0
+G1 X15.15 Y-41.51 Z5.99 J613.47 F500.0
+G1 X15.15 Y-45.25 Z5.99 J617.13 F500.0
+G1 X12.03 Y-47.05 Z5.99 J620.66 F500.0
+G1 X12.03 Y-51.25 Z5.99 J624.78 F500.0
+G1 X15.15 Y-53.05 Z5.99 J628.31 F500.0
+G1 X15.15 Y-57.25 Z5.99 J632.42 F500.0
+G1 X12.03 Y-59.05 Z5.99 J635.95 F500.0
+G1 X12.03 Y-63.25 Z5.99 J640.07 F500.0
+G1 X15.15 Y-65.05 Z5.99 J643.60 F500.0
+G1 X15.15 Y-69.25 Z5.99 J647.72 F500.0
+G1 X12.03 Y-71.05 Z5.99 J651.25 F500.0
+G1 X12.03 Y-71.43 Z5.99 J651.62 F500.0
+G1 X18.62 Y-71.43 Z5.99 J658.08 F500.0
+G1 X18.62 Y-71.05 Z5.99 J658.45 F500.0
+G1 X15.50 Y-69.25 Z5.99 J661.98 F500.0
+G1 X15.50 Y-65.05 Z5.99 J666.09 F500.0
+G1 X18.62 Y-63.25 Z5.99 J669.62 F500.0
+G1 X18.62 Y-59.05 Z5.99 J673.74 F500.0
+G1 X15.50 Y-57.25 Z5.99 J677.27 F500.0
+G1 X15.50 Y-53.05 Z5.99 J681.39 F500.0
+G1 X18.62 Y-51.25 Z5.99 J684.92 F500.0
+G1 X18.62 Y-47.05 Z5.99 J689.03 F500.0
+G1 X15.50 Y-45.25 Z5.99 J692.56 F500.0
+G1 X15.50 Y-41.51 Z5.99 J696.23 F500.0
+G1 X22.08 Y-41.51 Z5.99 J702.68 F500.0
+G1 X22.08 Y-45.25 Z5.99 J706.34 F500.0
+G1 X18.96 Y-47.05 Z5.99 J709.87 F500.0
+G1 X18.96 Y-51.25 Z5.99 J713.99 F500.0
+G1 X22.08 Y-53.05 Z5.99 J717.52 F500.0
+G1 X22.08 Y-57.25 Z5.99 J721.63 F500.0
+G1 X18.96 Y-59.05 Z5.99 J725.16 F500.0
+G1 X18.96 Y-63.25 Z5.99 J729.28 F500.0
+G1 X22.08 Y-65.05 Z5.99 J732.81 F500.0
+G1 X22.08 Y-69.25 Z5.99 J736.93 F500.0
+G1 X18.96 Y-71.05 Z5.99 J740.46 F500.0
+G1 X18.96 Y-71.43 Z5.99 J740.83 F500.0
+G1 X25.54 Y-71.43 Z5.99 J747.28 F500.0
+G1 X25.54 Y-71.05 Z5.99 J747.65 F500.0
+G1 X22.43 Y-69.25 Z5.99 J751.17 F500.0
+G1 X22.43 Y-65.05 Z5.99 J755.29 F500.0
+G1 X25.54 Y-63.25 Z5.99 J758.81 F500.0
+G1 X25.54 Y-59.05 Z5.99 J762.92 F500.0
+G1 X22.43 Y-57.25 Z5.99 J766.44 F500.0
+G1 X22.43 Y-53.05 Z5.99 J770.56 F500.0
+G1 X25.54 Y-51.25 Z5.99 J774.08 F500.0
+G1 X25.54 Y-47.05 Z5.99 J778.20 F500.0
+G1 X22.43 Y-45.25 Z5.99 J781.72 F500.0
+G1 X22.43 Y-41.51 Z5.99 J785.38 F500.0
+G1 X29.01 Y-41.51 Z5.99 J791.83 F500.0
+G1 X29.01 Y-45.25 Z5.99 J795.50 F500.0
+G1 X25.89 Y-47.05 Z5.99 J799.03 F500.0
+G1 X25.89 Y-51.25 Z5.99 J803.14 F500.0
+G1 X29.01 Y-53.05 Z5.99 J806.67 F500.0
+G1 X29.01 Y-57.25 Z5.99 J810.79 F500.0
+G1 X25.89 Y-59.05 Z5.99 J814.32 F500.0
+G1 X25.89 Y-63.25 Z5.99 J818.44 F500.0
+G1 X29.01 Y-65.05 Z5.99 J821.97 F500.0
+G1 X29.01 Y-69.25 Z5.99 J826.08 F500.0
+G1 X25.89 Y-71.05 Z5.99 J829.61 F500.0
+G1 X25.89 Y-71.43 Z5.99 J829.98 F500.0
+G1 X32.47 Y-71.43 Z5.99 J836.43 F500.0
+G1 X32.47 Y-71.05 Z5.99 J836.81 F500.0
+G1 X29.36 Y-69.25 Z5.99 J840.33 F500.0
+G1 X29.36 Y-65.05 Z5.99 J844.44 F500.0
+G1 X32.47 Y-63.25 Z5.99 J847.96 F500.0
+G1 X32.47 Y-59.05 Z5.99 J852.08 F500.0
+G1 X29.36 Y-57.25 Z5.99 J855.60 F500.0
+G1 X29.36 Y-53.05 Z5.99 J859.72 F500.0
+G1 X32.47 Y-51.25 Z5.99 J863.24 F500.0
+G1 X32.47 Y-47.05 Z5.99 J867.36 F500.0
+G1 X29.36 Y-45.25 Z5.99 J870.88 F500.0
+G1 X29.36 Y-41.51 Z5.99 J874.54 F500.0
+G1 X35.94 Y-41.51 Z5.99 J880.99 F500.0
+G1 X35.94 Y-45.25 Z5.99 J884.66 F500.0
+G1 X32.82 Y-47.05 Z5.99 J888.19 F500.0
+G1 X32.82 Y-51.25 Z5.99 J892.30 F500.0
+G1 X35.94 Y-53.05 Z5.99 J895.83 F500.0
+G1 X35.94 Y-57.25 Z5.99 J899.95 F500.0
+G1 X32.82 Y-59.05 Z5.99 J903.48 F500.0
+G1 X32.82 Y-63.25 Z5.99 J907.59 F500.0
+G1 X35.94 Y-65.05 Z5.99 J911.12 F500.0
+G1 X35.94 Y-69.25 Z5.99 J915.24 F500.0
+G1 X32.82 Y-71.05 Z5.99 J918.77 F500.0
+G1 X32.82 Y-71.43 Z5.99 J919.14 F500.0
+G1 X38.00 Y-70.24 Z5.99 J924.35 F500.0
+G1 X36.28 Y-69.25 Z5.99 J926.30 F500.0
+G1 X36.28 Y-65.05 Z5.99 J930.41 F500.0
+G1 X38.00 Y-64.06 Z5.99 J932.36 F500.0
+G1 X38.00 Y-58.24 Z5.99 J938.06 F500.0
+G1 X36.28 Y-57.25 Z5.99 J940.00 F500.0
+G1 X36.28 Y-53.05 Z5.99 J944.12 F500.0
+G1 X38.00 Y-52.06 Z5.99 J946.07 F500.0
+G1 X38.00 Y-46.24 Z5.99 J951.77 F500.0
+G1 X37.37 Y-45.88 Z5.99 J957.48 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X36.28 Y-45.25 Z5.99 J957.48 F800.0
+G1 X36.28 Y-41.51 Z5.99 J957.48 F800.0
+G1 X36.28 Y-41.51 Z15.99 J957.48 F800.0
+G1 X3.24 Y-75.87 Z15.99 J967.48 F800.0
+
+T1
+G1 X8.24 Y-70.87 Z6.99 J0.00 F300.0
+G1 X37.44 Y-70.87 Z6.99 J28.62 F300.0
+G1 X37.44 Y-51.07 Z6.99 J48.02 F300.0
+G1 X37.44 Y-42.07 Z6.99 J56.84 F300.0
+G1 X-2.16 Y-42.07 Z6.99 J95.65 F500.0
+G1 X-31.36 Y-42.07 Z6.99 J124.26 F500.0
+G1 X-31.36 Y-61.87 Z6.99 J143.67 F500.0
+G1 X-31.36 Y-70.87 Z6.99 J152.49 F500.0
+G1 X3.24 Y-70.87 Z6.99 J191.40 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X8.24 Y-70.87 Z6.99 J191.40 F800.0
+G1 X8.24 Y-70.87 Z16.99 J191.40 F800.0
+G1 X3.24 Y-75.87 Z16.99 J201.40 F800.0
+
+T1
+G1 X8.24 Y-70.87 Z6.99 J0.00 F300.0
+G1 X-30.19 Y-70.87 Z6.99 J37.66 F300.0
+G1 X-31.36 Y-70.20 Z6.99 J38.98 F300.0
+G1 X-31.36 Y-64.11 Z6.99 J44.95 F300.0
+G1 X-29.88 Y-63.25 Z6.99 J46.62 F500.0
+G1 X-29.88 Y-59.05 Z6.99 J50.74 F500.0
+G1 X-31.36 Y-58.20 Z6.99 J52.41 F500.0
+G1 X-31.36 Y-52.11 Z6.99 J58.38 F500.0
+G1 X-29.88 Y-51.25 Z6.99 J60.06 F500.0
+G1 X-29.88 Y-47.05 Z6.99 J64.17 F500.0
+G1 X-31.36 Y-46.20 Z6.99 J65.85 F500.0
+G1 X-26.42 Y-42.07 Z6.99 J72.16 F500.0
+G1 X-26.42 Y-45.25 Z6.99 J75.27 F500.0
+G1 X-29.53 Y-47.05 Z6.99 J78.80 F500.0
+G1 X-29.53 Y-51.25 Z6.99 J82.91 F500.0
+G1 X-26.42 Y-53.05 Z6.99 J86.43 F500.0
+G1 X-26.42 Y-57.25 Z6.99 J90.55 F500.0
+G1 X-29.53 Y-59.05 Z6.99 J94.07 F500.0
+G1 X-29.53 Y-63.25 Z6.99 J98.19 F500.0
+G1 X-26.42 Y-65.05 Z6.99 J101.71 F500.0
+G1 X-26.42 Y-69.25 Z6.99 J105.82 F500.0
+G1 X-29.22 Y-70.87 Z6.99 J108.99 F500.0
+G1 X-23.26 Y-70.87 Z6.99 J114.83 F500.0
+G1 X-26.07 Y-69.25 Z6.99 J118.01 F500.0
+G1 X-26.07 Y-65.05 Z6.99 J122.13 F500.0
+G1 X-22.95 Y-63.25 Z6.99 J125.66 F500.0
+G1 X-22.95 Y-59.05 Z6.99 J129.78 F500.0
+G1 X-26.07 Y-57.25 Z6.99 J133.31 F500.0
+G1 X-26.07 Y-53.05 Z6.99 J137.42 F500.0
+G1 X-22.95 Y-51.25 Z6.99 J140.95 F500.0
+G1 X-22.95 Y-47.05 Z6.99 J145.07 F500.0
+G1 X-26.07 Y-45.25 Z6.99 J148.60 F500.0
+G1 X-26.07 Y-42.07 Z6.99 J151.71 F500.0
+G1 X-19.49 Y-42.07 Z6.99 J158.16 F500.0
+G1 X-19.49 Y-45.25 Z6.99 J161.28 F500.0
+G1 X-22.61 Y-47.05 Z6.99 J164.81 F500.0
+G1 X-22.61 Y-51.25 Z6.99 J168.92 F500.0
+G1 X-19.49 Y-53.05 Z6.99 J172.45 F500.0
+G1 X-19.49 Y-57.25 Z6.99 J176.57 F500.0
+G1 X-22.61 Y-59.05 Z6.99 J180.10 F500.0
+G1 X-22.61 Y-63.25 Z6.99 J184.22 F500.0
+G1 X-19.49 Y-65.05 Z6.99 J187.75 F500.0
+G1 X-19.49 Y-69.25 Z6.99 J191.86 F500.0
+G1 X-22.29 Y-70.87 Z6.99 J195.03 F500.0
+G1 X-16.34 Y-70.87 Z6.99 J200.86 F500.0
+G1 X-19.14 Y-69.25 Z6.99 J204.03 F500.0
+G1 X-19.14 Y-65.05 Z6.99 J208.15 F500.0
+G1 X-16.02 Y-63.25 Z6.99 J211.68 F500.0
+G1 X-16.02 Y-59.05 Z6.99 J215.80 F500.0
+G1 X-19.14 Y-57.25 Z6.99 J219.33 F500.0
+G1 X-19.14 Y-53.05 Z6.99 J223.44 F500.0
+G1 X-16.02 Y-51.25 Z6.99 J226.97 F500.0
+G1 X-16.02 Y-47.05 Z6.99 J231.09 F500.0
+G1 X-19.14 Y-45.25 Z6.99 J234.62 F500.0
+G1 X-19.14 Y-42.07 Z6.99 J237.73 F500.0
+G1 X-12.56 Y-42.07 Z6.99 J244.18 F500.0
+G1 X-12.56 Y-45.25 Z6.99 J247.30 F500.0
+G1 X-15.68 Y-47.05 Z6.99 J250.83 F500.0
+G1 X-15.68 Y-51.25 Z6.99 J254.94 F500.0
+G1 X-12.56 Y-53.05 Z6.99 J258.47 F500.0
+G1 X-12.56 Y-57.25 Z6.99 J262.59 F500.0
+G1 X-15.68 Y-59.05 Z6.99 J266.12 F500.0
+G1 X-15.68 Y-63.25 Z6.99 J270.24 F500.0
+G1 X-12.56 Y-65.05 Z6.99 J273.77 F500.0
+G1 X-12.56 Y-69.25 Z6.99 J277.88 F500.0
+G1 X-15.37 Y-70.87 Z6.99 J281.06 F500.0
+G1 X-9.41 Y-70.87 Z6.99 J286.90 F500.0
+G1 X-12.21 Y-69.25 Z6.99 J290.07 F500.0
+G1 X-12.21 Y-65.05 Z6.99 J294.19 F500.0
+G1 X-9.10 Y-63.25 Z6.99 J297.71 F500.0
+G1 X-9.10 Y-59.05 Z6.99 J301.83 F500.0
+G1 X-12.21 Y-57.25 Z6.99 J305.35 F500.0
+G1 X-12.21 Y-53.05 Z6.99 J309.46 F500.0
+G1 X-9.10 Y-51.25 Z6.99 J312.98 F500.0
+G1 X-9.10 Y-47.05 Z6.99 J317.10 F500.0
+G1 X-12.21 Y-45.25 Z6.99 J320.62 F500.0
+G1 X-12.21 Y-42.07 Z6.99 J323.74 F500.0
+G1 X-5.63 Y-42.07 Z6.99 J330.19 F500.0
+G1 X-5.63 Y-45.25 Z6.99 J333.30 F500.0
+G1 X-8.75 Y-47.05 Z6.99 J336.83 F500.0
+G1 X-8.75 Y-51.25 Z6.99 J340.95 F500.0
+G1 X-5.63 Y-53.05 Z6.99 J344.48 F500.0
+G1 X-5.63 Y-57.25 Z6.99 J348.60 F500.0
+G1 X-8.75 Y-59.05 Z6.99 J352.13 F500.0
+G1 X-8.75 Y-63.25 Z6.99 J356.24 F500.0
+G1 X-5.63 Y-65.05 Z6.99 J359.77 F500.0
+G1 X-5.63 Y-69.25 Z6.99 J363.89 F500.0
+G1 X-8.44 Y-70.87 Z6.99 J367.07 F500.0
+G1 X-2.48 Y-70.87 Z6.99 J372.91 F500.0
+G1 X-5.28 Y-69.25 Z6.99 J376.08 F500.0
+G1 X-5.28 Y-65.05 Z6.99 J380.19 F500.0
+G1 X-2.17 Y-63.25 Z6.99 J383.71 F500.0
+G1 X-2.17 Y-59.05 Z6.99 J387.83 F500.0
+G1 X-5.28 Y-57.25 Z6.99 J391.35 F500.0
+G1 X-5.28 Y-53.05 Z6.99 J395.47 F500.0
+G1 X-2.17 Y-51.25 Z6.99 J398.99 F500.0
+G1 X-2.17 Y-47.05 Z6.99 J403.11 F500.0
+G1 X-5.28 Y-45.25 Z6.99 J406.63 F500.0
+G1 X-5.28 Y-42.07 Z6.99 J409.74 F500.0
+G1 X1.30 Y-42.07 Z6.99 J416.19 F500.0
+G1 X1.30 Y-45.25 Z6.99 J419.31 F500.0
+G1 X-1.82 Y-47.05 Z6.99 J422.84 F500.0
+G1 X-1.82 Y-51.25 Z6.99 J426.95 F500.0
+G1 X1.30 Y-53.05 Z6.99 J430.48 F500.0
+G1 X1.30 Y-57.25 Z6.99 J434.60 F500.0
+G1 X-1.82 Y-59.05 Z6.99 J438.13 F500.0
+G1 X-1.82 Y-63.25 Z6.99 J442.25 F500.0
+G1 X1.30 Y-65.05 Z6.99 J445.78 F500.0
+G1 X1.30 Y-69.25 Z6.99 J449.89 F500.0
+G1 X-1.51 Y-70.87 Z6.99 J453.07 F500.0
+G1 X4.45 Y-70.87 Z6.99 J458.91 F500.0
+G1 X1.64 Y-69.25 Z6.99 J462.09 F500.0
+G1 X1.64 Y-65.05 Z6.99 J466.21 F500.0
+G1 X4.76 Y-63.25 Z6.99 J469.74 F500.0
+G1 X4.76 Y-59.05 Z6.99 J473.85 F500.0
+G1 X1.64 Y-57.25 Z6.99 J477.38 F500.0
+G1 X1.64 Y-53.05 Z6.99 J481.50 F500.0
+G1 X4.76 Y-51.25 Z6.99 J485.03 F500.0
+G1 X4.76 Y-47.05 Z6.99 J489.14 F500.0
+G1 X1.64 Y-45.25 Z6.99 J492.67 F500.0
+G1 X1.64 Y-42.07 Z6.99 J495.79 F500.0
+G1 X8.22 Y-42.07 Z6.99 J502.24 F500.0
+G1 X8.22 Y-45.25 Z6.99 J505.35 F500.0
+G1 X5.11 Y-47.05 Z6.99 J508.88 F500.0
+G1 X5.11 Y-51.25 Z6.99 J512.99 F500.0
+G1 X8.22 Y-53.05 Z6.99 J516.51 F500.0
+G1 X8.22 Y-57.25 Z6.99 J520.63 F500.0
+G1 X5.11 Y-59.05 Z6.99 J524.15 F500.0
+G1 X5.11 Y-63.25 Z6.99 J528.27 F500.0
+G1 X8.22 Y-65.05 Z6.99 J531.79 F500.0
+G1 X8.22 Y-69.25 Z6.99 J535.90 F500.0
+G1 X5.42 Y-70.87 Z6.99 J539.07 F500.0
+G1 X11.38 Y-70.87 Z6.99 J544.92 F500.0
+G1 X8.57 Y-69.25 Z6.99 J548.09 F500.0
+G1 X8.57 Y-65.05 Z6.99 J552.21 F500.0
+G1 X11.69 Y-63.25 Z6.99 J555.74 F500.0
+G1 X11.69 Y-59.05 Z6.99 J559.86 F500.0
+G1 X8.57 Y-57.25 Z6.99 J563.39 F500.0
+G1 X8.57 Y-53.05 Z6.99 J567.50 F500.0
+G1 X11.69 Y-51.25 Z6.99 J571.03 F500.0
+G1 X11.69 Y-47.05 Z6.99 J575.15 F500.0
+G1 X8.57 Y-45.25 Z6.99 J578.68 F500.0
+G1 X8.57 Y-42.07 Z6.99 J581.79 F500.0
+G1 X15.15 Y-42.07 Z6.99 J588.24 F500.0
+G1 X15.15 Y-45.25 Z6.99 J591.36 F500.0
+G1 X12.03 Y-47.05 Z6.99 J594.89 F500.0
+G1 X12.03 Y-51.25 Z6.99 J599.01 F500.0
+G1 X15.15 Y-53.05 Z6.99 J602.54 F500.0
+G1 X15.15 Y-57.25 Z6.99 J606.65 F500.0
+G1 X12.03 Y-59.05 Z6.99 J610.18 F500.0
+G1 X12.03 Y-63.25 Z6.99 J614.30 F500.0
+G1 X15.15 Y-65.05 Z6.99 J617.83 F500.0
+G1 X15.15 Y-69.25 Z6.99 J621.94 F500.0
+G1 X12.35 Y-70.87 Z6.99 J625.11 F500.0
+G1 X18.31 Y-70.87 Z6.99 J630.95 F500.0
+G1 X15.50 Y-69.25 Z6.99 J634.13 F500.0
+G1 X15.50 Y-65.05 Z6.99 J638.25 F500.0
+G1 X18.62 Y-63.25 Z6.99 J641.78 F500.0
+G1 X18.62 Y-59.05 Z6.99 J645.89 F500.0
+G1 X15.50 Y-57.25 Z6.99 J649.42 F500.0
+G1 X15.50 Y-53.05 Z6.99 J653.54 F500.0
+G1 X18.62 Y-51.25 Z6.99 J657.07 F500.0
+G1 X18.62 Y-47.05 Z6.99 J661.19 F500.0
+G1 X15.50 Y-45.25 Z6.99 J664.72 F500.0
+G1 X15.50 Y-42.07 Z6.99 J667.83 F500.0
+G1 X22.08 Y-42.07 Z6.99 J674.28 F500.0
+G1 X22.08 Y-45.25 Z6.99 J677.40 F500.0
+G1 X18.96 Y-47.05 Z6.99 J680.93 F500.0
+G1 X18.96 Y-51.25 Z6.99 J685.04 F500.0
+G1 X22.08 Y-53.05 Z6.99 J688.57 F500.0
+G1 X22.08 Y-57.25 Z6.99 J692.69 F500.0
+G1 X18.96 Y-59.05 Z6.99 J696.22 F500.0
+G1 X18.96 Y-63.25 Z6.99 J700.34 F500.0
+G1 X22.08 Y-65.05 Z6.99 J703.87 F500.0
+G1 X22.08 Y-69.25 Z6.99 J707.98 F500.0
+G1 X19.28 Y-70.87 Z6.99 J711.15 F500.0
+G1 X25.23 Y-70.87 Z6.99 J716.98 F500.0
+G1 X22.43 Y-69.25 Z6.99 J720.15 F500.0
+G1 X22.43 Y-65.05 Z6.99 J724.27 F500.0
+G1 X25.54 Y-63.25 Z6.99 J727.79 F500.0
+G1 X25.54 Y-59.05 Z6.99 J731.91 F500.0
+G1 X22.43 Y-57.25 Z6.99 J735.43 F500.0
+G1 X22.43 Y-53.05 Z6.99 J739.54 F500.0
+G1 X25.54 Y-51.25 Z6.99 J743.07 F500.0
+G1 X25.54 Y-47.05 Z6.99 J747.18 F500.0
+G1 X22.43 Y-45.25 Z6.99 J750.70 F500.0
+G1 X22.43 Y-42.07 Z6.99 J753.82 F500.0
+G1 X29.01 Y-42.07 Z6.99 J760.27 F500.0
+G1 X29.01 Y-45.25 Z6.99 J763.38 F500.0
+G1 X25.89 Y-47.05 Z6.99 J766.91 F500.0
+G1 X25.89 Y-51.25 Z6.99 J771.03 F500.0
+G1 X29.01 Y-53.05 Z6.99 J774.56 F500.0
+G1 X29.01 Y-57.25 Z6.99 J778.68 F500.0
+G1 X25.89 Y-59.05 Z6.99 J782.21 F500.0
+G1 X25.89 Y-63.25 Z6.99 J786.32 F500.0
+G1 X29.01 Y-65.05 Z6.99 J789.85 F500.0
+G1 X29.01 Y-69.25 Z6.99 J793.97 F500.0
+G1 X26.20 Y-70.87 Z6.99 J797.15 F500.0
+G1 X32.16 Y-70.87 Z6.99 J802.99 F500.0
+G1 X29.36 Y-69.25 Z6.99 J806.16 F500.0
+G1 X29.36 Y-65.05 Z6.99 J810.27 F500.0
+G1 X32.47 Y-63.25 Z6.99 J813.80 F500.0
+G1 X32.47 Y-59.05 Z6.99 J817.91 F500.0
+G1 X29.36 Y-57.25 Z6.99 J821.43 F500.0
+G1 X29.36 Y-53.05 Z6.99 J825.55 F500.0
+G1 X32.47 Y-51.25 Z6.99 J829.07 F500.0
+G1 X32.47 Y-47.05 Z6.99 J833.19 F500.0
+G1 X29.36 Y-45.25 Z6.99 J836.71 F500.0
+G1 X29.36 Y-42.07 Z6.99 J839.82 F500.0
+G1 X35.94 Y-42.07 Z6.99 J846.27 F500.0
+G1 X35.94 Y-45.25 Z6.99 J849.39 F500.0
+G1 X32.82 Y-47.05 Z6.99 J852.92 F500.0
+G1 X32.82 Y-51.25 Z6.99 J857.03 F500.0
+G1 X35.94 Y-53.05 Z6.99 J860.56 F500.0
+G1 X35.94 Y-57.25 Z6.99 J864.68 F500.0
+G1 X32.82 Y-59.05 Z6.99 J868.21 F500.0
+G1 X32.82 Y-63.25 Z6.99 J872.33 F500.0
+G1 X35.94 Y-65.05 Z6.99 J875.86 F500.0
+G1 X35.94 Y-69.25 Z6.99 J879.97 F500.0
+G1 X33.13 Y-70.87 Z6.99 J883.15 F500.0
+G1 X37.44 Y-69.92 Z6.99 J887.48 F500.0
+G1 X36.28 Y-69.25 Z6.99 J888.79 F500.0
+G1 X36.28 Y-65.05 Z6.99 J892.91 F500.0
+G1 X37.44 Y-64.38 Z6.99 J894.22 F500.0
+G1 X37.44 Y-57.92 Z6.99 J900.55 F500.0
+G1 X36.28 Y-57.25 Z6.99 J901.86 F500.0
+G1 X36.28 Y-53.05 Z6.99 J905.98 F500.0
+G1 X37.44 Y-52.38 Z6.99 J907.29 F500.0
+G1 X37.44 Y-46.40 Z6.99 J918.15 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X37.44 Y-45.92 Z6.99 J918.15 F800.0
+G1 X36.28 Y-45.25 Z6.99 J918.15 F800.0
+G1 X36.28 Y-42.07 Z6.99 J918.15 F800.0
+G1 X36.28 Y-42.07 Z16.99 J918.15 F800.0
+G1 X-0.21 Y-75.32 Z16.99 J928.15 F800.0
+
+T1
+G1 X4.79 Y-70.32 Z7.99 J0.00 F300.0
+G1 X36.89 Y-70.32 Z7.99 J31.46 F300.0
+G1 X36.89 Y-52.52 Z7.99 J48.90 F300.0
+G1 X36.89 Y-42.62 Z7.99 J58.60 F300.0
+G1 X1.29 Y-42.62 Z7.99 J93.49 F500.0
+G1 X-30.81 Y-42.62 Z7.99 J124.95 F500.0
+G1 X-30.81 Y-60.42 Z7.99 J142.39 F500.0
+G1 X-30.81 Y-70.32 Z7.99 J152.10 F500.0
+G1 X-0.21 Y-70.32 Z7.99 J187.08 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X4.79 Y-70.32 Z7.99 J187.08 F800.0
+G1 X4.79 Y-70.32 Z17.99 J187.08 F800.0
+G1 X-0.21 Y-75.32 Z17.99 J197.08 F800.0
+
+T1
+G1 X4.79 Y-70.32 Z7.99 J0.00 F300.0
+G1 X-30.81 Y-63.79 Z7.99 J35.47 F300.0
+G1 X-29.88 Y-63.25 Z7.99 J36.53 F300.0
+G1 X-29.88 Y-59.05 Z7.99 J40.64 F300.0
+G1 X-30.81 Y-58.52 Z7.99 J41.69 F500.0
+G1 X-30.81 Y-51.79 Z7.99 J48.29 F500.0
+G1 X-29.88 Y-51.25 Z7.99 J49.34 F500.0
+G1 X-29.88 Y-47.05 Z7.99 J53.46 F500.0
+G1 X-30.81 Y-46.52 Z7.99 J54.51 F500.0
+G1 X-26.42 Y-42.62 Z7.99 J60.26 F500.0
+G1 X-26.42 Y-45.25 Z7.99 J62.84 F500.0
+G1 X-29.53 Y-47.05 Z7.99 J66.36 F500.0
+G1 X-29.53 Y-51.25 Z7.99 J70.48 F500.0
+G1 X-26.42 Y-53.05 Z7.99 J74.00 F500.0
+G1 X-26.42 Y-57.25 Z7.99 J78.11 F500.0
+G1 X-29.53 Y-59.05 Z7.99 J81.64 F500.0
+G1 X-29.53 Y-63.25 Z7.99 J85.75 F500.0
+G1 X-26.42 Y-65.05 Z7.99 J89.27 F500.0
+G1 X-26.42 Y-69.25 Z7.99 J93.39 F500.0
+G1 X-28.26 Y-70.32 Z7.99 J95.48 F500.0
+G1 X-24.22 Y-70.32 Z7.99 J99.43 F500.0
+G1 X-26.07 Y-69.25 Z7.99 J101.53 F500.0
+G1 X-26.07 Y-65.05 Z7.99 J105.64 F500.0
+G1 X-22.95 Y-63.25 Z7.99 J109.17 F500.0
+G1 X-22.95 Y-59.05 Z7.99 J113.29 F500.0
+G1 X-26.07 Y-57.25 Z7.99 J116.82 F500.0
+G1 X-26.07 Y-53.05 Z7.99 J120.94 F500.0
+G1 X-22.95 Y-51.25 Z7.99 J124.47 F500.0
+G1 X-22.95 Y-47.05 Z7.99 J128.58 F500.0
+G1 X-26.07 Y-45.25 Z7.99 J132.11 F500.0
+G1 X-26.07 Y-42.62 Z7.99 J134.69 F500.0
+G1 X-19.49 Y-42.62 Z7.99 J141.14 F500.0
+G1 X-19.49 Y-45.25 Z7.99 J143.72 F500.0
+G1 X-22.61 Y-47.05 Z7.99 J147.25 F500.0
+G1 X-22.61 Y-51.25 Z7.99 J151.36 F500.0
+G1 X-19.49 Y-53.05 Z7.99 J154.89 F500.0
+G1 X-19.49 Y-57.25 Z7.99 J159.01 F500.0
+G1 X-22.61 Y-59.05 Z7.99 J162.54 F500.0
+G1 X-22.61 Y-63.25 Z7.99 J166.65 F500.0
+G1 X-19.49 Y-65.05 Z7.99 J170.18 F500.0
+G1 X-19.49 Y-69.25 Z7.99 J174.30 F500.0
+G1 X-21.34 Y-70.32 Z7.99 J176.39 F500.0
+G1 X-17.29 Y-70.32 Z7.99 J180.36 F500.0
+G1 X-19.14 Y-69.25 Z7.99 J182.46 F500.0
+G1 X-19.14 Y-65.05 Z7.99 J186.57 F500.0
+G1 X-16.02 Y-63.25 Z7.99 J190.10 F500.0
+G1 X-16.02 Y-59.05 Z7.99 J194.22 F500.0
+G1 X-19.14 Y-57.25 Z7.99 J197.75 F500.0
+G1 X-19.14 Y-53.05 Z7.99 J201.87 F500.0
+G1 X-16.02 Y-51.25 Z7.99 J205.40 F500.0
+G1 X-16.02 Y-47.05 Z7.99 J209.51 F500.0
+G1 X-19.14 Y-45.25 Z7.99 J213.04 F500.0
+G1 X-19.14 Y-42.62 Z7.99 J215.62 F500.0
+G1 X-12.56 Y-42.62 Z7.99 J222.07 F500.0
+G1 X-12.56 Y-45.25 Z7.99 J224.64 F500.0
+G1 X-15.68 Y-47.05 Z7.99 J228.17 F500.0
+G1 X-15.68 Y-51.25 Z7.99 J232.29 F500.0
+G1 X-12.56 Y-53.05 Z7.99 J235.82 F500.0
+G1 X-12.56 Y-57.25 Z7.99 J239.94 F500.0
+G1 X-15.68 Y-59.05 Z7.99 J243.47 F500.0
+G1 X-15.68 Y-63.25 Z7.99 J247.58 F500.0
+G1 X-12.56 Y-65.05 Z7.99 J251.11 F500.0
+G1 X-12.56 Y-69.25 Z7.99 J255.23 F500.0
+G1 X-14.41 Y-70.32 Z7.99 J257.32 F500.0
+G1 X-10.37 Y-70.32 Z7.99 J261.28 F500.0
+G1 X-12.21 Y-69.25 Z7.99 J263.37 F500.0
+G1 X-12.21 Y-65.05 Z7.99 J267.48 F500.0
+G1 X-9.10 Y-63.25 Z7.99 J271.01 F500.0
+G1 X-9.10 Y-59.05 Z7.99 J275.12 F500.0
+G1 X-12.21 Y-57.25 Z7.99 J278.64 F500.0
+G1 X-12.21 Y-53.05 Z7.99 J282.76 F500.0
+G1 X-9.10 Y-51.25 Z7.99 J286.28 F500.0
+G1 X-9.10 Y-47.05 Z7.99 J290.40 F500.0
+G1 X-12.21 Y-45.25 Z7.99 J293.92 F500.0
+G1 X-12.21 Y-42.62 Z7.99 J296.50 F500.0
+G1 X-5.63 Y-42.62 Z7.99 J302.94 F500.0
+G1 X-5.63 Y-45.25 Z7.99 J305.52 F500.0
+G1 X-8.75 Y-47.05 Z7.99 J309.05 F500.0
+G1 X-8.75 Y-51.25 Z7.99 J313.17 F500.0
+G1 X-5.63 Y-53.05 Z7.99 J316.70 F500.0
+G1 X-5.63 Y-57.25 Z7.99 J320.81 F500.0
+G1 X-8.75 Y-59.05 Z7.99 J324.34 F500.0
+G1 X-8.75 Y-63.25 Z7.99 J328.46 F500.0
+G1 X-5.63 Y-65.05 Z7.99 J331.99 F500.0
+G1 X-5.63 Y-69.25 Z7.99 J336.10 F500.0
+G1 X-7.48 Y-70.32 Z7.99 J338.20 F500.0
+G1 X-3.44 Y-70.32 Z7.99 J342.16 F500.0
+G1 X-5.28 Y-69.25 Z7.99 J344.24 F500.0
+G1 X-5.28 Y-65.05 Z7.99 J348.36 F500.0
+G1 X-2.17 Y-63.25 Z7.99 J351.88 F500.0
+G1 X-2.17 Y-59.05 Z7.99 J356.00 F500.0
+G1 X-5.28 Y-57.25 Z7.99 J359.52 F500.0
+G1 X-5.28 Y-53.05 Z7.99 J363.64 F500.0
+G1 X-2.17 Y-51.25 Z7.99 J367.16 F500.0
+G1 X-2.17 Y-47.05 Z7.99 J371.27 F500.0
+G1 X-5.28 Y-45.25 Z7.99 J374.79 F500.0
+G1 X-5.28 Y-42.62 Z7.99 J377.37 F500.0
+G1 X1.30 Y-42.62 Z7.99 J383.82 F500.0
+G1 X1.30 Y-45.25 Z7.99 J386.40 F500.0
+G1 X-1.82 Y-47.05 Z7.99 J389.93 F500.0
+G1 X-1.82 Y-51.25 Z7.99 J394.04 F500.0
+G1 X1.30 Y-53.05 Z7.99 J397.57 F500.0
+G1 X1.30 Y-57.25 Z7.99 J401.69 F500.0
+G1 X-1.82 Y-59.05 Z7.99 J405.22 F500.0
+G1 X-1.82 Y-63.25 Z7.99 J409.34 F500.0
+G1 X1.30 Y-65.05 Z7.99 J412.87 F500.0
+G1 X1.30 Y-69.25 Z7.99 J416.98 F500.0
+G1 X-0.55 Y-70.32 Z7.99 J419.08 F500.0
+G1 X3.49 Y-70.32 Z7.99 J423.03 F500.0
+G1 X1.64 Y-69.25 Z7.99 J425.13 F500.0
+G1 X1.64 Y-65.05 Z7.99 J429.25 F500.0
+G1 X4.76 Y-63.25 Z7.99 J432.78 F500.0
+G1 X4.76 Y-59.05 Z7.99 J436.89 F500.0
+G1 X1.64 Y-57.25 Z7.99 J440.42 F500.0
+G1 X1.64 Y-53.05 Z7.99 J444.54 F500.0
+G1 X4.76 Y-51.25 Z7.99 J448.07 F500.0
+G1 X4.76 Y-47.05 Z7.99 J452.18 F500.0
+G1 X1.64 Y-45.25 Z7.99 J455.71 F500.0
+G1 X1.64 Y-42.62 Z7.99 J458.29 F500.0
+G1 X8.22 Y-42.62 Z7.99 J464.74 F500.0
+G1 X8.22 Y-45.25 Z7.99 J467.32 F500.0
+G1 X5.11 Y-47.05 Z7.99 J470.84 F500.0
+G1 X5.11 Y-51.25 Z7.99 J474.95 F500.0
+G1 X8.22 Y-53.05 Z7.99 J478.48 F500.0
+G1 X8.22 Y-57.25 Z7.99 J482.59 F500.0
+G1 X5.11 Y-59.05 Z7.99 J486.11 F500.0
+G1 X5.11 Y-63.25 Z7.99 J490.23 F500.0
+G1 X8.22 Y-65.05 Z7.99 J493.75 F500.0
+G1 X8.22 Y-69.25 Z7.99 J497.87 F500.0
+G1 X6.38 Y-70.32 Z7.99 J499.95 F500.0
+G1 X10.42 Y-70.32 Z7.99 J503.91 F500.0
+G1 X8.57 Y-69.25 Z7.99 J506.01 F500.0
+G1 X8.57 Y-65.05 Z7.99 J510.12 F500.0
+G1 X11.69 Y-63.25 Z7.99 J513.65 F500.0
+G1 X11.69 Y-59.05 Z7.99 J517.77 F500.0
+G1 X8.57 Y-57.25 Z7.99 J521.30 F500.0
+G1 X8.57 Y-53.05 Z7.99 J525.41 F500.0
+G1 X11.69 Y-51.25 Z7.99 J528.94 F500.0
+G1 X11.69 Y-47.05 Z7.99 J533.06 F500.0
+G1 X8.57 Y-45.25 Z7.99 J536.59 F500.0
+G1 X8.57 Y-42.62 Z7.99 J539.17 F500.0
+G1 X15.15 Y-42.62 Z7.99 J545.62 F500.0
+G1 X15.15 Y-45.25 Z7.99 J548.19 F500.0
+G1 X12.03 Y-47.05 Z7.99 J551.72 F500.0
+G1 X12.03 Y-51.25 Z7.99 J555.84 F500.0
+G1 X15.15 Y-53.05 Z7.99 J559.37 F500.0
+G1 X15.15 Y-57.25 Z7.99 J563.48 F500.0
+G1 X12.03 Y-59.05 Z7.99 J567.01 F500.0
+G1 X12.03 Y-63.25 Z7.99 J571.13 F500.0
+G1 X15.15 Y-65.05 Z7.99 J574.66 F500.0
+G1 X15.15 Y-69.25 Z7.99 J578.78 F500.0
+G1 X13.31 Y-70.32 Z7.99 J580.86 F500.0
+G1 X17.35 Y-70.32 Z7.99 J584.82 F500.0
+G1 X15.50 Y-69.25 Z7.99 J586.92 F500.0
+G1 X15.50 Y-65.05 Z7.99 J591.03 F500.0
+G1 X18.62 Y-63.25 Z7.99 J594.56 F500.0
+G1 X18.62 Y-59.05 Z7.99 J598.68 F500.0
+G1 X15.50 Y-57.25 Z7.99 J602.21 F500.0
+G1 X15.50 Y-53.05 Z7.99 J606.32 F500.0
+G1 X18.62 Y-51.25 Z7.99 J609.85 F500.0
+G1 X18.62 Y-47.05 Z7.99 J613.97 F500.0
+G1 X15.50 Y-45.25 Z7.99 J617.50 F500.0
+G1 X15.50 Y-42.62 Z7.99 J620.08 F500.0
+G1 X22.08 Y-42.62 Z7.99 J626.53 F500.0
+G1 X22.08 Y-45.25 Z7.99 J629.10 F500.0
+G1 X18.96 Y-47.05 Z7.99 J632.63 F500.0
+G1 X18.96 Y-51.25 Z7.99 J636.75 F500.0
+G1 X22.08 Y-53.05 Z7.99 J640.28 F500.0
+G1 X22.08 Y-57.25 Z7.99 J644.40 F500.0
+G1 X18.96 Y-59.05 Z7.99 J647.93 F500.0
+G1 X18.96 Y-63.25 Z7.99 J652.04 F500.0
+G1 X22.08 Y-65.05 Z7.99 J655.57 F500.0
+G1 X22.08 Y-69.25 Z7.99 J659.69 F500.0
+G1 X20.24 Y-70.32 Z7.99 J661.77 F500.0
+G1 X24.27 Y-70.32 Z7.99 J665.72 F500.0
+G1 X22.43 Y-69.25 Z7.99 J667.81 F500.0
+G1 X22.43 Y-65.05 Z7.99 J671.92 F500.0
+G1 X25.54 Y-63.25 Z7.99 J675.45 F500.0
+G1 X25.54 Y-59.05 Z7.99 J679.56 F500.0
+G1 X22.43 Y-57.25 Z7.99 J683.08 F500.0
+G1 X22.43 Y-53.05 Z7.99 J687.20 F500.0
+G1 X25.54 Y-51.25 Z7.99 J690.72 F500.0
+G1 X25.54 Y-47.05 Z7.99 J694.84 F500.0
+G1 X22.43 Y-45.25 Z7.99 J698.36 F500.0
+G1 X22.43 Y-42.62 Z7.99 J700.94 F500.0
+G1 X29.01 Y-42.62 Z7.99 J707.38 F500.0
+G1 X29.01 Y-45.25 Z7.99 J709.96 F500.0
+G1 X25.89 Y-47.05 Z7.99 J713.49 F500.0
+G1 X25.89 Y-51.25 Z7.99 J717.61 F500.0
+G1 X29.01 Y-53.05 Z7.99 J721.14 F500.0
+G1 X29.01 Y-57.25 Z7.99 J725.25 F500.0
+G1 X25.89 Y-59.05 Z7.99 J728.78 F500.0
+G1 X25.89 Y-63.25 Z7.99 J732.90 F500.0
+G1 X29.01 Y-65.05 Z7.99 J736.43 F500.0
+G1 X29.01 Y-69.25 Z7.99 J740.55 F500.0
+G1 X27.16 Y-70.32 Z7.99 J742.64 F500.0
+G1 X31.20 Y-70.32 Z7.99 J746.60 F500.0
+G1 X29.36 Y-69.25 Z7.99 J748.68 F500.0
+G1 X29.36 Y-65.05 Z7.99 J752.80 F500.0
+G1 X32.47 Y-63.25 Z7.99 J756.32 F500.0
+G1 X32.47 Y-59.05 Z7.99 J760.44 F500.0
+G1 X29.36 Y-57.25 Z7.99 J763.96 F500.0
+G1 X29.36 Y-53.05 Z7.99 J768.08 F500.0
+G1 X32.47 Y-51.25 Z7.99 J771.60 F500.0
+G1 X32.47 Y-47.05 Z7.99 J775.71 F500.0
+G1 X29.36 Y-45.25 Z7.99 J779.23 F500.0
+G1 X29.36 Y-42.62 Z7.99 J781.81 F500.0
+G1 X35.94 Y-42.62 Z7.99 J788.26 F500.0
+G1 X35.94 Y-45.25 Z7.99 J790.84 F500.0
+G1 X32.82 Y-47.05 Z7.99 J794.37 F500.0
+G1 X32.82 Y-51.25 Z7.99 J798.48 F500.0
+G1 X35.94 Y-53.05 Z7.99 J802.01 F500.0
+G1 X35.94 Y-57.25 Z7.99 J806.13 F500.0
+G1 X32.82 Y-59.05 Z7.99 J809.66 F500.0
+G1 X32.82 Y-63.25 Z7.99 J813.78 F500.0
+G1 X35.94 Y-65.05 Z7.99 J817.31 F500.0
+G1 X35.94 Y-69.25 Z7.99 J821.42 F500.0
+G1 X34.09 Y-70.32 Z7.99 J823.52 F500.0
+G1 X36.89 Y-69.60 Z7.99 J826.35 F500.0
+G1 X36.28 Y-69.25 Z7.99 J827.04 F500.0
+G1 X36.28 Y-65.05 Z7.99 J831.15 F500.0
+G1 X36.89 Y-64.70 Z7.99 J831.84 F500.0
+G1 X36.89 Y-57.60 Z7.99 J838.80 F500.0
+G1 X36.28 Y-57.25 Z7.99 J839.49 F500.0
+G1 X36.28 Y-53.05 Z7.99 J843.61 F500.0
+G1 X36.89 Y-52.70 Z7.99 J844.30 F500.0
+G1 X36.89 Y-47.27 Z7.99 J854.62 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X36.89 Y-45.60 Z7.99 J854.62 F800.0
+G1 X36.28 Y-45.25 Z7.99 J854.62 F800.0
+G1 X36.28 Y-42.62 Z7.99 J854.62 F800.0
+G1 X36.28 Y-42.62 Z17.99 J854.62 F800.0
+G1 X-3.65 Y-74.76 Z17.99 J864.62 F800.0
+
+T1
+G1 X1.35 Y-69.76 Z8.99 J0.00 F300.0
+G1 X36.33 Y-69.76 Z8.99 J34.28 F300.0
+G1 X36.33 Y-53.96 Z8.99 J49.76 F300.0
+G1 X36.33 Y-43.18 Z8.99 J60.33 F300.0
+G1 X4.73 Y-43.18 Z8.99 J91.30 F500.0
+G1 X-30.25 Y-43.18 Z8.99 J125.58 F500.0
+G1 X-30.25 Y-58.98 Z8.99 J141.06 F500.0
+G1 X-30.25 Y-69.76 Z8.99 J151.63 F500.0
+G1 X-3.65 Y-69.76 Z8.99 J182.69 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X1.35 Y-69.76 Z8.99 J182.69 F800.0
+G1 X1.35 Y-69.76 Z18.99 J182.69 F800.0
+G1 X-3.65 Y-74.76 Z18.99 J192.69 F800.0
+
+T1
+G1 X1.35 Y-69.76 Z8.99 J0.00 F300.0
+G1 X-30.25 Y-63.47 Z8.99 J31.58 F300.0
+G1 X-29.88 Y-63.25 Z8.99 J32.00 F300.0
+G1 X-29.88 Y-59.05 Z8.99 J36.12 F300.0
+G1 X-30.25 Y-58.84 Z8.99 J36.53 F500.0
+G1 X-30.25 Y-51.47 Z8.99 J43.76 F500.0
+G1 X-29.88 Y-51.25 Z8.99 J44.18 F500.0
+G1 X-29.88 Y-47.05 Z8.99 J48.29 F500.0
+G1 X-30.25 Y-46.84 Z8.99 J48.71 F500.0
+G1 X-26.42 Y-43.18 Z8.99 J53.90 F500.0
+G1 X-26.42 Y-45.25 Z8.99 J55.93 F500.0
+G1 X-29.53 Y-47.05 Z8.99 J59.45 F500.0
+G1 X-29.53 Y-51.25 Z8.99 J63.57 F500.0
+G1 X-26.42 Y-53.05 Z8.99 J67.09 F500.0
+G1 X-26.42 Y-57.25 Z8.99 J71.21 F500.0
+G1 X-29.53 Y-59.05 Z8.99 J74.73 F500.0
+G1 X-29.53 Y-63.25 Z8.99 J78.84 F500.0
+G1 X-26.42 Y-65.05 Z8.99 J82.37 F500.0
+G1 X-26.42 Y-69.25 Z8.99 J86.48 F500.0
+G1 X-27.30 Y-69.76 Z8.99 J87.48 F500.0
+G1 X-25.18 Y-69.76 Z8.99 J89.56 F500.0
+G1 X-26.07 Y-69.25 Z8.99 J90.56 F500.0
+G1 X-26.07 Y-65.05 Z8.99 J94.68 F500.0
+G1 X-22.95 Y-63.25 Z8.99 J98.21 F500.0
+G1 X-22.95 Y-59.05 Z8.99 J102.32 F500.0
+G1 X-26.07 Y-57.25 Z8.99 J105.85 F500.0
+G1 X-26.07 Y-53.05 Z8.99 J109.97 F500.0
+G1 X-22.95 Y-51.25 Z8.99 J113.50 F500.0
+G1 X-22.95 Y-47.05 Z8.99 J117.61 F500.0
+G1 X-26.07 Y-45.25 Z8.99 J121.14 F500.0
+G1 X-26.07 Y-43.18 Z8.99 J123.17 F500.0
+G1 X-19.49 Y-43.18 Z8.99 J129.62 F500.0
+G1 X-19.49 Y-45.25 Z8.99 J131.65 F500.0
+G1 X-22.61 Y-47.05 Z8.99 J135.18 F500.0
+G1 X-22.61 Y-51.25 Z8.99 J139.30 F500.0
+G1 X-19.49 Y-53.05 Z8.99 J142.83 F500.0
+G1 X-19.49 Y-57.25 Z8.99 J146.94 F500.0
+G1 X-22.61 Y-59.05 Z8.99 J150.47 F500.0
+G1 X-22.61 Y-63.25 Z8.99 J154.59 F500.0
+G1 X-19.49 Y-65.05 Z8.99 J158.12 F500.0
+G1 X-19.49 Y-69.25 Z8.99 J162.23 F500.0
+G1 X-20.37 Y-69.76 Z8.99 J163.23 F500.0
+G1 X-18.25 Y-69.76 Z8.99 J165.31 F500.0
+G1 X-19.14 Y-69.25 Z8.99 J166.31 F500.0
+G1 X-19.14 Y-65.05 Z8.99 J170.43 F500.0
+G1 X-16.02 Y-63.25 Z8.99 J173.96 F500.0
+G1 X-16.02 Y-59.05 Z8.99 J178.08 F500.0
+G1 X-19.14 Y-57.25 Z8.99 J181.61 F500.0
+G1 X-19.14 Y-53.05 Z8.99 J185.72 F500.0
+G1 X-16.02 Y-51.25 Z8.99 J189.25 F500.0
+G1 X-16.02 Y-47.05 Z8.99 J193.37 F500.0
+G1 X-19.14 Y-45.25 Z8.99 J196.90 F500.0
+G1 X-19.14 Y-43.18 Z8.99 J198.93 F500.0
+G1 X-12.56 Y-43.18 Z8.99 J205.37 F500.0
+G1 X-12.56 Y-45.25 Z8.99 J207.40 F500.0
+G1 X-15.68 Y-47.05 Z8.99 J210.93 F500.0
+G1 X-15.68 Y-51.25 Z8.99 J215.05 F500.0
+G1 X-12.56 Y-53.05 Z8.99 J218.58 F500.0
+G1 X-12.56 Y-57.25 Z8.99 J222.70 F500.0
+G1 X-15.68 Y-59.05 Z8.99 J226.23 F500.0
+G1 X-15.68 Y-63.25 Z8.99 J230.34 F500.0
+G1 X-12.56 Y-65.05 Z8.99 J233.87 F500.0
+G1 X-12.56 Y-69.25 Z8.99 J237.99 F500.0
+G1 X-13.45 Y-69.76 Z8.99 J238.99 F500.0
+G1 X-11.33 Y-69.76 Z8.99 J241.07 F500.0
+G1 X-12.21 Y-69.25 Z8.99 J242.07 F500.0
+G1 X-12.21 Y-65.05 Z8.99 J246.18 F500.0
+G1 X-9.10 Y-63.25 Z8.99 J249.70 F500.0
+G1 X-9.10 Y-59.05 Z8.99 J253.82 F500.0
+G1 X-12.21 Y-57.25 Z8.99 J257.34 F500.0
+G1 X-12.21 Y-53.05 Z8.99 J261.46 F500.0
+G1 X-9.10 Y-51.25 Z8.99 J264.98 F500.0
+G1 X-9.10 Y-47.05 Z8.99 J269.10 F500.0
+G1 X-12.21 Y-45.25 Z8.99 J272.62 F500.0
+G1 X-12.21 Y-43.18 Z8.99 J274.65 F500.0
+G1 X-5.63 Y-43.18 Z8.99 J281.09 F500.0
+G1 X-5.63 Y-45.25 Z8.99 J283.12 F500.0
+G1 X-8.75 Y-47.05 Z8.99 J286.65 F500.0
+G1 X-8.75 Y-51.25 Z8.99 J290.77 F500.0
+G1 X-5.63 Y-53.05 Z8.99 J294.30 F500.0
+G1 X-5.63 Y-57.25 Z8.99 J298.41 F500.0
+G1 X-8.75 Y-59.05 Z8.99 J301.94 F500.0
+G1 X-8.75 Y-63.25 Z8.99 J306.06 F500.0
+G1 X-5.63 Y-65.05 Z8.99 J309.59 F500.0
+G1 X-5.63 Y-69.25 Z8.99 J313.71 F500.0
+G1 X-6.52 Y-69.76 Z8.99 J314.71 F500.0
+G1 X-4.40 Y-69.76 Z8.99 J316.79 F500.0
+G1 X-5.28 Y-69.25 Z8.99 J317.79 F500.0
+G1 X-5.28 Y-65.05 Z8.99 J321.90 F500.0
+G1 X-2.17 Y-63.25 Z8.99 J325.42 F500.0
+G1 X-2.17 Y-59.05 Z8.99 J329.54 F500.0
+G1 X-5.28 Y-57.25 Z8.99 J333.06 F500.0
+G1 X-5.28 Y-53.05 Z8.99 J337.18 F500.0
+G1 X-2.17 Y-51.25 Z8.99 J340.70 F500.0
+G1 X-2.17 Y-47.05 Z8.99 J344.81 F500.0
+G1 X-5.28 Y-45.25 Z8.99 J348.34 F500.0
+G1 X-5.28 Y-43.18 Z8.99 J350.36 F500.0
+G1 X1.30 Y-43.18 Z8.99 J356.81 F500.0
+G1 X1.30 Y-45.25 Z8.99 J358.84 F500.0
+G1 X-1.82 Y-47.05 Z8.99 J362.37 F500.0
+G1 X-1.82 Y-51.25 Z8.99 J366.49 F500.0
+G1 X1.30 Y-53.05 Z8.99 J370.02 F500.0
+G1 X1.30 Y-57.25 Z8.99 J374.13 F500.0
+G1 X-1.82 Y-59.05 Z8.99 J377.66 F500.0
+G1 X-1.82 Y-63.25 Z8.99 J381.78 F500.0
+G1 X1.30 Y-65.05 Z8.99 J385.31 F500.0
+G1 X1.30 Y-69.25 Z8.99 J389.43 F500.0
+G1 X0.41 Y-69.76 Z8.99 J390.43 F500.0
+G1 X2.53 Y-69.76 Z8.99 J392.51 F500.0
+G1 X1.64 Y-69.25 Z8.99 J393.51 F500.0
+G1 X1.64 Y-65.05 Z8.99 J397.63 F500.0
+G1 X4.76 Y-63.25 Z8.99 J401.16 F500.0
+G1 X4.76 Y-59.05 Z8.99 J405.28 F500.0
+G1 X1.64 Y-57.25 Z8.99 J408.81 F500.0
+G1 X1.64 Y-53.05 Z8.99 J412.92 F500.0
+G1 X4.76 Y-51.25 Z8.99 J416.45 F500.0
+G1 X4.76 Y-47.05 Z8.99 J420.57 F500.0
+G1 X1.64 Y-45.25 Z8.99 J424.10 F500.0
+G1 X1.64 Y-43.18 Z8.99 J426.13 F500.0
+G1 X8.22 Y-43.18 Z8.99 J432.57 F500.0
+G1 X8.22 Y-45.25 Z8.99 J434.60 F500.0
+G1 X5.11 Y-47.05 Z8.99 J438.12 F500.0
+G1 X5.11 Y-51.25 Z8.99 J442.24 F500.0
+G1 X8.22 Y-53.05 Z8.99 J445.76 F500.0
+G1 X8.22 Y-57.25 Z8.99 J449.88 F500.0
+G1 X5.11 Y-59.05 Z8.99 J453.40 F500.0
+G1 X5.11 Y-63.25 Z8.99 J457.52 F500.0
+G1 X8.22 Y-65.05 Z8.99 J461.04 F500.0
+G1 X8.22 Y-69.25 Z8.99 J465.15 F500.0
+G1 X7.34 Y-69.76 Z8.99 J466.15 F500.0
+G1 X9.46 Y-69.76 Z8.99 J468.23 F500.0
+G1 X8.57 Y-69.25 Z8.99 J469.23 F500.0
+G1 X8.57 Y-65.05 Z8.99 J473.35 F500.0
+G1 X11.69 Y-63.25 Z8.99 J476.88 F500.0
+G1 X11.69 Y-59.05 Z8.99 J480.99 F500.0
+G1 X8.57 Y-57.25 Z8.99 J484.52 F500.0
+G1 X8.57 Y-53.05 Z8.99 J488.64 F500.0
+G1 X11.69 Y-51.25 Z8.99 J492.17 F500.0
+G1 X11.69 Y-47.05 Z8.99 J496.29 F500.0
+G1 X8.57 Y-45.25 Z8.99 J499.82 F500.0
+G1 X8.57 Y-43.18 Z8.99 J501.84 F500.0
+G1 X15.15 Y-43.18 Z8.99 J508.29 F500.0
+G1 X15.15 Y-45.25 Z8.99 J510.32 F500.0
+G1 X12.03 Y-47.05 Z8.99 J513.85 F500.0
+G1 X12.03 Y-51.25 Z8.99 J517.97 F500.0
+G1 X15.15 Y-53.05 Z8.99 J521.50 F500.0
+G1 X15.15 Y-57.25 Z8.99 J525.61 F500.0
+G1 X12.03 Y-59.05 Z8.99 J529.14 F500.0
+G1 X12.03 Y-63.25 Z8.99 J533.26 F500.0
+G1 X15.15 Y-65.05 Z8.99 J536.79 F500.0
+G1 X15.15 Y-69.25 Z8.99 J540.91 F500.0
+G1 X14.27 Y-69.76 Z8.99 J541.90 F500.0
+G1 X16.39 Y-69.76 Z8.99 J543.98 F500.0
+G1 X15.50 Y-69.25 Z8.99 J544.99 F500.0
+G1 X15.50 Y-65.05 Z8.99 J549.10 F500.0
+G1 X18.62 Y-63.25 Z8.99 J552.63 F500.0
+G1 X18.62 Y-59.05 Z8.99 J556.75 F500.0
+G1 X15.50 Y-57.25 Z8.99 J560.28 F500.0
+G1 X15.50 Y-53.05 Z8.99 J564.39 F500.0
+G1 X18.62 Y-51.25 Z8.99 J567.92 F500.0
+G1 X18.62 Y-47.05 Z8.99 J572.04 F500.0
+G1 X15.50 Y-45.25 Z8.99 J575.57 F500.0
+G1 X15.50 Y-43.18 Z8.99 J577.60 F500.0
+G1 X22.08 Y-43.18 Z8.99 J584.05 F500.0
+G1 X22.08 Y-45.25 Z8.99 J586.07 F500.0
+G1 X18.96 Y-47.05 Z8.99 J589.60 F500.0
+G1 X18.96 Y-51.25 Z8.99 J593.72 F500.0
+G1 X22.08 Y-53.05 Z8.99 J597.25 F500.0
+G1 X22.08 Y-57.25 Z8.99 J601.37 F500.0
+G1 X18.96 Y-59.05 Z8.99 J604.90 F500.0
+G1 X18.96 Y-63.25 Z8.99 J609.01 F500.0
+G1 X22.08 Y-65.05 Z8.99 J612.54 F500.0
+G1 X22.08 Y-69.25 Z8.99 J616.66 F500.0
+G1 X21.20 Y-69.76 Z8.99 J617.66 F500.0
+G1 X23.31 Y-69.76 Z8.99 J619.72 F500.0
+G1 X22.43 Y-69.25 Z8.99 J620.72 F500.0
+G1 X22.43 Y-65.05 Z8.99 J624.84 F500.0
+G1 X25.54 Y-63.25 Z8.99 J628.36 F500.0
+G1 X25.54 Y-59.05 Z8.99 J632.47 F500.0
+G1 X22.43 Y-57.25 Z8.99 J635.99 F500.0
+G1 X22.43 Y-53.05 Z8.99 J640.11 F500.0
+G1 X25.54 Y-51.25 Z8.99 J643.63 F500.0
+G1 X25.54 Y-47.05 Z8.99 J647.75 F500.0
+G1 X22.43 Y-45.25 Z8.99 J651.27 F500.0
+G1 X22.43 Y-43.18 Z8.99 J653.30 F500.0
+G1 X29.01 Y-43.18 Z8.99 J659.75 F500.0
+G1 X29.01 Y-45.25 Z8.99 J661.78 F500.0
+G1 X25.89 Y-47.05 Z8.99 J665.31 F500.0
+G1 X25.89 Y-51.25 Z8.99 J669.42 F500.0
+G1 X29.01 Y-53.05 Z8.99 J672.95 F500.0
+G1 X29.01 Y-57.25 Z8.99 J677.07 F500.0
+G1 X25.89 Y-59.05 Z8.99 J680.60 F500.0
+G1 X25.89 Y-63.25 Z8.99 J684.71 F500.0
+G1 X29.01 Y-65.05 Z8.99 J688.24 F500.0
+G1 X29.01 Y-69.25 Z8.99 J692.36 F500.0
+G1 X28.12 Y-69.76 Z8.99 J693.36 F500.0
+G1 X30.24 Y-69.76 Z8.99 J695.44 F500.0
+G1 X29.36 Y-69.25 Z8.99 J696.44 F500.0
+G1 X29.36 Y-65.05 Z8.99 J700.55 F500.0
+G1 X32.47 Y-63.25 Z8.99 J704.08 F500.0
+G1 X32.47 Y-59.05 Z8.99 J708.19 F500.0
+G1 X29.36 Y-57.25 Z8.99 J711.71 F500.0
+G1 X29.36 Y-53.05 Z8.99 J715.83 F500.0
+G1 X32.47 Y-51.25 Z8.99 J719.35 F500.0
+G1 X32.47 Y-47.05 Z8.99 J723.47 F500.0
+G1 X29.36 Y-45.25 Z8.99 J726.99 F500.0
+G1 X29.36 Y-43.18 Z8.99 J729.02 F500.0
+G1 X35.94 Y-43.18 Z8.99 J735.47 F500.0
+G1 X35.94 Y-45.25 Z8.99 J737.49 F500.0
+G1 X32.82 Y-47.05 Z8.99 J741.02 F500.0
+G1 X32.82 Y-51.25 Z8.99 J745.14 F500.0
+G1 X35.94 Y-53.05 Z8.99 J748.67 F500.0
+G1 X35.94 Y-57.25 Z8.99 J752.79 F500.0
+G1 X32.82 Y-59.05 Z8.99 J756.32 F500.0
+G1 X32.82 Y-63.25 Z8.99 J760.43 F500.0
+G1 X35.94 Y-65.05 Z8.99 J763.96 F500.0
+G1 X35.94 Y-69.25 Z8.99 J768.08 F500.0
+G1 X35.05 Y-69.76 Z8.99 J769.08 F500.0
+G1 X36.33 Y-69.28 Z8.99 J770.42 F500.0
+G1 X36.28 Y-69.25 Z8.99 J770.48 F500.0
+G1 X36.28 Y-65.05 Z8.99 J774.60 F500.0
+G1 X36.33 Y-65.02 Z8.99 J774.65 F500.0
+G1 X36.33 Y-57.28 Z8.99 J782.24 F500.0
+G1 X36.28 Y-57.25 Z8.99 J782.30 F500.0
+G1 X36.28 Y-53.05 Z8.99 J786.41 F500.0
+G1 X36.33 Y-53.02 Z8.99 J786.47 F500.0
+G1 X36.33 Y-48.15 Z8.99 J796.24 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X36.33 Y-45.28 Z8.99 J796.24 F800.0
+G1 X36.28 Y-45.25 Z8.99 J796.24 F800.0
+G1 X36.28 Y-43.18 Z8.99 J796.24 F800.0
+G1 X36.28 Y-43.18 Z18.99 J796.24 F800.0
+G1 X30.78 Y-74.21 Z18.99 J806.24 F800.0
+
+T1
+G1 X35.78 Y-69.21 Z9.99 J0.00 F300.0
+G1 X35.78 Y-55.41 Z9.99 J13.52 F300.0
+G1 X35.78 Y-43.73 Z9.99 J24.97 F300.0
+G1 X8.18 Y-43.73 Z9.99 J52.02 F300.0
+G1 X-29.70 Y-43.73 Z9.99 J89.14 F500.0
+G1 X-29.70 Y-57.53 Z9.99 J102.66 F500.0
+G1 X-29.70 Y-69.21 Z9.99 J114.11 F500.0
+G1 X-2.10 Y-69.21 Z9.99 J141.16 F500.0
+G1 X30.78 Y-69.21 Z9.99 J178.38 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X35.78 Y-69.21 Z9.99 J178.38 F800.0
+G1 X35.78 Y-69.21 Z19.99 J178.38 F800.0
+G1 X30.78 Y-74.21 Z19.99 J188.38 F800.0
+
+T1
+G1 X35.78 Y-69.21 Z9.99 J0.00 F300.0
+G1 X-26.42 Y-43.73 Z9.99 J65.87 F300.0
+G1 X-26.42 Y-45.25 Z9.99 J67.36 F300.0
+G1 X-29.53 Y-47.05 Z9.99 J70.88 F300.0
+G1 X-29.53 Y-51.25 Z9.99 J75.00 F500.0
+G1 X-26.42 Y-53.05 Z9.99 J78.52 F500.0
+G1 X-26.42 Y-57.25 Z9.99 J82.64 F500.0
+G1 X-29.53 Y-59.05 Z9.99 J86.16 F500.0
+G1 X-29.53 Y-63.25 Z9.99 J90.28 F500.0
+G1 X-26.42 Y-65.05 Z9.99 J93.80 F500.0
+G1 X-26.42 Y-69.21 Z9.99 J97.87 F500.0
+G1 X-26.07 Y-69.21 Z9.99 J98.22 F500.0
+G1 X-26.07 Y-65.05 Z9.99 J102.29 F500.0
+G1 X-22.95 Y-63.25 Z9.99 J105.82 F500.0
+G1 X-22.95 Y-59.05 Z9.99 J109.94 F500.0
+G1 X-26.07 Y-57.25 Z9.99 J113.47 F500.0
+G1 X-26.07 Y-53.05 Z9.99 J117.59 F500.0
+G1 X-22.95 Y-51.25 Z9.99 J121.12 F500.0
+G1 X-22.95 Y-47.05 Z9.99 J125.23 F500.0
+G1 X-26.07 Y-45.25 Z9.99 J128.76 F500.0
+G1 X-26.07 Y-43.73 Z9.99 J130.25 F500.0
+G1 X-19.49 Y-43.73 Z9.99 J136.70 F500.0
+G1 X-19.49 Y-45.25 Z9.99 J138.19 F500.0
+G1 X-22.61 Y-47.05 Z9.99 J141.72 F500.0
+G1 X-22.61 Y-51.25 Z9.99 J145.84 F500.0
+G1 X-19.49 Y-53.05 Z9.99 J149.37 F500.0
+G1 X-19.49 Y-57.25 Z9.99 J153.48 F500.0
+G1 X-22.61 Y-59.05 Z9.99 J157.01 F500.0
+G1 X-22.61 Y-63.25 Z9.99 J161.13 F500.0
+G1 X-19.49 Y-65.05 Z9.99 J164.66 F500.0
+G1 X-19.49 Y-69.21 Z9.99 J168.73 F500.0
+G1 X-19.14 Y-69.21 Z9.99 J169.08 F500.0
+G1 X-19.14 Y-65.05 Z9.99 J173.15 F500.0
+G1 X-16.02 Y-63.25 Z9.99 J176.68 F500.0
+G1 X-16.02 Y-59.05 Z9.99 J180.80 F500.0
+G1 X-19.14 Y-57.25 Z9.99 J184.33 F500.0
+G1 X-19.14 Y-53.05 Z9.99 J188.45 F500.0
+G1 X-16.02 Y-51.25 Z9.99 J191.98 F500.0
+G1 X-16.02 Y-47.05 Z9.99 J196.09 F500.0
+G1 X-19.14 Y-45.25 Z9.99 J199.62 F500.0
+G1 X-19.14 Y-43.73 Z9.99 J201.11 F500.0
+G1 X-12.56 Y-43.73 Z9.99 J207.56 F500.0
+G1 X-12.56 Y-45.25 Z9.99 J209.05 F500.0
+G1 X-15.68 Y-47.05 Z9.99 J212.58 F500.0
+G1 X-15.68 Y-51.25 Z9.99 J216.70 F500.0
+G1 X-12.56 Y-53.05 Z9.99 J220.23 F500.0
+G1 X-12.56 Y-57.25 Z9.99 J224.34 F500.0
+G1 X-15.68 Y-59.05 Z9.99 J227.87 F500.0
+G1 X-15.68 Y-63.25 Z9.99 J231.99 F500.0
+G1 X-12.56 Y-65.05 Z9.99 J235.52 F500.0
+G1 X-12.56 Y-69.21 Z9.99 J239.59 F500.0
+G1 X-12.21 Y-69.21 Z9.99 J239.94 F500.0
+G1 X-12.21 Y-65.05 Z9.99 J244.01 F500.0
+G1 X-9.10 Y-63.25 Z9.99 J247.54 F500.0
+G1 X-9.10 Y-59.05 Z9.99 J251.65 F500.0
+G1 X-12.21 Y-57.25 Z9.99 J255.17 F500.0
+G1 X-12.21 Y-53.05 Z9.99 J259.29 F500.0
+G1 X-9.10 Y-51.25 Z9.99 J262.81 F500.0
+G1 X-9.10 Y-47.05 Z9.99 J266.93 F500.0
+G1 X-12.21 Y-45.25 Z9.99 J270.45 F500.0
+G1 X-12.21 Y-43.73 Z9.99 J271.94 F500.0
+G1 X-5.63 Y-43.73 Z9.99 J278.39 F500.0
+G1 X-5.63 Y-45.25 Z9.99 J279.88 F500.0
+G1 X-8.75 Y-47.05 Z9.99 J283.41 F500.0
+G1 X-8.75 Y-51.25 Z9.99 J287.52 F500.0
+G1 X-5.63 Y-53.05 Z9.99 J291.05 F500.0
+G1 X-5.63 Y-57.25 Z9.99 J295.17 F500.0
+G1 X-8.75 Y-59.05 Z9.99 J298.70 F500.0
+G1 X-8.75 Y-63.25 Z9.99 J302.81 F500.0
+G1 X-5.63 Y-65.05 Z9.99 J306.34 F500.0
+G1 X-5.63 Y-69.21 Z9.99 J310.42 F500.0
+G1 X-5.28 Y-69.21 Z9.99 J310.76 F500.0
+G1 X-5.28 Y-65.05 Z9.99 J314.84 F500.0
+G1 X-2.17 Y-63.25 Z9.99 J318.36 F500.0
+G1 X-2.17 Y-59.05 Z9.99 J322.48 F500.0
+G1 X-5.28 Y-57.25 Z9.99 J326.00 F500.0
+G1 X-5.28 Y-53.05 Z9.99 J330.11 F500.0
+G1 X-2.17 Y-51.25 Z9.99 J333.64 F500.0
+G1 X-2.17 Y-47.05 Z9.99 J337.75 F500.0
+G1 X-5.28 Y-45.25 Z9.99 J341.27 F500.0
+G1 X-5.28 Y-43.73 Z9.99 J342.76 F500.0
+G1 X1.30 Y-43.73 Z9.99 J349.21 F500.0
+G1 X1.30 Y-45.25 Z9.99 J350.70 F500.0
+G1 X-1.82 Y-47.05 Z9.99 J354.23 F500.0
+G1 X-1.82 Y-51.25 Z9.99 J358.35 F500.0
+G1 X1.30 Y-53.05 Z9.99 J361.88 F500.0
+G1 X1.30 Y-57.25 Z9.99 J365.99 F500.0
+G1 X-1.82 Y-59.05 Z9.99 J369.52 F500.0
+G1 X-1.82 Y-63.25 Z9.99 J373.64 F500.0
+G1 X1.30 Y-65.05 Z9.99 J377.17 F500.0
+G1 X1.30 Y-69.21 Z9.99 J381.25 F500.0
+G1 X1.64 Y-69.21 Z9.99 J381.58 F500.0
+G1 X1.64 Y-65.05 Z9.99 J385.66 F500.0
+G1 X4.76 Y-63.25 Z9.99 J389.19 F500.0
+G1 X4.76 Y-59.05 Z9.99 J393.30 F500.0
+G1 X1.64 Y-57.25 Z9.99 J396.83 F500.0
+G1 X1.64 Y-53.05 Z9.99 J400.95 F500.0
+G1 X4.76 Y-51.25 Z9.99 J404.48 F500.0
+G1 X4.76 Y-47.05 Z9.99 J408.59 F500.0
+G1 X1.64 Y-45.25 Z9.99 J412.12 F500.0
+G1 X1.64 Y-43.73 Z9.99 J413.61 F500.0
+G1 X8.22 Y-43.73 Z9.99 J420.06 F500.0
+G1 X8.22 Y-45.25 Z9.99 J421.55 F500.0
+G1 X5.11 Y-47.05 Z9.99 J425.07 F500.0
+G1 X5.11 Y-51.25 Z9.99 J429.19 F500.0
+G1 X8.22 Y-53.05 Z9.99 J432.71 F500.0
+G1 X8.22 Y-57.25 Z9.99 J436.83 F500.0
+G1 X5.11 Y-59.05 Z9.99 J440.35 F500.0
+G1 X5.11 Y-63.25 Z9.99 J444.46 F500.0
+G1 X8.22 Y-65.05 Z9.99 J447.99 F500.0
+G1 X8.22 Y-69.21 Z9.99 J452.06 F500.0
+G1 X8.57 Y-69.21 Z9.99 J452.40 F500.0
+G1 X8.57 Y-65.05 Z9.99 J456.48 F500.0
+G1 X11.69 Y-63.25 Z9.99 J460.01 F500.0
+G1 X11.69 Y-59.05 Z9.99 J464.13 F500.0
+G1 X8.57 Y-57.25 Z9.99 J467.66 F500.0
+G1 X8.57 Y-53.05 Z9.99 J471.77 F500.0
+G1 X11.69 Y-51.25 Z9.99 J475.30 F500.0
+G1 X11.69 Y-47.05 Z9.99 J479.42 F500.0
+G1 X8.57 Y-45.25 Z9.99 J482.95 F500.0
+G1 X8.57 Y-43.73 Z9.99 J484.44 F500.0
+G1 X15.15 Y-43.73 Z9.99 J490.89 F500.0
+G1 X15.15 Y-45.25 Z9.99 J492.38 F500.0
+G1 X12.03 Y-47.05 Z9.99 J495.91 F500.0
+G1 X12.03 Y-51.25 Z9.99 J500.02 F500.0
+G1 X15.15 Y-53.05 Z9.99 J503.55 F500.0
+G1 X15.15 Y-57.25 Z9.99 J507.67 F500.0
+G1 X12.03 Y-59.05 Z9.99 J511.20 F500.0
+G1 X12.03 Y-63.25 Z9.99 J515.32 F500.0
+G1 X15.15 Y-65.05 Z9.99 J518.84 F500.0
+G1 X15.15 Y-69.21 Z9.99 J522.92 F500.0
+G1 X15.50 Y-69.21 Z9.99 J523.26 F500.0
+G1 X15.50 Y-65.05 Z9.99 J527.34 F500.0
+G1 X18.62 Y-63.25 Z9.99 J530.87 F500.0
+G1 X18.62 Y-59.05 Z9.99 J534.99 F500.0
+G1 X15.50 Y-57.25 Z9.99 J538.52 F500.0
+G1 X15.50 Y-53.05 Z9.99 J542.63 F500.0
+G1 X18.62 Y-51.25 Z9.99 J546.16 F500.0
+G1 X18.62 Y-47.05 Z9.99 J550.28 F500.0
+G1 X15.50 Y-45.25 Z9.99 J553.81 F500.0
+G1 X15.50 Y-43.73 Z9.99 J555.30 F500.0
+G1 X22.08 Y-43.73 Z9.99 J561.75 F500.0
+G1 X22.08 Y-45.25 Z9.99 J563.24 F500.0
+G1 X18.96 Y-47.05 Z9.99 J566.77 F500.0
+G1 X18.96 Y-51.25 Z9.99 J570.88 F500.0
+G1 X22.08 Y-53.05 Z9.99 J574.41 F500.0
+G1 X22.08 Y-57.25 Z9.99 J578.53 F500.0
+G1 X18.96 Y-59.05 Z9.99 J582.06 F500.0
+G1 X18.96 Y-63.25 Z9.99 J586.17 F500.0
+G1 X22.08 Y-65.05 Z9.99 J589.70 F500.0
+G1 X22.08 Y-69.21 Z9.99 J593.78 F500.0
+G1 X22.43 Y-69.21 Z9.99 J594.12 F500.0
+G1 X22.43 Y-65.05 Z9.99 J598.20 F500.0
+G1 X25.54 Y-63.25 Z9.99 J601.72 F500.0
+G1 X25.54 Y-59.05 Z9.99 J605.84 F500.0
+G1 X22.43 Y-57.25 Z9.99 J609.36 F500.0
+G1 X22.43 Y-53.05 Z9.99 J613.48 F500.0
+G1 X25.54 Y-51.25 Z9.99 J617.00 F500.0
+G1 X25.54 Y-47.05 Z9.99 J621.11 F500.0
+G1 X22.43 Y-45.25 Z9.99 J624.64 F500.0
+G1 X22.43 Y-43.73 Z9.99 J626.12 F500.0
+G1 X29.01 Y-43.73 Z9.99 J632.57 F500.0
+G1 X29.01 Y-45.25 Z9.99 J634.06 F500.0
+G1 X25.89 Y-47.05 Z9.99 J637.59 F500.0
+G1 X25.89 Y-51.25 Z9.99 J641.71 F500.0
+G1 X29.01 Y-53.05 Z9.99 J645.24 F500.0
+G1 X29.01 Y-57.25 Z9.99 J649.35 F500.0
+G1 X25.89 Y-59.05 Z9.99 J652.88 F500.0
+G1 X25.89 Y-63.25 Z9.99 J657.00 F500.0
+G1 X29.01 Y-65.05 Z9.99 J660.53 F500.0
+G1 X29.01 Y-69.21 Z9.99 J664.61 F500.0
+G1 X29.36 Y-69.21 Z9.99 J664.95 F500.0
+G1 X29.36 Y-65.05 Z9.99 J669.03 F500.0
+G1 X32.47 Y-63.25 Z9.99 J672.55 F500.0
+G1 X32.47 Y-59.05 Z9.99 J676.66 F500.0
+G1 X29.36 Y-57.25 Z9.99 J680.19 F500.0
+G1 X29.36 Y-53.05 Z9.99 J684.30 F500.0
+G1 X32.47 Y-51.25 Z9.99 J687.82 F500.0
+G1 X32.47 Y-47.05 Z9.99 J691.94 F500.0
+G1 X29.36 Y-45.25 Z9.99 J695.46 F500.0
+G1 X29.36 Y-43.73 Z9.99 J696.95 F500.0
+G1 X35.78 Y-45.34 Z9.99 J703.44 F500.0
+G1 X32.82 Y-47.05 Z9.99 J706.79 F500.0
+G1 X32.82 Y-51.25 Z9.99 J710.90 F500.0
+G1 X35.78 Y-52.96 Z9.99 J714.25 F500.0
+G1 X35.78 Y-57.34 Z9.99 J718.55 F500.0
+G1 X32.82 Y-59.05 Z9.99 J721.90 F500.0
+G1 X32.82 Y-61.67 Z9.99 J729.46 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X32.82 Y-63.25 Z9.99 J729.46 F800.0
+G1 X35.78 Y-64.96 Z9.99 J729.46 F800.0
+G1 X35.78 Y-64.96 Z19.99 J729.46 F800.0
+G1 X30.22 Y-73.65 Z19.99 J739.46 F800.0
+
+T1
+G1 X35.22 Y-68.65 Z10.99 J0.00 F300.0
+G1 X35.22 Y-56.85 Z10.99 J11.56 F300.0
+G1 X35.22 Y-44.29 Z10.99 J23.87 F300.0
+G1 X11.62 Y-44.29 Z10.99 J47.00 F300.0
+G1 X-29.14 Y-44.29 Z10.99 J86.95 F500.0
+G1 X-29.14 Y-56.09 Z10.99 J98.51 F500.0
+G1 X-29.14 Y-68.65 Z10.99 J110.82 F500.0
+G1 X-5.54 Y-68.65 Z10.99 J133.95 F500.0
+G1 X30.22 Y-68.65 Z10.99 J173.99 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X35.22 Y-68.65 Z10.99 J173.99 F800.0
+G1 X35.22 Y-68.65 Z20.99 J173.99 F800.0
+G1 X30.22 Y-73.65 Z20.99 J183.99 F800.0
+
+T1
+G1 X35.22 Y-68.65 Z10.99 J0.00 F300.0
+G1 X-26.42 Y-44.29 Z10.99 J64.95 F300.0
+G1 X-26.42 Y-45.25 Z10.99 J65.90 F300.0
+G1 X-29.14 Y-46.83 Z10.99 J68.98 F300.0
+G1 X-29.14 Y-51.48 Z10.99 J73.54 F500.0
+G1 X-26.42 Y-53.05 Z10.99 J76.61 F500.0
+G1 X-26.42 Y-57.25 Z10.99 J80.73 F500.0
+G1 X-29.14 Y-58.83 Z10.99 J83.81 F500.0
+G1 X-29.14 Y-63.48 Z10.99 J88.37 F500.0
+G1 X-26.42 Y-65.05 Z10.99 J91.45 F500.0
+G1 X-26.42 Y-68.65 Z10.99 J94.97 F500.0
+G1 X-26.07 Y-68.65 Z10.99 J95.32 F500.0
+G1 X-26.07 Y-65.05 Z10.99 J98.85 F500.0
+G1 X-22.95 Y-63.25 Z10.99 J102.38 F500.0
+G1 X-22.95 Y-59.05 Z10.99 J106.49 F500.0
+G1 X-26.07 Y-57.25 Z10.99 J110.02 F500.0
+G1 X-26.07 Y-53.05 Z10.99 J114.14 F500.0
+G1 X-22.95 Y-51.25 Z10.99 J117.67 F500.0
+G1 X-22.95 Y-47.05 Z10.99 J121.78 F500.0
+G1 X-26.07 Y-45.25 Z10.99 J125.31 F500.0
+G1 X-26.07 Y-44.29 Z10.99 J126.25 F500.0
+G1 X-19.49 Y-44.29 Z10.99 J132.70 F500.0
+G1 X-19.49 Y-45.25 Z10.99 J133.64 F500.0
+G1 X-22.61 Y-47.05 Z10.99 J137.17 F500.0
+G1 X-22.61 Y-51.25 Z10.99 J141.29 F500.0
+G1 X-19.49 Y-53.05 Z10.99 J144.82 F500.0
+G1 X-19.49 Y-57.25 Z10.99 J148.94 F500.0
+G1 X-22.61 Y-59.05 Z10.99 J152.47 F500.0
+G1 X-22.61 Y-63.25 Z10.99 J156.58 F500.0
+G1 X-19.49 Y-65.05 Z10.99 J160.11 F500.0
+G1 X-19.49 Y-68.65 Z10.99 J163.64 F500.0
+G1 X-19.14 Y-68.65 Z10.99 J163.98 F500.0
+G1 X-19.14 Y-65.05 Z10.99 J167.51 F500.0
+G1 X-16.02 Y-63.25 Z10.99 J171.04 F500.0
+G1 X-16.02 Y-59.05 Z10.99 J175.16 F500.0
+G1 X-19.14 Y-57.25 Z10.99 J178.69 F500.0
+G1 X-19.14 Y-53.05 Z10.99 J182.80 F500.0
+G1 X-16.02 Y-51.25 Z10.99 J186.33 F500.0
+G1 X-16.02 Y-47.05 Z10.99 J190.45 F500.0
+G1 X-19.14 Y-45.25 Z10.99 J193.98 F500.0
+G1 X-19.14 Y-44.29 Z10.99 J194.92 F500.0
+G1 X-12.56 Y-44.29 Z10.99 J201.37 F500.0
+G1 X-12.56 Y-45.25 Z10.99 J202.31 F500.0
+G1 X-15.68 Y-47.05 Z10.99 J205.84 F500.0
+G1 X-15.68 Y-51.25 Z10.99 J209.95 F500.0
+G1 X-12.56 Y-53.05 Z10.99 J213.48 F500.0
+G1 X-12.56 Y-57.25 Z10.99 J217.60 F500.0
+G1 X-15.68 Y-59.05 Z10.99 J221.13 F500.0
+G1 X-15.68 Y-63.25 Z10.99 J225.25 F500.0
+G1 X-12.56 Y-65.05 Z10.99 J228.78 F500.0
+G1 X-12.56 Y-68.65 Z10.99 J232.30 F500.0
+G1 X-12.21 Y-68.65 Z10.99 J232.65 F500.0
+G1 X-12.21 Y-65.05 Z10.99 J236.17 F500.0
+G1 X-9.10 Y-63.25 Z10.99 J239.70 F500.0
+G1 X-9.10 Y-59.05 Z10.99 J243.81 F500.0
+G1 X-12.21 Y-57.25 Z10.99 J247.33 F500.0
+G1 X-12.21 Y-53.05 Z10.99 J251.45 F500.0
+G1 X-9.10 Y-51.25 Z10.99 J254.97 F500.0
+G1 X-9.10 Y-47.05 Z10.99 J259.09 F500.0
+G1 X-12.21 Y-45.25 Z10.99 J262.61 F500.0
+G1 X-12.21 Y-44.29 Z10.99 J263.55 F500.0
+G1 X-5.63 Y-44.29 Z10.99 J270.00 F500.0
+G1 X-5.63 Y-45.25 Z10.99 J270.94 F500.0
+G1 X-8.75 Y-47.05 Z10.99 J274.47 F500.0
+G1 X-8.75 Y-51.25 Z10.99 J278.58 F500.0
+G1 X-5.63 Y-53.05 Z10.99 J282.11 F500.0
+G1 X-5.63 Y-57.25 Z10.99 J286.23 F500.0
+G1 X-8.75 Y-59.05 Z10.99 J289.76 F500.0
+G1 X-8.75 Y-63.25 Z10.99 J293.88 F500.0
+G1 X-5.63 Y-65.05 Z10.99 J297.41 F500.0
+G1 X-5.63 Y-68.65 Z10.99 J300.93 F500.0
+G1 X-5.28 Y-68.65 Z10.99 J301.28 F500.0
+G1 X-5.28 Y-65.05 Z10.99 J304.81 F500.0
+G1 X-2.17 Y-63.25 Z10.99 J308.33 F500.0
+G1 X-2.17 Y-59.05 Z10.99 J312.44 F500.0
+G1 X-5.28 Y-57.25 Z10.99 J315.96 F500.0
+G1 X-5.28 Y-53.05 Z10.99 J320.08 F500.0
+G1 X-2.17 Y-51.25 Z10.99 J323.60 F500.0
+G1 X-2.17 Y-47.05 Z10.99 J327.72 F500.0
+G1 X-5.28 Y-45.25 Z10.99 J331.24 F500.0
+G1 X-5.28 Y-44.29 Z10.99 J332.18 F500.0
+G1 X1.30 Y-44.29 Z10.99 J338.63 F500.0
+G1 X1.30 Y-45.25 Z10.99 J339.57 F500.0
+G1 X-1.82 Y-47.05 Z10.99 J343.10 F500.0
+G1 X-1.82 Y-51.25 Z10.99 J347.22 F500.0
+G1 X1.30 Y-53.05 Z10.99 J350.75 F500.0
+G1 X1.30 Y-57.25 Z10.99 J354.86 F500.0
+G1 X-1.82 Y-59.05 Z10.99 J358.39 F500.0
+G1 X-1.82 Y-63.25 Z10.99 J362.51 F500.0
+G1 X1.30 Y-65.05 Z10.99 J366.04 F500.0
+G1 X1.30 Y-68.65 Z10.99 J369.57 F500.0
+G1 X1.64 Y-68.65 Z10.99 J369.90 F500.0
+G1 X1.64 Y-65.05 Z10.99 J373.43 F500.0
+G1 X4.76 Y-63.25 Z10.99 J376.96 F500.0
+G1 X4.76 Y-59.05 Z10.99 J381.07 F500.0
+G1 X1.64 Y-57.25 Z10.99 J384.60 F500.0
+G1 X1.64 Y-53.05 Z10.99 J388.72 F500.0
+G1 X4.76 Y-51.25 Z10.99 J392.25 F500.0
+G1 X4.76 Y-47.05 Z10.99 J396.36 F500.0
+G1 X1.64 Y-45.25 Z10.99 J399.89 F500.0
+G1 X1.64 Y-44.29 Z10.99 J400.83 F500.0
+G1 X8.22 Y-44.29 Z10.99 J407.28 F500.0
+G1 X8.22 Y-45.25 Z10.99 J408.22 F500.0
+G1 X5.11 Y-47.05 Z10.99 J411.75 F500.0
+G1 X5.11 Y-51.25 Z10.99 J415.86 F500.0
+G1 X8.22 Y-53.05 Z10.99 J419.38 F500.0
+G1 X8.22 Y-57.25 Z10.99 J423.50 F500.0
+G1 X5.11 Y-59.05 Z10.99 J427.02 F500.0
+G1 X5.11 Y-63.25 Z10.99 J431.14 F500.0
+G1 X8.22 Y-65.05 Z10.99 J434.66 F500.0
+G1 X8.22 Y-68.65 Z10.99 J438.19 F500.0
+G1 X8.57 Y-68.65 Z10.99 J438.53 F500.0
+G1 X8.57 Y-65.05 Z10.99 J442.06 F500.0
+G1 X11.69 Y-63.25 Z10.99 J445.59 F500.0
+G1 X11.69 Y-59.05 Z10.99 J449.70 F500.0
+G1 X8.57 Y-57.25 Z10.99 J453.23 F500.0
+G1 X8.57 Y-53.05 Z10.99 J457.35 F500.0
+G1 X11.69 Y-51.25 Z10.99 J460.88 F500.0
+G1 X11.69 Y-47.05 Z10.99 J464.99 F500.0
+G1 X8.57 Y-45.25 Z10.99 J468.52 F500.0
+G1 X8.57 Y-44.29 Z10.99 J469.47 F500.0
+G1 X15.15 Y-44.29 Z10.99 J475.91 F500.0
+G1 X15.15 Y-45.25 Z10.99 J476.85 F500.0
+G1 X12.03 Y-47.05 Z10.99 J480.38 F500.0
+G1 X12.03 Y-51.25 Z10.99 J484.50 F500.0
+G1 X15.15 Y-53.05 Z10.99 J488.03 F500.0
+G1 X15.15 Y-57.25 Z10.99 J492.15 F500.0
+G1 X12.03 Y-59.05 Z10.99 J495.68 F500.0
+G1 X12.03 Y-63.25 Z10.99 J499.79 F500.0
+G1 X15.15 Y-65.05 Z10.99 J503.32 F500.0
+G1 X15.15 Y-68.65 Z10.99 J506.85 F500.0
+G1 X15.50 Y-68.65 Z10.99 J507.19 F500.0
+G1 X15.50 Y-65.05 Z10.99 J510.72 F500.0
+G1 X18.62 Y-63.25 Z10.99 J514.25 F500.0
+G1 X18.62 Y-59.05 Z10.99 J518.37 F500.0
+G1 X15.50 Y-57.25 Z10.99 J521.90 F500.0
+G1 X15.50 Y-53.05 Z10.99 J526.01 F500.0
+G1 X18.62 Y-51.25 Z10.99 J529.54 F500.0
+G1 X18.62 Y-47.05 Z10.99 J533.66 F500.0
+G1 X15.50 Y-45.25 Z10.99 J537.19 F500.0
+G1 X15.50 Y-44.29 Z10.99 J538.13 F500.0
+G1 X22.08 Y-44.29 Z10.99 J544.58 F500.0
+G1 X22.08 Y-45.25 Z10.99 J545.52 F500.0
+G1 X18.96 Y-47.05 Z10.99 J549.05 F500.0
+G1 X18.96 Y-51.25 Z10.99 J553.17 F500.0
+G1 X22.08 Y-53.05 Z10.99 J556.70 F500.0
+G1 X22.08 Y-57.25 Z10.99 J560.81 F500.0
+G1 X18.96 Y-59.05 Z10.99 J564.34 F500.0
+G1 X18.96 Y-63.25 Z10.99 J568.46 F500.0
+G1 X22.08 Y-65.05 Z10.99 J571.99 F500.0
+G1 X22.08 Y-68.65 Z10.99 J575.52 F500.0
+G1 X22.43 Y-68.65 Z10.99 J575.86 F500.0
+G1 X22.43 Y-65.05 Z10.99 J579.39 F500.0
+G1 X25.54 Y-63.25 Z10.99 J582.91 F500.0
+G1 X25.54 Y-59.05 Z10.99 J587.02 F500.0
+G1 X22.43 Y-57.25 Z10.99 J590.55 F500.0
+G1 X22.43 Y-53.05 Z10.99 J594.66 F500.0
+G1 X25.54 Y-51.25 Z10.99 J598.18 F500.0
+G1 X25.54 Y-47.05 Z10.99 J602.30 F500.0
+G1 X22.43 Y-45.25 Z10.99 J605.82 F500.0
+G1 X22.43 Y-44.29 Z10.99 J606.76 F500.0
+G1 X29.01 Y-44.29 Z10.99 J613.21 F500.0
+G1 X29.01 Y-45.25 Z10.99 J614.15 F500.0
+G1 X25.89 Y-47.05 Z10.99 J617.68 F500.0
+G1 X25.89 Y-51.25 Z10.99 J621.80 F500.0
+G1 X29.01 Y-53.05 Z10.99 J625.33 F500.0
+G1 X29.01 Y-57.25 Z10.99 J629.44 F500.0
+G1 X25.89 Y-59.05 Z10.99 J632.97 F500.0
+G1 X25.89 Y-63.25 Z10.99 J637.09 F500.0
+G1 X29.01 Y-65.05 Z10.99 J640.62 F500.0
+G1 X29.01 Y-68.65 Z10.99 J644.15 F500.0
+G1 X29.36 Y-68.65 Z10.99 J644.49 F500.0
+G1 X29.36 Y-65.05 Z10.99 J648.02 F500.0
+G1 X32.47 Y-63.25 Z10.99 J651.54 F500.0
+G1 X32.47 Y-59.05 Z10.99 J655.65 F500.0
+G1 X29.36 Y-57.25 Z10.99 J659.18 F500.0
+G1 X29.36 Y-53.05 Z10.99 J663.29 F500.0
+G1 X32.47 Y-51.25 Z10.99 J666.81 F500.0
+G1 X32.47 Y-47.05 Z10.99 J670.93 F500.0
+G1 X29.36 Y-45.25 Z10.99 J674.45 F500.0
+G1 X29.36 Y-44.29 Z10.99 J675.39 F500.0
+G1 X35.22 Y-45.66 Z10.99 J681.29 F500.0
+G1 X32.82 Y-47.05 Z10.99 J684.01 F500.0
+G1 X32.82 Y-51.25 Z10.99 J688.12 F500.0
+G1 X35.22 Y-52.64 Z10.99 J690.84 F500.0
+G1 X35.22 Y-57.66 Z10.99 J695.76 F500.0
+G1 X32.82 Y-59.05 Z10.99 J698.48 F500.0
+G1 X32.82 Y-61.02 Z10.99 J705.42 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X32.82 Y-63.25 Z10.99 J705.42 F800.0
+G1 X35.22 Y-64.64 Z10.99 J705.42 F800.0
+G1 X35.22 Y-64.64 Z20.99 J705.42 F800.0
+G1 X29.67 Y-73.10 Z20.99 J715.42 F800.0
+
+T1
+G1 X34.67 Y-68.10 Z11.99 J0.00 F300.0
+G1 X34.67 Y-58.30 Z11.99 J9.60 F300.0
+G1 X34.67 Y-44.84 Z11.99 J22.79 F300.0
+G1 X15.07 Y-44.84 Z11.99 J42.00 F300.0
+G1 X-28.59 Y-44.84 Z11.99 J84.79 F500.0
+G1 X-28.59 Y-54.64 Z11.99 J94.39 F500.0
+G1 X-28.59 Y-68.10 Z11.99 J107.58 F500.0
+G1 X-8.99 Y-68.10 Z11.99 J126.79 F500.0
+G1 X29.67 Y-68.10 Z11.99 J169.68 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X34.67 Y-68.10 Z11.99 J169.68 F800.0
+G1 X34.67 Y-68.10 Z21.99 J169.68 F800.0
+G1 X29.67 Y-73.10 Z21.99 J179.68 F800.0
+
+T1
+G1 X34.67 Y-68.10 Z11.99 J0.00 F300.0
+G1 X-26.42 Y-44.84 Z11.99 J64.06 F300.0
+G1 X-26.42 Y-45.25 Z11.99 J64.46 F300.0
+G1 X-28.59 Y-46.51 Z11.99 J66.92 F300.0
+G1 X-28.59 Y-51.80 Z11.99 J72.11 F500.0
+G1 X-26.42 Y-53.05 Z11.99 J74.56 F500.0
+G1 X-26.42 Y-57.25 Z11.99 J78.68 F500.0
+G1 X-28.59 Y-58.51 Z11.99 J81.13 F500.0
+G1 X-28.59 Y-63.80 Z11.99 J86.32 F500.0
+G1 X-26.42 Y-65.05 Z11.99 J88.77 F500.0
+G1 X-26.42 Y-68.10 Z11.99 J91.76 F500.0
+G1 X-26.07 Y-68.10 Z11.99 J92.10 F500.0
+G1 X-26.07 Y-65.05 Z11.99 J95.09 F500.0
+G1 X-22.95 Y-63.25 Z11.99 J98.62 F500.0
+G1 X-22.95 Y-59.05 Z11.99 J102.74 F500.0
+G1 X-26.07 Y-57.25 Z11.99 J106.27 F500.0
+G1 X-26.07 Y-53.05 Z11.99 J110.39 F500.0
+G1 X-22.95 Y-51.25 Z11.99 J113.92 F500.0
+G1 X-22.95 Y-47.05 Z11.99 J118.03 F500.0
+G1 X-26.07 Y-45.25 Z11.99 J121.56 F500.0
+G1 X-26.07 Y-44.84 Z11.99 J121.96 F500.0
+G1 X-19.49 Y-44.84 Z11.99 J128.41 F500.0
+G1 X-19.49 Y-45.25 Z11.99 J128.81 F500.0
+G1 X-22.61 Y-47.05 Z11.99 J132.34 F500.0
+G1 X-22.61 Y-51.25 Z11.99 J136.46 F500.0
+G1 X-19.49 Y-53.05 Z11.99 J139.99 F500.0
+G1 X-19.49 Y-57.25 Z11.99 J144.11 F500.0
+G1 X-22.61 Y-59.05 Z11.99 J147.64 F500.0
+G1 X-22.61 Y-63.25 Z11.99 J151.75 F500.0
+G1 X-19.49 Y-65.05 Z11.99 J155.28 F500.0
+G1 X-19.49 Y-68.10 Z11.99 J158.27 F500.0
+G1 X-19.14 Y-68.10 Z11.99 J158.61 F500.0
+G1 X-19.14 Y-65.05 Z11.99 J161.60 F500.0
+G1 X-16.02 Y-63.25 Z11.99 J165.13 F500.0
+G1 X-16.02 Y-59.05 Z11.99 J169.25 F500.0
+G1 X-19.14 Y-57.25 Z11.99 J172.78 F500.0
+G1 X-19.14 Y-53.05 Z11.99 J176.89 F500.0
+G1 X-16.02 Y-51.25 Z11.99 J180.42 F500.0
+G1 X-16.02 Y-47.05 Z11.99 J184.54 F500.0
+G1 X-19.14 Y-45.25 Z11.99 J188.07 F500.0
+G1 X-19.14 Y-44.84 Z11.99 J188.47 F500.0
+G1 X-12.56 Y-44.84 Z11.99 J194.92 F500.0
+G1 X-12.56 Y-45.25 Z11.99 J195.32 F500.0
+G1 X-15.68 Y-47.05 Z11.99 J198.85 F500.0
+G1 X-15.68 Y-51.25 Z11.99 J202.97 F500.0
+G1 X-12.56 Y-53.05 Z11.99 J206.50 F500.0
+G1 X-12.56 Y-57.25 Z11.99 J210.61 F500.0
+G1 X-15.68 Y-59.05 Z11.99 J214.14 F500.0
+G1 X-15.68 Y-63.25 Z11.99 J218.26 F500.0
+G1 X-12.56 Y-65.05 Z11.99 J221.79 F500.0
+G1 X-12.56 Y-68.10 Z11.99 J224.78 F500.0
+G1 X-12.21 Y-68.10 Z11.99 J225.12 F500.0
+G1 X-12.21 Y-65.05 Z11.99 J228.11 F500.0
+G1 X-9.10 Y-63.25 Z11.99 J231.63 F500.0
+G1 X-9.10 Y-59.05 Z11.99 J235.75 F500.0
+G1 X-12.21 Y-57.25 Z11.99 J239.27 F500.0
+G1 X-12.21 Y-53.05 Z11.99 J243.39 F500.0
+G1 X-9.10 Y-51.25 Z11.99 J246.91 F500.0
+G1 X-9.10 Y-47.05 Z11.99 J251.02 F500.0
+G1 X-12.21 Y-45.25 Z11.99 J254.55 F500.0
+G1 X-12.21 Y-44.84 Z11.99 J254.95 F500.0
+G1 X-5.63 Y-44.84 Z11.99 J261.40 F500.0
+G1 X-5.63 Y-45.25 Z11.99 J261.80 F500.0
+G1 X-8.75 Y-47.05 Z11.99 J265.33 F500.0
+G1 X-8.75 Y-51.25 Z11.99 J269.44 F500.0
+G1 X-5.63 Y-53.05 Z11.99 J272.97 F500.0
+G1 X-5.63 Y-57.25 Z11.99 J277.09 F500.0
+G1 X-8.75 Y-59.05 Z11.99 J280.62 F500.0
+G1 X-8.75 Y-63.25 Z11.99 J284.74 F500.0
+G1 X-5.63 Y-65.05 Z11.99 J288.27 F500.0
+G1 X-5.63 Y-68.10 Z11.99 J291.25 F500.0
+G1 X-5.28 Y-68.10 Z11.99 J291.60 F500.0
+G1 X-5.28 Y-65.05 Z11.99 J294.59 F500.0
+G1 X-2.17 Y-63.25 Z11.99 J298.11 F500.0
+G1 X-2.17 Y-59.05 Z11.99 J302.22 F500.0
+G1 X-5.28 Y-57.25 Z11.99 J305.74 F500.0
+G1 X-5.28 Y-53.05 Z11.99 J309.86 F500.0
+G1 X-2.17 Y-51.25 Z11.99 J313.38 F500.0
+G1 X-2.17 Y-47.05 Z11.99 J317.50 F500.0
+G1 X-5.28 Y-45.25 Z11.99 J321.02 F500.0
+G1 X-5.28 Y-44.84 Z11.99 J321.42 F500.0
+G1 X1.30 Y-44.84 Z11.99 J327.87 F500.0
+G1 X1.30 Y-45.25 Z11.99 J328.27 F500.0
+G1 X-1.82 Y-47.05 Z11.99 J331.80 F500.0
+G1 X-1.82 Y-51.25 Z11.99 J335.92 F500.0
+G1 X1.30 Y-53.05 Z11.99 J339.45 F500.0
+G1 X1.30 Y-57.25 Z11.99 J343.56 F500.0
+G1 X-1.82 Y-59.05 Z11.99 J347.09 F500.0
+G1 X-1.82 Y-63.25 Z11.99 J351.21 F500.0
+G1 X1.30 Y-65.05 Z11.99 J354.74 F500.0
+G1 X1.30 Y-68.10 Z11.99 J357.73 F500.0
+G1 X1.64 Y-68.10 Z11.99 J358.06 F500.0
+G1 X1.64 Y-65.05 Z11.99 J361.05 F500.0
+G1 X4.76 Y-63.25 Z11.99 J364.58 F500.0
+G1 X4.76 Y-59.05 Z11.99 J368.70 F500.0
+G1 X1.64 Y-57.25 Z11.99 J372.23 F500.0
+G1 X1.64 Y-53.05 Z11.99 J376.34 F500.0
+G1 X4.76 Y-51.25 Z11.99 J379.87 F500.0
+G1 X4.76 Y-47.05 Z11.99 J383.99 F500.0
+G1 X1.64 Y-45.25 Z11.99 J387.52 F500.0
+G1 X1.64 Y-44.84 Z11.99 J387.92 F500.0
+G1 X8.22 Y-44.84 Z11.99 J394.37 F500.0
+G1 X8.22 Y-45.25 Z11.99 J394.77 F500.0
+G1 X5.11 Y-47.05 Z11.99 J398.29 F500.0
+G1 X5.11 Y-51.25 Z11.99 J402.41 F500.0
+G1 X8.22 Y-53.05 Z11.99 J405.93 F500.0
+G1 X8.22 Y-57.25 Z11.99 J410.05 F500.0
+G1 X5.11 Y-59.05 Z11.99 J413.57 F500.0
+G1 X5.11 Y-63.25 Z11.99 J417.68 F500.0
+G1 X8.22 Y-65.05 Z11.99 J421.20 F500.0
+G1 X8.22 Y-68.10 Z11.99 J424.19 F500.0
+G1 X8.57 Y-68.10 Z11.99 J424.54 F500.0
+G1 X8.57 Y-65.05 Z11.99 J427.53 F500.0
+G1 X11.69 Y-63.25 Z11.99 J431.06 F500.0
+G1 X11.69 Y-59.05 Z11.99 J435.17 F500.0
+G1 X8.57 Y-57.25 Z11.99 J438.70 F500.0
+G1 X8.57 Y-53.05 Z11.99 J442.82 F500.0
+G1 X11.69 Y-51.25 Z11.99 J446.35 F500.0
+G1 X11.69 Y-47.05 Z11.99 J450.46 F500.0
+G1 X8.57 Y-45.25 Z11.99 J453.99 F500.0
+G1 X8.57 Y-44.84 Z11.99 J454.40 F500.0
+G1 X15.15 Y-44.84 Z11.99 J460.84 F500.0
+G1 X15.15 Y-45.25 Z11.99 J461.25 F500.0
+G1 X12.03 Y-47.05 Z11.99 J464.78 F500.0
+G1 X12.03 Y-51.25 Z11.99 J468.89 F500.0
+G1 X15.15 Y-53.05 Z11.99 J472.42 F500.0
+G1 X15.15 Y-57.25 Z11.99 J476.54 F500.0
+G1 X12.03 Y-59.05 Z11.99 J480.07 F500.0
+G1 X12.03 Y-63.25 Z11.99 J484.18 F500.0
+G1 X15.15 Y-65.05 Z11.99 J487.71 F500.0
+G1 X15.15 Y-68.10 Z11.99 J490.70 F500.0
+G1 X15.50 Y-68.10 Z11.99 J491.05 F500.0
+G1 X15.50 Y-65.05 Z11.99 J494.03 F500.0
+G1 X18.62 Y-63.25 Z11.99 J497.56 F500.0
+G1 X18.62 Y-59.05 Z11.99 J501.68 F500.0
+G1 X15.50 Y-57.25 Z11.99 J505.21 F500.0
+G1 X15.50 Y-53.05 Z11.99 J509.33 F500.0
+G1 X18.62 Y-51.25 Z11.99 J512.86 F500.0
+G1 X18.62 Y-47.05 Z11.99 J516.97 F500.0
+G1 X15.50 Y-45.25 Z11.99 J520.50 F500.0
+G1 X15.50 Y-44.84 Z11.99 J520.90 F500.0
+G1 X22.08 Y-44.84 Z11.99 J527.35 F500.0
+G1 X22.08 Y-45.25 Z11.99 J527.75 F500.0
+G1 X18.96 Y-47.05 Z11.99 J531.28 F500.0
+G1 X18.96 Y-51.25 Z11.99 J535.40 F500.0
+G1 X22.08 Y-53.05 Z11.99 J538.93 F500.0
+G1 X22.08 Y-57.25 Z11.99 J543.05 F500.0
+G1 X18.96 Y-59.05 Z11.99 J546.58 F500.0
+G1 X18.96 Y-63.25 Z11.99 J550.69 F500.0
+G1 X22.08 Y-65.05 Z11.99 J554.22 F500.0
+G1 X22.08 Y-68.10 Z11.99 J557.21 F500.0
+G1 X22.43 Y-68.10 Z11.99 J557.55 F500.0
+G1 X22.43 Y-65.05 Z11.99 J560.54 F500.0
+G1 X25.54 Y-63.25 Z11.99 J564.06 F500.0
+G1 X25.54 Y-59.05 Z11.99 J568.18 F500.0
+G1 X22.43 Y-57.25 Z11.99 J571.70 F500.0
+G1 X22.43 Y-53.05 Z11.99 J575.82 F500.0
+G1 X25.54 Y-51.25 Z11.99 J579.34 F500.0
+G1 X25.54 Y-47.05 Z11.99 J583.46 F500.0
+G1 X22.43 Y-45.25 Z11.99 J586.98 F500.0
+G1 X22.43 Y-44.84 Z11.99 J587.38 F500.0
+G1 X29.01 Y-44.84 Z11.99 J593.83 F500.0
+G1 X29.01 Y-45.25 Z11.99 J594.23 F500.0
+G1 X25.89 Y-47.05 Z11.99 J597.76 F500.0
+G1 X25.89 Y-51.25 Z11.99 J601.87 F500.0
+G1 X29.01 Y-53.05 Z11.99 J605.40 F500.0
+G1 X29.01 Y-57.25 Z11.99 J609.52 F500.0
+G1 X25.89 Y-59.05 Z11.99 J613.05 F500.0
+G1 X25.89 Y-63.25 Z11.99 J617.17 F500.0
+G1 X29.01 Y-65.05 Z11.99 J620.70 F500.0
+G1 X29.01 Y-68.10 Z11.99 J623.69 F500.0
+G1 X29.36 Y-68.10 Z11.99 J624.03 F500.0
+G1 X29.36 Y-65.05 Z11.99 J627.02 F500.0
+G1 X32.47 Y-63.25 Z11.99 J630.54 F500.0
+G1 X32.47 Y-59.05 Z11.99 J634.66 F500.0
+G1 X29.36 Y-57.25 Z11.99 J638.18 F500.0
+G1 X29.36 Y-53.05 Z11.99 J642.29 F500.0
+G1 X32.47 Y-51.25 Z11.99 J645.81 F500.0
+G1 X32.47 Y-47.05 Z11.99 J649.93 F500.0
+G1 X29.36 Y-45.25 Z11.99 J653.45 F500.0
+G1 X29.36 Y-44.84 Z11.99 J653.85 F500.0
+G1 X34.67 Y-45.98 Z11.99 J659.18 F500.0
+G1 X32.82 Y-47.05 Z11.99 J661.27 F500.0
+G1 X32.82 Y-51.25 Z11.99 J665.39 F500.0
+G1 X34.67 Y-52.32 Z11.99 J667.48 F500.0
+G1 X34.67 Y-57.98 Z11.99 J673.03 F500.0
+G1 X32.82 Y-59.05 Z11.99 J675.12 F500.0
+G1 X32.82 Y-60.39 Z11.99 J681.43 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X32.82 Y-63.25 Z11.99 J681.43 F800.0
+G1 X34.67 Y-64.32 Z11.99 J681.43 F800.0
+G1 X34.67 Y-64.32 Z21.99 J681.43 F800.0
+G1 X29.12 Y-72.55 Z21.99 J691.43 F800.0
+
+T1
+G1 X34.12 Y-67.55 Z12.99 J0.00 F300.0
+G1 X34.12 Y-59.75 Z12.99 J7.64 F300.0
+G1 X34.12 Y-45.39 Z12.99 J21.72 F300.0
+G1 X18.52 Y-45.39 Z12.99 J37.00 F300.0
+G1 X-28.04 Y-45.39 Z12.99 J82.63 F500.0
+G1 X-28.04 Y-53.19 Z12.99 J90.28 F500.0
+G1 X-28.04 Y-67.55 Z12.99 J104.35 F500.0
+G1 X-12.44 Y-67.55 Z12.99 J119.64 F500.0
+G1 X29.12 Y-67.55 Z12.99 J165.37 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X34.12 Y-67.55 Z12.99 J165.37 F800.0
+G1 X34.12 Y-67.55 Z22.99 J165.37 F800.0
+G1 X29.12 Y-72.55 Z22.99 J175.37 F800.0
+
+T1
+G1 X34.12 Y-67.55 Z12.99 J0.00 F300.0
+G1 X-26.66 Y-45.39 Z12.99 J63.40 F300.0
+G1 X-28.04 Y-46.19 Z12.99 J64.96 F300.0
+G1 X-28.04 Y-52.12 Z12.99 J70.77 F300.0
+G1 X-26.42 Y-53.05 Z12.99 J72.60 F500.0
+G1 X-26.42 Y-57.25 Z12.99 J76.72 F500.0
+G1 X-28.04 Y-58.19 Z12.99 J78.55 F500.0
+G1 X-28.04 Y-64.12 Z12.99 J84.37 F500.0
+G1 X-26.42 Y-65.05 Z12.99 J86.20 F500.0
+G1 X-26.42 Y-67.55 Z12.99 J88.65 F500.0
+G1 X-26.07 Y-67.55 Z12.99 J88.99 F500.0
+G1 X-26.07 Y-65.05 Z12.99 J91.44 F500.0
+G1 X-22.95 Y-63.25 Z12.99 J94.97 F500.0
+G1 X-22.95 Y-59.05 Z12.99 J99.08 F500.0
+G1 X-26.07 Y-57.25 Z12.99 J102.61 F500.0
+G1 X-26.07 Y-53.05 Z12.99 J106.73 F500.0
+G1 X-22.95 Y-51.25 Z12.99 J110.26 F500.0
+G1 X-22.95 Y-47.05 Z12.99 J114.38 F500.0
+G1 X-25.82 Y-45.39 Z12.99 J117.63 F500.0
+G1 X-19.74 Y-45.39 Z12.99 J123.58 F500.0
+G1 X-22.61 Y-47.05 Z12.99 J126.83 F500.0
+G1 X-22.61 Y-51.25 Z12.99 J130.95 F500.0
+G1 X-19.49 Y-53.05 Z12.99 J134.48 F500.0
+G1 X-19.49 Y-57.25 Z12.99 J138.60 F500.0
+G1 X-22.61 Y-59.05 Z12.99 J142.13 F500.0
+G1 X-22.61 Y-63.25 Z12.99 J146.24 F500.0
+G1 X-19.49 Y-65.05 Z12.99 J149.77 F500.0
+G1 X-19.49 Y-67.55 Z12.99 J152.22 F500.0
+G1 X-19.14 Y-67.55 Z12.99 J152.56 F500.0
+G1 X-19.14 Y-65.05 Z12.99 J155.01 F500.0
+G1 X-16.02 Y-63.25 Z12.99 J158.54 F500.0
+G1 X-16.02 Y-59.05 Z12.99 J162.66 F500.0
+G1 X-19.14 Y-57.25 Z12.99 J166.19 F500.0
+G1 X-19.14 Y-53.05 Z12.99 J170.31 F500.0
+G1 X-16.02 Y-51.25 Z12.99 J173.84 F500.0
+G1 X-16.02 Y-47.05 Z12.99 J177.95 F500.0
+G1 X-18.89 Y-45.39 Z12.99 J181.20 F500.0
+G1 X-12.81 Y-45.39 Z12.99 J187.16 F500.0
+G1 X-15.68 Y-47.05 Z12.99 J190.41 F500.0
+G1 X-15.68 Y-51.25 Z12.99 J194.52 F500.0
+G1 X-12.56 Y-53.05 Z12.99 J198.05 F500.0
+G1 X-12.56 Y-57.25 Z12.99 J202.17 F500.0
+G1 X-15.68 Y-59.05 Z12.99 J205.70 F500.0
+G1 X-15.68 Y-63.25 Z12.99 J209.82 F500.0
+G1 X-12.56 Y-65.05 Z12.99 J213.35 F500.0
+G1 X-12.56 Y-67.55 Z12.99 J215.80 F500.0
+G1 X-12.21 Y-67.55 Z12.99 J216.14 F500.0
+G1 X-12.21 Y-65.05 Z12.99 J218.59 F500.0
+G1 X-9.10 Y-63.25 Z12.99 J222.11 F500.0
+G1 X-9.10 Y-59.05 Z12.99 J226.23 F500.0
+G1 X-12.21 Y-57.25 Z12.99 J229.75 F500.0
+G1 X-12.21 Y-53.05 Z12.99 J233.86 F500.0
+G1 X-9.10 Y-51.25 Z12.99 J237.39 F500.0
+G1 X-9.10 Y-47.05 Z12.99 J241.50 F500.0
+G1 X-11.97 Y-45.39 Z12.99 J244.75 F500.0
+G1 X-5.88 Y-45.39 Z12.99 J250.72 F500.0
+G1 X-8.75 Y-47.05 Z12.99 J253.97 F500.0
+G1 X-8.75 Y-51.25 Z12.99 J258.08 F500.0
+G1 X-5.63 Y-53.05 Z12.99 J261.61 F500.0
+G1 X-5.63 Y-57.25 Z12.99 J265.73 F500.0
+G1 X-8.75 Y-59.05 Z12.99 J269.26 F500.0
+G1 X-8.75 Y-63.25 Z12.99 J273.38 F500.0
+G1 X-5.63 Y-65.05 Z12.99 J276.91 F500.0
+G1 X-5.63 Y-67.55 Z12.99 J279.36 F500.0
+G1 X-5.28 Y-67.55 Z12.99 J279.70 F500.0
+G1 X-5.28 Y-65.05 Z12.99 J282.15 F500.0
+G1 X-2.17 Y-63.25 Z12.99 J285.67 F500.0
+G1 X-2.17 Y-59.05 Z12.99 J289.79 F500.0
+G1 X-5.28 Y-57.25 Z12.99 J293.31 F500.0
+G1 X-5.28 Y-53.05 Z12.99 J297.42 F500.0
+G1 X-2.17 Y-51.25 Z12.99 J300.95 F500.0
+G1 X-2.17 Y-47.05 Z12.99 J305.06 F500.0
+G1 X-5.04 Y-45.39 Z12.99 J308.31 F500.0
+G1 X1.05 Y-45.39 Z12.99 J314.28 F500.0
+G1 X-1.82 Y-47.05 Z12.99 J317.53 F500.0
+G1 X-1.82 Y-51.25 Z12.99 J321.64 F500.0
+G1 X1.30 Y-53.05 Z12.99 J325.17 F500.0
+G1 X1.30 Y-57.25 Z12.99 J329.29 F500.0
+G1 X-1.82 Y-59.05 Z12.99 J332.82 F500.0
+G1 X-1.82 Y-63.25 Z12.99 J336.94 F500.0
+G1 X1.30 Y-65.05 Z12.99 J340.47 F500.0
+G1 X1.30 Y-67.55 Z12.99 J342.92 F500.0
+G1 X1.64 Y-67.55 Z12.99 J343.25 F500.0
+G1 X1.64 Y-65.05 Z12.99 J345.70 F500.0
+G1 X4.76 Y-63.25 Z12.99 J349.23 F500.0
+G1 X4.76 Y-59.05 Z12.99 J353.35 F500.0
+G1 X1.64 Y-57.25 Z12.99 J356.88 F500.0
+G1 X1.64 Y-53.05 Z12.99 J360.99 F500.0
+G1 X4.76 Y-51.25 Z12.99 J364.52 F500.0
+G1 X4.76 Y-47.05 Z12.99 J368.64 F500.0
+G1 X1.89 Y-45.39 Z12.99 J371.89 F500.0
+G1 X7.98 Y-45.39 Z12.99 J377.86 F500.0
+G1 X5.11 Y-47.05 Z12.99 J381.10 F500.0
+G1 X5.11 Y-51.25 Z12.99 J385.22 F500.0
+G1 X8.22 Y-53.05 Z12.99 J388.74 F500.0
+G1 X8.22 Y-57.25 Z12.99 J392.86 F500.0
+G1 X5.11 Y-59.05 Z12.99 J396.38 F500.0
+G1 X5.11 Y-63.25 Z12.99 J400.50 F500.0
+G1 X8.22 Y-65.05 Z12.99 J404.02 F500.0
+G1 X8.22 Y-67.55 Z12.99 J406.47 F500.0
+G1 X8.57 Y-67.55 Z12.99 J406.81 F500.0
+G1 X8.57 Y-65.05 Z12.99 J409.26 F500.0
+G1 X11.69 Y-63.25 Z12.99 J412.79 F500.0
+G1 X11.69 Y-59.05 Z12.99 J416.91 F500.0
+G1 X8.57 Y-57.25 Z12.99 J420.44 F500.0
+G1 X8.57 Y-53.05 Z12.99 J424.55 F500.0
+G1 X11.69 Y-51.25 Z12.99 J428.08 F500.0
+G1 X11.69 Y-47.05 Z12.99 J432.20 F500.0
+G1 X8.82 Y-45.39 Z12.99 J435.45 F500.0
+G1 X14.91 Y-45.39 Z12.99 J441.41 F500.0
+G1 X12.03 Y-47.05 Z12.99 J444.67 F500.0
+G1 X12.03 Y-51.25 Z12.99 J448.79 F500.0
+G1 X15.15 Y-53.05 Z12.99 J452.32 F500.0
+G1 X15.15 Y-57.25 Z12.99 J456.43 F500.0
+G1 X12.03 Y-59.05 Z12.99 J459.96 F500.0
+G1 X12.03 Y-63.25 Z12.99 J464.08 F500.0
+G1 X15.15 Y-65.05 Z12.99 J467.61 F500.0
+G1 X15.15 Y-67.55 Z12.99 J470.06 F500.0
+G1 X15.50 Y-67.55 Z12.99 J470.40 F500.0
+G1 X15.50 Y-65.05 Z12.99 J472.85 F500.0
+G1 X18.62 Y-63.25 Z12.99 J476.38 F500.0
+G1 X18.62 Y-59.05 Z12.99 J480.50 F500.0
+G1 X15.50 Y-57.25 Z12.99 J484.03 F500.0
+G1 X15.50 Y-53.05 Z12.99 J488.15 F500.0
+G1 X18.62 Y-51.25 Z12.99 J491.68 F500.0
+G1 X18.62 Y-47.05 Z12.99 J495.79 F500.0
+G1 X15.75 Y-45.39 Z12.99 J499.04 F500.0
+G1 X21.83 Y-45.39 Z12.99 J505.00 F500.0
+G1 X18.96 Y-47.05 Z12.99 J508.25 F500.0
+G1 X18.96 Y-51.25 Z12.99 J512.36 F500.0
+G1 X22.08 Y-53.05 Z12.99 J515.89 F500.0
+G1 X22.08 Y-57.25 Z12.99 J520.01 F500.0
+G1 X18.96 Y-59.05 Z12.99 J523.54 F500.0
+G1 X18.96 Y-63.25 Z12.99 J527.66 F500.0
+G1 X22.08 Y-65.05 Z12.99 J531.19 F500.0
+G1 X22.08 Y-67.55 Z12.99 J533.64 F500.0
+G1 X22.43 Y-67.55 Z12.99 J533.98 F500.0
+G1 X22.43 Y-65.05 Z12.99 J536.43 F500.0
+G1 X25.54 Y-63.25 Z12.99 J539.95 F500.0
+G1 X25.54 Y-59.05 Z12.99 J544.07 F500.0
+G1 X22.43 Y-57.25 Z12.99 J547.59 F500.0
+G1 X22.43 Y-53.05 Z12.99 J551.70 F500.0
+G1 X25.54 Y-51.25 Z12.99 J555.23 F500.0
+G1 X25.54 Y-47.05 Z12.99 J559.34 F500.0
+G1 X22.68 Y-45.39 Z12.99 J562.58 F500.0
+G1 X28.76 Y-45.39 Z12.99 J568.54 F500.0
+G1 X25.89 Y-47.05 Z12.99 J571.79 F500.0
+G1 X25.89 Y-51.25 Z12.99 J575.91 F500.0
+G1 X29.01 Y-53.05 Z12.99 J579.44 F500.0
+G1 X29.01 Y-57.25 Z12.99 J583.55 F500.0
+G1 X25.89 Y-59.05 Z12.99 J587.08 F500.0
+G1 X25.89 Y-63.25 Z12.99 J591.20 F500.0
+G1 X29.01 Y-65.05 Z12.99 J594.73 F500.0
+G1 X29.01 Y-67.55 Z12.99 J597.18 F500.0
+G1 X29.36 Y-67.55 Z12.99 J597.52 F500.0
+G1 X29.36 Y-65.05 Z12.99 J599.97 F500.0
+G1 X32.47 Y-63.25 Z12.99 J603.49 F500.0
+G1 X32.47 Y-59.05 Z12.99 J607.61 F500.0
+G1 X29.36 Y-57.25 Z12.99 J611.13 F500.0
+G1 X29.36 Y-53.05 Z12.99 J615.25 F500.0
+G1 X32.47 Y-51.25 Z12.99 J618.77 F500.0
+G1 X32.47 Y-47.05 Z12.99 J622.88 F500.0
+G1 X29.60 Y-45.39 Z12.99 J626.13 F500.0
+G1 X34.12 Y-46.30 Z12.99 J630.65 F500.0
+G1 X32.82 Y-47.05 Z12.99 J632.12 F500.0
+G1 X32.82 Y-51.25 Z12.99 J636.24 F500.0
+G1 X34.12 Y-52.00 Z12.99 J637.71 F500.0
+G1 X34.12 Y-58.30 Z12.99 J643.88 F500.0
+G1 X32.82 Y-59.05 Z12.99 J645.35 F500.0
+G1 X32.82 Y-59.75 Z12.99 J651.04 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X32.82 Y-63.25 Z12.99 J651.04 F800.0
+G1 X34.12 Y-64.00 Z12.99 J651.04 F800.0
+G1 X34.12 Y-64.00 Z22.99 J651.04 F800.0
+G1 X28.56 Y-71.99 Z22.99 J661.04 F800.0
+
+T1
+G1 X33.56 Y-66.99 Z13.99 J0.00 F300.0
+G1 X33.56 Y-61.19 Z13.99 J5.68 F300.0
+G1 X33.56 Y-45.95 Z13.99 J20.62 F300.0
+G1 X21.96 Y-45.95 Z13.99 J31.99 F300.0
+G1 X-27.48 Y-45.95 Z13.99 J80.44 F500.0
+G1 X-27.48 Y-51.75 Z13.99 J86.12 F500.0
+G1 X-27.48 Y-66.99 Z13.99 J101.06 F500.0
+G1 X-15.88 Y-66.99 Z13.99 J112.43 F500.0
+G1 X28.56 Y-66.99 Z13.99 J160.98 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X33.56 Y-66.99 Z13.99 J160.98 F800.0
+G1 X33.56 Y-66.99 Z23.99 J160.98 F800.0
+G1 X28.56 Y-71.99 Z23.99 J170.98 F800.0
+
+T1
+G1 X33.56 Y-66.99 Z13.99 J0.00 F300.0
+G1 X-27.48 Y-52.44 Z13.99 J61.49 F300.0
+G1 X-26.42 Y-53.05 Z13.99 J62.69 F300.0
+G1 X-26.42 Y-57.25 Z13.99 J66.81 F300.0
+G1 X-27.48 Y-57.87 Z13.99 J68.01 F500.0
+G1 X-27.48 Y-64.44 Z13.99 J74.45 F500.0
+G1 X-26.42 Y-65.05 Z13.99 J75.65 F500.0
+G1 X-26.42 Y-66.99 Z13.99 J77.55 F500.0
+G1 X-26.07 Y-66.99 Z13.99 J77.89 F500.0
+G1 X-26.07 Y-65.05 Z13.99 J79.79 F500.0
+G1 X-22.95 Y-63.25 Z13.99 J83.32 F500.0
+G1 X-22.95 Y-59.05 Z13.99 J87.44 F500.0
+G1 X-26.07 Y-57.25 Z13.99 J90.97 F500.0
+G1 X-26.07 Y-53.05 Z13.99 J95.08 F500.0
+G1 X-22.95 Y-51.25 Z13.99 J98.61 F500.0
+G1 X-22.95 Y-47.05 Z13.99 J102.73 F500.0
+G1 X-24.86 Y-45.95 Z13.99 J104.89 F500.0
+G1 X-20.70 Y-45.95 Z13.99 J108.97 F500.0
+G1 X-22.61 Y-47.05 Z13.99 J111.13 F500.0
+G1 X-22.61 Y-51.25 Z13.99 J115.24 F500.0
+G1 X-19.49 Y-53.05 Z13.99 J118.77 F500.0
+G1 X-19.49 Y-57.25 Z13.99 J122.89 F500.0
+G1 X-22.61 Y-59.05 Z13.99 J126.42 F500.0
+G1 X-22.61 Y-63.25 Z13.99 J130.54 F500.0
+G1 X-19.49 Y-65.05 Z13.99 J134.07 F500.0
+G1 X-19.49 Y-66.99 Z13.99 J135.97 F500.0
+G1 X-19.14 Y-66.99 Z13.99 J136.31 F500.0
+G1 X-19.14 Y-65.05 Z13.99 J138.21 F500.0
+G1 X-16.02 Y-63.25 Z13.99 J141.74 F500.0
+G1 X-16.02 Y-59.05 Z13.99 J145.86 F500.0
+G1 X-19.14 Y-57.25 Z13.99 J149.39 F500.0
+G1 X-19.14 Y-53.05 Z13.99 J153.50 F500.0
+G1 X-16.02 Y-51.25 Z13.99 J157.03 F500.0
+G1 X-16.02 Y-47.05 Z13.99 J161.15 F500.0
+G1 X-17.93 Y-45.95 Z13.99 J163.31 F500.0
+G1 X-13.77 Y-45.95 Z13.99 J167.39 F500.0
+G1 X-15.68 Y-47.05 Z13.99 J169.55 F500.0
+G1 X-15.68 Y-51.25 Z13.99 J173.66 F500.0
+G1 X-12.56 Y-53.05 Z13.99 J177.19 F500.0
+G1 X-12.56 Y-57.25 Z13.99 J181.31 F500.0
+G1 X-15.68 Y-59.05 Z13.99 J184.84 F500.0
+G1 X-15.68 Y-63.25 Z13.99 J188.95 F500.0
+G1 X-12.56 Y-65.05 Z13.99 J192.48 F500.0
+G1 X-12.56 Y-66.99 Z13.99 J194.38 F500.0
+G1 X-12.21 Y-66.99 Z13.99 J194.73 F500.0
+G1 X-12.21 Y-65.05 Z13.99 J196.63 F500.0
+G1 X-9.10 Y-63.25 Z13.99 J200.15 F500.0
+G1 X-9.10 Y-59.05 Z13.99 J204.27 F500.0
+G1 X-12.21 Y-57.25 Z13.99 J207.79 F500.0
+G1 X-12.21 Y-53.05 Z13.99 J211.90 F500.0
+G1 X-9.10 Y-51.25 Z13.99 J215.42 F500.0
+G1 X-9.10 Y-47.05 Z13.99 J219.54 F500.0
+G1 X-11.00 Y-45.95 Z13.99 J221.69 F500.0
+G1 X-6.84 Y-45.95 Z13.99 J225.77 F500.0
+G1 X-8.75 Y-47.05 Z13.99 J227.93 F500.0
+G1 X-8.75 Y-51.25 Z13.99 J232.05 F500.0
+G1 X-5.63 Y-53.05 Z13.99 J235.58 F500.0
+G1 X-5.63 Y-57.25 Z13.99 J239.69 F500.0
+G1 X-8.75 Y-59.05 Z13.99 J243.22 F500.0
+G1 X-8.75 Y-63.25 Z13.99 J247.34 F500.0
+G1 X-5.63 Y-65.05 Z13.99 J250.87 F500.0
+G1 X-5.63 Y-66.99 Z13.99 J252.77 F500.0
+G1 X-5.28 Y-66.99 Z13.99 J253.11 F500.0
+G1 X-5.28 Y-65.05 Z13.99 J255.01 F500.0
+G1 X-2.17 Y-63.25 Z13.99 J258.53 F500.0
+G1 X-2.17 Y-59.05 Z13.99 J262.65 F500.0
+G1 X-5.28 Y-57.25 Z13.99 J266.17 F500.0
+G1 X-5.28 Y-53.05 Z13.99 J270.29 F500.0
+G1 X-2.17 Y-51.25 Z13.99 J273.81 F500.0
+G1 X-2.17 Y-47.05 Z13.99 J277.92 F500.0
+G1 X-4.08 Y-45.95 Z13.99 J280.09 F500.0
+G1 X0.09 Y-45.95 Z13.99 J284.17 F500.0
+G1 X-1.82 Y-47.05 Z13.99 J286.33 F500.0
+G1 X-1.82 Y-51.25 Z13.99 J290.45 F500.0
+G1 X1.30 Y-53.05 Z13.99 J293.98 F500.0
+G1 X1.30 Y-57.25 Z13.99 J298.09 F500.0
+G1 X-1.82 Y-59.05 Z13.99 J301.62 F500.0
+G1 X-1.82 Y-63.25 Z13.99 J305.74 F500.0
+G1 X1.30 Y-65.05 Z13.99 J309.27 F500.0
+G1 X1.30 Y-66.99 Z13.99 J311.17 F500.0
+G1 X1.64 Y-66.99 Z13.99 J311.50 F500.0
+G1 X1.64 Y-65.05 Z13.99 J313.41 F500.0
+G1 X4.76 Y-63.25 Z13.99 J316.94 F500.0
+G1 X4.76 Y-59.05 Z13.99 J321.05 F500.0
+G1 X1.64 Y-57.25 Z13.99 J324.58 F500.0
+G1 X1.64 Y-53.05 Z13.99 J328.70 F500.0
+G1 X4.76 Y-51.25 Z13.99 J332.23 F500.0
+G1 X4.76 Y-47.05 Z13.99 J336.34 F500.0
+G1 X2.85 Y-45.95 Z13.99 J338.50 F500.0
+G1 X7.02 Y-45.95 Z13.99 J342.59 F500.0
+G1 X5.11 Y-47.05 Z13.99 J344.75 F500.0
+G1 X5.11 Y-51.25 Z13.99 J348.87 F500.0
+G1 X8.22 Y-53.05 Z13.99 J352.39 F500.0
+G1 X8.22 Y-57.25 Z13.99 J356.50 F500.0
+G1 X5.11 Y-59.05 Z13.99 J360.02 F500.0
+G1 X5.11 Y-63.25 Z13.99 J364.14 F500.0
+G1 X8.22 Y-65.05 Z13.99 J367.66 F500.0
+G1 X8.22 Y-66.99 Z13.99 J369.56 F500.0
+G1 X8.57 Y-66.99 Z13.99 J369.91 F500.0
+G1 X8.57 Y-65.05 Z13.99 J371.81 F500.0
+G1 X11.69 Y-63.25 Z13.99 J375.34 F500.0
+G1 X11.69 Y-59.05 Z13.99 J379.45 F500.0
+G1 X8.57 Y-57.25 Z13.99 J382.98 F500.0
+G1 X8.57 Y-53.05 Z13.99 J387.10 F500.0
+G1 X11.69 Y-51.25 Z13.99 J390.63 F500.0
+G1 X11.69 Y-47.05 Z13.99 J394.75 F500.0
+G1 X9.78 Y-45.95 Z13.99 J396.91 F500.0
+G1 X13.94 Y-45.95 Z13.99 J400.98 F500.0
+G1 X12.03 Y-47.05 Z13.99 J403.14 F500.0
+G1 X12.03 Y-51.25 Z13.99 J407.26 F500.0
+G1 X15.15 Y-53.05 Z13.99 J410.79 F500.0
+G1 X15.15 Y-57.25 Z13.99 J414.90 F500.0
+G1 X12.03 Y-59.05 Z13.99 J418.43 F500.0
+G1 X12.03 Y-63.25 Z13.99 J422.55 F500.0
+G1 X15.15 Y-65.05 Z13.99 J426.08 F500.0
+G1 X15.15 Y-66.99 Z13.99 J427.98 F500.0
+G1 X15.50 Y-66.99 Z13.99 J428.32 F500.0
+G1 X15.50 Y-65.05 Z13.99 J430.23 F500.0
+G1 X18.62 Y-63.25 Z13.99 J433.76 F500.0
+G1 X18.62 Y-59.05 Z13.99 J437.87 F500.0
+G1 X15.50 Y-57.25 Z13.99 J441.40 F500.0
+G1 X15.50 Y-53.05 Z13.99 J445.52 F500.0
+G1 X18.62 Y-51.25 Z13.99 J449.05 F500.0
+G1 X18.62 Y-47.05 Z13.99 J453.16 F500.0
+G1 X16.71 Y-45.95 Z13.99 J455.32 F500.0
+G1 X20.87 Y-45.95 Z13.99 J459.40 F500.0
+G1 X18.96 Y-47.05 Z13.99 J461.56 F500.0
+G1 X18.96 Y-51.25 Z13.99 J465.68 F500.0
+G1 X22.08 Y-53.05 Z13.99 J469.21 F500.0
+G1 X22.08 Y-57.25 Z13.99 J473.32 F500.0
+G1 X18.96 Y-59.05 Z13.99 J476.85 F500.0
+G1 X18.96 Y-63.25 Z13.99 J480.97 F500.0
+G1 X22.08 Y-65.05 Z13.99 J484.50 F500.0
+G1 X22.08 Y-66.99 Z13.99 J486.40 F500.0
+G1 X22.43 Y-66.99 Z13.99 J486.74 F500.0
+G1 X22.43 Y-65.05 Z13.99 J488.64 F500.0
+G1 X25.54 Y-63.25 Z13.99 J492.16 F500.0
+G1 X25.54 Y-59.05 Z13.99 J496.28 F500.0
+G1 X22.43 Y-57.25 Z13.99 J499.80 F500.0
+G1 X22.43 Y-53.05 Z13.99 J503.92 F500.0
+G1 X25.54 Y-51.25 Z13.99 J507.44 F500.0
+G1 X25.54 Y-47.05 Z13.99 J511.56 F500.0
+G1 X23.64 Y-45.95 Z13.99 J513.71 F500.0
+G1 X27.80 Y-45.95 Z13.99 J517.78 F500.0
+G1 X25.89 Y-47.05 Z13.99 J519.94 F500.0
+G1 X25.89 Y-51.25 Z13.99 J524.06 F500.0
+G1 X29.01 Y-53.05 Z13.99 J527.59 F500.0
+G1 X29.01 Y-57.25 Z13.99 J531.71 F500.0
+G1 X25.89 Y-59.05 Z13.99 J535.24 F500.0
+G1 X25.89 Y-63.25 Z13.99 J539.35 F500.0
+G1 X29.01 Y-65.05 Z13.99 J542.88 F500.0
+G1 X29.01 Y-66.99 Z13.99 J544.78 F500.0
+G1 X29.36 Y-66.99 Z13.99 J545.13 F500.0
+G1 X29.36 Y-65.05 Z13.99 J547.03 F500.0
+G1 X32.47 Y-63.25 Z13.99 J550.55 F500.0
+G1 X32.47 Y-59.05 Z13.99 J554.67 F500.0
+G1 X29.36 Y-57.25 Z13.99 J558.19 F500.0
+G1 X29.36 Y-53.05 Z13.99 J562.30 F500.0
+G1 X32.47 Y-51.25 Z13.99 J565.82 F500.0
+G1 X32.47 Y-47.05 Z13.99 J569.94 F500.0
+G1 X30.56 Y-45.95 Z13.99 J572.10 F500.0
+G1 X33.56 Y-46.62 Z13.99 J575.11 F500.0
+G1 X32.82 Y-47.05 Z13.99 J575.95 F500.0
+G1 X32.82 Y-51.25 Z13.99 J580.07 F500.0
+G1 X33.56 Y-51.68 Z13.99 J580.91 F500.0
+G1 X33.56 Y-58.62 Z13.99 J587.71 F500.0
+G1 X32.82 Y-59.05 Z13.99 J588.55 F500.0
+G1 X32.82 Y-59.11 Z13.99 J593.60 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X32.82 Y-63.25 Z13.99 J593.60 F800.0
+G1 X33.56 Y-63.68 Z13.99 J593.60 F800.0
+G1 X33.56 Y-63.68 Z23.99 J593.60 F800.0
+G1 X28.01 Y-71.44 Z23.99 J603.60 F800.0
+
+T1
+G1 X33.01 Y-66.44 Z14.99 J0.00 F300.0
+G1 X33.01 Y-62.64 Z14.99 J3.72 F300.0
+G1 X33.01 Y-46.50 Z14.99 J19.54 F300.0
+G1 X25.41 Y-46.50 Z14.99 J26.99 F300.0
+G1 X-26.93 Y-46.50 Z14.99 J78.28 F500.0
+G1 X-26.93 Y-50.30 Z14.99 J82.01 F500.0
+G1 X-26.93 Y-66.44 Z14.99 J97.82 F500.0
+G1 X-19.33 Y-66.44 Z14.99 J105.27 F500.0
+G1 X28.01 Y-66.44 Z14.99 J156.66 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X33.01 Y-66.44 Z14.99 J156.66 F800.0
+G1 X33.01 Y-66.44 Z24.99 J156.66 F800.0
+G1 X28.01 Y-71.44 Z24.99 J166.66 F800.0
+
+T1
+G1 X33.01 Y-66.44 Z14.99 J0.00 F300.0
+G1 X-26.93 Y-52.76 Z14.99 J60.26 F300.0
+G1 X-26.42 Y-53.05 Z14.99 J60.83 F300.0
+G1 X-26.42 Y-57.25 Z14.99 J64.95 F300.0
+G1 X-26.93 Y-57.55 Z14.99 J65.53 F500.0
+G1 X-26.93 Y-64.76 Z14.99 J72.59 F500.0
+G1 X-26.42 Y-65.05 Z14.99 J73.17 F500.0
+G1 X-26.42 Y-66.44 Z14.99 J74.53 F500.0
+G1 X-26.07 Y-66.44 Z14.99 J74.87 F500.0
+G1 X-26.07 Y-65.05 Z14.99 J76.24 F500.0
+G1 X-22.95 Y-63.25 Z14.99 J79.77 F500.0
+G1 X-22.95 Y-59.05 Z14.99 J83.88 F500.0
+G1 X-26.07 Y-57.25 Z14.99 J87.41 F500.0
+G1 X-26.07 Y-53.05 Z14.99 J91.53 F500.0
+G1 X-22.95 Y-51.25 Z14.99 J95.06 F500.0
+G1 X-22.95 Y-47.05 Z14.99 J99.17 F500.0
+G1 X-23.90 Y-46.50 Z14.99 J100.25 F500.0
+G1 X-21.66 Y-46.50 Z14.99 J102.44 F500.0
+G1 X-22.61 Y-47.05 Z14.99 J103.52 F500.0
+G1 X-22.61 Y-51.25 Z14.99 J107.64 F500.0
+G1 X-19.49 Y-53.05 Z14.99 J111.17 F500.0
+G1 X-19.49 Y-57.25 Z14.99 J115.28 F500.0
+G1 X-22.61 Y-59.05 Z14.99 J118.81 F500.0
+G1 X-22.61 Y-63.25 Z14.99 J122.93 F500.0
+G1 X-19.49 Y-65.05 Z14.99 J126.46 F500.0
+G1 X-19.49 Y-66.44 Z14.99 J127.82 F500.0
+G1 X-19.14 Y-66.44 Z14.99 J128.16 F500.0
+G1 X-19.14 Y-65.05 Z14.99 J129.53 F500.0
+G1 X-16.02 Y-63.25 Z14.99 J133.06 F500.0
+G1 X-16.02 Y-59.05 Z14.99 J137.17 F500.0
+G1 X-19.14 Y-57.25 Z14.99 J140.70 F500.0
+G1 X-19.14 Y-53.05 Z14.99 J144.82 F500.0
+G1 X-16.02 Y-51.25 Z14.99 J148.35 F500.0
+G1 X-16.02 Y-47.05 Z14.99 J152.46 F500.0
+G1 X-16.97 Y-46.50 Z14.99 J153.54 F500.0
+G1 X-14.73 Y-46.50 Z14.99 J155.73 F500.0
+G1 X-15.68 Y-47.05 Z14.99 J156.81 F500.0
+G1 X-15.68 Y-51.25 Z14.99 J160.93 F500.0
+G1 X-12.56 Y-53.05 Z14.99 J164.46 F500.0
+G1 X-12.56 Y-57.25 Z14.99 J168.57 F500.0
+G1 X-15.68 Y-59.05 Z14.99 J172.10 F500.0
+G1 X-15.68 Y-63.25 Z14.99 J176.22 F500.0
+G1 X-12.56 Y-65.05 Z14.99 J179.75 F500.0
+G1 X-12.56 Y-66.44 Z14.99 J181.11 F500.0
+G1 X-12.21 Y-66.44 Z14.99 J181.45 F500.0
+G1 X-12.21 Y-65.05 Z14.99 J182.82 F500.0
+G1 X-9.10 Y-63.25 Z14.99 J186.34 F500.0
+G1 X-9.10 Y-59.05 Z14.99 J190.45 F500.0
+G1 X-12.21 Y-57.25 Z14.99 J193.97 F500.0
+G1 X-12.21 Y-53.05 Z14.99 J198.09 F500.0
+G1 X-9.10 Y-51.25 Z14.99 J201.61 F500.0
+G1 X-9.10 Y-47.05 Z14.99 J205.73 F500.0
+G1 X-10.05 Y-46.50 Z14.99 J206.80 F500.0
+G1 X-7.80 Y-46.50 Z14.99 J209.01 F500.0
+G1 X-8.75 Y-47.05 Z14.99 J210.08 F500.0
+G1 X-8.75 Y-51.25 Z14.99 J214.20 F500.0
+G1 X-5.63 Y-53.05 Z14.99 J217.73 F500.0
+G1 X-5.63 Y-57.25 Z14.99 J221.85 F500.0
+G1 X-8.75 Y-59.05 Z14.99 J225.38 F500.0
+G1 X-8.75 Y-63.25 Z14.99 J229.49 F500.0
+G1 X-5.63 Y-65.05 Z14.99 J233.02 F500.0
+G1 X-5.63 Y-66.44 Z14.99 J234.38 F500.0
+G1 X-5.28 Y-66.44 Z14.99 J234.73 F500.0
+G1 X-5.28 Y-65.05 Z14.99 J236.09 F500.0
+G1 X-2.17 Y-63.25 Z14.99 J239.61 F500.0
+G1 X-2.17 Y-59.05 Z14.99 J243.73 F500.0
+G1 X-5.28 Y-57.25 Z14.99 J247.25 F500.0
+G1 X-5.28 Y-53.05 Z14.99 J251.36 F500.0
+G1 X-2.17 Y-51.25 Z14.99 J254.89 F500.0
+G1 X-2.17 Y-47.05 Z14.99 J259.00 F500.0
+G1 X-3.12 Y-46.50 Z14.99 J260.08 F500.0
+G1 X-0.87 Y-46.50 Z14.99 J262.28 F500.0
+G1 X-1.82 Y-47.05 Z14.99 J263.36 F500.0
+G1 X-1.82 Y-51.25 Z14.99 J267.47 F500.0
+G1 X1.30 Y-53.05 Z14.99 J271.00 F500.0
+G1 X1.30 Y-57.25 Z14.99 J275.12 F500.0
+G1 X-1.82 Y-59.05 Z14.99 J278.65 F500.0
+G1 X-1.82 Y-63.25 Z14.99 J282.77 F500.0
+G1 X1.30 Y-65.05 Z14.99 J286.30 F500.0
+G1 X1.30 Y-66.44 Z14.99 J287.66 F500.0
+G1 X1.64 Y-66.44 Z14.99 J287.99 F500.0
+G1 X1.64 Y-65.05 Z14.99 J289.35 F500.0
+G1 X4.76 Y-63.25 Z14.99 J292.88 F500.0
+G1 X4.76 Y-59.05 Z14.99 J297.00 F500.0
+G1 X1.64 Y-57.25 Z14.99 J300.53 F500.0
+G1 X1.64 Y-53.05 Z14.99 J304.65 F500.0
+G1 X4.76 Y-51.25 Z14.99 J308.18 F500.0
+G1 X4.76 Y-47.05 Z14.99 J312.29 F500.0
+G1 X3.81 Y-46.50 Z14.99 J313.37 F500.0
+G1 X6.06 Y-46.50 Z14.99 J315.57 F500.0
+G1 X5.11 Y-47.05 Z14.99 J316.65 F500.0
+G1 X5.11 Y-51.25 Z14.99 J320.76 F500.0
+G1 X8.22 Y-53.05 Z14.99 J324.29 F500.0
+G1 X8.22 Y-57.25 Z14.99 J328.40 F500.0
+G1 X5.11 Y-59.05 Z14.99 J331.92 F500.0
+G1 X5.11 Y-63.25 Z14.99 J336.04 F500.0
+G1 X8.22 Y-65.05 Z14.99 J339.56 F500.0
+G1 X8.22 Y-66.44 Z14.99 J340.92 F500.0
+G1 X8.57 Y-66.44 Z14.99 J341.27 F500.0
+G1 X8.57 Y-65.05 Z14.99 J342.63 F500.0
+G1 X11.69 Y-63.25 Z14.99 J346.16 F500.0
+G1 X11.69 Y-59.05 Z14.99 J350.27 F500.0
+G1 X8.57 Y-57.25 Z14.99 J353.80 F500.0
+G1 X8.57 Y-53.05 Z14.99 J357.92 F500.0
+G1 X11.69 Y-51.25 Z14.99 J361.45 F500.0
+G1 X11.69 Y-47.05 Z14.99 J365.57 F500.0
+G1 X10.74 Y-46.50 Z14.99 J366.64 F500.0
+G1 X12.98 Y-46.50 Z14.99 J368.84 F500.0
+G1 X12.03 Y-47.05 Z14.99 J369.91 F500.0
+G1 X12.03 Y-51.25 Z14.99 J374.03 F500.0
+G1 X15.15 Y-53.05 Z14.99 J377.56 F500.0
+G1 X15.15 Y-57.25 Z14.99 J381.67 F500.0
+G1 X12.03 Y-59.05 Z14.99 J385.20 F500.0
+G1 X12.03 Y-63.25 Z14.99 J389.32 F500.0
+G1 X15.15 Y-65.05 Z14.99 J392.85 F500.0
+G1 X15.15 Y-66.44 Z14.99 J394.21 F500.0
+G1 X15.50 Y-66.44 Z14.99 J394.56 F500.0
+G1 X15.50 Y-65.05 Z14.99 J395.92 F500.0
+G1 X18.62 Y-63.25 Z14.99 J399.45 F500.0
+G1 X18.62 Y-59.05 Z14.99 J403.56 F500.0
+G1 X15.50 Y-57.25 Z14.99 J407.09 F500.0
+G1 X15.50 Y-53.05 Z14.99 J411.21 F500.0
+G1 X18.62 Y-51.25 Z14.99 J414.74 F500.0
+G1 X18.62 Y-47.05 Z14.99 J418.86 F500.0
+G1 X17.67 Y-46.50 Z14.99 J419.93 F500.0
+G1 X19.91 Y-46.50 Z14.99 J422.13 F500.0
+G1 X18.96 Y-47.05 Z14.99 J423.20 F500.0
+G1 X18.96 Y-51.25 Z14.99 J427.32 F500.0
+G1 X22.08 Y-53.05 Z14.99 J430.85 F500.0
+G1 X22.08 Y-57.25 Z14.99 J434.96 F500.0
+G1 X18.96 Y-59.05 Z14.99 J438.49 F500.0
+G1 X18.96 Y-63.25 Z14.99 J442.61 F500.0
+G1 X22.08 Y-65.05 Z14.99 J446.14 F500.0
+G1 X22.08 Y-66.44 Z14.99 J447.50 F500.0
+G1 X22.43 Y-66.44 Z14.99 J447.85 F500.0
+G1 X22.43 Y-65.05 Z14.99 J449.21 F500.0
+G1 X25.54 Y-63.25 Z14.99 J452.73 F500.0
+G1 X25.54 Y-59.05 Z14.99 J456.85 F500.0
+G1 X22.43 Y-57.25 Z14.99 J460.37 F500.0
+G1 X22.43 Y-53.05 Z14.99 J464.48 F500.0
+G1 X25.54 Y-51.25 Z14.99 J468.00 F500.0
+G1 X25.54 Y-47.05 Z14.99 J472.12 F500.0
+G1 X24.60 Y-46.50 Z14.99 J473.19 F500.0
+G1 X26.84 Y-46.50 Z14.99 J475.38 F500.0
+G1 X25.89 Y-47.05 Z14.99 J476.46 F500.0
+G1 X25.89 Y-51.25 Z14.99 J480.57 F500.0
+G1 X29.01 Y-53.05 Z14.99 J484.10 F500.0
+G1 X29.01 Y-57.25 Z14.99 J488.22 F500.0
+G1 X25.89 Y-59.05 Z14.99 J491.75 F500.0
+G1 X25.89 Y-63.25 Z14.99 J495.87 F500.0
+G1 X29.01 Y-65.05 Z14.99 J499.40 F500.0
+G1 X29.01 Y-66.44 Z14.99 J500.76 F500.0
+G1 X29.36 Y-66.44 Z14.99 J501.10 F500.0
+G1 X29.36 Y-65.05 Z14.99 J502.46 F500.0
+G1 X32.47 Y-63.25 Z14.99 J505.99 F500.0
+G1 X32.47 Y-59.05 Z14.99 J510.10 F500.0
+G1 X29.36 Y-57.25 Z14.99 J513.62 F500.0
+G1 X29.36 Y-53.05 Z14.99 J517.74 F500.0
+G1 X32.47 Y-51.25 Z14.99 J521.26 F500.0
+G1 X32.47 Y-47.05 Z14.99 J525.38 F500.0
+G1 X31.52 Y-46.50 Z14.99 J526.45 F500.0
+G1 X33.01 Y-46.94 Z14.99 J527.97 F500.0
+G1 X32.82 Y-47.05 Z14.99 J528.19 F500.0
+G1 X32.82 Y-51.25 Z14.99 J532.31 F500.0
+G1 X33.01 Y-51.36 Z14.99 J532.52 F500.0
+G1 X33.01 Y-58.58 Z14.99 J544.60 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X33.01 Y-58.94 Z14.99 J544.60 F800.0
+G1 X32.82 Y-59.05 Z14.99 J544.60 F800.0
+G1 X32.82 Y-63.25 Z14.99 J544.60 F800.0
+G1 X33.01 Y-63.36 Z14.99 J544.60 F800.0
+G1 X33.01 Y-63.36 Z24.99 J544.60 F800.0
+G1 X27.45 Y-70.88 Z24.99 J554.60 F800.0
+
+T1
+G1 X32.45 Y-65.88 Z15.99 J0.00 F300.0
+G1 X32.45 Y-64.08 Z15.99 J1.76 F300.0
+G1 X32.45 Y-47.06 Z15.99 J18.44 F300.0
+G1 X28.85 Y-47.06 Z15.99 J21.97 F300.0
+G1 X-26.37 Y-47.06 Z15.99 J76.09 F500.0
+G1 X-26.37 Y-48.86 Z15.99 J77.85 F500.0
+G1 X-26.37 Y-65.88 Z15.99 J94.53 F500.0
+G1 X-22.77 Y-65.88 Z15.99 J98.06 F500.0
+G1 X27.45 Y-65.88 Z15.99 J152.27 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X32.45 Y-65.88 Z15.99 J152.27 F800.0
+G1 X32.45 Y-65.88 Z25.99 J152.27 F800.0
+G1 X27.45 Y-70.88 Z25.99 J162.27 F800.0
+
+T1
+G1 X32.45 Y-65.88 Z15.99 J0.00 F300.0
+G1 X-26.07 Y-65.88 Z15.99 J57.35 F300.0
+G1 X-26.07 Y-65.05 Z15.99 J58.17 F300.0
+G1 X-22.95 Y-63.25 Z15.99 J61.70 F300.0
+G1 X-22.95 Y-59.05 Z15.99 J65.81 F500.0
+G1 X-26.07 Y-57.25 Z15.99 J69.34 F500.0
+G1 X-26.07 Y-53.05 Z15.99 J73.46 F500.0
+G1 X-22.95 Y-51.25 Z15.99 J76.99 F500.0
+G1 X-22.95 Y-47.06 Z15.99 J81.10 F500.0
+G1 X-22.61 Y-47.06 Z15.99 J81.43 F500.0
+G1 X-22.61 Y-51.25 Z15.99 J85.53 F500.0
+G1 X-19.49 Y-53.05 Z15.99 J89.06 F500.0
+G1 X-19.49 Y-57.25 Z15.99 J93.18 F500.0
+G1 X-22.61 Y-59.05 Z15.99 J96.71 F500.0
+G1 X-22.61 Y-63.25 Z15.99 J100.83 F500.0
+G1 X-19.49 Y-65.05 Z15.99 J104.36 F500.0
+G1 X-19.49 Y-65.88 Z15.99 J105.17 F500.0
+G1 X-19.14 Y-65.88 Z15.99 J105.51 F500.0
+G1 X-19.14 Y-65.05 Z15.99 J106.33 F500.0
+G1 X-16.02 Y-63.25 Z15.99 J109.86 F500.0
+G1 X-16.02 Y-59.05 Z15.99 J113.97 F500.0
+G1 X-19.14 Y-57.25 Z15.99 J117.50 F500.0
+G1 X-19.14 Y-53.05 Z15.99 J121.62 F500.0
+G1 X-16.02 Y-51.25 Z15.99 J125.15 F500.0
+G1 X-16.02 Y-47.06 Z15.99 J129.25 F500.0
+G1 X-15.68 Y-47.06 Z15.99 J129.59 F500.0
+G1 X-15.68 Y-51.25 Z15.99 J133.69 F500.0
+G1 X-12.56 Y-53.05 Z15.99 J137.22 F500.0
+G1 X-12.56 Y-57.25 Z15.99 J141.34 F500.0
+G1 X-15.68 Y-59.05 Z15.99 J144.87 F500.0
+G1 X-15.68 Y-63.25 Z15.99 J148.99 F500.0
+G1 X-12.56 Y-65.05 Z15.99 J152.52 F500.0
+G1 X-12.56 Y-65.88 Z15.99 J153.33 F500.0
+G1 X-12.21 Y-65.88 Z15.99 J153.67 F500.0
+G1 X-12.21 Y-65.05 Z15.99 J154.49 F500.0
+G1 X-9.10 Y-63.25 Z15.99 J158.01 F500.0
+G1 X-9.10 Y-59.05 Z15.99 J162.12 F500.0
+G1 X-12.21 Y-57.25 Z15.99 J165.64 F500.0
+G1 X-12.21 Y-53.05 Z15.99 J169.76 F500.0
+G1 X-9.10 Y-51.25 Z15.99 J173.28 F500.0
+G1 X-9.10 Y-47.06 Z15.99 J177.39 F500.0
+G1 X-8.75 Y-47.06 Z15.99 J177.73 F500.0
+G1 X-8.75 Y-51.25 Z15.99 J181.84 F500.0
+G1 X-5.63 Y-53.05 Z15.99 J185.37 F500.0
+G1 X-5.63 Y-57.25 Z15.99 J189.48 F500.0
+G1 X-8.75 Y-59.05 Z15.99 J193.01 F500.0
+G1 X-8.75 Y-63.25 Z15.99 J197.13 F500.0
+G1 X-5.63 Y-65.05 Z15.99 J200.66 F500.0
+G1 X-5.63 Y-65.88 Z15.99 J201.47 F500.0
+G1 X-5.28 Y-65.88 Z15.99 J201.82 F500.0
+G1 X-5.28 Y-65.05 Z15.99 J202.63 F500.0
+G1 X-2.17 Y-63.25 Z15.99 J206.15 F500.0
+G1 X-2.17 Y-59.05 Z15.99 J210.27 F500.0
+G1 X-5.28 Y-57.25 Z15.99 J213.79 F500.0
+G1 X-5.28 Y-53.05 Z15.99 J217.90 F500.0
+G1 X-2.17 Y-51.25 Z15.99 J221.43 F500.0
+G1 X-2.17 Y-47.06 Z15.99 J225.53 F500.0
+G1 X-1.82 Y-47.06 Z15.99 J225.87 F500.0
+G1 X-1.82 Y-51.25 Z15.99 J229.98 F500.0
+G1 X1.30 Y-53.05 Z15.99 J233.51 F500.0
+G1 X1.30 Y-57.25 Z15.99 J237.63 F500.0
+G1 X-1.82 Y-59.05 Z15.99 J241.16 F500.0
+G1 X-1.82 Y-63.25 Z15.99 J245.27 F500.0
+G1 X1.30 Y-65.05 Z15.99 J248.80 F500.0
+G1 X1.30 Y-65.88 Z15.99 J249.62 F500.0
+G1 X1.64 Y-65.88 Z15.99 J249.95 F500.0
+G1 X1.64 Y-65.05 Z15.99 J250.76 F500.0
+G1 X4.76 Y-63.25 Z15.99 J254.29 F500.0
+G1 X4.76 Y-59.05 Z15.99 J258.41 F500.0
+G1 X1.64 Y-57.25 Z15.99 J261.94 F500.0
+G1 X1.64 Y-53.05 Z15.99 J266.05 F500.0
+G1 X4.76 Y-51.25 Z15.99 J269.58 F500.0
+G1 X4.76 Y-47.06 Z15.99 J273.69 F500.0
+G1 X5.11 Y-47.06 Z15.99 J274.03 F500.0
+G1 X5.11 Y-51.25 Z15.99 J278.14 F500.0
+G1 X8.22 Y-53.05 Z15.99 J281.66 F500.0
+G1 X8.22 Y-57.25 Z15.99 J285.78 F500.0
+G1 X5.11 Y-59.05 Z15.99 J289.30 F500.0
+G1 X5.11 Y-63.25 Z15.99 J293.42 F500.0
+G1 X8.22 Y-65.05 Z15.99 J296.94 F500.0
+G1 X8.22 Y-65.88 Z15.99 J297.75 F500.0
+G1 X8.57 Y-65.88 Z15.99 J298.09 F500.0
+G1 X8.57 Y-65.05 Z15.99 J298.91 F500.0
+G1 X11.69 Y-63.25 Z15.99 J302.44 F500.0
+G1 X11.69 Y-59.05 Z15.99 J306.55 F500.0
+G1 X8.57 Y-57.25 Z15.99 J310.08 F500.0
+G1 X8.57 Y-53.05 Z15.99 J314.20 F500.0
+G1 X11.69 Y-51.25 Z15.99 J317.73 F500.0
+G1 X11.69 Y-47.06 Z15.99 J321.83 F500.0
+G1 X12.03 Y-47.06 Z15.99 J322.17 F500.0
+G1 X12.03 Y-51.25 Z15.99 J326.27 F500.0
+G1 X15.15 Y-53.05 Z15.99 J329.80 F500.0
+G1 X15.15 Y-57.25 Z15.99 J333.92 F500.0
+G1 X12.03 Y-59.05 Z15.99 J337.45 F500.0
+G1 X12.03 Y-63.25 Z15.99 J341.57 F500.0
+G1 X15.15 Y-65.05 Z15.99 J345.10 F500.0
+G1 X15.15 Y-65.88 Z15.99 J345.91 F500.0
+G1 X15.50 Y-65.88 Z15.99 J346.25 F500.0
+G1 X15.50 Y-65.05 Z15.99 J347.07 F500.0
+G1 X18.62 Y-63.25 Z15.99 J350.60 F500.0
+G1 X18.62 Y-59.05 Z15.99 J354.71 F500.0
+G1 X15.50 Y-57.25 Z15.99 J358.24 F500.0
+G1 X15.50 Y-53.05 Z15.99 J362.36 F500.0
+G1 X18.62 Y-51.25 Z15.99 J365.89 F500.0
+G1 X18.62 Y-47.06 Z15.99 J369.99 F500.0
+G1 X18.96 Y-47.06 Z15.99 J370.33 F500.0
+G1 X18.96 Y-51.25 Z15.99 J374.43 F500.0
+G1 X22.08 Y-53.05 Z15.99 J377.96 F500.0
+G1 X22.08 Y-57.25 Z15.99 J382.08 F500.0
+G1 X18.96 Y-59.05 Z15.99 J385.61 F500.0
+G1 X18.96 Y-63.25 Z15.99 J389.72 F500.0
+G1 X22.08 Y-65.05 Z15.99 J393.25 F500.0
+G1 X22.08 Y-65.88 Z15.99 J394.07 F500.0
+G1 X22.43 Y-65.88 Z15.99 J394.41 F500.0
+G1 X22.43 Y-65.05 Z15.99 J395.22 F500.0
+G1 X25.54 Y-63.25 Z15.99 J398.75 F500.0
+G1 X25.54 Y-59.05 Z15.99 J402.86 F500.0
+G1 X22.43 Y-57.25 Z15.99 J406.38 F500.0
+G1 X22.43 Y-53.05 Z15.99 J410.50 F500.0
+G1 X25.54 Y-51.25 Z15.99 J414.02 F500.0
+G1 X25.54 Y-47.06 Z15.99 J418.13 F500.0
+G1 X25.89 Y-47.06 Z15.99 J418.47 F500.0
+G1 X25.89 Y-51.25 Z15.99 J422.58 F500.0
+G1 X29.01 Y-53.05 Z15.99 J426.11 F500.0
+G1 X29.01 Y-57.25 Z15.99 J430.22 F500.0
+G1 X25.89 Y-59.05 Z15.99 J433.75 F500.0
+G1 X25.89 Y-63.25 Z15.99 J437.87 F500.0
+G1 X29.01 Y-65.05 Z15.99 J441.40 F500.0
+G1 X29.01 Y-65.88 Z15.99 J442.21 F500.0
+G1 X29.36 Y-65.88 Z15.99 J442.55 F500.0
+G1 X29.36 Y-65.05 Z15.99 J443.37 F500.0
+G1 X32.45 Y-63.26 Z15.99 J446.87 F500.0
+G1 X32.45 Y-59.04 Z15.99 J451.00 F500.0
+G1 X29.36 Y-57.25 Z15.99 J454.50 F500.0
+G1 X29.36 Y-54.48 Z15.99 J462.22 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X29.36 Y-53.05 Z15.99 J462.22 F800.0
+G1 X32.45 Y-51.26 Z15.99 J462.22 F800.0
\ No newline at end of file
@@ -0,0 +1,5670 @@
+M211 S0
+M400
+M280 P0 S2
+M400
+T0
+G1 X100.00000 Y200.00000 Z0.00000 J0.00 F300.0
+G1 X100.00000 Y239.81000 Z0.00000 J39.01 F300.0
+G1 X100.00000 Y239.90000 Z0.00000 J39.10 F300.0
+G1 X20.39000 Y239.90000 Z0.00000 J117.12 F300.0
+G1 X20.10000 Y239.90000 Z0.00000 J117.40 F500.0
+G1 X20.10000 Y200.09000 Z0.00000 J156.42 F500.0
+G1 X20.10000 Y200.00000 Z0.00000 J156.51 F500.0
+G1 X94.71000 Y200.00000 Z0.00000 J234.62 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X99.71000 Y200.00000 Z0.00000 J234.62 F800.0
+G1 X99.71000 Y200.00000 Z10.00000 J234.62 F800.0
+G1 X94.71000 Y195.00000 Z10.00000 J244.62 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X99.71000 Y200.00000 Z0.00000 J0.00 F300.0
+G1 X20.10000 Y201.11000 Z0.00000 J78.03 F300.0
+G1 X20.20000 Y201.17000 Z0.00000 J78.14 F300.0
+G1 X20.20000 Y205.37000 Z0.00000 J82.26 F300.0
+G1 X20.10000 Y205.42000 Z0.00000 J82.37 F500.0
+G1 X20.10000 Y213.11000 Z0.00000 J89.91 F500.0
+G1 X20.20000 Y213.17000 Z0.00000 J90.02 F500.0
+G1 X20.20000 Y217.37000 Z0.00000 J94.14 F500.0
+G1 X20.10000 Y217.43000 Z0.00000 J94.25 F500.0
+G1 X20.10000 Y225.11000 Z0.00000 J101.78 F500.0
+G1 X20.20000 Y225.17000 Z0.00000 J101.89 F500.0
+G1 X20.20000 Y229.37000 Z0.00000 J106.01 F500.0
+G1 X20.10000 Y229.42000 Z0.00000 J106.12 F500.0
+G1 X20.10000 Y237.11000 Z0.00000 J113.65 F500.0
+G1 X20.20000 Y237.17000 Z0.00000 J113.77 F500.0
+G1 X20.20000 Y239.90000 Z0.00000 J116.44 F500.0
+G1 X20.55000 Y239.90000 Z0.00000 J116.78 F500.0
+G1 X20.55000 Y237.17000 Z0.00000 J119.46 F500.0
+G1 X23.67000 Y235.37000 Z0.00000 J122.99 F500.0
+G1 X23.67000 Y231.17000 Z0.00000 J127.11 F500.0
+G1 X20.55000 Y229.37000 Z0.00000 J130.64 F500.0
+G1 X20.55000 Y225.17000 Z0.00000 J134.75 F500.0
+G1 X23.67000 Y223.37000 Z0.00000 J138.28 F500.0
+G1 X23.67000 Y219.17000 Z0.00000 J142.40 F500.0
+G1 X20.55000 Y217.37000 Z0.00000 J145.93 F500.0
+G1 X20.55000 Y213.17000 Z0.00000 J150.04 F500.0
+G1 X23.67000 Y211.37000 Z0.00000 J153.57 F500.0
+G1 X23.67000 Y207.17000 Z0.00000 J157.69 F500.0
+G1 X20.55000 Y205.37000 Z0.00000 J161.22 F500.0
+G1 X20.55000 Y201.17000 Z0.00000 J165.34 F500.0
+G1 X22.56000 Y200.00000 Z0.00000 J167.62 F500.0
+G1 X25.11000 Y200.00000 Z0.00000 J170.11 F500.0
+G1 X27.13000 Y201.17000 Z0.00000 J172.40 F500.0
+G1 X27.13000 Y205.37000 Z0.00000 J176.52 F500.0
+G1 X24.01000 Y207.17000 Z0.00000 J180.05 F500.0
+G1 X24.01000 Y211.37000 Z0.00000 J184.16 F500.0
+G1 X27.13000 Y213.17000 Z0.00000 J187.69 F500.0
+G1 X27.13000 Y217.37000 Z0.00000 J191.81 F500.0
+G1 X24.01000 Y219.17000 Z0.00000 J195.34 F500.0
+G1 X24.01000 Y223.37000 Z0.00000 J199.46 F500.0
+G1 X27.13000 Y225.17000 Z0.00000 J202.99 F500.0
+G1 X27.13000 Y229.37000 Z0.00000 J207.10 F500.0
+G1 X24.01000 Y231.17000 Z0.00000 J210.63 F500.0
+G1 X24.01000 Y235.37000 Z0.00000 J214.75 F500.0
+G1 X27.13000 Y237.17000 Z0.00000 J218.28 F500.0
+G1 X27.13000 Y239.90000 Z0.00000 J220.95 F500.0
+G1 X27.48000 Y239.90000 Z0.00000 J221.30 F500.0
+G1 X27.48000 Y237.17000 Z0.00000 J223.97 F500.0
+G1 X30.59000 Y235.37000 Z0.00000 J227.49 F500.0
+G1 X30.59000 Y231.17000 Z0.00000 J231.61 F500.0
+G1 X27.48000 Y229.37000 Z0.00000 J235.13 F500.0
+G1 X27.48000 Y225.17000 Z0.00000 J239.25 F500.0
+G1 X30.59000 Y223.37000 Z0.00000 J242.77 F500.0
+G1 X30.59000 Y219.17000 Z0.00000 J246.88 F500.0
+G1 X27.48000 Y217.37000 Z0.00000 J250.41 F500.0
+G1 X27.48000 Y213.17000 Z0.00000 J254.52 F500.0
+G1 X30.59000 Y211.37000 Z0.00000 J258.04 F500.0
+G1 X30.59000 Y207.17000 Z0.00000 J262.16 F500.0
+G1 X27.48000 Y205.37000 Z0.00000 J265.68 F500.0
+G1 X27.48000 Y201.17000 Z0.00000 J269.80 F500.0
+G1 X29.49000 Y200.00000 Z0.00000 J272.08 F500.0
+G1 X32.04000 Y200.00000 Z0.00000 J274.57 F500.0
+G1 X34.06000 Y201.17000 Z0.00000 J276.86 F500.0
+G1 X34.06000 Y205.37000 Z0.00000 J280.98 F500.0
+G1 X30.94000 Y207.17000 Z0.00000 J284.51 F500.0
+G1 X30.94000 Y211.37000 Z0.00000 J288.62 F500.0
+G1 X34.06000 Y213.17000 Z0.00000 J292.15 F500.0
+G1 X34.06000 Y217.37000 Z0.00000 J296.27 F500.0
+G1 X30.94000 Y219.17000 Z0.00000 J299.80 F500.0
+G1 X30.94000 Y223.37000 Z0.00000 J303.92 F500.0
+G1 X34.06000 Y225.17000 Z0.00000 J307.45 F500.0
+G1 X34.06000 Y229.37000 Z0.00000 J311.56 F500.0
+G1 X30.94000 Y231.17000 Z0.00000 J315.09 F500.0
+G1 X30.94000 Y235.37000 Z0.00000 J319.21 F500.0
+G1 X34.06000 Y237.17000 Z0.00000 J322.74 F500.0
+G1 X34.06000 Y239.90000 Z0.00000 J325.41 F500.0
+G1 X34.40000 Y239.90000 Z0.00000 J325.75 F500.0
+G1 X34.40000 Y237.17000 Z0.00000 J328.42 F500.0
+G1 X37.52000 Y235.37000 Z0.00000 J331.95 F500.0
+G1 X37.52000 Y231.17000 Z0.00000 J336.07 F500.0
+G1 X34.40000 Y229.37000 Z0.00000 J339.60 F500.0
+G1 X34.40000 Y225.17000 Z0.00000 J343.71 F500.0
+G1 X37.52000 Y223.37000 Z0.00000 J347.24 F500.0
+G1 X37.52000 Y219.17000 Z0.00000 J351.36 F500.0
+G1 X34.40000 Y217.37000 Z0.00000 J354.89 F500.0
+G1 X34.40000 Y213.17000 Z0.00000 J359.01 F500.0
+G1 X37.52000 Y211.37000 Z0.00000 J362.54 F500.0
+G1 X37.52000 Y207.17000 Z0.00000 J366.65 F500.0
+G1 X34.40000 Y205.37000 Z0.00000 J370.18 F500.0
+G1 X34.40000 Y201.17000 Z0.00000 J374.30 F500.0
+G1 X36.42000 Y200.00000 Z0.00000 J376.59 F500.0
+G1 X38.97000 Y200.00000 Z0.00000 J379.08 F500.0
+G1 X40.99000 Y201.17000 Z0.00000 J381.37 F500.0
+G1 X40.99000 Y205.37000 Z0.00000 J385.49 F500.0
+G1 X37.87000 Y207.17000 Z0.00000 J389.02 F500.0
+G1 X37.87000 Y211.37000 Z0.00000 J393.13 F500.0
+G1 X40.99000 Y213.17000 Z0.00000 J396.66 F500.0
+G1 X40.99000 Y217.37000 Z0.00000 J400.78 F500.0
+G1 X37.87000 Y219.17000 Z0.00000 J404.31 F500.0
+G1 X37.87000 Y223.37000 Z0.00000 J408.43 F500.0
+G1 X40.99000 Y225.17000 Z0.00000 J411.96 F500.0
+G1 X40.99000 Y229.37000 Z0.00000 J416.07 F500.0
+G1 X37.87000 Y231.17000 Z0.00000 J419.60 F500.0
+G1 X37.87000 Y235.37000 Z0.00000 J423.72 F500.0
+G1 X40.99000 Y237.17000 Z0.00000 J427.25 F500.0
+G1 X40.99000 Y239.90000 Z0.00000 J429.92 F500.0
+G1 X41.33000 Y239.90000 Z0.00000 J430.26 F500.0
+G1 X41.33000 Y237.17000 Z0.00000 J432.93 F500.0
+G1 X44.45000 Y235.37000 Z0.00000 J436.46 F500.0
+G1 X44.45000 Y231.17000 Z0.00000 J440.58 F500.0
+G1 X41.33000 Y229.37000 Z0.00000 J444.11 F500.0
+G1 X41.33000 Y225.17000 Z0.00000 J448.22 F500.0
+G1 X44.45000 Y223.37000 Z0.00000 J451.75 F500.0
+G1 X44.45000 Y219.17000 Z0.00000 J455.87 F500.0
+G1 X41.33000 Y217.37000 Z0.00000 J459.40 F500.0
+G1 X41.33000 Y213.17000 Z0.00000 J463.52 F500.0
+G1 X44.45000 Y211.37000 Z0.00000 J467.05 F500.0
+G1 X44.45000 Y207.17000 Z0.00000 J471.16 F500.0
+G1 X41.33000 Y205.37000 Z0.00000 J474.69 F500.0
+G1 X41.33000 Y201.17000 Z0.00000 J478.81 F500.0
+G1 X43.35000 Y200.00000 Z0.00000 J481.10 F500.0
+G1 X45.90000 Y200.00000 Z0.00000 J483.59 F500.0
+G1 X47.91000 Y201.17000 Z0.00000 J485.87 F500.0
+G1 X47.91000 Y205.37000 Z0.00000 J489.99 F500.0
+G1 X44.80000 Y207.17000 Z0.00000 J493.51 F500.0
+G1 X44.80000 Y211.37000 Z0.00000 J497.63 F500.0
+G1 X47.91000 Y213.17000 Z0.00000 J501.15 F500.0
+G1 X47.91000 Y217.37000 Z0.00000 J505.26 F500.0
+G1 X44.80000 Y219.17000 Z0.00000 J508.79 F500.0
+G1 X44.80000 Y223.37000 Z0.00000 J512.90 F500.0
+G1 X47.91000 Y225.17000 Z0.00000 J516.42 F500.0
+G1 X47.91000 Y229.37000 Z0.00000 J520.54 F500.0
+G1 X44.80000 Y231.17000 Z0.00000 J524.06 F500.0
+G1 X44.80000 Y235.37000 Z0.00000 J528.18 F500.0
+G1 X47.91000 Y237.17000 Z0.00000 J531.70 F500.0
+G1 X47.91000 Y239.90000 Z0.00000 J534.37 F500.0
+G1 X48.26000 Y239.90000 Z0.00000 J534.72 F500.0
+G1 X48.26000 Y237.17000 Z0.00000 J537.39 F500.0
+G1 X51.38000 Y235.37000 Z0.00000 J540.92 F500.0
+G1 X51.38000 Y231.17000 Z0.00000 J545.04 F500.0
+G1 X48.26000 Y229.37000 Z0.00000 J548.57 F500.0
+G1 X48.26000 Y225.17000 Z0.00000 J552.68 F500.0
+G1 X51.38000 Y223.37000 Z0.00000 J556.21 F500.0
+G1 X51.38000 Y219.17000 Z0.00000 J560.33 F500.0
+G1 X48.26000 Y217.37000 Z0.00000 J563.86 F500.0
+G1 X48.26000 Y213.17000 Z0.00000 J567.98 F500.0
+G1 X51.38000 Y211.37000 Z0.00000 J571.51 F500.0
+G1 X51.38000 Y207.17000 Z0.00000 J575.62 F500.0
+G1 X48.26000 Y205.37000 Z0.00000 J579.15 F500.0
+G1 X48.26000 Y201.17000 Z0.00000 J583.27 F500.0
+G1 X50.28000 Y200.00000 Z0.00000 J585.56 F500.0
+G1 X52.83000 Y200.00000 Z0.00000 J588.05 F500.0
+G1 X54.84000 Y201.17000 Z0.00000 J590.33 F500.0
+G1 X54.84000 Y205.37000 Z0.00000 J594.45 F500.0
+G1 X51.73000 Y207.17000 Z0.00000 J597.97 F500.0
+G1 X51.73000 Y211.37000 Z0.00000 J602.09 F500.0
+G1 X54.84000 Y213.17000 Z0.00000 J605.61 F500.0
+G1 X54.84000 Y217.37000 Z0.00000 J609.72 F500.0
+G1 X51.73000 Y219.17000 Z0.00000 J613.25 F500.0
+G1 X51.73000 Y223.37000 Z0.00000 J617.36 F500.0
+G1 X54.84000 Y225.17000 Z0.00000 J620.88 F500.0
+G1 X54.84000 Y229.37000 Z0.00000 J625.00 F500.0
+G1 X51.73000 Y231.17000 Z0.00000 J628.52 F500.0
+G1 X51.73000 Y235.37000 Z0.00000 J632.64 F500.0
+G1 X54.84000 Y237.17000 Z0.00000 J636.16 F500.0
+G1 X54.84000 Y239.90000 Z0.00000 J638.83 F500.0
+G1 X55.19000 Y239.90000 Z0.00000 J639.18 F500.0
+G1 X55.19000 Y237.17000 Z0.00000 J641.85 F500.0
+G1 X58.31000 Y235.37000 Z0.00000 J645.38 F500.0
+G1 X58.31000 Y231.17000 Z0.00000 J649.50 F500.0
+G1 X55.19000 Y229.37000 Z0.00000 J653.03 F500.0
+G1 X55.19000 Y225.17000 Z0.00000 J657.14 F500.0
+G1 X58.31000 Y223.37000 Z0.00000 J660.67 F500.0
+G1 X58.31000 Y219.17000 Z0.00000 J664.79 F500.0
+G1 X55.19000 Y217.37000 Z0.00000 J668.32 F500.0
+G1 X55.19000 Y213.17000 Z0.00000 J672.44 F500.0
+G1 X58.31000 Y211.37000 Z0.00000 J675.97 F500.0
+G1 X58.31000 Y207.17000 Z0.00000 J680.08 F500.0
+G1 X55.19000 Y205.37000 Z0.00000 J683.61 F500.0
+G1 X55.19000 Y201.17000 Z0.00000 J687.73 F500.0
+G1 X57.20000 Y200.00000 Z0.00000 J690.01 F500.0
+G1 X59.76000 Y200.00000 Z0.00000 J692.52 F500.0
+G1 X61.77000 Y201.17000 Z0.00000 J694.80 F500.0
+G1 X61.77000 Y205.37000 Z0.00000 J698.91 F500.0
+G1 X58.65000 Y207.17000 Z0.00000 J702.44 F500.0
+G1 X58.65000 Y211.37000 Z0.00000 J706.56 F500.0
+G1 X61.77000 Y213.17000 Z0.00000 J710.09 F500.0
+G1 X61.77000 Y217.37000 Z0.00000 J714.20 F500.0
+G1 X58.65000 Y219.17000 Z0.00000 J717.73 F500.0
+G1 X58.65000 Y223.37000 Z0.00000 J721.85 F500.0
+G1 X61.77000 Y225.17000 Z0.00000 J725.38 F500.0
+G1 X61.77000 Y229.37000 Z0.00000 J729.50 F500.0
+G1 X58.65000 Y231.17000 Z0.00000 J733.03 F500.0
+G1 X58.65000 Y235.37000 Z0.00000 J737.14 F500.0
+G1 X61.77000 Y237.17000 Z0.00000 J740.67 F500.0
+G1 X61.77000 Y239.90000 Z0.00000 J743.35 F500.0
+G1 X62.12000 Y239.90000 Z0.00000 J743.69 F500.0
+G1 X62.12000 Y237.17000 Z0.00000 J746.37 F500.0
+G1 X65.23000 Y235.37000 Z0.00000 J749.89 F500.0
+G1 X65.23000 Y231.17000 Z0.00000 J754.00 F500.0
+G1 X62.12000 Y229.37000 Z0.00000 J757.52 F500.0
+G1 X62.12000 Y225.17000 Z0.00000 J761.64 F500.0
+G1 X65.23000 Y223.37000 Z0.00000 J765.16 F500.0
+G1 X65.23000 Y219.17000 Z0.00000 J769.28 F500.0
+G1 X62.12000 Y217.37000 Z0.00000 J772.80 F500.0
+G1 X62.12000 Y213.17000 Z0.00000 J776.91 F500.0
+G1 X65.23000 Y211.37000 Z0.00000 J780.44 F500.0
+G1 X65.23000 Y207.17000 Z0.00000 J784.55 F500.0
+G1 X62.12000 Y205.37000 Z0.00000 J788.07 F500.0
+G1 X62.12000 Y201.17000 Z0.00000 J792.19 F500.0
+G1 X64.13000 Y200.00000 Z0.00000 J794.47 F500.0
+G1 X66.68000 Y200.00000 Z0.00000 J796.97 F500.0
+G1 X68.70000 Y201.17000 Z0.00000 J799.26 F500.0
+G1 X68.70000 Y205.37000 Z0.00000 J803.37 F500.0
+G1 X65.58000 Y207.17000 Z0.00000 J806.90 F500.0
+G1 X65.58000 Y211.37000 Z0.00000 J811.02 F500.0
+G1 X68.70000 Y213.17000 Z0.00000 J814.55 F500.0
+G1 X68.70000 Y217.37000 Z0.00000 J818.66 F500.0
+G1 X65.58000 Y219.17000 Z0.00000 J822.19 F500.0
+G1 X65.58000 Y223.37000 Z0.00000 J826.31 F500.0
+G1 X68.70000 Y225.17000 Z0.00000 J829.84 F500.0
+G1 X68.70000 Y229.37000 Z0.00000 J833.96 F500.0
+G1 X65.58000 Y231.17000 Z0.00000 J837.49 F500.0
+G1 X65.58000 Y235.37000 Z0.00000 J841.60 F500.0
+G1 X68.70000 Y237.17000 Z0.00000 J845.13 F500.0
+G1 X68.70000 Y239.90000 Z0.00000 J847.81 F500.0
+G1 X69.04000 Y239.90000 Z0.00000 J848.14 F500.0
+G1 X69.04000 Y237.17000 Z0.00000 J850.82 F500.0
+G1 X72.16000 Y235.37000 Z0.00000 J854.35 F500.0
+G1 X72.16000 Y231.17000 Z0.00000 J858.46 F500.0
+G1 X69.04000 Y229.37000 Z0.00000 J861.99 F500.0
+G1 X69.04000 Y225.17000 Z0.00000 J866.11 F500.0
+G1 X72.16000 Y223.37000 Z0.00000 J869.64 F500.0
+G1 X72.16000 Y219.17000 Z0.00000 J873.75 F500.0
+G1 X69.04000 Y217.37000 Z0.00000 J877.28 F500.0
+G1 X69.04000 Y213.17000 Z0.00000 J881.40 F500.0
+G1 X72.16000 Y211.37000 Z0.00000 J884.93 F500.0
+G1 X72.16000 Y207.17000 Z0.00000 J889.05 F500.0
+G1 X69.04000 Y205.37000 Z0.00000 J892.58 F500.0
+G1 X69.04000 Y201.17000 Z0.00000 J896.69 F500.0
+G1 X71.06000 Y200.00000 Z0.00000 J898.98 F500.0
+G1 X73.61000 Y200.00000 Z0.00000 J901.48 F500.0
+G1 X75.63000 Y201.17000 Z0.00000 J903.77 F500.0
+G1 X75.63000 Y205.37000 Z0.00000 J907.88 F500.0
+G1 X72.51000 Y207.17000 Z0.00000 J911.41 F500.0
+G1 X72.51000 Y211.37000 Z0.00000 J915.53 F500.0
+G1 X75.63000 Y213.17000 Z0.00000 J919.06 F500.0
+G1 X75.63000 Y217.37000 Z0.00000 J923.17 F500.0
+G1 X72.51000 Y219.17000 Z0.00000 J926.70 F500.0
+G1 X72.51000 Y223.37000 Z0.00000 J930.82 F500.0
+G1 X75.63000 Y225.17000 Z0.00000 J934.35 F500.0
+G1 X75.63000 Y229.37000 Z0.00000 J938.47 F500.0
+G1 X72.51000 Y231.17000 Z0.00000 J942.00 F500.0
+G1 X72.51000 Y235.37000 Z0.00000 J946.11 F500.0
+G1 X75.63000 Y237.17000 Z0.00000 J949.64 F500.0
+G1 X75.63000 Y239.90000 Z0.00000 J952.32 F500.0
+G1 X75.97000 Y239.90000 Z0.00000 J952.65 F500.0
+G1 X75.97000 Y237.17000 Z0.00000 J955.33 F500.0
+G1 X79.09000 Y235.37000 Z0.00000 J958.86 F500.0
+G1 X79.09000 Y231.17000 Z0.00000 J962.97 F500.0
+G1 X75.97000 Y229.37000 Z0.00000 J966.50 F500.0
+G1 X75.97000 Y225.17000 Z0.00000 J970.62 F500.0
+G1 X79.09000 Y223.37000 Z0.00000 J974.15 F500.0
+G1 X79.09000 Y219.17000 Z0.00000 J978.26 F500.0
+G1 X75.97000 Y217.37000 Z0.00000 J981.79 F500.0
+G1 X75.97000 Y213.17000 Z0.00000 J985.91 F500.0
+G1 X79.09000 Y211.37000 Z0.00000 J989.44 F500.0
+G1 X79.09000 Y207.17000 Z0.00000 J993.56 F500.0
+G1 X75.97000 Y205.37000 Z0.00000 J997.09 F500.0
+G1 X75.97000 Y201.17000 Z0.00000 J1001.20 F500.0
+G1 X77.99000 Y200.00000 Z0.00000 J1003.49 F500.0
+G1 X80.54000 Y200.00000 Z0.00000 J1005.99 F500.0
+G1 X82.55000 Y201.17000 Z0.00000 J1008.27 F500.0
+G1 X82.55000 Y205.37000 Z0.00000 J1012.38 F500.0
+G1 X79.44000 Y207.17000 Z0.00000 J1015.90 F500.0
+G1 X79.44000 Y211.37000 Z0.00000 J1020.02 F500.0
+G1 X82.55000 Y213.17000 Z0.00000 J1023.54 F500.0
+G1 X82.55000 Y217.37000 Z0.00000 J1027.66 F500.0
+G1 X79.44000 Y219.17000 Z0.00000 J1031.18 F500.0
+G1 X79.44000 Y223.37000 Z0.00000 J1035.30 F500.0
+G1 X82.55000 Y225.17000 Z0.00000 J1038.82 F500.0
+G1 X82.55000 Y229.37000 Z0.00000 J1042.93 F500.0
+G1 X79.44000 Y231.17000 Z0.00000 J1046.45 F500.0
+G1 X79.44000 Y235.37000 Z0.00000 J1050.57 F500.0
+G1 X82.55000 Y237.17000 Z0.00000 J1054.09 F500.0
+G1 X82.55000 Y239.90000 Z0.00000 J1056.77 F500.0
+G1 X82.90000 Y239.90000 Z0.00000 J1057.11 F500.0
+G1 X82.90000 Y237.17000 Z0.00000 J1059.79 F500.0
+G1 X86.02000 Y235.37000 Z0.00000 J1063.32 F500.0
+G1 X86.02000 Y231.17000 Z0.00000 J1067.43 F500.0
+G1 X82.90000 Y229.37000 Z0.00000 J1070.96 F500.0
+G1 X82.90000 Y225.17000 Z0.00000 J1075.08 F500.0
+G1 X86.02000 Y223.37000 Z0.00000 J1078.61 F500.0
+G1 X86.02000 Y219.17000 Z0.00000 J1082.72 F500.0
+G1 X82.90000 Y217.37000 Z0.00000 J1086.25 F500.0
+G1 X82.90000 Y213.17000 Z0.00000 J1090.37 F500.0
+G1 X86.02000 Y211.37000 Z0.00000 J1093.90 F500.0
+G1 X86.02000 Y207.17000 Z0.00000 J1098.02 F500.0
+G1 X82.90000 Y205.37000 Z0.00000 J1101.55 F500.0
+G1 X82.90000 Y201.17000 Z0.00000 J1105.66 F500.0
+G1 X84.92000 Y200.00000 Z0.00000 J1107.95 F500.0
+G1 X87.47000 Y200.00000 Z0.00000 J1110.45 F500.0
+G1 X89.48000 Y201.17000 Z0.00000 J1112.73 F500.0
+G1 X89.48000 Y205.37000 Z0.00000 J1116.84 F500.0
+G1 X86.37000 Y207.17000 Z0.00000 J1120.36 F500.0
+G1 X86.37000 Y211.37000 Z0.00000 J1124.48 F500.0
+G1 X89.48000 Y213.17000 Z0.00000 J1128.00 F500.0
+G1 X89.48000 Y217.37000 Z0.00000 J1132.12 F500.0
+G1 X86.37000 Y219.17000 Z0.00000 J1135.64 F500.0
+G1 X86.37000 Y223.37000 Z0.00000 J1139.76 F500.0
+G1 X89.48000 Y225.17000 Z0.00000 J1143.28 F500.0
+G1 X89.48000 Y229.37000 Z0.00000 J1147.39 F500.0
+G1 X86.37000 Y231.17000 Z0.00000 J1150.91 F500.0
+G1 X86.37000 Y235.37000 Z0.00000 J1155.03 F500.0
+G1 X89.48000 Y237.17000 Z0.00000 J1158.55 F500.0
+G1 X89.48000 Y239.90000 Z0.00000 J1161.23 F500.0
+G1 X89.83000 Y239.90000 Z0.00000 J1161.57 F500.0
+G1 X89.83000 Y237.17000 Z0.00000 J1164.25 F500.0
+G1 X92.95000 Y235.37000 Z0.00000 J1167.78 F500.0
+G1 X92.95000 Y231.17000 Z0.00000 J1171.89 F500.0
+G1 X89.83000 Y229.37000 Z0.00000 J1175.42 F500.0
+G1 X89.83000 Y225.17000 Z0.00000 J1179.54 F500.0
+G1 X92.95000 Y223.37000 Z0.00000 J1183.07 F500.0
+G1 X92.95000 Y219.17000 Z0.00000 J1187.18 F500.0
+G1 X89.83000 Y217.37000 Z0.00000 J1190.71 F500.0
+G1 X89.83000 Y213.17000 Z0.00000 J1194.83 F500.0
+G1 X92.95000 Y211.37000 Z0.00000 J1198.36 F500.0
+G1 X92.95000 Y207.17000 Z0.00000 J1202.48 F500.0
+G1 X89.83000 Y205.37000 Z0.00000 J1206.01 F500.0
+G1 X89.83000 Y201.17000 Z0.00000 J1210.12 F500.0
+G1 X91.85000 Y200.00000 Z0.00000 J1212.41 F500.0
+G1 X94.40000 Y200.00000 Z0.00000 J1214.91 F500.0
+G1 X96.41000 Y201.17000 Z0.00000 J1217.19 F500.0
+G1 X96.41000 Y205.37000 Z0.00000 J1221.30 F500.0
+G1 X93.29000 Y207.17000 Z0.00000 J1224.83 F500.0
+G1 X93.29000 Y211.37000 Z0.00000 J1228.95 F500.0
+G1 X96.41000 Y213.17000 Z0.00000 J1232.48 F500.0
+G1 X96.41000 Y217.37000 Z0.00000 J1236.60 F500.0
+G1 X93.29000 Y219.17000 Z0.00000 J1240.13 F500.0
+G1 X93.29000 Y223.37000 Z0.00000 J1244.24 F500.0
+G1 X96.41000 Y225.17000 Z0.00000 J1247.77 F500.0
+G1 X96.41000 Y229.37000 Z0.00000 J1251.89 F500.0
+G1 X93.29000 Y231.17000 Z0.00000 J1255.42 F500.0
+G1 X93.29000 Y235.37000 Z0.00000 J1259.53 F500.0
+G1 X96.41000 Y237.17000 Z0.00000 J1263.06 F500.0
+G1 X96.41000 Y239.90000 Z0.00000 J1265.74 F500.0
+G1 X96.76000 Y239.90000 Z0.00000 J1266.08 F500.0
+G1 X96.76000 Y237.17000 Z0.00000 J1268.76 F500.0
+G1 X99.88000 Y235.37000 Z0.00000 J1272.29 F500.0
+G1 X99.88000 Y231.17000 Z0.00000 J1276.40 F500.0
+G1 X96.76000 Y229.37000 Z0.00000 J1279.93 F500.0
+G1 X96.76000 Y225.17000 Z0.00000 J1284.05 F500.0
+G1 X99.88000 Y223.37000 Z0.00000 J1287.58 F500.0
+G1 X99.88000 Y219.17000 Z0.00000 J1291.70 F500.0
+G1 X96.76000 Y217.37000 Z0.00000 J1295.23 F500.0
+G1 X96.76000 Y213.17000 Z0.00000 J1299.34 F500.0
+G1 X99.88000 Y211.37000 Z0.00000 J1302.87 F500.0
+G1 X99.88000 Y207.17000 Z0.00000 J1306.99 F500.0
+G1 X96.76000 Y205.37000 Z0.00000 J1310.52 F500.0
+G1 X96.76000 Y203.84000 Z0.00000 J1317.01 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X96.76000 Y201.17000 Z0.00000 J1317.01 F800.0
+G1 X98.77000 Y200.00000 Z0.00000 J1317.01 F800.0
+G1 X98.77000 Y200.00000 Z10.00000 J1317.01 F800.0
+G1 X91.26000 Y195.56000 Z10.00000 J1327.01 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X96.26000 Y200.56000 Z1.00000 J0.00 F300.0
+G1 X99.44000 Y200.56000 Z1.00000 J3.12 F300.0
+G1 X99.44000 Y238.36000 Z1.00000 J40.16 F300.0
+G1 X99.44000 Y239.34000 Z1.00000 J41.12 F300.0
+G1 X23.84000 Y239.34000 Z1.00000 J115.21 F500.0
+G1 X20.66000 Y239.34000 Z1.00000 J118.33 F500.0
+G1 X20.66000 Y201.54000 Z1.00000 J155.37 F500.0
+G1 X20.66000 Y200.56000 Z1.00000 J156.33 F500.0
+G1 X91.26000 Y200.56000 Z1.00000 J230.52 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X96.26000 Y200.56000 Z1.00000 J230.52 F800.0
+G1 X96.26000 Y200.56000 Z11.00000 J230.52 F800.0
+G1 X91.26000 Y195.56000 Z11.00000 J240.52 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X96.26000 Y200.56000 Z1.00000 J0.00 F300.0
+G1 X20.66000 Y237.10000 Z1.00000 J82.29 F300.0
+G1 X23.67000 Y235.37000 Z1.00000 J85.69 F300.0
+G1 X23.67000 Y231.17000 Z1.00000 J89.80 F300.0
+G1 X20.66000 Y229.43000 Z1.00000 J93.21 F500.0
+G1 X20.66000 Y225.10000 Z1.00000 J97.45 F500.0
+G1 X23.67000 Y223.37000 Z1.00000 J100.86 F500.0
+G1 X23.67000 Y219.17000 Z1.00000 J104.97 F500.0
+G1 X20.66000 Y217.43000 Z1.00000 J108.38 F500.0
+G1 X20.66000 Y213.10000 Z1.00000 J112.62 F500.0
+G1 X23.67000 Y211.37000 Z1.00000 J116.03 F500.0
+G1 X23.67000 Y207.17000 Z1.00000 J120.14 F500.0
+G1 X20.66000 Y205.43000 Z1.00000 J123.55 F500.0
+G1 X20.66000 Y201.10000 Z1.00000 J127.79 F500.0
+G1 X21.60000 Y200.56000 Z1.00000 J128.85 F500.0
+G1 X26.07000 Y200.56000 Z1.00000 J133.24 F500.0
+G1 X27.13000 Y201.17000 Z1.00000 J134.43 F500.0
+G1 X27.13000 Y205.37000 Z1.00000 J138.55 F500.0
+G1 X24.01000 Y207.17000 Z1.00000 J142.08 F500.0
+G1 X24.01000 Y211.37000 Z1.00000 J146.20 F500.0
+G1 X27.13000 Y213.17000 Z1.00000 J149.73 F500.0
+G1 X27.13000 Y217.37000 Z1.00000 J153.84 F500.0
+G1 X24.01000 Y219.17000 Z1.00000 J157.37 F500.0
+G1 X24.01000 Y223.37000 Z1.00000 J161.49 F500.0
+G1 X27.13000 Y225.17000 Z1.00000 J165.02 F500.0
+G1 X27.13000 Y229.37000 Z1.00000 J169.13 F500.0
+G1 X24.01000 Y231.17000 Z1.00000 J172.66 F500.0
+G1 X24.01000 Y235.37000 Z1.00000 J176.78 F500.0
+G1 X27.13000 Y237.17000 Z1.00000 J180.31 F500.0
+G1 X27.13000 Y239.34000 Z1.00000 J182.44 F500.0
+G1 X27.48000 Y239.34000 Z1.00000 J182.78 F500.0
+G1 X27.48000 Y237.17000 Z1.00000 J184.91 F500.0
+G1 X30.59000 Y235.37000 Z1.00000 J188.43 F500.0
+G1 X30.59000 Y231.17000 Z1.00000 J192.54 F500.0
+G1 X27.48000 Y229.37000 Z1.00000 J196.06 F500.0
+G1 X27.48000 Y225.17000 Z1.00000 J200.18 F500.0
+G1 X30.59000 Y223.37000 Z1.00000 J203.70 F500.0
+G1 X30.59000 Y219.17000 Z1.00000 J207.82 F500.0
+G1 X27.48000 Y217.37000 Z1.00000 J211.34 F500.0
+G1 X27.48000 Y213.17000 Z1.00000 J215.46 F500.0
+G1 X30.59000 Y211.37000 Z1.00000 J218.98 F500.0
+G1 X30.59000 Y207.17000 Z1.00000 J223.09 F500.0
+G1 X27.48000 Y205.37000 Z1.00000 J226.61 F500.0
+G1 X27.48000 Y201.17000 Z1.00000 J230.73 F500.0
+G1 X28.53000 Y200.56000 Z1.00000 J231.92 F500.0
+G1 X33.00000 Y200.56000 Z1.00000 J236.30 F500.0
+G1 X34.06000 Y201.17000 Z1.00000 J237.50 F500.0
+G1 X34.06000 Y205.37000 Z1.00000 J241.62 F500.0
+G1 X30.94000 Y207.17000 Z1.00000 J245.15 F500.0
+G1 X30.94000 Y211.37000 Z1.00000 J249.26 F500.0
+G1 X34.06000 Y213.17000 Z1.00000 J252.79 F500.0
+G1 X34.06000 Y217.37000 Z1.00000 J256.91 F500.0
+G1 X30.94000 Y219.17000 Z1.00000 J260.44 F500.0
+G1 X30.94000 Y223.37000 Z1.00000 J264.55 F500.0
+G1 X34.06000 Y225.17000 Z1.00000 J268.08 F500.0
+G1 X34.06000 Y229.37000 Z1.00000 J272.20 F500.0
+G1 X30.94000 Y231.17000 Z1.00000 J275.73 F500.0
+G1 X30.94000 Y235.37000 Z1.00000 J279.85 F500.0
+G1 X34.06000 Y237.17000 Z1.00000 J283.38 F500.0
+G1 X34.06000 Y239.34000 Z1.00000 J285.50 F500.0
+G1 X34.40000 Y239.34000 Z1.00000 J285.84 F500.0
+G1 X34.40000 Y237.17000 Z1.00000 J287.96 F500.0
+G1 X37.52000 Y235.37000 Z1.00000 J291.49 F500.0
+G1 X37.52000 Y231.17000 Z1.00000 J295.61 F500.0
+G1 X34.40000 Y229.37000 Z1.00000 J299.14 F500.0
+G1 X34.40000 Y225.17000 Z1.00000 J303.25 F500.0
+G1 X37.52000 Y223.37000 Z1.00000 J306.78 F500.0
+G1 X37.52000 Y219.17000 Z1.00000 J310.90 F500.0
+G1 X34.40000 Y217.37000 Z1.00000 J314.43 F500.0
+G1 X34.40000 Y213.17000 Z1.00000 J318.55 F500.0
+G1 X37.52000 Y211.37000 Z1.00000 J322.08 F500.0
+G1 X37.52000 Y207.17000 Z1.00000 J326.19 F500.0
+G1 X34.40000 Y205.37000 Z1.00000 J329.72 F500.0
+G1 X34.40000 Y201.17000 Z1.00000 J333.84 F500.0
+G1 X35.46000 Y200.56000 Z1.00000 J335.04 F500.0
+G1 X39.93000 Y200.56000 Z1.00000 J339.42 F500.0
+G1 X40.99000 Y201.17000 Z1.00000 J340.62 F500.0
+G1 X40.99000 Y205.37000 Z1.00000 J344.73 F500.0
+G1 X37.87000 Y207.17000 Z1.00000 J348.26 F500.0
+G1 X37.87000 Y211.37000 Z1.00000 J352.38 F500.0
+G1 X40.99000 Y213.17000 Z1.00000 J355.91 F500.0
+G1 X40.99000 Y217.37000 Z1.00000 J360.02 F500.0
+G1 X37.87000 Y219.17000 Z1.00000 J363.55 F500.0
+G1 X37.87000 Y223.37000 Z1.00000 J367.67 F500.0
+G1 X40.99000 Y225.17000 Z1.00000 J371.20 F500.0
+G1 X40.99000 Y229.37000 Z1.00000 J375.32 F500.0
+G1 X37.87000 Y231.17000 Z1.00000 J378.85 F500.0
+G1 X37.87000 Y235.37000 Z1.00000 J382.96 F500.0
+G1 X40.99000 Y237.17000 Z1.00000 J386.49 F500.0
+G1 X40.99000 Y239.34000 Z1.00000 J388.62 F500.0
+G1 X41.33000 Y239.34000 Z1.00000 J388.95 F500.0
+G1 X41.33000 Y237.17000 Z1.00000 J391.08 F500.0
+G1 X44.45000 Y235.37000 Z1.00000 J394.61 F500.0
+G1 X44.45000 Y231.17000 Z1.00000 J398.72 F500.0
+G1 X41.33000 Y229.37000 Z1.00000 J402.25 F500.0
+G1 X41.33000 Y225.17000 Z1.00000 J406.37 F500.0
+G1 X44.45000 Y223.37000 Z1.00000 J409.90 F500.0
+G1 X44.45000 Y219.17000 Z1.00000 J414.02 F500.0
+G1 X41.33000 Y217.37000 Z1.00000 J417.55 F500.0
+G1 X41.33000 Y213.17000 Z1.00000 J421.66 F500.0
+G1 X44.45000 Y211.37000 Z1.00000 J425.19 F500.0
+G1 X44.45000 Y207.17000 Z1.00000 J429.31 F500.0
+G1 X41.33000 Y205.37000 Z1.00000 J432.84 F500.0
+G1 X41.33000 Y201.17000 Z1.00000 J436.95 F500.0
+G1 X42.39000 Y200.56000 Z1.00000 J438.15 F500.0
+G1 X46.86000 Y200.56000 Z1.00000 J442.53 F500.0
+G1 X47.91000 Y201.17000 Z1.00000 J443.72 F500.0
+G1 X47.91000 Y205.37000 Z1.00000 J447.84 F500.0
+G1 X44.80000 Y207.17000 Z1.00000 J451.36 F500.0
+G1 X44.80000 Y211.37000 Z1.00000 J455.48 F500.0
+G1 X47.91000 Y213.17000 Z1.00000 J459.00 F500.0
+G1 X47.91000 Y217.37000 Z1.00000 J463.11 F500.0
+G1 X44.80000 Y219.17000 Z1.00000 J466.63 F500.0
+G1 X44.80000 Y223.37000 Z1.00000 J470.75 F500.0
+G1 X47.91000 Y225.17000 Z1.00000 J474.27 F500.0
+G1 X47.91000 Y229.37000 Z1.00000 J478.39 F500.0
+G1 X44.80000 Y231.17000 Z1.00000 J481.91 F500.0
+G1 X44.80000 Y235.37000 Z1.00000 J486.03 F500.0
+G1 X47.91000 Y237.17000 Z1.00000 J489.55 F500.0
+G1 X47.91000 Y239.34000 Z1.00000 J491.67 F500.0
+G1 X48.26000 Y239.34000 Z1.00000 J492.02 F500.0
+G1 X48.26000 Y237.17000 Z1.00000 J494.14 F500.0
+G1 X51.38000 Y235.37000 Z1.00000 J497.67 F500.0
+G1 X51.38000 Y231.17000 Z1.00000 J501.79 F500.0
+G1 X48.26000 Y229.37000 Z1.00000 J505.32 F500.0
+G1 X48.26000 Y225.17000 Z1.00000 J509.44 F500.0
+G1 X51.38000 Y223.37000 Z1.00000 J512.97 F500.0
+G1 X51.38000 Y219.17000 Z1.00000 J517.08 F500.0
+G1 X48.26000 Y217.37000 Z1.00000 J520.61 F500.0
+G1 X48.26000 Y213.17000 Z1.00000 J524.73 F500.0
+G1 X51.38000 Y211.37000 Z1.00000 J528.26 F500.0
+G1 X51.38000 Y207.17000 Z1.00000 J532.37 F500.0
+G1 X48.26000 Y205.37000 Z1.00000 J535.90 F500.0
+G1 X48.26000 Y201.17000 Z1.00000 J540.02 F500.0
+G1 X49.32000 Y200.56000 Z1.00000 J541.22 F500.0
+G1 X53.79000 Y200.56000 Z1.00000 J545.60 F500.0
+G1 X54.84000 Y201.17000 Z1.00000 J546.79 F500.0
+G1 X54.84000 Y205.37000 Z1.00000 J550.90 F500.0
+G1 X51.73000 Y207.17000 Z1.00000 J554.43 F500.0
+G1 X51.73000 Y211.37000 Z1.00000 J558.54 F500.0
+G1 X54.84000 Y213.17000 Z1.00000 J562.06 F500.0
+G1 X54.84000 Y217.37000 Z1.00000 J566.18 F500.0
+G1 X51.73000 Y219.17000 Z1.00000 J569.70 F500.0
+G1 X51.73000 Y223.37000 Z1.00000 J573.82 F500.0
+G1 X54.84000 Y225.17000 Z1.00000 J577.34 F500.0
+G1 X54.84000 Y229.37000 Z1.00000 J581.45 F500.0
+G1 X51.73000 Y231.17000 Z1.00000 J584.98 F500.0
+G1 X51.73000 Y235.37000 Z1.00000 J589.09 F500.0
+G1 X54.84000 Y237.17000 Z1.00000 J592.61 F500.0
+G1 X54.84000 Y239.34000 Z1.00000 J594.74 F500.0
+G1 X55.19000 Y239.34000 Z1.00000 J595.08 F500.0
+G1 X55.19000 Y237.17000 Z1.00000 J597.21 F500.0
+G1 X58.31000 Y235.37000 Z1.00000 J600.74 F500.0
+G1 X58.31000 Y231.17000 Z1.00000 J604.86 F500.0
+G1 X55.19000 Y229.37000 Z1.00000 J608.39 F500.0
+G1 X55.19000 Y225.17000 Z1.00000 J612.50 F500.0
+G1 X58.31000 Y223.37000 Z1.00000 J616.03 F500.0
+G1 X58.31000 Y219.17000 Z1.00000 J620.15 F500.0
+G1 X55.19000 Y217.37000 Z1.00000 J623.68 F500.0
+G1 X55.19000 Y213.17000 Z1.00000 J627.79 F500.0
+G1 X58.31000 Y211.37000 Z1.00000 J631.32 F500.0
+G1 X58.31000 Y207.17000 Z1.00000 J635.44 F500.0
+G1 X55.19000 Y205.37000 Z1.00000 J638.97 F500.0
+G1 X55.19000 Y201.17000 Z1.00000 J643.09 F500.0
+G1 X56.24000 Y200.56000 Z1.00000 J644.28 F500.0
+G1 X60.72000 Y200.56000 Z1.00000 J648.67 F500.0
+G1 X61.77000 Y201.17000 Z1.00000 J649.86 F500.0
+G1 X61.77000 Y205.37000 Z1.00000 J653.97 F500.0
+G1 X58.65000 Y207.17000 Z1.00000 J657.50 F500.0
+G1 X58.65000 Y211.37000 Z1.00000 J661.62 F500.0
+G1 X61.77000 Y213.17000 Z1.00000 J665.15 F500.0
+G1 X61.77000 Y217.37000 Z1.00000 J669.26 F500.0
+G1 X58.65000 Y219.17000 Z1.00000 J672.79 F500.0
+G1 X58.65000 Y223.37000 Z1.00000 J676.91 F500.0
+G1 X61.77000 Y225.17000 Z1.00000 J680.44 F500.0
+G1 X61.77000 Y229.37000 Z1.00000 J684.56 F500.0
+G1 X58.65000 Y231.17000 Z1.00000 J688.09 F500.0
+G1 X58.65000 Y235.37000 Z1.00000 J692.20 F500.0
+G1 X61.77000 Y237.17000 Z1.00000 J695.73 F500.0
+G1 X61.77000 Y239.34000 Z1.00000 J697.86 F500.0
+G1 X62.12000 Y239.34000 Z1.00000 J698.20 F500.0
+G1 X62.12000 Y237.17000 Z1.00000 J700.33 F500.0
+G1 X65.23000 Y235.37000 Z1.00000 J703.85 F500.0
+G1 X65.23000 Y231.17000 Z1.00000 J707.97 F500.0
+G1 X62.12000 Y229.37000 Z1.00000 J711.49 F500.0
+G1 X62.12000 Y225.17000 Z1.00000 J715.60 F500.0
+G1 X65.23000 Y223.37000 Z1.00000 J719.12 F500.0
+G1 X65.23000 Y219.17000 Z1.00000 J723.24 F500.0
+G1 X62.12000 Y217.37000 Z1.00000 J726.76 F500.0
+G1 X62.12000 Y213.17000 Z1.00000 J730.88 F500.0
+G1 X65.23000 Y211.37000 Z1.00000 J734.40 F500.0
+G1 X65.23000 Y207.17000 Z1.00000 J738.52 F500.0
+G1 X62.12000 Y205.37000 Z1.00000 J742.04 F500.0
+G1 X62.12000 Y201.17000 Z1.00000 J746.15 F500.0
+G1 X63.17000 Y200.56000 Z1.00000 J747.34 F500.0
+G1 X67.64000 Y200.56000 Z1.00000 J751.72 F500.0
+G1 X68.70000 Y201.17000 Z1.00000 J752.92 F500.0
+G1 X68.70000 Y205.37000 Z1.00000 J757.04 F500.0
+G1 X65.58000 Y207.17000 Z1.00000 J760.57 F500.0
+G1 X65.58000 Y211.37000 Z1.00000 J764.68 F500.0
+G1 X68.70000 Y213.17000 Z1.00000 J768.21 F500.0
+G1 X68.70000 Y217.37000 Z1.00000 J772.33 F500.0
+G1 X65.58000 Y219.17000 Z1.00000 J775.86 F500.0
+G1 X65.58000 Y223.37000 Z1.00000 J779.98 F500.0
+G1 X68.70000 Y225.17000 Z1.00000 J783.51 F500.0
+G1 X68.70000 Y229.37000 Z1.00000 J787.62 F500.0
+G1 X65.58000 Y231.17000 Z1.00000 J791.15 F500.0
+G1 X65.58000 Y235.37000 Z1.00000 J795.27 F500.0
+G1 X68.70000 Y237.17000 Z1.00000 J798.80 F500.0
+G1 X68.70000 Y239.34000 Z1.00000 J800.92 F500.0
+G1 X69.04000 Y239.34000 Z1.00000 J801.26 F500.0
+G1 X69.04000 Y237.17000 Z1.00000 J803.38 F500.0
+G1 X72.16000 Y235.37000 Z1.00000 J806.91 F500.0
+G1 X72.16000 Y231.17000 Z1.00000 J811.03 F500.0
+G1 X69.04000 Y229.37000 Z1.00000 J814.56 F500.0
+G1 X69.04000 Y225.17000 Z1.00000 J818.68 F500.0
+G1 X72.16000 Y223.37000 Z1.00000 J822.21 F500.0
+G1 X72.16000 Y219.17000 Z1.00000 J826.32 F500.0
+G1 X69.04000 Y217.37000 Z1.00000 J829.85 F500.0
+G1 X69.04000 Y213.17000 Z1.00000 J833.97 F500.0
+G1 X72.16000 Y211.37000 Z1.00000 J837.50 F500.0
+G1 X72.16000 Y207.17000 Z1.00000 J841.61 F500.0
+G1 X69.04000 Y205.37000 Z1.00000 J845.14 F500.0
+G1 X69.04000 Y201.17000 Z1.00000 J849.26 F500.0
+G1 X70.10000 Y200.56000 Z1.00000 J850.46 F500.0
+G1 X74.57000 Y200.56000 Z1.00000 J854.84 F500.0
+G1 X75.63000 Y201.17000 Z1.00000 J856.04 F500.0
+G1 X75.63000 Y205.37000 Z1.00000 J860.15 F500.0
+G1 X72.51000 Y207.17000 Z1.00000 J863.68 F500.0
+G1 X72.51000 Y211.37000 Z1.00000 J867.80 F500.0
+G1 X75.63000 Y213.17000 Z1.00000 J871.33 F500.0
+G1 X75.63000 Y217.37000 Z1.00000 J875.45 F500.0
+G1 X72.51000 Y219.17000 Z1.00000 J878.98 F500.0
+G1 X72.51000 Y223.37000 Z1.00000 J883.09 F500.0
+G1 X75.63000 Y225.17000 Z1.00000 J886.62 F500.0
+G1 X75.63000 Y229.37000 Z1.00000 J890.74 F500.0
+G1 X72.51000 Y231.17000 Z1.00000 J894.27 F500.0
+G1 X72.51000 Y235.37000 Z1.00000 J898.38 F500.0
+G1 X75.63000 Y237.17000 Z1.00000 J901.91 F500.0
+G1 X75.63000 Y239.34000 Z1.00000 J904.04 F500.0
+G1 X75.97000 Y239.34000 Z1.00000 J904.37 F500.0
+G1 X75.97000 Y237.17000 Z1.00000 J906.50 F500.0
+G1 X79.09000 Y235.37000 Z1.00000 J910.03 F500.0
+G1 X79.09000 Y231.17000 Z1.00000 J914.15 F500.0
+G1 X75.97000 Y229.37000 Z1.00000 J917.68 F500.0
+G1 X75.97000 Y225.17000 Z1.00000 J921.79 F500.0
+G1 X79.09000 Y223.37000 Z1.00000 J925.32 F500.0
+G1 X79.09000 Y219.17000 Z1.00000 J929.44 F500.0
+G1 X75.97000 Y217.37000 Z1.00000 J932.97 F500.0
+G1 X75.97000 Y213.17000 Z1.00000 J937.08 F500.0
+G1 X79.09000 Y211.37000 Z1.00000 J940.61 F500.0
+G1 X79.09000 Y207.17000 Z1.00000 J944.73 F500.0
+G1 X75.97000 Y205.37000 Z1.00000 J948.26 F500.0
+G1 X75.97000 Y201.17000 Z1.00000 J952.38 F500.0
+G1 X77.03000 Y200.56000 Z1.00000 J953.57 F500.0
+G1 X81.50000 Y200.56000 Z1.00000 J957.95 F500.0
+G1 X82.55000 Y201.17000 Z1.00000 J959.14 F500.0
+G1 X82.55000 Y205.37000 Z1.00000 J963.26 F500.0
+G1 X79.44000 Y207.17000 Z1.00000 J966.78 F500.0
+G1 X79.44000 Y211.37000 Z1.00000 J970.90 F500.0
+G1 X82.55000 Y213.17000 Z1.00000 J974.42 F500.0
+G1 X82.55000 Y217.37000 Z1.00000 J978.54 F500.0
+G1 X79.44000 Y219.17000 Z1.00000 J982.06 F500.0
+G1 X79.44000 Y223.37000 Z1.00000 J986.17 F500.0
+G1 X82.55000 Y225.17000 Z1.00000 J989.69 F500.0
+G1 X82.55000 Y229.37000 Z1.00000 J993.81 F500.0
+G1 X79.44000 Y231.17000 Z1.00000 J997.33 F500.0
+G1 X79.44000 Y235.37000 Z1.00000 J1001.45 F500.0
+G1 X82.55000 Y237.17000 Z1.00000 J1004.97 F500.0
+G1 X82.55000 Y239.34000 Z1.00000 J1007.10 F500.0
+G1 X82.90000 Y239.34000 Z1.00000 J1007.44 F500.0
+G1 X82.90000 Y237.17000 Z1.00000 J1009.57 F500.0
+G1 X86.02000 Y235.37000 Z1.00000 J1013.10 F500.0
+G1 X86.02000 Y231.17000 Z1.00000 J1017.21 F500.0
+G1 X82.90000 Y229.37000 Z1.00000 J1020.74 F500.0
+G1 X82.90000 Y225.17000 Z1.00000 J1024.86 F500.0
+G1 X86.02000 Y223.37000 Z1.00000 J1028.39 F500.0
+G1 X86.02000 Y219.17000 Z1.00000 J1032.50 F500.0
+G1 X82.90000 Y217.37000 Z1.00000 J1036.03 F500.0
+G1 X82.90000 Y213.17000 Z1.00000 J1040.15 F500.0
+G1 X86.02000 Y211.37000 Z1.00000 J1043.68 F500.0
+G1 X86.02000 Y207.17000 Z1.00000 J1047.80 F500.0
+G1 X82.90000 Y205.37000 Z1.00000 J1051.33 F500.0
+G1 X82.90000 Y201.17000 Z1.00000 J1055.44 F500.0
+G1 X83.96000 Y200.56000 Z1.00000 J1056.64 F500.0
+G1 X88.43000 Y200.56000 Z1.00000 J1061.02 F500.0
+G1 X89.48000 Y201.17000 Z1.00000 J1062.21 F500.0
+G1 X89.48000 Y205.37000 Z1.00000 J1066.33 F500.0
+G1 X86.37000 Y207.17000 Z1.00000 J1069.85 F500.0
+G1 X86.37000 Y211.37000 Z1.00000 J1073.96 F500.0
+G1 X89.48000 Y213.17000 Z1.00000 J1077.49 F500.0
+G1 X89.48000 Y217.37000 Z1.00000 J1081.60 F500.0
+G1 X86.37000 Y219.17000 Z1.00000 J1085.12 F500.0
+G1 X86.37000 Y223.37000 Z1.00000 J1089.24 F500.0
+G1 X89.48000 Y225.17000 Z1.00000 J1092.76 F500.0
+G1 X89.48000 Y229.37000 Z1.00000 J1096.88 F500.0
+G1 X86.37000 Y231.17000 Z1.00000 J1100.40 F500.0
+G1 X86.37000 Y235.37000 Z1.00000 J1104.51 F500.0
+G1 X89.48000 Y237.17000 Z1.00000 J1108.04 F500.0
+G1 X89.48000 Y239.34000 Z1.00000 J1110.16 F500.0
+G1 X89.83000 Y239.34000 Z1.00000 J1110.50 F500.0
+G1 X89.83000 Y237.17000 Z1.00000 J1112.63 F500.0
+G1 X92.95000 Y235.37000 Z1.00000 J1116.16 F500.0
+G1 X92.95000 Y231.17000 Z1.00000 J1120.28 F500.0
+G1 X89.83000 Y229.37000 Z1.00000 J1123.81 F500.0
+G1 X89.83000 Y225.17000 Z1.00000 J1127.92 F500.0
+G1 X92.95000 Y223.37000 Z1.00000 J1131.45 F500.0
+G1 X92.95000 Y219.17000 Z1.00000 J1135.57 F500.0
+G1 X89.83000 Y217.37000 Z1.00000 J1139.10 F500.0
+G1 X89.83000 Y213.17000 Z1.00000 J1143.22 F500.0
+G1 X92.95000 Y211.37000 Z1.00000 J1146.75 F500.0
+G1 X92.95000 Y207.17000 Z1.00000 J1150.86 F500.0
+G1 X89.83000 Y205.37000 Z1.00000 J1154.39 F500.0
+G1 X89.83000 Y201.17000 Z1.00000 J1158.51 F500.0
+G1 X90.89000 Y200.56000 Z1.00000 J1159.71 F500.0
+G1 X95.36000 Y200.56000 Z1.00000 J1164.09 F500.0
+G1 X96.41000 Y201.17000 Z1.00000 J1165.28 F500.0
+G1 X96.41000 Y205.37000 Z1.00000 J1169.39 F500.0
+G1 X93.29000 Y207.17000 Z1.00000 J1172.92 F500.0
+G1 X93.29000 Y211.37000 Z1.00000 J1177.04 F500.0
+G1 X96.41000 Y213.17000 Z1.00000 J1180.57 F500.0
+G1 X96.41000 Y217.37000 Z1.00000 J1184.68 F500.0
+G1 X93.29000 Y219.17000 Z1.00000 J1188.21 F500.0
+G1 X93.29000 Y223.37000 Z1.00000 J1192.33 F500.0
+G1 X96.41000 Y225.17000 Z1.00000 J1195.86 F500.0
+G1 X96.41000 Y229.37000 Z1.00000 J1199.98 F500.0
+G1 X93.29000 Y231.17000 Z1.00000 J1203.51 F500.0
+G1 X93.29000 Y235.37000 Z1.00000 J1207.62 F500.0
+G1 X96.41000 Y237.17000 Z1.00000 J1211.15 F500.0
+G1 X96.41000 Y239.34000 Z1.00000 J1213.28 F500.0
+G1 X96.76000 Y239.34000 Z1.00000 J1213.62 F500.0
+G1 X96.76000 Y237.17000 Z1.00000 J1215.75 F500.0
+G1 X99.44000 Y235.62000 Z1.00000 J1218.78 F500.0
+G1 X99.44000 Y230.92000 Z1.00000 J1223.39 F500.0
+G1 X96.76000 Y229.37000 Z1.00000 J1226.42 F500.0
+G1 X96.76000 Y225.17000 Z1.00000 J1230.54 F500.0
+G1 X99.44000 Y223.62000 Z1.00000 J1233.57 F500.0
+G1 X99.44000 Y218.92000 Z1.00000 J1238.18 F500.0
+G1 X96.76000 Y217.37000 Z1.00000 J1241.21 F500.0
+G1 X96.76000 Y213.17000 Z1.00000 J1245.33 F500.0
+G1 X99.44000 Y211.62000 Z1.00000 J1248.36 F500.0
+G1 X99.44000 Y206.92000 Z1.00000 J1252.97 F500.0
+G1 X96.76000 Y205.37000 Z1.00000 J1256.00 F500.0
+G1 X96.76000 Y204.96000 Z1.00000 J1261.41 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X96.76000 Y201.17000 Z1.00000 J1261.41 F800.0
+G1 X97.81000 Y200.56000 Z1.00000 J1261.41 F800.0
+G1 X97.81000 Y200.56000 Z11.00000 J1261.41 F800.0
+G1 X87.81000 Y196.11000 Z11.00000 J1271.41 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X92.81000 Y201.11000 Z2.00000 J0.00 F300.0
+G1 X98.89000 Y201.11000 Z2.00000 J5.96 F300.0
+G1 X98.89000 Y236.91000 Z2.00000 J41.04 F300.0
+G1 X98.89000 Y238.79000 Z2.00000 J42.88 F300.0
+G1 X27.29000 Y238.79000 Z2.00000 J113.05 F500.0
+G1 X21.21000 Y238.79000 Z2.00000 J119.01 F500.0
+G1 X21.21000 Y202.99000 Z2.00000 J154.10 F500.0
+G1 X21.21000 Y201.11000 Z2.00000 J155.94 F500.0
+G1 X87.81000 Y201.11000 Z2.00000 J226.21 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X92.81000 Y201.11000 Z2.00000 J226.21 F800.0
+G1 X92.81000 Y201.11000 Z12.00000 J226.21 F800.0
+G1 X87.81000 Y196.11000 Z12.00000 J236.21 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X92.81000 Y201.11000 Z2.00000 J0.00 F300.0
+G1 X21.21000 Y236.79000 Z2.00000 J78.39 F300.0
+G1 X23.67000 Y235.37000 Z2.00000 J81.18 F300.0
+G1 X23.67000 Y231.17000 Z2.00000 J85.29 F300.0
+G1 X21.21000 Y229.75000 Z2.00000 J88.08 F500.0
+G1 X21.21000 Y224.78000 Z2.00000 J92.95 F500.0
+G1 X23.67000 Y223.37000 Z2.00000 J95.73 F500.0
+G1 X23.67000 Y219.17000 Z2.00000 J99.84 F500.0
+G1 X21.21000 Y217.75000 Z2.00000 J102.63 F500.0
+G1 X21.21000 Y212.78000 Z2.00000 J107.50 F500.0
+G1 X23.67000 Y211.37000 Z2.00000 J110.27 F500.0
+G1 X23.67000 Y207.17000 Z2.00000 J114.39 F500.0
+G1 X21.21000 Y205.75000 Z2.00000 J117.17 F500.0
+G1 X27.03000 Y201.11000 Z2.00000 J124.47 F500.0
+G1 X27.13000 Y201.17000 Z2.00000 J124.58 F500.0
+G1 X27.13000 Y205.37000 Z2.00000 J128.70 F500.0
+G1 X24.01000 Y207.17000 Z2.00000 J132.23 F500.0
+G1 X24.01000 Y211.37000 Z2.00000 J136.35 F500.0
+G1 X27.13000 Y213.17000 Z2.00000 J139.87 F500.0
+G1 X27.13000 Y217.37000 Z2.00000 J143.99 F500.0
+G1 X24.01000 Y219.17000 Z2.00000 J147.52 F500.0
+G1 X24.01000 Y223.37000 Z2.00000 J151.64 F500.0
+G1 X27.13000 Y225.17000 Z2.00000 J155.17 F500.0
+G1 X27.13000 Y229.37000 Z2.00000 J159.28 F500.0
+G1 X24.01000 Y231.17000 Z2.00000 J162.81 F500.0
+G1 X24.01000 Y235.37000 Z2.00000 J166.93 F500.0
+G1 X27.13000 Y237.17000 Z2.00000 J170.46 F500.0
+G1 X27.13000 Y238.79000 Z2.00000 J172.05 F500.0
+G1 X27.48000 Y238.79000 Z2.00000 J172.39 F500.0
+G1 X27.48000 Y237.17000 Z2.00000 J173.98 F500.0
+G1 X30.59000 Y235.37000 Z2.00000 J177.50 F500.0
+G1 X30.59000 Y231.17000 Z2.00000 J181.61 F500.0
+G1 X27.48000 Y229.37000 Z2.00000 J185.14 F500.0
+G1 X27.48000 Y225.17000 Z2.00000 J189.25 F500.0
+G1 X30.59000 Y223.37000 Z2.00000 J192.77 F500.0
+G1 X30.59000 Y219.17000 Z2.00000 J196.89 F500.0
+G1 X27.48000 Y217.37000 Z2.00000 J200.41 F500.0
+G1 X27.48000 Y213.17000 Z2.00000 J204.53 F500.0
+G1 X30.59000 Y211.37000 Z2.00000 J208.05 F500.0
+G1 X30.59000 Y207.17000 Z2.00000 J212.16 F500.0
+G1 X27.48000 Y205.37000 Z2.00000 J215.69 F500.0
+G1 X27.48000 Y201.17000 Z2.00000 J219.80 F500.0
+G1 X27.57000 Y201.11000 Z2.00000 J219.91 F500.0
+G1 X33.96000 Y201.11000 Z2.00000 J226.17 F500.0
+G1 X34.06000 Y201.17000 Z2.00000 J226.28 F500.0
+G1 X34.06000 Y205.37000 Z2.00000 J230.40 F500.0
+G1 X30.94000 Y207.17000 Z2.00000 J233.93 F500.0
+G1 X30.94000 Y211.37000 Z2.00000 J238.05 F500.0
+G1 X34.06000 Y213.17000 Z2.00000 J241.58 F500.0
+G1 X34.06000 Y217.37000 Z2.00000 J245.69 F500.0
+G1 X30.94000 Y219.17000 Z2.00000 J249.22 F500.0
+G1 X30.94000 Y223.37000 Z2.00000 J253.34 F500.0
+G1 X34.06000 Y225.17000 Z2.00000 J256.87 F500.0
+G1 X34.06000 Y229.37000 Z2.00000 J260.98 F500.0
+G1 X30.94000 Y231.17000 Z2.00000 J264.51 F500.0
+G1 X30.94000 Y235.37000 Z2.00000 J268.63 F500.0
+G1 X34.06000 Y237.17000 Z2.00000 J272.16 F500.0
+G1 X34.06000 Y238.79000 Z2.00000 J273.75 F500.0
+G1 X34.40000 Y238.79000 Z2.00000 J274.08 F500.0
+G1 X34.40000 Y237.17000 Z2.00000 J275.67 F500.0
+G1 X37.52000 Y235.37000 Z2.00000 J279.20 F500.0
+G1 X37.52000 Y231.17000 Z2.00000 J283.31 F500.0
+G1 X34.40000 Y229.37000 Z2.00000 J286.84 F500.0
+G1 X34.40000 Y225.17000 Z2.00000 J290.96 F500.0
+G1 X37.52000 Y223.37000 Z2.00000 J294.49 F500.0
+G1 X37.52000 Y219.17000 Z2.00000 J298.61 F500.0
+G1 X34.40000 Y217.37000 Z2.00000 J302.14 F500.0
+G1 X34.40000 Y213.17000 Z2.00000 J306.25 F500.0
+G1 X37.52000 Y211.37000 Z2.00000 J309.78 F500.0
+G1 X37.52000 Y207.17000 Z2.00000 J313.90 F500.0
+G1 X34.40000 Y205.37000 Z2.00000 J317.43 F500.0
+G1 X34.40000 Y201.17000 Z2.00000 J321.54 F500.0
+G1 X34.50000 Y201.11000 Z2.00000 J321.66 F500.0
+G1 X40.89000 Y201.11000 Z2.00000 J327.92 F500.0
+G1 X40.99000 Y201.17000 Z2.00000 J328.04 F500.0
+G1 X40.99000 Y205.37000 Z2.00000 J332.15 F500.0
+G1 X37.87000 Y207.17000 Z2.00000 J335.68 F500.0
+G1 X37.87000 Y211.37000 Z2.00000 J339.80 F500.0
+G1 X40.99000 Y213.17000 Z2.00000 J343.33 F500.0
+G1 X40.99000 Y217.37000 Z2.00000 J347.44 F500.0
+G1 X37.87000 Y219.17000 Z2.00000 J350.97 F500.0
+G1 X37.87000 Y223.37000 Z2.00000 J355.09 F500.0
+G1 X40.99000 Y225.17000 Z2.00000 J358.62 F500.0
+G1 X40.99000 Y229.37000 Z2.00000 J362.73 F500.0
+G1 X37.87000 Y231.17000 Z2.00000 J366.26 F500.0
+G1 X37.87000 Y235.37000 Z2.00000 J370.38 F500.0
+G1 X40.99000 Y237.17000 Z2.00000 J373.91 F500.0
+G1 X40.99000 Y238.79000 Z2.00000 J375.50 F500.0
+G1 X41.33000 Y238.79000 Z2.00000 J375.83 F500.0
+G1 X41.33000 Y237.17000 Z2.00000 J377.42 F500.0
+G1 X44.45000 Y235.37000 Z2.00000 J380.95 F500.0
+G1 X44.45000 Y231.17000 Z2.00000 J385.07 F500.0
+G1 X41.33000 Y229.37000 Z2.00000 J388.60 F500.0
+G1 X41.33000 Y225.17000 Z2.00000 J392.71 F500.0
+G1 X44.45000 Y223.37000 Z2.00000 J396.24 F500.0
+G1 X44.45000 Y219.17000 Z2.00000 J400.36 F500.0
+G1 X41.33000 Y217.37000 Z2.00000 J403.89 F500.0
+G1 X41.33000 Y213.17000 Z2.00000 J408.00 F500.0
+G1 X44.45000 Y211.37000 Z2.00000 J411.53 F500.0
+G1 X44.45000 Y207.17000 Z2.00000 J415.65 F500.0
+G1 X41.33000 Y205.37000 Z2.00000 J419.18 F500.0
+G1 X41.33000 Y201.17000 Z2.00000 J423.29 F500.0
+G1 X41.43000 Y201.11000 Z2.00000 J423.41 F500.0
+G1 X47.82000 Y201.11000 Z2.00000 J429.67 F500.0
+G1 X47.91000 Y201.17000 Z2.00000 J429.78 F500.0
+G1 X47.91000 Y205.37000 Z2.00000 J433.89 F500.0
+G1 X44.80000 Y207.17000 Z2.00000 J437.41 F500.0
+G1 X44.80000 Y211.37000 Z2.00000 J441.53 F500.0
+G1 X47.91000 Y213.17000 Z2.00000 J445.05 F500.0
+G1 X47.91000 Y217.37000 Z2.00000 J449.17 F500.0
+G1 X44.80000 Y219.17000 Z2.00000 J452.69 F500.0
+G1 X44.80000 Y223.37000 Z2.00000 J456.81 F500.0
+G1 X47.91000 Y225.17000 Z2.00000 J460.33 F500.0
+G1 X47.91000 Y229.37000 Z2.00000 J464.44 F500.0
+G1 X44.80000 Y231.17000 Z2.00000 J467.96 F500.0
+G1 X44.80000 Y235.37000 Z2.00000 J472.08 F500.0
+G1 X47.91000 Y237.17000 Z2.00000 J475.60 F500.0
+G1 X47.91000 Y238.79000 Z2.00000 J477.19 F500.0
+G1 X48.26000 Y238.79000 Z2.00000 J477.53 F500.0
+G1 X48.26000 Y237.17000 Z2.00000 J479.12 F500.0
+G1 X51.38000 Y235.37000 Z2.00000 J482.65 F500.0
+G1 X51.38000 Y231.17000 Z2.00000 J486.77 F500.0
+G1 X48.26000 Y229.37000 Z2.00000 J490.30 F500.0
+G1 X48.26000 Y225.17000 Z2.00000 J494.41 F500.0
+G1 X51.38000 Y223.37000 Z2.00000 J497.94 F500.0
+G1 X51.38000 Y219.17000 Z2.00000 J502.06 F500.0
+G1 X48.26000 Y217.37000 Z2.00000 J505.59 F500.0
+G1 X48.26000 Y213.17000 Z2.00000 J509.70 F500.0
+G1 X51.38000 Y211.37000 Z2.00000 J513.23 F500.0
+G1 X51.38000 Y207.17000 Z2.00000 J517.35 F500.0
+G1 X48.26000 Y205.37000 Z2.00000 J520.88 F500.0
+G1 X48.26000 Y201.17000 Z2.00000 J525.00 F500.0
+G1 X48.36000 Y201.11000 Z2.00000 J525.11 F500.0
+G1 X54.75000 Y201.11000 Z2.00000 J531.37 F500.0
+G1 X54.84000 Y201.17000 Z2.00000 J531.48 F500.0
+G1 X54.84000 Y205.37000 Z2.00000 J535.59 F500.0
+G1 X51.73000 Y207.17000 Z2.00000 J539.12 F500.0
+G1 X51.73000 Y211.37000 Z2.00000 J543.23 F500.0
+G1 X54.84000 Y213.17000 Z2.00000 J546.75 F500.0
+G1 X54.84000 Y217.37000 Z2.00000 J550.87 F500.0
+G1 X51.73000 Y219.17000 Z2.00000 J554.39 F500.0
+G1 X51.73000 Y223.37000 Z2.00000 J558.51 F500.0
+G1 X54.84000 Y225.17000 Z2.00000 J562.03 F500.0
+G1 X54.84000 Y229.37000 Z2.00000 J566.14 F500.0
+G1 X51.73000 Y231.17000 Z2.00000 J569.67 F500.0
+G1 X51.73000 Y235.37000 Z2.00000 J573.78 F500.0
+G1 X54.84000 Y237.17000 Z2.00000 J577.30 F500.0
+G1 X54.84000 Y238.79000 Z2.00000 J578.89 F500.0
+G1 X55.19000 Y238.79000 Z2.00000 J579.23 F500.0
+G1 X55.19000 Y237.17000 Z2.00000 J580.82 F500.0
+G1 X58.31000 Y235.37000 Z2.00000 J584.35 F500.0
+G1 X58.31000 Y231.17000 Z2.00000 J588.47 F500.0
+G1 X55.19000 Y229.37000 Z2.00000 J592.00 F500.0
+G1 X55.19000 Y225.17000 Z2.00000 J596.11 F500.0
+G1 X58.31000 Y223.37000 Z2.00000 J599.64 F500.0
+G1 X58.31000 Y219.17000 Z2.00000 J603.76 F500.0
+G1 X55.19000 Y217.37000 Z2.00000 J607.29 F500.0
+G1 X55.19000 Y213.17000 Z2.00000 J611.41 F500.0
+G1 X58.31000 Y211.37000 Z2.00000 J614.94 F500.0
+G1 X58.31000 Y207.17000 Z2.00000 J619.05 F500.0
+G1 X55.19000 Y205.37000 Z2.00000 J622.58 F500.0
+G1 X55.19000 Y201.17000 Z2.00000 J626.70 F500.0
+G1 X55.28000 Y201.11000 Z2.00000 J626.80 F500.0
+G1 X61.68000 Y201.11000 Z2.00000 J633.08 F500.0
+G1 X61.77000 Y201.17000 Z2.00000 J633.18 F500.0
+G1 X61.77000 Y205.37000 Z2.00000 J637.30 F500.0
+G1 X58.65000 Y207.17000 Z2.00000 J640.83 F500.0
+G1 X58.65000 Y211.37000 Z2.00000 J644.94 F500.0
+G1 X61.77000 Y213.17000 Z2.00000 J648.47 F500.0
+G1 X61.77000 Y217.37000 Z2.00000 J652.59 F500.0
+G1 X58.65000 Y219.17000 Z2.00000 J656.12 F500.0
+G1 X58.65000 Y223.37000 Z2.00000 J660.24 F500.0
+G1 X61.77000 Y225.17000 Z2.00000 J663.77 F500.0
+G1 X61.77000 Y229.37000 Z2.00000 J667.88 F500.0
+G1 X58.65000 Y231.17000 Z2.00000 J671.41 F500.0
+G1 X58.65000 Y235.37000 Z2.00000 J675.53 F500.0
+G1 X61.77000 Y237.17000 Z2.00000 J679.06 F500.0
+G1 X61.77000 Y238.79000 Z2.00000 J680.64 F500.0
+G1 X62.12000 Y238.79000 Z2.00000 J680.99 F500.0
+G1 X62.12000 Y237.17000 Z2.00000 J682.58 F500.0
+G1 X65.23000 Y235.37000 Z2.00000 J686.10 F500.0
+G1 X65.23000 Y231.17000 Z2.00000 J690.21 F500.0
+G1 X62.12000 Y229.37000 Z2.00000 J693.73 F500.0
+G1 X62.12000 Y225.17000 Z2.00000 J697.85 F500.0
+G1 X65.23000 Y223.37000 Z2.00000 J701.37 F500.0
+G1 X65.23000 Y219.17000 Z2.00000 J705.49 F500.0
+G1 X62.12000 Y217.37000 Z2.00000 J709.01 F500.0
+G1 X62.12000 Y213.17000 Z2.00000 J713.13 F500.0
+G1 X65.23000 Y211.37000 Z2.00000 J716.65 F500.0
+G1 X65.23000 Y207.17000 Z2.00000 J720.76 F500.0
+G1 X62.12000 Y205.37000 Z2.00000 J724.28 F500.0
+G1 X62.12000 Y201.17000 Z2.00000 J728.40 F500.0
+G1 X62.21000 Y201.11000 Z2.00000 J728.51 F500.0
+G1 X68.60000 Y201.11000 Z2.00000 J734.77 F500.0
+G1 X68.70000 Y201.17000 Z2.00000 J734.88 F500.0
+G1 X68.70000 Y205.37000 Z2.00000 J739.00 F500.0
+G1 X65.58000 Y207.17000 Z2.00000 J742.53 F500.0
+G1 X65.58000 Y211.37000 Z2.00000 J746.64 F500.0
+G1 X68.70000 Y213.17000 Z2.00000 J750.17 F500.0
+G1 X68.70000 Y217.37000 Z2.00000 J754.29 F500.0
+G1 X65.58000 Y219.17000 Z2.00000 J757.82 F500.0
+G1 X65.58000 Y223.37000 Z2.00000 J761.94 F500.0
+G1 X68.70000 Y225.17000 Z2.00000 J765.47 F500.0
+G1 X68.70000 Y229.37000 Z2.00000 J769.58 F500.0
+G1 X65.58000 Y231.17000 Z2.00000 J773.11 F500.0
+G1 X65.58000 Y235.37000 Z2.00000 J777.23 F500.0
+G1 X68.70000 Y237.17000 Z2.00000 J780.76 F500.0
+G1 X68.70000 Y238.79000 Z2.00000 J782.35 F500.0
+G1 X69.04000 Y238.79000 Z2.00000 J782.68 F500.0
+G1 X69.04000 Y237.17000 Z2.00000 J784.27 F500.0
+G1 X72.16000 Y235.37000 Z2.00000 J787.80 F500.0
+G1 X72.16000 Y231.17000 Z2.00000 J791.91 F500.0
+G1 X69.04000 Y229.37000 Z2.00000 J795.44 F500.0
+G1 X69.04000 Y225.17000 Z2.00000 J799.56 F500.0
+G1 X72.16000 Y223.37000 Z2.00000 J803.09 F500.0
+G1 X72.16000 Y219.17000 Z2.00000 J807.20 F500.0
+G1 X69.04000 Y217.37000 Z2.00000 J810.73 F500.0
+G1 X69.04000 Y213.17000 Z2.00000 J814.85 F500.0
+G1 X72.16000 Y211.37000 Z2.00000 J818.38 F500.0
+G1 X72.16000 Y207.17000 Z2.00000 J822.50 F500.0
+G1 X69.04000 Y205.37000 Z2.00000 J826.03 F500.0
+G1 X69.04000 Y201.17000 Z2.00000 J830.14 F500.0
+G1 X69.14000 Y201.11000 Z2.00000 J830.26 F500.0
+G1 X75.53000 Y201.11000 Z2.00000 J836.52 F500.0
+G1 X75.63000 Y201.17000 Z2.00000 J836.63 F500.0
+G1 X75.63000 Y205.37000 Z2.00000 J840.75 F500.0
+G1 X72.51000 Y207.17000 Z2.00000 J844.28 F500.0
+G1 X72.51000 Y211.37000 Z2.00000 J848.40 F500.0
+G1 X75.63000 Y213.17000 Z2.00000 J851.93 F500.0
+G1 X75.63000 Y217.37000 Z2.00000 J856.04 F500.0
+G1 X72.51000 Y219.17000 Z2.00000 J859.57 F500.0
+G1 X72.51000 Y223.37000 Z2.00000 J863.69 F500.0
+G1 X75.63000 Y225.17000 Z2.00000 J867.22 F500.0
+G1 X75.63000 Y229.37000 Z2.00000 J871.33 F500.0
+G1 X72.51000 Y231.17000 Z2.00000 J874.86 F500.0
+G1 X72.51000 Y235.37000 Z2.00000 J878.98 F500.0
+G1 X75.63000 Y237.17000 Z2.00000 J882.51 F500.0
+G1 X75.63000 Y238.79000 Z2.00000 J884.10 F500.0
+G1 X75.97000 Y238.79000 Z2.00000 J884.43 F500.0
+G1 X75.97000 Y237.17000 Z2.00000 J886.02 F500.0
+G1 X79.09000 Y235.37000 Z2.00000 J889.55 F500.0
+G1 X79.09000 Y231.17000 Z2.00000 J893.66 F500.0
+G1 X75.97000 Y229.37000 Z2.00000 J897.19 F500.0
+G1 X75.97000 Y225.17000 Z2.00000 J901.31 F500.0
+G1 X79.09000 Y223.37000 Z2.00000 J904.84 F500.0
+G1 X79.09000 Y219.17000 Z2.00000 J908.96 F500.0
+G1 X75.97000 Y217.37000 Z2.00000 J912.49 F500.0
+G1 X75.97000 Y213.17000 Z2.00000 J916.60 F500.0
+G1 X79.09000 Y211.37000 Z2.00000 J920.13 F500.0
+G1 X79.09000 Y207.17000 Z2.00000 J924.25 F500.0
+G1 X75.97000 Y205.37000 Z2.00000 J927.78 F500.0
+G1 X75.97000 Y201.17000 Z2.00000 J931.89 F500.0
+G1 X76.07000 Y201.11000 Z2.00000 J932.01 F500.0
+G1 X82.46000 Y201.11000 Z2.00000 J938.27 F500.0
+G1 X82.55000 Y201.17000 Z2.00000 J938.38 F500.0
+G1 X82.55000 Y205.37000 Z2.00000 J942.49 F500.0
+G1 X79.44000 Y207.17000 Z2.00000 J946.01 F500.0
+G1 X79.44000 Y211.37000 Z2.00000 J950.13 F500.0
+G1 X82.55000 Y213.17000 Z2.00000 J953.65 F500.0
+G1 X82.55000 Y217.37000 Z2.00000 J957.77 F500.0
+G1 X79.44000 Y219.17000 Z2.00000 J961.29 F500.0
+G1 X79.44000 Y223.37000 Z2.00000 J965.40 F500.0
+G1 X82.55000 Y225.17000 Z2.00000 J968.93 F500.0
+G1 X82.55000 Y229.37000 Z2.00000 J973.04 F500.0
+G1 X79.44000 Y231.17000 Z2.00000 J976.56 F500.0
+G1 X79.44000 Y235.37000 Z2.00000 J980.68 F500.0
+G1 X82.55000 Y237.17000 Z2.00000 J984.20 F500.0
+G1 X82.55000 Y238.79000 Z2.00000 J985.79 F500.0
+G1 X82.90000 Y238.79000 Z2.00000 J986.13 F500.0
+G1 X82.90000 Y237.17000 Z2.00000 J987.72 F500.0
+G1 X86.02000 Y235.37000 Z2.00000 J991.25 F500.0
+G1 X86.02000 Y231.17000 Z2.00000 J995.36 F500.0
+G1 X82.90000 Y229.37000 Z2.00000 J998.89 F500.0
+G1 X82.90000 Y225.17000 Z2.00000 J1003.01 F500.0
+G1 X86.02000 Y223.37000 Z2.00000 J1006.54 F500.0
+G1 X86.02000 Y219.17000 Z2.00000 J1010.66 F500.0
+G1 X82.90000 Y217.37000 Z2.00000 J1014.19 F500.0
+G1 X82.90000 Y213.17000 Z2.00000 J1018.30 F500.0
+G1 X86.02000 Y211.37000 Z2.00000 J1021.83 F500.0
+G1 X86.02000 Y207.17000 Z2.00000 J1025.95 F500.0
+G1 X82.90000 Y205.37000 Z2.00000 J1029.48 F500.0
+G1 X82.90000 Y201.17000 Z2.00000 J1033.59 F500.0
+G1 X83.00000 Y201.11000 Z2.00000 J1033.71 F500.0
+G1 X89.39000 Y201.11000 Z2.00000 J1039.97 F500.0
+G1 X89.48000 Y201.17000 Z2.00000 J1040.08 F500.0
+G1 X89.48000 Y205.37000 Z2.00000 J1044.19 F500.0
+G1 X86.37000 Y207.17000 Z2.00000 J1047.71 F500.0
+G1 X86.37000 Y211.37000 Z2.00000 J1051.83 F500.0
+G1 X89.48000 Y213.17000 Z2.00000 J1055.35 F500.0
+G1 X89.48000 Y217.37000 Z2.00000 J1059.47 F500.0
+G1 X86.37000 Y219.17000 Z2.00000 J1062.99 F500.0
+G1 X86.37000 Y223.37000 Z2.00000 J1067.11 F500.0
+G1 X89.48000 Y225.17000 Z2.00000 J1070.63 F500.0
+G1 X89.48000 Y229.37000 Z2.00000 J1074.74 F500.0
+G1 X86.37000 Y231.17000 Z2.00000 J1078.26 F500.0
+G1 X86.37000 Y235.37000 Z2.00000 J1082.38 F500.0
+G1 X89.48000 Y237.17000 Z2.00000 J1085.90 F500.0
+G1 X89.48000 Y238.79000 Z2.00000 J1087.49 F500.0
+G1 X89.83000 Y238.79000 Z2.00000 J1087.83 F500.0
+G1 X89.83000 Y237.17000 Z2.00000 J1089.42 F500.0
+G1 X92.95000 Y235.37000 Z2.00000 J1092.95 F500.0
+G1 X92.95000 Y231.17000 Z2.00000 J1097.07 F500.0
+G1 X89.83000 Y229.37000 Z2.00000 J1100.60 F500.0
+G1 X89.83000 Y225.17000 Z2.00000 J1104.71 F500.0
+G1 X92.95000 Y223.37000 Z2.00000 J1108.24 F500.0
+G1 X92.95000 Y219.17000 Z2.00000 J1112.36 F500.0
+G1 X89.83000 Y217.37000 Z2.00000 J1115.89 F500.0
+G1 X89.83000 Y213.17000 Z2.00000 J1120.00 F500.0
+G1 X92.95000 Y211.37000 Z2.00000 J1123.53 F500.0
+G1 X92.95000 Y207.17000 Z2.00000 J1127.65 F500.0
+G1 X89.83000 Y205.37000 Z2.00000 J1131.18 F500.0
+G1 X89.83000 Y201.17000 Z2.00000 J1135.30 F500.0
+G1 X89.93000 Y201.11000 Z2.00000 J1135.41 F500.0
+G1 X96.32000 Y201.11000 Z2.00000 J1141.67 F500.0
+G1 X96.41000 Y201.17000 Z2.00000 J1141.78 F500.0
+G1 X96.41000 Y205.37000 Z2.00000 J1145.89 F500.0
+G1 X93.29000 Y207.17000 Z2.00000 J1149.42 F500.0
+G1 X93.29000 Y211.37000 Z2.00000 J1153.54 F500.0
+G1 X96.41000 Y213.17000 Z2.00000 J1157.07 F500.0
+G1 X96.41000 Y217.37000 Z2.00000 J1161.19 F500.0
+G1 X93.29000 Y219.17000 Z2.00000 J1164.72 F500.0
+G1 X93.29000 Y223.37000 Z2.00000 J1168.83 F500.0
+G1 X96.41000 Y225.17000 Z2.00000 J1172.36 F500.0
+G1 X96.41000 Y229.37000 Z2.00000 J1176.48 F500.0
+G1 X93.29000 Y231.17000 Z2.00000 J1180.01 F500.0
+G1 X93.29000 Y235.37000 Z2.00000 J1184.12 F500.0
+G1 X96.41000 Y237.17000 Z2.00000 J1187.65 F500.0
+G1 X96.41000 Y238.79000 Z2.00000 J1189.24 F500.0
+G1 X96.76000 Y238.79000 Z2.00000 J1189.58 F500.0
+G1 X96.76000 Y237.17000 Z2.00000 J1191.17 F500.0
+G1 X98.89000 Y235.94000 Z2.00000 J1193.58 F500.0
+G1 X98.89000 Y230.60000 Z2.00000 J1198.82 F500.0
+G1 X96.76000 Y229.37000 Z2.00000 J1201.23 F500.0
+G1 X96.76000 Y225.17000 Z2.00000 J1205.34 F500.0
+G1 X98.89000 Y223.94000 Z2.00000 J1207.75 F500.0
+G1 X98.89000 Y218.60000 Z2.00000 J1212.99 F500.0
+G1 X96.76000 Y217.37000 Z2.00000 J1215.40 F500.0
+G1 X96.76000 Y213.17000 Z2.00000 J1219.51 F500.0
+G1 X98.89000 Y211.94000 Z2.00000 J1221.92 F500.0
+G1 X98.89000 Y206.60000 Z2.00000 J1227.16 F500.0
+G1 X97.36000 Y205.72000 Z2.00000 J1233.89 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X96.76000 Y205.37000 Z2.00000 J1233.89 F800.0
+G1 X96.76000 Y201.17000 Z2.00000 J1233.89 F800.0
+G1 X96.85000 Y201.11000 Z2.00000 J1233.89 F800.0
+G1 X96.85000 Y201.11000 Z12.00000 J1233.89 F800.0
+G1 X84.37000 Y196.67000 Z12.00000 J1243.89 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X89.37000 Y201.67000 Z3.00000 J0.00 F300.0
+G1 X98.33000 Y201.67000 Z3.00000 J8.78 F300.0
+G1 X98.33000 Y235.47000 Z3.00000 J41.90 F300.0
+G1 X98.33000 Y238.23000 Z3.00000 J44.61 F300.0
+G1 X30.73000 Y238.23000 Z3.00000 J110.86 F500.0
+G1 X21.77000 Y238.23000 Z3.00000 J119.64 F500.0
+G1 X21.77000 Y204.43000 Z3.00000 J152.76 F500.0
+G1 X21.77000 Y201.67000 Z3.00000 J155.47 F500.0
+G1 X84.37000 Y201.67000 Z3.00000 J221.82 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X89.37000 Y201.67000 Z3.00000 J221.82 F800.0
+G1 X89.37000 Y201.67000 Z13.00000 J221.82 F800.0
+G1 X84.37000 Y196.67000 Z13.00000 J231.82 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X89.37000 Y201.67000 Z3.00000 J0.00 F300.0
+G1 X21.77000 Y236.47000 Z3.00000 J74.51 F300.0
+G1 X23.67000 Y235.37000 Z3.00000 J76.66 F300.0
+G1 X23.67000 Y231.17000 Z3.00000 J80.77 F300.0
+G1 X21.77000 Y230.07000 Z3.00000 J82.93 F500.0
+G1 X21.77000 Y224.46000 Z3.00000 J88.42 F500.0
+G1 X23.67000 Y223.37000 Z3.00000 J90.57 F500.0
+G1 X23.67000 Y219.17000 Z3.00000 J94.69 F500.0
+G1 X21.77000 Y218.07000 Z3.00000 J96.84 F500.0
+G1 X21.77000 Y212.46000 Z3.00000 J102.34 F500.0
+G1 X23.67000 Y211.37000 Z3.00000 J104.48 F500.0
+G1 X23.67000 Y207.17000 Z3.00000 J108.60 F500.0
+G1 X21.77000 Y206.07000 Z3.00000 J110.75 F500.0
+G1 X27.13000 Y201.67000 Z3.00000 J117.55 F500.0
+G1 X27.13000 Y205.37000 Z3.00000 J121.17 F500.0
+G1 X24.01000 Y207.17000 Z3.00000 J124.70 F500.0
+G1 X24.01000 Y211.37000 Z3.00000 J128.82 F500.0
+G1 X27.13000 Y213.17000 Z3.00000 J132.35 F500.0
+G1 X27.13000 Y217.37000 Z3.00000 J136.46 F500.0
+G1 X24.01000 Y219.17000 Z3.00000 J139.99 F500.0
+G1 X24.01000 Y223.37000 Z3.00000 J144.11 F500.0
+G1 X27.13000 Y225.17000 Z3.00000 J147.64 F500.0
+G1 X27.13000 Y229.37000 Z3.00000 J151.76 F500.0
+G1 X24.01000 Y231.17000 Z3.00000 J155.28 F500.0
+G1 X24.01000 Y235.37000 Z3.00000 J159.40 F500.0
+G1 X27.13000 Y237.17000 Z3.00000 J162.93 F500.0
+G1 X27.13000 Y238.23000 Z3.00000 J163.97 F500.0
+G1 X27.48000 Y238.23000 Z3.00000 J164.31 F500.0
+G1 X27.48000 Y237.17000 Z3.00000 J165.35 F500.0
+G1 X30.59000 Y235.37000 Z3.00000 J168.87 F500.0
+G1 X30.59000 Y231.17000 Z3.00000 J172.99 F500.0
+G1 X27.48000 Y229.37000 Z3.00000 J176.51 F500.0
+G1 X27.48000 Y225.17000 Z3.00000 J180.63 F500.0
+G1 X30.59000 Y223.37000 Z3.00000 J184.15 F500.0
+G1 X30.59000 Y219.17000 Z3.00000 J188.26 F500.0
+G1 X27.48000 Y217.37000 Z3.00000 J191.79 F500.0
+G1 X27.48000 Y213.17000 Z3.00000 J195.90 F500.0
+G1 X30.59000 Y211.37000 Z3.00000 J199.42 F500.0
+G1 X30.59000 Y207.17000 Z3.00000 J203.54 F500.0
+G1 X27.48000 Y205.37000 Z3.00000 J207.06 F500.0
+G1 X27.48000 Y201.67000 Z3.00000 J210.69 F500.0
+G1 X34.06000 Y201.67000 Z3.00000 J217.13 F500.0
+G1 X34.06000 Y205.37000 Z3.00000 J220.76 F500.0
+G1 X30.94000 Y207.17000 Z3.00000 J224.29 F500.0
+G1 X30.94000 Y211.37000 Z3.00000 J228.41 F500.0
+G1 X34.06000 Y213.17000 Z3.00000 J231.94 F500.0
+G1 X34.06000 Y217.37000 Z3.00000 J236.05 F500.0
+G1 X30.94000 Y219.17000 Z3.00000 J239.58 F500.0
+G1 X30.94000 Y223.37000 Z3.00000 J243.70 F500.0
+G1 X34.06000 Y225.17000 Z3.00000 J247.23 F500.0
+G1 X34.06000 Y229.37000 Z3.00000 J251.34 F500.0
+G1 X30.94000 Y231.17000 Z3.00000 J254.87 F500.0
+G1 X30.94000 Y235.37000 Z3.00000 J258.99 F500.0
+G1 X34.06000 Y237.17000 Z3.00000 J262.52 F500.0
+G1 X34.06000 Y238.23000 Z3.00000 J263.56 F500.0
+G1 X34.40000 Y238.23000 Z3.00000 J263.89 F500.0
+G1 X34.40000 Y237.17000 Z3.00000 J264.93 F500.0
+G1 X37.52000 Y235.37000 Z3.00000 J268.46 F500.0
+G1 X37.52000 Y231.17000 Z3.00000 J272.58 F500.0
+G1 X34.40000 Y229.37000 Z3.00000 J276.11 F500.0
+G1 X34.40000 Y225.17000 Z3.00000 J280.22 F500.0
+G1 X37.52000 Y223.37000 Z3.00000 J283.75 F500.0
+G1 X37.52000 Y219.17000 Z3.00000 J287.87 F500.0
+G1 X34.40000 Y217.37000 Z3.00000 J291.40 F500.0
+G1 X34.40000 Y213.17000 Z3.00000 J295.52 F500.0
+G1 X37.52000 Y211.37000 Z3.00000 J299.05 F500.0
+G1 X37.52000 Y207.17000 Z3.00000 J303.16 F500.0
+G1 X34.40000 Y205.37000 Z3.00000 J306.69 F500.0
+G1 X34.40000 Y201.67000 Z3.00000 J310.32 F500.0
+G1 X40.99000 Y201.67000 Z3.00000 J316.78 F500.0
+G1 X40.99000 Y205.37000 Z3.00000 J320.40 F500.0
+G1 X37.87000 Y207.17000 Z3.00000 J323.93 F500.0
+G1 X37.87000 Y211.37000 Z3.00000 J328.05 F500.0
+G1 X40.99000 Y213.17000 Z3.00000 J331.58 F500.0
+G1 X40.99000 Y217.37000 Z3.00000 J335.69 F500.0
+G1 X37.87000 Y219.17000 Z3.00000 J339.22 F500.0
+G1 X37.87000 Y223.37000 Z3.00000 J343.34 F500.0
+G1 X40.99000 Y225.17000 Z3.00000 J346.87 F500.0
+G1 X40.99000 Y229.37000 Z3.00000 J350.99 F500.0
+G1 X37.87000 Y231.17000 Z3.00000 J354.52 F500.0
+G1 X37.87000 Y235.37000 Z3.00000 J358.63 F500.0
+G1 X40.99000 Y237.17000 Z3.00000 J362.16 F500.0
+G1 X40.99000 Y238.23000 Z3.00000 J363.20 F500.0
+G1 X41.33000 Y238.23000 Z3.00000 J363.53 F500.0
+G1 X41.33000 Y237.17000 Z3.00000 J364.57 F500.0
+G1 X44.45000 Y235.37000 Z3.00000 J368.10 F500.0
+G1 X44.45000 Y231.17000 Z3.00000 J372.22 F500.0
+G1 X41.33000 Y229.37000 Z3.00000 J375.75 F500.0
+G1 X41.33000 Y225.17000 Z3.00000 J379.86 F500.0
+G1 X44.45000 Y223.37000 Z3.00000 J383.39 F500.0
+G1 X44.45000 Y219.17000 Z3.00000 J387.51 F500.0
+G1 X41.33000 Y217.37000 Z3.00000 J391.04 F500.0
+G1 X41.33000 Y213.17000 Z3.00000 J395.16 F500.0
+G1 X44.45000 Y211.37000 Z3.00000 J398.69 F500.0
+G1 X44.45000 Y207.17000 Z3.00000 J402.80 F500.0
+G1 X41.33000 Y205.37000 Z3.00000 J406.33 F500.0
+G1 X41.33000 Y201.67000 Z3.00000 J409.96 F500.0
+G1 X47.91000 Y201.67000 Z3.00000 J416.41 F500.0
+G1 X47.91000 Y205.37000 Z3.00000 J420.03 F500.0
+G1 X44.80000 Y207.17000 Z3.00000 J423.55 F500.0
+G1 X44.80000 Y211.37000 Z3.00000 J427.67 F500.0
+G1 X47.91000 Y213.17000 Z3.00000 J431.19 F500.0
+G1 X47.91000 Y217.37000 Z3.00000 J435.31 F500.0
+G1 X44.80000 Y219.17000 Z3.00000 J438.83 F500.0
+G1 X44.80000 Y223.37000 Z3.00000 J442.94 F500.0
+G1 X47.91000 Y225.17000 Z3.00000 J446.47 F500.0
+G1 X47.91000 Y229.37000 Z3.00000 J450.58 F500.0
+G1 X44.80000 Y231.17000 Z3.00000 J454.10 F500.0
+G1 X44.80000 Y235.37000 Z3.00000 J458.22 F500.0
+G1 X47.91000 Y237.17000 Z3.00000 J461.74 F500.0
+G1 X47.91000 Y238.23000 Z3.00000 J462.78 F500.0
+G1 X48.26000 Y238.23000 Z3.00000 J463.12 F500.0
+G1 X48.26000 Y237.17000 Z3.00000 J464.16 F500.0
+G1 X51.38000 Y235.37000 Z3.00000 J467.69 F500.0
+G1 X51.38000 Y231.17000 Z3.00000 J471.81 F500.0
+G1 X48.26000 Y229.37000 Z3.00000 J475.34 F500.0
+G1 X48.26000 Y225.17000 Z3.00000 J479.45 F500.0
+G1 X51.38000 Y223.37000 Z3.00000 J482.98 F500.0
+G1 X51.38000 Y219.17000 Z3.00000 J487.10 F500.0
+G1 X48.26000 Y217.37000 Z3.00000 J490.63 F500.0
+G1 X48.26000 Y213.17000 Z3.00000 J494.75 F500.0
+G1 X51.38000 Y211.37000 Z3.00000 J498.28 F500.0
+G1 X51.38000 Y207.17000 Z3.00000 J502.39 F500.0
+G1 X48.26000 Y205.37000 Z3.00000 J505.92 F500.0
+G1 X48.26000 Y201.67000 Z3.00000 J509.55 F500.0
+G1 X54.84000 Y201.67000 Z3.00000 J516.00 F500.0
+G1 X54.84000 Y205.37000 Z3.00000 J519.62 F500.0
+G1 X51.73000 Y207.17000 Z3.00000 J523.14 F500.0
+G1 X51.73000 Y211.37000 Z3.00000 J527.26 F500.0
+G1 X54.84000 Y213.17000 Z3.00000 J530.78 F500.0
+G1 X54.84000 Y217.37000 Z3.00000 J534.90 F500.0
+G1 X51.73000 Y219.17000 Z3.00000 J538.42 F500.0
+G1 X51.73000 Y223.37000 Z3.00000 J542.53 F500.0
+G1 X54.84000 Y225.17000 Z3.00000 J546.06 F500.0
+G1 X54.84000 Y229.37000 Z3.00000 J550.17 F500.0
+G1 X51.73000 Y231.17000 Z3.00000 J553.69 F500.0
+G1 X51.73000 Y235.37000 Z3.00000 J557.81 F500.0
+G1 X54.84000 Y237.17000 Z3.00000 J561.33 F500.0
+G1 X54.84000 Y238.23000 Z3.00000 J562.37 F500.0
+G1 X55.19000 Y238.23000 Z3.00000 J562.71 F500.0
+G1 X55.19000 Y237.17000 Z3.00000 J563.75 F500.0
+G1 X58.31000 Y235.37000 Z3.00000 J567.28 F500.0
+G1 X58.31000 Y231.17000 Z3.00000 J571.40 F500.0
+G1 X55.19000 Y229.37000 Z3.00000 J574.93 F500.0
+G1 X55.19000 Y225.17000 Z3.00000 J579.04 F500.0
+G1 X58.31000 Y223.37000 Z3.00000 J582.57 F500.0
+G1 X58.31000 Y219.17000 Z3.00000 J586.69 F500.0
+G1 X55.19000 Y217.37000 Z3.00000 J590.22 F500.0
+G1 X55.19000 Y213.17000 Z3.00000 J594.33 F500.0
+G1 X58.31000 Y211.37000 Z3.00000 J597.86 F500.0
+G1 X58.31000 Y207.17000 Z3.00000 J601.98 F500.0
+G1 X55.19000 Y205.37000 Z3.00000 J605.51 F500.0
+G1 X55.19000 Y201.67000 Z3.00000 J609.14 F500.0
+G1 X61.77000 Y201.67000 Z3.00000 J615.59 F500.0
+G1 X61.77000 Y205.37000 Z3.00000 J619.21 F500.0
+G1 X58.65000 Y207.17000 Z3.00000 J622.74 F500.0
+G1 X58.65000 Y211.37000 Z3.00000 J626.86 F500.0
+G1 X61.77000 Y213.17000 Z3.00000 J630.39 F500.0
+G1 X61.77000 Y217.37000 Z3.00000 J634.50 F500.0
+G1 X58.65000 Y219.17000 Z3.00000 J638.03 F500.0
+G1 X58.65000 Y223.37000 Z3.00000 J642.15 F500.0
+G1 X61.77000 Y225.17000 Z3.00000 J645.68 F500.0
+G1 X61.77000 Y229.37000 Z3.00000 J649.80 F500.0
+G1 X58.65000 Y231.17000 Z3.00000 J653.33 F500.0
+G1 X58.65000 Y235.37000 Z3.00000 J657.44 F500.0
+G1 X61.77000 Y237.17000 Z3.00000 J660.97 F500.0
+G1 X61.77000 Y238.23000 Z3.00000 J662.01 F500.0
+G1 X62.12000 Y238.23000 Z3.00000 J662.35 F500.0
+G1 X62.12000 Y237.17000 Z3.00000 J663.39 F500.0
+G1 X65.23000 Y235.37000 Z3.00000 J666.91 F500.0
+G1 X65.23000 Y231.17000 Z3.00000 J671.03 F500.0
+G1 X62.12000 Y229.37000 Z3.00000 J674.55 F500.0
+G1 X62.12000 Y225.17000 Z3.00000 J678.67 F500.0
+G1 X65.23000 Y223.37000 Z3.00000 J682.19 F500.0
+G1 X65.23000 Y219.17000 Z3.00000 J686.30 F500.0
+G1 X62.12000 Y217.37000 Z3.00000 J689.83 F500.0
+G1 X62.12000 Y213.17000 Z3.00000 J693.94 F500.0
+G1 X65.23000 Y211.37000 Z3.00000 J697.46 F500.0
+G1 X65.23000 Y207.17000 Z3.00000 J701.58 F500.0
+G1 X62.12000 Y205.37000 Z3.00000 J705.10 F500.0
+G1 X62.12000 Y201.67000 Z3.00000 J708.73 F500.0
+G1 X68.70000 Y201.67000 Z3.00000 J715.17 F500.0
+G1 X68.70000 Y205.37000 Z3.00000 J718.80 F500.0
+G1 X65.58000 Y207.17000 Z3.00000 J722.33 F500.0
+G1 X65.58000 Y211.37000 Z3.00000 J726.45 F500.0
+G1 X68.70000 Y213.17000 Z3.00000 J729.98 F500.0
+G1 X68.70000 Y217.37000 Z3.00000 J734.09 F500.0
+G1 X65.58000 Y219.17000 Z3.00000 J737.62 F500.0
+G1 X65.58000 Y223.37000 Z3.00000 J741.74 F500.0
+G1 X68.70000 Y225.17000 Z3.00000 J745.27 F500.0
+G1 X68.70000 Y229.37000 Z3.00000 J749.38 F500.0
+G1 X65.58000 Y231.17000 Z3.00000 J752.91 F500.0
+G1 X65.58000 Y235.37000 Z3.00000 J757.03 F500.0
+G1 X68.70000 Y237.17000 Z3.00000 J760.56 F500.0
+G1 X68.70000 Y238.23000 Z3.00000 J761.60 F500.0
+G1 X69.04000 Y238.23000 Z3.00000 J761.93 F500.0
+G1 X69.04000 Y237.17000 Z3.00000 J762.97 F500.0
+G1 X72.16000 Y235.37000 Z3.00000 J766.50 F500.0
+G1 X72.16000 Y231.17000 Z3.00000 J770.62 F500.0
+G1 X69.04000 Y229.37000 Z3.00000 J774.15 F500.0
+G1 X69.04000 Y225.17000 Z3.00000 J778.26 F500.0
+G1 X72.16000 Y223.37000 Z3.00000 J781.79 F500.0
+G1 X72.16000 Y219.17000 Z3.00000 J785.91 F500.0
+G1 X69.04000 Y217.37000 Z3.00000 J789.44 F500.0
+G1 X69.04000 Y213.17000 Z3.00000 J793.56 F500.0
+G1 X72.16000 Y211.37000 Z3.00000 J797.09 F500.0
+G1 X72.16000 Y207.17000 Z3.00000 J801.20 F500.0
+G1 X69.04000 Y205.37000 Z3.00000 J804.73 F500.0
+G1 X69.04000 Y201.67000 Z3.00000 J808.36 F500.0
+G1 X75.63000 Y201.67000 Z3.00000 J814.82 F500.0
+G1 X75.63000 Y205.37000 Z3.00000 J818.44 F500.0
+G1 X72.51000 Y207.17000 Z3.00000 J821.97 F500.0
+G1 X72.51000 Y211.37000 Z3.00000 J826.09 F500.0
+G1 X75.63000 Y213.17000 Z3.00000 J829.62 F500.0
+G1 X75.63000 Y217.37000 Z3.00000 J833.73 F500.0
+G1 X72.51000 Y219.17000 Z3.00000 J837.26 F500.0
+G1 X72.51000 Y223.37000 Z3.00000 J841.38 F500.0
+G1 X75.63000 Y225.17000 Z3.00000 J844.91 F500.0
+G1 X75.63000 Y229.37000 Z3.00000 J849.03 F500.0
+G1 X72.51000 Y231.17000 Z3.00000 J852.56 F500.0
+G1 X72.51000 Y235.37000 Z3.00000 J856.67 F500.0
+G1 X75.63000 Y237.17000 Z3.00000 J860.20 F500.0
+G1 X75.63000 Y238.23000 Z3.00000 J861.24 F500.0
+G1 X75.97000 Y238.23000 Z3.00000 J861.57 F500.0
+G1 X75.97000 Y237.17000 Z3.00000 J862.61 F500.0
+G1 X79.09000 Y235.37000 Z3.00000 J866.14 F500.0
+G1 X79.09000 Y231.17000 Z3.00000 J870.26 F500.0
+G1 X75.97000 Y229.37000 Z3.00000 J873.79 F500.0
+G1 X75.97000 Y225.17000 Z3.00000 J877.90 F500.0
+G1 X79.09000 Y223.37000 Z3.00000 J881.43 F500.0
+G1 X79.09000 Y219.17000 Z3.00000 J885.55 F500.0
+G1 X75.97000 Y217.37000 Z3.00000 J889.08 F500.0
+G1 X75.97000 Y213.17000 Z3.00000 J893.20 F500.0
+G1 X79.09000 Y211.37000 Z3.00000 J896.73 F500.0
+G1 X79.09000 Y207.17000 Z3.00000 J900.84 F500.0
+G1 X75.97000 Y205.37000 Z3.00000 J904.37 F500.0
+G1 X75.97000 Y201.67000 Z3.00000 J908.00 F500.0
+G1 X82.55000 Y201.67000 Z3.00000 J914.45 F500.0
+G1 X82.55000 Y205.37000 Z3.00000 J918.07 F500.0
+G1 X79.44000 Y207.17000 Z3.00000 J921.59 F500.0
+G1 X79.44000 Y211.37000 Z3.00000 J925.71 F500.0
+G1 X82.55000 Y213.17000 Z3.00000 J929.23 F500.0
+G1 X82.55000 Y217.37000 Z3.00000 J933.35 F500.0
+G1 X79.44000 Y219.17000 Z3.00000 J936.87 F500.0
+G1 X79.44000 Y223.37000 Z3.00000 J940.98 F500.0
+G1 X82.55000 Y225.17000 Z3.00000 J944.51 F500.0
+G1 X82.55000 Y229.37000 Z3.00000 J948.62 F500.0
+G1 X79.44000 Y231.17000 Z3.00000 J952.14 F500.0
+G1 X79.44000 Y235.37000 Z3.00000 J956.26 F500.0
+G1 X82.55000 Y237.17000 Z3.00000 J959.78 F500.0
+G1 X82.55000 Y238.23000 Z3.00000 J960.82 F500.0
+G1 X82.90000 Y238.23000 Z3.00000 J961.16 F500.0
+G1 X82.90000 Y237.17000 Z3.00000 J962.20 F500.0
+G1 X86.02000 Y235.37000 Z3.00000 J965.73 F500.0
+G1 X86.02000 Y231.17000 Z3.00000 J969.85 F500.0
+G1 X82.90000 Y229.37000 Z3.00000 J973.38 F500.0
+G1 X82.90000 Y225.17000 Z3.00000 J977.49 F500.0
+G1 X86.02000 Y223.37000 Z3.00000 J981.02 F500.0
+G1 X86.02000 Y219.17000 Z3.00000 J985.14 F500.0
+G1 X82.90000 Y217.37000 Z3.00000 J988.67 F500.0
+G1 X82.90000 Y213.17000 Z3.00000 J992.79 F500.0
+G1 X86.02000 Y211.37000 Z3.00000 J996.32 F500.0
+G1 X86.02000 Y207.17000 Z3.00000 J1000.43 F500.0
+G1 X82.90000 Y205.37000 Z3.00000 J1003.96 F500.0
+G1 X82.90000 Y201.67000 Z3.00000 J1007.59 F500.0
+G1 X89.48000 Y201.67000 Z3.00000 J1014.04 F500.0
+G1 X89.48000 Y205.37000 Z3.00000 J1017.66 F500.0
+G1 X86.37000 Y207.17000 Z3.00000 J1021.18 F500.0
+G1 X86.37000 Y211.37000 Z3.00000 J1025.30 F500.0
+G1 X89.48000 Y213.17000 Z3.00000 J1028.82 F500.0
+G1 X89.48000 Y217.37000 Z3.00000 J1032.94 F500.0
+G1 X86.37000 Y219.17000 Z3.00000 J1036.46 F500.0
+G1 X86.37000 Y223.37000 Z3.00000 J1040.57 F500.0
+G1 X89.48000 Y225.17000 Z3.00000 J1044.10 F500.0
+G1 X89.48000 Y229.37000 Z3.00000 J1048.21 F500.0
+G1 X86.37000 Y231.17000 Z3.00000 J1051.73 F500.0
+G1 X86.37000 Y235.37000 Z3.00000 J1055.85 F500.0
+G1 X89.48000 Y237.17000 Z3.00000 J1059.37 F500.0
+G1 X89.48000 Y238.23000 Z3.00000 J1060.41 F500.0
+G1 X89.83000 Y238.23000 Z3.00000 J1060.75 F500.0
+G1 X89.83000 Y237.17000 Z3.00000 J1061.79 F500.0
+G1 X92.95000 Y235.37000 Z3.00000 J1065.32 F500.0
+G1 X92.95000 Y231.17000 Z3.00000 J1069.44 F500.0
+G1 X89.83000 Y229.37000 Z3.00000 J1072.97 F500.0
+G1 X89.83000 Y225.17000 Z3.00000 J1077.08 F500.0
+G1 X92.95000 Y223.37000 Z3.00000 J1080.61 F500.0
+G1 X92.95000 Y219.17000 Z3.00000 J1084.73 F500.0
+G1 X89.83000 Y217.37000 Z3.00000 J1088.26 F500.0
+G1 X89.83000 Y213.17000 Z3.00000 J1092.37 F500.0
+G1 X92.95000 Y211.37000 Z3.00000 J1095.90 F500.0
+G1 X92.95000 Y207.17000 Z3.00000 J1100.02 F500.0
+G1 X89.83000 Y205.37000 Z3.00000 J1103.55 F500.0
+G1 X89.83000 Y201.67000 Z3.00000 J1107.18 F500.0
+G1 X96.41000 Y201.67000 Z3.00000 J1113.63 F500.0
+G1 X96.41000 Y205.37000 Z3.00000 J1117.25 F500.0
+G1 X93.29000 Y207.17000 Z3.00000 J1120.78 F500.0
+G1 X93.29000 Y211.37000 Z3.00000 J1124.90 F500.0
+G1 X96.41000 Y213.17000 Z3.00000 J1128.43 F500.0
+G1 X96.41000 Y217.37000 Z3.00000 J1132.54 F500.0
+G1 X93.29000 Y219.17000 Z3.00000 J1136.07 F500.0
+G1 X93.29000 Y223.37000 Z3.00000 J1140.19 F500.0
+G1 X96.41000 Y225.17000 Z3.00000 J1143.72 F500.0
+G1 X96.41000 Y229.37000 Z3.00000 J1147.84 F500.0
+G1 X93.29000 Y231.17000 Z3.00000 J1151.37 F500.0
+G1 X93.29000 Y235.37000 Z3.00000 J1155.48 F500.0
+G1 X96.41000 Y237.17000 Z3.00000 J1159.01 F500.0
+G1 X96.41000 Y238.23000 Z3.00000 J1160.05 F500.0
+G1 X96.76000 Y238.23000 Z3.00000 J1160.39 F500.0
+G1 X96.76000 Y237.17000 Z3.00000 J1161.43 F500.0
+G1 X98.33000 Y236.26000 Z3.00000 J1163.21 F500.0
+G1 X98.33000 Y230.28000 Z3.00000 J1169.07 F500.0
+G1 X96.76000 Y229.37000 Z3.00000 J1170.85 F500.0
+G1 X96.76000 Y225.17000 Z3.00000 J1174.96 F500.0
+G1 X98.33000 Y224.26000 Z3.00000 J1176.74 F500.0
+G1 X98.33000 Y218.28000 Z3.00000 J1182.60 F500.0
+G1 X96.76000 Y217.37000 Z3.00000 J1184.38 F500.0
+G1 X96.76000 Y213.17000 Z3.00000 J1188.50 F500.0
+G1 X98.33000 Y212.26000 Z3.00000 J1190.28 F500.0
+G1 X98.33000 Y206.28000 Z3.00000 J1196.14 F500.0
+G1 X97.88000 Y206.02000 Z3.00000 J1201.64 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X96.76000 Y205.37000 Z3.00000 J1201.64 F800.0
+G1 X96.76000 Y201.67000 Z3.00000 J1201.64 F800.0
+G1 X96.76000 Y201.67000 Z13.00000 J1201.64 F800.0
+G1 X80.92000 Y197.22000 Z13.00000 J1211.64 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X85.92000 Y202.22000 Z4.00000 J0.00 F300.0
+G1 X97.78000 Y202.22000 Z4.00000 J11.62 F300.0
+G1 X97.78000 Y234.02000 Z4.00000 J42.79 F300.0
+G1 X97.78000 Y237.68000 Z4.00000 J46.37 F300.0
+G1 X34.18000 Y237.68000 Z4.00000 J108.70 F500.0
+G1 X22.32000 Y237.68000 Z4.00000 J120.32 F500.0
+G1 X22.32000 Y205.88000 Z4.00000 J151.49 F500.0
+G1 X22.32000 Y202.22000 Z4.00000 J155.08 F500.0
+G1 X80.92000 Y202.22000 Z4.00000 J217.50 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X85.92000 Y202.22000 Z4.00000 J217.50 F800.0
+G1 X85.92000 Y202.22000 Z14.00000 J217.50 F800.0
+G1 X80.92000 Y197.22000 Z14.00000 J227.50 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X85.92000 Y202.22000 Z4.00000 J0.00 F300.0
+G1 X22.32000 Y236.14000 Z4.00000 J70.64 F300.0
+G1 X23.67000 Y235.37000 Z4.00000 J72.16 F300.0
+G1 X23.67000 Y231.17000 Z4.00000 J76.28 F300.0
+G1 X22.32000 Y230.39000 Z4.00000 J77.81 F500.0
+G1 X22.32000 Y224.14000 Z4.00000 J83.93 F500.0
+G1 X23.67000 Y223.37000 Z4.00000 J85.46 F500.0
+G1 X23.67000 Y219.17000 Z4.00000 J89.57 F500.0
+G1 X22.32000 Y218.39000 Z4.00000 J91.10 F500.0
+G1 X22.32000 Y212.14000 Z4.00000 J97.23 F500.0
+G1 X23.67000 Y211.37000 Z4.00000 J98.75 F500.0
+G1 X23.67000 Y207.17000 Z4.00000 J102.86 F500.0
+G1 X22.32000 Y206.39000 Z4.00000 J104.39 F500.0
+G1 X27.13000 Y202.22000 Z4.00000 J110.63 F500.0
+G1 X27.13000 Y205.37000 Z4.00000 J113.72 F500.0
+G1 X24.01000 Y207.17000 Z4.00000 J117.25 F500.0
+G1 X24.01000 Y211.37000 Z4.00000 J121.36 F500.0
+G1 X27.13000 Y213.17000 Z4.00000 J124.89 F500.0
+G1 X27.13000 Y217.37000 Z4.00000 J129.01 F500.0
+G1 X24.01000 Y219.17000 Z4.00000 J132.54 F500.0
+G1 X24.01000 Y223.37000 Z4.00000 J136.66 F500.0
+G1 X27.13000 Y225.17000 Z4.00000 J140.19 F500.0
+G1 X27.13000 Y229.37000 Z4.00000 J144.30 F500.0
+G1 X24.01000 Y231.17000 Z4.00000 J147.83 F500.0
+G1 X24.01000 Y235.37000 Z4.00000 J151.95 F500.0
+G1 X27.13000 Y237.17000 Z4.00000 J155.48 F500.0
+G1 X27.13000 Y237.68000 Z4.00000 J155.98 F500.0
+G1 X27.48000 Y237.68000 Z4.00000 J156.32 F500.0
+G1 X27.48000 Y237.17000 Z4.00000 J156.82 F500.0
+G1 X30.59000 Y235.37000 Z4.00000 J160.34 F500.0
+G1 X30.59000 Y231.17000 Z4.00000 J164.46 F500.0
+G1 X27.48000 Y229.37000 Z4.00000 J167.98 F500.0
+G1 X27.48000 Y225.17000 Z4.00000 J172.10 F500.0
+G1 X30.59000 Y223.37000 Z4.00000 J175.62 F500.0
+G1 X30.59000 Y219.17000 Z4.00000 J179.73 F500.0
+G1 X27.48000 Y217.37000 Z4.00000 J183.25 F500.0
+G1 X27.48000 Y213.17000 Z4.00000 J187.37 F500.0
+G1 X30.59000 Y211.37000 Z4.00000 J190.89 F500.0
+G1 X30.59000 Y207.17000 Z4.00000 J195.01 F500.0
+G1 X27.48000 Y205.37000 Z4.00000 J198.53 F500.0
+G1 X27.48000 Y202.22000 Z4.00000 J201.62 F500.0
+G1 X34.06000 Y202.22000 Z4.00000 J208.06 F500.0
+G1 X34.06000 Y205.37000 Z4.00000 J211.15 F500.0
+G1 X30.94000 Y207.17000 Z4.00000 J214.68 F500.0
+G1 X30.94000 Y211.37000 Z4.00000 J218.80 F500.0
+G1 X34.06000 Y213.17000 Z4.00000 J222.33 F500.0
+G1 X34.06000 Y217.37000 Z4.00000 J226.44 F500.0
+G1 X30.94000 Y219.17000 Z4.00000 J229.97 F500.0
+G1 X30.94000 Y223.37000 Z4.00000 J234.09 F500.0
+G1 X34.06000 Y225.17000 Z4.00000 J237.62 F500.0
+G1 X34.06000 Y229.37000 Z4.00000 J241.74 F500.0
+G1 X30.94000 Y231.17000 Z4.00000 J245.27 F500.0
+G1 X30.94000 Y235.37000 Z4.00000 J249.38 F500.0
+G1 X34.06000 Y237.17000 Z4.00000 J252.91 F500.0
+G1 X34.06000 Y237.68000 Z4.00000 J253.41 F500.0
+G1 X34.40000 Y237.68000 Z4.00000 J253.74 F500.0
+G1 X34.40000 Y237.17000 Z4.00000 J254.24 F500.0
+G1 X37.52000 Y235.37000 Z4.00000 J257.77 F500.0
+G1 X37.52000 Y231.17000 Z4.00000 J261.89 F500.0
+G1 X34.40000 Y229.37000 Z4.00000 J265.42 F500.0
+G1 X34.40000 Y225.17000 Z4.00000 J269.54 F500.0
+G1 X37.52000 Y223.37000 Z4.00000 J273.07 F500.0
+G1 X37.52000 Y219.17000 Z4.00000 J277.18 F500.0
+G1 X34.40000 Y217.37000 Z4.00000 J280.71 F500.0
+G1 X34.40000 Y213.17000 Z4.00000 J284.83 F500.0
+G1 X37.52000 Y211.37000 Z4.00000 J288.36 F500.0
+G1 X37.52000 Y207.17000 Z4.00000 J292.47 F500.0
+G1 X34.40000 Y205.37000 Z4.00000 J296.00 F500.0
+G1 X34.40000 Y202.22000 Z4.00000 J299.09 F500.0
+G1 X40.99000 Y202.22000 Z4.00000 J305.55 F500.0
+G1 X40.99000 Y205.37000 Z4.00000 J308.64 F500.0
+G1 X37.87000 Y207.17000 Z4.00000 J312.17 F500.0
+G1 X37.87000 Y211.37000 Z4.00000 J316.28 F500.0
+G1 X40.99000 Y213.17000 Z4.00000 J319.81 F500.0
+G1 X40.99000 Y217.37000 Z4.00000 J323.93 F500.0
+G1 X37.87000 Y219.17000 Z4.00000 J327.46 F500.0
+G1 X37.87000 Y223.37000 Z4.00000 J331.57 F500.0
+G1 X40.99000 Y225.17000 Z4.00000 J335.10 F500.0
+G1 X40.99000 Y229.37000 Z4.00000 J339.22 F500.0
+G1 X37.87000 Y231.17000 Z4.00000 J342.75 F500.0
+G1 X37.87000 Y235.37000 Z4.00000 J346.87 F500.0
+G1 X40.99000 Y237.17000 Z4.00000 J350.40 F500.0
+G1 X40.99000 Y237.68000 Z4.00000 J350.90 F500.0
+G1 X41.33000 Y237.68000 Z4.00000 J351.23 F500.0
+G1 X41.33000 Y237.17000 Z4.00000 J351.73 F500.0
+G1 X44.45000 Y235.37000 Z4.00000 J355.26 F500.0
+G1 X44.45000 Y231.17000 Z4.00000 J359.37 F500.0
+G1 X41.33000 Y229.37000 Z4.00000 J362.90 F500.0
+G1 X41.33000 Y225.17000 Z4.00000 J367.02 F500.0
+G1 X44.45000 Y223.37000 Z4.00000 J370.55 F500.0
+G1 X44.45000 Y219.17000 Z4.00000 J374.67 F500.0
+G1 X41.33000 Y217.37000 Z4.00000 J378.20 F500.0
+G1 X41.33000 Y213.17000 Z4.00000 J382.31 F500.0
+G1 X44.45000 Y211.37000 Z4.00000 J385.84 F500.0
+G1 X44.45000 Y207.17000 Z4.00000 J389.96 F500.0
+G1 X41.33000 Y205.37000 Z4.00000 J393.49 F500.0
+G1 X41.33000 Y202.22000 Z4.00000 J396.58 F500.0
+G1 X47.91000 Y202.22000 Z4.00000 J403.02 F500.0
+G1 X47.91000 Y205.37000 Z4.00000 J406.11 F500.0
+G1 X44.80000 Y207.17000 Z4.00000 J409.63 F500.0
+G1 X44.80000 Y211.37000 Z4.00000 J413.75 F500.0
+G1 X47.91000 Y213.17000 Z4.00000 J417.27 F500.0
+G1 X47.91000 Y217.37000 Z4.00000 J421.39 F500.0
+G1 X44.80000 Y219.17000 Z4.00000 J424.91 F500.0
+G1 X44.80000 Y223.37000 Z4.00000 J429.02 F500.0
+G1 X47.91000 Y225.17000 Z4.00000 J432.55 F500.0
+G1 X47.91000 Y229.37000 Z4.00000 J436.66 F500.0
+G1 X44.80000 Y231.17000 Z4.00000 J440.18 F500.0
+G1 X44.80000 Y235.37000 Z4.00000 J444.30 F500.0
+G1 X47.91000 Y237.17000 Z4.00000 J447.82 F500.0
+G1 X47.91000 Y237.68000 Z4.00000 J448.32 F500.0
+G1 X48.26000 Y237.68000 Z4.00000 J448.66 F500.0
+G1 X48.26000 Y237.17000 Z4.00000 J449.16 F500.0
+G1 X51.38000 Y235.37000 Z4.00000 J452.69 F500.0
+G1 X51.38000 Y231.17000 Z4.00000 J456.81 F500.0
+G1 X48.26000 Y229.37000 Z4.00000 J460.34 F500.0
+G1 X48.26000 Y225.17000 Z4.00000 J464.45 F500.0
+G1 X51.38000 Y223.37000 Z4.00000 J467.98 F500.0
+G1 X51.38000 Y219.17000 Z4.00000 J472.10 F500.0
+G1 X48.26000 Y217.37000 Z4.00000 J475.63 F500.0
+G1 X48.26000 Y213.17000 Z4.00000 J479.75 F500.0
+G1 X51.38000 Y211.37000 Z4.00000 J483.28 F500.0
+G1 X51.38000 Y207.17000 Z4.00000 J487.39 F500.0
+G1 X48.26000 Y205.37000 Z4.00000 J490.92 F500.0
+G1 X48.26000 Y202.22000 Z4.00000 J494.01 F500.0
+G1 X54.84000 Y202.22000 Z4.00000 J500.46 F500.0
+G1 X54.84000 Y205.37000 Z4.00000 J503.54 F500.0
+G1 X51.73000 Y207.17000 Z4.00000 J507.07 F500.0
+G1 X51.73000 Y211.37000 Z4.00000 J511.18 F500.0
+G1 X54.84000 Y213.17000 Z4.00000 J514.70 F500.0
+G1 X54.84000 Y217.37000 Z4.00000 J518.82 F500.0
+G1 X51.73000 Y219.17000 Z4.00000 J522.34 F500.0
+G1 X51.73000 Y223.37000 Z4.00000 J526.46 F500.0
+G1 X54.84000 Y225.17000 Z4.00000 J529.98 F500.0
+G1 X54.84000 Y229.37000 Z4.00000 J534.09 F500.0
+G1 X51.73000 Y231.17000 Z4.00000 J537.62 F500.0
+G1 X51.73000 Y235.37000 Z4.00000 J541.73 F500.0
+G1 X54.84000 Y237.17000 Z4.00000 J545.25 F500.0
+G1 X54.84000 Y237.68000 Z4.00000 J545.75 F500.0
+G1 X55.19000 Y237.68000 Z4.00000 J546.10 F500.0
+G1 X55.19000 Y237.17000 Z4.00000 J546.60 F500.0
+G1 X58.31000 Y235.37000 Z4.00000 J550.13 F500.0
+G1 X58.31000 Y231.17000 Z4.00000 J554.24 F500.0
+G1 X55.19000 Y229.37000 Z4.00000 J557.77 F500.0
+G1 X55.19000 Y225.17000 Z4.00000 J561.89 F500.0
+G1 X58.31000 Y223.37000 Z4.00000 J565.42 F500.0
+G1 X58.31000 Y219.17000 Z4.00000 J569.53 F500.0
+G1 X55.19000 Y217.37000 Z4.00000 J573.06 F500.0
+G1 X55.19000 Y213.17000 Z4.00000 J577.18 F500.0
+G1 X58.31000 Y211.37000 Z4.00000 J580.71 F500.0
+G1 X58.31000 Y207.17000 Z4.00000 J584.83 F500.0
+G1 X55.19000 Y205.37000 Z4.00000 J588.36 F500.0
+G1 X55.19000 Y202.22000 Z4.00000 J591.44 F500.0
+G1 X61.77000 Y202.22000 Z4.00000 J597.89 F500.0
+G1 X61.77000 Y205.37000 Z4.00000 J600.98 F500.0
+G1 X58.65000 Y207.17000 Z4.00000 J604.51 F500.0
+G1 X58.65000 Y211.37000 Z4.00000 J608.62 F500.0
+G1 X61.77000 Y213.17000 Z4.00000 J612.15 F500.0
+G1 X61.77000 Y217.37000 Z4.00000 J616.27 F500.0
+G1 X58.65000 Y219.17000 Z4.00000 J619.80 F500.0
+G1 X58.65000 Y223.37000 Z4.00000 J623.92 F500.0
+G1 X61.77000 Y225.17000 Z4.00000 J627.45 F500.0
+G1 X61.77000 Y229.37000 Z4.00000 J631.56 F500.0
+G1 X58.65000 Y231.17000 Z4.00000 J635.09 F500.0
+G1 X58.65000 Y235.37000 Z4.00000 J639.21 F500.0
+G1 X61.77000 Y237.17000 Z4.00000 J642.74 F500.0
+G1 X61.77000 Y237.68000 Z4.00000 J643.24 F500.0
+G1 X62.12000 Y237.68000 Z4.00000 J643.58 F500.0
+G1 X62.12000 Y237.17000 Z4.00000 J644.08 F500.0
+G1 X65.23000 Y235.37000 Z4.00000 J647.60 F500.0
+G1 X65.23000 Y231.17000 Z4.00000 J651.72 F500.0
+G1 X62.12000 Y229.37000 Z4.00000 J655.24 F500.0
+G1 X62.12000 Y225.17000 Z4.00000 J659.36 F500.0
+G1 X65.23000 Y223.37000 Z4.00000 J662.88 F500.0
+G1 X65.23000 Y219.17000 Z4.00000 J666.99 F500.0
+G1 X62.12000 Y217.37000 Z4.00000 J670.51 F500.0
+G1 X62.12000 Y213.17000 Z4.00000 J674.63 F500.0
+G1 X65.23000 Y211.37000 Z4.00000 J678.15 F500.0
+G1 X65.23000 Y207.17000 Z4.00000 J682.27 F500.0
+G1 X62.12000 Y205.37000 Z4.00000 J685.79 F500.0
+G1 X62.12000 Y202.22000 Z4.00000 J688.88 F500.0
+G1 X68.70000 Y202.22000 Z4.00000 J695.32 F500.0
+G1 X68.70000 Y205.37000 Z4.00000 J698.41 F500.0
+G1 X65.58000 Y207.17000 Z4.00000 J701.94 F500.0
+G1 X65.58000 Y211.37000 Z4.00000 J706.06 F500.0
+G1 X68.70000 Y213.17000 Z4.00000 J709.59 F500.0
+G1 X68.70000 Y217.37000 Z4.00000 J713.70 F500.0
+G1 X65.58000 Y219.17000 Z4.00000 J717.23 F500.0
+G1 X65.58000 Y223.37000 Z4.00000 J721.35 F500.0
+G1 X68.70000 Y225.17000 Z4.00000 J724.88 F500.0
+G1 X68.70000 Y229.37000 Z4.00000 J729.00 F500.0
+G1 X65.58000 Y231.17000 Z4.00000 J732.53 F500.0
+G1 X65.58000 Y235.37000 Z4.00000 J736.64 F500.0
+G1 X68.70000 Y237.17000 Z4.00000 J740.17 F500.0
+G1 X68.70000 Y237.68000 Z4.00000 J740.67 F500.0
+G1 X69.04000 Y237.68000 Z4.00000 J741.00 F500.0
+G1 X69.04000 Y237.17000 Z4.00000 J741.50 F500.0
+G1 X72.16000 Y235.37000 Z4.00000 J745.03 F500.0
+G1 X72.16000 Y231.17000 Z4.00000 J749.15 F500.0
+G1 X69.04000 Y229.37000 Z4.00000 J752.68 F500.0
+G1 X69.04000 Y225.17000 Z4.00000 J756.80 F500.0
+G1 X72.16000 Y223.37000 Z4.00000 J760.33 F500.0
+G1 X72.16000 Y219.17000 Z4.00000 J764.44 F500.0
+G1 X69.04000 Y217.37000 Z4.00000 J767.97 F500.0
+G1 X69.04000 Y213.17000 Z4.00000 J772.09 F500.0
+G1 X72.16000 Y211.37000 Z4.00000 J775.62 F500.0
+G1 X72.16000 Y207.17000 Z4.00000 J779.73 F500.0
+G1 X69.04000 Y205.37000 Z4.00000 J783.26 F500.0
+G1 X69.04000 Y202.22000 Z4.00000 J786.35 F500.0
+G1 X75.63000 Y202.22000 Z4.00000 J792.81 F500.0
+G1 X75.63000 Y205.37000 Z4.00000 J795.90 F500.0
+G1 X72.51000 Y207.17000 Z4.00000 J799.43 F500.0
+G1 X72.51000 Y211.37000 Z4.00000 J803.54 F500.0
+G1 X75.63000 Y213.17000 Z4.00000 J807.07 F500.0
+G1 X75.63000 Y217.37000 Z4.00000 J811.19 F500.0
+G1 X72.51000 Y219.17000 Z4.00000 J814.72 F500.0
+G1 X72.51000 Y223.37000 Z4.00000 J818.83 F500.0
+G1 X75.63000 Y225.17000 Z4.00000 J822.36 F500.0
+G1 X75.63000 Y229.37000 Z4.00000 J826.48 F500.0
+G1 X72.51000 Y231.17000 Z4.00000 J830.01 F500.0
+G1 X72.51000 Y235.37000 Z4.00000 J834.13 F500.0
+G1 X75.63000 Y237.17000 Z4.00000 J837.66 F500.0
+G1 X75.63000 Y237.68000 Z4.00000 J838.16 F500.0
+G1 X75.97000 Y237.68000 Z4.00000 J838.49 F500.0
+G1 X75.97000 Y237.17000 Z4.00000 J838.99 F500.0
+G1 X79.09000 Y235.37000 Z4.00000 J842.52 F500.0
+G1 X79.09000 Y231.17000 Z4.00000 J846.63 F500.0
+G1 X75.97000 Y229.37000 Z4.00000 J850.16 F500.0
+G1 X75.97000 Y225.17000 Z4.00000 J854.28 F500.0
+G1 X79.09000 Y223.37000 Z4.00000 J857.81 F500.0
+G1 X79.09000 Y219.17000 Z4.00000 J861.93 F500.0
+G1 X75.97000 Y217.37000 Z4.00000 J865.46 F500.0
+G1 X75.97000 Y213.17000 Z4.00000 J869.57 F500.0
+G1 X79.09000 Y211.37000 Z4.00000 J873.10 F500.0
+G1 X79.09000 Y207.17000 Z4.00000 J877.22 F500.0
+G1 X75.97000 Y205.37000 Z4.00000 J880.75 F500.0
+G1 X75.97000 Y202.22000 Z4.00000 J883.84 F500.0
+G1 X82.55000 Y202.22000 Z4.00000 J890.28 F500.0
+G1 X82.55000 Y205.37000 Z4.00000 J893.37 F500.0
+G1 X79.44000 Y207.17000 Z4.00000 J896.89 F500.0
+G1 X79.44000 Y211.37000 Z4.00000 J901.01 F500.0
+G1 X82.55000 Y213.17000 Z4.00000 J904.53 F500.0
+G1 X82.55000 Y217.37000 Z4.00000 J908.65 F500.0
+G1 X79.44000 Y219.17000 Z4.00000 J912.17 F500.0
+G1 X79.44000 Y223.37000 Z4.00000 J916.28 F500.0
+G1 X82.55000 Y225.17000 Z4.00000 J919.81 F500.0
+G1 X82.55000 Y229.37000 Z4.00000 J923.92 F500.0
+G1 X79.44000 Y231.17000 Z4.00000 J927.44 F500.0
+G1 X79.44000 Y235.37000 Z4.00000 J931.56 F500.0
+G1 X82.55000 Y237.17000 Z4.00000 J935.08 F500.0
+G1 X82.55000 Y237.68000 Z4.00000 J935.58 F500.0
+G1 X82.90000 Y237.68000 Z4.00000 J935.92 F500.0
+G1 X82.90000 Y237.17000 Z4.00000 J936.42 F500.0
+G1 X86.02000 Y235.37000 Z4.00000 J939.95 F500.0
+G1 X86.02000 Y231.17000 Z4.00000 J944.07 F500.0
+G1 X82.90000 Y229.37000 Z4.00000 J947.60 F500.0
+G1 X82.90000 Y225.17000 Z4.00000 J951.71 F500.0
+G1 X86.02000 Y223.37000 Z4.00000 J955.24 F500.0
+G1 X86.02000 Y219.17000 Z4.00000 J959.36 F500.0
+G1 X82.90000 Y217.37000 Z4.00000 J962.89 F500.0
+G1 X82.90000 Y213.17000 Z4.00000 J967.01 F500.0
+G1 X86.02000 Y211.37000 Z4.00000 J970.54 F500.0
+G1 X86.02000 Y207.17000 Z4.00000 J974.65 F500.0
+G1 X82.90000 Y205.37000 Z4.00000 J978.18 F500.0
+G1 X82.90000 Y202.22000 Z4.00000 J981.27 F500.0
+G1 X89.48000 Y202.22000 Z4.00000 J987.72 F500.0
+G1 X89.48000 Y205.37000 Z4.00000 J990.80 F500.0
+G1 X86.37000 Y207.17000 Z4.00000 J994.33 F500.0
+G1 X86.37000 Y211.37000 Z4.00000 J998.44 F500.0
+G1 X89.48000 Y213.17000 Z4.00000 J1001.96 F500.0
+G1 X89.48000 Y217.37000 Z4.00000 J1006.08 F500.0
+G1 X86.37000 Y219.17000 Z4.00000 J1009.60 F500.0
+G1 X86.37000 Y223.37000 Z4.00000 J1013.72 F500.0
+G1 X89.48000 Y225.17000 Z4.00000 J1017.24 F500.0
+G1 X89.48000 Y229.37000 Z4.00000 J1021.35 F500.0
+G1 X86.37000 Y231.17000 Z4.00000 J1024.88 F500.0
+G1 X86.37000 Y235.37000 Z4.00000 J1028.99 F500.0
+G1 X89.48000 Y237.17000 Z4.00000 J1032.51 F500.0
+G1 X89.48000 Y237.68000 Z4.00000 J1033.01 F500.0
+G1 X89.83000 Y237.68000 Z4.00000 J1033.36 F500.0
+G1 X89.83000 Y237.17000 Z4.00000 J1033.86 F500.0
+G1 X92.95000 Y235.37000 Z4.00000 J1037.39 F500.0
+G1 X92.95000 Y231.17000 Z4.00000 J1041.50 F500.0
+G1 X89.83000 Y229.37000 Z4.00000 J1045.03 F500.0
+G1 X89.83000 Y225.17000 Z4.00000 J1049.15 F500.0
+G1 X92.95000 Y223.37000 Z4.00000 J1052.68 F500.0
+G1 X92.95000 Y219.17000 Z4.00000 J1056.79 F500.0
+G1 X89.83000 Y217.37000 Z4.00000 J1060.32 F500.0
+G1 X89.83000 Y213.17000 Z4.00000 J1064.44 F500.0
+G1 X92.95000 Y211.37000 Z4.00000 J1067.97 F500.0
+G1 X92.95000 Y207.17000 Z4.00000 J1072.09 F500.0
+G1 X89.83000 Y205.37000 Z4.00000 J1075.62 F500.0
+G1 X89.83000 Y202.22000 Z4.00000 J1078.70 F500.0
+G1 X96.41000 Y202.22000 Z4.00000 J1085.15 F500.0
+G1 X96.41000 Y205.37000 Z4.00000 J1088.24 F500.0
+G1 X93.29000 Y207.17000 Z4.00000 J1091.77 F500.0
+G1 X93.29000 Y211.37000 Z4.00000 J1095.88 F500.0
+G1 X96.41000 Y213.17000 Z4.00000 J1099.41 F500.0
+G1 X96.41000 Y217.37000 Z4.00000 J1103.53 F500.0
+G1 X93.29000 Y219.17000 Z4.00000 J1107.06 F500.0
+G1 X93.29000 Y223.37000 Z4.00000 J1111.18 F500.0
+G1 X96.41000 Y225.17000 Z4.00000 J1114.71 F500.0
+G1 X96.41000 Y229.37000 Z4.00000 J1118.82 F500.0
+G1 X93.29000 Y231.17000 Z4.00000 J1122.35 F500.0
+G1 X93.29000 Y235.37000 Z4.00000 J1126.47 F500.0
+G1 X96.41000 Y237.17000 Z4.00000 J1130.00 F500.0
+G1 X96.41000 Y237.68000 Z4.00000 J1130.50 F500.0
+G1 X96.76000 Y237.68000 Z4.00000 J1130.84 F500.0
+G1 X96.76000 Y237.17000 Z4.00000 J1131.34 F500.0
+G1 X97.78000 Y236.58000 Z4.00000 J1132.50 F500.0
+G1 X97.78000 Y229.96000 Z4.00000 J1138.98 F500.0
+G1 X96.76000 Y229.37000 Z4.00000 J1140.14 F500.0
+G1 X96.76000 Y225.17000 Z4.00000 J1144.25 F500.0
+G1 X97.78000 Y224.58000 Z4.00000 J1145.41 F500.0
+G1 X97.78000 Y217.96000 Z4.00000 J1151.90 F500.0
+G1 X96.76000 Y217.37000 Z4.00000 J1153.05 F500.0
+G1 X96.76000 Y213.17000 Z4.00000 J1157.17 F500.0
+G1 X97.78000 Y212.58000 Z4.00000 J1158.32 F500.0
+G1 X97.78000 Y206.63000 Z4.00000 J1169.15 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X97.78000 Y205.96000 Z4.00000 J1169.15 F800.0
+G1 X96.76000 Y205.37000 Z4.00000 J1169.15 F800.0
+G1 X96.76000 Y202.22000 Z4.00000 J1169.15 F800.0
+G1 X96.76000 Y202.22000 Z14.00000 J1169.15 F800.0
+G1 X77.48000 Y197.78000 Z14.00000 J1179.15 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X82.48000 Y202.78000 Z5.00000 J0.00 F300.0
+G1 X97.22000 Y202.78000 Z5.00000 J14.45 F300.0
+G1 X97.22000 Y232.58000 Z5.00000 J43.65 F300.0
+G1 X97.22000 Y237.12000 Z5.00000 J48.10 F300.0
+G1 X37.62000 Y237.12000 Z5.00000 J106.51 F500.0
+G1 X22.88000 Y237.12000 Z5.00000 J120.95 F500.0
+G1 X22.88000 Y207.32000 Z5.00000 J150.16 F500.0
+G1 X22.88000 Y202.78000 Z5.00000 J154.60 F500.0
+G1 X77.48000 Y202.78000 Z5.00000 J213.11 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X82.48000 Y202.78000 Z5.00000 J213.11 F800.0
+G1 X82.48000 Y202.78000 Z15.00000 J213.11 F800.0
+G1 X77.48000 Y197.78000 Z15.00000 J223.11 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X82.48000 Y202.78000 Z5.00000 J0.00 F300.0
+G1 X22.88000 Y235.82000 Z5.00000 J66.79 F300.0
+G1 X23.67000 Y235.37000 Z5.00000 J67.68 F300.0
+G1 X23.67000 Y231.17000 Z5.00000 J71.79 F300.0
+G1 X22.88000 Y230.71000 Z5.00000 J72.69 F500.0
+G1 X22.88000 Y223.82000 Z5.00000 J79.44 F500.0
+G1 X23.67000 Y223.37000 Z5.00000 J80.33 F500.0
+G1 X23.67000 Y219.17000 Z5.00000 J84.45 F500.0
+G1 X22.88000 Y218.71000 Z5.00000 J85.34 F500.0
+G1 X22.88000 Y211.82000 Z5.00000 J92.10 F500.0
+G1 X23.67000 Y211.37000 Z5.00000 J92.99 F500.0
+G1 X23.67000 Y207.17000 Z5.00000 J97.10 F500.0
+G1 X22.88000 Y206.71000 Z5.00000 J98.00 F500.0
+G1 X27.13000 Y202.78000 Z5.00000 J103.67 F500.0
+G1 X27.13000 Y205.37000 Z5.00000 J106.21 F500.0
+G1 X24.01000 Y207.17000 Z5.00000 J109.74 F500.0
+G1 X24.01000 Y211.37000 Z5.00000 J113.86 F500.0
+G1 X27.13000 Y213.17000 Z5.00000 J117.39 F500.0
+G1 X27.13000 Y217.37000 Z5.00000 J121.50 F500.0
+G1 X24.01000 Y219.17000 Z5.00000 J125.03 F500.0
+G1 X24.01000 Y223.37000 Z5.00000 J129.15 F500.0
+G1 X27.13000 Y225.17000 Z5.00000 J132.68 F500.0
+G1 X27.13000 Y229.37000 Z5.00000 J136.79 F500.0
+G1 X24.01000 Y231.17000 Z5.00000 J140.32 F500.0
+G1 X24.01000 Y235.37000 Z5.00000 J144.44 F500.0
+G1 X27.05000 Y237.12000 Z5.00000 J147.88 F500.0
+G1 X27.56000 Y237.12000 Z5.00000 J148.38 F500.0
+G1 X30.59000 Y235.37000 Z5.00000 J151.81 F500.0
+G1 X30.59000 Y231.17000 Z5.00000 J155.92 F500.0
+G1 X27.48000 Y229.37000 Z5.00000 J159.44 F500.0
+G1 X27.48000 Y225.17000 Z5.00000 J163.56 F500.0
+G1 X30.59000 Y223.37000 Z5.00000 J167.08 F500.0
+G1 X30.59000 Y219.17000 Z5.00000 J171.20 F500.0
+G1 X27.48000 Y217.37000 Z5.00000 J174.72 F500.0
+G1 X27.48000 Y213.17000 Z5.00000 J178.83 F500.0
+G1 X30.59000 Y211.37000 Z5.00000 J182.36 F500.0
+G1 X30.59000 Y207.17000 Z5.00000 J186.47 F500.0
+G1 X27.48000 Y205.37000 Z5.00000 J189.99 F500.0
+G1 X27.48000 Y202.78000 Z5.00000 J192.53 F500.0
+G1 X34.06000 Y202.78000 Z5.00000 J198.98 F500.0
+G1 X34.06000 Y205.37000 Z5.00000 J201.52 F500.0
+G1 X30.94000 Y207.17000 Z5.00000 J205.05 F500.0
+G1 X30.94000 Y211.37000 Z5.00000 J209.16 F500.0
+G1 X34.06000 Y213.17000 Z5.00000 J212.69 F500.0
+G1 X34.06000 Y217.37000 Z5.00000 J216.81 F500.0
+G1 X30.94000 Y219.17000 Z5.00000 J220.34 F500.0
+G1 X30.94000 Y223.37000 Z5.00000 J224.46 F500.0
+G1 X34.06000 Y225.17000 Z5.00000 J227.99 F500.0
+G1 X34.06000 Y229.37000 Z5.00000 J232.10 F500.0
+G1 X30.94000 Y231.17000 Z5.00000 J235.63 F500.0
+G1 X30.94000 Y235.37000 Z5.00000 J239.75 F500.0
+G1 X33.98000 Y237.12000 Z5.00000 J243.19 F500.0
+G1 X34.48000 Y237.12000 Z5.00000 J243.68 F500.0
+G1 X37.52000 Y235.37000 Z5.00000 J247.11 F500.0
+G1 X37.52000 Y231.17000 Z5.00000 J251.23 F500.0
+G1 X34.40000 Y229.37000 Z5.00000 J254.76 F500.0
+G1 X34.40000 Y225.17000 Z5.00000 J258.87 F500.0
+G1 X37.52000 Y223.37000 Z5.00000 J262.40 F500.0
+G1 X37.52000 Y219.17000 Z5.00000 J266.52 F500.0
+G1 X34.40000 Y217.37000 Z5.00000 J270.05 F500.0
+G1 X34.40000 Y213.17000 Z5.00000 J274.17 F500.0
+G1 X37.52000 Y211.37000 Z5.00000 J277.70 F500.0
+G1 X37.52000 Y207.17000 Z5.00000 J281.81 F500.0
+G1 X34.40000 Y205.37000 Z5.00000 J285.34 F500.0
+G1 X34.40000 Y202.78000 Z5.00000 J287.88 F500.0
+G1 X40.99000 Y202.78000 Z5.00000 J294.34 F500.0
+G1 X40.99000 Y205.37000 Z5.00000 J296.88 F500.0
+G1 X37.87000 Y207.17000 Z5.00000 J300.41 F500.0
+G1 X37.87000 Y211.37000 Z5.00000 J304.52 F500.0
+G1 X40.99000 Y213.17000 Z5.00000 J308.05 F500.0
+G1 X40.99000 Y217.37000 Z5.00000 J312.17 F500.0
+G1 X37.87000 Y219.17000 Z5.00000 J315.70 F500.0
+G1 X37.87000 Y223.37000 Z5.00000 J319.81 F500.0
+G1 X40.99000 Y225.17000 Z5.00000 J323.34 F500.0
+G1 X40.99000 Y229.37000 Z5.00000 J327.46 F500.0
+G1 X37.87000 Y231.17000 Z5.00000 J330.99 F500.0
+G1 X37.87000 Y235.37000 Z5.00000 J335.11 F500.0
+G1 X40.91000 Y237.12000 Z5.00000 J338.54 F500.0
+G1 X41.41000 Y237.12000 Z5.00000 J339.03 F500.0
+G1 X44.45000 Y235.37000 Z5.00000 J342.47 F500.0
+G1 X44.45000 Y231.17000 Z5.00000 J346.59 F500.0
+G1 X41.33000 Y229.37000 Z5.00000 J350.12 F500.0
+G1 X41.33000 Y225.17000 Z5.00000 J354.23 F500.0
+G1 X44.45000 Y223.37000 Z5.00000 J357.76 F500.0
+G1 X44.45000 Y219.17000 Z5.00000 J361.88 F500.0
+G1 X41.33000 Y217.37000 Z5.00000 J365.41 F500.0
+G1 X41.33000 Y213.17000 Z5.00000 J369.53 F500.0
+G1 X44.45000 Y211.37000 Z5.00000 J373.06 F500.0
+G1 X44.45000 Y207.17000 Z5.00000 J377.17 F500.0
+G1 X41.33000 Y205.37000 Z5.00000 J380.70 F500.0
+G1 X41.33000 Y202.78000 Z5.00000 J383.24 F500.0
+G1 X47.91000 Y202.78000 Z5.00000 J389.69 F500.0
+G1 X47.91000 Y205.37000 Z5.00000 J392.23 F500.0
+G1 X44.80000 Y207.17000 Z5.00000 J395.75 F500.0
+G1 X44.80000 Y211.37000 Z5.00000 J399.86 F500.0
+G1 X47.91000 Y213.17000 Z5.00000 J403.39 F500.0
+G1 X47.91000 Y217.37000 Z5.00000 J407.50 F500.0
+G1 X44.80000 Y219.17000 Z5.00000 J411.02 F500.0
+G1 X44.80000 Y223.37000 Z5.00000 J415.14 F500.0
+G1 X47.91000 Y225.17000 Z5.00000 J418.66 F500.0
+G1 X47.91000 Y229.37000 Z5.00000 J422.78 F500.0
+G1 X44.80000 Y231.17000 Z5.00000 J426.30 F500.0
+G1 X44.80000 Y235.37000 Z5.00000 J430.41 F500.0
+G1 X47.83000 Y237.12000 Z5.00000 J433.84 F500.0
+G1 X48.34000 Y237.12000 Z5.00000 J434.34 F500.0
+G1 X51.38000 Y235.37000 Z5.00000 J437.78 F500.0
+G1 X51.38000 Y231.17000 Z5.00000 J441.90 F500.0
+G1 X48.26000 Y229.37000 Z5.00000 J445.43 F500.0
+G1 X48.26000 Y225.17000 Z5.00000 J449.54 F500.0
+G1 X51.38000 Y223.37000 Z5.00000 J453.07 F500.0
+G1 X51.38000 Y219.17000 Z5.00000 J457.19 F500.0
+G1 X48.26000 Y217.37000 Z5.00000 J460.72 F500.0
+G1 X48.26000 Y213.17000 Z5.00000 J464.83 F500.0
+G1 X51.38000 Y211.37000 Z5.00000 J468.36 F500.0
+G1 X51.38000 Y207.17000 Z5.00000 J472.48 F500.0
+G1 X48.26000 Y205.37000 Z5.00000 J476.01 F500.0
+G1 X48.26000 Y202.78000 Z5.00000 J478.55 F500.0
+G1 X54.84000 Y202.78000 Z5.00000 J485.00 F500.0
+G1 X54.84000 Y205.37000 Z5.00000 J487.54 F500.0
+G1 X51.73000 Y207.17000 Z5.00000 J491.06 F500.0
+G1 X51.73000 Y211.37000 Z5.00000 J495.17 F500.0
+G1 X54.84000 Y213.17000 Z5.00000 J498.69 F500.0
+G1 X54.84000 Y217.37000 Z5.00000 J502.81 F500.0
+G1 X51.73000 Y219.17000 Z5.00000 J506.33 F500.0
+G1 X51.73000 Y223.37000 Z5.00000 J510.45 F500.0
+G1 X54.84000 Y225.17000 Z5.00000 J513.97 F500.0
+G1 X54.84000 Y229.37000 Z5.00000 J518.08 F500.0
+G1 X51.73000 Y231.17000 Z5.00000 J521.61 F500.0
+G1 X51.73000 Y235.37000 Z5.00000 J525.72 F500.0
+G1 X54.76000 Y237.12000 Z5.00000 J529.15 F500.0
+G1 X55.27000 Y237.12000 Z5.00000 J529.65 F500.0
+G1 X58.31000 Y235.37000 Z5.00000 J533.09 F500.0
+G1 X58.31000 Y231.17000 Z5.00000 J537.20 F500.0
+G1 X55.19000 Y229.37000 Z5.00000 J540.73 F500.0
+G1 X55.19000 Y225.17000 Z5.00000 J544.85 F500.0
+G1 X58.31000 Y223.37000 Z5.00000 J548.38 F500.0
+G1 X58.31000 Y219.17000 Z5.00000 J552.50 F500.0
+G1 X55.19000 Y217.37000 Z5.00000 J556.03 F500.0
+G1 X55.19000 Y213.17000 Z5.00000 J560.14 F500.0
+G1 X58.31000 Y211.37000 Z5.00000 J563.67 F500.0
+G1 X58.31000 Y207.17000 Z5.00000 J567.79 F500.0
+G1 X55.19000 Y205.37000 Z5.00000 J571.32 F500.0
+G1 X55.19000 Y202.78000 Z5.00000 J573.86 F500.0
+G1 X61.77000 Y202.78000 Z5.00000 J580.31 F500.0
+G1 X61.77000 Y205.37000 Z5.00000 J582.84 F500.0
+G1 X58.65000 Y207.17000 Z5.00000 J586.37 F500.0
+G1 X58.65000 Y211.37000 Z5.00000 J590.49 F500.0
+G1 X61.77000 Y213.17000 Z5.00000 J594.02 F500.0
+G1 X61.77000 Y217.37000 Z5.00000 J598.14 F500.0
+G1 X58.65000 Y219.17000 Z5.00000 J601.67 F500.0
+G1 X58.65000 Y223.37000 Z5.00000 J605.78 F500.0
+G1 X61.77000 Y225.17000 Z5.00000 J609.31 F500.0
+G1 X61.77000 Y229.37000 Z5.00000 J613.43 F500.0
+G1 X58.65000 Y231.17000 Z5.00000 J616.96 F500.0
+G1 X58.65000 Y235.37000 Z5.00000 J621.07 F500.0
+G1 X61.69000 Y237.12000 Z5.00000 J624.51 F500.0
+G1 X62.20000 Y237.12000 Z5.00000 J625.01 F500.0
+G1 X65.23000 Y235.37000 Z5.00000 J628.44 F500.0
+G1 X65.23000 Y231.17000 Z5.00000 J632.56 F500.0
+G1 X62.12000 Y229.37000 Z5.00000 J636.08 F500.0
+G1 X62.12000 Y225.17000 Z5.00000 J640.19 F500.0
+G1 X65.23000 Y223.37000 Z5.00000 J643.71 F500.0
+G1 X65.23000 Y219.17000 Z5.00000 J647.83 F500.0
+G1 X62.12000 Y217.37000 Z5.00000 J651.35 F500.0
+G1 X62.12000 Y213.17000 Z5.00000 J655.47 F500.0
+G1 X65.23000 Y211.37000 Z5.00000 J658.99 F500.0
+G1 X65.23000 Y207.17000 Z5.00000 J663.11 F500.0
+G1 X62.12000 Y205.37000 Z5.00000 J666.63 F500.0
+G1 X62.12000 Y202.78000 Z5.00000 J669.17 F500.0
+G1 X68.70000 Y202.78000 Z5.00000 J675.61 F500.0
+G1 X68.70000 Y205.37000 Z5.00000 J678.15 F500.0
+G1 X65.58000 Y207.17000 Z5.00000 J681.68 F500.0
+G1 X65.58000 Y211.37000 Z5.00000 J685.80 F500.0
+G1 X68.70000 Y213.17000 Z5.00000 J689.33 F500.0
+G1 X68.70000 Y217.37000 Z5.00000 J693.44 F500.0
+G1 X65.58000 Y219.17000 Z5.00000 J696.97 F500.0
+G1 X65.58000 Y223.37000 Z5.00000 J701.09 F500.0
+G1 X68.70000 Y225.17000 Z5.00000 J704.62 F500.0
+G1 X68.70000 Y229.37000 Z5.00000 J708.74 F500.0
+G1 X65.58000 Y231.17000 Z5.00000 J712.27 F500.0
+G1 X65.58000 Y235.37000 Z5.00000 J716.38 F500.0
+G1 X68.62000 Y237.12000 Z5.00000 J719.82 F500.0
+G1 X69.12000 Y237.12000 Z5.00000 J720.31 F500.0
+G1 X72.16000 Y235.37000 Z5.00000 J723.75 F500.0
+G1 X72.16000 Y231.17000 Z5.00000 J727.86 F500.0
+G1 X69.04000 Y229.37000 Z5.00000 J731.39 F500.0
+G1 X69.04000 Y225.17000 Z5.00000 J735.51 F500.0
+G1 X72.16000 Y223.37000 Z5.00000 J739.04 F500.0
+G1 X72.16000 Y219.17000 Z5.00000 J743.15 F500.0
+G1 X69.04000 Y217.37000 Z5.00000 J746.68 F500.0
+G1 X69.04000 Y213.17000 Z5.00000 J750.80 F500.0
+G1 X72.16000 Y211.37000 Z5.00000 J754.33 F500.0
+G1 X72.16000 Y207.17000 Z5.00000 J758.45 F500.0
+G1 X69.04000 Y205.37000 Z5.00000 J761.98 F500.0
+G1 X69.04000 Y202.78000 Z5.00000 J764.51 F500.0
+G1 X75.63000 Y202.78000 Z5.00000 J770.97 F500.0
+G1 X75.63000 Y205.37000 Z5.00000 J773.51 F500.0
+G1 X72.51000 Y207.17000 Z5.00000 J777.04 F500.0
+G1 X72.51000 Y211.37000 Z5.00000 J781.16 F500.0
+G1 X75.63000 Y213.17000 Z5.00000 J784.69 F500.0
+G1 X75.63000 Y217.37000 Z5.00000 J788.80 F500.0
+G1 X72.51000 Y219.17000 Z5.00000 J792.33 F500.0
+G1 X72.51000 Y223.37000 Z5.00000 J796.45 F500.0
+G1 X75.63000 Y225.17000 Z5.00000 J799.98 F500.0
+G1 X75.63000 Y229.37000 Z5.00000 J804.10 F500.0
+G1 X72.51000 Y231.17000 Z5.00000 J807.62 F500.0
+G1 X72.51000 Y235.37000 Z5.00000 J811.74 F500.0
+G1 X75.55000 Y237.12000 Z5.00000 J815.18 F500.0
+G1 X76.05000 Y237.12000 Z5.00000 J815.67 F500.0
+G1 X79.09000 Y235.37000 Z5.00000 J819.11 F500.0
+G1 X79.09000 Y231.17000 Z5.00000 J823.22 F500.0
+G1 X75.97000 Y229.37000 Z5.00000 J826.75 F500.0
+G1 X75.97000 Y225.17000 Z5.00000 J830.87 F500.0
+G1 X79.09000 Y223.37000 Z5.00000 J834.40 F500.0
+G1 X79.09000 Y219.17000 Z5.00000 J838.51 F500.0
+G1 X75.97000 Y217.37000 Z5.00000 J842.04 F500.0
+G1 X75.97000 Y213.17000 Z5.00000 J846.16 F500.0
+G1 X79.09000 Y211.37000 Z5.00000 J849.69 F500.0
+G1 X79.09000 Y207.17000 Z5.00000 J853.81 F500.0
+G1 X75.97000 Y205.37000 Z5.00000 J857.34 F500.0
+G1 X75.97000 Y202.78000 Z5.00000 J859.87 F500.0
+G1 X82.55000 Y202.78000 Z5.00000 J866.32 F500.0
+G1 X82.55000 Y205.37000 Z5.00000 J868.86 F500.0
+G1 X79.44000 Y207.17000 Z5.00000 J872.38 F500.0
+G1 X79.44000 Y211.37000 Z5.00000 J876.50 F500.0
+G1 X82.55000 Y213.17000 Z5.00000 J880.02 F500.0
+G1 X82.55000 Y217.37000 Z5.00000 J884.14 F500.0
+G1 X79.44000 Y219.17000 Z5.00000 J887.66 F500.0
+G1 X79.44000 Y223.37000 Z5.00000 J891.77 F500.0
+G1 X82.55000 Y225.17000 Z5.00000 J895.29 F500.0
+G1 X82.55000 Y229.37000 Z5.00000 J899.41 F500.0
+G1 X79.44000 Y231.17000 Z5.00000 J902.93 F500.0
+G1 X79.44000 Y235.37000 Z5.00000 J907.05 F500.0
+G1 X82.48000 Y237.12000 Z5.00000 J910.49 F500.0
+G1 X82.98000 Y237.12000 Z5.00000 J910.98 F500.0
+G1 X86.02000 Y235.37000 Z5.00000 J914.41 F500.0
+G1 X86.02000 Y231.17000 Z5.00000 J918.53 F500.0
+G1 X82.90000 Y229.37000 Z5.00000 J922.06 F500.0
+G1 X82.90000 Y225.17000 Z5.00000 J926.18 F500.0
+G1 X86.02000 Y223.37000 Z5.00000 J929.71 F500.0
+G1 X86.02000 Y219.17000 Z5.00000 J933.82 F500.0
+G1 X82.90000 Y217.37000 Z5.00000 J937.35 F500.0
+G1 X82.90000 Y213.17000 Z5.00000 J941.47 F500.0
+G1 X86.02000 Y211.37000 Z5.00000 J945.00 F500.0
+G1 X86.02000 Y207.17000 Z5.00000 J949.11 F500.0
+G1 X82.90000 Y205.37000 Z5.00000 J952.64 F500.0
+G1 X82.90000 Y202.78000 Z5.00000 J955.18 F500.0
+G1 X89.48000 Y202.78000 Z5.00000 J961.63 F500.0
+G1 X89.48000 Y205.37000 Z5.00000 J964.17 F500.0
+G1 X86.37000 Y207.17000 Z5.00000 J967.69 F500.0
+G1 X86.37000 Y211.37000 Z5.00000 J971.81 F500.0
+G1 X89.48000 Y213.17000 Z5.00000 J975.33 F500.0
+G1 X89.48000 Y217.37000 Z5.00000 J979.44 F500.0
+G1 X86.37000 Y219.17000 Z5.00000 J982.96 F500.0
+G1 X86.37000 Y223.37000 Z5.00000 J987.08 F500.0
+G1 X89.48000 Y225.17000 Z5.00000 J990.60 F500.0
+G1 X89.48000 Y229.37000 Z5.00000 J994.72 F500.0
+G1 X86.37000 Y231.17000 Z5.00000 J998.24 F500.0
+G1 X86.37000 Y235.37000 Z5.00000 J1002.36 F500.0
+G1 X89.40000 Y237.12000 Z5.00000 J1005.78 F500.0
+G1 X89.91000 Y237.12000 Z5.00000 J1006.28 F500.0
+G1 X92.95000 Y235.37000 Z5.00000 J1009.72 F500.0
+G1 X92.95000 Y231.17000 Z5.00000 J1013.84 F500.0
+G1 X89.83000 Y229.37000 Z5.00000 J1017.37 F500.0
+G1 X89.83000 Y225.17000 Z5.00000 J1021.48 F500.0
+G1 X92.95000 Y223.37000 Z5.00000 J1025.01 F500.0
+G1 X92.95000 Y219.17000 Z5.00000 J1029.13 F500.0
+G1 X89.83000 Y217.37000 Z5.00000 J1032.66 F500.0
+G1 X89.83000 Y213.17000 Z5.00000 J1036.78 F500.0
+G1 X92.95000 Y211.37000 Z5.00000 J1040.31 F500.0
+G1 X92.95000 Y207.17000 Z5.00000 J1044.42 F500.0
+G1 X89.83000 Y205.37000 Z5.00000 J1047.95 F500.0
+G1 X89.83000 Y202.78000 Z5.00000 J1050.49 F500.0
+G1 X96.41000 Y202.78000 Z5.00000 J1056.94 F500.0
+G1 X96.41000 Y205.37000 Z5.00000 J1059.48 F500.0
+G1 X93.29000 Y207.17000 Z5.00000 J1063.01 F500.0
+G1 X93.29000 Y211.37000 Z5.00000 J1067.12 F500.0
+G1 X96.41000 Y213.17000 Z5.00000 J1070.65 F500.0
+G1 X96.41000 Y217.37000 Z5.00000 J1074.77 F500.0
+G1 X93.29000 Y219.17000 Z5.00000 J1078.30 F500.0
+G1 X93.29000 Y223.37000 Z5.00000 J1082.41 F500.0
+G1 X96.41000 Y225.17000 Z5.00000 J1085.94 F500.0
+G1 X96.41000 Y229.37000 Z5.00000 J1090.06 F500.0
+G1 X93.29000 Y231.17000 Z5.00000 J1093.59 F500.0
+G1 X93.29000 Y235.37000 Z5.00000 J1097.71 F500.0
+G1 X96.33000 Y237.12000 Z5.00000 J1101.14 F500.0
+G1 X96.84000 Y237.12000 Z5.00000 J1101.64 F500.0
+G1 X97.22000 Y236.90000 Z5.00000 J1102.07 F500.0
+G1 X97.22000 Y229.64000 Z5.00000 J1109.19 F500.0
+G1 X96.76000 Y229.37000 Z5.00000 J1109.71 F500.0
+G1 X96.76000 Y225.17000 Z5.00000 J1113.83 F500.0
+G1 X97.22000 Y224.90000 Z5.00000 J1114.35 F500.0
+G1 X97.22000 Y217.64000 Z5.00000 J1121.46 F500.0
+G1 X96.76000 Y217.37000 Z5.00000 J1121.99 F500.0
+G1 X96.76000 Y213.17000 Z5.00000 J1126.10 F500.0
+G1 X97.22000 Y212.90000 Z5.00000 J1126.63 F500.0
+G1 X97.22000 Y207.52000 Z5.00000 J1136.90 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X97.22000 Y205.64000 Z5.00000 J1136.90 F800.0
+G1 X96.76000 Y205.37000 Z5.00000 J1136.90 F800.0
+G1 X96.76000 Y202.78000 Z5.00000 J1136.90 F800.0
+G1 X96.76000 Y202.78000 Z15.00000 J1136.90 F800.0
+G1 X74.03000 Y198.33000 Z15.00000 J1146.90 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X79.03000 Y203.33000 Z6.00000 J0.00 F300.0
+G1 X96.67000 Y203.33000 Z6.00000 J17.29 F300.0
+G1 X96.67000 Y231.13000 Z6.00000 J44.53 F300.0
+G1 X96.67000 Y236.57000 Z6.00000 J49.86 F300.0
+G1 X41.07000 Y236.57000 Z6.00000 J104.35 F500.0
+G1 X23.43000 Y236.57000 Z6.00000 J121.64 F500.0
+G1 X23.43000 Y208.77000 Z6.00000 J148.88 F500.0
+G1 X23.43000 Y203.33000 Z6.00000 J154.21 F500.0
+G1 X74.03000 Y203.33000 Z6.00000 J208.80 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X79.03000 Y203.33000 Z6.00000 J208.80 F800.0
+G1 X79.03000 Y203.33000 Z16.00000 J208.80 F800.0
+G1 X74.03000 Y198.33000 Z16.00000 J218.80 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X79.03000 Y203.33000 Z6.00000 J0.00 F300.0
+G1 X23.43000 Y235.50000 Z6.00000 J62.95 F300.0
+G1 X23.67000 Y235.37000 Z6.00000 J63.22 F300.0
+G1 X23.67000 Y231.17000 Z6.00000 J67.34 F300.0
+G1 X23.43000 Y231.03000 Z6.00000 J67.61 F500.0
+G1 X23.43000 Y223.51000 Z6.00000 J74.98 F500.0
+G1 X23.67000 Y223.37000 Z6.00000 J75.25 F500.0
+G1 X23.67000 Y219.17000 Z6.00000 J79.37 F500.0
+G1 X23.43000 Y219.03000 Z6.00000 J79.64 F500.0
+G1 X23.43000 Y211.50000 Z6.00000 J87.02 F500.0
+G1 X23.67000 Y211.37000 Z6.00000 J87.28 F500.0
+G1 X23.67000 Y207.17000 Z6.00000 J91.40 F500.0
+G1 X23.43000 Y207.03000 Z6.00000 J91.67 F500.0
+G1 X27.13000 Y203.33000 Z6.00000 J96.80 F500.0
+G1 X27.13000 Y205.37000 Z6.00000 J98.80 F500.0
+G1 X24.01000 Y207.17000 Z6.00000 J102.33 F500.0
+G1 X24.01000 Y211.37000 Z6.00000 J106.45 F500.0
+G1 X27.13000 Y213.17000 Z6.00000 J109.98 F500.0
+G1 X27.13000 Y217.37000 Z6.00000 J114.09 F500.0
+G1 X24.01000 Y219.17000 Z6.00000 J117.62 F500.0
+G1 X24.01000 Y223.37000 Z6.00000 J121.74 F500.0
+G1 X27.13000 Y225.17000 Z6.00000 J125.27 F500.0
+G1 X27.13000 Y229.37000 Z6.00000 J129.38 F500.0
+G1 X24.01000 Y231.17000 Z6.00000 J132.91 F500.0
+G1 X24.01000 Y235.37000 Z6.00000 J137.03 F500.0
+G1 X26.09000 Y236.57000 Z6.00000 J139.38 F500.0
+G1 X28.51000 Y236.57000 Z6.00000 J141.76 F500.0
+G1 X30.59000 Y235.37000 Z6.00000 J144.11 F500.0
+G1 X30.59000 Y231.17000 Z6.00000 J148.22 F500.0
+G1 X27.48000 Y229.37000 Z6.00000 J151.75 F500.0
+G1 X27.48000 Y225.17000 Z6.00000 J155.86 F500.0
+G1 X30.59000 Y223.37000 Z6.00000 J159.38 F500.0
+G1 X30.59000 Y219.17000 Z6.00000 J163.50 F500.0
+G1 X27.48000 Y217.37000 Z6.00000 J167.02 F500.0
+G1 X27.48000 Y213.17000 Z6.00000 J171.14 F500.0
+G1 X30.59000 Y211.37000 Z6.00000 J174.66 F500.0
+G1 X30.59000 Y207.17000 Z6.00000 J178.77 F500.0
+G1 X27.48000 Y205.37000 Z6.00000 J182.30 F500.0
+G1 X27.48000 Y203.33000 Z6.00000 J184.29 F500.0
+G1 X34.06000 Y203.33000 Z6.00000 J190.74 F500.0
+G1 X34.06000 Y205.37000 Z6.00000 J192.74 F500.0
+G1 X30.94000 Y207.17000 Z6.00000 J196.27 F500.0
+G1 X30.94000 Y211.37000 Z6.00000 J200.39 F500.0
+G1 X34.06000 Y213.17000 Z6.00000 J203.92 F500.0
+G1 X34.06000 Y217.37000 Z6.00000 J208.03 F500.0
+G1 X30.94000 Y219.17000 Z6.00000 J211.56 F500.0
+G1 X30.94000 Y223.37000 Z6.00000 J215.68 F500.0
+G1 X34.06000 Y225.17000 Z6.00000 J219.21 F500.0
+G1 X34.06000 Y229.37000 Z6.00000 J223.33 F500.0
+G1 X30.94000 Y231.17000 Z6.00000 J226.86 F500.0
+G1 X30.94000 Y235.37000 Z6.00000 J230.97 F500.0
+G1 X33.02000 Y236.57000 Z6.00000 J233.33 F500.0
+G1 X35.44000 Y236.57000 Z6.00000 J235.70 F500.0
+G1 X37.52000 Y235.37000 Z6.00000 J238.05 F500.0
+G1 X37.52000 Y231.17000 Z6.00000 J242.17 F500.0
+G1 X34.40000 Y229.37000 Z6.00000 J245.70 F500.0
+G1 X34.40000 Y225.17000 Z6.00000 J249.81 F500.0
+G1 X37.52000 Y223.37000 Z6.00000 J253.34 F500.0
+G1 X37.52000 Y219.17000 Z6.00000 J257.46 F500.0
+G1 X34.40000 Y217.37000 Z6.00000 J260.99 F500.0
+G1 X34.40000 Y213.17000 Z6.00000 J265.10 F500.0
+G1 X37.52000 Y211.37000 Z6.00000 J268.63 F500.0
+G1 X37.52000 Y207.17000 Z6.00000 J272.75 F500.0
+G1 X34.40000 Y205.37000 Z6.00000 J276.28 F500.0
+G1 X34.40000 Y203.33000 Z6.00000 J278.28 F500.0
+G1 X40.99000 Y203.33000 Z6.00000 J284.74 F500.0
+G1 X40.99000 Y205.37000 Z6.00000 J286.74 F500.0
+G1 X37.87000 Y207.17000 Z6.00000 J290.27 F500.0
+G1 X37.87000 Y211.37000 Z6.00000 J294.38 F500.0
+G1 X40.99000 Y213.17000 Z6.00000 J297.91 F500.0
+G1 X40.99000 Y217.37000 Z6.00000 J302.03 F500.0
+G1 X37.87000 Y219.17000 Z6.00000 J305.56 F500.0
+G1 X37.87000 Y223.37000 Z6.00000 J309.67 F500.0
+G1 X40.99000 Y225.17000 Z6.00000 J313.20 F500.0
+G1 X40.99000 Y229.37000 Z6.00000 J317.32 F500.0
+G1 X37.87000 Y231.17000 Z6.00000 J320.85 F500.0
+G1 X37.87000 Y235.37000 Z6.00000 J324.97 F500.0
+G1 X39.95000 Y236.57000 Z6.00000 J327.32 F500.0
+G1 X42.37000 Y236.57000 Z6.00000 J329.69 F500.0
+G1 X44.45000 Y235.37000 Z6.00000 J332.04 F500.0
+G1 X44.45000 Y231.17000 Z6.00000 J336.16 F500.0
+G1 X41.33000 Y229.37000 Z6.00000 J339.69 F500.0
+G1 X41.33000 Y225.17000 Z6.00000 J343.81 F500.0
+G1 X44.45000 Y223.37000 Z6.00000 J347.34 F500.0
+G1 X44.45000 Y219.17000 Z6.00000 J351.45 F500.0
+G1 X41.33000 Y217.37000 Z6.00000 J354.98 F500.0
+G1 X41.33000 Y213.17000 Z6.00000 J359.10 F500.0
+G1 X44.45000 Y211.37000 Z6.00000 J362.63 F500.0
+G1 X44.45000 Y207.17000 Z6.00000 J366.74 F500.0
+G1 X41.33000 Y205.37000 Z6.00000 J370.27 F500.0
+G1 X41.33000 Y203.33000 Z6.00000 J372.27 F500.0
+G1 X47.91000 Y203.33000 Z6.00000 J378.72 F500.0
+G1 X47.91000 Y205.37000 Z6.00000 J380.72 F500.0
+G1 X44.80000 Y207.17000 Z6.00000 J384.24 F500.0
+G1 X44.80000 Y211.37000 Z6.00000 J388.36 F500.0
+G1 X47.91000 Y213.17000 Z6.00000 J391.88 F500.0
+G1 X47.91000 Y217.37000 Z6.00000 J396.00 F500.0
+G1 X44.80000 Y219.17000 Z6.00000 J399.52 F500.0
+G1 X44.80000 Y223.37000 Z6.00000 J403.63 F500.0
+G1 X47.91000 Y225.17000 Z6.00000 J407.16 F500.0
+G1 X47.91000 Y229.37000 Z6.00000 J411.27 F500.0
+G1 X44.80000 Y231.17000 Z6.00000 J414.79 F500.0
+G1 X44.80000 Y235.37000 Z6.00000 J418.91 F500.0
+G1 X46.87000 Y236.57000 Z6.00000 J421.25 F500.0
+G1 X49.30000 Y236.57000 Z6.00000 J423.64 F500.0
+G1 X51.38000 Y235.37000 Z6.00000 J425.99 F500.0
+G1 X51.38000 Y231.17000 Z6.00000 J430.10 F500.0
+G1 X48.26000 Y229.37000 Z6.00000 J433.63 F500.0
+G1 X48.26000 Y225.17000 Z6.00000 J437.75 F500.0
+G1 X51.38000 Y223.37000 Z6.00000 J441.28 F500.0
+G1 X51.38000 Y219.17000 Z6.00000 J445.40 F500.0
+G1 X48.26000 Y217.37000 Z6.00000 J448.93 F500.0
+G1 X48.26000 Y213.17000 Z6.00000 J453.04 F500.0
+G1 X51.38000 Y211.37000 Z6.00000 J456.57 F500.0
+G1 X51.38000 Y207.17000 Z6.00000 J460.69 F500.0
+G1 X48.26000 Y205.37000 Z6.00000 J464.22 F500.0
+G1 X48.26000 Y203.33000 Z6.00000 J466.22 F500.0
+G1 X54.84000 Y203.33000 Z6.00000 J472.67 F500.0
+G1 X54.84000 Y205.37000 Z6.00000 J474.67 F500.0
+G1 X51.73000 Y207.17000 Z6.00000 J478.19 F500.0
+G1 X51.73000 Y211.37000 Z6.00000 J482.30 F500.0
+G1 X54.84000 Y213.17000 Z6.00000 J485.82 F500.0
+G1 X54.84000 Y217.37000 Z6.00000 J489.94 F500.0
+G1 X51.73000 Y219.17000 Z6.00000 J493.46 F500.0
+G1 X51.73000 Y223.37000 Z6.00000 J497.58 F500.0
+G1 X54.84000 Y225.17000 Z6.00000 J501.10 F500.0
+G1 X54.84000 Y229.37000 Z6.00000 J505.21 F500.0
+G1 X51.73000 Y231.17000 Z6.00000 J508.74 F500.0
+G1 X51.73000 Y235.37000 Z6.00000 J512.85 F500.0
+G1 X53.80000 Y236.57000 Z6.00000 J515.20 F500.0
+G1 X56.23000 Y236.57000 Z6.00000 J517.58 F500.0
+G1 X58.31000 Y235.37000 Z6.00000 J519.93 F500.0
+G1 X58.31000 Y231.17000 Z6.00000 J524.05 F500.0
+G1 X55.19000 Y229.37000 Z6.00000 J527.58 F500.0
+G1 X55.19000 Y225.17000 Z6.00000 J531.69 F500.0
+G1 X58.31000 Y223.37000 Z6.00000 J535.22 F500.0
+G1 X58.31000 Y219.17000 Z6.00000 J539.34 F500.0
+G1 X55.19000 Y217.37000 Z6.00000 J542.87 F500.0
+G1 X55.19000 Y213.17000 Z6.00000 J546.99 F500.0
+G1 X58.31000 Y211.37000 Z6.00000 J550.52 F500.0
+G1 X58.31000 Y207.17000 Z6.00000 J554.63 F500.0
+G1 X55.19000 Y205.37000 Z6.00000 J558.16 F500.0
+G1 X55.19000 Y203.33000 Z6.00000 J560.16 F500.0
+G1 X61.77000 Y203.33000 Z6.00000 J566.61 F500.0
+G1 X61.77000 Y205.37000 Z6.00000 J568.61 F500.0
+G1 X58.65000 Y207.17000 Z6.00000 J572.14 F500.0
+G1 X58.65000 Y211.37000 Z6.00000 J576.25 F500.0
+G1 X61.77000 Y213.17000 Z6.00000 J579.78 F500.0
+G1 X61.77000 Y217.37000 Z6.00000 J583.90 F500.0
+G1 X58.65000 Y219.17000 Z6.00000 J587.43 F500.0
+G1 X58.65000 Y223.37000 Z6.00000 J591.55 F500.0
+G1 X61.77000 Y225.17000 Z6.00000 J595.08 F500.0
+G1 X61.77000 Y229.37000 Z6.00000 J599.19 F500.0
+G1 X58.65000 Y231.17000 Z6.00000 J602.72 F500.0
+G1 X58.65000 Y235.37000 Z6.00000 J606.84 F500.0
+G1 X60.73000 Y236.57000 Z6.00000 J609.19 F500.0
+G1 X63.16000 Y236.57000 Z6.00000 J611.57 F500.0
+G1 X65.23000 Y235.37000 Z6.00000 J613.92 F500.0
+G1 X65.23000 Y231.17000 Z6.00000 J618.03 F500.0
+G1 X62.12000 Y229.37000 Z6.00000 J621.56 F500.0
+G1 X62.12000 Y225.17000 Z6.00000 J625.67 F500.0
+G1 X65.23000 Y223.37000 Z6.00000 J629.19 F500.0
+G1 X65.23000 Y219.17000 Z6.00000 J633.31 F500.0
+G1 X62.12000 Y217.37000 Z6.00000 J636.83 F500.0
+G1 X62.12000 Y213.17000 Z6.00000 J640.95 F500.0
+G1 X65.23000 Y211.37000 Z6.00000 J644.47 F500.0
+G1 X65.23000 Y207.17000 Z6.00000 J648.58 F500.0
+G1 X62.12000 Y205.37000 Z6.00000 J652.11 F500.0
+G1 X62.12000 Y203.33000 Z6.00000 J654.10 F500.0
+G1 X68.70000 Y203.33000 Z6.00000 J660.55 F500.0
+G1 X68.70000 Y205.37000 Z6.00000 J662.55 F500.0
+G1 X65.58000 Y207.17000 Z6.00000 J666.08 F500.0
+G1 X65.58000 Y211.37000 Z6.00000 J670.20 F500.0
+G1 X68.70000 Y213.17000 Z6.00000 J673.73 F500.0
+G1 X68.70000 Y217.37000 Z6.00000 J677.84 F500.0
+G1 X65.58000 Y219.17000 Z6.00000 J681.37 F500.0
+G1 X65.58000 Y223.37000 Z6.00000 J685.49 F500.0
+G1 X68.70000 Y225.17000 Z6.00000 J689.02 F500.0
+G1 X68.70000 Y229.37000 Z6.00000 J693.14 F500.0
+G1 X65.58000 Y231.17000 Z6.00000 J696.67 F500.0
+G1 X65.58000 Y235.37000 Z6.00000 J700.78 F500.0
+G1 X67.66000 Y236.57000 Z6.00000 J703.14 F500.0
+G1 X70.08000 Y236.57000 Z6.00000 J705.51 F500.0
+G1 X72.16000 Y235.37000 Z6.00000 J707.86 F500.0
+G1 X72.16000 Y231.17000 Z6.00000 J711.98 F500.0
+G1 X69.04000 Y229.37000 Z6.00000 J715.51 F500.0
+G1 X69.04000 Y225.17000 Z6.00000 J719.62 F500.0
+G1 X72.16000 Y223.37000 Z6.00000 J723.15 F500.0
+G1 X72.16000 Y219.17000 Z6.00000 J727.27 F500.0
+G1 X69.04000 Y217.37000 Z6.00000 J730.80 F500.0
+G1 X69.04000 Y213.17000 Z6.00000 J734.91 F500.0
+G1 X72.16000 Y211.37000 Z6.00000 J738.44 F500.0
+G1 X72.16000 Y207.17000 Z6.00000 J742.56 F500.0
+G1 X69.04000 Y205.37000 Z6.00000 J746.09 F500.0
+G1 X69.04000 Y203.33000 Z6.00000 J748.09 F500.0
+G1 X75.63000 Y203.33000 Z6.00000 J754.55 F500.0
+G1 X75.63000 Y205.37000 Z6.00000 J756.55 F500.0
+G1 X72.51000 Y207.17000 Z6.00000 J760.08 F500.0
+G1 X72.51000 Y211.37000 Z6.00000 J764.19 F500.0
+G1 X75.63000 Y213.17000 Z6.00000 J767.72 F500.0
+G1 X75.63000 Y217.37000 Z6.00000 J771.84 F500.0
+G1 X72.51000 Y219.17000 Z6.00000 J775.37 F500.0
+G1 X72.51000 Y223.37000 Z6.00000 J779.48 F500.0
+G1 X75.63000 Y225.17000 Z6.00000 J783.01 F500.0
+G1 X75.63000 Y229.37000 Z6.00000 J787.13 F500.0
+G1 X72.51000 Y231.17000 Z6.00000 J790.66 F500.0
+G1 X72.51000 Y235.37000 Z6.00000 J794.78 F500.0
+G1 X74.59000 Y236.57000 Z6.00000 J797.13 F500.0
+G1 X77.01000 Y236.57000 Z6.00000 J799.50 F500.0
+G1 X79.09000 Y235.37000 Z6.00000 J801.85 F500.0
+G1 X79.09000 Y231.17000 Z6.00000 J805.97 F500.0
+G1 X75.97000 Y229.37000 Z6.00000 J809.50 F500.0
+G1 X75.97000 Y225.17000 Z6.00000 J813.62 F500.0
+G1 X79.09000 Y223.37000 Z6.00000 J817.15 F500.0
+G1 X79.09000 Y219.17000 Z6.00000 J821.26 F500.0
+G1 X75.97000 Y217.37000 Z6.00000 J824.79 F500.0
+G1 X75.97000 Y213.17000 Z6.00000 J828.91 F500.0
+G1 X79.09000 Y211.37000 Z6.00000 J832.44 F500.0
+G1 X79.09000 Y207.17000 Z6.00000 J836.55 F500.0
+G1 X75.97000 Y205.37000 Z6.00000 J840.08 F500.0
+G1 X75.97000 Y203.33000 Z6.00000 J842.08 F500.0
+G1 X82.55000 Y203.33000 Z6.00000 J848.53 F500.0
+G1 X82.55000 Y205.37000 Z6.00000 J850.53 F500.0
+G1 X79.44000 Y207.17000 Z6.00000 J854.05 F500.0
+G1 X79.44000 Y211.37000 Z6.00000 J858.17 F500.0
+G1 X82.55000 Y213.17000 Z6.00000 J861.69 F500.0
+G1 X82.55000 Y217.37000 Z6.00000 J865.81 F500.0
+G1 X79.44000 Y219.17000 Z6.00000 J869.33 F500.0
+G1 X79.44000 Y223.37000 Z6.00000 J873.44 F500.0
+G1 X82.55000 Y225.17000 Z6.00000 J876.97 F500.0
+G1 X82.55000 Y229.37000 Z6.00000 J881.08 F500.0
+G1 X79.44000 Y231.17000 Z6.00000 J884.60 F500.0
+G1 X79.44000 Y235.37000 Z6.00000 J888.72 F500.0
+G1 X81.52000 Y236.57000 Z6.00000 J891.07 F500.0
+G1 X83.94000 Y236.57000 Z6.00000 J893.44 F500.0
+G1 X86.02000 Y235.37000 Z6.00000 J895.80 F500.0
+G1 X86.02000 Y231.17000 Z6.00000 J899.91 F500.0
+G1 X82.90000 Y229.37000 Z6.00000 J903.44 F500.0
+G1 X82.90000 Y225.17000 Z6.00000 J907.56 F500.0
+G1 X86.02000 Y223.37000 Z6.00000 J911.09 F500.0
+G1 X86.02000 Y219.17000 Z6.00000 J915.20 F500.0
+G1 X82.90000 Y217.37000 Z6.00000 J918.73 F500.0
+G1 X82.90000 Y213.17000 Z6.00000 J922.85 F500.0
+G1 X86.02000 Y211.37000 Z6.00000 J926.38 F500.0
+G1 X86.02000 Y207.17000 Z6.00000 J930.50 F500.0
+G1 X82.90000 Y205.37000 Z6.00000 J934.03 F500.0
+G1 X82.90000 Y203.33000 Z6.00000 J936.03 F500.0
+G1 X89.48000 Y203.33000 Z6.00000 J942.47 F500.0
+G1 X89.48000 Y205.37000 Z6.00000 J944.47 F500.0
+G1 X86.37000 Y207.17000 Z6.00000 J947.99 F500.0
+G1 X86.37000 Y211.37000 Z6.00000 J952.11 F500.0
+G1 X89.48000 Y213.17000 Z6.00000 J955.63 F500.0
+G1 X89.48000 Y217.37000 Z6.00000 J959.75 F500.0
+G1 X86.37000 Y219.17000 Z6.00000 J963.27 F500.0
+G1 X86.37000 Y223.37000 Z6.00000 J967.39 F500.0
+G1 X89.48000 Y225.17000 Z6.00000 J970.91 F500.0
+G1 X89.48000 Y229.37000 Z6.00000 J975.02 F500.0
+G1 X86.37000 Y231.17000 Z6.00000 J978.54 F500.0
+G1 X86.37000 Y235.37000 Z6.00000 J982.66 F500.0
+G1 X88.44000 Y236.57000 Z6.00000 J985.01 F500.0
+G1 X90.87000 Y236.57000 Z6.00000 J987.39 F500.0
+G1 X92.95000 Y235.37000 Z6.00000 J989.74 F500.0
+G1 X92.95000 Y231.17000 Z6.00000 J993.86 F500.0
+G1 X89.83000 Y229.37000 Z6.00000 J997.39 F500.0
+G1 X89.83000 Y225.17000 Z6.00000 J1001.50 F500.0
+G1 X92.95000 Y223.37000 Z6.00000 J1005.03 F500.0
+G1 X92.95000 Y219.17000 Z6.00000 J1009.15 F500.0
+G1 X89.83000 Y217.37000 Z6.00000 J1012.68 F500.0
+G1 X89.83000 Y213.17000 Z6.00000 J1016.79 F500.0
+G1 X92.95000 Y211.37000 Z6.00000 J1020.32 F500.0
+G1 X92.95000 Y207.17000 Z6.00000 J1024.44 F500.0
+G1 X89.83000 Y205.37000 Z6.00000 J1027.97 F500.0
+G1 X89.83000 Y203.33000 Z6.00000 J1029.97 F500.0
+G1 X96.41000 Y203.33000 Z6.00000 J1036.42 F500.0
+G1 X96.41000 Y205.37000 Z6.00000 J1038.42 F500.0
+G1 X93.29000 Y207.17000 Z6.00000 J1041.95 F500.0
+G1 X93.29000 Y211.37000 Z6.00000 J1046.06 F500.0
+G1 X96.41000 Y213.17000 Z6.00000 J1049.59 F500.0
+G1 X96.41000 Y217.37000 Z6.00000 J1053.71 F500.0
+G1 X93.29000 Y219.17000 Z6.00000 J1057.24 F500.0
+G1 X93.29000 Y223.37000 Z6.00000 J1061.35 F500.0
+G1 X96.41000 Y225.17000 Z6.00000 J1064.88 F500.0
+G1 X96.41000 Y229.37000 Z6.00000 J1069.00 F500.0
+G1 X93.29000 Y231.17000 Z6.00000 J1072.53 F500.0
+G1 X93.29000 Y232.77000 Z6.00000 J1079.10 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X93.29000 Y235.37000 Z6.00000 J1079.10 F800.0
+G1 X95.37000 Y236.57000 Z6.00000 J1079.10 F800.0
+G1 X95.37000 Y236.57000 Z16.00000 J1079.10 F800.0
+G1 X70.59000 Y198.89000 Z16.00000 J1089.10 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X75.59000 Y203.89000 Z7.00000 J0.00 F300.0
+G1 X96.11000 Y203.89000 Z7.00000 J20.11 F300.0
+G1 X96.11000 Y229.69000 Z7.00000 J45.39 F300.0
+G1 X96.11000 Y236.01000 Z7.00000 J51.59 F300.0
+G1 X44.51000 Y236.01000 Z7.00000 J102.16 F500.0
+G1 X23.99000 Y236.01000 Z7.00000 J122.26 F500.0
+G1 X23.99000 Y210.21000 Z7.00000 J147.55 F500.0
+G1 X23.99000 Y203.89000 Z7.00000 J153.74 F500.0
+G1 X70.59000 Y203.89000 Z7.00000 J204.41 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X75.59000 Y203.89000 Z7.00000 J204.41 F800.0
+G1 X75.59000 Y203.89000 Z17.00000 J204.41 F800.0
+G1 X70.59000 Y198.89000 Z17.00000 J214.41 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X75.59000 Y203.89000 Z7.00000 J0.00 F300.0
+G1 X27.13000 Y203.89000 Z7.00000 J47.49 F300.0
+G1 X27.13000 Y205.37000 Z7.00000 J48.94 F300.0
+G1 X24.01000 Y207.17000 Z7.00000 J52.47 F300.0
+G1 X24.01000 Y211.37000 Z7.00000 J56.59 F500.0
+G1 X27.13000 Y213.17000 Z7.00000 J60.12 F500.0
+G1 X27.13000 Y217.37000 Z7.00000 J64.23 F500.0
+G1 X24.01000 Y219.17000 Z7.00000 J67.76 F500.0
+G1 X24.01000 Y223.37000 Z7.00000 J71.88 F500.0
+G1 X27.13000 Y225.17000 Z7.00000 J75.41 F500.0
+G1 X27.13000 Y229.37000 Z7.00000 J79.53 F500.0
+G1 X24.01000 Y231.17000 Z7.00000 J83.06 F500.0
+G1 X24.01000 Y235.37000 Z7.00000 J87.17 F500.0
+G1 X25.13000 Y236.01000 Z7.00000 J88.44 F500.0
+G1 X29.48000 Y236.01000 Z7.00000 J92.70 F500.0
+G1 X30.59000 Y235.37000 Z7.00000 J93.95 F500.0
+G1 X30.59000 Y231.17000 Z7.00000 J98.07 F500.0
+G1 X27.48000 Y229.37000 Z7.00000 J101.59 F500.0
+G1 X27.48000 Y225.17000 Z7.00000 J105.71 F500.0
+G1 X30.59000 Y223.37000 Z7.00000 J109.23 F500.0
+G1 X30.59000 Y219.17000 Z7.00000 J113.35 F500.0
+G1 X27.48000 Y217.37000 Z7.00000 J116.87 F500.0
+G1 X27.48000 Y213.17000 Z7.00000 J120.98 F500.0
+G1 X30.59000 Y211.37000 Z7.00000 J124.50 F500.0
+G1 X30.59000 Y207.17000 Z7.00000 J128.62 F500.0
+G1 X27.48000 Y205.37000 Z7.00000 J132.14 F500.0
+G1 X27.48000 Y203.89000 Z7.00000 J133.59 F500.0
+G1 X34.06000 Y203.89000 Z7.00000 J140.04 F500.0
+G1 X34.06000 Y205.37000 Z7.00000 J141.49 F500.0
+G1 X30.94000 Y207.17000 Z7.00000 J145.02 F500.0
+G1 X30.94000 Y211.37000 Z7.00000 J149.14 F500.0
+G1 X34.06000 Y213.17000 Z7.00000 J152.67 F500.0
+G1 X34.06000 Y217.37000 Z7.00000 J156.78 F500.0
+G1 X30.94000 Y219.17000 Z7.00000 J160.31 F500.0
+G1 X30.94000 Y223.37000 Z7.00000 J164.43 F500.0
+G1 X34.06000 Y225.17000 Z7.00000 J167.96 F500.0
+G1 X34.06000 Y229.37000 Z7.00000 J172.07 F500.0
+G1 X30.94000 Y231.17000 Z7.00000 J175.60 F500.0
+G1 X30.94000 Y235.37000 Z7.00000 J179.72 F500.0
+G1 X32.06000 Y236.01000 Z7.00000 J180.98 F500.0
+G1 X36.41000 Y236.01000 Z7.00000 J185.25 F500.0
+G1 X37.52000 Y235.37000 Z7.00000 J186.50 F500.0
+G1 X37.52000 Y231.17000 Z7.00000 J190.62 F500.0
+G1 X34.40000 Y229.37000 Z7.00000 J194.15 F500.0
+G1 X34.40000 Y225.17000 Z7.00000 J198.27 F500.0
+G1 X37.52000 Y223.37000 Z7.00000 J201.80 F500.0
+G1 X37.52000 Y219.17000 Z7.00000 J205.91 F500.0
+G1 X34.40000 Y217.37000 Z7.00000 J209.44 F500.0
+G1 X34.40000 Y213.17000 Z7.00000 J213.56 F500.0
+G1 X37.52000 Y211.37000 Z7.00000 J217.09 F500.0
+G1 X37.52000 Y207.17000 Z7.00000 J221.20 F500.0
+G1 X34.40000 Y205.37000 Z7.00000 J224.73 F500.0
+G1 X34.40000 Y203.89000 Z7.00000 J226.18 F500.0
+G1 X40.99000 Y203.89000 Z7.00000 J232.64 F500.0
+G1 X40.99000 Y205.37000 Z7.00000 J234.09 F500.0
+G1 X37.87000 Y207.17000 Z7.00000 J237.62 F500.0
+G1 X37.87000 Y211.37000 Z7.00000 J241.74 F500.0
+G1 X40.99000 Y213.17000 Z7.00000 J245.27 F500.0
+G1 X40.99000 Y217.37000 Z7.00000 J249.38 F500.0
+G1 X37.87000 Y219.17000 Z7.00000 J252.91 F500.0
+G1 X37.87000 Y223.37000 Z7.00000 J257.03 F500.0
+G1 X40.99000 Y225.17000 Z7.00000 J260.56 F500.0
+G1 X40.99000 Y229.37000 Z7.00000 J264.68 F500.0
+G1 X37.87000 Y231.17000 Z7.00000 J268.21 F500.0
+G1 X37.87000 Y235.37000 Z7.00000 J272.32 F500.0
+G1 X38.99000 Y236.01000 Z7.00000 J273.59 F500.0
+G1 X43.33000 Y236.01000 Z7.00000 J277.84 F500.0
+G1 X44.45000 Y235.37000 Z7.00000 J279.10 F500.0
+G1 X44.45000 Y231.17000 Z7.00000 J283.22 F500.0
+G1 X41.33000 Y229.37000 Z7.00000 J286.75 F500.0
+G1 X41.33000 Y225.17000 Z7.00000 J290.87 F500.0
+G1 X44.45000 Y223.37000 Z7.00000 J294.40 F500.0
+G1 X44.45000 Y219.17000 Z7.00000 J298.51 F500.0
+G1 X41.33000 Y217.37000 Z7.00000 J302.04 F500.0
+G1 X41.33000 Y213.17000 Z7.00000 J306.16 F500.0
+G1 X44.45000 Y211.37000 Z7.00000 J309.69 F500.0
+G1 X44.45000 Y207.17000 Z7.00000 J313.80 F500.0
+G1 X41.33000 Y205.37000 Z7.00000 J317.33 F500.0
+G1 X41.33000 Y203.89000 Z7.00000 J318.78 F500.0
+G1 X47.91000 Y203.89000 Z7.00000 J325.23 F500.0
+G1 X47.91000 Y205.37000 Z7.00000 J326.68 F500.0
+G1 X44.80000 Y207.17000 Z7.00000 J330.20 F500.0
+G1 X44.80000 Y211.37000 Z7.00000 J334.32 F500.0
+G1 X47.91000 Y213.17000 Z7.00000 J337.84 F500.0
+G1 X47.91000 Y217.37000 Z7.00000 J341.96 F500.0
+G1 X44.80000 Y219.17000 Z7.00000 J345.48 F500.0
+G1 X44.80000 Y223.37000 Z7.00000 J349.59 F500.0
+G1 X47.91000 Y225.17000 Z7.00000 J353.12 F500.0
+G1 X47.91000 Y229.37000 Z7.00000 J357.23 F500.0
+G1 X44.80000 Y231.17000 Z7.00000 J360.75 F500.0
+G1 X44.80000 Y235.37000 Z7.00000 J364.87 F500.0
+G1 X45.91000 Y236.01000 Z7.00000 J366.13 F500.0
+G1 X50.26000 Y236.01000 Z7.00000 J370.39 F500.0
+G1 X51.38000 Y235.37000 Z7.00000 J371.65 F500.0
+G1 X51.38000 Y231.17000 Z7.00000 J375.77 F500.0
+G1 X48.26000 Y229.37000 Z7.00000 J379.30 F500.0
+G1 X48.26000 Y225.17000 Z7.00000 J383.41 F500.0
+G1 X51.38000 Y223.37000 Z7.00000 J386.94 F500.0
+G1 X51.38000 Y219.17000 Z7.00000 J391.06 F500.0
+G1 X48.26000 Y217.37000 Z7.00000 J394.59 F500.0
+G1 X48.26000 Y213.17000 Z7.00000 J398.71 F500.0
+G1 X51.38000 Y211.37000 Z7.00000 J402.24 F500.0
+G1 X51.38000 Y207.17000 Z7.00000 J406.35 F500.0
+G1 X48.26000 Y205.37000 Z7.00000 J409.88 F500.0
+G1 X48.26000 Y203.89000 Z7.00000 J411.33 F500.0
+G1 X54.84000 Y203.89000 Z7.00000 J417.78 F500.0
+G1 X54.84000 Y205.37000 Z7.00000 J419.23 F500.0
+G1 X51.73000 Y207.17000 Z7.00000 J422.75 F500.0
+G1 X51.73000 Y211.37000 Z7.00000 J426.87 F500.0
+G1 X54.84000 Y213.17000 Z7.00000 J430.39 F500.0
+G1 X54.84000 Y217.37000 Z7.00000 J434.51 F500.0
+G1 X51.73000 Y219.17000 Z7.00000 J438.03 F500.0
+G1 X51.73000 Y223.37000 Z7.00000 J442.14 F500.0
+G1 X54.84000 Y225.17000 Z7.00000 J445.67 F500.0
+G1 X54.84000 Y229.37000 Z7.00000 J449.78 F500.0
+G1 X51.73000 Y231.17000 Z7.00000 J453.30 F500.0
+G1 X51.73000 Y235.37000 Z7.00000 J457.42 F500.0
+G1 X52.84000 Y236.01000 Z7.00000 J458.67 F500.0
+G1 X57.19000 Y236.01000 Z7.00000 J462.94 F500.0
+G1 X58.31000 Y235.37000 Z7.00000 J464.20 F500.0
+G1 X58.31000 Y231.17000 Z7.00000 J468.32 F500.0
+G1 X55.19000 Y229.37000 Z7.00000 J471.85 F500.0
+G1 X55.19000 Y225.17000 Z7.00000 J475.96 F500.0
+G1 X58.31000 Y223.37000 Z7.00000 J479.49 F500.0
+G1 X58.31000 Y219.17000 Z7.00000 J483.61 F500.0
+G1 X55.19000 Y217.37000 Z7.00000 J487.14 F500.0
+G1 X55.19000 Y213.17000 Z7.00000 J491.26 F500.0
+G1 X58.31000 Y211.37000 Z7.00000 J494.79 F500.0
+G1 X58.31000 Y207.17000 Z7.00000 J498.90 F500.0
+G1 X55.19000 Y205.37000 Z7.00000 J502.43 F500.0
+G1 X55.19000 Y203.89000 Z7.00000 J503.88 F500.0
+G1 X61.77000 Y203.89000 Z7.00000 J510.33 F500.0
+G1 X61.77000 Y205.37000 Z7.00000 J511.78 F500.0
+G1 X58.65000 Y207.17000 Z7.00000 J515.31 F500.0
+G1 X58.65000 Y211.37000 Z7.00000 J519.43 F500.0
+G1 X61.77000 Y213.17000 Z7.00000 J522.96 F500.0
+G1 X61.77000 Y217.37000 Z7.00000 J527.07 F500.0
+G1 X58.65000 Y219.17000 Z7.00000 J530.60 F500.0
+G1 X58.65000 Y223.37000 Z7.00000 J534.72 F500.0
+G1 X61.77000 Y225.17000 Z7.00000 J538.25 F500.0
+G1 X61.77000 Y229.37000 Z7.00000 J542.36 F500.0
+G1 X58.65000 Y231.17000 Z7.00000 J545.89 F500.0
+G1 X58.65000 Y235.37000 Z7.00000 J550.01 F500.0
+G1 X59.77000 Y236.01000 Z7.00000 J551.27 F500.0
+G1 X64.12000 Y236.01000 Z7.00000 J555.54 F500.0
+G1 X65.23000 Y235.37000 Z7.00000 J556.79 F500.0
+G1 X65.23000 Y231.17000 Z7.00000 J560.91 F500.0
+G1 X62.12000 Y229.37000 Z7.00000 J564.43 F500.0
+G1 X62.12000 Y225.17000 Z7.00000 J568.55 F500.0
+G1 X65.23000 Y223.37000 Z7.00000 J572.07 F500.0
+G1 X65.23000 Y219.17000 Z7.00000 J576.18 F500.0
+G1 X62.12000 Y217.37000 Z7.00000 J579.71 F500.0
+G1 X62.12000 Y213.17000 Z7.00000 J583.82 F500.0
+G1 X65.23000 Y211.37000 Z7.00000 J587.34 F500.0
+G1 X65.23000 Y207.17000 Z7.00000 J591.46 F500.0
+G1 X62.12000 Y205.37000 Z7.00000 J594.98 F500.0
+G1 X62.12000 Y203.89000 Z7.00000 J596.43 F500.0
+G1 X68.70000 Y203.89000 Z7.00000 J602.88 F500.0
+G1 X68.70000 Y205.37000 Z7.00000 J604.33 F500.0
+G1 X65.58000 Y207.17000 Z7.00000 J607.86 F500.0
+G1 X65.58000 Y211.37000 Z7.00000 J611.98 F500.0
+G1 X68.70000 Y213.17000 Z7.00000 J615.51 F500.0
+G1 X68.70000 Y217.37000 Z7.00000 J619.62 F500.0
+G1 X65.58000 Y219.17000 Z7.00000 J623.15 F500.0
+G1 X65.58000 Y223.37000 Z7.00000 J627.27 F500.0
+G1 X68.70000 Y225.17000 Z7.00000 J630.80 F500.0
+G1 X68.70000 Y229.37000 Z7.00000 J634.91 F500.0
+G1 X65.58000 Y231.17000 Z7.00000 J638.44 F500.0
+G1 X65.58000 Y235.37000 Z7.00000 J642.56 F500.0
+G1 X66.70000 Y236.01000 Z7.00000 J643.82 F500.0
+G1 X71.05000 Y236.01000 Z7.00000 J648.09 F500.0
+G1 X72.16000 Y235.37000 Z7.00000 J649.34 F500.0
+G1 X72.16000 Y231.17000 Z7.00000 J653.46 F500.0
+G1 X69.04000 Y229.37000 Z7.00000 J656.99 F500.0
+G1 X69.04000 Y225.17000 Z7.00000 J661.10 F500.0
+G1 X72.16000 Y223.37000 Z7.00000 J664.63 F500.0
+G1 X72.16000 Y219.17000 Z7.00000 J668.75 F500.0
+G1 X69.04000 Y217.37000 Z7.00000 J672.28 F500.0
+G1 X69.04000 Y213.17000 Z7.00000 J676.40 F500.0
+G1 X72.16000 Y211.37000 Z7.00000 J679.93 F500.0
+G1 X72.16000 Y207.17000 Z7.00000 J684.04 F500.0
+G1 X69.04000 Y205.37000 Z7.00000 J687.57 F500.0
+G1 X69.04000 Y203.89000 Z7.00000 J689.02 F500.0
+G1 X75.63000 Y203.89000 Z7.00000 J695.48 F500.0
+G1 X75.63000 Y205.37000 Z7.00000 J696.93 F500.0
+G1 X72.51000 Y207.17000 Z7.00000 J700.46 F500.0
+G1 X72.51000 Y211.37000 Z7.00000 J704.58 F500.0
+G1 X75.63000 Y213.17000 Z7.00000 J708.11 F500.0
+G1 X75.63000 Y217.37000 Z7.00000 J712.22 F500.0
+G1 X72.51000 Y219.17000 Z7.00000 J715.75 F500.0
+G1 X72.51000 Y223.37000 Z7.00000 J719.87 F500.0
+G1 X75.63000 Y225.17000 Z7.00000 J723.40 F500.0
+G1 X75.63000 Y229.37000 Z7.00000 J727.52 F500.0
+G1 X72.51000 Y231.17000 Z7.00000 J731.05 F500.0
+G1 X72.51000 Y235.37000 Z7.00000 J735.16 F500.0
+G1 X73.63000 Y236.01000 Z7.00000 J736.43 F500.0
+G1 X77.98000 Y236.01000 Z7.00000 J740.69 F500.0
+G1 X79.09000 Y235.37000 Z7.00000 J741.94 F500.0
+G1 X79.09000 Y231.17000 Z7.00000 J746.06 F500.0
+G1 X75.97000 Y229.37000 Z7.00000 J749.59 F500.0
+G1 X75.97000 Y225.17000 Z7.00000 J753.71 F500.0
+G1 X79.09000 Y223.37000 Z7.00000 J757.24 F500.0
+G1 X79.09000 Y219.17000 Z7.00000 J761.35 F500.0
+G1 X75.97000 Y217.37000 Z7.00000 J764.88 F500.0
+G1 X75.97000 Y213.17000 Z7.00000 J769.00 F500.0
+G1 X79.09000 Y211.37000 Z7.00000 J772.53 F500.0
+G1 X79.09000 Y207.17000 Z7.00000 J776.64 F500.0
+G1 X75.97000 Y205.37000 Z7.00000 J780.17 F500.0
+G1 X75.97000 Y203.89000 Z7.00000 J781.62 F500.0
+G1 X82.55000 Y203.89000 Z7.00000 J788.07 F500.0
+G1 X82.55000 Y205.37000 Z7.00000 J789.52 F500.0
+G1 X79.44000 Y207.17000 Z7.00000 J793.04 F500.0
+G1 X79.44000 Y211.37000 Z7.00000 J797.16 F500.0
+G1 X82.55000 Y213.17000 Z7.00000 J800.68 F500.0
+G1 X82.55000 Y217.37000 Z7.00000 J804.80 F500.0
+G1 X79.44000 Y219.17000 Z7.00000 J808.32 F500.0
+G1 X79.44000 Y223.37000 Z7.00000 J812.44 F500.0
+G1 X82.55000 Y225.17000 Z7.00000 J815.96 F500.0
+G1 X82.55000 Y229.37000 Z7.00000 J820.07 F500.0
+G1 X79.44000 Y231.17000 Z7.00000 J823.59 F500.0
+G1 X79.44000 Y235.37000 Z7.00000 J827.71 F500.0
+G1 X80.55000 Y236.01000 Z7.00000 J828.97 F500.0
+G1 X84.90000 Y236.01000 Z7.00000 J833.23 F500.0
+G1 X86.02000 Y235.37000 Z7.00000 J834.49 F500.0
+G1 X86.02000 Y231.17000 Z7.00000 J838.61 F500.0
+G1 X82.90000 Y229.37000 Z7.00000 J842.14 F500.0
+G1 X82.90000 Y225.17000 Z7.00000 J846.26 F500.0
+G1 X86.02000 Y223.37000 Z7.00000 J849.79 F500.0
+G1 X86.02000 Y219.17000 Z7.00000 J853.90 F500.0
+G1 X82.90000 Y217.37000 Z7.00000 J857.43 F500.0
+G1 X82.90000 Y213.17000 Z7.00000 J861.55 F500.0
+G1 X86.02000 Y211.37000 Z7.00000 J865.08 F500.0
+G1 X86.02000 Y207.17000 Z7.00000 J869.19 F500.0
+G1 X82.90000 Y205.37000 Z7.00000 J872.72 F500.0
+G1 X82.90000 Y203.89000 Z7.00000 J874.17 F500.0
+G1 X89.48000 Y203.89000 Z7.00000 J880.62 F500.0
+G1 X89.48000 Y205.37000 Z7.00000 J882.07 F500.0
+G1 X86.37000 Y207.17000 Z7.00000 J885.59 F500.0
+G1 X86.37000 Y211.37000 Z7.00000 J889.71 F500.0
+G1 X89.48000 Y213.17000 Z7.00000 J893.23 F500.0
+G1 X89.48000 Y217.37000 Z7.00000 J897.35 F500.0
+G1 X86.37000 Y219.17000 Z7.00000 J900.87 F500.0
+G1 X86.37000 Y223.37000 Z7.00000 J904.98 F500.0
+G1 X89.48000 Y225.17000 Z7.00000 J908.51 F500.0
+G1 X89.48000 Y229.37000 Z7.00000 J912.62 F500.0
+G1 X86.37000 Y231.17000 Z7.00000 J916.14 F500.0
+G1 X86.37000 Y235.37000 Z7.00000 J920.26 F500.0
+G1 X87.48000 Y236.01000 Z7.00000 J921.52 F500.0
+G1 X91.83000 Y236.01000 Z7.00000 J925.78 F500.0
+G1 X92.95000 Y235.37000 Z7.00000 J927.04 F500.0
+G1 X92.95000 Y231.17000 Z7.00000 J931.16 F500.0
+G1 X89.83000 Y229.37000 Z7.00000 J934.69 F500.0
+G1 X89.83000 Y225.17000 Z7.00000 J938.80 F500.0
+G1 X92.95000 Y223.37000 Z7.00000 J942.33 F500.0
+G1 X92.95000 Y219.17000 Z7.00000 J946.45 F500.0
+G1 X89.83000 Y217.37000 Z7.00000 J949.98 F500.0
+G1 X89.83000 Y213.17000 Z7.00000 J954.10 F500.0
+G1 X92.95000 Y211.37000 Z7.00000 J957.63 F500.0
+G1 X92.95000 Y207.17000 Z7.00000 J961.74 F500.0
+G1 X89.83000 Y205.37000 Z7.00000 J965.27 F500.0
+G1 X89.83000 Y203.89000 Z7.00000 J966.72 F500.0
+G1 X96.11000 Y205.54000 Z7.00000 J973.09 F500.0
+G1 X93.29000 Y207.17000 Z7.00000 J976.28 F500.0
+G1 X93.29000 Y211.37000 Z7.00000 J980.39 F500.0
+G1 X96.11000 Y213.00000 Z7.00000 J983.59 F500.0
+G1 X96.11000 Y217.54000 Z7.00000 J988.04 F500.0
+G1 X93.29000 Y219.17000 Z7.00000 J991.23 F500.0
+G1 X93.29000 Y223.37000 Z7.00000 J995.34 F500.0
+G1 X96.11000 Y225.00000 Z7.00000 J998.54 F500.0
+G1 X96.11000 Y229.54000 Z7.00000 J1002.98 F500.0
+G1 X93.29000 Y231.17000 Z7.00000 J1006.18 F500.0
+G1 X93.29000 Y231.66000 Z7.00000 J1011.66 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X93.29000 Y235.37000 Z7.00000 J1011.66 F800.0
+G1 X94.41000 Y236.01000 Z7.00000 J1011.66 F800.0
+G1 X94.41000 Y236.01000 Z17.00000 J1011.66 F800.0
+G1 X67.14000 Y199.44000 Z17.00000 J1021.66 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X72.14000 Y204.44000 Z8.00000 J0.00 F300.0
+G1 X95.56000 Y204.44000 Z8.00000 J22.95 F300.0
+G1 X95.56000 Y228.24000 Z8.00000 J46.28 F300.0
+G1 X95.56000 Y235.46000 Z8.00000 J53.35 F300.0
+G1 X47.96000 Y235.46000 Z8.00000 J100.00 F500.0
+G1 X24.54000 Y235.46000 Z8.00000 J122.95 F500.0
+G1 X24.54000 Y211.66000 Z8.00000 J146.27 F500.0
+G1 X24.54000 Y204.44000 Z8.00000 J153.35 F500.0
+G1 X67.14000 Y204.44000 Z8.00000 J200.10 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X72.14000 Y204.44000 Z8.00000 J200.10 F800.0
+G1 X72.14000 Y204.44000 Z18.00000 J200.10 F800.0
+G1 X67.14000 Y199.44000 Z18.00000 J210.10 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X72.14000 Y204.44000 Z8.00000 J0.00 F300.0
+G1 X27.13000 Y204.44000 Z8.00000 J44.11 F300.0
+G1 X27.13000 Y205.37000 Z8.00000 J45.02 F300.0
+G1 X24.54000 Y206.86000 Z8.00000 J47.95 F300.0
+G1 X24.54000 Y211.67000 Z8.00000 J52.66 F500.0
+G1 X27.13000 Y213.17000 Z8.00000 J55.59 F500.0
+G1 X27.13000 Y217.37000 Z8.00000 J59.71 F500.0
+G1 X24.54000 Y218.86000 Z8.00000 J62.64 F500.0
+G1 X24.54000 Y223.67000 Z8.00000 J67.35 F500.0
+G1 X27.13000 Y225.17000 Z8.00000 J70.29 F500.0
+G1 X27.13000 Y229.37000 Z8.00000 J74.40 F500.0
+G1 X24.54000 Y230.86000 Z8.00000 J77.33 F500.0
+G1 X30.44000 Y235.46000 Z8.00000 J84.66 F500.0
+G1 X30.59000 Y235.37000 Z8.00000 J84.83 F500.0
+G1 X30.59000 Y231.17000 Z8.00000 J88.95 F500.0
+G1 X27.48000 Y229.37000 Z8.00000 J92.47 F500.0
+G1 X27.48000 Y225.17000 Z8.00000 J96.59 F500.0
+G1 X30.59000 Y223.37000 Z8.00000 J100.11 F500.0
+G1 X30.59000 Y219.17000 Z8.00000 J104.22 F500.0
+G1 X27.48000 Y217.37000 Z8.00000 J107.75 F500.0
+G1 X27.48000 Y213.17000 Z8.00000 J111.86 F500.0
+G1 X30.59000 Y211.37000 Z8.00000 J115.38 F500.0
+G1 X30.59000 Y207.17000 Z8.00000 J119.50 F500.0
+G1 X27.48000 Y205.37000 Z8.00000 J123.02 F500.0
+G1 X27.48000 Y204.44000 Z8.00000 J123.93 F500.0
+G1 X34.06000 Y204.44000 Z8.00000 J130.38 F500.0
+G1 X34.06000 Y205.37000 Z8.00000 J131.29 F500.0
+G1 X30.94000 Y207.17000 Z8.00000 J134.82 F500.0
+G1 X30.94000 Y211.37000 Z8.00000 J138.94 F500.0
+G1 X34.06000 Y213.17000 Z8.00000 J142.47 F500.0
+G1 X34.06000 Y217.37000 Z8.00000 J146.58 F500.0
+G1 X30.94000 Y219.17000 Z8.00000 J150.11 F500.0
+G1 X30.94000 Y223.37000 Z8.00000 J154.23 F500.0
+G1 X34.06000 Y225.17000 Z8.00000 J157.76 F500.0
+G1 X34.06000 Y229.37000 Z8.00000 J161.88 F500.0
+G1 X30.94000 Y231.17000 Z8.00000 J165.41 F500.0
+G1 X30.94000 Y235.37000 Z8.00000 J169.52 F500.0
+G1 X31.10000 Y235.46000 Z8.00000 J169.70 F500.0
+G1 X37.36000 Y235.46000 Z8.00000 J175.84 F500.0
+G1 X37.52000 Y235.37000 Z8.00000 J176.02 F500.0
+G1 X37.52000 Y231.17000 Z8.00000 J180.13 F500.0
+G1 X34.40000 Y229.37000 Z8.00000 J183.66 F500.0
+G1 X34.40000 Y225.17000 Z8.00000 J187.78 F500.0
+G1 X37.52000 Y223.37000 Z8.00000 J191.31 F500.0
+G1 X37.52000 Y219.17000 Z8.00000 J195.42 F500.0
+G1 X34.40000 Y217.37000 Z8.00000 J198.95 F500.0
+G1 X34.40000 Y213.17000 Z8.00000 J203.07 F500.0
+G1 X37.52000 Y211.37000 Z8.00000 J206.60 F500.0
+G1 X37.52000 Y207.17000 Z8.00000 J210.72 F500.0
+G1 X34.40000 Y205.37000 Z8.00000 J214.25 F500.0
+G1 X34.40000 Y204.44000 Z8.00000 J215.16 F500.0
+G1 X40.99000 Y204.44000 Z8.00000 J221.62 F500.0
+G1 X40.99000 Y205.37000 Z8.00000 J222.53 F500.0
+G1 X37.87000 Y207.17000 Z8.00000 J226.06 F500.0
+G1 X37.87000 Y211.37000 Z8.00000 J230.17 F500.0
+G1 X40.99000 Y213.17000 Z8.00000 J233.70 F500.0
+G1 X40.99000 Y217.37000 Z8.00000 J237.82 F500.0
+G1 X37.87000 Y219.17000 Z8.00000 J241.35 F500.0
+G1 X37.87000 Y223.37000 Z8.00000 J245.47 F500.0
+G1 X40.99000 Y225.17000 Z8.00000 J248.99 F500.0
+G1 X40.99000 Y229.37000 Z8.00000 J253.11 F500.0
+G1 X37.87000 Y231.17000 Z8.00000 J256.64 F500.0
+G1 X37.87000 Y235.37000 Z8.00000 J260.76 F500.0
+G1 X38.03000 Y235.46000 Z8.00000 J260.94 F500.0
+G1 X44.29000 Y235.46000 Z8.00000 J267.07 F500.0
+G1 X44.45000 Y235.37000 Z8.00000 J267.25 F500.0
+G1 X44.45000 Y231.17000 Z8.00000 J271.37 F500.0
+G1 X41.33000 Y229.37000 Z8.00000 J274.90 F500.0
+G1 X41.33000 Y225.17000 Z8.00000 J279.01 F500.0
+G1 X44.45000 Y223.37000 Z8.00000 J282.54 F500.0
+G1 X44.45000 Y219.17000 Z8.00000 J286.66 F500.0
+G1 X41.33000 Y217.37000 Z8.00000 J290.19 F500.0
+G1 X41.33000 Y213.17000 Z8.00000 J294.31 F500.0
+G1 X44.45000 Y211.37000 Z8.00000 J297.84 F500.0
+G1 X44.45000 Y207.17000 Z8.00000 J301.95 F500.0
+G1 X41.33000 Y205.37000 Z8.00000 J305.48 F500.0
+G1 X41.33000 Y204.44000 Z8.00000 J306.39 F500.0
+G1 X47.91000 Y204.44000 Z8.00000 J312.84 F500.0
+G1 X47.91000 Y205.37000 Z8.00000 J313.75 F500.0
+G1 X44.80000 Y207.17000 Z8.00000 J317.27 F500.0
+G1 X44.80000 Y211.37000 Z8.00000 J321.39 F500.0
+G1 X47.91000 Y213.17000 Z8.00000 J324.91 F500.0
+G1 X47.91000 Y217.37000 Z8.00000 J329.03 F500.0
+G1 X44.80000 Y219.17000 Z8.00000 J332.55 F500.0
+G1 X44.80000 Y223.37000 Z8.00000 J336.66 F500.0
+G1 X47.91000 Y225.17000 Z8.00000 J340.19 F500.0
+G1 X47.91000 Y229.37000 Z8.00000 J344.30 F500.0
+G1 X44.80000 Y231.17000 Z8.00000 J347.82 F500.0
+G1 X44.80000 Y235.37000 Z8.00000 J351.94 F500.0
+G1 X44.95000 Y235.46000 Z8.00000 J352.11 F500.0
+G1 X51.22000 Y235.46000 Z8.00000 J358.26 F500.0
+G1 X51.38000 Y235.37000 Z8.00000 J358.44 F500.0
+G1 X51.38000 Y231.17000 Z8.00000 J362.55 F500.0
+G1 X48.26000 Y229.37000 Z8.00000 J366.08 F500.0
+G1 X48.26000 Y225.17000 Z8.00000 J370.20 F500.0
+G1 X51.38000 Y223.37000 Z8.00000 J373.73 F500.0
+G1 X51.38000 Y219.17000 Z8.00000 J377.84 F500.0
+G1 X48.26000 Y217.37000 Z8.00000 J381.37 F500.0
+G1 X48.26000 Y213.17000 Z8.00000 J385.49 F500.0
+G1 X51.38000 Y211.37000 Z8.00000 J389.02 F500.0
+G1 X51.38000 Y207.17000 Z8.00000 J393.14 F500.0
+G1 X48.26000 Y205.37000 Z8.00000 J396.67 F500.0
+G1 X48.26000 Y204.44000 Z8.00000 J397.58 F500.0
+G1 X54.84000 Y204.44000 Z8.00000 J404.03 F500.0
+G1 X54.84000 Y205.37000 Z8.00000 J404.94 F500.0
+G1 X51.73000 Y207.17000 Z8.00000 J408.46 F500.0
+G1 X51.73000 Y211.37000 Z8.00000 J412.57 F500.0
+G1 X54.84000 Y213.17000 Z8.00000 J416.10 F500.0
+G1 X54.84000 Y217.37000 Z8.00000 J420.21 F500.0
+G1 X51.73000 Y219.17000 Z8.00000 J423.73 F500.0
+G1 X51.73000 Y223.37000 Z8.00000 J427.85 F500.0
+G1 X54.84000 Y225.17000 Z8.00000 J431.37 F500.0
+G1 X54.84000 Y229.37000 Z8.00000 J435.49 F500.0
+G1 X51.73000 Y231.17000 Z8.00000 J439.01 F500.0
+G1 X51.73000 Y235.37000 Z8.00000 J443.12 F500.0
+G1 X51.88000 Y235.46000 Z8.00000 J443.30 F500.0
+G1 X58.15000 Y235.46000 Z8.00000 J449.44 F500.0
+G1 X58.31000 Y235.37000 Z8.00000 J449.62 F500.0
+G1 X58.31000 Y231.17000 Z8.00000 J453.74 F500.0
+G1 X55.19000 Y229.37000 Z8.00000 J457.27 F500.0
+G1 X55.19000 Y225.17000 Z8.00000 J461.38 F500.0
+G1 X58.31000 Y223.37000 Z8.00000 J464.91 F500.0
+G1 X58.31000 Y219.17000 Z8.00000 J469.03 F500.0
+G1 X55.19000 Y217.37000 Z8.00000 J472.56 F500.0
+G1 X55.19000 Y213.17000 Z8.00000 J476.67 F500.0
+G1 X58.31000 Y211.37000 Z8.00000 J480.20 F500.0
+G1 X58.31000 Y207.17000 Z8.00000 J484.32 F500.0
+G1 X55.19000 Y205.37000 Z8.00000 J487.85 F500.0
+G1 X55.19000 Y204.44000 Z8.00000 J488.76 F500.0
+G1 X61.77000 Y204.44000 Z8.00000 J495.21 F500.0
+G1 X61.77000 Y205.37000 Z8.00000 J496.12 F500.0
+G1 X58.65000 Y207.17000 Z8.00000 J499.65 F500.0
+G1 X58.65000 Y211.37000 Z8.00000 J503.77 F500.0
+G1 X61.77000 Y213.17000 Z8.00000 J507.30 F500.0
+G1 X61.77000 Y217.37000 Z8.00000 J511.41 F500.0
+G1 X58.65000 Y219.17000 Z8.00000 J514.94 F500.0
+G1 X58.65000 Y223.37000 Z8.00000 J519.06 F500.0
+G1 X61.77000 Y225.17000 Z8.00000 J522.59 F500.0
+G1 X61.77000 Y229.37000 Z8.00000 J526.70 F500.0
+G1 X58.65000 Y231.17000 Z8.00000 J530.23 F500.0
+G1 X58.65000 Y235.37000 Z8.00000 J534.35 F500.0
+G1 X58.81000 Y235.46000 Z8.00000 J534.53 F500.0
+G1 X65.08000 Y235.46000 Z8.00000 J540.68 F500.0
+G1 X65.23000 Y235.37000 Z8.00000 J540.85 F500.0
+G1 X65.23000 Y231.17000 Z8.00000 J544.96 F500.0
+G1 X62.12000 Y229.37000 Z8.00000 J548.48 F500.0
+G1 X62.12000 Y225.17000 Z8.00000 J552.60 F500.0
+G1 X65.23000 Y223.37000 Z8.00000 J556.12 F500.0
+G1 X65.23000 Y219.17000 Z8.00000 J560.24 F500.0
+G1 X62.12000 Y217.37000 Z8.00000 J563.76 F500.0
+G1 X62.12000 Y213.17000 Z8.00000 J567.88 F500.0
+G1 X65.23000 Y211.37000 Z8.00000 J571.40 F500.0
+G1 X65.23000 Y207.17000 Z8.00000 J575.51 F500.0
+G1 X62.12000 Y205.37000 Z8.00000 J579.03 F500.0
+G1 X62.12000 Y204.44000 Z8.00000 J579.95 F500.0
+G1 X68.70000 Y204.44000 Z8.00000 J586.39 F500.0
+G1 X68.70000 Y205.37000 Z8.00000 J587.31 F500.0
+G1 X65.58000 Y207.17000 Z8.00000 J590.84 F500.0
+G1 X65.58000 Y211.37000 Z8.00000 J594.95 F500.0
+G1 X68.70000 Y213.17000 Z8.00000 J598.48 F500.0
+G1 X68.70000 Y217.37000 Z8.00000 J602.60 F500.0
+G1 X65.58000 Y219.17000 Z8.00000 J606.13 F500.0
+G1 X65.58000 Y223.37000 Z8.00000 J610.24 F500.0
+G1 X68.70000 Y225.17000 Z8.00000 J613.77 F500.0
+G1 X68.70000 Y229.37000 Z8.00000 J617.89 F500.0
+G1 X65.58000 Y231.17000 Z8.00000 J621.42 F500.0
+G1 X65.58000 Y235.37000 Z8.00000 J625.54 F500.0
+G1 X65.74000 Y235.46000 Z8.00000 J625.72 F500.0
+G1 X72.01000 Y235.46000 Z8.00000 J631.86 F500.0
+G1 X72.16000 Y235.37000 Z8.00000 J632.03 F500.0
+G1 X72.16000 Y231.17000 Z8.00000 J636.15 F500.0
+G1 X69.04000 Y229.37000 Z8.00000 J639.68 F500.0
+G1 X69.04000 Y225.17000 Z8.00000 J643.79 F500.0
+G1 X72.16000 Y223.37000 Z8.00000 J647.32 F500.0
+G1 X72.16000 Y219.17000 Z8.00000 J651.44 F500.0
+G1 X69.04000 Y217.37000 Z8.00000 J654.97 F500.0
+G1 X69.04000 Y213.17000 Z8.00000 J659.09 F500.0
+G1 X72.16000 Y211.37000 Z8.00000 J662.62 F500.0
+G1 X72.16000 Y207.17000 Z8.00000 J666.73 F500.0
+G1 X69.04000 Y205.37000 Z8.00000 J670.26 F500.0
+G1 X69.04000 Y204.44000 Z8.00000 J671.17 F500.0
+G1 X75.63000 Y204.44000 Z8.00000 J677.63 F500.0
+G1 X75.63000 Y205.37000 Z8.00000 J678.54 F500.0
+G1 X72.51000 Y207.17000 Z8.00000 J682.07 F500.0
+G1 X72.51000 Y211.37000 Z8.00000 J686.19 F500.0
+G1 X75.63000 Y213.17000 Z8.00000 J689.72 F500.0
+G1 X75.63000 Y217.37000 Z8.00000 J693.83 F500.0
+G1 X72.51000 Y219.17000 Z8.00000 J697.36 F500.0
+G1 X72.51000 Y223.37000 Z8.00000 J701.48 F500.0
+G1 X75.63000 Y225.17000 Z8.00000 J705.01 F500.0
+G1 X75.63000 Y229.37000 Z8.00000 J709.13 F500.0
+G1 X72.51000 Y231.17000 Z8.00000 J712.66 F500.0
+G1 X72.51000 Y235.37000 Z8.00000 J716.77 F500.0
+G1 X72.67000 Y235.46000 Z8.00000 J716.95 F500.0
+G1 X78.93000 Y235.46000 Z8.00000 J723.09 F500.0
+G1 X79.09000 Y235.37000 Z8.00000 J723.27 F500.0
+G1 X79.09000 Y231.17000 Z8.00000 J727.38 F500.0
+G1 X75.97000 Y229.37000 Z8.00000 J730.91 F500.0
+G1 X75.97000 Y225.17000 Z8.00000 J735.03 F500.0
+G1 X79.09000 Y223.37000 Z8.00000 J738.56 F500.0
+G1 X79.09000 Y219.17000 Z8.00000 J742.67 F500.0
+G1 X75.97000 Y217.37000 Z8.00000 J746.20 F500.0
+G1 X75.97000 Y213.17000 Z8.00000 J750.32 F500.0
+G1 X79.09000 Y211.37000 Z8.00000 J753.85 F500.0
+G1 X79.09000 Y207.17000 Z8.00000 J757.97 F500.0
+G1 X75.97000 Y205.37000 Z8.00000 J761.50 F500.0
+G1 X75.97000 Y204.44000 Z8.00000 J762.41 F500.0
+G1 X82.55000 Y204.44000 Z8.00000 J768.86 F500.0
+G1 X82.55000 Y205.37000 Z8.00000 J769.77 F500.0
+G1 X79.44000 Y207.17000 Z8.00000 J773.29 F500.0
+G1 X79.44000 Y211.37000 Z8.00000 J777.40 F500.0
+G1 X82.55000 Y213.17000 Z8.00000 J780.93 F500.0
+G1 X82.55000 Y217.37000 Z8.00000 J785.04 F500.0
+G1 X79.44000 Y219.17000 Z8.00000 J788.56 F500.0
+G1 X79.44000 Y223.37000 Z8.00000 J792.68 F500.0
+G1 X82.55000 Y225.17000 Z8.00000 J796.20 F500.0
+G1 X82.55000 Y229.37000 Z8.00000 J800.32 F500.0
+G1 X79.44000 Y231.17000 Z8.00000 J803.84 F500.0
+G1 X79.44000 Y235.37000 Z8.00000 J807.95 F500.0
+G1 X79.60000 Y235.46000 Z8.00000 J808.13 F500.0
+G1 X85.86000 Y235.46000 Z8.00000 J814.27 F500.0
+G1 X86.02000 Y235.37000 Z8.00000 J814.45 F500.0
+G1 X86.02000 Y231.17000 Z8.00000 J818.57 F500.0
+G1 X82.90000 Y229.37000 Z8.00000 J822.10 F500.0
+G1 X82.90000 Y225.17000 Z8.00000 J826.21 F500.0
+G1 X86.02000 Y223.37000 Z8.00000 J829.74 F500.0
+G1 X86.02000 Y219.17000 Z8.00000 J833.86 F500.0
+G1 X82.90000 Y217.37000 Z8.00000 J837.39 F500.0
+G1 X82.90000 Y213.17000 Z8.00000 J841.50 F500.0
+G1 X86.02000 Y211.37000 Z8.00000 J845.03 F500.0
+G1 X86.02000 Y207.17000 Z8.00000 J849.15 F500.0
+G1 X82.90000 Y205.37000 Z8.00000 J852.68 F500.0
+G1 X82.90000 Y204.44000 Z8.00000 J853.59 F500.0
+G1 X89.48000 Y204.44000 Z8.00000 J860.04 F500.0
+G1 X89.48000 Y205.37000 Z8.00000 J860.95 F500.0
+G1 X86.37000 Y207.17000 Z8.00000 J864.47 F500.0
+G1 X86.37000 Y211.37000 Z8.00000 J868.59 F500.0
+G1 X89.48000 Y213.17000 Z8.00000 J872.11 F500.0
+G1 X89.48000 Y217.37000 Z8.00000 J876.23 F500.0
+G1 X86.37000 Y219.17000 Z8.00000 J879.75 F500.0
+G1 X86.37000 Y223.37000 Z8.00000 J883.86 F500.0
+G1 X89.48000 Y225.17000 Z8.00000 J887.38 F500.0
+G1 X89.48000 Y229.37000 Z8.00000 J891.50 F500.0
+G1 X86.37000 Y231.17000 Z8.00000 J895.02 F500.0
+G1 X86.37000 Y235.37000 Z8.00000 J899.14 F500.0
+G1 X86.52000 Y235.46000 Z8.00000 J899.31 F500.0
+G1 X92.79000 Y235.46000 Z8.00000 J905.45 F500.0
+G1 X92.95000 Y235.37000 Z8.00000 J905.63 F500.0
+G1 X92.95000 Y231.17000 Z8.00000 J909.75 F500.0
+G1 X89.83000 Y229.37000 Z8.00000 J913.28 F500.0
+G1 X89.83000 Y225.17000 Z8.00000 J917.40 F500.0
+G1 X92.95000 Y223.37000 Z8.00000 J920.93 F500.0
+G1 X92.95000 Y219.17000 Z8.00000 J925.04 F500.0
+G1 X89.83000 Y217.37000 Z8.00000 J928.57 F500.0
+G1 X89.83000 Y213.17000 Z8.00000 J932.69 F500.0
+G1 X92.95000 Y211.37000 Z8.00000 J936.22 F500.0
+G1 X92.95000 Y207.17000 Z8.00000 J940.33 F500.0
+G1 X89.83000 Y205.37000 Z8.00000 J943.86 F500.0
+G1 X89.83000 Y204.44000 Z8.00000 J944.77 F500.0
+G1 X95.56000 Y205.86000 Z8.00000 J950.56 F500.0
+G1 X93.29000 Y207.17000 Z8.00000 J953.13 F500.0
+G1 X93.29000 Y211.37000 Z8.00000 J957.24 F500.0
+G1 X95.56000 Y212.68000 Z8.00000 J959.81 F500.0
+G1 X95.56000 Y217.86000 Z8.00000 J964.89 F500.0
+G1 X93.29000 Y219.17000 Z8.00000 J967.46 F500.0
+G1 X93.29000 Y223.37000 Z8.00000 J971.57 F500.0
+G1 X95.56000 Y224.68000 Z8.00000 J974.14 F500.0
+G1 X95.56000 Y229.86000 Z8.00000 J979.22 F500.0
+G1 X93.82000 Y230.86000 Z8.00000 J986.19 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X93.29000 Y231.17000 Z8.00000 J986.19 F800.0
+G1 X93.29000 Y235.37000 Z8.00000 J986.19 F800.0
+G1 X93.45000 Y235.46000 Z8.00000 J986.19 F800.0
+G1 X93.45000 Y235.46000 Z18.00000 J986.19 F800.0
+G1 X63.69000 Y199.99000 Z18.00000 J996.19 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X68.69000 Y204.99000 Z9.00000 J0.00 F300.0
+G1 X95.01000 Y204.99000 Z9.00000 J25.79 F300.0
+G1 X95.01000 Y226.79000 Z9.00000 J47.16 F300.0
+G1 X95.01000 Y234.91000 Z9.00000 J55.12 F300.0
+G1 X51.41000 Y234.91000 Z9.00000 J97.84 F500.0
+G1 X25.09000 Y234.91000 Z9.00000 J123.64 F500.0
+G1 X25.09000 Y213.11000 Z9.00000 J145.00 F500.0
+G1 X25.09000 Y204.99000 Z9.00000 J152.96 F500.0
+G1 X63.69000 Y204.99000 Z9.00000 J195.79 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X68.69000 Y204.99000 Z9.00000 J195.79 F800.0
+G1 X68.69000 Y204.99000 Z19.00000 J195.79 F800.0
+G1 X63.69000 Y199.99000 Z19.00000 J205.79 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X68.69000 Y204.99000 Z9.00000 J0.00 F300.0
+G1 X27.13000 Y204.99000 Z9.00000 J40.73 F300.0
+G1 X27.13000 Y205.37000 Z9.00000 J41.10 F300.0
+G1 X25.09000 Y206.54000 Z9.00000 J43.40 F300.0
+G1 X25.09000 Y211.99000 Z9.00000 J48.74 F500.0
+G1 X27.13000 Y213.17000 Z9.00000 J51.05 F500.0
+G1 X27.13000 Y217.37000 Z9.00000 J55.17 F500.0
+G1 X25.09000 Y218.54000 Z9.00000 J57.47 F500.0
+G1 X25.09000 Y223.99000 Z9.00000 J62.81 F500.0
+G1 X27.13000 Y225.17000 Z9.00000 J65.12 F500.0
+G1 X27.13000 Y229.37000 Z9.00000 J69.24 F500.0
+G1 X25.09000 Y230.54000 Z9.00000 J71.54 F500.0
+G1 X30.59000 Y234.91000 Z9.00000 J78.43 F500.0
+G1 X30.59000 Y231.17000 Z9.00000 J82.09 F500.0
+G1 X27.48000 Y229.37000 Z9.00000 J85.62 F500.0
+G1 X27.48000 Y225.17000 Z9.00000 J89.73 F500.0
+G1 X30.59000 Y223.37000 Z9.00000 J93.25 F500.0
+G1 X30.59000 Y219.17000 Z9.00000 J97.37 F500.0
+G1 X27.48000 Y217.37000 Z9.00000 J100.89 F500.0
+G1 X27.48000 Y213.17000 Z9.00000 J105.01 F500.0
+G1 X30.59000 Y211.37000 Z9.00000 J108.53 F500.0
+G1 X30.59000 Y207.17000 Z9.00000 J112.64 F500.0
+G1 X27.48000 Y205.37000 Z9.00000 J116.17 F500.0
+G1 X27.48000 Y204.99000 Z9.00000 J116.54 F500.0
+G1 X34.06000 Y204.99000 Z9.00000 J122.99 F500.0
+G1 X34.06000 Y205.37000 Z9.00000 J123.36 F500.0
+G1 X30.94000 Y207.17000 Z9.00000 J126.89 F500.0
+G1 X30.94000 Y211.37000 Z9.00000 J131.00 F500.0
+G1 X34.06000 Y213.17000 Z9.00000 J134.53 F500.0
+G1 X34.06000 Y217.37000 Z9.00000 J138.65 F500.0
+G1 X30.94000 Y219.17000 Z9.00000 J142.18 F500.0
+G1 X30.94000 Y223.37000 Z9.00000 J146.30 F500.0
+G1 X34.06000 Y225.17000 Z9.00000 J149.83 F500.0
+G1 X34.06000 Y229.37000 Z9.00000 J153.94 F500.0
+G1 X30.94000 Y231.17000 Z9.00000 J157.47 F500.0
+G1 X30.94000 Y234.91000 Z9.00000 J161.14 F500.0
+G1 X37.52000 Y234.91000 Z9.00000 J167.59 F500.0
+G1 X37.52000 Y231.17000 Z9.00000 J171.25 F500.0
+G1 X34.40000 Y229.37000 Z9.00000 J174.78 F500.0
+G1 X34.40000 Y225.17000 Z9.00000 J178.90 F500.0
+G1 X37.52000 Y223.37000 Z9.00000 J182.43 F500.0
+G1 X37.52000 Y219.17000 Z9.00000 J186.54 F500.0
+G1 X34.40000 Y217.37000 Z9.00000 J190.07 F500.0
+G1 X34.40000 Y213.17000 Z9.00000 J194.19 F500.0
+G1 X37.52000 Y211.37000 Z9.00000 J197.72 F500.0
+G1 X37.52000 Y207.17000 Z9.00000 J201.84 F500.0
+G1 X34.40000 Y205.37000 Z9.00000 J205.37 F500.0
+G1 X34.40000 Y204.99000 Z9.00000 J205.74 F500.0
+G1 X40.99000 Y204.99000 Z9.00000 J212.20 F500.0
+G1 X40.99000 Y205.37000 Z9.00000 J212.57 F500.0
+G1 X37.87000 Y207.17000 Z9.00000 J216.10 F500.0
+G1 X37.87000 Y211.37000 Z9.00000 J220.21 F500.0
+G1 X40.99000 Y213.17000 Z9.00000 J223.74 F500.0
+G1 X40.99000 Y217.37000 Z9.00000 J227.86 F500.0
+G1 X37.87000 Y219.17000 Z9.00000 J231.39 F500.0
+G1 X37.87000 Y223.37000 Z9.00000 J235.51 F500.0
+G1 X40.99000 Y225.17000 Z9.00000 J239.04 F500.0
+G1 X40.99000 Y229.37000 Z9.00000 J243.15 F500.0
+G1 X37.87000 Y231.17000 Z9.00000 J246.68 F500.0
+G1 X37.87000 Y234.91000 Z9.00000 J250.35 F500.0
+G1 X44.45000 Y234.91000 Z9.00000 J256.80 F500.0
+G1 X44.45000 Y231.17000 Z9.00000 J260.46 F500.0
+G1 X41.33000 Y229.37000 Z9.00000 J263.99 F500.0
+G1 X41.33000 Y225.17000 Z9.00000 J268.11 F500.0
+G1 X44.45000 Y223.37000 Z9.00000 J271.64 F500.0
+G1 X44.45000 Y219.17000 Z9.00000 J275.75 F500.0
+G1 X41.33000 Y217.37000 Z9.00000 J279.28 F500.0
+G1 X41.33000 Y213.17000 Z9.00000 J283.40 F500.0
+G1 X44.45000 Y211.37000 Z9.00000 J286.93 F500.0
+G1 X44.45000 Y207.17000 Z9.00000 J291.04 F500.0
+G1 X41.33000 Y205.37000 Z9.00000 J294.57 F500.0
+G1 X41.33000 Y204.99000 Z9.00000 J294.95 F500.0
+G1 X47.91000 Y204.99000 Z9.00000 J301.40 F500.0
+G1 X47.91000 Y205.37000 Z9.00000 J301.77 F500.0
+G1 X44.80000 Y207.17000 Z9.00000 J305.29 F500.0
+G1 X44.80000 Y211.37000 Z9.00000 J309.41 F500.0
+G1 X47.91000 Y213.17000 Z9.00000 J312.93 F500.0
+G1 X47.91000 Y217.37000 Z9.00000 J317.04 F500.0
+G1 X44.80000 Y219.17000 Z9.00000 J320.56 F500.0
+G1 X44.80000 Y223.37000 Z9.00000 J324.68 F500.0
+G1 X47.91000 Y225.17000 Z9.00000 J328.20 F500.0
+G1 X47.91000 Y229.37000 Z9.00000 J332.32 F500.0
+G1 X44.80000 Y231.17000 Z9.00000 J335.84 F500.0
+G1 X44.80000 Y234.91000 Z9.00000 J339.50 F500.0
+G1 X51.38000 Y234.91000 Z9.00000 J345.95 F500.0
+G1 X51.38000 Y231.17000 Z9.00000 J349.62 F500.0
+G1 X48.26000 Y229.37000 Z9.00000 J353.15 F500.0
+G1 X48.26000 Y225.17000 Z9.00000 J357.26 F500.0
+G1 X51.38000 Y223.37000 Z9.00000 J360.79 F500.0
+G1 X51.38000 Y219.17000 Z9.00000 J364.91 F500.0
+G1 X48.26000 Y217.37000 Z9.00000 J368.44 F500.0
+G1 X48.26000 Y213.17000 Z9.00000 J372.56 F500.0
+G1 X51.38000 Y211.37000 Z9.00000 J376.09 F500.0
+G1 X51.38000 Y207.17000 Z9.00000 J380.20 F500.0
+G1 X48.26000 Y205.37000 Z9.00000 J383.73 F500.0
+G1 X48.26000 Y204.99000 Z9.00000 J384.10 F500.0
+G1 X54.84000 Y204.99000 Z9.00000 J390.55 F500.0
+G1 X54.84000 Y205.37000 Z9.00000 J390.92 F500.0
+G1 X51.73000 Y207.17000 Z9.00000 J394.45 F500.0
+G1 X51.73000 Y211.37000 Z9.00000 J398.56 F500.0
+G1 X54.84000 Y213.17000 Z9.00000 J402.08 F500.0
+G1 X54.84000 Y217.37000 Z9.00000 J406.20 F500.0
+G1 X51.73000 Y219.17000 Z9.00000 J409.72 F500.0
+G1 X51.73000 Y223.37000 Z9.00000 J413.84 F500.0
+G1 X54.84000 Y225.17000 Z9.00000 J417.36 F500.0
+G1 X54.84000 Y229.37000 Z9.00000 J421.47 F500.0
+G1 X51.73000 Y231.17000 Z9.00000 J425.00 F500.0
+G1 X51.73000 Y234.91000 Z9.00000 J428.66 F500.0
+G1 X58.31000 Y234.91000 Z9.00000 J435.11 F500.0
+G1 X58.31000 Y231.17000 Z9.00000 J438.78 F500.0
+G1 X55.19000 Y229.37000 Z9.00000 J442.31 F500.0
+G1 X55.19000 Y225.17000 Z9.00000 J446.42 F500.0
+G1 X58.31000 Y223.37000 Z9.00000 J449.95 F500.0
+G1 X58.31000 Y219.17000 Z9.00000 J454.07 F500.0
+G1 X55.19000 Y217.37000 Z9.00000 J457.60 F500.0
+G1 X55.19000 Y213.17000 Z9.00000 J461.71 F500.0
+G1 X58.31000 Y211.37000 Z9.00000 J465.24 F500.0
+G1 X58.31000 Y207.17000 Z9.00000 J469.36 F500.0
+G1 X55.19000 Y205.37000 Z9.00000 J472.89 F500.0
+G1 X55.19000 Y204.99000 Z9.00000 J473.26 F500.0
+G1 X61.77000 Y204.99000 Z9.00000 J479.71 F500.0
+G1 X61.77000 Y205.37000 Z9.00000 J480.08 F500.0
+G1 X58.65000 Y207.17000 Z9.00000 J483.61 F500.0
+G1 X58.65000 Y211.37000 Z9.00000 J487.73 F500.0
+G1 X61.77000 Y213.17000 Z9.00000 J491.26 F500.0
+G1 X61.77000 Y217.37000 Z9.00000 J495.37 F500.0
+G1 X58.65000 Y219.17000 Z9.00000 J498.90 F500.0
+G1 X58.65000 Y223.37000 Z9.00000 J503.02 F500.0
+G1 X61.77000 Y225.17000 Z9.00000 J506.55 F500.0
+G1 X61.77000 Y229.37000 Z9.00000 J510.67 F500.0
+G1 X58.65000 Y231.17000 Z9.00000 J514.20 F500.0
+G1 X58.65000 Y234.91000 Z9.00000 J517.86 F500.0
+G1 X65.23000 Y234.91000 Z9.00000 J524.31 F500.0
+G1 X65.23000 Y231.17000 Z9.00000 J527.97 F500.0
+G1 X62.12000 Y229.37000 Z9.00000 J531.50 F500.0
+G1 X62.12000 Y225.17000 Z9.00000 J535.61 F500.0
+G1 X65.23000 Y223.37000 Z9.00000 J539.13 F500.0
+G1 X65.23000 Y219.17000 Z9.00000 J543.25 F500.0
+G1 X62.12000 Y217.37000 Z9.00000 J546.77 F500.0
+G1 X62.12000 Y213.17000 Z9.00000 J550.89 F500.0
+G1 X65.23000 Y211.37000 Z9.00000 J554.41 F500.0
+G1 X65.23000 Y207.17000 Z9.00000 J558.52 F500.0
+G1 X62.12000 Y205.37000 Z9.00000 J562.05 F500.0
+G1 X62.12000 Y204.99000 Z9.00000 J562.42 F500.0
+G1 X68.70000 Y204.99000 Z9.00000 J568.87 F500.0
+G1 X68.70000 Y205.37000 Z9.00000 J569.24 F500.0
+G1 X65.58000 Y207.17000 Z9.00000 J572.77 F500.0
+G1 X65.58000 Y211.37000 Z9.00000 J576.89 F500.0
+G1 X68.70000 Y213.17000 Z9.00000 J580.42 F500.0
+G1 X68.70000 Y217.37000 Z9.00000 J584.53 F500.0
+G1 X65.58000 Y219.17000 Z9.00000 J588.06 F500.0
+G1 X65.58000 Y223.37000 Z9.00000 J592.18 F500.0
+G1 X68.70000 Y225.17000 Z9.00000 J595.71 F500.0
+G1 X68.70000 Y229.37000 Z9.00000 J599.82 F500.0
+G1 X65.58000 Y231.17000 Z9.00000 J603.35 F500.0
+G1 X65.58000 Y234.91000 Z9.00000 J607.02 F500.0
+G1 X72.16000 Y234.91000 Z9.00000 J613.47 F500.0
+G1 X72.16000 Y231.17000 Z9.00000 J617.13 F500.0
+G1 X69.04000 Y229.37000 Z9.00000 J620.66 F500.0
+G1 X69.04000 Y225.17000 Z9.00000 J624.78 F500.0
+G1 X72.16000 Y223.37000 Z9.00000 J628.31 F500.0
+G1 X72.16000 Y219.17000 Z9.00000 J632.42 F500.0
+G1 X69.04000 Y217.37000 Z9.00000 J635.95 F500.0
+G1 X69.04000 Y213.17000 Z9.00000 J640.07 F500.0
+G1 X72.16000 Y211.37000 Z9.00000 J643.60 F500.0
+G1 X72.16000 Y207.17000 Z9.00000 J647.72 F500.0
+G1 X69.04000 Y205.37000 Z9.00000 J651.25 F500.0
+G1 X69.04000 Y204.99000 Z9.00000 J651.62 F500.0
+G1 X75.63000 Y204.99000 Z9.00000 J658.08 F500.0
+G1 X75.63000 Y205.37000 Z9.00000 J658.45 F500.0
+G1 X72.51000 Y207.17000 Z9.00000 J661.98 F500.0
+G1 X72.51000 Y211.37000 Z9.00000 J666.09 F500.0
+G1 X75.63000 Y213.17000 Z9.00000 J669.62 F500.0
+G1 X75.63000 Y217.37000 Z9.00000 J673.74 F500.0
+G1 X72.51000 Y219.17000 Z9.00000 J677.27 F500.0
+G1 X72.51000 Y223.37000 Z9.00000 J681.39 F500.0
+G1 X75.63000 Y225.17000 Z9.00000 J684.92 F500.0
+G1 X75.63000 Y229.37000 Z9.00000 J689.03 F500.0
+G1 X72.51000 Y231.17000 Z9.00000 J692.56 F500.0
+G1 X72.51000 Y234.91000 Z9.00000 J696.23 F500.0
+G1 X79.09000 Y234.91000 Z9.00000 J702.68 F500.0
+G1 X79.09000 Y231.17000 Z9.00000 J706.34 F500.0
+G1 X75.97000 Y229.37000 Z9.00000 J709.87 F500.0
+G1 X75.97000 Y225.17000 Z9.00000 J713.99 F500.0
+G1 X79.09000 Y223.37000 Z9.00000 J717.52 F500.0
+G1 X79.09000 Y219.17000 Z9.00000 J721.63 F500.0
+G1 X75.97000 Y217.37000 Z9.00000 J725.16 F500.0
+G1 X75.97000 Y213.17000 Z9.00000 J729.28 F500.0
+G1 X79.09000 Y211.37000 Z9.00000 J732.81 F500.0
+G1 X79.09000 Y207.17000 Z9.00000 J736.93 F500.0
+G1 X75.97000 Y205.37000 Z9.00000 J740.46 F500.0
+G1 X75.97000 Y204.99000 Z9.00000 J740.83 F500.0
+G1 X82.55000 Y204.99000 Z9.00000 J747.28 F500.0
+G1 X82.55000 Y205.37000 Z9.00000 J747.65 F500.0
+G1 X79.44000 Y207.17000 Z9.00000 J751.17 F500.0
+G1 X79.44000 Y211.37000 Z9.00000 J755.29 F500.0
+G1 X82.55000 Y213.17000 Z9.00000 J758.81 F500.0
+G1 X82.55000 Y217.37000 Z9.00000 J762.92 F500.0
+G1 X79.44000 Y219.17000 Z9.00000 J766.44 F500.0
+G1 X79.44000 Y223.37000 Z9.00000 J770.56 F500.0
+G1 X82.55000 Y225.17000 Z9.00000 J774.08 F500.0
+G1 X82.55000 Y229.37000 Z9.00000 J778.20 F500.0
+G1 X79.44000 Y231.17000 Z9.00000 J781.72 F500.0
+G1 X79.44000 Y234.91000 Z9.00000 J785.38 F500.0
+G1 X86.02000 Y234.91000 Z9.00000 J791.83 F500.0
+G1 X86.02000 Y231.17000 Z9.00000 J795.50 F500.0
+G1 X82.90000 Y229.37000 Z9.00000 J799.03 F500.0
+G1 X82.90000 Y225.17000 Z9.00000 J803.14 F500.0
+G1 X86.02000 Y223.37000 Z9.00000 J806.67 F500.0
+G1 X86.02000 Y219.17000 Z9.00000 J810.79 F500.0
+G1 X82.90000 Y217.37000 Z9.00000 J814.32 F500.0
+G1 X82.90000 Y213.17000 Z9.00000 J818.44 F500.0
+G1 X86.02000 Y211.37000 Z9.00000 J821.97 F500.0
+G1 X86.02000 Y207.17000 Z9.00000 J826.08 F500.0
+G1 X82.90000 Y205.37000 Z9.00000 J829.61 F500.0
+G1 X82.90000 Y204.99000 Z9.00000 J829.98 F500.0
+G1 X89.48000 Y204.99000 Z9.00000 J836.43 F500.0
+G1 X89.48000 Y205.37000 Z9.00000 J836.81 F500.0
+G1 X86.37000 Y207.17000 Z9.00000 J840.33 F500.0
+G1 X86.37000 Y211.37000 Z9.00000 J844.44 F500.0
+G1 X89.48000 Y213.17000 Z9.00000 J847.96 F500.0
+G1 X89.48000 Y217.37000 Z9.00000 J852.08 F500.0
+G1 X86.37000 Y219.17000 Z9.00000 J855.60 F500.0
+G1 X86.37000 Y223.37000 Z9.00000 J859.72 F500.0
+G1 X89.48000 Y225.17000 Z9.00000 J863.24 F500.0
+G1 X89.48000 Y229.37000 Z9.00000 J867.36 F500.0
+G1 X86.37000 Y231.17000 Z9.00000 J870.88 F500.0
+G1 X86.37000 Y234.91000 Z9.00000 J874.54 F500.0
+G1 X92.95000 Y234.91000 Z9.00000 J880.99 F500.0
+G1 X92.95000 Y231.17000 Z9.00000 J884.66 F500.0
+G1 X89.83000 Y229.37000 Z9.00000 J888.19 F500.0
+G1 X89.83000 Y225.17000 Z9.00000 J892.30 F500.0
+G1 X92.95000 Y223.37000 Z9.00000 J895.83 F500.0
+G1 X92.95000 Y219.17000 Z9.00000 J899.95 F500.0
+G1 X89.83000 Y217.37000 Z9.00000 J903.48 F500.0
+G1 X89.83000 Y213.17000 Z9.00000 J907.59 F500.0
+G1 X92.95000 Y211.37000 Z9.00000 J911.12 F500.0
+G1 X92.95000 Y207.17000 Z9.00000 J915.24 F500.0
+G1 X89.83000 Y205.37000 Z9.00000 J918.77 F500.0
+G1 X89.83000 Y204.99000 Z9.00000 J919.14 F500.0
+G1 X95.01000 Y206.18000 Z9.00000 J924.35 F500.0
+G1 X93.29000 Y207.17000 Z9.00000 J926.30 F500.0
+G1 X93.29000 Y211.37000 Z9.00000 J930.41 F500.0
+G1 X95.01000 Y212.36000 Z9.00000 J932.36 F500.0
+G1 X95.01000 Y218.18000 Z9.00000 J938.06 F500.0
+G1 X93.29000 Y219.17000 Z9.00000 J940.00 F500.0
+G1 X93.29000 Y223.37000 Z9.00000 J944.12 F500.0
+G1 X95.01000 Y224.36000 Z9.00000 J946.07 F500.0
+G1 X95.01000 Y230.18000 Z9.00000 J951.77 F500.0
+G1 X94.38000 Y230.54000 Z9.00000 J957.48 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X93.29000 Y231.17000 Z9.00000 J957.48 F800.0
+G1 X93.29000 Y234.91000 Z9.00000 J957.48 F800.0
+G1 X93.29000 Y234.91000 Z19.00000 J957.48 F800.0
+G1 X60.25000 Y200.55000 Z19.00000 J967.48 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X65.25000 Y205.55000 Z10.00000 J0.00 F300.0
+G1 X94.45000 Y205.55000 Z10.00000 J28.62 F300.0
+G1 X94.45000 Y225.35000 Z10.00000 J48.02 F300.0
+G1 X94.45000 Y234.35000 Z10.00000 J56.84 F300.0
+G1 X54.85000 Y234.35000 Z10.00000 J95.65 F500.0
+G1 X25.65000 Y234.35000 Z10.00000 J124.26 F500.0
+G1 X25.65000 Y214.55000 Z10.00000 J143.67 F500.0
+G1 X25.65000 Y205.55000 Z10.00000 J152.49 F500.0
+G1 X60.25000 Y205.55000 Z10.00000 J191.40 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X65.25000 Y205.55000 Z10.00000 J191.40 F800.0
+G1 X65.25000 Y205.55000 Z20.00000 J191.40 F800.0
+G1 X60.25000 Y200.55000 Z20.00000 J201.40 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X65.25000 Y205.55000 Z10.00000 J0.00 F300.0
+G1 X26.82000 Y205.55000 Z10.00000 J37.66 F300.0
+G1 X25.65000 Y206.22000 Z10.00000 J38.98 F300.0
+G1 X25.65000 Y212.31000 Z10.00000 J44.95 F300.0
+G1 X27.13000 Y213.17000 Z10.00000 J46.62 F500.0
+G1 X27.13000 Y217.37000 Z10.00000 J50.74 F500.0
+G1 X25.65000 Y218.22000 Z10.00000 J52.41 F500.0
+G1 X25.65000 Y224.31000 Z10.00000 J58.38 F500.0
+G1 X27.13000 Y225.17000 Z10.00000 J60.06 F500.0
+G1 X27.13000 Y229.37000 Z10.00000 J64.17 F500.0
+G1 X25.65000 Y230.22000 Z10.00000 J65.85 F500.0
+G1 X30.59000 Y234.35000 Z10.00000 J72.16 F500.0
+G1 X30.59000 Y231.17000 Z10.00000 J75.27 F500.0
+G1 X27.48000 Y229.37000 Z10.00000 J78.80 F500.0
+G1 X27.48000 Y225.17000 Z10.00000 J82.91 F500.0
+G1 X30.59000 Y223.37000 Z10.00000 J86.43 F500.0
+G1 X30.59000 Y219.17000 Z10.00000 J90.55 F500.0
+G1 X27.48000 Y217.37000 Z10.00000 J94.07 F500.0
+G1 X27.48000 Y213.17000 Z10.00000 J98.19 F500.0
+G1 X30.59000 Y211.37000 Z10.00000 J101.71 F500.0
+G1 X30.59000 Y207.17000 Z10.00000 J105.82 F500.0
+G1 X27.79000 Y205.55000 Z10.00000 J108.99 F500.0
+G1 X33.75000 Y205.55000 Z10.00000 J114.83 F500.0
+G1 X30.94000 Y207.17000 Z10.00000 J118.01 F500.0
+G1 X30.94000 Y211.37000 Z10.00000 J122.13 F500.0
+G1 X34.06000 Y213.17000 Z10.00000 J125.66 F500.0
+G1 X34.06000 Y217.37000 Z10.00000 J129.78 F500.0
+G1 X30.94000 Y219.17000 Z10.00000 J133.31 F500.0
+G1 X30.94000 Y223.37000 Z10.00000 J137.42 F500.0
+G1 X34.06000 Y225.17000 Z10.00000 J140.95 F500.0
+G1 X34.06000 Y229.37000 Z10.00000 J145.07 F500.0
+G1 X30.94000 Y231.17000 Z10.00000 J148.60 F500.0
+G1 X30.94000 Y234.35000 Z10.00000 J151.71 F500.0
+G1 X37.52000 Y234.35000 Z10.00000 J158.16 F500.0
+G1 X37.52000 Y231.17000 Z10.00000 J161.28 F500.0
+G1 X34.40000 Y229.37000 Z10.00000 J164.81 F500.0
+G1 X34.40000 Y225.17000 Z10.00000 J168.92 F500.0
+G1 X37.52000 Y223.37000 Z10.00000 J172.45 F500.0
+G1 X37.52000 Y219.17000 Z10.00000 J176.57 F500.0
+G1 X34.40000 Y217.37000 Z10.00000 J180.10 F500.0
+G1 X34.40000 Y213.17000 Z10.00000 J184.22 F500.0
+G1 X37.52000 Y211.37000 Z10.00000 J187.75 F500.0
+G1 X37.52000 Y207.17000 Z10.00000 J191.86 F500.0
+G1 X34.72000 Y205.55000 Z10.00000 J195.03 F500.0
+G1 X40.67000 Y205.55000 Z10.00000 J200.86 F500.0
+G1 X37.87000 Y207.17000 Z10.00000 J204.03 F500.0
+G1 X37.87000 Y211.37000 Z10.00000 J208.15 F500.0
+G1 X40.99000 Y213.17000 Z10.00000 J211.68 F500.0
+G1 X40.99000 Y217.37000 Z10.00000 J215.80 F500.0
+G1 X37.87000 Y219.17000 Z10.00000 J219.33 F500.0
+G1 X37.87000 Y223.37000 Z10.00000 J223.44 F500.0
+G1 X40.99000 Y225.17000 Z10.00000 J226.97 F500.0
+G1 X40.99000 Y229.37000 Z10.00000 J231.09 F500.0
+G1 X37.87000 Y231.17000 Z10.00000 J234.62 F500.0
+G1 X37.87000 Y234.35000 Z10.00000 J237.73 F500.0
+G1 X44.45000 Y234.35000 Z10.00000 J244.18 F500.0
+G1 X44.45000 Y231.17000 Z10.00000 J247.30 F500.0
+G1 X41.33000 Y229.37000 Z10.00000 J250.83 F500.0
+G1 X41.33000 Y225.17000 Z10.00000 J254.94 F500.0
+G1 X44.45000 Y223.37000 Z10.00000 J258.47 F500.0
+G1 X44.45000 Y219.17000 Z10.00000 J262.59 F500.0
+G1 X41.33000 Y217.37000 Z10.00000 J266.12 F500.0
+G1 X41.33000 Y213.17000 Z10.00000 J270.24 F500.0
+G1 X44.45000 Y211.37000 Z10.00000 J273.77 F500.0
+G1 X44.45000 Y207.17000 Z10.00000 J277.88 F500.0
+G1 X41.64000 Y205.55000 Z10.00000 J281.06 F500.0
+G1 X47.60000 Y205.55000 Z10.00000 J286.90 F500.0
+G1 X44.80000 Y207.17000 Z10.00000 J290.07 F500.0
+G1 X44.80000 Y211.37000 Z10.00000 J294.19 F500.0
+G1 X47.91000 Y213.17000 Z10.00000 J297.71 F500.0
+G1 X47.91000 Y217.37000 Z10.00000 J301.83 F500.0
+G1 X44.80000 Y219.17000 Z10.00000 J305.35 F500.0
+G1 X44.80000 Y223.37000 Z10.00000 J309.46 F500.0
+G1 X47.91000 Y225.17000 Z10.00000 J312.98 F500.0
+G1 X47.91000 Y229.37000 Z10.00000 J317.10 F500.0
+G1 X44.80000 Y231.17000 Z10.00000 J320.62 F500.0
+G1 X44.80000 Y234.35000 Z10.00000 J323.74 F500.0
+G1 X51.38000 Y234.35000 Z10.00000 J330.19 F500.0
+G1 X51.38000 Y231.17000 Z10.00000 J333.30 F500.0
+G1 X48.26000 Y229.37000 Z10.00000 J336.83 F500.0
+G1 X48.26000 Y225.17000 Z10.00000 J340.95 F500.0
+G1 X51.38000 Y223.37000 Z10.00000 J344.48 F500.0
+G1 X51.38000 Y219.17000 Z10.00000 J348.60 F500.0
+G1 X48.26000 Y217.37000 Z10.00000 J352.13 F500.0
+G1 X48.26000 Y213.17000 Z10.00000 J356.24 F500.0
+G1 X51.38000 Y211.37000 Z10.00000 J359.77 F500.0
+G1 X51.38000 Y207.17000 Z10.00000 J363.89 F500.0
+G1 X48.57000 Y205.55000 Z10.00000 J367.07 F500.0
+G1 X54.53000 Y205.55000 Z10.00000 J372.91 F500.0
+G1 X51.73000 Y207.17000 Z10.00000 J376.08 F500.0
+G1 X51.73000 Y211.37000 Z10.00000 J380.19 F500.0
+G1 X54.84000 Y213.17000 Z10.00000 J383.71 F500.0
+G1 X54.84000 Y217.37000 Z10.00000 J387.83 F500.0
+G1 X51.73000 Y219.17000 Z10.00000 J391.35 F500.0
+G1 X51.73000 Y223.37000 Z10.00000 J395.47 F500.0
+G1 X54.84000 Y225.17000 Z10.00000 J398.99 F500.0
+G1 X54.84000 Y229.37000 Z10.00000 J403.11 F500.0
+G1 X51.73000 Y231.17000 Z10.00000 J406.63 F500.0
+G1 X51.73000 Y234.35000 Z10.00000 J409.74 F500.0
+G1 X58.31000 Y234.35000 Z10.00000 J416.19 F500.0
+G1 X58.31000 Y231.17000 Z10.00000 J419.31 F500.0
+G1 X55.19000 Y229.37000 Z10.00000 J422.84 F500.0
+G1 X55.19000 Y225.17000 Z10.00000 J426.95 F500.0
+G1 X58.31000 Y223.37000 Z10.00000 J430.48 F500.0
+G1 X58.31000 Y219.17000 Z10.00000 J434.60 F500.0
+G1 X55.19000 Y217.37000 Z10.00000 J438.13 F500.0
+G1 X55.19000 Y213.17000 Z10.00000 J442.25 F500.0
+G1 X58.31000 Y211.37000 Z10.00000 J445.78 F500.0
+G1 X58.31000 Y207.17000 Z10.00000 J449.89 F500.0
+G1 X55.50000 Y205.55000 Z10.00000 J453.07 F500.0
+G1 X61.46000 Y205.55000 Z10.00000 J458.91 F500.0
+G1 X58.65000 Y207.17000 Z10.00000 J462.09 F500.0
+G1 X58.65000 Y211.37000 Z10.00000 J466.21 F500.0
+G1 X61.77000 Y213.17000 Z10.00000 J469.74 F500.0
+G1 X61.77000 Y217.37000 Z10.00000 J473.85 F500.0
+G1 X58.65000 Y219.17000 Z10.00000 J477.38 F500.0
+G1 X58.65000 Y223.37000 Z10.00000 J481.50 F500.0
+G1 X61.77000 Y225.17000 Z10.00000 J485.03 F500.0
+G1 X61.77000 Y229.37000 Z10.00000 J489.14 F500.0
+G1 X58.65000 Y231.17000 Z10.00000 J492.67 F500.0
+G1 X58.65000 Y234.35000 Z10.00000 J495.79 F500.0
+G1 X65.23000 Y234.35000 Z10.00000 J502.24 F500.0
+G1 X65.23000 Y231.17000 Z10.00000 J505.35 F500.0
+G1 X62.12000 Y229.37000 Z10.00000 J508.88 F500.0
+G1 X62.12000 Y225.17000 Z10.00000 J512.99 F500.0
+G1 X65.23000 Y223.37000 Z10.00000 J516.51 F500.0
+G1 X65.23000 Y219.17000 Z10.00000 J520.63 F500.0
+G1 X62.12000 Y217.37000 Z10.00000 J524.15 F500.0
+G1 X62.12000 Y213.17000 Z10.00000 J528.27 F500.0
+G1 X65.23000 Y211.37000 Z10.00000 J531.79 F500.0
+G1 X65.23000 Y207.17000 Z10.00000 J535.90 F500.0
+G1 X62.43000 Y205.55000 Z10.00000 J539.07 F500.0
+G1 X68.39000 Y205.55000 Z10.00000 J544.92 F500.0
+G1 X65.58000 Y207.17000 Z10.00000 J548.09 F500.0
+G1 X65.58000 Y211.37000 Z10.00000 J552.21 F500.0
+G1 X68.70000 Y213.17000 Z10.00000 J555.74 F500.0
+G1 X68.70000 Y217.37000 Z10.00000 J559.86 F500.0
+G1 X65.58000 Y219.17000 Z10.00000 J563.39 F500.0
+G1 X65.58000 Y223.37000 Z10.00000 J567.50 F500.0
+G1 X68.70000 Y225.17000 Z10.00000 J571.03 F500.0
+G1 X68.70000 Y229.37000 Z10.00000 J575.15 F500.0
+G1 X65.58000 Y231.17000 Z10.00000 J578.68 F500.0
+G1 X65.58000 Y234.35000 Z10.00000 J581.79 F500.0
+G1 X72.16000 Y234.35000 Z10.00000 J588.24 F500.0
+G1 X72.16000 Y231.17000 Z10.00000 J591.36 F500.0
+G1 X69.04000 Y229.37000 Z10.00000 J594.89 F500.0
+G1 X69.04000 Y225.17000 Z10.00000 J599.01 F500.0
+G1 X72.16000 Y223.37000 Z10.00000 J602.54 F500.0
+G1 X72.16000 Y219.17000 Z10.00000 J606.65 F500.0
+G1 X69.04000 Y217.37000 Z10.00000 J610.18 F500.0
+G1 X69.04000 Y213.17000 Z10.00000 J614.30 F500.0
+G1 X72.16000 Y211.37000 Z10.00000 J617.83 F500.0
+G1 X72.16000 Y207.17000 Z10.00000 J621.94 F500.0
+G1 X69.36000 Y205.55000 Z10.00000 J625.11 F500.0
+G1 X75.32000 Y205.55000 Z10.00000 J630.95 F500.0
+G1 X72.51000 Y207.17000 Z10.00000 J634.13 F500.0
+G1 X72.51000 Y211.37000 Z10.00000 J638.25 F500.0
+G1 X75.63000 Y213.17000 Z10.00000 J641.78 F500.0
+G1 X75.63000 Y217.37000 Z10.00000 J645.89 F500.0
+G1 X72.51000 Y219.17000 Z10.00000 J649.42 F500.0
+G1 X72.51000 Y223.37000 Z10.00000 J653.54 F500.0
+G1 X75.63000 Y225.17000 Z10.00000 J657.07 F500.0
+G1 X75.63000 Y229.37000 Z10.00000 J661.19 F500.0
+G1 X72.51000 Y231.17000 Z10.00000 J664.72 F500.0
+G1 X72.51000 Y234.35000 Z10.00000 J667.83 F500.0
+G1 X79.09000 Y234.35000 Z10.00000 J674.28 F500.0
+G1 X79.09000 Y231.17000 Z10.00000 J677.40 F500.0
+G1 X75.97000 Y229.37000 Z10.00000 J680.93 F500.0
+G1 X75.97000 Y225.17000 Z10.00000 J685.04 F500.0
+G1 X79.09000 Y223.37000 Z10.00000 J688.57 F500.0
+G1 X79.09000 Y219.17000 Z10.00000 J692.69 F500.0
+G1 X75.97000 Y217.37000 Z10.00000 J696.22 F500.0
+G1 X75.97000 Y213.17000 Z10.00000 J700.34 F500.0
+G1 X79.09000 Y211.37000 Z10.00000 J703.87 F500.0
+G1 X79.09000 Y207.17000 Z10.00000 J707.98 F500.0
+G1 X76.29000 Y205.55000 Z10.00000 J711.15 F500.0
+G1 X82.24000 Y205.55000 Z10.00000 J716.98 F500.0
+G1 X79.44000 Y207.17000 Z10.00000 J720.15 F500.0
+G1 X79.44000 Y211.37000 Z10.00000 J724.27 F500.0
+G1 X82.55000 Y213.17000 Z10.00000 J727.79 F500.0
+G1 X82.55000 Y217.37000 Z10.00000 J731.91 F500.0
+G1 X79.44000 Y219.17000 Z10.00000 J735.43 F500.0
+G1 X79.44000 Y223.37000 Z10.00000 J739.54 F500.0
+G1 X82.55000 Y225.17000 Z10.00000 J743.07 F500.0
+G1 X82.55000 Y229.37000 Z10.00000 J747.18 F500.0
+G1 X79.44000 Y231.17000 Z10.00000 J750.70 F500.0
+G1 X79.44000 Y234.35000 Z10.00000 J753.82 F500.0
+G1 X86.02000 Y234.35000 Z10.00000 J760.27 F500.0
+G1 X86.02000 Y231.17000 Z10.00000 J763.38 F500.0
+G1 X82.90000 Y229.37000 Z10.00000 J766.91 F500.0
+G1 X82.90000 Y225.17000 Z10.00000 J771.03 F500.0
+G1 X86.02000 Y223.37000 Z10.00000 J774.56 F500.0
+G1 X86.02000 Y219.17000 Z10.00000 J778.68 F500.0
+G1 X82.90000 Y217.37000 Z10.00000 J782.21 F500.0
+G1 X82.90000 Y213.17000 Z10.00000 J786.32 F500.0
+G1 X86.02000 Y211.37000 Z10.00000 J789.85 F500.0
+G1 X86.02000 Y207.17000 Z10.00000 J793.97 F500.0
+G1 X83.21000 Y205.55000 Z10.00000 J797.15 F500.0
+G1 X89.17000 Y205.55000 Z10.00000 J802.99 F500.0
+G1 X86.37000 Y207.17000 Z10.00000 J806.16 F500.0
+G1 X86.37000 Y211.37000 Z10.00000 J810.27 F500.0
+G1 X89.48000 Y213.17000 Z10.00000 J813.80 F500.0
+G1 X89.48000 Y217.37000 Z10.00000 J817.91 F500.0
+G1 X86.37000 Y219.17000 Z10.00000 J821.43 F500.0
+G1 X86.37000 Y223.37000 Z10.00000 J825.55 F500.0
+G1 X89.48000 Y225.17000 Z10.00000 J829.07 F500.0
+G1 X89.48000 Y229.37000 Z10.00000 J833.19 F500.0
+G1 X86.37000 Y231.17000 Z10.00000 J836.71 F500.0
+G1 X86.37000 Y234.35000 Z10.00000 J839.82 F500.0
+G1 X92.95000 Y234.35000 Z10.00000 J846.27 F500.0
+G1 X92.95000 Y231.17000 Z10.00000 J849.39 F500.0
+G1 X89.83000 Y229.37000 Z10.00000 J852.92 F500.0
+G1 X89.83000 Y225.17000 Z10.00000 J857.03 F500.0
+G1 X92.95000 Y223.37000 Z10.00000 J860.56 F500.0
+G1 X92.95000 Y219.17000 Z10.00000 J864.68 F500.0
+G1 X89.83000 Y217.37000 Z10.00000 J868.21 F500.0
+G1 X89.83000 Y213.17000 Z10.00000 J872.33 F500.0
+G1 X92.95000 Y211.37000 Z10.00000 J875.86 F500.0
+G1 X92.95000 Y207.17000 Z10.00000 J879.97 F500.0
+G1 X90.14000 Y205.55000 Z10.00000 J883.15 F500.0
+G1 X94.45000 Y206.50000 Z10.00000 J887.48 F500.0
+G1 X93.29000 Y207.17000 Z10.00000 J888.79 F500.0
+G1 X93.29000 Y211.37000 Z10.00000 J892.91 F500.0
+G1 X94.45000 Y212.04000 Z10.00000 J894.22 F500.0
+G1 X94.45000 Y218.50000 Z10.00000 J900.55 F500.0
+G1 X93.29000 Y219.17000 Z10.00000 J901.86 F500.0
+G1 X93.29000 Y223.37000 Z10.00000 J905.98 F500.0
+G1 X94.45000 Y224.04000 Z10.00000 J907.29 F500.0
+G1 X94.45000 Y230.02000 Z10.00000 J918.15 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X94.45000 Y230.50000 Z10.00000 J918.15 F800.0
+G1 X93.29000 Y231.17000 Z10.00000 J918.15 F800.0
+G1 X93.29000 Y234.35000 Z10.00000 J918.15 F800.0
+G1 X93.29000 Y234.35000 Z20.00000 J918.15 F800.0
+G1 X56.80000 Y201.10000 Z20.00000 J928.15 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X61.80000 Y206.10000 Z11.00000 J0.00 F300.0
+G1 X93.90000 Y206.10000 Z11.00000 J31.46 F300.0
+G1 X93.90000 Y223.90000 Z11.00000 J48.90 F300.0
+G1 X93.90000 Y233.80000 Z11.00000 J58.60 F300.0
+G1 X58.30000 Y233.80000 Z11.00000 J93.49 F500.0
+G1 X26.20000 Y233.80000 Z11.00000 J124.95 F500.0
+G1 X26.20000 Y216.00000 Z11.00000 J142.39 F500.0
+G1 X26.20000 Y206.10000 Z11.00000 J152.10 F500.0
+G1 X56.80000 Y206.10000 Z11.00000 J187.08 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X61.80000 Y206.10000 Z11.00000 J187.08 F800.0
+G1 X61.80000 Y206.10000 Z21.00000 J187.08 F800.0
+G1 X56.80000 Y201.10000 Z21.00000 J197.08 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X61.80000 Y206.10000 Z11.00000 J0.00 F300.0
+G1 X26.20000 Y212.63000 Z11.00000 J35.47 F300.0
+G1 X27.13000 Y213.17000 Z11.00000 J36.53 F300.0
+G1 X27.13000 Y217.37000 Z11.00000 J40.64 F300.0
+G1 X26.20000 Y217.90000 Z11.00000 J41.69 F500.0
+G1 X26.20000 Y224.63000 Z11.00000 J48.29 F500.0
+G1 X27.13000 Y225.17000 Z11.00000 J49.34 F500.0
+G1 X27.13000 Y229.37000 Z11.00000 J53.46 F500.0
+G1 X26.20000 Y229.90000 Z11.00000 J54.51 F500.0
+G1 X30.59000 Y233.80000 Z11.00000 J60.26 F500.0
+G1 X30.59000 Y231.17000 Z11.00000 J62.84 F500.0
+G1 X27.48000 Y229.37000 Z11.00000 J66.36 F500.0
+G1 X27.48000 Y225.17000 Z11.00000 J70.48 F500.0
+G1 X30.59000 Y223.37000 Z11.00000 J74.00 F500.0
+G1 X30.59000 Y219.17000 Z11.00000 J78.11 F500.0
+G1 X27.48000 Y217.37000 Z11.00000 J81.64 F500.0
+G1 X27.48000 Y213.17000 Z11.00000 J85.75 F500.0
+G1 X30.59000 Y211.37000 Z11.00000 J89.27 F500.0
+G1 X30.59000 Y207.17000 Z11.00000 J93.39 F500.0
+G1 X28.75000 Y206.10000 Z11.00000 J95.48 F500.0
+G1 X32.79000 Y206.10000 Z11.00000 J99.43 F500.0
+G1 X30.94000 Y207.17000 Z11.00000 J101.53 F500.0
+G1 X30.94000 Y211.37000 Z11.00000 J105.64 F500.0
+G1 X34.06000 Y213.17000 Z11.00000 J109.17 F500.0
+G1 X34.06000 Y217.37000 Z11.00000 J113.29 F500.0
+G1 X30.94000 Y219.17000 Z11.00000 J116.82 F500.0
+G1 X30.94000 Y223.37000 Z11.00000 J120.94 F500.0
+G1 X34.06000 Y225.17000 Z11.00000 J124.47 F500.0
+G1 X34.06000 Y229.37000 Z11.00000 J128.58 F500.0
+G1 X30.94000 Y231.17000 Z11.00000 J132.11 F500.0
+G1 X30.94000 Y233.80000 Z11.00000 J134.69 F500.0
+G1 X37.52000 Y233.80000 Z11.00000 J141.14 F500.0
+G1 X37.52000 Y231.17000 Z11.00000 J143.72 F500.0
+G1 X34.40000 Y229.37000 Z11.00000 J147.25 F500.0
+G1 X34.40000 Y225.17000 Z11.00000 J151.36 F500.0
+G1 X37.52000 Y223.37000 Z11.00000 J154.89 F500.0
+G1 X37.52000 Y219.17000 Z11.00000 J159.01 F500.0
+G1 X34.40000 Y217.37000 Z11.00000 J162.54 F500.0
+G1 X34.40000 Y213.17000 Z11.00000 J166.65 F500.0
+G1 X37.52000 Y211.37000 Z11.00000 J170.18 F500.0
+G1 X37.52000 Y207.17000 Z11.00000 J174.30 F500.0
+G1 X35.67000 Y206.10000 Z11.00000 J176.39 F500.0
+G1 X39.72000 Y206.10000 Z11.00000 J180.36 F500.0
+G1 X37.87000 Y207.17000 Z11.00000 J182.46 F500.0
+G1 X37.87000 Y211.37000 Z11.00000 J186.57 F500.0
+G1 X40.99000 Y213.17000 Z11.00000 J190.10 F500.0
+G1 X40.99000 Y217.37000 Z11.00000 J194.22 F500.0
+G1 X37.87000 Y219.17000 Z11.00000 J197.75 F500.0
+G1 X37.87000 Y223.37000 Z11.00000 J201.87 F500.0
+G1 X40.99000 Y225.17000 Z11.00000 J205.40 F500.0
+G1 X40.99000 Y229.37000 Z11.00000 J209.51 F500.0
+G1 X37.87000 Y231.17000 Z11.00000 J213.04 F500.0
+G1 X37.87000 Y233.80000 Z11.00000 J215.62 F500.0
+G1 X44.45000 Y233.80000 Z11.00000 J222.07 F500.0
+G1 X44.45000 Y231.17000 Z11.00000 J224.64 F500.0
+G1 X41.33000 Y229.37000 Z11.00000 J228.17 F500.0
+G1 X41.33000 Y225.17000 Z11.00000 J232.29 F500.0
+G1 X44.45000 Y223.37000 Z11.00000 J235.82 F500.0
+G1 X44.45000 Y219.17000 Z11.00000 J239.94 F500.0
+G1 X41.33000 Y217.37000 Z11.00000 J243.47 F500.0
+G1 X41.33000 Y213.17000 Z11.00000 J247.58 F500.0
+G1 X44.45000 Y211.37000 Z11.00000 J251.11 F500.0
+G1 X44.45000 Y207.17000 Z11.00000 J255.23 F500.0
+G1 X42.60000 Y206.10000 Z11.00000 J257.32 F500.0
+G1 X46.64000 Y206.10000 Z11.00000 J261.28 F500.0
+G1 X44.80000 Y207.17000 Z11.00000 J263.37 F500.0
+G1 X44.80000 Y211.37000 Z11.00000 J267.48 F500.0
+G1 X47.91000 Y213.17000 Z11.00000 J271.01 F500.0
+G1 X47.91000 Y217.37000 Z11.00000 J275.12 F500.0
+G1 X44.80000 Y219.17000 Z11.00000 J278.64 F500.0
+G1 X44.80000 Y223.37000 Z11.00000 J282.76 F500.0
+G1 X47.91000 Y225.17000 Z11.00000 J286.28 F500.0
+G1 X47.91000 Y229.37000 Z11.00000 J290.40 F500.0
+G1 X44.80000 Y231.17000 Z11.00000 J293.92 F500.0
+G1 X44.80000 Y233.80000 Z11.00000 J296.50 F500.0
+G1 X51.38000 Y233.80000 Z11.00000 J302.94 F500.0
+G1 X51.38000 Y231.17000 Z11.00000 J305.52 F500.0
+G1 X48.26000 Y229.37000 Z11.00000 J309.05 F500.0
+G1 X48.26000 Y225.17000 Z11.00000 J313.17 F500.0
+G1 X51.38000 Y223.37000 Z11.00000 J316.70 F500.0
+G1 X51.38000 Y219.17000 Z11.00000 J320.81 F500.0
+G1 X48.26000 Y217.37000 Z11.00000 J324.34 F500.0
+G1 X48.26000 Y213.17000 Z11.00000 J328.46 F500.0
+G1 X51.38000 Y211.37000 Z11.00000 J331.99 F500.0
+G1 X51.38000 Y207.17000 Z11.00000 J336.10 F500.0
+G1 X49.53000 Y206.10000 Z11.00000 J338.20 F500.0
+G1 X53.57000 Y206.10000 Z11.00000 J342.16 F500.0
+G1 X51.73000 Y207.17000 Z11.00000 J344.24 F500.0
+G1 X51.73000 Y211.37000 Z11.00000 J348.36 F500.0
+G1 X54.84000 Y213.17000 Z11.00000 J351.88 F500.0
+G1 X54.84000 Y217.37000 Z11.00000 J356.00 F500.0
+G1 X51.73000 Y219.17000 Z11.00000 J359.52 F500.0
+G1 X51.73000 Y223.37000 Z11.00000 J363.64 F500.0
+G1 X54.84000 Y225.17000 Z11.00000 J367.16 F500.0
+G1 X54.84000 Y229.37000 Z11.00000 J371.27 F500.0
+G1 X51.73000 Y231.17000 Z11.00000 J374.79 F500.0
+G1 X51.73000 Y233.80000 Z11.00000 J377.37 F500.0
+G1 X58.31000 Y233.80000 Z11.00000 J383.82 F500.0
+G1 X58.31000 Y231.17000 Z11.00000 J386.40 F500.0
+G1 X55.19000 Y229.37000 Z11.00000 J389.93 F500.0
+G1 X55.19000 Y225.17000 Z11.00000 J394.04 F500.0
+G1 X58.31000 Y223.37000 Z11.00000 J397.57 F500.0
+G1 X58.31000 Y219.17000 Z11.00000 J401.69 F500.0
+G1 X55.19000 Y217.37000 Z11.00000 J405.22 F500.0
+G1 X55.19000 Y213.17000 Z11.00000 J409.34 F500.0
+G1 X58.31000 Y211.37000 Z11.00000 J412.87 F500.0
+G1 X58.31000 Y207.17000 Z11.00000 J416.98 F500.0
+G1 X56.46000 Y206.10000 Z11.00000 J419.08 F500.0
+G1 X60.50000 Y206.10000 Z11.00000 J423.03 F500.0
+G1 X58.65000 Y207.17000 Z11.00000 J425.13 F500.0
+G1 X58.65000 Y211.37000 Z11.00000 J429.25 F500.0
+G1 X61.77000 Y213.17000 Z11.00000 J432.78 F500.0
+G1 X61.77000 Y217.37000 Z11.00000 J436.89 F500.0
+G1 X58.65000 Y219.17000 Z11.00000 J440.42 F500.0
+G1 X58.65000 Y223.37000 Z11.00000 J444.54 F500.0
+G1 X61.77000 Y225.17000 Z11.00000 J448.07 F500.0
+G1 X61.77000 Y229.37000 Z11.00000 J452.18 F500.0
+G1 X58.65000 Y231.17000 Z11.00000 J455.71 F500.0
+G1 X58.65000 Y233.80000 Z11.00000 J458.29 F500.0
+G1 X65.23000 Y233.80000 Z11.00000 J464.74 F500.0
+G1 X65.23000 Y231.17000 Z11.00000 J467.32 F500.0
+G1 X62.12000 Y229.37000 Z11.00000 J470.84 F500.0
+G1 X62.12000 Y225.17000 Z11.00000 J474.95 F500.0
+G1 X65.23000 Y223.37000 Z11.00000 J478.48 F500.0
+G1 X65.23000 Y219.17000 Z11.00000 J482.59 F500.0
+G1 X62.12000 Y217.37000 Z11.00000 J486.11 F500.0
+G1 X62.12000 Y213.17000 Z11.00000 J490.23 F500.0
+G1 X65.23000 Y211.37000 Z11.00000 J493.75 F500.0
+G1 X65.23000 Y207.17000 Z11.00000 J497.87 F500.0
+G1 X63.39000 Y206.10000 Z11.00000 J499.95 F500.0
+G1 X67.43000 Y206.10000 Z11.00000 J503.91 F500.0
+G1 X65.58000 Y207.17000 Z11.00000 J506.01 F500.0
+G1 X65.58000 Y211.37000 Z11.00000 J510.12 F500.0
+G1 X68.70000 Y213.17000 Z11.00000 J513.65 F500.0
+G1 X68.70000 Y217.37000 Z11.00000 J517.77 F500.0
+G1 X65.58000 Y219.17000 Z11.00000 J521.30 F500.0
+G1 X65.58000 Y223.37000 Z11.00000 J525.41 F500.0
+G1 X68.70000 Y225.17000 Z11.00000 J528.94 F500.0
+G1 X68.70000 Y229.37000 Z11.00000 J533.06 F500.0
+G1 X65.58000 Y231.17000 Z11.00000 J536.59 F500.0
+G1 X65.58000 Y233.80000 Z11.00000 J539.17 F500.0
+G1 X72.16000 Y233.80000 Z11.00000 J545.62 F500.0
+G1 X72.16000 Y231.17000 Z11.00000 J548.19 F500.0
+G1 X69.04000 Y229.37000 Z11.00000 J551.72 F500.0
+G1 X69.04000 Y225.17000 Z11.00000 J555.84 F500.0
+G1 X72.16000 Y223.37000 Z11.00000 J559.37 F500.0
+G1 X72.16000 Y219.17000 Z11.00000 J563.48 F500.0
+G1 X69.04000 Y217.37000 Z11.00000 J567.01 F500.0
+G1 X69.04000 Y213.17000 Z11.00000 J571.13 F500.0
+G1 X72.16000 Y211.37000 Z11.00000 J574.66 F500.0
+G1 X72.16000 Y207.17000 Z11.00000 J578.78 F500.0
+G1 X70.32000 Y206.10000 Z11.00000 J580.86 F500.0
+G1 X74.36000 Y206.10000 Z11.00000 J584.82 F500.0
+G1 X72.51000 Y207.17000 Z11.00000 J586.92 F500.0
+G1 X72.51000 Y211.37000 Z11.00000 J591.03 F500.0
+G1 X75.63000 Y213.17000 Z11.00000 J594.56 F500.0
+G1 X75.63000 Y217.37000 Z11.00000 J598.68 F500.0
+G1 X72.51000 Y219.17000 Z11.00000 J602.21 F500.0
+G1 X72.51000 Y223.37000 Z11.00000 J606.32 F500.0
+G1 X75.63000 Y225.17000 Z11.00000 J609.85 F500.0
+G1 X75.63000 Y229.37000 Z11.00000 J613.97 F500.0
+G1 X72.51000 Y231.17000 Z11.00000 J617.50 F500.0
+G1 X72.51000 Y233.80000 Z11.00000 J620.08 F500.0
+G1 X79.09000 Y233.80000 Z11.00000 J626.53 F500.0
+G1 X79.09000 Y231.17000 Z11.00000 J629.10 F500.0
+G1 X75.97000 Y229.37000 Z11.00000 J632.63 F500.0
+G1 X75.97000 Y225.17000 Z11.00000 J636.75 F500.0
+G1 X79.09000 Y223.37000 Z11.00000 J640.28 F500.0
+G1 X79.09000 Y219.17000 Z11.00000 J644.40 F500.0
+G1 X75.97000 Y217.37000 Z11.00000 J647.93 F500.0
+G1 X75.97000 Y213.17000 Z11.00000 J652.04 F500.0
+G1 X79.09000 Y211.37000 Z11.00000 J655.57 F500.0
+G1 X79.09000 Y207.17000 Z11.00000 J659.69 F500.0
+G1 X77.25000 Y206.10000 Z11.00000 J661.77 F500.0
+G1 X81.28000 Y206.10000 Z11.00000 J665.72 F500.0
+G1 X79.44000 Y207.17000 Z11.00000 J667.81 F500.0
+G1 X79.44000 Y211.37000 Z11.00000 J671.92 F500.0
+G1 X82.55000 Y213.17000 Z11.00000 J675.45 F500.0
+G1 X82.55000 Y217.37000 Z11.00000 J679.56 F500.0
+G1 X79.44000 Y219.17000 Z11.00000 J683.08 F500.0
+G1 X79.44000 Y223.37000 Z11.00000 J687.20 F500.0
+G1 X82.55000 Y225.17000 Z11.00000 J690.72 F500.0
+G1 X82.55000 Y229.37000 Z11.00000 J694.84 F500.0
+G1 X79.44000 Y231.17000 Z11.00000 J698.36 F500.0
+G1 X79.44000 Y233.80000 Z11.00000 J700.94 F500.0
+G1 X86.02000 Y233.80000 Z11.00000 J707.38 F500.0
+G1 X86.02000 Y231.17000 Z11.00000 J709.96 F500.0
+G1 X82.90000 Y229.37000 Z11.00000 J713.49 F500.0
+G1 X82.90000 Y225.17000 Z11.00000 J717.61 F500.0
+G1 X86.02000 Y223.37000 Z11.00000 J721.14 F500.0
+G1 X86.02000 Y219.17000 Z11.00000 J725.25 F500.0
+G1 X82.90000 Y217.37000 Z11.00000 J728.78 F500.0
+G1 X82.90000 Y213.17000 Z11.00000 J732.90 F500.0
+G1 X86.02000 Y211.37000 Z11.00000 J736.43 F500.0
+G1 X86.02000 Y207.17000 Z11.00000 J740.55 F500.0
+G1 X84.17000 Y206.10000 Z11.00000 J742.64 F500.0
+G1 X88.21000 Y206.10000 Z11.00000 J746.60 F500.0
+G1 X86.37000 Y207.17000 Z11.00000 J748.68 F500.0
+G1 X86.37000 Y211.37000 Z11.00000 J752.80 F500.0
+G1 X89.48000 Y213.17000 Z11.00000 J756.32 F500.0
+G1 X89.48000 Y217.37000 Z11.00000 J760.44 F500.0
+G1 X86.37000 Y219.17000 Z11.00000 J763.96 F500.0
+G1 X86.37000 Y223.37000 Z11.00000 J768.08 F500.0
+G1 X89.48000 Y225.17000 Z11.00000 J771.60 F500.0
+G1 X89.48000 Y229.37000 Z11.00000 J775.71 F500.0
+G1 X86.37000 Y231.17000 Z11.00000 J779.23 F500.0
+G1 X86.37000 Y233.80000 Z11.00000 J781.81 F500.0
+G1 X92.95000 Y233.80000 Z11.00000 J788.26 F500.0
+G1 X92.95000 Y231.17000 Z11.00000 J790.84 F500.0
+G1 X89.83000 Y229.37000 Z11.00000 J794.37 F500.0
+G1 X89.83000 Y225.17000 Z11.00000 J798.48 F500.0
+G1 X92.95000 Y223.37000 Z11.00000 J802.01 F500.0
+G1 X92.95000 Y219.17000 Z11.00000 J806.13 F500.0
+G1 X89.83000 Y217.37000 Z11.00000 J809.66 F500.0
+G1 X89.83000 Y213.17000 Z11.00000 J813.78 F500.0
+G1 X92.95000 Y211.37000 Z11.00000 J817.31 F500.0
+G1 X92.95000 Y207.17000 Z11.00000 J821.42 F500.0
+G1 X91.10000 Y206.10000 Z11.00000 J823.52 F500.0
+G1 X93.90000 Y206.82000 Z11.00000 J826.35 F500.0
+G1 X93.29000 Y207.17000 Z11.00000 J827.04 F500.0
+G1 X93.29000 Y211.37000 Z11.00000 J831.15 F500.0
+G1 X93.90000 Y211.72000 Z11.00000 J831.84 F500.0
+G1 X93.90000 Y218.82000 Z11.00000 J838.80 F500.0
+G1 X93.29000 Y219.17000 Z11.00000 J839.49 F500.0
+G1 X93.29000 Y223.37000 Z11.00000 J843.61 F500.0
+G1 X93.90000 Y223.72000 Z11.00000 J844.30 F500.0
+G1 X93.90000 Y229.15000 Z11.00000 J854.62 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X93.90000 Y230.82000 Z11.00000 J854.62 F800.0
+G1 X93.29000 Y231.17000 Z11.00000 J854.62 F800.0
+G1 X93.29000 Y233.80000 Z11.00000 J854.62 F800.0
+G1 X93.29000 Y233.80000 Z21.00000 J854.62 F800.0
+G1 X53.36000 Y201.66000 Z21.00000 J864.62 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X58.36000 Y206.66000 Z12.00000 J0.00 F300.0
+G1 X93.34000 Y206.66000 Z12.00000 J34.28 F300.0
+G1 X93.34000 Y222.46000 Z12.00000 J49.76 F300.0
+G1 X93.34000 Y233.24000 Z12.00000 J60.33 F300.0
+G1 X61.74000 Y233.24000 Z12.00000 J91.30 F500.0
+G1 X26.76000 Y233.24000 Z12.00000 J125.58 F500.0
+G1 X26.76000 Y217.44000 Z12.00000 J141.06 F500.0
+G1 X26.76000 Y206.66000 Z12.00000 J151.63 F500.0
+G1 X53.36000 Y206.66000 Z12.00000 J182.69 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X58.36000 Y206.66000 Z12.00000 J182.69 F800.0
+G1 X58.36000 Y206.66000 Z22.00000 J182.69 F800.0
+G1 X53.36000 Y201.66000 Z22.00000 J192.69 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X58.36000 Y206.66000 Z12.00000 J0.00 F300.0
+G1 X26.76000 Y212.95000 Z12.00000 J31.58 F300.0
+G1 X27.13000 Y213.17000 Z12.00000 J32.00 F300.0
+G1 X27.13000 Y217.37000 Z12.00000 J36.12 F300.0
+G1 X26.76000 Y217.58000 Z12.00000 J36.53 F500.0
+G1 X26.76000 Y224.95000 Z12.00000 J43.76 F500.0
+G1 X27.13000 Y225.17000 Z12.00000 J44.18 F500.0
+G1 X27.13000 Y229.37000 Z12.00000 J48.29 F500.0
+G1 X26.76000 Y229.58000 Z12.00000 J48.71 F500.0
+G1 X30.59000 Y233.24000 Z12.00000 J53.90 F500.0
+G1 X30.59000 Y231.17000 Z12.00000 J55.93 F500.0
+G1 X27.48000 Y229.37000 Z12.00000 J59.45 F500.0
+G1 X27.48000 Y225.17000 Z12.00000 J63.57 F500.0
+G1 X30.59000 Y223.37000 Z12.00000 J67.09 F500.0
+G1 X30.59000 Y219.17000 Z12.00000 J71.21 F500.0
+G1 X27.48000 Y217.37000 Z12.00000 J74.73 F500.0
+G1 X27.48000 Y213.17000 Z12.00000 J78.84 F500.0
+G1 X30.59000 Y211.37000 Z12.00000 J82.37 F500.0
+G1 X30.59000 Y207.17000 Z12.00000 J86.48 F500.0
+G1 X29.71000 Y206.66000 Z12.00000 J87.48 F500.0
+G1 X31.83000 Y206.66000 Z12.00000 J89.56 F500.0
+G1 X30.94000 Y207.17000 Z12.00000 J90.56 F500.0
+G1 X30.94000 Y211.37000 Z12.00000 J94.68 F500.0
+G1 X34.06000 Y213.17000 Z12.00000 J98.21 F500.0
+G1 X34.06000 Y217.37000 Z12.00000 J102.32 F500.0
+G1 X30.94000 Y219.17000 Z12.00000 J105.85 F500.0
+G1 X30.94000 Y223.37000 Z12.00000 J109.97 F500.0
+G1 X34.06000 Y225.17000 Z12.00000 J113.50 F500.0
+G1 X34.06000 Y229.37000 Z12.00000 J117.61 F500.0
+G1 X30.94000 Y231.17000 Z12.00000 J121.14 F500.0
+G1 X30.94000 Y233.24000 Z12.00000 J123.17 F500.0
+G1 X37.52000 Y233.24000 Z12.00000 J129.62 F500.0
+G1 X37.52000 Y231.17000 Z12.00000 J131.65 F500.0
+G1 X34.40000 Y229.37000 Z12.00000 J135.18 F500.0
+G1 X34.40000 Y225.17000 Z12.00000 J139.30 F500.0
+G1 X37.52000 Y223.37000 Z12.00000 J142.83 F500.0
+G1 X37.52000 Y219.17000 Z12.00000 J146.94 F500.0
+G1 X34.40000 Y217.37000 Z12.00000 J150.47 F500.0
+G1 X34.40000 Y213.17000 Z12.00000 J154.59 F500.0
+G1 X37.52000 Y211.37000 Z12.00000 J158.12 F500.0
+G1 X37.52000 Y207.17000 Z12.00000 J162.23 F500.0
+G1 X36.64000 Y206.66000 Z12.00000 J163.23 F500.0
+G1 X38.76000 Y206.66000 Z12.00000 J165.31 F500.0
+G1 X37.87000 Y207.17000 Z12.00000 J166.31 F500.0
+G1 X37.87000 Y211.37000 Z12.00000 J170.43 F500.0
+G1 X40.99000 Y213.17000 Z12.00000 J173.96 F500.0
+G1 X40.99000 Y217.37000 Z12.00000 J178.08 F500.0
+G1 X37.87000 Y219.17000 Z12.00000 J181.61 F500.0
+G1 X37.87000 Y223.37000 Z12.00000 J185.72 F500.0
+G1 X40.99000 Y225.17000 Z12.00000 J189.25 F500.0
+G1 X40.99000 Y229.37000 Z12.00000 J193.37 F500.0
+G1 X37.87000 Y231.17000 Z12.00000 J196.90 F500.0
+G1 X37.87000 Y233.24000 Z12.00000 J198.93 F500.0
+G1 X44.45000 Y233.24000 Z12.00000 J205.37 F500.0
+G1 X44.45000 Y231.17000 Z12.00000 J207.40 F500.0
+G1 X41.33000 Y229.37000 Z12.00000 J210.93 F500.0
+G1 X41.33000 Y225.17000 Z12.00000 J215.05 F500.0
+G1 X44.45000 Y223.37000 Z12.00000 J218.58 F500.0
+G1 X44.45000 Y219.17000 Z12.00000 J222.70 F500.0
+G1 X41.33000 Y217.37000 Z12.00000 J226.23 F500.0
+G1 X41.33000 Y213.17000 Z12.00000 J230.34 F500.0
+G1 X44.45000 Y211.37000 Z12.00000 J233.87 F500.0
+G1 X44.45000 Y207.17000 Z12.00000 J237.99 F500.0
+G1 X43.56000 Y206.66000 Z12.00000 J238.99 F500.0
+G1 X45.68000 Y206.66000 Z12.00000 J241.07 F500.0
+G1 X44.80000 Y207.17000 Z12.00000 J242.07 F500.0
+G1 X44.80000 Y211.37000 Z12.00000 J246.18 F500.0
+G1 X47.91000 Y213.17000 Z12.00000 J249.70 F500.0
+G1 X47.91000 Y217.37000 Z12.00000 J253.82 F500.0
+G1 X44.80000 Y219.17000 Z12.00000 J257.34 F500.0
+G1 X44.80000 Y223.37000 Z12.00000 J261.46 F500.0
+G1 X47.91000 Y225.17000 Z12.00000 J264.98 F500.0
+G1 X47.91000 Y229.37000 Z12.00000 J269.10 F500.0
+G1 X44.80000 Y231.17000 Z12.00000 J272.62 F500.0
+G1 X44.80000 Y233.24000 Z12.00000 J274.65 F500.0
+G1 X51.38000 Y233.24000 Z12.00000 J281.09 F500.0
+G1 X51.38000 Y231.17000 Z12.00000 J283.12 F500.0
+G1 X48.26000 Y229.37000 Z12.00000 J286.65 F500.0
+G1 X48.26000 Y225.17000 Z12.00000 J290.77 F500.0
+G1 X51.38000 Y223.37000 Z12.00000 J294.30 F500.0
+G1 X51.38000 Y219.17000 Z12.00000 J298.41 F500.0
+G1 X48.26000 Y217.37000 Z12.00000 J301.94 F500.0
+G1 X48.26000 Y213.17000 Z12.00000 J306.06 F500.0
+G1 X51.38000 Y211.37000 Z12.00000 J309.59 F500.0
+G1 X51.38000 Y207.17000 Z12.00000 J313.71 F500.0
+G1 X50.49000 Y206.66000 Z12.00000 J314.71 F500.0
+G1 X52.61000 Y206.66000 Z12.00000 J316.79 F500.0
+G1 X51.73000 Y207.17000 Z12.00000 J317.79 F500.0
+G1 X51.73000 Y211.37000 Z12.00000 J321.90 F500.0
+G1 X54.84000 Y213.17000 Z12.00000 J325.42 F500.0
+G1 X54.84000 Y217.37000 Z12.00000 J329.54 F500.0
+G1 X51.73000 Y219.17000 Z12.00000 J333.06 F500.0
+G1 X51.73000 Y223.37000 Z12.00000 J337.18 F500.0
+G1 X54.84000 Y225.17000 Z12.00000 J340.70 F500.0
+G1 X54.84000 Y229.37000 Z12.00000 J344.81 F500.0
+G1 X51.73000 Y231.17000 Z12.00000 J348.34 F500.0
+G1 X51.73000 Y233.24000 Z12.00000 J350.36 F500.0
+G1 X58.31000 Y233.24000 Z12.00000 J356.81 F500.0
+G1 X58.31000 Y231.17000 Z12.00000 J358.84 F500.0
+G1 X55.19000 Y229.37000 Z12.00000 J362.37 F500.0
+G1 X55.19000 Y225.17000 Z12.00000 J366.49 F500.0
+G1 X58.31000 Y223.37000 Z12.00000 J370.02 F500.0
+G1 X58.31000 Y219.17000 Z12.00000 J374.13 F500.0
+G1 X55.19000 Y217.37000 Z12.00000 J377.66 F500.0
+G1 X55.19000 Y213.17000 Z12.00000 J381.78 F500.0
+G1 X58.31000 Y211.37000 Z12.00000 J385.31 F500.0
+G1 X58.31000 Y207.17000 Z12.00000 J389.43 F500.0
+G1 X57.42000 Y206.66000 Z12.00000 J390.43 F500.0
+G1 X59.54000 Y206.66000 Z12.00000 J392.51 F500.0
+G1 X58.65000 Y207.17000 Z12.00000 J393.51 F500.0
+G1 X58.65000 Y211.37000 Z12.00000 J397.63 F500.0
+G1 X61.77000 Y213.17000 Z12.00000 J401.16 F500.0
+G1 X61.77000 Y217.37000 Z12.00000 J405.28 F500.0
+G1 X58.65000 Y219.17000 Z12.00000 J408.81 F500.0
+G1 X58.65000 Y223.37000 Z12.00000 J412.92 F500.0
+G1 X61.77000 Y225.17000 Z12.00000 J416.45 F500.0
+G1 X61.77000 Y229.37000 Z12.00000 J420.57 F500.0
+G1 X58.65000 Y231.17000 Z12.00000 J424.10 F500.0
+G1 X58.65000 Y233.24000 Z12.00000 J426.13 F500.0
+G1 X65.23000 Y233.24000 Z12.00000 J432.57 F500.0
+G1 X65.23000 Y231.17000 Z12.00000 J434.60 F500.0
+G1 X62.12000 Y229.37000 Z12.00000 J438.12 F500.0
+G1 X62.12000 Y225.17000 Z12.00000 J442.24 F500.0
+G1 X65.23000 Y223.37000 Z12.00000 J445.76 F500.0
+G1 X65.23000 Y219.17000 Z12.00000 J449.88 F500.0
+G1 X62.12000 Y217.37000 Z12.00000 J453.40 F500.0
+G1 X62.12000 Y213.17000 Z12.00000 J457.52 F500.0
+G1 X65.23000 Y211.37000 Z12.00000 J461.04 F500.0
+G1 X65.23000 Y207.17000 Z12.00000 J465.15 F500.0
+G1 X64.35000 Y206.66000 Z12.00000 J466.15 F500.0
+G1 X66.47000 Y206.66000 Z12.00000 J468.23 F500.0
+G1 X65.58000 Y207.17000 Z12.00000 J469.23 F500.0
+G1 X65.58000 Y211.37000 Z12.00000 J473.35 F500.0
+G1 X68.70000 Y213.17000 Z12.00000 J476.88 F500.0
+G1 X68.70000 Y217.37000 Z12.00000 J480.99 F500.0
+G1 X65.58000 Y219.17000 Z12.00000 J484.52 F500.0
+G1 X65.58000 Y223.37000 Z12.00000 J488.64 F500.0
+G1 X68.70000 Y225.17000 Z12.00000 J492.17 F500.0
+G1 X68.70000 Y229.37000 Z12.00000 J496.29 F500.0
+G1 X65.58000 Y231.17000 Z12.00000 J499.82 F500.0
+G1 X65.58000 Y233.24000 Z12.00000 J501.84 F500.0
+G1 X72.16000 Y233.24000 Z12.00000 J508.29 F500.0
+G1 X72.16000 Y231.17000 Z12.00000 J510.32 F500.0
+G1 X69.04000 Y229.37000 Z12.00000 J513.85 F500.0
+G1 X69.04000 Y225.17000 Z12.00000 J517.97 F500.0
+G1 X72.16000 Y223.37000 Z12.00000 J521.50 F500.0
+G1 X72.16000 Y219.17000 Z12.00000 J525.61 F500.0
+G1 X69.04000 Y217.37000 Z12.00000 J529.14 F500.0
+G1 X69.04000 Y213.17000 Z12.00000 J533.26 F500.0
+G1 X72.16000 Y211.37000 Z12.00000 J536.79 F500.0
+G1 X72.16000 Y207.17000 Z12.00000 J540.91 F500.0
+G1 X71.28000 Y206.66000 Z12.00000 J541.90 F500.0
+G1 X73.40000 Y206.66000 Z12.00000 J543.98 F500.0
+G1 X72.51000 Y207.17000 Z12.00000 J544.99 F500.0
+G1 X72.51000 Y211.37000 Z12.00000 J549.10 F500.0
+G1 X75.63000 Y213.17000 Z12.00000 J552.63 F500.0
+G1 X75.63000 Y217.37000 Z12.00000 J556.75 F500.0
+G1 X72.51000 Y219.17000 Z12.00000 J560.28 F500.0
+G1 X72.51000 Y223.37000 Z12.00000 J564.39 F500.0
+G1 X75.63000 Y225.17000 Z12.00000 J567.92 F500.0
+G1 X75.63000 Y229.37000 Z12.00000 J572.04 F500.0
+G1 X72.51000 Y231.17000 Z12.00000 J575.57 F500.0
+G1 X72.51000 Y233.24000 Z12.00000 J577.60 F500.0
+G1 X79.09000 Y233.24000 Z12.00000 J584.05 F500.0
+G1 X79.09000 Y231.17000 Z12.00000 J586.07 F500.0
+G1 X75.97000 Y229.37000 Z12.00000 J589.60 F500.0
+G1 X75.97000 Y225.17000 Z12.00000 J593.72 F500.0
+G1 X79.09000 Y223.37000 Z12.00000 J597.25 F500.0
+G1 X79.09000 Y219.17000 Z12.00000 J601.37 F500.0
+G1 X75.97000 Y217.37000 Z12.00000 J604.90 F500.0
+G1 X75.97000 Y213.17000 Z12.00000 J609.01 F500.0
+G1 X79.09000 Y211.37000 Z12.00000 J612.54 F500.0
+G1 X79.09000 Y207.17000 Z12.00000 J616.66 F500.0
+G1 X78.21000 Y206.66000 Z12.00000 J617.66 F500.0
+G1 X80.32000 Y206.66000 Z12.00000 J619.72 F500.0
+G1 X79.44000 Y207.17000 Z12.00000 J620.72 F500.0
+G1 X79.44000 Y211.37000 Z12.00000 J624.84 F500.0
+G1 X82.55000 Y213.17000 Z12.00000 J628.36 F500.0
+G1 X82.55000 Y217.37000 Z12.00000 J632.47 F500.0
+G1 X79.44000 Y219.17000 Z12.00000 J635.99 F500.0
+G1 X79.44000 Y223.37000 Z12.00000 J640.11 F500.0
+G1 X82.55000 Y225.17000 Z12.00000 J643.63 F500.0
+G1 X82.55000 Y229.37000 Z12.00000 J647.75 F500.0
+G1 X79.44000 Y231.17000 Z12.00000 J651.27 F500.0
+G1 X79.44000 Y233.24000 Z12.00000 J653.30 F500.0
+G1 X86.02000 Y233.24000 Z12.00000 J659.75 F500.0
+G1 X86.02000 Y231.17000 Z12.00000 J661.78 F500.0
+G1 X82.90000 Y229.37000 Z12.00000 J665.31 F500.0
+G1 X82.90000 Y225.17000 Z12.00000 J669.42 F500.0
+G1 X86.02000 Y223.37000 Z12.00000 J672.95 F500.0
+G1 X86.02000 Y219.17000 Z12.00000 J677.07 F500.0
+G1 X82.90000 Y217.37000 Z12.00000 J680.60 F500.0
+G1 X82.90000 Y213.17000 Z12.00000 J684.71 F500.0
+G1 X86.02000 Y211.37000 Z12.00000 J688.24 F500.0
+G1 X86.02000 Y207.17000 Z12.00000 J692.36 F500.0
+G1 X85.13000 Y206.66000 Z12.00000 J693.36 F500.0
+G1 X87.25000 Y206.66000 Z12.00000 J695.44 F500.0
+G1 X86.37000 Y207.17000 Z12.00000 J696.44 F500.0
+G1 X86.37000 Y211.37000 Z12.00000 J700.55 F500.0
+G1 X89.48000 Y213.17000 Z12.00000 J704.08 F500.0
+G1 X89.48000 Y217.37000 Z12.00000 J708.19 F500.0
+G1 X86.37000 Y219.17000 Z12.00000 J711.71 F500.0
+G1 X86.37000 Y223.37000 Z12.00000 J715.83 F500.0
+G1 X89.48000 Y225.17000 Z12.00000 J719.35 F500.0
+G1 X89.48000 Y229.37000 Z12.00000 J723.47 F500.0
+G1 X86.37000 Y231.17000 Z12.00000 J726.99 F500.0
+G1 X86.37000 Y233.24000 Z12.00000 J729.02 F500.0
+G1 X92.95000 Y233.24000 Z12.00000 J735.47 F500.0
+G1 X92.95000 Y231.17000 Z12.00000 J737.49 F500.0
+G1 X89.83000 Y229.37000 Z12.00000 J741.02 F500.0
+G1 X89.83000 Y225.17000 Z12.00000 J745.14 F500.0
+G1 X92.95000 Y223.37000 Z12.00000 J748.67 F500.0
+G1 X92.95000 Y219.17000 Z12.00000 J752.79 F500.0
+G1 X89.83000 Y217.37000 Z12.00000 J756.32 F500.0
+G1 X89.83000 Y213.17000 Z12.00000 J760.43 F500.0
+G1 X92.95000 Y211.37000 Z12.00000 J763.96 F500.0
+G1 X92.95000 Y207.17000 Z12.00000 J768.08 F500.0
+G1 X92.06000 Y206.66000 Z12.00000 J769.08 F500.0
+G1 X93.34000 Y207.14000 Z12.00000 J770.42 F500.0
+G1 X93.29000 Y207.17000 Z12.00000 J770.48 F500.0
+G1 X93.29000 Y211.37000 Z12.00000 J774.60 F500.0
+G1 X93.34000 Y211.40000 Z12.00000 J774.65 F500.0
+G1 X93.34000 Y219.14000 Z12.00000 J782.24 F500.0
+G1 X93.29000 Y219.17000 Z12.00000 J782.30 F500.0
+G1 X93.29000 Y223.37000 Z12.00000 J786.41 F500.0
+G1 X93.34000 Y223.40000 Z12.00000 J786.47 F500.0
+G1 X93.34000 Y228.27000 Z12.00000 J796.24 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X93.34000 Y231.14000 Z12.00000 J796.24 F800.0
+G1 X93.29000 Y231.17000 Z12.00000 J796.24 F800.0
+G1 X93.29000 Y233.24000 Z12.00000 J796.24 F800.0
+G1 X93.29000 Y233.24000 Z22.00000 J796.24 F800.0
+G1 X87.79000 Y202.21000 Z22.00000 J806.24 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X92.79000 Y207.21000 Z13.00000 J0.00 F300.0
+G1 X92.79000 Y221.01000 Z13.00000 J13.52 F300.0
+G1 X92.79000 Y232.69000 Z13.00000 J24.97 F300.0
+G1 X65.19000 Y232.69000 Z13.00000 J52.02 F300.0
+G1 X27.31000 Y232.69000 Z13.00000 J89.14 F500.0
+G1 X27.31000 Y218.89000 Z13.00000 J102.66 F500.0
+G1 X27.31000 Y207.21000 Z13.00000 J114.11 F500.0
+G1 X54.91000 Y207.21000 Z13.00000 J141.16 F500.0
+G1 X87.79000 Y207.21000 Z13.00000 J178.38 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X92.79000 Y207.21000 Z13.00000 J178.38 F800.0
+G1 X92.79000 Y207.21000 Z23.00000 J178.38 F800.0
+G1 X87.79000 Y202.21000 Z23.00000 J188.38 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X92.79000 Y207.21000 Z13.00000 J0.00 F300.0
+G1 X30.59000 Y232.69000 Z13.00000 J65.87 F300.0
+G1 X30.59000 Y231.17000 Z13.00000 J67.36 F300.0
+G1 X27.48000 Y229.37000 Z13.00000 J70.88 F300.0
+G1 X27.48000 Y225.17000 Z13.00000 J75.00 F500.0
+G1 X30.59000 Y223.37000 Z13.00000 J78.52 F500.0
+G1 X30.59000 Y219.17000 Z13.00000 J82.64 F500.0
+G1 X27.48000 Y217.37000 Z13.00000 J86.16 F500.0
+G1 X27.48000 Y213.17000 Z13.00000 J90.28 F500.0
+G1 X30.59000 Y211.37000 Z13.00000 J93.80 F500.0
+G1 X30.59000 Y207.21000 Z13.00000 J97.87 F500.0
+G1 X30.94000 Y207.21000 Z13.00000 J98.22 F500.0
+G1 X30.94000 Y211.37000 Z13.00000 J102.29 F500.0
+G1 X34.06000 Y213.17000 Z13.00000 J105.82 F500.0
+G1 X34.06000 Y217.37000 Z13.00000 J109.94 F500.0
+G1 X30.94000 Y219.17000 Z13.00000 J113.47 F500.0
+G1 X30.94000 Y223.37000 Z13.00000 J117.59 F500.0
+G1 X34.06000 Y225.17000 Z13.00000 J121.12 F500.0
+G1 X34.06000 Y229.37000 Z13.00000 J125.23 F500.0
+G1 X30.94000 Y231.17000 Z13.00000 J128.76 F500.0
+G1 X30.94000 Y232.69000 Z13.00000 J130.25 F500.0
+G1 X37.52000 Y232.69000 Z13.00000 J136.70 F500.0
+G1 X37.52000 Y231.17000 Z13.00000 J138.19 F500.0
+G1 X34.40000 Y229.37000 Z13.00000 J141.72 F500.0
+G1 X34.40000 Y225.17000 Z13.00000 J145.84 F500.0
+G1 X37.52000 Y223.37000 Z13.00000 J149.37 F500.0
+G1 X37.52000 Y219.17000 Z13.00000 J153.48 F500.0
+G1 X34.40000 Y217.37000 Z13.00000 J157.01 F500.0
+G1 X34.40000 Y213.17000 Z13.00000 J161.13 F500.0
+G1 X37.52000 Y211.37000 Z13.00000 J164.66 F500.0
+G1 X37.52000 Y207.21000 Z13.00000 J168.73 F500.0
+G1 X37.87000 Y207.21000 Z13.00000 J169.08 F500.0
+G1 X37.87000 Y211.37000 Z13.00000 J173.15 F500.0
+G1 X40.99000 Y213.17000 Z13.00000 J176.68 F500.0
+G1 X40.99000 Y217.37000 Z13.00000 J180.80 F500.0
+G1 X37.87000 Y219.17000 Z13.00000 J184.33 F500.0
+G1 X37.87000 Y223.37000 Z13.00000 J188.45 F500.0
+G1 X40.99000 Y225.17000 Z13.00000 J191.98 F500.0
+G1 X40.99000 Y229.37000 Z13.00000 J196.09 F500.0
+G1 X37.87000 Y231.17000 Z13.00000 J199.62 F500.0
+G1 X37.87000 Y232.69000 Z13.00000 J201.11 F500.0
+G1 X44.45000 Y232.69000 Z13.00000 J207.56 F500.0
+G1 X44.45000 Y231.17000 Z13.00000 J209.05 F500.0
+G1 X41.33000 Y229.37000 Z13.00000 J212.58 F500.0
+G1 X41.33000 Y225.17000 Z13.00000 J216.70 F500.0
+G1 X44.45000 Y223.37000 Z13.00000 J220.23 F500.0
+G1 X44.45000 Y219.17000 Z13.00000 J224.34 F500.0
+G1 X41.33000 Y217.37000 Z13.00000 J227.87 F500.0
+G1 X41.33000 Y213.17000 Z13.00000 J231.99 F500.0
+G1 X44.45000 Y211.37000 Z13.00000 J235.52 F500.0
+G1 X44.45000 Y207.21000 Z13.00000 J239.59 F500.0
+G1 X44.80000 Y207.21000 Z13.00000 J239.94 F500.0
+G1 X44.80000 Y211.37000 Z13.00000 J244.01 F500.0
+G1 X47.91000 Y213.17000 Z13.00000 J247.54 F500.0
+G1 X47.91000 Y217.37000 Z13.00000 J251.65 F500.0
+G1 X44.80000 Y219.17000 Z13.00000 J255.17 F500.0
+G1 X44.80000 Y223.37000 Z13.00000 J259.29 F500.0
+G1 X47.91000 Y225.17000 Z13.00000 J262.81 F500.0
+G1 X47.91000 Y229.37000 Z13.00000 J266.93 F500.0
+G1 X44.80000 Y231.17000 Z13.00000 J270.45 F500.0
+G1 X44.80000 Y232.69000 Z13.00000 J271.94 F500.0
+G1 X51.38000 Y232.69000 Z13.00000 J278.39 F500.0
+G1 X51.38000 Y231.17000 Z13.00000 J279.88 F500.0
+G1 X48.26000 Y229.37000 Z13.00000 J283.41 F500.0
+G1 X48.26000 Y225.17000 Z13.00000 J287.52 F500.0
+G1 X51.38000 Y223.37000 Z13.00000 J291.05 F500.0
+G1 X51.38000 Y219.17000 Z13.00000 J295.17 F500.0
+G1 X48.26000 Y217.37000 Z13.00000 J298.70 F500.0
+G1 X48.26000 Y213.17000 Z13.00000 J302.81 F500.0
+G1 X51.38000 Y211.37000 Z13.00000 J306.34 F500.0
+G1 X51.38000 Y207.21000 Z13.00000 J310.42 F500.0
+G1 X51.73000 Y207.21000 Z13.00000 J310.76 F500.0
+G1 X51.73000 Y211.37000 Z13.00000 J314.84 F500.0
+G1 X54.84000 Y213.17000 Z13.00000 J318.36 F500.0
+G1 X54.84000 Y217.37000 Z13.00000 J322.48 F500.0
+G1 X51.73000 Y219.17000 Z13.00000 J326.00 F500.0
+G1 X51.73000 Y223.37000 Z13.00000 J330.11 F500.0
+G1 X54.84000 Y225.17000 Z13.00000 J333.64 F500.0
+G1 X54.84000 Y229.37000 Z13.00000 J337.75 F500.0
+G1 X51.73000 Y231.17000 Z13.00000 J341.27 F500.0
+G1 X51.73000 Y232.69000 Z13.00000 J342.76 F500.0
+G1 X58.31000 Y232.69000 Z13.00000 J349.21 F500.0
+G1 X58.31000 Y231.17000 Z13.00000 J350.70 F500.0
+G1 X55.19000 Y229.37000 Z13.00000 J354.23 F500.0
+G1 X55.19000 Y225.17000 Z13.00000 J358.35 F500.0
+G1 X58.31000 Y223.37000 Z13.00000 J361.88 F500.0
+G1 X58.31000 Y219.17000 Z13.00000 J365.99 F500.0
+G1 X55.19000 Y217.37000 Z13.00000 J369.52 F500.0
+G1 X55.19000 Y213.17000 Z13.00000 J373.64 F500.0
+G1 X58.31000 Y211.37000 Z13.00000 J377.17 F500.0
+G1 X58.31000 Y207.21000 Z13.00000 J381.25 F500.0
+G1 X58.65000 Y207.21000 Z13.00000 J381.58 F500.0
+G1 X58.65000 Y211.37000 Z13.00000 J385.66 F500.0
+G1 X61.77000 Y213.17000 Z13.00000 J389.19 F500.0
+G1 X61.77000 Y217.37000 Z13.00000 J393.30 F500.0
+G1 X58.65000 Y219.17000 Z13.00000 J396.83 F500.0
+G1 X58.65000 Y223.37000 Z13.00000 J400.95 F500.0
+G1 X61.77000 Y225.17000 Z13.00000 J404.48 F500.0
+G1 X61.77000 Y229.37000 Z13.00000 J408.59 F500.0
+G1 X58.65000 Y231.17000 Z13.00000 J412.12 F500.0
+G1 X58.65000 Y232.69000 Z13.00000 J413.61 F500.0
+G1 X65.23000 Y232.69000 Z13.00000 J420.06 F500.0
+G1 X65.23000 Y231.17000 Z13.00000 J421.55 F500.0
+G1 X62.12000 Y229.37000 Z13.00000 J425.07 F500.0
+G1 X62.12000 Y225.17000 Z13.00000 J429.19 F500.0
+G1 X65.23000 Y223.37000 Z13.00000 J432.71 F500.0
+G1 X65.23000 Y219.17000 Z13.00000 J436.83 F500.0
+G1 X62.12000 Y217.37000 Z13.00000 J440.35 F500.0
+G1 X62.12000 Y213.17000 Z13.00000 J444.46 F500.0
+G1 X65.23000 Y211.37000 Z13.00000 J447.99 F500.0
+G1 X65.23000 Y207.21000 Z13.00000 J452.06 F500.0
+G1 X65.58000 Y207.21000 Z13.00000 J452.40 F500.0
+G1 X65.58000 Y211.37000 Z13.00000 J456.48 F500.0
+G1 X68.70000 Y213.17000 Z13.00000 J460.01 F500.0
+G1 X68.70000 Y217.37000 Z13.00000 J464.13 F500.0
+G1 X65.58000 Y219.17000 Z13.00000 J467.66 F500.0
+G1 X65.58000 Y223.37000 Z13.00000 J471.77 F500.0
+G1 X68.70000 Y225.17000 Z13.00000 J475.30 F500.0
+G1 X68.70000 Y229.37000 Z13.00000 J479.42 F500.0
+G1 X65.58000 Y231.17000 Z13.00000 J482.95 F500.0
+G1 X65.58000 Y232.69000 Z13.00000 J484.44 F500.0
+G1 X72.16000 Y232.69000 Z13.00000 J490.89 F500.0
+G1 X72.16000 Y231.17000 Z13.00000 J492.38 F500.0
+G1 X69.04000 Y229.37000 Z13.00000 J495.91 F500.0
+G1 X69.04000 Y225.17000 Z13.00000 J500.02 F500.0
+G1 X72.16000 Y223.37000 Z13.00000 J503.55 F500.0
+G1 X72.16000 Y219.17000 Z13.00000 J507.67 F500.0
+G1 X69.04000 Y217.37000 Z13.00000 J511.20 F500.0
+G1 X69.04000 Y213.17000 Z13.00000 J515.32 F500.0
+G1 X72.16000 Y211.37000 Z13.00000 J518.84 F500.0
+G1 X72.16000 Y207.21000 Z13.00000 J522.92 F500.0
+G1 X72.51000 Y207.21000 Z13.00000 J523.26 F500.0
+G1 X72.51000 Y211.37000 Z13.00000 J527.34 F500.0
+G1 X75.63000 Y213.17000 Z13.00000 J530.87 F500.0
+G1 X75.63000 Y217.37000 Z13.00000 J534.99 F500.0
+G1 X72.51000 Y219.17000 Z13.00000 J538.52 F500.0
+G1 X72.51000 Y223.37000 Z13.00000 J542.63 F500.0
+G1 X75.63000 Y225.17000 Z13.00000 J546.16 F500.0
+G1 X75.63000 Y229.37000 Z13.00000 J550.28 F500.0
+G1 X72.51000 Y231.17000 Z13.00000 J553.81 F500.0
+G1 X72.51000 Y232.69000 Z13.00000 J555.30 F500.0
+G1 X79.09000 Y232.69000 Z13.00000 J561.75 F500.0
+G1 X79.09000 Y231.17000 Z13.00000 J563.24 F500.0
+G1 X75.97000 Y229.37000 Z13.00000 J566.77 F500.0
+G1 X75.97000 Y225.17000 Z13.00000 J570.88 F500.0
+G1 X79.09000 Y223.37000 Z13.00000 J574.41 F500.0
+G1 X79.09000 Y219.17000 Z13.00000 J578.53 F500.0
+G1 X75.97000 Y217.37000 Z13.00000 J582.06 F500.0
+G1 X75.97000 Y213.17000 Z13.00000 J586.17 F500.0
+G1 X79.09000 Y211.37000 Z13.00000 J589.70 F500.0
+G1 X79.09000 Y207.21000 Z13.00000 J593.78 F500.0
+G1 X79.44000 Y207.21000 Z13.00000 J594.12 F500.0
+G1 X79.44000 Y211.37000 Z13.00000 J598.20 F500.0
+G1 X82.55000 Y213.17000 Z13.00000 J601.72 F500.0
+G1 X82.55000 Y217.37000 Z13.00000 J605.84 F500.0
+G1 X79.44000 Y219.17000 Z13.00000 J609.36 F500.0
+G1 X79.44000 Y223.37000 Z13.00000 J613.48 F500.0
+G1 X82.55000 Y225.17000 Z13.00000 J617.00 F500.0
+G1 X82.55000 Y229.37000 Z13.00000 J621.11 F500.0
+G1 X79.44000 Y231.17000 Z13.00000 J624.64 F500.0
+G1 X79.44000 Y232.69000 Z13.00000 J626.12 F500.0
+G1 X86.02000 Y232.69000 Z13.00000 J632.57 F500.0
+G1 X86.02000 Y231.17000 Z13.00000 J634.06 F500.0
+G1 X82.90000 Y229.37000 Z13.00000 J637.59 F500.0
+G1 X82.90000 Y225.17000 Z13.00000 J641.71 F500.0
+G1 X86.02000 Y223.37000 Z13.00000 J645.24 F500.0
+G1 X86.02000 Y219.17000 Z13.00000 J649.35 F500.0
+G1 X82.90000 Y217.37000 Z13.00000 J652.88 F500.0
+G1 X82.90000 Y213.17000 Z13.00000 J657.00 F500.0
+G1 X86.02000 Y211.37000 Z13.00000 J660.53 F500.0
+G1 X86.02000 Y207.21000 Z13.00000 J664.61 F500.0
+G1 X86.37000 Y207.21000 Z13.00000 J664.95 F500.0
+G1 X86.37000 Y211.37000 Z13.00000 J669.03 F500.0
+G1 X89.48000 Y213.17000 Z13.00000 J672.55 F500.0
+G1 X89.48000 Y217.37000 Z13.00000 J676.66 F500.0
+G1 X86.37000 Y219.17000 Z13.00000 J680.19 F500.0
+G1 X86.37000 Y223.37000 Z13.00000 J684.30 F500.0
+G1 X89.48000 Y225.17000 Z13.00000 J687.82 F500.0
+G1 X89.48000 Y229.37000 Z13.00000 J691.94 F500.0
+G1 X86.37000 Y231.17000 Z13.00000 J695.46 F500.0
+G1 X86.37000 Y232.69000 Z13.00000 J696.95 F500.0
+G1 X92.79000 Y231.08000 Z13.00000 J703.44 F500.0
+G1 X89.83000 Y229.37000 Z13.00000 J706.79 F500.0
+G1 X89.83000 Y225.17000 Z13.00000 J710.90 F500.0
+G1 X92.79000 Y223.46000 Z13.00000 J714.25 F500.0
+G1 X92.79000 Y219.08000 Z13.00000 J718.55 F500.0
+G1 X89.83000 Y217.37000 Z13.00000 J721.90 F500.0
+G1 X89.83000 Y214.75000 Z13.00000 J729.46 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X89.83000 Y213.17000 Z13.00000 J729.46 F800.0
+G1 X92.79000 Y211.46000 Z13.00000 J729.46 F800.0
+G1 X92.79000 Y211.46000 Z23.00000 J729.46 F800.0
+G1 X87.23000 Y202.77000 Z23.00000 J739.46 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X92.23000 Y207.77000 Z14.00000 J0.00 F300.0
+G1 X92.23000 Y219.57000 Z14.00000 J11.56 F300.0
+G1 X92.23000 Y232.13000 Z14.00000 J23.87 F300.0
+G1 X68.63000 Y232.13000 Z14.00000 J47.00 F300.0
+G1 X27.87000 Y232.13000 Z14.00000 J86.95 F500.0
+G1 X27.87000 Y220.33000 Z14.00000 J98.51 F500.0
+G1 X27.87000 Y207.77000 Z14.00000 J110.82 F500.0
+G1 X51.47000 Y207.77000 Z14.00000 J133.95 F500.0
+G1 X87.23000 Y207.77000 Z14.00000 J173.99 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X92.23000 Y207.77000 Z14.00000 J173.99 F800.0
+G1 X92.23000 Y207.77000 Z24.00000 J173.99 F800.0
+G1 X87.23000 Y202.77000 Z24.00000 J183.99 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X92.23000 Y207.77000 Z14.00000 J0.00 F300.0
+G1 X30.59000 Y232.13000 Z14.00000 J64.95 F300.0
+G1 X30.59000 Y231.17000 Z14.00000 J65.90 F300.0
+G1 X27.87000 Y229.59000 Z14.00000 J68.98 F300.0
+G1 X27.87000 Y224.94000 Z14.00000 J73.54 F500.0
+G1 X30.59000 Y223.37000 Z14.00000 J76.61 F500.0
+G1 X30.59000 Y219.17000 Z14.00000 J80.73 F500.0
+G1 X27.87000 Y217.59000 Z14.00000 J83.81 F500.0
+G1 X27.87000 Y212.94000 Z14.00000 J88.37 F500.0
+G1 X30.59000 Y211.37000 Z14.00000 J91.45 F500.0
+G1 X30.59000 Y207.77000 Z14.00000 J94.97 F500.0
+G1 X30.94000 Y207.77000 Z14.00000 J95.32 F500.0
+G1 X30.94000 Y211.37000 Z14.00000 J98.85 F500.0
+G1 X34.06000 Y213.17000 Z14.00000 J102.38 F500.0
+G1 X34.06000 Y217.37000 Z14.00000 J106.49 F500.0
+G1 X30.94000 Y219.17000 Z14.00000 J110.02 F500.0
+G1 X30.94000 Y223.37000 Z14.00000 J114.14 F500.0
+G1 X34.06000 Y225.17000 Z14.00000 J117.67 F500.0
+G1 X34.06000 Y229.37000 Z14.00000 J121.78 F500.0
+G1 X30.94000 Y231.17000 Z14.00000 J125.31 F500.0
+G1 X30.94000 Y232.13000 Z14.00000 J126.25 F500.0
+G1 X37.52000 Y232.13000 Z14.00000 J132.70 F500.0
+G1 X37.52000 Y231.17000 Z14.00000 J133.64 F500.0
+G1 X34.40000 Y229.37000 Z14.00000 J137.17 F500.0
+G1 X34.40000 Y225.17000 Z14.00000 J141.29 F500.0
+G1 X37.52000 Y223.37000 Z14.00000 J144.82 F500.0
+G1 X37.52000 Y219.17000 Z14.00000 J148.94 F500.0
+G1 X34.40000 Y217.37000 Z14.00000 J152.47 F500.0
+G1 X34.40000 Y213.17000 Z14.00000 J156.58 F500.0
+G1 X37.52000 Y211.37000 Z14.00000 J160.11 F500.0
+G1 X37.52000 Y207.77000 Z14.00000 J163.64 F500.0
+G1 X37.87000 Y207.77000 Z14.00000 J163.98 F500.0
+G1 X37.87000 Y211.37000 Z14.00000 J167.51 F500.0
+G1 X40.99000 Y213.17000 Z14.00000 J171.04 F500.0
+G1 X40.99000 Y217.37000 Z14.00000 J175.16 F500.0
+G1 X37.87000 Y219.17000 Z14.00000 J178.69 F500.0
+G1 X37.87000 Y223.37000 Z14.00000 J182.80 F500.0
+G1 X40.99000 Y225.17000 Z14.00000 J186.33 F500.0
+G1 X40.99000 Y229.37000 Z14.00000 J190.45 F500.0
+G1 X37.87000 Y231.17000 Z14.00000 J193.98 F500.0
+G1 X37.87000 Y232.13000 Z14.00000 J194.92 F500.0
+G1 X44.45000 Y232.13000 Z14.00000 J201.37 F500.0
+G1 X44.45000 Y231.17000 Z14.00000 J202.31 F500.0
+G1 X41.33000 Y229.37000 Z14.00000 J205.84 F500.0
+G1 X41.33000 Y225.17000 Z14.00000 J209.95 F500.0
+G1 X44.45000 Y223.37000 Z14.00000 J213.48 F500.0
+G1 X44.45000 Y219.17000 Z14.00000 J217.60 F500.0
+G1 X41.33000 Y217.37000 Z14.00000 J221.13 F500.0
+G1 X41.33000 Y213.17000 Z14.00000 J225.25 F500.0
+G1 X44.45000 Y211.37000 Z14.00000 J228.78 F500.0
+G1 X44.45000 Y207.77000 Z14.00000 J232.30 F500.0
+G1 X44.80000 Y207.77000 Z14.00000 J232.65 F500.0
+G1 X44.80000 Y211.37000 Z14.00000 J236.17 F500.0
+G1 X47.91000 Y213.17000 Z14.00000 J239.70 F500.0
+G1 X47.91000 Y217.37000 Z14.00000 J243.81 F500.0
+G1 X44.80000 Y219.17000 Z14.00000 J247.33 F500.0
+G1 X44.80000 Y223.37000 Z14.00000 J251.45 F500.0
+G1 X47.91000 Y225.17000 Z14.00000 J254.97 F500.0
+G1 X47.91000 Y229.37000 Z14.00000 J259.09 F500.0
+G1 X44.80000 Y231.17000 Z14.00000 J262.61 F500.0
+G1 X44.80000 Y232.13000 Z14.00000 J263.55 F500.0
+G1 X51.38000 Y232.13000 Z14.00000 J270.00 F500.0
+G1 X51.38000 Y231.17000 Z14.00000 J270.94 F500.0
+G1 X48.26000 Y229.37000 Z14.00000 J274.47 F500.0
+G1 X48.26000 Y225.17000 Z14.00000 J278.58 F500.0
+G1 X51.38000 Y223.37000 Z14.00000 J282.11 F500.0
+G1 X51.38000 Y219.17000 Z14.00000 J286.23 F500.0
+G1 X48.26000 Y217.37000 Z14.00000 J289.76 F500.0
+G1 X48.26000 Y213.17000 Z14.00000 J293.88 F500.0
+G1 X51.38000 Y211.37000 Z14.00000 J297.41 F500.0
+G1 X51.38000 Y207.77000 Z14.00000 J300.93 F500.0
+G1 X51.73000 Y207.77000 Z14.00000 J301.28 F500.0
+G1 X51.73000 Y211.37000 Z14.00000 J304.81 F500.0
+G1 X54.84000 Y213.17000 Z14.00000 J308.33 F500.0
+G1 X54.84000 Y217.37000 Z14.00000 J312.44 F500.0
+G1 X51.73000 Y219.17000 Z14.00000 J315.96 F500.0
+G1 X51.73000 Y223.37000 Z14.00000 J320.08 F500.0
+G1 X54.84000 Y225.17000 Z14.00000 J323.60 F500.0
+G1 X54.84000 Y229.37000 Z14.00000 J327.72 F500.0
+G1 X51.73000 Y231.17000 Z14.00000 J331.24 F500.0
+G1 X51.73000 Y232.13000 Z14.00000 J332.18 F500.0
+G1 X58.31000 Y232.13000 Z14.00000 J338.63 F500.0
+G1 X58.31000 Y231.17000 Z14.00000 J339.57 F500.0
+G1 X55.19000 Y229.37000 Z14.00000 J343.10 F500.0
+G1 X55.19000 Y225.17000 Z14.00000 J347.22 F500.0
+G1 X58.31000 Y223.37000 Z14.00000 J350.75 F500.0
+G1 X58.31000 Y219.17000 Z14.00000 J354.86 F500.0
+G1 X55.19000 Y217.37000 Z14.00000 J358.39 F500.0
+G1 X55.19000 Y213.17000 Z14.00000 J362.51 F500.0
+G1 X58.31000 Y211.37000 Z14.00000 J366.04 F500.0
+G1 X58.31000 Y207.77000 Z14.00000 J369.57 F500.0
+G1 X58.65000 Y207.77000 Z14.00000 J369.90 F500.0
+G1 X58.65000 Y211.37000 Z14.00000 J373.43 F500.0
+G1 X61.77000 Y213.17000 Z14.00000 J376.96 F500.0
+G1 X61.77000 Y217.37000 Z14.00000 J381.07 F500.0
+G1 X58.65000 Y219.17000 Z14.00000 J384.60 F500.0
+G1 X58.65000 Y223.37000 Z14.00000 J388.72 F500.0
+G1 X61.77000 Y225.17000 Z14.00000 J392.25 F500.0
+G1 X61.77000 Y229.37000 Z14.00000 J396.36 F500.0
+G1 X58.65000 Y231.17000 Z14.00000 J399.89 F500.0
+G1 X58.65000 Y232.13000 Z14.00000 J400.83 F500.0
+G1 X65.23000 Y232.13000 Z14.00000 J407.28 F500.0
+G1 X65.23000 Y231.17000 Z14.00000 J408.22 F500.0
+G1 X62.12000 Y229.37000 Z14.00000 J411.75 F500.0
+G1 X62.12000 Y225.17000 Z14.00000 J415.86 F500.0
+G1 X65.23000 Y223.37000 Z14.00000 J419.38 F500.0
+G1 X65.23000 Y219.17000 Z14.00000 J423.50 F500.0
+G1 X62.12000 Y217.37000 Z14.00000 J427.02 F500.0
+G1 X62.12000 Y213.17000 Z14.00000 J431.14 F500.0
+G1 X65.23000 Y211.37000 Z14.00000 J434.66 F500.0
+G1 X65.23000 Y207.77000 Z14.00000 J438.19 F500.0
+G1 X65.58000 Y207.77000 Z14.00000 J438.53 F500.0
+G1 X65.58000 Y211.37000 Z14.00000 J442.06 F500.0
+G1 X68.70000 Y213.17000 Z14.00000 J445.59 F500.0
+G1 X68.70000 Y217.37000 Z14.00000 J449.70 F500.0
+G1 X65.58000 Y219.17000 Z14.00000 J453.23 F500.0
+G1 X65.58000 Y223.37000 Z14.00000 J457.35 F500.0
+G1 X68.70000 Y225.17000 Z14.00000 J460.88 F500.0
+G1 X68.70000 Y229.37000 Z14.00000 J464.99 F500.0
+G1 X65.58000 Y231.17000 Z14.00000 J468.52 F500.0
+G1 X65.58000 Y232.13000 Z14.00000 J469.47 F500.0
+G1 X72.16000 Y232.13000 Z14.00000 J475.91 F500.0
+G1 X72.16000 Y231.17000 Z14.00000 J476.85 F500.0
+G1 X69.04000 Y229.37000 Z14.00000 J480.38 F500.0
+G1 X69.04000 Y225.17000 Z14.00000 J484.50 F500.0
+G1 X72.16000 Y223.37000 Z14.00000 J488.03 F500.0
+G1 X72.16000 Y219.17000 Z14.00000 J492.15 F500.0
+G1 X69.04000 Y217.37000 Z14.00000 J495.68 F500.0
+G1 X69.04000 Y213.17000 Z14.00000 J499.79 F500.0
+G1 X72.16000 Y211.37000 Z14.00000 J503.32 F500.0
+G1 X72.16000 Y207.77000 Z14.00000 J506.85 F500.0
+G1 X72.51000 Y207.77000 Z14.00000 J507.19 F500.0
+G1 X72.51000 Y211.37000 Z14.00000 J510.72 F500.0
+G1 X75.63000 Y213.17000 Z14.00000 J514.25 F500.0
+G1 X75.63000 Y217.37000 Z14.00000 J518.37 F500.0
+G1 X72.51000 Y219.17000 Z14.00000 J521.90 F500.0
+G1 X72.51000 Y223.37000 Z14.00000 J526.01 F500.0
+G1 X75.63000 Y225.17000 Z14.00000 J529.54 F500.0
+G1 X75.63000 Y229.37000 Z14.00000 J533.66 F500.0
+G1 X72.51000 Y231.17000 Z14.00000 J537.19 F500.0
+G1 X72.51000 Y232.13000 Z14.00000 J538.13 F500.0
+G1 X79.09000 Y232.13000 Z14.00000 J544.58 F500.0
+G1 X79.09000 Y231.17000 Z14.00000 J545.52 F500.0
+G1 X75.97000 Y229.37000 Z14.00000 J549.05 F500.0
+G1 X75.97000 Y225.17000 Z14.00000 J553.17 F500.0
+G1 X79.09000 Y223.37000 Z14.00000 J556.70 F500.0
+G1 X79.09000 Y219.17000 Z14.00000 J560.81 F500.0
+G1 X75.97000 Y217.37000 Z14.00000 J564.34 F500.0
+G1 X75.97000 Y213.17000 Z14.00000 J568.46 F500.0
+G1 X79.09000 Y211.37000 Z14.00000 J571.99 F500.0
+G1 X79.09000 Y207.77000 Z14.00000 J575.52 F500.0
+G1 X79.44000 Y207.77000 Z14.00000 J575.86 F500.0
+G1 X79.44000 Y211.37000 Z14.00000 J579.39 F500.0
+G1 X82.55000 Y213.17000 Z14.00000 J582.91 F500.0
+G1 X82.55000 Y217.37000 Z14.00000 J587.02 F500.0
+G1 X79.44000 Y219.17000 Z14.00000 J590.55 F500.0
+G1 X79.44000 Y223.37000 Z14.00000 J594.66 F500.0
+G1 X82.55000 Y225.17000 Z14.00000 J598.18 F500.0
+G1 X82.55000 Y229.37000 Z14.00000 J602.30 F500.0
+G1 X79.44000 Y231.17000 Z14.00000 J605.82 F500.0
+G1 X79.44000 Y232.13000 Z14.00000 J606.76 F500.0
+G1 X86.02000 Y232.13000 Z14.00000 J613.21 F500.0
+G1 X86.02000 Y231.17000 Z14.00000 J614.15 F500.0
+G1 X82.90000 Y229.37000 Z14.00000 J617.68 F500.0
+G1 X82.90000 Y225.17000 Z14.00000 J621.80 F500.0
+G1 X86.02000 Y223.37000 Z14.00000 J625.33 F500.0
+G1 X86.02000 Y219.17000 Z14.00000 J629.44 F500.0
+G1 X82.90000 Y217.37000 Z14.00000 J632.97 F500.0
+G1 X82.90000 Y213.17000 Z14.00000 J637.09 F500.0
+G1 X86.02000 Y211.37000 Z14.00000 J640.62 F500.0
+G1 X86.02000 Y207.77000 Z14.00000 J644.15 F500.0
+G1 X86.37000 Y207.77000 Z14.00000 J644.49 F500.0
+G1 X86.37000 Y211.37000 Z14.00000 J648.02 F500.0
+G1 X89.48000 Y213.17000 Z14.00000 J651.54 F500.0
+G1 X89.48000 Y217.37000 Z14.00000 J655.65 F500.0
+G1 X86.37000 Y219.17000 Z14.00000 J659.18 F500.0
+G1 X86.37000 Y223.37000 Z14.00000 J663.29 F500.0
+G1 X89.48000 Y225.17000 Z14.00000 J666.81 F500.0
+G1 X89.48000 Y229.37000 Z14.00000 J670.93 F500.0
+G1 X86.37000 Y231.17000 Z14.00000 J674.45 F500.0
+G1 X86.37000 Y232.13000 Z14.00000 J675.39 F500.0
+G1 X92.23000 Y230.76000 Z14.00000 J681.29 F500.0
+G1 X89.83000 Y229.37000 Z14.00000 J684.01 F500.0
+G1 X89.83000 Y225.17000 Z14.00000 J688.12 F500.0
+G1 X92.23000 Y223.78000 Z14.00000 J690.84 F500.0
+G1 X92.23000 Y218.76000 Z14.00000 J695.76 F500.0
+G1 X89.83000 Y217.37000 Z14.00000 J698.48 F500.0
+G1 X89.83000 Y215.40000 Z14.00000 J705.42 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X89.83000 Y213.17000 Z14.00000 J705.42 F800.0
+G1 X92.23000 Y211.78000 Z14.00000 J705.42 F800.0
+G1 X92.23000 Y211.78000 Z24.00000 J705.42 F800.0
+G1 X86.68000 Y203.32000 Z24.00000 J715.42 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X91.68000 Y208.32000 Z15.00000 J0.00 F300.0
+G1 X91.68000 Y218.12000 Z15.00000 J9.60 F300.0
+G1 X91.68000 Y231.58000 Z15.00000 J22.79 F300.0
+G1 X72.08000 Y231.58000 Z15.00000 J42.00 F300.0
+G1 X28.42000 Y231.58000 Z15.00000 J84.79 F500.0
+G1 X28.42000 Y221.78000 Z15.00000 J94.39 F500.0
+G1 X28.42000 Y208.32000 Z15.00000 J107.58 F500.0
+G1 X48.02000 Y208.32000 Z15.00000 J126.79 F500.0
+G1 X86.68000 Y208.32000 Z15.00000 J169.68 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X91.68000 Y208.32000 Z15.00000 J169.68 F800.0
+G1 X91.68000 Y208.32000 Z25.00000 J169.68 F800.0
+G1 X86.68000 Y203.32000 Z25.00000 J179.68 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X91.68000 Y208.32000 Z15.00000 J0.00 F300.0
+G1 X30.59000 Y231.58000 Z15.00000 J64.06 F300.0
+G1 X30.59000 Y231.17000 Z15.00000 J64.46 F300.0
+G1 X28.42000 Y229.91000 Z15.00000 J66.92 F300.0
+G1 X28.42000 Y224.62000 Z15.00000 J72.11 F500.0
+G1 X30.59000 Y223.37000 Z15.00000 J74.56 F500.0
+G1 X30.59000 Y219.17000 Z15.00000 J78.68 F500.0
+G1 X28.42000 Y217.91000 Z15.00000 J81.13 F500.0
+G1 X28.42000 Y212.62000 Z15.00000 J86.32 F500.0
+G1 X30.59000 Y211.37000 Z15.00000 J88.77 F500.0
+G1 X30.59000 Y208.32000 Z15.00000 J91.76 F500.0
+G1 X30.94000 Y208.32000 Z15.00000 J92.10 F500.0
+G1 X30.94000 Y211.37000 Z15.00000 J95.09 F500.0
+G1 X34.06000 Y213.17000 Z15.00000 J98.62 F500.0
+G1 X34.06000 Y217.37000 Z15.00000 J102.74 F500.0
+G1 X30.94000 Y219.17000 Z15.00000 J106.27 F500.0
+G1 X30.94000 Y223.37000 Z15.00000 J110.39 F500.0
+G1 X34.06000 Y225.17000 Z15.00000 J113.92 F500.0
+G1 X34.06000 Y229.37000 Z15.00000 J118.03 F500.0
+G1 X30.94000 Y231.17000 Z15.00000 J121.56 F500.0
+G1 X30.94000 Y231.58000 Z15.00000 J121.96 F500.0
+G1 X37.52000 Y231.58000 Z15.00000 J128.41 F500.0
+G1 X37.52000 Y231.17000 Z15.00000 J128.81 F500.0
+G1 X34.40000 Y229.37000 Z15.00000 J132.34 F500.0
+G1 X34.40000 Y225.17000 Z15.00000 J136.46 F500.0
+G1 X37.52000 Y223.37000 Z15.00000 J139.99 F500.0
+G1 X37.52000 Y219.17000 Z15.00000 J144.11 F500.0
+G1 X34.40000 Y217.37000 Z15.00000 J147.64 F500.0
+G1 X34.40000 Y213.17000 Z15.00000 J151.75 F500.0
+G1 X37.52000 Y211.37000 Z15.00000 J155.28 F500.0
+G1 X37.52000 Y208.32000 Z15.00000 J158.27 F500.0
+G1 X37.87000 Y208.32000 Z15.00000 J158.61 F500.0
+G1 X37.87000 Y211.37000 Z15.00000 J161.60 F500.0
+G1 X40.99000 Y213.17000 Z15.00000 J165.13 F500.0
+G1 X40.99000 Y217.37000 Z15.00000 J169.25 F500.0
+G1 X37.87000 Y219.17000 Z15.00000 J172.78 F500.0
+G1 X37.87000 Y223.37000 Z15.00000 J176.89 F500.0
+G1 X40.99000 Y225.17000 Z15.00000 J180.42 F500.0
+G1 X40.99000 Y229.37000 Z15.00000 J184.54 F500.0
+G1 X37.87000 Y231.17000 Z15.00000 J188.07 F500.0
+G1 X37.87000 Y231.58000 Z15.00000 J188.47 F500.0
+G1 X44.45000 Y231.58000 Z15.00000 J194.92 F500.0
+G1 X44.45000 Y231.17000 Z15.00000 J195.32 F500.0
+G1 X41.33000 Y229.37000 Z15.00000 J198.85 F500.0
+G1 X41.33000 Y225.17000 Z15.00000 J202.97 F500.0
+G1 X44.45000 Y223.37000 Z15.00000 J206.50 F500.0
+G1 X44.45000 Y219.17000 Z15.00000 J210.61 F500.0
+G1 X41.33000 Y217.37000 Z15.00000 J214.14 F500.0
+G1 X41.33000 Y213.17000 Z15.00000 J218.26 F500.0
+G1 X44.45000 Y211.37000 Z15.00000 J221.79 F500.0
+G1 X44.45000 Y208.32000 Z15.00000 J224.78 F500.0
+G1 X44.80000 Y208.32000 Z15.00000 J225.12 F500.0
+G1 X44.80000 Y211.37000 Z15.00000 J228.11 F500.0
+G1 X47.91000 Y213.17000 Z15.00000 J231.63 F500.0
+G1 X47.91000 Y217.37000 Z15.00000 J235.75 F500.0
+G1 X44.80000 Y219.17000 Z15.00000 J239.27 F500.0
+G1 X44.80000 Y223.37000 Z15.00000 J243.39 F500.0
+G1 X47.91000 Y225.17000 Z15.00000 J246.91 F500.0
+G1 X47.91000 Y229.37000 Z15.00000 J251.02 F500.0
+G1 X44.80000 Y231.17000 Z15.00000 J254.55 F500.0
+G1 X44.80000 Y231.58000 Z15.00000 J254.95 F500.0
+G1 X51.38000 Y231.58000 Z15.00000 J261.40 F500.0
+G1 X51.38000 Y231.17000 Z15.00000 J261.80 F500.0
+G1 X48.26000 Y229.37000 Z15.00000 J265.33 F500.0
+G1 X48.26000 Y225.17000 Z15.00000 J269.44 F500.0
+G1 X51.38000 Y223.37000 Z15.00000 J272.97 F500.0
+G1 X51.38000 Y219.17000 Z15.00000 J277.09 F500.0
+G1 X48.26000 Y217.37000 Z15.00000 J280.62 F500.0
+G1 X48.26000 Y213.17000 Z15.00000 J284.74 F500.0
+G1 X51.38000 Y211.37000 Z15.00000 J288.27 F500.0
+G1 X51.38000 Y208.32000 Z15.00000 J291.25 F500.0
+G1 X51.73000 Y208.32000 Z15.00000 J291.60 F500.0
+G1 X51.73000 Y211.37000 Z15.00000 J294.59 F500.0
+G1 X54.84000 Y213.17000 Z15.00000 J298.11 F500.0
+G1 X54.84000 Y217.37000 Z15.00000 J302.22 F500.0
+G1 X51.73000 Y219.17000 Z15.00000 J305.74 F500.0
+G1 X51.73000 Y223.37000 Z15.00000 J309.86 F500.0
+G1 X54.84000 Y225.17000 Z15.00000 J313.38 F500.0
+G1 X54.84000 Y229.37000 Z15.00000 J317.50 F500.0
+G1 X51.73000 Y231.17000 Z15.00000 J321.02 F500.0
+G1 X51.73000 Y231.58000 Z15.00000 J321.42 F500.0
+G1 X58.31000 Y231.58000 Z15.00000 J327.87 F500.0
+G1 X58.31000 Y231.17000 Z15.00000 J328.27 F500.0
+G1 X55.19000 Y229.37000 Z15.00000 J331.80 F500.0
+G1 X55.19000 Y225.17000 Z15.00000 J335.92 F500.0
+G1 X58.31000 Y223.37000 Z15.00000 J339.45 F500.0
+G1 X58.31000 Y219.17000 Z15.00000 J343.56 F500.0
+G1 X55.19000 Y217.37000 Z15.00000 J347.09 F500.0
+G1 X55.19000 Y213.17000 Z15.00000 J351.21 F500.0
+G1 X58.31000 Y211.37000 Z15.00000 J354.74 F500.0
+G1 X58.31000 Y208.32000 Z15.00000 J357.73 F500.0
+G1 X58.65000 Y208.32000 Z15.00000 J358.06 F500.0
+G1 X58.65000 Y211.37000 Z15.00000 J361.05 F500.0
+G1 X61.77000 Y213.17000 Z15.00000 J364.58 F500.0
+G1 X61.77000 Y217.37000 Z15.00000 J368.70 F500.0
+G1 X58.65000 Y219.17000 Z15.00000 J372.23 F500.0
+G1 X58.65000 Y223.37000 Z15.00000 J376.34 F500.0
+G1 X61.77000 Y225.17000 Z15.00000 J379.87 F500.0
+G1 X61.77000 Y229.37000 Z15.00000 J383.99 F500.0
+G1 X58.65000 Y231.17000 Z15.00000 J387.52 F500.0
+G1 X58.65000 Y231.58000 Z15.00000 J387.92 F500.0
+G1 X65.23000 Y231.58000 Z15.00000 J394.37 F500.0
+G1 X65.23000 Y231.17000 Z15.00000 J394.77 F500.0
+G1 X62.12000 Y229.37000 Z15.00000 J398.29 F500.0
+G1 X62.12000 Y225.17000 Z15.00000 J402.41 F500.0
+G1 X65.23000 Y223.37000 Z15.00000 J405.93 F500.0
+G1 X65.23000 Y219.17000 Z15.00000 J410.05 F500.0
+G1 X62.12000 Y217.37000 Z15.00000 J413.57 F500.0
+G1 X62.12000 Y213.17000 Z15.00000 J417.68 F500.0
+G1 X65.23000 Y211.37000 Z15.00000 J421.20 F500.0
+G1 X65.23000 Y208.32000 Z15.00000 J424.19 F500.0
+G1 X65.58000 Y208.32000 Z15.00000 J424.54 F500.0
+G1 X65.58000 Y211.37000 Z15.00000 J427.53 F500.0
+G1 X68.70000 Y213.17000 Z15.00000 J431.06 F500.0
+G1 X68.70000 Y217.37000 Z15.00000 J435.17 F500.0
+G1 X65.58000 Y219.17000 Z15.00000 J438.70 F500.0
+G1 X65.58000 Y223.37000 Z15.00000 J442.82 F500.0
+G1 X68.70000 Y225.17000 Z15.00000 J446.35 F500.0
+G1 X68.70000 Y229.37000 Z15.00000 J450.46 F500.0
+G1 X65.58000 Y231.17000 Z15.00000 J453.99 F500.0
+G1 X65.58000 Y231.58000 Z15.00000 J454.40 F500.0
+G1 X72.16000 Y231.58000 Z15.00000 J460.84 F500.0
+G1 X72.16000 Y231.17000 Z15.00000 J461.25 F500.0
+G1 X69.04000 Y229.37000 Z15.00000 J464.78 F500.0
+G1 X69.04000 Y225.17000 Z15.00000 J468.89 F500.0
+G1 X72.16000 Y223.37000 Z15.00000 J472.42 F500.0
+G1 X72.16000 Y219.17000 Z15.00000 J476.54 F500.0
+G1 X69.04000 Y217.37000 Z15.00000 J480.07 F500.0
+G1 X69.04000 Y213.17000 Z15.00000 J484.18 F500.0
+G1 X72.16000 Y211.37000 Z15.00000 J487.71 F500.0
+G1 X72.16000 Y208.32000 Z15.00000 J490.70 F500.0
+G1 X72.51000 Y208.32000 Z15.00000 J491.05 F500.0
+G1 X72.51000 Y211.37000 Z15.00000 J494.03 F500.0
+G1 X75.63000 Y213.17000 Z15.00000 J497.56 F500.0
+G1 X75.63000 Y217.37000 Z15.00000 J501.68 F500.0
+G1 X72.51000 Y219.17000 Z15.00000 J505.21 F500.0
+G1 X72.51000 Y223.37000 Z15.00000 J509.33 F500.0
+G1 X75.63000 Y225.17000 Z15.00000 J512.86 F500.0
+G1 X75.63000 Y229.37000 Z15.00000 J516.97 F500.0
+G1 X72.51000 Y231.17000 Z15.00000 J520.50 F500.0
+G1 X72.51000 Y231.58000 Z15.00000 J520.90 F500.0
+G1 X79.09000 Y231.58000 Z15.00000 J527.35 F500.0
+G1 X79.09000 Y231.17000 Z15.00000 J527.75 F500.0
+G1 X75.97000 Y229.37000 Z15.00000 J531.28 F500.0
+G1 X75.97000 Y225.17000 Z15.00000 J535.40 F500.0
+G1 X79.09000 Y223.37000 Z15.00000 J538.93 F500.0
+G1 X79.09000 Y219.17000 Z15.00000 J543.05 F500.0
+G1 X75.97000 Y217.37000 Z15.00000 J546.58 F500.0
+G1 X75.97000 Y213.17000 Z15.00000 J550.69 F500.0
+G1 X79.09000 Y211.37000 Z15.00000 J554.22 F500.0
+G1 X79.09000 Y208.32000 Z15.00000 J557.21 F500.0
+G1 X79.44000 Y208.32000 Z15.00000 J557.55 F500.0
+G1 X79.44000 Y211.37000 Z15.00000 J560.54 F500.0
+G1 X82.55000 Y213.17000 Z15.00000 J564.06 F500.0
+G1 X82.55000 Y217.37000 Z15.00000 J568.18 F500.0
+G1 X79.44000 Y219.17000 Z15.00000 J571.70 F500.0
+G1 X79.44000 Y223.37000 Z15.00000 J575.82 F500.0
+G1 X82.55000 Y225.17000 Z15.00000 J579.34 F500.0
+G1 X82.55000 Y229.37000 Z15.00000 J583.46 F500.0
+G1 X79.44000 Y231.17000 Z15.00000 J586.98 F500.0
+G1 X79.44000 Y231.58000 Z15.00000 J587.38 F500.0
+G1 X86.02000 Y231.58000 Z15.00000 J593.83 F500.0
+G1 X86.02000 Y231.17000 Z15.00000 J594.23 F500.0
+G1 X82.90000 Y229.37000 Z15.00000 J597.76 F500.0
+G1 X82.90000 Y225.17000 Z15.00000 J601.87 F500.0
+G1 X86.02000 Y223.37000 Z15.00000 J605.40 F500.0
+G1 X86.02000 Y219.17000 Z15.00000 J609.52 F500.0
+G1 X82.90000 Y217.37000 Z15.00000 J613.05 F500.0
+G1 X82.90000 Y213.17000 Z15.00000 J617.17 F500.0
+G1 X86.02000 Y211.37000 Z15.00000 J620.70 F500.0
+G1 X86.02000 Y208.32000 Z15.00000 J623.69 F500.0
+G1 X86.37000 Y208.32000 Z15.00000 J624.03 F500.0
+G1 X86.37000 Y211.37000 Z15.00000 J627.02 F500.0
+G1 X89.48000 Y213.17000 Z15.00000 J630.54 F500.0
+G1 X89.48000 Y217.37000 Z15.00000 J634.66 F500.0
+G1 X86.37000 Y219.17000 Z15.00000 J638.18 F500.0
+G1 X86.37000 Y223.37000 Z15.00000 J642.29 F500.0
+G1 X89.48000 Y225.17000 Z15.00000 J645.81 F500.0
+G1 X89.48000 Y229.37000 Z15.00000 J649.93 F500.0
+G1 X86.37000 Y231.17000 Z15.00000 J653.45 F500.0
+G1 X86.37000 Y231.58000 Z15.00000 J653.85 F500.0
+G1 X91.68000 Y230.44000 Z15.00000 J659.18 F500.0
+G1 X89.83000 Y229.37000 Z15.00000 J661.27 F500.0
+G1 X89.83000 Y225.17000 Z15.00000 J665.39 F500.0
+G1 X91.68000 Y224.10000 Z15.00000 J667.48 F500.0
+G1 X91.68000 Y218.44000 Z15.00000 J673.03 F500.0
+G1 X89.83000 Y217.37000 Z15.00000 J675.12 F500.0
+G1 X89.83000 Y216.03000 Z15.00000 J681.43 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X89.83000 Y213.17000 Z15.00000 J681.43 F800.0
+G1 X91.68000 Y212.10000 Z15.00000 J681.43 F800.0
+G1 X91.68000 Y212.10000 Z25.00000 J681.43 F800.0
+G1 X86.13000 Y203.87000 Z25.00000 J691.43 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X91.13000 Y208.87000 Z16.00000 J0.00 F300.0
+G1 X91.13000 Y216.67000 Z16.00000 J7.64 F300.0
+G1 X91.13000 Y231.03000 Z16.00000 J21.72 F300.0
+G1 X75.53000 Y231.03000 Z16.00000 J37.00 F300.0
+G1 X28.97000 Y231.03000 Z16.00000 J82.63 F500.0
+G1 X28.97000 Y223.23000 Z16.00000 J90.28 F500.0
+G1 X28.97000 Y208.87000 Z16.00000 J104.35 F500.0
+G1 X44.57000 Y208.87000 Z16.00000 J119.64 F500.0
+G1 X86.13000 Y208.87000 Z16.00000 J165.37 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X91.13000 Y208.87000 Z16.00000 J165.37 F800.0
+G1 X91.13000 Y208.87000 Z26.00000 J165.37 F800.0
+G1 X86.13000 Y203.87000 Z26.00000 J175.37 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X91.13000 Y208.87000 Z16.00000 J0.00 F300.0
+G1 X30.35000 Y231.03000 Z16.00000 J63.40 F300.0
+G1 X28.97000 Y230.23000 Z16.00000 J64.96 F300.0
+G1 X28.97000 Y224.30000 Z16.00000 J70.77 F300.0
+G1 X30.59000 Y223.37000 Z16.00000 J72.60 F500.0
+G1 X30.59000 Y219.17000 Z16.00000 J76.72 F500.0
+G1 X28.97000 Y218.23000 Z16.00000 J78.55 F500.0
+G1 X28.97000 Y212.30000 Z16.00000 J84.37 F500.0
+G1 X30.59000 Y211.37000 Z16.00000 J86.20 F500.0
+G1 X30.59000 Y208.87000 Z16.00000 J88.65 F500.0
+G1 X30.94000 Y208.87000 Z16.00000 J88.99 F500.0
+G1 X30.94000 Y211.37000 Z16.00000 J91.44 F500.0
+G1 X34.06000 Y213.17000 Z16.00000 J94.97 F500.0
+G1 X34.06000 Y217.37000 Z16.00000 J99.08 F500.0
+G1 X30.94000 Y219.17000 Z16.00000 J102.61 F500.0
+G1 X30.94000 Y223.37000 Z16.00000 J106.73 F500.0
+G1 X34.06000 Y225.17000 Z16.00000 J110.26 F500.0
+G1 X34.06000 Y229.37000 Z16.00000 J114.38 F500.0
+G1 X31.19000 Y231.03000 Z16.00000 J117.63 F500.0
+G1 X37.27000 Y231.03000 Z16.00000 J123.58 F500.0
+G1 X34.40000 Y229.37000 Z16.00000 J126.83 F500.0
+G1 X34.40000 Y225.17000 Z16.00000 J130.95 F500.0
+G1 X37.52000 Y223.37000 Z16.00000 J134.48 F500.0
+G1 X37.52000 Y219.17000 Z16.00000 J138.60 F500.0
+G1 X34.40000 Y217.37000 Z16.00000 J142.13 F500.0
+G1 X34.40000 Y213.17000 Z16.00000 J146.24 F500.0
+G1 X37.52000 Y211.37000 Z16.00000 J149.77 F500.0
+G1 X37.52000 Y208.87000 Z16.00000 J152.22 F500.0
+G1 X37.87000 Y208.87000 Z16.00000 J152.56 F500.0
+G1 X37.87000 Y211.37000 Z16.00000 J155.01 F500.0
+G1 X40.99000 Y213.17000 Z16.00000 J158.54 F500.0
+G1 X40.99000 Y217.37000 Z16.00000 J162.66 F500.0
+G1 X37.87000 Y219.17000 Z16.00000 J166.19 F500.0
+G1 X37.87000 Y223.37000 Z16.00000 J170.31 F500.0
+G1 X40.99000 Y225.17000 Z16.00000 J173.84 F500.0
+G1 X40.99000 Y229.37000 Z16.00000 J177.95 F500.0
+G1 X38.12000 Y231.03000 Z16.00000 J181.20 F500.0
+G1 X44.20000 Y231.03000 Z16.00000 J187.16 F500.0
+G1 X41.33000 Y229.37000 Z16.00000 J190.41 F500.0
+G1 X41.33000 Y225.17000 Z16.00000 J194.52 F500.0
+G1 X44.45000 Y223.37000 Z16.00000 J198.05 F500.0
+G1 X44.45000 Y219.17000 Z16.00000 J202.17 F500.0
+G1 X41.33000 Y217.37000 Z16.00000 J205.70 F500.0
+G1 X41.33000 Y213.17000 Z16.00000 J209.82 F500.0
+G1 X44.45000 Y211.37000 Z16.00000 J213.35 F500.0
+G1 X44.45000 Y208.87000 Z16.00000 J215.80 F500.0
+G1 X44.80000 Y208.87000 Z16.00000 J216.14 F500.0
+G1 X44.80000 Y211.37000 Z16.00000 J218.59 F500.0
+G1 X47.91000 Y213.17000 Z16.00000 J222.11 F500.0
+G1 X47.91000 Y217.37000 Z16.00000 J226.23 F500.0
+G1 X44.80000 Y219.17000 Z16.00000 J229.75 F500.0
+G1 X44.80000 Y223.37000 Z16.00000 J233.86 F500.0
+G1 X47.91000 Y225.17000 Z16.00000 J237.39 F500.0
+G1 X47.91000 Y229.37000 Z16.00000 J241.50 F500.0
+G1 X45.04000 Y231.03000 Z16.00000 J244.75 F500.0
+G1 X51.13000 Y231.03000 Z16.00000 J250.72 F500.0
+G1 X48.26000 Y229.37000 Z16.00000 J253.97 F500.0
+G1 X48.26000 Y225.17000 Z16.00000 J258.08 F500.0
+G1 X51.38000 Y223.37000 Z16.00000 J261.61 F500.0
+G1 X51.38000 Y219.17000 Z16.00000 J265.73 F500.0
+G1 X48.26000 Y217.37000 Z16.00000 J269.26 F500.0
+G1 X48.26000 Y213.17000 Z16.00000 J273.38 F500.0
+G1 X51.38000 Y211.37000 Z16.00000 J276.91 F500.0
+G1 X51.38000 Y208.87000 Z16.00000 J279.36 F500.0
+G1 X51.73000 Y208.87000 Z16.00000 J279.70 F500.0
+G1 X51.73000 Y211.37000 Z16.00000 J282.15 F500.0
+G1 X54.84000 Y213.17000 Z16.00000 J285.67 F500.0
+G1 X54.84000 Y217.37000 Z16.00000 J289.79 F500.0
+G1 X51.73000 Y219.17000 Z16.00000 J293.31 F500.0
+G1 X51.73000 Y223.37000 Z16.00000 J297.42 F500.0
+G1 X54.84000 Y225.17000 Z16.00000 J300.95 F500.0
+G1 X54.84000 Y229.37000 Z16.00000 J305.06 F500.0
+G1 X51.97000 Y231.03000 Z16.00000 J308.31 F500.0
+G1 X58.06000 Y231.03000 Z16.00000 J314.28 F500.0
+G1 X55.19000 Y229.37000 Z16.00000 J317.53 F500.0
+G1 X55.19000 Y225.17000 Z16.00000 J321.64 F500.0
+G1 X58.31000 Y223.37000 Z16.00000 J325.17 F500.0
+G1 X58.31000 Y219.17000 Z16.00000 J329.29 F500.0
+G1 X55.19000 Y217.37000 Z16.00000 J332.82 F500.0
+G1 X55.19000 Y213.17000 Z16.00000 J336.94 F500.0
+G1 X58.31000 Y211.37000 Z16.00000 J340.47 F500.0
+G1 X58.31000 Y208.87000 Z16.00000 J342.92 F500.0
+G1 X58.65000 Y208.87000 Z16.00000 J343.25 F500.0
+G1 X58.65000 Y211.37000 Z16.00000 J345.70 F500.0
+G1 X61.77000 Y213.17000 Z16.00000 J349.23 F500.0
+G1 X61.77000 Y217.37000 Z16.00000 J353.35 F500.0
+G1 X58.65000 Y219.17000 Z16.00000 J356.88 F500.0
+G1 X58.65000 Y223.37000 Z16.00000 J360.99 F500.0
+G1 X61.77000 Y225.17000 Z16.00000 J364.52 F500.0
+G1 X61.77000 Y229.37000 Z16.00000 J368.64 F500.0
+G1 X58.90000 Y231.03000 Z16.00000 J371.89 F500.0
+G1 X64.99000 Y231.03000 Z16.00000 J377.86 F500.0
+G1 X62.12000 Y229.37000 Z16.00000 J381.10 F500.0
+G1 X62.12000 Y225.17000 Z16.00000 J385.22 F500.0
+G1 X65.23000 Y223.37000 Z16.00000 J388.74 F500.0
+G1 X65.23000 Y219.17000 Z16.00000 J392.86 F500.0
+G1 X62.12000 Y217.37000 Z16.00000 J396.38 F500.0
+G1 X62.12000 Y213.17000 Z16.00000 J400.50 F500.0
+G1 X65.23000 Y211.37000 Z16.00000 J404.02 F500.0
+G1 X65.23000 Y208.87000 Z16.00000 J406.47 F500.0
+G1 X65.58000 Y208.87000 Z16.00000 J406.81 F500.0
+G1 X65.58000 Y211.37000 Z16.00000 J409.26 F500.0
+G1 X68.70000 Y213.17000 Z16.00000 J412.79 F500.0
+G1 X68.70000 Y217.37000 Z16.00000 J416.91 F500.0
+G1 X65.58000 Y219.17000 Z16.00000 J420.44 F500.0
+G1 X65.58000 Y223.37000 Z16.00000 J424.55 F500.0
+G1 X68.70000 Y225.17000 Z16.00000 J428.08 F500.0
+G1 X68.70000 Y229.37000 Z16.00000 J432.20 F500.0
+G1 X65.83000 Y231.03000 Z16.00000 J435.45 F500.0
+G1 X71.92000 Y231.03000 Z16.00000 J441.41 F500.0
+G1 X69.04000 Y229.37000 Z16.00000 J444.67 F500.0
+G1 X69.04000 Y225.17000 Z16.00000 J448.79 F500.0
+G1 X72.16000 Y223.37000 Z16.00000 J452.32 F500.0
+G1 X72.16000 Y219.17000 Z16.00000 J456.43 F500.0
+G1 X69.04000 Y217.37000 Z16.00000 J459.96 F500.0
+G1 X69.04000 Y213.17000 Z16.00000 J464.08 F500.0
+G1 X72.16000 Y211.37000 Z16.00000 J467.61 F500.0
+G1 X72.16000 Y208.87000 Z16.00000 J470.06 F500.0
+G1 X72.51000 Y208.87000 Z16.00000 J470.40 F500.0
+G1 X72.51000 Y211.37000 Z16.00000 J472.85 F500.0
+G1 X75.63000 Y213.17000 Z16.00000 J476.38 F500.0
+G1 X75.63000 Y217.37000 Z16.00000 J480.50 F500.0
+G1 X72.51000 Y219.17000 Z16.00000 J484.03 F500.0
+G1 X72.51000 Y223.37000 Z16.00000 J488.15 F500.0
+G1 X75.63000 Y225.17000 Z16.00000 J491.68 F500.0
+G1 X75.63000 Y229.37000 Z16.00000 J495.79 F500.0
+G1 X72.76000 Y231.03000 Z16.00000 J499.04 F500.0
+G1 X78.84000 Y231.03000 Z16.00000 J505.00 F500.0
+G1 X75.97000 Y229.37000 Z16.00000 J508.25 F500.0
+G1 X75.97000 Y225.17000 Z16.00000 J512.36 F500.0
+G1 X79.09000 Y223.37000 Z16.00000 J515.89 F500.0
+G1 X79.09000 Y219.17000 Z16.00000 J520.01 F500.0
+G1 X75.97000 Y217.37000 Z16.00000 J523.54 F500.0
+G1 X75.97000 Y213.17000 Z16.00000 J527.66 F500.0
+G1 X79.09000 Y211.37000 Z16.00000 J531.19 F500.0
+G1 X79.09000 Y208.87000 Z16.00000 J533.64 F500.0
+G1 X79.44000 Y208.87000 Z16.00000 J533.98 F500.0
+G1 X79.44000 Y211.37000 Z16.00000 J536.43 F500.0
+G1 X82.55000 Y213.17000 Z16.00000 J539.95 F500.0
+G1 X82.55000 Y217.37000 Z16.00000 J544.07 F500.0
+G1 X79.44000 Y219.17000 Z16.00000 J547.59 F500.0
+G1 X79.44000 Y223.37000 Z16.00000 J551.70 F500.0
+G1 X82.55000 Y225.17000 Z16.00000 J555.23 F500.0
+G1 X82.55000 Y229.37000 Z16.00000 J559.34 F500.0
+G1 X79.69000 Y231.03000 Z16.00000 J562.58 F500.0
+G1 X85.77000 Y231.03000 Z16.00000 J568.54 F500.0
+G1 X82.90000 Y229.37000 Z16.00000 J571.79 F500.0
+G1 X82.90000 Y225.17000 Z16.00000 J575.91 F500.0
+G1 X86.02000 Y223.37000 Z16.00000 J579.44 F500.0
+G1 X86.02000 Y219.17000 Z16.00000 J583.55 F500.0
+G1 X82.90000 Y217.37000 Z16.00000 J587.08 F500.0
+G1 X82.90000 Y213.17000 Z16.00000 J591.20 F500.0
+G1 X86.02000 Y211.37000 Z16.00000 J594.73 F500.0
+G1 X86.02000 Y208.87000 Z16.00000 J597.18 F500.0
+G1 X86.37000 Y208.87000 Z16.00000 J597.52 F500.0
+G1 X86.37000 Y211.37000 Z16.00000 J599.97 F500.0
+G1 X89.48000 Y213.17000 Z16.00000 J603.49 F500.0
+G1 X89.48000 Y217.37000 Z16.00000 J607.61 F500.0
+G1 X86.37000 Y219.17000 Z16.00000 J611.13 F500.0
+G1 X86.37000 Y223.37000 Z16.00000 J615.25 F500.0
+G1 X89.48000 Y225.17000 Z16.00000 J618.77 F500.0
+G1 X89.48000 Y229.37000 Z16.00000 J622.88 F500.0
+G1 X86.61000 Y231.03000 Z16.00000 J626.13 F500.0
+G1 X91.13000 Y230.12000 Z16.00000 J630.65 F500.0
+G1 X89.83000 Y229.37000 Z16.00000 J632.12 F500.0
+G1 X89.83000 Y225.17000 Z16.00000 J636.24 F500.0
+G1 X91.13000 Y224.42000 Z16.00000 J637.71 F500.0
+G1 X91.13000 Y218.12000 Z16.00000 J643.88 F500.0
+G1 X89.83000 Y217.37000 Z16.00000 J645.35 F500.0
+G1 X89.83000 Y216.67000 Z16.00000 J651.04 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X89.83000 Y213.17000 Z16.00000 J651.04 F800.0
+G1 X91.13000 Y212.42000 Z16.00000 J651.04 F800.0
+G1 X91.13000 Y212.42000 Z26.00000 J651.04 F800.0
+G1 X85.57000 Y204.43000 Z26.00000 J661.04 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X90.57000 Y209.43000 Z17.00000 J0.00 F300.0
+G1 X90.57000 Y215.23000 Z17.00000 J5.68 F300.0
+G1 X90.57000 Y230.47000 Z17.00000 J20.62 F300.0
+G1 X78.97000 Y230.47000 Z17.00000 J31.99 F300.0
+G1 X29.53000 Y230.47000 Z17.00000 J80.44 F500.0
+G1 X29.53000 Y224.67000 Z17.00000 J86.12 F500.0
+G1 X29.53000 Y209.43000 Z17.00000 J101.06 F500.0
+G1 X41.13000 Y209.43000 Z17.00000 J112.43 F500.0
+G1 X85.57000 Y209.43000 Z17.00000 J160.98 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X90.57000 Y209.43000 Z17.00000 J160.98 F800.0
+G1 X90.57000 Y209.43000 Z27.00000 J160.98 F800.0
+G1 X85.57000 Y204.43000 Z27.00000 J170.98 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X90.57000 Y209.43000 Z17.00000 J0.00 F300.0
+G1 X29.53000 Y223.98000 Z17.00000 J61.49 F300.0
+G1 X30.59000 Y223.37000 Z17.00000 J62.69 F300.0
+G1 X30.59000 Y219.17000 Z17.00000 J66.81 F300.0
+G1 X29.53000 Y218.55000 Z17.00000 J68.01 F500.0
+G1 X29.53000 Y211.98000 Z17.00000 J74.45 F500.0
+G1 X30.59000 Y211.37000 Z17.00000 J75.65 F500.0
+G1 X30.59000 Y209.43000 Z17.00000 J77.55 F500.0
+G1 X30.94000 Y209.43000 Z17.00000 J77.89 F500.0
+G1 X30.94000 Y211.37000 Z17.00000 J79.79 F500.0
+G1 X34.06000 Y213.17000 Z17.00000 J83.32 F500.0
+G1 X34.06000 Y217.37000 Z17.00000 J87.44 F500.0
+G1 X30.94000 Y219.17000 Z17.00000 J90.97 F500.0
+G1 X30.94000 Y223.37000 Z17.00000 J95.08 F500.0
+G1 X34.06000 Y225.17000 Z17.00000 J98.61 F500.0
+G1 X34.06000 Y229.37000 Z17.00000 J102.73 F500.0
+G1 X32.15000 Y230.47000 Z17.00000 J104.89 F500.0
+G1 X36.31000 Y230.47000 Z17.00000 J108.97 F500.0
+G1 X34.40000 Y229.37000 Z17.00000 J111.13 F500.0
+G1 X34.40000 Y225.17000 Z17.00000 J115.24 F500.0
+G1 X37.52000 Y223.37000 Z17.00000 J118.77 F500.0
+G1 X37.52000 Y219.17000 Z17.00000 J122.89 F500.0
+G1 X34.40000 Y217.37000 Z17.00000 J126.42 F500.0
+G1 X34.40000 Y213.17000 Z17.00000 J130.54 F500.0
+G1 X37.52000 Y211.37000 Z17.00000 J134.07 F500.0
+G1 X37.52000 Y209.43000 Z17.00000 J135.97 F500.0
+G1 X37.87000 Y209.43000 Z17.00000 J136.31 F500.0
+G1 X37.87000 Y211.37000 Z17.00000 J138.21 F500.0
+G1 X40.99000 Y213.17000 Z17.00000 J141.74 F500.0
+G1 X40.99000 Y217.37000 Z17.00000 J145.86 F500.0
+G1 X37.87000 Y219.17000 Z17.00000 J149.39 F500.0
+G1 X37.87000 Y223.37000 Z17.00000 J153.50 F500.0
+G1 X40.99000 Y225.17000 Z17.00000 J157.03 F500.0
+G1 X40.99000 Y229.37000 Z17.00000 J161.15 F500.0
+G1 X39.08000 Y230.47000 Z17.00000 J163.31 F500.0
+G1 X43.24000 Y230.47000 Z17.00000 J167.39 F500.0
+G1 X41.33000 Y229.37000 Z17.00000 J169.55 F500.0
+G1 X41.33000 Y225.17000 Z17.00000 J173.66 F500.0
+G1 X44.45000 Y223.37000 Z17.00000 J177.19 F500.0
+G1 X44.45000 Y219.17000 Z17.00000 J181.31 F500.0
+G1 X41.33000 Y217.37000 Z17.00000 J184.84 F500.0
+G1 X41.33000 Y213.17000 Z17.00000 J188.95 F500.0
+G1 X44.45000 Y211.37000 Z17.00000 J192.48 F500.0
+G1 X44.45000 Y209.43000 Z17.00000 J194.38 F500.0
+G1 X44.80000 Y209.43000 Z17.00000 J194.73 F500.0
+G1 X44.80000 Y211.37000 Z17.00000 J196.63 F500.0
+G1 X47.91000 Y213.17000 Z17.00000 J200.15 F500.0
+G1 X47.91000 Y217.37000 Z17.00000 J204.27 F500.0
+G1 X44.80000 Y219.17000 Z17.00000 J207.79 F500.0
+G1 X44.80000 Y223.37000 Z17.00000 J211.90 F500.0
+G1 X47.91000 Y225.17000 Z17.00000 J215.42 F500.0
+G1 X47.91000 Y229.37000 Z17.00000 J219.54 F500.0
+G1 X46.01000 Y230.47000 Z17.00000 J221.69 F500.0
+G1 X50.17000 Y230.47000 Z17.00000 J225.77 F500.0
+G1 X48.26000 Y229.37000 Z17.00000 J227.93 F500.0
+G1 X48.26000 Y225.17000 Z17.00000 J232.05 F500.0
+G1 X51.38000 Y223.37000 Z17.00000 J235.58 F500.0
+G1 X51.38000 Y219.17000 Z17.00000 J239.69 F500.0
+G1 X48.26000 Y217.37000 Z17.00000 J243.22 F500.0
+G1 X48.26000 Y213.17000 Z17.00000 J247.34 F500.0
+G1 X51.38000 Y211.37000 Z17.00000 J250.87 F500.0
+G1 X51.38000 Y209.43000 Z17.00000 J252.77 F500.0
+G1 X51.73000 Y209.43000 Z17.00000 J253.11 F500.0
+G1 X51.73000 Y211.37000 Z17.00000 J255.01 F500.0
+G1 X54.84000 Y213.17000 Z17.00000 J258.53 F500.0
+G1 X54.84000 Y217.37000 Z17.00000 J262.65 F500.0
+G1 X51.73000 Y219.17000 Z17.00000 J266.17 F500.0
+G1 X51.73000 Y223.37000 Z17.00000 J270.29 F500.0
+G1 X54.84000 Y225.17000 Z17.00000 J273.81 F500.0
+G1 X54.84000 Y229.37000 Z17.00000 J277.92 F500.0
+G1 X52.93000 Y230.47000 Z17.00000 J280.09 F500.0
+G1 X57.10000 Y230.47000 Z17.00000 J284.17 F500.0
+G1 X55.19000 Y229.37000 Z17.00000 J286.33 F500.0
+G1 X55.19000 Y225.17000 Z17.00000 J290.45 F500.0
+G1 X58.31000 Y223.37000 Z17.00000 J293.98 F500.0
+G1 X58.31000 Y219.17000 Z17.00000 J298.09 F500.0
+G1 X55.19000 Y217.37000 Z17.00000 J301.62 F500.0
+G1 X55.19000 Y213.17000 Z17.00000 J305.74 F500.0
+G1 X58.31000 Y211.37000 Z17.00000 J309.27 F500.0
+G1 X58.31000 Y209.43000 Z17.00000 J311.17 F500.0
+G1 X58.65000 Y209.43000 Z17.00000 J311.50 F500.0
+G1 X58.65000 Y211.37000 Z17.00000 J313.41 F500.0
+G1 X61.77000 Y213.17000 Z17.00000 J316.94 F500.0
+G1 X61.77000 Y217.37000 Z17.00000 J321.05 F500.0
+G1 X58.65000 Y219.17000 Z17.00000 J324.58 F500.0
+G1 X58.65000 Y223.37000 Z17.00000 J328.70 F500.0
+G1 X61.77000 Y225.17000 Z17.00000 J332.23 F500.0
+G1 X61.77000 Y229.37000 Z17.00000 J336.34 F500.0
+G1 X59.86000 Y230.47000 Z17.00000 J338.50 F500.0
+G1 X64.03000 Y230.47000 Z17.00000 J342.59 F500.0
+G1 X62.12000 Y229.37000 Z17.00000 J344.75 F500.0
+G1 X62.12000 Y225.17000 Z17.00000 J348.87 F500.0
+G1 X65.23000 Y223.37000 Z17.00000 J352.39 F500.0
+G1 X65.23000 Y219.17000 Z17.00000 J356.50 F500.0
+G1 X62.12000 Y217.37000 Z17.00000 J360.02 F500.0
+G1 X62.12000 Y213.17000 Z17.00000 J364.14 F500.0
+G1 X65.23000 Y211.37000 Z17.00000 J367.66 F500.0
+G1 X65.23000 Y209.43000 Z17.00000 J369.56 F500.0
+G1 X65.58000 Y209.43000 Z17.00000 J369.91 F500.0
+G1 X65.58000 Y211.37000 Z17.00000 J371.81 F500.0
+G1 X68.70000 Y213.17000 Z17.00000 J375.34 F500.0
+G1 X68.70000 Y217.37000 Z17.00000 J379.45 F500.0
+G1 X65.58000 Y219.17000 Z17.00000 J382.98 F500.0
+G1 X65.58000 Y223.37000 Z17.00000 J387.10 F500.0
+G1 X68.70000 Y225.17000 Z17.00000 J390.63 F500.0
+G1 X68.70000 Y229.37000 Z17.00000 J394.75 F500.0
+G1 X66.79000 Y230.47000 Z17.00000 J396.91 F500.0
+G1 X70.95000 Y230.47000 Z17.00000 J400.98 F500.0
+G1 X69.04000 Y229.37000 Z17.00000 J403.14 F500.0
+G1 X69.04000 Y225.17000 Z17.00000 J407.26 F500.0
+G1 X72.16000 Y223.37000 Z17.00000 J410.79 F500.0
+G1 X72.16000 Y219.17000 Z17.00000 J414.90 F500.0
+G1 X69.04000 Y217.37000 Z17.00000 J418.43 F500.0
+G1 X69.04000 Y213.17000 Z17.00000 J422.55 F500.0
+G1 X72.16000 Y211.37000 Z17.00000 J426.08 F500.0
+G1 X72.16000 Y209.43000 Z17.00000 J427.98 F500.0
+G1 X72.51000 Y209.43000 Z17.00000 J428.32 F500.0
+G1 X72.51000 Y211.37000 Z17.00000 J430.23 F500.0
+G1 X75.63000 Y213.17000 Z17.00000 J433.76 F500.0
+G1 X75.63000 Y217.37000 Z17.00000 J437.87 F500.0
+G1 X72.51000 Y219.17000 Z17.00000 J441.40 F500.0
+G1 X72.51000 Y223.37000 Z17.00000 J445.52 F500.0
+G1 X75.63000 Y225.17000 Z17.00000 J449.05 F500.0
+G1 X75.63000 Y229.37000 Z17.00000 J453.16 F500.0
+G1 X73.72000 Y230.47000 Z17.00000 J455.32 F500.0
+G1 X77.88000 Y230.47000 Z17.00000 J459.40 F500.0
+G1 X75.97000 Y229.37000 Z17.00000 J461.56 F500.0
+G1 X75.97000 Y225.17000 Z17.00000 J465.68 F500.0
+G1 X79.09000 Y223.37000 Z17.00000 J469.21 F500.0
+G1 X79.09000 Y219.17000 Z17.00000 J473.32 F500.0
+G1 X75.97000 Y217.37000 Z17.00000 J476.85 F500.0
+G1 X75.97000 Y213.17000 Z17.00000 J480.97 F500.0
+G1 X79.09000 Y211.37000 Z17.00000 J484.50 F500.0
+G1 X79.09000 Y209.43000 Z17.00000 J486.40 F500.0
+G1 X79.44000 Y209.43000 Z17.00000 J486.74 F500.0
+G1 X79.44000 Y211.37000 Z17.00000 J488.64 F500.0
+G1 X82.55000 Y213.17000 Z17.00000 J492.16 F500.0
+G1 X82.55000 Y217.37000 Z17.00000 J496.28 F500.0
+G1 X79.44000 Y219.17000 Z17.00000 J499.80 F500.0
+G1 X79.44000 Y223.37000 Z17.00000 J503.92 F500.0
+G1 X82.55000 Y225.17000 Z17.00000 J507.44 F500.0
+G1 X82.55000 Y229.37000 Z17.00000 J511.56 F500.0
+G1 X80.65000 Y230.47000 Z17.00000 J513.71 F500.0
+G1 X84.81000 Y230.47000 Z17.00000 J517.78 F500.0
+G1 X82.90000 Y229.37000 Z17.00000 J519.94 F500.0
+G1 X82.90000 Y225.17000 Z17.00000 J524.06 F500.0
+G1 X86.02000 Y223.37000 Z17.00000 J527.59 F500.0
+G1 X86.02000 Y219.17000 Z17.00000 J531.71 F500.0
+G1 X82.90000 Y217.37000 Z17.00000 J535.24 F500.0
+G1 X82.90000 Y213.17000 Z17.00000 J539.35 F500.0
+G1 X86.02000 Y211.37000 Z17.00000 J542.88 F500.0
+G1 X86.02000 Y209.43000 Z17.00000 J544.78 F500.0
+G1 X86.37000 Y209.43000 Z17.00000 J545.13 F500.0
+G1 X86.37000 Y211.37000 Z17.00000 J547.03 F500.0
+G1 X89.48000 Y213.17000 Z17.00000 J550.55 F500.0
+G1 X89.48000 Y217.37000 Z17.00000 J554.67 F500.0
+G1 X86.37000 Y219.17000 Z17.00000 J558.19 F500.0
+G1 X86.37000 Y223.37000 Z17.00000 J562.30 F500.0
+G1 X89.48000 Y225.17000 Z17.00000 J565.82 F500.0
+G1 X89.48000 Y229.37000 Z17.00000 J569.94 F500.0
+G1 X87.57000 Y230.47000 Z17.00000 J572.10 F500.0
+G1 X90.57000 Y229.80000 Z17.00000 J575.11 F500.0
+G1 X89.83000 Y229.37000 Z17.00000 J575.95 F500.0
+G1 X89.83000 Y225.17000 Z17.00000 J580.07 F500.0
+G1 X90.57000 Y224.74000 Z17.00000 J580.91 F500.0
+G1 X90.57000 Y217.80000 Z17.00000 J587.71 F500.0
+G1 X89.83000 Y217.37000 Z17.00000 J588.55 F500.0
+G1 X89.83000 Y217.31000 Z17.00000 J593.60 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X89.83000 Y213.17000 Z17.00000 J593.60 F800.0
+G1 X90.57000 Y212.74000 Z17.00000 J593.60 F800.0
+G1 X90.57000 Y212.74000 Z27.00000 J593.60 F800.0
+G1 X85.02000 Y204.98000 Z27.00000 J603.60 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X90.02000 Y209.98000 Z18.00000 J0.00 F300.0
+G1 X90.02000 Y213.78000 Z18.00000 J3.72 F300.0
+G1 X90.02000 Y229.92000 Z18.00000 J19.54 F300.0
+G1 X82.42000 Y229.92000 Z18.00000 J26.99 F300.0
+G1 X30.08000 Y229.92000 Z18.00000 J78.28 F500.0
+G1 X30.08000 Y226.12000 Z18.00000 J82.01 F500.0
+G1 X30.08000 Y209.98000 Z18.00000 J97.82 F500.0
+G1 X37.68000 Y209.98000 Z18.00000 J105.27 F500.0
+G1 X85.02000 Y209.98000 Z18.00000 J156.66 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X90.02000 Y209.98000 Z18.00000 J156.66 F800.0
+G1 X90.02000 Y209.98000 Z28.00000 J156.66 F800.0
+G1 X85.02000 Y204.98000 Z28.00000 J166.66 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X90.02000 Y209.98000 Z18.00000 J0.00 F300.0
+G1 X30.08000 Y223.66000 Z18.00000 J60.26 F300.0
+G1 X30.59000 Y223.37000 Z18.00000 J60.83 F300.0
+G1 X30.59000 Y219.17000 Z18.00000 J64.95 F300.0
+G1 X30.08000 Y218.87000 Z18.00000 J65.53 F500.0
+G1 X30.08000 Y211.66000 Z18.00000 J72.59 F500.0
+G1 X30.59000 Y211.37000 Z18.00000 J73.17 F500.0
+G1 X30.59000 Y209.98000 Z18.00000 J74.53 F500.0
+G1 X30.94000 Y209.98000 Z18.00000 J74.87 F500.0
+G1 X30.94000 Y211.37000 Z18.00000 J76.24 F500.0
+G1 X34.06000 Y213.17000 Z18.00000 J79.77 F500.0
+G1 X34.06000 Y217.37000 Z18.00000 J83.88 F500.0
+G1 X30.94000 Y219.17000 Z18.00000 J87.41 F500.0
+G1 X30.94000 Y223.37000 Z18.00000 J91.53 F500.0
+G1 X34.06000 Y225.17000 Z18.00000 J95.06 F500.0
+G1 X34.06000 Y229.37000 Z18.00000 J99.17 F500.0
+G1 X33.11000 Y229.92000 Z18.00000 J100.25 F500.0
+G1 X35.35000 Y229.92000 Z18.00000 J102.44 F500.0
+G1 X34.40000 Y229.37000 Z18.00000 J103.52 F500.0
+G1 X34.40000 Y225.17000 Z18.00000 J107.64 F500.0
+G1 X37.52000 Y223.37000 Z18.00000 J111.17 F500.0
+G1 X37.52000 Y219.17000 Z18.00000 J115.28 F500.0
+G1 X34.40000 Y217.37000 Z18.00000 J118.81 F500.0
+G1 X34.40000 Y213.17000 Z18.00000 J122.93 F500.0
+G1 X37.52000 Y211.37000 Z18.00000 J126.46 F500.0
+G1 X37.52000 Y209.98000 Z18.00000 J127.82 F500.0
+G1 X37.87000 Y209.98000 Z18.00000 J128.16 F500.0
+G1 X37.87000 Y211.37000 Z18.00000 J129.53 F500.0
+G1 X40.99000 Y213.17000 Z18.00000 J133.06 F500.0
+G1 X40.99000 Y217.37000 Z18.00000 J137.17 F500.0
+G1 X37.87000 Y219.17000 Z18.00000 J140.70 F500.0
+G1 X37.87000 Y223.37000 Z18.00000 J144.82 F500.0
+G1 X40.99000 Y225.17000 Z18.00000 J148.35 F500.0
+G1 X40.99000 Y229.37000 Z18.00000 J152.46 F500.0
+G1 X40.04000 Y229.92000 Z18.00000 J153.54 F500.0
+G1 X42.28000 Y229.92000 Z18.00000 J155.73 F500.0
+G1 X41.33000 Y229.37000 Z18.00000 J156.81 F500.0
+G1 X41.33000 Y225.17000 Z18.00000 J160.93 F500.0
+G1 X44.45000 Y223.37000 Z18.00000 J164.46 F500.0
+G1 X44.45000 Y219.17000 Z18.00000 J168.57 F500.0
+G1 X41.33000 Y217.37000 Z18.00000 J172.10 F500.0
+G1 X41.33000 Y213.17000 Z18.00000 J176.22 F500.0
+G1 X44.45000 Y211.37000 Z18.00000 J179.75 F500.0
+G1 X44.45000 Y209.98000 Z18.00000 J181.11 F500.0
+G1 X44.80000 Y209.98000 Z18.00000 J181.45 F500.0
+G1 X44.80000 Y211.37000 Z18.00000 J182.82 F500.0
+G1 X47.91000 Y213.17000 Z18.00000 J186.34 F500.0
+G1 X47.91000 Y217.37000 Z18.00000 J190.45 F500.0
+G1 X44.80000 Y219.17000 Z18.00000 J193.97 F500.0
+G1 X44.80000 Y223.37000 Z18.00000 J198.09 F500.0
+G1 X47.91000 Y225.17000 Z18.00000 J201.61 F500.0
+G1 X47.91000 Y229.37000 Z18.00000 J205.73 F500.0
+G1 X46.96000 Y229.92000 Z18.00000 J206.80 F500.0
+G1 X49.21000 Y229.92000 Z18.00000 J209.01 F500.0
+G1 X48.26000 Y229.37000 Z18.00000 J210.08 F500.0
+G1 X48.26000 Y225.17000 Z18.00000 J214.20 F500.0
+G1 X51.38000 Y223.37000 Z18.00000 J217.73 F500.0
+G1 X51.38000 Y219.17000 Z18.00000 J221.85 F500.0
+G1 X48.26000 Y217.37000 Z18.00000 J225.38 F500.0
+G1 X48.26000 Y213.17000 Z18.00000 J229.49 F500.0
+G1 X51.38000 Y211.37000 Z18.00000 J233.02 F500.0
+G1 X51.38000 Y209.98000 Z18.00000 J234.38 F500.0
+G1 X51.73000 Y209.98000 Z18.00000 J234.73 F500.0
+G1 X51.73000 Y211.37000 Z18.00000 J236.09 F500.0
+G1 X54.84000 Y213.17000 Z18.00000 J239.61 F500.0
+G1 X54.84000 Y217.37000 Z18.00000 J243.73 F500.0
+G1 X51.73000 Y219.17000 Z18.00000 J247.25 F500.0
+G1 X51.73000 Y223.37000 Z18.00000 J251.36 F500.0
+G1 X54.84000 Y225.17000 Z18.00000 J254.89 F500.0
+G1 X54.84000 Y229.37000 Z18.00000 J259.00 F500.0
+G1 X53.89000 Y229.92000 Z18.00000 J260.08 F500.0
+G1 X56.14000 Y229.92000 Z18.00000 J262.28 F500.0
+G1 X55.19000 Y229.37000 Z18.00000 J263.36 F500.0
+G1 X55.19000 Y225.17000 Z18.00000 J267.47 F500.0
+G1 X58.31000 Y223.37000 Z18.00000 J271.00 F500.0
+G1 X58.31000 Y219.17000 Z18.00000 J275.12 F500.0
+G1 X55.19000 Y217.37000 Z18.00000 J278.65 F500.0
+G1 X55.19000 Y213.17000 Z18.00000 J282.77 F500.0
+G1 X58.31000 Y211.37000 Z18.00000 J286.30 F500.0
+G1 X58.31000 Y209.98000 Z18.00000 J287.66 F500.0
+G1 X58.65000 Y209.98000 Z18.00000 J287.99 F500.0
+G1 X58.65000 Y211.37000 Z18.00000 J289.35 F500.0
+G1 X61.77000 Y213.17000 Z18.00000 J292.88 F500.0
+G1 X61.77000 Y217.37000 Z18.00000 J297.00 F500.0
+G1 X58.65000 Y219.17000 Z18.00000 J300.53 F500.0
+G1 X58.65000 Y223.37000 Z18.00000 J304.65 F500.0
+G1 X61.77000 Y225.17000 Z18.00000 J308.18 F500.0
+G1 X61.77000 Y229.37000 Z18.00000 J312.29 F500.0
+G1 X60.82000 Y229.92000 Z18.00000 J313.37 F500.0
+G1 X63.07000 Y229.92000 Z18.00000 J315.57 F500.0
+G1 X62.12000 Y229.37000 Z18.00000 J316.65 F500.0
+G1 X62.12000 Y225.17000 Z18.00000 J320.76 F500.0
+G1 X65.23000 Y223.37000 Z18.00000 J324.29 F500.0
+G1 X65.23000 Y219.17000 Z18.00000 J328.40 F500.0
+G1 X62.12000 Y217.37000 Z18.00000 J331.92 F500.0
+G1 X62.12000 Y213.17000 Z18.00000 J336.04 F500.0
+G1 X65.23000 Y211.37000 Z18.00000 J339.56 F500.0
+G1 X65.23000 Y209.98000 Z18.00000 J340.92 F500.0
+G1 X65.58000 Y209.98000 Z18.00000 J341.27 F500.0
+G1 X65.58000 Y211.37000 Z18.00000 J342.63 F500.0
+G1 X68.70000 Y213.17000 Z18.00000 J346.16 F500.0
+G1 X68.70000 Y217.37000 Z18.00000 J350.27 F500.0
+G1 X65.58000 Y219.17000 Z18.00000 J353.80 F500.0
+G1 X65.58000 Y223.37000 Z18.00000 J357.92 F500.0
+G1 X68.70000 Y225.17000 Z18.00000 J361.45 F500.0
+G1 X68.70000 Y229.37000 Z18.00000 J365.57 F500.0
+G1 X67.75000 Y229.92000 Z18.00000 J366.64 F500.0
+G1 X69.99000 Y229.92000 Z18.00000 J368.84 F500.0
+G1 X69.04000 Y229.37000 Z18.00000 J369.91 F500.0
+G1 X69.04000 Y225.17000 Z18.00000 J374.03 F500.0
+G1 X72.16000 Y223.37000 Z18.00000 J377.56 F500.0
+G1 X72.16000 Y219.17000 Z18.00000 J381.67 F500.0
+G1 X69.04000 Y217.37000 Z18.00000 J385.20 F500.0
+G1 X69.04000 Y213.17000 Z18.00000 J389.32 F500.0
+G1 X72.16000 Y211.37000 Z18.00000 J392.85 F500.0
+G1 X72.16000 Y209.98000 Z18.00000 J394.21 F500.0
+G1 X72.51000 Y209.98000 Z18.00000 J394.56 F500.0
+G1 X72.51000 Y211.37000 Z18.00000 J395.92 F500.0
+G1 X75.63000 Y213.17000 Z18.00000 J399.45 F500.0
+G1 X75.63000 Y217.37000 Z18.00000 J403.56 F500.0
+G1 X72.51000 Y219.17000 Z18.00000 J407.09 F500.0
+G1 X72.51000 Y223.37000 Z18.00000 J411.21 F500.0
+G1 X75.63000 Y225.17000 Z18.00000 J414.74 F500.0
+G1 X75.63000 Y229.37000 Z18.00000 J418.86 F500.0
+G1 X74.68000 Y229.92000 Z18.00000 J419.93 F500.0
+G1 X76.92000 Y229.92000 Z18.00000 J422.13 F500.0
+G1 X75.97000 Y229.37000 Z18.00000 J423.20 F500.0
+G1 X75.97000 Y225.17000 Z18.00000 J427.32 F500.0
+G1 X79.09000 Y223.37000 Z18.00000 J430.85 F500.0
+G1 X79.09000 Y219.17000 Z18.00000 J434.96 F500.0
+G1 X75.97000 Y217.37000 Z18.00000 J438.49 F500.0
+G1 X75.97000 Y213.17000 Z18.00000 J442.61 F500.0
+G1 X79.09000 Y211.37000 Z18.00000 J446.14 F500.0
+G1 X79.09000 Y209.98000 Z18.00000 J447.50 F500.0
+G1 X79.44000 Y209.98000 Z18.00000 J447.85 F500.0
+G1 X79.44000 Y211.37000 Z18.00000 J449.21 F500.0
+G1 X82.55000 Y213.17000 Z18.00000 J452.73 F500.0
+G1 X82.55000 Y217.37000 Z18.00000 J456.85 F500.0
+G1 X79.44000 Y219.17000 Z18.00000 J460.37 F500.0
+G1 X79.44000 Y223.37000 Z18.00000 J464.48 F500.0
+G1 X82.55000 Y225.17000 Z18.00000 J468.00 F500.0
+G1 X82.55000 Y229.37000 Z18.00000 J472.12 F500.0
+G1 X81.61000 Y229.92000 Z18.00000 J473.19 F500.0
+G1 X83.85000 Y229.92000 Z18.00000 J475.38 F500.0
+G1 X82.90000 Y229.37000 Z18.00000 J476.46 F500.0
+G1 X82.90000 Y225.17000 Z18.00000 J480.57 F500.0
+G1 X86.02000 Y223.37000 Z18.00000 J484.10 F500.0
+G1 X86.02000 Y219.17000 Z18.00000 J488.22 F500.0
+G1 X82.90000 Y217.37000 Z18.00000 J491.75 F500.0
+G1 X82.90000 Y213.17000 Z18.00000 J495.87 F500.0
+G1 X86.02000 Y211.37000 Z18.00000 J499.40 F500.0
+G1 X86.02000 Y209.98000 Z18.00000 J500.76 F500.0
+G1 X86.37000 Y209.98000 Z18.00000 J501.10 F500.0
+G1 X86.37000 Y211.37000 Z18.00000 J502.46 F500.0
+G1 X89.48000 Y213.17000 Z18.00000 J505.99 F500.0
+G1 X89.48000 Y217.37000 Z18.00000 J510.10 F500.0
+G1 X86.37000 Y219.17000 Z18.00000 J513.62 F500.0
+G1 X86.37000 Y223.37000 Z18.00000 J517.74 F500.0
+G1 X89.48000 Y225.17000 Z18.00000 J521.26 F500.0
+G1 X89.48000 Y229.37000 Z18.00000 J525.38 F500.0
+G1 X88.53000 Y229.92000 Z18.00000 J526.45 F500.0
+G1 X90.02000 Y229.48000 Z18.00000 J527.97 F500.0
+G1 X89.83000 Y229.37000 Z18.00000 J528.19 F500.0
+G1 X89.83000 Y225.17000 Z18.00000 J532.31 F500.0
+G1 X90.02000 Y225.06000 Z18.00000 J532.52 F500.0
+G1 X90.02000 Y217.84000 Z18.00000 J544.60 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X90.02000 Y217.48000 Z18.00000 J544.60 F800.0
+G1 X89.83000 Y217.37000 Z18.00000 J544.60 F800.0
+G1 X89.83000 Y213.17000 Z18.00000 J544.60 F800.0
+G1 X90.02000 Y213.06000 Z18.00000 J544.60 F800.0
+G1 X90.02000 Y213.06000 Z28.00000 J544.60 F800.0
+G1 X84.46000 Y205.54000 Z28.00000 J554.60 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X89.46000 Y210.54000 Z19.00000 J0.00 F300.0
+G1 X89.46000 Y212.34000 Z19.00000 J1.76 F300.0
+G1 X89.46000 Y229.36000 Z19.00000 J18.44 F300.0
+G1 X85.86000 Y229.36000 Z19.00000 J21.97 F300.0
+G1 X30.64000 Y229.36000 Z19.00000 J76.09 F500.0
+G1 X30.64000 Y227.56000 Z19.00000 J77.85 F500.0
+G1 X30.64000 Y210.54000 Z19.00000 J94.53 F500.0
+G1 X34.24000 Y210.54000 Z19.00000 J98.06 F500.0
+G1 X84.46000 Y210.54000 Z19.00000 J152.27 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X89.46000 Y210.54000 Z19.00000 J152.27 F800.0
+G1 X89.46000 Y210.54000 Z29.00000 J152.27 F800.0
+G1 X84.46000 Y205.54000 Z29.00000 J162.27 F800.0
+
+M400
+M280 P0 S2
+M400
+T0
+G1 X89.46000 Y210.54000 Z19.00000 J0.00 F300.0
+G1 X30.94000 Y210.54000 Z19.00000 J57.35 F300.0
+G1 X30.94000 Y211.37000 Z19.00000 J58.17 F300.0
+G1 X34.06000 Y213.17000 Z19.00000 J61.70 F300.0
+G1 X34.06000 Y217.37000 Z19.00000 J65.81 F500.0
+G1 X30.94000 Y219.17000 Z19.00000 J69.34 F500.0
+G1 X30.94000 Y223.37000 Z19.00000 J73.46 F500.0
+G1 X34.06000 Y225.17000 Z19.00000 J76.99 F500.0
+G1 X34.06000 Y229.36000 Z19.00000 J81.10 F500.0
+G1 X34.40000 Y229.36000 Z19.00000 J81.43 F500.0
+G1 X34.40000 Y225.17000 Z19.00000 J85.53 F500.0
+G1 X37.52000 Y223.37000 Z19.00000 J89.06 F500.0
+G1 X37.52000 Y219.17000 Z19.00000 J93.18 F500.0
+G1 X34.40000 Y217.37000 Z19.00000 J96.71 F500.0
+G1 X34.40000 Y213.17000 Z19.00000 J100.83 F500.0
+G1 X37.52000 Y211.37000 Z19.00000 J104.36 F500.0
+G1 X37.52000 Y210.54000 Z19.00000 J105.17 F500.0
+G1 X37.87000 Y210.54000 Z19.00000 J105.51 F500.0
+G1 X37.87000 Y211.37000 Z19.00000 J106.33 F500.0
+G1 X40.99000 Y213.17000 Z19.00000 J109.86 F500.0
+G1 X40.99000 Y217.37000 Z19.00000 J113.97 F500.0
+G1 X37.87000 Y219.17000 Z19.00000 J117.50 F500.0
+G1 X37.87000 Y223.37000 Z19.00000 J121.62 F500.0
+G1 X40.99000 Y225.17000 Z19.00000 J125.15 F500.0
+G1 X40.99000 Y229.36000 Z19.00000 J129.25 F500.0
+G1 X41.33000 Y229.36000 Z19.00000 J129.59 F500.0
+G1 X41.33000 Y225.17000 Z19.00000 J133.69 F500.0
+G1 X44.45000 Y223.37000 Z19.00000 J137.22 F500.0
+G1 X44.45000 Y219.17000 Z19.00000 J141.34 F500.0
+G1 X41.33000 Y217.37000 Z19.00000 J144.87 F500.0
+G1 X41.33000 Y213.17000 Z19.00000 J148.99 F500.0
+G1 X44.45000 Y211.37000 Z19.00000 J152.52 F500.0
+G1 X44.45000 Y210.54000 Z19.00000 J153.33 F500.0
+G1 X44.80000 Y210.54000 Z19.00000 J153.67 F500.0
+G1 X44.80000 Y211.37000 Z19.00000 J154.49 F500.0
+G1 X47.91000 Y213.17000 Z19.00000 J158.01 F500.0
+G1 X47.91000 Y217.37000 Z19.00000 J162.12 F500.0
+G1 X44.80000 Y219.17000 Z19.00000 J165.64 F500.0
+G1 X44.80000 Y223.37000 Z19.00000 J169.76 F500.0
+G1 X47.91000 Y225.17000 Z19.00000 J173.28 F500.0
+G1 X47.91000 Y229.36000 Z19.00000 J177.39 F500.0
+G1 X48.26000 Y229.36000 Z19.00000 J177.73 F500.0
+G1 X48.26000 Y225.17000 Z19.00000 J181.84 F500.0
+G1 X51.38000 Y223.37000 Z19.00000 J185.37 F500.0
+G1 X51.38000 Y219.17000 Z19.00000 J189.48 F500.0
+G1 X48.26000 Y217.37000 Z19.00000 J193.01 F500.0
+G1 X48.26000 Y213.17000 Z19.00000 J197.13 F500.0
+G1 X51.38000 Y211.37000 Z19.00000 J200.66 F500.0
+G1 X51.38000 Y210.54000 Z19.00000 J201.47 F500.0
+G1 X51.73000 Y210.54000 Z19.00000 J201.82 F500.0
+G1 X51.73000 Y211.37000 Z19.00000 J202.63 F500.0
+G1 X54.84000 Y213.17000 Z19.00000 J206.15 F500.0
+G1 X54.84000 Y217.37000 Z19.00000 J210.27 F500.0
+G1 X51.73000 Y219.17000 Z19.00000 J213.79 F500.0
+G1 X51.73000 Y223.37000 Z19.00000 J217.90 F500.0
+G1 X54.84000 Y225.17000 Z19.00000 J221.43 F500.0
+G1 X54.84000 Y229.36000 Z19.00000 J225.53 F500.0
+G1 X55.19000 Y229.36000 Z19.00000 J225.87 F500.0
+G1 X55.19000 Y225.17000 Z19.00000 J229.98 F500.0
+G1 X58.31000 Y223.37000 Z19.00000 J233.51 F500.0
+G1 X58.31000 Y219.17000 Z19.00000 J237.63 F500.0
+G1 X55.19000 Y217.37000 Z19.00000 J241.16 F500.0
+G1 X55.19000 Y213.17000 Z19.00000 J245.27 F500.0
+G1 X58.31000 Y211.37000 Z19.00000 J248.80 F500.0
+G1 X58.31000 Y210.54000 Z19.00000 J249.62 F500.0
+G1 X58.65000 Y210.54000 Z19.00000 J249.95 F500.0
+G1 X58.65000 Y211.37000 Z19.00000 J250.76 F500.0
+G1 X61.77000 Y213.17000 Z19.00000 J254.29 F500.0
+G1 X61.77000 Y217.37000 Z19.00000 J258.41 F500.0
+G1 X58.65000 Y219.17000 Z19.00000 J261.94 F500.0
+G1 X58.65000 Y223.37000 Z19.00000 J266.05 F500.0
+G1 X61.77000 Y225.17000 Z19.00000 J269.58 F500.0
+G1 X61.77000 Y229.36000 Z19.00000 J273.69 F500.0
+G1 X62.12000 Y229.36000 Z19.00000 J274.03 F500.0
+G1 X62.12000 Y225.17000 Z19.00000 J278.14 F500.0
+G1 X65.23000 Y223.37000 Z19.00000 J281.66 F500.0
+G1 X65.23000 Y219.17000 Z19.00000 J285.78 F500.0
+G1 X62.12000 Y217.37000 Z19.00000 J289.30 F500.0
+G1 X62.12000 Y213.17000 Z19.00000 J293.42 F500.0
+G1 X65.23000 Y211.37000 Z19.00000 J296.94 F500.0
+G1 X65.23000 Y210.54000 Z19.00000 J297.75 F500.0
+G1 X65.58000 Y210.54000 Z19.00000 J298.09 F500.0
+G1 X65.58000 Y211.37000 Z19.00000 J298.91 F500.0
+G1 X68.70000 Y213.17000 Z19.00000 J302.44 F500.0
+G1 X68.70000 Y217.37000 Z19.00000 J306.55 F500.0
+G1 X65.58000 Y219.17000 Z19.00000 J310.08 F500.0
+G1 X65.58000 Y223.37000 Z19.00000 J314.20 F500.0
+G1 X68.70000 Y225.17000 Z19.00000 J317.73 F500.0
+G1 X68.70000 Y229.36000 Z19.00000 J321.83 F500.0
+G1 X69.04000 Y229.36000 Z19.00000 J322.17 F500.0
+G1 X69.04000 Y225.17000 Z19.00000 J326.27 F500.0
+G1 X72.16000 Y223.37000 Z19.00000 J329.80 F500.0
+G1 X72.16000 Y219.17000 Z19.00000 J333.92 F500.0
+G1 X69.04000 Y217.37000 Z19.00000 J337.45 F500.0
+G1 X69.04000 Y213.17000 Z19.00000 J341.57 F500.0
+G1 X72.16000 Y211.37000 Z19.00000 J345.10 F500.0
+G1 X72.16000 Y210.54000 Z19.00000 J345.91 F500.0
+G1 X72.51000 Y210.54000 Z19.00000 J346.25 F500.0
+G1 X72.51000 Y211.37000 Z19.00000 J347.07 F500.0
+G1 X75.63000 Y213.17000 Z19.00000 J350.60 F500.0
+G1 X75.63000 Y217.37000 Z19.00000 J354.71 F500.0
+G1 X72.51000 Y219.17000 Z19.00000 J358.24 F500.0
+G1 X72.51000 Y223.37000 Z19.00000 J362.36 F500.0
+G1 X75.63000 Y225.17000 Z19.00000 J365.89 F500.0
+G1 X75.63000 Y229.36000 Z19.00000 J369.99 F500.0
+G1 X75.97000 Y229.36000 Z19.00000 J370.33 F500.0
+G1 X75.97000 Y225.17000 Z19.00000 J374.43 F500.0
+G1 X79.09000 Y223.37000 Z19.00000 J377.96 F500.0
+G1 X79.09000 Y219.17000 Z19.00000 J382.08 F500.0
+G1 X75.97000 Y217.37000 Z19.00000 J385.61 F500.0
+G1 X75.97000 Y213.17000 Z19.00000 J389.72 F500.0
+G1 X79.09000 Y211.37000 Z19.00000 J393.25 F500.0
+G1 X79.09000 Y210.54000 Z19.00000 J394.07 F500.0
+G1 X79.44000 Y210.54000 Z19.00000 J394.41 F500.0
+G1 X79.44000 Y211.37000 Z19.00000 J395.22 F500.0
+G1 X82.55000 Y213.17000 Z19.00000 J398.75 F500.0
+G1 X82.55000 Y217.37000 Z19.00000 J402.86 F500.0
+G1 X79.44000 Y219.17000 Z19.00000 J406.38 F500.0
+G1 X79.44000 Y223.37000 Z19.00000 J410.50 F500.0
+G1 X82.55000 Y225.17000 Z19.00000 J414.02 F500.0
+G1 X82.55000 Y229.36000 Z19.00000 J418.13 F500.0
+G1 X82.90000 Y229.36000 Z19.00000 J418.47 F500.0
+G1 X82.90000 Y225.17000 Z19.00000 J422.58 F500.0
+G1 X86.02000 Y223.37000 Z19.00000 J426.11 F500.0
+G1 X86.02000 Y219.17000 Z19.00000 J430.22 F500.0
+G1 X82.90000 Y217.37000 Z19.00000 J433.75 F500.0
+G1 X82.90000 Y213.17000 Z19.00000 J437.87 F500.0
+G1 X86.02000 Y211.37000 Z19.00000 J441.40 F500.0
+G1 X86.02000 Y210.54000 Z19.00000 J442.21 F500.0
+G1 X86.37000 Y210.54000 Z19.00000 J442.55 F500.0
+G1 X86.37000 Y211.37000 Z19.00000 J443.37 F500.0
+G1 X89.46000 Y213.16000 Z19.00000 J446.87 F500.0
+G1 X89.46000 Y217.38000 Z19.00000 J451.00 F500.0
+G1 X86.37000 Y219.17000 Z19.00000 J454.50 F500.0
+G1 X86.37000 Y221.94000 Z19.00000 J462.22 F300.0
+M400
+M280 P1.0000 S95
+M280 P1.0000 S2
+M400
+; fiber_basic cut 0
+G1 X86.37000 Y223.37000 Z19.00000 J462.22 F800.0
+G1 X89.46000 Y225.16000 Z19.00000 J462.22 F800.0
+G1 X89.46000 Y225.16000 Z59.00000 F300
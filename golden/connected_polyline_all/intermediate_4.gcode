@@ -0,0 +1,5172 @@
+T1
+G1 X39.655 Y-19.945 Z0.100
+G1 X39.945 Y-19.945 Z0.100
+G1 X39.945 Y19.855 Z0.100
+G1 X39.945 Y19.945 Z0.100
+G1 X-39.655 Y19.945 Z0.100
+G1 X-39.945 Y19.945 Z0.100
+G1 X-39.945 Y-19.855 Z0.100
+G1 X-39.945 Y-19.945 Z0.100
+G1 X39.655 Y-19.945 Z0.100
+G1 X39.655 Y-19.945 Z0.100
+G1 X-39.945 Y-18.837 Z0.100
+G1 X-39.848 Y-18.781 Z0.100
+G1 X-39.848 Y-14.581 Z0.100
+G1 X-39.945 Y-14.525 Z0.100
+G1 X-39.945 Y-6.837 Z0.100
+G1 X-39.848 Y-6.781 Z0.100
+G1 X-39.848 Y-2.581 Z0.100
+G1 X-39.945 Y-2.525 Z0.100
+G1 X-39.945 Y5.163 Z0.100
+G1 X-39.848 Y5.219 Z0.100
+G1 X-39.848 Y9.419 Z0.100
+G1 X-39.945 Y9.475 Z0.100
+G1 X-39.945 Y17.163 Z0.100
+G1 X-39.848 Y17.219 Z0.100
+G1 X-39.848 Y19.945 Z0.100
+G1 X-39.502 Y19.945 Z0.100
+G1 X-39.502 Y17.219 Z0.100
+G1 X-36.384 Y15.419 Z0.100
+G1 X-36.384 Y11.219 Z0.100
+G1 X-39.502 Y9.419 Z0.100
+G1 X-39.502 Y5.219 Z0.100
+G1 X-36.384 Y3.419 Z0.100
+G1 X-36.384 Y-0.781 Z0.100
+G1 X-39.502 Y-2.581 Z0.100
+G1 X-39.502 Y-6.781 Z0.100
+G1 X-36.384 Y-8.581 Z0.100
+G1 X-36.384 Y-12.781 Z0.100
+G1 X-39.502 Y-14.581 Z0.100
+G1 X-39.502 Y-18.781 Z0.100
+G1 X-37.486 Y-19.945 Z0.100
+G1 X-34.936 Y-19.945 Z0.100
+G1 X-32.920 Y-18.781 Z0.100
+G1 X-32.920 Y-14.581 Z0.100
+G1 X-36.038 Y-12.781 Z0.100
+G1 X-36.038 Y-8.581 Z0.100
+G1 X-32.920 Y-6.781 Z0.100
+G1 X-32.920 Y-2.581 Z0.100
+G1 X-36.038 Y-0.781 Z0.100
+G1 X-36.038 Y3.419 Z0.100
+G1 X-32.920 Y5.219 Z0.100
+G1 X-32.920 Y9.419 Z0.100
+G1 X-36.038 Y11.219 Z0.100
+G1 X-36.038 Y15.419 Z0.100
+G1 X-32.920 Y17.219 Z0.100
+G1 X-32.920 Y19.945 Z0.100
+G1 X-32.574 Y19.945 Z0.100
+G1 X-32.574 Y17.219 Z0.100
+G1 X-29.456 Y15.419 Z0.100
+G1 X-29.456 Y11.219 Z0.100
+G1 X-32.574 Y9.419 Z0.100
+G1 X-32.574 Y5.219 Z0.100
+G1 X-29.456 Y3.419 Z0.100
+G1 X-29.456 Y-0.781 Z0.100
+G1 X-32.574 Y-2.581 Z0.100
+G1 X-32.574 Y-6.781 Z0.100
+G1 X-29.456 Y-8.581 Z0.100
+G1 X-29.456 Y-12.781 Z0.100
+G1 X-32.574 Y-14.581 Z0.100
+G1 X-32.574 Y-18.781 Z0.100
+G1 X-30.558 Y-19.945 Z0.100
+G1 X-28.008 Y-19.945 Z0.100
+G1 X-25.992 Y-18.781 Z0.100
+G1 X-25.992 Y-14.581 Z0.100
+G1 X-29.110 Y-12.781 Z0.100
+G1 X-29.110 Y-8.581 Z0.100
+G1 X-25.992 Y-6.781 Z0.100
+G1 X-25.992 Y-2.581 Z0.100
+G1 X-29.110 Y-0.781 Z0.100
+G1 X-29.110 Y3.419 Z0.100
+G1 X-25.992 Y5.219 Z0.100
+G1 X-25.992 Y9.419 Z0.100
+G1 X-29.110 Y11.219 Z0.100
+G1 X-29.110 Y15.419 Z0.100
+G1 X-25.992 Y17.219 Z0.100
+G1 X-25.992 Y19.945 Z0.100
+G1 X-25.646 Y19.945 Z0.100
+G1 X-25.646 Y17.219 Z0.100
+G1 X-22.528 Y15.419 Z0.100
+G1 X-22.528 Y11.219 Z0.100
+G1 X-25.646 Y9.419 Z0.100
+G1 X-25.646 Y5.219 Z0.100
+G1 X-22.528 Y3.419 Z0.100
+G1 X-22.528 Y-0.781 Z0.100
+G1 X-25.646 Y-2.581 Z0.100
+G1 X-25.646 Y-6.781 Z0.100
+G1 X-22.528 Y-8.581 Z0.100
+G1 X-22.528 Y-12.781 Z0.100
+G1 X-25.646 Y-14.581 Z0.100
+G1 X-25.646 Y-18.781 Z0.100
+G1 X-23.630 Y-19.945 Z0.100
+G1 X-21.079 Y-19.945 Z0.100
+G1 X-19.063 Y-18.781 Z0.100
+G1 X-19.063 Y-14.581 Z0.100
+G1 X-22.181 Y-12.781 Z0.100
+G1 X-22.181 Y-8.581 Z0.100
+G1 X-19.063 Y-6.781 Z0.100
+G1 X-19.063 Y-2.581 Z0.100
+G1 X-22.181 Y-0.781 Z0.100
+G1 X-22.181 Y3.419 Z0.100
+G1 X-19.063 Y5.219 Z0.100
+G1 X-19.063 Y9.419 Z0.100
+G1 X-22.181 Y11.219 Z0.100
+G1 X-22.181 Y15.419 Z0.100
+G1 X-19.063 Y17.219 Z0.100
+G1 X-19.063 Y19.945 Z0.100
+G1 X-18.717 Y19.945 Z0.100
+G1 X-18.717 Y17.219 Z0.100
+G1 X-15.599 Y15.419 Z0.100
+G1 X-15.599 Y11.219 Z0.100
+G1 X-18.717 Y9.419 Z0.100
+G1 X-18.717 Y5.219 Z0.100
+G1 X-15.599 Y3.419 Z0.100
+G1 X-15.599 Y-0.781 Z0.100
+G1 X-18.717 Y-2.581 Z0.100
+G1 X-18.717 Y-6.781 Z0.100
+G1 X-15.599 Y-8.581 Z0.100
+G1 X-15.599 Y-12.781 Z0.100
+G1 X-18.717 Y-14.581 Z0.100
+G1 X-18.717 Y-18.781 Z0.100
+G1 X-16.701 Y-19.945 Z0.100
+G1 X-14.152 Y-19.945 Z0.100
+G1 X-12.136 Y-18.781 Z0.100
+G1 X-12.136 Y-14.581 Z0.100
+G1 X-15.254 Y-12.781 Z0.100
+G1 X-15.254 Y-8.581 Z0.100
+G1 X-12.136 Y-6.781 Z0.100
+G1 X-12.136 Y-2.581 Z0.100
+G1 X-15.254 Y-0.781 Z0.100
+G1 X-15.254 Y3.419 Z0.100
+G1 X-12.136 Y5.219 Z0.100
+G1 X-12.136 Y9.419 Z0.100
+G1 X-15.254 Y11.219 Z0.100
+G1 X-15.254 Y15.419 Z0.100
+G1 X-12.136 Y17.219 Z0.100
+G1 X-12.136 Y19.945 Z0.100
+G1 X-11.789 Y19.945 Z0.100
+G1 X-11.789 Y17.219 Z0.100
+G1 X-8.671 Y15.419 Z0.100
+G1 X-8.671 Y11.219 Z0.100
+G1 X-11.789 Y9.419 Z0.100
+G1 X-11.789 Y5.219 Z0.100
+G1 X-8.671 Y3.419 Z0.100
+G1 X-8.671 Y-0.781 Z0.100
+G1 X-11.789 Y-2.581 Z0.100
+G1 X-11.789 Y-6.781 Z0.100
+G1 X-8.671 Y-8.581 Z0.100
+G1 X-8.671 Y-12.781 Z0.100
+G1 X-11.789 Y-14.581 Z0.100
+G1 X-11.789 Y-18.781 Z0.100
+G1 X-9.773 Y-19.945 Z0.100
+G1 X-7.223 Y-19.945 Z0.100
+G1 X-5.207 Y-18.781 Z0.100
+G1 X-5.207 Y-14.581 Z0.100
+G1 X-8.325 Y-12.781 Z0.100
+G1 X-8.325 Y-8.581 Z0.100
+G1 X-5.207 Y-6.781 Z0.100
+G1 X-5.207 Y-2.581 Z0.100
+G1 X-8.325 Y-0.781 Z0.100
+G1 X-8.325 Y3.419 Z0.100
+G1 X-5.207 Y5.219 Z0.100
+G1 X-5.207 Y9.419 Z0.100
+G1 X-8.325 Y11.219 Z0.100
+G1 X-8.325 Y15.419 Z0.100
+G1 X-5.207 Y17.219 Z0.100
+G1 X-5.207 Y19.945 Z0.100
+G1 X-4.861 Y19.945 Z0.100
+G1 X-4.861 Y17.219 Z0.100
+G1 X-1.743 Y15.419 Z0.100
+G1 X-1.743 Y11.219 Z0.100
+G1 X-4.861 Y9.419 Z0.100
+G1 X-4.861 Y5.219 Z0.100
+G1 X-1.743 Y3.419 Z0.100
+G1 X-1.743 Y-0.781 Z0.100
+G1 X-4.861 Y-2.581 Z0.100
+G1 X-4.861 Y-6.781 Z0.100
+G1 X-1.743 Y-8.581 Z0.100
+G1 X-1.743 Y-12.781 Z0.100
+G1 X-4.861 Y-14.581 Z0.100
+G1 X-4.861 Y-18.781 Z0.100
+G1 X-2.845 Y-19.945 Z0.100
+G1 X-0.295 Y-19.945 Z0.100
+G1 X1.721 Y-18.781 Z0.100
+G1 X1.721 Y-14.581 Z0.100
+G1 X-1.397 Y-12.781 Z0.100
+G1 X-1.397 Y-8.581 Z0.100
+G1 X1.721 Y-6.781 Z0.100
+G1 X1.721 Y-2.581 Z0.100
+G1 X-1.397 Y-0.781 Z0.100
+G1 X-1.397 Y3.419 Z0.100
+G1 X1.721 Y5.219 Z0.100
+G1 X1.721 Y9.419 Z0.100
+G1 X-1.397 Y11.219 Z0.100
+G1 X-1.397 Y15.419 Z0.100
+G1 X1.721 Y17.219 Z0.100
+G1 X1.721 Y19.945 Z0.100
+G1 X2.067 Y19.945 Z0.100
+G1 X2.067 Y17.219 Z0.100
+G1 X5.185 Y15.419 Z0.100
+G1 X5.185 Y11.219 Z0.100
+G1 X2.067 Y9.419 Z0.100
+G1 X2.067 Y5.219 Z0.100
+G1 X5.185 Y3.419 Z0.100
+G1 X5.185 Y-0.781 Z0.100
+G1 X2.067 Y-2.581 Z0.100
+G1 X2.067 Y-6.781 Z0.100
+G1 X5.185 Y-8.581 Z0.100
+G1 X5.185 Y-12.781 Z0.100
+G1 X2.067 Y-14.581 Z0.100
+G1 X2.067 Y-18.781 Z0.100
+G1 X4.083 Y-19.945 Z0.100
+G1 X6.633 Y-19.945 Z0.100
+G1 X8.649 Y-18.781 Z0.100
+G1 X8.649 Y-14.581 Z0.100
+G1 X5.531 Y-12.781 Z0.100
+G1 X5.531 Y-8.581 Z0.100
+G1 X8.649 Y-6.781 Z0.100
+G1 X8.649 Y-2.581 Z0.100
+G1 X5.531 Y-0.781 Z0.100
+G1 X5.531 Y3.419 Z0.100
+G1 X8.649 Y5.219 Z0.100
+G1 X8.649 Y9.419 Z0.100
+G1 X5.531 Y11.219 Z0.100
+G1 X5.531 Y15.419 Z0.100
+G1 X8.649 Y17.219 Z0.100
+G1 X8.649 Y19.945 Z0.100
+G1 X8.995 Y19.945 Z0.100
+G1 X8.995 Y17.219 Z0.100
+G1 X12.113 Y15.419 Z0.100
+G1 X12.113 Y11.219 Z0.100
+G1 X8.995 Y9.419 Z0.100
+G1 X8.995 Y5.219 Z0.100
+G1 X12.113 Y3.419 Z0.100
+G1 X12.113 Y-0.781 Z0.100
+G1 X8.995 Y-2.581 Z0.100
+G1 X8.995 Y-6.781 Z0.100
+G1 X12.113 Y-8.581 Z0.100
+G1 X12.113 Y-12.781 Z0.100
+G1 X8.995 Y-14.581 Z0.100
+G1 X8.995 Y-18.781 Z0.100
+G1 X11.011 Y-19.945 Z0.100
+G1 X13.562 Y-19.945 Z0.100
+G1 X15.578 Y-18.781 Z0.100
+G1 X15.578 Y-14.581 Z0.100
+G1 X12.460 Y-12.781 Z0.100
+G1 X12.460 Y-8.581 Z0.100
+G1 X15.578 Y-6.781 Z0.100
+G1 X15.578 Y-2.581 Z0.100
+G1 X12.460 Y-0.781 Z0.100
+G1 X12.460 Y3.419 Z0.100
+G1 X15.578 Y5.219 Z0.100
+G1 X15.578 Y9.419 Z0.100
+G1 X12.460 Y11.219 Z0.100
+G1 X12.460 Y15.419 Z0.100
+G1 X15.578 Y17.219 Z0.100
+G1 X15.578 Y19.945 Z0.100
+G1 X15.924 Y19.945 Z0.100
+G1 X15.924 Y17.219 Z0.100
+G1 X19.042 Y15.419 Z0.100
+G1 X19.042 Y11.219 Z0.100
+G1 X15.924 Y9.419 Z0.100
+G1 X15.924 Y5.219 Z0.100
+G1 X19.042 Y3.419 Z0.100
+G1 X19.042 Y-0.781 Z0.100
+G1 X15.924 Y-2.581 Z0.100
+G1 X15.924 Y-6.781 Z0.100
+G1 X19.042 Y-8.581 Z0.100
+G1 X19.042 Y-12.781 Z0.100
+G1 X15.924 Y-14.581 Z0.100
+G1 X15.924 Y-18.781 Z0.100
+G1 X17.940 Y-19.945 Z0.100
+G1 X20.489 Y-19.945 Z0.100
+G1 X22.505 Y-18.781 Z0.100
+G1 X22.505 Y-14.581 Z0.100
+G1 X19.387 Y-12.781 Z0.100
+G1 X19.387 Y-8.581 Z0.100
+G1 X22.505 Y-6.781 Z0.100
+G1 X22.505 Y-2.581 Z0.100
+G1 X19.387 Y-0.781 Z0.100
+G1 X19.387 Y3.419 Z0.100
+G1 X22.505 Y5.219 Z0.100
+G1 X22.505 Y9.419 Z0.100
+G1 X19.387 Y11.219 Z0.100
+G1 X19.387 Y15.419 Z0.100
+G1 X22.505 Y17.219 Z0.100
+G1 X22.505 Y19.945 Z0.100
+G1 X22.852 Y19.945 Z0.100
+G1 X22.852 Y17.219 Z0.100
+G1 X25.970 Y15.419 Z0.100
+G1 X25.970 Y11.219 Z0.100
+G1 X22.852 Y9.419 Z0.100
+G1 X22.852 Y5.219 Z0.100
+G1 X25.970 Y3.419 Z0.100
+G1 X25.970 Y-0.781 Z0.100
+G1 X22.852 Y-2.581 Z0.100
+G1 X22.852 Y-6.781 Z0.100
+G1 X25.970 Y-8.581 Z0.100
+G1 X25.970 Y-12.781 Z0.100
+G1 X22.852 Y-14.581 Z0.100
+G1 X22.852 Y-18.781 Z0.100
+G1 X24.868 Y-19.945 Z0.100
+G1 X27.418 Y-19.945 Z0.100
+G1 X29.434 Y-18.781 Z0.100
+G1 X29.434 Y-14.581 Z0.100
+G1 X26.316 Y-12.781 Z0.100
+G1 X26.316 Y-8.581 Z0.100
+G1 X29.434 Y-6.781 Z0.100
+G1 X29.434 Y-2.581 Z0.100
+G1 X26.316 Y-0.781 Z0.100
+G1 X26.316 Y3.419 Z0.100
+G1 X29.434 Y5.219 Z0.100
+G1 X29.434 Y9.419 Z0.100
+G1 X26.316 Y11.219 Z0.100
+G1 X26.316 Y15.419 Z0.100
+G1 X29.434 Y17.219 Z0.100
+G1 X29.434 Y19.945 Z0.100
+G1 X29.780 Y19.945 Z0.100
+G1 X29.780 Y17.219 Z0.100
+G1 X32.898 Y15.419 Z0.100
+G1 X32.898 Y11.219 Z0.100
+G1 X29.780 Y9.419 Z0.100
+G1 X29.780 Y5.219 Z0.100
+G1 X32.898 Y3.419 Z0.100
+G1 X32.898 Y-0.781 Z0.100
+G1 X29.780 Y-2.581 Z0.100
+G1 X29.780 Y-6.781 Z0.100
+G1 X32.898 Y-8.581 Z0.100
+G1 X32.898 Y-12.781 Z0.100
+G1 X29.780 Y-14.581 Z0.100
+G1 X29.780 Y-18.781 Z0.100
+G1 X31.796 Y-19.945 Z0.100
+G1 X34.346 Y-19.945 Z0.100
+G1 X36.362 Y-18.781 Z0.100
+G1 X36.362 Y-14.581 Z0.100
+G1 X33.244 Y-12.781 Z0.100
+G1 X33.244 Y-8.581 Z0.100
+G1 X36.362 Y-6.781 Z0.100
+G1 X36.362 Y-2.581 Z0.100
+G1 X33.244 Y-0.781 Z0.100
+G1 X33.244 Y3.419 Z0.100
+G1 X36.362 Y5.219 Z0.100
+G1 X36.362 Y9.419 Z0.100
+G1 X33.244 Y11.219 Z0.100
+G1 X33.244 Y15.419 Z0.100
+G1 X36.362 Y17.219 Z0.100
+G1 X36.362 Y19.945 Z0.100
+G1 X36.708 Y19.945 Z0.100
+G1 X36.708 Y17.219 Z0.100
+G1 X39.826 Y15.419 Z0.100
+G1 X39.826 Y11.219 Z0.100
+G1 X36.708 Y9.419 Z0.100
+G1 X36.708 Y5.219 Z0.100
+G1 X39.826 Y3.419 Z0.100
+G1 X39.826 Y-0.781 Z0.100
+G1 X36.708 Y-2.581 Z0.100
+G1 X36.708 Y-6.781 Z0.100
+G1 X39.826 Y-8.581 Z0.100
+G1 X39.826 Y-12.781 Z0.100
+G1 X36.708 Y-14.581 Z0.100
+G1 X36.708 Y-18.781 Z0.100
+G1 X38.724 Y-19.945 Z0.100
+T1
+G1 X36.210 Y-19.390 Z1.100
+G1 X39.390 Y-19.390 Z1.100
+G1 X39.390 Y18.410 Z1.100
+G1 X39.390 Y19.390 Z1.100
+G1 X-36.210 Y19.390 Z1.100
+G1 X-39.390 Y19.390 Z1.100
+G1 X-39.390 Y-18.410 Z1.100
+G1 X-39.390 Y-19.390 Z1.100
+G1 X36.210 Y-19.390 Z1.100
+G1 X36.210 Y-19.390 Z1.100
+G1 X-39.390 Y17.154 Z1.100
+G1 X-36.384 Y15.419 Z1.100
+G1 X-36.384 Y11.219 Z1.100
+G1 X-39.390 Y9.484 Z1.100
+G1 X-39.390 Y5.154 Z1.100
+G1 X-36.384 Y3.419 Z1.100
+G1 X-36.384 Y-0.781 Z1.100
+G1 X-39.390 Y-2.516 Z1.100
+G1 X-39.390 Y-6.846 Z1.100
+G1 X-36.384 Y-8.581 Z1.100
+G1 X-36.384 Y-12.781 Z1.100
+G1 X-39.390 Y-14.516 Z1.100
+G1 X-39.390 Y-18.846 Z1.100
+G1 X-38.447 Y-19.390 Z1.100
+G1 X-33.975 Y-19.390 Z1.100
+G1 X-32.920 Y-18.781 Z1.100
+G1 X-32.920 Y-14.581 Z1.100
+G1 X-36.038 Y-12.781 Z1.100
+G1 X-36.038 Y-8.581 Z1.100
+G1 X-32.920 Y-6.781 Z1.100
+G1 X-32.920 Y-2.581 Z1.100
+G1 X-36.038 Y-0.781 Z1.100
+G1 X-36.038 Y3.419 Z1.100
+G1 X-32.920 Y5.219 Z1.100
+G1 X-32.920 Y9.419 Z1.100
+G1 X-36.038 Y11.219 Z1.100
+G1 X-36.038 Y15.419 Z1.100
+G1 X-32.920 Y17.219 Z1.100
+G1 X-32.920 Y19.390 Z1.100
+G1 X-32.574 Y19.390 Z1.100
+G1 X-32.574 Y17.219 Z1.100
+G1 X-29.456 Y15.419 Z1.100
+G1 X-29.456 Y11.219 Z1.100
+G1 X-32.574 Y9.419 Z1.100
+G1 X-32.574 Y5.219 Z1.100
+G1 X-29.456 Y3.419 Z1.100
+G1 X-29.456 Y-0.781 Z1.100
+G1 X-32.574 Y-2.581 Z1.100
+G1 X-32.574 Y-6.781 Z1.100
+G1 X-29.456 Y-8.581 Z1.100
+G1 X-29.456 Y-12.781 Z1.100
+G1 X-32.574 Y-14.581 Z1.100
+G1 X-32.574 Y-18.781 Z1.100
+G1 X-31.519 Y-19.390 Z1.100
+G1 X-27.047 Y-19.390 Z1.100
+G1 X-25.992 Y-18.781 Z1.100
+G1 X-25.992 Y-14.581 Z1.100
+G1 X-29.110 Y-12.781 Z1.100
+G1 X-29.110 Y-8.581 Z1.100
+G1 X-25.992 Y-6.781 Z1.100
+G1 X-25.992 Y-2.581 Z1.100
+G1 X-29.110 Y-0.781 Z1.100
+G1 X-29.110 Y3.419 Z1.100
+G1 X-25.992 Y5.219 Z1.100
+G1 X-25.992 Y9.419 Z1.100
+G1 X-29.110 Y11.219 Z1.100
+G1 X-29.110 Y15.419 Z1.100
+G1 X-25.992 Y17.219 Z1.100
+G1 X-25.992 Y19.390 Z1.100
+G1 X-25.646 Y19.390 Z1.100
+G1 X-25.646 Y17.219 Z1.100
+G1 X-22.528 Y15.419 Z1.100
+G1 X-22.528 Y11.219 Z1.100
+G1 X-25.646 Y9.419 Z1.100
+G1 X-25.646 Y5.219 Z1.100
+G1 X-22.528 Y3.419 Z1.100
+G1 X-22.528 Y-0.781 Z1.100
+G1 X-25.646 Y-2.581 Z1.100
+G1 X-25.646 Y-6.781 Z1.100
+G1 X-22.528 Y-8.581 Z1.100
+G1 X-22.528 Y-12.781 Z1.100
+G1 X-25.646 Y-14.581 Z1.100
+G1 X-25.646 Y-18.781 Z1.100
+G1 X-24.591 Y-19.390 Z1.100
+G1 X-20.118 Y-19.390 Z1.100
+G1 X-19.063 Y-18.781 Z1.100
+G1 X-19.063 Y-14.581 Z1.100
+G1 X-22.181 Y-12.781 Z1.100
+G1 X-22.181 Y-8.581 Z1.100
+G1 X-19.063 Y-6.781 Z1.100
+G1 X-19.063 Y-2.581 Z1.100
+G1 X-22.181 Y-0.781 Z1.100
+G1 X-22.181 Y3.419 Z1.100
+G1 X-19.063 Y5.219 Z1.100
+G1 X-19.063 Y9.419 Z1.100
+G1 X-22.181 Y11.219 Z1.100
+G1 X-22.181 Y15.419 Z1.100
+G1 X-19.063 Y17.219 Z1.100
+G1 X-19.063 Y19.390 Z1.100
+G1 X-18.717 Y19.390 Z1.100
+G1 X-18.717 Y17.219 Z1.100
+G1 X-15.599 Y15.419 Z1.100
+G1 X-15.599 Y11.219 Z1.100
+G1 X-18.717 Y9.419 Z1.100
+G1 X-18.717 Y5.219 Z1.100
+G1 X-15.599 Y3.419 Z1.100
+G1 X-15.599 Y-0.781 Z1.100
+G1 X-18.717 Y-2.581 Z1.100
+G1 X-18.717 Y-6.781 Z1.100
+G1 X-15.599 Y-8.581 Z1.100
+G1 X-15.599 Y-12.781 Z1.100
+G1 X-18.717 Y-14.581 Z1.100
+G1 X-18.717 Y-18.781 Z1.100
+G1 X-17.662 Y-19.390 Z1.100
+G1 X-13.191 Y-19.390 Z1.100
+G1 X-12.136 Y-18.781 Z1.100
+G1 X-12.136 Y-14.581 Z1.100
+G1 X-15.254 Y-12.781 Z1.100
+G1 X-15.254 Y-8.581 Z1.100
+G1 X-12.136 Y-6.781 Z1.100
+G1 X-12.136 Y-2.581 Z1.100
+G1 X-15.254 Y-0.781 Z1.100
+G1 X-15.254 Y3.419 Z1.100
+G1 X-12.136 Y5.219 Z1.100
+G1 X-12.136 Y9.419 Z1.100
+G1 X-15.254 Y11.219 Z1.100
+G1 X-15.254 Y15.419 Z1.100
+G1 X-12.136 Y17.219 Z1.100
+G1 X-12.136 Y19.390 Z1.100
+G1 X-11.789 Y19.390 Z1.100
+G1 X-11.789 Y17.219 Z1.100
+G1 X-8.671 Y15.419 Z1.100
+G1 X-8.671 Y11.219 Z1.100
+G1 X-11.789 Y9.419 Z1.100
+G1 X-11.789 Y5.219 Z1.100
+G1 X-8.671 Y3.419 Z1.100
+G1 X-8.671 Y-0.781 Z1.100
+G1 X-11.789 Y-2.581 Z1.100
+G1 X-11.789 Y-6.781 Z1.100
+G1 X-8.671 Y-8.581 Z1.100
+G1 X-8.671 Y-12.781 Z1.100
+G1 X-11.789 Y-14.581 Z1.100
+G1 X-11.789 Y-18.781 Z1.100
+G1 X-10.734 Y-19.390 Z1.100
+G1 X-6.262 Y-19.390 Z1.100
+G1 X-5.207 Y-18.781 Z1.100
+G1 X-5.207 Y-14.581 Z1.100
+G1 X-8.325 Y-12.781 Z1.100
+G1 X-8.325 Y-8.581 Z1.100
+G1 X-5.207 Y-6.781 Z1.100
+G1 X-5.207 Y-2.581 Z1.100
+G1 X-8.325 Y-0.781 Z1.100
+G1 X-8.325 Y3.419 Z1.100
+G1 X-5.207 Y5.219 Z1.100
+G1 X-5.207 Y9.419 Z1.100
+G1 X-8.325 Y11.219 Z1.100
+G1 X-8.325 Y15.419 Z1.100
+G1 X-5.207 Y17.219 Z1.100
+G1 X-5.207 Y19.390 Z1.100
+G1 X-4.861 Y19.390 Z1.100
+G1 X-4.861 Y17.219 Z1.100
+G1 X-1.743 Y15.419 Z1.100
+G1 X-1.743 Y11.219 Z1.100
+G1 X-4.861 Y9.419 Z1.100
+G1 X-4.861 Y5.219 Z1.100
+G1 X-1.743 Y3.419 Z1.100
+G1 X-1.743 Y-0.781 Z1.100
+G1 X-4.861 Y-2.581 Z1.100
+G1 X-4.861 Y-6.781 Z1.100
+G1 X-1.743 Y-8.581 Z1.100
+G1 X-1.743 Y-12.781 Z1.100
+G1 X-4.861 Y-14.581 Z1.100
+G1 X-4.861 Y-18.781 Z1.100
+G1 X-3.806 Y-19.390 Z1.100
+G1 X0.666 Y-19.390 Z1.100
+G1 X1.721 Y-18.781 Z1.100
+G1 X1.721 Y-14.581 Z1.100
+G1 X-1.397 Y-12.781 Z1.100
+G1 X-1.397 Y-8.581 Z1.100
+G1 X1.721 Y-6.781 Z1.100
+G1 X1.721 Y-2.581 Z1.100
+G1 X-1.397 Y-0.781 Z1.100
+G1 X-1.397 Y3.419 Z1.100
+G1 X1.721 Y5.219 Z1.100
+G1 X1.721 Y9.419 Z1.100
+G1 X-1.397 Y11.219 Z1.100
+G1 X-1.397 Y15.419 Z1.100
+G1 X1.721 Y17.219 Z1.100
+G1 X1.721 Y19.390 Z1.100
+G1 X2.067 Y19.390 Z1.100
+G1 X2.067 Y17.219 Z1.100
+G1 X5.185 Y15.419 Z1.100
+G1 X5.185 Y11.219 Z1.100
+G1 X2.067 Y9.419 Z1.100
+G1 X2.067 Y5.219 Z1.100
+G1 X5.185 Y3.419 Z1.100
+G1 X5.185 Y-0.781 Z1.100
+G1 X2.067 Y-2.581 Z1.100
+G1 X2.067 Y-6.781 Z1.100
+G1 X5.185 Y-8.581 Z1.100
+G1 X5.185 Y-12.781 Z1.100
+G1 X2.067 Y-14.581 Z1.100
+G1 X2.067 Y-18.781 Z1.100
+G1 X3.122 Y-19.390 Z1.100
+G1 X7.594 Y-19.390 Z1.100
+G1 X8.649 Y-18.781 Z1.100
+G1 X8.649 Y-14.581 Z1.100
+G1 X5.531 Y-12.781 Z1.100
+G1 X5.531 Y-8.581 Z1.100
+G1 X8.649 Y-6.781 Z1.100
+G1 X8.649 Y-2.581 Z1.100
+G1 X5.531 Y-0.781 Z1.100
+G1 X5.531 Y3.419 Z1.100
+G1 X8.649 Y5.219 Z1.100
+G1 X8.649 Y9.419 Z1.100
+G1 X5.531 Y11.219 Z1.100
+G1 X5.531 Y15.419 Z1.100
+G1 X8.649 Y17.219 Z1.100
+G1 X8.649 Y19.390 Z1.100
+G1 X8.995 Y19.390 Z1.100
+G1 X8.995 Y17.219 Z1.100
+G1 X12.113 Y15.419 Z1.100
+G1 X12.113 Y11.219 Z1.100
+G1 X8.995 Y9.419 Z1.100
+G1 X8.995 Y5.219 Z1.100
+G1 X12.113 Y3.419 Z1.100
+G1 X12.113 Y-0.781 Z1.100
+G1 X8.995 Y-2.581 Z1.100
+G1 X8.995 Y-6.781 Z1.100
+G1 X12.113 Y-8.581 Z1.100
+G1 X12.113 Y-12.781 Z1.100
+G1 X8.995 Y-14.581 Z1.100
+G1 X8.995 Y-18.781 Z1.100
+G1 X10.050 Y-19.390 Z1.100
+G1 X14.523 Y-19.390 Z1.100
+G1 X15.578 Y-18.781 Z1.100
+G1 X15.578 Y-14.581 Z1.100
+G1 X12.460 Y-12.781 Z1.100
+G1 X12.460 Y-8.581 Z1.100
+G1 X15.578 Y-6.781 Z1.100
+G1 X15.578 Y-2.581 Z1.100
+G1 X12.460 Y-0.781 Z1.100
+G1 X12.460 Y3.419 Z1.100
+G1 X15.578 Y5.219 Z1.100
+G1 X15.578 Y9.419 Z1.100
+G1 X12.460 Y11.219 Z1.100
+G1 X12.460 Y15.419 Z1.100
+G1 X15.578 Y17.219 Z1.100
+G1 X15.578 Y19.390 Z1.100
+G1 X15.924 Y19.390 Z1.100
+G1 X15.924 Y17.219 Z1.100
+G1 X19.042 Y15.419 Z1.100
+G1 X19.042 Y11.219 Z1.100
+G1 X15.924 Y9.419 Z1.100
+G1 X15.924 Y5.219 Z1.100
+G1 X19.042 Y3.419 Z1.100
+G1 X19.042 Y-0.781 Z1.100
+G1 X15.924 Y-2.581 Z1.100
+G1 X15.924 Y-6.781 Z1.100
+G1 X19.042 Y-8.581 Z1.100
+G1 X19.042 Y-12.781 Z1.100
+G1 X15.924 Y-14.581 Z1.100
+G1 X15.924 Y-18.781 Z1.100
+G1 X16.979 Y-19.390 Z1.100
+G1 X21.450 Y-19.390 Z1.100
+G1 X22.505 Y-18.781 Z1.100
+G1 X22.505 Y-14.581 Z1.100
+G1 X19.387 Y-12.781 Z1.100
+G1 X19.387 Y-8.581 Z1.100
+G1 X22.505 Y-6.781 Z1.100
+G1 X22.505 Y-2.581 Z1.100
+G1 X19.387 Y-0.781 Z1.100
+G1 X19.387 Y3.419 Z1.100
+G1 X22.505 Y5.219 Z1.100
+G1 X22.505 Y9.419 Z1.100
+G1 X19.387 Y11.219 Z1.100
+G1 X19.387 Y15.419 Z1.100
+G1 X22.505 Y17.219 Z1.100
+G1 X22.505 Y19.390 Z1.100
+G1 X22.852 Y19.390 Z1.100
+G1 X22.852 Y17.219 Z1.100
+G1 X25.970 Y15.419 Z1.100
+G1 X25.970 Y11.219 Z1.100
+G1 X22.852 Y9.419 Z1.100
+G1 X22.852 Y5.219 Z1.100
+G1 X25.970 Y3.419 Z1.100
+G1 X25.970 Y-0.781 Z1.100
+G1 X22.852 Y-2.581 Z1.100
+G1 X22.852 Y-6.781 Z1.100
+G1 X25.970 Y-8.581 Z1.100
+G1 X25.970 Y-12.781 Z1.100
+G1 X22.852 Y-14.581 Z1.100
+G1 X22.852 Y-18.781 Z1.100
+G1 X23.907 Y-19.390 Z1.100
+G1 X28.379 Y-19.390 Z1.100
+G1 X29.434 Y-18.781 Z1.100
+G1 X29.434 Y-14.581 Z1.100
+G1 X26.316 Y-12.781 Z1.100
+G1 X26.316 Y-8.581 Z1.100
+G1 X29.434 Y-6.781 Z1.100
+G1 X29.434 Y-2.581 Z1.100
+G1 X26.316 Y-0.781 Z1.100
+G1 X26.316 Y3.419 Z1.100
+G1 X29.434 Y5.219 Z1.100
+G1 X29.434 Y9.419 Z1.100
+G1 X26.316 Y11.219 Z1.100
+G1 X26.316 Y15.419 Z1.100
+G1 X29.434 Y17.219 Z1.100
+G1 X29.434 Y19.390 Z1.100
+G1 X29.780 Y19.390 Z1.100
+G1 X29.780 Y17.219 Z1.100
+G1 X32.898 Y15.419 Z1.100
+G1 X32.898 Y11.219 Z1.100
+G1 X29.780 Y9.419 Z1.100
+G1 X29.780 Y5.219 Z1.100
+G1 X32.898 Y3.419 Z1.100
+G1 X32.898 Y-0.781 Z1.100
+G1 X29.780 Y-2.581 Z1.100
+G1 X29.780 Y-6.781 Z1.100
+G1 X32.898 Y-8.581 Z1.100
+G1 X32.898 Y-12.781 Z1.100
+G1 X29.780 Y-14.581 Z1.100
+G1 X29.780 Y-18.781 Z1.100
+G1 X30.835 Y-19.390 Z1.100
+G1 X35.307 Y-19.390 Z1.100
+G1 X36.362 Y-18.781 Z1.100
+G1 X36.362 Y-14.581 Z1.100
+G1 X33.244 Y-12.781 Z1.100
+G1 X33.244 Y-8.581 Z1.100
+G1 X36.362 Y-6.781 Z1.100
+G1 X36.362 Y-2.581 Z1.100
+G1 X33.244 Y-0.781 Z1.100
+G1 X33.244 Y3.419 Z1.100
+G1 X36.362 Y5.219 Z1.100
+G1 X36.362 Y9.419 Z1.100
+G1 X33.244 Y11.219 Z1.100
+G1 X33.244 Y15.419 Z1.100
+G1 X36.362 Y17.219 Z1.100
+G1 X36.362 Y19.390 Z1.100
+G1 X36.708 Y19.390 Z1.100
+G1 X36.708 Y17.219 Z1.100
+G1 X39.390 Y15.671 Z1.100
+G1 X39.390 Y10.967 Z1.100
+G1 X36.708 Y9.419 Z1.100
+G1 X36.708 Y5.219 Z1.100
+G1 X39.390 Y3.671 Z1.100
+G1 X39.390 Y-1.033 Z1.100
+G1 X36.708 Y-2.581 Z1.100
+G1 X36.708 Y-6.781 Z1.100
+G1 X39.390 Y-8.329 Z1.100
+G1 X39.390 Y-13.033 Z1.100
+G1 X36.708 Y-14.581 Z1.100
+G1 X36.708 Y-18.781 Z1.100
+G1 X37.763 Y-19.390 Z1.100
+T1
+G1 X32.764 Y-18.836 Z2.100
+G1 X38.836 Y-18.836 Z2.100
+G1 X38.836 Y16.964 Z2.100
+G1 X38.836 Y18.836 Z2.100
+G1 X-32.764 Y18.836 Z2.100
+G1 X-38.836 Y18.836 Z2.100
+G1 X-38.836 Y-16.964 Z2.100
+G1 X-38.836 Y-18.836 Z2.100
+G1 X32.764 Y-18.836 Z2.100
+G1 X32.764 Y-18.836 Z2.100
+G1 X-38.836 Y16.835 Z2.100
+G1 X-36.384 Y15.419 Z2.100
+G1 X-36.384 Y11.219 Z2.100
+G1 X-38.836 Y9.803 Z2.100
+G1 X-38.836 Y4.835 Z2.100
+G1 X-36.384 Y3.419 Z2.100
+G1 X-36.384 Y-0.781 Z2.100
+G1 X-38.836 Y-2.197 Z2.100
+G1 X-38.836 Y-7.165 Z2.100
+G1 X-36.384 Y-8.581 Z2.100
+G1 X-36.384 Y-12.781 Z2.100
+G1 X-38.836 Y-14.197 Z2.100
+G1 X-33.015 Y-18.836 Z2.100
+G1 X-32.920 Y-18.781 Z2.100
+G1 X-32.920 Y-14.581 Z2.100
+G1 X-36.038 Y-12.781 Z2.100
+G1 X-36.038 Y-8.581 Z2.100
+G1 X-32.920 Y-6.781 Z2.100
+G1 X-32.920 Y-2.581 Z2.100
+G1 X-36.038 Y-0.781 Z2.100
+G1 X-36.038 Y3.419 Z2.100
+G1 X-32.920 Y5.219 Z2.100
+G1 X-32.920 Y9.419 Z2.100
+G1 X-36.038 Y11.219 Z2.100
+G1 X-36.038 Y15.419 Z2.100
+G1 X-32.920 Y17.219 Z2.100
+G1 X-32.920 Y18.836 Z2.100
+G1 X-32.574 Y18.836 Z2.100
+G1 X-32.574 Y17.219 Z2.100
+G1 X-29.456 Y15.419 Z2.100
+G1 X-29.456 Y11.219 Z2.100
+G1 X-32.574 Y9.419 Z2.100
+G1 X-32.574 Y5.219 Z2.100
+G1 X-29.456 Y3.419 Z2.100
+G1 X-29.456 Y-0.781 Z2.100
+G1 X-32.574 Y-2.581 Z2.100
+G1 X-32.574 Y-6.781 Z2.100
+G1 X-29.456 Y-8.581 Z2.100
+G1 X-29.456 Y-12.781 Z2.100
+G1 X-32.574 Y-14.581 Z2.100
+G1 X-32.574 Y-18.781 Z2.100
+G1 X-32.479 Y-18.836 Z2.100
+G1 X-26.087 Y-18.836 Z2.100
+G1 X-25.992 Y-18.781 Z2.100
+G1 X-25.992 Y-14.581 Z2.100
+G1 X-29.110 Y-12.781 Z2.100
+G1 X-29.110 Y-8.581 Z2.100
+G1 X-25.992 Y-6.781 Z2.100
+G1 X-25.992 Y-2.581 Z2.100
+G1 X-29.110 Y-0.781 Z2.100
+G1 X-29.110 Y3.419 Z2.100
+G1 X-25.992 Y5.219 Z2.100
+G1 X-25.992 Y9.419 Z2.100
+G1 X-29.110 Y11.219 Z2.100
+G1 X-29.110 Y15.419 Z2.100
+G1 X-25.992 Y17.219 Z2.100
+G1 X-25.992 Y18.836 Z2.100
+G1 X-25.646 Y18.836 Z2.100
+G1 X-25.646 Y17.219 Z2.100
+G1 X-22.528 Y15.419 Z2.100
+G1 X-22.528 Y11.219 Z2.100
+G1 X-25.646 Y9.419 Z2.100
+G1 X-25.646 Y5.219 Z2.100
+G1 X-22.528 Y3.419 Z2.100
+G1 X-22.528 Y-0.781 Z2.100
+G1 X-25.646 Y-2.581 Z2.100
+G1 X-25.646 Y-6.781 Z2.100
+G1 X-22.528 Y-8.581 Z2.100
+G1 X-22.528 Y-12.781 Z2.100
+G1 X-25.646 Y-14.581 Z2.100
+G1 X-25.646 Y-18.781 Z2.100
+G1 X-25.551 Y-18.836 Z2.100
+G1 X-19.158 Y-18.836 Z2.100
+G1 X-19.063 Y-18.781 Z2.100
+G1 X-19.063 Y-14.581 Z2.100
+G1 X-22.181 Y-12.781 Z2.100
+G1 X-22.181 Y-8.581 Z2.100
+G1 X-19.063 Y-6.781 Z2.100
+G1 X-19.063 Y-2.581 Z2.100
+G1 X-22.181 Y-0.781 Z2.100
+G1 X-22.181 Y3.419 Z2.100
+G1 X-19.063 Y5.219 Z2.100
+G1 X-19.063 Y9.419 Z2.100
+G1 X-22.181 Y11.219 Z2.100
+G1 X-22.181 Y15.419 Z2.100
+G1 X-19.063 Y17.219 Z2.100
+G1 X-19.063 Y18.836 Z2.100
+G1 X-18.717 Y18.836 Z2.100
+G1 X-18.717 Y17.219 Z2.100
+G1 X-15.599 Y15.419 Z2.100
+G1 X-15.599 Y11.219 Z2.100
+G1 X-18.717 Y9.419 Z2.100
+G1 X-18.717 Y5.219 Z2.100
+G1 X-15.599 Y3.419 Z2.100
+G1 X-15.599 Y-0.781 Z2.100
+G1 X-18.717 Y-2.581 Z2.100
+G1 X-18.717 Y-6.781 Z2.100
+G1 X-15.599 Y-8.581 Z2.100
+G1 X-15.599 Y-12.781 Z2.100
+G1 X-18.717 Y-14.581 Z2.100
+G1 X-18.717 Y-18.781 Z2.100
+G1 X-18.622 Y-18.836 Z2.100
+G1 X-12.231 Y-18.836 Z2.100
+G1 X-12.136 Y-18.781 Z2.100
+G1 X-12.136 Y-14.581 Z2.100
+G1 X-15.254 Y-12.781 Z2.100
+G1 X-15.254 Y-8.581 Z2.100
+G1 X-12.136 Y-6.781 Z2.100
+G1 X-12.136 Y-2.581 Z2.100
+G1 X-15.254 Y-0.781 Z2.100
+G1 X-15.254 Y3.419 Z2.100
+G1 X-12.136 Y5.219 Z2.100
+G1 X-12.136 Y9.419 Z2.100
+G1 X-15.254 Y11.219 Z2.100
+G1 X-15.254 Y15.419 Z2.100
+G1 X-12.136 Y17.219 Z2.100
+G1 X-12.136 Y18.836 Z2.100
+G1 X-11.789 Y18.836 Z2.100
+G1 X-11.789 Y17.219 Z2.100
+G1 X-8.671 Y15.419 Z2.100
+G1 X-8.671 Y11.219 Z2.100
+G1 X-11.789 Y9.419 Z2.100
+G1 X-11.789 Y5.219 Z2.100
+G1 X-8.671 Y3.419 Z2.100
+G1 X-8.671 Y-0.781 Z2.100
+G1 X-11.789 Y-2.581 Z2.100
+G1 X-11.789 Y-6.781 Z2.100
+G1 X-8.671 Y-8.581 Z2.100
+G1 X-8.671 Y-12.781 Z2.100
+G1 X-11.789 Y-14.581 Z2.100
+G1 X-11.789 Y-18.781 Z2.100
+G1 X-11.694 Y-18.836 Z2.100
+G1 X-5.302 Y-18.836 Z2.100
+G1 X-5.207 Y-18.781 Z2.100
+G1 X-5.207 Y-14.581 Z2.100
+G1 X-8.325 Y-12.781 Z2.100
+G1 X-8.325 Y-8.581 Z2.100
+G1 X-5.207 Y-6.781 Z2.100
+G1 X-5.207 Y-2.581 Z2.100
+G1 X-8.325 Y-0.781 Z2.100
+G1 X-8.325 Y3.419 Z2.100
+G1 X-5.207 Y5.219 Z2.100
+G1 X-5.207 Y9.419 Z2.100
+G1 X-8.325 Y11.219 Z2.100
+G1 X-8.325 Y15.419 Z2.100
+G1 X-5.207 Y17.219 Z2.100
+G1 X-5.207 Y18.836 Z2.100
+G1 X-4.861 Y18.836 Z2.100
+G1 X-4.861 Y17.219 Z2.100
+G1 X-1.743 Y15.419 Z2.100
+G1 X-1.743 Y11.219 Z2.100
+G1 X-4.861 Y9.419 Z2.100
+G1 X-4.861 Y5.219 Z2.100
+G1 X-1.743 Y3.419 Z2.100
+G1 X-1.743 Y-0.781 Z2.100
+G1 X-4.861 Y-2.581 Z2.100
+G1 X-4.861 Y-6.781 Z2.100
+G1 X-1.743 Y-8.581 Z2.100
+G1 X-1.743 Y-12.781 Z2.100
+G1 X-4.861 Y-14.581 Z2.100
+G1 X-4.861 Y-18.781 Z2.100
+G1 X-4.766 Y-18.836 Z2.100
+G1 X1.626 Y-18.836 Z2.100
+G1 X1.721 Y-18.781 Z2.100
+G1 X1.721 Y-14.581 Z2.100
+G1 X-1.397 Y-12.781 Z2.100
+G1 X-1.397 Y-8.581 Z2.100
+G1 X1.721 Y-6.781 Z2.100
+G1 X1.721 Y-2.581 Z2.100
+G1 X-1.397 Y-0.781 Z2.100
+G1 X-1.397 Y3.419 Z2.100
+G1 X1.721 Y5.219 Z2.100
+G1 X1.721 Y9.419 Z2.100
+G1 X-1.397 Y11.219 Z2.100
+G1 X-1.397 Y15.419 Z2.100
+G1 X1.721 Y17.219 Z2.100
+G1 X1.721 Y18.836 Z2.100
+G1 X2.067 Y18.836 Z2.100
+G1 X2.067 Y17.219 Z2.100
+G1 X5.185 Y15.419 Z2.100
+G1 X5.185 Y11.219 Z2.100
+G1 X2.067 Y9.419 Z2.100
+G1 X2.067 Y5.219 Z2.100
+G1 X5.185 Y3.419 Z2.100
+G1 X5.185 Y-0.781 Z2.100
+G1 X2.067 Y-2.581 Z2.100
+G1 X2.067 Y-6.781 Z2.100
+G1 X5.185 Y-8.581 Z2.100
+G1 X5.185 Y-12.781 Z2.100
+G1 X2.067 Y-14.581 Z2.100
+G1 X2.067 Y-18.781 Z2.100
+G1 X2.162 Y-18.836 Z2.100
+G1 X8.554 Y-18.836 Z2.100
+G1 X8.649 Y-18.781 Z2.100
+G1 X8.649 Y-14.581 Z2.100
+G1 X5.531 Y-12.781 Z2.100
+G1 X5.531 Y-8.581 Z2.100
+G1 X8.649 Y-6.781 Z2.100
+G1 X8.649 Y-2.581 Z2.100
+G1 X5.531 Y-0.781 Z2.100
+G1 X5.531 Y3.419 Z2.100
+G1 X8.649 Y5.219 Z2.100
+G1 X8.649 Y9.419 Z2.100
+G1 X5.531 Y11.219 Z2.100
+G1 X5.531 Y15.419 Z2.100
+G1 X8.649 Y17.219 Z2.100
+G1 X8.649 Y18.836 Z2.100
+G1 X8.995 Y18.836 Z2.100
+G1 X8.995 Y17.219 Z2.100
+G1 X12.113 Y15.419 Z2.100
+G1 X12.113 Y11.219 Z2.100
+G1 X8.995 Y9.419 Z2.100
+G1 X8.995 Y5.219 Z2.100
+G1 X12.113 Y3.419 Z2.100
+G1 X12.113 Y-0.781 Z2.100
+G1 X8.995 Y-2.581 Z2.100
+G1 X8.995 Y-6.781 Z2.100
+G1 X12.113 Y-8.581 Z2.100
+G1 X12.113 Y-12.781 Z2.100
+G1 X8.995 Y-14.581 Z2.100
+G1 X8.995 Y-18.781 Z2.100
+G1 X9.090 Y-18.836 Z2.100
+G1 X15.483 Y-18.836 Z2.100
+G1 X15.578 Y-18.781 Z2.100
+G1 X15.578 Y-14.581 Z2.100
+G1 X12.460 Y-12.781 Z2.100
+G1 X12.460 Y-8.581 Z2.100
+G1 X15.578 Y-6.781 Z2.100
+G1 X15.578 Y-2.581 Z2.100
+G1 X12.460 Y-0.781 Z2.100
+G1 X12.460 Y3.419 Z2.100
+G1 X15.578 Y5.219 Z2.100
+G1 X15.578 Y9.419 Z2.100
+G1 X12.460 Y11.219 Z2.100
+G1 X12.460 Y15.419 Z2.100
+G1 X15.578 Y17.219 Z2.100
+G1 X15.578 Y18.836 Z2.100
+G1 X15.924 Y18.836 Z2.100
+G1 X15.924 Y17.219 Z2.100
+G1 X19.042 Y15.419 Z2.100
+G1 X19.042 Y11.219 Z2.100
+G1 X15.924 Y9.419 Z2.100
+G1 X15.924 Y5.219 Z2.100
+G1 X19.042 Y3.419 Z2.100
+G1 X19.042 Y-0.781 Z2.100
+G1 X15.924 Y-2.581 Z2.100
+G1 X15.924 Y-6.781 Z2.100
+G1 X19.042 Y-8.581 Z2.100
+G1 X19.042 Y-12.781 Z2.100
+G1 X15.924 Y-14.581 Z2.100
+G1 X15.924 Y-18.781 Z2.100
+G1 X16.019 Y-18.836 Z2.100
+G1 X22.410 Y-18.836 Z2.100
+G1 X22.505 Y-18.781 Z2.100
+G1 X22.505 Y-14.581 Z2.100
+G1 X19.387 Y-12.781 Z2.100
+G1 X19.387 Y-8.581 Z2.100
+G1 X22.505 Y-6.781 Z2.100
+G1 X22.505 Y-2.581 Z2.100
+G1 X19.387 Y-0.781 Z2.100
+G1 X19.387 Y3.419 Z2.100
+G1 X22.505 Y5.219 Z2.100
+G1 X22.505 Y9.419 Z2.100
+G1 X19.387 Y11.219 Z2.100
+G1 X19.387 Y15.419 Z2.100
+G1 X22.505 Y17.219 Z2.100
+G1 X22.505 Y18.836 Z2.100
+G1 X22.852 Y18.836 Z2.100
+G1 X22.852 Y17.219 Z2.100
+G1 X25.970 Y15.419 Z2.100
+G1 X25.970 Y11.219 Z2.100
+G1 X22.852 Y9.419 Z2.100
+G1 X22.852 Y5.219 Z2.100
+G1 X25.970 Y3.419 Z2.100
+G1 X25.970 Y-0.781 Z2.100
+G1 X22.852 Y-2.581 Z2.100
+G1 X22.852 Y-6.781 Z2.100
+G1 X25.970 Y-8.581 Z2.100
+G1 X25.970 Y-12.781 Z2.100
+G1 X22.852 Y-14.581 Z2.100
+G1 X22.852 Y-18.781 Z2.100
+G1 X22.947 Y-18.836 Z2.100
+G1 X29.339 Y-18.836 Z2.100
+G1 X29.434 Y-18.781 Z2.100
+G1 X29.434 Y-14.581 Z2.100
+G1 X26.316 Y-12.781 Z2.100
+G1 X26.316 Y-8.581 Z2.100
+G1 X29.434 Y-6.781 Z2.100
+G1 X29.434 Y-2.581 Z2.100
+G1 X26.316 Y-0.781 Z2.100
+G1 X26.316 Y3.419 Z2.100
+G1 X29.434 Y5.219 Z2.100
+G1 X29.434 Y9.419 Z2.100
+G1 X26.316 Y11.219 Z2.100
+G1 X26.316 Y15.419 Z2.100
+G1 X29.434 Y17.219 Z2.100
+G1 X29.434 Y18.836 Z2.100
+G1 X29.780 Y18.836 Z2.100
+G1 X29.780 Y17.219 Z2.100
+G1 X32.898 Y15.419 Z2.100
+G1 X32.898 Y11.219 Z2.100
+G1 X29.780 Y9.419 Z2.100
+G1 X29.780 Y5.219 Z2.100
+G1 X32.898 Y3.419 Z2.100
+G1 X32.898 Y-0.781 Z2.100
+G1 X29.780 Y-2.581 Z2.100
+G1 X29.780 Y-6.781 Z2.100
+G1 X32.898 Y-8.581 Z2.100
+G1 X32.898 Y-12.781 Z2.100
+G1 X29.780 Y-14.581 Z2.100
+G1 X29.780 Y-18.781 Z2.100
+G1 X29.875 Y-18.836 Z2.100
+G1 X36.267 Y-18.836 Z2.100
+G1 X36.362 Y-18.781 Z2.100
+G1 X36.362 Y-14.581 Z2.100
+G1 X33.244 Y-12.781 Z2.100
+G1 X33.244 Y-8.581 Z2.100
+G1 X36.362 Y-6.781 Z2.100
+G1 X36.362 Y-2.581 Z2.100
+G1 X33.244 Y-0.781 Z2.100
+G1 X33.244 Y3.419 Z2.100
+G1 X36.362 Y5.219 Z2.100
+G1 X36.362 Y9.419 Z2.100
+G1 X33.244 Y11.219 Z2.100
+G1 X33.244 Y15.419 Z2.100
+G1 X36.362 Y17.219 Z2.100
+G1 X36.362 Y18.836 Z2.100
+G1 X36.708 Y18.836 Z2.100
+G1 X36.708 Y17.219 Z2.100
+G1 X38.836 Y15.991 Z2.100
+G1 X38.836 Y10.647 Z2.100
+G1 X36.708 Y9.419 Z2.100
+G1 X36.708 Y5.219 Z2.100
+G1 X38.836 Y3.991 Z2.100
+G1 X38.836 Y-1.353 Z2.100
+G1 X36.708 Y-2.581 Z2.100
+G1 X36.708 Y-6.781 Z2.100
+G1 X38.836 Y-8.009 Z2.100
+G1 X38.836 Y-13.353 Z2.100
+G1 X36.708 Y-14.581 Z2.100
+G1 X36.708 Y-18.781 Z2.100
+G1 X36.803 Y-18.836 Z2.100
+T1
+G1 X29.318 Y-18.282 Z3.100
+G1 X38.282 Y-18.282 Z3.100
+G1 X38.282 Y15.518 Z3.100
+G1 X38.282 Y18.282 Z3.100
+G1 X-29.318 Y18.282 Z3.100
+G1 X-38.282 Y18.282 Z3.100
+G1 X-38.282 Y-15.518 Z3.100
+G1 X-38.282 Y-18.282 Z3.100
+G1 X29.318 Y-18.282 Z3.100
+G1 X29.318 Y-18.282 Z3.100
+G1 X-38.282 Y16.515 Z3.100
+G1 X-36.384 Y15.419 Z3.100
+G1 X-36.384 Y11.219 Z3.100
+G1 X-38.282 Y10.123 Z3.100
+G1 X-38.282 Y4.515 Z3.100
+G1 X-36.384 Y3.419 Z3.100
+G1 X-36.384 Y-0.781 Z3.100
+G1 X-38.282 Y-1.877 Z3.100
+G1 X-38.282 Y-7.485 Z3.100
+G1 X-36.384 Y-8.581 Z3.100
+G1 X-36.384 Y-12.781 Z3.100
+G1 X-38.282 Y-13.877 Z3.100
+G1 X-32.920 Y-18.282 Z3.100
+G1 X-32.920 Y-14.581 Z3.100
+G1 X-36.038 Y-12.781 Z3.100
+G1 X-36.038 Y-8.581 Z3.100
+G1 X-32.920 Y-6.781 Z3.100
+G1 X-32.920 Y-2.581 Z3.100
+G1 X-36.038 Y-0.781 Z3.100
+G1 X-36.038 Y3.419 Z3.100
+G1 X-32.920 Y5.219 Z3.100
+G1 X-32.920 Y9.419 Z3.100
+G1 X-36.038 Y11.219 Z3.100
+G1 X-36.038 Y15.419 Z3.100
+G1 X-32.920 Y17.219 Z3.100
+G1 X-32.920 Y18.282 Z3.100
+G1 X-32.574 Y18.282 Z3.100
+G1 X-32.574 Y17.219 Z3.100
+G1 X-29.456 Y15.419 Z3.100
+G1 X-29.456 Y11.219 Z3.100
+G1 X-32.574 Y9.419 Z3.100
+G1 X-32.574 Y5.219 Z3.100
+G1 X-29.456 Y3.419 Z3.100
+G1 X-29.456 Y-0.781 Z3.100
+G1 X-32.574 Y-2.581 Z3.100
+G1 X-32.574 Y-6.781 Z3.100
+G1 X-29.456 Y-8.581 Z3.100
+G1 X-29.456 Y-12.781 Z3.100
+G1 X-32.574 Y-14.581 Z3.100
+G1 X-32.574 Y-18.282 Z3.100
+G1 X-25.992 Y-18.282 Z3.100
+G1 X-25.992 Y-14.581 Z3.100
+G1 X-29.110 Y-12.781 Z3.100
+G1 X-29.110 Y-8.581 Z3.100
+G1 X-25.992 Y-6.781 Z3.100
+G1 X-25.992 Y-2.581 Z3.100
+G1 X-29.110 Y-0.781 Z3.100
+G1 X-29.110 Y3.419 Z3.100
+G1 X-25.992 Y5.219 Z3.100
+G1 X-25.992 Y9.419 Z3.100
+G1 X-29.110 Y11.219 Z3.100
+G1 X-29.110 Y15.419 Z3.100
+G1 X-25.992 Y17.219 Z3.100
+G1 X-25.992 Y18.282 Z3.100
+G1 X-25.646 Y18.282 Z3.100
+G1 X-25.646 Y17.219 Z3.100
+G1 X-22.528 Y15.419 Z3.100
+G1 X-22.528 Y11.219 Z3.100
+G1 X-25.646 Y9.419 Z3.100
+G1 X-25.646 Y5.219 Z3.100
+G1 X-22.528 Y3.419 Z3.100
+G1 X-22.528 Y-0.781 Z3.100
+G1 X-25.646 Y-2.581 Z3.100
+G1 X-25.646 Y-6.781 Z3.100
+G1 X-22.528 Y-8.581 Z3.100
+G1 X-22.528 Y-12.781 Z3.100
+G1 X-25.646 Y-14.581 Z3.100
+G1 X-25.646 Y-18.282 Z3.100
+G1 X-19.063 Y-18.282 Z3.100
+G1 X-19.063 Y-14.581 Z3.100
+G1 X-22.181 Y-12.781 Z3.100
+G1 X-22.181 Y-8.581 Z3.100
+G1 X-19.063 Y-6.781 Z3.100
+G1 X-19.063 Y-2.581 Z3.100
+G1 X-22.181 Y-0.781 Z3.100
+G1 X-22.181 Y3.419 Z3.100
+G1 X-19.063 Y5.219 Z3.100
+G1 X-19.063 Y9.419 Z3.100
+G1 X-22.181 Y11.219 Z3.100
+G1 X-22.181 Y15.419 Z3.100
+G1 X-19.063 Y17.219 Z3.100
+G1 X-19.063 Y18.282 Z3.100
+G1 X-18.717 Y18.282 Z3.100
+G1 X-18.717 Y17.219 Z3.100
+G1 X-15.599 Y15.419 Z3.100
+G1 X-15.599 Y11.219 Z3.100
+G1 X-18.717 Y9.419 Z3.100
+G1 X-18.717 Y5.219 Z3.100
+G1 X-15.599 Y3.419 Z3.100
+G1 X-15.599 Y-0.781 Z3.100
+G1 X-18.717 Y-2.581 Z3.100
+G1 X-18.717 Y-6.781 Z3.100
+G1 X-15.599 Y-8.581 Z3.100
+G1 X-15.599 Y-12.781 Z3.100
+G1 X-18.717 Y-14.581 Z3.100
+G1 X-18.717 Y-18.282 Z3.100
+G1 X-12.136 Y-18.282 Z3.100
+G1 X-12.136 Y-14.581 Z3.100
+G1 X-15.254 Y-12.781 Z3.100
+G1 X-15.254 Y-8.581 Z3.100
+G1 X-12.136 Y-6.781 Z3.100
+G1 X-12.136 Y-2.581 Z3.100
+G1 X-15.254 Y-0.781 Z3.100
+G1 X-15.254 Y3.419 Z3.100
+G1 X-12.136 Y5.219 Z3.100
+G1 X-12.136 Y9.419 Z3.100
+G1 X-15.254 Y11.219 Z3.100
+G1 X-15.254 Y15.419 Z3.100
+G1 X-12.136 Y17.219 Z3.100
+G1 X-12.136 Y18.282 Z3.100
+G1 X-11.789 Y18.282 Z3.100
+G1 X-11.789 Y17.219 Z3.100
+G1 X-8.671 Y15.419 Z3.100
+G1 X-8.671 Y11.219 Z3.100
+G1 X-11.789 Y9.419 Z3.100
+G1 X-11.789 Y5.219 Z3.100
+G1 X-8.671 Y3.419 Z3.100
+G1 X-8.671 Y-0.781 Z3.100
+G1 X-11.789 Y-2.581 Z3.100
+G1 X-11.789 Y-6.781 Z3.100
+G1 X-8.671 Y-8.581 Z3.100
+G1 X-8.671 Y-12.781 Z3.100
+G1 X-11.789 Y-14.581 Z3.100
+G1 X-11.789 Y-18.282 Z3.100
+G1 X-5.207 Y-18.282 Z3.100
+G1 X-5.207 Y-14.581 Z3.100
+G1 X-8.325 Y-12.781 Z3.100
+G1 X-8.325 Y-8.581 Z3.100
+G1 X-5.207 Y-6.781 Z3.100
+G1 X-5.207 Y-2.581 Z3.100
+G1 X-8.325 Y-0.781 Z3.100
+G1 X-8.325 Y3.419 Z3.100
+G1 X-5.207 Y5.219 Z3.100
+G1 X-5.207 Y9.419 Z3.100
+G1 X-8.325 Y11.219 Z3.100
+G1 X-8.325 Y15.419 Z3.100
+G1 X-5.207 Y17.219 Z3.100
+G1 X-5.207 Y18.282 Z3.100
+G1 X-4.861 Y18.282 Z3.100
+G1 X-4.861 Y17.219 Z3.100
+G1 X-1.743 Y15.419 Z3.100
+G1 X-1.743 Y11.219 Z3.100
+G1 X-4.861 Y9.419 Z3.100
+G1 X-4.861 Y5.219 Z3.100
+G1 X-1.743 Y3.419 Z3.100
+G1 X-1.743 Y-0.781 Z3.100
+G1 X-4.861 Y-2.581 Z3.100
+G1 X-4.861 Y-6.781 Z3.100
+G1 X-1.743 Y-8.581 Z3.100
+G1 X-1.743 Y-12.781 Z3.100
+G1 X-4.861 Y-14.581 Z3.100
+G1 X-4.861 Y-18.282 Z3.100
+G1 X1.721 Y-18.282 Z3.100
+G1 X1.721 Y-14.581 Z3.100
+G1 X-1.397 Y-12.781 Z3.100
+G1 X-1.397 Y-8.581 Z3.100
+G1 X1.721 Y-6.781 Z3.100
+G1 X1.721 Y-2.581 Z3.100
+G1 X-1.397 Y-0.781 Z3.100
+G1 X-1.397 Y3.419 Z3.100
+G1 X1.721 Y5.219 Z3.100
+G1 X1.721 Y9.419 Z3.100
+G1 X-1.397 Y11.219 Z3.100
+G1 X-1.397 Y15.419 Z3.100
+G1 X1.721 Y17.219 Z3.100
+G1 X1.721 Y18.282 Z3.100
+G1 X2.067 Y18.282 Z3.100
+G1 X2.067 Y17.219 Z3.100
+G1 X5.185 Y15.419 Z3.100
+G1 X5.185 Y11.219 Z3.100
+G1 X2.067 Y9.419 Z3.100
+G1 X2.067 Y5.219 Z3.100
+G1 X5.185 Y3.419 Z3.100
+G1 X5.185 Y-0.781 Z3.100
+G1 X2.067 Y-2.581 Z3.100
+G1 X2.067 Y-6.781 Z3.100
+G1 X5.185 Y-8.581 Z3.100
+G1 X5.185 Y-12.781 Z3.100
+G1 X2.067 Y-14.581 Z3.100
+G1 X2.067 Y-18.282 Z3.100
+G1 X8.649 Y-18.282 Z3.100
+G1 X8.649 Y-14.581 Z3.100
+G1 X5.531 Y-12.781 Z3.100
+G1 X5.531 Y-8.581 Z3.100
+G1 X8.649 Y-6.781 Z3.100
+G1 X8.649 Y-2.581 Z3.100
+G1 X5.531 Y-0.781 Z3.100
+G1 X5.531 Y3.419 Z3.100
+G1 X8.649 Y5.219 Z3.100
+G1 X8.649 Y9.419 Z3.100
+G1 X5.531 Y11.219 Z3.100
+G1 X5.531 Y15.419 Z3.100
+G1 X8.649 Y17.219 Z3.100
+G1 X8.649 Y18.282 Z3.100
+G1 X8.995 Y18.282 Z3.100
+G1 X8.995 Y17.219 Z3.100
+G1 X12.113 Y15.419 Z3.100
+G1 X12.113 Y11.219 Z3.100
+G1 X8.995 Y9.419 Z3.100
+G1 X8.995 Y5.219 Z3.100
+G1 X12.113 Y3.419 Z3.100
+G1 X12.113 Y-0.781 Z3.100
+G1 X8.995 Y-2.581 Z3.100
+G1 X8.995 Y-6.781 Z3.100
+G1 X12.113 Y-8.581 Z3.100
+G1 X12.113 Y-12.781 Z3.100
+G1 X8.995 Y-14.581 Z3.100
+G1 X8.995 Y-18.282 Z3.100
+G1 X15.578 Y-18.282 Z3.100
+G1 X15.578 Y-14.581 Z3.100
+G1 X12.460 Y-12.781 Z3.100
+G1 X12.460 Y-8.581 Z3.100
+G1 X15.578 Y-6.781 Z3.100
+G1 X15.578 Y-2.581 Z3.100
+G1 X12.460 Y-0.781 Z3.100
+G1 X12.460 Y3.419 Z3.100
+G1 X15.578 Y5.219 Z3.100
+G1 X15.578 Y9.419 Z3.100
+G1 X12.460 Y11.219 Z3.100
+G1 X12.460 Y15.419 Z3.100
+G1 X15.578 Y17.219 Z3.100
+G1 X15.578 Y18.282 Z3.100
+G1 X15.924 Y18.282 Z3.100
+G1 X15.924 Y17.219 Z3.100
+G1 X19.042 Y15.419 Z3.100
+G1 X19.042 Y11.219 Z3.100
+G1 X15.924 Y9.419 Z3.100
+G1 X15.924 Y5.219 Z3.100
+G1 X19.042 Y3.419 Z3.100
+G1 X19.042 Y-0.781 Z3.100
+G1 X15.924 Y-2.581 Z3.100
+G1 X15.924 Y-6.781 Z3.100
+G1 X19.042 Y-8.581 Z3.100
+G1 X19.042 Y-12.781 Z3.100
+G1 X15.924 Y-14.581 Z3.100
+G1 X15.924 Y-18.282 Z3.100
+G1 X22.505 Y-18.282 Z3.100
+G1 X22.505 Y-14.581 Z3.100
+G1 X19.387 Y-12.781 Z3.100
+G1 X19.387 Y-8.581 Z3.100
+G1 X22.505 Y-6.781 Z3.100
+G1 X22.505 Y-2.581 Z3.100
+G1 X19.387 Y-0.781 Z3.100
+G1 X19.387 Y3.419 Z3.100
+G1 X22.505 Y5.219 Z3.100
+G1 X22.505 Y9.419 Z3.100
+G1 X19.387 Y11.219 Z3.100
+G1 X19.387 Y15.419 Z3.100
+G1 X22.505 Y17.219 Z3.100
+G1 X22.505 Y18.282 Z3.100
+G1 X22.852 Y18.282 Z3.100
+G1 X22.852 Y17.219 Z3.100
+G1 X25.970 Y15.419 Z3.100
+G1 X25.970 Y11.219 Z3.100
+G1 X22.852 Y9.419 Z3.100
+G1 X22.852 Y5.219 Z3.100
+G1 X25.970 Y3.419 Z3.100
+G1 X25.970 Y-0.781 Z3.100
+G1 X22.852 Y-2.581 Z3.100
+G1 X22.852 Y-6.781 Z3.100
+G1 X25.970 Y-8.581 Z3.100
+G1 X25.970 Y-12.781 Z3.100
+G1 X22.852 Y-14.581 Z3.100
+G1 X22.852 Y-18.282 Z3.100
+G1 X29.434 Y-18.282 Z3.100
+G1 X29.434 Y-14.581 Z3.100
+G1 X26.316 Y-12.781 Z3.100
+G1 X26.316 Y-8.581 Z3.100
+G1 X29.434 Y-6.781 Z3.100
+G1 X29.434 Y-2.581 Z3.100
+G1 X26.316 Y-0.781 Z3.100
+G1 X26.316 Y3.419 Z3.100
+G1 X29.434 Y5.219 Z3.100
+G1 X29.434 Y9.419 Z3.100
+G1 X26.316 Y11.219 Z3.100
+G1 X26.316 Y15.419 Z3.100
+G1 X29.434 Y17.219 Z3.100
+G1 X29.434 Y18.282 Z3.100
+G1 X29.780 Y18.282 Z3.100
+G1 X29.780 Y17.219 Z3.100
+G1 X32.898 Y15.419 Z3.100
+G1 X32.898 Y11.219 Z3.100
+G1 X29.780 Y9.419 Z3.100
+G1 X29.780 Y5.219 Z3.100
+G1 X32.898 Y3.419 Z3.100
+G1 X32.898 Y-0.781 Z3.100
+G1 X29.780 Y-2.581 Z3.100
+G1 X29.780 Y-6.781 Z3.100
+G1 X32.898 Y-8.581 Z3.100
+G1 X32.898 Y-12.781 Z3.100
+G1 X29.780 Y-14.581 Z3.100
+G1 X29.780 Y-18.282 Z3.100
+G1 X36.362 Y-18.282 Z3.100
+G1 X36.362 Y-14.581 Z3.100
+G1 X33.244 Y-12.781 Z3.100
+G1 X33.244 Y-8.581 Z3.100
+G1 X36.362 Y-6.781 Z3.100
+G1 X36.362 Y-2.581 Z3.100
+G1 X33.244 Y-0.781 Z3.100
+G1 X33.244 Y3.419 Z3.100
+G1 X36.362 Y5.219 Z3.100
+G1 X36.362 Y9.419 Z3.100
+G1 X33.244 Y11.219 Z3.100
+G1 X33.244 Y15.419 Z3.100
+G1 X36.362 Y17.219 Z3.100
+G1 X36.362 Y18.282 Z3.100
+G1 X36.708 Y18.282 Z3.100
+G1 X36.708 Y17.219 Z3.100
+G1 X38.282 Y16.310 Z3.100
+G1 X38.282 Y10.328 Z3.100
+G1 X36.708 Y9.419 Z3.100
+G1 X36.708 Y5.219 Z3.100
+G1 X38.282 Y4.310 Z3.100
+G1 X38.282 Y-1.672 Z3.100
+G1 X36.708 Y-2.581 Z3.100
+G1 X36.708 Y-6.781 Z3.100
+G1 X38.282 Y-7.690 Z3.100
+G1 X38.282 Y-13.672 Z3.100
+G1 X36.708 Y-14.581 Z3.100
+G1 X36.708 Y-18.282 Z3.100
+T1
+G1 X25.873 Y-17.727 Z4.100
+G1 X37.727 Y-17.727 Z4.100
+G1 X37.727 Y14.073 Z4.100
+G1 X37.727 Y17.727 Z4.100
+G1 X-25.873 Y17.727 Z4.100
+G1 X-37.727 Y17.727 Z4.100
+G1 X-37.727 Y-14.073 Z4.100
+G1 X-37.727 Y-17.727 Z4.100
+G1 X25.873 Y-17.727 Z4.100
+G1 X25.873 Y-17.727 Z4.100
+G1 X-37.727 Y16.194 Z4.100
+G1 X-36.384 Y15.419 Z4.100
+G1 X-36.384 Y11.219 Z4.100
+G1 X-37.727 Y10.444 Z4.100
+G1 X-37.727 Y4.194 Z4.100
+G1 X-36.384 Y3.419 Z4.100
+G1 X-36.384 Y-0.781 Z4.100
+G1 X-37.727 Y-1.556 Z4.100
+G1 X-37.727 Y-7.806 Z4.100
+G1 X-36.384 Y-8.581 Z4.100
+G1 X-36.384 Y-12.781 Z4.100
+G1 X-37.727 Y-13.556 Z4.100
+G1 X-32.920 Y-17.727 Z4.100
+G1 X-32.920 Y-14.581 Z4.100
+G1 X-36.038 Y-12.781 Z4.100
+G1 X-36.038 Y-8.581 Z4.100
+G1 X-32.920 Y-6.781 Z4.100
+G1 X-32.920 Y-2.581 Z4.100
+G1 X-36.038 Y-0.781 Z4.100
+G1 X-36.038 Y3.419 Z4.100
+G1 X-32.920 Y5.219 Z4.100
+G1 X-32.920 Y9.419 Z4.100
+G1 X-36.038 Y11.219 Z4.100
+G1 X-36.038 Y15.419 Z4.100
+G1 X-32.920 Y17.219 Z4.100
+G1 X-32.920 Y17.727 Z4.100
+G1 X-32.574 Y17.727 Z4.100
+G1 X-32.574 Y17.219 Z4.100
+G1 X-29.456 Y15.419 Z4.100
+G1 X-29.456 Y11.219 Z4.100
+G1 X-32.574 Y9.419 Z4.100
+G1 X-32.574 Y5.219 Z4.100
+G1 X-29.456 Y3.419 Z4.100
+G1 X-29.456 Y-0.781 Z4.100
+G1 X-32.574 Y-2.581 Z4.100
+G1 X-32.574 Y-6.781 Z4.100
+G1 X-29.456 Y-8.581 Z4.100
+G1 X-29.456 Y-12.781 Z4.100
+G1 X-32.574 Y-14.581 Z4.100
+G1 X-32.574 Y-17.727 Z4.100
+G1 X-25.992 Y-17.727 Z4.100
+G1 X-25.992 Y-14.581 Z4.100
+G1 X-29.110 Y-12.781 Z4.100
+G1 X-29.110 Y-8.581 Z4.100
+G1 X-25.992 Y-6.781 Z4.100
+G1 X-25.992 Y-2.581 Z4.100
+G1 X-29.110 Y-0.781 Z4.100
+G1 X-29.110 Y3.419 Z4.100
+G1 X-25.992 Y5.219 Z4.100
+G1 X-25.992 Y9.419 Z4.100
+G1 X-29.110 Y11.219 Z4.100
+G1 X-29.110 Y15.419 Z4.100
+G1 X-25.992 Y17.219 Z4.100
+G1 X-25.992 Y17.727 Z4.100
+G1 X-25.646 Y17.727 Z4.100
+G1 X-25.646 Y17.219 Z4.100
+G1 X-22.528 Y15.419 Z4.100
+G1 X-22.528 Y11.219 Z4.100
+G1 X-25.646 Y9.419 Z4.100
+G1 X-25.646 Y5.219 Z4.100
+G1 X-22.528 Y3.419 Z4.100
+G1 X-22.528 Y-0.781 Z4.100
+G1 X-25.646 Y-2.581 Z4.100
+G1 X-25.646 Y-6.781 Z4.100
+G1 X-22.528 Y-8.581 Z4.100
+G1 X-22.528 Y-12.781 Z4.100
+G1 X-25.646 Y-14.581 Z4.100
+G1 X-25.646 Y-17.727 Z4.100
+G1 X-19.063 Y-17.727 Z4.100
+G1 X-19.063 Y-14.581 Z4.100
+G1 X-22.181 Y-12.781 Z4.100
+G1 X-22.181 Y-8.581 Z4.100
+G1 X-19.063 Y-6.781 Z4.100
+G1 X-19.063 Y-2.581 Z4.100
+G1 X-22.181 Y-0.781 Z4.100
+G1 X-22.181 Y3.419 Z4.100
+G1 X-19.063 Y5.219 Z4.100
+G1 X-19.063 Y9.419 Z4.100
+G1 X-22.181 Y11.219 Z4.100
+G1 X-22.181 Y15.419 Z4.100
+G1 X-19.063 Y17.219 Z4.100
+G1 X-19.063 Y17.727 Z4.100
+G1 X-18.717 Y17.727 Z4.100
+G1 X-18.717 Y17.219 Z4.100
+G1 X-15.599 Y15.419 Z4.100
+G1 X-15.599 Y11.219 Z4.100
+G1 X-18.717 Y9.419 Z4.100
+G1 X-18.717 Y5.219 Z4.100
+G1 X-15.599 Y3.419 Z4.100
+G1 X-15.599 Y-0.781 Z4.100
+G1 X-18.717 Y-2.581 Z4.100
+G1 X-18.717 Y-6.781 Z4.100
+G1 X-15.599 Y-8.581 Z4.100
+G1 X-15.599 Y-12.781 Z4.100
+G1 X-18.717 Y-14.581 Z4.100
+G1 X-18.717 Y-17.727 Z4.100
+G1 X-12.136 Y-17.727 Z4.100
+G1 X-12.136 Y-14.581 Z4.100
+G1 X-15.254 Y-12.781 Z4.100
+G1 X-15.254 Y-8.581 Z4.100
+G1 X-12.136 Y-6.781 Z4.100
+G1 X-12.136 Y-2.581 Z4.100
+G1 X-15.254 Y-0.781 Z4.100
+G1 X-15.254 Y3.419 Z4.100
+G1 X-12.136 Y5.219 Z4.100
+G1 X-12.136 Y9.419 Z4.100
+G1 X-15.254 Y11.219 Z4.100
+G1 X-15.254 Y15.419 Z4.100
+G1 X-12.136 Y17.219 Z4.100
+G1 X-12.136 Y17.727 Z4.100
+G1 X-11.789 Y17.727 Z4.100
+G1 X-11.789 Y17.219 Z4.100
+G1 X-8.671 Y15.419 Z4.100
+G1 X-8.671 Y11.219 Z4.100
+G1 X-11.789 Y9.419 Z4.100
+G1 X-11.789 Y5.219 Z4.100
+G1 X-8.671 Y3.419 Z4.100
+G1 X-8.671 Y-0.781 Z4.100
+G1 X-11.789 Y-2.581 Z4.100
+G1 X-11.789 Y-6.781 Z4.100
+G1 X-8.671 Y-8.581 Z4.100
+G1 X-8.671 Y-12.781 Z4.100
+G1 X-11.789 Y-14.581 Z4.100
+G1 X-11.789 Y-17.727 Z4.100
+G1 X-5.207 Y-17.727 Z4.100
+G1 X-5.207 Y-14.581 Z4.100
+G1 X-8.325 Y-12.781 Z4.100
+G1 X-8.325 Y-8.581 Z4.100
+G1 X-5.207 Y-6.781 Z4.100
+G1 X-5.207 Y-2.581 Z4.100
+G1 X-8.325 Y-0.781 Z4.100
+G1 X-8.325 Y3.419 Z4.100
+G1 X-5.207 Y5.219 Z4.100
+G1 X-5.207 Y9.419 Z4.100
+G1 X-8.325 Y11.219 Z4.100
+G1 X-8.325 Y15.419 Z4.100
+G1 X-5.207 Y17.219 Z4.100
+G1 X-5.207 Y17.727 Z4.100
+G1 X-4.861 Y17.727 Z4.100
+G1 X-4.861 Y17.219 Z4.100
+G1 X-1.743 Y15.419 Z4.100
+G1 X-1.743 Y11.219 Z4.100
+G1 X-4.861 Y9.419 Z4.100
+G1 X-4.861 Y5.219 Z4.100
+G1 X-1.743 Y3.419 Z4.100
+G1 X-1.743 Y-0.781 Z4.100
+G1 X-4.861 Y-2.581 Z4.100
+G1 X-4.861 Y-6.781 Z4.100
+G1 X-1.743 Y-8.581 Z4.100
+G1 X-1.743 Y-12.781 Z4.100
+G1 X-4.861 Y-14.581 Z4.100
+G1 X-4.861 Y-17.727 Z4.100
+G1 X1.721 Y-17.727 Z4.100
+G1 X1.721 Y-14.581 Z4.100
+G1 X-1.397 Y-12.781 Z4.100
+G1 X-1.397 Y-8.581 Z4.100
+G1 X1.721 Y-6.781 Z4.100
+G1 X1.721 Y-2.581 Z4.100
+G1 X-1.397 Y-0.781 Z4.100
+G1 X-1.397 Y3.419 Z4.100
+G1 X1.721 Y5.219 Z4.100
+G1 X1.721 Y9.419 Z4.100
+G1 X-1.397 Y11.219 Z4.100
+G1 X-1.397 Y15.419 Z4.100
+G1 X1.721 Y17.219 Z4.100
+G1 X1.721 Y17.727 Z4.100
+G1 X2.067 Y17.727 Z4.100
+G1 X2.067 Y17.219 Z4.100
+G1 X5.185 Y15.419 Z4.100
+G1 X5.185 Y11.219 Z4.100
+G1 X2.067 Y9.419 Z4.100
+G1 X2.067 Y5.219 Z4.100
+G1 X5.185 Y3.419 Z4.100
+G1 X5.185 Y-0.781 Z4.100
+G1 X2.067 Y-2.581 Z4.100
+G1 X2.067 Y-6.781 Z4.100
+G1 X5.185 Y-8.581 Z4.100
+G1 X5.185 Y-12.781 Z4.100
+G1 X2.067 Y-14.581 Z4.100
+G1 X2.067 Y-17.727 Z4.100
+G1 X8.649 Y-17.727 Z4.100
+G1 X8.649 Y-14.581 Z4.100
+G1 X5.531 Y-12.781 Z4.100
+G1 X5.531 Y-8.581 Z4.100
+G1 X8.649 Y-6.781 Z4.100
+G1 X8.649 Y-2.581 Z4.100
+G1 X5.531 Y-0.781 Z4.100
+G1 X5.531 Y3.419 Z4.100
+G1 X8.649 Y5.219 Z4.100
+G1 X8.649 Y9.419 Z4.100
+G1 X5.531 Y11.219 Z4.100
+G1 X5.531 Y15.419 Z4.100
+G1 X8.649 Y17.219 Z4.100
+G1 X8.649 Y17.727 Z4.100
+G1 X8.995 Y17.727 Z4.100
+G1 X8.995 Y17.219 Z4.100
+G1 X12.113 Y15.419 Z4.100
+G1 X12.113 Y11.219 Z4.100
+G1 X8.995 Y9.419 Z4.100
+G1 X8.995 Y5.219 Z4.100
+G1 X12.113 Y3.419 Z4.100
+G1 X12.113 Y-0.781 Z4.100
+G1 X8.995 Y-2.581 Z4.100
+G1 X8.995 Y-6.781 Z4.100
+G1 X12.113 Y-8.581 Z4.100
+G1 X12.113 Y-12.781 Z4.100
+G1 X8.995 Y-14.581 Z4.100
+G1 X8.995 Y-17.727 Z4.100
+G1 X15.578 Y-17.727 Z4.100
+G1 X15.578 Y-14.581 Z4.100
+G1 X12.460 Y-12.781 Z4.100
+G1 X12.460 Y-8.581 Z4.100
+G1 X15.578 Y-6.781 Z4.100
+G1 X15.578 Y-2.581 Z4.100
+G1 X12.460 Y-0.781 Z4.100
+G1 X12.460 Y3.419 Z4.100
+G1 X15.578 Y5.219 Z4.100
+G1 X15.578 Y9.419 Z4.100
+G1 X12.460 Y11.219 Z4.100
+G1 X12.460 Y15.419 Z4.100
+G1 X15.578 Y17.219 Z4.100
+G1 X15.578 Y17.727 Z4.100
+G1 X15.924 Y17.727 Z4.100
+G1 X15.924 Y17.219 Z4.100
+G1 X19.042 Y15.419 Z4.100
+G1 X19.042 Y11.219 Z4.100
+G1 X15.924 Y9.419 Z4.100
+G1 X15.924 Y5.219 Z4.100
+G1 X19.042 Y3.419 Z4.100
+G1 X19.042 Y-0.781 Z4.100
+G1 X15.924 Y-2.581 Z4.100
+G1 X15.924 Y-6.781 Z4.100
+G1 X19.042 Y-8.581 Z4.100
+G1 X19.042 Y-12.781 Z4.100
+G1 X15.924 Y-14.581 Z4.100
+G1 X15.924 Y-17.727 Z4.100
+G1 X22.505 Y-17.727 Z4.100
+G1 X22.505 Y-14.581 Z4.100
+G1 X19.387 Y-12.781 Z4.100
+G1 X19.387 Y-8.581 Z4.100
+G1 X22.505 Y-6.781 Z4.100
+G1 X22.505 Y-2.581 Z4.100
+G1 X19.387 Y-0.781 Z4.100
+G1 X19.387 Y3.419 Z4.100
+G1 X22.505 Y5.219 Z4.100
+G1 X22.505 Y9.419 Z4.100
+G1 X19.387 Y11.219 Z4.100
+G1 X19.387 Y15.419 Z4.100
+G1 X22.505 Y17.219 Z4.100
+G1 X22.505 Y17.727 Z4.100
+G1 X22.852 Y17.727 Z4.100
+G1 X22.852 Y17.219 Z4.100
+G1 X25.970 Y15.419 Z4.100
+G1 X25.970 Y11.219 Z4.100
+G1 X22.852 Y9.419 Z4.100
+G1 X22.852 Y5.219 Z4.100
+G1 X25.970 Y3.419 Z4.100
+G1 X25.970 Y-0.781 Z4.100
+G1 X22.852 Y-2.581 Z4.100
+G1 X22.852 Y-6.781 Z4.100
+G1 X25.970 Y-8.581 Z4.100
+G1 X25.970 Y-12.781 Z4.100
+G1 X22.852 Y-14.581 Z4.100
+G1 X22.852 Y-17.727 Z4.100
+G1 X29.434 Y-17.727 Z4.100
+G1 X29.434 Y-14.581 Z4.100
+G1 X26.316 Y-12.781 Z4.100
+G1 X26.316 Y-8.581 Z4.100
+G1 X29.434 Y-6.781 Z4.100
+G1 X29.434 Y-2.581 Z4.100
+G1 X26.316 Y-0.781 Z4.100
+G1 X26.316 Y3.419 Z4.100
+G1 X29.434 Y5.219 Z4.100
+G1 X29.434 Y9.419 Z4.100
+G1 X26.316 Y11.219 Z4.100
+G1 X26.316 Y15.419 Z4.100
+G1 X29.434 Y17.219 Z4.100
+G1 X29.434 Y17.727 Z4.100
+G1 X29.780 Y17.727 Z4.100
+G1 X29.780 Y17.219 Z4.100
+G1 X32.898 Y15.419 Z4.100
+G1 X32.898 Y11.219 Z4.100
+G1 X29.780 Y9.419 Z4.100
+G1 X29.780 Y5.219 Z4.100
+G1 X32.898 Y3.419 Z4.100
+G1 X32.898 Y-0.781 Z4.100
+G1 X29.780 Y-2.581 Z4.100
+G1 X29.780 Y-6.781 Z4.100
+G1 X32.898 Y-8.581 Z4.100
+G1 X32.898 Y-12.781 Z4.100
+G1 X29.780 Y-14.581 Z4.100
+G1 X29.780 Y-17.727 Z4.100
+G1 X36.362 Y-17.727 Z4.100
+G1 X36.362 Y-14.581 Z4.100
+G1 X33.244 Y-12.781 Z4.100
+G1 X33.244 Y-8.581 Z4.100
+G1 X36.362 Y-6.781 Z4.100
+G1 X36.362 Y-2.581 Z4.100
+G1 X33.244 Y-0.781 Z4.100
+G1 X33.244 Y3.419 Z4.100
+G1 X36.362 Y5.219 Z4.100
+G1 X36.362 Y9.419 Z4.100
+G1 X33.244 Y11.219 Z4.100
+G1 X33.244 Y15.419 Z4.100
+G1 X36.362 Y17.219 Z4.100
+G1 X36.362 Y17.727 Z4.100
+G1 X36.708 Y17.727 Z4.100
+G1 X36.708 Y17.219 Z4.100
+G1 X37.727 Y16.631 Z4.100
+G1 X37.727 Y10.007 Z4.100
+G1 X36.708 Y9.419 Z4.100
+G1 X36.708 Y5.219 Z4.100
+G1 X37.727 Y4.631 Z4.100
+G1 X37.727 Y-1.993 Z4.100
+G1 X36.708 Y-2.581 Z4.100
+G1 X36.708 Y-6.781 Z4.100
+G1 X37.727 Y-7.369 Z4.100
+G1 X37.727 Y-13.993 Z4.100
+G1 X36.708 Y-14.581 Z4.100
+G1 X36.708 Y-17.727 Z4.100
+T1
+G1 X22.427 Y-17.173 Z5.100
+G1 X37.173 Y-17.173 Z5.100
+G1 X37.173 Y12.627 Z5.100
+G1 X37.173 Y17.173 Z5.100
+G1 X-22.427 Y17.173 Z5.100
+G1 X-37.173 Y17.173 Z5.100
+G1 X-37.173 Y-12.627 Z5.100
+G1 X-37.173 Y-17.173 Z5.100
+G1 X22.427 Y-17.173 Z5.100
+G1 X22.427 Y-17.173 Z5.100
+G1 X-37.173 Y15.874 Z5.100
+G1 X-36.384 Y15.419 Z5.100
+G1 X-36.384 Y11.219 Z5.100
+G1 X-37.173 Y10.764 Z5.100
+G1 X-37.173 Y3.874 Z5.100
+G1 X-36.384 Y3.419 Z5.100
+G1 X-36.384 Y-0.781 Z5.100
+G1 X-37.173 Y-1.236 Z5.100
+G1 X-37.173 Y-8.126 Z5.100
+G1 X-36.384 Y-8.581 Z5.100
+G1 X-36.384 Y-12.781 Z5.100
+G1 X-37.173 Y-13.236 Z5.100
+G1 X-32.920 Y-17.173 Z5.100
+G1 X-32.920 Y-14.581 Z5.100
+G1 X-36.038 Y-12.781 Z5.100
+G1 X-36.038 Y-8.581 Z5.100
+G1 X-32.920 Y-6.781 Z5.100
+G1 X-32.920 Y-2.581 Z5.100
+G1 X-36.038 Y-0.781 Z5.100
+G1 X-36.038 Y3.419 Z5.100
+G1 X-32.920 Y5.219 Z5.100
+G1 X-32.920 Y9.419 Z5.100
+G1 X-36.038 Y11.219 Z5.100
+G1 X-36.038 Y15.419 Z5.100
+G1 X-33.000 Y17.173 Z5.100
+G1 X-32.494 Y17.173 Z5.100
+G1 X-29.456 Y15.419 Z5.100
+G1 X-29.456 Y11.219 Z5.100
+G1 X-32.574 Y9.419 Z5.100
+G1 X-32.574 Y5.219 Z5.100
+G1 X-29.456 Y3.419 Z5.100
+G1 X-29.456 Y-0.781 Z5.100
+G1 X-32.574 Y-2.581 Z5.100
+G1 X-32.574 Y-6.781 Z5.100
+G1 X-29.456 Y-8.581 Z5.100
+G1 X-29.456 Y-12.781 Z5.100
+G1 X-32.574 Y-14.581 Z5.100
+G1 X-32.574 Y-17.173 Z5.100
+G1 X-25.992 Y-17.173 Z5.100
+G1 X-25.992 Y-14.581 Z5.100
+G1 X-29.110 Y-12.781 Z5.100
+G1 X-29.110 Y-8.581 Z5.100
+G1 X-25.992 Y-6.781 Z5.100
+G1 X-25.992 Y-2.581 Z5.100
+G1 X-29.110 Y-0.781 Z5.100
+G1 X-29.110 Y3.419 Z5.100
+G1 X-25.992 Y5.219 Z5.100
+G1 X-25.992 Y9.419 Z5.100
+G1 X-29.110 Y11.219 Z5.100
+G1 X-29.110 Y15.419 Z5.100
+G1 X-26.072 Y17.173 Z5.100
+G1 X-25.566 Y17.173 Z5.100
+G1 X-22.528 Y15.419 Z5.100
+G1 X-22.528 Y11.219 Z5.100
+G1 X-25.646 Y9.419 Z5.100
+G1 X-25.646 Y5.219 Z5.100
+G1 X-22.528 Y3.419 Z5.100
+G1 X-22.528 Y-0.781 Z5.100
+G1 X-25.646 Y-2.581 Z5.100
+G1 X-25.646 Y-6.781 Z5.100
+G1 X-22.528 Y-8.581 Z5.100
+G1 X-22.528 Y-12.781 Z5.100
+G1 X-25.646 Y-14.581 Z5.100
+G1 X-25.646 Y-17.173 Z5.100
+G1 X-19.063 Y-17.173 Z5.100
+G1 X-19.063 Y-14.581 Z5.100
+G1 X-22.181 Y-12.781 Z5.100
+G1 X-22.181 Y-8.581 Z5.100
+G1 X-19.063 Y-6.781 Z5.100
+G1 X-19.063 Y-2.581 Z5.100
+G1 X-22.181 Y-0.781 Z5.100
+G1 X-22.181 Y3.419 Z5.100
+G1 X-19.063 Y5.219 Z5.100
+G1 X-19.063 Y9.419 Z5.100
+G1 X-22.181 Y11.219 Z5.100
+G1 X-22.181 Y15.419 Z5.100
+G1 X-19.143 Y17.173 Z5.100
+G1 X-18.637 Y17.173 Z5.100
+G1 X-15.599 Y15.419 Z5.100
+G1 X-15.599 Y11.219 Z5.100
+G1 X-18.717 Y9.419 Z5.100
+G1 X-18.717 Y5.219 Z5.100
+G1 X-15.599 Y3.419 Z5.100
+G1 X-15.599 Y-0.781 Z5.100
+G1 X-18.717 Y-2.581 Z5.100
+G1 X-18.717 Y-6.781 Z5.100
+G1 X-15.599 Y-8.581 Z5.100
+G1 X-15.599 Y-12.781 Z5.100
+G1 X-18.717 Y-14.581 Z5.100
+G1 X-18.717 Y-17.173 Z5.100
+G1 X-12.136 Y-17.173 Z5.100
+G1 X-12.136 Y-14.581 Z5.100
+G1 X-15.254 Y-12.781 Z5.100
+G1 X-15.254 Y-8.581 Z5.100
+G1 X-12.136 Y-6.781 Z5.100
+G1 X-12.136 Y-2.581 Z5.100
+G1 X-15.254 Y-0.781 Z5.100
+G1 X-15.254 Y3.419 Z5.100
+G1 X-12.136 Y5.219 Z5.100
+G1 X-12.136 Y9.419 Z5.100
+G1 X-15.254 Y11.219 Z5.100
+G1 X-15.254 Y15.419 Z5.100
+G1 X-12.216 Y17.173 Z5.100
+G1 X-11.709 Y17.173 Z5.100
+G1 X-8.671 Y15.419 Z5.100
+G1 X-8.671 Y11.219 Z5.100
+G1 X-11.789 Y9.419 Z5.100
+G1 X-11.789 Y5.219 Z5.100
+G1 X-8.671 Y3.419 Z5.100
+G1 X-8.671 Y-0.781 Z5.100
+G1 X-11.789 Y-2.581 Z5.100
+G1 X-11.789 Y-6.781 Z5.100
+G1 X-8.671 Y-8.581 Z5.100
+G1 X-8.671 Y-12.781 Z5.100
+G1 X-11.789 Y-14.581 Z5.100
+G1 X-11.789 Y-17.173 Z5.100
+G1 X-5.207 Y-17.173 Z5.100
+G1 X-5.207 Y-14.581 Z5.100
+G1 X-8.325 Y-12.781 Z5.100
+G1 X-8.325 Y-8.581 Z5.100
+G1 X-5.207 Y-6.781 Z5.100
+G1 X-5.207 Y-2.581 Z5.100
+G1 X-8.325 Y-0.781 Z5.100
+G1 X-8.325 Y3.419 Z5.100
+G1 X-5.207 Y5.219 Z5.100
+G1 X-5.207 Y9.419 Z5.100
+G1 X-8.325 Y11.219 Z5.100
+G1 X-8.325 Y15.419 Z5.100
+G1 X-5.287 Y17.173 Z5.100
+G1 X-4.781 Y17.173 Z5.100
+G1 X-1.743 Y15.419 Z5.100
+G1 X-1.743 Y11.219 Z5.100
+G1 X-4.861 Y9.419 Z5.100
+G1 X-4.861 Y5.219 Z5.100
+G1 X-1.743 Y3.419 Z5.100
+G1 X-1.743 Y-0.781 Z5.100
+G1 X-4.861 Y-2.581 Z5.100
+G1 X-4.861 Y-6.781 Z5.100
+G1 X-1.743 Y-8.581 Z5.100
+G1 X-1.743 Y-12.781 Z5.100
+G1 X-4.861 Y-14.581 Z5.100
+G1 X-4.861 Y-17.173 Z5.100
+G1 X1.721 Y-17.173 Z5.100
+G1 X1.721 Y-14.581 Z5.100
+G1 X-1.397 Y-12.781 Z5.100
+G1 X-1.397 Y-8.581 Z5.100
+G1 X1.721 Y-6.781 Z5.100
+G1 X1.721 Y-2.581 Z5.100
+G1 X-1.397 Y-0.781 Z5.100
+G1 X-1.397 Y3.419 Z5.100
+G1 X1.721 Y5.219 Z5.100
+G1 X1.721 Y9.419 Z5.100
+G1 X-1.397 Y11.219 Z5.100
+G1 X-1.397 Y15.419 Z5.100
+G1 X1.641 Y17.173 Z5.100
+G1 X2.147 Y17.173 Z5.100
+G1 X5.185 Y15.419 Z5.100
+G1 X5.185 Y11.219 Z5.100
+G1 X2.067 Y9.419 Z5.100
+G1 X2.067 Y5.219 Z5.100
+G1 X5.185 Y3.419 Z5.100
+G1 X5.185 Y-0.781 Z5.100
+G1 X2.067 Y-2.581 Z5.100
+G1 X2.067 Y-6.781 Z5.100
+G1 X5.185 Y-8.581 Z5.100
+G1 X5.185 Y-12.781 Z5.100
+G1 X2.067 Y-14.581 Z5.100
+G1 X2.067 Y-17.173 Z5.100
+G1 X8.649 Y-17.173 Z5.100
+G1 X8.649 Y-14.581 Z5.100
+G1 X5.531 Y-12.781 Z5.100
+G1 X5.531 Y-8.581 Z5.100
+G1 X8.649 Y-6.781 Z5.100
+G1 X8.649 Y-2.581 Z5.100
+G1 X5.531 Y-0.781 Z5.100
+G1 X5.531 Y3.419 Z5.100
+G1 X8.649 Y5.219 Z5.100
+G1 X8.649 Y9.419 Z5.100
+G1 X5.531 Y11.219 Z5.100
+G1 X5.531 Y15.419 Z5.100
+G1 X8.569 Y17.173 Z5.100
+G1 X9.075 Y17.173 Z5.100
+G1 X12.113 Y15.419 Z5.100
+G1 X12.113 Y11.219 Z5.100
+G1 X8.995 Y9.419 Z5.100
+G1 X8.995 Y5.219 Z5.100
+G1 X12.113 Y3.419 Z5.100
+G1 X12.113 Y-0.781 Z5.100
+G1 X8.995 Y-2.581 Z5.100
+G1 X8.995 Y-6.781 Z5.100
+G1 X12.113 Y-8.581 Z5.100
+G1 X12.113 Y-12.781 Z5.100
+G1 X8.995 Y-14.581 Z5.100
+G1 X8.995 Y-17.173 Z5.100
+G1 X15.578 Y-17.173 Z5.100
+G1 X15.578 Y-14.581 Z5.100
+G1 X12.460 Y-12.781 Z5.100
+G1 X12.460 Y-8.581 Z5.100
+G1 X15.578 Y-6.781 Z5.100
+G1 X15.578 Y-2.581 Z5.100
+G1 X12.460 Y-0.781 Z5.100
+G1 X12.460 Y3.419 Z5.100
+G1 X15.578 Y5.219 Z5.100
+G1 X15.578 Y9.419 Z5.100
+G1 X12.460 Y11.219 Z5.100
+G1 X12.460 Y15.419 Z5.100
+G1 X15.498 Y17.173 Z5.100
+G1 X16.004 Y17.173 Z5.100
+G1 X19.042 Y15.419 Z5.100
+G1 X19.042 Y11.219 Z5.100
+G1 X15.924 Y9.419 Z5.100
+G1 X15.924 Y5.219 Z5.100
+G1 X19.042 Y3.419 Z5.100
+G1 X19.042 Y-0.781 Z5.100
+G1 X15.924 Y-2.581 Z5.100
+G1 X15.924 Y-6.781 Z5.100
+G1 X19.042 Y-8.581 Z5.100
+G1 X19.042 Y-12.781 Z5.100
+G1 X15.924 Y-14.581 Z5.100
+G1 X15.924 Y-17.173 Z5.100
+G1 X22.505 Y-17.173 Z5.100
+G1 X22.505 Y-14.581 Z5.100
+G1 X19.387 Y-12.781 Z5.100
+G1 X19.387 Y-8.581 Z5.100
+G1 X22.505 Y-6.781 Z5.100
+G1 X22.505 Y-2.581 Z5.100
+G1 X19.387 Y-0.781 Z5.100
+G1 X19.387 Y3.419 Z5.100
+G1 X22.505 Y5.219 Z5.100
+G1 X22.505 Y9.419 Z5.100
+G1 X19.387 Y11.219 Z5.100
+G1 X19.387 Y15.419 Z5.100
+G1 X22.425 Y17.173 Z5.100
+G1 X22.932 Y17.173 Z5.100
+G1 X25.970 Y15.419 Z5.100
+G1 X25.970 Y11.219 Z5.100
+G1 X22.852 Y9.419 Z5.100
+G1 X22.852 Y5.219 Z5.100
+G1 X25.970 Y3.419 Z5.100
+G1 X25.970 Y-0.781 Z5.100
+G1 X22.852 Y-2.581 Z5.100
+G1 X22.852 Y-6.781 Z5.100
+G1 X25.970 Y-8.581 Z5.100
+G1 X25.970 Y-12.781 Z5.100
+G1 X22.852 Y-14.581 Z5.100
+G1 X22.852 Y-17.173 Z5.100
+G1 X29.434 Y-17.173 Z5.100
+G1 X29.434 Y-14.581 Z5.100
+G1 X26.316 Y-12.781 Z5.100
+G1 X26.316 Y-8.581 Z5.100
+G1 X29.434 Y-6.781 Z5.100
+G1 X29.434 Y-2.581 Z5.100
+G1 X26.316 Y-0.781 Z5.100
+G1 X26.316 Y3.419 Z5.100
+G1 X29.434 Y5.219 Z5.100
+G1 X29.434 Y9.419 Z5.100
+G1 X26.316 Y11.219 Z5.100
+G1 X26.316 Y15.419 Z5.100
+G1 X29.354 Y17.173 Z5.100
+G1 X29.860 Y17.173 Z5.100
+G1 X32.898 Y15.419 Z5.100
+G1 X32.898 Y11.219 Z5.100
+G1 X29.780 Y9.419 Z5.100
+G1 X29.780 Y5.219 Z5.100
+G1 X32.898 Y3.419 Z5.100
+G1 X32.898 Y-0.781 Z5.100
+G1 X29.780 Y-2.581 Z5.100
+G1 X29.780 Y-6.781 Z5.100
+G1 X32.898 Y-8.581 Z5.100
+G1 X32.898 Y-12.781 Z5.100
+G1 X29.780 Y-14.581 Z5.100
+G1 X29.780 Y-17.173 Z5.100
+G1 X36.362 Y-17.173 Z5.100
+G1 X36.362 Y-14.581 Z5.100
+G1 X33.244 Y-12.781 Z5.100
+G1 X33.244 Y-8.581 Z5.100
+G1 X36.362 Y-6.781 Z5.100
+G1 X36.362 Y-2.581 Z5.100
+G1 X33.244 Y-0.781 Z5.100
+G1 X33.244 Y3.419 Z5.100
+G1 X36.362 Y5.219 Z5.100
+G1 X36.362 Y9.419 Z5.100
+G1 X33.244 Y11.219 Z5.100
+G1 X33.244 Y15.419 Z5.100
+G1 X36.282 Y17.173 Z5.100
+G1 X36.788 Y17.173 Z5.100
+G1 X37.173 Y16.951 Z5.100
+G1 X37.173 Y9.687 Z5.100
+G1 X36.708 Y9.419 Z5.100
+G1 X36.708 Y5.219 Z5.100
+G1 X37.173 Y4.951 Z5.100
+G1 X37.173 Y-2.313 Z5.100
+G1 X36.708 Y-2.581 Z5.100
+G1 X36.708 Y-6.781 Z5.100
+G1 X37.173 Y-7.049 Z5.100
+G1 X37.173 Y-14.313 Z5.100
+G1 X36.708 Y-14.581 Z5.100
+G1 X36.708 Y-17.173 Z5.100
+T1
+G1 X18.981 Y-16.619 Z6.100
+G1 X36.619 Y-16.619 Z6.100
+G1 X36.619 Y11.181 Z6.100
+G1 X36.619 Y16.619 Z6.100
+G1 X-18.981 Y16.619 Z6.100
+G1 X-36.619 Y16.619 Z6.100
+G1 X-36.619 Y-11.181 Z6.100
+G1 X-36.619 Y-16.619 Z6.100
+G1 X18.981 Y-16.619 Z6.100
+G1 X18.981 Y-16.619 Z6.100
+G1 X-36.619 Y15.555 Z6.100
+G1 X-36.384 Y15.419 Z6.100
+G1 X-36.384 Y11.219 Z6.100
+G1 X-36.619 Y11.083 Z6.100
+G1 X-36.619 Y3.555 Z6.100
+G1 X-36.384 Y3.419 Z6.100
+G1 X-36.384 Y-0.781 Z6.100
+G1 X-36.619 Y-0.917 Z6.100
+G1 X-36.619 Y-8.445 Z6.100
+G1 X-36.384 Y-8.581 Z6.100
+G1 X-36.384 Y-12.781 Z6.100
+G1 X-36.619 Y-12.917 Z6.100
+G1 X-32.920 Y-16.619 Z6.100
+G1 X-32.920 Y-14.581 Z6.100
+G1 X-36.038 Y-12.781 Z6.100
+G1 X-36.038 Y-8.581 Z6.100
+G1 X-32.920 Y-6.781 Z6.100
+G1 X-32.920 Y-2.581 Z6.100
+G1 X-36.038 Y-0.781 Z6.100
+G1 X-36.038 Y3.419 Z6.100
+G1 X-32.920 Y5.219 Z6.100
+G1 X-32.920 Y9.419 Z6.100
+G1 X-36.038 Y11.219 Z6.100
+G1 X-36.038 Y15.419 Z6.100
+G1 X-33.959 Y16.619 Z6.100
+G1 X-31.535 Y16.619 Z6.100
+G1 X-29.456 Y15.419 Z6.100
+G1 X-29.456 Y11.219 Z6.100
+G1 X-32.574 Y9.419 Z6.100
+G1 X-32.574 Y5.219 Z6.100
+G1 X-29.456 Y3.419 Z6.100
+G1 X-29.456 Y-0.781 Z6.100
+G1 X-32.574 Y-2.581 Z6.100
+G1 X-32.574 Y-6.781 Z6.100
+G1 X-29.456 Y-8.581 Z6.100
+G1 X-29.456 Y-12.781 Z6.100
+G1 X-32.574 Y-14.581 Z6.100
+G1 X-32.574 Y-16.619 Z6.100
+G1 X-25.992 Y-16.619 Z6.100
+G1 X-25.992 Y-14.581 Z6.100
+G1 X-29.110 Y-12.781 Z6.100
+G1 X-29.110 Y-8.581 Z6.100
+G1 X-25.992 Y-6.781 Z6.100
+G1 X-25.992 Y-2.581 Z6.100
+G1 X-29.110 Y-0.781 Z6.100
+G1 X-29.110 Y3.419 Z6.100
+G1 X-25.992 Y5.219 Z6.100
+G1 X-25.992 Y9.419 Z6.100
+G1 X-29.110 Y11.219 Z6.100
+G1 X-29.110 Y15.419 Z6.100
+G1 X-27.031 Y16.619 Z6.100
+G1 X-24.607 Y16.619 Z6.100
+G1 X-22.528 Y15.419 Z6.100
+G1 X-22.528 Y11.219 Z6.100
+G1 X-25.646 Y9.419 Z6.100
+G1 X-25.646 Y5.219 Z6.100
+G1 X-22.528 Y3.419 Z6.100
+G1 X-22.528 Y-0.781 Z6.100
+G1 X-25.646 Y-2.581 Z6.100
+G1 X-25.646 Y-6.781 Z6.100
+G1 X-22.528 Y-8.581 Z6.100
+G1 X-22.528 Y-12.781 Z6.100
+G1 X-25.646 Y-14.581 Z6.100
+G1 X-25.646 Y-16.619 Z6.100
+G1 X-19.063 Y-16.619 Z6.100
+G1 X-19.063 Y-14.581 Z6.100
+G1 X-22.181 Y-12.781 Z6.100
+G1 X-22.181 Y-8.581 Z6.100
+G1 X-19.063 Y-6.781 Z6.100
+G1 X-19.063 Y-2.581 Z6.100
+G1 X-22.181 Y-0.781 Z6.100
+G1 X-22.181 Y3.419 Z6.100
+G1 X-19.063 Y5.219 Z6.100
+G1 X-19.063 Y9.419 Z6.100
+G1 X-22.181 Y11.219 Z6.100
+G1 X-22.181 Y15.419 Z6.100
+G1 X-20.102 Y16.619 Z6.100
+G1 X-17.678 Y16.619 Z6.100
+G1 X-15.599 Y15.419 Z6.100
+G1 X-15.599 Y11.219 Z6.100
+G1 X-18.717 Y9.419 Z6.100
+G1 X-18.717 Y5.219 Z6.100
+G1 X-15.599 Y3.419 Z6.100
+G1 X-15.599 Y-0.781 Z6.100
+G1 X-18.717 Y-2.581 Z6.100
+G1 X-18.717 Y-6.781 Z6.100
+G1 X-15.599 Y-8.581 Z6.100
+G1 X-15.599 Y-12.781 Z6.100
+G1 X-18.717 Y-14.581 Z6.100
+G1 X-18.717 Y-16.619 Z6.100
+G1 X-12.136 Y-16.619 Z6.100
+G1 X-12.136 Y-14.581 Z6.100
+G1 X-15.254 Y-12.781 Z6.100
+G1 X-15.254 Y-8.581 Z6.100
+G1 X-12.136 Y-6.781 Z6.100
+G1 X-12.136 Y-2.581 Z6.100
+G1 X-15.254 Y-0.781 Z6.100
+G1 X-15.254 Y3.419 Z6.100
+G1 X-12.136 Y5.219 Z6.100
+G1 X-12.136 Y9.419 Z6.100
+G1 X-15.254 Y11.219 Z6.100
+G1 X-15.254 Y15.419 Z6.100
+G1 X-13.175 Y16.619 Z6.100
+G1 X-10.750 Y16.619 Z6.100
+G1 X-8.671 Y15.419 Z6.100
+G1 X-8.671 Y11.219 Z6.100
+G1 X-11.789 Y9.419 Z6.100
+G1 X-11.789 Y5.219 Z6.100
+G1 X-8.671 Y3.419 Z6.100
+G1 X-8.671 Y-0.781 Z6.100
+G1 X-11.789 Y-2.581 Z6.100
+G1 X-11.789 Y-6.781 Z6.100
+G1 X-8.671 Y-8.581 Z6.100
+G1 X-8.671 Y-12.781 Z6.100
+G1 X-11.789 Y-14.581 Z6.100
+G1 X-11.789 Y-16.619 Z6.100
+G1 X-5.207 Y-16.619 Z6.100
+G1 X-5.207 Y-14.581 Z6.100
+G1 X-8.325 Y-12.781 Z6.100
+G1 X-8.325 Y-8.581 Z6.100
+G1 X-5.207 Y-6.781 Z6.100
+G1 X-5.207 Y-2.581 Z6.100
+G1 X-8.325 Y-0.781 Z6.100
+G1 X-8.325 Y3.419 Z6.100
+G1 X-5.207 Y5.219 Z6.100
+G1 X-5.207 Y9.419 Z6.100
+G1 X-8.325 Y11.219 Z6.100
+G1 X-8.325 Y15.419 Z6.100
+G1 X-6.246 Y16.619 Z6.100
+G1 X-3.822 Y16.619 Z6.100
+G1 X-1.743 Y15.419 Z6.100
+G1 X-1.743 Y11.219 Z6.100
+G1 X-4.861 Y9.419 Z6.100
+G1 X-4.861 Y5.219 Z6.100
+G1 X-1.743 Y3.419 Z6.100
+G1 X-1.743 Y-0.781 Z6.100
+G1 X-4.861 Y-2.581 Z6.100
+G1 X-4.861 Y-6.781 Z6.100
+G1 X-1.743 Y-8.581 Z6.100
+G1 X-1.743 Y-12.781 Z6.100
+G1 X-4.861 Y-14.581 Z6.100
+G1 X-4.861 Y-16.619 Z6.100
+G1 X1.721 Y-16.619 Z6.100
+G1 X1.721 Y-14.581 Z6.100
+G1 X-1.397 Y-12.781 Z6.100
+G1 X-1.397 Y-8.581 Z6.100
+G1 X1.721 Y-6.781 Z6.100
+G1 X1.721 Y-2.581 Z6.100
+G1 X-1.397 Y-0.781 Z6.100
+G1 X-1.397 Y3.419 Z6.100
+G1 X1.721 Y5.219 Z6.100
+G1 X1.721 Y9.419 Z6.100
+G1 X-1.397 Y11.219 Z6.100
+G1 X-1.397 Y15.419 Z6.100
+G1 X0.682 Y16.619 Z6.100
+G1 X3.106 Y16.619 Z6.100
+G1 X5.185 Y15.419 Z6.100
+G1 X5.185 Y11.219 Z6.100
+G1 X2.067 Y9.419 Z6.100
+G1 X2.067 Y5.219 Z6.100
+G1 X5.185 Y3.419 Z6.100
+G1 X5.185 Y-0.781 Z6.100
+G1 X2.067 Y-2.581 Z6.100
+G1 X2.067 Y-6.781 Z6.100
+G1 X5.185 Y-8.581 Z6.100
+G1 X5.185 Y-12.781 Z6.100
+G1 X2.067 Y-14.581 Z6.100
+G1 X2.067 Y-16.619 Z6.100
+G1 X8.649 Y-16.619 Z6.100
+G1 X8.649 Y-14.581 Z6.100
+G1 X5.531 Y-12.781 Z6.100
+G1 X5.531 Y-8.581 Z6.100
+G1 X8.649 Y-6.781 Z6.100
+G1 X8.649 Y-2.581 Z6.100
+G1 X5.531 Y-0.781 Z6.100
+G1 X5.531 Y3.419 Z6.100
+G1 X8.649 Y5.219 Z6.100
+G1 X8.649 Y9.419 Z6.100
+G1 X5.531 Y11.219 Z6.100
+G1 X5.531 Y15.419 Z6.100
+G1 X7.610 Y16.619 Z6.100
+G1 X10.034 Y16.619 Z6.100
+G1 X12.113 Y15.419 Z6.100
+G1 X12.113 Y11.219 Z6.100
+G1 X8.995 Y9.419 Z6.100
+G1 X8.995 Y5.219 Z6.100
+G1 X12.113 Y3.419 Z6.100
+G1 X12.113 Y-0.781 Z6.100
+G1 X8.995 Y-2.581 Z6.100
+G1 X8.995 Y-6.781 Z6.100
+G1 X12.113 Y-8.581 Z6.100
+G1 X12.113 Y-12.781 Z6.100
+G1 X8.995 Y-14.581 Z6.100
+G1 X8.995 Y-16.619 Z6.100
+G1 X15.578 Y-16.619 Z6.100
+G1 X15.578 Y-14.581 Z6.100
+G1 X12.460 Y-12.781 Z6.100
+G1 X12.460 Y-8.581 Z6.100
+G1 X15.578 Y-6.781 Z6.100
+G1 X15.578 Y-2.581 Z6.100
+G1 X12.460 Y-0.781 Z6.100
+G1 X12.460 Y3.419 Z6.100
+G1 X15.578 Y5.219 Z6.100
+G1 X15.578 Y9.419 Z6.100
+G1 X12.460 Y11.219 Z6.100
+G1 X12.460 Y15.419 Z6.100
+G1 X14.539 Y16.619 Z6.100
+G1 X16.963 Y16.619 Z6.100
+G1 X19.042 Y15.419 Z6.100
+G1 X19.042 Y11.219 Z6.100
+G1 X15.924 Y9.419 Z6.100
+G1 X15.924 Y5.219 Z6.100
+G1 X19.042 Y3.419 Z6.100
+G1 X19.042 Y-0.781 Z6.100
+G1 X15.924 Y-2.581 Z6.100
+G1 X15.924 Y-6.781 Z6.100
+G1 X19.042 Y-8.581 Z6.100
+G1 X19.042 Y-12.781 Z6.100
+G1 X15.924 Y-14.581 Z6.100
+G1 X15.924 Y-16.619 Z6.100
+G1 X22.505 Y-16.619 Z6.100
+G1 X22.505 Y-14.581 Z6.100
+G1 X19.387 Y-12.781 Z6.100
+G1 X19.387 Y-8.581 Z6.100
+G1 X22.505 Y-6.781 Z6.100
+G1 X22.505 Y-2.581 Z6.100
+G1 X19.387 Y-0.781 Z6.100
+G1 X19.387 Y3.419 Z6.100
+G1 X22.505 Y5.219 Z6.100
+G1 X22.505 Y9.419 Z6.100
+G1 X19.387 Y11.219 Z6.100
+G1 X19.387 Y15.419 Z6.100
+G1 X21.466 Y16.619 Z6.100
+G1 X23.891 Y16.619 Z6.100
+G1 X25.970 Y15.419 Z6.100
+G1 X25.970 Y11.219 Z6.100
+G1 X22.852 Y9.419 Z6.100
+G1 X22.852 Y5.219 Z6.100
+G1 X25.970 Y3.419 Z6.100
+G1 X25.970 Y-0.781 Z6.100
+G1 X22.852 Y-2.581 Z6.100
+G1 X22.852 Y-6.781 Z6.100
+G1 X25.970 Y-8.581 Z6.100
+G1 X25.970 Y-12.781 Z6.100
+G1 X22.852 Y-14.581 Z6.100
+G1 X22.852 Y-16.619 Z6.100
+G1 X29.434 Y-16.619 Z6.100
+G1 X29.434 Y-14.581 Z6.100
+G1 X26.316 Y-12.781 Z6.100
+G1 X26.316 Y-8.581 Z6.100
+G1 X29.434 Y-6.781 Z6.100
+G1 X29.434 Y-2.581 Z6.100
+G1 X26.316 Y-0.781 Z6.100
+G1 X26.316 Y3.419 Z6.100
+G1 X29.434 Y5.219 Z6.100
+G1 X29.434 Y9.419 Z6.100
+G1 X26.316 Y11.219 Z6.100
+G1 X26.316 Y15.419 Z6.100
+G1 X28.395 Y16.619 Z6.100
+G1 X30.819 Y16.619 Z6.100
+G1 X32.898 Y15.419 Z6.100
+G1 X32.898 Y11.219 Z6.100
+G1 X29.780 Y9.419 Z6.100
+G1 X29.780 Y5.219 Z6.100
+G1 X32.898 Y3.419 Z6.100
+G1 X32.898 Y-0.781 Z6.100
+G1 X29.780 Y-2.581 Z6.100
+G1 X29.780 Y-6.781 Z6.100
+G1 X32.898 Y-8.581 Z6.100
+G1 X32.898 Y-12.781 Z6.100
+G1 X29.780 Y-14.581 Z6.100
+G1 X29.780 Y-16.619 Z6.100
+G1 X36.362 Y-16.619 Z6.100
+G1 X36.362 Y-14.581 Z6.100
+G1 X33.244 Y-12.781 Z6.100
+G1 X33.244 Y-8.581 Z6.100
+G1 X36.362 Y-6.781 Z6.100
+G1 X36.362 Y-2.581 Z6.100
+G1 X33.244 Y-0.781 Z6.100
+G1 X33.244 Y3.419 Z6.100
+G1 X36.362 Y5.219 Z6.100
+G1 X36.362 Y9.419 Z6.100
+G1 X33.244 Y11.219 Z6.100
+G1 X33.244 Y15.419 Z6.100
+G1 X35.323 Y16.619 Z6.100
+T1
+G1 X15.536 Y-16.064 Z7.100
+G1 X36.064 Y-16.064 Z7.100
+G1 X36.064 Y9.736 Z7.100
+G1 X36.064 Y16.064 Z7.100
+G1 X-15.536 Y16.064 Z7.100
+G1 X-36.064 Y16.064 Z7.100
+G1 X-36.064 Y-9.736 Z7.100
+G1 X-36.064 Y-16.064 Z7.100
+G1 X15.536 Y-16.064 Z7.100
+G1 X15.536 Y-16.064 Z7.100
+G1 X-32.920 Y-16.064 Z7.100
+G1 X-32.920 Y-14.581 Z7.100
+G1 X-36.038 Y-12.781 Z7.100
+G1 X-36.038 Y-8.581 Z7.100
+G1 X-32.920 Y-6.781 Z7.100
+G1 X-32.920 Y-2.581 Z7.100
+G1 X-36.038 Y-0.781 Z7.100
+G1 X-36.038 Y3.419 Z7.100
+G1 X-32.920 Y5.219 Z7.100
+G1 X-32.920 Y9.419 Z7.100
+G1 X-36.038 Y11.219 Z7.100
+G1 X-36.038 Y15.419 Z7.100
+G1 X-34.921 Y16.064 Z7.100
+G1 X-30.573 Y16.064 Z7.100
+G1 X-29.456 Y15.419 Z7.100
+G1 X-29.456 Y11.219 Z7.100
+G1 X-32.574 Y9.419 Z7.100
+G1 X-32.574 Y5.219 Z7.100
+G1 X-29.456 Y3.419 Z7.100
+G1 X-29.456 Y-0.781 Z7.100
+G1 X-32.574 Y-2.581 Z7.100
+G1 X-32.574 Y-6.781 Z7.100
+G1 X-29.456 Y-8.581 Z7.100
+G1 X-29.456 Y-12.781 Z7.100
+G1 X-32.574 Y-14.581 Z7.100
+G1 X-32.574 Y-16.064 Z7.100
+G1 X-25.992 Y-16.064 Z7.100
+G1 X-25.992 Y-14.581 Z7.100
+G1 X-29.110 Y-12.781 Z7.100
+G1 X-29.110 Y-8.581 Z7.100
+G1 X-25.992 Y-6.781 Z7.100
+G1 X-25.992 Y-2.581 Z7.100
+G1 X-29.110 Y-0.781 Z7.100
+G1 X-29.110 Y3.419 Z7.100
+G1 X-25.992 Y5.219 Z7.100
+G1 X-25.992 Y9.419 Z7.100
+G1 X-29.110 Y11.219 Z7.100
+G1 X-29.110 Y15.419 Z7.100
+G1 X-27.993 Y16.064 Z7.100
+G1 X-23.645 Y16.064 Z7.100
+G1 X-22.528 Y15.419 Z7.100
+G1 X-22.528 Y11.219 Z7.100
+G1 X-25.646 Y9.419 Z7.100
+G1 X-25.646 Y5.219 Z7.100
+G1 X-22.528 Y3.419 Z7.100
+G1 X-22.528 Y-0.781 Z7.100
+G1 X-25.646 Y-2.581 Z7.100
+G1 X-25.646 Y-6.781 Z7.100
+G1 X-22.528 Y-8.581 Z7.100
+G1 X-22.528 Y-12.781 Z7.100
+G1 X-25.646 Y-14.581 Z7.100
+G1 X-25.646 Y-16.064 Z7.100
+G1 X-19.063 Y-16.064 Z7.100
+G1 X-19.063 Y-14.581 Z7.100
+G1 X-22.181 Y-12.781 Z7.100
+G1 X-22.181 Y-8.581 Z7.100
+G1 X-19.063 Y-6.781 Z7.100
+G1 X-19.063 Y-2.581 Z7.100
+G1 X-22.181 Y-0.781 Z7.100
+G1 X-22.181 Y3.419 Z7.100
+G1 X-19.063 Y5.219 Z7.100
+G1 X-19.063 Y9.419 Z7.100
+G1 X-22.181 Y11.219 Z7.100
+G1 X-22.181 Y15.419 Z7.100
+G1 X-21.064 Y16.064 Z7.100
+G1 X-16.716 Y16.064 Z7.100
+G1 X-15.599 Y15.419 Z7.100
+G1 X-15.599 Y11.219 Z7.100
+G1 X-18.717 Y9.419 Z7.100
+G1 X-18.717 Y5.219 Z7.100
+G1 X-15.599 Y3.419 Z7.100
+G1 X-15.599 Y-0.781 Z7.100
+G1 X-18.717 Y-2.581 Z7.100
+G1 X-18.717 Y-6.781 Z7.100
+G1 X-15.599 Y-8.581 Z7.100
+G1 X-15.599 Y-12.781 Z7.100
+G1 X-18.717 Y-14.581 Z7.100
+G1 X-18.717 Y-16.064 Z7.100
+G1 X-12.136 Y-16.064 Z7.100
+G1 X-12.136 Y-14.581 Z7.100
+G1 X-15.254 Y-12.781 Z7.100
+G1 X-15.254 Y-8.581 Z7.100
+G1 X-12.136 Y-6.781 Z7.100
+G1 X-12.136 Y-2.581 Z7.100
+G1 X-15.254 Y-0.781 Z7.100
+G1 X-15.254 Y3.419 Z7.100
+G1 X-12.136 Y5.219 Z7.100
+G1 X-12.136 Y9.419 Z7.100
+G1 X-15.254 Y11.219 Z7.100
+G1 X-15.254 Y15.419 Z7.100
+G1 X-14.137 Y16.064 Z7.100
+G1 X-9.788 Y16.064 Z7.100
+G1 X-8.671 Y15.419 Z7.100
+G1 X-8.671 Y11.219 Z7.100
+G1 X-11.789 Y9.419 Z7.100
+G1 X-11.789 Y5.219 Z7.100
+G1 X-8.671 Y3.419 Z7.100
+G1 X-8.671 Y-0.781 Z7.100
+G1 X-11.789 Y-2.581 Z7.100
+G1 X-11.789 Y-6.781 Z7.100
+G1 X-8.671 Y-8.581 Z7.100
+G1 X-8.671 Y-12.781 Z7.100
+G1 X-11.789 Y-14.581 Z7.100
+G1 X-11.789 Y-16.064 Z7.100
+G1 X-5.207 Y-16.064 Z7.100
+G1 X-5.207 Y-14.581 Z7.100
+G1 X-8.325 Y-12.781 Z7.100
+G1 X-8.325 Y-8.581 Z7.100
+G1 X-5.207 Y-6.781 Z7.100
+G1 X-5.207 Y-2.581 Z7.100
+G1 X-8.325 Y-0.781 Z7.100
+G1 X-8.325 Y3.419 Z7.100
+G1 X-5.207 Y5.219 Z7.100
+G1 X-5.207 Y9.419 Z7.100
+G1 X-8.325 Y11.219 Z7.100
+G1 X-8.325 Y15.419 Z7.100
+G1 X-7.208 Y16.064 Z7.100
+G1 X-2.860 Y16.064 Z7.100
+G1 X-1.743 Y15.419 Z7.100
+G1 X-1.743 Y11.219 Z7.100
+G1 X-4.861 Y9.419 Z7.100
+G1 X-4.861 Y5.219 Z7.100
+G1 X-1.743 Y3.419 Z7.100
+G1 X-1.743 Y-0.781 Z7.100
+G1 X-4.861 Y-2.581 Z7.100
+G1 X-4.861 Y-6.781 Z7.100
+G1 X-1.743 Y-8.581 Z7.100
+G1 X-1.743 Y-12.781 Z7.100
+G1 X-4.861 Y-14.581 Z7.100
+G1 X-4.861 Y-16.064 Z7.100
+G1 X1.721 Y-16.064 Z7.100
+G1 X1.721 Y-14.581 Z7.100
+G1 X-1.397 Y-12.781 Z7.100
+G1 X-1.397 Y-8.581 Z7.100
+G1 X1.721 Y-6.781 Z7.100
+G1 X1.721 Y-2.581 Z7.100
+G1 X-1.397 Y-0.781 Z7.100
+G1 X-1.397 Y3.419 Z7.100
+G1 X1.721 Y5.219 Z7.100
+G1 X1.721 Y9.419 Z7.100
+G1 X-1.397 Y11.219 Z7.100
+G1 X-1.397 Y15.419 Z7.100
+G1 X-0.280 Y16.064 Z7.100
+G1 X4.068 Y16.064 Z7.100
+G1 X5.185 Y15.419 Z7.100
+G1 X5.185 Y11.219 Z7.100
+G1 X2.067 Y9.419 Z7.100
+G1 X2.067 Y5.219 Z7.100
+G1 X5.185 Y3.419 Z7.100
+G1 X5.185 Y-0.781 Z7.100
+G1 X2.067 Y-2.581 Z7.100
+G1 X2.067 Y-6.781 Z7.100
+G1 X5.185 Y-8.581 Z7.100
+G1 X5.185 Y-12.781 Z7.100
+G1 X2.067 Y-14.581 Z7.100
+G1 X2.067 Y-16.064 Z7.100
+G1 X8.649 Y-16.064 Z7.100
+G1 X8.649 Y-14.581 Z7.100
+G1 X5.531 Y-12.781 Z7.100
+G1 X5.531 Y-8.581 Z7.100
+G1 X8.649 Y-6.781 Z7.100
+G1 X8.649 Y-2.581 Z7.100
+G1 X5.531 Y-0.781 Z7.100
+G1 X5.531 Y3.419 Z7.100
+G1 X8.649 Y5.219 Z7.100
+G1 X8.649 Y9.419 Z7.100
+G1 X5.531 Y11.219 Z7.100
+G1 X5.531 Y15.419 Z7.100
+G1 X6.648 Y16.064 Z7.100
+G1 X10.996 Y16.064 Z7.100
+G1 X12.113 Y15.419 Z7.100
+G1 X12.113 Y11.219 Z7.100
+G1 X8.995 Y9.419 Z7.100
+G1 X8.995 Y5.219 Z7.100
+G1 X12.113 Y3.419 Z7.100
+G1 X12.113 Y-0.781 Z7.100
+G1 X8.995 Y-2.581 Z7.100
+G1 X8.995 Y-6.781 Z7.100
+G1 X12.113 Y-8.581 Z7.100
+G1 X12.113 Y-12.781 Z7.100
+G1 X8.995 Y-14.581 Z7.100
+G1 X8.995 Y-16.064 Z7.100
+G1 X15.578 Y-16.064 Z7.100
+G1 X15.578 Y-14.581 Z7.100
+G1 X12.460 Y-12.781 Z7.100
+G1 X12.460 Y-8.581 Z7.100
+G1 X15.578 Y-6.781 Z7.100
+G1 X15.578 Y-2.581 Z7.100
+G1 X12.460 Y-0.781 Z7.100
+G1 X12.460 Y3.419 Z7.100
+G1 X15.578 Y5.219 Z7.100
+G1 X15.578 Y9.419 Z7.100
+G1 X12.460 Y11.219 Z7.100
+G1 X12.460 Y15.419 Z7.100
+G1 X13.577 Y16.064 Z7.100
+G1 X17.925 Y16.064 Z7.100
+G1 X19.042 Y15.419 Z7.100
+G1 X19.042 Y11.219 Z7.100
+G1 X15.924 Y9.419 Z7.100
+G1 X15.924 Y5.219 Z7.100
+G1 X19.042 Y3.419 Z7.100
+G1 X19.042 Y-0.781 Z7.100
+G1 X15.924 Y-2.581 Z7.100
+G1 X15.924 Y-6.781 Z7.100
+G1 X19.042 Y-8.581 Z7.100
+G1 X19.042 Y-12.781 Z7.100
+G1 X15.924 Y-14.581 Z7.100
+G1 X15.924 Y-16.064 Z7.100
+G1 X22.505 Y-16.064 Z7.100
+G1 X22.505 Y-14.581 Z7.100
+G1 X19.387 Y-12.781 Z7.100
+G1 X19.387 Y-8.581 Z7.100
+G1 X22.505 Y-6.781 Z7.100
+G1 X22.505 Y-2.581 Z7.100
+G1 X19.387 Y-0.781 Z7.100
+G1 X19.387 Y3.419 Z7.100
+G1 X22.505 Y5.219 Z7.100
+G1 X22.505 Y9.419 Z7.100
+G1 X19.387 Y11.219 Z7.100
+G1 X19.387 Y15.419 Z7.100
+G1 X20.504 Y16.064 Z7.100
+G1 X24.853 Y16.064 Z7.100
+G1 X25.970 Y15.419 Z7.100
+G1 X25.970 Y11.219 Z7.100
+G1 X22.852 Y9.419 Z7.100
+G1 X22.852 Y5.219 Z7.100
+G1 X25.970 Y3.419 Z7.100
+G1 X25.970 Y-0.781 Z7.100
+G1 X22.852 Y-2.581 Z7.100
+G1 X22.852 Y-6.781 Z7.100
+G1 X25.970 Y-8.581 Z7.100
+G1 X25.970 Y-12.781 Z7.100
+G1 X22.852 Y-14.581 Z7.100
+G1 X22.852 Y-16.064 Z7.100
+G1 X29.434 Y-16.064 Z7.100
+G1 X29.434 Y-14.581 Z7.100
+G1 X26.316 Y-12.781 Z7.100
+G1 X26.316 Y-8.581 Z7.100
+G1 X29.434 Y-6.781 Z7.100
+G1 X29.434 Y-2.581 Z7.100
+G1 X26.316 Y-0.781 Z7.100
+G1 X26.316 Y3.419 Z7.100
+G1 X29.434 Y5.219 Z7.100
+G1 X29.434 Y9.419 Z7.100
+G1 X26.316 Y11.219 Z7.100
+G1 X26.316 Y15.419 Z7.100
+G1 X27.433 Y16.064 Z7.100
+G1 X31.781 Y16.064 Z7.100
+G1 X32.898 Y15.419 Z7.100
+G1 X32.898 Y11.219 Z7.100
+G1 X29.780 Y9.419 Z7.100
+G1 X29.780 Y5.219 Z7.100
+G1 X32.898 Y3.419 Z7.100
+G1 X32.898 Y-0.781 Z7.100
+G1 X29.780 Y-2.581 Z7.100
+G1 X29.780 Y-6.781 Z7.100
+G1 X32.898 Y-8.581 Z7.100
+G1 X32.898 Y-12.781 Z7.100
+G1 X29.780 Y-14.581 Z7.100
+G1 X29.780 Y-16.064 Z7.100
+G1 X36.064 Y-14.409 Z7.100
+G1 X33.244 Y-12.781 Z7.100
+G1 X33.244 Y-8.581 Z7.100
+G1 X36.064 Y-6.953 Z7.100
+G1 X36.064 Y-2.409 Z7.100
+G1 X33.244 Y-0.781 Z7.100
+G1 X33.244 Y3.419 Z7.100
+G1 X36.064 Y5.047 Z7.100
+G1 X36.064 Y9.591 Z7.100
+G1 X33.244 Y11.219 Z7.100
+G1 X33.244 Y15.419 Z7.100
+G1 X34.361 Y16.064 Z7.100
+T1
+G1 X12.090 Y-15.510 Z8.100
+G1 X35.510 Y-15.510 Z8.100
+G1 X35.510 Y8.290 Z8.100
+G1 X35.510 Y15.510 Z8.100
+G1 X-12.090 Y15.510 Z8.100
+G1 X-35.510 Y15.510 Z8.100
+G1 X-35.510 Y-8.290 Z8.100
+G1 X-35.510 Y-15.510 Z8.100
+G1 X12.090 Y-15.510 Z8.100
+G1 X12.090 Y-15.510 Z8.100
+G1 X-32.920 Y-15.510 Z8.100
+G1 X-32.920 Y-14.581 Z8.100
+G1 X-35.510 Y-13.086 Z8.100
+G1 X-35.510 Y-8.276 Z8.100
+G1 X-32.920 Y-6.781 Z8.100
+G1 X-32.920 Y-2.581 Z8.100
+G1 X-35.510 Y-1.086 Z8.100
+G1 X-35.510 Y3.724 Z8.100
+G1 X-32.920 Y5.219 Z8.100
+G1 X-32.920 Y9.419 Z8.100
+G1 X-35.510 Y10.914 Z8.100
+G1 X-29.614 Y15.510 Z8.100
+G1 X-29.456 Y15.419 Z8.100
+G1 X-29.456 Y11.219 Z8.100
+G1 X-32.574 Y9.419 Z8.100
+G1 X-32.574 Y5.219 Z8.100
+G1 X-29.456 Y3.419 Z8.100
+G1 X-29.456 Y-0.781 Z8.100
+G1 X-32.574 Y-2.581 Z8.100
+G1 X-32.574 Y-6.781 Z8.100
+G1 X-29.456 Y-8.581 Z8.100
+G1 X-29.456 Y-12.781 Z8.100
+G1 X-32.574 Y-14.581 Z8.100
+G1 X-32.574 Y-15.510 Z8.100
+G1 X-25.992 Y-15.510 Z8.100
+G1 X-25.992 Y-14.581 Z8.100
+G1 X-29.110 Y-12.781 Z8.100
+G1 X-29.110 Y-8.581 Z8.100
+G1 X-25.992 Y-6.781 Z8.100
+G1 X-25.992 Y-2.581 Z8.100
+G1 X-29.110 Y-0.781 Z8.100
+G1 X-29.110 Y3.419 Z8.100
+G1 X-25.992 Y5.219 Z8.100
+G1 X-25.992 Y9.419 Z8.100
+G1 X-29.110 Y11.219 Z8.100
+G1 X-29.110 Y15.419 Z8.100
+G1 X-28.952 Y15.510 Z8.100
+G1 X-22.686 Y15.510 Z8.100
+G1 X-22.528 Y15.419 Z8.100
+G1 X-22.528 Y11.219 Z8.100
+G1 X-25.646 Y9.419 Z8.100
+G1 X-25.646 Y5.219 Z8.100
+G1 X-22.528 Y3.419 Z8.100
+G1 X-22.528 Y-0.781 Z8.100
+G1 X-25.646 Y-2.581 Z8.100
+G1 X-25.646 Y-6.781 Z8.100
+G1 X-22.528 Y-8.581 Z8.100
+G1 X-22.528 Y-12.781 Z8.100
+G1 X-25.646 Y-14.581 Z8.100
+G1 X-25.646 Y-15.510 Z8.100
+G1 X-19.063 Y-15.510 Z8.100
+G1 X-19.063 Y-14.581 Z8.100
+G1 X-22.181 Y-12.781 Z8.100
+G1 X-22.181 Y-8.581 Z8.100
+G1 X-19.063 Y-6.781 Z8.100
+G1 X-19.063 Y-2.581 Z8.100
+G1 X-22.181 Y-0.781 Z8.100
+G1 X-22.181 Y3.419 Z8.100
+G1 X-19.063 Y5.219 Z8.100
+G1 X-19.063 Y9.419 Z8.100
+G1 X-22.181 Y11.219 Z8.100
+G1 X-22.181 Y15.419 Z8.100
+G1 X-22.023 Y15.510 Z8.100
+G1 X-15.757 Y15.510 Z8.100
+G1 X-15.599 Y15.419 Z8.100
+G1 X-15.599 Y11.219 Z8.100
+G1 X-18.717 Y9.419 Z8.100
+G1 X-18.717 Y5.219 Z8.100
+G1 X-15.599 Y3.419 Z8.100
+G1 X-15.599 Y-0.781 Z8.100
+G1 X-18.717 Y-2.581 Z8.100
+G1 X-18.717 Y-6.781 Z8.100
+G1 X-15.599 Y-8.581 Z8.100
+G1 X-15.599 Y-12.781 Z8.100
+G1 X-18.717 Y-14.581 Z8.100
+G1 X-18.717 Y-15.510 Z8.100
+G1 X-12.136 Y-15.510 Z8.100
+G1 X-12.136 Y-14.581 Z8.100
+G1 X-15.254 Y-12.781 Z8.100
+G1 X-15.254 Y-8.581 Z8.100
+G1 X-12.136 Y-6.781 Z8.100
+G1 X-12.136 Y-2.581 Z8.100
+G1 X-15.254 Y-0.781 Z8.100
+G1 X-15.254 Y3.419 Z8.100
+G1 X-12.136 Y5.219 Z8.100
+G1 X-12.136 Y9.419 Z8.100
+G1 X-15.254 Y11.219 Z8.100
+G1 X-15.254 Y15.419 Z8.100
+G1 X-15.096 Y15.510 Z8.100
+G1 X-8.829 Y15.510 Z8.100
+G1 X-8.671 Y15.419 Z8.100
+G1 X-8.671 Y11.219 Z8.100
+G1 X-11.789 Y9.419 Z8.100
+G1 X-11.789 Y5.219 Z8.100
+G1 X-8.671 Y3.419 Z8.100
+G1 X-8.671 Y-0.781 Z8.100
+G1 X-11.789 Y-2.581 Z8.100
+G1 X-11.789 Y-6.781 Z8.100
+G1 X-8.671 Y-8.581 Z8.100
+G1 X-8.671 Y-12.781 Z8.100
+G1 X-11.789 Y-14.581 Z8.100
+G1 X-11.789 Y-15.510 Z8.100
+G1 X-5.207 Y-15.510 Z8.100
+G1 X-5.207 Y-14.581 Z8.100
+G1 X-8.325 Y-12.781 Z8.100
+G1 X-8.325 Y-8.581 Z8.100
+G1 X-5.207 Y-6.781 Z8.100
+G1 X-5.207 Y-2.581 Z8.100
+G1 X-8.325 Y-0.781 Z8.100
+G1 X-8.325 Y3.419 Z8.100
+G1 X-5.207 Y5.219 Z8.100
+G1 X-5.207 Y9.419 Z8.100
+G1 X-8.325 Y11.219 Z8.100
+G1 X-8.325 Y15.419 Z8.100
+G1 X-8.167 Y15.510 Z8.100
+G1 X-1.901 Y15.510 Z8.100
+G1 X-1.743 Y15.419 Z8.100
+G1 X-1.743 Y11.219 Z8.100
+G1 X-4.861 Y9.419 Z8.100
+G1 X-4.861 Y5.219 Z8.100
+G1 X-1.743 Y3.419 Z8.100
+G1 X-1.743 Y-0.781 Z8.100
+G1 X-4.861 Y-2.581 Z8.100
+G1 X-4.861 Y-6.781 Z8.100
+G1 X-1.743 Y-8.581 Z8.100
+G1 X-1.743 Y-12.781 Z8.100
+G1 X-4.861 Y-14.581 Z8.100
+G1 X-4.861 Y-15.510 Z8.100
+G1 X1.721 Y-15.510 Z8.100
+G1 X1.721 Y-14.581 Z8.100
+G1 X-1.397 Y-12.781 Z8.100
+G1 X-1.397 Y-8.581 Z8.100
+G1 X1.721 Y-6.781 Z8.100
+G1 X1.721 Y-2.581 Z8.100
+G1 X-1.397 Y-0.781 Z8.100
+G1 X-1.397 Y3.419 Z8.100
+G1 X1.721 Y5.219 Z8.100
+G1 X1.721 Y9.419 Z8.100
+G1 X-1.397 Y11.219 Z8.100
+G1 X-1.397 Y15.419 Z8.100
+G1 X-1.239 Y15.510 Z8.100
+G1 X5.027 Y15.510 Z8.100
+G1 X5.185 Y15.419 Z8.100
+G1 X5.185 Y11.219 Z8.100
+G1 X2.067 Y9.419 Z8.100
+G1 X2.067 Y5.219 Z8.100
+G1 X5.185 Y3.419 Z8.100
+G1 X5.185 Y-0.781 Z8.100
+G1 X2.067 Y-2.581 Z8.100
+G1 X2.067 Y-6.781 Z8.100
+G1 X5.185 Y-8.581 Z8.100
+G1 X5.185 Y-12.781 Z8.100
+G1 X2.067 Y-14.581 Z8.100
+G1 X2.067 Y-15.510 Z8.100
+G1 X8.649 Y-15.510 Z8.100
+G1 X8.649 Y-14.581 Z8.100
+G1 X5.531 Y-12.781 Z8.100
+G1 X5.531 Y-8.581 Z8.100
+G1 X8.649 Y-6.781 Z8.100
+G1 X8.649 Y-2.581 Z8.100
+G1 X5.531 Y-0.781 Z8.100
+G1 X5.531 Y3.419 Z8.100
+G1 X8.649 Y5.219 Z8.100
+G1 X8.649 Y9.419 Z8.100
+G1 X5.531 Y11.219 Z8.100
+G1 X5.531 Y15.419 Z8.100
+G1 X5.689 Y15.510 Z8.100
+G1 X11.955 Y15.510 Z8.100
+G1 X12.113 Y15.419 Z8.100
+G1 X12.113 Y11.219 Z8.100
+G1 X8.995 Y9.419 Z8.100
+G1 X8.995 Y5.219 Z8.100
+G1 X12.113 Y3.419 Z8.100
+G1 X12.113 Y-0.781 Z8.100
+G1 X8.995 Y-2.581 Z8.100
+G1 X8.995 Y-6.781 Z8.100
+G1 X12.113 Y-8.581 Z8.100
+G1 X12.113 Y-12.781 Z8.100
+G1 X8.995 Y-14.581 Z8.100
+G1 X8.995 Y-15.510 Z8.100
+G1 X15.578 Y-15.510 Z8.100
+G1 X15.578 Y-14.581 Z8.100
+G1 X12.460 Y-12.781 Z8.100
+G1 X12.460 Y-8.581 Z8.100
+G1 X15.578 Y-6.781 Z8.100
+G1 X15.578 Y-2.581 Z8.100
+G1 X12.460 Y-0.781 Z8.100
+G1 X12.460 Y3.419 Z8.100
+G1 X15.578 Y5.219 Z8.100
+G1 X15.578 Y9.419 Z8.100
+G1 X12.460 Y11.219 Z8.100
+G1 X12.460 Y15.419 Z8.100
+G1 X12.618 Y15.510 Z8.100
+G1 X18.884 Y15.510 Z8.100
+G1 X19.042 Y15.419 Z8.100
+G1 X19.042 Y11.219 Z8.100
+G1 X15.924 Y9.419 Z8.100
+G1 X15.924 Y5.219 Z8.100
+G1 X19.042 Y3.419 Z8.100
+G1 X19.042 Y-0.781 Z8.100
+G1 X15.924 Y-2.581 Z8.100
+G1 X15.924 Y-6.781 Z8.100
+G1 X19.042 Y-8.581 Z8.100
+G1 X19.042 Y-12.781 Z8.100
+G1 X15.924 Y-14.581 Z8.100
+G1 X15.924 Y-15.510 Z8.100
+G1 X22.505 Y-15.510 Z8.100
+G1 X22.505 Y-14.581 Z8.100
+G1 X19.387 Y-12.781 Z8.100
+G1 X19.387 Y-8.581 Z8.100
+G1 X22.505 Y-6.781 Z8.100
+G1 X22.505 Y-2.581 Z8.100
+G1 X19.387 Y-0.781 Z8.100
+G1 X19.387 Y3.419 Z8.100
+G1 X22.505 Y5.219 Z8.100
+G1 X22.505 Y9.419 Z8.100
+G1 X19.387 Y11.219 Z8.100
+G1 X19.387 Y15.419 Z8.100
+G1 X19.545 Y15.510 Z8.100
+G1 X25.812 Y15.510 Z8.100
+G1 X25.970 Y15.419 Z8.100
+G1 X25.970 Y11.219 Z8.100
+G1 X22.852 Y9.419 Z8.100
+G1 X22.852 Y5.219 Z8.100
+G1 X25.970 Y3.419 Z8.100
+G1 X25.970 Y-0.781 Z8.100
+G1 X22.852 Y-2.581 Z8.100
+G1 X22.852 Y-6.781 Z8.100
+G1 X25.970 Y-8.581 Z8.100
+G1 X25.970 Y-12.781 Z8.100
+G1 X22.852 Y-14.581 Z8.100
+G1 X22.852 Y-15.510 Z8.100
+G1 X29.434 Y-15.510 Z8.100
+G1 X29.434 Y-14.581 Z8.100
+G1 X26.316 Y-12.781 Z8.100
+G1 X26.316 Y-8.581 Z8.100
+G1 X29.434 Y-6.781 Z8.100
+G1 X29.434 Y-2.581 Z8.100
+G1 X26.316 Y-0.781 Z8.100
+G1 X26.316 Y3.419 Z8.100
+G1 X29.434 Y5.219 Z8.100
+G1 X29.434 Y9.419 Z8.100
+G1 X26.316 Y11.219 Z8.100
+G1 X26.316 Y15.419 Z8.100
+G1 X26.474 Y15.510 Z8.100
+G1 X32.740 Y15.510 Z8.100
+G1 X32.898 Y15.419 Z8.100
+G1 X32.898 Y11.219 Z8.100
+G1 X29.780 Y9.419 Z8.100
+G1 X29.780 Y5.219 Z8.100
+G1 X32.898 Y3.419 Z8.100
+G1 X32.898 Y-0.781 Z8.100
+G1 X29.780 Y-2.581 Z8.100
+G1 X29.780 Y-6.781 Z8.100
+G1 X32.898 Y-8.581 Z8.100
+G1 X32.898 Y-12.781 Z8.100
+G1 X29.780 Y-14.581 Z8.100
+G1 X29.780 Y-15.510 Z8.100
+G1 X35.510 Y-14.089 Z8.100
+G1 X33.244 Y-12.781 Z8.100
+G1 X33.244 Y-8.581 Z8.100
+G1 X35.510 Y-7.273 Z8.100
+G1 X35.510 Y-2.089 Z8.100
+G1 X33.244 Y-0.781 Z8.100
+G1 X33.244 Y3.419 Z8.100
+G1 X35.510 Y4.727 Z8.100
+G1 X35.510 Y9.911 Z8.100
+G1 X33.244 Y11.219 Z8.100
+G1 X33.244 Y15.419 Z8.100
+G1 X33.402 Y15.510 Z8.100
+T1
+G1 X8.644 Y-14.956 Z9.100
+G1 X34.956 Y-14.956 Z9.100
+G1 X34.956 Y6.844 Z9.100
+G1 X34.956 Y14.956 Z9.100
+G1 X-8.644 Y14.956 Z9.100
+G1 X-34.956 Y14.956 Z9.100
+G1 X-34.956 Y-6.844 Z9.100
+G1 X-34.956 Y-14.956 Z9.100
+G1 X8.644 Y-14.956 Z9.100
+G1 X8.644 Y-14.956 Z9.100
+G1 X-32.920 Y-14.956 Z9.100
+G1 X-32.920 Y-14.581 Z9.100
+G1 X-34.956 Y-13.406 Z9.100
+G1 X-34.956 Y-7.956 Z9.100
+G1 X-32.920 Y-6.781 Z9.100
+G1 X-32.920 Y-2.581 Z9.100
+G1 X-34.956 Y-1.406 Z9.100
+G1 X-34.956 Y4.044 Z9.100
+G1 X-32.920 Y5.219 Z9.100
+G1 X-32.920 Y9.419 Z9.100
+G1 X-34.956 Y10.594 Z9.100
+G1 X-29.456 Y14.956 Z9.100
+G1 X-29.456 Y11.219 Z9.100
+G1 X-32.574 Y9.419 Z9.100
+G1 X-32.574 Y5.219 Z9.100
+G1 X-29.456 Y3.419 Z9.100
+G1 X-29.456 Y-0.781 Z9.100
+G1 X-32.574 Y-2.581 Z9.100
+G1 X-32.574 Y-6.781 Z9.100
+G1 X-29.456 Y-8.581 Z9.100
+G1 X-29.456 Y-12.781 Z9.100
+G1 X-32.574 Y-14.581 Z9.100
+G1 X-32.574 Y-14.956 Z9.100
+G1 X-25.992 Y-14.956 Z9.100
+G1 X-25.992 Y-14.581 Z9.100
+G1 X-29.110 Y-12.781 Z9.100
+G1 X-29.110 Y-8.581 Z9.100
+G1 X-25.992 Y-6.781 Z9.100
+G1 X-25.992 Y-2.581 Z9.100
+G1 X-29.110 Y-0.781 Z9.100
+G1 X-29.110 Y3.419 Z9.100
+G1 X-25.992 Y5.219 Z9.100
+G1 X-25.992 Y9.419 Z9.100
+G1 X-29.110 Y11.219 Z9.100
+G1 X-29.110 Y14.956 Z9.100
+G1 X-22.528 Y14.956 Z9.100
+G1 X-22.528 Y11.219 Z9.100
+G1 X-25.646 Y9.419 Z9.100
+G1 X-25.646 Y5.219 Z9.100
+G1 X-22.528 Y3.419 Z9.100
+G1 X-22.528 Y-0.781 Z9.100
+G1 X-25.646 Y-2.581 Z9.100
+G1 X-25.646 Y-6.781 Z9.100
+G1 X-22.528 Y-8.581 Z9.100
+G1 X-22.528 Y-12.781 Z9.100
+G1 X-25.646 Y-14.581 Z9.100
+G1 X-25.646 Y-14.956 Z9.100
+G1 X-19.063 Y-14.956 Z9.100
+G1 X-19.063 Y-14.581 Z9.100
+G1 X-22.181 Y-12.781 Z9.100
+G1 X-22.181 Y-8.581 Z9.100
+G1 X-19.063 Y-6.781 Z9.100
+G1 X-19.063 Y-2.581 Z9.100
+G1 X-22.181 Y-0.781 Z9.100
+G1 X-22.181 Y3.419 Z9.100
+G1 X-19.063 Y5.219 Z9.100
+G1 X-19.063 Y9.419 Z9.100
+G1 X-22.181 Y11.219 Z9.100
+G1 X-22.181 Y14.956 Z9.100
+G1 X-15.599 Y14.956 Z9.100
+G1 X-15.599 Y11.219 Z9.100
+G1 X-18.717 Y9.419 Z9.100
+G1 X-18.717 Y5.219 Z9.100
+G1 X-15.599 Y3.419 Z9.100
+G1 X-15.599 Y-0.781 Z9.100
+G1 X-18.717 Y-2.581 Z9.100
+G1 X-18.717 Y-6.781 Z9.100
+G1 X-15.599 Y-8.581 Z9.100
+G1 X-15.599 Y-12.781 Z9.100
+G1 X-18.717 Y-14.581 Z9.100
+G1 X-18.717 Y-14.956 Z9.100
+G1 X-12.136 Y-14.956 Z9.100
+G1 X-12.136 Y-14.581 Z9.100
+G1 X-15.254 Y-12.781 Z9.100
+G1 X-15.254 Y-8.581 Z9.100
+G1 X-12.136 Y-6.781 Z9.100
+G1 X-12.136 Y-2.581 Z9.100
+G1 X-15.254 Y-0.781 Z9.100
+G1 X-15.254 Y3.419 Z9.100
+G1 X-12.136 Y5.219 Z9.100
+G1 X-12.136 Y9.419 Z9.100
+G1 X-15.254 Y11.219 Z9.100
+G1 X-15.254 Y14.956 Z9.100
+G1 X-8.671 Y14.956 Z9.100
+G1 X-8.671 Y11.219 Z9.100
+G1 X-11.789 Y9.419 Z9.100
+G1 X-11.789 Y5.219 Z9.100
+G1 X-8.671 Y3.419 Z9.100
+G1 X-8.671 Y-0.781 Z9.100
+G1 X-11.789 Y-2.581 Z9.100
+G1 X-11.789 Y-6.781 Z9.100
+G1 X-8.671 Y-8.581 Z9.100
+G1 X-8.671 Y-12.781 Z9.100
+G1 X-11.789 Y-14.581 Z9.100
+G1 X-11.789 Y-14.956 Z9.100
+G1 X-5.207 Y-14.956 Z9.100
+G1 X-5.207 Y-14.581 Z9.100
+G1 X-8.325 Y-12.781 Z9.100
+G1 X-8.325 Y-8.581 Z9.100
+G1 X-5.207 Y-6.781 Z9.100
+G1 X-5.207 Y-2.581 Z9.100
+G1 X-8.325 Y-0.781 Z9.100
+G1 X-8.325 Y3.419 Z9.100
+G1 X-5.207 Y5.219 Z9.100
+G1 X-5.207 Y9.419 Z9.100
+G1 X-8.325 Y11.219 Z9.100
+G1 X-8.325 Y14.956 Z9.100
+G1 X-1.743 Y14.956 Z9.100
+G1 X-1.743 Y11.219 Z9.100
+G1 X-4.861 Y9.419 Z9.100
+G1 X-4.861 Y5.219 Z9.100
+G1 X-1.743 Y3.419 Z9.100
+G1 X-1.743 Y-0.781 Z9.100
+G1 X-4.861 Y-2.581 Z9.100
+G1 X-4.861 Y-6.781 Z9.100
+G1 X-1.743 Y-8.581 Z9.100
+G1 X-1.743 Y-12.781 Z9.100
+G1 X-4.861 Y-14.581 Z9.100
+G1 X-4.861 Y-14.956 Z9.100
+G1 X1.721 Y-14.956 Z9.100
+G1 X1.721 Y-14.581 Z9.100
+G1 X-1.397 Y-12.781 Z9.100
+G1 X-1.397 Y-8.581 Z9.100
+G1 X1.721 Y-6.781 Z9.100
+G1 X1.721 Y-2.581 Z9.100
+G1 X-1.397 Y-0.781 Z9.100
+G1 X-1.397 Y3.419 Z9.100
+G1 X1.721 Y5.219 Z9.100
+G1 X1.721 Y9.419 Z9.100
+G1 X-1.397 Y11.219 Z9.100
+G1 X-1.397 Y14.956 Z9.100
+G1 X5.185 Y14.956 Z9.100
+G1 X5.185 Y11.219 Z9.100
+G1 X2.067 Y9.419 Z9.100
+G1 X2.067 Y5.219 Z9.100
+G1 X5.185 Y3.419 Z9.100
+G1 X5.185 Y-0.781 Z9.100
+G1 X2.067 Y-2.581 Z9.100
+G1 X2.067 Y-6.781 Z9.100
+G1 X5.185 Y-8.581 Z9.100
+G1 X5.185 Y-12.781 Z9.100
+G1 X2.067 Y-14.581 Z9.100
+G1 X2.067 Y-14.956 Z9.100
+G1 X8.649 Y-14.956 Z9.100
+G1 X8.649 Y-14.581 Z9.100
+G1 X5.531 Y-12.781 Z9.100
+G1 X5.531 Y-8.581 Z9.100
+G1 X8.649 Y-6.781 Z9.100
+G1 X8.649 Y-2.581 Z9.100
+G1 X5.531 Y-0.781 Z9.100
+G1 X5.531 Y3.419 Z9.100
+G1 X8.649 Y5.219 Z9.100
+G1 X8.649 Y9.419 Z9.100
+G1 X5.531 Y11.219 Z9.100
+G1 X5.531 Y14.956 Z9.100
+G1 X12.113 Y14.956 Z9.100
+G1 X12.113 Y11.219 Z9.100
+G1 X8.995 Y9.419 Z9.100
+G1 X8.995 Y5.219 Z9.100
+G1 X12.113 Y3.419 Z9.100
+G1 X12.113 Y-0.781 Z9.100
+G1 X8.995 Y-2.581 Z9.100
+G1 X8.995 Y-6.781 Z9.100
+G1 X12.113 Y-8.581 Z9.100
+G1 X12.113 Y-12.781 Z9.100
+G1 X8.995 Y-14.581 Z9.100
+G1 X8.995 Y-14.956 Z9.100
+G1 X15.578 Y-14.956 Z9.100
+G1 X15.578 Y-14.581 Z9.100
+G1 X12.460 Y-12.781 Z9.100
+G1 X12.460 Y-8.581 Z9.100
+G1 X15.578 Y-6.781 Z9.100
+G1 X15.578 Y-2.581 Z9.100
+G1 X12.460 Y-0.781 Z9.100
+G1 X12.460 Y3.419 Z9.100
+G1 X15.578 Y5.219 Z9.100
+G1 X15.578 Y9.419 Z9.100
+G1 X12.460 Y11.219 Z9.100
+G1 X12.460 Y14.956 Z9.100
+G1 X19.042 Y14.956 Z9.100
+G1 X19.042 Y11.219 Z9.100
+G1 X15.924 Y9.419 Z9.100
+G1 X15.924 Y5.219 Z9.100
+G1 X19.042 Y3.419 Z9.100
+G1 X19.042 Y-0.781 Z9.100
+G1 X15.924 Y-2.581 Z9.100
+G1 X15.924 Y-6.781 Z9.100
+G1 X19.042 Y-8.581 Z9.100
+G1 X19.042 Y-12.781 Z9.100
+G1 X15.924 Y-14.581 Z9.100
+G1 X15.924 Y-14.956 Z9.100
+G1 X22.505 Y-14.956 Z9.100
+G1 X22.505 Y-14.581 Z9.100
+G1 X19.387 Y-12.781 Z9.100
+G1 X19.387 Y-8.581 Z9.100
+G1 X22.505 Y-6.781 Z9.100
+G1 X22.505 Y-2.581 Z9.100
+G1 X19.387 Y-0.781 Z9.100
+G1 X19.387 Y3.419 Z9.100
+G1 X22.505 Y5.219 Z9.100
+G1 X22.505 Y9.419 Z9.100
+G1 X19.387 Y11.219 Z9.100
+G1 X19.387 Y14.956 Z9.100
+G1 X25.970 Y14.956 Z9.100
+G1 X25.970 Y11.219 Z9.100
+G1 X22.852 Y9.419 Z9.100
+G1 X22.852 Y5.219 Z9.100
+G1 X25.970 Y3.419 Z9.100
+G1 X25.970 Y-0.781 Z9.100
+G1 X22.852 Y-2.581 Z9.100
+G1 X22.852 Y-6.781 Z9.100
+G1 X25.970 Y-8.581 Z9.100
+G1 X25.970 Y-12.781 Z9.100
+G1 X22.852 Y-14.581 Z9.100
+G1 X22.852 Y-14.956 Z9.100
+G1 X29.434 Y-14.956 Z9.100
+G1 X29.434 Y-14.581 Z9.100
+G1 X26.316 Y-12.781 Z9.100
+G1 X26.316 Y-8.581 Z9.100
+G1 X29.434 Y-6.781 Z9.100
+G1 X29.434 Y-2.581 Z9.100
+G1 X26.316 Y-0.781 Z9.100
+G1 X26.316 Y3.419 Z9.100
+G1 X29.434 Y5.219 Z9.100
+G1 X29.434 Y9.419 Z9.100
+G1 X26.316 Y11.219 Z9.100
+G1 X26.316 Y14.956 Z9.100
+G1 X32.898 Y14.956 Z9.100
+G1 X32.898 Y11.219 Z9.100
+G1 X29.780 Y9.419 Z9.100
+G1 X29.780 Y5.219 Z9.100
+G1 X32.898 Y3.419 Z9.100
+G1 X32.898 Y-0.781 Z9.100
+G1 X29.780 Y-2.581 Z9.100
+G1 X29.780 Y-6.781 Z9.100
+G1 X32.898 Y-8.581 Z9.100
+G1 X32.898 Y-12.781 Z9.100
+G1 X29.780 Y-14.581 Z9.100
+G1 X29.780 Y-14.956 Z9.100
+G1 X34.956 Y-13.769 Z9.100
+G1 X33.244 Y-12.781 Z9.100
+G1 X33.244 Y-8.581 Z9.100
+G1 X34.956 Y-7.593 Z9.100
+G1 X34.956 Y-1.769 Z9.100
+G1 X33.244 Y-0.781 Z9.100
+G1 X33.244 Y3.419 Z9.100
+G1 X34.956 Y4.407 Z9.100
+G1 X34.956 Y10.231 Z9.100
+G1 X33.244 Y11.219 Z9.100
+G1 X33.244 Y14.956 Z9.100
+T1
+G1 X5.199 Y-14.401 Z10.100
+G1 X34.401 Y-14.401 Z10.100
+G1 X34.401 Y5.399 Z10.100
+G1 X34.401 Y14.401 Z10.100
+G1 X-5.199 Y14.401 Z10.100
+G1 X-34.401 Y14.401 Z10.100
+G1 X-34.401 Y-5.399 Z10.100
+G1 X-34.401 Y-14.401 Z10.100
+G1 X5.199 Y-14.401 Z10.100
+G1 X5.199 Y-14.401 Z10.100
+G1 X-33.232 Y-14.401 Z10.100
+G1 X-34.401 Y-13.726 Z10.100
+G1 X-34.401 Y-7.636 Z10.100
+G1 X-32.920 Y-6.781 Z10.100
+G1 X-32.920 Y-2.581 Z10.100
+G1 X-34.401 Y-1.726 Z10.100
+G1 X-34.401 Y4.364 Z10.100
+G1 X-32.920 Y5.219 Z10.100
+G1 X-32.920 Y9.419 Z10.100
+G1 X-34.401 Y10.274 Z10.100
+G1 X-29.456 Y14.401 Z10.100
+G1 X-29.456 Y11.219 Z10.100
+G1 X-32.574 Y9.419 Z10.100
+G1 X-32.574 Y5.219 Z10.100
+G1 X-29.456 Y3.419 Z10.100
+G1 X-29.456 Y-0.781 Z10.100
+G1 X-32.574 Y-2.581 Z10.100
+G1 X-32.574 Y-6.781 Z10.100
+G1 X-29.456 Y-8.581 Z10.100
+G1 X-29.456 Y-12.781 Z10.100
+G1 X-32.262 Y-14.401 Z10.100
+G1 X-26.304 Y-14.401 Z10.100
+G1 X-29.110 Y-12.781 Z10.100
+G1 X-29.110 Y-8.581 Z10.100
+G1 X-25.992 Y-6.781 Z10.100
+G1 X-25.992 Y-2.581 Z10.100
+G1 X-29.110 Y-0.781 Z10.100
+G1 X-29.110 Y3.419 Z10.100
+G1 X-25.992 Y5.219 Z10.100
+G1 X-25.992 Y9.419 Z10.100
+G1 X-29.110 Y11.219 Z10.100
+G1 X-29.110 Y14.401 Z10.100
+G1 X-22.528 Y14.401 Z10.100
+G1 X-22.528 Y11.219 Z10.100
+G1 X-25.646 Y9.419 Z10.100
+G1 X-25.646 Y5.219 Z10.100
+G1 X-22.528 Y3.419 Z10.100
+G1 X-22.528 Y-0.781 Z10.100
+G1 X-25.646 Y-2.581 Z10.100
+G1 X-25.646 Y-6.781 Z10.100
+G1 X-22.528 Y-8.581 Z10.100
+G1 X-22.528 Y-12.781 Z10.100
+G1 X-25.334 Y-14.401 Z10.100
+G1 X-19.375 Y-14.401 Z10.100
+G1 X-22.181 Y-12.781 Z10.100
+G1 X-22.181 Y-8.581 Z10.100
+G1 X-19.063 Y-6.781 Z10.100
+G1 X-19.063 Y-2.581 Z10.100
+G1 X-22.181 Y-0.781 Z10.100
+G1 X-22.181 Y3.419 Z10.100
+G1 X-19.063 Y5.219 Z10.100
+G1 X-19.063 Y9.419 Z10.100
+G1 X-22.181 Y11.219 Z10.100
+G1 X-22.181 Y14.401 Z10.100
+G1 X-15.599 Y14.401 Z10.100
+G1 X-15.599 Y11.219 Z10.100
+G1 X-18.717 Y9.419 Z10.100
+G1 X-18.717 Y5.219 Z10.100
+G1 X-15.599 Y3.419 Z10.100
+G1 X-15.599 Y-0.781 Z10.100
+G1 X-18.717 Y-2.581 Z10.100
+G1 X-18.717 Y-6.781 Z10.100
+G1 X-15.599 Y-8.581 Z10.100
+G1 X-15.599 Y-12.781 Z10.100
+G1 X-18.405 Y-14.401 Z10.100
+G1 X-12.448 Y-14.401 Z10.100
+G1 X-15.254 Y-12.781 Z10.100
+G1 X-15.254 Y-8.581 Z10.100
+G1 X-12.136 Y-6.781 Z10.100
+G1 X-12.136 Y-2.581 Z10.100
+G1 X-15.254 Y-0.781 Z10.100
+G1 X-15.254 Y3.419 Z10.100
+G1 X-12.136 Y5.219 Z10.100
+G1 X-12.136 Y9.419 Z10.100
+G1 X-15.254 Y11.219 Z10.100
+G1 X-15.254 Y14.401 Z10.100
+G1 X-8.671 Y14.401 Z10.100
+G1 X-8.671 Y11.219 Z10.100
+G1 X-11.789 Y9.419 Z10.100
+G1 X-11.789 Y5.219 Z10.100
+G1 X-8.671 Y3.419 Z10.100
+G1 X-8.671 Y-0.781 Z10.100
+G1 X-11.789 Y-2.581 Z10.100
+G1 X-11.789 Y-6.781 Z10.100
+G1 X-8.671 Y-8.581 Z10.100
+G1 X-8.671 Y-12.781 Z10.100
+G1 X-11.477 Y-14.401 Z10.100
+G1 X-5.519 Y-14.401 Z10.100
+G1 X-8.325 Y-12.781 Z10.100
+G1 X-8.325 Y-8.581 Z10.100
+G1 X-5.207 Y-6.781 Z10.100
+G1 X-5.207 Y-2.581 Z10.100
+G1 X-8.325 Y-0.781 Z10.100
+G1 X-8.325 Y3.419 Z10.100
+G1 X-5.207 Y5.219 Z10.100
+G1 X-5.207 Y9.419 Z10.100
+G1 X-8.325 Y11.219 Z10.100
+G1 X-8.325 Y14.401 Z10.100
+G1 X-1.743 Y14.401 Z10.100
+G1 X-1.743 Y11.219 Z10.100
+G1 X-4.861 Y9.419 Z10.100
+G1 X-4.861 Y5.219 Z10.100
+G1 X-1.743 Y3.419 Z10.100
+G1 X-1.743 Y-0.781 Z10.100
+G1 X-4.861 Y-2.581 Z10.100
+G1 X-4.861 Y-6.781 Z10.100
+G1 X-1.743 Y-8.581 Z10.100
+G1 X-1.743 Y-12.781 Z10.100
+G1 X-4.549 Y-14.401 Z10.100
+G1 X1.409 Y-14.401 Z10.100
+G1 X-1.397 Y-12.781 Z10.100
+G1 X-1.397 Y-8.581 Z10.100
+G1 X1.721 Y-6.781 Z10.100
+G1 X1.721 Y-2.581 Z10.100
+G1 X-1.397 Y-0.781 Z10.100
+G1 X-1.397 Y3.419 Z10.100
+G1 X1.721 Y5.219 Z10.100
+G1 X1.721 Y9.419 Z10.100
+G1 X-1.397 Y11.219 Z10.100
+G1 X-1.397 Y14.401 Z10.100
+G1 X5.185 Y14.401 Z10.100
+G1 X5.185 Y11.219 Z10.100
+G1 X2.067 Y9.419 Z10.100
+G1 X2.067 Y5.219 Z10.100
+G1 X5.185 Y3.419 Z10.100
+G1 X5.185 Y-0.781 Z10.100
+G1 X2.067 Y-2.581 Z10.100
+G1 X2.067 Y-6.781 Z10.100
+G1 X5.185 Y-8.581 Z10.100
+G1 X5.185 Y-12.781 Z10.100
+G1 X2.379 Y-14.401 Z10.100
+G1 X8.337 Y-14.401 Z10.100
+G1 X5.531 Y-12.781 Z10.100
+G1 X5.531 Y-8.581 Z10.100
+G1 X8.649 Y-6.781 Z10.100
+G1 X8.649 Y-2.581 Z10.100
+G1 X5.531 Y-0.781 Z10.100
+G1 X5.531 Y3.419 Z10.100
+G1 X8.649 Y5.219 Z10.100
+G1 X8.649 Y9.419 Z10.100
+G1 X5.531 Y11.219 Z10.100
+G1 X5.531 Y14.401 Z10.100
+G1 X12.113 Y14.401 Z10.100
+G1 X12.113 Y11.219 Z10.100
+G1 X8.995 Y9.419 Z10.100
+G1 X8.995 Y5.219 Z10.100
+G1 X12.113 Y3.419 Z10.100
+G1 X12.113 Y-0.781 Z10.100
+G1 X8.995 Y-2.581 Z10.100
+G1 X8.995 Y-6.781 Z10.100
+G1 X12.113 Y-8.581 Z10.100
+G1 X12.113 Y-12.781 Z10.100
+G1 X9.307 Y-14.401 Z10.100
+G1 X15.266 Y-14.401 Z10.100
+G1 X12.460 Y-12.781 Z10.100
+G1 X12.460 Y-8.581 Z10.100
+G1 X15.578 Y-6.781 Z10.100
+G1 X15.578 Y-2.581 Z10.100
+G1 X12.460 Y-0.781 Z10.100
+G1 X12.460 Y3.419 Z10.100
+G1 X15.578 Y5.219 Z10.100
+G1 X15.578 Y9.419 Z10.100
+G1 X12.460 Y11.219 Z10.100
+G1 X12.460 Y14.401 Z10.100
+G1 X19.042 Y14.401 Z10.100
+G1 X19.042 Y11.219 Z10.100
+G1 X15.924 Y9.419 Z10.100
+G1 X15.924 Y5.219 Z10.100
+G1 X19.042 Y3.419 Z10.100
+G1 X19.042 Y-0.781 Z10.100
+G1 X15.924 Y-2.581 Z10.100
+G1 X15.924 Y-6.781 Z10.100
+G1 X19.042 Y-8.581 Z10.100
+G1 X19.042 Y-12.781 Z10.100
+G1 X16.236 Y-14.401 Z10.100
+G1 X22.193 Y-14.401 Z10.100
+G1 X19.387 Y-12.781 Z10.100
+G1 X19.387 Y-8.581 Z10.100
+G1 X22.505 Y-6.781 Z10.100
+G1 X22.505 Y-2.581 Z10.100
+G1 X19.387 Y-0.781 Z10.100
+G1 X19.387 Y3.419 Z10.100
+G1 X22.505 Y5.219 Z10.100
+G1 X22.505 Y9.419 Z10.100
+G1 X19.387 Y11.219 Z10.100
+G1 X19.387 Y14.401 Z10.100
+G1 X25.970 Y14.401 Z10.100
+G1 X25.970 Y11.219 Z10.100
+G1 X22.852 Y9.419 Z10.100
+G1 X22.852 Y5.219 Z10.100
+G1 X25.970 Y3.419 Z10.100
+G1 X25.970 Y-0.781 Z10.100
+G1 X22.852 Y-2.581 Z10.100
+G1 X22.852 Y-6.781 Z10.100
+G1 X25.970 Y-8.581 Z10.100
+G1 X25.970 Y-12.781 Z10.100
+G1 X23.164 Y-14.401 Z10.100
+G1 X29.122 Y-14.401 Z10.100
+G1 X26.316 Y-12.781 Z10.100
+G1 X26.316 Y-8.581 Z10.100
+G1 X29.434 Y-6.781 Z10.100
+G1 X29.434 Y-2.581 Z10.100
+G1 X26.316 Y-0.781 Z10.100
+G1 X26.316 Y3.419 Z10.100
+G1 X29.434 Y5.219 Z10.100
+G1 X29.434 Y9.419 Z10.100
+G1 X26.316 Y11.219 Z10.100
+G1 X26.316 Y14.401 Z10.100
+G1 X32.898 Y14.401 Z10.100
+G1 X32.898 Y11.219 Z10.100
+G1 X29.780 Y9.419 Z10.100
+G1 X29.780 Y5.219 Z10.100
+G1 X32.898 Y3.419 Z10.100
+G1 X32.898 Y-0.781 Z10.100
+G1 X29.780 Y-2.581 Z10.100
+G1 X29.780 Y-6.781 Z10.100
+G1 X32.898 Y-8.581 Z10.100
+G1 X32.898 Y-12.781 Z10.100
+G1 X30.092 Y-14.401 Z10.100
+G1 X34.401 Y-13.449 Z10.100
+G1 X33.244 Y-12.781 Z10.100
+G1 X33.244 Y-8.581 Z10.100
+G1 X34.401 Y-7.913 Z10.100
+G1 X34.401 Y-1.449 Z10.100
+G1 X33.244 Y-0.781 Z10.100
+G1 X33.244 Y3.419 Z10.100
+G1 X34.401 Y4.087 Z10.100
+G1 X34.401 Y10.551 Z10.100
+G1 X33.244 Y11.219 Z10.100
+G1 X33.244 Y14.401 Z10.100
+T1
+G1 X1.753 Y-13.847 Z11.100
+G1 X33.847 Y-13.847 Z11.100
+G1 X33.847 Y3.953 Z11.100
+G1 X33.847 Y13.847 Z11.100
+G1 X-1.753 Y13.847 Z11.100
+G1 X-33.847 Y13.847 Z11.100
+G1 X-33.847 Y-3.953 Z11.100
+G1 X-33.847 Y-13.847 Z11.100
+G1 X1.753 Y-13.847 Z11.100
+G1 X1.753 Y-13.847 Z11.100
+G1 X-33.847 Y-7.316 Z11.100
+G1 X-32.920 Y-6.781 Z11.100
+G1 X-32.920 Y-2.581 Z11.100
+G1 X-33.847 Y-2.046 Z11.100
+G1 X-33.847 Y4.684 Z11.100
+G1 X-32.920 Y5.219 Z11.100
+G1 X-32.920 Y9.419 Z11.100
+G1 X-33.847 Y9.954 Z11.100
+G1 X-29.456 Y13.847 Z11.100
+G1 X-29.456 Y11.219 Z11.100
+G1 X-32.574 Y9.419 Z11.100
+G1 X-32.574 Y5.219 Z11.100
+G1 X-29.456 Y3.419 Z11.100
+G1 X-29.456 Y-0.781 Z11.100
+G1 X-32.574 Y-2.581 Z11.100
+G1 X-32.574 Y-6.781 Z11.100
+G1 X-29.456 Y-8.581 Z11.100
+G1 X-29.456 Y-12.781 Z11.100
+G1 X-31.303 Y-13.847 Z11.100
+G1 X-27.263 Y-13.847 Z11.100
+G1 X-29.110 Y-12.781 Z11.100
+G1 X-29.110 Y-8.581 Z11.100
+G1 X-25.992 Y-6.781 Z11.100
+G1 X-25.992 Y-2.581 Z11.100
+G1 X-29.110 Y-0.781 Z11.100
+G1 X-29.110 Y3.419 Z11.100
+G1 X-25.992 Y5.219 Z11.100
+G1 X-25.992 Y9.419 Z11.100
+G1 X-29.110 Y11.219 Z11.100
+G1 X-29.110 Y13.847 Z11.100
+G1 X-22.528 Y13.847 Z11.100
+G1 X-22.528 Y11.219 Z11.100
+G1 X-25.646 Y9.419 Z11.100
+G1 X-25.646 Y5.219 Z11.100
+G1 X-22.528 Y3.419 Z11.100
+G1 X-22.528 Y-0.781 Z11.100
+G1 X-25.646 Y-2.581 Z11.100
+G1 X-25.646 Y-6.781 Z11.100
+G1 X-22.528 Y-8.581 Z11.100
+G1 X-22.528 Y-12.781 Z11.100
+G1 X-24.375 Y-13.847 Z11.100
+G1 X-20.334 Y-13.847 Z11.100
+G1 X-22.181 Y-12.781 Z11.100
+G1 X-22.181 Y-8.581 Z11.100
+G1 X-19.063 Y-6.781 Z11.100
+G1 X-19.063 Y-2.581 Z11.100
+G1 X-22.181 Y-0.781 Z11.100
+G1 X-22.181 Y3.419 Z11.100
+G1 X-19.063 Y5.219 Z11.100
+G1 X-19.063 Y9.419 Z11.100
+G1 X-22.181 Y11.219 Z11.100
+G1 X-22.181 Y13.847 Z11.100
+G1 X-15.599 Y13.847 Z11.100
+G1 X-15.599 Y11.219 Z11.100
+G1 X-18.717 Y9.419 Z11.100
+G1 X-18.717 Y5.219 Z11.100
+G1 X-15.599 Y3.419 Z11.100
+G1 X-15.599 Y-0.781 Z11.100
+G1 X-18.717 Y-2.581 Z11.100
+G1 X-18.717 Y-6.781 Z11.100
+G1 X-15.599 Y-8.581 Z11.100
+G1 X-15.599 Y-12.781 Z11.100
+G1 X-17.446 Y-13.847 Z11.100
+G1 X-13.407 Y-13.847 Z11.100
+G1 X-15.254 Y-12.781 Z11.100
+G1 X-15.254 Y-8.581 Z11.100
+G1 X-12.136 Y-6.781 Z11.100
+G1 X-12.136 Y-2.581 Z11.100
+G1 X-15.254 Y-0.781 Z11.100
+G1 X-15.254 Y3.419 Z11.100
+G1 X-12.136 Y5.219 Z11.100
+G1 X-12.136 Y9.419 Z11.100
+G1 X-15.254 Y11.219 Z11.100
+G1 X-15.254 Y13.847 Z11.100
+G1 X-8.671 Y13.847 Z11.100
+G1 X-8.671 Y11.219 Z11.100
+G1 X-11.789 Y9.419 Z11.100
+G1 X-11.789 Y5.219 Z11.100
+G1 X-8.671 Y3.419 Z11.100
+G1 X-8.671 Y-0.781 Z11.100
+G1 X-11.789 Y-2.581 Z11.100
+G1 X-11.789 Y-6.781 Z11.100
+G1 X-8.671 Y-8.581 Z11.100
+G1 X-8.671 Y-12.781 Z11.100
+G1 X-10.518 Y-13.847 Z11.100
+G1 X-6.478 Y-13.847 Z11.100
+G1 X-8.325 Y-12.781 Z11.100
+G1 X-8.325 Y-8.581 Z11.100
+G1 X-5.207 Y-6.781 Z11.100
+G1 X-5.207 Y-2.581 Z11.100
+G1 X-8.325 Y-0.781 Z11.100
+G1 X-8.325 Y3.419 Z11.100
+G1 X-5.207 Y5.219 Z11.100
+G1 X-5.207 Y9.419 Z11.100
+G1 X-8.325 Y11.219 Z11.100
+G1 X-8.325 Y13.847 Z11.100
+G1 X-1.743 Y13.847 Z11.100
+G1 X-1.743 Y11.219 Z11.100
+G1 X-4.861 Y9.419 Z11.100
+G1 X-4.861 Y5.219 Z11.100
+G1 X-1.743 Y3.419 Z11.100
+G1 X-1.743 Y-0.781 Z11.100
+G1 X-4.861 Y-2.581 Z11.100
+G1 X-4.861 Y-6.781 Z11.100
+G1 X-1.743 Y-8.581 Z11.100
+G1 X-1.743 Y-12.781 Z11.100
+G1 X-3.590 Y-13.847 Z11.100
+G1 X0.450 Y-13.847 Z11.100
+G1 X-1.397 Y-12.781 Z11.100
+G1 X-1.397 Y-8.581 Z11.100
+G1 X1.721 Y-6.781 Z11.100
+G1 X1.721 Y-2.581 Z11.100
+G1 X-1.397 Y-0.781 Z11.100
+G1 X-1.397 Y3.419 Z11.100
+G1 X1.721 Y5.219 Z11.100
+G1 X1.721 Y9.419 Z11.100
+G1 X-1.397 Y11.219 Z11.100
+G1 X-1.397 Y13.847 Z11.100
+G1 X5.185 Y13.847 Z11.100
+G1 X5.185 Y11.219 Z11.100
+G1 X2.067 Y9.419 Z11.100
+G1 X2.067 Y5.219 Z11.100
+G1 X5.185 Y3.419 Z11.100
+G1 X5.185 Y-0.781 Z11.100
+G1 X2.067 Y-2.581 Z11.100
+G1 X2.067 Y-6.781 Z11.100
+G1 X5.185 Y-8.581 Z11.100
+G1 X5.185 Y-12.781 Z11.100
+G1 X3.338 Y-13.847 Z11.100
+G1 X7.378 Y-13.847 Z11.100
+G1 X5.531 Y-12.781 Z11.100
+G1 X5.531 Y-8.581 Z11.100
+G1 X8.649 Y-6.781 Z11.100
+G1 X8.649 Y-2.581 Z11.100
+G1 X5.531 Y-0.781 Z11.100
+G1 X5.531 Y3.419 Z11.100
+G1 X8.649 Y5.219 Z11.100
+G1 X8.649 Y9.419 Z11.100
+G1 X5.531 Y11.219 Z11.100
+G1 X5.531 Y13.847 Z11.100
+G1 X12.113 Y13.847 Z11.100
+G1 X12.113 Y11.219 Z11.100
+G1 X8.995 Y9.419 Z11.100
+G1 X8.995 Y5.219 Z11.100
+G1 X12.113 Y3.419 Z11.100
+G1 X12.113 Y-0.781 Z11.100
+G1 X8.995 Y-2.581 Z11.100
+G1 X8.995 Y-6.781 Z11.100
+G1 X12.113 Y-8.581 Z11.100
+G1 X12.113 Y-12.781 Z11.100
+G1 X10.266 Y-13.847 Z11.100
+G1 X14.307 Y-13.847 Z11.100
+G1 X12.460 Y-12.781 Z11.100
+G1 X12.460 Y-8.581 Z11.100
+G1 X15.578 Y-6.781 Z11.100
+G1 X15.578 Y-2.581 Z11.100
+G1 X12.460 Y-0.781 Z11.100
+G1 X12.460 Y3.419 Z11.100
+G1 X15.578 Y5.219 Z11.100
+G1 X15.578 Y9.419 Z11.100
+G1 X12.460 Y11.219 Z11.100
+G1 X12.460 Y13.847 Z11.100
+G1 X19.042 Y13.847 Z11.100
+G1 X19.042 Y11.219 Z11.100
+G1 X15.924 Y9.419 Z11.100
+G1 X15.924 Y5.219 Z11.100
+G1 X19.042 Y3.419 Z11.100
+G1 X19.042 Y-0.781 Z11.100
+G1 X15.924 Y-2.581 Z11.100
+G1 X15.924 Y-6.781 Z11.100
+G1 X19.042 Y-8.581 Z11.100
+G1 X19.042 Y-12.781 Z11.100
+G1 X17.195 Y-13.847 Z11.100
+G1 X21.234 Y-13.847 Z11.100
+G1 X19.387 Y-12.781 Z11.100
+G1 X19.387 Y-8.581 Z11.100
+G1 X22.505 Y-6.781 Z11.100
+G1 X22.505 Y-2.581 Z11.100
+G1 X19.387 Y-0.781 Z11.100
+G1 X19.387 Y3.419 Z11.100
+G1 X22.505 Y5.219 Z11.100
+G1 X22.505 Y9.419 Z11.100
+G1 X19.387 Y11.219 Z11.100
+G1 X19.387 Y13.847 Z11.100
+G1 X25.970 Y13.847 Z11.100
+G1 X25.970 Y11.219 Z11.100
+G1 X22.852 Y9.419 Z11.100
+G1 X22.852 Y5.219 Z11.100
+G1 X25.970 Y3.419 Z11.100
+G1 X25.970 Y-0.781 Z11.100
+G1 X22.852 Y-2.581 Z11.100
+G1 X22.852 Y-6.781 Z11.100
+G1 X25.970 Y-8.581 Z11.100
+G1 X25.970 Y-12.781 Z11.100
+G1 X24.123 Y-13.847 Z11.100
+G1 X28.163 Y-13.847 Z11.100
+G1 X26.316 Y-12.781 Z11.100
+G1 X26.316 Y-8.581 Z11.100
+G1 X29.434 Y-6.781 Z11.100
+G1 X29.434 Y-2.581 Z11.100
+G1 X26.316 Y-0.781 Z11.100
+G1 X26.316 Y3.419 Z11.100
+G1 X29.434 Y5.219 Z11.100
+G1 X29.434 Y9.419 Z11.100
+G1 X26.316 Y11.219 Z11.100
+G1 X26.316 Y13.847 Z11.100
+G1 X32.898 Y13.847 Z11.100
+G1 X32.898 Y11.219 Z11.100
+G1 X29.780 Y9.419 Z11.100
+G1 X29.780 Y5.219 Z11.100
+G1 X32.898 Y3.419 Z11.100
+G1 X32.898 Y-0.781 Z11.100
+G1 X29.780 Y-2.581 Z11.100
+G1 X29.780 Y-6.781 Z11.100
+G1 X32.898 Y-8.581 Z11.100
+G1 X32.898 Y-12.781 Z11.100
+G1 X31.051 Y-13.847 Z11.100
+G1 X33.847 Y-13.129 Z11.100
+G1 X33.244 Y-12.781 Z11.100
+G1 X33.244 Y-8.581 Z11.100
+G1 X33.847 Y-8.233 Z11.100
+G1 X33.847 Y-1.129 Z11.100
+G1 X33.244 Y-0.781 Z11.100
+G1 X33.244 Y3.419 Z11.100
+G1 X33.847 Y3.767 Z11.100
+G1 X33.847 Y10.871 Z11.100
+G1 X33.244 Y11.219 Z11.100
+G1 X33.244 Y13.847 Z11.100
+T1
+G1 X-1.693 Y-13.293 Z12.100
+G1 X33.293 Y-13.293 Z12.100
+G1 X33.293 Y2.507 Z12.100
+G1 X33.293 Y13.293 Z12.100
+G1 X1.693 Y13.293 Z12.100
+G1 X-33.293 Y13.293 Z12.100
+G1 X-33.293 Y-2.507 Z12.100
+G1 X-33.293 Y-13.293 Z12.100
+G1 X-1.693 Y-13.293 Z12.100
+G1 X-1.693 Y-13.293 Z12.100
+G1 X-33.293 Y-6.996 Z12.100
+G1 X-32.920 Y-6.781 Z12.100
+G1 X-32.920 Y-2.581 Z12.100
+G1 X-33.293 Y-2.366 Z12.100
+G1 X-33.293 Y5.004 Z12.100
+G1 X-32.920 Y5.219 Z12.100
+G1 X-32.920 Y9.419 Z12.100
+G1 X-33.293 Y9.634 Z12.100
+G1 X-29.456 Y13.293 Z12.100
+G1 X-29.456 Y11.219 Z12.100
+G1 X-32.574 Y9.419 Z12.100
+G1 X-32.574 Y5.219 Z12.100
+G1 X-29.456 Y3.419 Z12.100
+G1 X-29.456 Y-0.781 Z12.100
+G1 X-32.574 Y-2.581 Z12.100
+G1 X-32.574 Y-6.781 Z12.100
+G1 X-29.456 Y-8.581 Z12.100
+G1 X-29.456 Y-12.781 Z12.100
+G1 X-30.343 Y-13.293 Z12.100
+G1 X-28.223 Y-13.293 Z12.100
+G1 X-29.110 Y-12.781 Z12.100
+G1 X-29.110 Y-8.581 Z12.100
+G1 X-25.992 Y-6.781 Z12.100
+G1 X-25.992 Y-2.581 Z12.100
+G1 X-29.110 Y-0.781 Z12.100
+G1 X-29.110 Y3.419 Z12.100
+G1 X-25.992 Y5.219 Z12.100
+G1 X-25.992 Y9.419 Z12.100
+G1 X-29.110 Y11.219 Z12.100
+G1 X-29.110 Y13.293 Z12.100
+G1 X-22.528 Y13.293 Z12.100
+G1 X-22.528 Y11.219 Z12.100
+G1 X-25.646 Y9.419 Z12.100
+G1 X-25.646 Y5.219 Z12.100
+G1 X-22.528 Y3.419 Z12.100
+G1 X-22.528 Y-0.781 Z12.100
+G1 X-25.646 Y-2.581 Z12.100
+G1 X-25.646 Y-6.781 Z12.100
+G1 X-22.528 Y-8.581 Z12.100
+G1 X-22.528 Y-12.781 Z12.100
+G1 X-23.415 Y-13.293 Z12.100
+G1 X-21.294 Y-13.293 Z12.100
+G1 X-22.181 Y-12.781 Z12.100
+G1 X-22.181 Y-8.581 Z12.100
+G1 X-19.063 Y-6.781 Z12.100
+G1 X-19.063 Y-2.581 Z12.100
+G1 X-22.181 Y-0.781 Z12.100
+G1 X-22.181 Y3.419 Z12.100
+G1 X-19.063 Y5.219 Z12.100
+G1 X-19.063 Y9.419 Z12.100
+G1 X-22.181 Y11.219 Z12.100
+G1 X-22.181 Y13.293 Z12.100
+G1 X-15.599 Y13.293 Z12.100
+G1 X-15.599 Y11.219 Z12.100
+G1 X-18.717 Y9.419 Z12.100
+G1 X-18.717 Y5.219 Z12.100
+G1 X-15.599 Y3.419 Z12.100
+G1 X-15.599 Y-0.781 Z12.100
+G1 X-18.717 Y-2.581 Z12.100
+G1 X-18.717 Y-6.781 Z12.100
+G1 X-15.599 Y-8.581 Z12.100
+G1 X-15.599 Y-12.781 Z12.100
+G1 X-16.486 Y-13.293 Z12.100
+G1 X-14.367 Y-13.293 Z12.100
+G1 X-15.254 Y-12.781 Z12.100
+G1 X-15.254 Y-8.581 Z12.100
+G1 X-12.136 Y-6.781 Z12.100
+G1 X-12.136 Y-2.581 Z12.100
+G1 X-15.254 Y-0.781 Z12.100
+G1 X-15.254 Y3.419 Z12.100
+G1 X-12.136 Y5.219 Z12.100
+G1 X-12.136 Y9.419 Z12.100
+G1 X-15.254 Y11.219 Z12.100
+G1 X-15.254 Y13.293 Z12.100
+G1 X-8.671 Y13.293 Z12.100
+G1 X-8.671 Y11.219 Z12.100
+G1 X-11.789 Y9.419 Z12.100
+G1 X-11.789 Y5.219 Z12.100
+G1 X-8.671 Y3.419 Z12.100
+G1 X-8.671 Y-0.781 Z12.100
+G1 X-11.789 Y-2.581 Z12.100
+G1 X-11.789 Y-6.781 Z12.100
+G1 X-8.671 Y-8.581 Z12.100
+G1 X-8.671 Y-12.781 Z12.100
+G1 X-9.558 Y-13.293 Z12.100
+G1 X-7.438 Y-13.293 Z12.100
+G1 X-8.325 Y-12.781 Z12.100
+G1 X-8.325 Y-8.581 Z12.100
+G1 X-5.207 Y-6.781 Z12.100
+G1 X-5.207 Y-2.581 Z12.100
+G1 X-8.325 Y-0.781 Z12.100
+G1 X-8.325 Y3.419 Z12.100
+G1 X-5.207 Y5.219 Z12.100
+G1 X-5.207 Y9.419 Z12.100
+G1 X-8.325 Y11.219 Z12.100
+G1 X-8.325 Y13.293 Z12.100
+G1 X-1.743 Y13.293 Z12.100
+G1 X-1.743 Y11.219 Z12.100
+G1 X-4.861 Y9.419 Z12.100
+G1 X-4.861 Y5.219 Z12.100
+G1 X-1.743 Y3.419 Z12.100
+G1 X-1.743 Y-0.781 Z12.100
+G1 X-4.861 Y-2.581 Z12.100
+G1 X-4.861 Y-6.781 Z12.100
+G1 X-1.743 Y-8.581 Z12.100
+G1 X-1.743 Y-12.781 Z12.100
+G1 X-2.630 Y-13.293 Z12.100
+G1 X-0.510 Y-13.293 Z12.100
+G1 X-1.397 Y-12.781 Z12.100
+G1 X-1.397 Y-8.581 Z12.100
+G1 X1.721 Y-6.781 Z12.100
+G1 X1.721 Y-2.581 Z12.100
+G1 X-1.397 Y-0.781 Z12.100
+G1 X-1.397 Y3.419 Z12.100
+G1 X1.721 Y5.219 Z12.100
+G1 X1.721 Y9.419 Z12.100
+G1 X-1.397 Y11.219 Z12.100
+G1 X-1.397 Y13.293 Z12.100
+G1 X5.185 Y13.293 Z12.100
+G1 X5.185 Y11.219 Z12.100
+G1 X2.067 Y9.419 Z12.100
+G1 X2.067 Y5.219 Z12.100
+G1 X5.185 Y3.419 Z12.100
+G1 X5.185 Y-0.781 Z12.100
+G1 X2.067 Y-2.581 Z12.100
+G1 X2.067 Y-6.781 Z12.100
+G1 X5.185 Y-8.581 Z12.100
+G1 X5.185 Y-12.781 Z12.100
+G1 X4.298 Y-13.293 Z12.100
+G1 X6.418 Y-13.293 Z12.100
+G1 X5.531 Y-12.781 Z12.100
+G1 X5.531 Y-8.581 Z12.100
+G1 X8.649 Y-6.781 Z12.100
+G1 X8.649 Y-2.581 Z12.100
+G1 X5.531 Y-0.781 Z12.100
+G1 X5.531 Y3.419 Z12.100
+G1 X8.649 Y5.219 Z12.100
+G1 X8.649 Y9.419 Z12.100
+G1 X5.531 Y11.219 Z12.100
+G1 X5.531 Y13.293 Z12.100
+G1 X12.113 Y13.293 Z12.100
+G1 X12.113 Y11.219 Z12.100
+G1 X8.995 Y9.419 Z12.100
+G1 X8.995 Y5.219 Z12.100
+G1 X12.113 Y3.419 Z12.100
+G1 X12.113 Y-0.781 Z12.100
+G1 X8.995 Y-2.581 Z12.100
+G1 X8.995 Y-6.781 Z12.100
+G1 X12.113 Y-8.581 Z12.100
+G1 X12.113 Y-12.781 Z12.100
+G1 X11.226 Y-13.293 Z12.100
+G1 X13.347 Y-13.293 Z12.100
+G1 X12.460 Y-12.781 Z12.100
+G1 X12.460 Y-8.581 Z12.100
+G1 X15.578 Y-6.781 Z12.100
+G1 X15.578 Y-2.581 Z12.100
+G1 X12.460 Y-0.781 Z12.100
+G1 X12.460 Y3.419 Z12.100
+G1 X15.578 Y5.219 Z12.100
+G1 X15.578 Y9.419 Z12.100
+G1 X12.460 Y11.219 Z12.100
+G1 X12.460 Y13.293 Z12.100
+G1 X19.042 Y13.293 Z12.100
+G1 X19.042 Y11.219 Z12.100
+G1 X15.924 Y9.419 Z12.100
+G1 X15.924 Y5.219 Z12.100
+G1 X19.042 Y3.419 Z12.100
+G1 X19.042 Y-0.781 Z12.100
+G1 X15.924 Y-2.581 Z12.100
+G1 X15.924 Y-6.781 Z12.100
+G1 X19.042 Y-8.581 Z12.100
+G1 X19.042 Y-12.781 Z12.100
+G1 X18.155 Y-13.293 Z12.100
+G1 X20.274 Y-13.293 Z12.100
+G1 X19.387 Y-12.781 Z12.100
+G1 X19.387 Y-8.581 Z12.100
+G1 X22.505 Y-6.781 Z12.100
+G1 X22.505 Y-2.581 Z12.100
+G1 X19.387 Y-0.781 Z12.100
+G1 X19.387 Y3.419 Z12.100
+G1 X22.505 Y5.219 Z12.100
+G1 X22.505 Y9.419 Z12.100
+G1 X19.387 Y11.219 Z12.100
+G1 X19.387 Y13.293 Z12.100
+G1 X25.970 Y13.293 Z12.100
+G1 X25.970 Y11.219 Z12.100
+G1 X22.852 Y9.419 Z12.100
+G1 X22.852 Y5.219 Z12.100
+G1 X25.970 Y3.419 Z12.100
+G1 X25.970 Y-0.781 Z12.100
+G1 X22.852 Y-2.581 Z12.100
+G1 X22.852 Y-6.781 Z12.100
+G1 X25.970 Y-8.581 Z12.100
+G1 X25.970 Y-12.781 Z12.100
+G1 X25.083 Y-13.293 Z12.100
+G1 X27.203 Y-13.293 Z12.100
+G1 X26.316 Y-12.781 Z12.100
+G1 X26.316 Y-8.581 Z12.100
+G1 X29.434 Y-6.781 Z12.100
+G1 X29.434 Y-2.581 Z12.100
+G1 X26.316 Y-0.781 Z12.100
+G1 X26.316 Y3.419 Z12.100
+G1 X29.434 Y5.219 Z12.100
+G1 X29.434 Y9.419 Z12.100
+G1 X26.316 Y11.219 Z12.100
+G1 X26.316 Y13.293 Z12.100
+G1 X32.898 Y13.293 Z12.100
+G1 X32.898 Y11.219 Z12.100
+G1 X29.780 Y9.419 Z12.100
+G1 X29.780 Y5.219 Z12.100
+G1 X32.898 Y3.419 Z12.100
+G1 X32.898 Y-0.781 Z12.100
+G1 X29.780 Y-2.581 Z12.100
+G1 X29.780 Y-6.781 Z12.100
+G1 X32.898 Y-8.581 Z12.100
+G1 X32.898 Y-12.781 Z12.100
+G1 X32.011 Y-13.293 Z12.100
+G1 X33.293 Y-12.809 Z12.100
+G1 X33.244 Y-12.781 Z12.100
+G1 X33.244 Y-8.581 Z12.100
+G1 X33.293 Y-8.553 Z12.100
+G1 X33.293 Y-0.809 Z12.100
+G1 X33.244 Y-0.781 Z12.100
+G1 X33.244 Y3.419 Z12.100
+G1 X33.293 Y3.447 Z12.100
+G1 X33.293 Y11.191 Z12.100
+G1 X33.244 Y11.219 Z12.100
+G1 X33.244 Y13.293 Z12.100
+T1
+G1 X32.739 Y-12.739 Z13.100
+G1 X32.739 Y1.061 Z13.100
+G1 X32.739 Y12.739 Z13.100
+G1 X5.139 Y12.739 Z13.100
+G1 X-32.739 Y12.739 Z13.100
+G1 X-32.739 Y-1.061 Z13.100
+G1 X-32.739 Y-12.739 Z13.100
+G1 X-5.139 Y-12.739 Z13.100
+G1 X32.739 Y-12.739 Z13.100
+G1 X32.739 Y-12.739 Z13.100
+G1 X-29.456 Y12.739 Z13.100
+G1 X-29.456 Y11.219 Z13.100
+G1 X-32.574 Y9.419 Z13.100
+G1 X-32.574 Y5.219 Z13.100
+G1 X-29.456 Y3.419 Z13.100
+G1 X-29.456 Y-0.781 Z13.100
+G1 X-32.574 Y-2.581 Z13.100
+G1 X-32.574 Y-6.781 Z13.100
+G1 X-29.456 Y-8.581 Z13.100
+G1 X-29.456 Y-12.739 Z13.100
+G1 X-29.110 Y-12.739 Z13.100
+G1 X-29.110 Y-8.581 Z13.100
+G1 X-25.992 Y-6.781 Z13.100
+G1 X-25.992 Y-2.581 Z13.100
+G1 X-29.110 Y-0.781 Z13.100
+G1 X-29.110 Y3.419 Z13.100
+G1 X-25.992 Y5.219 Z13.100
+G1 X-25.992 Y9.419 Z13.100
+G1 X-29.110 Y11.219 Z13.100
+G1 X-29.110 Y12.739 Z13.100
+G1 X-22.528 Y12.739 Z13.100
+G1 X-22.528 Y11.219 Z13.100
+G1 X-25.646 Y9.419 Z13.100
+G1 X-25.646 Y5.219 Z13.100
+G1 X-22.528 Y3.419 Z13.100
+G1 X-22.528 Y-0.781 Z13.100
+G1 X-25.646 Y-2.581 Z13.100
+G1 X-25.646 Y-6.781 Z13.100
+G1 X-22.528 Y-8.581 Z13.100
+G1 X-22.528 Y-12.739 Z13.100
+G1 X-22.181 Y-12.739 Z13.100
+G1 X-22.181 Y-8.581 Z13.100
+G1 X-19.063 Y-6.781 Z13.100
+G1 X-19.063 Y-2.581 Z13.100
+G1 X-22.181 Y-0.781 Z13.100
+G1 X-22.181 Y3.419 Z13.100
+G1 X-19.063 Y5.219 Z13.100
+G1 X-19.063 Y9.419 Z13.100
+G1 X-22.181 Y11.219 Z13.100
+G1 X-22.181 Y12.739 Z13.100
+G1 X-15.599 Y12.739 Z13.100
+G1 X-15.599 Y11.219 Z13.100
+G1 X-18.717 Y9.419 Z13.100
+G1 X-18.717 Y5.219 Z13.100
+G1 X-15.599 Y3.419 Z13.100
+G1 X-15.599 Y-0.781 Z13.100
+G1 X-18.717 Y-2.581 Z13.100
+G1 X-18.717 Y-6.781 Z13.100
+G1 X-15.599 Y-8.581 Z13.100
+G1 X-15.599 Y-12.739 Z13.100
+G1 X-15.254 Y-12.739 Z13.100
+G1 X-15.254 Y-8.581 Z13.100
+G1 X-12.136 Y-6.781 Z13.100
+G1 X-12.136 Y-2.581 Z13.100
+G1 X-15.254 Y-0.781 Z13.100
+G1 X-15.254 Y3.419 Z13.100
+G1 X-12.136 Y5.219 Z13.100
+G1 X-12.136 Y9.419 Z13.100
+G1 X-15.254 Y11.219 Z13.100
+G1 X-15.254 Y12.739 Z13.100
+G1 X-8.671 Y12.739 Z13.100
+G1 X-8.671 Y11.219 Z13.100
+G1 X-11.789 Y9.419 Z13.100
+G1 X-11.789 Y5.219 Z13.100
+G1 X-8.671 Y3.419 Z13.100
+G1 X-8.671 Y-0.781 Z13.100
+G1 X-11.789 Y-2.581 Z13.100
+G1 X-11.789 Y-6.781 Z13.100
+G1 X-8.671 Y-8.581 Z13.100
+G1 X-8.671 Y-12.739 Z13.100
+G1 X-8.325 Y-12.739 Z13.100
+G1 X-8.325 Y-8.581 Z13.100
+G1 X-5.207 Y-6.781 Z13.100
+G1 X-5.207 Y-2.581 Z13.100
+G1 X-8.325 Y-0.781 Z13.100
+G1 X-8.325 Y3.419 Z13.100
+G1 X-5.207 Y5.219 Z13.100
+G1 X-5.207 Y9.419 Z13.100
+G1 X-8.325 Y11.219 Z13.100
+G1 X-8.325 Y12.739 Z13.100
+G1 X-1.743 Y12.739 Z13.100
+G1 X-1.743 Y11.219 Z13.100
+G1 X-4.861 Y9.419 Z13.100
+G1 X-4.861 Y5.219 Z13.100
+G1 X-1.743 Y3.419 Z13.100
+G1 X-1.743 Y-0.781 Z13.100
+G1 X-4.861 Y-2.581 Z13.100
+G1 X-4.861 Y-6.781 Z13.100
+G1 X-1.743 Y-8.581 Z13.100
+G1 X-1.743 Y-12.739 Z13.100
+G1 X-1.397 Y-12.739 Z13.100
+G1 X-1.397 Y-8.581 Z13.100
+G1 X1.721 Y-6.781 Z13.100
+G1 X1.721 Y-2.581 Z13.100
+G1 X-1.397 Y-0.781 Z13.100
+G1 X-1.397 Y3.419 Z13.100
+G1 X1.721 Y5.219 Z13.100
+G1 X1.721 Y9.419 Z13.100
+G1 X-1.397 Y11.219 Z13.100
+G1 X-1.397 Y12.739 Z13.100
+G1 X5.185 Y12.739 Z13.100
+G1 X5.185 Y11.219 Z13.100
+G1 X2.067 Y9.419 Z13.100
+G1 X2.067 Y5.219 Z13.100
+G1 X5.185 Y3.419 Z13.100
+G1 X5.185 Y-0.781 Z13.100
+G1 X2.067 Y-2.581 Z13.100
+G1 X2.067 Y-6.781 Z13.100
+G1 X5.185 Y-8.581 Z13.100
+G1 X5.185 Y-12.739 Z13.100
+G1 X5.531 Y-12.739 Z13.100
+G1 X5.531 Y-8.581 Z13.100
+G1 X8.649 Y-6.781 Z13.100
+G1 X8.649 Y-2.581 Z13.100
+G1 X5.531 Y-0.781 Z13.100
+G1 X5.531 Y3.419 Z13.100
+G1 X8.649 Y5.219 Z13.100
+G1 X8.649 Y9.419 Z13.100
+G1 X5.531 Y11.219 Z13.100
+G1 X5.531 Y12.739 Z13.100
+G1 X12.113 Y12.739 Z13.100
+G1 X12.113 Y11.219 Z13.100
+G1 X8.995 Y9.419 Z13.100
+G1 X8.995 Y5.219 Z13.100
+G1 X12.113 Y3.419 Z13.100
+G1 X12.113 Y-0.781 Z13.100
+G1 X8.995 Y-2.581 Z13.100
+G1 X8.995 Y-6.781 Z13.100
+G1 X12.113 Y-8.581 Z13.100
+G1 X12.113 Y-12.739 Z13.100
+G1 X12.460 Y-12.739 Z13.100
+G1 X12.460 Y-8.581 Z13.100
+G1 X15.578 Y-6.781 Z13.100
+G1 X15.578 Y-2.581 Z13.100
+G1 X12.460 Y-0.781 Z13.100
+G1 X12.460 Y3.419 Z13.100
+G1 X15.578 Y5.219 Z13.100
+G1 X15.578 Y9.419 Z13.100
+G1 X12.460 Y11.219 Z13.100
+G1 X12.460 Y12.739 Z13.100
+G1 X19.042 Y12.739 Z13.100
+G1 X19.042 Y11.219 Z13.100
+G1 X15.924 Y9.419 Z13.100
+G1 X15.924 Y5.219 Z13.100
+G1 X19.042 Y3.419 Z13.100
+G1 X19.042 Y-0.781 Z13.100
+G1 X15.924 Y-2.581 Z13.100
+G1 X15.924 Y-6.781 Z13.100
+G1 X19.042 Y-8.581 Z13.100
+G1 X19.042 Y-12.739 Z13.100
+G1 X19.387 Y-12.739 Z13.100
+G1 X19.387 Y-8.581 Z13.100
+G1 X22.505 Y-6.781 Z13.100
+G1 X22.505 Y-2.581 Z13.100
+G1 X19.387 Y-0.781 Z13.100
+G1 X19.387 Y3.419 Z13.100
+G1 X22.505 Y5.219 Z13.100
+G1 X22.505 Y9.419 Z13.100
+G1 X19.387 Y11.219 Z13.100
+G1 X19.387 Y12.739 Z13.100
+G1 X25.970 Y12.739 Z13.100
+G1 X25.970 Y11.219 Z13.100
+G1 X22.852 Y9.419 Z13.100
+G1 X22.852 Y5.219 Z13.100
+G1 X25.970 Y3.419 Z13.100
+G1 X25.970 Y-0.781 Z13.100
+G1 X22.852 Y-2.581 Z13.100
+G1 X22.852 Y-6.781 Z13.100
+G1 X25.970 Y-8.581 Z13.100
+G1 X25.970 Y-12.739 Z13.100
+G1 X26.316 Y-12.739 Z13.100
+G1 X26.316 Y-8.581 Z13.100
+G1 X29.434 Y-6.781 Z13.100
+G1 X29.434 Y-2.581 Z13.100
+G1 X26.316 Y-0.781 Z13.100
+G1 X26.316 Y3.419 Z13.100
+G1 X29.434 Y5.219 Z13.100
+G1 X29.434 Y9.419 Z13.100
+G1 X26.316 Y11.219 Z13.100
+G1 X26.316 Y12.739 Z13.100
+G1 X32.739 Y11.127 Z13.100
+G1 X29.780 Y9.419 Z13.100
+G1 X29.780 Y5.219 Z13.100
+G1 X32.739 Y3.511 Z13.100
+G1 X32.739 Y-0.873 Z13.100
+G1 X29.780 Y-2.581 Z13.100
+G1 X29.780 Y-6.781 Z13.100
+G1 X32.739 Y-8.489 Z13.100
+T1
+G1 X32.184 Y-12.184 Z14.100
+G1 X32.184 Y-0.384 Z14.100
+G1 X32.184 Y12.184 Z14.100
+G1 X8.584 Y12.184 Z14.100
+G1 X-32.184 Y12.184 Z14.100
+G1 X-32.184 Y0.384 Z14.100
+G1 X-32.184 Y-12.184 Z14.100
+G1 X-8.584 Y-12.184 Z14.100
+G1 X32.184 Y-12.184 Z14.100
+G1 X32.184 Y-12.184 Z14.100
+G1 X-29.456 Y12.184 Z14.100
+G1 X-29.456 Y11.219 Z14.100
+G1 X-32.184 Y9.644 Z14.100
+G1 X-32.184 Y4.994 Z14.100
+G1 X-29.456 Y3.419 Z14.100
+G1 X-29.456 Y-0.781 Z14.100
+G1 X-32.184 Y-2.356 Z14.100
+G1 X-32.184 Y-7.006 Z14.100
+G1 X-29.456 Y-8.581 Z14.100
+G1 X-29.456 Y-12.184 Z14.100
+G1 X-29.110 Y-12.184 Z14.100
+G1 X-29.110 Y-8.581 Z14.100
+G1 X-25.992 Y-6.781 Z14.100
+G1 X-25.992 Y-2.581 Z14.100
+G1 X-29.110 Y-0.781 Z14.100
+G1 X-29.110 Y3.419 Z14.100
+G1 X-25.992 Y5.219 Z14.100
+G1 X-25.992 Y9.419 Z14.100
+G1 X-29.110 Y11.219 Z14.100
+G1 X-29.110 Y12.184 Z14.100
+G1 X-22.528 Y12.184 Z14.100
+G1 X-22.528 Y11.219 Z14.100
+G1 X-25.646 Y9.419 Z14.100
+G1 X-25.646 Y5.219 Z14.100
+G1 X-22.528 Y3.419 Z14.100
+G1 X-22.528 Y-0.781 Z14.100
+G1 X-25.646 Y-2.581 Z14.100
+G1 X-25.646 Y-6.781 Z14.100
+G1 X-22.528 Y-8.581 Z14.100
+G1 X-22.528 Y-12.184 Z14.100
+G1 X-22.181 Y-12.184 Z14.100
+G1 X-22.181 Y-8.581 Z14.100
+G1 X-19.063 Y-6.781 Z14.100
+G1 X-19.063 Y-2.581 Z14.100
+G1 X-22.181 Y-0.781 Z14.100
+G1 X-22.181 Y3.419 Z14.100
+G1 X-19.063 Y5.219 Z14.100
+G1 X-19.063 Y9.419 Z14.100
+G1 X-22.181 Y11.219 Z14.100
+G1 X-22.181 Y12.184 Z14.100
+G1 X-15.599 Y12.184 Z14.100
+G1 X-15.599 Y11.219 Z14.100
+G1 X-18.717 Y9.419 Z14.100
+G1 X-18.717 Y5.219 Z14.100
+G1 X-15.599 Y3.419 Z14.100
+G1 X-15.599 Y-0.781 Z14.100
+G1 X-18.717 Y-2.581 Z14.100
+G1 X-18.717 Y-6.781 Z14.100
+G1 X-15.599 Y-8.581 Z14.100
+G1 X-15.599 Y-12.184 Z14.100
+G1 X-15.254 Y-12.184 Z14.100
+G1 X-15.254 Y-8.581 Z14.100
+G1 X-12.136 Y-6.781 Z14.100
+G1 X-12.136 Y-2.581 Z14.100
+G1 X-15.254 Y-0.781 Z14.100
+G1 X-15.254 Y3.419 Z14.100
+G1 X-12.136 Y5.219 Z14.100
+G1 X-12.136 Y9.419 Z14.100
+G1 X-15.254 Y11.219 Z14.100
+G1 X-15.254 Y12.184 Z14.100
+G1 X-8.671 Y12.184 Z14.100
+G1 X-8.671 Y11.219 Z14.100
+G1 X-11.789 Y9.419 Z14.100
+G1 X-11.789 Y5.219 Z14.100
+G1 X-8.671 Y3.419 Z14.100
+G1 X-8.671 Y-0.781 Z14.100
+G1 X-11.789 Y-2.581 Z14.100
+G1 X-11.789 Y-6.781 Z14.100
+G1 X-8.671 Y-8.581 Z14.100
+G1 X-8.671 Y-12.184 Z14.100
+G1 X-8.325 Y-12.184 Z14.100
+G1 X-8.325 Y-8.581 Z14.100
+G1 X-5.207 Y-6.781 Z14.100
+G1 X-5.207 Y-2.581 Z14.100
+G1 X-8.325 Y-0.781 Z14.100
+G1 X-8.325 Y3.419 Z14.100
+G1 X-5.207 Y5.219 Z14.100
+G1 X-5.207 Y9.419 Z14.100
+G1 X-8.325 Y11.219 Z14.100
+G1 X-8.325 Y12.184 Z14.100
+G1 X-1.743 Y12.184 Z14.100
+G1 X-1.743 Y11.219 Z14.100
+G1 X-4.861 Y9.419 Z14.100
+G1 X-4.861 Y5.219 Z14.100
+G1 X-1.743 Y3.419 Z14.100
+G1 X-1.743 Y-0.781 Z14.100
+G1 X-4.861 Y-2.581 Z14.100
+G1 X-4.861 Y-6.781 Z14.100
+G1 X-1.743 Y-8.581 Z14.100
+G1 X-1.743 Y-12.184 Z14.100
+G1 X-1.397 Y-12.184 Z14.100
+G1 X-1.397 Y-8.581 Z14.100
+G1 X1.721 Y-6.781 Z14.100
+G1 X1.721 Y-2.581 Z14.100
+G1 X-1.397 Y-0.781 Z14.100
+G1 X-1.397 Y3.419 Z14.100
+G1 X1.721 Y5.219 Z14.100
+G1 X1.721 Y9.419 Z14.100
+G1 X-1.397 Y11.219 Z14.100
+G1 X-1.397 Y12.184 Z14.100
+G1 X5.185 Y12.184 Z14.100
+G1 X5.185 Y11.219 Z14.100
+G1 X2.067 Y9.419 Z14.100
+G1 X2.067 Y5.219 Z14.100
+G1 X5.185 Y3.419 Z14.100
+G1 X5.185 Y-0.781 Z14.100
+G1 X2.067 Y-2.581 Z14.100
+G1 X2.067 Y-6.781 Z14.100
+G1 X5.185 Y-8.581 Z14.100
+G1 X5.185 Y-12.184 Z14.100
+G1 X5.531 Y-12.184 Z14.100
+G1 X5.531 Y-8.581 Z14.100
+G1 X8.649 Y-6.781 Z14.100
+G1 X8.649 Y-2.581 Z14.100
+G1 X5.531 Y-0.781 Z14.100
+G1 X5.531 Y3.419 Z14.100
+G1 X8.649 Y5.219 Z14.100
+G1 X8.649 Y9.419 Z14.100
+G1 X5.531 Y11.219 Z14.100
+G1 X5.531 Y12.184 Z14.100
+G1 X12.113 Y12.184 Z14.100
+G1 X12.113 Y11.219 Z14.100
+G1 X8.995 Y9.419 Z14.100
+G1 X8.995 Y5.219 Z14.100
+G1 X12.113 Y3.419 Z14.100
+G1 X12.113 Y-0.781 Z14.100
+G1 X8.995 Y-2.581 Z14.100
+G1 X8.995 Y-6.781 Z14.100
+G1 X12.113 Y-8.581 Z14.100
+G1 X12.113 Y-12.184 Z14.100
+G1 X12.460 Y-12.184 Z14.100
+G1 X12.460 Y-8.581 Z14.100
+G1 X15.578 Y-6.781 Z14.100
+G1 X15.578 Y-2.581 Z14.100
+G1 X12.460 Y-0.781 Z14.100
+G1 X12.460 Y3.419 Z14.100
+G1 X15.578 Y5.219 Z14.100
+G1 X15.578 Y9.419 Z14.100
+G1 X12.460 Y11.219 Z14.100
+G1 X12.460 Y12.184 Z14.100
+G1 X19.042 Y12.184 Z14.100
+G1 X19.042 Y11.219 Z14.100
+G1 X15.924 Y9.419 Z14.100
+G1 X15.924 Y5.219 Z14.100
+G1 X19.042 Y3.419 Z14.100
+G1 X19.042 Y-0.781 Z14.100
+G1 X15.924 Y-2.581 Z14.100
+G1 X15.924 Y-6.781 Z14.100
+G1 X19.042 Y-8.581 Z14.100
+G1 X19.042 Y-12.184 Z14.100
+G1 X19.387 Y-12.184 Z14.100
+G1 X19.387 Y-8.581 Z14.100
+G1 X22.505 Y-6.781 Z14.100
+G1 X22.505 Y-2.581 Z14.100
+G1 X19.387 Y-0.781 Z14.100
+G1 X19.387 Y3.419 Z14.100
+G1 X22.505 Y5.219 Z14.100
+G1 X22.505 Y9.419 Z14.100
+G1 X19.387 Y11.219 Z14.100
+G1 X19.387 Y12.184 Z14.100
+G1 X25.970 Y12.184 Z14.100
+G1 X25.970 Y11.219 Z14.100
+G1 X22.852 Y9.419 Z14.100
+G1 X22.852 Y5.219 Z14.100
+G1 X25.970 Y3.419 Z14.100
+G1 X25.970 Y-0.781 Z14.100
+G1 X22.852 Y-2.581 Z14.100
+G1 X22.852 Y-6.781 Z14.100
+G1 X25.970 Y-8.581 Z14.100
+G1 X25.970 Y-12.184 Z14.100
+G1 X26.316 Y-12.184 Z14.100
+G1 X26.316 Y-8.581 Z14.100
+G1 X29.434 Y-6.781 Z14.100
+G1 X29.434 Y-2.581 Z14.100
+G1 X26.316 Y-0.781 Z14.100
+G1 X26.316 Y3.419 Z14.100
+G1 X29.434 Y5.219 Z14.100
+G1 X29.434 Y9.419 Z14.100
+G1 X26.316 Y11.219 Z14.100
+G1 X26.316 Y12.184 Z14.100
+G1 X32.184 Y10.807 Z14.100
+G1 X29.780 Y9.419 Z14.100
+G1 X29.780 Y5.219 Z14.100
+G1 X32.184 Y3.831 Z14.100
+G1 X32.184 Y-1.193 Z14.100
+G1 X29.780 Y-2.581 Z14.100
+G1 X29.780 Y-6.781 Z14.100
+G1 X32.184 Y-8.169 Z14.100
+T1
+G1 X31.630 Y-11.630 Z15.100
+G1 X31.630 Y-1.830 Z15.100
+G1 X31.630 Y11.630 Z15.100
+G1 X12.030 Y11.630 Z15.100
+G1 X-31.630 Y11.630 Z15.100
+G1 X-31.630 Y1.830 Z15.100
+G1 X-31.630 Y-11.630 Z15.100
+G1 X-12.030 Y-11.630 Z15.100
+G1 X31.630 Y-11.630 Z15.100
+G1 X31.630 Y-11.630 Z15.100
+G1 X-29.456 Y11.630 Z15.100
+G1 X-29.456 Y11.219 Z15.100
+G1 X-31.630 Y9.964 Z15.100
+G1 X-31.630 Y4.674 Z15.100
+G1 X-29.456 Y3.419 Z15.100
+G1 X-29.456 Y-0.781 Z15.100
+G1 X-31.630 Y-2.036 Z15.100
+G1 X-31.630 Y-7.326 Z15.100
+G1 X-29.456 Y-8.581 Z15.100
+G1 X-29.456 Y-11.630 Z15.100
+G1 X-29.110 Y-11.630 Z15.100
+G1 X-29.110 Y-8.581 Z15.100
+G1 X-25.992 Y-6.781 Z15.100
+G1 X-25.992 Y-2.581 Z15.100
+G1 X-29.110 Y-0.781 Z15.100
+G1 X-29.110 Y3.419 Z15.100
+G1 X-25.992 Y5.219 Z15.100
+G1 X-25.992 Y9.419 Z15.100
+G1 X-29.110 Y11.219 Z15.100
+G1 X-29.110 Y11.630 Z15.100
+G1 X-22.528 Y11.630 Z15.100
+G1 X-22.528 Y11.219 Z15.100
+G1 X-25.646 Y9.419 Z15.100
+G1 X-25.646 Y5.219 Z15.100
+G1 X-22.528 Y3.419 Z15.100
+G1 X-22.528 Y-0.781 Z15.100
+G1 X-25.646 Y-2.581 Z15.100
+G1 X-25.646 Y-6.781 Z15.100
+G1 X-22.528 Y-8.581 Z15.100
+G1 X-22.528 Y-11.630 Z15.100
+G1 X-22.181 Y-11.630 Z15.100
+G1 X-22.181 Y-8.581 Z15.100
+G1 X-19.063 Y-6.781 Z15.100
+G1 X-19.063 Y-2.581 Z15.100
+G1 X-22.181 Y-0.781 Z15.100
+G1 X-22.181 Y3.419 Z15.100
+G1 X-19.063 Y5.219 Z15.100
+G1 X-19.063 Y9.419 Z15.100
+G1 X-22.181 Y11.219 Z15.100
+G1 X-22.181 Y11.630 Z15.100
+G1 X-15.599 Y11.630 Z15.100
+G1 X-15.599 Y11.219 Z15.100
+G1 X-18.717 Y9.419 Z15.100
+G1 X-18.717 Y5.219 Z15.100
+G1 X-15.599 Y3.419 Z15.100
+G1 X-15.599 Y-0.781 Z15.100
+G1 X-18.717 Y-2.581 Z15.100
+G1 X-18.717 Y-6.781 Z15.100
+G1 X-15.599 Y-8.581 Z15.100
+G1 X-15.599 Y-11.630 Z15.100
+G1 X-15.254 Y-11.630 Z15.100
+G1 X-15.254 Y-8.581 Z15.100
+G1 X-12.136 Y-6.781 Z15.100
+G1 X-12.136 Y-2.581 Z15.100
+G1 X-15.254 Y-0.781 Z15.100
+G1 X-15.254 Y3.419 Z15.100
+G1 X-12.136 Y5.219 Z15.100
+G1 X-12.136 Y9.419 Z15.100
+G1 X-15.254 Y11.219 Z15.100
+G1 X-15.254 Y11.630 Z15.100
+G1 X-8.671 Y11.630 Z15.100
+G1 X-8.671 Y11.219 Z15.100
+G1 X-11.789 Y9.419 Z15.100
+G1 X-11.789 Y5.219 Z15.100
+G1 X-8.671 Y3.419 Z15.100
+G1 X-8.671 Y-0.781 Z15.100
+G1 X-11.789 Y-2.581 Z15.100
+G1 X-11.789 Y-6.781 Z15.100
+G1 X-8.671 Y-8.581 Z15.100
+G1 X-8.671 Y-11.630 Z15.100
+G1 X-8.325 Y-11.630 Z15.100
+G1 X-8.325 Y-8.581 Z15.100
+G1 X-5.207 Y-6.781 Z15.100
+G1 X-5.207 Y-2.581 Z15.100
+G1 X-8.325 Y-0.781 Z15.100
+G1 X-8.325 Y3.419 Z15.100
+G1 X-5.207 Y5.219 Z15.100
+G1 X-5.207 Y9.419 Z15.100
+G1 X-8.325 Y11.219 Z15.100
+G1 X-8.325 Y11.630 Z15.100
+G1 X-1.743 Y11.630 Z15.100
+G1 X-1.743 Y11.219 Z15.100
+G1 X-4.861 Y9.419 Z15.100
+G1 X-4.861 Y5.219 Z15.100
+G1 X-1.743 Y3.419 Z15.100
+G1 X-1.743 Y-0.781 Z15.100
+G1 X-4.861 Y-2.581 Z15.100
+G1 X-4.861 Y-6.781 Z15.100
+G1 X-1.743 Y-8.581 Z15.100
+G1 X-1.743 Y-11.630 Z15.100
+G1 X-1.397 Y-11.630 Z15.100
+G1 X-1.397 Y-8.581 Z15.100
+G1 X1.721 Y-6.781 Z15.100
+G1 X1.721 Y-2.581 Z15.100
+G1 X-1.397 Y-0.781 Z15.100
+G1 X-1.397 Y3.419 Z15.100
+G1 X1.721 Y5.219 Z15.100
+G1 X1.721 Y9.419 Z15.100
+G1 X-1.397 Y11.219 Z15.100
+G1 X-1.397 Y11.630 Z15.100
+G1 X5.185 Y11.630 Z15.100
+G1 X5.185 Y11.219 Z15.100
+G1 X2.067 Y9.419 Z15.100
+G1 X2.067 Y5.219 Z15.100
+G1 X5.185 Y3.419 Z15.100
+G1 X5.185 Y-0.781 Z15.100
+G1 X2.067 Y-2.581 Z15.100
+G1 X2.067 Y-6.781 Z15.100
+G1 X5.185 Y-8.581 Z15.100
+G1 X5.185 Y-11.630 Z15.100
+G1 X5.531 Y-11.630 Z15.100
+G1 X5.531 Y-8.581 Z15.100
+G1 X8.649 Y-6.781 Z15.100
+G1 X8.649 Y-2.581 Z15.100
+G1 X5.531 Y-0.781 Z15.100
+G1 X5.531 Y3.419 Z15.100
+G1 X8.649 Y5.219 Z15.100
+G1 X8.649 Y9.419 Z15.100
+G1 X5.531 Y11.219 Z15.100
+G1 X5.531 Y11.630 Z15.100
+G1 X12.113 Y11.630 Z15.100
+G1 X12.113 Y11.219 Z15.100
+G1 X8.995 Y9.419 Z15.100
+G1 X8.995 Y5.219 Z15.100
+G1 X12.113 Y3.419 Z15.100
+G1 X12.113 Y-0.781 Z15.100
+G1 X8.995 Y-2.581 Z15.100
+G1 X8.995 Y-6.781 Z15.100
+G1 X12.113 Y-8.581 Z15.100
+G1 X12.113 Y-11.630 Z15.100
+G1 X12.460 Y-11.630 Z15.100
+G1 X12.460 Y-8.581 Z15.100
+G1 X15.578 Y-6.781 Z15.100
+G1 X15.578 Y-2.581 Z15.100
+G1 X12.460 Y-0.781 Z15.100
+G1 X12.460 Y3.419 Z15.100
+G1 X15.578 Y5.219 Z15.100
+G1 X15.578 Y9.419 Z15.100
+G1 X12.460 Y11.219 Z15.100
+G1 X12.460 Y11.630 Z15.100
+G1 X19.042 Y11.630 Z15.100
+G1 X19.042 Y11.219 Z15.100
+G1 X15.924 Y9.419 Z15.100
+G1 X15.924 Y5.219 Z15.100
+G1 X19.042 Y3.419 Z15.100
+G1 X19.042 Y-0.781 Z15.100
+G1 X15.924 Y-2.581 Z15.100
+G1 X15.924 Y-6.781 Z15.100
+G1 X19.042 Y-8.581 Z15.100
+G1 X19.042 Y-11.630 Z15.100
+G1 X19.387 Y-11.630 Z15.100
+G1 X19.387 Y-8.581 Z15.100
+G1 X22.505 Y-6.781 Z15.100
+G1 X22.505 Y-2.581 Z15.100
+G1 X19.387 Y-0.781 Z15.100
+G1 X19.387 Y3.419 Z15.100
+G1 X22.505 Y5.219 Z15.100
+G1 X22.505 Y9.419 Z15.100
+G1 X19.387 Y11.219 Z15.100
+G1 X19.387 Y11.630 Z15.100
+G1 X25.970 Y11.630 Z15.100
+G1 X25.970 Y11.219 Z15.100
+G1 X22.852 Y9.419 Z15.100
+G1 X22.852 Y5.219 Z15.100
+G1 X25.970 Y3.419 Z15.100
+G1 X25.970 Y-0.781 Z15.100
+G1 X22.852 Y-2.581 Z15.100
+G1 X22.852 Y-6.781 Z15.100
+G1 X25.970 Y-8.581 Z15.100
+G1 X25.970 Y-11.630 Z15.100
+G1 X26.316 Y-11.630 Z15.100
+G1 X26.316 Y-8.581 Z15.100
+G1 X29.434 Y-6.781 Z15.100
+G1 X29.434 Y-2.581 Z15.100
+G1 X26.316 Y-0.781 Z15.100
+G1 X26.316 Y3.419 Z15.100
+G1 X29.434 Y5.219 Z15.100
+G1 X29.434 Y9.419 Z15.100
+G1 X26.316 Y11.219 Z15.100
+G1 X26.316 Y11.630 Z15.100
+G1 X31.630 Y10.487 Z15.100
+G1 X29.780 Y9.419 Z15.100
+G1 X29.780 Y5.219 Z15.100
+G1 X31.630 Y4.151 Z15.100
+G1 X31.630 Y-1.513 Z15.100
+G1 X29.780 Y-2.581 Z15.100
+G1 X29.780 Y-6.781 Z15.100
+G1 X31.630 Y-7.849 Z15.100
+T1
+G1 X31.076 Y-11.076 Z16.100
+G1 X31.076 Y-3.276 Z16.100
+G1 X31.076 Y11.076 Z16.100
+G1 X15.476 Y11.076 Z16.100
+G1 X-31.076 Y11.076 Z16.100
+G1 X-31.076 Y3.276 Z16.100
+G1 X-31.076 Y-11.076 Z16.100
+G1 X-15.476 Y-11.076 Z16.100
+G1 X31.076 Y-11.076 Z16.100
+G1 X31.076 Y-11.076 Z16.100
+G1 X-29.704 Y11.076 Z16.100
+G1 X-31.076 Y10.284 Z16.100
+G1 X-31.076 Y4.354 Z16.100
+G1 X-29.456 Y3.419 Z16.100
+G1 X-29.456 Y-0.781 Z16.100
+G1 X-31.076 Y-1.716 Z16.100
+G1 X-31.076 Y-7.646 Z16.100
+G1 X-29.456 Y-8.581 Z16.100
+G1 X-29.456 Y-11.076 Z16.100
+G1 X-29.110 Y-11.076 Z16.100
+G1 X-29.110 Y-8.581 Z16.100
+G1 X-25.992 Y-6.781 Z16.100
+G1 X-25.992 Y-2.581 Z16.100
+G1 X-29.110 Y-0.781 Z16.100
+G1 X-29.110 Y3.419 Z16.100
+G1 X-25.992 Y5.219 Z16.100
+G1 X-25.992 Y9.419 Z16.100
+G1 X-28.862 Y11.076 Z16.100
+G1 X-22.776 Y11.076 Z16.100
+G1 X-25.646 Y9.419 Z16.100
+G1 X-25.646 Y5.219 Z16.100
+G1 X-22.528 Y3.419 Z16.100
+G1 X-22.528 Y-0.781 Z16.100
+G1 X-25.646 Y-2.581 Z16.100
+G1 X-25.646 Y-6.781 Z16.100
+G1 X-22.528 Y-8.581 Z16.100
+G1 X-22.528 Y-11.076 Z16.100
+G1 X-22.181 Y-11.076 Z16.100
+G1 X-22.181 Y-8.581 Z16.100
+G1 X-19.063 Y-6.781 Z16.100
+G1 X-19.063 Y-2.581 Z16.100
+G1 X-22.181 Y-0.781 Z16.100
+G1 X-22.181 Y3.419 Z16.100
+G1 X-19.063 Y5.219 Z16.100
+G1 X-19.063 Y9.419 Z16.100
+G1 X-21.933 Y11.076 Z16.100
+G1 X-15.847 Y11.076 Z16.100
+G1 X-18.717 Y9.419 Z16.100
+G1 X-18.717 Y5.219 Z16.100
+G1 X-15.599 Y3.419 Z16.100
+G1 X-15.599 Y-0.781 Z16.100
+G1 X-18.717 Y-2.581 Z16.100
+G1 X-18.717 Y-6.781 Z16.100
+G1 X-15.599 Y-8.581 Z16.100
+G1 X-15.599 Y-11.076 Z16.100
+G1 X-15.254 Y-11.076 Z16.100
+G1 X-15.254 Y-8.581 Z16.100
+G1 X-12.136 Y-6.781 Z16.100
+G1 X-12.136 Y-2.581 Z16.100
+G1 X-15.254 Y-0.781 Z16.100
+G1 X-15.254 Y3.419 Z16.100
+G1 X-12.136 Y5.219 Z16.100
+G1 X-12.136 Y9.419 Z16.100
+G1 X-15.006 Y11.076 Z16.100
+G1 X-8.919 Y11.076 Z16.100
+G1 X-11.789 Y9.419 Z16.100
+G1 X-11.789 Y5.219 Z16.100
+G1 X-8.671 Y3.419 Z16.100
+G1 X-8.671 Y-0.781 Z16.100
+G1 X-11.789 Y-2.581 Z16.100
+G1 X-11.789 Y-6.781 Z16.100
+G1 X-8.671 Y-8.581 Z16.100
+G1 X-8.671 Y-11.076 Z16.100
+G1 X-8.325 Y-11.076 Z16.100
+G1 X-8.325 Y-8.581 Z16.100
+G1 X-5.207 Y-6.781 Z16.100
+G1 X-5.207 Y-2.581 Z16.100
+G1 X-8.325 Y-0.781 Z16.100
+G1 X-8.325 Y3.419 Z16.100
+G1 X-5.207 Y5.219 Z16.100
+G1 X-5.207 Y9.419 Z16.100
+G1 X-8.077 Y11.076 Z16.100
+G1 X-1.991 Y11.076 Z16.100
+G1 X-4.861 Y9.419 Z16.100
+G1 X-4.861 Y5.219 Z16.100
+G1 X-1.743 Y3.419 Z16.100
+G1 X-1.743 Y-0.781 Z16.100
+G1 X-4.861 Y-2.581 Z16.100
+G1 X-4.861 Y-6.781 Z16.100
+G1 X-1.743 Y-8.581 Z16.100
+G1 X-1.743 Y-11.076 Z16.100
+G1 X-1.397 Y-11.076 Z16.100
+G1 X-1.397 Y-8.581 Z16.100
+G1 X1.721 Y-6.781 Z16.100
+G1 X1.721 Y-2.581 Z16.100
+G1 X-1.397 Y-0.781 Z16.100
+G1 X-1.397 Y3.419 Z16.100
+G1 X1.721 Y5.219 Z16.100
+G1 X1.721 Y9.419 Z16.100
+G1 X-1.149 Y11.076 Z16.100
+G1 X4.937 Y11.076 Z16.100
+G1 X2.067 Y9.419 Z16.100
+G1 X2.067 Y5.219 Z16.100
+G1 X5.185 Y3.419 Z16.100
+G1 X5.185 Y-0.781 Z16.100
+G1 X2.067 Y-2.581 Z16.100
+G1 X2.067 Y-6.781 Z16.100
+G1 X5.185 Y-8.581 Z16.100
+G1 X5.185 Y-11.076 Z16.100
+G1 X5.531 Y-11.076 Z16.100
+G1 X5.531 Y-8.581 Z16.100
+G1 X8.649 Y-6.781 Z16.100
+G1 X8.649 Y-2.581 Z16.100
+G1 X5.531 Y-0.781 Z16.100
+G1 X5.531 Y3.419 Z16.100
+G1 X8.649 Y5.219 Z16.100
+G1 X8.649 Y9.419 Z16.100
+G1 X5.779 Y11.076 Z16.100
+G1 X11.865 Y11.076 Z16.100
+G1 X8.995 Y9.419 Z16.100
+G1 X8.995 Y5.219 Z16.100
+G1 X12.113 Y3.419 Z16.100
+G1 X12.113 Y-0.781 Z16.100
+G1 X8.995 Y-2.581 Z16.100
+G1 X8.995 Y-6.781 Z16.100
+G1 X12.113 Y-8.581 Z16.100
+G1 X12.113 Y-11.076 Z16.100
+G1 X12.460 Y-11.076 Z16.100
+G1 X12.460 Y-8.581 Z16.100
+G1 X15.578 Y-6.781 Z16.100
+G1 X15.578 Y-2.581 Z16.100
+G1 X12.460 Y-0.781 Z16.100
+G1 X12.460 Y3.419 Z16.100
+G1 X15.578 Y5.219 Z16.100
+G1 X15.578 Y9.419 Z16.100
+G1 X12.708 Y11.076 Z16.100
+G1 X18.794 Y11.076 Z16.100
+G1 X15.924 Y9.419 Z16.100
+G1 X15.924 Y5.219 Z16.100
+G1 X19.042 Y3.419 Z16.100
+G1 X19.042 Y-0.781 Z16.100
+G1 X15.924 Y-2.581 Z16.100
+G1 X15.924 Y-6.781 Z16.100
+G1 X19.042 Y-8.581 Z16.100
+G1 X19.042 Y-11.076 Z16.100
+G1 X19.387 Y-11.076 Z16.100
+G1 X19.387 Y-8.581 Z16.100
+G1 X22.505 Y-6.781 Z16.100
+G1 X22.505 Y-2.581 Z16.100
+G1 X19.387 Y-0.781 Z16.100
+G1 X19.387 Y3.419 Z16.100
+G1 X22.505 Y5.219 Z16.100
+G1 X22.505 Y9.419 Z16.100
+G1 X19.635 Y11.076 Z16.100
+G1 X25.722 Y11.076 Z16.100
+G1 X22.852 Y9.419 Z16.100
+G1 X22.852 Y5.219 Z16.100
+G1 X25.970 Y3.419 Z16.100
+G1 X25.970 Y-0.781 Z16.100
+G1 X22.852 Y-2.581 Z16.100
+G1 X22.852 Y-6.781 Z16.100
+G1 X25.970 Y-8.581 Z16.100
+G1 X25.970 Y-11.076 Z16.100
+G1 X26.316 Y-11.076 Z16.100
+G1 X26.316 Y-8.581 Z16.100
+G1 X29.434 Y-6.781 Z16.100
+G1 X29.434 Y-2.581 Z16.100
+G1 X26.316 Y-0.781 Z16.100
+G1 X26.316 Y3.419 Z16.100
+G1 X29.434 Y5.219 Z16.100
+G1 X29.434 Y9.419 Z16.100
+G1 X26.564 Y11.076 Z16.100
+G1 X31.076 Y10.167 Z16.100
+G1 X29.780 Y9.419 Z16.100
+G1 X29.780 Y5.219 Z16.100
+G1 X31.076 Y4.471 Z16.100
+G1 X31.076 Y-1.833 Z16.100
+G1 X29.780 Y-2.581 Z16.100
+G1 X29.780 Y-6.781 Z16.100
+G1 X31.076 Y-7.529 Z16.100
+T1
+G1 X30.521 Y-10.521 Z17.100
+G1 X30.521 Y-4.721 Z17.100
+G1 X30.521 Y10.521 Z17.100
+G1 X18.921 Y10.521 Z17.100
+G1 X-30.521 Y10.521 Z17.100
+G1 X-30.521 Y4.721 Z17.100
+G1 X-30.521 Y-10.521 Z17.100
+G1 X-18.921 Y-10.521 Z17.100
+G1 X30.521 Y-10.521 Z17.100
+G1 X30.521 Y-10.521 Z17.100
+G1 X-30.521 Y4.034 Z17.100
+G1 X-29.456 Y3.419 Z17.100
+G1 X-29.456 Y-0.781 Z17.100
+G1 X-30.521 Y-1.396 Z17.100
+G1 X-30.521 Y-7.966 Z17.100
+G1 X-29.456 Y-8.581 Z17.100
+G1 X-29.456 Y-10.521 Z17.100
+G1 X-29.110 Y-10.521 Z17.100
+G1 X-29.110 Y-8.581 Z17.100
+G1 X-25.992 Y-6.781 Z17.100
+G1 X-25.992 Y-2.581 Z17.100
+G1 X-29.110 Y-0.781 Z17.100
+G1 X-29.110 Y3.419 Z17.100
+G1 X-25.992 Y5.219 Z17.100
+G1 X-25.992 Y9.419 Z17.100
+G1 X-27.901 Y10.521 Z17.100
+G1 X-23.737 Y10.521 Z17.100
+G1 X-25.646 Y9.419 Z17.100
+G1 X-25.646 Y5.219 Z17.100
+G1 X-22.528 Y3.419 Z17.100
+G1 X-22.528 Y-0.781 Z17.100
+G1 X-25.646 Y-2.581 Z17.100
+G1 X-25.646 Y-6.781 Z17.100
+G1 X-22.528 Y-8.581 Z17.100
+G1 X-22.528 Y-10.521 Z17.100
+G1 X-22.181 Y-10.521 Z17.100
+G1 X-22.181 Y-8.581 Z17.100
+G1 X-19.063 Y-6.781 Z17.100
+G1 X-19.063 Y-2.581 Z17.100
+G1 X-22.181 Y-0.781 Z17.100
+G1 X-22.181 Y3.419 Z17.100
+G1 X-19.063 Y5.219 Z17.100
+G1 X-19.063 Y9.419 Z17.100
+G1 X-20.972 Y10.521 Z17.100
+G1 X-16.808 Y10.521 Z17.100
+G1 X-18.717 Y9.419 Z17.100
+G1 X-18.717 Y5.219 Z17.100
+G1 X-15.599 Y3.419 Z17.100
+G1 X-15.599 Y-0.781 Z17.100
+G1 X-18.717 Y-2.581 Z17.100
+G1 X-18.717 Y-6.781 Z17.100
+G1 X-15.599 Y-8.581 Z17.100
+G1 X-15.599 Y-10.521 Z17.100
+G1 X-15.254 Y-10.521 Z17.100
+G1 X-15.254 Y-8.581 Z17.100
+G1 X-12.136 Y-6.781 Z17.100
+G1 X-12.136 Y-2.581 Z17.100
+G1 X-15.254 Y-0.781 Z17.100
+G1 X-15.254 Y3.419 Z17.100
+G1 X-12.136 Y5.219 Z17.100
+G1 X-12.136 Y9.419 Z17.100
+G1 X-14.045 Y10.521 Z17.100
+G1 X-9.880 Y10.521 Z17.100
+G1 X-11.789 Y9.419 Z17.100
+G1 X-11.789 Y5.219 Z17.100
+G1 X-8.671 Y3.419 Z17.100
+G1 X-8.671 Y-0.781 Z17.100
+G1 X-11.789 Y-2.581 Z17.100
+G1 X-11.789 Y-6.781 Z17.100
+G1 X-8.671 Y-8.581 Z17.100
+G1 X-8.671 Y-10.521 Z17.100
+G1 X-8.325 Y-10.521 Z17.100
+G1 X-8.325 Y-8.581 Z17.100
+G1 X-5.207 Y-6.781 Z17.100
+G1 X-5.207 Y-2.581 Z17.100
+G1 X-8.325 Y-0.781 Z17.100
+G1 X-8.325 Y3.419 Z17.100
+G1 X-5.207 Y5.219 Z17.100
+G1 X-5.207 Y9.419 Z17.100
+G1 X-7.116 Y10.521 Z17.100
+G1 X-2.952 Y10.521 Z17.100
+G1 X-4.861 Y9.419 Z17.100
+G1 X-4.861 Y5.219 Z17.100
+G1 X-1.743 Y3.419 Z17.100
+G1 X-1.743 Y-0.781 Z17.100
+G1 X-4.861 Y-2.581 Z17.100
+G1 X-4.861 Y-6.781 Z17.100
+G1 X-1.743 Y-8.581 Z17.100
+G1 X-1.743 Y-10.521 Z17.100
+G1 X-1.397 Y-10.521 Z17.100
+G1 X-1.397 Y-8.581 Z17.100
+G1 X1.721 Y-6.781 Z17.100
+G1 X1.721 Y-2.581 Z17.100
+G1 X-1.397 Y-0.781 Z17.100
+G1 X-1.397 Y3.419 Z17.100
+G1 X1.721 Y5.219 Z17.100
+G1 X1.721 Y9.419 Z17.100
+G1 X-0.188 Y10.521 Z17.100
+G1 X3.976 Y10.521 Z17.100
+G1 X2.067 Y9.419 Z17.100
+G1 X2.067 Y5.219 Z17.100
+G1 X5.185 Y3.419 Z17.100
+G1 X5.185 Y-0.781 Z17.100
+G1 X2.067 Y-2.581 Z17.100
+G1 X2.067 Y-6.781 Z17.100
+G1 X5.185 Y-8.581 Z17.100
+G1 X5.185 Y-10.521 Z17.100
+G1 X5.531 Y-10.521 Z17.100
+G1 X5.531 Y-8.581 Z17.100
+G1 X8.649 Y-6.781 Z17.100
+G1 X8.649 Y-2.581 Z17.100
+G1 X5.531 Y-0.781 Z17.100
+G1 X5.531 Y3.419 Z17.100
+G1 X8.649 Y5.219 Z17.100
+G1 X8.649 Y9.419 Z17.100
+G1 X6.740 Y10.521 Z17.100
+G1 X10.904 Y10.521 Z17.100
+G1 X8.995 Y9.419 Z17.100
+G1 X8.995 Y5.219 Z17.100
+G1 X12.113 Y3.419 Z17.100
+G1 X12.113 Y-0.781 Z17.100
+G1 X8.995 Y-2.581 Z17.100
+G1 X8.995 Y-6.781 Z17.100
+G1 X12.113 Y-8.581 Z17.100
+G1 X12.113 Y-10.521 Z17.100
+G1 X12.460 Y-10.521 Z17.100
+G1 X12.460 Y-8.581 Z17.100
+G1 X15.578 Y-6.781 Z17.100
+G1 X15.578 Y-2.581 Z17.100
+G1 X12.460 Y-0.781 Z17.100
+G1 X12.460 Y3.419 Z17.100
+G1 X15.578 Y5.219 Z17.100
+G1 X15.578 Y9.419 Z17.100
+G1 X13.669 Y10.521 Z17.100
+G1 X17.833 Y10.521 Z17.100
+G1 X15.924 Y9.419 Z17.100
+G1 X15.924 Y5.219 Z17.100
+G1 X19.042 Y3.419 Z17.100
+G1 X19.042 Y-0.781 Z17.100
+G1 X15.924 Y-2.581 Z17.100
+G1 X15.924 Y-6.781 Z17.100
+G1 X19.042 Y-8.581 Z17.100
+G1 X19.042 Y-10.521 Z17.100
+G1 X19.387 Y-10.521 Z17.100
+G1 X19.387 Y-8.581 Z17.100
+G1 X22.505 Y-6.781 Z17.100
+G1 X22.505 Y-2.581 Z17.100
+G1 X19.387 Y-0.781 Z17.100
+G1 X19.387 Y3.419 Z17.100
+G1 X22.505 Y5.219 Z17.100
+G1 X22.505 Y9.419 Z17.100
+G1 X20.596 Y10.521 Z17.100
+G1 X24.761 Y10.521 Z17.100
+G1 X22.852 Y9.419 Z17.100
+G1 X22.852 Y5.219 Z17.100
+G1 X25.970 Y3.419 Z17.100
+G1 X25.970 Y-0.781 Z17.100
+G1 X22.852 Y-2.581 Z17.100
+G1 X22.852 Y-6.781 Z17.100
+G1 X25.970 Y-8.581 Z17.100
+G1 X25.970 Y-10.521 Z17.100
+G1 X26.316 Y-10.521 Z17.100
+G1 X26.316 Y-8.581 Z17.100
+G1 X29.434 Y-6.781 Z17.100
+G1 X29.434 Y-2.581 Z17.100
+G1 X26.316 Y-0.781 Z17.100
+G1 X26.316 Y3.419 Z17.100
+G1 X29.434 Y5.219 Z17.100
+G1 X29.434 Y9.419 Z17.100
+G1 X27.525 Y10.521 Z17.100
+G1 X30.521 Y9.847 Z17.100
+G1 X29.780 Y9.419 Z17.100
+G1 X29.780 Y5.219 Z17.100
+G1 X30.521 Y4.791 Z17.100
+G1 X30.521 Y-2.153 Z17.100
+G1 X29.780 Y-2.581 Z17.100
+G1 X29.780 Y-6.781 Z17.100
+G1 X30.521 Y-7.209 Z17.100
+T1
+G1 X29.967 Y-9.967 Z18.100
+G1 X29.967 Y-6.167 Z18.100
+G1 X29.967 Y9.967 Z18.100
+G1 X22.367 Y9.967 Z18.100
+G1 X-29.967 Y9.967 Z18.100
+G1 X-29.967 Y6.167 Z18.100
+G1 X-29.967 Y-9.967 Z18.100
+G1 X-22.367 Y-9.967 Z18.100
+G1 X29.967 Y-9.967 Z18.100
+G1 X29.967 Y-9.967 Z18.100
+G1 X-29.967 Y3.714 Z18.100
+G1 X-29.456 Y3.419 Z18.100
+G1 X-29.456 Y-0.781 Z18.100
+G1 X-29.967 Y-1.076 Z18.100
+G1 X-29.967 Y-8.286 Z18.100
+G1 X-29.456 Y-8.581 Z18.100
+G1 X-29.456 Y-9.967 Z18.100
+G1 X-29.110 Y-9.967 Z18.100
+G1 X-29.110 Y-8.581 Z18.100
+G1 X-25.992 Y-6.781 Z18.100
+G1 X-25.992 Y-2.581 Z18.100
+G1 X-29.110 Y-0.781 Z18.100
+G1 X-29.110 Y3.419 Z18.100
+G1 X-25.992 Y5.219 Z18.100
+G1 X-25.992 Y9.419 Z18.100
+G1 X-26.941 Y9.967 Z18.100
+G1 X-24.697 Y9.967 Z18.100
+G1 X-25.646 Y9.419 Z18.100
+G1 X-25.646 Y5.219 Z18.100
+G1 X-22.528 Y3.419 Z18.100
+G1 X-22.528 Y-0.781 Z18.100
+G1 X-25.646 Y-2.581 Z18.100
+G1 X-25.646 Y-6.781 Z18.100
+G1 X-22.528 Y-8.581 Z18.100
+G1 X-22.528 Y-9.967 Z18.100
+G1 X-22.181 Y-9.967 Z18.100
+G1 X-22.181 Y-8.581 Z18.100
+G1 X-19.063 Y-6.781 Z18.100
+G1 X-19.063 Y-2.581 Z18.100
+G1 X-22.181 Y-0.781 Z18.100
+G1 X-22.181 Y3.419 Z18.100
+G1 X-19.063 Y5.219 Z18.100
+G1 X-19.063 Y9.419 Z18.100
+G1 X-20.012 Y9.967 Z18.100
+G1 X-17.768 Y9.967 Z18.100
+G1 X-18.717 Y9.419 Z18.100
+G1 X-18.717 Y5.219 Z18.100
+G1 X-15.599 Y3.419 Z18.100
+G1 X-15.599 Y-0.781 Z18.100
+G1 X-18.717 Y-2.581 Z18.100
+G1 X-18.717 Y-6.781 Z18.100
+G1 X-15.599 Y-8.581 Z18.100
+G1 X-15.599 Y-9.967 Z18.100
+G1 X-15.254 Y-9.967 Z18.100
+G1 X-15.254 Y-8.581 Z18.100
+G1 X-12.136 Y-6.781 Z18.100
+G1 X-12.136 Y-2.581 Z18.100
+G1 X-15.254 Y-0.781 Z18.100
+G1 X-15.254 Y3.419 Z18.100
+G1 X-12.136 Y5.219 Z18.100
+G1 X-12.136 Y9.419 Z18.100
+G1 X-13.085 Y9.967 Z18.100
+G1 X-10.840 Y9.967 Z18.100
+G1 X-11.789 Y9.419 Z18.100
+G1 X-11.789 Y5.219 Z18.100
+G1 X-8.671 Y3.419 Z18.100
+G1 X-8.671 Y-0.781 Z18.100
+G1 X-11.789 Y-2.581 Z18.100
+G1 X-11.789 Y-6.781 Z18.100
+G1 X-8.671 Y-8.581 Z18.100
+G1 X-8.671 Y-9.967 Z18.100
+G1 X-8.325 Y-9.967 Z18.100
+G1 X-8.325 Y-8.581 Z18.100
+G1 X-5.207 Y-6.781 Z18.100
+G1 X-5.207 Y-2.581 Z18.100
+G1 X-8.325 Y-0.781 Z18.100
+G1 X-8.325 Y3.419 Z18.100
+G1 X-5.207 Y5.219 Z18.100
+G1 X-5.207 Y9.419 Z18.100
+G1 X-6.156 Y9.967 Z18.100
+G1 X-3.912 Y9.967 Z18.100
+G1 X-4.861 Y9.419 Z18.100
+G1 X-4.861 Y5.219 Z18.100
+G1 X-1.743 Y3.419 Z18.100
+G1 X-1.743 Y-0.781 Z18.100
+G1 X-4.861 Y-2.581 Z18.100
+G1 X-4.861 Y-6.781 Z18.100
+G1 X-1.743 Y-8.581 Z18.100
+G1 X-1.743 Y-9.967 Z18.100
+G1 X-1.397 Y-9.967 Z18.100
+G1 X-1.397 Y-8.581 Z18.100
+G1 X1.721 Y-6.781 Z18.100
+G1 X1.721 Y-2.581 Z18.100
+G1 X-1.397 Y-0.781 Z18.100
+G1 X-1.397 Y3.419 Z18.100
+G1 X1.721 Y5.219 Z18.100
+G1 X1.721 Y9.419 Z18.100
+G1 X0.772 Y9.967 Z18.100
+G1 X3.016 Y9.967 Z18.100
+G1 X2.067 Y9.419 Z18.100
+G1 X2.067 Y5.219 Z18.100
+G1 X5.185 Y3.419 Z18.100
+G1 X5.185 Y-0.781 Z18.100
+G1 X2.067 Y-2.581 Z18.100
+G1 X2.067 Y-6.781 Z18.100
+G1 X5.185 Y-8.581 Z18.100
+G1 X5.185 Y-9.967 Z18.100
+G1 X5.531 Y-9.967 Z18.100
+G1 X5.531 Y-8.581 Z18.100
+G1 X8.649 Y-6.781 Z18.100
+G1 X8.649 Y-2.581 Z18.100
+G1 X5.531 Y-0.781 Z18.100
+G1 X5.531 Y3.419 Z18.100
+G1 X8.649 Y5.219 Z18.100
+G1 X8.649 Y9.419 Z18.100
+G1 X7.700 Y9.967 Z18.100
+G1 X9.944 Y9.967 Z18.100
+G1 X8.995 Y9.419 Z18.100
+G1 X8.995 Y5.219 Z18.100
+G1 X12.113 Y3.419 Z18.100
+G1 X12.113 Y-0.781 Z18.100
+G1 X8.995 Y-2.581 Z18.100
+G1 X8.995 Y-6.781 Z18.100
+G1 X12.113 Y-8.581 Z18.100
+G1 X12.113 Y-9.967 Z18.100
+G1 X12.460 Y-9.967 Z18.100
+G1 X12.460 Y-8.581 Z18.100
+G1 X15.578 Y-6.781 Z18.100
+G1 X15.578 Y-2.581 Z18.100
+G1 X12.460 Y-0.781 Z18.100
+G1 X12.460 Y3.419 Z18.100
+G1 X15.578 Y5.219 Z18.100
+G1 X15.578 Y9.419 Z18.100
+G1 X14.629 Y9.967 Z18.100
+G1 X16.873 Y9.967 Z18.100
+G1 X15.924 Y9.419 Z18.100
+G1 X15.924 Y5.219 Z18.100
+G1 X19.042 Y3.419 Z18.100
+G1 X19.042 Y-0.781 Z18.100
+G1 X15.924 Y-2.581 Z18.100
+G1 X15.924 Y-6.781 Z18.100
+G1 X19.042 Y-8.581 Z18.100
+G1 X19.042 Y-9.967 Z18.100
+G1 X19.387 Y-9.967 Z18.100
+G1 X19.387 Y-8.581 Z18.100
+G1 X22.505 Y-6.781 Z18.100
+G1 X22.505 Y-2.581 Z18.100
+G1 X19.387 Y-0.781 Z18.100
+G1 X19.387 Y3.419 Z18.100
+G1 X22.505 Y5.219 Z18.100
+G1 X22.505 Y9.419 Z18.100
+G1 X21.556 Y9.967 Z18.100
+G1 X23.801 Y9.967 Z18.100
+G1 X22.852 Y9.419 Z18.100
+G1 X22.852 Y5.219 Z18.100
+G1 X25.970 Y3.419 Z18.100
+G1 X25.970 Y-0.781 Z18.100
+G1 X22.852 Y-2.581 Z18.100
+G1 X22.852 Y-6.781 Z18.100
+G1 X25.970 Y-8.581 Z18.100
+G1 X25.970 Y-9.967 Z18.100
+G1 X26.316 Y-9.967 Z18.100
+G1 X26.316 Y-8.581 Z18.100
+G1 X29.434 Y-6.781 Z18.100
+G1 X29.434 Y-2.581 Z18.100
+G1 X26.316 Y-0.781 Z18.100
+G1 X26.316 Y3.419 Z18.100
+G1 X29.434 Y5.219 Z18.100
+G1 X29.434 Y9.419 Z18.100
+G1 X28.485 Y9.967 Z18.100
+G1 X29.967 Y9.527 Z18.100
+G1 X29.780 Y9.419 Z18.100
+G1 X29.780 Y5.219 Z18.100
+G1 X29.967 Y5.111 Z18.100
+G1 X29.967 Y-2.473 Z18.100
+G1 X29.780 Y-2.581 Z18.100
+G1 X29.780 Y-6.781 Z18.100
+G1 X29.967 Y-6.889 Z18.100
+T1
+G1 X29.413 Y-9.413 Z19.100
+G1 X29.413 Y-7.613 Z19.100
+G1 X29.413 Y9.413 Z19.100
+G1 X25.813 Y9.413 Z19.100
+G1 X-29.413 Y9.413 Z19.100
+G1 X-29.413 Y7.613 Z19.100
+G1 X-29.413 Y-9.413 Z19.100
+G1 X-25.813 Y-9.413 Z19.100
+G1 X29.413 Y-9.413 Z19.100
+G1 X29.413 Y-9.413 Z19.100
+G1 X-29.110 Y-9.413 Z19.100
+G1 X-29.110 Y-8.581 Z19.100
+G1 X-25.992 Y-6.781 Z19.100
+G1 X-25.992 Y-2.581 Z19.100
+G1 X-29.110 Y-0.781 Z19.100
+G1 X-29.110 Y3.419 Z19.100
+G1 X-25.992 Y5.219 Z19.100
+G1 X-25.992 Y9.413 Z19.100
+G1 X-25.646 Y9.413 Z19.100
+G1 X-25.646 Y5.219 Z19.100
+G1 X-22.528 Y3.419 Z19.100
+G1 X-22.528 Y-0.781 Z19.100
+G1 X-25.646 Y-2.581 Z19.100
+G1 X-25.646 Y-6.781 Z19.100
+G1 X-22.528 Y-8.581 Z19.100
+G1 X-22.528 Y-9.413 Z19.100
+G1 X-22.181 Y-9.413 Z19.100
+G1 X-22.181 Y-8.581 Z19.100
+G1 X-19.063 Y-6.781 Z19.100
+G1 X-19.063 Y-2.581 Z19.100
+G1 X-22.181 Y-0.781 Z19.100
+G1 X-22.181 Y3.419 Z19.100
+G1 X-19.063 Y5.219 Z19.100
+G1 X-19.063 Y9.413 Z19.100
+G1 X-18.717 Y9.413 Z19.100
+G1 X-18.717 Y5.219 Z19.100
+G1 X-15.599 Y3.419 Z19.100
+G1 X-15.599 Y-0.781 Z19.100
+G1 X-18.717 Y-2.581 Z19.100
+G1 X-18.717 Y-6.781 Z19.100
+G1 X-15.599 Y-8.581 Z19.100
+G1 X-15.599 Y-9.413 Z19.100
+G1 X-15.254 Y-9.413 Z19.100
+G1 X-15.254 Y-8.581 Z19.100
+G1 X-12.136 Y-6.781 Z19.100
+G1 X-12.136 Y-2.581 Z19.100
+G1 X-15.254 Y-0.781 Z19.100
+G1 X-15.254 Y3.419 Z19.100
+G1 X-12.136 Y5.219 Z19.100
+G1 X-12.136 Y9.413 Z19.100
+G1 X-11.789 Y9.413 Z19.100
+G1 X-11.789 Y5.219 Z19.100
+G1 X-8.671 Y3.419 Z19.100
+G1 X-8.671 Y-0.781 Z19.100
+G1 X-11.789 Y-2.581 Z19.100
+G1 X-11.789 Y-6.781 Z19.100
+G1 X-8.671 Y-8.581 Z19.100
+G1 X-8.671 Y-9.413 Z19.100
+G1 X-8.325 Y-9.413 Z19.100
+G1 X-8.325 Y-8.581 Z19.100
+G1 X-5.207 Y-6.781 Z19.100
+G1 X-5.207 Y-2.581 Z19.100
+G1 X-8.325 Y-0.781 Z19.100
+G1 X-8.325 Y3.419 Z19.100
+G1 X-5.207 Y5.219 Z19.100
+G1 X-5.207 Y9.413 Z19.100
+G1 X-4.861 Y9.413 Z19.100
+G1 X-4.861 Y5.219 Z19.100
+G1 X-1.743 Y3.419 Z19.100
+G1 X-1.743 Y-0.781 Z19.100
+G1 X-4.861 Y-2.581 Z19.100
+G1 X-4.861 Y-6.781 Z19.100
+G1 X-1.743 Y-8.581 Z19.100
+G1 X-1.743 Y-9.413 Z19.100
+G1 X-1.397 Y-9.413 Z19.100
+G1 X-1.397 Y-8.581 Z19.100
+G1 X1.721 Y-6.781 Z19.100
+G1 X1.721 Y-2.581 Z19.100
+G1 X-1.397 Y-0.781 Z19.100
+G1 X-1.397 Y3.419 Z19.100
+G1 X1.721 Y5.219 Z19.100
+G1 X1.721 Y9.413 Z19.100
+G1 X2.067 Y9.413 Z19.100
+G1 X2.067 Y5.219 Z19.100
+G1 X5.185 Y3.419 Z19.100
+G1 X5.185 Y-0.781 Z19.100
+G1 X2.067 Y-2.581 Z19.100
+G1 X2.067 Y-6.781 Z19.100
+G1 X5.185 Y-8.581 Z19.100
+G1 X5.185 Y-9.413 Z19.100
+G1 X5.531 Y-9.413 Z19.100
+G1 X5.531 Y-8.581 Z19.100
+G1 X8.649 Y-6.781 Z19.100
+G1 X8.649 Y-2.581 Z19.100
+G1 X5.531 Y-0.781 Z19.100
+G1 X5.531 Y3.419 Z19.100
+G1 X8.649 Y5.219 Z19.100
+G1 X8.649 Y9.413 Z19.100
+G1 X8.995 Y9.413 Z19.100
+G1 X8.995 Y5.219 Z19.100
+G1 X12.113 Y3.419 Z19.100
+G1 X12.113 Y-0.781 Z19.100
+G1 X8.995 Y-2.581 Z19.100
+G1 X8.995 Y-6.781 Z19.100
+G1 X12.113 Y-8.581 Z19.100
+G1 X12.113 Y-9.413 Z19.100
+G1 X12.460 Y-9.413 Z19.100
+G1 X12.460 Y-8.581 Z19.100
+G1 X15.578 Y-6.781 Z19.100
+G1 X15.578 Y-2.581 Z19.100
+G1 X12.460 Y-0.781 Z19.100
+G1 X12.460 Y3.419 Z19.100
+G1 X15.578 Y5.219 Z19.100
+G1 X15.578 Y9.413 Z19.100
+G1 X15.924 Y9.413 Z19.100
+G1 X15.924 Y5.219 Z19.100
+G1 X19.042 Y3.419 Z19.100
+G1 X19.042 Y-0.781 Z19.100
+G1 X15.924 Y-2.581 Z19.100
+G1 X15.924 Y-6.781 Z19.100
+G1 X19.042 Y-8.581 Z19.100
+G1 X19.042 Y-9.413 Z19.100
+G1 X19.387 Y-9.413 Z19.100
+G1 X19.387 Y-8.581 Z19.100
+G1 X22.505 Y-6.781 Z19.100
+G1 X22.505 Y-2.581 Z19.100
+G1 X19.387 Y-0.781 Z19.100
+G1 X19.387 Y3.419 Z19.100
+G1 X22.505 Y5.219 Z19.100
+G1 X22.505 Y9.413 Z19.100
+G1 X22.852 Y9.413 Z19.100
+G1 X22.852 Y5.219 Z19.100
+G1 X25.970 Y3.419 Z19.100
+G1 X25.970 Y-0.781 Z19.100
+G1 X22.852 Y-2.581 Z19.100
+G1 X22.852 Y-6.781 Z19.100
+G1 X25.970 Y-8.581 Z19.100
+G1 X25.970 Y-9.413 Z19.100
+G1 X26.316 Y-9.413 Z19.100
+G1 X26.316 Y-8.581 Z19.100
+G1 X29.413 Y-6.793 Z19.100
+G1 X29.413 Y-2.569 Z19.100
+G1 X26.316 Y-0.781 Z19.100
+G1 X26.316 Y3.419 Z19.100
+G1 X29.413 Y5.207 Z19.100
@@ -0,0 +1,5171 @@
+T1
+G1 X39.95 Y-19.95 Z0.1
+G1 X39.95 Y19.86 Z0.1
+G1 X39.95 Y19.95 Z0.1
+G1 X-39.66 Y19.95 Z0.1
+G1 X-39.95 Y19.95 Z0.1
+G1 X-39.95 Y-19.86 Z0.1
+G1 X-39.95 Y-19.95 Z0.1
+G1 X39.66 Y-19.95 Z0.1
+G1 X39.66 Y-19.95 Z0.1
+G1 X-39.95 Y-18.84 Z0.1
+G1 X-39.85 Y-18.78 Z0.1
+G1 X-39.85 Y-14.58 Z0.1
+G1 X-39.95 Y-14.53 Z0.1
+G1 X-39.95 Y-6.84 Z0.1
+G1 X-39.85 Y-6.78 Z0.1
+G1 X-39.85 Y-2.58 Z0.1
+G1 X-39.95 Y-2.52 Z0.1
+G1 X-39.95 Y5.16 Z0.1
+G1 X-39.85 Y5.22 Z0.1
+G1 X-39.85 Y9.42 Z0.1
+G1 X-39.95 Y9.47 Z0.1
+G1 X-39.95 Y17.16 Z0.1
+G1 X-39.85 Y17.22 Z0.1
+G1 X-39.85 Y19.95 Z0.1
+G1 X-39.5 Y19.95 Z0.1
+G1 X-39.5 Y17.22 Z0.1
+G1 X-36.38 Y15.42 Z0.1
+G1 X-36.38 Y11.22 Z0.1
+G1 X-39.5 Y9.42 Z0.1
+G1 X-39.5 Y5.22 Z0.1
+G1 X-36.38 Y3.42 Z0.1
+G1 X-36.38 Y-0.78 Z0.1
+G1 X-39.5 Y-2.58 Z0.1
+G1 X-39.5 Y-6.78 Z0.1
+G1 X-36.38 Y-8.58 Z0.1
+G1 X-36.38 Y-12.78 Z0.1
+G1 X-39.5 Y-14.58 Z0.1
+G1 X-39.5 Y-18.78 Z0.1
+G1 X-37.49 Y-19.95 Z0.1
+G1 X-34.94 Y-19.95 Z0.1
+G1 X-32.92 Y-18.78 Z0.1
+G1 X-32.92 Y-14.58 Z0.1
+G1 X-36.04 Y-12.78 Z0.1
+G1 X-36.04 Y-8.58 Z0.1
+G1 X-32.92 Y-6.78 Z0.1
+G1 X-32.92 Y-2.58 Z0.1
+G1 X-36.04 Y-0.78 Z0.1
+G1 X-36.04 Y3.42 Z0.1
+G1 X-32.92 Y5.22 Z0.1
+G1 X-32.92 Y9.42 Z0.1
+G1 X-36.04 Y11.22 Z0.1
+G1 X-36.04 Y15.42 Z0.1
+G1 X-32.92 Y17.22 Z0.1
+G1 X-32.92 Y19.95 Z0.1
+G1 X-32.57 Y19.95 Z0.1
+G1 X-32.57 Y17.22 Z0.1
+G1 X-29.46 Y15.42 Z0.1
+G1 X-29.46 Y11.22 Z0.1
+G1 X-32.57 Y9.42 Z0.1
+G1 X-32.57 Y5.22 Z0.1
+G1 X-29.46 Y3.42 Z0.1
+G1 X-29.46 Y-0.78 Z0.1
+G1 X-32.57 Y-2.58 Z0.1
+G1 X-32.57 Y-6.78 Z0.1
+G1 X-29.46 Y-8.58 Z0.1
+G1 X-29.46 Y-12.78 Z0.1
+G1 X-32.57 Y-14.58 Z0.1
+G1 X-32.57 Y-18.78 Z0.1
+G1 X-30.56 Y-19.95 Z0.1
+G1 X-28.01 Y-19.95 Z0.1
+G1 X-25.99 Y-18.78 Z0.1
+G1 X-25.99 Y-14.58 Z0.1
+G1 X-29.11 Y-12.78 Z0.1
+G1 X-29.11 Y-8.58 Z0.1
+G1 X-25.99 Y-6.78 Z0.1
+G1 X-25.99 Y-2.58 Z0.1
+G1 X-29.11 Y-0.78 Z0.1
+G1 X-29.11 Y3.42 Z0.1
+G1 X-25.99 Y5.22 Z0.1
+G1 X-25.99 Y9.42 Z0.1
+G1 X-29.11 Y11.22 Z0.1
+G1 X-29.11 Y15.42 Z0.1
+G1 X-25.99 Y17.22 Z0.1
+G1 X-25.99 Y19.95 Z0.1
+G1 X-25.65 Y19.95 Z0.1
+G1 X-25.65 Y17.22 Z0.1
+G1 X-22.53 Y15.42 Z0.1
+G1 X-22.53 Y11.22 Z0.1
+G1 X-25.65 Y9.42 Z0.1
+G1 X-25.65 Y5.22 Z0.1
+G1 X-22.53 Y3.42 Z0.1
+G1 X-22.53 Y-0.78 Z0.1
+G1 X-25.65 Y-2.58 Z0.1
+G1 X-25.65 Y-6.78 Z0.1
+G1 X-22.53 Y-8.58 Z0.1
+G1 X-22.53 Y-12.78 Z0.1
+G1 X-25.65 Y-14.58 Z0.1
+G1 X-25.65 Y-18.78 Z0.1
+G1 X-23.63 Y-19.95 Z0.1
+G1 X-21.08 Y-19.95 Z0.1
+G1 X-19.06 Y-18.78 Z0.1
+G1 X-19.06 Y-14.58 Z0.1
+G1 X-22.18 Y-12.78 Z0.1
+G1 X-22.18 Y-8.58 Z0.1
+G1 X-19.06 Y-6.78 Z0.1
+G1 X-19.06 Y-2.58 Z0.1
+G1 X-22.18 Y-0.78 Z0.1
+G1 X-22.18 Y3.42 Z0.1
+G1 X-19.06 Y5.22 Z0.1
+G1 X-19.06 Y9.42 Z0.1
+G1 X-22.18 Y11.22 Z0.1
+G1 X-22.18 Y15.42 Z0.1
+G1 X-19.06 Y17.22 Z0.1
+G1 X-19.06 Y19.95 Z0.1
+G1 X-18.72 Y19.95 Z0.1
+G1 X-18.72 Y17.22 Z0.1
+G1 X-15.6 Y15.42 Z0.1
+G1 X-15.6 Y11.22 Z0.1
+G1 X-18.72 Y9.42 Z0.1
+G1 X-18.72 Y5.22 Z0.1
+G1 X-15.6 Y3.42 Z0.1
+G1 X-15.6 Y-0.78 Z0.1
+G1 X-18.72 Y-2.58 Z0.1
+G1 X-18.72 Y-6.78 Z0.1
+G1 X-15.6 Y-8.58 Z0.1
+G1 X-15.6 Y-12.78 Z0.1
+G1 X-18.72 Y-14.58 Z0.1
+G1 X-18.72 Y-18.78 Z0.1
+G1 X-16.7 Y-19.95 Z0.1
+G1 X-14.15 Y-19.95 Z0.1
+G1 X-12.14 Y-18.78 Z0.1
+G1 X-12.14 Y-14.58 Z0.1
+G1 X-15.25 Y-12.78 Z0.1
+G1 X-15.25 Y-8.58 Z0.1
+G1 X-12.14 Y-6.78 Z0.1
+G1 X-12.14 Y-2.58 Z0.1
+G1 X-15.25 Y-0.78 Z0.1
+G1 X-15.25 Y3.42 Z0.1
+G1 X-12.14 Y5.22 Z0.1
+G1 X-12.14 Y9.42 Z0.1
+G1 X-15.25 Y11.22 Z0.1
+G1 X-15.25 Y15.42 Z0.1
+G1 X-12.14 Y17.22 Z0.1
+G1 X-12.14 Y19.95 Z0.1
+G1 X-11.79 Y19.95 Z0.1
+G1 X-11.79 Y17.22 Z0.1
+G1 X-8.67 Y15.42 Z0.1
+G1 X-8.67 Y11.22 Z0.1
+G1 X-11.79 Y9.42 Z0.1
+G1 X-11.79 Y5.22 Z0.1
+G1 X-8.67 Y3.42 Z0.1
+G1 X-8.67 Y-0.78 Z0.1
+G1 X-11.79 Y-2.58 Z0.1
+G1 X-11.79 Y-6.78 Z0.1
+G1 X-8.67 Y-8.58 Z0.1
+G1 X-8.67 Y-12.78 Z0.1
+G1 X-11.79 Y-14.58 Z0.1
+G1 X-11.79 Y-18.78 Z0.1
+G1 X-9.77 Y-19.95 Z0.1
+G1 X-7.22 Y-19.95 Z0.1
+G1 X-5.21 Y-18.78 Z0.1
+G1 X-5.21 Y-14.58 Z0.1
+G1 X-8.32 Y-12.78 Z0.1
+G1 X-8.32 Y-8.58 Z0.1
+G1 X-5.21 Y-6.78 Z0.1
+G1 X-5.21 Y-2.58 Z0.1
+G1 X-8.32 Y-0.78 Z0.1
+G1 X-8.32 Y3.42 Z0.1
+G1 X-5.21 Y5.22 Z0.1
+G1 X-5.21 Y9.42 Z0.1
+G1 X-8.32 Y11.22 Z0.1
+G1 X-8.32 Y15.42 Z0.1
+G1 X-5.21 Y17.22 Z0.1
+G1 X-5.21 Y19.95 Z0.1
+G1 X-4.86 Y19.95 Z0.1
+G1 X-4.86 Y17.22 Z0.1
+G1 X-1.74 Y15.42 Z0.1
+G1 X-1.74 Y11.22 Z0.1
+G1 X-4.86 Y9.42 Z0.1
+G1 X-4.86 Y5.22 Z0.1
+G1 X-1.74 Y3.42 Z0.1
+G1 X-1.74 Y-0.78 Z0.1
+G1 X-4.86 Y-2.58 Z0.1
+G1 X-4.86 Y-6.78 Z0.1
+G1 X-1.74 Y-8.58 Z0.1
+G1 X-1.74 Y-12.78 Z0.1
+G1 X-4.86 Y-14.58 Z0.1
+G1 X-4.86 Y-18.78 Z0.1
+G1 X-2.85 Y-19.95 Z0.1
+G1 X-0.29 Y-19.95 Z0.1
+G1 X1.72 Y-18.78 Z0.1
+G1 X1.72 Y-14.58 Z0.1
+G1 X-1.4 Y-12.78 Z0.1
+G1 X-1.4 Y-8.58 Z0.1
+G1 X1.72 Y-6.78 Z0.1
+G1 X1.72 Y-2.58 Z0.1
+G1 X-1.4 Y-0.78 Z0.1
+G1 X-1.4 Y3.42 Z0.1
+G1 X1.72 Y5.22 Z0.1
+G1 X1.72 Y9.42 Z0.1
+G1 X-1.4 Y11.22 Z0.1
+G1 X-1.4 Y15.42 Z0.1
+G1 X1.72 Y17.22 Z0.1
+G1 X1.72 Y19.95 Z0.1
+G1 X2.07 Y19.95 Z0.1
+G1 X2.07 Y17.22 Z0.1
+G1 X5.18 Y15.42 Z0.1
+G1 X5.18 Y11.22 Z0.1
+G1 X2.07 Y9.42 Z0.1
+G1 X2.07 Y5.22 Z0.1
+G1 X5.18 Y3.42 Z0.1
+G1 X5.18 Y-0.78 Z0.1
+G1 X2.07 Y-2.58 Z0.1
+G1 X2.07 Y-6.78 Z0.1
+G1 X5.18 Y-8.58 Z0.1
+G1 X5.18 Y-12.78 Z0.1
+G1 X2.07 Y-14.58 Z0.1
+G1 X2.07 Y-18.78 Z0.1
+G1 X4.08 Y-19.95 Z0.1
+G1 X6.63 Y-19.95 Z0.1
+G1 X8.65 Y-18.78 Z0.1
+G1 X8.65 Y-14.58 Z0.1
+G1 X5.53 Y-12.78 Z0.1
+G1 X5.53 Y-8.58 Z0.1
+G1 X8.65 Y-6.78 Z0.1
+G1 X8.65 Y-2.58 Z0.1
+G1 X5.53 Y-0.78 Z0.1
+G1 X5.53 Y3.42 Z0.1
+G1 X8.65 Y5.22 Z0.1
+G1 X8.65 Y9.42 Z0.1
+G1 X5.53 Y11.22 Z0.1
+G1 X5.53 Y15.42 Z0.1
+G1 X8.65 Y17.22 Z0.1
+G1 X8.65 Y19.95 Z0.1
+G1 X8.99 Y19.95 Z0.1
+G1 X8.99 Y17.22 Z0.1
+G1 X12.11 Y15.42 Z0.1
+G1 X12.11 Y11.22 Z0.1
+G1 X8.99 Y9.42 Z0.1
+G1 X8.99 Y5.22 Z0.1
+G1 X12.11 Y3.42 Z0.1
+G1 X12.11 Y-0.78 Z0.1
+G1 X8.99 Y-2.58 Z0.1
+G1 X8.99 Y-6.78 Z0.1
+G1 X12.11 Y-8.58 Z0.1
+G1 X12.11 Y-12.78 Z0.1
+G1 X8.99 Y-14.58 Z0.1
+G1 X8.99 Y-18.78 Z0.1
+G1 X11.01 Y-19.95 Z0.1
+G1 X13.56 Y-19.95 Z0.1
+G1 X15.58 Y-18.78 Z0.1
+G1 X15.58 Y-14.58 Z0.1
+G1 X12.46 Y-12.78 Z0.1
+G1 X12.46 Y-8.58 Z0.1
+G1 X15.58 Y-6.78 Z0.1
+G1 X15.58 Y-2.58 Z0.1
+G1 X12.46 Y-0.78 Z0.1
+G1 X12.46 Y3.42 Z0.1
+G1 X15.58 Y5.22 Z0.1
+G1 X15.58 Y9.42 Z0.1
+G1 X12.46 Y11.22 Z0.1
+G1 X12.46 Y15.42 Z0.1
+G1 X15.58 Y17.22 Z0.1
+G1 X15.58 Y19.95 Z0.1
+G1 X15.92 Y19.95 Z0.1
+G1 X15.92 Y17.22 Z0.1
+G1 X19.04 Y15.42 Z0.1
+G1 X19.04 Y11.22 Z0.1
+G1 X15.92 Y9.42 Z0.1
+G1 X15.92 Y5.22 Z0.1
+G1 X19.04 Y3.42 Z0.1
+G1 X19.04 Y-0.78 Z0.1
+G1 X15.92 Y-2.58 Z0.1
+G1 X15.92 Y-6.78 Z0.1
+G1 X19.04 Y-8.58 Z0.1
+G1 X19.04 Y-12.78 Z0.1
+G1 X15.92 Y-14.58 Z0.1
+G1 X15.92 Y-18.78 Z0.1
+G1 X17.94 Y-19.95 Z0.1
+G1 X20.49 Y-19.95 Z0.1
+G1 X22.5 Y-18.78 Z0.1
+G1 X22.5 Y-14.58 Z0.1
+G1 X19.39 Y-12.78 Z0.1
+G1 X19.39 Y-8.58 Z0.1
+G1 X22.5 Y-6.78 Z0.1
+G1 X22.5 Y-2.58 Z0.1
+G1 X19.39 Y-0.78 Z0.1
+G1 X19.39 Y3.42 Z0.1
+G1 X22.5 Y5.22 Z0.1
+G1 X22.5 Y9.42 Z0.1
+G1 X19.39 Y11.22 Z0.1
+G1 X19.39 Y15.42 Z0.1
+G1 X22.5 Y17.22 Z0.1
+G1 X22.5 Y19.95 Z0.1
+G1 X22.85 Y19.95 Z0.1
+G1 X22.85 Y17.22 Z0.1
+G1 X25.97 Y15.42 Z0.1
+G1 X25.97 Y11.22 Z0.1
+G1 X22.85 Y9.42 Z0.1
+G1 X22.85 Y5.22 Z0.1
+G1 X25.97 Y3.42 Z0.1
+G1 X25.97 Y-0.78 Z0.1
+G1 X22.85 Y-2.58 Z0.1
+G1 X22.85 Y-6.78 Z0.1
+G1 X25.97 Y-8.58 Z0.1
+G1 X25.97 Y-12.78 Z0.1
+G1 X22.85 Y-14.58 Z0.1
+G1 X22.85 Y-18.78 Z0.1
+G1 X24.87 Y-19.95 Z0.1
+G1 X27.42 Y-19.95 Z0.1
+G1 X29.43 Y-18.78 Z0.1
+G1 X29.43 Y-14.58 Z0.1
+G1 X26.32 Y-12.78 Z0.1
+G1 X26.32 Y-8.58 Z0.1
+G1 X29.43 Y-6.78 Z0.1
+G1 X29.43 Y-2.58 Z0.1
+G1 X26.32 Y-0.78 Z0.1
+G1 X26.32 Y3.42 Z0.1
+G1 X29.43 Y5.22 Z0.1
+G1 X29.43 Y9.42 Z0.1
+G1 X26.32 Y11.22 Z0.1
+G1 X26.32 Y15.42 Z0.1
+G1 X29.43 Y17.22 Z0.1
+G1 X29.43 Y19.95 Z0.1
+G1 X29.78 Y19.95 Z0.1
+G1 X29.78 Y17.22 Z0.1
+G1 X32.9 Y15.42 Z0.1
+G1 X32.9 Y11.22 Z0.1
+G1 X29.78 Y9.42 Z0.1
+G1 X29.78 Y5.22 Z0.1
+G1 X32.9 Y3.42 Z0.1
+G1 X32.9 Y-0.78 Z0.1
+G1 X29.78 Y-2.58 Z0.1
+G1 X29.78 Y-6.78 Z0.1
+G1 X32.9 Y-8.58 Z0.1
+G1 X32.9 Y-12.78 Z0.1
+G1 X29.78 Y-14.58 Z0.1
+G1 X29.78 Y-18.78 Z0.1
+G1 X31.8 Y-19.95 Z0.1
+G1 X34.35 Y-19.95 Z0.1
+G1 X36.36 Y-18.78 Z0.1
+G1 X36.36 Y-14.58 Z0.1
+G1 X33.24 Y-12.78 Z0.1
+G1 X33.24 Y-8.58 Z0.1
+G1 X36.36 Y-6.78 Z0.1
+G1 X36.36 Y-2.58 Z0.1
+G1 X33.24 Y-0.78 Z0.1
+G1 X33.24 Y3.42 Z0.1
+G1 X36.36 Y5.22 Z0.1
+G1 X36.36 Y9.42 Z0.1
+G1 X33.24 Y11.22 Z0.1
+G1 X33.24 Y15.42 Z0.1
+G1 X36.36 Y17.22 Z0.1
+G1 X36.36 Y19.95 Z0.1
+G1 X36.71 Y19.95 Z0.1
+G1 X36.71 Y17.22 Z0.1
+G1 X39.83 Y15.42 Z0.1
+G1 X39.83 Y11.22 Z0.1
+G1 X36.71 Y9.42 Z0.1
+G1 X36.71 Y5.22 Z0.1
+G1 X39.83 Y3.42 Z0.1
+G1 X39.83 Y-0.78 Z0.1
+G1 X36.71 Y-2.58 Z0.1
+G1 X36.71 Y-6.78 Z0.1
+G1 X39.83 Y-8.58 Z0.1
+G1 X39.83 Y-12.78 Z0.1
+G1 X36.71 Y-14.58 Z0.1
+G1 X36.71 Y-18.78 Z0.1
+G1 X38.72 Y-19.95 Z0.1
+T1
+G1 X36.21 Y-19.39 Z1.1
+G1 X39.39 Y-19.39 Z1.1
+G1 X39.39 Y18.41 Z1.1
+G1 X39.39 Y19.39 Z1.1
+G1 X-36.21 Y19.39 Z1.1
+G1 X-39.39 Y19.39 Z1.1
+G1 X-39.39 Y-18.41 Z1.1
+G1 X-39.39 Y-19.39 Z1.1
+G1 X36.21 Y-19.39 Z1.1
+G1 X36.21 Y-19.39 Z1.1
+G1 X-39.39 Y17.15 Z1.1
+G1 X-36.38 Y15.42 Z1.1
+G1 X-36.38 Y11.22 Z1.1
+G1 X-39.39 Y9.48 Z1.1
+G1 X-39.39 Y5.15 Z1.1
+G1 X-36.38 Y3.42 Z1.1
+G1 X-36.38 Y-0.78 Z1.1
+G1 X-39.39 Y-2.52 Z1.1
+G1 X-39.39 Y-6.85 Z1.1
+G1 X-36.38 Y-8.58 Z1.1
+G1 X-36.38 Y-12.78 Z1.1
+G1 X-39.39 Y-14.52 Z1.1
+G1 X-39.39 Y-18.85 Z1.1
+G1 X-38.45 Y-19.39 Z1.1
+G1 X-33.98 Y-19.39 Z1.1
+G1 X-32.92 Y-18.78 Z1.1
+G1 X-32.92 Y-14.58 Z1.1
+G1 X-36.04 Y-12.78 Z1.1
+G1 X-36.04 Y-8.58 Z1.1
+G1 X-32.92 Y-6.78 Z1.1
+G1 X-32.92 Y-2.58 Z1.1
+G1 X-36.04 Y-0.78 Z1.1
+G1 X-36.04 Y3.42 Z1.1
+G1 X-32.92 Y5.22 Z1.1
+G1 X-32.92 Y9.42 Z1.1
+G1 X-36.04 Y11.22 Z1.1
+G1 X-36.04 Y15.42 Z1.1
+G1 X-32.92 Y17.22 Z1.1
+G1 X-32.92 Y19.39 Z1.1
+G1 X-32.57 Y19.39 Z1.1
+G1 X-32.57 Y17.22 Z1.1
+G1 X-29.46 Y15.42 Z1.1
+G1 X-29.46 Y11.22 Z1.1
+G1 X-32.57 Y9.42 Z1.1
+G1 X-32.57 Y5.22 Z1.1
+G1 X-29.46 Y3.42 Z1.1
+G1 X-29.46 Y-0.78 Z1.1
+G1 X-32.57 Y-2.58 Z1.1
+G1 X-32.57 Y-6.78 Z1.1
+G1 X-29.46 Y-8.58 Z1.1
+G1 X-29.46 Y-12.78 Z1.1
+G1 X-32.57 Y-14.58 Z1.1
+G1 X-32.57 Y-18.78 Z1.1
+G1 X-31.52 Y-19.39 Z1.1
+G1 X-27.05 Y-19.39 Z1.1
+G1 X-25.99 Y-18.78 Z1.1
+G1 X-25.99 Y-14.58 Z1.1
+G1 X-29.11 Y-12.78 Z1.1
+G1 X-29.11 Y-8.58 Z1.1
+G1 X-25.99 Y-6.78 Z1.1
+G1 X-25.99 Y-2.58 Z1.1
+G1 X-29.11 Y-0.78 Z1.1
+G1 X-29.11 Y3.42 Z1.1
+G1 X-25.99 Y5.22 Z1.1
+G1 X-25.99 Y9.42 Z1.1
+G1 X-29.11 Y11.22 Z1.1
+G1 X-29.11 Y15.42 Z1.1
+G1 X-25.99 Y17.22 Z1.1
+G1 X-25.99 Y19.39 Z1.1
+G1 X-25.65 Y19.39 Z1.1
+G1 X-25.65 Y17.22 Z1.1
+G1 X-22.53 Y15.42 Z1.1
+G1 X-22.53 Y11.22 Z1.1
+G1 X-25.65 Y9.42 Z1.1
+G1 X-25.65 Y5.22 Z1.1
+G1 X-22.53 Y3.42 Z1.1
+G1 X-22.53 Y-0.78 Z1.1
+G1 X-25.65 Y-2.58 Z1.1
+G1 X-25.65 Y-6.78 Z1.1
+G1 X-22.53 Y-8.58 Z1.1
+G1 X-22.53 Y-12.78 Z1.1
+G1 X-25.65 Y-14.58 Z1.1
+G1 X-25.65 Y-18.78 Z1.1
+G1 X-24.59 Y-19.39 Z1.1
+G1 X-20.12 Y-19.39 Z1.1
+G1 X-19.06 Y-18.78 Z1.1
+G1 X-19.06 Y-14.58 Z1.1
+G1 X-22.18 Y-12.78 Z1.1
+G1 X-22.18 Y-8.58 Z1.1
+G1 X-19.06 Y-6.78 Z1.1
+G1 X-19.06 Y-2.58 Z1.1
+G1 X-22.18 Y-0.78 Z1.1
+G1 X-22.18 Y3.42 Z1.1
+G1 X-19.06 Y5.22 Z1.1
+G1 X-19.06 Y9.42 Z1.1
+G1 X-22.18 Y11.22 Z1.1
+G1 X-22.18 Y15.42 Z1.1
+G1 X-19.06 Y17.22 Z1.1
+G1 X-19.06 Y19.39 Z1.1
+G1 X-18.72 Y19.39 Z1.1
+G1 X-18.72 Y17.22 Z1.1
+G1 X-15.6 Y15.42 Z1.1
+G1 X-15.6 Y11.22 Z1.1
+G1 X-18.72 Y9.42 Z1.1
+G1 X-18.72 Y5.22 Z1.1
+G1 X-15.6 Y3.42 Z1.1
+G1 X-15.6 Y-0.78 Z1.1
+G1 X-18.72 Y-2.58 Z1.1
+G1 X-18.72 Y-6.78 Z1.1
+G1 X-15.6 Y-8.58 Z1.1
+G1 X-15.6 Y-12.78 Z1.1
+G1 X-18.72 Y-14.58 Z1.1
+G1 X-18.72 Y-18.78 Z1.1
+G1 X-17.66 Y-19.39 Z1.1
+G1 X-13.19 Y-19.39 Z1.1
+G1 X-12.14 Y-18.78 Z1.1
+G1 X-12.14 Y-14.58 Z1.1
+G1 X-15.25 Y-12.78 Z1.1
+G1 X-15.25 Y-8.58 Z1.1
+G1 X-12.14 Y-6.78 Z1.1
+G1 X-12.14 Y-2.58 Z1.1
+G1 X-15.25 Y-0.78 Z1.1
+G1 X-15.25 Y3.42 Z1.1
+G1 X-12.14 Y5.22 Z1.1
+G1 X-12.14 Y9.42 Z1.1
+G1 X-15.25 Y11.22 Z1.1
+G1 X-15.25 Y15.42 Z1.1
+G1 X-12.14 Y17.22 Z1.1
+G1 X-12.14 Y19.39 Z1.1
+G1 X-11.79 Y19.39 Z1.1
+G1 X-11.79 Y17.22 Z1.1
+G1 X-8.67 Y15.42 Z1.1
+G1 X-8.67 Y11.22 Z1.1
+G1 X-11.79 Y9.42 Z1.1
+G1 X-11.79 Y5.22 Z1.1
+G1 X-8.67 Y3.42 Z1.1
+G1 X-8.67 Y-0.78 Z1.1
+G1 X-11.79 Y-2.58 Z1.1
+G1 X-11.79 Y-6.78 Z1.1
+G1 X-8.67 Y-8.58 Z1.1
+G1 X-8.67 Y-12.78 Z1.1
+G1 X-11.79 Y-14.58 Z1.1
+G1 X-11.79 Y-18.78 Z1.1
+G1 X-10.73 Y-19.39 Z1.1
+G1 X-6.26 Y-19.39 Z1.1
+G1 X-5.21 Y-18.78 Z1.1
+G1 X-5.21 Y-14.58 Z1.1
+G1 X-8.32 Y-12.78 Z1.1
+G1 X-8.32 Y-8.58 Z1.1
+G1 X-5.21 Y-6.78 Z1.1
+G1 X-5.21 Y-2.58 Z1.1
+G1 X-8.32 Y-0.78 Z1.1
+G1 X-8.32 Y3.42 Z1.1
+G1 X-5.21 Y5.22 Z1.1
+G1 X-5.21 Y9.42 Z1.1
+G1 X-8.32 Y11.22 Z1.1
+G1 X-8.32 Y15.42 Z1.1
+G1 X-5.21 Y17.22 Z1.1
+G1 X-5.21 Y19.39 Z1.1
+G1 X-4.86 Y19.39 Z1.1
+G1 X-4.86 Y17.22 Z1.1
+G1 X-1.74 Y15.42 Z1.1
+G1 X-1.74 Y11.22 Z1.1
+G1 X-4.86 Y9.42 Z1.1
+G1 X-4.86 Y5.22 Z1.1
+G1 X-1.74 Y3.42 Z1.1
+G1 X-1.74 Y-0.78 Z1.1
+G1 X-4.86 Y-2.58 Z1.1
+G1 X-4.86 Y-6.78 Z1.1
+G1 X-1.74 Y-8.58 Z1.1
+G1 X-1.74 Y-12.78 Z1.1
+G1 X-4.86 Y-14.58 Z1.1
+G1 X-4.86 Y-18.78 Z1.1
+G1 X-3.81 Y-19.39 Z1.1
+G1 X0.67 Y-19.39 Z1.1
+G1 X1.72 Y-18.78 Z1.1
+G1 X1.72 Y-14.58 Z1.1
+G1 X-1.4 Y-12.78 Z1.1
+G1 X-1.4 Y-8.58 Z1.1
+G1 X1.72 Y-6.78 Z1.1
+G1 X1.72 Y-2.58 Z1.1
+G1 X-1.4 Y-0.78 Z1.1
+G1 X-1.4 Y3.42 Z1.1
+G1 X1.72 Y5.22 Z1.1
+G1 X1.72 Y9.42 Z1.1
+G1 X-1.4 Y11.22 Z1.1
+G1 X-1.4 Y15.42 Z1.1
+G1 X1.72 Y17.22 Z1.1
+G1 X1.72 Y19.39 Z1.1
+G1 X2.07 Y19.39 Z1.1
+G1 X2.07 Y17.22 Z1.1
+G1 X5.18 Y15.42 Z1.1
+G1 X5.18 Y11.22 Z1.1
+G1 X2.07 Y9.42 Z1.1
+G1 X2.07 Y5.22 Z1.1
+G1 X5.18 Y3.42 Z1.1
+G1 X5.18 Y-0.78 Z1.1
+G1 X2.07 Y-2.58 Z1.1
+G1 X2.07 Y-6.78 Z1.1
+G1 X5.18 Y-8.58 Z1.1
+G1 X5.18 Y-12.78 Z1.1
+G1 X2.07 Y-14.58 Z1.1
+G1 X2.07 Y-18.78 Z1.1
+G1 X3.12 Y-19.39 Z1.1
+G1 X7.59 Y-19.39 Z1.1
+G1 X8.65 Y-18.78 Z1.1
+G1 X8.65 Y-14.58 Z1.1
+G1 X5.53 Y-12.78 Z1.1
+G1 X5.53 Y-8.58 Z1.1
+G1 X8.65 Y-6.78 Z1.1
+G1 X8.65 Y-2.58 Z1.1
+G1 X5.53 Y-0.78 Z1.1
+G1 X5.53 Y3.42 Z1.1
+G1 X8.65 Y5.22 Z1.1
+G1 X8.65 Y9.42 Z1.1
+G1 X5.53 Y11.22 Z1.1
+G1 X5.53 Y15.42 Z1.1
+G1 X8.65 Y17.22 Z1.1
+G1 X8.65 Y19.39 Z1.1
+G1 X8.99 Y19.39 Z1.1
+G1 X8.99 Y17.22 Z1.1
+G1 X12.11 Y15.42 Z1.1
+G1 X12.11 Y11.22 Z1.1
+G1 X8.99 Y9.42 Z1.1
+G1 X8.99 Y5.22 Z1.1
+G1 X12.11 Y3.42 Z1.1
+G1 X12.11 Y-0.78 Z1.1
+G1 X8.99 Y-2.58 Z1.1
+G1 X8.99 Y-6.78 Z1.1
+G1 X12.11 Y-8.58 Z1.1
+G1 X12.11 Y-12.78 Z1.1
+G1 X8.99 Y-14.58 Z1.1
+G1 X8.99 Y-18.78 Z1.1
+G1 X10.05 Y-19.39 Z1.1
+G1 X14.52 Y-19.39 Z1.1
+G1 X15.58 Y-18.78 Z1.1
+G1 X15.58 Y-14.58 Z1.1
+G1 X12.46 Y-12.78 Z1.1
+G1 X12.46 Y-8.58 Z1.1
+G1 X15.58 Y-6.78 Z1.1
+G1 X15.58 Y-2.58 Z1.1
+G1 X12.46 Y-0.78 Z1.1
+G1 X12.46 Y3.42 Z1.1
+G1 X15.58 Y5.22 Z1.1
+G1 X15.58 Y9.42 Z1.1
+G1 X12.46 Y11.22 Z1.1
+G1 X12.46 Y15.42 Z1.1
+G1 X15.58 Y17.22 Z1.1
+G1 X15.58 Y19.39 Z1.1
+G1 X15.92 Y19.39 Z1.1
+G1 X15.92 Y17.22 Z1.1
+G1 X19.04 Y15.42 Z1.1
+G1 X19.04 Y11.22 Z1.1
+G1 X15.92 Y9.42 Z1.1
+G1 X15.92 Y5.22 Z1.1
+G1 X19.04 Y3.42 Z1.1
+G1 X19.04 Y-0.78 Z1.1
+G1 X15.92 Y-2.58 Z1.1
+G1 X15.92 Y-6.78 Z1.1
+G1 X19.04 Y-8.58 Z1.1
+G1 X19.04 Y-12.78 Z1.1
+G1 X15.92 Y-14.58 Z1.1
+G1 X15.92 Y-18.78 Z1.1
+G1 X16.98 Y-19.39 Z1.1
+G1 X21.45 Y-19.39 Z1.1
+G1 X22.5 Y-18.78 Z1.1
+G1 X22.5 Y-14.58 Z1.1
+G1 X19.39 Y-12.78 Z1.1
+G1 X19.39 Y-8.58 Z1.1
+G1 X22.5 Y-6.78 Z1.1
+G1 X22.5 Y-2.58 Z1.1
+G1 X19.39 Y-0.78 Z1.1
+G1 X19.39 Y3.42 Z1.1
+G1 X22.5 Y5.22 Z1.1
+G1 X22.5 Y9.42 Z1.1
+G1 X19.39 Y11.22 Z1.1
+G1 X19.39 Y15.42 Z1.1
+G1 X22.5 Y17.22 Z1.1
+G1 X22.5 Y19.39 Z1.1
+G1 X22.85 Y19.39 Z1.1
+G1 X22.85 Y17.22 Z1.1
+G1 X25.97 Y15.42 Z1.1
+G1 X25.97 Y11.22 Z1.1
+G1 X22.85 Y9.42 Z1.1
+G1 X22.85 Y5.22 Z1.1
+G1 X25.97 Y3.42 Z1.1
+G1 X25.97 Y-0.78 Z1.1
+G1 X22.85 Y-2.58 Z1.1
+G1 X22.85 Y-6.78 Z1.1
+G1 X25.97 Y-8.58 Z1.1
+G1 X25.97 Y-12.78 Z1.1
+G1 X22.85 Y-14.58 Z1.1
+G1 X22.85 Y-18.78 Z1.1
+G1 X23.91 Y-19.39 Z1.1
+G1 X28.38 Y-19.39 Z1.1
+G1 X29.43 Y-18.78 Z1.1
+G1 X29.43 Y-14.58 Z1.1
+G1 X26.32 Y-12.78 Z1.1
+G1 X26.32 Y-8.58 Z1.1
+G1 X29.43 Y-6.78 Z1.1
+G1 X29.43 Y-2.58 Z1.1
+G1 X26.32 Y-0.78 Z1.1
+G1 X26.32 Y3.42 Z1.1
+G1 X29.43 Y5.22 Z1.1
+G1 X29.43 Y9.42 Z1.1
+G1 X26.32 Y11.22 Z1.1
+G1 X26.32 Y15.42 Z1.1
+G1 X29.43 Y17.22 Z1.1
+G1 X29.43 Y19.39 Z1.1
+G1 X29.78 Y19.39 Z1.1
+G1 X29.78 Y17.22 Z1.1
+G1 X32.9 Y15.42 Z1.1
+G1 X32.9 Y11.22 Z1.1
+G1 X29.78 Y9.42 Z1.1
+G1 X29.78 Y5.22 Z1.1
+G1 X32.9 Y3.42 Z1.1
+G1 X32.9 Y-0.78 Z1.1
+G1 X29.78 Y-2.58 Z1.1
+G1 X29.78 Y-6.78 Z1.1
+G1 X32.9 Y-8.58 Z1.1
+G1 X32.9 Y-12.78 Z1.1
+G1 X29.78 Y-14.58 Z1.1
+G1 X29.78 Y-18.78 Z1.1
+G1 X30.84 Y-19.39 Z1.1
+G1 X35.31 Y-19.39 Z1.1
+G1 X36.36 Y-18.78 Z1.1
+G1 X36.36 Y-14.58 Z1.1
+G1 X33.24 Y-12.78 Z1.1
+G1 X33.24 Y-8.58 Z1.1
+G1 X36.36 Y-6.78 Z1.1
+G1 X36.36 Y-2.58 Z1.1
+G1 X33.24 Y-0.78 Z1.1
+G1 X33.24 Y3.42 Z1.1
+G1 X36.36 Y5.22 Z1.1
+G1 X36.36 Y9.42 Z1.1
+G1 X33.24 Y11.22 Z1.1
+G1 X33.24 Y15.42 Z1.1
+G1 X36.36 Y17.22 Z1.1
+G1 X36.36 Y19.39 Z1.1
+G1 X36.71 Y19.39 Z1.1
+G1 X36.71 Y17.22 Z1.1
+G1 X39.39 Y15.67 Z1.1
+G1 X39.39 Y10.97 Z1.1
+G1 X36.71 Y9.42 Z1.1
+G1 X36.71 Y5.22 Z1.1
+G1 X39.39 Y3.67 Z1.1
+G1 X39.39 Y-1.03 Z1.1
+G1 X36.71 Y-2.58 Z1.1
+G1 X36.71 Y-6.78 Z1.1
+G1 X39.39 Y-8.33 Z1.1
+G1 X39.39 Y-13.03 Z1.1
+G1 X36.71 Y-14.58 Z1.1
+G1 X36.71 Y-18.78 Z1.1
+G1 X37.76 Y-19.39 Z1.1
+T1
+G1 X32.76 Y-18.84 Z2.1
+G1 X38.84 Y-18.84 Z2.1
+G1 X38.84 Y16.96 Z2.1
+G1 X38.84 Y18.84 Z2.1
+G1 X-32.76 Y18.84 Z2.1
+G1 X-38.84 Y18.84 Z2.1
+G1 X-38.84 Y-16.96 Z2.1
+G1 X-38.84 Y-18.84 Z2.1
+G1 X32.76 Y-18.84 Z2.1
+G1 X32.76 Y-18.84 Z2.1
+G1 X-38.84 Y16.84 Z2.1
+G1 X-36.38 Y15.42 Z2.1
+G1 X-36.38 Y11.22 Z2.1
+G1 X-38.84 Y9.8 Z2.1
+G1 X-38.84 Y4.83 Z2.1
+G1 X-36.38 Y3.42 Z2.1
+G1 X-36.38 Y-0.78 Z2.1
+G1 X-38.84 Y-2.2 Z2.1
+G1 X-38.84 Y-7.17 Z2.1
+G1 X-36.38 Y-8.58 Z2.1
+G1 X-36.38 Y-12.78 Z2.1
+G1 X-38.84 Y-14.2 Z2.1
+G1 X-33.02 Y-18.84 Z2.1
+G1 X-32.92 Y-18.78 Z2.1
+G1 X-32.92 Y-14.58 Z2.1
+G1 X-36.04 Y-12.78 Z2.1
+G1 X-36.04 Y-8.58 Z2.1
+G1 X-32.92 Y-6.78 Z2.1
+G1 X-32.92 Y-2.58 Z2.1
+G1 X-36.04 Y-0.78 Z2.1
+G1 X-36.04 Y3.42 Z2.1
+G1 X-32.92 Y5.22 Z2.1
+G1 X-32.92 Y9.42 Z2.1
+G1 X-36.04 Y11.22 Z2.1
+G1 X-36.04 Y15.42 Z2.1
+G1 X-32.92 Y17.22 Z2.1
+G1 X-32.92 Y18.84 Z2.1
+G1 X-32.57 Y18.84 Z2.1
+G1 X-32.57 Y17.22 Z2.1
+G1 X-29.46 Y15.42 Z2.1
+G1 X-29.46 Y11.22 Z2.1
+G1 X-32.57 Y9.42 Z2.1
+G1 X-32.57 Y5.22 Z2.1
+G1 X-29.46 Y3.42 Z2.1
+G1 X-29.46 Y-0.78 Z2.1
+G1 X-32.57 Y-2.58 Z2.1
+G1 X-32.57 Y-6.78 Z2.1
+G1 X-29.46 Y-8.58 Z2.1
+G1 X-29.46 Y-12.78 Z2.1
+G1 X-32.57 Y-14.58 Z2.1
+G1 X-32.57 Y-18.78 Z2.1
+G1 X-32.48 Y-18.84 Z2.1
+G1 X-26.09 Y-18.84 Z2.1
+G1 X-25.99 Y-18.78 Z2.1
+G1 X-25.99 Y-14.58 Z2.1
+G1 X-29.11 Y-12.78 Z2.1
+G1 X-29.11 Y-8.58 Z2.1
+G1 X-25.99 Y-6.78 Z2.1
+G1 X-25.99 Y-2.58 Z2.1
+G1 X-29.11 Y-0.78 Z2.1
+G1 X-29.11 Y3.42 Z2.1
+G1 X-25.99 Y5.22 Z2.1
+G1 X-25.99 Y9.42 Z2.1
+G1 X-29.11 Y11.22 Z2.1
+G1 X-29.11 Y15.42 Z2.1
+G1 X-25.99 Y17.22 Z2.1
+G1 X-25.99 Y18.84 Z2.1
+G1 X-25.65 Y18.84 Z2.1
+G1 X-25.65 Y17.22 Z2.1
+G1 X-22.53 Y15.42 Z2.1
+G1 X-22.53 Y11.22 Z2.1
+G1 X-25.65 Y9.42 Z2.1
+G1 X-25.65 Y5.22 Z2.1
+G1 X-22.53 Y3.42 Z2.1
+G1 X-22.53 Y-0.78 Z2.1
+G1 X-25.65 Y-2.58 Z2.1
+G1 X-25.65 Y-6.78 Z2.1
+G1 X-22.53 Y-8.58 Z2.1
+G1 X-22.53 Y-12.78 Z2.1
+G1 X-25.65 Y-14.58 Z2.1
+G1 X-25.65 Y-18.78 Z2.1
+G1 X-25.55 Y-18.84 Z2.1
+G1 X-19.16 Y-18.84 Z2.1
+G1 X-19.06 Y-18.78 Z2.1
+G1 X-19.06 Y-14.58 Z2.1
+G1 X-22.18 Y-12.78 Z2.1
+G1 X-22.18 Y-8.58 Z2.1
+G1 X-19.06 Y-6.78 Z2.1
+G1 X-19.06 Y-2.58 Z2.1
+G1 X-22.18 Y-0.78 Z2.1
+G1 X-22.18 Y3.42 Z2.1
+G1 X-19.06 Y5.22 Z2.1
+G1 X-19.06 Y9.42 Z2.1
+G1 X-22.18 Y11.22 Z2.1
+G1 X-22.18 Y15.42 Z2.1
+G1 X-19.06 Y17.22 Z2.1
+G1 X-19.06 Y18.84 Z2.1
+G1 X-18.72 Y18.84 Z2.1
+G1 X-18.72 Y17.22 Z2.1
+G1 X-15.6 Y15.42 Z2.1
+G1 X-15.6 Y11.22 Z2.1
+G1 X-18.72 Y9.42 Z2.1
+G1 X-18.72 Y5.22 Z2.1
+G1 X-15.6 Y3.42 Z2.1
+G1 X-15.6 Y-0.78 Z2.1
+G1 X-18.72 Y-2.58 Z2.1
+G1 X-18.72 Y-6.78 Z2.1
+G1 X-15.6 Y-8.58 Z2.1
+G1 X-15.6 Y-12.78 Z2.1
+G1 X-18.72 Y-14.58 Z2.1
+G1 X-18.72 Y-18.78 Z2.1
+G1 X-18.62 Y-18.84 Z2.1
+G1 X-12.23 Y-18.84 Z2.1
+G1 X-12.14 Y-18.78 Z2.1
+G1 X-12.14 Y-14.58 Z2.1
+G1 X-15.25 Y-12.78 Z2.1
+G1 X-15.25 Y-8.58 Z2.1
+G1 X-12.14 Y-6.78 Z2.1
+G1 X-12.14 Y-2.58 Z2.1
+G1 X-15.25 Y-0.78 Z2.1
+G1 X-15.25 Y3.42 Z2.1
+G1 X-12.14 Y5.22 Z2.1
+G1 X-12.14 Y9.42 Z2.1
+G1 X-15.25 Y11.22 Z2.1
+G1 X-15.25 Y15.42 Z2.1
+G1 X-12.14 Y17.22 Z2.1
+G1 X-12.14 Y18.84 Z2.1
+G1 X-11.79 Y18.84 Z2.1
+G1 X-11.79 Y17.22 Z2.1
+G1 X-8.67 Y15.42 Z2.1
+G1 X-8.67 Y11.22 Z2.1
+G1 X-11.79 Y9.42 Z2.1
+G1 X-11.79 Y5.22 Z2.1
+G1 X-8.67 Y3.42 Z2.1
+G1 X-8.67 Y-0.78 Z2.1
+G1 X-11.79 Y-2.58 Z2.1
+G1 X-11.79 Y-6.78 Z2.1
+G1 X-8.67 Y-8.58 Z2.1
+G1 X-8.67 Y-12.78 Z2.1
+G1 X-11.79 Y-14.58 Z2.1
+G1 X-11.79 Y-18.78 Z2.1
+G1 X-11.69 Y-18.84 Z2.1
+G1 X-5.3 Y-18.84 Z2.1
+G1 X-5.21 Y-18.78 Z2.1
+G1 X-5.21 Y-14.58 Z2.1
+G1 X-8.32 Y-12.78 Z2.1
+G1 X-8.32 Y-8.58 Z2.1
+G1 X-5.21 Y-6.78 Z2.1
+G1 X-5.21 Y-2.58 Z2.1
+G1 X-8.32 Y-0.78 Z2.1
+G1 X-8.32 Y3.42 Z2.1
+G1 X-5.21 Y5.22 Z2.1
+G1 X-5.21 Y9.42 Z2.1
+G1 X-8.32 Y11.22 Z2.1
+G1 X-8.32 Y15.42 Z2.1
+G1 X-5.21 Y17.22 Z2.1
+G1 X-5.21 Y18.84 Z2.1
+G1 X-4.86 Y18.84 Z2.1
+G1 X-4.86 Y17.22 Z2.1
+G1 X-1.74 Y15.42 Z2.1
+G1 X-1.74 Y11.22 Z2.1
+G1 X-4.86 Y9.42 Z2.1
+G1 X-4.86 Y5.22 Z2.1
+G1 X-1.74 Y3.42 Z2.1
+G1 X-1.74 Y-0.78 Z2.1
+G1 X-4.86 Y-2.58 Z2.1
+G1 X-4.86 Y-6.78 Z2.1
+G1 X-1.74 Y-8.58 Z2.1
+G1 X-1.74 Y-12.78 Z2.1
+G1 X-4.86 Y-14.58 Z2.1
+G1 X-4.86 Y-18.78 Z2.1
+G1 X-4.77 Y-18.84 Z2.1
+G1 X1.63 Y-18.84 Z2.1
+G1 X1.72 Y-18.78 Z2.1
+G1 X1.72 Y-14.58 Z2.1
+G1 X-1.4 Y-12.78 Z2.1
+G1 X-1.4 Y-8.58 Z2.1
+G1 X1.72 Y-6.78 Z2.1
+G1 X1.72 Y-2.58 Z2.1
+G1 X-1.4 Y-0.78 Z2.1
+G1 X-1.4 Y3.42 Z2.1
+G1 X1.72 Y5.22 Z2.1
+G1 X1.72 Y9.42 Z2.1
+G1 X-1.4 Y11.22 Z2.1
+G1 X-1.4 Y15.42 Z2.1
+G1 X1.72 Y17.22 Z2.1
+G1 X1.72 Y18.84 Z2.1
+G1 X2.07 Y18.84 Z2.1
+G1 X2.07 Y17.22 Z2.1
+G1 X5.18 Y15.42 Z2.1
+G1 X5.18 Y11.22 Z2.1
+G1 X2.07 Y9.42 Z2.1
+G1 X2.07 Y5.22 Z2.1
+G1 X5.18 Y3.42 Z2.1
+G1 X5.18 Y-0.78 Z2.1
+G1 X2.07 Y-2.58 Z2.1
+G1 X2.07 Y-6.78 Z2.1
+G1 X5.18 Y-8.58 Z2.1
+G1 X5.18 Y-12.78 Z2.1
+G1 X2.07 Y-14.58 Z2.1
+G1 X2.07 Y-18.78 Z2.1
+G1 X2.16 Y-18.84 Z2.1
+G1 X8.55 Y-18.84 Z2.1
+G1 X8.65 Y-18.78 Z2.1
+G1 X8.65 Y-14.58 Z2.1
+G1 X5.53 Y-12.78 Z2.1
+G1 X5.53 Y-8.58 Z2.1
+G1 X8.65 Y-6.78 Z2.1
+G1 X8.65 Y-2.58 Z2.1
+G1 X5.53 Y-0.78 Z2.1
+G1 X5.53 Y3.42 Z2.1
+G1 X8.65 Y5.22 Z2.1
+G1 X8.65 Y9.42 Z2.1
+G1 X5.53 Y11.22 Z2.1
+G1 X5.53 Y15.42 Z2.1
+G1 X8.65 Y17.22 Z2.1
+G1 X8.65 Y18.84 Z2.1
+G1 X8.99 Y18.84 Z2.1
+G1 X8.99 Y17.22 Z2.1
+G1 X12.11 Y15.42 Z2.1
+G1 X12.11 Y11.22 Z2.1
+G1 X8.99 Y9.42 Z2.1
+G1 X8.99 Y5.22 Z2.1
+G1 X12.11 Y3.42 Z2.1
+G1 X12.11 Y-0.78 Z2.1
+G1 X8.99 Y-2.58 Z2.1
+G1 X8.99 Y-6.78 Z2.1
+G1 X12.11 Y-8.58 Z2.1
+G1 X12.11 Y-12.78 Z2.1
+G1 X8.99 Y-14.58 Z2.1
+G1 X8.99 Y-18.78 Z2.1
+G1 X9.09 Y-18.84 Z2.1
+G1 X15.48 Y-18.84 Z2.1
+G1 X15.58 Y-18.78 Z2.1
+G1 X15.58 Y-14.58 Z2.1
+G1 X12.46 Y-12.78 Z2.1
+G1 X12.46 Y-8.58 Z2.1
+G1 X15.58 Y-6.78 Z2.1
+G1 X15.58 Y-2.58 Z2.1
+G1 X12.46 Y-0.78 Z2.1
+G1 X12.46 Y3.42 Z2.1
+G1 X15.58 Y5.22 Z2.1
+G1 X15.58 Y9.42 Z2.1
+G1 X12.46 Y11.22 Z2.1
+G1 X12.46 Y15.42 Z2.1
+G1 X15.58 Y17.22 Z2.1
+G1 X15.58 Y18.84 Z2.1
+G1 X15.92 Y18.84 Z2.1
+G1 X15.92 Y17.22 Z2.1
+G1 X19.04 Y15.42 Z2.1
+G1 X19.04 Y11.22 Z2.1
+G1 X15.92 Y9.42 Z2.1
+G1 X15.92 Y5.22 Z2.1
+G1 X19.04 Y3.42 Z2.1
+G1 X19.04 Y-0.78 Z2.1
+G1 X15.92 Y-2.58 Z2.1
+G1 X15.92 Y-6.78 Z2.1
+G1 X19.04 Y-8.58 Z2.1
+G1 X19.04 Y-12.78 Z2.1
+G1 X15.92 Y-14.58 Z2.1
+G1 X15.92 Y-18.78 Z2.1
+G1 X16.02 Y-18.84 Z2.1
+G1 X22.41 Y-18.84 Z2.1
+G1 X22.5 Y-18.78 Z2.1
+G1 X22.5 Y-14.58 Z2.1
+G1 X19.39 Y-12.78 Z2.1
+G1 X19.39 Y-8.58 Z2.1
+G1 X22.5 Y-6.78 Z2.1
+G1 X22.5 Y-2.58 Z2.1
+G1 X19.39 Y-0.78 Z2.1
+G1 X19.39 Y3.42 Z2.1
+G1 X22.5 Y5.22 Z2.1
+G1 X22.5 Y9.42 Z2.1
+G1 X19.39 Y11.22 Z2.1
+G1 X19.39 Y15.42 Z2.1
+G1 X22.5 Y17.22 Z2.1
+G1 X22.5 Y18.84 Z2.1
+G1 X22.85 Y18.84 Z2.1
+G1 X22.85 Y17.22 Z2.1
+G1 X25.97 Y15.42 Z2.1
+G1 X25.97 Y11.22 Z2.1
+G1 X22.85 Y9.42 Z2.1
+G1 X22.85 Y5.22 Z2.1
+G1 X25.97 Y3.42 Z2.1
+G1 X25.97 Y-0.78 Z2.1
+G1 X22.85 Y-2.58 Z2.1
+G1 X22.85 Y-6.78 Z2.1
+G1 X25.97 Y-8.58 Z2.1
+G1 X25.97 Y-12.78 Z2.1
+G1 X22.85 Y-14.58 Z2.1
+G1 X22.85 Y-18.78 Z2.1
+G1 X22.95 Y-18.84 Z2.1
+G1 X29.34 Y-18.84 Z2.1
+G1 X29.43 Y-18.78 Z2.1
+G1 X29.43 Y-14.58 Z2.1
+G1 X26.32 Y-12.78 Z2.1
+G1 X26.32 Y-8.58 Z2.1
+G1 X29.43 Y-6.78 Z2.1
+G1 X29.43 Y-2.58 Z2.1
+G1 X26.32 Y-0.78 Z2.1
+G1 X26.32 Y3.42 Z2.1
+G1 X29.43 Y5.22 Z2.1
+G1 X29.43 Y9.42 Z2.1
+G1 X26.32 Y11.22 Z2.1
+G1 X26.32 Y15.42 Z2.1
+G1 X29.43 Y17.22 Z2.1
+G1 X29.43 Y18.84 Z2.1
+G1 X29.78 Y18.84 Z2.1
+G1 X29.78 Y17.22 Z2.1
+G1 X32.9 Y15.42 Z2.1
+G1 X32.9 Y11.22 Z2.1
+G1 X29.78 Y9.42 Z2.1
+G1 X29.78 Y5.22 Z2.1
+G1 X32.9 Y3.42 Z2.1
+G1 X32.9 Y-0.78 Z2.1
+G1 X29.78 Y-2.58 Z2.1
+G1 X29.78 Y-6.78 Z2.1
+G1 X32.9 Y-8.58 Z2.1
+G1 X32.9 Y-12.78 Z2.1
+G1 X29.78 Y-14.58 Z2.1
+G1 X29.78 Y-18.78 Z2.1
+G1 X29.88 Y-18.84 Z2.1
+G1 X36.27 Y-18.84 Z2.1
+G1 X36.36 Y-18.78 Z2.1
+G1 X36.36 Y-14.58 Z2.1
+G1 X33.24 Y-12.78 Z2.1
+G1 X33.24 Y-8.58 Z2.1
+G1 X36.36 Y-6.78 Z2.1
+G1 X36.36 Y-2.58 Z2.1
+G1 X33.24 Y-0.78 Z2.1
+G1 X33.24 Y3.42 Z2.1
+G1 X36.36 Y5.22 Z2.1
+G1 X36.36 Y9.42 Z2.1
+G1 X33.24 Y11.22 Z2.1
+G1 X33.24 Y15.42 Z2.1
+G1 X36.36 Y17.22 Z2.1
+G1 X36.36 Y18.84 Z2.1
+G1 X36.71 Y18.84 Z2.1
+G1 X36.71 Y17.22 Z2.1
+G1 X38.84 Y15.99 Z2.1
+G1 X38.84 Y10.65 Z2.1
+G1 X36.71 Y9.42 Z2.1
+G1 X36.71 Y5.22 Z2.1
+G1 X38.84 Y3.99 Z2.1
+G1 X38.84 Y-1.35 Z2.1
+G1 X36.71 Y-2.58 Z2.1
+G1 X36.71 Y-6.78 Z2.1
+G1 X38.84 Y-8.01 Z2.1
+G1 X38.84 Y-13.35 Z2.1
+G1 X36.71 Y-14.58 Z2.1
+G1 X36.71 Y-18.78 Z2.1
+G1 X36.8 Y-18.84 Z2.1
+T1
+G1 X29.32 Y-18.28 Z3.1
+G1 X38.28 Y-18.28 Z3.1
+G1 X38.28 Y15.52 Z3.1
+G1 X38.28 Y18.28 Z3.1
+G1 X-29.32 Y18.28 Z3.1
+G1 X-38.28 Y18.28 Z3.1
+G1 X-38.28 Y-15.52 Z3.1
+G1 X-38.28 Y-18.28 Z3.1
+G1 X29.32 Y-18.28 Z3.1
+G1 X29.32 Y-18.28 Z3.1
+G1 X-38.28 Y16.52 Z3.1
+G1 X-36.38 Y15.42 Z3.1
+G1 X-36.38 Y11.22 Z3.1
+G1 X-38.28 Y10.12 Z3.1
+G1 X-38.28 Y4.51 Z3.1
+G1 X-36.38 Y3.42 Z3.1
+G1 X-36.38 Y-0.78 Z3.1
+G1 X-38.28 Y-1.88 Z3.1
+G1 X-38.28 Y-7.49 Z3.1
+G1 X-36.38 Y-8.58 Z3.1
+G1 X-36.38 Y-12.78 Z3.1
+G1 X-38.28 Y-13.88 Z3.1
+G1 X-32.92 Y-18.28 Z3.1
+G1 X-32.92 Y-14.58 Z3.1
+G1 X-36.04 Y-12.78 Z3.1
+G1 X-36.04 Y-8.58 Z3.1
+G1 X-32.92 Y-6.78 Z3.1
+G1 X-32.92 Y-2.58 Z3.1
+G1 X-36.04 Y-0.78 Z3.1
+G1 X-36.04 Y3.42 Z3.1
+G1 X-32.92 Y5.22 Z3.1
+G1 X-32.92 Y9.42 Z3.1
+G1 X-36.04 Y11.22 Z3.1
+G1 X-36.04 Y15.42 Z3.1
+G1 X-32.92 Y17.22 Z3.1
+G1 X-32.92 Y18.28 Z3.1
+G1 X-32.57 Y18.28 Z3.1
+G1 X-32.57 Y17.22 Z3.1
+G1 X-29.46 Y15.42 Z3.1
+G1 X-29.46 Y11.22 Z3.1
+G1 X-32.57 Y9.42 Z3.1
+G1 X-32.57 Y5.22 Z3.1
+G1 X-29.46 Y3.42 Z3.1
+G1 X-29.46 Y-0.78 Z3.1
+G1 X-32.57 Y-2.58 Z3.1
+G1 X-32.57 Y-6.78 Z3.1
+G1 X-29.46 Y-8.58 Z3.1
+G1 X-29.46 Y-12.78 Z3.1
+G1 X-32.57 Y-14.58 Z3.1
+G1 X-32.57 Y-18.28 Z3.1
+G1 X-25.99 Y-18.28 Z3.1
+G1 X-25.99 Y-14.58 Z3.1
+G1 X-29.11 Y-12.78 Z3.1
+G1 X-29.11 Y-8.58 Z3.1
+G1 X-25.99 Y-6.78 Z3.1
+G1 X-25.99 Y-2.58 Z3.1
+G1 X-29.11 Y-0.78 Z3.1
+G1 X-29.11 Y3.42 Z3.1
+G1 X-25.99 Y5.22 Z3.1
+G1 X-25.99 Y9.42 Z3.1
+G1 X-29.11 Y11.22 Z3.1
+G1 X-29.11 Y15.42 Z3.1
+G1 X-25.99 Y17.22 Z3.1
+G1 X-25.99 Y18.28 Z3.1
+G1 X-25.65 Y18.28 Z3.1
+G1 X-25.65 Y17.22 Z3.1
+G1 X-22.53 Y15.42 Z3.1
+G1 X-22.53 Y11.22 Z3.1
+G1 X-25.65 Y9.42 Z3.1
+G1 X-25.65 Y5.22 Z3.1
+G1 X-22.53 Y3.42 Z3.1
+G1 X-22.53 Y-0.78 Z3.1
+G1 X-25.65 Y-2.58 Z3.1
+G1 X-25.65 Y-6.78 Z3.1
+G1 X-22.53 Y-8.58 Z3.1
+G1 X-22.53 Y-12.78 Z3.1
+G1 X-25.65 Y-14.58 Z3.1
+G1 X-25.65 Y-18.28 Z3.1
+G1 X-19.06 Y-18.28 Z3.1
+G1 X-19.06 Y-14.58 Z3.1
+G1 X-22.18 Y-12.78 Z3.1
+G1 X-22.18 Y-8.58 Z3.1
+G1 X-19.06 Y-6.78 Z3.1
+G1 X-19.06 Y-2.58 Z3.1
+G1 X-22.18 Y-0.78 Z3.1
+G1 X-22.18 Y3.42 Z3.1
+G1 X-19.06 Y5.22 Z3.1
+G1 X-19.06 Y9.42 Z3.1
+G1 X-22.18 Y11.22 Z3.1
+G1 X-22.18 Y15.42 Z3.1
+G1 X-19.06 Y17.22 Z3.1
+G1 X-19.06 Y18.28 Z3.1
+G1 X-18.72 Y18.28 Z3.1
+G1 X-18.72 Y17.22 Z3.1
+G1 X-15.6 Y15.42 Z3.1
+G1 X-15.6 Y11.22 Z3.1
+G1 X-18.72 Y9.42 Z3.1
+G1 X-18.72 Y5.22 Z3.1
+G1 X-15.6 Y3.42 Z3.1
+G1 X-15.6 Y-0.78 Z3.1
+G1 X-18.72 Y-2.58 Z3.1
+G1 X-18.72 Y-6.78 Z3.1
+G1 X-15.6 Y-8.58 Z3.1
+G1 X-15.6 Y-12.78 Z3.1
+G1 X-18.72 Y-14.58 Z3.1
+G1 X-18.72 Y-18.28 Z3.1
+G1 X-12.14 Y-18.28 Z3.1
+G1 X-12.14 Y-14.58 Z3.1
+G1 X-15.25 Y-12.78 Z3.1
+G1 X-15.25 Y-8.58 Z3.1
+G1 X-12.14 Y-6.78 Z3.1
+G1 X-12.14 Y-2.58 Z3.1
+G1 X-15.25 Y-0.78 Z3.1
+G1 X-15.25 Y3.42 Z3.1
+G1 X-12.14 Y5.22 Z3.1
+G1 X-12.14 Y9.42 Z3.1
+G1 X-15.25 Y11.22 Z3.1
+G1 X-15.25 Y15.42 Z3.1
+G1 X-12.14 Y17.22 Z3.1
+G1 X-12.14 Y18.28 Z3.1
+G1 X-11.79 Y18.28 Z3.1
+G1 X-11.79 Y17.22 Z3.1
+G1 X-8.67 Y15.42 Z3.1
+G1 X-8.67 Y11.22 Z3.1
+G1 X-11.79 Y9.42 Z3.1
+G1 X-11.79 Y5.22 Z3.1
+G1 X-8.67 Y3.42 Z3.1
+G1 X-8.67 Y-0.78 Z3.1
+G1 X-11.79 Y-2.58 Z3.1
+G1 X-11.79 Y-6.78 Z3.1
+G1 X-8.67 Y-8.58 Z3.1
+G1 X-8.67 Y-12.78 Z3.1
+G1 X-11.79 Y-14.58 Z3.1
+G1 X-11.79 Y-18.28 Z3.1
+G1 X-5.21 Y-18.28 Z3.1
+G1 X-5.21 Y-14.58 Z3.1
+G1 X-8.32 Y-12.78 Z3.1
+G1 X-8.32 Y-8.58 Z3.1
+G1 X-5.21 Y-6.78 Z3.1
+G1 X-5.21 Y-2.58 Z3.1
+G1 X-8.32 Y-0.78 Z3.1
+G1 X-8.32 Y3.42 Z3.1
+G1 X-5.21 Y5.22 Z3.1
+G1 X-5.21 Y9.42 Z3.1
+G1 X-8.32 Y11.22 Z3.1
+G1 X-8.32 Y15.42 Z3.1
+G1 X-5.21 Y17.22 Z3.1
+G1 X-5.21 Y18.28 Z3.1
+G1 X-4.86 Y18.28 Z3.1
+G1 X-4.86 Y17.22 Z3.1
+G1 X-1.74 Y15.42 Z3.1
+G1 X-1.74 Y11.22 Z3.1
+G1 X-4.86 Y9.42 Z3.1
+G1 X-4.86 Y5.22 Z3.1
+G1 X-1.74 Y3.42 Z3.1
+G1 X-1.74 Y-0.78 Z3.1
+G1 X-4.86 Y-2.58 Z3.1
+G1 X-4.86 Y-6.78 Z3.1
+G1 X-1.74 Y-8.58 Z3.1
+G1 X-1.74 Y-12.78 Z3.1
+G1 X-4.86 Y-14.58 Z3.1
+G1 X-4.86 Y-18.28 Z3.1
+G1 X1.72 Y-18.28 Z3.1
+G1 X1.72 Y-14.58 Z3.1
+G1 X-1.4 Y-12.78 Z3.1
+G1 X-1.4 Y-8.58 Z3.1
+G1 X1.72 Y-6.78 Z3.1
+G1 X1.72 Y-2.58 Z3.1
+G1 X-1.4 Y-0.78 Z3.1
+G1 X-1.4 Y3.42 Z3.1
+G1 X1.72 Y5.22 Z3.1
+G1 X1.72 Y9.42 Z3.1
+G1 X-1.4 Y11.22 Z3.1
+G1 X-1.4 Y15.42 Z3.1
+G1 X1.72 Y17.22 Z3.1
+G1 X1.72 Y18.28 Z3.1
+G1 X2.07 Y18.28 Z3.1
+G1 X2.07 Y17.22 Z3.1
+G1 X5.18 Y15.42 Z3.1
+G1 X5.18 Y11.22 Z3.1
+G1 X2.07 Y9.42 Z3.1
+G1 X2.07 Y5.22 Z3.1
+G1 X5.18 Y3.42 Z3.1
+G1 X5.18 Y-0.78 Z3.1
+G1 X2.07 Y-2.58 Z3.1
+G1 X2.07 Y-6.78 Z3.1
+G1 X5.18 Y-8.58 Z3.1
+G1 X5.18 Y-12.78 Z3.1
+G1 X2.07 Y-14.58 Z3.1
+G1 X2.07 Y-18.28 Z3.1
+G1 X8.65 Y-18.28 Z3.1
+G1 X8.65 Y-14.58 Z3.1
+G1 X5.53 Y-12.78 Z3.1
+G1 X5.53 Y-8.58 Z3.1
+G1 X8.65 Y-6.78 Z3.1
+G1 X8.65 Y-2.58 Z3.1
+G1 X5.53 Y-0.78 Z3.1
+G1 X5.53 Y3.42 Z3.1
+G1 X8.65 Y5.22 Z3.1
+G1 X8.65 Y9.42 Z3.1
+G1 X5.53 Y11.22 Z3.1
+G1 X5.53 Y15.42 Z3.1
+G1 X8.65 Y17.22 Z3.1
+G1 X8.65 Y18.28 Z3.1
+G1 X8.99 Y18.28 Z3.1
+G1 X8.99 Y17.22 Z3.1
+G1 X12.11 Y15.42 Z3.1
+G1 X12.11 Y11.22 Z3.1
+G1 X8.99 Y9.42 Z3.1
+G1 X8.99 Y5.22 Z3.1
+G1 X12.11 Y3.42 Z3.1
+G1 X12.11 Y-0.78 Z3.1
+G1 X8.99 Y-2.58 Z3.1
+G1 X8.99 Y-6.78 Z3.1
+G1 X12.11 Y-8.58 Z3.1
+G1 X12.11 Y-12.78 Z3.1
+G1 X8.99 Y-14.58 Z3.1
+G1 X8.99 Y-18.28 Z3.1
+G1 X15.58 Y-18.28 Z3.1
+G1 X15.58 Y-14.58 Z3.1
+G1 X12.46 Y-12.78 Z3.1
+G1 X12.46 Y-8.58 Z3.1
+G1 X15.58 Y-6.78 Z3.1
+G1 X15.58 Y-2.58 Z3.1
+G1 X12.46 Y-0.78 Z3.1
+G1 X12.46 Y3.42 Z3.1
+G1 X15.58 Y5.22 Z3.1
+G1 X15.58 Y9.42 Z3.1
+G1 X12.46 Y11.22 Z3.1
+G1 X12.46 Y15.42 Z3.1
+G1 X15.58 Y17.22 Z3.1
+G1 X15.58 Y18.28 Z3.1
+G1 X15.92 Y18.28 Z3.1
+G1 X15.92 Y17.22 Z3.1
+G1 X19.04 Y15.42 Z3.1
+G1 X19.04 Y11.22 Z3.1
+G1 X15.92 Y9.42 Z3.1
+G1 X15.92 Y5.22 Z3.1
+G1 X19.04 Y3.42 Z3.1
+G1 X19.04 Y-0.78 Z3.1
+G1 X15.92 Y-2.58 Z3.1
+G1 X15.92 Y-6.78 Z3.1
+G1 X19.04 Y-8.58 Z3.1
+G1 X19.04 Y-12.78 Z3.1
+G1 X15.92 Y-14.58 Z3.1
+G1 X15.92 Y-18.28 Z3.1
+G1 X22.5 Y-18.28 Z3.1
+G1 X22.5 Y-14.58 Z3.1
+G1 X19.39 Y-12.78 Z3.1
+G1 X19.39 Y-8.58 Z3.1
+G1 X22.5 Y-6.78 Z3.1
+G1 X22.5 Y-2.58 Z3.1
+G1 X19.39 Y-0.78 Z3.1
+G1 X19.39 Y3.42 Z3.1
+G1 X22.5 Y5.22 Z3.1
+G1 X22.5 Y9.42 Z3.1
+G1 X19.39 Y11.22 Z3.1
+G1 X19.39 Y15.42 Z3.1
+G1 X22.5 Y17.22 Z3.1
+G1 X22.5 Y18.28 Z3.1
+G1 X22.85 Y18.28 Z3.1
+G1 X22.85 Y17.22 Z3.1
+G1 X25.97 Y15.42 Z3.1
+G1 X25.97 Y11.22 Z3.1
+G1 X22.85 Y9.42 Z3.1
+G1 X22.85 Y5.22 Z3.1
+G1 X25.97 Y3.42 Z3.1
+G1 X25.97 Y-0.78 Z3.1
+G1 X22.85 Y-2.58 Z3.1
+G1 X22.85 Y-6.78 Z3.1
+G1 X25.97 Y-8.58 Z3.1
+G1 X25.97 Y-12.78 Z3.1
+G1 X22.85 Y-14.58 Z3.1
+G1 X22.85 Y-18.28 Z3.1
+G1 X29.43 Y-18.28 Z3.1
+G1 X29.43 Y-14.58 Z3.1
+G1 X26.32 Y-12.78 Z3.1
+G1 X26.32 Y-8.58 Z3.1
+G1 X29.43 Y-6.78 Z3.1
+G1 X29.43 Y-2.58 Z3.1
+G1 X26.32 Y-0.78 Z3.1
+G1 X26.32 Y3.42 Z3.1
+G1 X29.43 Y5.22 Z3.1
+G1 X29.43 Y9.42 Z3.1
+G1 X26.32 Y11.22 Z3.1
+G1 X26.32 Y15.42 Z3.1
+G1 X29.43 Y17.22 Z3.1
+G1 X29.43 Y18.28 Z3.1
+G1 X29.78 Y18.28 Z3.1
+G1 X29.78 Y17.22 Z3.1
+G1 X32.9 Y15.42 Z3.1
+G1 X32.9 Y11.22 Z3.1
+G1 X29.78 Y9.42 Z3.1
+G1 X29.78 Y5.22 Z3.1
+G1 X32.9 Y3.42 Z3.1
+G1 X32.9 Y-0.78 Z3.1
+G1 X29.78 Y-2.58 Z3.1
+G1 X29.78 Y-6.78 Z3.1
+G1 X32.9 Y-8.58 Z3.1
+G1 X32.9 Y-12.78 Z3.1
+G1 X29.78 Y-14.58 Z3.1
+G1 X29.78 Y-18.28 Z3.1
+G1 X36.36 Y-18.28 Z3.1
+G1 X36.36 Y-14.58 Z3.1
+G1 X33.24 Y-12.78 Z3.1
+G1 X33.24 Y-8.58 Z3.1
+G1 X36.36 Y-6.78 Z3.1
+G1 X36.36 Y-2.58 Z3.1
+G1 X33.24 Y-0.78 Z3.1
+G1 X33.24 Y3.42 Z3.1
+G1 X36.36 Y5.22 Z3.1
+G1 X36.36 Y9.42 Z3.1
+G1 X33.24 Y11.22 Z3.1
+G1 X33.24 Y15.42 Z3.1
+G1 X36.36 Y17.22 Z3.1
+G1 X36.36 Y18.28 Z3.1
+G1 X36.71 Y18.28 Z3.1
+G1 X36.71 Y17.22 Z3.1
+G1 X38.28 Y16.31 Z3.1
+G1 X38.28 Y10.33 Z3.1
+G1 X36.71 Y9.42 Z3.1
+G1 X36.71 Y5.22 Z3.1
+G1 X38.28 Y4.31 Z3.1
+G1 X38.28 Y-1.67 Z3.1
+G1 X36.71 Y-2.58 Z3.1
+G1 X36.71 Y-6.78 Z3.1
+G1 X38.28 Y-7.69 Z3.1
+G1 X38.28 Y-13.67 Z3.1
+G1 X36.71 Y-14.58 Z3.1
+G1 X36.71 Y-18.28 Z3.1
+T1
+G1 X25.87 Y-17.73 Z4.1
+G1 X37.73 Y-17.73 Z4.1
+G1 X37.73 Y14.07 Z4.1
+G1 X37.73 Y17.73 Z4.1
+G1 X-25.87 Y17.73 Z4.1
+G1 X-37.73 Y17.73 Z4.1
+G1 X-37.73 Y-14.07 Z4.1
+G1 X-37.73 Y-17.73 Z4.1
+G1 X25.87 Y-17.73 Z4.1
+G1 X25.87 Y-17.73 Z4.1
+G1 X-37.73 Y16.19 Z4.1
+G1 X-36.38 Y15.42 Z4.1
+G1 X-36.38 Y11.22 Z4.1
+G1 X-37.73 Y10.44 Z4.1
+G1 X-37.73 Y4.19 Z4.1
+G1 X-36.38 Y3.42 Z4.1
+G1 X-36.38 Y-0.78 Z4.1
+G1 X-37.73 Y-1.56 Z4.1
+G1 X-37.73 Y-7.81 Z4.1
+G1 X-36.38 Y-8.58 Z4.1
+G1 X-36.38 Y-12.78 Z4.1
+G1 X-37.73 Y-13.56 Z4.1
+G1 X-32.92 Y-17.73 Z4.1
+G1 X-32.92 Y-14.58 Z4.1
+G1 X-36.04 Y-12.78 Z4.1
+G1 X-36.04 Y-8.58 Z4.1
+G1 X-32.92 Y-6.78 Z4.1
+G1 X-32.92 Y-2.58 Z4.1
+G1 X-36.04 Y-0.78 Z4.1
+G1 X-36.04 Y3.42 Z4.1
+G1 X-32.92 Y5.22 Z4.1
+G1 X-32.92 Y9.42 Z4.1
+G1 X-36.04 Y11.22 Z4.1
+G1 X-36.04 Y15.42 Z4.1
+G1 X-32.92 Y17.22 Z4.1
+G1 X-32.92 Y17.73 Z4.1
+G1 X-32.57 Y17.73 Z4.1
+G1 X-32.57 Y17.22 Z4.1
+G1 X-29.46 Y15.42 Z4.1
+G1 X-29.46 Y11.22 Z4.1
+G1 X-32.57 Y9.42 Z4.1
+G1 X-32.57 Y5.22 Z4.1
+G1 X-29.46 Y3.42 Z4.1
+G1 X-29.46 Y-0.78 Z4.1
+G1 X-32.57 Y-2.58 Z4.1
+G1 X-32.57 Y-6.78 Z4.1
+G1 X-29.46 Y-8.58 Z4.1
+G1 X-29.46 Y-12.78 Z4.1
+G1 X-32.57 Y-14.58 Z4.1
+G1 X-32.57 Y-17.73 Z4.1
+G1 X-25.99 Y-17.73 Z4.1
+G1 X-25.99 Y-14.58 Z4.1
+G1 X-29.11 Y-12.78 Z4.1
+G1 X-29.11 Y-8.58 Z4.1
+G1 X-25.99 Y-6.78 Z4.1
+G1 X-25.99 Y-2.58 Z4.1
+G1 X-29.11 Y-0.78 Z4.1
+G1 X-29.11 Y3.42 Z4.1
+G1 X-25.99 Y5.22 Z4.1
+G1 X-25.99 Y9.42 Z4.1
+G1 X-29.11 Y11.22 Z4.1
+G1 X-29.11 Y15.42 Z4.1
+G1 X-25.99 Y17.22 Z4.1
+G1 X-25.99 Y17.73 Z4.1
+G1 X-25.65 Y17.73 Z4.1
+G1 X-25.65 Y17.22 Z4.1
+G1 X-22.53 Y15.42 Z4.1
+G1 X-22.53 Y11.22 Z4.1
+G1 X-25.65 Y9.42 Z4.1
+G1 X-25.65 Y5.22 Z4.1
+G1 X-22.53 Y3.42 Z4.1
+G1 X-22.53 Y-0.78 Z4.1
+G1 X-25.65 Y-2.58 Z4.1
+G1 X-25.65 Y-6.78 Z4.1
+G1 X-22.53 Y-8.58 Z4.1
+G1 X-22.53 Y-12.78 Z4.1
+G1 X-25.65 Y-14.58 Z4.1
+G1 X-25.65 Y-17.73 Z4.1
+G1 X-19.06 Y-17.73 Z4.1
+G1 X-19.06 Y-14.58 Z4.1
+G1 X-22.18 Y-12.78 Z4.1
+G1 X-22.18 Y-8.58 Z4.1
+G1 X-19.06 Y-6.78 Z4.1
+G1 X-19.06 Y-2.58 Z4.1
+G1 X-22.18 Y-0.78 Z4.1
+G1 X-22.18 Y3.42 Z4.1
+G1 X-19.06 Y5.22 Z4.1
+G1 X-19.06 Y9.42 Z4.1
+G1 X-22.18 Y11.22 Z4.1
+G1 X-22.18 Y15.42 Z4.1
+G1 X-19.06 Y17.22 Z4.1
+G1 X-19.06 Y17.73 Z4.1
+G1 X-18.72 Y17.73 Z4.1
+G1 X-18.72 Y17.22 Z4.1
+G1 X-15.6 Y15.42 Z4.1
+G1 X-15.6 Y11.22 Z4.1
+G1 X-18.72 Y9.42 Z4.1
+G1 X-18.72 Y5.22 Z4.1
+G1 X-15.6 Y3.42 Z4.1
+G1 X-15.6 Y-0.78 Z4.1
+G1 X-18.72 Y-2.58 Z4.1
+G1 X-18.72 Y-6.78 Z4.1
+G1 X-15.6 Y-8.58 Z4.1
+G1 X-15.6 Y-12.78 Z4.1
+G1 X-18.72 Y-14.58 Z4.1
+G1 X-18.72 Y-17.73 Z4.1
+G1 X-12.14 Y-17.73 Z4.1
+G1 X-12.14 Y-14.58 Z4.1
+G1 X-15.25 Y-12.78 Z4.1
+G1 X-15.25 Y-8.58 Z4.1
+G1 X-12.14 Y-6.78 Z4.1
+G1 X-12.14 Y-2.58 Z4.1
+G1 X-15.25 Y-0.78 Z4.1
+G1 X-15.25 Y3.42 Z4.1
+G1 X-12.14 Y5.22 Z4.1
+G1 X-12.14 Y9.42 Z4.1
+G1 X-15.25 Y11.22 Z4.1
+G1 X-15.25 Y15.42 Z4.1
+G1 X-12.14 Y17.22 Z4.1
+G1 X-12.14 Y17.73 Z4.1
+G1 X-11.79 Y17.73 Z4.1
+G1 X-11.79 Y17.22 Z4.1
+G1 X-8.67 Y15.42 Z4.1
+G1 X-8.67 Y11.22 Z4.1
+G1 X-11.79 Y9.42 Z4.1
+G1 X-11.79 Y5.22 Z4.1
+G1 X-8.67 Y3.42 Z4.1
+G1 X-8.67 Y-0.78 Z4.1
+G1 X-11.79 Y-2.58 Z4.1
+G1 X-11.79 Y-6.78 Z4.1
+G1 X-8.67 Y-8.58 Z4.1
+G1 X-8.67 Y-12.78 Z4.1
+G1 X-11.79 Y-14.58 Z4.1
+G1 X-11.79 Y-17.73 Z4.1
+G1 X-5.21 Y-17.73 Z4.1
+G1 X-5.21 Y-14.58 Z4.1
+G1 X-8.32 Y-12.78 Z4.1
+G1 X-8.32 Y-8.58 Z4.1
+G1 X-5.21 Y-6.78 Z4.1
+G1 X-5.21 Y-2.58 Z4.1
+G1 X-8.32 Y-0.78 Z4.1
+G1 X-8.32 Y3.42 Z4.1
+G1 X-5.21 Y5.22 Z4.1
+G1 X-5.21 Y9.42 Z4.1
+G1 X-8.32 Y11.22 Z4.1
+G1 X-8.32 Y15.42 Z4.1
+G1 X-5.21 Y17.22 Z4.1
+G1 X-5.21 Y17.73 Z4.1
+G1 X-4.86 Y17.73 Z4.1
+G1 X-4.86 Y17.22 Z4.1
+G1 X-1.74 Y15.42 Z4.1
+G1 X-1.74 Y11.22 Z4.1
+G1 X-4.86 Y9.42 Z4.1
+G1 X-4.86 Y5.22 Z4.1
+G1 X-1.74 Y3.42 Z4.1
+G1 X-1.74 Y-0.78 Z4.1
+G1 X-4.86 Y-2.58 Z4.1
+G1 X-4.86 Y-6.78 Z4.1
+G1 X-1.74 Y-8.58 Z4.1
+G1 X-1.74 Y-12.78 Z4.1
+G1 X-4.86 Y-14.58 Z4.1
+G1 X-4.86 Y-17.73 Z4.1
+G1 X1.72 Y-17.73 Z4.1
+G1 X1.72 Y-14.58 Z4.1
+G1 X-1.4 Y-12.78 Z4.1
+G1 X-1.4 Y-8.58 Z4.1
+G1 X1.72 Y-6.78 Z4.1
+G1 X1.72 Y-2.58 Z4.1
+G1 X-1.4 Y-0.78 Z4.1
+G1 X-1.4 Y3.42 Z4.1
+G1 X1.72 Y5.22 Z4.1
+G1 X1.72 Y9.42 Z4.1
+G1 X-1.4 Y11.22 Z4.1
+G1 X-1.4 Y15.42 Z4.1
+G1 X1.72 Y17.22 Z4.1
+G1 X1.72 Y17.73 Z4.1
+G1 X2.07 Y17.73 Z4.1
+G1 X2.07 Y17.22 Z4.1
+G1 X5.18 Y15.42 Z4.1
+G1 X5.18 Y11.22 Z4.1
+G1 X2.07 Y9.42 Z4.1
+G1 X2.07 Y5.22 Z4.1
+G1 X5.18 Y3.42 Z4.1
+G1 X5.18 Y-0.78 Z4.1
+G1 X2.07 Y-2.58 Z4.1
+G1 X2.07 Y-6.78 Z4.1
+G1 X5.18 Y-8.58 Z4.1
+G1 X5.18 Y-12.78 Z4.1
+G1 X2.07 Y-14.58 Z4.1
+G1 X2.07 Y-17.73 Z4.1
+G1 X8.65 Y-17.73 Z4.1
+G1 X8.65 Y-14.58 Z4.1
+G1 X5.53 Y-12.78 Z4.1
+G1 X5.53 Y-8.58 Z4.1
+G1 X8.65 Y-6.78 Z4.1
+G1 X8.65 Y-2.58 Z4.1
+G1 X5.53 Y-0.78 Z4.1
+G1 X5.53 Y3.42 Z4.1
+G1 X8.65 Y5.22 Z4.1
+G1 X8.65 Y9.42 Z4.1
+G1 X5.53 Y11.22 Z4.1
+G1 X5.53 Y15.42 Z4.1
+G1 X8.65 Y17.22 Z4.1
+G1 X8.65 Y17.73 Z4.1
+G1 X8.99 Y17.73 Z4.1
+G1 X8.99 Y17.22 Z4.1
+G1 X12.11 Y15.42 Z4.1
+G1 X12.11 Y11.22 Z4.1
+G1 X8.99 Y9.42 Z4.1
+G1 X8.99 Y5.22 Z4.1
+G1 X12.11 Y3.42 Z4.1
+G1 X12.11 Y-0.78 Z4.1
+G1 X8.99 Y-2.58 Z4.1
+G1 X8.99 Y-6.78 Z4.1
+G1 X12.11 Y-8.58 Z4.1
+G1 X12.11 Y-12.78 Z4.1
+G1 X8.99 Y-14.58 Z4.1
+G1 X8.99 Y-17.73 Z4.1
+G1 X15.58 Y-17.73 Z4.1
+G1 X15.58 Y-14.58 Z4.1
+G1 X12.46 Y-12.78 Z4.1
+G1 X12.46 Y-8.58 Z4.1
+G1 X15.58 Y-6.78 Z4.1
+G1 X15.58 Y-2.58 Z4.1
+G1 X12.46 Y-0.78 Z4.1
+G1 X12.46 Y3.42 Z4.1
+G1 X15.58 Y5.22 Z4.1
+G1 X15.58 Y9.42 Z4.1
+G1 X12.46 Y11.22 Z4.1
+G1 X12.46 Y15.42 Z4.1
+G1 X15.58 Y17.22 Z4.1
+G1 X15.58 Y17.73 Z4.1
+G1 X15.92 Y17.73 Z4.1
+G1 X15.92 Y17.22 Z4.1
+G1 X19.04 Y15.42 Z4.1
+G1 X19.04 Y11.22 Z4.1
+G1 X15.92 Y9.42 Z4.1
+G1 X15.92 Y5.22 Z4.1
+G1 X19.04 Y3.42 Z4.1
+G1 X19.04 Y-0.78 Z4.1
+G1 X15.92 Y-2.58 Z4.1
+G1 X15.92 Y-6.78 Z4.1
+G1 X19.04 Y-8.58 Z4.1
+G1 X19.04 Y-12.78 Z4.1
+G1 X15.92 Y-14.58 Z4.1
+G1 X15.92 Y-17.73 Z4.1
+G1 X22.5 Y-17.73 Z4.1
+G1 X22.5 Y-14.58 Z4.1
+G1 X19.39 Y-12.78 Z4.1
+G1 X19.39 Y-8.58 Z4.1
+G1 X22.5 Y-6.78 Z4.1
+G1 X22.5 Y-2.58 Z4.1
+G1 X19.39 Y-0.78 Z4.1
+G1 X19.39 Y3.42 Z4.1
+G1 X22.5 Y5.22 Z4.1
+G1 X22.5 Y9.42 Z4.1
+G1 X19.39 Y11.22 Z4.1
+G1 X19.39 Y15.42 Z4.1
+G1 X22.5 Y17.22 Z4.1
+G1 X22.5 Y17.73 Z4.1
+G1 X22.85 Y17.73 Z4.1
+G1 X22.85 Y17.22 Z4.1
+G1 X25.97 Y15.42 Z4.1
+G1 X25.97 Y11.22 Z4.1
+G1 X22.85 Y9.42 Z4.1
+G1 X22.85 Y5.22 Z4.1
+G1 X25.97 Y3.42 Z4.1
+G1 X25.97 Y-0.78 Z4.1
+G1 X22.85 Y-2.58 Z4.1
+G1 X22.85 Y-6.78 Z4.1
+G1 X25.97 Y-8.58 Z4.1
+G1 X25.97 Y-12.78 Z4.1
+G1 X22.85 Y-14.58 Z4.1
+G1 X22.85 Y-17.73 Z4.1
+G1 X29.43 Y-17.73 Z4.1
+G1 X29.43 Y-14.58 Z4.1
+G1 X26.32 Y-12.78 Z4.1
+G1 X26.32 Y-8.58 Z4.1
+G1 X29.43 Y-6.78 Z4.1
+G1 X29.43 Y-2.58 Z4.1
+G1 X26.32 Y-0.78 Z4.1
+G1 X26.32 Y3.42 Z4.1
+G1 X29.43 Y5.22 Z4.1
+G1 X29.43 Y9.42 Z4.1
+G1 X26.32 Y11.22 Z4.1
+G1 X26.32 Y15.42 Z4.1
+G1 X29.43 Y17.22 Z4.1
+G1 X29.43 Y17.73 Z4.1
+G1 X29.78 Y17.73 Z4.1
+G1 X29.78 Y17.22 Z4.1
+G1 X32.9 Y15.42 Z4.1
+G1 X32.9 Y11.22 Z4.1
+G1 X29.78 Y9.42 Z4.1
+G1 X29.78 Y5.22 Z4.1
+G1 X32.9 Y3.42 Z4.1
+G1 X32.9 Y-0.78 Z4.1
+G1 X29.78 Y-2.58 Z4.1
+G1 X29.78 Y-6.78 Z4.1
+G1 X32.9 Y-8.58 Z4.1
+G1 X32.9 Y-12.78 Z4.1
+G1 X29.78 Y-14.58 Z4.1
+G1 X29.78 Y-17.73 Z4.1
+G1 X36.36 Y-17.73 Z4.1
+G1 X36.36 Y-14.58 Z4.1
+G1 X33.24 Y-12.78 Z4.1
+G1 X33.24 Y-8.58 Z4.1
+G1 X36.36 Y-6.78 Z4.1
+G1 X36.36 Y-2.58 Z4.1
+G1 X33.24 Y-0.78 Z4.1
+G1 X33.24 Y3.42 Z4.1
+G1 X36.36 Y5.22 Z4.1
+G1 X36.36 Y9.42 Z4.1
+G1 X33.24 Y11.22 Z4.1
+G1 X33.24 Y15.42 Z4.1
+G1 X36.36 Y17.22 Z4.1
+G1 X36.36 Y17.73 Z4.1
+G1 X36.71 Y17.73 Z4.1
+G1 X36.71 Y17.22 Z4.1
+G1 X37.73 Y16.63 Z4.1
+G1 X37.73 Y10.01 Z4.1
+G1 X36.71 Y9.42 Z4.1
+G1 X36.71 Y5.22 Z4.1
+G1 X37.73 Y4.63 Z4.1
+G1 X37.73 Y-1.99 Z4.1
+G1 X36.71 Y-2.58 Z4.1
+G1 X36.71 Y-6.78 Z4.1
+G1 X37.73 Y-7.37 Z4.1
+G1 X37.73 Y-13.99 Z4.1
+G1 X36.71 Y-14.58 Z4.1
+G1 X36.71 Y-17.73 Z4.1
+T1
+G1 X22.43 Y-17.17 Z5.1
+G1 X37.17 Y-17.17 Z5.1
+G1 X37.17 Y12.63 Z5.1
+G1 X37.17 Y17.17 Z5.1
+G1 X-22.43 Y17.17 Z5.1
+G1 X-37.17 Y17.17 Z5.1
+G1 X-37.17 Y-12.63 Z5.1
+G1 X-37.17 Y-17.17 Z5.1
+G1 X22.43 Y-17.17 Z5.1
+G1 X22.43 Y-17.17 Z5.1
+G1 X-37.17 Y15.87 Z5.1
+G1 X-36.38 Y15.42 Z5.1
+G1 X-36.38 Y11.22 Z5.1
+G1 X-37.17 Y10.76 Z5.1
+G1 X-37.17 Y3.87 Z5.1
+G1 X-36.38 Y3.42 Z5.1
+G1 X-36.38 Y-0.78 Z5.1
+G1 X-37.17 Y-1.24 Z5.1
+G1 X-37.17 Y-8.13 Z5.1
+G1 X-36.38 Y-8.58 Z5.1
+G1 X-36.38 Y-12.78 Z5.1
+G1 X-37.17 Y-13.24 Z5.1
+G1 X-32.92 Y-17.17 Z5.1
+G1 X-32.92 Y-14.58 Z5.1
+G1 X-36.04 Y-12.78 Z5.1
+G1 X-36.04 Y-8.58 Z5.1
+G1 X-32.92 Y-6.78 Z5.1
+G1 X-32.92 Y-2.58 Z5.1
+G1 X-36.04 Y-0.78 Z5.1
+G1 X-36.04 Y3.42 Z5.1
+G1 X-32.92 Y5.22 Z5.1
+G1 X-32.92 Y9.42 Z5.1
+G1 X-36.04 Y11.22 Z5.1
+G1 X-36.04 Y15.42 Z5.1
+G1 X-33.0 Y17.17 Z5.1
+G1 X-32.49 Y17.17 Z5.1
+G1 X-29.46 Y15.42 Z5.1
+G1 X-29.46 Y11.22 Z5.1
+G1 X-32.57 Y9.42 Z5.1
+G1 X-32.57 Y5.22 Z5.1
+G1 X-29.46 Y3.42 Z5.1
+G1 X-29.46 Y-0.78 Z5.1
+G1 X-32.57 Y-2.58 Z5.1
+G1 X-32.57 Y-6.78 Z5.1
+G1 X-29.46 Y-8.58 Z5.1
+G1 X-29.46 Y-12.78 Z5.1
+G1 X-32.57 Y-14.58 Z5.1
+G1 X-32.57 Y-17.17 Z5.1
+G1 X-25.99 Y-17.17 Z5.1
+G1 X-25.99 Y-14.58 Z5.1
+G1 X-29.11 Y-12.78 Z5.1
+G1 X-29.11 Y-8.58 Z5.1
+G1 X-25.99 Y-6.78 Z5.1
+G1 X-25.99 Y-2.58 Z5.1
+G1 X-29.11 Y-0.78 Z5.1
+G1 X-29.11 Y3.42 Z5.1
+G1 X-25.99 Y5.22 Z5.1
+G1 X-25.99 Y9.42 Z5.1
+G1 X-29.11 Y11.22 Z5.1
+G1 X-29.11 Y15.42 Z5.1
+G1 X-26.07 Y17.17 Z5.1
+G1 X-25.57 Y17.17 Z5.1
+G1 X-22.53 Y15.42 Z5.1
+G1 X-22.53 Y11.22 Z5.1
+G1 X-25.65 Y9.42 Z5.1
+G1 X-25.65 Y5.22 Z5.1
+G1 X-22.53 Y3.42 Z5.1
+G1 X-22.53 Y-0.78 Z5.1
+G1 X-25.65 Y-2.58 Z5.1
+G1 X-25.65 Y-6.78 Z5.1
+G1 X-22.53 Y-8.58 Z5.1
+G1 X-22.53 Y-12.78 Z5.1
+G1 X-25.65 Y-14.58 Z5.1
+G1 X-25.65 Y-17.17 Z5.1
+G1 X-19.06 Y-17.17 Z5.1
+G1 X-19.06 Y-14.58 Z5.1
+G1 X-22.18 Y-12.78 Z5.1
+G1 X-22.18 Y-8.58 Z5.1
+G1 X-19.06 Y-6.78 Z5.1
+G1 X-19.06 Y-2.58 Z5.1
+G1 X-22.18 Y-0.78 Z5.1
+G1 X-22.18 Y3.42 Z5.1
+G1 X-19.06 Y5.22 Z5.1
+G1 X-19.06 Y9.42 Z5.1
+G1 X-22.18 Y11.22 Z5.1
+G1 X-22.18 Y15.42 Z5.1
+G1 X-19.14 Y17.17 Z5.1
+G1 X-18.64 Y17.17 Z5.1
+G1 X-15.6 Y15.42 Z5.1
+G1 X-15.6 Y11.22 Z5.1
+G1 X-18.72 Y9.42 Z5.1
+G1 X-18.72 Y5.22 Z5.1
+G1 X-15.6 Y3.42 Z5.1
+G1 X-15.6 Y-0.78 Z5.1
+G1 X-18.72 Y-2.58 Z5.1
+G1 X-18.72 Y-6.78 Z5.1
+G1 X-15.6 Y-8.58 Z5.1
+G1 X-15.6 Y-12.78 Z5.1
+G1 X-18.72 Y-14.58 Z5.1
+G1 X-18.72 Y-17.17 Z5.1
+G1 X-12.14 Y-17.17 Z5.1
+G1 X-12.14 Y-14.58 Z5.1
+G1 X-15.25 Y-12.78 Z5.1
+G1 X-15.25 Y-8.58 Z5.1
+G1 X-12.14 Y-6.78 Z5.1
+G1 X-12.14 Y-2.58 Z5.1
+G1 X-15.25 Y-0.78 Z5.1
+G1 X-15.25 Y3.42 Z5.1
+G1 X-12.14 Y5.22 Z5.1
+G1 X-12.14 Y9.42 Z5.1
+G1 X-15.25 Y11.22 Z5.1
+G1 X-15.25 Y15.42 Z5.1
+G1 X-12.22 Y17.17 Z5.1
+G1 X-11.71 Y17.17 Z5.1
+G1 X-8.67 Y15.42 Z5.1
+G1 X-8.67 Y11.22 Z5.1
+G1 X-11.79 Y9.42 Z5.1
+G1 X-11.79 Y5.22 Z5.1
+G1 X-8.67 Y3.42 Z5.1
+G1 X-8.67 Y-0.78 Z5.1
+G1 X-11.79 Y-2.58 Z5.1
+G1 X-11.79 Y-6.78 Z5.1
+G1 X-8.67 Y-8.58 Z5.1
+G1 X-8.67 Y-12.78 Z5.1
+G1 X-11.79 Y-14.58 Z5.1
+G1 X-11.79 Y-17.17 Z5.1
+G1 X-5.21 Y-17.17 Z5.1
+G1 X-5.21 Y-14.58 Z5.1
+G1 X-8.32 Y-12.78 Z5.1
+G1 X-8.32 Y-8.58 Z5.1
+G1 X-5.21 Y-6.78 Z5.1
+G1 X-5.21 Y-2.58 Z5.1
+G1 X-8.32 Y-0.78 Z5.1
+G1 X-8.32 Y3.42 Z5.1
+G1 X-5.21 Y5.22 Z5.1
+G1 X-5.21 Y9.42 Z5.1
+G1 X-8.32 Y11.22 Z5.1
+G1 X-8.32 Y15.42 Z5.1
+G1 X-5.29 Y17.17 Z5.1
+G1 X-4.78 Y17.17 Z5.1
+G1 X-1.74 Y15.42 Z5.1
+G1 X-1.74 Y11.22 Z5.1
+G1 X-4.86 Y9.42 Z5.1
+G1 X-4.86 Y5.22 Z5.1
+G1 X-1.74 Y3.42 Z5.1
+G1 X-1.74 Y-0.78 Z5.1
+G1 X-4.86 Y-2.58 Z5.1
+G1 X-4.86 Y-6.78 Z5.1
+G1 X-1.74 Y-8.58 Z5.1
+G1 X-1.74 Y-12.78 Z5.1
+G1 X-4.86 Y-14.58 Z5.1
+G1 X-4.86 Y-17.17 Z5.1
+G1 X1.72 Y-17.17 Z5.1
+G1 X1.72 Y-14.58 Z5.1
+G1 X-1.4 Y-12.78 Z5.1
+G1 X-1.4 Y-8.58 Z5.1
+G1 X1.72 Y-6.78 Z5.1
+G1 X1.72 Y-2.58 Z5.1
+G1 X-1.4 Y-0.78 Z5.1
+G1 X-1.4 Y3.42 Z5.1
+G1 X1.72 Y5.22 Z5.1
+G1 X1.72 Y9.42 Z5.1
+G1 X-1.4 Y11.22 Z5.1
+G1 X-1.4 Y15.42 Z5.1
+G1 X1.64 Y17.17 Z5.1
+G1 X2.15 Y17.17 Z5.1
+G1 X5.18 Y15.42 Z5.1
+G1 X5.18 Y11.22 Z5.1
+G1 X2.07 Y9.42 Z5.1
+G1 X2.07 Y5.22 Z5.1
+G1 X5.18 Y3.42 Z5.1
+G1 X5.18 Y-0.78 Z5.1
+G1 X2.07 Y-2.58 Z5.1
+G1 X2.07 Y-6.78 Z5.1
+G1 X5.18 Y-8.58 Z5.1
+G1 X5.18 Y-12.78 Z5.1
+G1 X2.07 Y-14.58 Z5.1
+G1 X2.07 Y-17.17 Z5.1
+G1 X8.65 Y-17.17 Z5.1
+G1 X8.65 Y-14.58 Z5.1
+G1 X5.53 Y-12.78 Z5.1
+G1 X5.53 Y-8.58 Z5.1
+G1 X8.65 Y-6.78 Z5.1
+G1 X8.65 Y-2.58 Z5.1
+G1 X5.53 Y-0.78 Z5.1
+G1 X5.53 Y3.42 Z5.1
+G1 X8.65 Y5.22 Z5.1
+G1 X8.65 Y9.42 Z5.1
+G1 X5.53 Y11.22 Z5.1
+G1 X5.53 Y15.42 Z5.1
+G1 X8.57 Y17.17 Z5.1
+G1 X9.07 Y17.17 Z5.1
+G1 X12.11 Y15.42 Z5.1
+G1 X12.11 Y11.22 Z5.1
+G1 X8.99 Y9.42 Z5.1
+G1 X8.99 Y5.22 Z5.1
+G1 X12.11 Y3.42 Z5.1
+G1 X12.11 Y-0.78 Z5.1
+G1 X8.99 Y-2.58 Z5.1
+G1 X8.99 Y-6.78 Z5.1
+G1 X12.11 Y-8.58 Z5.1
+G1 X12.11 Y-12.78 Z5.1
+G1 X8.99 Y-14.58 Z5.1
+G1 X8.99 Y-17.17 Z5.1
+G1 X15.58 Y-17.17 Z5.1
+G1 X15.58 Y-14.58 Z5.1
+G1 X12.46 Y-12.78 Z5.1
+G1 X12.46 Y-8.58 Z5.1
+G1 X15.58 Y-6.78 Z5.1
+G1 X15.58 Y-2.58 Z5.1
+G1 X12.46 Y-0.78 Z5.1
+G1 X12.46 Y3.42 Z5.1
+G1 X15.58 Y5.22 Z5.1
+G1 X15.58 Y9.42 Z5.1
+G1 X12.46 Y11.22 Z5.1
+G1 X12.46 Y15.42 Z5.1
+G1 X15.5 Y17.17 Z5.1
+G1 X16.0 Y17.17 Z5.1
+G1 X19.04 Y15.42 Z5.1
+G1 X19.04 Y11.22 Z5.1
+G1 X15.92 Y9.42 Z5.1
+G1 X15.92 Y5.22 Z5.1
+G1 X19.04 Y3.42 Z5.1
+G1 X19.04 Y-0.78 Z5.1
+G1 X15.92 Y-2.58 Z5.1
+G1 X15.92 Y-6.78 Z5.1
+G1 X19.04 Y-8.58 Z5.1
+G1 X19.04 Y-12.78 Z5.1
+G1 X15.92 Y-14.58 Z5.1
+G1 X15.92 Y-17.17 Z5.1
+G1 X22.5 Y-17.17 Z5.1
+G1 X22.5 Y-14.58 Z5.1
+G1 X19.39 Y-12.78 Z5.1
+G1 X19.39 Y-8.58 Z5.1
+G1 X22.5 Y-6.78 Z5.1
+G1 X22.5 Y-2.58 Z5.1
+G1 X19.39 Y-0.78 Z5.1
+G1 X19.39 Y3.42 Z5.1
+G1 X22.5 Y5.22 Z5.1
+G1 X22.5 Y9.42 Z5.1
+G1 X19.39 Y11.22 Z5.1
+G1 X19.39 Y15.42 Z5.1
+G1 X22.43 Y17.17 Z5.1
+G1 X22.93 Y17.17 Z5.1
+G1 X25.97 Y15.42 Z5.1
+G1 X25.97 Y11.22 Z5.1
+G1 X22.85 Y9.42 Z5.1
+G1 X22.85 Y5.22 Z5.1
+G1 X25.97 Y3.42 Z5.1
+G1 X25.97 Y-0.78 Z5.1
+G1 X22.85 Y-2.58 Z5.1
+G1 X22.85 Y-6.78 Z5.1
+G1 X25.97 Y-8.58 Z5.1
+G1 X25.97 Y-12.78 Z5.1
+G1 X22.85 Y-14.58 Z5.1
+G1 X22.85 Y-17.17 Z5.1
+G1 X29.43 Y-17.17 Z5.1
+G1 X29.43 Y-14.58 Z5.1
+G1 X26.32 Y-12.78 Z5.1
+G1 X26.32 Y-8.58 Z5.1
+G1 X29.43 Y-6.78 Z5.1
+G1 X29.43 Y-2.58 Z5.1
+G1 X26.32 Y-0.78 Z5.1
+G1 X26.32 Y3.42 Z5.1
+G1 X29.43 Y5.22 Z5.1
+G1 X29.43 Y9.42 Z5.1
+G1 X26.32 Y11.22 Z5.1
+G1 X26.32 Y15.42 Z5.1
+G1 X29.35 Y17.17 Z5.1
+G1 X29.86 Y17.17 Z5.1
+G1 X32.9 Y15.42 Z5.1
+G1 X32.9 Y11.22 Z5.1
+G1 X29.78 Y9.42 Z5.1
+G1 X29.78 Y5.22 Z5.1
+G1 X32.9 Y3.42 Z5.1
+G1 X32.9 Y-0.78 Z5.1
+G1 X29.78 Y-2.58 Z5.1
+G1 X29.78 Y-6.78 Z5.1
+G1 X32.9 Y-8.58 Z5.1
+G1 X32.9 Y-12.78 Z5.1
+G1 X29.78 Y-14.58 Z5.1
+G1 X29.78 Y-17.17 Z5.1
+G1 X36.36 Y-17.17 Z5.1
+G1 X36.36 Y-14.58 Z5.1
+G1 X33.24 Y-12.78 Z5.1
+G1 X33.24 Y-8.58 Z5.1
+G1 X36.36 Y-6.78 Z5.1
+G1 X36.36 Y-2.58 Z5.1
+G1 X33.24 Y-0.78 Z5.1
+G1 X33.24 Y3.42 Z5.1
+G1 X36.36 Y5.22 Z5.1
+G1 X36.36 Y9.42 Z5.1
+G1 X33.24 Y11.22 Z5.1
+G1 X33.24 Y15.42 Z5.1
+G1 X36.28 Y17.17 Z5.1
+G1 X36.79 Y17.17 Z5.1
+G1 X37.17 Y16.95 Z5.1
+G1 X37.17 Y9.69 Z5.1
+G1 X36.71 Y9.42 Z5.1
+G1 X36.71 Y5.22 Z5.1
+G1 X37.17 Y4.95 Z5.1
+G1 X37.17 Y-2.31 Z5.1
+G1 X36.71 Y-2.58 Z5.1
+G1 X36.71 Y-6.78 Z5.1
+G1 X37.17 Y-7.05 Z5.1
+G1 X37.17 Y-14.31 Z5.1
+G1 X36.71 Y-14.58 Z5.1
+G1 X36.71 Y-17.17 Z5.1
+T1
+G1 X18.98 Y-16.62 Z6.1
+G1 X36.62 Y-16.62 Z6.1
+G1 X36.62 Y11.18 Z6.1
+G1 X36.62 Y16.62 Z6.1
+G1 X-18.98 Y16.62 Z6.1
+G1 X-36.62 Y16.62 Z6.1
+G1 X-36.62 Y-11.18 Z6.1
+G1 X-36.62 Y-16.62 Z6.1
+G1 X18.98 Y-16.62 Z6.1
+G1 X18.98 Y-16.62 Z6.1
+G1 X-36.62 Y15.55 Z6.1
+G1 X-36.38 Y15.42 Z6.1
+G1 X-36.38 Y11.22 Z6.1
+G1 X-36.62 Y11.08 Z6.1
+G1 X-36.62 Y3.56 Z6.1
+G1 X-36.38 Y3.42 Z6.1
+G1 X-36.38 Y-0.78 Z6.1
+G1 X-36.62 Y-0.92 Z6.1
+G1 X-36.62 Y-8.45 Z6.1
+G1 X-36.38 Y-8.58 Z6.1
+G1 X-36.38 Y-12.78 Z6.1
+G1 X-36.62 Y-12.92 Z6.1
+G1 X-32.92 Y-16.62 Z6.1
+G1 X-32.92 Y-14.58 Z6.1
+G1 X-36.04 Y-12.78 Z6.1
+G1 X-36.04 Y-8.58 Z6.1
+G1 X-32.92 Y-6.78 Z6.1
+G1 X-32.92 Y-2.58 Z6.1
+G1 X-36.04 Y-0.78 Z6.1
+G1 X-36.04 Y3.42 Z6.1
+G1 X-32.92 Y5.22 Z6.1
+G1 X-32.92 Y9.42 Z6.1
+G1 X-36.04 Y11.22 Z6.1
+G1 X-36.04 Y15.42 Z6.1
+G1 X-33.96 Y16.62 Z6.1
+G1 X-31.54 Y16.62 Z6.1
+G1 X-29.46 Y15.42 Z6.1
+G1 X-29.46 Y11.22 Z6.1
+G1 X-32.57 Y9.42 Z6.1
+G1 X-32.57 Y5.22 Z6.1
+G1 X-29.46 Y3.42 Z6.1
+G1 X-29.46 Y-0.78 Z6.1
+G1 X-32.57 Y-2.58 Z6.1
+G1 X-32.57 Y-6.78 Z6.1
+G1 X-29.46 Y-8.58 Z6.1
+G1 X-29.46 Y-12.78 Z6.1
+G1 X-32.57 Y-14.58 Z6.1
+G1 X-32.57 Y-16.62 Z6.1
+G1 X-25.99 Y-16.62 Z6.1
+G1 X-25.99 Y-14.58 Z6.1
+G1 X-29.11 Y-12.78 Z6.1
+G1 X-29.11 Y-8.58 Z6.1
+G1 X-25.99 Y-6.78 Z6.1
+G1 X-25.99 Y-2.58 Z6.1
+G1 X-29.11 Y-0.78 Z6.1
+G1 X-29.11 Y3.42 Z6.1
+G1 X-25.99 Y5.22 Z6.1
+G1 X-25.99 Y9.42 Z6.1
+G1 X-29.11 Y11.22 Z6.1
+G1 X-29.11 Y15.42 Z6.1
+G1 X-27.03 Y16.62 Z6.1
+G1 X-24.61 Y16.62 Z6.1
+G1 X-22.53 Y15.42 Z6.1
+G1 X-22.53 Y11.22 Z6.1
+G1 X-25.65 Y9.42 Z6.1
+G1 X-25.65 Y5.22 Z6.1
+G1 X-22.53 Y3.42 Z6.1
+G1 X-22.53 Y-0.78 Z6.1
+G1 X-25.65 Y-2.58 Z6.1
+G1 X-25.65 Y-6.78 Z6.1
+G1 X-22.53 Y-8.58 Z6.1
+G1 X-22.53 Y-12.78 Z6.1
+G1 X-25.65 Y-14.58 Z6.1
+G1 X-25.65 Y-16.62 Z6.1
+G1 X-19.06 Y-16.62 Z6.1
+G1 X-19.06 Y-14.58 Z6.1
+G1 X-22.18 Y-12.78 Z6.1
+G1 X-22.18 Y-8.58 Z6.1
+G1 X-19.06 Y-6.78 Z6.1
+G1 X-19.06 Y-2.58 Z6.1
+G1 X-22.18 Y-0.78 Z6.1
+G1 X-22.18 Y3.42 Z6.1
+G1 X-19.06 Y5.22 Z6.1
+G1 X-19.06 Y9.42 Z6.1
+G1 X-22.18 Y11.22 Z6.1
+G1 X-22.18 Y15.42 Z6.1
+G1 X-20.1 Y16.62 Z6.1
+G1 X-17.68 Y16.62 Z6.1
+G1 X-15.6 Y15.42 Z6.1
+G1 X-15.6 Y11.22 Z6.1
+G1 X-18.72 Y9.42 Z6.1
+G1 X-18.72 Y5.22 Z6.1
+G1 X-15.6 Y3.42 Z6.1
+G1 X-15.6 Y-0.78 Z6.1
+G1 X-18.72 Y-2.58 Z6.1
+G1 X-18.72 Y-6.78 Z6.1
+G1 X-15.6 Y-8.58 Z6.1
+G1 X-15.6 Y-12.78 Z6.1
+G1 X-18.72 Y-14.58 Z6.1
+G1 X-18.72 Y-16.62 Z6.1
+G1 X-12.14 Y-16.62 Z6.1
+G1 X-12.14 Y-14.58 Z6.1
+G1 X-15.25 Y-12.78 Z6.1
+G1 X-15.25 Y-8.58 Z6.1
+G1 X-12.14 Y-6.78 Z6.1
+G1 X-12.14 Y-2.58 Z6.1
+G1 X-15.25 Y-0.78 Z6.1
+G1 X-15.25 Y3.42 Z6.1
+G1 X-12.14 Y5.22 Z6.1
+G1 X-12.14 Y9.42 Z6.1
+G1 X-15.25 Y11.22 Z6.1
+G1 X-15.25 Y15.42 Z6.1
+G1 X-13.18 Y16.62 Z6.1
+G1 X-10.75 Y16.62 Z6.1
+G1 X-8.67 Y15.42 Z6.1
+G1 X-8.67 Y11.22 Z6.1
+G1 X-11.79 Y9.42 Z6.1
+G1 X-11.79 Y5.22 Z6.1
+G1 X-8.67 Y3.42 Z6.1
+G1 X-8.67 Y-0.78 Z6.1
+G1 X-11.79 Y-2.58 Z6.1
+G1 X-11.79 Y-6.78 Z6.1
+G1 X-8.67 Y-8.58 Z6.1
+G1 X-8.67 Y-12.78 Z6.1
+G1 X-11.79 Y-14.58 Z6.1
+G1 X-11.79 Y-16.62 Z6.1
+G1 X-5.21 Y-16.62 Z6.1
+G1 X-5.21 Y-14.58 Z6.1
+G1 X-8.32 Y-12.78 Z6.1
+G1 X-8.32 Y-8.58 Z6.1
+G1 X-5.21 Y-6.78 Z6.1
+G1 X-5.21 Y-2.58 Z6.1
+G1 X-8.32 Y-0.78 Z6.1
+G1 X-8.32 Y3.42 Z6.1
+G1 X-5.21 Y5.22 Z6.1
+G1 X-5.21 Y9.42 Z6.1
+G1 X-8.32 Y11.22 Z6.1
+G1 X-8.32 Y15.42 Z6.1
+G1 X-6.25 Y16.62 Z6.1
+G1 X-3.82 Y16.62 Z6.1
+G1 X-1.74 Y15.42 Z6.1
+G1 X-1.74 Y11.22 Z6.1
+G1 X-4.86 Y9.42 Z6.1
+G1 X-4.86 Y5.22 Z6.1
+G1 X-1.74 Y3.42 Z6.1
+G1 X-1.74 Y-0.78 Z6.1
+G1 X-4.86 Y-2.58 Z6.1
+G1 X-4.86 Y-6.78 Z6.1
+G1 X-1.74 Y-8.58 Z6.1
+G1 X-1.74 Y-12.78 Z6.1
+G1 X-4.86 Y-14.58 Z6.1
+G1 X-4.86 Y-16.62 Z6.1
+G1 X1.72 Y-16.62 Z6.1
+G1 X1.72 Y-14.58 Z6.1
+G1 X-1.4 Y-12.78 Z6.1
+G1 X-1.4 Y-8.58 Z6.1
+G1 X1.72 Y-6.78 Z6.1
+G1 X1.72 Y-2.58 Z6.1
+G1 X-1.4 Y-0.78 Z6.1
+G1 X-1.4 Y3.42 Z6.1
+G1 X1.72 Y5.22 Z6.1
+G1 X1.72 Y9.42 Z6.1
+G1 X-1.4 Y11.22 Z6.1
+G1 X-1.4 Y15.42 Z6.1
+G1 X0.68 Y16.62 Z6.1
+G1 X3.11 Y16.62 Z6.1
+G1 X5.18 Y15.42 Z6.1
+G1 X5.18 Y11.22 Z6.1
+G1 X2.07 Y9.42 Z6.1
+G1 X2.07 Y5.22 Z6.1
+G1 X5.18 Y3.42 Z6.1
+G1 X5.18 Y-0.78 Z6.1
+G1 X2.07 Y-2.58 Z6.1
+G1 X2.07 Y-6.78 Z6.1
+G1 X5.18 Y-8.58 Z6.1
+G1 X5.18 Y-12.78 Z6.1
+G1 X2.07 Y-14.58 Z6.1
+G1 X2.07 Y-16.62 Z6.1
+G1 X8.65 Y-16.62 Z6.1
+G1 X8.65 Y-14.58 Z6.1
+G1 X5.53 Y-12.78 Z6.1
+G1 X5.53 Y-8.58 Z6.1
+G1 X8.65 Y-6.78 Z6.1
+G1 X8.65 Y-2.58 Z6.1
+G1 X5.53 Y-0.78 Z6.1
+G1 X5.53 Y3.42 Z6.1
+G1 X8.65 Y5.22 Z6.1
+G1 X8.65 Y9.42 Z6.1
+G1 X5.53 Y11.22 Z6.1
+G1 X5.53 Y15.42 Z6.1
+G1 X7.61 Y16.62 Z6.1
+G1 X10.03 Y16.62 Z6.1
+G1 X12.11 Y15.42 Z6.1
+G1 X12.11 Y11.22 Z6.1
+G1 X8.99 Y9.42 Z6.1
+G1 X8.99 Y5.22 Z6.1
+G1 X12.11 Y3.42 Z6.1
+G1 X12.11 Y-0.78 Z6.1
+G1 X8.99 Y-2.58 Z6.1
+G1 X8.99 Y-6.78 Z6.1
+G1 X12.11 Y-8.58 Z6.1
+G1 X12.11 Y-12.78 Z6.1
+G1 X8.99 Y-14.58 Z6.1
+G1 X8.99 Y-16.62 Z6.1
+G1 X15.58 Y-16.62 Z6.1
+G1 X15.58 Y-14.58 Z6.1
+G1 X12.46 Y-12.78 Z6.1
+G1 X12.46 Y-8.58 Z6.1
+G1 X15.58 Y-6.78 Z6.1
+G1 X15.58 Y-2.58 Z6.1
+G1 X12.46 Y-0.78 Z6.1
+G1 X12.46 Y3.42 Z6.1
+G1 X15.58 Y5.22 Z6.1
+G1 X15.58 Y9.42 Z6.1
+G1 X12.46 Y11.22 Z6.1
+G1 X12.46 Y15.42 Z6.1
+G1 X14.54 Y16.62 Z6.1
+G1 X16.96 Y16.62 Z6.1
+G1 X19.04 Y15.42 Z6.1
+G1 X19.04 Y11.22 Z6.1
+G1 X15.92 Y9.42 Z6.1
+G1 X15.92 Y5.22 Z6.1
+G1 X19.04 Y3.42 Z6.1
+G1 X19.04 Y-0.78 Z6.1
+G1 X15.92 Y-2.58 Z6.1
+G1 X15.92 Y-6.78 Z6.1
+G1 X19.04 Y-8.58 Z6.1
+G1 X19.04 Y-12.78 Z6.1
+G1 X15.92 Y-14.58 Z6.1
+G1 X15.92 Y-16.62 Z6.1
+G1 X22.5 Y-16.62 Z6.1
+G1 X22.5 Y-14.58 Z6.1
+G1 X19.39 Y-12.78 Z6.1
+G1 X19.39 Y-8.58 Z6.1
+G1 X22.5 Y-6.78 Z6.1
+G1 X22.5 Y-2.58 Z6.1
+G1 X19.39 Y-0.78 Z6.1
+G1 X19.39 Y3.42 Z6.1
+G1 X22.5 Y5.22 Z6.1
+G1 X22.5 Y9.42 Z6.1
+G1 X19.39 Y11.22 Z6.1
+G1 X19.39 Y15.42 Z6.1
+G1 X21.47 Y16.62 Z6.1
+G1 X23.89 Y16.62 Z6.1
+G1 X25.97 Y15.42 Z6.1
+G1 X25.97 Y11.22 Z6.1
+G1 X22.85 Y9.42 Z6.1
+G1 X22.85 Y5.22 Z6.1
+G1 X25.97 Y3.42 Z6.1
+G1 X25.97 Y-0.78 Z6.1
+G1 X22.85 Y-2.58 Z6.1
+G1 X22.85 Y-6.78 Z6.1
+G1 X25.97 Y-8.58 Z6.1
+G1 X25.97 Y-12.78 Z6.1
+G1 X22.85 Y-14.58 Z6.1
+G1 X22.85 Y-16.62 Z6.1
+G1 X29.43 Y-16.62 Z6.1
+G1 X29.43 Y-14.58 Z6.1
+G1 X26.32 Y-12.78 Z6.1
+G1 X26.32 Y-8.58 Z6.1
+G1 X29.43 Y-6.78 Z6.1
+G1 X29.43 Y-2.58 Z6.1
+G1 X26.32 Y-0.78 Z6.1
+G1 X26.32 Y3.42 Z6.1
+G1 X29.43 Y5.22 Z6.1
+G1 X29.43 Y9.42 Z6.1
+G1 X26.32 Y11.22 Z6.1
+G1 X26.32 Y15.42 Z6.1
+G1 X28.39 Y16.62 Z6.1
+G1 X30.82 Y16.62 Z6.1
+G1 X32.9 Y15.42 Z6.1
+G1 X32.9 Y11.22 Z6.1
+G1 X29.78 Y9.42 Z6.1
+G1 X29.78 Y5.22 Z6.1
+G1 X32.9 Y3.42 Z6.1
+G1 X32.9 Y-0.78 Z6.1
+G1 X29.78 Y-2.58 Z6.1
+G1 X29.78 Y-6.78 Z6.1
+G1 X32.9 Y-8.58 Z6.1
+G1 X32.9 Y-12.78 Z6.1
+G1 X29.78 Y-14.58 Z6.1
+G1 X29.78 Y-16.62 Z6.1
+G1 X36.36 Y-16.62 Z6.1
+G1 X36.36 Y-14.58 Z6.1
+G1 X33.24 Y-12.78 Z6.1
+G1 X33.24 Y-8.58 Z6.1
+G1 X36.36 Y-6.78 Z6.1
+G1 X36.36 Y-2.58 Z6.1
+G1 X33.24 Y-0.78 Z6.1
+G1 X33.24 Y3.42 Z6.1
+G1 X36.36 Y5.22 Z6.1
+G1 X36.36 Y9.42 Z6.1
+G1 X33.24 Y11.22 Z6.1
+G1 X33.24 Y15.42 Z6.1
+G1 X35.32 Y16.62 Z6.1
+T1
+G1 X15.54 Y-16.06 Z7.1
+G1 X36.06 Y-16.06 Z7.1
+G1 X36.06 Y9.74 Z7.1
+G1 X36.06 Y16.06 Z7.1
+G1 X-15.54 Y16.06 Z7.1
+G1 X-36.06 Y16.06 Z7.1
+G1 X-36.06 Y-9.74 Z7.1
+G1 X-36.06 Y-16.06 Z7.1
+G1 X15.54 Y-16.06 Z7.1
+G1 X15.54 Y-16.06 Z7.1
+G1 X-32.92 Y-16.06 Z7.1
+G1 X-32.92 Y-14.58 Z7.1
+G1 X-36.04 Y-12.78 Z7.1
+G1 X-36.04 Y-8.58 Z7.1
+G1 X-32.92 Y-6.78 Z7.1
+G1 X-32.92 Y-2.58 Z7.1
+G1 X-36.04 Y-0.78 Z7.1
+G1 X-36.04 Y3.42 Z7.1
+G1 X-32.92 Y5.22 Z7.1
+G1 X-32.92 Y9.42 Z7.1
+G1 X-36.04 Y11.22 Z7.1
+G1 X-36.04 Y15.42 Z7.1
+G1 X-34.92 Y16.06 Z7.1
+G1 X-30.57 Y16.06 Z7.1
+G1 X-29.46 Y15.42 Z7.1
+G1 X-29.46 Y11.22 Z7.1
+G1 X-32.57 Y9.42 Z7.1
+G1 X-32.57 Y5.22 Z7.1
+G1 X-29.46 Y3.42 Z7.1
+G1 X-29.46 Y-0.78 Z7.1
+G1 X-32.57 Y-2.58 Z7.1
+G1 X-32.57 Y-6.78 Z7.1
+G1 X-29.46 Y-8.58 Z7.1
+G1 X-29.46 Y-12.78 Z7.1
+G1 X-32.57 Y-14.58 Z7.1
+G1 X-32.57 Y-16.06 Z7.1
+G1 X-25.99 Y-16.06 Z7.1
+G1 X-25.99 Y-14.58 Z7.1
+G1 X-29.11 Y-12.78 Z7.1
+G1 X-29.11 Y-8.58 Z7.1
+G1 X-25.99 Y-6.78 Z7.1
+G1 X-25.99 Y-2.58 Z7.1
+G1 X-29.11 Y-0.78 Z7.1
+G1 X-29.11 Y3.42 Z7.1
+G1 X-25.99 Y5.22 Z7.1
+G1 X-25.99 Y9.42 Z7.1
+G1 X-29.11 Y11.22 Z7.1
+G1 X-29.11 Y15.42 Z7.1
+G1 X-27.99 Y16.06 Z7.1
+G1 X-23.64 Y16.06 Z7.1
+G1 X-22.53 Y15.42 Z7.1
+G1 X-22.53 Y11.22 Z7.1
+G1 X-25.65 Y9.42 Z7.1
+G1 X-25.65 Y5.22 Z7.1
+G1 X-22.53 Y3.42 Z7.1
+G1 X-22.53 Y-0.78 Z7.1
+G1 X-25.65 Y-2.58 Z7.1
+G1 X-25.65 Y-6.78 Z7.1
+G1 X-22.53 Y-8.58 Z7.1
+G1 X-22.53 Y-12.78 Z7.1
+G1 X-25.65 Y-14.58 Z7.1
+G1 X-25.65 Y-16.06 Z7.1
+G1 X-19.06 Y-16.06 Z7.1
+G1 X-19.06 Y-14.58 Z7.1
+G1 X-22.18 Y-12.78 Z7.1
+G1 X-22.18 Y-8.58 Z7.1
+G1 X-19.06 Y-6.78 Z7.1
+G1 X-19.06 Y-2.58 Z7.1
+G1 X-22.18 Y-0.78 Z7.1
+G1 X-22.18 Y3.42 Z7.1
+G1 X-19.06 Y5.22 Z7.1
+G1 X-19.06 Y9.42 Z7.1
+G1 X-22.18 Y11.22 Z7.1
+G1 X-22.18 Y15.42 Z7.1
+G1 X-21.06 Y16.06 Z7.1
+G1 X-16.72 Y16.06 Z7.1
+G1 X-15.6 Y15.42 Z7.1
+G1 X-15.6 Y11.22 Z7.1
+G1 X-18.72 Y9.42 Z7.1
+G1 X-18.72 Y5.22 Z7.1
+G1 X-15.6 Y3.42 Z7.1
+G1 X-15.6 Y-0.78 Z7.1
+G1 X-18.72 Y-2.58 Z7.1
+G1 X-18.72 Y-6.78 Z7.1
+G1 X-15.6 Y-8.58 Z7.1
+G1 X-15.6 Y-12.78 Z7.1
+G1 X-18.72 Y-14.58 Z7.1
+G1 X-18.72 Y-16.06 Z7.1
+G1 X-12.14 Y-16.06 Z7.1
+G1 X-12.14 Y-14.58 Z7.1
+G1 X-15.25 Y-12.78 Z7.1
+G1 X-15.25 Y-8.58 Z7.1
+G1 X-12.14 Y-6.78 Z7.1
+G1 X-12.14 Y-2.58 Z7.1
+G1 X-15.25 Y-0.78 Z7.1
+G1 X-15.25 Y3.42 Z7.1
+G1 X-12.14 Y5.22 Z7.1
+G1 X-12.14 Y9.42 Z7.1
+G1 X-15.25 Y11.22 Z7.1
+G1 X-15.25 Y15.42 Z7.1
+G1 X-14.14 Y16.06 Z7.1
+G1 X-9.79 Y16.06 Z7.1
+G1 X-8.67 Y15.42 Z7.1
+G1 X-8.67 Y11.22 Z7.1
+G1 X-11.79 Y9.42 Z7.1
+G1 X-11.79 Y5.22 Z7.1
+G1 X-8.67 Y3.42 Z7.1
+G1 X-8.67 Y-0.78 Z7.1
+G1 X-11.79 Y-2.58 Z7.1
+G1 X-11.79 Y-6.78 Z7.1
+G1 X-8.67 Y-8.58 Z7.1
+G1 X-8.67 Y-12.78 Z7.1
+G1 X-11.79 Y-14.58 Z7.1
+G1 X-11.79 Y-16.06 Z7.1
+G1 X-5.21 Y-16.06 Z7.1
+G1 X-5.21 Y-14.58 Z7.1
+G1 X-8.32 Y-12.78 Z7.1
+G1 X-8.32 Y-8.58 Z7.1
+G1 X-5.21 Y-6.78 Z7.1
+G1 X-5.21 Y-2.58 Z7.1
+G1 X-8.32 Y-0.78 Z7.1
+G1 X-8.32 Y3.42 Z7.1
+G1 X-5.21 Y5.22 Z7.1
+G1 X-5.21 Y9.42 Z7.1
+G1 X-8.32 Y11.22 Z7.1
+G1 X-8.32 Y15.42 Z7.1
+G1 X-7.21 Y16.06 Z7.1
+G1 X-2.86 Y16.06 Z7.1
+G1 X-1.74 Y15.42 Z7.1
+G1 X-1.74 Y11.22 Z7.1
+G1 X-4.86 Y9.42 Z7.1
+G1 X-4.86 Y5.22 Z7.1
+G1 X-1.74 Y3.42 Z7.1
+G1 X-1.74 Y-0.78 Z7.1
+G1 X-4.86 Y-2.58 Z7.1
+G1 X-4.86 Y-6.78 Z7.1
+G1 X-1.74 Y-8.58 Z7.1
+G1 X-1.74 Y-12.78 Z7.1
+G1 X-4.86 Y-14.58 Z7.1
+G1 X-4.86 Y-16.06 Z7.1
+G1 X1.72 Y-16.06 Z7.1
+G1 X1.72 Y-14.58 Z7.1
+G1 X-1.4 Y-12.78 Z7.1
+G1 X-1.4 Y-8.58 Z7.1
+G1 X1.72 Y-6.78 Z7.1
+G1 X1.72 Y-2.58 Z7.1
+G1 X-1.4 Y-0.78 Z7.1
+G1 X-1.4 Y3.42 Z7.1
+G1 X1.72 Y5.22 Z7.1
+G1 X1.72 Y9.42 Z7.1
+G1 X-1.4 Y11.22 Z7.1
+G1 X-1.4 Y15.42 Z7.1
+G1 X-0.28 Y16.06 Z7.1
+G1 X4.07 Y16.06 Z7.1
+G1 X5.18 Y15.42 Z7.1
+G1 X5.18 Y11.22 Z7.1
+G1 X2.07 Y9.42 Z7.1
+G1 X2.07 Y5.22 Z7.1
+G1 X5.18 Y3.42 Z7.1
+G1 X5.18 Y-0.78 Z7.1
+G1 X2.07 Y-2.58 Z7.1
+G1 X2.07 Y-6.78 Z7.1
+G1 X5.18 Y-8.58 Z7.1
+G1 X5.18 Y-12.78 Z7.1
+G1 X2.07 Y-14.58 Z7.1
+G1 X2.07 Y-16.06 Z7.1
+G1 X8.65 Y-16.06 Z7.1
+G1 X8.65 Y-14.58 Z7.1
+G1 X5.53 Y-12.78 Z7.1
+G1 X5.53 Y-8.58 Z7.1
+G1 X8.65 Y-6.78 Z7.1
+G1 X8.65 Y-2.58 Z7.1
+G1 X5.53 Y-0.78 Z7.1
+G1 X5.53 Y3.42 Z7.1
+G1 X8.65 Y5.22 Z7.1
+G1 X8.65 Y9.42 Z7.1
+G1 X5.53 Y11.22 Z7.1
+G1 X5.53 Y15.42 Z7.1
+G1 X6.65 Y16.06 Z7.1
+G1 X11.0 Y16.06 Z7.1
+G1 X12.11 Y15.42 Z7.1
+G1 X12.11 Y11.22 Z7.1
+G1 X8.99 Y9.42 Z7.1
+G1 X8.99 Y5.22 Z7.1
+G1 X12.11 Y3.42 Z7.1
+G1 X12.11 Y-0.78 Z7.1
+G1 X8.99 Y-2.58 Z7.1
+G1 X8.99 Y-6.78 Z7.1
+G1 X12.11 Y-8.58 Z7.1
+G1 X12.11 Y-12.78 Z7.1
+G1 X8.99 Y-14.58 Z7.1
+G1 X8.99 Y-16.06 Z7.1
+G1 X15.58 Y-16.06 Z7.1
+G1 X15.58 Y-14.58 Z7.1
+G1 X12.46 Y-12.78 Z7.1
+G1 X12.46 Y-8.58 Z7.1
+G1 X15.58 Y-6.78 Z7.1
+G1 X15.58 Y-2.58 Z7.1
+G1 X12.46 Y-0.78 Z7.1
+G1 X12.46 Y3.42 Z7.1
+G1 X15.58 Y5.22 Z7.1
+G1 X15.58 Y9.42 Z7.1
+G1 X12.46 Y11.22 Z7.1
+G1 X12.46 Y15.42 Z7.1
+G1 X13.58 Y16.06 Z7.1
+G1 X17.93 Y16.06 Z7.1
+G1 X19.04 Y15.42 Z7.1
+G1 X19.04 Y11.22 Z7.1
+G1 X15.92 Y9.42 Z7.1
+G1 X15.92 Y5.22 Z7.1
+G1 X19.04 Y3.42 Z7.1
+G1 X19.04 Y-0.78 Z7.1
+G1 X15.92 Y-2.58 Z7.1
+G1 X15.92 Y-6.78 Z7.1
+G1 X19.04 Y-8.58 Z7.1
+G1 X19.04 Y-12.78 Z7.1
+G1 X15.92 Y-14.58 Z7.1
+G1 X15.92 Y-16.06 Z7.1
+G1 X22.5 Y-16.06 Z7.1
+G1 X22.5 Y-14.58 Z7.1
+G1 X19.39 Y-12.78 Z7.1
+G1 X19.39 Y-8.58 Z7.1
+G1 X22.5 Y-6.78 Z7.1
+G1 X22.5 Y-2.58 Z7.1
+G1 X19.39 Y-0.78 Z7.1
+G1 X19.39 Y3.42 Z7.1
+G1 X22.5 Y5.22 Z7.1
+G1 X22.5 Y9.42 Z7.1
+G1 X19.39 Y11.22 Z7.1
+G1 X19.39 Y15.42 Z7.1
+G1 X20.5 Y16.06 Z7.1
+G1 X24.85 Y16.06 Z7.1
+G1 X25.97 Y15.42 Z7.1
+G1 X25.97 Y11.22 Z7.1
+G1 X22.85 Y9.42 Z7.1
+G1 X22.85 Y5.22 Z7.1
+G1 X25.97 Y3.42 Z7.1
+G1 X25.97 Y-0.78 Z7.1
+G1 X22.85 Y-2.58 Z7.1
+G1 X22.85 Y-6.78 Z7.1
+G1 X25.97 Y-8.58 Z7.1
+G1 X25.97 Y-12.78 Z7.1
+G1 X22.85 Y-14.58 Z7.1
+G1 X22.85 Y-16.06 Z7.1
+G1 X29.43 Y-16.06 Z7.1
+G1 X29.43 Y-14.58 Z7.1
+G1 X26.32 Y-12.78 Z7.1
+G1 X26.32 Y-8.58 Z7.1
+G1 X29.43 Y-6.78 Z7.1
+G1 X29.43 Y-2.58 Z7.1
+G1 X26.32 Y-0.78 Z7.1
+G1 X26.32 Y3.42 Z7.1
+G1 X29.43 Y5.22 Z7.1
+G1 X29.43 Y9.42 Z7.1
+G1 X26.32 Y11.22 Z7.1
+G1 X26.32 Y15.42 Z7.1
+G1 X27.43 Y16.06 Z7.1
+G1 X31.78 Y16.06 Z7.1
+G1 X32.9 Y15.42 Z7.1
+G1 X32.9 Y11.22 Z7.1
+G1 X29.78 Y9.42 Z7.1
+G1 X29.78 Y5.22 Z7.1
+G1 X32.9 Y3.42 Z7.1
+G1 X32.9 Y-0.78 Z7.1
+G1 X29.78 Y-2.58 Z7.1
+G1 X29.78 Y-6.78 Z7.1
+G1 X32.9 Y-8.58 Z7.1
+G1 X32.9 Y-12.78 Z7.1
+G1 X29.78 Y-14.58 Z7.1
+G1 X29.78 Y-16.06 Z7.1
+G1 X36.06 Y-14.41 Z7.1
+G1 X33.24 Y-12.78 Z7.1
+G1 X33.24 Y-8.58 Z7.1
+G1 X36.06 Y-6.95 Z7.1
+G1 X36.06 Y-2.41 Z7.1
+G1 X33.24 Y-0.78 Z7.1
+G1 X33.24 Y3.42 Z7.1
+G1 X36.06 Y5.05 Z7.1
+G1 X36.06 Y9.59 Z7.1
+G1 X33.24 Y11.22 Z7.1
+G1 X33.24 Y15.42 Z7.1
+G1 X34.36 Y16.06 Z7.1
+T1
+G1 X12.09 Y-15.51 Z8.1
+G1 X35.51 Y-15.51 Z8.1
+G1 X35.51 Y8.29 Z8.1
+G1 X35.51 Y15.51 Z8.1
+G1 X-12.09 Y15.51 Z8.1
+G1 X-35.51 Y15.51 Z8.1
+G1 X-35.51 Y-8.29 Z8.1
+G1 X-35.51 Y-15.51 Z8.1
+G1 X12.09 Y-15.51 Z8.1
+G1 X12.09 Y-15.51 Z8.1
+G1 X-32.92 Y-15.51 Z8.1
+G1 X-32.92 Y-14.58 Z8.1
+G1 X-35.51 Y-13.09 Z8.1
+G1 X-35.51 Y-8.28 Z8.1
+G1 X-32.92 Y-6.78 Z8.1
+G1 X-32.92 Y-2.58 Z8.1
+G1 X-35.51 Y-1.09 Z8.1
+G1 X-35.51 Y3.72 Z8.1
+G1 X-32.92 Y5.22 Z8.1
+G1 X-32.92 Y9.42 Z8.1
+G1 X-35.51 Y10.91 Z8.1
+G1 X-29.61 Y15.51 Z8.1
+G1 X-29.46 Y15.42 Z8.1
+G1 X-29.46 Y11.22 Z8.1
+G1 X-32.57 Y9.42 Z8.1
+G1 X-32.57 Y5.22 Z8.1
+G1 X-29.46 Y3.42 Z8.1
+G1 X-29.46 Y-0.78 Z8.1
+G1 X-32.57 Y-2.58 Z8.1
+G1 X-32.57 Y-6.78 Z8.1
+G1 X-29.46 Y-8.58 Z8.1
+G1 X-29.46 Y-12.78 Z8.1
+G1 X-32.57 Y-14.58 Z8.1
+G1 X-32.57 Y-15.51 Z8.1
+G1 X-25.99 Y-15.51 Z8.1
+G1 X-25.99 Y-14.58 Z8.1
+G1 X-29.11 Y-12.78 Z8.1
+G1 X-29.11 Y-8.58 Z8.1
+G1 X-25.99 Y-6.78 Z8.1
+G1 X-25.99 Y-2.58 Z8.1
+G1 X-29.11 Y-0.78 Z8.1
+G1 X-29.11 Y3.42 Z8.1
+G1 X-25.99 Y5.22 Z8.1
+G1 X-25.99 Y9.42 Z8.1
+G1 X-29.11 Y11.22 Z8.1
+G1 X-29.11 Y15.42 Z8.1
+G1 X-28.95 Y15.51 Z8.1
+G1 X-22.69 Y15.51 Z8.1
+G1 X-22.53 Y15.42 Z8.1
+G1 X-22.53 Y11.22 Z8.1
+G1 X-25.65 Y9.42 Z8.1
+G1 X-25.65 Y5.22 Z8.1
+G1 X-22.53 Y3.42 Z8.1
+G1 X-22.53 Y-0.78 Z8.1
+G1 X-25.65 Y-2.58 Z8.1
+G1 X-25.65 Y-6.78 Z8.1
+G1 X-22.53 Y-8.58 Z8.1
+G1 X-22.53 Y-12.78 Z8.1
+G1 X-25.65 Y-14.58 Z8.1
+G1 X-25.65 Y-15.51 Z8.1
+G1 X-19.06 Y-15.51 Z8.1
+G1 X-19.06 Y-14.58 Z8.1
+G1 X-22.18 Y-12.78 Z8.1
+G1 X-22.18 Y-8.58 Z8.1
+G1 X-19.06 Y-6.78 Z8.1
+G1 X-19.06 Y-2.58 Z8.1
+G1 X-22.18 Y-0.78 Z8.1
+G1 X-22.18 Y3.42 Z8.1
+G1 X-19.06 Y5.22 Z8.1
+G1 X-19.06 Y9.42 Z8.1
+G1 X-22.18 Y11.22 Z8.1
+G1 X-22.18 Y15.42 Z8.1
+G1 X-22.02 Y15.51 Z8.1
+G1 X-15.76 Y15.51 Z8.1
+G1 X-15.6 Y15.42 Z8.1
+G1 X-15.6 Y11.22 Z8.1
+G1 X-18.72 Y9.42 Z8.1
+G1 X-18.72 Y5.22 Z8.1
+G1 X-15.6 Y3.42 Z8.1
+G1 X-15.6 Y-0.78 Z8.1
+G1 X-18.72 Y-2.58 Z8.1
+G1 X-18.72 Y-6.78 Z8.1
+G1 X-15.6 Y-8.58 Z8.1
+G1 X-15.6 Y-12.78 Z8.1
+G1 X-18.72 Y-14.58 Z8.1
+G1 X-18.72 Y-15.51 Z8.1
+G1 X-12.14 Y-15.51 Z8.1
+G1 X-12.14 Y-14.58 Z8.1
+G1 X-15.25 Y-12.78 Z8.1
+G1 X-15.25 Y-8.58 Z8.1
+G1 X-12.14 Y-6.78 Z8.1
+G1 X-12.14 Y-2.58 Z8.1
+G1 X-15.25 Y-0.78 Z8.1
+G1 X-15.25 Y3.42 Z8.1
+G1 X-12.14 Y5.22 Z8.1
+G1 X-12.14 Y9.42 Z8.1
+G1 X-15.25 Y11.22 Z8.1
+G1 X-15.25 Y15.42 Z8.1
+G1 X-15.1 Y15.51 Z8.1
+G1 X-8.83 Y15.51 Z8.1
+G1 X-8.67 Y15.42 Z8.1
+G1 X-8.67 Y11.22 Z8.1
+G1 X-11.79 Y9.42 Z8.1
+G1 X-11.79 Y5.22 Z8.1
+G1 X-8.67 Y3.42 Z8.1
+G1 X-8.67 Y-0.78 Z8.1
+G1 X-11.79 Y-2.58 Z8.1
+G1 X-11.79 Y-6.78 Z8.1
+G1 X-8.67 Y-8.58 Z8.1
+G1 X-8.67 Y-12.78 Z8.1
+G1 X-11.79 Y-14.58 Z8.1
+G1 X-11.79 Y-15.51 Z8.1
+G1 X-5.21 Y-15.51 Z8.1
+G1 X-5.21 Y-14.58 Z8.1
+G1 X-8.32 Y-12.78 Z8.1
+G1 X-8.32 Y-8.58 Z8.1
+G1 X-5.21 Y-6.78 Z8.1
+G1 X-5.21 Y-2.58 Z8.1
+G1 X-8.32 Y-0.78 Z8.1
+G1 X-8.32 Y3.42 Z8.1
+G1 X-5.21 Y5.22 Z8.1
+G1 X-5.21 Y9.42 Z8.1
+G1 X-8.32 Y11.22 Z8.1
+G1 X-8.32 Y15.42 Z8.1
+G1 X-8.17 Y15.51 Z8.1
+G1 X-1.9 Y15.51 Z8.1
+G1 X-1.74 Y15.42 Z8.1
+G1 X-1.74 Y11.22 Z8.1
+G1 X-4.86 Y9.42 Z8.1
+G1 X-4.86 Y5.22 Z8.1
+G1 X-1.74 Y3.42 Z8.1
+G1 X-1.74 Y-0.78 Z8.1
+G1 X-4.86 Y-2.58 Z8.1
+G1 X-4.86 Y-6.78 Z8.1
+G1 X-1.74 Y-8.58 Z8.1
+G1 X-1.74 Y-12.78 Z8.1
+G1 X-4.86 Y-14.58 Z8.1
+G1 X-4.86 Y-15.51 Z8.1
+G1 X1.72 Y-15.51 Z8.1
+G1 X1.72 Y-14.58 Z8.1
+G1 X-1.4 Y-12.78 Z8.1
+G1 X-1.4 Y-8.58 Z8.1
+G1 X1.72 Y-6.78 Z8.1
+G1 X1.72 Y-2.58 Z8.1
+G1 X-1.4 Y-0.78 Z8.1
+G1 X-1.4 Y3.42 Z8.1
+G1 X1.72 Y5.22 Z8.1
+G1 X1.72 Y9.42 Z8.1
+G1 X-1.4 Y11.22 Z8.1
+G1 X-1.4 Y15.42 Z8.1
+G1 X-1.24 Y15.51 Z8.1
+G1 X5.03 Y15.51 Z8.1
+G1 X5.18 Y15.42 Z8.1
+G1 X5.18 Y11.22 Z8.1
+G1 X2.07 Y9.42 Z8.1
+G1 X2.07 Y5.22 Z8.1
+G1 X5.18 Y3.42 Z8.1
+G1 X5.18 Y-0.78 Z8.1
+G1 X2.07 Y-2.58 Z8.1
+G1 X2.07 Y-6.78 Z8.1
+G1 X5.18 Y-8.58 Z8.1
+G1 X5.18 Y-12.78 Z8.1
+G1 X2.07 Y-14.58 Z8.1
+G1 X2.07 Y-15.51 Z8.1
+G1 X8.65 Y-15.51 Z8.1
+G1 X8.65 Y-14.58 Z8.1
+G1 X5.53 Y-12.78 Z8.1
+G1 X5.53 Y-8.58 Z8.1
+G1 X8.65 Y-6.78 Z8.1
+G1 X8.65 Y-2.58 Z8.1
+G1 X5.53 Y-0.78 Z8.1
+G1 X5.53 Y3.42 Z8.1
+G1 X8.65 Y5.22 Z8.1
+G1 X8.65 Y9.42 Z8.1
+G1 X5.53 Y11.22 Z8.1
+G1 X5.53 Y15.42 Z8.1
+G1 X5.69 Y15.51 Z8.1
+G1 X11.96 Y15.51 Z8.1
+G1 X12.11 Y15.42 Z8.1
+G1 X12.11 Y11.22 Z8.1
+G1 X8.99 Y9.42 Z8.1
+G1 X8.99 Y5.22 Z8.1
+G1 X12.11 Y3.42 Z8.1
+G1 X12.11 Y-0.78 Z8.1
+G1 X8.99 Y-2.58 Z8.1
+G1 X8.99 Y-6.78 Z8.1
+G1 X12.11 Y-8.58 Z8.1
+G1 X12.11 Y-12.78 Z8.1
+G1 X8.99 Y-14.58 Z8.1
+G1 X8.99 Y-15.51 Z8.1
+G1 X15.58 Y-15.51 Z8.1
+G1 X15.58 Y-14.58 Z8.1
+G1 X12.46 Y-12.78 Z8.1
+G1 X12.46 Y-8.58 Z8.1
+G1 X15.58 Y-6.78 Z8.1
+G1 X15.58 Y-2.58 Z8.1
+G1 X12.46 Y-0.78 Z8.1
+G1 X12.46 Y3.42 Z8.1
+G1 X15.58 Y5.22 Z8.1
+G1 X15.58 Y9.42 Z8.1
+G1 X12.46 Y11.22 Z8.1
+G1 X12.46 Y15.42 Z8.1
+G1 X12.62 Y15.51 Z8.1
+G1 X18.88 Y15.51 Z8.1
+G1 X19.04 Y15.42 Z8.1
+G1 X19.04 Y11.22 Z8.1
+G1 X15.92 Y9.42 Z8.1
+G1 X15.92 Y5.22 Z8.1
+G1 X19.04 Y3.42 Z8.1
+G1 X19.04 Y-0.78 Z8.1
+G1 X15.92 Y-2.58 Z8.1
+G1 X15.92 Y-6.78 Z8.1
+G1 X19.04 Y-8.58 Z8.1
+G1 X19.04 Y-12.78 Z8.1
+G1 X15.92 Y-14.58 Z8.1
+G1 X15.92 Y-15.51 Z8.1
+G1 X22.5 Y-15.51 Z8.1
+G1 X22.5 Y-14.58 Z8.1
+G1 X19.39 Y-12.78 Z8.1
+G1 X19.39 Y-8.58 Z8.1
+G1 X22.5 Y-6.78 Z8.1
+G1 X22.5 Y-2.58 Z8.1
+G1 X19.39 Y-0.78 Z8.1
+G1 X19.39 Y3.42 Z8.1
+G1 X22.5 Y5.22 Z8.1
+G1 X22.5 Y9.42 Z8.1
+G1 X19.39 Y11.22 Z8.1
+G1 X19.39 Y15.42 Z8.1
+G1 X19.55 Y15.51 Z8.1
+G1 X25.81 Y15.51 Z8.1
+G1 X25.97 Y15.42 Z8.1
+G1 X25.97 Y11.22 Z8.1
+G1 X22.85 Y9.42 Z8.1
+G1 X22.85 Y5.22 Z8.1
+G1 X25.97 Y3.42 Z8.1
+G1 X25.97 Y-0.78 Z8.1
+G1 X22.85 Y-2.58 Z8.1
+G1 X22.85 Y-6.78 Z8.1
+G1 X25.97 Y-8.58 Z8.1
+G1 X25.97 Y-12.78 Z8.1
+G1 X22.85 Y-14.58 Z8.1
+G1 X22.85 Y-15.51 Z8.1
+G1 X29.43 Y-15.51 Z8.1
+G1 X29.43 Y-14.58 Z8.1
+G1 X26.32 Y-12.78 Z8.1
+G1 X26.32 Y-8.58 Z8.1
+G1 X29.43 Y-6.78 Z8.1
+G1 X29.43 Y-2.58 Z8.1
+G1 X26.32 Y-0.78 Z8.1
+G1 X26.32 Y3.42 Z8.1
+G1 X29.43 Y5.22 Z8.1
+G1 X29.43 Y9.42 Z8.1
+G1 X26.32 Y11.22 Z8.1
+G1 X26.32 Y15.42 Z8.1
+G1 X26.47 Y15.51 Z8.1
+G1 X32.74 Y15.51 Z8.1
+G1 X32.9 Y15.42 Z8.1
+G1 X32.9 Y11.22 Z8.1
+G1 X29.78 Y9.42 Z8.1
+G1 X29.78 Y5.22 Z8.1
+G1 X32.9 Y3.42 Z8.1
+G1 X32.9 Y-0.78 Z8.1
+G1 X29.78 Y-2.58 Z8.1
+G1 X29.78 Y-6.78 Z8.1
+G1 X32.9 Y-8.58 Z8.1
+G1 X32.9 Y-12.78 Z8.1
+G1 X29.78 Y-14.58 Z8.1
+G1 X29.78 Y-15.51 Z8.1
+G1 X35.51 Y-14.09 Z8.1
+G1 X33.24 Y-12.78 Z8.1
+G1 X33.24 Y-8.58 Z8.1
+G1 X35.51 Y-7.27 Z8.1
+G1 X35.51 Y-2.09 Z8.1
+G1 X33.24 Y-0.78 Z8.1
+G1 X33.24 Y3.42 Z8.1
+G1 X35.51 Y4.73 Z8.1
+G1 X35.51 Y9.91 Z8.1
+G1 X33.24 Y11.22 Z8.1
+G1 X33.24 Y15.42 Z8.1
+G1 X33.4 Y15.51 Z8.1
+T1
+G1 X8.64 Y-14.96 Z9.1
+G1 X34.96 Y-14.96 Z9.1
+G1 X34.96 Y6.84 Z9.1
+G1 X34.96 Y14.96 Z9.1
+G1 X-8.64 Y14.96 Z9.1
+G1 X-34.96 Y14.96 Z9.1
+G1 X-34.96 Y-6.84 Z9.1
+G1 X-34.96 Y-14.96 Z9.1
+G1 X8.64 Y-14.96 Z9.1
+G1 X8.64 Y-14.96 Z9.1
+G1 X-32.92 Y-14.96 Z9.1
+G1 X-32.92 Y-14.58 Z9.1
+G1 X-34.96 Y-13.41 Z9.1
+G1 X-34.96 Y-7.96 Z9.1
+G1 X-32.92 Y-6.78 Z9.1
+G1 X-32.92 Y-2.58 Z9.1
+G1 X-34.96 Y-1.41 Z9.1
+G1 X-34.96 Y4.04 Z9.1
+G1 X-32.92 Y5.22 Z9.1
+G1 X-32.92 Y9.42 Z9.1
+G1 X-34.96 Y10.59 Z9.1
+G1 X-29.46 Y14.96 Z9.1
+G1 X-29.46 Y11.22 Z9.1
+G1 X-32.57 Y9.42 Z9.1
+G1 X-32.57 Y5.22 Z9.1
+G1 X-29.46 Y3.42 Z9.1
+G1 X-29.46 Y-0.78 Z9.1
+G1 X-32.57 Y-2.58 Z9.1
+G1 X-32.57 Y-6.78 Z9.1
+G1 X-29.46 Y-8.58 Z9.1
+G1 X-29.46 Y-12.78 Z9.1
+G1 X-32.57 Y-14.58 Z9.1
+G1 X-32.57 Y-14.96 Z9.1
+G1 X-25.99 Y-14.96 Z9.1
+G1 X-25.99 Y-14.58 Z9.1
+G1 X-29.11 Y-12.78 Z9.1
+G1 X-29.11 Y-8.58 Z9.1
+G1 X-25.99 Y-6.78 Z9.1
+G1 X-25.99 Y-2.58 Z9.1
+G1 X-29.11 Y-0.78 Z9.1
+G1 X-29.11 Y3.42 Z9.1
+G1 X-25.99 Y5.22 Z9.1
+G1 X-25.99 Y9.42 Z9.1
+G1 X-29.11 Y11.22 Z9.1
+G1 X-29.11 Y14.96 Z9.1
+G1 X-22.53 Y14.96 Z9.1
+G1 X-22.53 Y11.22 Z9.1
+G1 X-25.65 Y9.42 Z9.1
+G1 X-25.65 Y5.22 Z9.1
+G1 X-22.53 Y3.42 Z9.1
+G1 X-22.53 Y-0.78 Z9.1
+G1 X-25.65 Y-2.58 Z9.1
+G1 X-25.65 Y-6.78 Z9.1
+G1 X-22.53 Y-8.58 Z9.1
+G1 X-22.53 Y-12.78 Z9.1
+G1 X-25.65 Y-14.58 Z9.1
+G1 X-25.65 Y-14.96 Z9.1
+G1 X-19.06 Y-14.96 Z9.1
+G1 X-19.06 Y-14.58 Z9.1
+G1 X-22.18 Y-12.78 Z9.1
+G1 X-22.18 Y-8.58 Z9.1
+G1 X-19.06 Y-6.78 Z9.1
+G1 X-19.06 Y-2.58 Z9.1
+G1 X-22.18 Y-0.78 Z9.1
+G1 X-22.18 Y3.42 Z9.1
+G1 X-19.06 Y5.22 Z9.1
+G1 X-19.06 Y9.42 Z9.1
+G1 X-22.18 Y11.22 Z9.1
+G1 X-22.18 Y14.96 Z9.1
+G1 X-15.6 Y14.96 Z9.1
+G1 X-15.6 Y11.22 Z9.1
+G1 X-18.72 Y9.42 Z9.1
+G1 X-18.72 Y5.22 Z9.1
+G1 X-15.6 Y3.42 Z9.1
+G1 X-15.6 Y-0.78 Z9.1
+G1 X-18.72 Y-2.58 Z9.1
+G1 X-18.72 Y-6.78 Z9.1
+G1 X-15.6 Y-8.58 Z9.1
+G1 X-15.6 Y-12.78 Z9.1
+G1 X-18.72 Y-14.58 Z9.1
+G1 X-18.72 Y-14.96 Z9.1
+G1 X-12.14 Y-14.96 Z9.1
+G1 X-12.14 Y-14.58 Z9.1
+G1 X-15.25 Y-12.78 Z9.1
+G1 X-15.25 Y-8.58 Z9.1
+G1 X-12.14 Y-6.78 Z9.1
+G1 X-12.14 Y-2.58 Z9.1
+G1 X-15.25 Y-0.78 Z9.1
+G1 X-15.25 Y3.42 Z9.1
+G1 X-12.14 Y5.22 Z9.1
+G1 X-12.14 Y9.42 Z9.1
+G1 X-15.25 Y11.22 Z9.1
+G1 X-15.25 Y14.96 Z9.1
+G1 X-8.67 Y14.96 Z9.1
+G1 X-8.67 Y11.22 Z9.1
+G1 X-11.79 Y9.42 Z9.1
+G1 X-11.79 Y5.22 Z9.1
+G1 X-8.67 Y3.42 Z9.1
+G1 X-8.67 Y-0.78 Z9.1
+G1 X-11.79 Y-2.58 Z9.1
+G1 X-11.79 Y-6.78 Z9.1
+G1 X-8.67 Y-8.58 Z9.1
+G1 X-8.67 Y-12.78 Z9.1
+G1 X-11.79 Y-14.58 Z9.1
+G1 X-11.79 Y-14.96 Z9.1
+G1 X-5.21 Y-14.96 Z9.1
+G1 X-5.21 Y-14.58 Z9.1
+G1 X-8.32 Y-12.78 Z9.1
+G1 X-8.32 Y-8.58 Z9.1
+G1 X-5.21 Y-6.78 Z9.1
+G1 X-5.21 Y-2.58 Z9.1
+G1 X-8.32 Y-0.78 Z9.1
+G1 X-8.32 Y3.42 Z9.1
+G1 X-5.21 Y5.22 Z9.1
+G1 X-5.21 Y9.42 Z9.1
+G1 X-8.32 Y11.22 Z9.1
+G1 X-8.32 Y14.96 Z9.1
+G1 X-1.74 Y14.96 Z9.1
+G1 X-1.74 Y11.22 Z9.1
+G1 X-4.86 Y9.42 Z9.1
+G1 X-4.86 Y5.22 Z9.1
+G1 X-1.74 Y3.42 Z9.1
+G1 X-1.74 Y-0.78 Z9.1
+G1 X-4.86 Y-2.58 Z9.1
+G1 X-4.86 Y-6.78 Z9.1
+G1 X-1.74 Y-8.58 Z9.1
+G1 X-1.74 Y-12.78 Z9.1
+G1 X-4.86 Y-14.58 Z9.1
+G1 X-4.86 Y-14.96 Z9.1
+G1 X1.72 Y-14.96 Z9.1
+G1 X1.72 Y-14.58 Z9.1
+G1 X-1.4 Y-12.78 Z9.1
+G1 X-1.4 Y-8.58 Z9.1
+G1 X1.72 Y-6.78 Z9.1
+G1 X1.72 Y-2.58 Z9.1
+G1 X-1.4 Y-0.78 Z9.1
+G1 X-1.4 Y3.42 Z9.1
+G1 X1.72 Y5.22 Z9.1
+G1 X1.72 Y9.42 Z9.1
+G1 X-1.4 Y11.22 Z9.1
+G1 X-1.4 Y14.96 Z9.1
+G1 X5.18 Y14.96 Z9.1
+G1 X5.18 Y11.22 Z9.1
+G1 X2.07 Y9.42 Z9.1
+G1 X2.07 Y5.22 Z9.1
+G1 X5.18 Y3.42 Z9.1
+G1 X5.18 Y-0.78 Z9.1
+G1 X2.07 Y-2.58 Z9.1
+G1 X2.07 Y-6.78 Z9.1
+G1 X5.18 Y-8.58 Z9.1
+G1 X5.18 Y-12.78 Z9.1
+G1 X2.07 Y-14.58 Z9.1
+G1 X2.07 Y-14.96 Z9.1
+G1 X8.65 Y-14.96 Z9.1
+G1 X8.65 Y-14.58 Z9.1
+G1 X5.53 Y-12.78 Z9.1
+G1 X5.53 Y-8.58 Z9.1
+G1 X8.65 Y-6.78 Z9.1
+G1 X8.65 Y-2.58 Z9.1
+G1 X5.53 Y-0.78 Z9.1
+G1 X5.53 Y3.42 Z9.1
+G1 X8.65 Y5.22 Z9.1
+G1 X8.65 Y9.42 Z9.1
+G1 X5.53 Y11.22 Z9.1
+G1 X5.53 Y14.96 Z9.1
+G1 X12.11 Y14.96 Z9.1
+G1 X12.11 Y11.22 Z9.1
+G1 X8.99 Y9.42 Z9.1
+G1 X8.99 Y5.22 Z9.1
+G1 X12.11 Y3.42 Z9.1
+G1 X12.11 Y-0.78 Z9.1
+G1 X8.99 Y-2.58 Z9.1
+G1 X8.99 Y-6.78 Z9.1
+G1 X12.11 Y-8.58 Z9.1
+G1 X12.11 Y-12.78 Z9.1
+G1 X8.99 Y-14.58 Z9.1
+G1 X8.99 Y-14.96 Z9.1
+G1 X15.58 Y-14.96 Z9.1
+G1 X15.58 Y-14.58 Z9.1
+G1 X12.46 Y-12.78 Z9.1
+G1 X12.46 Y-8.58 Z9.1
+G1 X15.58 Y-6.78 Z9.1
+G1 X15.58 Y-2.58 Z9.1
+G1 X12.46 Y-0.78 Z9.1
+G1 X12.46 Y3.42 Z9.1
+G1 X15.58 Y5.22 Z9.1
+G1 X15.58 Y9.42 Z9.1
+G1 X12.46 Y11.22 Z9.1
+G1 X12.46 Y14.96 Z9.1
+G1 X19.04 Y14.96 Z9.1
+G1 X19.04 Y11.22 Z9.1
+G1 X15.92 Y9.42 Z9.1
+G1 X15.92 Y5.22 Z9.1
+G1 X19.04 Y3.42 Z9.1
+G1 X19.04 Y-0.78 Z9.1
+G1 X15.92 Y-2.58 Z9.1
+G1 X15.92 Y-6.78 Z9.1
+G1 X19.04 Y-8.58 Z9.1
+G1 X19.04 Y-12.78 Z9.1
+G1 X15.92 Y-14.58 Z9.1
+G1 X15.92 Y-14.96 Z9.1
+G1 X22.5 Y-14.96 Z9.1
+G1 X22.5 Y-14.58 Z9.1
+G1 X19.39 Y-12.78 Z9.1
+G1 X19.39 Y-8.58 Z9.1
+G1 X22.5 Y-6.78 Z9.1
+G1 X22.5 Y-2.58 Z9.1
+G1 X19.39 Y-0.78 Z9.1
+G1 X19.39 Y3.42 Z9.1
+G1 X22.5 Y5.22 Z9.1
+G1 X22.5 Y9.42 Z9.1
+G1 X19.39 Y11.22 Z9.1
+G1 X19.39 Y14.96 Z9.1
+G1 X25.97 Y14.96 Z9.1
+G1 X25.97 Y11.22 Z9.1
+G1 X22.85 Y9.42 Z9.1
+G1 X22.85 Y5.22 Z9.1
+G1 X25.97 Y3.42 Z9.1
+G1 X25.97 Y-0.78 Z9.1
+G1 X22.85 Y-2.58 Z9.1
+G1 X22.85 Y-6.78 Z9.1
+G1 X25.97 Y-8.58 Z9.1
+G1 X25.97 Y-12.78 Z9.1
+G1 X22.85 Y-14.58 Z9.1
+G1 X22.85 Y-14.96 Z9.1
+G1 X29.43 Y-14.96 Z9.1
+G1 X29.43 Y-14.58 Z9.1
+G1 X26.32 Y-12.78 Z9.1
+G1 X26.32 Y-8.58 Z9.1
+G1 X29.43 Y-6.78 Z9.1
+G1 X29.43 Y-2.58 Z9.1
+G1 X26.32 Y-0.78 Z9.1
+G1 X26.32 Y3.42 Z9.1
+G1 X29.43 Y5.22 Z9.1
+G1 X29.43 Y9.42 Z9.1
+G1 X26.32 Y11.22 Z9.1
+G1 X26.32 Y14.96 Z9.1
+G1 X32.9 Y14.96 Z9.1
+G1 X32.9 Y11.22 Z9.1
+G1 X29.78 Y9.42 Z9.1
+G1 X29.78 Y5.22 Z9.1
+G1 X32.9 Y3.42 Z9.1
+G1 X32.9 Y-0.78 Z9.1
+G1 X29.78 Y-2.58 Z9.1
+G1 X29.78 Y-6.78 Z9.1
+G1 X32.9 Y-8.58 Z9.1
+G1 X32.9 Y-12.78 Z9.1
+G1 X29.78 Y-14.58 Z9.1
+G1 X29.78 Y-14.96 Z9.1
+G1 X34.96 Y-13.77 Z9.1
+G1 X33.24 Y-12.78 Z9.1
+G1 X33.24 Y-8.58 Z9.1
+G1 X34.96 Y-7.59 Z9.1
+G1 X34.96 Y-1.77 Z9.1
+G1 X33.24 Y-0.78 Z9.1
+G1 X33.24 Y3.42 Z9.1
+G1 X34.96 Y4.41 Z9.1
+G1 X34.96 Y10.23 Z9.1
+G1 X33.24 Y11.22 Z9.1
+G1 X33.24 Y14.96 Z9.1
+T1
+G1 X5.2 Y-14.4 Z10.1
+G1 X34.4 Y-14.4 Z10.1
+G1 X34.4 Y5.4 Z10.1
+G1 X34.4 Y14.4 Z10.1
+G1 X-5.2 Y14.4 Z10.1
+G1 X-34.4 Y14.4 Z10.1
+G1 X-34.4 Y-5.4 Z10.1
+G1 X-34.4 Y-14.4 Z10.1
+G1 X5.2 Y-14.4 Z10.1
+G1 X5.2 Y-14.4 Z10.1
+G1 X-33.23 Y-14.4 Z10.1
+G1 X-34.4 Y-13.73 Z10.1
+G1 X-34.4 Y-7.64 Z10.1
+G1 X-32.92 Y-6.78 Z10.1
+G1 X-32.92 Y-2.58 Z10.1
+G1 X-34.4 Y-1.73 Z10.1
+G1 X-34.4 Y4.36 Z10.1
+G1 X-32.92 Y5.22 Z10.1
+G1 X-32.92 Y9.42 Z10.1
+G1 X-34.4 Y10.27 Z10.1
+G1 X-29.46 Y14.4 Z10.1
+G1 X-29.46 Y11.22 Z10.1
+G1 X-32.57 Y9.42 Z10.1
+G1 X-32.57 Y5.22 Z10.1
+G1 X-29.46 Y3.42 Z10.1
+G1 X-29.46 Y-0.78 Z10.1
+G1 X-32.57 Y-2.58 Z10.1
+G1 X-32.57 Y-6.78 Z10.1
+G1 X-29.46 Y-8.58 Z10.1
+G1 X-29.46 Y-12.78 Z10.1
+G1 X-32.26 Y-14.4 Z10.1
+G1 X-26.3 Y-14.4 Z10.1
+G1 X-29.11 Y-12.78 Z10.1
+G1 X-29.11 Y-8.58 Z10.1
+G1 X-25.99 Y-6.78 Z10.1
+G1 X-25.99 Y-2.58 Z10.1
+G1 X-29.11 Y-0.78 Z10.1
+G1 X-29.11 Y3.42 Z10.1
+G1 X-25.99 Y5.22 Z10.1
+G1 X-25.99 Y9.42 Z10.1
+G1 X-29.11 Y11.22 Z10.1
+G1 X-29.11 Y14.4 Z10.1
+G1 X-22.53 Y14.4 Z10.1
+G1 X-22.53 Y11.22 Z10.1
+G1 X-25.65 Y9.42 Z10.1
+G1 X-25.65 Y5.22 Z10.1
+G1 X-22.53 Y3.42 Z10.1
+G1 X-22.53 Y-0.78 Z10.1
+G1 X-25.65 Y-2.58 Z10.1
+G1 X-25.65 Y-6.78 Z10.1
+G1 X-22.53 Y-8.58 Z10.1
+G1 X-22.53 Y-12.78 Z10.1
+G1 X-25.33 Y-14.4 Z10.1
+G1 X-19.38 Y-14.4 Z10.1
+G1 X-22.18 Y-12.78 Z10.1
+G1 X-22.18 Y-8.58 Z10.1
+G1 X-19.06 Y-6.78 Z10.1
+G1 X-19.06 Y-2.58 Z10.1
+G1 X-22.18 Y-0.78 Z10.1
+G1 X-22.18 Y3.42 Z10.1
+G1 X-19.06 Y5.22 Z10.1
+G1 X-19.06 Y9.42 Z10.1
+G1 X-22.18 Y11.22 Z10.1
+G1 X-22.18 Y14.4 Z10.1
+G1 X-15.6 Y14.4 Z10.1
+G1 X-15.6 Y11.22 Z10.1
+G1 X-18.72 Y9.42 Z10.1
+G1 X-18.72 Y5.22 Z10.1
+G1 X-15.6 Y3.42 Z10.1
+G1 X-15.6 Y-0.78 Z10.1
+G1 X-18.72 Y-2.58 Z10.1
+G1 X-18.72 Y-6.78 Z10.1
+G1 X-15.6 Y-8.58 Z10.1
+G1 X-15.6 Y-12.78 Z10.1
+G1 X-18.41 Y-14.4 Z10.1
+G1 X-12.45 Y-14.4 Z10.1
+G1 X-15.25 Y-12.78 Z10.1
+G1 X-15.25 Y-8.58 Z10.1
+G1 X-12.14 Y-6.78 Z10.1
+G1 X-12.14 Y-2.58 Z10.1
+G1 X-15.25 Y-0.78 Z10.1
+G1 X-15.25 Y3.42 Z10.1
+G1 X-12.14 Y5.22 Z10.1
+G1 X-12.14 Y9.42 Z10.1
+G1 X-15.25 Y11.22 Z10.1
+G1 X-15.25 Y14.4 Z10.1
+G1 X-8.67 Y14.4 Z10.1
+G1 X-8.67 Y11.22 Z10.1
+G1 X-11.79 Y9.42 Z10.1
+G1 X-11.79 Y5.22 Z10.1
+G1 X-8.67 Y3.42 Z10.1
+G1 X-8.67 Y-0.78 Z10.1
+G1 X-11.79 Y-2.58 Z10.1
+G1 X-11.79 Y-6.78 Z10.1
+G1 X-8.67 Y-8.58 Z10.1
+G1 X-8.67 Y-12.78 Z10.1
+G1 X-11.48 Y-14.4 Z10.1
+G1 X-5.52 Y-14.4 Z10.1
+G1 X-8.32 Y-12.78 Z10.1
+G1 X-8.32 Y-8.58 Z10.1
+G1 X-5.21 Y-6.78 Z10.1
+G1 X-5.21 Y-2.58 Z10.1
+G1 X-8.32 Y-0.78 Z10.1
+G1 X-8.32 Y3.42 Z10.1
+G1 X-5.21 Y5.22 Z10.1
+G1 X-5.21 Y9.42 Z10.1
+G1 X-8.32 Y11.22 Z10.1
+G1 X-8.32 Y14.4 Z10.1
+G1 X-1.74 Y14.4 Z10.1
+G1 X-1.74 Y11.22 Z10.1
+G1 X-4.86 Y9.42 Z10.1
+G1 X-4.86 Y5.22 Z10.1
+G1 X-1.74 Y3.42 Z10.1
+G1 X-1.74 Y-0.78 Z10.1
+G1 X-4.86 Y-2.58 Z10.1
+G1 X-4.86 Y-6.78 Z10.1
+G1 X-1.74 Y-8.58 Z10.1
+G1 X-1.74 Y-12.78 Z10.1
+G1 X-4.55 Y-14.4 Z10.1
+G1 X1.41 Y-14.4 Z10.1
+G1 X-1.4 Y-12.78 Z10.1
+G1 X-1.4 Y-8.58 Z10.1
+G1 X1.72 Y-6.78 Z10.1
+G1 X1.72 Y-2.58 Z10.1
+G1 X-1.4 Y-0.78 Z10.1
+G1 X-1.4 Y3.42 Z10.1
+G1 X1.72 Y5.22 Z10.1
+G1 X1.72 Y9.42 Z10.1
+G1 X-1.4 Y11.22 Z10.1
+G1 X-1.4 Y14.4 Z10.1
+G1 X5.18 Y14.4 Z10.1
+G1 X5.18 Y11.22 Z10.1
+G1 X2.07 Y9.42 Z10.1
+G1 X2.07 Y5.22 Z10.1
+G1 X5.18 Y3.42 Z10.1
+G1 X5.18 Y-0.78 Z10.1
+G1 X2.07 Y-2.58 Z10.1
+G1 X2.07 Y-6.78 Z10.1
+G1 X5.18 Y-8.58 Z10.1
+G1 X5.18 Y-12.78 Z10.1
+G1 X2.38 Y-14.4 Z10.1
+G1 X8.34 Y-14.4 Z10.1
+G1 X5.53 Y-12.78 Z10.1
+G1 X5.53 Y-8.58 Z10.1
+G1 X8.65 Y-6.78 Z10.1
+G1 X8.65 Y-2.58 Z10.1
+G1 X5.53 Y-0.78 Z10.1
+G1 X5.53 Y3.42 Z10.1
+G1 X8.65 Y5.22 Z10.1
+G1 X8.65 Y9.42 Z10.1
+G1 X5.53 Y11.22 Z10.1
+G1 X5.53 Y14.4 Z10.1
+G1 X12.11 Y14.4 Z10.1
+G1 X12.11 Y11.22 Z10.1
+G1 X8.99 Y9.42 Z10.1
+G1 X8.99 Y5.22 Z10.1
+G1 X12.11 Y3.42 Z10.1
+G1 X12.11 Y-0.78 Z10.1
+G1 X8.99 Y-2.58 Z10.1
+G1 X8.99 Y-6.78 Z10.1
+G1 X12.11 Y-8.58 Z10.1
+G1 X12.11 Y-12.78 Z10.1
+G1 X9.31 Y-14.4 Z10.1
+G1 X15.27 Y-14.4 Z10.1
+G1 X12.46 Y-12.78 Z10.1
+G1 X12.46 Y-8.58 Z10.1
+G1 X15.58 Y-6.78 Z10.1
+G1 X15.58 Y-2.58 Z10.1
+G1 X12.46 Y-0.78 Z10.1
+G1 X12.46 Y3.42 Z10.1
+G1 X15.58 Y5.22 Z10.1
+G1 X15.58 Y9.42 Z10.1
+G1 X12.46 Y11.22 Z10.1
+G1 X12.46 Y14.4 Z10.1
+G1 X19.04 Y14.4 Z10.1
+G1 X19.04 Y11.22 Z10.1
+G1 X15.92 Y9.42 Z10.1
+G1 X15.92 Y5.22 Z10.1
+G1 X19.04 Y3.42 Z10.1
+G1 X19.04 Y-0.78 Z10.1
+G1 X15.92 Y-2.58 Z10.1
+G1 X15.92 Y-6.78 Z10.1
+G1 X19.04 Y-8.58 Z10.1
+G1 X19.04 Y-12.78 Z10.1
+G1 X16.24 Y-14.4 Z10.1
+G1 X22.19 Y-14.4 Z10.1
+G1 X19.39 Y-12.78 Z10.1
+G1 X19.39 Y-8.58 Z10.1
+G1 X22.5 Y-6.78 Z10.1
+G1 X22.5 Y-2.58 Z10.1
+G1 X19.39 Y-0.78 Z10.1
+G1 X19.39 Y3.42 Z10.1
+G1 X22.5 Y5.22 Z10.1
+G1 X22.5 Y9.42 Z10.1
+G1 X19.39 Y11.22 Z10.1
+G1 X19.39 Y14.4 Z10.1
+G1 X25.97 Y14.4 Z10.1
+G1 X25.97 Y11.22 Z10.1
+G1 X22.85 Y9.42 Z10.1
+G1 X22.85 Y5.22 Z10.1
+G1 X25.97 Y3.42 Z10.1
+G1 X25.97 Y-0.78 Z10.1
+G1 X22.85 Y-2.58 Z10.1
+G1 X22.85 Y-6.78 Z10.1
+G1 X25.97 Y-8.58 Z10.1
+G1 X25.97 Y-12.78 Z10.1
+G1 X23.16 Y-14.4 Z10.1
+G1 X29.12 Y-14.4 Z10.1
+G1 X26.32 Y-12.78 Z10.1
+G1 X26.32 Y-8.58 Z10.1
+G1 X29.43 Y-6.78 Z10.1
+G1 X29.43 Y-2.58 Z10.1
+G1 X26.32 Y-0.78 Z10.1
+G1 X26.32 Y3.42 Z10.1
+G1 X29.43 Y5.22 Z10.1
+G1 X29.43 Y9.42 Z10.1
+G1 X26.32 Y11.22 Z10.1
+G1 X26.32 Y14.4 Z10.1
+G1 X32.9 Y14.4 Z10.1
+G1 X32.9 Y11.22 Z10.1
+G1 X29.78 Y9.42 Z10.1
+G1 X29.78 Y5.22 Z10.1
+G1 X32.9 Y3.42 Z10.1
+G1 X32.9 Y-0.78 Z10.1
+G1 X29.78 Y-2.58 Z10.1
+G1 X29.78 Y-6.78 Z10.1
+G1 X32.9 Y-8.58 Z10.1
+G1 X32.9 Y-12.78 Z10.1
+G1 X30.09 Y-14.4 Z10.1
+G1 X34.4 Y-13.45 Z10.1
+G1 X33.24 Y-12.78 Z10.1
+G1 X33.24 Y-8.58 Z10.1
+G1 X34.4 Y-7.91 Z10.1
+G1 X34.4 Y-1.45 Z10.1
+G1 X33.24 Y-0.78 Z10.1
+G1 X33.24 Y3.42 Z10.1
+G1 X34.4 Y4.09 Z10.1
+G1 X34.4 Y10.55 Z10.1
+G1 X33.24 Y11.22 Z10.1
+G1 X33.24 Y14.4 Z10.1
+T1
+G1 X1.75 Y-13.85 Z11.1
+G1 X33.85 Y-13.85 Z11.1
+G1 X33.85 Y3.95 Z11.1
+G1 X33.85 Y13.85 Z11.1
+G1 X-1.75 Y13.85 Z11.1
+G1 X-33.85 Y13.85 Z11.1
+G1 X-33.85 Y-3.95 Z11.1
+G1 X-33.85 Y-13.85 Z11.1
+G1 X1.75 Y-13.85 Z11.1
+G1 X1.75 Y-13.85 Z11.1
+G1 X-33.85 Y-7.32 Z11.1
+G1 X-32.92 Y-6.78 Z11.1
+G1 X-32.92 Y-2.58 Z11.1
+G1 X-33.85 Y-2.05 Z11.1
+G1 X-33.85 Y4.68 Z11.1
+G1 X-32.92 Y5.22 Z11.1
+G1 X-32.92 Y9.42 Z11.1
+G1 X-33.85 Y9.95 Z11.1
+G1 X-29.46 Y13.85 Z11.1
+G1 X-29.46 Y11.22 Z11.1
+G1 X-32.57 Y9.42 Z11.1
+G1 X-32.57 Y5.22 Z11.1
+G1 X-29.46 Y3.42 Z11.1
+G1 X-29.46 Y-0.78 Z11.1
+G1 X-32.57 Y-2.58 Z11.1
+G1 X-32.57 Y-6.78 Z11.1
+G1 X-29.46 Y-8.58 Z11.1
+G1 X-29.46 Y-12.78 Z11.1
+G1 X-31.3 Y-13.85 Z11.1
+G1 X-27.26 Y-13.85 Z11.1
+G1 X-29.11 Y-12.78 Z11.1
+G1 X-29.11 Y-8.58 Z11.1
+G1 X-25.99 Y-6.78 Z11.1
+G1 X-25.99 Y-2.58 Z11.1
+G1 X-29.11 Y-0.78 Z11.1
+G1 X-29.11 Y3.42 Z11.1
+G1 X-25.99 Y5.22 Z11.1
+G1 X-25.99 Y9.42 Z11.1
+G1 X-29.11 Y11.22 Z11.1
+G1 X-29.11 Y13.85 Z11.1
+G1 X-22.53 Y13.85 Z11.1
+G1 X-22.53 Y11.22 Z11.1
+G1 X-25.65 Y9.42 Z11.1
+G1 X-25.65 Y5.22 Z11.1
+G1 X-22.53 Y3.42 Z11.1
+G1 X-22.53 Y-0.78 Z11.1
+G1 X-25.65 Y-2.58 Z11.1
+G1 X-25.65 Y-6.78 Z11.1
+G1 X-22.53 Y-8.58 Z11.1
+G1 X-22.53 Y-12.78 Z11.1
+G1 X-24.38 Y-13.85 Z11.1
+G1 X-20.33 Y-13.85 Z11.1
+G1 X-22.18 Y-12.78 Z11.1
+G1 X-22.18 Y-8.58 Z11.1
+G1 X-19.06 Y-6.78 Z11.1
+G1 X-19.06 Y-2.58 Z11.1
+G1 X-22.18 Y-0.78 Z11.1
+G1 X-22.18 Y3.42 Z11.1
+G1 X-19.06 Y5.22 Z11.1
+G1 X-19.06 Y9.42 Z11.1
+G1 X-22.18 Y11.22 Z11.1
+G1 X-22.18 Y13.85 Z11.1
+G1 X-15.6 Y13.85 Z11.1
+G1 X-15.6 Y11.22 Z11.1
+G1 X-18.72 Y9.42 Z11.1
+G1 X-18.72 Y5.22 Z11.1
+G1 X-15.6 Y3.42 Z11.1
+G1 X-15.6 Y-0.78 Z11.1
+G1 X-18.72 Y-2.58 Z11.1
+G1 X-18.72 Y-6.78 Z11.1
+G1 X-15.6 Y-8.58 Z11.1
+G1 X-15.6 Y-12.78 Z11.1
+G1 X-17.45 Y-13.85 Z11.1
+G1 X-13.41 Y-13.85 Z11.1
+G1 X-15.25 Y-12.78 Z11.1
+G1 X-15.25 Y-8.58 Z11.1
+G1 X-12.14 Y-6.78 Z11.1
+G1 X-12.14 Y-2.58 Z11.1
+G1 X-15.25 Y-0.78 Z11.1
+G1 X-15.25 Y3.42 Z11.1
+G1 X-12.14 Y5.22 Z11.1
+G1 X-12.14 Y9.42 Z11.1
+G1 X-15.25 Y11.22 Z11.1
+G1 X-15.25 Y13.85 Z11.1
+G1 X-8.67 Y13.85 Z11.1
+G1 X-8.67 Y11.22 Z11.1
+G1 X-11.79 Y9.42 Z11.1
+G1 X-11.79 Y5.22 Z11.1
+G1 X-8.67 Y3.42 Z11.1
+G1 X-8.67 Y-0.78 Z11.1
+G1 X-11.79 Y-2.58 Z11.1
+G1 X-11.79 Y-6.78 Z11.1
+G1 X-8.67 Y-8.58 Z11.1
+G1 X-8.67 Y-12.78 Z11.1
+G1 X-10.52 Y-13.85 Z11.1
+G1 X-6.48 Y-13.85 Z11.1
+G1 X-8.32 Y-12.78 Z11.1
+G1 X-8.32 Y-8.58 Z11.1
+G1 X-5.21 Y-6.78 Z11.1
+G1 X-5.21 Y-2.58 Z11.1
+G1 X-8.32 Y-0.78 Z11.1
+G1 X-8.32 Y3.42 Z11.1
+G1 X-5.21 Y5.22 Z11.1
+G1 X-5.21 Y9.42 Z11.1
+G1 X-8.32 Y11.22 Z11.1
+G1 X-8.32 Y13.85 Z11.1
+G1 X-1.74 Y13.85 Z11.1
+G1 X-1.74 Y11.22 Z11.1
+G1 X-4.86 Y9.42 Z11.1
+G1 X-4.86 Y5.22 Z11.1
+G1 X-1.74 Y3.42 Z11.1
+G1 X-1.74 Y-0.78 Z11.1
+G1 X-4.86 Y-2.58 Z11.1
+G1 X-4.86 Y-6.78 Z11.1
+G1 X-1.74 Y-8.58 Z11.1
+G1 X-1.74 Y-12.78 Z11.1
+G1 X-3.59 Y-13.85 Z11.1
+G1 X0.45 Y-13.85 Z11.1
+G1 X-1.4 Y-12.78 Z11.1
+G1 X-1.4 Y-8.58 Z11.1
+G1 X1.72 Y-6.78 Z11.1
+G1 X1.72 Y-2.58 Z11.1
+G1 X-1.4 Y-0.78 Z11.1
+G1 X-1.4 Y3.42 Z11.1
+G1 X1.72 Y5.22 Z11.1
+G1 X1.72 Y9.42 Z11.1
+G1 X-1.4 Y11.22 Z11.1
+G1 X-1.4 Y13.85 Z11.1
+G1 X5.18 Y13.85 Z11.1
+G1 X5.18 Y11.22 Z11.1
+G1 X2.07 Y9.42 Z11.1
+G1 X2.07 Y5.22 Z11.1
+G1 X5.18 Y3.42 Z11.1
+G1 X5.18 Y-0.78 Z11.1
+G1 X2.07 Y-2.58 Z11.1
+G1 X2.07 Y-6.78 Z11.1
+G1 X5.18 Y-8.58 Z11.1
+G1 X5.18 Y-12.78 Z11.1
+G1 X3.34 Y-13.85 Z11.1
+G1 X7.38 Y-13.85 Z11.1
+G1 X5.53 Y-12.78 Z11.1
+G1 X5.53 Y-8.58 Z11.1
+G1 X8.65 Y-6.78 Z11.1
+G1 X8.65 Y-2.58 Z11.1
+G1 X5.53 Y-0.78 Z11.1
+G1 X5.53 Y3.42 Z11.1
+G1 X8.65 Y5.22 Z11.1
+G1 X8.65 Y9.42 Z11.1
+G1 X5.53 Y11.22 Z11.1
+G1 X5.53 Y13.85 Z11.1
+G1 X12.11 Y13.85 Z11.1
+G1 X12.11 Y11.22 Z11.1
+G1 X8.99 Y9.42 Z11.1
+G1 X8.99 Y5.22 Z11.1
+G1 X12.11 Y3.42 Z11.1
+G1 X12.11 Y-0.78 Z11.1
+G1 X8.99 Y-2.58 Z11.1
+G1 X8.99 Y-6.78 Z11.1
+G1 X12.11 Y-8.58 Z11.1
+G1 X12.11 Y-12.78 Z11.1
+G1 X10.27 Y-13.85 Z11.1
+G1 X14.31 Y-13.85 Z11.1
+G1 X12.46 Y-12.78 Z11.1
+G1 X12.46 Y-8.58 Z11.1
+G1 X15.58 Y-6.78 Z11.1
+G1 X15.58 Y-2.58 Z11.1
+G1 X12.46 Y-0.78 Z11.1
+G1 X12.46 Y3.42 Z11.1
+G1 X15.58 Y5.22 Z11.1
+G1 X15.58 Y9.42 Z11.1
+G1 X12.46 Y11.22 Z11.1
+G1 X12.46 Y13.85 Z11.1
+G1 X19.04 Y13.85 Z11.1
+G1 X19.04 Y11.22 Z11.1
+G1 X15.92 Y9.42 Z11.1
+G1 X15.92 Y5.22 Z11.1
+G1 X19.04 Y3.42 Z11.1
+G1 X19.04 Y-0.78 Z11.1
+G1 X15.92 Y-2.58 Z11.1
+G1 X15.92 Y-6.78 Z11.1
+G1 X19.04 Y-8.58 Z11.1
+G1 X19.04 Y-12.78 Z11.1
+G1 X17.2 Y-13.85 Z11.1
+G1 X21.23 Y-13.85 Z11.1
+G1 X19.39 Y-12.78 Z11.1
+G1 X19.39 Y-8.58 Z11.1
+G1 X22.5 Y-6.78 Z11.1
+G1 X22.5 Y-2.58 Z11.1
+G1 X19.39 Y-0.78 Z11.1
+G1 X19.39 Y3.42 Z11.1
+G1 X22.5 Y5.22 Z11.1
+G1 X22.5 Y9.42 Z11.1
+G1 X19.39 Y11.22 Z11.1
+G1 X19.39 Y13.85 Z11.1
+G1 X25.97 Y13.85 Z11.1
+G1 X25.97 Y11.22 Z11.1
+G1 X22.85 Y9.42 Z11.1
+G1 X22.85 Y5.22 Z11.1
+G1 X25.97 Y3.42 Z11.1
+G1 X25.97 Y-0.78 Z11.1
+G1 X22.85 Y-2.58 Z11.1
+G1 X22.85 Y-6.78 Z11.1
+G1 X25.97 Y-8.58 Z11.1
+G1 X25.97 Y-12.78 Z11.1
+G1 X24.12 Y-13.85 Z11.1
+G1 X28.16 Y-13.85 Z11.1
+G1 X26.32 Y-12.78 Z11.1
+G1 X26.32 Y-8.58 Z11.1
+G1 X29.43 Y-6.78 Z11.1
+G1 X29.43 Y-2.58 Z11.1
+G1 X26.32 Y-0.78 Z11.1
+G1 X26.32 Y3.42 Z11.1
+G1 X29.43 Y5.22 Z11.1
+G1 X29.43 Y9.42 Z11.1
+G1 X26.32 Y11.22 Z11.1
+G1 X26.32 Y13.85 Z11.1
+G1 X32.9 Y13.85 Z11.1
+G1 X32.9 Y11.22 Z11.1
+G1 X29.78 Y9.42 Z11.1
+G1 X29.78 Y5.22 Z11.1
+G1 X32.9 Y3.42 Z11.1
+G1 X32.9 Y-0.78 Z11.1
+G1 X29.78 Y-2.58 Z11.1
+G1 X29.78 Y-6.78 Z11.1
+G1 X32.9 Y-8.58 Z11.1
+G1 X32.9 Y-12.78 Z11.1
+G1 X31.05 Y-13.85 Z11.1
+G1 X33.85 Y-13.13 Z11.1
+G1 X33.24 Y-12.78 Z11.1
+G1 X33.24 Y-8.58 Z11.1
+G1 X33.85 Y-8.23 Z11.1
+G1 X33.85 Y-1.13 Z11.1
+G1 X33.24 Y-0.78 Z11.1
+G1 X33.24 Y3.42 Z11.1
+G1 X33.85 Y3.77 Z11.1
+G1 X33.85 Y10.87 Z11.1
+G1 X33.24 Y11.22 Z11.1
+G1 X33.24 Y13.85 Z11.1
+T1
+G1 X-1.69 Y-13.29 Z12.1
+G1 X33.29 Y-13.29 Z12.1
+G1 X33.29 Y2.51 Z12.1
+G1 X33.29 Y13.29 Z12.1
+G1 X1.69 Y13.29 Z12.1
+G1 X-33.29 Y13.29 Z12.1
+G1 X-33.29 Y-2.51 Z12.1
+G1 X-33.29 Y-13.29 Z12.1
+G1 X-1.69 Y-13.29 Z12.1
+G1 X-1.69 Y-13.29 Z12.1
+G1 X-33.29 Y-7.0 Z12.1
+G1 X-32.92 Y-6.78 Z12.1
+G1 X-32.92 Y-2.58 Z12.1
+G1 X-33.29 Y-2.37 Z12.1
+G1 X-33.29 Y5.0 Z12.1
+G1 X-32.92 Y5.22 Z12.1
+G1 X-32.92 Y9.42 Z12.1
+G1 X-33.29 Y9.63 Z12.1
+G1 X-29.46 Y13.29 Z12.1
+G1 X-29.46 Y11.22 Z12.1
+G1 X-32.57 Y9.42 Z12.1
+G1 X-32.57 Y5.22 Z12.1
+G1 X-29.46 Y3.42 Z12.1
+G1 X-29.46 Y-0.78 Z12.1
+G1 X-32.57 Y-2.58 Z12.1
+G1 X-32.57 Y-6.78 Z12.1
+G1 X-29.46 Y-8.58 Z12.1
+G1 X-29.46 Y-12.78 Z12.1
+G1 X-30.34 Y-13.29 Z12.1
+G1 X-28.22 Y-13.29 Z12.1
+G1 X-29.11 Y-12.78 Z12.1
+G1 X-29.11 Y-8.58 Z12.1
+G1 X-25.99 Y-6.78 Z12.1
+G1 X-25.99 Y-2.58 Z12.1
+G1 X-29.11 Y-0.78 Z12.1
+G1 X-29.11 Y3.42 Z12.1
+G1 X-25.99 Y5.22 Z12.1
+G1 X-25.99 Y9.42 Z12.1
+G1 X-29.11 Y11.22 Z12.1
+G1 X-29.11 Y13.29 Z12.1
+G1 X-22.53 Y13.29 Z12.1
+G1 X-22.53 Y11.22 Z12.1
+G1 X-25.65 Y9.42 Z12.1
+G1 X-25.65 Y5.22 Z12.1
+G1 X-22.53 Y3.42 Z12.1
+G1 X-22.53 Y-0.78 Z12.1
+G1 X-25.65 Y-2.58 Z12.1
+G1 X-25.65 Y-6.78 Z12.1
+G1 X-22.53 Y-8.58 Z12.1
+G1 X-22.53 Y-12.78 Z12.1
+G1 X-23.41 Y-13.29 Z12.1
+G1 X-21.29 Y-13.29 Z12.1
+G1 X-22.18 Y-12.78 Z12.1
+G1 X-22.18 Y-8.58 Z12.1
+G1 X-19.06 Y-6.78 Z12.1
+G1 X-19.06 Y-2.58 Z12.1
+G1 X-22.18 Y-0.78 Z12.1
+G1 X-22.18 Y3.42 Z12.1
+G1 X-19.06 Y5.22 Z12.1
+G1 X-19.06 Y9.42 Z12.1
+G1 X-22.18 Y11.22 Z12.1
+G1 X-22.18 Y13.29 Z12.1
+G1 X-15.6 Y13.29 Z12.1
+G1 X-15.6 Y11.22 Z12.1
+G1 X-18.72 Y9.42 Z12.1
+G1 X-18.72 Y5.22 Z12.1
+G1 X-15.6 Y3.42 Z12.1
+G1 X-15.6 Y-0.78 Z12.1
+G1 X-18.72 Y-2.58 Z12.1
+G1 X-18.72 Y-6.78 Z12.1
+G1 X-15.6 Y-8.58 Z12.1
+G1 X-15.6 Y-12.78 Z12.1
+G1 X-16.49 Y-13.29 Z12.1
+G1 X-14.37 Y-13.29 Z12.1
+G1 X-15.25 Y-12.78 Z12.1
+G1 X-15.25 Y-8.58 Z12.1
+G1 X-12.14 Y-6.78 Z12.1
+G1 X-12.14 Y-2.58 Z12.1
+G1 X-15.25 Y-0.78 Z12.1
+G1 X-15.25 Y3.42 Z12.1
+G1 X-12.14 Y5.22 Z12.1
+G1 X-12.14 Y9.42 Z12.1
+G1 X-15.25 Y11.22 Z12.1
+G1 X-15.25 Y13.29 Z12.1
+G1 X-8.67 Y13.29 Z12.1
+G1 X-8.67 Y11.22 Z12.1
+G1 X-11.79 Y9.42 Z12.1
+G1 X-11.79 Y5.22 Z12.1
+G1 X-8.67 Y3.42 Z12.1
+G1 X-8.67 Y-0.78 Z12.1
+G1 X-11.79 Y-2.58 Z12.1
+G1 X-11.79 Y-6.78 Z12.1
+G1 X-8.67 Y-8.58 Z12.1
+G1 X-8.67 Y-12.78 Z12.1
+G1 X-9.56 Y-13.29 Z12.1
+G1 X-7.44 Y-13.29 Z12.1
+G1 X-8.32 Y-12.78 Z12.1
+G1 X-8.32 Y-8.58 Z12.1
+G1 X-5.21 Y-6.78 Z12.1
+G1 X-5.21 Y-2.58 Z12.1
+G1 X-8.32 Y-0.78 Z12.1
+G1 X-8.32 Y3.42 Z12.1
+G1 X-5.21 Y5.22 Z12.1
+G1 X-5.21 Y9.42 Z12.1
+G1 X-8.32 Y11.22 Z12.1
+G1 X-8.32 Y13.29 Z12.1
+G1 X-1.74 Y13.29 Z12.1
+G1 X-1.74 Y11.22 Z12.1
+G1 X-4.86 Y9.42 Z12.1
+G1 X-4.86 Y5.22 Z12.1
+G1 X-1.74 Y3.42 Z12.1
+G1 X-1.74 Y-0.78 Z12.1
+G1 X-4.86 Y-2.58 Z12.1
+G1 X-4.86 Y-6.78 Z12.1
+G1 X-1.74 Y-8.58 Z12.1
+G1 X-1.74 Y-12.78 Z12.1
+G1 X-2.63 Y-13.29 Z12.1
+G1 X-0.51 Y-13.29 Z12.1
+G1 X-1.4 Y-12.78 Z12.1
+G1 X-1.4 Y-8.58 Z12.1
+G1 X1.72 Y-6.78 Z12.1
+G1 X1.72 Y-2.58 Z12.1
+G1 X-1.4 Y-0.78 Z12.1
+G1 X-1.4 Y3.42 Z12.1
+G1 X1.72 Y5.22 Z12.1
+G1 X1.72 Y9.42 Z12.1
+G1 X-1.4 Y11.22 Z12.1
+G1 X-1.4 Y13.29 Z12.1
+G1 X5.18 Y13.29 Z12.1
+G1 X5.18 Y11.22 Z12.1
+G1 X2.07 Y9.42 Z12.1
+G1 X2.07 Y5.22 Z12.1
+G1 X5.18 Y3.42 Z12.1
+G1 X5.18 Y-0.78 Z12.1
+G1 X2.07 Y-2.58 Z12.1
+G1 X2.07 Y-6.78 Z12.1
+G1 X5.18 Y-8.58 Z12.1
+G1 X5.18 Y-12.78 Z12.1
+G1 X4.3 Y-13.29 Z12.1
+G1 X6.42 Y-13.29 Z12.1
+G1 X5.53 Y-12.78 Z12.1
+G1 X5.53 Y-8.58 Z12.1
+G1 X8.65 Y-6.78 Z12.1
+G1 X8.65 Y-2.58 Z12.1
+G1 X5.53 Y-0.78 Z12.1
+G1 X5.53 Y3.42 Z12.1
+G1 X8.65 Y5.22 Z12.1
+G1 X8.65 Y9.42 Z12.1
+G1 X5.53 Y11.22 Z12.1
+G1 X5.53 Y13.29 Z12.1
+G1 X12.11 Y13.29 Z12.1
+G1 X12.11 Y11.22 Z12.1
+G1 X8.99 Y9.42 Z12.1
+G1 X8.99 Y5.22 Z12.1
+G1 X12.11 Y3.42 Z12.1
+G1 X12.11 Y-0.78 Z12.1
+G1 X8.99 Y-2.58 Z12.1
+G1 X8.99 Y-6.78 Z12.1
+G1 X12.11 Y-8.58 Z12.1
+G1 X12.11 Y-12.78 Z12.1
+G1 X11.23 Y-13.29 Z12.1
+G1 X13.35 Y-13.29 Z12.1
+G1 X12.46 Y-12.78 Z12.1
+G1 X12.46 Y-8.58 Z12.1
+G1 X15.58 Y-6.78 Z12.1
+G1 X15.58 Y-2.58 Z12.1
+G1 X12.46 Y-0.78 Z12.1
+G1 X12.46 Y3.42 Z12.1
+G1 X15.58 Y5.22 Z12.1
+G1 X15.58 Y9.42 Z12.1
+G1 X12.46 Y11.22 Z12.1
+G1 X12.46 Y13.29 Z12.1
+G1 X19.04 Y13.29 Z12.1
+G1 X19.04 Y11.22 Z12.1
+G1 X15.92 Y9.42 Z12.1
+G1 X15.92 Y5.22 Z12.1
+G1 X19.04 Y3.42 Z12.1
+G1 X19.04 Y-0.78 Z12.1
+G1 X15.92 Y-2.58 Z12.1
+G1 X15.92 Y-6.78 Z12.1
+G1 X19.04 Y-8.58 Z12.1
+G1 X19.04 Y-12.78 Z12.1
+G1 X18.16 Y-13.29 Z12.1
+G1 X20.27 Y-13.29 Z12.1
+G1 X19.39 Y-12.78 Z12.1
+G1 X19.39 Y-8.58 Z12.1
+G1 X22.5 Y-6.78 Z12.1
+G1 X22.5 Y-2.58 Z12.1
+G1 X19.39 Y-0.78 Z12.1
+G1 X19.39 Y3.42 Z12.1
+G1 X22.5 Y5.22 Z12.1
+G1 X22.5 Y9.42 Z12.1
+G1 X19.39 Y11.22 Z12.1
+G1 X19.39 Y13.29 Z12.1
+G1 X25.97 Y13.29 Z12.1
+G1 X25.97 Y11.22 Z12.1
+G1 X22.85 Y9.42 Z12.1
+G1 X22.85 Y5.22 Z12.1
+G1 X25.97 Y3.42 Z12.1
+G1 X25.97 Y-0.78 Z12.1
+G1 X22.85 Y-2.58 Z12.1
+G1 X22.85 Y-6.78 Z12.1
+G1 X25.97 Y-8.58 Z12.1
+G1 X25.97 Y-12.78 Z12.1
+G1 X25.08 Y-13.29 Z12.1
+G1 X27.2 Y-13.29 Z12.1
+G1 X26.32 Y-12.78 Z12.1
+G1 X26.32 Y-8.58 Z12.1
+G1 X29.43 Y-6.78 Z12.1
+G1 X29.43 Y-2.58 Z12.1
+G1 X26.32 Y-0.78 Z12.1
+G1 X26.32 Y3.42 Z12.1
+G1 X29.43 Y5.22 Z12.1
+G1 X29.43 Y9.42 Z12.1
+G1 X26.32 Y11.22 Z12.1
+G1 X26.32 Y13.29 Z12.1
+G1 X32.9 Y13.29 Z12.1
+G1 X32.9 Y11.22 Z12.1
+G1 X29.78 Y9.42 Z12.1
+G1 X29.78 Y5.22 Z12.1
+G1 X32.9 Y3.42 Z12.1
+G1 X32.9 Y-0.78 Z12.1
+G1 X29.78 Y-2.58 Z12.1
+G1 X29.78 Y-6.78 Z12.1
+G1 X32.9 Y-8.58 Z12.1
+G1 X32.9 Y-12.78 Z12.1
+G1 X32.01 Y-13.29 Z12.1
+G1 X33.29 Y-12.81 Z12.1
+G1 X33.24 Y-12.78 Z12.1
+G1 X33.24 Y-8.58 Z12.1
+G1 X33.29 Y-8.55 Z12.1
+G1 X33.29 Y-0.81 Z12.1
+G1 X33.24 Y-0.78 Z12.1
+G1 X33.24 Y3.42 Z12.1
+G1 X33.29 Y3.45 Z12.1
+G1 X33.29 Y11.19 Z12.1
+G1 X33.24 Y11.22 Z12.1
+G1 X33.24 Y13.29 Z12.1
+T1
+G1 X32.74 Y-12.74 Z13.1
+G1 X32.74 Y1.06 Z13.1
+G1 X32.74 Y12.74 Z13.1
+G1 X5.14 Y12.74 Z13.1
+G1 X-32.74 Y12.74 Z13.1
+G1 X-32.74 Y-1.06 Z13.1
+G1 X-32.74 Y-12.74 Z13.1
+G1 X-5.14 Y-12.74 Z13.1
+G1 X32.74 Y-12.74 Z13.1
+G1 X32.74 Y-12.74 Z13.1
+G1 X-29.46 Y12.74 Z13.1
+G1 X-29.46 Y11.22 Z13.1
+G1 X-32.57 Y9.42 Z13.1
+G1 X-32.57 Y5.22 Z13.1
+G1 X-29.46 Y3.42 Z13.1
+G1 X-29.46 Y-0.78 Z13.1
+G1 X-32.57 Y-2.58 Z13.1
+G1 X-32.57 Y-6.78 Z13.1
+G1 X-29.46 Y-8.58 Z13.1
+G1 X-29.46 Y-12.74 Z13.1
+G1 X-29.11 Y-12.74 Z13.1
+G1 X-29.11 Y-8.58 Z13.1
+G1 X-25.99 Y-6.78 Z13.1
+G1 X-25.99 Y-2.58 Z13.1
+G1 X-29.11 Y-0.78 Z13.1
+G1 X-29.11 Y3.42 Z13.1
+G1 X-25.99 Y5.22 Z13.1
+G1 X-25.99 Y9.42 Z13.1
+G1 X-29.11 Y11.22 Z13.1
+G1 X-29.11 Y12.74 Z13.1
+G1 X-22.53 Y12.74 Z13.1
+G1 X-22.53 Y11.22 Z13.1
+G1 X-25.65 Y9.42 Z13.1
+G1 X-25.65 Y5.22 Z13.1
+G1 X-22.53 Y3.42 Z13.1
+G1 X-22.53 Y-0.78 Z13.1
+G1 X-25.65 Y-2.58 Z13.1
+G1 X-25.65 Y-6.78 Z13.1
+G1 X-22.53 Y-8.58 Z13.1
+G1 X-22.53 Y-12.74 Z13.1
+G1 X-22.18 Y-12.74 Z13.1
+G1 X-22.18 Y-8.58 Z13.1
+G1 X-19.06 Y-6.78 Z13.1
+G1 X-19.06 Y-2.58 Z13.1
+G1 X-22.18 Y-0.78 Z13.1
+G1 X-22.18 Y3.42 Z13.1
+G1 X-19.06 Y5.22 Z13.1
+G1 X-19.06 Y9.42 Z13.1
+G1 X-22.18 Y11.22 Z13.1
+G1 X-22.18 Y12.74 Z13.1
+G1 X-15.6 Y12.74 Z13.1
+G1 X-15.6 Y11.22 Z13.1
+G1 X-18.72 Y9.42 Z13.1
+G1 X-18.72 Y5.22 Z13.1
+G1 X-15.6 Y3.42 Z13.1
+G1 X-15.6 Y-0.78 Z13.1
+G1 X-18.72 Y-2.58 Z13.1
+G1 X-18.72 Y-6.78 Z13.1
+G1 X-15.6 Y-8.58 Z13.1
+G1 X-15.6 Y-12.74 Z13.1
+G1 X-15.25 Y-12.74 Z13.1
+G1 X-15.25 Y-8.58 Z13.1
+G1 X-12.14 Y-6.78 Z13.1
+G1 X-12.14 Y-2.58 Z13.1
+G1 X-15.25 Y-0.78 Z13.1
+G1 X-15.25 Y3.42 Z13.1
+G1 X-12.14 Y5.22 Z13.1
+G1 X-12.14 Y9.42 Z13.1
+G1 X-15.25 Y11.22 Z13.1
+G1 X-15.25 Y12.74 Z13.1
+G1 X-8.67 Y12.74 Z13.1
+G1 X-8.67 Y11.22 Z13.1
+G1 X-11.79 Y9.42 Z13.1
+G1 X-11.79 Y5.22 Z13.1
+G1 X-8.67 Y3.42 Z13.1
+G1 X-8.67 Y-0.78 Z13.1
+G1 X-11.79 Y-2.58 Z13.1
+G1 X-11.79 Y-6.78 Z13.1
+G1 X-8.67 Y-8.58 Z13.1
+G1 X-8.67 Y-12.74 Z13.1
+G1 X-8.32 Y-12.74 Z13.1
+G1 X-8.32 Y-8.58 Z13.1
+G1 X-5.21 Y-6.78 Z13.1
+G1 X-5.21 Y-2.58 Z13.1
+G1 X-8.32 Y-0.78 Z13.1
+G1 X-8.32 Y3.42 Z13.1
+G1 X-5.21 Y5.22 Z13.1
+G1 X-5.21 Y9.42 Z13.1
+G1 X-8.32 Y11.22 Z13.1
+G1 X-8.32 Y12.74 Z13.1
+G1 X-1.74 Y12.74 Z13.1
+G1 X-1.74 Y11.22 Z13.1
+G1 X-4.86 Y9.42 Z13.1
+G1 X-4.86 Y5.22 Z13.1
+G1 X-1.74 Y3.42 Z13.1
+G1 X-1.74 Y-0.78 Z13.1
+G1 X-4.86 Y-2.58 Z13.1
+G1 X-4.86 Y-6.78 Z13.1
+G1 X-1.74 Y-8.58 Z13.1
+G1 X-1.74 Y-12.74 Z13.1
+G1 X-1.4 Y-12.74 Z13.1
+G1 X-1.4 Y-8.58 Z13.1
+G1 X1.72 Y-6.78 Z13.1
+G1 X1.72 Y-2.58 Z13.1
+G1 X-1.4 Y-0.78 Z13.1
+G1 X-1.4 Y3.42 Z13.1
+G1 X1.72 Y5.22 Z13.1
+G1 X1.72 Y9.42 Z13.1
+G1 X-1.4 Y11.22 Z13.1
+G1 X-1.4 Y12.74 Z13.1
+G1 X5.18 Y12.74 Z13.1
+G1 X5.18 Y11.22 Z13.1
+G1 X2.07 Y9.42 Z13.1
+G1 X2.07 Y5.22 Z13.1
+G1 X5.18 Y3.42 Z13.1
+G1 X5.18 Y-0.78 Z13.1
+G1 X2.07 Y-2.58 Z13.1
+G1 X2.07 Y-6.78 Z13.1
+G1 X5.18 Y-8.58 Z13.1
+G1 X5.18 Y-12.74 Z13.1
+G1 X5.53 Y-12.74 Z13.1
+G1 X5.53 Y-8.58 Z13.1
+G1 X8.65 Y-6.78 Z13.1
+G1 X8.65 Y-2.58 Z13.1
+G1 X5.53 Y-0.78 Z13.1
+G1 X5.53 Y3.42 Z13.1
+G1 X8.65 Y5.22 Z13.1
+G1 X8.65 Y9.42 Z13.1
+G1 X5.53 Y11.22 Z13.1
+G1 X5.53 Y12.74 Z13.1
+G1 X12.11 Y12.74 Z13.1
+G1 X12.11 Y11.22 Z13.1
+G1 X8.99 Y9.42 Z13.1
+G1 X8.99 Y5.22 Z13.1
+G1 X12.11 Y3.42 Z13.1
+G1 X12.11 Y-0.78 Z13.1
+G1 X8.99 Y-2.58 Z13.1
+G1 X8.99 Y-6.78 Z13.1
+G1 X12.11 Y-8.58 Z13.1
+G1 X12.11 Y-12.74 Z13.1
+G1 X12.46 Y-12.74 Z13.1
+G1 X12.46 Y-8.58 Z13.1
+G1 X15.58 Y-6.78 Z13.1
+G1 X15.58 Y-2.58 Z13.1
+G1 X12.46 Y-0.78 Z13.1
+G1 X12.46 Y3.42 Z13.1
+G1 X15.58 Y5.22 Z13.1
+G1 X15.58 Y9.42 Z13.1
+G1 X12.46 Y11.22 Z13.1
+G1 X12.46 Y12.74 Z13.1
+G1 X19.04 Y12.74 Z13.1
+G1 X19.04 Y11.22 Z13.1
+G1 X15.92 Y9.42 Z13.1
+G1 X15.92 Y5.22 Z13.1
+G1 X19.04 Y3.42 Z13.1
+G1 X19.04 Y-0.78 Z13.1
+G1 X15.92 Y-2.58 Z13.1
+G1 X15.92 Y-6.78 Z13.1
+G1 X19.04 Y-8.58 Z13.1
+G1 X19.04 Y-12.74 Z13.1
+G1 X19.39 Y-12.74 Z13.1
+G1 X19.39 Y-8.58 Z13.1
+G1 X22.5 Y-6.78 Z13.1
+G1 X22.5 Y-2.58 Z13.1
+G1 X19.39 Y-0.78 Z13.1
+G1 X19.39 Y3.42 Z13.1
+G1 X22.5 Y5.22 Z13.1
+G1 X22.5 Y9.42 Z13.1
+G1 X19.39 Y11.22 Z13.1
+G1 X19.39 Y12.74 Z13.1
+G1 X25.97 Y12.74 Z13.1
+G1 X25.97 Y11.22 Z13.1
+G1 X22.85 Y9.42 Z13.1
+G1 X22.85 Y5.22 Z13.1
+G1 X25.97 Y3.42 Z13.1
+G1 X25.97 Y-0.78 Z13.1
+G1 X22.85 Y-2.58 Z13.1
+G1 X22.85 Y-6.78 Z13.1
+G1 X25.97 Y-8.58 Z13.1
+G1 X25.97 Y-12.74 Z13.1
+G1 X26.32 Y-12.74 Z13.1
+G1 X26.32 Y-8.58 Z13.1
+G1 X29.43 Y-6.78 Z13.1
+G1 X29.43 Y-2.58 Z13.1
+G1 X26.32 Y-0.78 Z13.1
+G1 X26.32 Y3.42 Z13.1
+G1 X29.43 Y5.22 Z13.1
+G1 X29.43 Y9.42 Z13.1
+G1 X26.32 Y11.22 Z13.1
+G1 X26.32 Y12.74 Z13.1
+G1 X32.74 Y11.13 Z13.1
+G1 X29.78 Y9.42 Z13.1
+G1 X29.78 Y5.22 Z13.1
+G1 X32.74 Y3.51 Z13.1
+G1 X32.74 Y-0.87 Z13.1
+G1 X29.78 Y-2.58 Z13.1
+G1 X29.78 Y-6.78 Z13.1
+G1 X32.74 Y-8.49 Z13.1
+T1
+G1 X32.18 Y-12.18 Z14.1
+G1 X32.18 Y-0.38 Z14.1
+G1 X32.18 Y12.18 Z14.1
+G1 X8.58 Y12.18 Z14.1
+G1 X-32.18 Y12.18 Z14.1
+G1 X-32.18 Y0.38 Z14.1
+G1 X-32.18 Y-12.18 Z14.1
+G1 X-8.58 Y-12.18 Z14.1
+G1 X32.18 Y-12.18 Z14.1
+G1 X32.18 Y-12.18 Z14.1
+G1 X-29.46 Y12.18 Z14.1
+G1 X-29.46 Y11.22 Z14.1
+G1 X-32.18 Y9.64 Z14.1
+G1 X-32.18 Y4.99 Z14.1
+G1 X-29.46 Y3.42 Z14.1
+G1 X-29.46 Y-0.78 Z14.1
+G1 X-32.18 Y-2.36 Z14.1
+G1 X-32.18 Y-7.01 Z14.1
+G1 X-29.46 Y-8.58 Z14.1
+G1 X-29.46 Y-12.18 Z14.1
+G1 X-29.11 Y-12.18 Z14.1
+G1 X-29.11 Y-8.58 Z14.1
+G1 X-25.99 Y-6.78 Z14.1
+G1 X-25.99 Y-2.58 Z14.1
+G1 X-29.11 Y-0.78 Z14.1
+G1 X-29.11 Y3.42 Z14.1
+G1 X-25.99 Y5.22 Z14.1
+G1 X-25.99 Y9.42 Z14.1
+G1 X-29.11 Y11.22 Z14.1
+G1 X-29.11 Y12.18 Z14.1
+G1 X-22.53 Y12.18 Z14.1
+G1 X-22.53 Y11.22 Z14.1
+G1 X-25.65 Y9.42 Z14.1
+G1 X-25.65 Y5.22 Z14.1
+G1 X-22.53 Y3.42 Z14.1
+G1 X-22.53 Y-0.78 Z14.1
+G1 X-25.65 Y-2.58 Z14.1
+G1 X-25.65 Y-6.78 Z14.1
+G1 X-22.53 Y-8.58 Z14.1
+G1 X-22.53 Y-12.18 Z14.1
+G1 X-22.18 Y-12.18 Z14.1
+G1 X-22.18 Y-8.58 Z14.1
+G1 X-19.06 Y-6.78 Z14.1
+G1 X-19.06 Y-2.58 Z14.1
+G1 X-22.18 Y-0.78 Z14.1
+G1 X-22.18 Y3.42 Z14.1
+G1 X-19.06 Y5.22 Z14.1
+G1 X-19.06 Y9.42 Z14.1
+G1 X-22.18 Y11.22 Z14.1
+G1 X-22.18 Y12.18 Z14.1
+G1 X-15.6 Y12.18 Z14.1
+G1 X-15.6 Y11.22 Z14.1
+G1 X-18.72 Y9.42 Z14.1
+G1 X-18.72 Y5.22 Z14.1
+G1 X-15.6 Y3.42 Z14.1
+G1 X-15.6 Y-0.78 Z14.1
+G1 X-18.72 Y-2.58 Z14.1
+G1 X-18.72 Y-6.78 Z14.1
+G1 X-15.6 Y-8.58 Z14.1
+G1 X-15.6 Y-12.18 Z14.1
+G1 X-15.25 Y-12.18 Z14.1
+G1 X-15.25 Y-8.58 Z14.1
+G1 X-12.14 Y-6.78 Z14.1
+G1 X-12.14 Y-2.58 Z14.1
+G1 X-15.25 Y-0.78 Z14.1
+G1 X-15.25 Y3.42 Z14.1
+G1 X-12.14 Y5.22 Z14.1
+G1 X-12.14 Y9.42 Z14.1
+G1 X-15.25 Y11.22 Z14.1
+G1 X-15.25 Y12.18 Z14.1
+G1 X-8.67 Y12.18 Z14.1
+G1 X-8.67 Y11.22 Z14.1
+G1 X-11.79 Y9.42 Z14.1
+G1 X-11.79 Y5.22 Z14.1
+G1 X-8.67 Y3.42 Z14.1
+G1 X-8.67 Y-0.78 Z14.1
+G1 X-11.79 Y-2.58 Z14.1
+G1 X-11.79 Y-6.78 Z14.1
+G1 X-8.67 Y-8.58 Z14.1
+G1 X-8.67 Y-12.18 Z14.1
+G1 X-8.32 Y-12.18 Z14.1
+G1 X-8.32 Y-8.58 Z14.1
+G1 X-5.21 Y-6.78 Z14.1
+G1 X-5.21 Y-2.58 Z14.1
+G1 X-8.32 Y-0.78 Z14.1
+G1 X-8.32 Y3.42 Z14.1
+G1 X-5.21 Y5.22 Z14.1
+G1 X-5.21 Y9.42 Z14.1
+G1 X-8.32 Y11.22 Z14.1
+G1 X-8.32 Y12.18 Z14.1
+G1 X-1.74 Y12.18 Z14.1
+G1 X-1.74 Y11.22 Z14.1
+G1 X-4.86 Y9.42 Z14.1
+G1 X-4.86 Y5.22 Z14.1
+G1 X-1.74 Y3.42 Z14.1
+G1 X-1.74 Y-0.78 Z14.1
+G1 X-4.86 Y-2.58 Z14.1
+G1 X-4.86 Y-6.78 Z14.1
+G1 X-1.74 Y-8.58 Z14.1
+G1 X-1.74 Y-12.18 Z14.1
+G1 X-1.4 Y-12.18 Z14.1
+G1 X-1.4 Y-8.58 Z14.1
+G1 X1.72 Y-6.78 Z14.1
+G1 X1.72 Y-2.58 Z14.1
+G1 X-1.4 Y-0.78 Z14.1
+G1 X-1.4 Y3.42 Z14.1
+G1 X1.72 Y5.22 Z14.1
+G1 X1.72 Y9.42 Z14.1
+G1 X-1.4 Y11.22 Z14.1
+G1 X-1.4 Y12.18 Z14.1
+G1 X5.18 Y12.18 Z14.1
+G1 X5.18 Y11.22 Z14.1
+G1 X2.07 Y9.42 Z14.1
+G1 X2.07 Y5.22 Z14.1
+G1 X5.18 Y3.42 Z14.1
+G1 X5.18 Y-0.78 Z14.1
+G1 X2.07 Y-2.58 Z14.1
+G1 X2.07 Y-6.78 Z14.1
+G1 X5.18 Y-8.58 Z14.1
+G1 X5.18 Y-12.18 Z14.1
+G1 X5.53 Y-12.18 Z14.1
+G1 X5.53 Y-8.58 Z14.1
+G1 X8.65 Y-6.78 Z14.1
+G1 X8.65 Y-2.58 Z14.1
+G1 X5.53 Y-0.78 Z14.1
+G1 X5.53 Y3.42 Z14.1
+G1 X8.65 Y5.22 Z14.1
+G1 X8.65 Y9.42 Z14.1
+G1 X5.53 Y11.22 Z14.1
+G1 X5.53 Y12.18 Z14.1
+G1 X12.11 Y12.18 Z14.1
+G1 X12.11 Y11.22 Z14.1
+G1 X8.99 Y9.42 Z14.1
+G1 X8.99 Y5.22 Z14.1
+G1 X12.11 Y3.42 Z14.1
+G1 X12.11 Y-0.78 Z14.1
+G1 X8.99 Y-2.58 Z14.1
+G1 X8.99 Y-6.78 Z14.1
+G1 X12.11 Y-8.58 Z14.1
+G1 X12.11 Y-12.18 Z14.1
+G1 X12.46 Y-12.18 Z14.1
+G1 X12.46 Y-8.58 Z14.1
+G1 X15.58 Y-6.78 Z14.1
+G1 X15.58 Y-2.58 Z14.1
+G1 X12.46 Y-0.78 Z14.1
+G1 X12.46 Y3.42 Z14.1
+G1 X15.58 Y5.22 Z14.1
+G1 X15.58 Y9.42 Z14.1
+G1 X12.46 Y11.22 Z14.1
+G1 X12.46 Y12.18 Z14.1
+G1 X19.04 Y12.18 Z14.1
+G1 X19.04 Y11.22 Z14.1
+G1 X15.92 Y9.42 Z14.1
+G1 X15.92 Y5.22 Z14.1
+G1 X19.04 Y3.42 Z14.1
+G1 X19.04 Y-0.78 Z14.1
+G1 X15.92 Y-2.58 Z14.1
+G1 X15.92 Y-6.78 Z14.1
+G1 X19.04 Y-8.58 Z14.1
+G1 X19.04 Y-12.18 Z14.1
+G1 X19.39 Y-12.18 Z14.1
+G1 X19.39 Y-8.58 Z14.1
+G1 X22.5 Y-6.78 Z14.1
+G1 X22.5 Y-2.58 Z14.1
+G1 X19.39 Y-0.78 Z14.1
+G1 X19.39 Y3.42 Z14.1
+G1 X22.5 Y5.22 Z14.1
+G1 X22.5 Y9.42 Z14.1
+G1 X19.39 Y11.22 Z14.1
+G1 X19.39 Y12.18 Z14.1
+G1 X25.97 Y12.18 Z14.1
+G1 X25.97 Y11.22 Z14.1
+G1 X22.85 Y9.42 Z14.1
+G1 X22.85 Y5.22 Z14.1
+G1 X25.97 Y3.42 Z14.1
+G1 X25.97 Y-0.78 Z14.1
+G1 X22.85 Y-2.58 Z14.1
+G1 X22.85 Y-6.78 Z14.1
+G1 X25.97 Y-8.58 Z14.1
+G1 X25.97 Y-12.18 Z14.1
+G1 X26.32 Y-12.18 Z14.1
+G1 X26.32 Y-8.58 Z14.1
+G1 X29.43 Y-6.78 Z14.1
+G1 X29.43 Y-2.58 Z14.1
+G1 X26.32 Y-0.78 Z14.1
+G1 X26.32 Y3.42 Z14.1
+G1 X29.43 Y5.22 Z14.1
+G1 X29.43 Y9.42 Z14.1
+G1 X26.32 Y11.22 Z14.1
+G1 X26.32 Y12.18 Z14.1
+G1 X32.18 Y10.81 Z14.1
+G1 X29.78 Y9.42 Z14.1
+G1 X29.78 Y5.22 Z14.1
+G1 X32.18 Y3.83 Z14.1
+G1 X32.18 Y-1.19 Z14.1
+G1 X29.78 Y-2.58 Z14.1
+G1 X29.78 Y-6.78 Z14.1
+G1 X32.18 Y-8.17 Z14.1
+T1
+G1 X31.63 Y-11.63 Z15.1
+G1 X31.63 Y-1.83 Z15.1
+G1 X31.63 Y11.63 Z15.1
+G1 X12.03 Y11.63 Z15.1
+G1 X-31.63 Y11.63 Z15.1
+G1 X-31.63 Y1.83 Z15.1
+G1 X-31.63 Y-11.63 Z15.1
+G1 X-12.03 Y-11.63 Z15.1
+G1 X31.63 Y-11.63 Z15.1
+G1 X31.63 Y-11.63 Z15.1
+G1 X-29.46 Y11.63 Z15.1
+G1 X-29.46 Y11.22 Z15.1
+G1 X-31.63 Y9.96 Z15.1
+G1 X-31.63 Y4.67 Z15.1
+G1 X-29.46 Y3.42 Z15.1
+G1 X-29.46 Y-0.78 Z15.1
+G1 X-31.63 Y-2.04 Z15.1
+G1 X-31.63 Y-7.33 Z15.1
+G1 X-29.46 Y-8.58 Z15.1
+G1 X-29.46 Y-11.63 Z15.1
+G1 X-29.11 Y-11.63 Z15.1
+G1 X-29.11 Y-8.58 Z15.1
+G1 X-25.99 Y-6.78 Z15.1
+G1 X-25.99 Y-2.58 Z15.1
+G1 X-29.11 Y-0.78 Z15.1
+G1 X-29.11 Y3.42 Z15.1
+G1 X-25.99 Y5.22 Z15.1
+G1 X-25.99 Y9.42 Z15.1
+G1 X-29.11 Y11.22 Z15.1
+G1 X-29.11 Y11.63 Z15.1
+G1 X-22.53 Y11.63 Z15.1
+G1 X-22.53 Y11.22 Z15.1
+G1 X-25.65 Y9.42 Z15.1
+G1 X-25.65 Y5.22 Z15.1
+G1 X-22.53 Y3.42 Z15.1
+G1 X-22.53 Y-0.78 Z15.1
+G1 X-25.65 Y-2.58 Z15.1
+G1 X-25.65 Y-6.78 Z15.1
+G1 X-22.53 Y-8.58 Z15.1
+G1 X-22.53 Y-11.63 Z15.1
+G1 X-22.18 Y-11.63 Z15.1
+G1 X-22.18 Y-8.58 Z15.1
+G1 X-19.06 Y-6.78 Z15.1
+G1 X-19.06 Y-2.58 Z15.1
+G1 X-22.18 Y-0.78 Z15.1
+G1 X-22.18 Y3.42 Z15.1
+G1 X-19.06 Y5.22 Z15.1
+G1 X-19.06 Y9.42 Z15.1
+G1 X-22.18 Y11.22 Z15.1
+G1 X-22.18 Y11.63 Z15.1
+G1 X-15.6 Y11.63 Z15.1
+G1 X-15.6 Y11.22 Z15.1
+G1 X-18.72 Y9.42 Z15.1
+G1 X-18.72 Y5.22 Z15.1
+G1 X-15.6 Y3.42 Z15.1
+G1 X-15.6 Y-0.78 Z15.1
+G1 X-18.72 Y-2.58 Z15.1
+G1 X-18.72 Y-6.78 Z15.1
+G1 X-15.6 Y-8.58 Z15.1
+G1 X-15.6 Y-11.63 Z15.1
+G1 X-15.25 Y-11.63 Z15.1
+G1 X-15.25 Y-8.58 Z15.1
+G1 X-12.14 Y-6.78 Z15.1
+G1 X-12.14 Y-2.58 Z15.1
+G1 X-15.25 Y-0.78 Z15.1
+G1 X-15.25 Y3.42 Z15.1
+G1 X-12.14 Y5.22 Z15.1
+G1 X-12.14 Y9.42 Z15.1
+G1 X-15.25 Y11.22 Z15.1
+G1 X-15.25 Y11.63 Z15.1
+G1 X-8.67 Y11.63 Z15.1
+G1 X-8.67 Y11.22 Z15.1
+G1 X-11.79 Y9.42 Z15.1
+G1 X-11.79 Y5.22 Z15.1
+G1 X-8.67 Y3.42 Z15.1
+G1 X-8.67 Y-0.78 Z15.1
+G1 X-11.79 Y-2.58 Z15.1
+G1 X-11.79 Y-6.78 Z15.1
+G1 X-8.67 Y-8.58 Z15.1
+G1 X-8.67 Y-11.63 Z15.1
+G1 X-8.32 Y-11.63 Z15.1
+G1 X-8.32 Y-8.58 Z15.1
+G1 X-5.21 Y-6.78 Z15.1
+G1 X-5.21 Y-2.58 Z15.1
+G1 X-8.32 Y-0.78 Z15.1
+G1 X-8.32 Y3.42 Z15.1
+G1 X-5.21 Y5.22 Z15.1
+G1 X-5.21 Y9.42 Z15.1
+G1 X-8.32 Y11.22 Z15.1
+G1 X-8.32 Y11.63 Z15.1
+G1 X-1.74 Y11.63 Z15.1
+G1 X-1.74 Y11.22 Z15.1
+G1 X-4.86 Y9.42 Z15.1
+G1 X-4.86 Y5.22 Z15.1
+G1 X-1.74 Y3.42 Z15.1
+G1 X-1.74 Y-0.78 Z15.1
+G1 X-4.86 Y-2.58 Z15.1
+G1 X-4.86 Y-6.78 Z15.1
+G1 X-1.74 Y-8.58 Z15.1
+G1 X-1.74 Y-11.63 Z15.1
+G1 X-1.4 Y-11.63 Z15.1
+G1 X-1.4 Y-8.58 Z15.1
+G1 X1.72 Y-6.78 Z15.1
+G1 X1.72 Y-2.58 Z15.1
+G1 X-1.4 Y-0.78 Z15.1
+G1 X-1.4 Y3.42 Z15.1
+G1 X1.72 Y5.22 Z15.1
+G1 X1.72 Y9.42 Z15.1
+G1 X-1.4 Y11.22 Z15.1
+G1 X-1.4 Y11.63 Z15.1
+G1 X5.18 Y11.63 Z15.1
+G1 X5.18 Y11.22 Z15.1
+G1 X2.07 Y9.42 Z15.1
+G1 X2.07 Y5.22 Z15.1
+G1 X5.18 Y3.42 Z15.1
+G1 X5.18 Y-0.78 Z15.1
+G1 X2.07 Y-2.58 Z15.1
+G1 X2.07 Y-6.78 Z15.1
+G1 X5.18 Y-8.58 Z15.1
+G1 X5.18 Y-11.63 Z15.1
+G1 X5.53 Y-11.63 Z15.1
+G1 X5.53 Y-8.58 Z15.1
+G1 X8.65 Y-6.78 Z15.1
+G1 X8.65 Y-2.58 Z15.1
+G1 X5.53 Y-0.78 Z15.1
+G1 X5.53 Y3.42 Z15.1
+G1 X8.65 Y5.22 Z15.1
+G1 X8.65 Y9.42 Z15.1
+G1 X5.53 Y11.22 Z15.1
+G1 X5.53 Y11.63 Z15.1
+G1 X12.11 Y11.63 Z15.1
+G1 X12.11 Y11.22 Z15.1
+G1 X8.99 Y9.42 Z15.1
+G1 X8.99 Y5.22 Z15.1
+G1 X12.11 Y3.42 Z15.1
+G1 X12.11 Y-0.78 Z15.1
+G1 X8.99 Y-2.58 Z15.1
+G1 X8.99 Y-6.78 Z15.1
+G1 X12.11 Y-8.58 Z15.1
+G1 X12.11 Y-11.63 Z15.1
+G1 X12.46 Y-11.63 Z15.1
+G1 X12.46 Y-8.58 Z15.1
+G1 X15.58 Y-6.78 Z15.1
+G1 X15.58 Y-2.58 Z15.1
+G1 X12.46 Y-0.78 Z15.1
+G1 X12.46 Y3.42 Z15.1
+G1 X15.58 Y5.22 Z15.1
+G1 X15.58 Y9.42 Z15.1
+G1 X12.46 Y11.22 Z15.1
+G1 X12.46 Y11.63 Z15.1
+G1 X19.04 Y11.63 Z15.1
+G1 X19.04 Y11.22 Z15.1
+G1 X15.92 Y9.42 Z15.1
+G1 X15.92 Y5.22 Z15.1
+G1 X19.04 Y3.42 Z15.1
+G1 X19.04 Y-0.78 Z15.1
+G1 X15.92 Y-2.58 Z15.1
+G1 X15.92 Y-6.78 Z15.1
+G1 X19.04 Y-8.58 Z15.1
+G1 X19.04 Y-11.63 Z15.1
+G1 X19.39 Y-11.63 Z15.1
+G1 X19.39 Y-8.58 Z15.1
+G1 X22.5 Y-6.78 Z15.1
+G1 X22.5 Y-2.58 Z15.1
+G1 X19.39 Y-0.78 Z15.1
+G1 X19.39 Y3.42 Z15.1
+G1 X22.5 Y5.22 Z15.1
+G1 X22.5 Y9.42 Z15.1
+G1 X19.39 Y11.22 Z15.1
+G1 X19.39 Y11.63 Z15.1
+G1 X25.97 Y11.63 Z15.1
+G1 X25.97 Y11.22 Z15.1
+G1 X22.85 Y9.42 Z15.1
+G1 X22.85 Y5.22 Z15.1
+G1 X25.97 Y3.42 Z15.1
+G1 X25.97 Y-0.78 Z15.1
+G1 X22.85 Y-2.58 Z15.1
+G1 X22.85 Y-6.78 Z15.1
+G1 X25.97 Y-8.58 Z15.1
+G1 X25.97 Y-11.63 Z15.1
+G1 X26.32 Y-11.63 Z15.1
+G1 X26.32 Y-8.58 Z15.1
+G1 X29.43 Y-6.78 Z15.1
+G1 X29.43 Y-2.58 Z15.1
+G1 X26.32 Y-0.78 Z15.1
+G1 X26.32 Y3.42 Z15.1
+G1 X29.43 Y5.22 Z15.1
+G1 X29.43 Y9.42 Z15.1
+G1 X26.32 Y11.22 Z15.1
+G1 X26.32 Y11.63 Z15.1
+G1 X31.63 Y10.49 Z15.1
+G1 X29.78 Y9.42 Z15.1
+G1 X29.78 Y5.22 Z15.1
+G1 X31.63 Y4.15 Z15.1
+G1 X31.63 Y-1.51 Z15.1
+G1 X29.78 Y-2.58 Z15.1
+G1 X29.78 Y-6.78 Z15.1
+G1 X31.63 Y-7.85 Z15.1
+T1
+G1 X31.08 Y-11.08 Z16.1
+G1 X31.08 Y-3.28 Z16.1
+G1 X31.08 Y11.08 Z16.1
+G1 X15.48 Y11.08 Z16.1
+G1 X-31.08 Y11.08 Z16.1
+G1 X-31.08 Y3.28 Z16.1
+G1 X-31.08 Y-11.08 Z16.1
+G1 X-15.48 Y-11.08 Z16.1
+G1 X31.08 Y-11.08 Z16.1
+G1 X31.08 Y-11.08 Z16.1
+G1 X-29.7 Y11.08 Z16.1
+G1 X-31.08 Y10.28 Z16.1
+G1 X-31.08 Y4.35 Z16.1
+G1 X-29.46 Y3.42 Z16.1
+G1 X-29.46 Y-0.78 Z16.1
+G1 X-31.08 Y-1.72 Z16.1
+G1 X-31.08 Y-7.65 Z16.1
+G1 X-29.46 Y-8.58 Z16.1
+G1 X-29.46 Y-11.08 Z16.1
+G1 X-29.11 Y-11.08 Z16.1
+G1 X-29.11 Y-8.58 Z16.1
+G1 X-25.99 Y-6.78 Z16.1
+G1 X-25.99 Y-2.58 Z16.1
+G1 X-29.11 Y-0.78 Z16.1
+G1 X-29.11 Y3.42 Z16.1
+G1 X-25.99 Y5.22 Z16.1
+G1 X-25.99 Y9.42 Z16.1
+G1 X-28.86 Y11.08 Z16.1
+G1 X-22.78 Y11.08 Z16.1
+G1 X-25.65 Y9.42 Z16.1
+G1 X-25.65 Y5.22 Z16.1
+G1 X-22.53 Y3.42 Z16.1
+G1 X-22.53 Y-0.78 Z16.1
+G1 X-25.65 Y-2.58 Z16.1
+G1 X-25.65 Y-6.78 Z16.1
+G1 X-22.53 Y-8.58 Z16.1
+G1 X-22.53 Y-11.08 Z16.1
+G1 X-22.18 Y-11.08 Z16.1
+G1 X-22.18 Y-8.58 Z16.1
+G1 X-19.06 Y-6.78 Z16.1
+G1 X-19.06 Y-2.58 Z16.1
+G1 X-22.18 Y-0.78 Z16.1
+G1 X-22.18 Y3.42 Z16.1
+G1 X-19.06 Y5.22 Z16.1
+G1 X-19.06 Y9.42 Z16.1
+G1 X-21.93 Y11.08 Z16.1
+G1 X-15.85 Y11.08 Z16.1
+G1 X-18.72 Y9.42 Z16.1
+G1 X-18.72 Y5.22 Z16.1
+G1 X-15.6 Y3.42 Z16.1
+G1 X-15.6 Y-0.78 Z16.1
+G1 X-18.72 Y-2.58 Z16.1
+G1 X-18.72 Y-6.78 Z16.1
+G1 X-15.6 Y-8.58 Z16.1
+G1 X-15.6 Y-11.08 Z16.1
+G1 X-15.25 Y-11.08 Z16.1
+G1 X-15.25 Y-8.58 Z16.1
+G1 X-12.14 Y-6.78 Z16.1
+G1 X-12.14 Y-2.58 Z16.1
+G1 X-15.25 Y-0.78 Z16.1
+G1 X-15.25 Y3.42 Z16.1
+G1 X-12.14 Y5.22 Z16.1
+G1 X-12.14 Y9.42 Z16.1
+G1 X-15.01 Y11.08 Z16.1
+G1 X-8.92 Y11.08 Z16.1
+G1 X-11.79 Y9.42 Z16.1
+G1 X-11.79 Y5.22 Z16.1
+G1 X-8.67 Y3.42 Z16.1
+G1 X-8.67 Y-0.78 Z16.1
+G1 X-11.79 Y-2.58 Z16.1
+G1 X-11.79 Y-6.78 Z16.1
+G1 X-8.67 Y-8.58 Z16.1
+G1 X-8.67 Y-11.08 Z16.1
+G1 X-8.32 Y-11.08 Z16.1
+G1 X-8.32 Y-8.58 Z16.1
+G1 X-5.21 Y-6.78 Z16.1
+G1 X-5.21 Y-2.58 Z16.1
+G1 X-8.32 Y-0.78 Z16.1
+G1 X-8.32 Y3.42 Z16.1
+G1 X-5.21 Y5.22 Z16.1
+G1 X-5.21 Y9.42 Z16.1
+G1 X-8.08 Y11.08 Z16.1
+G1 X-1.99 Y11.08 Z16.1
+G1 X-4.86 Y9.42 Z16.1
+G1 X-4.86 Y5.22 Z16.1
+G1 X-1.74 Y3.42 Z16.1
+G1 X-1.74 Y-0.78 Z16.1
+G1 X-4.86 Y-2.58 Z16.1
+G1 X-4.86 Y-6.78 Z16.1
+G1 X-1.74 Y-8.58 Z16.1
+G1 X-1.74 Y-11.08 Z16.1
+G1 X-1.4 Y-11.08 Z16.1
+G1 X-1.4 Y-8.58 Z16.1
+G1 X1.72 Y-6.78 Z16.1
+G1 X1.72 Y-2.58 Z16.1
+G1 X-1.4 Y-0.78 Z16.1
+G1 X-1.4 Y3.42 Z16.1
+G1 X1.72 Y5.22 Z16.1
+G1 X1.72 Y9.42 Z16.1
+G1 X-1.15 Y11.08 Z16.1
+G1 X4.94 Y11.08 Z16.1
+G1 X2.07 Y9.42 Z16.1
+G1 X2.07 Y5.22 Z16.1
+G1 X5.18 Y3.42 Z16.1
+G1 X5.18 Y-0.78 Z16.1
+G1 X2.07 Y-2.58 Z16.1
+G1 X2.07 Y-6.78 Z16.1
+G1 X5.18 Y-8.58 Z16.1
+G1 X5.18 Y-11.08 Z16.1
+G1 X5.53 Y-11.08 Z16.1
+G1 X5.53 Y-8.58 Z16.1
+G1 X8.65 Y-6.78 Z16.1
+G1 X8.65 Y-2.58 Z16.1
+G1 X5.53 Y-0.78 Z16.1
+G1 X5.53 Y3.42 Z16.1
+G1 X8.65 Y5.22 Z16.1
+G1 X8.65 Y9.42 Z16.1
+G1 X5.78 Y11.08 Z16.1
+G1 X11.87 Y11.08 Z16.1
+G1 X8.99 Y9.42 Z16.1
+G1 X8.99 Y5.22 Z16.1
+G1 X12.11 Y3.42 Z16.1
+G1 X12.11 Y-0.78 Z16.1
+G1 X8.99 Y-2.58 Z16.1
+G1 X8.99 Y-6.78 Z16.1
+G1 X12.11 Y-8.58 Z16.1
+G1 X12.11 Y-11.08 Z16.1
+G1 X12.46 Y-11.08 Z16.1
+G1 X12.46 Y-8.58 Z16.1
+G1 X15.58 Y-6.78 Z16.1
+G1 X15.58 Y-2.58 Z16.1
+G1 X12.46 Y-0.78 Z16.1
+G1 X12.46 Y3.42 Z16.1
+G1 X15.58 Y5.22 Z16.1
+G1 X15.58 Y9.42 Z16.1
+G1 X12.71 Y11.08 Z16.1
+G1 X18.79 Y11.08 Z16.1
+G1 X15.92 Y9.42 Z16.1
+G1 X15.92 Y5.22 Z16.1
+G1 X19.04 Y3.42 Z16.1
+G1 X19.04 Y-0.78 Z16.1
+G1 X15.92 Y-2.58 Z16.1
+G1 X15.92 Y-6.78 Z16.1
+G1 X19.04 Y-8.58 Z16.1
+G1 X19.04 Y-11.08 Z16.1
+G1 X19.39 Y-11.08 Z16.1
+G1 X19.39 Y-8.58 Z16.1
+G1 X22.5 Y-6.78 Z16.1
+G1 X22.5 Y-2.58 Z16.1
+G1 X19.39 Y-0.78 Z16.1
+G1 X19.39 Y3.42 Z16.1
+G1 X22.5 Y5.22 Z16.1
+G1 X22.5 Y9.42 Z16.1
+G1 X19.64 Y11.08 Z16.1
+G1 X25.72 Y11.08 Z16.1
+G1 X22.85 Y9.42 Z16.1
+G1 X22.85 Y5.22 Z16.1
+G1 X25.97 Y3.42 Z16.1
+G1 X25.97 Y-0.78 Z16.1
+G1 X22.85 Y-2.58 Z16.1
+G1 X22.85 Y-6.78 Z16.1
+G1 X25.97 Y-8.58 Z16.1
+G1 X25.97 Y-11.08 Z16.1
+G1 X26.32 Y-11.08 Z16.1
+G1 X26.32 Y-8.58 Z16.1
+G1 X29.43 Y-6.78 Z16.1
+G1 X29.43 Y-2.58 Z16.1
+G1 X26.32 Y-0.78 Z16.1
+G1 X26.32 Y3.42 Z16.1
+G1 X29.43 Y5.22 Z16.1
+G1 X29.43 Y9.42 Z16.1
+G1 X26.56 Y11.08 Z16.1
+G1 X31.08 Y10.17 Z16.1
+G1 X29.78 Y9.42 Z16.1
+G1 X29.78 Y5.22 Z16.1
+G1 X31.08 Y4.47 Z16.1
+G1 X31.08 Y-1.83 Z16.1
+G1 X29.78 Y-2.58 Z16.1
+G1 X29.78 Y-6.78 Z16.1
+G1 X31.08 Y-7.53 Z16.1
+T1
+G1 X30.52 Y-10.52 Z17.1
+G1 X30.52 Y-4.72 Z17.1
+G1 X30.52 Y10.52 Z17.1
+G1 X18.92 Y10.52 Z17.1
+G1 X-30.52 Y10.52 Z17.1
+G1 X-30.52 Y4.72 Z17.1
+G1 X-30.52 Y-10.52 Z17.1
+G1 X-18.92 Y-10.52 Z17.1
+G1 X30.52 Y-10.52 Z17.1
+G1 X30.52 Y-10.52 Z17.1
+G1 X-30.52 Y4.03 Z17.1
+G1 X-29.46 Y3.42 Z17.1
+G1 X-29.46 Y-0.78 Z17.1
+G1 X-30.52 Y-1.4 Z17.1
+G1 X-30.52 Y-7.97 Z17.1
+G1 X-29.46 Y-8.58 Z17.1
+G1 X-29.46 Y-10.52 Z17.1
+G1 X-29.11 Y-10.52 Z17.1
+G1 X-29.11 Y-8.58 Z17.1
+G1 X-25.99 Y-6.78 Z17.1
+G1 X-25.99 Y-2.58 Z17.1
+G1 X-29.11 Y-0.78 Z17.1
+G1 X-29.11 Y3.42 Z17.1
+G1 X-25.99 Y5.22 Z17.1
+G1 X-25.99 Y9.42 Z17.1
+G1 X-27.9 Y10.52 Z17.1
+G1 X-23.74 Y10.52 Z17.1
+G1 X-25.65 Y9.42 Z17.1
+G1 X-25.65 Y5.22 Z17.1
+G1 X-22.53 Y3.42 Z17.1
+G1 X-22.53 Y-0.78 Z17.1
+G1 X-25.65 Y-2.58 Z17.1
+G1 X-25.65 Y-6.78 Z17.1
+G1 X-22.53 Y-8.58 Z17.1
+G1 X-22.53 Y-10.52 Z17.1
+G1 X-22.18 Y-10.52 Z17.1
+G1 X-22.18 Y-8.58 Z17.1
+G1 X-19.06 Y-6.78 Z17.1
+G1 X-19.06 Y-2.58 Z17.1
+G1 X-22.18 Y-0.78 Z17.1
+G1 X-22.18 Y3.42 Z17.1
+G1 X-19.06 Y5.22 Z17.1
+G1 X-19.06 Y9.42 Z17.1
+G1 X-20.97 Y10.52 Z17.1
+G1 X-16.81 Y10.52 Z17.1
+G1 X-18.72 Y9.42 Z17.1
+G1 X-18.72 Y5.22 Z17.1
+G1 X-15.6 Y3.42 Z17.1
+G1 X-15.6 Y-0.78 Z17.1
+G1 X-18.72 Y-2.58 Z17.1
+G1 X-18.72 Y-6.78 Z17.1
+G1 X-15.6 Y-8.58 Z17.1
+G1 X-15.6 Y-10.52 Z17.1
+G1 X-15.25 Y-10.52 Z17.1
+G1 X-15.25 Y-8.58 Z17.1
+G1 X-12.14 Y-6.78 Z17.1
+G1 X-12.14 Y-2.58 Z17.1
+G1 X-15.25 Y-0.78 Z17.1
+G1 X-15.25 Y3.42 Z17.1
+G1 X-12.14 Y5.22 Z17.1
+G1 X-12.14 Y9.42 Z17.1
+G1 X-14.04 Y10.52 Z17.1
+G1 X-9.88 Y10.52 Z17.1
+G1 X-11.79 Y9.42 Z17.1
+G1 X-11.79 Y5.22 Z17.1
+G1 X-8.67 Y3.42 Z17.1
+G1 X-8.67 Y-0.78 Z17.1
+G1 X-11.79 Y-2.58 Z17.1
+G1 X-11.79 Y-6.78 Z17.1
+G1 X-8.67 Y-8.58 Z17.1
+G1 X-8.67 Y-10.52 Z17.1
+G1 X-8.32 Y-10.52 Z17.1
+G1 X-8.32 Y-8.58 Z17.1
+G1 X-5.21 Y-6.78 Z17.1
+G1 X-5.21 Y-2.58 Z17.1
+G1 X-8.32 Y-0.78 Z17.1
+G1 X-8.32 Y3.42 Z17.1
+G1 X-5.21 Y5.22 Z17.1
+G1 X-5.21 Y9.42 Z17.1
+G1 X-7.12 Y10.52 Z17.1
+G1 X-2.95 Y10.52 Z17.1
+G1 X-4.86 Y9.42 Z17.1
+G1 X-4.86 Y5.22 Z17.1
+G1 X-1.74 Y3.42 Z17.1
+G1 X-1.74 Y-0.78 Z17.1
+G1 X-4.86 Y-2.58 Z17.1
+G1 X-4.86 Y-6.78 Z17.1
+G1 X-1.74 Y-8.58 Z17.1
+G1 X-1.74 Y-10.52 Z17.1
+G1 X-1.4 Y-10.52 Z17.1
+G1 X-1.4 Y-8.58 Z17.1
+G1 X1.72 Y-6.78 Z17.1
+G1 X1.72 Y-2.58 Z17.1
+G1 X-1.4 Y-0.78 Z17.1
+G1 X-1.4 Y3.42 Z17.1
+G1 X1.72 Y5.22 Z17.1
+G1 X1.72 Y9.42 Z17.1
+G1 X-0.19 Y10.52 Z17.1
+G1 X3.98 Y10.52 Z17.1
+G1 X2.07 Y9.42 Z17.1
+G1 X2.07 Y5.22 Z17.1
+G1 X5.18 Y3.42 Z17.1
+G1 X5.18 Y-0.78 Z17.1
+G1 X2.07 Y-2.58 Z17.1
+G1 X2.07 Y-6.78 Z17.1
+G1 X5.18 Y-8.58 Z17.1
+G1 X5.18 Y-10.52 Z17.1
+G1 X5.53 Y-10.52 Z17.1
+G1 X5.53 Y-8.58 Z17.1
+G1 X8.65 Y-6.78 Z17.1
+G1 X8.65 Y-2.58 Z17.1
+G1 X5.53 Y-0.78 Z17.1
+G1 X5.53 Y3.42 Z17.1
+G1 X8.65 Y5.22 Z17.1
+G1 X8.65 Y9.42 Z17.1
+G1 X6.74 Y10.52 Z17.1
+G1 X10.9 Y10.52 Z17.1
+G1 X8.99 Y9.42 Z17.1
+G1 X8.99 Y5.22 Z17.1
+G1 X12.11 Y3.42 Z17.1
+G1 X12.11 Y-0.78 Z17.1
+G1 X8.99 Y-2.58 Z17.1
+G1 X8.99 Y-6.78 Z17.1
+G1 X12.11 Y-8.58 Z17.1
+G1 X12.11 Y-10.52 Z17.1
+G1 X12.46 Y-10.52 Z17.1
+G1 X12.46 Y-8.58 Z17.1
+G1 X15.58 Y-6.78 Z17.1
+G1 X15.58 Y-2.58 Z17.1
+G1 X12.46 Y-0.78 Z17.1
+G1 X12.46 Y3.42 Z17.1
+G1 X15.58 Y5.22 Z17.1
+G1 X15.58 Y9.42 Z17.1
+G1 X13.67 Y10.52 Z17.1
+G1 X17.83 Y10.52 Z17.1
+G1 X15.92 Y9.42 Z17.1
+G1 X15.92 Y5.22 Z17.1
+G1 X19.04 Y3.42 Z17.1
+G1 X19.04 Y-0.78 Z17.1
+G1 X15.92 Y-2.58 Z17.1
+G1 X15.92 Y-6.78 Z17.1
+G1 X19.04 Y-8.58 Z17.1
+G1 X19.04 Y-10.52 Z17.1
+G1 X19.39 Y-10.52 Z17.1
+G1 X19.39 Y-8.58 Z17.1
+G1 X22.5 Y-6.78 Z17.1
+G1 X22.5 Y-2.58 Z17.1
+G1 X19.39 Y-0.78 Z17.1
+G1 X19.39 Y3.42 Z17.1
+G1 X22.5 Y5.22 Z17.1
+G1 X22.5 Y9.42 Z17.1
+G1 X20.6 Y10.52 Z17.1
+G1 X24.76 Y10.52 Z17.1
+G1 X22.85 Y9.42 Z17.1
+G1 X22.85 Y5.22 Z17.1
+G1 X25.97 Y3.42 Z17.1
+G1 X25.97 Y-0.78 Z17.1
+G1 X22.85 Y-2.58 Z17.1
+G1 X22.85 Y-6.78 Z17.1
+G1 X25.97 Y-8.58 Z17.1
+G1 X25.97 Y-10.52 Z17.1
+G1 X26.32 Y-10.52 Z17.1
+G1 X26.32 Y-8.58 Z17.1
+G1 X29.43 Y-6.78 Z17.1
+G1 X29.43 Y-2.58 Z17.1
+G1 X26.32 Y-0.78 Z17.1
+G1 X26.32 Y3.42 Z17.1
+G1 X29.43 Y5.22 Z17.1
+G1 X29.43 Y9.42 Z17.1
+G1 X27.52 Y10.52 Z17.1
+G1 X30.52 Y9.85 Z17.1
+G1 X29.78 Y9.42 Z17.1
+G1 X29.78 Y5.22 Z17.1
+G1 X30.52 Y4.79 Z17.1
+G1 X30.52 Y-2.15 Z17.1
+G1 X29.78 Y-2.58 Z17.1
+G1 X29.78 Y-6.78 Z17.1
+G1 X30.52 Y-7.21 Z17.1
+T1
+G1 X29.97 Y-9.97 Z18.1
+G1 X29.97 Y-6.17 Z18.1
+G1 X29.97 Y9.97 Z18.1
+G1 X22.37 Y9.97 Z18.1
+G1 X-29.97 Y9.97 Z18.1
+G1 X-29.97 Y6.17 Z18.1
+G1 X-29.97 Y-9.97 Z18.1
+G1 X-22.37 Y-9.97 Z18.1
+G1 X29.97 Y-9.97 Z18.1
+G1 X29.97 Y-9.97 Z18.1
+G1 X-29.97 Y3.71 Z18.1
+G1 X-29.46 Y3.42 Z18.1
+G1 X-29.46 Y-0.78 Z18.1
+G1 X-29.97 Y-1.08 Z18.1
+G1 X-29.97 Y-8.29 Z18.1
+G1 X-29.46 Y-8.58 Z18.1
+G1 X-29.46 Y-9.97 Z18.1
+G1 X-29.11 Y-9.97 Z18.1
+G1 X-29.11 Y-8.58 Z18.1
+G1 X-25.99 Y-6.78 Z18.1
+G1 X-25.99 Y-2.58 Z18.1
+G1 X-29.11 Y-0.78 Z18.1
+G1 X-29.11 Y3.42 Z18.1
+G1 X-25.99 Y5.22 Z18.1
+G1 X-25.99 Y9.42 Z18.1
+G1 X-26.94 Y9.97 Z18.1
+G1 X-24.7 Y9.97 Z18.1
+G1 X-25.65 Y9.42 Z18.1
+G1 X-25.65 Y5.22 Z18.1
+G1 X-22.53 Y3.42 Z18.1
+G1 X-22.53 Y-0.78 Z18.1
+G1 X-25.65 Y-2.58 Z18.1
+G1 X-25.65 Y-6.78 Z18.1
+G1 X-22.53 Y-8.58 Z18.1
+G1 X-22.53 Y-9.97 Z18.1
+G1 X-22.18 Y-9.97 Z18.1
+G1 X-22.18 Y-8.58 Z18.1
+G1 X-19.06 Y-6.78 Z18.1
+G1 X-19.06 Y-2.58 Z18.1
+G1 X-22.18 Y-0.78 Z18.1
+G1 X-22.18 Y3.42 Z18.1
+G1 X-19.06 Y5.22 Z18.1
+G1 X-19.06 Y9.42 Z18.1
+G1 X-20.01 Y9.97 Z18.1
+G1 X-17.77 Y9.97 Z18.1
+G1 X-18.72 Y9.42 Z18.1
+G1 X-18.72 Y5.22 Z18.1
+G1 X-15.6 Y3.42 Z18.1
+G1 X-15.6 Y-0.78 Z18.1
+G1 X-18.72 Y-2.58 Z18.1
+G1 X-18.72 Y-6.78 Z18.1
+G1 X-15.6 Y-8.58 Z18.1
+G1 X-15.6 Y-9.97 Z18.1
+G1 X-15.25 Y-9.97 Z18.1
+G1 X-15.25 Y-8.58 Z18.1
+G1 X-12.14 Y-6.78 Z18.1
+G1 X-12.14 Y-2.58 Z18.1
+G1 X-15.25 Y-0.78 Z18.1
+G1 X-15.25 Y3.42 Z18.1
+G1 X-12.14 Y5.22 Z18.1
+G1 X-12.14 Y9.42 Z18.1
+G1 X-13.09 Y9.97 Z18.1
+G1 X-10.84 Y9.97 Z18.1
+G1 X-11.79 Y9.42 Z18.1
+G1 X-11.79 Y5.22 Z18.1
+G1 X-8.67 Y3.42 Z18.1
+G1 X-8.67 Y-0.78 Z18.1
+G1 X-11.79 Y-2.58 Z18.1
+G1 X-11.79 Y-6.78 Z18.1
+G1 X-8.67 Y-8.58 Z18.1
+G1 X-8.67 Y-9.97 Z18.1
+G1 X-8.32 Y-9.97 Z18.1
+G1 X-8.32 Y-8.58 Z18.1
+G1 X-5.21 Y-6.78 Z18.1
+G1 X-5.21 Y-2.58 Z18.1
+G1 X-8.32 Y-0.78 Z18.1
+G1 X-8.32 Y3.42 Z18.1
+G1 X-5.21 Y5.22 Z18.1
+G1 X-5.21 Y9.42 Z18.1
+G1 X-6.16 Y9.97 Z18.1
+G1 X-3.91 Y9.97 Z18.1
+G1 X-4.86 Y9.42 Z18.1
+G1 X-4.86 Y5.22 Z18.1
+G1 X-1.74 Y3.42 Z18.1
+G1 X-1.74 Y-0.78 Z18.1
+G1 X-4.86 Y-2.58 Z18.1
+G1 X-4.86 Y-6.78 Z18.1
+G1 X-1.74 Y-8.58 Z18.1
+G1 X-1.74 Y-9.97 Z18.1
+G1 X-1.4 Y-9.97 Z18.1
+G1 X-1.4 Y-8.58 Z18.1
+G1 X1.72 Y-6.78 Z18.1
+G1 X1.72 Y-2.58 Z18.1
+G1 X-1.4 Y-0.78 Z18.1
+G1 X-1.4 Y3.42 Z18.1
+G1 X1.72 Y5.22 Z18.1
+G1 X1.72 Y9.42 Z18.1
+G1 X0.77 Y9.97 Z18.1
+G1 X3.02 Y9.97 Z18.1
+G1 X2.07 Y9.42 Z18.1
+G1 X2.07 Y5.22 Z18.1
+G1 X5.18 Y3.42 Z18.1
+G1 X5.18 Y-0.78 Z18.1
+G1 X2.07 Y-2.58 Z18.1
+G1 X2.07 Y-6.78 Z18.1
+G1 X5.18 Y-8.58 Z18.1
+G1 X5.18 Y-9.97 Z18.1
+G1 X5.53 Y-9.97 Z18.1
+G1 X5.53 Y-8.58 Z18.1
+G1 X8.65 Y-6.78 Z18.1
+G1 X8.65 Y-2.58 Z18.1
+G1 X5.53 Y-0.78 Z18.1
+G1 X5.53 Y3.42 Z18.1
+G1 X8.65 Y5.22 Z18.1
+G1 X8.65 Y9.42 Z18.1
+G1 X7.7 Y9.97 Z18.1
+G1 X9.94 Y9.97 Z18.1
+G1 X8.99 Y9.42 Z18.1
+G1 X8.99 Y5.22 Z18.1
+G1 X12.11 Y3.42 Z18.1
+G1 X12.11 Y-0.78 Z18.1
+G1 X8.99 Y-2.58 Z18.1
+G1 X8.99 Y-6.78 Z18.1
+G1 X12.11 Y-8.58 Z18.1
+G1 X12.11 Y-9.97 Z18.1
+G1 X12.46 Y-9.97 Z18.1
+G1 X12.46 Y-8.58 Z18.1
+G1 X15.58 Y-6.78 Z18.1
+G1 X15.58 Y-2.58 Z18.1
+G1 X12.46 Y-0.78 Z18.1
+G1 X12.46 Y3.42 Z18.1
+G1 X15.58 Y5.22 Z18.1
+G1 X15.58 Y9.42 Z18.1
+G1 X14.63 Y9.97 Z18.1
+G1 X16.87 Y9.97 Z18.1
+G1 X15.92 Y9.42 Z18.1
+G1 X15.92 Y5.22 Z18.1
+G1 X19.04 Y3.42 Z18.1
+G1 X19.04 Y-0.78 Z18.1
+G1 X15.92 Y-2.58 Z18.1
+G1 X15.92 Y-6.78 Z18.1
+G1 X19.04 Y-8.58 Z18.1
+G1 X19.04 Y-9.97 Z18.1
+G1 X19.39 Y-9.97 Z18.1
+G1 X19.39 Y-8.58 Z18.1
+G1 X22.5 Y-6.78 Z18.1
+G1 X22.5 Y-2.58 Z18.1
+G1 X19.39 Y-0.78 Z18.1
+G1 X19.39 Y3.42 Z18.1
+G1 X22.5 Y5.22 Z18.1
+G1 X22.5 Y9.42 Z18.1
+G1 X21.56 Y9.97 Z18.1
+G1 X23.8 Y9.97 Z18.1
+G1 X22.85 Y9.42 Z18.1
+G1 X22.85 Y5.22 Z18.1
+G1 X25.97 Y3.42 Z18.1
+G1 X25.97 Y-0.78 Z18.1
+G1 X22.85 Y-2.58 Z18.1
+G1 X22.85 Y-6.78 Z18.1
+G1 X25.97 Y-8.58 Z18.1
+G1 X25.97 Y-9.97 Z18.1
+G1 X26.32 Y-9.97 Z18.1
+G1 X26.32 Y-8.58 Z18.1
+G1 X29.43 Y-6.78 Z18.1
+G1 X29.43 Y-2.58 Z18.1
+G1 X26.32 Y-0.78 Z18.1
+G1 X26.32 Y3.42 Z18.1
+G1 X29.43 Y5.22 Z18.1
+G1 X29.43 Y9.42 Z18.1
+G1 X28.48 Y9.97 Z18.1
+G1 X29.97 Y9.53 Z18.1
+G1 X29.78 Y9.42 Z18.1
+G1 X29.78 Y5.22 Z18.1
+G1 X29.97 Y5.11 Z18.1
+G1 X29.97 Y-2.47 Z18.1
+G1 X29.78 Y-2.58 Z18.1
+G1 X29.78 Y-6.78 Z18.1
+G1 X29.97 Y-6.89 Z18.1
+T1
+G1 X29.41 Y-9.41 Z19.1
+G1 X29.41 Y-7.61 Z19.1
+G1 X29.41 Y9.41 Z19.1
+G1 X25.81 Y9.41 Z19.1
+G1 X-29.41 Y9.41 Z19.1
+G1 X-29.41 Y7.61 Z19.1
+G1 X-29.41 Y-9.41 Z19.1
+G1 X-25.81 Y-9.41 Z19.1
+G1 X29.41 Y-9.41 Z19.1
+G1 X29.41 Y-9.41 Z19.1
+G1 X-29.11 Y-9.41 Z19.1
+G1 X-29.11 Y-8.58 Z19.1
+G1 X-25.99 Y-6.78 Z19.1
+G1 X-25.99 Y-2.58 Z19.1
+G1 X-29.11 Y-0.78 Z19.1
+G1 X-29.11 Y3.42 Z19.1
+G1 X-25.99 Y5.22 Z19.1
+G1 X-25.99 Y9.41 Z19.1
+G1 X-25.65 Y9.41 Z19.1
+G1 X-25.65 Y5.22 Z19.1
+G1 X-22.53 Y3.42 Z19.1
+G1 X-22.53 Y-0.78 Z19.1
+G1 X-25.65 Y-2.58 Z19.1
+G1 X-25.65 Y-6.78 Z19.1
+G1 X-22.53 Y-8.58 Z19.1
+G1 X-22.53 Y-9.41 Z19.1
+G1 X-22.18 Y-9.41 Z19.1
+G1 X-22.18 Y-8.58 Z19.1
+G1 X-19.06 Y-6.78 Z19.1
+G1 X-19.06 Y-2.58 Z19.1
+G1 X-22.18 Y-0.78 Z19.1
+G1 X-22.18 Y3.42 Z19.1
+G1 X-19.06 Y5.22 Z19.1
+G1 X-19.06 Y9.41 Z19.1
+G1 X-18.72 Y9.41 Z19.1
+G1 X-18.72 Y5.22 Z19.1
+G1 X-15.6 Y3.42 Z19.1
+G1 X-15.6 Y-0.78 Z19.1
+G1 X-18.72 Y-2.58 Z19.1
+G1 X-18.72 Y-6.78 Z19.1
+G1 X-15.6 Y-8.58 Z19.1
+G1 X-15.6 Y-9.41 Z19.1
+G1 X-15.25 Y-9.41 Z19.1
+G1 X-15.25 Y-8.58 Z19.1
+G1 X-12.14 Y-6.78 Z19.1
+G1 X-12.14 Y-2.58 Z19.1
+G1 X-15.25 Y-0.78 Z19.1
+G1 X-15.25 Y3.42 Z19.1
+G1 X-12.14 Y5.22 Z19.1
+G1 X-12.14 Y9.41 Z19.1
+G1 X-11.79 Y9.41 Z19.1
+G1 X-11.79 Y5.22 Z19.1
+G1 X-8.67 Y3.42 Z19.1
+G1 X-8.67 Y-0.78 Z19.1
+G1 X-11.79 Y-2.58 Z19.1
+G1 X-11.79 Y-6.78 Z19.1
+G1 X-8.67 Y-8.58 Z19.1
+G1 X-8.67 Y-9.41 Z19.1
+G1 X-8.32 Y-9.41 Z19.1
+G1 X-8.32 Y-8.58 Z19.1
+G1 X-5.21 Y-6.78 Z19.1
+G1 X-5.21 Y-2.58 Z19.1
+G1 X-8.32 Y-0.78 Z19.1
+G1 X-8.32 Y3.42 Z19.1
+G1 X-5.21 Y5.22 Z19.1
+G1 X-5.21 Y9.41 Z19.1
+G1 X-4.86 Y9.41 Z19.1
+G1 X-4.86 Y5.22 Z19.1
+G1 X-1.74 Y3.42 Z19.1
+G1 X-1.74 Y-0.78 Z19.1
+G1 X-4.86 Y-2.58 Z19.1
+G1 X-4.86 Y-6.78 Z19.1
+G1 X-1.74 Y-8.58 Z19.1
+G1 X-1.74 Y-9.41 Z19.1
+G1 X-1.4 Y-9.41 Z19.1
+G1 X-1.4 Y-8.58 Z19.1
+G1 X1.72 Y-6.78 Z19.1
+G1 X1.72 Y-2.58 Z19.1
+G1 X-1.4 Y-0.78 Z19.1
+G1 X-1.4 Y3.42 Z19.1
+G1 X1.72 Y5.22 Z19.1
+G1 X1.72 Y9.41 Z19.1
+G1 X2.07 Y9.41 Z19.1
+G1 X2.07 Y5.22 Z19.1
+G1 X5.18 Y3.42 Z19.1
+G1 X5.18 Y-0.78 Z19.1
+G1 X2.07 Y-2.58 Z19.1
+G1 X2.07 Y-6.78 Z19.1
+G1 X5.18 Y-8.58 Z19.1
+G1 X5.18 Y-9.41 Z19.1
+G1 X5.53 Y-9.41 Z19.1
+G1 X5.53 Y-8.58 Z19.1
+G1 X8.65 Y-6.78 Z19.1
+G1 X8.65 Y-2.58 Z19.1
+G1 X5.53 Y-0.78 Z19.1
+G1 X5.53 Y3.42 Z19.1
+G1 X8.65 Y5.22 Z19.1
+G1 X8.65 Y9.41 Z19.1
+G1 X8.99 Y9.41 Z19.1
+G1 X8.99 Y5.22 Z19.1
+G1 X12.11 Y3.42 Z19.1
+G1 X12.11 Y-0.78 Z19.1
+G1 X8.99 Y-2.58 Z19.1
+G1 X8.99 Y-6.78 Z19.1
+G1 X12.11 Y-8.58 Z19.1
+G1 X12.11 Y-9.41 Z19.1
+G1 X12.46 Y-9.41 Z19.1
+G1 X12.46 Y-8.58 Z19.1
+G1 X15.58 Y-6.78 Z19.1
+G1 X15.58 Y-2.58 Z19.1
+G1 X12.46 Y-0.78 Z19.1
+G1 X12.46 Y3.42 Z19.1
+G1 X15.58 Y5.22 Z19.1
+G1 X15.58 Y9.41 Z19.1
+G1 X15.92 Y9.41 Z19.1
+G1 X15.92 Y5.22 Z19.1
+G1 X19.04 Y3.42 Z19.1
+G1 X19.04 Y-0.78 Z19.1
+G1 X15.92 Y-2.58 Z19.1
+G1 X15.92 Y-6.78 Z19.1
+G1 X19.04 Y-8.58 Z19.1
+G1 X19.04 Y-9.41 Z19.1
+G1 X19.39 Y-9.41 Z19.1
+G1 X19.39 Y-8.58 Z19.1
+G1 X22.5 Y-6.78 Z19.1
+G1 X22.5 Y-2.58 Z19.1
+G1 X19.39 Y-0.78 Z19.1
+G1 X19.39 Y3.42 Z19.1
+G1 X22.5 Y5.22 Z19.1
+G1 X22.5 Y9.41 Z19.1
+G1 X22.85 Y9.41 Z19.1
+G1 X22.85 Y5.22 Z19.1
+G1 X25.97 Y3.42 Z19.1
+G1 X25.97 Y-0.78 Z19.1
+G1 X22.85 Y-2.58 Z19.1
+G1 X22.85 Y-6.78 Z19.1
+G1 X25.97 Y-8.58 Z19.1
+G1 X25.97 Y-9.41 Z19.1
+G1 X26.32 Y-9.41 Z19.1
+G1 X26.32 Y-8.58 Z19.1
+G1 X29.41 Y-6.79 Z19.1
+G1 X29.41 Y-2.57 Z19.1
+G1 X26.32 Y-0.78 Z19.1
+G1 X26.32 Y3.42 Z19.1
+G1 X29.41 Y5.21 Z19.1
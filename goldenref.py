@@ -0,0 +1,100 @@
+import contextlib
+import importlib
+import inspect
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+
+# 基准版本：改为内存/流式处理之前的逐行实现，golden.py 的参考输出由它生成
+BASELINE_REVISION = "45d2b33d0e73d4d27fe8b150ff5583ece0c5a78b"
+
+
+def export_baseline(folder, revision=BASELINE_REVISION, repo_folder=None):
+    """用 git archive 把基准版本顶层的 .py 文件导出到 folder"""
+    repo_folder = repo_folder or os.path.dirname(os.path.abspath(__file__))
+    try:
+        data = subprocess.run(["git", "archive", "--format=tar", revision], cwd=repo_folder,
+                              capture_output=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise RuntimeError(f"无法导出基准版本 {revision}：{e}")
+    with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+        members = [member for member in tar.getmembers()
+                   if member.isfile() and "/" not in member.name and member.name.endswith(".py")]
+        tar.extractall(folder, members=members)
+
+
+def run_reference(baseline_folder, case_folder, input_name, steps, array_name, jbi_folder, user, tool):
+    """
+    在单独的进程中用基准版本的实现依次执行各步骤（基准版本的模块与当前模块同名，不能在同一进程中导入）。
+
+    steps 为 [(输出文件名, 模块名, 函数名, 参数列表)]，输出写到 case_folder 中。
+    全部步骤完成后再用基准版本的 trans_gcode_to_array、arraytojbi 写出点数组（文本）和 JBI 文件。
+    返回 {"stages", "stopped_at", "error", "jbi"}，含义与 golden.py 的 manifest 相同。
+    """
+    spec = {"case_folder": os.path.abspath(case_folder), "input_name": input_name, "steps": steps,
+            "array_name": array_name, "jbi_folder": jbi_folder, "user": user, "tool": tool}
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), os.path.abspath(baseline_folder)],
+                            input=json.dumps(spec), capture_output=True, text=True, encoding="utf-8",
+                            cwd=baseline_folder)
+    if result.returncode != 0:
+        raise RuntimeError(f"基准版本执行失败：\n{result.stderr}")
+    return json.loads(result.stdout)
+
+
+def baseline_args(func, args):
+    """
+    去掉基准版本函数不接受的参数（之后新增的参数，如 cutter 的 period）。
+    被去掉的参数必须为 None（保持原有行为），否则基准版本无法生成对应的参考输出。
+    """
+    count = len(inspect.signature(func).parameters) - 2  # 输入、输出路径
+    if any(arg is not None for arg in args[count:]):
+        raise ValueError(f"基准版本的 {func.__module__}.{func.__name__} 不支持参数 {args[count:]}")
+    return args[:count]
+
+
+def run_steps(case_folder, input_name, steps, array_name, jbi_folder, user, tool):
+    """run_reference 在子进程中执行的部分"""
+    result = {"stages": [], "stopped_at": None, "error": None, "jbi": []}
+    current = os.path.join(case_folder, input_name)
+    for output_name, module_name, func_name, args in steps:
+        func = getattr(importlib.import_module(module_name), func_name)
+        args = baseline_args(func, args)
+        output_path = os.path.join(case_folder, output_name)
+        try:
+            func(current, output_path, *args)
+        except (Exception, SystemExit) as e:
+            result["stopped_at"] = module_name
+            result["error"] = f"{type(e).__name__}: {e}"
+            return result
+        if not os.path.exists(output_path):
+            result["stopped_at"] = module_name
+            result["error"] = "没有写出输出文件"
+            return result
+        result["stages"].append({"name": module_name, "output": output_name})
+        current = output_path
+
+    trans_gcode_to_array = importlib.import_module("trans_gcode_to_array")
+    arraytojbi = importlib.import_module("arraytojbi")
+    array_path = os.path.join(case_folder, array_name)
+    output_folder = os.path.join(case_folder, jbi_folder)
+    trans_gcode_to_array.process_gcode_to_array(current, array_path)
+    arraytojbi.process_array_to_jbi(array_path, output_folder, user, tool)
+    result["jbi"] = sorted((name for name in os.listdir(output_folder) if name.endswith(".JBI")),
+                           key=lambda name: int(name[:-4]))
+    return result
+
+
+def main():
+    # 子进程：第一个参数为基准版本的源码文件夹，步骤说明从标准输入读取，结果以 JSON 写到标准输出
+    sys.path[0] = sys.argv[1]
+    spec = json.load(sys.stdin)
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = run_steps(**spec)
+    json.dump(result, sys.stdout, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 import argparse
 
+from gcodeparse import BLANK_LINE, GCodeLine, iter_blocks, parse_lines, split_blocks, to_lines
+from pipelinelog import log
+
 
 def process_file(input_file, output_file, x_offset, y_offset, j_offset):
     """
@@ -15,121 +18,124 @@ def process_file(input_file, output_file, x_offset, y_offset, j_offset):
     try:
         # 读取输入文件内容
         with open(input_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # 分割文本块，使用空行分割
-        blocks = content.split('\n\n')
-        processed_blocks = []
-
-        # 记录 T1 块的索引
-        t1_block_indices = []
-
-        # 遍历每个块，识别 T1 块
-        for block_index, block in enumerate(blocks):
-            if not block.strip():
-                continue  # 跳过空白块
-
-            lines = block.split('\n')
-            if not lines:
-                continue
-
-            # 检查第一行是否以 T1 开头
-            if lines[0].strip().startswith('T1'):
-                t1_block_indices.append(block_index)
-
-        # 处理每个 T1 块
-        for t1_block_index in t1_block_indices:
-            # 获取当前 T1 块
-            t1_block = blocks[t1_block_index]
-            t1_lines = t1_block.split('\n')
-
-            # 获取下一个块，如果存在
-            if t1_block_index + 1 < len(blocks):
-                next_block = blocks[t1_block_index + 1]
-                next_block_lines = next_block.split('\n')
-
-                # 寻找下一个块中的第一条 G1 行
-                g1_line = None
-                for line in next_block_lines:
-                    if line.strip().startswith('G1'):
-                        g1_line = line.strip()
-                        break
-
-                if g1_line:
-                    # 提取 XY 坐标值
-                    x_value = extract_parameter(g1_line, 'X')
-                    y_value = extract_parameter(g1_line, 'Y')
-
-                    # 将提取的 X 和 Y 值加上偏移
-                    x_value_with_offset = x_value + x_offset if x_value is not None else None
-                    y_value_with_offset = y_value + y_offset if y_value is not None else None
-
-                    if x_value_with_offset is None or y_value_with_offset is None:
-                        continue
-
-                    # 获取当前块的最后一条 G1 行
-                    last_g1_line = None
-                    for line in reversed(t1_lines):
-                        if line.strip().startswith('G1'):
-                            last_g1_line = line.strip()
-                            break
-
-                    if last_g1_line:
-                        # 提取 Z、J/E、F 值
-                        z_value = extract_parameter(last_g1_line, 'Z')
-                        j_value = extract_parameter(last_g1_line, 'J')
-                        e_value = extract_parameter(last_g1_line, 'E')
-                        f_value = extract_parameter(last_g1_line, 'F')
-
-                        # 确定 J/E 的值
-                        selected_j = j_value if j_value is not None else e_value
-
-                        # 确定 J 值加上偏移
-                        if selected_j is not None:
-                            selected_j_with_offset = selected_j + j_offset
-
-                        # 构建新的 G1 行
-                        new_g1_parts = ["G1"]  # 添加 G1 指令开头
-                        if x_value_with_offset is not None:
-                            new_g1_parts.append(f"X{x_value_with_offset:.2f}")
-                        if y_value_with_offset is not None:
-                            new_g1_parts.append(f"Y{y_value_with_offset:.2f}")
-                        if z_value is not None:
-                            new_g1_parts.append(f"Z{z_value}")
-                        if selected_j is not None:
-                            new_g1_parts.append(f"J{selected_j_with_offset:.2f}")
-                        if f_value is not None:
-                            new_g1_parts.append(f"F{f_value}")
-
-                        new_g1_line = ' '.join(new_g1_parts)
-
-                        # 将新的 G1 行添加到当前 T1 块的最后
-                        new_t1_block = '\n'.join(t1_lines + [new_g1_line])
-
-                        # 更新块
-                        blocks[t1_block_index] = new_t1_block
+            lines = f.readlines()
+
+        result = process_commands(parse_lines(lines), x_offset, y_offset, j_offset)
 
         # 保存处理后的块到输出文件
-        result = '\n\n'.join(blocks)
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(result)
+            f.writelines(to_lines(result))
 
-        print("文件处理完成！")
-        print("输出已保存到：", output_file)
+        log("文件处理完成！")
+        log("输出已保存到：", output_file)
     except Exception as e:
-        print(f"处理失败：{str(e)}")
-
-
-def extract_parameter(line, param):
-    """从 G1 行中提取指定参数的值"""
-    parts = line.split()
-    for part in parts:
-        if part.startswith(param):
-            try:
-                return float(part[1:])
-            except ValueError:
-                return part[1:]  # 返回原始值，如果无法转换为浮点数
-    return None
+        log(f"处理失败：{str(e)}")
+
+
+def process_commands(commands, x_offset, y_offset, j_offset):
+    """
+    在每个 T1 块末尾追加一条指向下一个块第一条 G1 的 G1 命令，返回新的指令列表。
+
+    参数:
+        commands (list): GCodeLine 列表
+        x_offset (float): X 偏移量
+        y_offset (float): Y 偏移量
+        j_offset (float): J 偏移量
+    """
+    # 分割文本块，使用空行分割
+    blocks = split_blocks(commands)
+
+    # 处理每个 T1 块（最后一个块没有下一个块，不做处理）
+    for block_index in range(len(blocks) - 1):
+        blocks[block_index] = connect_block(blocks[block_index], blocks[block_index + 1],
+                                            x_offset, y_offset, j_offset)
+
+    # 各块之间以空行分隔
+    result = []
+    for block_index, block in enumerate(blocks):
+        if block_index:
+            result.append(BLANK_LINE)
+        result.extend(block)
+    return result
+
+
+def stream_commands(commands, x_offset, y_offset, j_offset):
+    """process_commands 的流式版本：逐块输出，内存中只保留当前块和下一块"""
+    previous = None
+    for block in iter_blocks(commands):
+        if previous is not None:
+            yield from connect_block(previous, block, x_offset, y_offset, j_offset)
+            yield BLANK_LINE
+        previous = block
+    yield from previous
+
+
+def connect_block(t1_lines, next_block_lines, x_offset, y_offset, j_offset):
+    """
+    若 t1_lines 为 T1 块（第一行以 T1 开头），在其末尾追加一条指向下一个块第一条 G1 的 G1 命令，
+    返回新的文本块；其他块原样返回。
+    """
+    # 检查第一行是否以 T1 开头
+    if not t1_lines or t1_lines[0].code != 'T1':
+        return t1_lines
+
+    # 寻找下一个块中的第一条 G1 行和当前块的最后一条 G1 行
+    g1_line = next((line for line in next_block_lines if line.code == 'G1'), None)
+    last_g1_line = next((line for line in reversed(t1_lines) if line.code == 'G1'), None)
+
+    new_g1_line = connection_line(last_g1_line, g1_line, x_offset, y_offset, j_offset)
+    if new_g1_line is None:
+        return t1_lines
+
+    # 将新的 G1 行添加到当前 T1 块的最后
+    return t1_lines + [new_g1_line]
+
+
+def connection_line(last_g1_line, g1_line, x_offset, y_offset, j_offset):
+    """
+    根据当前块的最后一条 G1 行和下一个块的第一条 G1 行生成连接用的 G1 命令，
+    任一行不存在或下一个块的 G1 缺少 X、Y 时返回 None。
+    """
+    if not g1_line:
+        return None
+
+    # 将提取的 X 和 Y 值加上偏移
+    x_value_with_offset = g1_line.x + x_offset if g1_line.x is not None else None
+    y_value_with_offset = g1_line.y + y_offset if g1_line.y is not None else None
+
+    if x_value_with_offset is None or y_value_with_offset is None:
+        return None
+
+    if not last_g1_line:
+        return None
+
+    # 提取 Z、J/E、F 值
+    z_value = last_g1_line.z
+    f_value = last_g1_line.f
+
+    # 确定 J/E 的值
+    selected_j = last_g1_line.j if last_g1_line.j is not None else last_g1_line.e
+
+    # 确定 J 值加上偏移
+    selected_j_with_offset = None
+    if selected_j is not None:
+        selected_j_with_offset = selected_j + j_offset
+
+    # 构建新的 G1 行
+    new_g1_parts = ["G1"]  # 添加 G1 指令开头
+    new_g1_parts.append(f"X{x_value_with_offset:.2f}")
+    new_g1_parts.append(f"Y{y_value_with_offset:.2f}")
+    if z_value is not None:
+        new_g1_parts.append(f"Z{z_value}")
+    if selected_j is not None:
+        new_g1_parts.append(f"J{selected_j_with_offset:.2f}")
+        selected_j_with_offset = round(selected_j_with_offset, 2)
+    if f_value is not None:
+        new_g1_parts.append(f"F{f_value}")
+
+    return GCodeLine(' '.join(new_g1_parts) + '\n', "G1",
+                     round(x_value_with_offset, 2), round(y_value_with_offset, 2),
+                     z_value, j=selected_j_with_offset, f=f_value)
 
 
 def main():
@@ -0,0 +1,135 @@
+import numpy as np
+
+# 指令类型（cmd 列）
+CMD_OTHER = 0
+CMD_G0 = 1
+CMD_G1 = 2
+CMD_T0 = 3
+CMD_T1 = 4
+CMD_TYPE = 5
+CMD_BLANK = 6
+CMD_G92 = 7
+
+CMD_CODES = {"G0": CMD_G0, "G1": CMD_G1, "T0": CMD_T0, "T1": CMD_T1, "G92": CMD_G92}
+
+# 事件标记（flags 列，按位组合）
+FLAG_CUT = 1  # ; fiber_basic cut 注释
+FLAG_SERVO_UP = 2  # M280 P0 S95
+FLAG_SERVO_DOWN = 4  # M280 P0 S2
+
+
+class MotionTable:
+    """
+    G-code 指令的列式数值表，每行指令对应各数组中的一个元素。
+
+    - x/y/z/e/j/f: float64 数组，指令中没有该参数时为 NaN
+    - cmd: int8 数组，指令类型（CMD_*）
+    - tool: int8 数组，该行所在位置的当前打印头（0 表示 T0，1 表示 T1，-1 表示尚未出现打印头指令）
+    - flags: int8 数组，剪切、舵机抬起/落下事件（FLAG_*）
+    - block: int32 数组，该行所在文本块的编号（空行属于其后的文本块）
+    - block_starts: 每个文本块第一行的行号
+    """
+
+    def __init__(self, x, y, z, e, j, f, cmd, tool, flags, block, block_starts):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.e = e
+        self.j = j
+        self.f = f
+        self.cmd = cmd
+        self.tool = tool
+        self.flags = flags
+        self.block = block
+        self.block_starts = block_starts
+
+    def __len__(self):
+        return len(self.cmd)
+
+    @classmethod
+    def from_commands(cls, commands):
+        """由 GCodeLine 列表生成数值表（只读取已解析的字段，不再解析文本）"""
+        n = len(commands)
+        # None 转换为 float64 时为 NaN
+        columns = [np.array([getattr(cmd, name) for cmd in commands], dtype=np.float64).reshape(n)
+                   for name in ("x", "y", "z", "e", "j", "f")]
+
+        codes = [line.code for line in commands]
+        cmd = np.array([CMD_CODES.get(code, CMD_OTHER) for code in codes], dtype=np.int8).reshape(n)
+        flags = np.zeros(n, dtype=np.int8)
+        for i in np.flatnonzero(cmd == CMD_OTHER).tolist():
+            code = codes[i]
+            if code is None:
+                comment = commands[i].comment
+                if comment is None:
+                    cmd[i] = CMD_BLANK
+                elif comment.startswith("TYPE:"):
+                    cmd[i] = CMD_TYPE
+                elif "cut" in comment:
+                    flags[i] = FLAG_CUT
+            elif code == "M280":
+                raw = commands[i].raw
+                if "M280 P0 S95" in raw:
+                    flags[i] |= FLAG_SERVO_UP
+                if "M280 P0 S2" in raw:
+                    flags[i] |= FLAG_SERVO_DOWN
+
+        # 当前打印头：T0/T1 指令处取值，其余行沿用上一个打印头
+        tool_at = np.full(n, -1, dtype=np.int8)
+        tool_at[cmd == CMD_T0] = 0
+        tool_at[cmd == CMD_T1] = 1
+        last = np.maximum.accumulate(np.where(tool_at >= 0, np.arange(n), -1))
+        tool = np.where(last >= 0, tool_at[last], -1).astype(np.int8)
+
+        # 文本块编号：每遇到一个空行编号加一
+        block = np.cumsum(cmd == CMD_BLANK, dtype=np.int32)
+        block_starts = np.flatnonzero(np.diff(block, prepend=-1))
+
+        return cls(*columns, cmd, tool, flags, block, block_starts)
+
+    @property
+    def block_count(self):
+        """文本块数量（包括空块）"""
+        return int(self.block[-1]) + 1 if len(self.block) else 0
+
+    @property
+    def is_motion(self):
+        """G0/G1 指令的布尔掩码"""
+        return (self.cmd == CMD_G0) | (self.cmd == CMD_G1)
+
+    def block_any(self, mask):
+        """返回每行所在文本块中是否存在 mask 为真的行"""
+        counts = np.bincount(self.block[mask], minlength=self.block_count)
+        return (counts > 0)[self.block]
+
+    def block_first(self, values):
+        """返回每行所在文本块中 values 的第一个有效值（块内没有有效值时为 NaN）"""
+        valid = np.flatnonzero(~np.isnan(values))
+        first = np.full(self.block_count, np.nan)
+        if valid.size:
+            blocks, index = np.unique(self.block[valid], return_index=True)
+            first[blocks] = values[valid[index]]
+        return first[self.block]
+
+
+def segmented_cumsum(values, segments):
+    """
+    分段累加：segments 相同且相邻的元素为一段，每段从 0 开始依次累加。
+
+    每段单独调用 np.cumsum（逐个相加），结果与 Python 中逐行 acc += v 的结果逐位一致。
+    """
+    result = np.zeros(len(values))
+    if not len(values):
+        return result
+    bounds = np.concatenate(([0], np.flatnonzero(np.diff(segments)) + 1, [len(values)]))
+    # 只处理含有非零值的段
+    nonzero = np.add.reduceat(values != 0, bounds[:-1]) > 0
+    for start, end in zip(bounds[:-1][nonzero].tolist(), bounds[1:][nonzero].tolist()):
+        result[start:end] = np.cumsum(values[start:end])
+    return result
+
+
+def forward_fill(values, initial=0.0):
+    """前向填充：NaN 处沿用前面最近的有效值，前面没有有效值时为 initial"""
+    last = np.maximum.accumulate(np.where(np.isnan(values), -1, np.arange(len(values))))
+    return np.where(last >= 0, values[np.maximum(last, 0)], initial)
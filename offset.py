@@ -1,6 +1,18 @@
-import re
 import sys
 import os
+import re
+
+import numpy as np
+
+from gcodeparse import GCodeLine, parse_line
+from motiontable import MotionTable
+from pipelinelog import log
+
+# 常见格式的运动指令 "G1 X.. Y.. Z..[ E..][ J..][ F..]"（参数顺序与重新生成的行一致），
+# 可以直接替换坐标文本；其他格式的行按完整解析处理
+_NUMBER = r"[-+]?(?:\d+\.?\d*|\.\d+)"
+MOTION_LINE = re.compile(
+    rf"(G[01]) X({_NUMBER}) Y({_NUMBER}) Z({_NUMBER})((?: E{_NUMBER})?(?: J{_NUMBER})?(?: F{_NUMBER})?)\n?\Z")
 
 
 def process_gcode_with_offset(input_file, output_file, target_x, target_y, target_z):
@@ -13,85 +25,157 @@ def process_gcode_with_offset(input_file, output_file, target_x, target_y, targe
     - target_x: 目标 X 坐标
     - target_y: 目标 Y 坐标
     - target_z: 目标 Z 坐标
+
+    文件只读一遍：先读到第一个有效的 XYZ 坐标点（只缓存这之前的行）求出偏移量，
+    再边读边写其余各行，不保留整个文件。
     """
-    # 定义正则表达式，匹配 G0/G1 行中的 XYZ、E、J、F 参数
-    gcode_pattern = r"^(G0|G1)(.*)$"  # 捕获 G0/G1 和剩余部分
-    param_pattern = r"([XYZEFJ])([-]?\d+\.?\d*)"  # 匹配所有参数
+    with open(input_file, 'r') as f:
+        # 第一阶段：找到第一个有效的 XYZ 坐标
+        buffered = []
+        anchor = None
+        for line in f:
+            cmd = parse_line(line)
+            buffered.append(cmd)
+            if cmd.is_motion and cmd.has_xyz:
+                anchor = cmd
+                break
 
-    # 存储第一个有效的 XYZ 坐标
-    first_x = first_y = first_z = None
+        if anchor is None:
+            log("错误：文件中未找到有效的 XYZ 坐标点！")
+            sys.exit(1)
 
-    # 读取输入文件
-    with open(input_file, 'r') as f:
-        lines = f.readlines()
+        # 计算差值
+        offset_x = target_x - anchor.x
+        offset_y = target_y - anchor.y
+        offset_z = target_z - anchor.z
+        log(f"计算得到的偏移量：X={offset_x}, Y={offset_y}, Z={offset_z}")
 
-    # 找到第一个有效的 XYZ 坐标
-    for line in lines:
-        match = re.match(gcode_pattern, line.strip())
-        if match:
-            g_command, params = match.groups()
-            param_matches = re.findall(param_pattern, params)
-            x = y = z = None
-            for param_type, param_value in param_matches:
-                if param_type == 'X':
-                    x = float(param_value)
-                elif param_type == 'Y':
-                    y = float(param_value)
-                elif param_type == 'Z':
-                    z = float(param_value)
-            if x is not None and y is not None and z is not None:
-                first_x = x
-                first_y = y
-                first_z = z
-                break
+        # 第二阶段：逐行偏移并写入输出文件
+        with open(output_file, 'w') as out:
+            for cmd in buffered:
+                out.write(offset_line(cmd, offset_x, offset_y, offset_z).raw)
+            for line in f:
+                out.write(offset_text(line, offset_x, offset_y, offset_z))
 
-    if first_x is None or first_y is None or first_z is None:
-        print("错误：文件中未找到有效的 XYZ 坐标点！")
-        sys.exit(1)
+    log(f"处理完成！输出文件已保存至：{output_file}")
+
+
+def process_commands(commands, target_x, target_y, target_z, table=None):
+    """
+    process_gcode_with_offset 的内存版本：输入指令列表，返回整体偏移后的指令列表。
+
+    参数：
+    - commands: GCodeLine 列表
+    - target_x: 目标 X 坐标
+    - target_y: 目标 Y 坐标
+    - target_z: 目标 Z 坐标
+    - table: commands 对应的数值表，为空时自动生成；所有坐标的偏移一次性按向量计算
+    """
+    if table is None:
+        table = MotionTable.from_commands(commands)
+    motion = table.is_motion
+
+    # 找到第一个有效的 XYZ 坐标
+    valid = np.flatnonzero(motion & ~(np.isnan(table.x) | np.isnan(table.y) | np.isnan(table.z)))
+    if not valid.size:
+        raise ValueError("文件中未找到有效的 XYZ 坐标点！")
+    first = valid[0]
 
     # 计算差值
-    offset_x = target_x - first_x
-    offset_y = target_y - first_y
-    offset_z = target_z - first_z
-
-    print(f"计算得到的偏移量：X={offset_x}, Y={offset_y}, Z={offset_z}")
-
-    # 处理文件并写入输出文件
-    with open(output_file, 'w') as f:
-        for line in lines:
-            match = re.match(gcode_pattern, line.strip())
-            if match:
-                g_command, params = match.groups()
-                param_matches = re.findall(param_pattern, params)
-
-                # 初始化新参数字典
-                new_params = {}
-                for param_type, param_value in param_matches:
-                    if param_type == 'X':
-                        new_params['X'] = float(param_value) + offset_x
-                    elif param_type == 'Y':
-                        new_params['Y'] = float(param_value) + offset_y
-                    elif param_type == 'Z':
-                        new_params['Z'] = float(param_value) + offset_z
-                    else:
-                        # 保留 E、J、F 参数不变
-                        new_params[param_type] = param_value
-
-                # 构建新的 G-code 行
-                new_line = g_command
-                for param_type in ['X', 'Y', 'Z', 'E', 'J', 'F']:
-                    if param_type in new_params:
-                        if param_type in ['X', 'Y', 'Z']:
-                            new_line += f" {param_type}{new_params[param_type]:.5f}"
-                        else:
-                            new_line += f" {param_type}{new_params[param_type]}"
-                new_line += "\n"
-                f.write(new_line)
-            else:
-                # 非 G0/G1 行保持不变
-                f.write(line)
-
-    print(f"处理完成！输出文件已保存至：{output_file}")
+    offset_x = target_x - float(table.x[first])
+    offset_y = target_y - float(table.y[first])
+    offset_z = target_z - float(table.z[first])
+
+    log(f"计算得到的偏移量：X={offset_x}, Y={offset_y}, Z={offset_z}")
+
+    # 整体偏移（没有该坐标的行保持 NaN）
+    new_x = (table.x + offset_x).tolist()
+    new_y = (table.y + offset_y).tolist()
+    new_z = (table.z + offset_z).tolist()
+
+    # 处理每一行，非 G0/G1 行保持不变
+    new_lines = list(commands)
+    for i in np.flatnonzero(motion).tolist():
+        new_lines[i] = shift_line(commands[i], new_x[i], new_y[i], new_z[i])
+
+    return new_lines
+
+
+def stream_commands(commands, target_x, target_y, target_z):
+    """
+    process_commands 的流式版本：缓存到第一个有效的 XYZ 坐标点为止，
+    求出偏移量后输出缓存的行，其余各行逐行偏移后直接输出。
+    """
+    buffered = []
+    offsets = None
+    for cmd in commands:
+        if offsets is None:
+            buffered.append(cmd)
+            if cmd.is_motion and cmd.has_xyz:
+                # 计算差值
+                offsets = (target_x - cmd.x, target_y - cmd.y, target_z - cmd.z)
+                log(f"计算得到的偏移量：X={offsets[0]}, Y={offsets[1]}, Z={offsets[2]}")
+                for line in buffered:
+                    yield offset_line(line, *offsets)
+                buffered = None
+            continue
+        yield offset_line(cmd, *offsets)
+
+    if offsets is None:
+        raise ValueError("文件中未找到有效的 XYZ 坐标点！")
+
+
+def offset_text(line, offset_x, offset_y, offset_z):
+    """
+    offset_line 的文本版本：输入一行文本，返回偏移后的行文本。
+
+    常见格式的 G0/G1 行用预编译的正则直接替换坐标（E、J、F 文本原样保留），
+    不生成 GCodeLine；其他行按完整解析处理，结果与 offset_line 一致。
+    """
+    match = MOTION_LINE.match(line)
+    if match is None:
+        return offset_line(parse_line(line), offset_x, offset_y, offset_z).raw
+    code, x, y, z, rest = match.groups()
+    return (f"{code} X{float(x) + offset_x:.5f} Y{float(y) + offset_y:.5f} Z{float(z) + offset_z:.5f}"
+            f"{rest}\n")
+
+
+def offset_line(cmd, offset_x, offset_y, offset_z):
+    """对单行 G0/G1 指令加上偏移量，其他行保持不变"""
+    if not cmd.is_motion:
+        return cmd
+    return shift_line(cmd,
+                      cmd.x + offset_x if cmd.x is not None else None,
+                      cmd.y + offset_y if cmd.y is not None else None,
+                      cmd.z + offset_z if cmd.z is not None else None)
+
+
+def shift_line(cmd, new_x, new_y, new_z):
+    """按偏移后的坐标重新生成 G0/G1 行，参数按 X、Y、Z、E、J、F 顺序输出，E、J、F 保留原始文本"""
+    # 保留 E、J、F 参数的原始文本
+    kept = {}
+    for word in cmd.raw.partition(';')[0].split()[1:]:
+        letter = word[0]
+        if letter in 'EJF' and getattr(cmd, letter.lower()) is not None:
+            kept[letter] = word[1:]
+
+    # 构建新的 G-code 行
+    new_line = cmd.code
+    x = y = z = None
+    if cmd.x is not None:
+        new_line += f" X{new_x:.5f}"
+        x = round(new_x, 5)
+    if cmd.y is not None:
+        new_line += f" Y{new_y:.5f}"
+        y = round(new_y, 5)
+    if cmd.z is not None:
+        new_line += f" Z{new_z:.5f}"
+        z = round(new_z, 5)
+    for param_type in ['E', 'J', 'F']:
+        if param_type in kept:
+            new_line += f" {param_type}{kept[param_type]}"
+    new_line += "\n"
+    return GCodeLine(new_line, cmd.code, x, y, z, cmd.e, cmd.j, cmd.f)
 
 
 if __name__ == "__main__":
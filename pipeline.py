@@ -0,0 +1,399 @@
+import os
+import shutil
+
+import numpy as np
+
+import reorganization
+import TransferG0
+import G0Trimmer
+import GCodeAnnotator
+import GCodeProcessor
+import GCodeMotionExtractor
+import gcodefile
+import GCodeZFilter
+import Zreorganize
+import gcodeoffset
+import deleteG0
+import addextrusion
+import beforecheck
+import cutter
+import change_f
+import upupup
+import joffset
+import endZup
+import add_commands
+import offset
+import trans_gcode_to_array
+import arraytojbi
+import tooltagging
+import coordnormalize
+import postcut
+import pipelinelog
+from gcodeio import read_lines, write_lines
+from gcodeparse import iter_commands, parse_lines, to_lines
+from pipelinestats import PipelineProfiler
+from stagecache import input_key, stage_key
+
+# 后处理流程需要的参数（对应配置文件中的 gcode_processor 部分）
+REQUIRED_PARAMS = [
+    "type_map", "offset_x", "offset_y", "offset_z", "w", "h", "k2", "f1", "f2",
+    "distance", "insert_f", "connection_f", "j_distance", "global_offset_x",
+    "global_offset_y", "global_offset_z", "user", "tool"
+]
+
+# 与界面默认值一致的参数（性能测试和回归测试使用）
+DEFAULT_PARAMS = {
+    "type_map": {"FILL": "T0", "WALL-INNER": "T1", "WALL-OUTER": "T1", "SUPPORT": "T1",
+                 "SUPPORT-INTERFACE": "T1", "SKIN": "T0", "SKIRT": "T0"},
+    "offset_x": 3.04, "offset_y": -56.471, "offset_z": -3.11,
+    "w": 1.2, "h": 0.2, "k2": 0.98, "f1": 1000.0, "f2": 500.0,
+    "distance": 5.0, "insert_f": 300.0, "connection_f": 800.0, "j_distance": 10.0,
+    "global_offset_x": 100.0, "global_offset_y": 200.0, "global_offset_z": 0.0,
+    "user": 2, "tool": 0,
+}
+
+# 最终偏移后的 G-code（第 20 步输出），界面预览使用该文件
+PREVIEW_NAME = "intermediate_20.gcode"
+# 第 18 步的点数组：逐文件流程中以 .npy 格式交给第 19 步；文本表只在需要时导出（调试用）
+ARRAY_NAME = "intermediate_18.npy"
+ARRAY_TEXT_NAME = "intermediate_18.gcode"
+
+
+class PipelineCancelled(Exception):
+    """流程在两个步骤之间被取消"""
+
+
+def check_params(params):
+    """检查参数是否齐全，缺少时抛出 ValueError"""
+    missing_params = [param for param in REQUIRED_PARAMS if param not in params]
+    if missing_params:
+        raise ValueError(f"配置文件缺少必需参数: {', '.join(missing_params)}")
+
+
+def build_steps(params, before_check=True, fused=False):
+    """
+    按原有处理顺序返回 G-code 步骤列表（不含最后的数组导出和 JBI 生成）。
+
+    fused 为 True 时用合并后的步骤代替连续的几个步骤（输出与依次执行这几个步骤相同，
+    文件名为被代替的最后一个步骤的输出）：第 1～4 步合并为 tooltagging，
+    第 5～9 步合并为 coordnormalize，第 13～16 步合并为 postcut。
+
+    每一项为 (中间文件名, 文件版本函数, 内存版本函数, 流式版本函数, 额外参数)：
+    文件版本函数签名为 func(input_path, output_path, *args)，
+    内存版本函数签名为 func(commands, *args)，输入输出均为 GCodeLine 列表；
+    流式版本函数签名与内存版本相同，输入为 GCodeLine 迭代器，返回生成器。
+    """
+    p = params
+    if fused:
+        steps = [
+            ("intermediate_4.gcode", tooltagging.process_file, tooltagging.process_commands,
+             tooltagging.stream_commands, (p["type_map"],)),
+        ]
+    else:
+        steps = [
+            ("intermediate_1.gcode", reorganization.process_file, reorganization.process_commands,
+             reorganization.stream_commands, (p["type_map"],)),
+            ("intermediate_2.gcode", TransferG0.process_file, TransferG0.process_commands,
+             TransferG0.stream_commands, ()),
+            ("intermediate_3.gcode", G0Trimmer.process_file, G0Trimmer.process_commands,
+             G0Trimmer.stream_commands, ()),
+            ("intermediate_4.gcode", GCodeAnnotator.process_gcode, GCodeAnnotator.process_commands,
+             GCodeAnnotator.stream_commands, ()),
+        ]
+    if fused:
+        steps += [
+            ("intermediate_zreorganize.gcode", coordnormalize.process_file, coordnormalize.process_commands,
+             coordnormalize.stream_commands, ()),
+        ]
+    else:
+        steps += [
+            ("intermediate_5.gcode", GCodeProcessor.process_gcode, GCodeProcessor.process_commands,
+             GCodeProcessor.stream_commands, ()),
+            ("intermediate_6.gcode", GCodeMotionExtractor.process_gcode, GCodeMotionExtractor.process_commands,
+             GCodeMotionExtractor.stream_commands, ()),
+            ("intermediate_7.gcode", gcodefile.process_gcode, gcodefile.process_commands,
+             gcodefile.stream_commands, ()),
+            ("intermediate_8.gcode", GCodeZFilter.process_gcode, GCodeZFilter.process_commands,
+             GCodeZFilter.stream_commands, ()),
+            ("intermediate_zreorganize.gcode", Zreorganize.process_z_values, Zreorganize.process_commands,
+             Zreorganize.stream_commands, ()),
+        ]
+    steps += [
+        ("intermediate_9.gcode", gcodeoffset.process_gcode, gcodeoffset.process_commands,
+         gcodeoffset.stream_commands, (p["offset_x"], p["offset_y"], p["offset_z"])),
+        ("intermediate_10.gcode", deleteG0.process_file, deleteG0.process_commands,
+         deleteG0.stream_commands, ()),
+        ("intermediate_11.gcode", addextrusion.process_jcount, addextrusion.process_commands,
+         addextrusion.stream_commands, (p["w"], p["h"], p["k2"], p["f1"], p["f2"])),
+    ]
+    if before_check:
+        steps.append(("intermediate_11_5.gcode", beforecheck.process_gcode_file, beforecheck.process_commands,
+                      beforecheck.stream_commands, ()))
+    steps += [
+        ("intermediate_12.gcode", cutter.process_gcode_file, cutter.process_commands,
+         cutter.stream_commands, (p["distance"], p["insert_f"], p["connection_f"], p["j_distance"] - p["distance"],
+                                  p.get("cut_period") or None)),
+    ]
+    if fused:
+        steps += [
+            ("intermediate_16.gcode", postcut.process_file, postcut.process_commands,
+             postcut.stream_commands, (p["insert_f"], -5, -5, p["j_distance"])),
+        ]
+    else:
+        steps += [
+            ("intermediate_13.gcode", change_f.process_file, change_f.process_commands,
+             change_f.stream_commands, (p["insert_f"],)),
+            ("intermediate_14.gcode", upupup.process_file, upupup.process_commands,
+             upupup.stream_commands, ()),
+            ("intermediate_15.gcode", joffset.process_file, joffset.process_commands,
+             joffset.stream_commands, (-5, -5, p["j_distance"])),
+            ("intermediate_16.gcode", endZup.process_file, endZup.process_commands,
+             endZup.stream_commands, ()),
+        ]
+    steps += [
+        ("intermediate_17.gcode", add_commands.add_commands_and_swap_T0_T1, add_commands.process_commands,
+         add_commands.stream_commands, ()),
+        (PREVIEW_NAME, offset.process_gcode_with_offset, offset.process_commands,
+         offset.stream_commands, (p["global_offset_x"], p["global_offset_y"], p["global_offset_z"])),
+    ]
+    return steps
+
+
+def stage_keys(input_gcode_path, steps):
+    """
+    各步骤输出的缓存键（见 stagecache），最后多一项为第 18 步点数组的键。
+
+    每个键由上一步的键、步骤名、参数和代码版本计算，第一步的上一步为输入文件内容。
+    """
+    key = input_key(input_gcode_path)
+    keys = []
+    for name, file_func, _, _, args in steps:
+        key = stage_key(key, name, file_func.__module__, list(args))
+        keys.append(key)
+    keys.append(stage_key(key, ARRAY_NAME, trans_gcode_to_array.__name__, []))
+    return keys
+
+
+def resume_point(cache, keys):
+    """
+    从最后一步往前查找缓存，返回 (可以跳过的步骤数, 最后跳过的步骤的输出路径, 点数组路径)。
+
+    只有所有步骤都命中时才查找点数组；没有命中时返回 (0, None, None)。
+    """
+    for i in range(len(keys) - 2, -1, -1):
+        path = cache.lookup(keys[i])
+        if path:
+            array_path = cache.lookup(keys[-1], ".npy") if i == len(keys) - 2 else None
+            return i + 1, path, array_path
+    return 0, None, None
+
+
+def report_stage(progress, cancelled, done, total, name):
+    """
+    每一步开始前调用：cancelled() 为 True 时抛出 PipelineCancelled，
+    否则调用 progress(已完成的步骤数, 总步骤数, 即将开始的步骤名)。两者都可以为 None。
+    """
+    if cancelled is not None and cancelled():
+        raise PipelineCancelled(f"已在 {name} 之前取消")
+    if progress is not None:
+        progress(done, total, name)
+
+
+def check_cancelled(commands, cancelled, interval=10000):
+    """流式模式下每传递 interval 条指令检查一次是否取消"""
+    for count, cmd in enumerate(commands, 1):
+        if count % interval == 0 and cancelled():
+            raise PipelineCancelled("流式处理已取消")
+        yield cmd
+
+
+def run_pipeline(input_gcode_path, output_folder, params, dump_intermediates=False,
+                 intermediate_folder=None, before_check=True, preview_path=None, streaming=False,
+                 export_array_text=False, jbi_workers=None, profile=False, profile_summary=False, cache=None,
+                 progress=None, cancelled=None, fused=False, log=print):
+    """
+    执行完整的 G-code 后处理流程，并在 output_folder 中生成 JBI 文件。
+
+    默认在内存中依次执行各步骤：Cura 输出只解析一次，各步骤之间传递 GCodeLine 列表，
+    只写出 JBI 文件；
+    streaming 为 True 时各步骤串联为生成器，边读文件边处理，任何时候都不保留整个文件的指令列表，
+    内存占用只与最大的文本块有关（最终的点数组除外），适合很大的 Cura 输出；
+    dump_intermediates 为 True 时使用原有的逐文件流程，所有 intermediate_*.gcode
+    保存在 intermediate_folder（默认为 output_folder）中，便于调试。
+    preview_path 不为空时，内存模式和流式模式下额外写出最终 G-code 供界面预览。
+    export_array_text 为 True 时把第 18 步的点数组另存为文本表 intermediate_18.gcode（调试用）。
+    jbi_workers 为同时生成 JBI 文件的进程数（默认为 CPU 核数，1 表示在当前进程中逐个生成）。
+    params 中可选的 points_per_job（每个 JBI 文件的最大点数，默认 9500）和
+    balance_jobs（各文件点数平均分配）控制 JBI 文件的拆分；
+    可选的 cut_period 不为空（且大于 0）时，第 12 步除距离末端 distance 的剪切点外，
+    另外每隔 cut_period 向前增加剪切点（见 cutter.plan_cuts）。
+    profile 为 True 时记录每一步的耗时、内存和行数等（见 pipelinestats），
+    在 output_folder 中写出 pipeline_report.json（出错时也会写出，记录出错的步骤），
+    profile_summary 为 True 时同时打印汇总表。
+    cache 为 stagecache.StageCache 时，各步骤的输出按（输入内容、之前各步骤的参数和代码版本）
+    保存在缓存中，再次运行时从命中的最后一个步骤继续；所有步骤都命中时只重新生成 JBI 文件。
+    只修改后面步骤的参数（如 distance、global_offset_*、user/tool）时不再重新执行前面的步骤。
+    progress(已完成的步骤数, 总步骤数, 步骤名) 在每一步开始前和全部完成后调用（界面显示进度）；
+    cancelled() 在每一步开始前检查，返回 True 时停止并抛出 PipelineCancelled
+    （流式模式下各步骤同时进行，每处理一定数量的指令检查一次）。
+    fused 为 True 时使用合并后的步骤（见 build_steps），输出相同，遍历次数更少。
+    log(文本) 输出本流程、各步骤（见 pipelinelog）和 JBI 生成的提示信息
+    （默认打印；界面传入回调，在日志窗口中逐行显示）。
+
+    返回最终 G-code 文件路径（未写出时返回 None）。
+    """
+    check_params(params)
+    steps = build_steps(params, before_check, fused)
+    user = params["user"]
+    tool = params["tool"]
+    jbi_options = {"workers": jbi_workers,
+                   "points_per_job": params.get("points_per_job", arraytojbi.POINTS_PER_JOB),
+                   "balance": params.get("balance_jobs", False),
+                   "log": log}
+
+    # 各 G-code 步骤、点数组、JBI 文件
+    total = len(steps) + 2
+
+    mode = "dump" if dump_intermediates else "streaming" if streaming else "memory"
+    profiler = PipelineProfiler(input_gcode_path, mode, enabled=profile or profile_summary)
+    start, cached_path, cached_array = 0, None, None
+    # 各步骤中 pipelinelog.log 输出的提示信息也交给 log（只作用于当前线程）
+    log_token = pipelinelog.bind(log)
+    try:
+        if cache is not None:
+            with profiler.stage("stagecache") as record:
+                keys = stage_keys(input_gcode_path, steps)
+                start, cached_path, cached_array = resume_point(cache, keys)
+                record["skipped_steps"] = start
+                record["array_hit"] = cached_array is not None
+            if start:
+                log(f"从缓存恢复前 {start} 个步骤（至 {steps[start - 1][0]}）")
+
+        if cached_array is not None:
+            # 所有步骤和点数组都已缓存，只重新生成 JBI 文件
+            if dump_intermediates:
+                folder = intermediate_folder or output_folder
+                os.makedirs(folder, exist_ok=True)
+                final_path = os.path.join(folder, PREVIEW_NAME)
+                shutil.copyfile(cached_path, final_path)
+                shutil.copyfile(cached_array, os.path.join(folder, ARRAY_NAME))
+            else:
+                final_path = preview_path
+                if preview_path:
+                    shutil.copyfile(cached_path, preview_path)
+            arr = np.load(cached_array)
+            if export_array_text:
+                trans_gcode_to_array.write_array_to_file(arr, os.path.join(intermediate_folder or output_folder,
+                                                                           ARRAY_TEXT_NAME))
+            report_stage(progress, cancelled, total - 1, total, "arraytojbi")
+            with profiler.stage("arraytojbi") as record:
+                record["files"] = len(arraytojbi.write_jbi_files(arr, output_folder, user, tool, **jbi_options) or [])
+            report_stage(progress, None, total, total, "完成")
+            return final_path
+
+        if dump_intermediates:
+            folder = intermediate_folder or output_folder
+            current = input_gcode_path
+            if start:
+                os.makedirs(folder, exist_ok=True)
+                current = os.path.join(folder, steps[start - 1][0])
+                shutil.copyfile(cached_path, current)
+            for i, (name, file_func, _, _, args) in enumerate(steps[start:], start):
+                report_stage(progress, cancelled, i, total, file_func.__module__)
+                output_path = os.path.join(folder, name)
+                with profiler.stage(file_func.__module__, name):
+                    file_func(current, output_path, *args)
+                profiler.record_files(current, output_path)
+                if cache is not None:
+                    cache.store_file(keys[i], output_path)
+                current = output_path
+            array_path = os.path.join(folder, ARRAY_NAME)
+            report_stage(progress, cancelled, total - 2, total, "trans_gcode_to_array")
+            with profiler.stage("trans_gcode_to_array", ARRAY_NAME) as record:
+                arr = trans_gcode_to_array.process_gcode_to_array(current, array_path)
+                record["points"] = len(arr)
+            if cache is not None:
+                cache.store_file(keys[-1], array_path, ".npy")
+            if export_array_text:
+                trans_gcode_to_array.write_array_to_file(arr, os.path.join(folder, ARRAY_TEXT_NAME))
+            report_stage(progress, cancelled, total - 1, total, "arraytojbi")
+            with profiler.stage("arraytojbi") as record:
+                record["files"] = len(arraytojbi.process_array_to_jbi(array_path, output_folder, user, tool,
+                                                                      **jbi_options) or [])
+            report_stage(progress, None, total, total, "完成")
+            return current
+
+        if streaming:
+            # 各步骤在生成点数组时同时执行，进度只能按开始流式处理、生成 JBI 文件两处报告
+            report_stage(progress, cancelled, start, total, "流式处理各步骤")
+            commands = iter_commands(cached_path or input_gcode_path, encoding='utf-8')
+            if cancelled is not None:
+                commands = check_cancelled(commands, cancelled)
+            commands = profiler.stream_stage("gcodeparse", None, commands)
+            for i, (name, _, _, stream_func, args) in enumerate(steps[start:], start):
+                commands = stream_func(commands, *args)
+                if cache is not None:
+                    commands = cache.tee(keys[i], commands)
+                commands = profiler.stream_stage(stream_func.__module__, name, commands)
+            # 各步骤在生成点数组时才实际执行，耗时记在这一步中
+            with profiler.stage("trans_gcode_to_array（含流式各步骤）") as record:
+                if preview_path:
+                    with open(preview_path, 'w') as preview:
+                        arr = trans_gcode_to_array.commands_to_array(write_through(commands, preview))
+                else:
+                    arr = trans_gcode_to_array.commands_to_array(commands)
+                record["points"] = len(arr)
+            if cache is not None:
+                cache.store_array(keys[-1], arr)
+            if export_array_text:
+                trans_gcode_to_array.write_array_to_file(arr, os.path.join(intermediate_folder or output_folder,
+                                                                           ARRAY_TEXT_NAME))
+            report_stage(progress, cancelled, total - 1, total, "arraytojbi")
+            with profiler.stage("arraytojbi") as record:
+                record["files"] = len(arraytojbi.write_jbi_files(arr, output_folder, user, tool, **jbi_options) or [])
+            report_stage(progress, None, total, total, "完成")
+            return preview_path
+
+        with profiler.stage("gcodeparse"):
+            commands = parse_lines(read_lines(cached_path or input_gcode_path, encoding='utf-8'))
+        profiler.record_commands(None, commands)
+        for i, (name, _, commands_func, _, args) in enumerate(steps[start:], start):
+            report_stage(progress, cancelled, i, total, commands_func.__module__)
+            with profiler.stage(commands_func.__module__, name):
+                result = commands_func(commands, *args)
+            profiler.record_commands(commands, result)
+            if cache is not None:
+                cache.store_lines(keys[i], to_lines(result))
+            commands = result
+        if preview_path:
+            write_lines(preview_path, to_lines(commands))
+        report_stage(progress, cancelled, total - 2, total, "trans_gcode_to_array")
+        with profiler.stage("trans_gcode_to_array") as record:
+            arr = trans_gcode_to_array.commands_to_array(commands)
+            record["points"] = len(arr)
+        if cache is not None:
+            cache.store_array(keys[-1], arr)
+        if export_array_text:
+            trans_gcode_to_array.write_array_to_file(arr, os.path.join(intermediate_folder or output_folder,
+                                                                       ARRAY_TEXT_NAME))
+        report_stage(progress, cancelled, total - 1, total, "arraytojbi")
+        with profiler.stage("arraytojbi") as record:
+            record["files"] = len(arraytojbi.write_jbi_files(arr, output_folder, user, tool, **jbi_options) or [])
+        report_stage(progress, None, total, total, "完成")
+        return preview_path
+    finally:
+        pipelinelog.reset(log_token)
+        if cache is not None:
+            cache.evict()
+        report_path = profiler.write_report(output_folder)
+        if report_path:
+            if profile_summary:
+                log(profiler.summary())
+            log(f"性能报告已保存至: {report_path}")
+
+
+def write_through(commands, f):
+    """流式模式下边传递指令边写出到文件 f"""
+    for cmd in commands:
+        f.write(cmd.raw)
+        yield cmd
@@ -0,0 +1,24 @@
+import contextvars
+
+# 当前处理流程的日志输出函数 log(文本)，为 None 时直接打印。
+# 使用 ContextVar 而不是替换 sys.stdout：每个线程各自独立，后台线程中的流程不会收到界面线程或其他任务的输出
+_current = contextvars.ContextVar("pipeline_log", default=None)
+
+
+def log(*args):
+    """输出各步骤的提示信息：参数与 print 相同（以空格连接），交给 bind() 设置的函数，没有设置时打印"""
+    func = _current.get()
+    if func is None:
+        print(*args)
+    else:
+        func(" ".join(str(arg) for arg in args))
+
+
+def bind(func):
+    """在当前线程中设置日志输出函数，返回用于 reset() 的标记"""
+    return _current.set(func)
+
+
+def reset(token):
+    """恢复 bind() 之前的日志输出函数"""
+    _current.reset(token)
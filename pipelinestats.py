@@ -0,0 +1,250 @@
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # Windows 没有 resource 模块
+    resource = None
+
+# 性能报告文件名（与 JBI 文件保存在同一文件夹）
+REPORT_NAME = "pipeline_report.json"
+
+
+def peak_rss():
+    """
+    返回当前进程的峰值内存（字节），无法获取时返回 None。
+
+    Windows 上需要安装 psutil；Linux/macOS 上使用标准库 resource。
+    """
+    if psutil is not None:
+        peak = getattr(psutil.Process().memory_info(), "peak_wset", None)
+        if peak is not None:
+            return peak
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux 上单位为 KB，macOS 上为字节
+        return peak if sys.platform == "darwin" else peak * 1024
+    return None
+
+
+def new_counts():
+    """行数、字节数、文本块数和 T0/T1 数量的计数字典"""
+    return {"lines": 0, "bytes": 0, "blocks": 0, "t0": 0, "t1": 0}
+
+
+def add_line(counts, raw, code, blank):
+    """把一行计入 counts，blank 为 True 表示空行（块分隔行）"""
+    counts["lines"] += 1
+    counts["bytes"] += len(raw) if raw.isascii() else len(raw.encode("utf-8"))
+    if blank:
+        counts["blocks"] += 1
+    elif code == "T0":
+        counts["t0"] += 1
+    elif code == "T1":
+        counts["t1"] += 1
+
+
+def finish_counts(counts):
+    """文本块数等于空行数加一（没有行时为 0）"""
+    if counts["lines"]:
+        counts["blocks"] += 1
+    return counts
+
+
+def count_commands(commands):
+    """统计 GCodeLine 列表"""
+    counts = new_counts()
+    for cmd in commands:
+        add_line(counts, cmd.raw, cmd.code, cmd.code is None and cmd.comment is None)
+    return finish_counts(counts)
+
+
+def count_file(path):
+    """统计 G-code 文件（字节数为文件大小），文件不存在时返回 None"""
+    if not os.path.exists(path):
+        return None
+    counts = new_counts()
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            words = line.partition(";")[0].split()
+            add_line(counts, line, words[0] if words else None, not line.strip())
+    finish_counts(counts)
+    counts["bytes"] = os.path.getsize(path)
+    return counts
+
+
+class PipelineProfiler:
+    """
+    记录后处理流程每一步的耗时和内存，并生成 JSON 报告。
+
+    每一步记录：
+    - wall_time/cpu_time: 墙钟时间和 CPU 时间（秒）
+    - peak_rss_delta: 该步骤中进程峰值内存的增长（字节，未超过之前的峰值时为 0；
+      JBI 多进程生成时不包括子进程）
+    - input/output: 输入输出的行数、字节数、文本块数、T0/T1 数量
+    - error: 出错时的异常信息
+
+    enabled 为 False 时各方法都不做任何事，不影响处理速度。
+    """
+
+    def __init__(self, input_path, mode, enabled=True):
+        self.enabled = enabled
+        self.input_path = input_path
+        self.mode = mode
+        self.stages = []
+        self.error = None
+        self.started = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        self.streams = []  # 流式模式下各步骤的计数 [(记录, 输出计数)]
+        self.last_counts = None  # (指令列表, 计数)，避免重复统计上一步的输出
+
+    @contextmanager
+    def stage(self, name, output=None):
+        """计时一个步骤：with profiler.stage(名称, 输出文件名) as record: ..."""
+        if not self.enabled:
+            yield {}
+            return
+        record = {"name": name, "output_name": output}
+        rss = peak_rss()
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield record
+        except Exception as e:
+            record["error"] = f"{type(e).__name__}: {e}"
+            self.error = f"{name}: {record['error']}"
+            raise
+        finally:
+            record["wall_time"] = time.perf_counter() - wall
+            record["cpu_time"] = time.process_time() - cpu
+            end_rss = peak_rss()
+            record["peak_rss_delta"] = end_rss - rss if rss is not None and end_rss is not None else None
+            self.stages.append(record)
+
+    def record_commands(self, inputs, outputs):
+        """在上一个步骤的记录中加入输入、输出指令列表的计数"""
+        if not self.enabled:
+            return
+        record = self.stages[-1]
+        if inputs is not None:
+            if self.last_counts is not None and self.last_counts[0] is inputs:
+                record["input"] = self.last_counts[1]
+            else:
+                record["input"] = count_commands(inputs)
+        record["output"] = count_commands(outputs)
+        self.last_counts = (outputs, record["output"])
+
+    def record_files(self, input_path, output_path):
+        """在上一个步骤的记录中加入输入、输出文件的计数"""
+        if not self.enabled:
+            return
+        record = self.stages[-1]
+        if input_path is not None:
+            if self.last_counts is not None and self.last_counts[0] == input_path:
+                record["input"] = self.last_counts[1]
+            else:
+                record["input"] = count_file(input_path)
+        record["output"] = count_file(output_path)
+        self.last_counts = (output_path, record["output"])
+
+    def stream_stage(self, name, output, commands):
+        """
+        流式模式下统计一个步骤输出的指令（边传递边计数）。
+
+        各步骤交替执行，无法分开计时，耗时和内存只记录在最后消耗指令的步骤中。
+        """
+        if not self.enabled:
+            return commands
+        record = {"name": name, "output_name": output, "wall_time": None, "cpu_time": None,
+                  "peak_rss_delta": None}
+        if self.streams:
+            record["input"] = self.streams[-1][1]
+        counts = new_counts()
+        self.stages.append(record)
+        self.streams.append((record, counts))
+        return self.count_stream(record, counts, commands)
+
+    def count_stream(self, record, counts, commands):
+        """逐条传递指令并计数，结束时写入记录"""
+        for cmd in commands:
+            add_line(counts, cmd.raw, cmd.code, cmd.code is None and cmd.comment is None)
+            yield cmd
+        record["output"] = finish_counts(counts)
+
+    def report(self):
+        """返回报告字典"""
+        return {
+            "input": self.input_path,
+            "mode": self.mode,
+            "started": self.started,
+            "wall_time": time.perf_counter() - self.wall_start,
+            "cpu_time": time.process_time() - self.cpu_start,
+            "peak_rss": peak_rss(),
+            "error": self.error,
+            "stages": self.stages,
+        }
+
+    def write_report(self, folder):
+        """在 folder 中写出 JSON 报告，返回报告路径"""
+        if not self.enabled:
+            return None
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        path = os.path.join(folder, REPORT_NAME)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=4, ensure_ascii=False)
+        return path
+
+    def summary(self):
+        """返回各步骤的汇总表文本"""
+        rows = [("步骤", "耗时(s)", "CPU(s)", "内存增长(MB)", "输入行数", "输出行数", "输出(MB)", "块数", "T0", "T1")]
+        for record in self.stages:
+            output = record.get("output") or {}
+            rows.append((
+                record["name"],
+                format_value(record.get("wall_time"), "{:.3f}"),
+                format_value(record.get("cpu_time"), "{:.3f}"),
+                format_value(record.get("peak_rss_delta"), "{:.1f}", 1 / 2 ** 20),
+                format_value((record.get("input") or {}).get("lines"), "{}"),
+                format_value(output.get("lines"), "{}"),
+                format_value(output.get("bytes"), "{:.2f}", 1 / 2 ** 20),
+                format_value(output.get("blocks"), "{}"),
+                format_value(output.get("t0"), "{}"),
+                format_value(output.get("t1"), "{}"),
+            ))
+        report = self.report()
+        rows.append(("合计", format_value(report["wall_time"], "{:.3f}"), format_value(report["cpu_time"], "{:.3f}"),
+                     format_value(report["peak_rss"], "峰值 {:.1f}", 1 / 2 ** 20), "", "", "", "", "", ""))
+
+        widths = [max(display_width(row[i]) for row in rows) for i in range(len(rows[0]))]
+        lines = []
+        for row in rows:
+            cells = []
+            for i, (cell, width) in enumerate(zip(row, widths)):
+                padding = " " * (width - display_width(cell))
+                cells.append(cell + padding if i == 0 else padding + cell)
+            lines.append("  ".join(cells))
+        if self.error:
+            lines.append(f"出错: {self.error}")
+        return "\n".join(lines)
+
+
+def display_width(text):
+    """文本在终端中的显示宽度（中文字符占两格）"""
+    return sum(2 if ord(char) > 0x2E80 else 1 for char in text)
+
+
+def format_value(value, fmt, scale=1):
+    """格式化汇总表中的数值，没有数值时显示 -"""
+    if value is None:
+        return "-"
+    return fmt.format(value * scale)
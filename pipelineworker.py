@@ -0,0 +1,147 @@
+import threading
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from PyQt5.QtWidgets import QHBoxLayout, QLabel, QPlainTextEdit, QProgressBar, QPushButton, QVBoxLayout, QWidget
+
+from pipeline import PipelineCancelled
+
+
+class PipelineWorker(QObject):
+    """
+    在后台线程中执行 func(*args, progress=..., cancelled=..., log=..., **kwargs)。
+
+    func 应按 run_pipeline 的约定调用 progress(已完成的步骤数, 总步骤数, 步骤名)，
+    并在每一步开始前检查 cancelled()；提示信息交给 log(文本)，通过 log 信号发出。
+    不替换 sys.stdout，界面线程或其他任务 print 的内容不会混入本任务的日志。
+    结束时发出 finished(返回值)、failed(错误信息) 或 cancelled() 之一，最后发出 done()。
+    """
+    progress = pyqtSignal(int, int, str)
+    log = pyqtSignal(str)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    done = pyqtSignal()
+
+    def __init__(self, func, *args, **kwargs):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        """请求取消，当前步骤完成后停止"""
+        self.cancel_event.set()
+
+    def run(self):
+        try:
+            result = self.func(*self.args, progress=self.progress.emit, cancelled=self.cancel_event.is_set,
+                               log=self.log.emit, **self.kwargs)
+            self.finished.emit(result)
+        except PipelineCancelled as e:
+            self.log.emit(str(e))
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self.done.emit()
+
+
+class PipelineRunPanel(QWidget):
+    """
+    进度条、取消按钮和日志窗口，用 start() 在后台线程中执行处理流程。
+
+    finished/failed/cancelled 与 PipelineWorker 的同名信号相同（在界面线程中发出），
+    任一结果之后都会发出 stopped()，用于重新启用开始按钮。
+    """
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    stopped = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.thread = None
+        self.worker = None
+
+        self.stage_label = QLabel("", self)
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(0)
+        self.cancel_button = QPushButton("取消", self)
+        self.cancel_button.setEnabled(False)
+        self.cancel_button.clicked.connect(self.cancel)
+        self.log_view = QPlainTextEdit(self)
+        self.log_view.setReadOnly(True)
+        self.log_view.setMaximumBlockCount(5000)
+
+        progress_layout = QHBoxLayout()
+        progress_layout.addWidget(self.stage_label)
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.cancel_button)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(progress_layout)
+        layout.addWidget(self.log_view)
+
+    def is_running(self):
+        return self.thread is not None
+
+    def start(self, func, *args, **kwargs):
+        """在后台线程中执行 func（见 PipelineWorker），已有任务在执行时返回 False"""
+        if self.is_running():
+            return False
+        self.log_view.clear()
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(0)
+        self.stage_label.setText("开始")
+        self.cancel_button.setEnabled(True)
+
+        self.thread = QThread(self)
+        self.worker = PipelineWorker(func, *args, **kwargs)
+        self.worker.moveToThread(self.thread)
+        self.thread.started.connect(self.worker.run)
+        self.worker.progress.connect(self.on_progress)
+        self.worker.log.connect(self.log_view.appendPlainText)
+        self.worker.finished.connect(self.finished)
+        self.worker.failed.connect(self.on_failed)
+        self.worker.cancelled.connect(self.on_cancelled)
+        self.worker.done.connect(self.thread.quit)
+        self.thread.finished.connect(self.on_stopped)
+        self.thread.start()
+        return True
+
+    def cancel(self):
+        """请求取消（当前步骤完成后停止）"""
+        if self.worker is not None:
+            self.worker.cancel()
+            self.cancel_button.setEnabled(False)
+            self.stage_label.setText("正在取消…")
+
+    def shutdown(self):
+        """窗口关闭时调用：取消正在执行的任务并等待线程结束"""
+        if self.is_running():
+            self.worker.cancel()
+            self.thread.wait()
+
+    def on_progress(self, done, total, name):
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+        self.stage_label.setText(f"{done}/{total} {name}")
+
+    def on_failed(self, message):
+        self.log_view.appendPlainText(f"出错: {message}")
+        self.stage_label.setText("出错")
+        self.failed.emit(message)
+
+    def on_cancelled(self):
+        self.stage_label.setText("已取消")
+        self.cancelled.emit()
+
+    def on_stopped(self):
+        self.cancel_button.setEnabled(False)
+        self.thread.deleteLater()
+        self.worker.deleteLater()
+        self.thread = None
+        self.worker = None
+        self.stopped.emit()
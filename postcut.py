@@ -0,0 +1,138 @@
+from collections import deque
+
+from endZup import append_end_line, build_end_line
+from gcodeparse import BLANK_LINE, parse_lines, replace_params, to_lines
+from joffset import connection_line
+from pipelinelog import log
+from upupup import lift_g1
+
+
+def process_file(input_file, output_file, f_value, x_offset, y_offset, j_offset):
+    """
+    合并第 13～16 步（change_f → upupup → joffset → endZup），只读写一次文件，
+    输出与依次执行四个步骤相同。
+
+    参数:
+        input_file (str): 输入文件路径
+        output_file (str): 输出文件路径
+        f_value (float): T1 块中前四个 G1 命令替换后的 F 值
+        x_offset (float): 连接行的 X 偏移量
+        y_offset (float): 连接行的 Y 偏移量
+        j_offset (float): 连接行的 J 偏移量
+    """
+    try:
+        with open(input_file, 'r') as f:
+            lines = f.readlines()
+
+        result = process_commands(parse_lines(lines), f_value, x_offset, y_offset, j_offset)
+
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.writelines(to_lines(result))
+        log("T1 块处理完成！")
+    except Exception as e:
+        log(f"处理失败：{str(e)}")
+
+
+def process_commands(commands, f_value, x_offset, y_offset, j_offset):
+    """process_file 的内存版本：输入第 12 步输出的指令列表，返回 endZup 输出的指令列表"""
+    return list(stream_commands(commands, f_value, x_offset, y_offset, j_offset))
+
+
+def stream_commands(commands, f_value, x_offset, y_offset, j_offset):
+    """
+    process_commands 的流式版本：一次遍历，按空行分块，每块记录需要插入抬升行的位置，
+    不在列表中间插入。内存中通常只保留当前块和上一块。
+
+    - change_f：每个 T1 之后前四个带 F 参数的 G1 替换为 f_value
+    - upupup：T1 块（到下一个 T0 或 T1 为止，文件末尾未结束的不算）的最后一条 G1
+      之后插入 Z 值加 10 的复制行
+    - joffset：以 T1 开头的块末尾追加指向下一块第一条 G1 的连接行
+    - endZup：文件末尾追加最后一条包含 X、Y、Z 的 G1 抬升 40 后的结束行，
+      没有这样的 G1 时抛出 ValueError
+    """
+    f_param = (float(f_value), f"{f_value}")
+    offsets = (x_offset, y_offset, j_offset)
+    remaining = 0  # change_f：当前 T1 之后还需替换的 G1 数量
+    in_t1_block = False  # upupup：是否在 T1 块中
+    target = None  # upupup：(所在块, 行号)，当前 T1 块中最近的一条 G1
+    blocks = deque()  # 已结束、尚未输出的块，每块为 [指令列表, 抬升行插入位置列表]
+    block = [[], []]
+    separator = []  # 下一块之前的空行
+    last_data = None  # endZup：已输出的最后一条包含 X、Y、Z 的 G1
+
+    for cmd in commands:
+        code = cmd.code
+        if code == 'G1':
+            if remaining and cmd.f is not None:
+                cmd = replace_params(cmd, newline='\n', F=f_param)
+                remaining -= 1
+            if in_t1_block:
+                target = (block, len(block[0]))
+        elif code == 'T0' or code == 'T1':
+            # 上一个 T1 块结束，在其最后一条 G1 之后插入抬升行
+            if target is not None:
+                target[0][1].append(target[1])
+                target = None
+            in_t1_block = code == 'T1'
+            if in_t1_block:
+                remaining = 4
+        elif cmd.is_blank:
+            blocks.append(block)
+            block = [[], []]
+            # 输出下一块已结束、且不再等待插入抬升行的块
+            while len(blocks) > 1 and (target is None or target[0] is not blocks[0]):
+                lines, data = finish_block(blocks.popleft(), blocks[0], offsets)
+                yield from separator
+                yield from lines
+                separator = [BLANK_LINE]
+                if data is not None:
+                    last_data = data
+            continue
+        block[0].append(cmd)
+
+    # 文件末尾未结束的 T1 块不插入抬升行
+    blocks.append(block)
+    while len(blocks) > 1:
+        lines, data = finish_block(blocks.popleft(), blocks[0], offsets)
+        yield from separator
+        yield from lines
+        separator = [BLANK_LINE]
+        if data is not None:
+            last_data = data
+    lines, data = finish_block(blocks.popleft(), None, offsets)
+    if data is not None:
+        last_data = data
+
+    new_line = build_end_line([last_data] if last_data is not None else [])
+    if new_line is None:
+        raise ValueError("未找到包含 X、Y、Z 的 G1 数据行")
+    tail = separator + lines
+    yield from tail[:-1]
+    yield from append_end_line(tail[-1:], new_line)
+
+
+def finish_block(block, next_block, offsets):
+    """
+    返回 (块的输出行, 其中最后一条包含 X、Y、Z 的 G1)：插入抬升行，
+    以 T1 开头时追加指向 next_block（最后一块为 None）第一条 G1 的连接行。
+    """
+    lines, lifts = block
+    if lifts:
+        result = []
+        start = 0
+        for index in lifts:
+            result += lines[start:index + 1]
+            result.append(lift_g1(lines[index]))
+            start = index + 1
+        result += lines[start:]
+        lines = result
+
+    if next_block is not None and lines and lines[0].code == 'T1':
+        g1_line = next((line for line in next_block[0] if line.code == 'G1'), None)
+        last_g1_line = next((line for line in reversed(lines) if line.code == 'G1'), None)
+        new_line = connection_line(last_g1_line, g1_line, *offsets)
+        if new_line is not None:
+            lines = lines + [new_line]
+
+    data = next((line for line in reversed(lines) if line.code == 'G1' and line.has_xyz), None)
+    return lines, data
@@ -1,103 +1,127 @@
 import json
 import os
+import shutil
 import subprocess
 import argparse
 
-# 假设这些模块是你已有的 G-code 处理函数
-from reorganization import process_file as reorganize
-from TransferG0 import process_file as transfer_g0
-from G0Trimmer import process_file as trim_g0
-from GCodeAnnotator import process_gcode as next_step
-from GCodeProcessor import process_gcode as fifth_step
-from GCodeMotionExtractor import process_gcode as sixth_step
-from gcodefile import process_gcode as seventh_step
-from GCodeZFilter import process_gcode as eighth_step
-from Zreorganize import process_z_values as zreorganize_step
-from gcodeoffset import process_gcode as ninth_step
-from deleteG0 import process_file as tenth_step
-from addextrusion import process_jcount as eleventh_step
-from beforecheck import process_gcode_file as before_check_step  # 新增的第11.5步
-from cutter import process_gcode_file as twelfth_step
-from change_f import process_file as thirteenth_step
-from upupup import process_file as fourteenth_step
-from joffset import process_file as fifteenth_step
-from endZup import process_file as sixteenth_step
-from add_commands import add_commands_and_swap_T0_T1 as seventeenth_step
-from trans_gcode_to_array import process_gcode_to_array as eighteenth_step
-from arraytojbi import process_array_to_jbi as nineteenth_step
-from offset import process_gcode_with_offset as twentieth_step
-
-def update_json_config(file_path, json_config):
-    """直接根据输入的 json_config 更新 fdmprinter.def.json 中的参数值"""
-    try:
-        if not os.access(file_path, os.W_OK):
-            raise PermissionError(f"文件 {file_path} 无写权限，请以管理员权限运行程序")
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            json_data = json.load(f)
-        print(f"成功读取 {file_path}")
-
-        print(f"输入的 json_config: {json_config}")
-
-        parameter_paths = {
-            "layer_height": ["settings", "resolution", "children", "layer_height", "default_value"],
-            "layer_height_0": ["settings", "resolution", "children", "layer_height_0", "default_value"],
-            "line_width": ["settings", "resolution", "children", "line_width", "default_value"],
-            "wall_line_width": ["settings", "resolution", "children", "line_width", "children", "wall_line_width", "default_value"],
-            "wall_line_width_0": ["settings", "resolution", "children", "line_width", "children", "wall_line_width", "children", "wall_line_width_0", "default_value"],
-            "wall_line_width_x": ["settings", "resolution", "children", "line_width", "children", "wall_line_width", "children", "wall_line_width_x", "default_value"],
-            "infill_line_distance": ["settings", "infill", "children", "infill_sparse_density", "children", "infill_line_distance", "default_value"],
-            "top_bottom_thickness": ["settings", "top_bottom", "children", "top_bottom_thickness", "default_value"],
-            "top_thickness": ["settings", "top_bottom", "children", "top_bottom_thickness", "children", "top_thickness", "default_value"],
-            "top_layers": ["settings", "top_bottom", "children", "top_bottom_thickness", "children", "top_thickness", "children", "top_layers", "default_value"],
-            "bottom_thickness": ["settings", "top_bottom", "children", "top_bottom_thickness", "children", "bottom_thickness", "default_value"],
-            "bottom_layers": ["settings", "top_bottom", "children", "top_bottom_thickness", "children", "bottom_thickness", "children", "bottom_layers", "default_value"],
-            "wall_line_count": ["settings", "shell", "children", "wall_thickness", "children", "wall_line_count", "default_value"],
-            "infill_sparse_thickness": ["settings", "infill", "children", "infill_sparse_thickness", "default_value"],
-            "infill_pattern": ["settings", "infill", "children", "infill_pattern", "default_value"],
-            "initial_bottom_layers": ["settings", "top_bottom", "children", "top_bottom_thickness", "children", "bottom_thickness", "children", "bottom_layers", "default_value"],
-            "support_enable": ["settings", "support", "children", "support_enable", "default_value"]
-        }
-
-        for param_name, value in json_config.items():
-            if param_name in parameter_paths:
-                path = parameter_paths[param_name]
-                current = json_data
-                try:
-                    for key in path[:-1]:
-                        current = current.setdefault(key, {})
-                    current[path[-1]] = value
-                    print(f"成功更新 {param_name} 为 {value}")
-                except KeyError as e:
-                    print(f"更新 {param_name} 失败: 路径 {path} 中缺少键 {e}")
-            else:
-                print(f"警告: 参数 {param_name} 未在 fdmprinter.def.json 中定义，跳过更新")
-
-        if "bottom_layers" in json_config and "initial_bottom_layers" not in json_config:
-            json_config["initial_bottom_layers"] = json_config["bottom_layers"]
-            path = parameter_paths["initial_bottom_layers"]
-            current = json_data
+# G-code 后处理流程（20 个步骤）
+from pipeline import REQUIRED_PARAMS, PipelineCancelled, run_pipeline
+from stagecache import DEFAULT_MAX_BYTES, StageCache, file_digest, stage_key
+
+# json_config 中可以设置的 Cura 参数（及其在 fdmprinter.def.json 中的路径）
+PARAMETER_PATHS = {
+    "layer_height": ["settings", "resolution", "children", "layer_height", "default_value"],
+    "layer_height_0": ["settings", "resolution", "children", "layer_height_0", "default_value"],
+    "line_width": ["settings", "resolution", "children", "line_width", "default_value"],
+    "wall_line_width": ["settings", "resolution", "children", "line_width", "children", "wall_line_width", "default_value"],
+    "wall_line_width_0": ["settings", "resolution", "children", "line_width", "children", "wall_line_width", "children", "wall_line_width_0", "default_value"],
+    "wall_line_width_x": ["settings", "resolution", "children", "line_width", "children", "wall_line_width", "children", "wall_line_width_x", "default_value"],
+    "infill_line_distance": ["settings", "infill", "children", "infill_sparse_density", "children", "infill_line_distance", "default_value"],
+    "top_bottom_thickness": ["settings", "top_bottom", "children", "top_bottom_thickness", "default_value"],
+    "top_thickness": ["settings", "top_bottom", "children", "top_bottom_thickness", "children", "top_thickness", "default_value"],
+    "top_layers": ["settings", "top_bottom", "children", "top_bottom_thickness", "children", "top_thickness", "children", "top_layers", "default_value"],
+    "bottom_thickness": ["settings", "top_bottom", "children", "top_bottom_thickness", "children", "bottom_thickness", "default_value"],
+    "bottom_layers": ["settings", "top_bottom", "children", "top_bottom_thickness", "children", "bottom_thickness", "children", "bottom_layers", "default_value"],
+    "wall_line_count": ["settings", "shell", "children", "wall_thickness", "children", "wall_line_count", "default_value"],
+    "infill_sparse_thickness": ["settings", "infill", "children", "infill_sparse_thickness", "default_value"],
+    "infill_pattern": ["settings", "infill", "children", "infill_pattern", "default_value"],
+    "initial_bottom_layers": ["settings", "top_bottom", "children", "top_bottom_thickness", "children", "bottom_thickness", "children", "bottom_layers", "default_value"],
+    "support_enable": ["settings", "support", "children", "support_enable", "default_value"]
+}
+
+# 每次切片都通过命令行传给 CuraEngine 的设置
+EXTRA_SETTINGS = {"roofing_layer_count": 0}
+
+# 切片时检查是否取消的间隔（秒）
+CANCEL_POLL_SECONDS = 0.2
+
+# 切片缓存键中的固定标记：设置的传递方式（slice_command）改变时修改版本号，使之前的切片结果失效
+SLICE_KEY_TAG = "readjson.slice/1"
+
+def cura_value(value):
+    """设置值在 CuraEngine 命令行中的写法（布尔值写作 true/false）"""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+def slice_command(cura_engine_path, definition_path, stl_file_path, output_path, settings):
+    """
+    返回 CuraEngine 切片命令。
+
+    定义文件只读取、不修改，settings 中的参数都以 -s 名称=值 传入，
+    因此多个切片任务可以同时运行，也不需要 Cura 安装目录的写权限。
+    EXTRA_SETTINGS 与之前一样放在 -l 之后（作用于模型），其余参数放在 -l 之前（全局设置）。
+    """
+    command = [cura_engine_path, "slice", "-v", "-j", definition_path]
+    for name, value in settings.items():
+        if name not in EXTRA_SETTINGS:
+            command += ["-s", f"{name}={cura_value(value)}"]
+    command += ["-l", stl_file_path]
+    for name in EXTRA_SETTINGS:
+        command += ["-s", f"{name}={cura_value(settings[name])}"]
+    return command + ["-o", output_path]
+
+def effective_settings(json_config):
+    """
+    实际生效的 Cura 设置：json_config 中 PARAMETER_PATHS 定义的参数
+    （没有设置 initial_bottom_layers 时与 bottom_layers 相同）和 EXTRA_SETTINGS。
+    """
+    settings = {name: value for name, value in json_config.items() if name in PARAMETER_PATHS}
+    if "bottom_layers" in settings and "initial_bottom_layers" not in settings:
+        settings["initial_bottom_layers"] = settings["bottom_layers"]
+    settings.update(EXTRA_SETTINGS)
+    return settings
+
+def slice_key(stl_file_path, settings, cura_engine_path, definition_path):
+    """
+    切片结果的缓存键：STL 文件内容、实际生效的设置、CuraEngine 路径（含版本号）、
+    -j 传入的打印机定义文件的内容和 SLICE_KEY_TAG。
+    不使用模块名，命令行运行和被界面、批处理导入时同一切片的键相同。
+    """
+    return stage_key(file_digest(stl_file_path), "CuraEngine", None,
+                     [SLICE_KEY_TAG, cura_engine_path, file_digest(definition_path), settings])
+
+def run_cura(command, cancelled=None):
+    """
+    运行 CuraEngine 并返回其标准输出，返回码不为 0 时抛出 subprocess.CalledProcessError。
+    运行期间每隔 CANCEL_POLL_SECONDS 秒检查一次 cancelled()，返回 True 时结束 CuraEngine 并抛出 PipelineCancelled。
+    """
+    with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as process:
+        while True:
             try:
-                for key in path[:-1]:
-                    current = current.setdefault(key, {})
-                current[path[-1]] = json_config["bottom_layers"]
-                print(f"同步更新 initial_bottom_layers 为 {json_config['bottom_layers']}")
-            except KeyError as e:
-                print(f"更新 initial_bottom_layers 失败: 路径 {path} 中缺少键 {e}")
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=4, ensure_ascii=False)
-        print(f"成功保存 {file_path}")
-
-    except PermissionError as e:
-        print(f"权限错误: {str(e)}")
-        raise
-    except Exception as e:
-        print(f"更新 JSON 文件失败: {str(e)}")
-        raise
+                stdout, stderr = process.communicate(timeout=CANCEL_POLL_SECONDS)
+                break
+            except subprocess.TimeoutExpired:
+                if cancelled is not None and cancelled():
+                    process.kill()
+                    process.communicate()
+                    raise PipelineCancelled("切片已取消")
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command, stdout, stderr)
+    return stdout
+
+def open_cache(config_data, cache_folder=None):
+    """
+    返回缓存文件夹 cache_folder（默认为配置中 gcode_processor.cache_folder）对应的 StageCache，
+    大小上限为 gcode_processor.cache_max_mb（MB），没有设置缓存文件夹时返回 None。
+    """
+    gcode_processor = config_data.get("gcode_processor", {})
+    if cache_folder is None:
+        cache_folder = gcode_processor.get("cache_folder")
+    if not cache_folder:
+        return None
+    cache_max_mb = gcode_processor.get("cache_max_mb")
+    return StageCache(cache_folder, cache_max_mb * 2 ** 20 if cache_max_mb else DEFAULT_MAX_BYTES)
+
+def sliceSTL(stl_file_path, output_folder, config_data, cache_folder=None, log=print, cancelled=None):
+    """
+    切片 STL 文件并将生成的 G-code 文件保存到输出文件夹，提示信息通过 log 输出（默认打印）。
+    cancelled() 在 CuraEngine 运行期间定期检查，返回 True 时结束切片并抛出 PipelineCancelled
+    （不保留未写完的 G-code 文件）。
 
-def sliceSTL(stl_file_path, output_folder, config_data):
-    """切片 STL 文件并将生成的 G-code 文件保存到输出文件夹"""
+    设置了缓存文件夹（见 open_cache）时，STL 文件内容和实际生效的设置都与之前某次切片相同
+    则直接复制之前生成的 G-code，不再运行 CuraEngine。
+    """
     cura_engine_path = r"C:\Program Files\UltiMaker Cura 5.8.1\CuraEngine.exe"
     config_path = r"C:\Program Files\UltiMaker Cura 5.8.1\share\cura\resources\definitions\fdmprinter.def.json"
     output_path = os.path.join(output_folder, os.path.basename(stl_file_path).replace('.stl', '.gcode'))
@@ -106,110 +130,118 @@ def sliceSTL(stl_file_path, output_folder, config_data):
         json_config = config_data.get("json_config", {})
         if not json_config:
             raise ValueError("配置文件中缺少 json_config 部分")
-        update_json_config(config_path, json_config)
-
-        result = subprocess.run(
-            [cura_engine_path, "slice", "-v", "-j", config_path, "-l", stl_file_path,
-             "-s", "roofing_layer_count=0", "-o", output_path],
-            check=True, capture_output=True, text=True)
-        print(f"CuraEngine output: {result.stdout}")
-        print(f"切片完成，输出文件为 {output_path}")
+
+        for name in json_config:
+            if name not in PARAMETER_PATHS:
+                log(f"警告: 参数 {name} 未在 fdmprinter.def.json 中定义，跳过")
+        settings = effective_settings(json_config)
+
+        cache = open_cache(config_data, cache_folder)
+        if cache is not None:
+            key = slice_key(stl_file_path, settings, cura_engine_path, config_path)
+            cached_path = cache.lookup(key)
+            if cached_path:
+                shutil.copyfile(cached_path, output_path)
+                log(f"STL 文件和切片设置均未改变，使用缓存的切片结果: {output_path}")
+                return output_path
+
+        log(f"切片设置: {settings}")
+        try:
+            stdout = run_cura(slice_command(cura_engine_path, config_path, stl_file_path, output_path, settings),
+                              cancelled)
+        except PipelineCancelled:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            raise
+        log(f"CuraEngine output: {stdout}")
+        log(f"切片完成，输出文件为 {output_path}")
+        if cache is not None:
+            cache.store_file(key, output_path)
+            cache.evict()
         return output_path
     except subprocess.CalledProcessError as e:
-        print(f"切片失败: {str(e)}")
-        print(f"Error output: {e.output}")
+        log(f"切片失败: {str(e)}")
+        log(f"Error output: {e.output}")
         return None
+    except PipelineCancelled:
+        raise
     except Exception as e:
-        print(f"切片过程中发生错误: {str(e)}")
+        log(f"切片过程中发生错误: {str(e)}")
         return None
 
-def process_files(input_gcode_path, output_folder, config_data):
-    """处理 G-code 文件，执行 20 个步骤，所有中间文件保存在输出文件夹"""
+def process_files(input_gcode_path, output_folder, config_data, dump_intermediates=None, preview_path=None,
+                  streaming=None, export_array_text=None, jbi_workers=None, profile=None, cache_folder=None,
+                  progress=None, cancelled=None, fused=None, log=print):
+    """
+    处理 G-code 文件，执行 20 个步骤，JBI 文件保存在输出文件夹。
+
+    默认各步骤在内存中完成；dump_intermediates 为 True（或配置中 gcode_processor.dump_intermediates
+    为 true）时使用原有逐文件流程，所有中间文件保存在输出文件夹，便于调试。
+    streaming 为 True（或配置中 gcode_processor.streaming 为 true）时各步骤流式串联，
+    内存占用不随文件大小增长，用于很大的 Cura 输出。
+    export_array_text 为 True（或配置中 gcode_processor.export_array_text 为 true）时
+    额外导出第 18 步点数组的文本表。
+    jbi_workers（或配置中 gcode_processor.jbi_workers）为同时生成 JBI 文件的进程数，默认为 CPU 核数。
+    profile 为 True（或配置中 gcode_processor.profile 为 true）时记录每一步的耗时和内存，
+    在输出文件夹中写出 pipeline_report.json 并打印汇总表。
+    cache_folder（或配置中 gcode_processor.cache_folder）不为空时在该文件夹中缓存各步骤的输出，
+    同一 Cura 输出只修改后面步骤的参数时从缓存继续；缓存大小上限为 gcode_processor.cache_max_mb
+    （MB，默认 2048），超过时删除最久未使用的条目。
+    fused 为 True（或配置中 gcode_processor.fused_stages 为 true）时使用合并后的步骤，
+    输出相同，遍历次数更少。
+    progress、cancelled 传给 run_pipeline，用于界面显示进度和取消（取消时抛出 PipelineCancelled）；
+    log 为提示信息的输出函数（默认打印），同样传给 run_pipeline。
+
+    处理成功返回 True，失败（已打印错误信息）返回 False。
+    """
     gcode_processor = config_data.get("gcode_processor", {})
-    required_params = [
-        "type_map", "offset_x", "offset_y", "offset_z", "w", "h", "k2", "f1", "f2",
-        "distance", "insert_f", "connection_f", "j_distance", "global_offset_x",
-        "global_offset_y", "global_offset_z", "user", "tool"
-    ]
-    missing_params = [param for param in required_params if param not in gcode_processor]
+    missing_params = [param for param in REQUIRED_PARAMS if param not in gcode_processor]
     if missing_params:
         raise ValueError(f"配置文件缺少必需参数: {', '.join(missing_params)}")
 
-    type_map = gcode_processor["type_map"]
-    offset_x = gcode_processor["offset_x"]
-    offset_y = gcode_processor["offset_y"]
-    offset_z = gcode_processor["offset_z"]
-    w = gcode_processor["w"]
-    h = gcode_processor["h"]
-    k2 = gcode_processor["k2"]
-    f1 = gcode_processor["f1"]
-    f2 = gcode_processor["f2"]
-    distance = gcode_processor["distance"]
-    insert_f = gcode_processor["insert_f"]
-    connection_f = gcode_processor["connection_f"]
-    j_distance = gcode_processor["j_distance"]
-    global_offset_x = gcode_processor["global_offset_x"]
-    global_offset_y = gcode_processor["global_offset_y"]
-    global_offset_z = gcode_processor["global_offset_z"]
-    user = gcode_processor["user"]
-    tool = gcode_processor["tool"]
+    if dump_intermediates is None:
+        dump_intermediates = gcode_processor.get("dump_intermediates", False)
+    if streaming is None:
+        streaming = gcode_processor.get("streaming", False)
+    if export_array_text is None:
+        export_array_text = gcode_processor.get("export_array_text", False)
+    if jbi_workers is None:
+        jbi_workers = gcode_processor.get("jbi_workers")
+    if profile is None:
+        profile = gcode_processor.get("profile", False)
+    if fused is None:
+        fused = gcode_processor.get("fused_stages", False)
+    cache = open_cache(config_data, cache_folder)
 
     try:
-        intermediate_output1 = os.path.join(output_folder, "intermediate_1.gcode")
-        intermediate_output2 = os.path.join(output_folder, "intermediate_2.gcode")
-        intermediate_output3 = os.path.join(output_folder, "intermediate_3.gcode")
-        intermediate_output4 = os.path.join(output_folder, "intermediate_4.gcode")
-        intermediate_output5 = os.path.join(output_folder, "intermediate_5.gcode")
-        intermediate_output6 = os.path.join(output_folder, "intermediate_6.gcode")
-        intermediate_output7 = os.path.join(output_folder, "intermediate_7.gcode")
-        intermediate_output8 = os.path.join(output_folder, "intermediate_8.gcode")
-        intermediate_output_zreorganize = os.path.join(output_folder, "intermediate_zreorganize.gcode")
-        intermediate_output9 = os.path.join(output_folder, "intermediate_9.gcode")
-        intermediate_output10 = os.path.join(output_folder, "intermediate_10.gcode")
-        eleventh_output = os.path.join(output_folder, "intermediate_11.gcode")
-        before_check_output = os.path.join(output_folder, "intermediate_11_5.gcode")  # 新增中间文件
-        twelfth_output = os.path.join(output_folder, "intermediate_12.gcode")
-        thirteenth_output = os.path.join(output_folder, "intermediate_13.gcode")
-        fourteenth_output = os.path.join(output_folder, "intermediate_14.gcode")
-        fifteenth_output = os.path.join(output_folder, "intermediate_15.gcode")
-        intermediate_16 = os.path.join(output_folder, "intermediate_16.gcode")
-        intermediate_17 = os.path.join(output_folder, "intermediate_17.gcode")
-        intermediate_20 = os.path.join(output_folder, "intermediate_20.gcode")
-        intermediate_18 = os.path.join(output_folder, "intermediate_18.gcode")
-
-        reorganize(input_gcode_path, intermediate_output1, type_map)
-        transfer_g0(intermediate_output1, intermediate_output2)
-        trim_g0(intermediate_output2, intermediate_output3)
-        next_step(intermediate_output3, intermediate_output4)
-        fifth_step(intermediate_output4, intermediate_output5)
-        sixth_step(intermediate_output5, intermediate_output6)
-        seventh_step(intermediate_output6, intermediate_output7)
-        eighth_step(intermediate_output7, intermediate_output8)
-        zreorganize_step(intermediate_output8, intermediate_output_zreorganize)
-        ninth_step(intermediate_output_zreorganize, intermediate_output9, offset_x, offset_y, offset_z)
-        tenth_step(intermediate_output9, intermediate_output10)
-        eleventh_step(intermediate_output10, eleventh_output, w, h, k2, f1, f2)
-        before_check_step(eleventh_output, before_check_output)  # 新增第11.5步
-        twelfth_step(before_check_output, twelfth_output, distance, insert_f, connection_f, j_distance - distance)
-        thirteenth_step(twelfth_output, thirteenth_output, insert_f)
-        fourteenth_step(thirteenth_output, fourteenth_output)
-        fifteenth_step(fourteenth_output, fifteenth_output, -5, -5, j_distance)
-        sixteenth_step(fifteenth_output, intermediate_16)
-        seventeenth_step(intermediate_16, intermediate_17)
-        twentieth_step(intermediate_17, intermediate_20, global_offset_x, global_offset_y, global_offset_z)
-        eighteenth_step(intermediate_20, intermediate_18)
-        nineteenth_step(intermediate_18, output_folder, user, tool)
-
-        print(f"所有处理步骤完成！第19步输出文件夹: {output_folder}")
+        run_pipeline(input_gcode_path, output_folder, gcode_processor,
+                     dump_intermediates=dump_intermediates, preview_path=preview_path, streaming=streaming,
+                     export_array_text=export_array_text, jbi_workers=jbi_workers,
+                     profile=profile, profile_summary=profile, cache=cache,
+                     progress=progress, cancelled=cancelled, fused=fused, log=log)
+        log(f"所有处理步骤完成！第19步输出文件夹: {output_folder}")
+        return True
 
+    except PipelineCancelled as e:
+        log(f"处理已取消: {str(e)}")
+        raise
     except Exception as e:
-        print(f"处理失败: {str(e)}")
+        log(f"处理失败: {str(e)}")
+        return False
 
 def main():
     parser = argparse.ArgumentParser(description="STL 文件切片和 G-code 处理工具")
     parser.add_argument("stl_file", help="STL 文件路径")
     parser.add_argument("output_folder", help="输出文件夹路径")
     parser.add_argument("--config", help="配置文件路径", default=os.path.join(os.getcwd(), '1231.json'))
+    parser.add_argument("--dump-intermediates", action="store_true", help="保存所有中间 G-code 文件（调试用）")
+    parser.add_argument("--streaming", action="store_true", help="流式处理（适用于很大的 G-code 文件）")
+    parser.add_argument("--export-array-text", action="store_true", help="导出第 18 步点数组的文本表（调试用）")
+    parser.add_argument("--jbi-workers", type=int, help="同时生成 JBI 文件的进程数（默认为 CPU 核数）")
+    parser.add_argument("--profile", action="store_true", help="记录每一步的耗时和内存，输出性能报告")
+    parser.add_argument("--fused", action="store_true", help="使用合并后的步骤（输出相同，速度更快）")
+    parser.add_argument("--cache-folder", help="切片结果和中间结果的缓存文件夹（STL 和设置未改变时不再切片，"
+                                               "只修改后面步骤的参数时从缓存继续）")
     args = parser.parse_args()
 
     if not os.path.exists(args.output_folder):
@@ -222,9 +254,16 @@ def main():
         print(f"错误: 加载配置文件失败: {str(e)}")
         return
 
-    gcode_file = sliceSTL(args.stl_file, args.output_folder, config_data)
+    gcode_file = sliceSTL(args.stl_file, args.output_folder, config_data, cache_folder=args.cache_folder)
     if gcode_file:
-        process_files(gcode_file, args.output_folder, config_data)
+        process_files(gcode_file, args.output_folder, config_data,
+                      dump_intermediates=True if args.dump_intermediates else None,
+                      streaming=True if args.streaming else None,
+                      export_array_text=True if args.export_array_text else None,
+                      jbi_workers=args.jbi_workers,
+                      profile=True if args.profile else None,
+                      cache_folder=args.cache_folder,
+                      fused=True if args.fused else None)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
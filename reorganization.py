@@ -1,4 +1,4 @@
-import re
+from gcodeparse import parse_line, parse_lines, to_lines
 
 
 def process_file(input_file, output_file, type_map):
@@ -20,19 +20,33 @@ def process_file(input_file, output_file, type_map):
         raise Exception(f"读取输入文件失败: {str(e)}")
 
     # 处理并写入输出文件
+    result = process_commands(parse_lines(lines), type_map)
     try:
         with open(output_file, 'w', encoding='utf-8') as f:
-            for line in lines:
-                if ";TYPE:" in line:
-                    match = re.search(r';TYPE:(\S+)', line)
-                    if match:
-                        type_name = match.group(1)
-                        t_value = type_map.get(type_name, "T1")  # 如果 type_name 不在 type_map 中，默认使用 T1
-                        f.write(f"{t_value}\n")  # 在 TYPE 行前插入 T0 或 T1
-                        f.write(line)  # 写入原始 TYPE 行
-                    else:
-                        f.write(line)  # 未匹配到 TYPE，保持原样
-                else:
-                    f.write(line)  # 非 TYPE 行直接写入
+            f.writelines(to_lines(result))
     except Exception as e:
-        raise Exception(f"写入输出文件失败: {str(e)}")
\ No newline at end of file
+        raise Exception(f"写入输出文件失败: {str(e)}")
+
+
+def process_commands(commands, type_map):
+    """
+    process_file 的内存版本：输入解析后的指令列表，返回处理后的指令列表。
+
+    参数:
+    - commands (list): GCodeLine 列表
+    - type_map (dict): 类型到 T 值 ('T0' 或 'T1') 的映射
+    """
+    return list(stream_commands(commands, type_map))
+
+
+def stream_commands(commands, type_map):
+    """process_commands 的流式版本：逐条读入指令，遇到 ;TYPE: 行时先输出对应的 T0/T1"""
+    tool_lines = {}  # T 值到指令行的缓存，避免重复解析
+    for cmd in commands:
+        type_name = cmd.type_name
+        if type_name is not None:
+            t_value = type_map.get(type_name, "T1")  # 如果 type_name 不在 type_map 中，默认使用 T1
+            if t_value not in tool_lines:
+                tool_lines[t_value] = parse_line(f"{t_value}\n")
+            yield tool_lines[t_value]  # 在 TYPE 行前插入 T0 或 T1
+        yield cmd  # 写入原始行
@@ -0,0 +1,13 @@
+"""
+编译 gcodeparse 的可选 C 扩展 _gcodeparse：
+
+    python setup_gcodeparse.py build_ext --inplace
+
+编译失败或未编译时 gcodeparse 使用纯 Python 解析，结果相同。
+"""
+from setuptools import Extension, setup
+
+setup(
+    name="_gcodeparse",
+    ext_modules=[Extension("_gcodeparse", ["_gcodeparse.c"])],
+)
@@ -0,0 +1,207 @@
+import ast
+import hashlib
+import json
+import os
+import shutil
+import sys
+from contextlib import contextmanager
+
+import numpy as np
+
+# 缓存格式版本，缓存内容或键的计算方式改变时加一，使旧的缓存全部失效
+CACHE_VERSION = 1
+# 默认的缓存大小上限（字节）
+DEFAULT_MAX_BYTES = 2 * 2 ** 30
+# 各步骤共用、也会影响输出的模块（其源码变化时所有缓存失效）
+SHARED_MODULES = ("gcodeparse", "gcodeio", "motiontable")
+# 本仓库的文件夹，只有其中的模块（包括编译好的 C 扩展）计入代码版本
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_code_digests = {}
+
+
+def file_digest(path, chunk_size=2 ** 20):
+    """文件内容的 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def module_path(module_name):
+    """已加载的本仓库模块的文件路径（.py 或 C 扩展），其他模块返回 None"""
+    path = getattr(sys.modules.get(module_name), "__file__", None)
+    if not path or not os.path.exists(path):
+        return None
+    path = os.path.abspath(path)
+    return path if os.path.dirname(path) == REPO_DIR else None
+
+
+def local_imports(module_name):
+    """模块源码中 import 的本仓库模块名（只包括已加载的，如编译好的 _gcodeparse）"""
+    path = module_path(module_name)
+    if path is None or not path.endswith(".py"):
+        return []
+    with open(path, "rb") as f:
+        tree = ast.parse(f.read(), path)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+    return sorted(name for name in names if module_path(name) is not None)
+
+
+def code_digest(module_name):
+    """
+    模块的代码版本：模块及其直接、间接 import 的所有本仓库模块（包括 C 扩展）文件的 SHA-256，
+    每个模块只计算一次。模块不是本仓库的文件时返回模块名。
+    """
+    if module_name not in _code_digests:
+        if module_path(module_name) is None:
+            _code_digests[module_name] = module_name
+        else:
+            seen = {module_name}
+            pending = [module_name]
+            while pending:
+                for name in local_imports(pending.pop()):
+                    if name not in seen:
+                        seen.add(name)
+                        pending.append(name)
+            digest = hashlib.sha256()
+            for name in sorted(seen):
+                digest.update(f"{name}:{file_digest(module_path(name))}\n".encode("utf-8"))
+            _code_digests[module_name] = digest.hexdigest()
+    return _code_digests[module_name]
+
+
+def input_key(input_path):
+    """输入文件的缓存键：文件内容和共用模块的代码版本"""
+    return stage_key(file_digest(input_path), "input", None, [code_digest(name) for name in SHARED_MODULES])
+
+
+def stage_key(parent, name, module_name, args):
+    """
+    步骤输出的缓存键。
+
+    parent 为上一步输出的键（第一步为输入文件的键），因此键同时包含了输入内容
+    和之前所有步骤的参数、代码版本；name 为步骤名，args 为该步骤的参数。
+    """
+    payload = json.dumps([CACHE_VERSION, parent, name, module_name,
+                          code_digest(module_name) if module_name else None, args],
+                         sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class StageCache:
+    """
+    按内容寻址的中间结果缓存：每个条目是一个步骤的输出文件，文件名为缓存键。
+
+    条目的修改时间作为最近使用时间（命中时更新），evict() 按最近最少使用的顺序
+    删除条目，直到总大小不超过 max_bytes、条目数不超过 max_entries。
+    写入时先写临时文件再改名，多个进程同时使用同一缓存文件夹时不会读到不完整的条目。
+    """
+
+    def __init__(self, folder, max_bytes=DEFAULT_MAX_BYTES, max_entries=None):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key, suffix=".gcode"):
+        """条目的文件路径"""
+        return os.path.join(self.folder, key[:2], key + suffix)
+
+    def lookup(self, key, suffix=".gcode"):
+        """返回条目路径并更新其使用时间，没有该条目时返回 None"""
+        path = self.path(key, suffix)
+        try:
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    @contextmanager
+    def writer(self, key, suffix=".gcode", mode="w"):
+        """写入一个条目：with cache.writer(键) as f: ...，出错时不留下条目"""
+        path = self.path(key, suffix)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, mode, encoding=None if "b" in mode else "utf-8") as f:
+                yield f
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def store_lines(self, key, lines):
+        """保存行列表（readlines() 格式）"""
+        with self.writer(key) as f:
+            f.writelines(lines)
+
+    def store_file(self, key, source, suffix=".gcode"):
+        """复制文件作为条目，source 不存在时（该步骤没有输出）不保存"""
+        if not os.path.exists(source):
+            return
+        with self.writer(key, suffix, "wb") as f, open(source, "rb") as src:
+            shutil.copyfileobj(src, f)
+
+    def store_array(self, key, arr):
+        """以 .npy 格式保存点数组"""
+        with self.writer(key, ".npy", "wb") as f:
+            np.save(f, arr)
+
+    def tee(self, key, commands):
+        """流式模式下边传递指令边保存，指令全部传递完后才生成条目"""
+        with self.writer(key) as f:
+            for cmd in commands:
+                f.write(cmd.raw)
+                yield cmd
+
+    def entries(self):
+        """返回所有条目 [(使用时间, 字节数, 路径)]，按使用时间从早到晚排序"""
+        entries = []
+        if not os.path.isdir(self.folder):
+            return entries
+        for root, _, names in os.walk(self.folder):
+            for name in names:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        return entries
+
+    def evict(self):
+        """删除最近最少使用的条目，直到不超过大小和数量上限，返回删除的条目数"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        count = len(entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes and (self.max_entries is None or count <= self.max_entries):
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            count -= 1
+            removed += 1
+        return removed
+
+    def clear(self):
+        """删除所有条目"""
+        for _, _, path in self.entries():
+            os.remove(path)
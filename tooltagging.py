@@ -0,0 +1,123 @@
+from gcodeparse import BLANK_LINE, parse_line, parse_lines, to_lines
+from pipelinelog import log
+
+
+def process_file(input_path, output_path, type_map):
+    """
+    合并第 1～4 步（reorganization → TransferG0 → G0Trimmer → GCodeAnnotator），
+    只读写一次文件，输出与依次执行四个步骤相同。
+    """
+    try:
+        with open(input_path, 'r', encoding='utf-8') as infile:
+            lines = infile.readlines()
+
+        result = process_commands(parse_lines(lines), type_map)
+
+        with open(output_path, 'w') as outfile:
+            outfile.writelines(to_lines(result))
+        log("打印头标记处理完成！")
+    except Exception as e:
+        raise Exception(f"处理 G-code 文件时出错: {e}")
+
+
+def process_commands(commands, type_map):
+    """process_file 的内存版本：输入 Cura 输出的指令列表，返回第 4 步输出的指令列表"""
+    return list(stream_commands(commands, type_map))
+
+
+def stream_commands(commands, type_map):
+    """
+    process_commands 的流式版本：一次遍历完成四个步骤。
+
+    - reorganization：;TYPE: 行前插入 type_map 对应的 T0/T1（未映射的类型为 T1）
+    - TransferG0：只保留 TYPE、T0/T1、G0、G1 行（去除首尾空白）；不带 Z 的 G0 暂存，
+      只有下一条 G1 之前的最后一条被输出
+    - G0Trimmer：上一步的输出中没有空行，整个文件是一个数据块，
+      第一行不是 T0 时连续的 G0 只保留最后一条
+    - GCodeAnnotator：在 "G0 F15000" 之前插入空行、当前打印头和打印类型
+    """
+    tool_lines = {}  # T 值到指令行的缓存
+    header_lines = {}  # (打印头, 打印类型) 到插入行的缓存
+    pending_g0 = None  # TransferG0：等待下一条 G1 的不带 Z 的 G0
+    collapse = None  # G0Trimmer：是否合并连续 G0（由第一行决定）
+    last_g0 = None  # G0Trimmer：当前连续 G0 中的最后一条
+    current_head = ""
+    current_type = ""
+
+    for cmd in commands:
+        code = cmd.code
+
+        # 最常见的情况：不带注释的 G1，且前面没有暂存的 G0，各步骤都只是原样（去除空白后）输出
+        if code == "G1" and cmd.comment is None and pending_g0 is None and last_g0 is None \
+                and collapse is not None:
+            yield cmd.stripped()
+            continue
+
+        # reorganization + TransferG0：本行对应的输出
+        kept = []
+        type_name = cmd.type_name
+        if type_name is not None:
+            t_value = type_map.get(type_name, "T1")
+            if t_value not in tool_lines:
+                tool_lines[t_value] = parse_line(f"{t_value}\n")
+            kept.append(tool_lines[t_value])
+        if cmd.is_type or code == "T0" or code == "T1":
+            kept.append(cmd.stripped())
+        elif code == "G0":
+            if cmd.z is not None:
+                kept.append(cmd.stripped())
+            else:
+                pending_g0 = cmd.stripped()
+        elif code == "G1":
+            if pending_g0 is not None:
+                kept.append(pending_g0)
+                pending_g0 = None
+            kept.append(cmd.stripped())
+
+        # G0Trimmer + GCodeAnnotator
+        for line in kept:
+            if collapse is None:
+                collapse = line.code != "T0"
+            if collapse and line.code == "G0":
+                last_g0 = line
+                continue
+            if last_g0 is not None:
+                output = (last_g0, line)
+                last_g0 = None
+            else:
+                output = (line,)
+            for out in output:
+                current_head, current_type = annotate_state(out, current_head, current_type)
+                if is_travel_start(out):
+                    yield from header(header_lines, current_head, current_type)
+                yield out
+
+    # 文件末尾的连续 G0
+    if last_g0 is not None:
+        current_head, current_type = annotate_state(last_g0, current_head, current_type)
+        if is_travel_start(last_g0):
+            yield from header(header_lines, current_head, current_type)
+        yield last_g0
+
+
+def annotate_state(cmd, current_head, current_type):
+    """GCodeAnnotator 中的状态：返回经过 cmd 之后的 (当前打印头, 当前打印类型)"""
+    if cmd.code == "T0" or cmd.code == "T1":
+        current_head = cmd.code
+    type_name = cmd.type_name
+    if type_name is not None:
+        current_type = type_name
+    return current_head, current_type
+
+
+def is_travel_start(cmd):
+    """GCodeAnnotator 在其前面插入空行、打印头和打印类型的 "G0 F15000" 行"""
+    return cmd.code == "G0" and cmd.f == 15000 and cmd.raw.startswith("G0 F")
+
+
+def header(header_lines, current_head, current_type):
+    """空行、打印头和打印类型三行（按 (打印头, 打印类型) 缓存）"""
+    key = (current_head, current_type)
+    if key not in header_lines:
+        header_lines[key] = (BLANK_LINE, parse_line(f"{current_head}\n"), parse_line(f";TYPE:{current_type}\n"))
+    return header_lines[key]
@@ -1,75 +1,167 @@
 import sys
 import numpy as np
-import re
 import argparse
 import os
+from operator import attrgetter
+
+from gcodeparse import read_commands
+from motiontable import forward_fill
+
+# 脉冲换算系数
+JT = 8279 / 100
+ET = 12300 / 100
 
 def process_gcode_to_array(input_filepath, output_filepath):
-    # 读取切片软件生成的 Gcode 文件
-    with open(input_filepath, "r") as f:
-        data = f.readlines()
-    n = len(data)
-
-    jt = 8279 / 100
-    et = 12300 / 100
-
-    # 定义一个初始 m 行，7 列的二维数组，m 表示 m 个点
-    m = sum(1 for line in data if "G1" in line)
-    arr = np.zeros((m, 7))
-
-    # 正则表达式提取数据
-    pax = r"X([-]?\d+\.?\d*)"
-    pay = r"Y([-]?\d+\.?\d*)"
-    paz = r"Z([-]?\d+\.?\d*)"
-    pae = r"E([-]?\d+\.?\d*)"
-    paj = r"J([-]?\d+\.?\d*)"
-    paf = r"F(\d+)"
+    """
+    读取切片软件生成的 Gcode 文件，生成点数组并保存。
+
+    output_filepath 以 .npy 结尾时保存为二进制数组（arraytojbi 可直接内存映射读取），
+    否则按原有格式保存为制表符分隔的文本表（调试用）。返回点数组。
+    """
+    arr = commands_to_array(read_commands(input_filepath))
+
+    # 保存结果到输出文件
+    if output_filepath.endswith(".npy"):
+        np.save(output_filepath, arr)
+    else:
+        write_array_to_file(arr, output_filepath)
+    return arr
+
+def commands_to_array(commands):
+    """
+    process_gcode_to_array 的内存版本：输入指令列表，返回 m 行 7 列的点数组。
+
+    commands 为列表时按列一次性计算（见 points_batch）；
+    也可以是指令生成器（流式处理时不保留整个指令列表），此时逐点生成，只遍历一次。
+    """
+    if isinstance(commands, list):
+        return points_batch(commands)
+    return np.fromiter(iter_points(commands), dtype=np.dtype((np.float64, 7))).reshape(-1, 7)
+
+def points_batch(commands):
+    """
+    iter_points 的批量版本，结果逐位一致：
 
+    - 遍历一次指令，只记下 G1、G92 和舵机/剪切行，再取出参数组成数值列
+    - X/Y/Z/F 在 G1 行之间前向填充
+    - E/J 增量为与上一个值（G92 处清零）之差，累计值用 cumsum 计算
+    - 标记取每个点之后、下一条 G1 之前最后一个舵机或剪切行
+    """
+    g1 = []  # G1 行号
+    counted = []  # G1 和 G92 行
+    rows = []  # 标记行号
+    marks = []
+    for i, cmd in enumerate(commands):
+        code = cmd.code
+        if code == "G1":
+            g1.append(i)
+            counted.append(cmd)
+            continue
+        if code == "G92":
+            counted.append(cmd)
+        # 第一个点之前的标记没有对应的点，忽略
+        if not g1:
+            continue
+        if code == "M280":
+            if "M280 P0 S2" in cmd.raw:
+                rows.append(i)
+                marks.append(1)
+            elif "M280 P0 S95" in cmd.raw:
+                rows.append(i)
+                marks.append(3)
+        elif cmd.comment is not None and "cut" in cmd.comment:
+            rows.append(i)
+            marks.append(2)
+
+    arr = np.zeros((len(g1), 7))
+    if not g1:
+        return arr
+
+    points = [commands[i] for i in g1]
+    for column, name in enumerate("xyz"):
+        arr[:, column] = forward_fill(column_values(points, name))
+    # F 只取整数部分（加 0.0 使 -0.0 变为 0.0）
+    arr[:, 5] = forward_fill(np.trunc(column_values(points, "f")) + 0.0) / 60
+
+    # E/J：G92 行记为 0，上一个值为本行之前最近的 G1 或 G92 值
+    is_g1 = np.array([cmd.code == "G1" for cmd in counted])
+    for column, name, factor in ((3, "e", ET), (4, "j", JT)):
+        values = column_values(counted, name)
+        values[~is_g1] = 0.0
+        previous = np.zeros(len(values))
+        previous[1:] = forward_fill(values[:-1])
+        delta = (values - previous)[is_g1]
+        arr[:, column] = np.trunc(np.cumsum(np.where(np.isnan(delta), 0.0, delta)) * factor) + 0.0
+
+    # 同一个点之后有多个标记时，后出现的覆盖前面的
+    if rows:
+        owners = np.searchsorted(g1, rows, side="right") - 1
+        last = np.append(owners[1:] != owners[:-1], True)
+        arr[owners[last], 6] = np.array(marks)[last]
+    return arr
+
+def column_values(commands, name):
+    """取出各指令某个参数的数值组成 float64 数组，缺省为 NaN"""
+    nan = float("nan")
+    return np.fromiter((nan if value is None else value for value in map(attrgetter(name), commands)),
+                       dtype=np.float64, count=len(commands))
+
+def iter_points(commands):
+    """
+    逐个返回点数组的行 (x, y, z, E 脉冲, J 脉冲, 速度, 标记)，每条 G1 指令对应一个点。
+
+    点在下一条 G1 出现（或指令结束）时才输出，以便记录其后的舵机和剪切标记。
+    """
     x_value = y_value = z_value = e_value = j_value = f_value = exp = jxp = 0
-    p = 0  # 第 p 个点
+    point = None  # 当前点
 
-    for i in range(n):
-        line = data[i]
-        if "G92" in line:
+    for cmd in commands:
+        code = cmd.code
+        if code == "G92":
             e_value = j_value = 0
 
-        if "G1" in line:
-            x_value = float(re.search(pax, line).group(1)) if re.search(pax, line) else x_value
-            y_value = float(re.search(pay, line).group(1)) if re.search(pay, line) else y_value
-            z_value = float(re.search(paz, line).group(1)) if re.search(paz, line) else z_value
-            e = re.search(pae, line)
-            if e:
+        if code == "G1":
+            if point is not None:
+                yield point
+            x_value = cmd.x if cmd.x is not None else x_value
+            y_value = cmd.y if cmd.y is not None else y_value
+            z_value = cmd.z if cmd.z is not None else z_value
+            if cmd.e is not None:
                 ex = e_value
-                e_value = float(e.group(1))
+                e_value = cmd.e
                 exp += e_value - ex
-            j = re.search(paj, line)
-            if j:
+            if cmd.j is not None:
                 jx = j_value
-                j_value = float(j.group(1))
+                j_value = cmd.j
                 jxp += j_value - jx
-            f_value = float(re.search(paf, line).group(1)) if re.search(paf, line) else f_value
+            # F 只取整数部分
+            f_value = float(int(cmd.f)) if cmd.f is not None else f_value
 
-            arr[p] = [x_value, y_value, z_value, int(exp * et), int(jxp * jt), f_value / 60, 0]
-            p += 1
+            point = [x_value, y_value, z_value, int(exp * ET), int(jxp * JT), f_value / 60, 0]
 
-        if "M280 P0 S95" in line:
-            arr[p - 1, 6] = 3
-        if "M280 P0 S2" in line:
-            arr[p - 1, 6] = 1
-        if "cut" in line:
-            arr[p - 1, 6] = 2
+        # 第一个点之前的标记没有对应的点，忽略
+        elif point is None:
+            continue
+        elif code == "M280":
+            if "M280 P0 S95" in cmd.raw:
+                point[6] = 3
+            if "M280 P0 S2" in cmd.raw:
+                point[6] = 1
+        elif cmd.comment is not None and "cut" in cmd.comment:
+            point[6] = 2
 
-    # 保存结果到输出文件
-    write_array_to_file(arr, output_filepath)
+    if point is not None:
+        yield point
 
 def write_array_to_file(arr, output_filename="array.txt"):
+    """将点数组保存为文本表（%f 格式，只保留 6 位小数，主要用于调试查看）"""
     np.savetxt(output_filename, arr, fmt='%f', delimiter="\t")
 
 def main():
     # 设置命令行参数解析
     parser = argparse.ArgumentParser(description="处理 G-code 文件并生成数组")
     parser.add_argument('--input', required=True, help='输入 G-code 文件路径')
-    parser.add_argument('--output', required=True, help='输出文件路径')
+    parser.add_argument('--output', required=True, help='输出文件路径（.npy 为二进制数组，其他为文本表）')
     args = parser.parse_args()
 
     # 检查输入文件是否存在
@@ -14,6 +14,8 @@ from OpenGL.GL import *
 
 # 从 readjson.py 导入函数
 from readjson import sliceSTL, process_files
+# 后台线程执行切片和处理，显示进度和日志
+from pipelineworker import PipelineRunPanel
 # 导入分类和映射函数
 from jsonreclass import classify_json
 from jsonpp import map_parameters
@@ -21,6 +23,18 @@ from jsonpp import map_parameters
 import materialui
 import equipmentui
 
+def slice_and_process(stl_path, output_folder, config_data, preview_path, progress=None, cancelled=None, log=print):
+    """切片并执行后处理流程（在后台线程中执行），返回预览 G-code 路径，失败时抛出异常"""
+    if progress is not None:
+        progress(0, 1, "切片")
+    gcode_file = sliceSTL(stl_path, output_folder, config_data, log=log, cancelled=cancelled)
+    if not gcode_file:
+        raise RuntimeError("切片失败，未生成 G-code 文件")
+    if not process_files(gcode_file, output_folder, config_data, preview_path=preview_path,
+                         progress=progress, cancelled=cancelled, log=log):
+        raise RuntimeError("处理失败，详见日志")
+    return preview_path
+
 # STLViewer 类（保持不变，省略代码）
 class STLViewer(QOpenGLWidget):
     def __init__(self, parent=None):
@@ -472,6 +486,9 @@ class MainWindow(QMainWindow):
         left_layout = QVBoxLayout()
         left_layout.addLayout(top_layout)
         left_layout.addWidget(self.stack_widget_gl)
+        self.run_panel = PipelineRunPanel(self)
+        self.run_panel.setMaximumHeight(200)
+        left_layout.addWidget(self.run_panel)
         left_widget.setLayout(left_layout)
 
         params_widget = QWidget()
@@ -501,6 +518,9 @@ class MainWindow(QMainWindow):
         self.run_slice_button.clicked.connect(self.run_slice)
         self.load_stl_button.clicked.connect(self.load_stl)
         self.select_output_folder_button.clicked.connect(self.select_output_folder)
+        self.run_panel.finished.connect(self.on_slice_finished)
+        self.run_panel.failed.connect(self.on_slice_failed)
+        self.run_panel.stopped.connect(lambda: self.run_slice_button.setEnabled(True))
 
         # 参数映射
         self.support_type_map = {"网格": "grid", "树形": "tree", "线性": "lines"}
@@ -643,20 +663,27 @@ class MainWindow(QMainWindow):
             config_data['json_config']['layer_height'] = float(self.layer_thickness.text())
             config_data['json_config']['line_width'] = float(self.line_width.text())
 
-            gcode_file = sliceSTL(stl_path, output_folder, config_data)
-            if gcode_file:
-                process_files(gcode_file, output_folder, config_data)
-                gcode_path = os.path.join(output_folder, "intermediate_20.gcode")
-                if os.path.exists(gcode_path):
-                    self.gcode_viewer.load_gcode(gcode_path)
-                    self.stack_widget_gl.setCurrentWidget(self.gcode_viewer)
-                else:
-                    QMessageBox.critical(self, "错误", f"文件 {gcode_path} 不存在")
-            else:
-                QMessageBox.critical(self, "错误", "切片失败，未生成 G-code 文件")
+            # 切片和处理在后台线程中执行，完成后在 on_slice_finished 中加载预览
+            gcode_path = os.path.join(output_folder, "intermediate_20.gcode")
+            if self.run_panel.start(slice_and_process, stl_path, output_folder, config_data, gcode_path):
+                self.run_slice_button.setEnabled(False)
         except Exception as e:
             QMessageBox.critical(self, "错误", f"操作失败: {str(e)}")
 
+    def on_slice_finished(self, gcode_path):
+        if os.path.exists(gcode_path):
+            self.gcode_viewer.load_gcode(gcode_path)
+            self.stack_widget_gl.setCurrentWidget(self.gcode_viewer)
+        else:
+            QMessageBox.critical(self, "错误", f"文件 {gcode_path} 不存在")
+
+    def on_slice_failed(self, message):
+        QMessageBox.critical(self, "错误", f"操作失败: {message}")
+
+    def closeEvent(self, event):
+        self.run_panel.shutdown()
+        super().closeEvent(event)
+
     def load_stl(self):
         file_name, _ = QFileDialog.getOpenFileName(self, "打开 STL 文件", "", "STL Files (*.stl)")
         if file_name:
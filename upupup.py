@@ -1,5 +1,8 @@
 import argparse
 
+from gcodeparse import parse_lines, replace_params, to_lines
+from pipelinelog import log
+
 
 def process_file(input_file, output_file):
     """
@@ -14,61 +17,65 @@ def process_file(input_file, output_file):
         with open(input_file, 'r') as file:
             lines = file.readlines()
 
-        # 处理文本块
-        i = 0
-        while i < len(lines):
-            if lines[i].startswith('T1'):  # 检测到 T1 开头，开始处理文本块
-                block_start = i
-                block_end = None
-
-                # 找到文本块的结束（下一个 T0 或 T1）
-                for j in range(i + 1, len(lines)):
-                    if lines[j].startswith('T0') or lines[j].startswith('T1'):
-                        block_end = j
-                        break
-
-                # 如果找到了文本块的结束
-                if block_end is not None:
-                    # 获取文本块
-                    block_lines = lines[block_start:block_end]
-
-                    # 找到文本块内最后一条 G1 命令
-                    last_g1_line = None
-                    last_g1_index = -1
-                    for index, line in enumerate(reversed(block_lines)):
-                        if line.startswith('G1'):
-                            last_g1_line = line
-                            last_g1_index = len(block_lines) - index - 1
-                            break
-
-                    if last_g1_line:
-                        # 复制最后一条 G1 命令并修改 Z 值
-                        parts = last_g1_line.split()
-                        new_parts = []
-                        for part in parts:
-                            if part.startswith('Z'):
-                                # 增加 Z 值 10 并保留 3 位小数
-                                new_parts.append(f"Z{round(float(part[1:]) + 10, 3)}")
-                            else:
-                                new_parts.append(part)
-
-                        # 将修改后的行插入到最后一条 G1 命令后面
-                        lines.insert(block_start + last_g1_index + 1, ' '.join(new_parts) + '\n')
-                        # 跳到块的结束位置
-                        i = block_end
-                    else:
-                        i += 1
-                else:
-                    i += 1
-            else:
-                i += 1
+        commands = process_commands(parse_lines(lines))
 
         # 将修改后的内容写入输出文件
         with open(output_file, 'w') as file:
-            file.writelines(lines)
-        print("文件处理完成！")
+            file.writelines(to_lines(commands))
+        log("文件处理完成！")
     except Exception as e:
-        print(f"处理文件时出错: {e}")
+        log(f"处理文件时出错: {e}")
+
+
+def process_commands(lines):
+    """
+    process_file 的内存版本：在每个以 T1 开头的文本块中复制最后一条 G1 命令并修改 Z 值。
+
+    与 stream_commands 相同逐行生成新的指令列表，不修改输入列表。
+
+    参数:
+        lines (list): GCodeLine 列表
+
+    返回:
+        list: 处理后的指令列表
+    """
+    return list(stream_commands(lines))
+
+
+def stream_commands(commands):
+    """
+    process_commands 的流式版本：在 T1 文本块（到下一个 T0 或 T1 为止）中，
+    只缓存从最近一条 G1 开始的行；遇到块结束时在该 G1 之后插入复制行。
+    文件末尾未结束的 T1 块不做处理。
+    """
+    in_t1_block = False
+    pending = []  # 当前 T1 块中从最后一条 G1 开始的行
+    for cmd in commands:
+        if cmd.code == 'T0' or cmd.code == 'T1':
+            if pending:
+                yield pending[0]
+                yield lift_g1(pending[0])
+                yield from pending[1:]
+                pending = []
+            in_t1_block = cmd.code == 'T1'
+            yield cmd
+        elif in_t1_block and cmd.code == 'G1':
+            yield from pending
+            pending = [cmd]
+        elif pending:
+            pending.append(cmd)
+        else:
+            yield cmd
+    yield from pending
+
+
+def lift_g1(line):
+    """复制 G1 命令并将 Z 值增加 10（保留 3 位小数）"""
+    values = {}
+    if line.z is not None:
+        new_z = round(line.z + 10, 3)
+        values['Z'] = (new_z, f"{new_z}")
+    return replace_params(line, newline='\n', **values)
 
 
 def main():